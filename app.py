@@ -1,105 +1,683 @@
+import base64
+import cProfile
+import csv
+import gzip
+import hashlib
+import io
+import json
+import logging
+import mimetypes
 import os
+import pstats
+import re
+import shutil
 import sqlite3
-from flask import Flask, render_template, request, redirect, url_for, flash
+import sys
+import tempfile
+import threading
+import time
+from calendar import monthrange
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from itertools import chain, islice
+import click
+from flask import (Flask, Response, render_template, request, redirect, url_for, flash, g,
+                   abort, current_app, get_flashed_messages, has_app_context,
+                   has_request_context, jsonify, make_response, send_file,
+                   send_from_directory, session, stream_template, stream_with_context)
+from werkzeug.datastructures import FileStorage
+from werkzeug.http import is_resource_modified
 from werkzeug.utils import secure_filename
-from dateutil.relativedelta import relativedelta
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from urllib.parse import parse_qs
 from flask import Blueprint
+from flask.cli import with_appcontext
 
+# Route dashboard, foto dan perintah CLI (cli_group=None -> `flask init-db`, dst.)
+main_bp = Blueprint("main", __name__, cli_group=None)
+siswa_bp = Blueprint("siswa", __name__)
 bp = Blueprint("guru", __name__, url_prefix="/guru")
+api_bp = Blueprint("api", __name__, url_prefix="/api")
+laporan_bp = Blueprint("laporan", __name__, url_prefix="/laporan")
 
 # ---------- Config ----------
+# Nilai bawaan; bisa ditimpa lewat environment dengan awalan SEKOLAH_
+# (mis. SEKOLAH_DATABASE, SEKOLAH_UPLOAD_FOLDER, SEKOLAH_SECRET_KEY) atau
+# lewat argumen create_app(config).
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(APP_DIR, "sekolah.db")
 
 UPLOAD_SISWA = os.path.join(APP_DIR, "static", "uploads_siswa")
 UPLOAD_GURU = os.path.join(APP_DIR, "static", "uploads_guru")
-os.makedirs(UPLOAD_SISWA, exist_ok=True)
-os.makedirs(UPLOAD_GURU, exist_ok=True)
 
-ALLOWED_EXT = {"png", "jpg", "jpeg", "gif"}
+DEFAULT_CONFIG = {
+    "SECRET_KEY": "change_this_secret",
+    "DATABASE": DB_PATH,
+    "INVENTARIS_DATABASE": os.path.join(APP_DIR, "inventaris.db"),
+    "UPLOAD_FOLDER": UPLOAD_SISWA,
+    "UPLOAD_FOLDER_GURU": UPLOAD_GURU,
+    "ASSET_FOLDER": os.path.join(APP_DIR, "static", "build"),
+    # Upload foto mentah menunggu diproses worker (di luar static/)
+    "FOTO_ANTRIAN_FOLDER": os.path.join(APP_DIR, "antrian_foto"),
+    "FOTO_ASYNC": True,
+    "FOTO_WORKERS": 2,
+    # Multi sekolah: satu folder per sekolah berisi database & folder upload
+    # sendiri, diakses lewat /s/<sekolah>/... (lihat TenantMiddleware)
+    "TENANT_FOLDER": None,
+    "TENANT_HEADER": None,     # mis. "X-Sekolah" bila tenant dipilih reverse proxy
+    "BACKUP_FOLDER": os.path.join(APP_DIR, "backups"),
+    "REFRESH_TURUNAN_OTOMATIS": True,
+    "SLOW_QUERY_MS": 100,
+    "METRICS_ENABLED": True,
+    "PROFILER_ENABLED": False,
+    #"MAX_CONTENT_LENGTH": 16 * 1024 * 1024,  # 16 MB
+}
 
-def hitung_selisih_tahun_bulan(tanggal_awal):
-    """Mengembalikan selisih (tahun, bulan) dari tanggal_awal sampai hari ini"""
-    if not tanggal_awal:
-        return (0, 0)
+ALLOWED_EXT = {"png", "jpg", "jpeg", "gif"}
 
+# ---------- Perhitungan tanggal (usia & masa kerja) ----------
+# Semua selisih dihitung dengan aritmetika bulan bilangan bulat terhadap satu
+# tanggal acuan. Hasilnya sama dengan relativedelta antar dua `date`
+# (termasuk penyesuaian akhir bulan: 31 Jan -> 28 Feb dihitung 1 bulan),
+# tanpa membuat objek relativedelta per baris. String tanggal di-parse sekali
+# lalu di-cache.
+#
+# Perubahan yang disengaja dari kode lama: sisa masa kerja dulu dihitung
+# terhadap datetime.today() yang membawa jam, sehingga pada tanggal yang sama
+# dengan tanggal pensiun (mis. 17 Mei, pensiun 17 Mei 4 tahun lagi) hasilnya
+# kurang satu bulan (3 th 11 bl). Sekarang dihitung per tanggal: 4 th 0 bl.
+USIA_PENSIUN = 60
+
+@lru_cache(maxsize=16384)
+def parse_tanggal(value):
+    """'YYYY-MM-DD' -> date; None bila kosong atau tidak valid"""
+    if not value:
+        return None
+    text = str(value)
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        pass
     try:
-        # Menangani format data yang mungkin datang dari database (YYYY-MM-DD)
-        t_mulai = datetime.strptime(str(tanggal_awal), "%Y-%m-%d")
-    except:
+        # Menangani format tanpa nol di depan (mis. 2008-1-2)
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+def tanggal_acuan(sekarang=None):
+    """Tanggal acuan perhitungan: `sekarang` (date/datetime) atau hari ini"""
+    if sekarang is None:
+        return date.today()
+    if isinstance(sekarang, datetime):
+        return sekarang.date()
+    return sekarang
+
+def selisih_bulan(awal, akhir):
+    """Jumlah bulan penuh dari awal sampai akhir (negatif bila akhir < awal)"""
+    bulan = (akhir.year - awal.year) * 12 + (akhir.month - awal.month)
+    # Tanggal awal yang tidak ada di bulan akhir (mis. 31) diperlakukan
+    # sebagai hari terakhir bulan tersebut
+    hari = min(awal.day, monthrange(akhir.year, akhir.month)[1])
+    if akhir >= awal and akhir.day < hari:
+        bulan -= 1
+    elif akhir < awal and akhir.day > hari:
+        bulan += 1
+    return bulan
+
+def ke_tahun_bulan(bulan):
+    tahun, sisa = divmod(abs(bulan), 12)
+    return (tahun, sisa) if bulan >= 0 else (-tahun, -sisa)
+
+def tanggal_pensiun(lahir):
+    """Tanggal lahir + USIA_PENSIUN tahun (29 Feb menjadi 28 Feb)"""
+    tahun = lahir.year + USIA_PENSIUN
+    return date(tahun, lahir.month, min(lahir.day, monthrange(tahun, lahir.month)[1]))
+
+def tanggal_pensiun_iso(tanggal_lahir):
+    """Tanggal pensiun 'YYYY-MM-DD' untuk kolom guru.tanggal_pensiun (None bila tidak ada)"""
+    lahir = parse_tanggal(tanggal_lahir)
+    return tanggal_pensiun(lahir).isoformat() if lahir else None
+
+def hitung_selisih_tahun_bulan(tanggal_awal, sekarang=None):
+    """Mengembalikan selisih (tahun, bulan) dari tanggal_awal sampai hari ini (atau `sekarang`)"""
+    # Menangani format data yang mungkin datang dari database (YYYY-MM-DD)
+    awal = parse_tanggal(tanggal_awal)
+    if awal is None:
         return (0, 0)
+    return ke_tahun_bulan(selisih_bulan(awal, tanggal_acuan(sekarang)))
 
-    sekarang = datetime.today()
-    r = relativedelta(sekarang, t_mulai)
-    return (r.years, r.months)
-
-def hitung_sisa_masa_kerja(tanggal_lahir):
+def hitung_sisa_masa_kerja(tanggal_lahir, sekarang=None):
     """
     Guru pensiun umur 60 tahun.
     Menghitung sisa masa kerja (tahun, bulan)
     """
-    if not tanggal_lahir:
-        return (0, 0)
-
-    try:
-        # Menangani format data yang mungkin datang dari database (YYYY-MM-DD)
-        lahir = datetime.strptime(str(tanggal_lahir), "%Y-%m-%d")
-    except:
+    lahir = parse_tanggal(tanggal_lahir)
+    if lahir is None:
         return (0, 0)
 
-    # Menentukan tanggal pensiun (60 tahun setelah tanggal lahir)
-    pensiun = lahir.replace(year=lahir.year + 60)
-    sekarang = datetime.today()
-
+    pensiun = tanggal_pensiun(lahir)
+    sekarang = tanggal_acuan(sekarang)
     if pensiun < sekarang:
         return (0, 0)
+    return ke_tahun_bulan(selisih_bulan(sekarang, pensiun))
 
-    r = relativedelta(pensiun, sekarang)
-    return (r.years, r.months)
-
-def hitung_usia(tanggal_lahir):
+def hitung_usia(tanggal_lahir, sekarang=None):
     """
     FUNGSI BARU: Mengembalikan usia (tahun, bulan) dari tanggal_lahir sampai hari ini
     """
-    if not tanggal_lahir:
-        return (0, 0)
+    return hitung_selisih_tahun_bulan(tanggal_lahir, sekarang)
 
+def hitung_kolom(values, fungsi, sekarang=None):
+    """
+    Versi batch: menerapkan fungsi (hitung_usia, hitung_selisih_tahun_bulan,
+    hitung_sisa_masa_kerja) ke satu kolom tanggal terhadap satu tanggal acuan.
+    Nilai yang sama hanya dihitung sekali. Mengembalikan list (tahun, bulan).
+    """
+    acuan = tanggal_acuan(sekarang)
+    cache = {}
+    hasil = []
+    for value in values:
+        if value not in cache:
+            cache[value] = fungsi(value, acuan)
+        hasil.append(cache[value])
+    return hasil
+
+# ---------- Instrumentasi (timing, metrics, profiler) ----------
+# Setiap statement SQL diukur di level koneksi (InstrumentedConnection), jadi
+# query_db, transaksi tulis, import dan streaming ikut tercatat. Per request
+# dicatat durasi total, jumlah & durasi query (header Server-Timing) dan
+# query yang berulang (pola N+1). Query SELECT yang lambat dicatat ke log
+# beserta EXPLAIN QUERY PLAN. Angka kumulatif per proses tersedia di /metrics
+# (format Prometheus); tiap worker gunicorn punya angkanya sendiri.
+SLOW_QUERY_MS_DEFAULT = 100
+SQL_REPEAT_WARN = 20            # query identik sebanyak ini dalam satu request -> peringatan
+SLOW_QUERY_KEEP = 50            # jumlah query lambat terakhir yang disimpan untuk /metrics/slow
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+log = logging.getLogger(__name__)
+
+_sql_local = threading.local()
+_metrics_lock = threading.Lock()
+_metrics = {
+    "http": {},          # (endpoint, method, status) -> jumlah
+    "http_durasi": {},   # endpoint -> [jumlah per bucket..., sum, count]
+    "sql": {},           # endpoint -> [jumlah query, total detik]
+    "sql_lambat": 0,
+}
+_slow_queries = deque(maxlen=SLOW_QUERY_KEEP)
+
+def rapikan_sql(sql):
+    return " ".join(sql.split())
+
+def slow_query_ms():
+    if has_app_context():
+        return current_app.config.get("SLOW_QUERY_MS", SLOW_QUERY_MS_DEFAULT)
+    return SLOW_QUERY_MS_DEFAULT
+
+def explain(conn, sql, args):
+    """EXPLAIN QUERY PLAN tanpa ikut diukur (memakai execute bawaan sqlite3)"""
     try:
-        lahir = datetime.strptime(str(tanggal_lahir), "%Y-%m-%d")
-    except:
-        return (0, 0)
+        rows = sqlite3.Connection.execute(conn, "EXPLAIN QUERY PLAN " + sql, args or ()).fetchall()
+    except sqlite3.Error as e:
+        return [f"(EXPLAIN gagal: {e})"]
+    return [row[3] for row in rows]
+
+def catat_query(conn, sql, args, detik):
+    """Mencatat satu statement: statistik request, metrics proses, log query lambat"""
+    teks = rapikan_sql(sql)
+    endpoint = (request.endpoint or "-") if has_request_context() else "-"
+    if has_request_context():
+        stat = g.setdefault("sql_stat", {"jumlah": 0, "detik": 0.0, "per_sql": {}})
+        stat["jumlah"] += 1
+        stat["detik"] += detik
+        stat["per_sql"][teks] = stat["per_sql"].get(teks, 0) + 1
+
+    lambat = detik * 1000 >= slow_query_ms()
+    with _metrics_lock:
+        total = _metrics["sql"].setdefault(endpoint, [0, 0.0])
+        total[0] += 1
+        total[1] += detik
+        if lambat:
+            _metrics["sql_lambat"] += 1
+
+    if lambat and teks.split(" ", 1)[0].upper() in ("SELECT", "WITH"):
+        plan = explain(conn, sql, args)
+        _slow_queries.append({
+            "waktu": datetime.now().isoformat(timespec="seconds"),
+            "endpoint": endpoint,
+            "ms": round(detik * 1000, 1),
+            "sql": teks,
+            "plan": plan,
+        })
+        log.warning("query lambat %.1f ms [%s]: %s\n  plan: %s",
+                    detik * 1000, endpoint, teks, " | ".join(plan))
+
+@contextmanager
+def ukur_query(conn, sql, args=()):
+    """Mengukur satu query; blok di dalamnya (mis. execute + fetchall) dihitung sekali"""
+    if getattr(_sql_local, "aktif", False):
+        yield
+        return
+    _sql_local.aktif = True
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _sql_local.aktif = False
+        catat_query(conn, sql, args, time.perf_counter() - t0)
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Koneksi sqlite3 yang mengukur execute/executemany"""
+
+    def execute(self, sql, parameters=()):
+        with ukur_query(self, sql, parameters):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        with ukur_query(self, sql):
+            return super().executemany(sql, seq_of_parameters)
+
+@main_bp.before_app_request
+def mulai_timer():
+    g.t_mulai = time.perf_counter()
+    # Dibuat di awal supaya query selama stream ikut masuk dict yang sama
+    g.sql_stat = {"jumlah": 0, "detik": 0.0, "per_sql": {}}
+
+def selesai_request(endpoint, method, status, t_mulai, stat):
+    """Mencatat satu request yang sudah selesai ke metrics proses"""
+    detik = time.perf_counter() - t_mulai
+    with _metrics_lock:
+        key = (endpoint, method, status)
+        _metrics["http"][key] = _metrics["http"].get(key, 0) + 1
+        hist = _metrics["http_durasi"].setdefault(endpoint, [0] * len(HTTP_BUCKETS) + [0.0, 0])
+        for i, batas in enumerate(HTTP_BUCKETS):
+            if detik <= batas:
+                hist[i] += 1
+        hist[-2] += detik
+        hist[-1] += 1
+
+    for teks, jumlah in stat["per_sql"].items():
+        if jumlah >= SQL_REPEAT_WARN:
+            log.warning("%s: query yang sama dijalankan %d kali (N+1?): %s", endpoint, jumlah, teks)
+
+@main_bp.after_app_request
+def catat_request(response):
+    t_mulai = g.pop("t_mulai", None)
+    if t_mulai is None:
+        return response
+    detik = time.perf_counter() - t_mulai
+    stat = g.sql_stat
+    args = (request.endpoint or "-", request.method, response.status_code, t_mulai, stat)
+    if response.is_streamed:
+        # Header terkirim sebelum isi stream dibuat, jadi Server-Timing hanya
+        # mencakup waktu sampai stream dimulai (diberi nama sendiri). Durasi
+        # dan query lengkap masuk /metrics setelah stream selesai dikirim.
+        response.call_on_close(lambda: selesai_request(*args))
+        app_nama, db_nama = "app-awal", "db-awal"
+    else:
+        selesai_request(*args)
+        app_nama, db_nama = "app", "db"
+
+    response.headers.add("Server-Timing", f"{app_nama};dur={detik * 1000:.1f}")
+    response.headers.add("Server-Timing",
+                         f'{db_nama};dur={stat["detik"] * 1000:.1f};desc="{stat["jumlah"]} query"')
+    return response
+
+def label(**labels):
+    """Label Prometheus: {a="1",b="2"} dengan escape backslash & kutip"""
+    def esc(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in labels.items()) + "}"
+
+def render_metrics():
+    """Snapshot metrics proses ini dalam format teks Prometheus"""
+    with _metrics_lock:
+        http = dict(_metrics["http"])
+        durasi = {k: list(v) for k, v in _metrics["http_durasi"].items()}
+        sql = {k: list(v) for k, v in _metrics["sql"].items()}
+        lambat = _metrics["sql_lambat"]
+
+    baris = ["# HELP sekolah_http_requests_total Jumlah request HTTP.",
+             "# TYPE sekolah_http_requests_total counter"]
+    for (endpoint, method, status), n in sorted(http.items()):
+        baris.append(f"sekolah_http_requests_total{label(endpoint=endpoint, method=method, status=status)} {n}")
+
+    baris += ["# HELP sekolah_http_request_duration_seconds Durasi request HTTP.",
+              "# TYPE sekolah_http_request_duration_seconds histogram"]
+    for endpoint, hist in sorted(durasi.items()):
+        for batas, n in zip(HTTP_BUCKETS, hist):
+            baris.append(f"sekolah_http_request_duration_seconds_bucket{label(endpoint=endpoint, le=batas)} {n}")
+        baris.append(f"sekolah_http_request_duration_seconds_bucket{label(endpoint=endpoint, le='+Inf')} {hist[-1]}")
+        baris.append(f"sekolah_http_request_duration_seconds_sum{label(endpoint=endpoint)} {hist[-2]:.6f}")
+        baris.append(f"sekolah_http_request_duration_seconds_count{label(endpoint=endpoint)} {hist[-1]}")
+
+    baris += ["# HELP sekolah_sql_queries_total Jumlah statement SQL per endpoint.",
+              "# TYPE sekolah_sql_queries_total counter"]
+    for endpoint, (n, _) in sorted(sql.items()):
+        baris.append(f"sekolah_sql_queries_total{label(endpoint=endpoint)} {n}")
+    baris += ["# HELP sekolah_sql_query_seconds_total Total waktu SQL per endpoint.",
+              "# TYPE sekolah_sql_query_seconds_total counter"]
+    for endpoint, (_, detik) in sorted(sql.items()):
+        baris.append(f"sekolah_sql_query_seconds_total{label(endpoint=endpoint)} {detik:.6f}")
+    baris += ["# HELP sekolah_sql_slow_queries_total Jumlah query di atas SLOW_QUERY_MS.",
+              "# TYPE sekolah_sql_slow_queries_total counter",
+              f"sekolah_sql_slow_queries_total {lambat}"]
+    return "\n".join(baris) + "\n"
+
+@main_bp.route("/metrics")
+def metrics():
+    if not current_app.config.get("METRICS_ENABLED", True):
+        abort(404)
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+@main_bp.route("/metrics/slow")
+def metrics_slow():
+    if not current_app.config.get("METRICS_ENABLED", True):
+        abort(404)
+    return jsonify(list(_slow_queries))
+
+class ProfilerToggle:
+    """
+    Middleware WSGI: request dengan parameter ?_profile dijalankan di bawah
+    cProfile dan dijawab dengan ringkasan pstats (teks) alih-alih halaman.
+    Hanya dipasang bila config PROFILER_ENABLED aktif.
+    """
 
-    sekarang = datetime.today()
-    r = relativedelta(sekarang, lahir)
-    return (r.years, r.months)
+    def __init__(self, wsgi_app, limit=40):
+        self.wsgi_app = wsgi_app
+        self.limit = limit
 
+    def __call__(self, environ, start_response):
+        if "_profile" not in parse_qs(environ.get("QUERY_STRING", ""), keep_blank_values=True):
+            return self.wsgi_app(environ, start_response)
 
-app = Flask(__name__)
-app.secret_key = "change_this_secret"
-#app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16 MB
-app.config['UPLOAD_FOLDER'] = 'static/uploads_siswa'
-app.config['UPLOAD_FOLDER_GURU'] = 'static/uploads_guru'
+        status = []
+        def tangkap(status_line, headers, exc_info=None):
+            status.append(status_line)
+            return lambda data: None
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            body = self.wsgi_app(environ, tangkap)
+            try:
+                ukuran = sum(len(chunk) for chunk in body)
+            finally:
+                if hasattr(body, "close"):
+                    body.close()
+        finally:
+            profiler.disable()
+
+        out = io.StringIO()
+        out.write(f"{environ.get('REQUEST_METHOD')} {environ.get('PATH_INFO')} -> "
+                  f"{status[0] if status else '?'} ({ukuran} byte)\n\n")
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(self.limit)
+        start_response("200 OK", [("Content-Type", "text/plain; charset=utf-8"),
+                                  ("Cache-Control", "no-store")])
+        return [out.getvalue().encode("utf-8")]
+
+# ---------- Multi sekolah (tenant) ----------
+# Setiap sekolah punya shard sendiri di TENANT_FOLDER/<sekolah>/: sekolah.db,
+# inventaris.db, uploads_siswa/, uploads_guru/ dan antrian_foto/. Sekolah
+# dipilih lewat prefix URL /s/<sekolah>/ (dipindah ke SCRIPT_NAME sehingga
+# semua url_for ikut membawa prefix) atau header TENANT_HEADER. Semua state
+# per proses (koneksi, cache halaman & dashboard, skema, worker foto) sudah
+# dikunci per path database, jadi tiap sekolah otomatis punya cache sendiri
+# dan penulis di satu sekolah tidak pernah mengunci sekolah lain. Tanpa
+# tenant dipakai config DATABASE / UPLOAD_FOLDER (mode satu sekolah).
+TENANT_PREFIX = "/s"
+TENANT_ENVIRON_KEY = "sekolah.tenant"
+TENANT_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,39}$")
+# Config yang lokasinya pindah ke dalam folder shard
+TENANT_FILES = {
+    "DATABASE": "sekolah.db",
+    "INVENTARIS_DATABASE": "inventaris.db",
+    "UPLOAD_FOLDER": "uploads_siswa",
+    "UPLOAD_FOLDER_GURU": "uploads_guru",
+    "FOTO_ANTRIAN_FOLDER": "antrian_foto",
+    "BACKUP_FOLDER": "backups",
+}
+TENANT_DIRS = ("UPLOAD_FOLDER", "UPLOAD_FOLDER_GURU", "FOTO_ANTRIAN_FOLDER")
+
+class TenantMiddleware:
+    """WSGI: /s/<sekolah>/path -> SCRIPT_NAME .../s/<sekolah>, PATH_INFO /path"""
+
+    def __init__(self, wsgi_app, header=None):
+        self.wsgi_app = wsgi_app
+        self.header = "HTTP_" + header.upper().replace("-", "_") if header else None
+
+    def __call__(self, environ, start_response):
+        parts = environ.get("PATH_INFO", "").split("/", 3)
+        if len(parts) >= 3 and "/" + parts[1] == TENANT_PREFIX and TENANT_RE.match(parts[2]):
+            environ[TENANT_ENVIRON_KEY] = parts[2]
+            environ["SCRIPT_NAME"] = f"{environ.get('SCRIPT_NAME', '')}{TENANT_PREFIX}/{parts[2]}"
+            environ["PATH_INFO"] = "/" + (parts[3] if len(parts) > 3 else "")
+        elif self.header and TENANT_RE.match(environ.get(self.header, "")):
+            environ[TENANT_ENVIRON_KEY] = environ[self.header]
+        return self.wsgi_app(environ, start_response)
+
+def tenant_aktif():
+    """Id sekolah konteks ini, atau None (database bawaan)"""
+    if not has_app_context():
+        return None
+    if "tenant" not in g:
+        g.tenant = request.environ.get(TENANT_ENVIRON_KEY) if has_request_context() else None
+    return g.tenant
+
+def daftar_tenant():
+    folder = current_app.config["TENANT_FOLDER"]
+    if not folder or not os.path.isdir(folder):
+        return []
+    return sorted(name for name in os.listdir(folder)
+                  if TENANT_RE.match(name) and os.path.isdir(os.path.join(folder, name)))
+
+def lokasi(key):
+    """Path config `key` (DATABASE, UPLOAD_FOLDER, ...) untuk sekolah aktif"""
+    tenant = tenant_aktif()
+    if tenant is None:
+        return current_app.config[key]
+    return os.path.join(current_app.config["TENANT_FOLDER"], tenant, TENANT_FILES[key])
+
+@contextmanager
+def konteks_tenant(app, tenant):
+    """App context atas nama satu sekolah (thread latar belakang, CLI, fan-out)"""
+    with app.app_context():
+        g.tenant = tenant
+        yield
+
+_tenant_siap = set()   # (folder, tenant) yang foldernya sudah diperiksa proses ini
+
+@main_bp.before_app_request
+def cek_tenant():
+    """Sekolah yang tidak terdaftar -> 404; folder upload shard dibuat bila belum ada"""
+    tenant = tenant_aktif()
+    if tenant is None:
+        return
+    folder = current_app.config["TENANT_FOLDER"]
+    if (folder, tenant) in _tenant_siap:
+        return
+    if not folder or not os.path.isdir(os.path.join(folder, tenant)):
+        abort(404)
+    for key in TENANT_DIRS:
+        os.makedirs(lokasi(key), exist_ok=True)
+    _tenant_siap.add((folder, tenant))
 
 # ---------- DB helpers ----------
-def get_db():
-    conn = sqlite3.connect(DB_PATH, timeout=5)
+# Satu koneksi per worker thread, dipakai ulang antar request. Biaya connect +
+# PRAGMA hanya dibayar sekali per thread, bukan di setiap query.
+DB_BUSY_TIMEOUT_MS = 5000
+DB_MMAP_SIZE = 64 * 1024 * 1024  # 64 MB
+
+_db_local = threading.local()
+
+def db_path():
+    """Path database milik sekolah aktif (config DATABASE atau shard tenant)"""
+    return lokasi("DATABASE")
+
+def connect_db(path=None):
+    """Membuka koneksi baru dengan PRAGMA yang sesuai untuk banyak worker"""
+    # isolation_level=None -> autocommit; transaksi tulis dibuka eksplisit
+    # lewat transaction() supaya pembacaan tidak pernah memicu commit.
+    conn = sqlite3.connect(path or db_path(), timeout=DB_BUSY_TIMEOUT_MS / 1000,
+                           isolation_level=None, check_same_thread=False,
+                           factory=InstrumentedConnection)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA mmap_size={DB_MMAP_SIZE}")
+    conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
-def query_db(query, args=(), one=False):
+def get_db():
+    """Koneksi milik thread ini (dibuat sekali, dipakai ulang antar request)"""
+    path = db_path()
+    # Setelah fork (gunicorn) koneksi milik proses induk tidak boleh dipakai
+    if getattr(_db_local, "pid", None) != os.getpid():
+        _db_local.conns = {}
+        _db_local.pid = os.getpid()
+    # Satu koneksi per file database (beberapa instance app bisa berbeda DB)
+    conn = _db_local.conns.get(path)
+    if conn is None:
+        conn = _db_local.conns[path] = connect_db(path)
+    g.db = conn
+    return conn
+
+def close_db():
+    """Menutup koneksi thread ini (mis. sebelum backup atau saat shutdown)"""
+    conns = getattr(_db_local, "conns", None) or {}
+    for conn in conns.values():
+        conn.close()
+    conns.clear()
+
+@contextmanager
+def transaction():
+    """
+    Transaksi tulis eksplisit (BEGIN IMMEDIATE ... COMMIT).
+    Kunci tulis diambil di awal sehingga tidak ada upgrade lock di tengah
+    transaksi yang berujung "database is locked". Bisa bersarang: blok
+    dalam ikut transaksi luar.
+    """
     conn = get_db()
-    cur = conn.execute(query, args)
-    rv = cur.fetchall()
-    conn.commit()
-    conn.close()
-    return (rv[0] if rv else None) if one else rv
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
 
-# ---------- Init DB ----------
-def init_db():
+def query_db(query, args=(), one=False):
+    """Query baca; tidak membuka transaksi dan tidak commit"""
     conn = get_db()
-    c = conn.cursor()
+    # Waktu fetchall ikut dihitung sebagai bagian dari query yang sama
+    with ukur_query(conn, query, args):
+        cur = conn.execute(query, args)
+        rv = cur.fetchall()
+    cur.close()
+    return (rv[0] if rv else None) if one else rv
 
+def execute_db(query, args=()):
+    """Query tulis dalam transaksi; mengembalikan lastrowid"""
+    with transaction() as conn:
+        cur = conn.execute(query, args)
+        return cur.lastrowid
+
+def teardown_db(exc):
+    # Koneksi tetap hidup untuk request berikutnya; hanya pastikan tidak ada
+    # transaksi yang tertinggal (mis. karena exception di tengah view).
+    conn = g.pop("db", None)
+    if conn is not None and conn.in_transaction:
+        conn.execute("ROLLBACK")
+
+# ---------- Init DB (migrasi skema) ----------
+# Versi skema disimpan di PRAGMA user_version. Setiap migrasi dijalankan
+# berurutan, masing-masing dalam satu transaksi, dan hanya sekali. Skema tidak
+# lagi disentuh saat modul di-import maupun saat request: init_db() dipanggil
+# oleh `flask init-db` (lihat pastikan_skema).
+# Kolom yang diindex full-text, berikut bobot bm25 (kolom pertama paling penting)
+FTS_COLUMNS = {
+    "siswa": ("nama", "kelas", "jurusan", "alamat", "asal_sekolah", "tempat_lahir"),
+    "guru": ("nama", "nip", "nuptk", "jabatan"),
+}
+FTS_WEIGHTS = {
+    "siswa": (10.0, 2.0, 2.0, 1.0, 1.0, 1.0),
+    "guru": (10.0, 5.0, 5.0, 2.0),
+}
+
+# Tabel referensi (lookup) beserta isi awalnya
+LOOKUP_TABLES = {
+    "kelas": ("X", "XI", "XII"),
+    "jurusan": ("NKPI", "TKJ", "AT", "ATU", "TKR", "ATPH"),
+}
+
+# Kolom tanggal disimpan sebagai teks ISO 'YYYY-MM-DD' dan dijaga CHECK
+DATE_COLUMNS = {
+    "siswa": ("tanggal_lahir",),
+    "guru": ("tanggal_lahir", "sk_pertama", "sk_terakhir", "tanggal_pensiun"),
+}
+
+# Tabel yang perubahannya dicatat di data_versi (ETag / cache halaman)
+VERSI_TABLES = ("siswa", "guru")
+
+MIGRATIONS = []
+
+def migration(versi):
+    """Mendaftarkan fungsi migrasi untuk versi skema `versi`"""
+    def decorator(fn):
+        MIGRATIONS.append((versi, fn))
+        return fn
+    return decorator
+
+def kolom_tanggal(name):
+    return f"{name} TEXT CHECK ({name} IS NULL OR {name} IS date({name}))"
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def latest_version():
+    return max(versi for versi, _ in MIGRATIONS)
+
+def init_db(path=None):
+    """
+    Menjalankan migrasi yang belum diterapkan. Aman dipanggil berulang dan dari
+    beberapa worker sekaligus: versi dibaca ulang setelah kunci tulis diambil.
+    Mengembalikan daftar versi yang baru diterapkan.
+    """
+    conn = connect_db(path)
+    diterapkan = []
+    try:
+        for versi, fn in sorted(MIGRATIONS):
+            if schema_version(conn) >= versi:
+                continue
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if schema_version(conn) < versi:
+                    fn(conn.cursor())
+                    conn.execute(f"PRAGMA user_version = {int(versi)}")
+                    diterapkan.append(versi)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        # Index unik yang ditunda migrasi 3 dicoba lagi (lihat pasang_index_unik_guru)
+        if schema_version(conn) >= 3 and index_unik_tertunda(conn):
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                pasang_index_unik_guru(conn.cursor())
+    finally:
+        conn.close()
+    return diterapkan
+
+@migration(1)
+def migrasi_skema_dasar(c):
+    """Skema awal (sama dengan yang dulu dibuat init_db saat import modul)"""
     # Tabel Siswa
     c.execute("""CREATE TABLE IF NOT EXISTS siswa (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -134,188 +712,1941 @@ def init_db():
                     mk_total_bulan INTEGER,
                     sisa_mk_tahun INTEGER,
                     sisa_mk_bulan INTEGER,
-                    foto TEXT
+                    foto TEXT,
+                    tanggal_pensiun TEXT
+                )""")
+
+    # Kolom tanggal_pensiun (database lama belum punya): diisi sekali dari tanggal_lahir
+    guru_cols = {r[1] for r in c.execute("PRAGMA table_info(guru)")}
+    if "tanggal_pensiun" not in guru_cols:
+        c.execute("ALTER TABLE guru ADD COLUMN tanggal_pensiun TEXT")
+        rows = c.execute("SELECT id, tanggal_lahir FROM guru").fetchall()
+        c.executemany("UPDATE guru SET tanggal_pensiun=? WHERE id=?",
+                      [(tanggal_pensiun_iso(r["tanggal_lahir"]), r["id"]) for r in rows])
+
+    # Catatan internal aplikasi (mis. tanggal terakhir refresh kolom turunan)
+    c.execute("""CREATE TABLE IF NOT EXISTS app_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )""")
+
+    # Index full-text (FTS5) untuk pencarian siswa dan guru
+    for table, columns in FTS_COLUMNS.items():
+        init_fts(c, table, columns)
+
+@migration(2)
+def migrasi_lookup_kelas_jurusan(c):
+    """Tabel referensi kelas & jurusan, diisi dari nilai bawaan dan data siswa"""
+    for table, bawaan in LOOKUP_TABLES.items():
+        c.execute(f"""CREATE TABLE IF NOT EXISTS {table} (
+                        id INTEGER PRIMARY KEY,
+                        nama TEXT NOT NULL UNIQUE
+                    )""")
+        c.executemany(f"INSERT OR IGNORE INTO {table} (nama) VALUES (?)",
+                      [(nama,) for nama in bawaan])
+        # Nilai kosong diseragamkan menjadi NULL sebelum dijadikan foreign key
+        c.execute(f"UPDATE siswa SET {table} = NULLIF(TRIM({table}), '')")
+        c.execute(f"""INSERT OR IGNORE INTO {table} (nama)
+                      SELECT DISTINCT {table} FROM siswa
+                      WHERE {table} IS NOT NULL ORDER BY {table}""")
+
+def bangun_ulang_tabel(c, table, ddl):
+    """
+    Membuat ulang tabel dengan definisi kolom `ddl` (cara resmi SQLite untuk
+    menambah CHECK / foreign key). Tanggal dinormalisasi ke ISO, teks kosong
+    pada kolom tanggal menjadi NULL. id dipertahankan sehingga index FTS tetap
+    cocok; index & trigger dibuat ulang oleh pemanggil.
+    """
+    rows = c.execute(f"SELECT * FROM {table}").fetchall()
+    columns = rows[0].keys() if rows else None
+    data = []
+    for r in rows:
+        row = dict(r)
+        for col in DATE_COLUMNS[table]:
+            try:
+                row[col] = normalisasi_tanggal(row[col])
+            except ValueError:
+                current_app.logger.warning("%s id=%s: %s tidak valid (%r), dikosongkan",
+                                   table, row["id"], col, row[col])
+                row[col] = None
+        data.append(tuple(row[col] for col in columns))
+
+    c.execute(f"CREATE TABLE {table}_baru ({ddl})")
+    if data:
+        placeholders = ", ".join("?" for _ in columns)
+        c.executemany(f"INSERT INTO {table}_baru ({', '.join(columns)}) VALUES ({placeholders})",
+                      data)
+    c.execute(f"DROP TABLE {table}")
+    c.execute(f"ALTER TABLE {table}_baru RENAME TO {table}")
+
+@migration(3)
+def migrasi_tanggal_dan_index(c):
+    """Kolom tanggal bertipe (CHECK ISO), FK ke kelas/jurusan, index filter & unik"""
+    # NIP/NUPTK kosong atau isian pengganti ('-', '0', ...) menjadi NULL
+    # supaya tidak bentrok di index unik
+    for r in c.execute("SELECT id, nip, nuptk FROM guru").fetchall():
+        nip, nuptk = normalisasi_nomor_induk(r["nip"]), normalisasi_nomor_induk(r["nuptk"])
+        if (nip, nuptk) != (r["nip"], r["nuptk"]):
+            c.execute("UPDATE guru SET nip = ?, nuptk = ? WHERE id = ?", (nip, nuptk, r["id"]))
+
+    bangun_ulang_tabel(c, "siswa", f"""
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nama TEXT,
+                    kelas TEXT REFERENCES kelas (nama) ON UPDATE CASCADE,
+                    jurusan TEXT REFERENCES jurusan (nama) ON UPDATE CASCADE,
+                    tempat_lahir TEXT,
+                    {kolom_tanggal('tanggal_lahir')},
+                    asal_sekolah TEXT,
+                    usia_tahun INTEGER,
+                    usia_bulan INTEGER,
+                    alamat TEXT,
+                    foto TEXT""")
+    bangun_ulang_tabel(c, "guru", f"""
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nama TEXT,
+                    nip TEXT,
+                    tempat_lahir TEXT,
+                    {kolom_tanggal('tanggal_lahir')},
+                    agama TEXT,
+                    jabatan TEXT,
+                    nuptk TEXT,
+                    {kolom_tanggal('sk_pertama')},
+                    {kolom_tanggal('sk_terakhir')},
+                    pendidikan TEXT,
+                    mk_gol_tahun INTEGER,
+                    mk_gol_bulan INTEGER,
+                    mk_total_tahun INTEGER,
+                    mk_total_bulan INTEGER,
+                    sisa_mk_tahun INTEGER,
+                    sisa_mk_bulan INTEGER,
+                    foto TEXT,
+                    {kolom_tanggal('tanggal_pensiun')}""")
+
+    # Index untuk paginasi keyset (urut nama, lalu id)
+    c.execute("CREATE INDEX idx_siswa_nama ON siswa (IFNULL(nama, ''), id)")
+    c.execute("CREATE INDEX idx_guru_nama ON guru (IFNULL(nama, ''), id)")
+
+    # Index filter siswa (API ?kelas= / ?jurusan=, statistik dashboard)
+    c.execute("CREATE INDEX idx_siswa_kelas ON siswa (kelas)")
+    c.execute("CREATE INDEX idx_siswa_jurusan ON siswa (jurusan, kelas)")
+
+    # NIP & NUPTK unik (NULL boleh lebih dari satu); ditunda bila ada yang ganda
+    pasang_index_unik_guru(c)
+
+    # Index kolom tanggal untuk laporan pensiun / masa kerja
+    c.execute("CREATE INDEX idx_guru_pensiun ON guru (tanggal_pensiun)")
+    c.execute("CREATE INDEX idx_guru_tanggal_lahir ON guru (tanggal_lahir)")
+    c.execute("CREATE INDEX idx_guru_sk_pertama ON guru (sk_pertama)")
+
+    # Index foto untuk menghitung rujukan sebelum file foto dihapus
+    c.execute("CREATE INDEX idx_siswa_foto ON siswa (foto)")
+    c.execute("CREATE INDEX idx_guru_foto ON guru (foto)")
+
+    # Kelas/jurusan baru otomatis masuk tabel referensi
+    for col in LOOKUP_TABLES:
+        for suffix, event in (("ai", "INSERT"), ("au", f"UPDATE OF {col}")):
+            c.execute(f"""CREATE TRIGGER siswa_{col}_{suffix} BEFORE {event} ON siswa
+                          WHEN new.{col} IS NOT NULL BEGIN
+                            INSERT OR IGNORE INTO {col} (nama) VALUES (new.{col});
+                          END""")
+
+    # Trigger FTS ikut terhapus bersama tabel lama
+    for table, columns in FTS_COLUMNS.items():
+        init_fts(c, table, columns)
+
+# Index unik NIP/NUPTK. Data lama bisa berisi nomor ganda (salah ketik,
+# satu guru tercatat dua kali); migrasi tidak dibatalkan karenanya. Index
+# kolom yang masih ganda ditunda dan dicatat di log, lalu dicoba lagi oleh
+# setiap `flask init-db` sampai datanya dibereskan.
+INDEX_UNIK_GURU = ("nip", "nuptk")
+
+def nomor_induk_ganda(c, col):
+    return c.execute(f"""SELECT {col}, COUNT(*) FROM guru WHERE {col} IS NOT NULL
+                         GROUP BY {col} HAVING COUNT(*) > 1""").fetchall()
+
+def index_unik_tertunda(c):
+    """Kolom INDEX_UNIK_GURU yang index unik-nya belum terpasang"""
+    ada = {r[0] for r in c.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    return [col for col in INDEX_UNIK_GURU if f"idx_guru_{col}" not in ada]
+
+def pasang_index_unik_guru(c):
+    """Membuat index unik yang belum ada; mengembalikan {kolom: [(nilai, jumlah)]} yang ditunda"""
+    ditunda = {}
+    for col in index_unik_tertunda(c):
+        dup = nomor_induk_ganda(c, col)
+        if dup:
+            log.warning("index unik %s ditunda, nilai ganda: %s", col.upper(),
+                        ", ".join(f"{r[0]} ({r[1]}x)" for r in dup))
+            ditunda[col] = [tuple(r) for r in dup]
+        else:
+            c.execute(f"CREATE UNIQUE INDEX idx_guru_{col} ON guru ({col})")
+    return ditunda
+
+@migration(4)
+def migrasi_pindah_inventory(c):
+    """Tabel inventory (dari init_db.py) dipindah ke inventaris.db tersendiri"""
+    if not c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='inventory'").fetchone():
+        return
+    rows = c.execute("SELECT id, item_name, quantity FROM inventory").fetchall()
+    inv = sqlite3.connect(lokasi("INVENTARIS_DATABASE"))
+    try:
+        with inv:
+            inv.execute("""CREATE TABLE IF NOT EXISTS inventory (
+                            id INTEGER PRIMARY KEY,
+                            item_name TEXT NOT NULL,
+                            quantity INTEGER NOT NULL
+                        )""")
+            inv.executemany("INSERT OR IGNORE INTO inventory (id, item_name, quantity) VALUES (?, ?, ?)",
+                            [tuple(r) for r in rows])
+    finally:
+        inv.close()
+    c.execute("DROP TABLE inventory")
+
+@migration(5)
+def migrasi_versi_data(c):
+    """Penghitung versi per tabel (dasar ETag), dinaikkan trigger di setiap perubahan"""
+    c.execute("""CREATE TABLE data_versi (
+                    tabel TEXT PRIMARY KEY,
+                    versi INTEGER NOT NULL DEFAULT 0,
+                    diubah INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
                 )""")
+    for table in VERSI_TABLES:
+        c.execute("INSERT INTO data_versi (tabel) VALUES (?)", (table,))
+        for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE")):
+            c.execute(f"""CREATE TRIGGER {table}_versi_{suffix} AFTER {event} ON {table} BEGIN
+                            UPDATE data_versi
+                            SET versi = versi + 1, diubah = CAST(strftime('%s', 'now') AS INTEGER)
+                            WHERE tabel = '{table}';
+                          END""")
+
+@migration(6)
+def migrasi_foto_job(c):
+    """Antrian pemrosesan foto upload (lihat jadwalkan_foto)"""
+    c.execute("""CREATE TABLE foto_job (
+                    id INTEGER PRIMARY KEY,
+                    kind TEXT NOT NULL CHECK (kind IN ('siswa', 'guru')),
+                    row_id INTEGER NOT NULL,
+                    upload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'antri'
+                        CHECK (status IN ('antri', 'proses', 'selesai', 'gagal', 'batal')),
+                    percobaan INTEGER NOT NULL DEFAULT 0,
+                    foto TEXT,
+                    pesan TEXT,
+                    dibuat INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                    diambil INTEGER,
+                    selesai INTEGER
+                )""")
+    c.execute("CREATE INDEX idx_foto_job_status ON foto_job (status, id)")
+    c.execute("CREATE INDEX idx_foto_job_row ON foto_job (kind, row_id, id)")
 
-    conn.commit()
-    conn.close()
+def json_baris_sql(c, table, alias):
+    """Ekspresi json_object(...) berisi semua kolom `table` lewat `alias`"""
+    columns = [r[1] for r in c.execute(f"PRAGMA table_info({table})")]
+    return "json_object(" + ", ".join(f"'{col}', {alias}.{col}" for col in columns) + ")"
 
-init_db()
+def buat_trigger_perubahan(c, table):
+    """
+    (Re)create trigger log perubahan untuk `table`. Isi baris disimpan
+    sebagai JSON dari semua kolom saat trigger dibuat; migrasi yang
+    mengubah kolom harus memanggil fungsi ini lagi.
+    """
+    columns = [r[1] for r in c.execute(f"PRAGMA table_info({table})")]
+    data_sql = json_baris_sql(c, table, "new")
+    berubah_sql = " OR ".join(f"old.{col} IS NOT new.{col}" for col in columns)
+    for suffix in ("ai", "au", "ad"):
+        c.execute(f"DROP TRIGGER IF EXISTS {table}_log_{suffix}")
+    c.execute(f"""CREATE TRIGGER {table}_log_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO perubahan (tabel, row_id, op, data)
+                    VALUES ('{table}', new.id, 'I', {data_sql});
+                  END""")
+    # UPDATE yang tidak mengubah nilai apa pun tidak dicatat
+    c.execute(f"""CREATE TRIGGER {table}_log_au AFTER UPDATE ON {table} WHEN {berubah_sql} BEGIN
+                    INSERT INTO perubahan (tabel, row_id, op, data)
+                    VALUES ('{table}', new.id, 'U', {data_sql});
+                  END""")
+    c.execute(f"""CREATE TRIGGER {table}_log_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO perubahan (tabel, row_id, op) VALUES ('{table}', old.id, 'D');
+                  END""")
+
+@migration(7)
+def migrasi_log_perubahan(c):
+    """Log perubahan append-only (change data capture) untuk sinkronisasi inkremental"""
+    # AUTOINCREMENT: nomor urut tidak pernah dipakai ulang walau log dipadatkan
+    c.execute("""CREATE TABLE perubahan (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tabel TEXT NOT NULL,
+                    row_id INTEGER NOT NULL,
+                    op TEXT NOT NULL CHECK (op IN ('I', 'U', 'D')),
+                    data TEXT,
+                    waktu INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+                )""")
+    c.execute("CREATE INDEX idx_perubahan_row ON perubahan (tabel, row_id, seq)")
+    for table in VERSI_TABLES:
+        buat_trigger_perubahan(c, table)
+        # Isi awal: setiap baris yang ada tercatat sebagai INSERT, sehingga
+        # since=0 selalu menghasilkan salinan lengkap
+        c.execute(f"""INSERT INTO perubahan (tabel, row_id, op, data)
+                      SELECT '{table}', t.id, 'I', {json_baris_sql(c, table, "t")} FROM {table} t
+                      ORDER BY t.id""")
+
+def init_fts(c, table, columns):
+    """
+    Membuat tabel FTS5 external-content untuk table beserta trigger
+    sinkronisasinya. Index diisi ulang (rebuild) saat pertama kali dibuat.
+    """
+    fts = f"{table}_fts"
+    exists = c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                       (fts,)).fetchone()
+    cols = ", ".join(columns)
+    new_cols = ", ".join(f"new.{col}" for col in columns)
+    old_cols = ", ".join(f"old.{col}" for col in columns)
+
+    c.execute(f"""CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                    {cols},
+                    content='{table}', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3'
+                )""")
+    c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new_cols});
+                END""")
+    c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                END""")
+    c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN
+                    INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                    INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new_cols});
+                END""")
+    if not exists:
+        c.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+# Request tidak pernah menjalankan migrasi: migrasi bisa lama (membangun
+# ulang tabel) dan bergantung pada isi data, jadi dijalankan eksplisit lewat
+# `flask init-db` (atau `flask sekolah migrasi`) saat deploy. Request ke
+# database yang skemanya tertinggal dijawab 503 dengan petunjuk itu.
+_skema_siap = set()   # path database yang skemanya sudah diperiksa proses ini
+
+class SkemaUsang(Exception):
+    pass
+
+@main_bp.app_errorhandler(SkemaUsang)
+def skema_usang(e):
+    return Response(f"{e}\n", status=503, mimetype="text/plain")
+
+@main_bp.before_app_request
+def pastikan_skema():
+    """Menolak request bila skema database belum versi terbaru"""
+    path = db_path()
+    if path in _skema_siap:
+        return
+    versi = schema_version(get_db())
+    if versi < latest_version():
+        perintah = "flask sekolah migrasi" if current_app.config["TENANT_FOLDER"] else "flask init-db"
+        log.error("skema %s versi %s, butuh %s", path, versi, latest_version())
+        raise SkemaUsang(f"Skema database belum diperbarui (versi {versi}, "
+                         f"aplikasi butuh versi {latest_version()}). Jalankan `{perintah}`.")
+    _skema_siap.add(path)
+
+def cetak_index_ditunda(conn):
+    for col in index_unik_tertunda(conn):
+        daftar = ", ".join(f"{r[0]} ({r[1]}x)" for r in nomor_induk_ganda(conn, col))
+        print(f"Index unik {col.upper()} ditunda, nilai ganda: {daftar}")
+
+@main_bp.cli.command("init-db")
+@click.option("--status", is_flag=True, help="Hanya tampilkan versi skema.")
+def init_db_command(status):
+    """Membuat / memperbarui skema database ke versi terbaru."""
+    if not status:
+        diterapkan = init_db()
+        if diterapkan:
+            print(f"Migrasi diterapkan: {', '.join(map(str, diterapkan))}")
+        else:
+            print("Skema sudah versi terbaru.")
+    conn = connect_db()
+    try:
+        if status:
+            print(f"Versi skema: {schema_version(conn)} (terbaru: {latest_version()})")
+        if schema_version(conn) >= 3:
+            cetak_index_ditunda(conn)
+    finally:
+        conn.close()
 
 # ---------- Utils ----------
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXT
 
+def form_teks(name):
+    """Nilai teks dari form; isian kosong disimpan sebagai NULL"""
+    return (request.form.get(name) or "").strip() or None
+
+def form_tanggal(*names):
+    """Nilai tanggal dari form dalam format ISO YYYY-MM-DD (ValueError bila tidak valid)"""
+    return [normalisasi_tanggal(request.form.get(name)) for name in names]
+
+def get_lookup(table):
+    """Isi tabel referensi kelas / jurusan untuk pilihan di form"""
+    return [r["nama"] for r in query_db(f"SELECT nama FROM {table} ORDER BY id")]
+
+# ---------- Foto & thumbnail ----------
+# Foto disimpan berdasarkan hash isinya (content-addressed):
+#     <folder>/ab/cd/abcd...ef.jpg
+# Upload yang isinya sama menghasilkan nama yang sama (deduplikasi), dua file
+# berbeda tidak bisa saling menimpa, dan isi sebuah URL tidak pernah berubah
+# sehingga bisa di-cache selamanya oleh browser/CDN. File hanya dihapus bila
+# sudah tidak dirujuk baris mana pun (reference counting lewat kolom foto).
+#
+# Foto disimpan dengan sisi terpanjang maksimal FOTO_MAX_PX dan dibuatkan
+# thumbnail untuk setiap ukuran di THUMB_SIZES di folder thumbs/<ukuran>/.
+# Foto lama (nama file biasa, sebelum penyimpanan hash) tetap didukung dan
+# thumbnail-nya dibuat saat pertama diminta.
+FOTO_MAX_PX = 1600
+FOTO_JPEG_QUALITY = 85
+FOTO_HASH_LEN = 32
+FOTO_CHUNK_SIZE = 64 * 1024
+FOTO_EXT_BY_FORMAT = {"JPEG": "jpg", "PNG": "png", "GIF": "gif"}
+FOTO_CAS_RE = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{%d}\.[a-z]{3,4}$" % FOTO_HASH_LEN)
+THUMB_SIZES = (80, 160, 320)
+THUMB_QUALITY = 80
+THUMB_MAX_AGE = 60 * 60            # foto lama: isi bisa berubah
+FOTO_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+def foto_dirs():
+    return {"siswa": lokasi("UPLOAD_FOLDER"),
+            "guru": lokasi("UPLOAD_FOLDER_GURU")}
+
+def foto_valid(filename):
+    """Nama foto yang sah: path hash, atau nama file lama yang sudah aman"""
+    return bool(FOTO_CAS_RE.match(filename)) or filename == secure_filename(filename)
+
+def thumb_format():
+    """WebP bila Pillow mendukungnya, selain itu JPEG"""
+    from PIL import features
+    return ("webp", "WEBP") if features.check("webp") else ("jpg", "JPEG")
+
+def thumb_path(folder, filename, size):
+    ext, _ = thumb_format()
+    return os.path.join(folder, "thumbs", str(size), f"{filename}.{ext}")
+
+def tulis_atomik(path, write):
+    """
+    Memanggil write(fileobj) ke file sementara di folder tujuan lalu rename,
+    supaya pembaca tidak pernah melihat file setengah jadi.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def buat_thumbnail(folder, filename, size, img=None):
+    """Membuat (jika belum ada) thumbnail foto; mengembalikan path-nya atau None"""
+    path = thumb_path(folder, filename, size)
+    if os.path.exists(path):
+        return path
+    from PIL import Image, ImageOps
+    _, fmt = thumb_format()
+    try:
+        if img is None:
+            with Image.open(os.path.join(folder, filename)) as src:
+                return buat_thumbnail(folder, filename, size, ImageOps.exif_transpose(src))
+        thumb = img.convert("RGB")
+        thumb.thumbnail((size, size), Image.LANCZOS)
+        tulis_atomik(path, lambda f: thumb.save(f, fmt, quality=THUMB_QUALITY))
+    except (OSError, ValueError):
+        return None
+    return path
+
+def hash_upload(stream):
+    """Hash isi upload (dibaca per potongan, tidak dimuat utuh ke memori)"""
+    h = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(FOTO_CHUNK_SIZE), b""):
+        h.update(chunk)
+    stream.seek(0)
+    return h.hexdigest()[:FOTO_HASH_LEN]
+
+def simpan_foto(foto_file, kind):
+    """
+    Menyimpan foto upload ke penyimpanan hash milik `kind` (siswa/guru).
+    Jika isi yang sama sudah pernah disimpan, file yang ada dipakai ulang.
+    Foto diperkecil bila melebihi FOTO_MAX_PX (orientasi EXIF diterapkan)
+    lalu semua thumbnail dibuat. Mengembalikan nama foto (path relatif
+    untuk kolom foto) atau None jika tidak ada file yang valid.
+    """
+    if not (foto_file and foto_file.filename != "" and allowed_file(foto_file.filename)):
+        return None
+    folder = foto_dirs()[kind]
+    digest = hash_upload(foto_file.stream)
+    ext = foto_file.filename.rsplit(".", 1)[1].lower()
+
+    try:
+        from PIL import Image, ImageOps
+        src = Image.open(foto_file.stream)
+    except ImportError:
+        src = None
+    except OSError:
+        # Bukan gambar yang bisa dibaca Pillow: disimpan apa adanya
+        foto_file.stream.seek(0)
+        src = None
+    if src is not None:
+        ext = FOTO_EXT_BY_FORMAT.get(src.format, ext)
+
+    filename = f"{digest[:2]}/{digest[2:4]}/{digest}.{ext}"
+    path = os.path.join(folder, filename)
+    if os.path.exists(path):
+        if src is not None:
+            src.close()
+        return filename
+
+    if src is None:
+        tulis_atomik(path, lambda f: shutil.copyfileobj(foto_file.stream, f))
+        return filename
+
+    with src:
+        if getattr(src, "is_animated", False) or src.format not in FOTO_EXT_BY_FORMAT:
+            foto_file.stream.seek(0)
+            tulis_atomik(path, lambda f: shutil.copyfileobj(foto_file.stream, f))
+            return filename
+        img = ImageOps.exif_transpose(src)
+        if max(img.size) > FOTO_MAX_PX:
+            img.thumbnail((FOTO_MAX_PX, FOTO_MAX_PX), Image.LANCZOS)
+        for size in THUMB_SIZES:
+            buat_thumbnail(folder, filename, size, img)
+        if src.format == "JPEG":
+            tulis_atomik(path, lambda f: img.convert("RGB").save(
+                f, "JPEG", quality=FOTO_JPEG_QUALITY, optimize=True))
+        else:
+            tulis_atomik(path, lambda f: img.save(f, src.format, optimize=True))
+    return filename
+
+def hapus_thumbnail(folder, filename):
+    for size in THUMB_SIZES:
+        try:
+            os.remove(thumb_path(folder, filename, size))
+        except (OSError, ImportError):
+            pass
+
+def hapus_foto(kind, filename):
+    """
+    Menghapus foto beserta thumbnail-nya bila sudah tidak dirujuk baris mana
+    pun di tabel `kind`. Dipanggil setelah UPDATE/DELETE yang melepas foto.
+    """
+    hapus_foto_massal(kind, [filename])
+
+def hapus_foto_massal(kind, filenames):
+    """hapus_foto untuk banyak file sekaligus: satu query cek rujukan"""
+    filenames = {f for f in filenames if f}
+    if not filenames:
+        return
+    with transaction() as conn:
+        dipakai = {r["foto"] for r in conn.execute(
+            f"SELECT DISTINCT foto FROM {kind} WHERE foto IN (SELECT value FROM json_each(?))",
+            (json.dumps(sorted(filenames)),))}
+        folder = foto_dirs()[kind]
+        for filename in filenames - dipakai:
+            try:
+                os.remove(os.path.join(folder, filename))
+            except OSError:
+                pass
+            hapus_thumbnail(folder, filename)
+
+@main_bp.app_template_global()
+def foto_url(kind, filename, size=THUMB_SIZES[0]):
+    """URL thumbnail foto untuk template (gambar default jika tidak ada foto)"""
+    if not filename:
+        return url_for("static", filename="noimage.png")
+    return url_for("main.foto_thumb", kind=kind, size=size, filename=filename)
+
+@main_bp.route("/foto/<kind>/<int:size>/<path:filename>")
+def foto_thumb(kind, size, filename):
+    folder = foto_dirs().get(kind)
+    if folder is None or size not in THUMB_SIZES or not foto_valid(filename):
+        abort(404)
+    # Foto hash tidak pernah berubah isi -> boleh di-cache selamanya
+    immutable = bool(FOTO_CAS_RE.match(filename))
+    max_age = FOTO_IMMUTABLE_MAX_AGE if immutable else THUMB_MAX_AGE
+    try:
+        path = buat_thumbnail(folder, filename, size)
+    except ImportError:
+        path = None
+    if path is None:
+        # Pillow tidak tersedia / file bukan gambar: kirim file aslinya
+        resp = send_from_directory(folder, filename, max_age=max_age)
+    else:
+        resp = send_from_directory(os.path.dirname(path), os.path.basename(path),
+                                   max_age=max_age)
+    if immutable:
+        resp.cache_control.immutable = True
+    return resp
+
+def migrasi_foto_ke_hash(kind):
+    """
+    Memindahkan foto lama (nama file biasa) ke penyimpanan hash dan
+    memperbarui semua baris yang merujuknya. Mengembalikan jumlah file.
+    """
+    folder = foto_dirs()[kind]
+    rows = query_db(f"SELECT DISTINCT foto FROM {kind} WHERE foto IS NOT NULL AND foto != ''")
+    moved = 0
+    for row in rows:
+        lama = row["foto"]
+        path_lama = os.path.join(folder, lama)
+        if FOTO_CAS_RE.match(lama) or not os.path.isfile(path_lama):
+            continue
+        with open(path_lama, "rb") as f:
+            digest = hash_upload(f)
+        ext = lama.rsplit(".", 1)[-1].lower()
+        baru = f"{digest[:2]}/{digest[2:4]}/{digest}.{ext}"
+        path_baru = os.path.join(folder, baru)
+        if not os.path.exists(path_baru):
+            os.makedirs(os.path.dirname(path_baru), exist_ok=True)
+            shutil.copy2(path_lama, path_baru)
+        with transaction() as conn:
+            conn.execute(f"UPDATE {kind} SET foto=? WHERE foto=?", (baru, lama))
+        hapus_foto(kind, lama)
+        moved += 1
+    return moved
+
+@main_bp.cli.command("migrasi-foto")
+def migrasi_foto_command():
+    """Memindahkan foto lama ke penyimpanan berbasis hash isi file."""
+    init_db()
+    for kind in foto_dirs():
+        print(f"{kind}: {migrasi_foto_ke_hash(kind)} foto dipindahkan")
+
+# ---------- Antrian pemrosesan foto ----------
+# Route tambah/edit hanya menyalin upload mentah ke FOTO_ANTRIAN_FOLDER dan
+# mencatat job di tabel foto_job; resize, pembuatan thumbnail, penghapusan
+# EXIF dan pembersihan foto lama dikerjakan thread worker setelah response
+# terkirim. Job diambil secara atomik (UPDATE ... RETURNING) sehingga
+# beberapa proses gunicorn bisa berbagi antrian yang sama; job yang macet
+# (proses mati di tengah jalan) diambil ulang setelah FOTO_JOB_LEASE detik.
+# Dengan FOTO_ASYNC=False job dikerjakan langsung di dalam request.
+FOTO_JOB_LEASE = 5 * 60
+FOTO_JOB_MAX_PERCOBAAN = 3
+FOTO_JOB_POLL = 5.0                    # detik; job dari proses lain
+FOTO_JOB_SIMPAN = 7 * 24 * 60 * 60     # job selesai dihapus setelah ini
+FOTO_JOB_BERSIHKAN_SETIAP = 60 * 60
+
+class FotoJobGagal(Exception):
+    pass
+
+def antrian_dir():
+    return lokasi("FOTO_ANTRIAN_FOLDER")
+
+def jadwalkan_foto(kind, row_id, foto_file):
+    """
+    Menyalin upload ke folder antrian lalu mendaftarkan job yang akan
+    memasang foto itu ke baris `row_id`. Mengembalikan id job, atau None
+    bila tidak ada file yang valid.
+    """
+    if not (foto_file and foto_file.filename != "" and allowed_file(foto_file.filename)):
+        return None
+    ext = foto_file.filename.rsplit(".", 1)[1].lower()
+    upload = f"{os.urandom(16).hex()}.{ext}"
+    tulis_atomik(os.path.join(antrian_dir(), upload),
+                 lambda f: shutil.copyfileobj(foto_file.stream, f, FOTO_CHUNK_SIZE))
+    job_id = execute_db("INSERT INTO foto_job (kind, row_id, upload) VALUES (?, ?, ?)",
+                        (kind, row_id, upload))
+    if current_app.config["FOTO_ASYNC"]:
+        foto_worker().bangunkan()
+        flash("Foto sedang diproses dan akan segera tampil.", "info")
+    else:
+        jalankan_job_foto(job_id)
+    return job_id
+
+def ambil_job_foto(job_id=None):
+    """Menandai satu job (yang diminta, atau yang tertua) sebagai 'proses'"""
+    sekarang = int(time.time())
+    if job_id is None:
+        kondisi = "status = 'antri' OR (status = 'proses' AND diambil < ?)"
+        # Cek dulu tanpa transaksi tulis: worker yang polling antrian kosong
+        # tidak perlu mengambil lock tulis database setiap FOTO_JOB_POLL
+        if not query_db(f"SELECT 1 FROM foto_job WHERE {kondisi} LIMIT 1",
+                        (sekarang - FOTO_JOB_LEASE,)):
+            return None
+        where_sql = f"id = (SELECT id FROM foto_job WHERE {kondisi} ORDER BY id LIMIT 1)"
+        args = (sekarang, sekarang - FOTO_JOB_LEASE)
+    else:
+        where_sql = "id = ? AND status = 'antri'"
+        args = (sekarang, job_id)
+    with transaction() as conn:
+        # fetchall: RETURNING harus selesai di-step sebelum COMMIT
+        rows = conn.execute(f"""UPDATE foto_job
+                                SET status = 'proses', diambil = ?, percobaan = percobaan + 1
+                                WHERE {where_sql} RETURNING *""", args).fetchall()
+    return rows[0] if rows else None
+
+def pasang_foto_job(job, foto, simpan_ulang):
+    """
+    Memasang hasil job ke barisnya. Mengembalikan (status, pesan). Upload
+    yang kalah dari upload lebih baru untuk baris yang sama, atau barisnya
+    sudah dihapus, dibatalkan dan filenya dibersihkan.
+
+    simpan_foto memakai ulang file hash yang sudah ada tanpa lock, sehingga
+    file itu bisa dihapus hapus_foto_massal (belum dirujuk baris mana pun)
+    sebelum UPDATE di sini. Keberadaan file diperiksa lagi di dalam
+    transaksi tulis dan ditulis ulang lewat `simpan_ulang` bila hilang;
+    penghapusan juga memegang lock tulis, jadi setelah COMMIT file aman.
+    """
+    kind, foto_lama = job["kind"], None
+    with transaction() as conn:
+        lebih_baru = conn.execute("""SELECT 1 FROM foto_job
+                                     WHERE kind = ? AND row_id = ? AND id > ? AND status = 'selesai'
+                                     LIMIT 1""", (kind, job["row_id"], job["id"])).fetchone()
+        row = None if lebih_baru else conn.execute(
+            f"SELECT foto FROM {kind} WHERE id = ?", (job["row_id"],)).fetchone()
+        if row is not None:
+            if not os.path.exists(os.path.join(foto_dirs()[kind], foto)):
+                simpan_ulang()
+            foto_lama = row["foto"]
+            conn.execute(f"UPDATE {kind} SET foto = ? WHERE id = ?", (foto, job["row_id"]))
+    if row is None:
+        hapus_foto(kind, foto)
+        return "batal", "digantikan upload yang lebih baru" if lebih_baru else "data sudah dihapus"
+    if foto_lama != foto:
+        hapus_foto(kind, foto_lama)
+    return "selesai", None
+
+def jalankan_job_foto(job_id=None):
+    """Mengerjakan satu job; mengembalikan False bila antrian kosong"""
+    job = ambil_job_foto(job_id)
+    if job is None:
+        return False
+    path = os.path.join(antrian_dir(), job["upload"])
+    foto = None
+
+    def simpan():
+        with open(path, "rb") as f:
+            return simpan_foto(FileStorage(f, filename=job["upload"]), job["kind"])
+
+    try:
+        if job["percobaan"] > FOTO_JOB_MAX_PERCOBAAN:
+            # Diambil ulang setelah lease habis berkali-kali (proses mati saat mengerjakan)
+            raise FotoJobGagal("terlalu banyak percobaan")
+        foto = simpan()
+        if foto is None:
+            status, pesan = "gagal", "file tidak valid"
+        else:
+            status, pesan = pasang_foto_job(job, foto, simpan)
+    except FileNotFoundError:
+        status, pesan = "gagal", "file upload hilang"
+    except FotoJobGagal as e:
+        status, pesan = "gagal", str(e)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        log.exception("job foto %s gagal", job["id"])
+        status = "gagal" if job["percobaan"] >= FOTO_JOB_MAX_PERCOBAAN else "antri"
+        pesan = str(e)
+    execute_db("""UPDATE foto_job SET status = ?, foto = ?, pesan = ?,
+                  selesai = CASE WHEN ? = 'antri' THEN NULL ELSE CAST(strftime('%s', 'now') AS INTEGER) END
+                  WHERE id = ?""", (status, foto if status == "selesai" else None, pesan, status, job["id"]))
+    if status != "antri":
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return True
+
+def bersihkan_job_foto():
+    """Menghapus riwayat job lama dan file antrian yatim; mengembalikan jumlah job"""
+    batas = int(time.time()) - FOTO_JOB_SIMPAN
+    with transaction() as conn:
+        dihapus = conn.execute("""DELETE FROM foto_job
+                                  WHERE status IN ('selesai', 'gagal', 'batal') AND selesai < ?""",
+                               (batas,)).rowcount
+    aktif = {r["upload"] for r in query_db(
+        "SELECT upload FROM foto_job WHERE status IN ('antri', 'proses')")}
+    folder = antrian_dir()
+    for name in os.listdir(folder):
+        path = os.path.join(folder, name)
+        # File baru bisa jadi job-nya belum ter-commit
+        if name not in aktif and os.path.getmtime(path) < time.time() - FOTO_JOB_LEASE:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return dihapus
+
+class FotoWorker:
+    """Thread pool pemroses foto_job untuk satu file database di proses ini"""
+
+    def __init__(self, app, tenant, jumlah):
+        self.app = app
+        self.tenant = tenant
+        self.pid = os.getpid()
+        self.event = threading.Event()
+        self.dibersihkan = 0.0
+        self._lock = threading.Lock()
+        for i in range(jumlah):
+            threading.Thread(target=self.loop, name=f"foto-job-{i}", daemon=True).start()
+
+    def bangunkan(self):
+        self.event.set()
+
+    def loop(self):
+        while True:
+            self.event.clear()
+            try:
+                with konteks_tenant(self.app, self.tenant):
+                    while jalankan_job_foto():
+                        pass
+                    with self._lock:
+                        bersihkan = time.time() - self.dibersihkan > FOTO_JOB_BERSIHKAN_SETIAP
+                        if bersihkan:
+                            self.dibersihkan = time.time()
+                    if bersihkan:
+                        bersihkan_job_foto()
+            except Exception:
+                log.exception("worker foto berhenti sementara")
+            self.event.wait(FOTO_JOB_POLL)
+
+_foto_workers = {}   # path database -> FotoWorker
+_foto_workers_lock = threading.Lock()
+
+def foto_worker():
+    """Worker milik database aktif, dibuat saat pertama dibutuhkan (juga setelah fork)"""
+    path = db_path()
+    worker = _foto_workers.get(path)
+    if worker is None or worker.pid != os.getpid():
+        with _foto_workers_lock:
+            worker = _foto_workers.get(path)
+            if worker is None or worker.pid != os.getpid():
+                worker = _foto_workers[path] = FotoWorker(current_app._get_current_object(),
+                                                          tenant_aktif(),
+                                                          current_app.config["FOTO_WORKERS"])
+    return worker
+
+@main_bp.before_app_request
+def mulai_foto_worker():
+    """Job sisa proses sebelumnya ikut dikerjakan walau belum ada upload baru"""
+    if current_app.config["FOTO_ASYNC"]:
+        foto_worker()
+
+@main_bp.cli.command("foto-job")
+@click.option("--proses", is_flag=True, help="Kerjakan semua job yang menunggu sekarang.")
+@click.option("--bersihkan", is_flag=True, help="Hapus riwayat job lama dan file antrian yatim.")
+def foto_job_command(proses, bersihkan):
+    """Status antrian pemrosesan foto."""
+    init_db()
+    if proses:
+        jumlah = 0
+        while jalankan_job_foto():
+            jumlah += 1
+        print(f"{jumlah} job dikerjakan")
+    if bersihkan:
+        print(f"{bersihkan_job_foto()} job lama dihapus")
+    for row in query_db("SELECT status, COUNT(*) AS n FROM foto_job GROUP BY status ORDER BY status"):
+        print(f"{row['status']}: {row['n']}")
+
+# ---------- Aset statis (bundle) ----------
+# CSS/JS yang dipakai template digabung menjadi beberapa bundle oleh
+# `flask build-assets`: nama file diberi sidik jari isi (app.<hash>.css),
+# disertai salinan .gz (dan .br bila paket brotli terpasang), lalu dilayani
+# /assets/ dengan cache immutable. Tanpa hasil build (mis. saat
+# pengembangan) template memakai file sumbernya satu per satu.
+ASSET_BUNDLES = {
+    "app.css": (
+        "plugins/fontawesome-free/css/all.min.css",
+        "dist/css/adminlte.min.css",
+    ),
+    "app.js": (
+        "plugins/jquery/jquery.min.js",
+        "plugins/bootstrap/js/bootstrap.bundle.min.js",
+        "dist/js/adminlte.min.js",
+    ),
+    "chart.js": (
+        "plugins/chart.js/Chart.min.js",
+    ),
+}
+ASSET_MANIFEST = "manifest.json"
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+ASSET_COMPRESS_EXT = {".css", ".js", ".svg", ".ttf", ".eot", ".json"}
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)(?!data:|https?:|/)([^'")?#]+)([^'")]*)\1\s*\)""")
+SOURCEMAP_RE = re.compile(r"^\s*(//[#@] sourceMappingURL=.*|/\*[#@] sourceMappingURL=.*?\*/)\s*$", re.M)
+
+def sidik_jari(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+
+def tulis_aset(out_dir, name, data):
+    """Menulis satu file aset beserta versi terkompresinya; mengembalikan nama file"""
+    names = [name]
+    tulis_atomik(os.path.join(out_dir, name), lambda f: f.write(data))
+    if os.path.splitext(name)[1] in ASSET_COMPRESS_EXT:
+        tulis_atomik(os.path.join(out_dir, name + ".gz"),
+                     lambda f: f.write(gzip.compress(data, compresslevel=9, mtime=0)))
+        names.append(name + ".gz")
+        try:
+            import brotli
+        except ImportError:
+            brotli = None
+        if brotli is not None:
+            tulis_atomik(os.path.join(out_dir, name + ".br"),
+                         lambda f: f.write(brotli.compress(data)))
+            names.append(name + ".br")
+    return names
+
+def build_assets(static_dir, out_dir):
+    """
+    Membuat bundle ASSET_BUNDLES di out_dir. File yang dirujuk CSS (font,
+    gambar) ikut disalin dengan sidik jari dan url() di CSS ditulis ulang.
+    Mengembalikan (manifest, daftar semua file yang ditulis).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest, ditulis, disalin = {}, [], {}
+
+    def salin_rujukan(match, css_dir):
+        quote, rel, suffix = match.groups()
+        src = os.path.normpath(os.path.join(css_dir, rel))
+        if src not in disalin:
+            with open(src, "rb") as f:
+                data = f.read()
+            disalin[src] = sidik_jari(os.path.basename(src), data)
+            ditulis.extend(tulis_aset(out_dir, disalin[src], data))
+        return f"url({quote}{disalin[src]}{suffix}{quote})"
+
+    for bundle, sources in ASSET_BUNDLES.items():
+        parts = []
+        for rel in sources:
+            path = os.path.join(static_dir, rel)
+            with open(path, encoding="utf-8") as f:
+                text = SOURCEMAP_RE.sub("", f.read())
+            if bundle.endswith(".css"):
+                css_dir = os.path.dirname(path)
+                text = CSS_URL_RE.sub(lambda m: salin_rujukan(m, css_dir), text)
+            parts.append(text.strip())
+        sep = "\n" if bundle.endswith(".css") else ";\n"
+        data = (sep.join(parts) + "\n").encode("utf-8")
+        manifest[bundle] = sidik_jari(bundle, data)
+        ditulis.extend(tulis_aset(out_dir, manifest[bundle], data))
+
+    data = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+    tulis_atomik(os.path.join(out_dir, ASSET_MANIFEST), lambda f: f.write(data))
+    return manifest, ditulis + [ASSET_MANIFEST]
+
+@lru_cache(maxsize=8)
+def baca_manifest(out_dir, mtime):
+    with open(os.path.join(out_dir, ASSET_MANIFEST), encoding="utf-8") as f:
+        return json.load(f)
+
+def asset_manifest():
+    out_dir = current_app.config["ASSET_FOLDER"]
+    try:
+        mtime = os.path.getmtime(os.path.join(out_dir, ASSET_MANIFEST))
+    except OSError:
+        return None
+    return baca_manifest(out_dir, mtime)
+
+@main_bp.app_template_global()
+def asset_urls(bundle):
+    """URL bundle hasil build, atau file-file sumbernya bila belum di-build"""
+    manifest = asset_manifest()
+    if manifest and bundle in manifest:
+        return [url_for("main.asset", filename=manifest[bundle])]
+    return [url_for("static", filename=rel) for rel in ASSET_BUNDLES[bundle]]
+
+@main_bp.route("/assets/<path:filename>")
+def asset(filename):
+    folder = current_app.config["ASSET_FOLDER"]
+    mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    # Kirim versi terkompresi yang sudah jadi bila browser menerimanya
+    for encoding, ext in (("br", ".br"), ("gzip", ".gz")):
+        if request.accept_encodings[encoding] and os.path.isfile(os.path.join(folder, filename + ext)):
+            resp = send_from_directory(folder, filename + ext, mimetype=mimetype,
+                                       max_age=ASSET_MAX_AGE)
+            resp.headers["Content-Encoding"] = encoding
+            break
+    else:
+        resp = send_from_directory(folder, filename, mimetype=mimetype, max_age=ASSET_MAX_AGE)
+    resp.headers.pop("Content-Disposition", None)
+    resp.vary.add("Accept-Encoding")
+    resp.cache_control.public = True
+    resp.cache_control.immutable = True
+    return resp
+
+@main_bp.cli.command("build-assets")
+@click.option("--bersihkan", is_flag=True, help="Hapus file hasil build lama yang tidak dipakai lagi.")
+def build_assets_command(bersihkan):
+    """Menggabungkan, memberi sidik jari dan mengompres aset CSS/JS."""
+    out_dir = current_app.config["ASSET_FOLDER"]
+    manifest, ditulis = build_assets(current_app.static_folder, out_dir)
+    for bundle, name in manifest.items():
+        size = os.path.getsize(os.path.join(out_dir, name))
+        gz = os.path.join(out_dir, name + ".gz")
+        print(f"{bundle} -> {name} ({size // 1024} KB, gzip {os.path.getsize(gz) // 1024} KB)")
+    if bersihkan:
+        dipakai = set(ditulis)
+        for name in os.listdir(out_dir):
+            if name not in dipakai:
+                os.remove(os.path.join(out_dir, name))
+                print(f"dihapus: {name}")
+
+# ---------- Paginasi keyset ----------
+# Daftar diurutkan (nama, id). Cursor berisi (nama, id) baris terakhir/pertama
+# di halaman, sehingga halaman berikutnya cukup mencari posisi cursor di index
+# tanpa OFFSET yang harus melewati semua baris sebelumnya. Perbandingan ditulis
+# terurai (bukan row value) supaya SQLite bisa SEARCH lewat index ekspresi.
+# Baris halaman dialirkan langsung dari cursor ke template (lihat
+# alirkan_halaman dan render_stream), jadi halaman besar tidak menambah
+# memori worker.
+PER_PAGE_DEFAULT = 50
+PER_PAGE_MAX = 2000
+SORT_KEY = "IFNULL(nama, '')"
+
+def encode_cursor(row):
+    raw = json.dumps([row["nama"] or "", row["id"]]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def decode_cursor(token):
+    """Mengembalikan (nama, id) atau None jika cursor tidak valid"""
+    if not token:
+        return None
+    try:
+        nama, id_ = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        return (str(nama), int(id_))
+    except Exception:
+        return None
+
+def keyset_condition(cursor, op):
+    """Kondisi WHERE untuk baris sesudah (op=">") / sebelum (op="<") cursor"""
+    nama, id_ = cursor
+    return (f"{SORT_KEY} {op}= ? AND ({SORT_KEY} {op} ? OR id {op} ?)",
+            [nama, nama, id_])
+
+def get_per_page():
+    try:
+        per_page = int(request.args.get("per_page", PER_PAGE_DEFAULT))
+    except ValueError:
+        per_page = PER_PAGE_DEFAULT
+    return max(1, min(per_page, PER_PAGE_MAX))
+
+def alirkan_halaman(page, rows, keyset=None):
+    """
+    Generator baris halaman. Jumlah baris (dan cursor keyset bila `keyset`
+    berisi (has_next, has_prev)) baru diisi ke `page` setelah baris terakhir
+    lewat, jadi hanya boleh dibaca template sesudah loop baris (pager).
+    """
+    first = last = None
+    jumlah = 0
+    for row in rows:
+        if first is None:
+            first = row
+        last = row
+        jumlah += 1
+        yield row
+    page["jumlah"] = jumlah
+    if keyset:
+        has_next, has_prev = keyset
+        page["next_cursor"] = encode_cursor(last) if last and has_next else None
+        page["prev_cursor"] = encode_cursor(first) if first and has_prev else None
+
+def paginate_keyset(table, where="", args=(), columns="*"):
+    """
+    Mengambil satu halaman dari table berdasarkan parameter request
+    ?after=<cursor> / ?before=<cursor> / ?per_page=<n>.
+    Mengembalikan dict: rows (generator, lihat alirkan_halaman), total,
+    next_cursor, prev_cursor, per_page, jumlah.
+    """
+    per_page = get_per_page()
+    after = decode_cursor(request.args.get("after"))
+    before = decode_cursor(request.args.get("before"))
+
+    conditions = [f"({where})"] if where else []
+    params = list(args)
+    if before:
+        cond, cond_args = keyset_condition(before, "<")
+        conditions.append(cond)
+        params.extend(cond_args)
+        order = "DESC"
+    else:
+        if after:
+            cond, cond_args = keyset_condition(after, ">")
+            conditions.append(cond)
+            params.extend(cond_args)
+        order = "ASC"
+    where_sql = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+
+    order_sql = f"ORDER BY {SORT_KEY} {order}, id {order}"
+
+    # Masih ada baris di luar halaman ini? Cukup dicek lewat index
+    more = bool(query_db(f"SELECT 1 FROM {table} {where_sql} {order_sql} LIMIT 1 OFFSET ?",
+                         params + [per_page]))
+    sql = f"SELECT {columns} FROM {table} {where_sql} {order_sql} LIMIT ?"
+    if before:
+        # Halaman sebelum cursor dibaca mundur, urutannya dibalik oleh SQLite
+        sql = f"SELECT * FROM ({sql}) ORDER BY {SORT_KEY}, id"
+
+    total = query_db(f"SELECT COUNT(*) AS c FROM {table} {'WHERE ' + where if where else ''}",
+                     args, one=True)["c"]
+
+    has_next = more if not before else True
+    has_prev = (more if before else after is not None)
+    page = {"total": total, "per_page": per_page, "jumlah": 0,
+            "next_cursor": None, "prev_cursor": None}
+    page["rows"] = alirkan_halaman(page, iter_rows(sql, params + [per_page]),
+                                   keyset=(has_next, has_prev))
+    return page
+
 def process_siswa_data(siswa_list):
-    """Menghitung usia siswa secara real-time untuk ditampilkan"""
-    processed = []
+    """
+    Generator data siswa untuk ditampilkan, baris demi baris sehingga bisa
+    dipakai langsung pada halaman yang di-stream. Kolom usia_tahun/usia_bulan
+    selalu terkini (lihat refresh_kolom_turunan), jadi tidak dihitung ulang.
+    """
     for s in siswa_list:
         s_dict = dict(s)
-        tgl_lahir = s_dict.get("tanggal_lahir")
-        if tgl_lahir:
-            usia_th, usia_bln = hitung_usia(tgl_lahir)
-            # Menambahkan field realtime untuk display
-            s_dict["usia_tahun_realtime"] = usia_th
-            s_dict["usia_bulan_realtime"] = usia_bln
+        # Field realtime untuk display (nama lama dipertahankan)
+        s_dict["usia_tahun_realtime"] = s_dict.get("usia_tahun") or 0
+        s_dict["usia_bulan_realtime"] = s_dict.get("usia_bulan") or 0
+        yield s_dict
+
+# ---------- Refresh kolom turunan ----------
+# Kolom usia_* / mk_* / sisa_mk_* disimpan di tabel dan diperbarui sekali
+# sehari (lihat jadwalkan_refresh_turunan dan perintah `flask refresh-turunan`),
+# sehingga halaman daftar/detail cukup membaca kolom dan kolom tersebut bisa
+# dipakai untuk ORDER BY / WHERE di SQL.
+# Format: tabel -> [(kolom sumber, fungsi, (kolom tahun, kolom bulan)), ...]
+KOLOM_TURUNAN = {
+    "siswa": (
+        ("tanggal_lahir", hitung_usia, ("usia_tahun", "usia_bulan")),
+    ),
+    "guru": (
+        ("sk_pertama", hitung_selisih_tahun_bulan, ("mk_total_tahun", "mk_total_bulan")),
+        ("sk_terakhir", hitung_selisih_tahun_bulan, ("mk_gol_tahun", "mk_gol_bulan")),
+        ("tanggal_lahir", hitung_sisa_masa_kerja, ("sisa_mk_tahun", "sisa_mk_bulan")),
+    ),
+}
+REFRESH_META_KEY = "turunan_refreshed_on"
+
+def get_meta(key, conn=None):
+    row = (conn or get_db()).execute("SELECT value FROM app_meta WHERE key=?", (key,)).fetchone()
+    return row["value"] if row else None
+
+def set_meta(key, value, conn=None):
+    (conn or get_db()).execute(
+        "INSERT INTO app_meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value=excluded.value", (key, value))
+
+def hitung_perubahan_turunan(table, acuan):
+    """
+    Menghitung ulang kolom turunan satu tabel (batch, satu tanggal acuan) dan
+    mengembalikan parameter UPDATE hanya untuk baris yang nilainya berubah.
+    """
+    specs = KOLOM_TURUNAN[table]
+    sumber = sorted({spec[0] for spec in specs})
+    target = [col for spec in specs for col in spec[2]]
+    rows = query_db(f"SELECT id, {', '.join(sumber + target)} FROM {table}")
+
+    hasil = [hitung_kolom([r[spec[0]] for r in rows], spec[1], acuan) for spec in specs]
+    updates = []
+    for i, r in enumerate(rows):
+        baru = tuple(v for kolom in hasil for v in kolom[i])
+        if baru != tuple(r[col] for col in target):
+            # Sumber ikut dicocokkan supaya baris yang diedit sejak dibaca
+            # tidak ditimpa dengan hasil dari tanggal lama
+            updates.append(baru + (r["id"],) + tuple(r[col] for col in sumber))
+    set_sql = ", ".join(f"{col}=?" for col in target)
+    where_sql = " AND ".join(f"{col} IS ?" for col in sumber)
+    return f"UPDATE {table} SET {set_sql} WHERE id=? AND {where_sql}", updates
+
+def refresh_kolom_turunan(sekarang=None, paksa=False):
+    """
+    Memperbarui kolom turunan siswa & guru yang berubah sejak refresh terakhir.
+    Perhitungan dilakukan di luar transaksi; semua UPDATE ditulis dalam satu
+    transaksi. Mengembalikan {tabel: jumlah baris diperbarui}, atau None bila
+    sudah di-refresh untuk tanggal acuan ini (kecuali paksa=True).
+    """
+    acuan = tanggal_acuan(sekarang)
+    if not paksa and get_meta(REFRESH_META_KEY) == acuan.isoformat():
+        return None
+
+    rencana = {table: hitung_perubahan_turunan(table, acuan) for table in KOLOM_TURUNAN}
+    hasil = {}
+    with transaction() as conn:
+        # Worker lain mungkin sudah menyelesaikan refresh yang sama
+        if not paksa and get_meta(REFRESH_META_KEY, conn) == acuan.isoformat():
+            return None
+        for table, (sql, updates) in rencana.items():
+            conn.executemany(sql, updates)
+            hasil[table] = len(updates)
+        set_meta(REFRESH_META_KEY, acuan.isoformat(), conn)
+    return hasil
+
+_refresh_state = {}   # path database -> tanggal refresh terakhir dijadwalkan
+_refresh_lock = threading.Lock()
+
+def _refresh_background(app, tenant, path):
+    try:
+        with konteks_tenant(app, tenant):
+            try:
+                hasil = refresh_kolom_turunan()
+                if hasil:
+                    app.logger.info("refresh kolom turunan: %s", hasil)
+                    app.logger.info("log perubahan dipadatkan: %d entri", padatkan_perubahan())
+            except sqlite3.Error:
+                app.logger.exception("refresh kolom turunan gagal")
+                with _refresh_lock:
+                    _refresh_state.pop(path, None)
+    finally:
+        close_db()
+
+@main_bp.before_app_request
+def jadwalkan_refresh_turunan():
+    """Request pertama setiap hari memicu refresh di thread latar belakang"""
+    if not current_app.config.get("REFRESH_TURUNAN_OTOMATIS", True):
+        return
+    hari = date.today()
+    path = db_path()
+    with _refresh_lock:
+        if _refresh_state.get(path) == hari:
+            return
+        _refresh_state[path] = hari
+    threading.Thread(target=_refresh_background,
+                     args=(current_app._get_current_object(), tenant_aktif(), path), name="refresh-turunan", daemon=True).start()
+
+@main_bp.cli.command("refresh-turunan")
+@click.option("--paksa", is_flag=True, help="Hitung ulang walaupun sudah di-refresh hari ini.")
+def refresh_turunan_command(paksa):
+    """Memperbarui kolom usia, masa kerja dan sisa masa kerja yang tersimpan."""
+    init_db()
+    hasil = refresh_kolom_turunan(paksa=paksa)
+    if hasil is None:
+        print("Kolom turunan sudah diperbarui hari ini.")
+    else:
+        for table, jumlah in hasil.items():
+            print(f"{table}: {jumlah} baris diperbarui")
+
+# ---------- Pencarian full-text ----------
+def fts_query(keyword):
+    """
+    Mengubah input bebas menjadi query FTS5: setiap kata menjadi prefix
+    match ("kata"*) dan semua kata harus cocok. Tanda kutip di-escape
+    sehingga input pengguna tidak bisa memakai sintaks FTS5.
+    """
+    terms = [t.replace('"', '""') for t in keyword.split()]
+    return " ".join(f'"{t}"*' for t in terms if t)
+
+def offset_arg(name):
+    try:
+        return max(0, int(request.args.get(name, "")))
+    except ValueError:
+        return None
+
+def search_fts(table, keyword):
+    """
+    Mencari di table lewat index FTS5, diurutkan berdasarkan relevansi (bm25).
+    Hasil berurutan relevansi tidak punya kunci keyset yang stabil, jadi
+    cursor after/before di sini berisi offset; bentuk dict hasil sama dengan
+    paginate_keyset sehingga template paginasi bisa dipakai bersama.
+    """
+    per_page = get_per_page()
+    match = fts_query(keyword)
+    fts = f"{table}_fts"
+    after, before = offset_arg("after"), offset_arg("before")
+    if before is not None:
+        offset = max(0, before - per_page)
+    else:
+        offset = after or 0
+
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS[table])
+    sql = f"""SELECT t.* FROM {fts}
+              JOIN {table} t ON t.id = {fts}.rowid
+              WHERE {fts} MATCH ?
+              ORDER BY bm25({fts}, {weights}), t.id
+              LIMIT ? OFFSET ?"""
+    total = query_db(f"SELECT COUNT(*) AS c FROM {fts} WHERE {fts} MATCH ?",
+                     (match,), one=True)["c"]
+    page = {
+        "total": total,
+        "per_page": per_page,
+        "jumlah": 0,
+        "next_cursor": str(offset + per_page) if offset + per_page < total else None,
+        "prev_cursor": str(offset) if offset > 0 else None,
+    }
+    page["rows"] = alirkan_halaman(page, iter_rows(sql, (match, per_page, offset)))
+    return page
+
+# ---------- Import massal (CSV/XLSX) ----------
+# File dibaca baris demi baris (tidak pernah dimuat utuh ke memori), divalidasi,
+# lalu disimpan per potongan IMPORT_CHUNK_SIZE baris dengan executemany dalam
+# satu transaksi per potongan.
+IMPORT_CHUNK_SIZE = 500
+IMPORT_MAX_ERRORS = 200
+IMPORT_FIELDS = {
+    "siswa": ("nama", "kelas", "jurusan", "tempat_lahir", "tanggal_lahir",
+              "asal_sekolah", "alamat"),
+    "guru": ("nama", "nip", "tempat_lahir", "tanggal_lahir", "agama", "jabatan",
+             "nuptk", "sk_pertama", "sk_terakhir", "pendidikan"),
+}
+IMPORT_DATE_FIELDS = {"tanggal_lahir", "sk_pertama", "sk_terakhir"}
+IMPORT_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y")
+IMPORT_NOMOR_INDUK_FIELDS = {"nip", "nuptk"}
+IMPORT_EXT = {"csv", "xlsx"}
+
+def normalisasi_header(name):
+    return str(name or "").strip().lower().replace(" ", "_")
+
+def normalisasi_tanggal(value):
+    """Mengubah nilai tanggal dari file (teks/datetime Excel) menjadi YYYY-MM-DD"""
+    if value in (None, ""):
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    text = str(value).strip()
+    for fmt in IMPORT_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    raise ValueError(f"format tanggal tidak dikenal: {text}")
+
+def normalisasi_nomor_induk(value):
+    """
+    NIP/NUPTK tanpa spasi di tepi. Isian pengganti untuk "belum ada" ('-',
+    '0', '000', teks tanpa angka) menjadi None agar tidak bentrok di index unik.
+    """
+    text = str(value if value is not None else "").strip()
+    return text if re.search(r"[1-9]", text) else None
+
+def iter_csv_rows(stream):
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    sample = text.read(4096)
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.reader(text, dialect)
+    header = [normalisasi_header(h) for h in next(reader, [])]
+    for values in reader:
+        if any(v.strip() for v in values):
+            yield dict(zip(header, values))
+    text.detach()
+
+def iter_xlsx_rows(stream):
+    # openpyxl hanya dibutuhkan untuk import XLSX
+    from openpyxl import load_workbook
+    wb = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [normalisasi_header(h) for h in next(rows, ())]
+        for values in rows:
+            if any(v not in (None, "") for v in values):
+                yield dict(zip(header, values))
+    finally:
+        wb.close()
+
+def iter_upload_rows(file_storage):
+    ext = file_storage.filename.rsplit(".", 1)[-1].lower()
+    if ext == "xlsx":
+        return iter_xlsx_rows(file_storage.stream)
+    return iter_csv_rows(file_storage.stream)
+
+def validasi_baris(table, raw):
+    """Mengembalikan dict field yang sudah bersih; ValueError jika tidak valid"""
+    data = {}
+    for field in IMPORT_FIELDS[table]:
+        value = raw.get(field)
+        if field in IMPORT_DATE_FIELDS:
+            value = normalisasi_tanggal(value)
+        elif field in IMPORT_NOMOR_INDUK_FIELDS:
+            value = normalisasi_nomor_induk(value)
+        elif value is not None:
+            value = str(value).strip() or None
+        data[field] = value
+    if not data["nama"]:
+        raise ValueError("nama wajib diisi")
+    return data
+
+def lengkapi_siswa(data, sekarang):
+    usia_tahun, usia_bulan = hitung_usia(data["tanggal_lahir"], sekarang)
+    data.update(usia_tahun=usia_tahun, usia_bulan=usia_bulan)
+    return data
+
+def lengkapi_guru(data, sekarang):
+    mk_total_tahun, mk_total_bulan = hitung_selisih_tahun_bulan(data["sk_pertama"], sekarang)
+    mk_gol_tahun, mk_gol_bulan = hitung_selisih_tahun_bulan(data["sk_terakhir"], sekarang)
+    sisa_mk_tahun, sisa_mk_bulan = hitung_sisa_masa_kerja(data["tanggal_lahir"], sekarang)
+    data.update(mk_gol_tahun=mk_gol_tahun, mk_gol_bulan=mk_gol_bulan,
+                mk_total_tahun=mk_total_tahun, mk_total_bulan=mk_total_bulan,
+                sisa_mk_tahun=sisa_mk_tahun, sisa_mk_bulan=sisa_mk_bulan,
+                tanggal_pensiun=tanggal_pensiun_iso(data["tanggal_lahir"]))
+    return data
+
+# Pengisi kolom turunan (usia / masa kerja) per tabel untuk baris import
+LENGKAPI_TURUNAN = {"siswa": lengkapi_siswa, "guru": lengkapi_guru}
+
+def simpan_batch(table, batch):
+    """
+    Menyimpan satu potongan baris dengan executemany dalam satu transaksi.
+    Bila ada baris yang melanggar constraint (mis. NIP ganda) potongan itu
+    diulang per baris; mengembalikan [(indeks dalam batch, pesan)] yang gagal.
+    """
+    columns = list(batch[0].keys())
+    placeholders = ", ".join("?" for _ in columns)
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    params = [tuple(row[c] for c in columns) for row in batch]
+    try:
+        with transaction() as conn:
+            conn.executemany(sql, params)
+        return []
+    except sqlite3.IntegrityError:
+        pass
+
+    gagal = []
+    with transaction() as conn:
+        for i, p in enumerate(params):
+            try:
+                conn.execute(sql, p)
+            except sqlite3.IntegrityError as e:
+                gagal.append((i, f"data ganda / tidak valid ({e})"))
+    return gagal
+
+def import_rows(table, rows, progress=None):
+    """
+    Pipeline import: validasi -> hitung kolom turunan -> simpan per potongan.
+    `rows` adalah iterable dict (satu per baris file, header sudah dinormalisasi).
+    `progress(diproses, tersimpan)` dipanggil setiap satu potongan tersimpan.
+    Mengembalikan dict ringkasan: total, tersimpan, errors [(baris, pesan)].
+    """
+    result = {"total": 0, "tersimpan": 0, "errors": []}
+    for diproses, tersimpan in iter_import(table, rows, result):
+        if progress:
+            progress(diproses, tersimpan)
+    return result
+
+def iter_import(table, rows, result):
+    """
+    Generator di balik import_rows: yield (diproses, tersimpan) setiap satu
+    potongan tersimpan; ringkasan ditulis ke dict `result`. Dipakai langsung
+    oleh halaman import untuk mengalirkan progres ke browser.
+    """
+    lengkapi = LENGKAPI_TURUNAN[table]
+    # Satu tanggal acuan untuk seluruh file
+    sekarang = date.today()
+    batch = []
+
+    def flush():
+        gagal = simpan_batch(table, [data for _, data in batch])
+        for i, pesan in gagal:
+            if len(result["errors"]) < IMPORT_MAX_ERRORS:
+                result["errors"].append((batch[i][0], pesan))
+        result["tersimpan"] += len(batch) - len(gagal)
+        batch.clear()
+
+    try:
+        # Baris 1 adalah header, data dimulai dari baris 2
+        for line_no, raw in enumerate(rows, start=2):
+            result["total"] += 1
+            try:
+                batch.append((line_no, lengkapi(validasi_baris(table, raw), sekarang)))
+            except ValueError as e:
+                if len(result["errors"]) < IMPORT_MAX_ERRORS:
+                    result["errors"].append((line_no, str(e)))
+                continue
+            if len(batch) >= IMPORT_CHUNK_SIZE:
+                flush()
+                yield result["total"], result["tersimpan"]
+        if batch:
+            flush()
+            yield result["total"], result["tersimpan"]
+    finally:
+        result["errors"].sort()
+
+def handle_import(table, template):
+    """View bersama untuk halaman import siswa/guru"""
+    if request.method == "POST":
+        file = request.files.get("file")
+        if not file or file.filename == "":
+            flash("Pilih file CSV atau XLSX terlebih dahulu.", "warning")
+            return redirect(request.url)
+        if file.filename.rsplit(".", 1)[-1].lower() not in IMPORT_EXT:
+            flash("Format file harus .csv atau .xlsx.", "warning")
+            return redirect(request.url)
+
+        # Flask menutup file upload begitu view selesai, sebelum halaman
+        # selesai di-stream; isinya disalin ke file sementara milik import
+        salinan = tempfile.TemporaryFile()
+        shutil.copyfileobj(file.stream, salinan, FOTO_CHUNK_SIZE)
+        salinan.seek(0)
+        # Baris pertama dibaca sebelum halaman di-stream supaya file yang
+        # tidak bisa dibuka sama sekali masih dijawab redirect + flash
+        rows = iter_upload_rows(FileStorage(salinan, filename=file.filename))
+        try:
+            pertama = list(islice(rows, 1))
+        except ImportError:
+            salinan.close()
+            flash("Import XLSX membutuhkan paket openpyxl.", "danger")
+            return redirect(request.url)
+        except (UnicodeDecodeError, csv.Error) as e:
+            salinan.close()
+            flash(f"File tidak dapat dibaca: {e}", "danger")
+            return redirect(request.url)
+
+        result = {"total": 0, "tersimpan": 0, "errors": []}
+
+        def progress():
+            """Progres per potongan untuk template; ringkasan masuk ke `result`"""
+            try:
+                for diproses, tersimpan in iter_import(table, chain(pertama, rows), result):
+                    current_app.logger.info("import %s: %d baris diproses, %d tersimpan",
+                                            table, diproses, tersimpan)
+                    yield diproses, tersimpan
+            except (UnicodeDecodeError, csv.Error) as e:
+                # Potongan sebelumnya sudah tersimpan
+                result["gagal_baca"] = f"File tidak dapat dibaca: {e}"
+            finally:
+                salinan.close()
+
+        # Progres dikirim apa adanya (tanpa menunggu potongan 16 KB)
+        return render_stream(template, chunk_chars=0, title=f"Import {table.title()}",
+                             result=result, progress=progress(), fields=IMPORT_FIELDS[table])
+
+    return render_template(template, title=f"Import {table.title()}", result=None,
+                           progress=None, fields=IMPORT_FIELDS[table])
+
+# ---------- Dashboard stats ----------
+# Snapshot statistik dashboard disimpan di memori proses bersama versi tabel
+# siswa & guru (data_versi) saat dihitung, sama seperti cached_page. Setiap
+# perubahan lewat proses mana pun menaikkan versi itu lewat trigger, jadi
+# snapshot tidak perlu diinvalidasi manual dan tidak pernah basi.
+_stats_cache = {}   # path database -> (versi, data)
+_stats_lock = threading.Lock()
+
+def hitung_dashboard_stats():
+    """Menghitung semua angka dashboard dengan satu kali scan tabel siswa"""
+    rows = query_db("""SELECT jurusan, kelas, COUNT(*) AS c
+                       FROM siswa GROUP BY jurusan, kelas""")
+    total_guru = query_db("SELECT COUNT(*) AS c FROM guru", one=True)["c"]
+
+    total_siswa = 0
+    kelas_set = set()
+    per_jurusan = {}  # urutan mengikuti GROUP BY (jurusan terurut)
+    for r in rows:
+        total_siswa += r["c"]
+        if r["kelas"] is not None:
+            kelas_set.add(r["kelas"])
+        per_jurusan[r["jurusan"]] = per_jurusan.get(r["jurusan"], 0) + r["c"]
+
+    return {
+        "total_siswa": total_siswa,
+        "total_guru": total_guru,
+        "total_kelas": len(kelas_set),
+        "total_jurusan": sum(1 for j in per_jurusan if j is not None),
+        "chart_labels": [j or "Undefined" for j in per_jurusan],
+        "chart_values": list(per_jurusan.values()),
+    }
+
+def get_dashboard_stats():
+    path = db_path()
+    versi, _ = versi_data(VERSI_TABLES)
+    with _stats_lock:
+        versi_cache, data = _stats_cache.get(path, (None, None))
+    if versi_cache == versi:
+        return data
+    data = hitung_dashboard_stats()
+    with _stats_lock:
+        _stats_cache[path] = (versi, data)
+    return data
+
+# ---------- Cache halaman (ETag & fragment) ----------
+# Halaman daftar/detail bergantung pada satu atau dua tabel. Versi tabel
+# (data_versi, dinaikkan trigger) + URL menjadi ETag: bila browser sudah
+# punya versi yang sama dijawab 304 tanpa query data maupun render. Bila
+# belum, HTML hasil render disimpan di cache LRU per proses sehingga
+# worker yang sama cukup mengirim ulang string yang sudah jadi.
+PAGE_CACHE_MAX_ENTRIES = 256
+PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024   # total per proses worker
+PAGE_CACHE_MAX_CHARS = 512 * 1024   # halaman lebih besar selalu di-stream ulang
+STREAM_CHUNK_CHARS = 16 * 1024
+
+class LRUCache:
+    """
+    Cache LRU sederhana yang aman dipakai beberapa thread, dibatasi jumlah
+    entri dan total ukuran nilai (sys.getsizeof) dalam byte
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        size = sys.getsizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._bytes += size - self._sizes.get(key, 0)
+            self._data[key] = value
+            self._sizes[key] = size
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                lama, _ = self._data.popitem(last=False)
+                self._bytes -= self._sizes.pop(lama)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+_page_cache = LRUCache(PAGE_CACHE_MAX_ENTRIES, PAGE_CACHE_MAX_BYTES)
+
+@lru_cache(maxsize=1)
+def versi_build():
+    """Penanda versi kode & template: ETag lama tidak berlaku setelah deploy"""
+    paths = [os.path.abspath(__file__)]
+    for root, _, files in os.walk(os.path.join(APP_DIR, "templates")):
+        paths.extend(os.path.join(root, f) for f in files)
+    return max(int(os.path.getmtime(p)) for p in paths)
+
+def versi_data(tables):
+    """(versi, waktu ubah terakhir) tabel-tabel yang dipakai satu halaman"""
+    placeholders = ", ".join("?" for _ in tables)
+    rows = query_db(f"SELECT tabel, versi, diubah FROM data_versi WHERE tabel IN ({placeholders})",
+                    tables)
+    versi = tuple(sorted((r["tabel"], r["versi"]) for r in rows))
+    diubah = max((r["diubah"] for r in rows), default=0)
+    return versi, datetime.fromtimestamp(max(diubah, versi_build()), timezone.utc)
+
+def render_stream(template, chunk_chars=STREAM_CHUNK_CHARS, **context):
+    """
+    Seperti render_template, tetapi HTML dikirim bertahap (stream_template)
+    dalam potongan sekitar `chunk_chars` karakter: header halaman dan
+    baris pertama sudah sampai ke browser selagi baris berikutnya masih
+    dibaca dari cursor. Mengembalikan generator (view boleh langsung
+    mengembalikannya; cached_page ikut menyimpannya ke cache).
+    """
+    # Flash message diambil sekarang: cookie session sudah terkirim sebelum
+    # base.html dirender, jadi pop di tengah stream tidak ikut tersimpan.
+    # Hasilnya disimpan di request context dan dipakai lagi oleh template.
+    get_flashed_messages(with_categories=True)
+    parts = stream_template(template, **context)
+
+    def potongan():
+        buf, size = [], 0
+        for part in parts:
+            buf.append(part)
+            size += len(part)
+            if size >= chunk_chars:
+                yield "".join(buf)
+                buf, size = [], 0
+        if buf:
+            yield "".join(buf)
+    return potongan()
+
+def simpan_stream(chunks, key):
+    """Meneruskan potongan stream sambil mengumpulkannya untuk _page_cache"""
+    parts, size = [], 0
+    for chunk in chunks:
+        if parts is not None:
+            parts.append(chunk)
+            size += len(chunk)
+            if size > PAGE_CACHE_MAX_CHARS:
+                parts = None
+        yield chunk
+    # Hanya stream yang selesai utuh yang disimpan (bukan yang diputus klien)
+    if parts is not None:
+        _page_cache.set(key, "".join(parts))
+
+def cached_page(*tables):
+    """
+    Decorator view GET yang isinya hanya bergantung pada `tables`:
+    ETag/Last-Modified + 304, lalu cache LRU untuk HTML hasil render.
+    View boleh mengembalikan string atau generator (render_stream); hasil
+    stream disimpan ke cache setelah selesai dikirim.
+    Request yang membawa flash message tidak di-cache (isi layout berbeda).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != "GET" or session.get("_flashes"):
+                return view(*args, **kwargs)
+
+            versi, last_modified = versi_data(tables)
+            key = (db_path(), request.full_path, versi, versi_build())
+            etag = hashlib.sha1(repr(key).encode()).hexdigest()
+            if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+                resp = Response(status=304)
+            else:
+                html = _page_cache.get(key)
+                if html is None:
+                    rv = view(*args, **kwargs)
+                    if isinstance(rv, str):
+                        _page_cache.set(key, rv)
+                        resp = make_response(rv)
+                    elif isinstance(rv, Iterator):
+                        resp = Response(simpan_stream(rv, key), mimetype="text/html")
+                    else:
+                        # Redirect (mis. data tidak ditemukan) tidak di-cache
+                        return rv
+                else:
+                    resp = make_response(html)
+            resp.set_etag(etag)
+            resp.last_modified = last_modified
+            # Browser selalu bertanya ulang; jawabannya 304 selama data sama
+            resp.cache_control.no_cache = True
+            resp.cache_control.private = True
+            return resp
+        return wrapper
+    return decorator
+
+# ---------- Operasi massal ----------
+# Hapus / ubah banyak baris sekaligus dengan satu pernyataan SQL berbasis
+# himpunan dalam satu transaksi. Baris dipilih lewat daftar id (checkbox
+# name="id") atau filter kolom (cakupan=filter, filter_<kolom>=nilai). Foto
+# yang tidak lagi dirujuk dibersihkan sekaligus setelahnya.
+MASSAL_KOLOM = {
+    "siswa": ("kelas", "jurusan", "asal_sekolah"),
+    "guru": ("jabatan", "agama", "pendidikan"),
+}
+MASSAL_FILTER = {"siswa": ("kelas", "jurusan"), "guru": ("jabatan",)}
+# Urutan kenaikan kelas; kelas terakhir adalah angkatan yang lulus
+KENAIKAN_KELAS = (("X", "XI"), ("XI", "XII"))
+KELAS_LULUS = "XII"
+
+def target_massal(table):
+    """(where_sql, args) baris sasaran dari form; ValueError bila kosong"""
+    if request.form.get("cakupan") == "filter":
+        conditions, args = [], []
+        for col in MASSAL_FILTER[table]:
+            nilai = form_teks(f"filter_{col}")
+            if nilai:
+                conditions.append(f"{col} = ?")
+                args.append(nilai)
+        if not conditions:
+            raise ValueError("pilih minimal satu filter")
+        return " AND ".join(conditions), args
+    try:
+        ids = sorted({int(i) for i in request.form.getlist("id")})
+    except ValueError:
+        raise ValueError("id tidak valid")
+    if not ids:
+        raise ValueError("belum ada data yang dipilih")
+    return "id IN (SELECT value FROM json_each(?))", [json.dumps(ids)]
+
+def hapus_massal(table, where_sql, args):
+    """DELETE satu pernyataan; mengembalikan jumlah baris terhapus"""
+    with transaction() as conn:
+        fotos = [r["foto"] for r in conn.execute(
+            f"DELETE FROM {table} WHERE {where_sql} RETURNING foto", args).fetchall()]
+    hapus_foto_massal(table, fotos)
+    return len(fotos)
+
+def ubah_massal(table, kolom, nilai, where_sql, args):
+    """UPDATE satu kolom (dari MASSAL_KOLOM) untuk semua baris sasaran"""
+    if kolom not in MASSAL_KOLOM[table]:
+        raise ValueError(f"kolom tidak bisa diubah massal: {kolom}")
+    with transaction() as conn:
+        return conn.execute(f"UPDATE {table} SET {kolom} = ? WHERE {where_sql}",
+                            [nilai] + args).rowcount
+
+def naik_kelas(jurusan=None, hapus_lulus=False):
+    """
+    Kenaikan kelas satu angkatan secara atomik (X -> XI, XI -> XII) dengan
+    satu UPDATE. Bila hapus_lulus, siswa kelas XII dihapus lebih dulu dalam
+    transaksi yang sama. Mengembalikan (jumlah naik, jumlah lulus).
+    """
+    filter_sql, filter_args = ("AND jurusan = ?", [jurusan]) if jurusan else ("", [])
+    case_sql = " ".join("WHEN ? THEN ?" for _ in KENAIKAN_KELAS)
+    case_args = [k for pasangan in KENAIKAN_KELAS for k in pasangan]
+    asal = json.dumps([a for a, _ in KENAIKAN_KELAS])
+    fotos = []
+    with transaction() as conn:
+        if hapus_lulus:
+            fotos = [r["foto"] for r in conn.execute(
+                f"DELETE FROM siswa WHERE kelas = ? {filter_sql} RETURNING foto",
+                [KELAS_LULUS] + filter_args).fetchall()]
+        naik = conn.execute(f"""UPDATE siswa SET kelas = CASE kelas {case_sql} END
+                                WHERE kelas IN (SELECT value FROM json_each(?)) {filter_sql}""",
+                            case_args + [asal] + filter_args).rowcount
+    hapus_foto_massal("siswa", fotos)
+    return naik, len(fotos)
+
+def handle_massal(table, index_endpoint):
+    """View bersama untuk aksi massal siswa/guru (aksi=hapus | ubah:<kolom>)"""
+    aksi, _, kolom = request.form.get("aksi", "").partition(":")
+    try:
+        where_sql, args = target_massal(table)
+        if aksi == "hapus":
+            jumlah = hapus_massal(table, where_sql, args)
+            flash(f"{jumlah} data dihapus.", "danger")
+        elif aksi == "ubah":
+            jumlah = ubah_massal(table, kolom, form_teks("nilai"), where_sql, args)
+            flash(f"{kolom} diubah untuk {jumlah} data.", "success")
         else:
-            s_dict["usia_tahun_realtime"] = 0
-            s_dict["usia_bulan_realtime"] = 0
-        processed.append(s_dict)
-    return processed
+            raise ValueError("aksi tidak dikenal")
+    except ValueError as e:
+        flash(f"Aksi massal dibatalkan: {e}", "warning")
+    return redirect(url_for(index_endpoint))
 
 # ---------- Routes: Dashboard ----------
-@app.route("/dashboard")
-@app.route("/")
+@main_bp.route("/dashboard")
+@main_bp.route("/")
 def dashboard():
-    total_siswa = query_db("SELECT COUNT(*) AS c FROM siswa", one=True)["c"]
-    total_guru = query_db("SELECT COUNT(*) AS c FROM guru", one=True)["c"]
-    total_kelas = query_db("SELECT COUNT(DISTINCT kelas) AS c FROM siswa", one=True)["c"]
-    total_jurusan = query_db("SELECT COUNT(DISTINCT jurusan) AS c FROM siswa", one=True)["c"]
-
-    # simple stats per jurusan for chart
-    jurusan_rows = query_db("SELECT jurusan, COUNT(*) AS c FROM siswa GROUP BY jurusan")
-    labels = [r["jurusan"] or "Undefined" for r in jurusan_rows]
-    values = [r["c"] for r in jurusan_rows]
-
-    return render_template("dashboard.html",
-                            total_siswa=total_siswa,
-                            total_guru=total_guru,
-                            total_kelas=total_kelas,
-                            total_jurusan=total_jurusan,
-                            chart_labels=labels,
-                            chart_values=values)
+    return render_template("dashboard.html", **get_dashboard_stats())
 
 # ==========================
 # CRUD SISWA
 # ==========================
-@app.route("/siswa")
+@siswa_bp.route("/siswa")
+@cached_page("siswa")
 def siswa_index():
-    siswa = query_db("SELECT * FROM siswa ORDER BY nama ASC")
-    # Hitung usia real-time sebelum dikirim ke template
-    siswa_data = process_siswa_data(siswa)
-    return render_template("siswa/index.html", siswa=siswa_data, keyword="")
+    page = paginate_keyset("siswa")
+    # Field turunan dihitung per baris selagi halaman di-stream
+    siswa_data = process_siswa_data(page["rows"])
+    return render_stream("siswa/index.html", siswa=siswa_data, keyword="", page=page,
+                         kelas_list=get_lookup("kelas"), jurusan_list=get_lookup("jurusan"))
 
-@app.route("/siswa/tambah", methods=["GET", "POST"])
+@siswa_bp.route("/siswa/tambah", methods=["GET", "POST"])
 def siswa_tambah():
     if request.method == "POST":
         # Ambil data baru
         nama = request.form.get("nama")
-        kelas = request.form.get("kelas")
-        jurusan = request.form.get("jurusan")
+        kelas = form_teks("kelas")
+        jurusan = form_teks("jurusan")
         tempat_lahir = request.form.get("tempat_lahir")
-        tanggal_lahir = request.form.get("tanggal_lahir")
         asal_sekolah = request.form.get("asal_sekolah")
         alamat = request.form.get("alamat")
+        try:
+            tanggal_lahir, = form_tanggal("tanggal_lahir")
+        except ValueError as e:
+            flash(f"Tanggal tidak valid: {e}", "warning")
+            return redirect(request.url)
         
         # Hitung usia otomatis
         usia_tahun, usia_bulan = hitung_usia(tanggal_lahir)
 
-        foto_file = request.files.get("foto")
-        foto_filename = None
-        if foto_file and foto_file.filename != "" and allowed_file(foto_file.filename):
-            foto_filename = secure_filename(foto_file.filename)
-            foto_file.save(os.path.join(UPLOAD_SISWA, foto_filename))
-        
         insert_values = (nama, kelas, jurusan, tempat_lahir, tanggal_lahir, asal_sekolah, 
-                            usia_tahun, usia_bulan, alamat, foto_filename)
+                            usia_tahun, usia_bulan, alamat)
 
         # Menggunakan urutan kolom yang baru
-        query_db("""INSERT INTO siswa (nama, kelas, jurusan, tempat_lahir, tanggal_lahir, 
-                                        asal_sekolah, usia_tahun, usia_bulan, alamat, foto) 
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        siswa_id = execute_db("""INSERT INTO siswa (nama, kelas, jurusan, tempat_lahir, tanggal_lahir, 
+                                        asal_sekolah, usia_tahun, usia_bulan, alamat) 
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                     insert_values)
 
+        # Foto dipasang worker setelah diproses (jadwalkan_foto)
+        jadwalkan_foto("siswa", siswa_id, request.files.get("foto"))
         flash("Siswa berhasil ditambahkan.", "success")
-        return redirect(url_for("siswa_index"))
+        return redirect(url_for("siswa.siswa_index"))
 
-    return render_template("siswa/tambah.html")
+    return render_template("siswa/tambah.html", kelas_list=get_lookup("kelas"),
+                           jurusan_list=get_lookup("jurusan"))
 
-@app.route("/siswa/edit/<int:id>", methods=["GET", "POST"])
+@siswa_bp.route("/siswa/edit/<int:id>", methods=["GET", "POST"])
 def siswa_edit(id):
     siswa = query_db("SELECT * FROM siswa WHERE id=?", (id,), one=True)
     if not siswa:
         flash("Data siswa tidak ditemukan.", "warning")
-        return redirect(url_for("siswa_index"))
+        return redirect(url_for("siswa.siswa_index"))
 
-    # Hitung usia real-time untuk ditampilkan di form edit
-    siswa_data = dict(siswa)
-    usia_tahun, usia_bulan = hitung_usia(siswa_data.get("tanggal_lahir"))
-    siswa_data["usia_tahun_realtime"] = usia_tahun
-    siswa_data["usia_bulan_realtime"] = usia_bulan
+    # Usia untuk ditampilkan di form edit (kolom tersimpan selalu terkini)
+    siswa_data = next(process_siswa_data([siswa]))
 
 
     if request.method == "POST":
         # Ambil data baru
         nama = request.form.get("nama")
-        kelas = request.form.get("kelas")
-        jurusan = request.form.get("jurusan")
+        kelas = form_teks("kelas")
+        jurusan = form_teks("jurusan")
         tempat_lahir = request.form.get("tempat_lahir")
-        tanggal_lahir = request.form.get("tanggal_lahir")
         asal_sekolah = request.form.get("asal_sekolah")
         alamat = request.form.get("alamat")
+        try:
+            tanggal_lahir, = form_tanggal("tanggal_lahir")
+        except ValueError as e:
+            flash(f"Tanggal tidak valid: {e}", "warning")
+            return redirect(request.url)
         
         # Hitung usia otomatis
         usia_tahun, usia_bulan = hitung_usia(tanggal_lahir)
 
-        foto_file = request.files.get("foto")
-        foto_filename = siswa["foto"]
-
-        if foto_file and foto_file.filename != "" and allowed_file(foto_file.filename):
-            # optionally delete old file (skip if you want to keep)
-            if foto_filename:
-                try:
-                    os.remove(os.path.join(UPLOAD_SISWA, foto_filename))
-                except Exception:
-                    pass
-            foto_filename = secure_filename(foto_file.filename)
-            foto_file.save(os.path.join(UPLOAD_SISWA, foto_filename))
-        
         update_values = (nama, kelas, jurusan, tempat_lahir, tanggal_lahir, asal_sekolah,
-                            usia_tahun, usia_bulan, alamat, foto_filename, id)
+                            usia_tahun, usia_bulan, alamat, id)
 
         # Menggunakan urutan kolom yang baru
-        query_db("""UPDATE siswa SET 
+        execute_db("""UPDATE siswa SET 
                     nama=?, kelas=?, jurusan=?, tempat_lahir=?, tanggal_lahir=?, 
-                    asal_sekolah=?, usia_tahun=?, usia_bulan=?, alamat=?, foto=? 
+                    asal_sekolah=?, usia_tahun=?, usia_bulan=?, alamat=? 
                     WHERE id=?""",
                     update_values)
 
+        # Foto baru menggantikan (dan membersihkan) foto lama setelah diproses
+        jadwalkan_foto("siswa", id, request.files.get("foto"))
         flash("Data siswa berhasil diperbarui.", "success")
-        return redirect(url_for("siswa_index"))
+        return redirect(url_for("siswa.siswa_index"))
 
-    return render_template("siswa/edit.html", siswa=siswa_data)
+    return render_template("siswa/edit.html", siswa=siswa_data, kelas_list=get_lookup("kelas"),
+                           jurusan_list=get_lookup("jurusan"))
 
-@app.route("/siswa/hapus/<int:id>")
+@siswa_bp.route("/siswa/hapus/<int:id>")
 def siswa_hapus(id):
     siswa = query_db("SELECT foto FROM siswa WHERE id=?", (id,), one=True)
-    if siswa and siswa["foto"]:
-        try:
-            os.remove(os.path.join(UPLOAD_SISWA, siswa["foto"]))
-        except Exception:
-            pass
-    query_db("DELETE FROM siswa WHERE id=?", (id,))
+    execute_db("DELETE FROM siswa WHERE id=?", (id,))
+    if siswa:
+        hapus_foto("siswa", siswa["foto"])
     flash("Data siswa dihapus.", "danger")
-    return redirect(url_for("siswa_index"))
+    return redirect(url_for("siswa.siswa_index"))
 
-@app.route("/cari_siswa")
+@siswa_bp.route("/cari_siswa")
+@cached_page("siswa")
 def cari_siswa():
-    keyword = request.args.get("keyword", "")
-    siswa = query_db("""SELECT * FROM siswa
-                            WHERE nama LIKE ? OR kelas LIKE ? OR jurusan LIKE ? OR alamat LIKE ? OR asal_sekolah LIKE ? OR tempat_lahir LIKE ?
-                            ORDER BY nama ASC""",
-                            (f"%{keyword}%", f"%{keyword}%", f"%{keyword}%", f"%{keyword}%", f"%{keyword}%", f"%{keyword}%"))
-    # Hitung usia real-time sebelum dikirim ke template
-    siswa_data = process_siswa_data(siswa)
-    return render_template("siswa/index.html", siswa=siswa_data, keyword=keyword)
+    keyword = request.args.get("keyword", "").strip()
+    if fts_query(keyword):
+        page = search_fts("siswa", keyword)
+    else:
+        page = paginate_keyset("siswa")
+    # Field turunan dihitung per baris selagi halaman di-stream
+    siswa_data = process_siswa_data(page["rows"])
+    return render_stream("siswa/index.html", siswa=siswa_data, keyword=keyword, page=page,
+                         kelas_list=get_lookup("kelas"), jurusan_list=get_lookup("jurusan"))
+
+@siswa_bp.route("/siswa/import", methods=["GET", "POST"])
+def siswa_import():
+    return handle_import("siswa", "siswa/import.html")
+
+@siswa_bp.route("/siswa/massal", methods=["POST"])
+def siswa_massal():
+    return handle_massal("siswa", "siswa.siswa_index")
+
+@siswa_bp.route("/siswa/naik-kelas", methods=["POST"])
+def siswa_naik_kelas():
+    naik, lulus = naik_kelas(form_teks("jurusan"), hapus_lulus=bool(request.form.get("hapus_lulus")))
+    pesan = f"{naik} siswa naik kelas."
+    if lulus:
+        pesan += f" {lulus} siswa kelas {KELAS_LULUS} lulus dan dihapus."
+    flash(pesan, "success")
+    return redirect(url_for("siswa.siswa_index"))
 
 # ==========================
 # CRUD GURU
 # ==========================
 
 @bp.route("/")
+@cached_page("guru")
 def guru_index():
-    guru = query_db("SELECT * FROM guru ORDER BY nama ASC")
-    return render_template("guru/index.html", guru=guru)
+    q = request.args.get("q", "").strip()
+    if fts_query(q):
+        page = search_fts("guru", q)
+    else:
+        page = paginate_keyset("guru")
+    jabatan_list = [r["jabatan"] for r in query_db(
+        "SELECT DISTINCT jabatan FROM guru WHERE jabatan IS NOT NULL ORDER BY jabatan")]
+    return render_stream("guru/index.html", guru=page["rows"], page=page, q=q,
+                         jabatan_list=jabatan_list)
 
 
 @bp.route("/tambah", methods=["GET", "POST"])
@@ -323,46 +2654,48 @@ def guru_tambah():
     if request.method == "POST":
         # 1. Ambil data mentah dari form (10 fields)
         nama = request.form.get("nama")
-        nip = request.form.get("nip")
+        nip = normalisasi_nomor_induk(request.form.get("nip"))
         tempat_lahir = request.form.get("tempat_lahir")
-        tanggal_lahir = request.form.get("tanggal_lahir")
         agama = request.form.get("agama")
         jabatan = request.form.get("jabatan")
-        nuptk = request.form.get("nuptk")
-        sk_pertama = request.form.get("sk_pertama")
-        sk_terakhir = request.form.get("sk_terakhir")
+        nuptk = normalisasi_nomor_induk(request.form.get("nuptk"))
         pendidikan = request.form.get("pendidikan")
+        try:
+            tanggal_lahir, sk_pertama, sk_terakhir = form_tanggal(
+                "tanggal_lahir", "sk_pertama", "sk_terakhir")
+        except ValueError as e:
+            flash(f"Tanggal tidak valid: {e}", "warning")
+            return redirect(request.url)
         
         # 2. Hitung Masa Kerja secara otomatis berdasarkan tanggal yang dimasukkan (6 fields)
         mk_total_tahun, mk_total_bulan = hitung_selisih_tahun_bulan(sk_pertama)
         mk_gol_tahun, mk_gol_bulan = hitung_selisih_tahun_bulan(sk_terakhir)
         sisa_mk_tahun, sisa_mk_bulan = hitung_sisa_masa_kerja(tanggal_lahir)
-
-        foto_file = request.files.get("foto")
-        foto_filename = None
-        if foto_file and foto_file.filename != "" and allowed_file(foto_file.filename):
-            foto_filename = secure_filename(foto_file.filename)
-            foto_file.save(os.path.join(UPLOAD_GURU, foto_filename))
+        pensiun = tanggal_pensiun_iso(tanggal_lahir)
 
         # 3. Gabungkan data dalam urutan yang sesuai dengan kolom SQL (Total 17 values)
         insert_values = (
             nama, nip, tempat_lahir, tanggal_lahir, agama, jabatan, nuptk,
             sk_pertama, sk_terakhir, pendidikan, # Sumber data
             mk_gol_tahun, mk_gol_bulan, mk_total_tahun, mk_total_bulan, # Hasil perhitungan
-            sisa_mk_tahun, sisa_mk_bulan,
-            foto_filename # Foto
+            sisa_mk_tahun, sisa_mk_bulan, pensiun,
         )
         
         # 4. Simpan data yang sudah dihitung ke database.
-        # PERBAIKAN UTAMA: Mengurangi jumlah placeholder (?) dari 18 menjadi 17.
-        query_db("""INSERT INTO guru (
-                    nama, nip, tempat_lahir, tanggal_lahir, agama, jabatan, nuptk,
-                    sk_pertama, sk_terakhir, pendidikan, 
-                    mk_gol_tahun, mk_gol_bulan, mk_total_tahun, mk_total_bulan,
-                    sisa_mk_tahun, sisa_mk_bulan, foto)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                    insert_values) # Tepat 17 values
-
+        try:
+            guru_id = execute_db("""INSERT INTO guru (
+                        nama, nip, tempat_lahir, tanggal_lahir, agama, jabatan, nuptk,
+                        sk_pertama, sk_terakhir, pendidikan, 
+                        mk_gol_tahun, mk_gol_bulan, mk_total_tahun, mk_total_bulan,
+                        sisa_mk_tahun, sisa_mk_bulan, tanggal_pensiun)
+                        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+                        insert_values) # Tepat 17 values
+        except sqlite3.IntegrityError:
+            flash("NIP atau NUPTK sudah terdaftar.", "warning")
+            return redirect(request.url)
+
+        # 5. Foto dipasang worker setelah diproses (jadwalkan_foto)
+        jadwalkan_foto("guru", guru_id, request.files.get("foto"))
         flash("Data guru berhasil ditambahkan.", "success")
         return redirect(url_for("guru.guru_index"))
 
@@ -370,27 +2703,15 @@ def guru_tambah():
 
 
 @bp.route("/kartu/<int:id>")
+@cached_page("guru")
 def guru_kartu(id):
     guru = query_db("SELECT * FROM guru WHERE id=?", (id,), one=True)
     if not guru:
         flash("Data guru tidak ditemukan.", "warning")
         return redirect(url_for("guru.guru_index"))
 
-    # Recalculate derived fields based on SK dates and Tgl Lahir for REAL-TIME display
-    mk_total_tahun, mk_total_bulan = hitung_selisih_tahun_bulan(guru["sk_pertama"])
-    mk_gol_tahun, mk_gol_bulan = hitung_selisih_tahun_bulan(guru["sk_terakhir"])
-    sisa_tahun, sisa_bulan = hitung_sisa_masa_kerja(guru["tanggal_lahir"])
-
-    # Update the dictionary for rendering
-    guru = dict(guru)
-    guru["mk_total_tahun"] = mk_total_tahun
-    guru["mk_total_bulan"] = mk_total_bulan
-    guru["mk_gol_tahun"] = mk_gol_tahun
-    guru["mk_gol_bulan"] = mk_gol_bulan
-    guru["sisa_mk_tahun"] = sisa_tahun
-    guru["sisa_mk_bulan"] = sisa_bulan
-
-    return render_template("guru/kartu.html", guru=guru)
+    # Kolom masa kerja tersimpan selalu terkini (refresh_kolom_turunan)
+    return render_template("guru/kartu.html", guru=dict(guru))
 
 
 @bp.route("/edit/<int:id>", methods=["GET", "POST"])
@@ -403,54 +2724,50 @@ def guru_edit(id):
     if request.method == "POST":
         # 1. Ambil data mentah dari form (10 fields)
         nama = request.form.get("nama")
-        nip = request.form.get("nip")
+        nip = normalisasi_nomor_induk(request.form.get("nip"))
         tempat_lahir = request.form.get("tempat_lahir")
-        tanggal_lahir = request.form.get("tanggal_lahir")
         agama = request.form.get("agama")
         jabatan = request.form.get("jabatan")
-        nuptk = request.form.get("nuptk")
-        sk_pertama = request.form.get("sk_pertama")
-        sk_terakhir = request.form.get("sk_terakhir")
+        nuptk = normalisasi_nomor_induk(request.form.get("nuptk"))
         pendidikan = request.form.get("pendidikan")
+        try:
+            tanggal_lahir, sk_pertama, sk_terakhir = form_tanggal(
+                "tanggal_lahir", "sk_pertama", "sk_terakhir")
+        except ValueError as e:
+            flash(f"Tanggal tidak valid: {e}", "warning")
+            return redirect(request.url)
 
         # 2. Hitung Masa Kerja secara otomatis berdasarkan tanggal yang dimasukkan (6 fields)
         mk_total_tahun, mk_total_bulan = hitung_selisih_tahun_bulan(sk_pertama)
         mk_gol_tahun, mk_gol_bulan = hitung_selisih_tahun_bulan(sk_terakhir)
         sisa_mk_tahun, sisa_mk_bulan = hitung_sisa_masa_kerja(tanggal_lahir)
+        pensiun = tanggal_pensiun_iso(tanggal_lahir)
 
-        foto_file = request.files.get("foto")
-        foto_filename = guru["foto"]
-
-        if foto_file and foto_file.filename != "" and allowed_file(foto_file.filename):
-            if foto_filename:
-                try:
-                    os.remove(os.path.join(UPLOAD_GURU, foto_filename))
-                except:
-                    pass
-            foto_filename = secure_filename(foto_file.filename)
-            foto_file.save(os.path.join(UPLOAD_GURU, foto_filename))
-
-        # 3. Gabungkan data dalam urutan yang sesuai dengan kolom SQL baru (16 fields + foto + id)
+        # 3. Gabungkan data dalam urutan yang sesuai dengan kolom SQL baru (17 fields + id)
         update_values = (
             nama, nip, tempat_lahir, tanggal_lahir, agama, jabatan, nuptk,
             sk_pertama, sk_terakhir, pendidikan, # Sumber data
             mk_gol_tahun, mk_gol_bulan, mk_total_tahun, mk_total_bulan, # Hasil perhitungan
-            sisa_mk_tahun, sisa_mk_bulan,
-            foto_filename, # Foto
+            sisa_mk_tahun, sisa_mk_bulan, pensiun,
             id # ID untuk WHERE (PENTING: ID harus di akhir)
         )
 
         # 4. Perbarui data di database dengan urutan kolom baru
-        query_db("""
-            UPDATE guru SET
-                nama=?, nip=?, tempat_lahir=?, tanggal_lahir=?, agama=?, jabatan=?, nuptk=?,
-                sk_pertama=?, sk_terakhir=?, pendidikan=?, 
-                mk_gol_tahun=?, mk_gol_bulan=?, mk_total_tahun=?, mk_total_bulan=?,
-                sisa_mk_tahun=?, sisa_mk_bulan=?,
-                foto=? 
-            WHERE id=?
-        """, update_values)
-
+        try:
+            execute_db("""
+                UPDATE guru SET
+                    nama=?, nip=?, tempat_lahir=?, tanggal_lahir=?, agama=?, jabatan=?, nuptk=?,
+                    sk_pertama=?, sk_terakhir=?, pendidikan=?, 
+                    mk_gol_tahun=?, mk_gol_bulan=?, mk_total_tahun=?, mk_total_bulan=?,
+                    sisa_mk_tahun=?, sisa_mk_bulan=?, tanggal_pensiun=?
+                WHERE id=?
+            """, update_values)
+        except sqlite3.IntegrityError:
+            flash("NIP atau NUPTK sudah dipakai guru lain.", "warning")
+            return redirect(request.url)
+
+        # Foto baru menggantikan (dan membersihkan) foto lama setelah diproses
+        jadwalkan_foto("guru", id, request.files.get("foto"))
         flash("Data guru berhasil diperbarui.", "success")
         return redirect(url_for("guru.guru_index"))
 
@@ -460,17 +2777,15 @@ def guru_edit(id):
 @bp.route("/hapus/<int:id>")
 def guru_hapus(id):
     guru = query_db("SELECT foto FROM guru WHERE id=?", (id,), one=True)
-    if guru and guru["foto"]:
-        try:
-            os.remove(os.path.join(UPLOAD_GURU, guru["foto"]))
-        except Exception:
-            pass
-    query_db("DELETE FROM guru WHERE id=?", (id,))
+    execute_db("DELETE FROM guru WHERE id=?", (id,))
+    if guru:
+        hapus_foto("guru", guru["foto"])
     flash("Data guru dihapus.", "danger")
     return redirect(url_for("guru.guru_index"))
 
 
 @bp.route("/detail/<int:id>")
+@cached_page("guru")
 def guru_detail(id):
     guru = query_db("SELECT * FROM guru WHERE id = ?", [id], one=True)
 
@@ -478,19 +2793,10 @@ def guru_detail(id):
         flash("Data guru tidak ditemukan.", "warning")
         return redirect(url_for("guru.guru_index"))
     
-    # Hitung Masa Kerja Total (berdasarkan SK_PERTAMA)
-    masa_total_tahun, masa_total_bulan = hitung_selisih_tahun_bulan(guru["sk_pertama"])
-
-    # Hitung Masa Kerja Golongan (berdasarkan SK_TERAKHIR)
-    masa_golongan_tahun, masa_golongan_bulan = hitung_selisih_tahun_bulan(guru["sk_terakhir"])
-
-    # Hitung Sisa Masa Kerja (berdasarkan Tanggal Lahir)
-    sisa_tahun, sisa_bulan = hitung_sisa_masa_kerja(guru["tanggal_lahir"])
-
-    # Format data untuk dikirim ke template
-    masa_total = (masa_total_tahun, masa_total_bulan)
-    masa_golongan = (masa_golongan_tahun, masa_golongan_bulan)
-    sisa = (sisa_tahun, sisa_bulan)
+    # Masa kerja diambil dari kolom tersimpan (diperbarui refresh_kolom_turunan)
+    masa_total = (guru["mk_total_tahun"] or 0, guru["mk_total_bulan"] or 0)
+    masa_golongan = (guru["mk_gol_tahun"] or 0, guru["mk_gol_bulan"] or 0)
+    sisa = (guru["sisa_mk_tahun"] or 0, guru["sisa_mk_bulan"] or 0)
     
     guru_data = dict(guru)
     
@@ -502,12 +2808,1003 @@ def guru_detail(id):
         sisa=sisa
     )
 
-@bp.route("/import")
+@bp.route("/import", methods=["GET", "POST"])
 def guru_import():
-    return render_template("guru/import.html", title="Import Guru")
+    return handle_import("guru", "guru/import.html")
+
+@bp.route("/massal", methods=["POST"])
+def guru_massal():
+    return handle_massal("guru", "guru.guru_index")
+
+# ==========================
+# API JSON (siswa & guru)
+# ==========================
+# Data dialirkan langsung dari cursor database lewat generator: tidak ada
+# daftar lengkap di memori, dan byte pertama terkirim sebelum query selesai.
+API_COLUMNS = {
+    "siswa": ("id", "nama", "kelas", "jurusan", "tempat_lahir", "tanggal_lahir",
+              "asal_sekolah", "usia_tahun", "usia_bulan", "alamat", "foto"),
+    "guru": ("id", "nama", "nip", "tempat_lahir", "tanggal_lahir", "agama", "jabatan",
+             "nuptk", "sk_pertama", "sk_terakhir", "pendidikan",
+             "mk_gol_tahun", "mk_gol_bulan", "mk_total_tahun", "mk_total_bulan",
+             "sisa_mk_tahun", "sisa_mk_bulan", "tanggal_pensiun", "foto"),
+}
+API_FETCH_SIZE = 500
+API_RESERVED_ARGS = {"fields", "format", "limit", "after", "q"}
+
+class ApiError(Exception):
+    pass
+
+@api_bp.app_errorhandler(ApiError)
+def api_error(e):
+    return jsonify({"error": str(e)}), 400
+
+def api_query(table, fields=None):
+    """
+    Menyusun (sql, args, fields, next_cursor) dari parameter request:
+      ?fields=a,b      kolom yang dikirim (default semua)
+      ?<kolom>=nilai   filter sama-dengan, mis. ?kelas=X&jurusan=TKJ
+      ?q=kata          filter full-text (index FTS5)
+      ?limit=n&after=  paginasi keyset (nama, id)
+    """
+    columns = API_COLUMNS[table]
+    if fields is None:
+        fields = [f for f in request.args.get("fields", "").split(",") if f] or list(columns)
+    unknown = [f for f in fields if f not in columns]
+    if unknown:
+        raise ApiError(f"kolom tidak dikenal: {', '.join(unknown)}")
+
+    conditions, args = [], []
+    for key in request.args:
+        if key in API_RESERVED_ARGS:
+            continue
+        if key not in columns:
+            raise ApiError(f"filter tidak dikenal: {key}")
+        conditions.append(f"{key} = ?")
+        args.append(request.args[key])
+
+    q = fts_query(request.args.get("q", ""))
+    if q:
+        conditions.append(f"id IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)")
+        args.append(q)
+
+    after = request.args.get("after")
+    if after:
+        cursor = decode_cursor(after)
+        if cursor is None:
+            raise ApiError("cursor tidak valid")
+        cond, cond_args = keyset_condition(cursor, ">")
+        conditions.append(cond)
+        args.extend(cond_args)
+
+    where_sql = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+    order_sql = f"ORDER BY {SORT_KEY}, id"
+
+    limit = request.args.get("limit")
+    next_cursor = None
+    limit_sql = ""
+    if limit:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ApiError("limit harus bilangan bulat")
+        if limit < 1:
+            raise ApiError("limit minimal 1")
+        # Baris terakhir halaman ini + baris pertama halaman berikutnya;
+        # cukup dicari lewat index sehingga cursor lanjutan sudah diketahui
+        # sebelum streaming dimulai (dan bisa dikirim sebagai header).
+        edge = query_db(f"""SELECT nama, id FROM {table} {where_sql} {order_sql}
+                            LIMIT 2 OFFSET ?""", args + [limit - 1])
+        if len(edge) == 2:
+            next_cursor = encode_cursor(edge[0])
+        limit_sql = "LIMIT ?"
+        args = args + [limit]
+
+    sql = f"SELECT {', '.join(fields)} FROM {table} {where_sql} {order_sql} {limit_sql}"
+    return sql, args, fields, next_cursor
+
+def iter_rows(sql, args):
+    """Generator baris dict dari cursor, diambil per API_FETCH_SIZE baris"""
+    cur = get_db().execute(sql, args)
+    try:
+        while True:
+            batch = cur.fetchmany(API_FETCH_SIZE)
+            if not batch:
+                break
+            for row in batch:
+                yield dict(row)
+    finally:
+        cur.close()
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+def stream_json(rows, next_cursor):
+    yield '{"data": ['
+    first = True
+    for row in rows:
+        yield ("" if first else ",") + json.dumps(row, ensure_ascii=False)
+        first = False
+    yield "], " + '"next_cursor": ' + json.dumps(next_cursor) + "}"
+
+def api_response(table):
+    sql, args, fields, next_cursor = api_query(table)
+    rows = iter_rows(sql, args)
+
+    fmt = request.args.get("format")
+    if fmt is None and request.accept_mimetypes.best == "application/x-ndjson":
+        fmt = "ndjson"
+    if fmt == "ndjson":
+        body, mimetype = stream_ndjson(rows), "application/x-ndjson"
+    elif fmt in (None, "json"):
+        body, mimetype = stream_json(rows, next_cursor), "application/json"
+    else:
+        raise ApiError("format harus json atau ndjson")
+
+    resp = Response(stream_with_context(body), mimetype=mimetype)
+    if next_cursor:
+        resp.headers["X-Next-Cursor"] = next_cursor
+        next_args = request.args.to_dict()
+        next_args["after"] = next_cursor
+        resp.headers["Link"] = f'<{url_for(request.endpoint, **next_args)}>; rel="next"'
+    return resp
+
+@api_bp.route("/siswa")
+def api_siswa():
+    return api_response("siswa")
+
+@api_bp.route("/guru")
+def api_guru():
+    return api_response("guru")
+
+FOTO_JOB_FILTER = ("kind", "row_id", "status")
+FOTO_JOB_LIST_LIMIT = 100
+
+@api_bp.route("/foto-job/<int:id>")
+def api_foto_job(id):
+    """Status satu job foto (antri / proses / selesai / gagal / batal)"""
+    job = query_db("SELECT * FROM foto_job WHERE id=?", (id,), one=True)
+    if job is None:
+        return jsonify({"error": "job tidak ditemukan"}), 404
+    return jsonify(dict(job))
+
+@api_bp.route("/foto-job")
+def api_foto_job_list():
+    """Job foto terbaru, bisa difilter ?kind=siswa&row_id=12&status=antri"""
+    unknown = [k for k in request.args if k not in FOTO_JOB_FILTER]
+    if unknown:
+        raise ApiError(f"filter tidak dikenal: {', '.join(unknown)}")
+    where = [f"{k} = ?" for k in FOTO_JOB_FILTER if k in request.args]
+    args = [request.args[k] for k in FOTO_JOB_FILTER if k in request.args]
+    where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+    rows = query_db(f"SELECT * FROM foto_job {where_sql} ORDER BY id DESC LIMIT ?",
+                    args + [FOTO_JOB_LIST_LIMIT])
+    return jsonify({"data": [dict(r) for r in rows]})
+
+# ---------- Log perubahan (sinkronisasi inkremental) ----------
+# Trigger mencatat setiap INSERT/UPDATE/DELETE siswa & guru ke tabel
+# perubahan dengan nomor urut (seq) yang selalu naik. Klien menyimpan
+# next_cursor terakhir lalu meminta /api/changes?since=<seq>; since=0 berisi
+# salinan lengkap. Log dipadatkan setiap hari: entri yang sudah digantikan
+# entri lebih baru untuk baris yang sama dihapus, dan tombstone (D) lama
+# dibuang. Klien yang since-nya lebih tua dari tombstone terakhir yang
+# dibuang mendapat 410 dan harus sinkron ulang dari since=0.
+PERUBAHAN_PADATKAN_HARI = 7
+PERUBAHAN_TOMBSTONE_HARI = 90
+PERUBAHAN_LIMIT = 1000
+PERUBAHAN_MAX_LIMIT = 10000
+PERUBAHAN_META_KEY = "perubahan_tombstone_seq"
+
+def padatkan_perubahan(sekarang=None):
+    """Memadatkan log perubahan; mengembalikan jumlah entri yang dihapus"""
+    sekarang = int(sekarang if sekarang is not None else time.time())
+    batas = sekarang - PERUBAHAN_PADATKAN_HARI * 24 * 60 * 60
+    batas_tombstone = sekarang - PERUBAHAN_TOMBSTONE_HARI * 24 * 60 * 60
+    with transaction() as conn:
+        digantikan = conn.execute("""DELETE FROM perubahan
+                                     WHERE waktu < ? AND EXISTS (
+                                        SELECT 1 FROM perubahan baru
+                                        WHERE baru.tabel = perubahan.tabel
+                                          AND baru.row_id = perubahan.row_id
+                                          AND baru.seq > perubahan.seq)""", (batas,)).rowcount
+        tombstone = [r["seq"] for r in conn.execute(
+            "DELETE FROM perubahan WHERE op = 'D' AND waktu < ? RETURNING seq",
+            (batas_tombstone,)).fetchall()]
+        if tombstone:
+            lama = int(get_meta(PERUBAHAN_META_KEY, conn) or 0)
+            set_meta(PERUBAHAN_META_KEY, str(max(lama, *tombstone)), conn)
+    return digantikan + len(tombstone)
+
+@main_bp.cli.command("padatkan-perubahan")
+def padatkan_perubahan_command():
+    """Memadatkan log perubahan siswa & guru (juga dijalankan harian otomatis)."""
+    init_db()
+    print(f"{padatkan_perubahan()} entri log dihapus")
+
+def iter_perubahan(sql, args):
+    for row in iter_rows(sql, args):
+        row["data"] = json.loads(row["data"]) if row["data"] else None
+        yield row
+
+def arg_int(name, default):
+    try:
+        return int(request.args.get(name, default))
+    except ValueError:
+        raise ApiError(f"{name} harus bilangan bulat")
+
+@api_bp.route("/changes")
+def api_changes():
+    """
+    Perubahan siswa/guru setelah ?since=<seq> (urut seq), ?tabel= opsional.
+    Setiap entri: seq, tabel, row_id, op (I/U/D), data (isi baris), waktu.
+    """
+    since = arg_int("since", 0)
+    limit = arg_int("limit", PERUBAHAN_LIMIT)
+    if since < 0 or not 1 <= limit <= PERUBAHAN_MAX_LIMIT:
+        raise ApiError(f"since minimal 0, limit 1..{PERUBAHAN_MAX_LIMIT}")
+    tabel = request.args.get("tabel")
+    if tabel is not None and tabel not in VERSI_TABLES:
+        raise ApiError(f"tabel harus salah satu dari: {', '.join(VERSI_TABLES)}")
+    # since=0 (salinan lengkap) tidak butuh tombstone, jadi selalu boleh
+    if 0 < since < int(get_meta(PERUBAHAN_META_KEY) or 0):
+        return jsonify({"error": "log sudah dipadatkan, sinkron ulang dari since=0"}), 410
+
+    # seq dibagikan berurutan oleh satu-satunya penulis, jadi semua entri
+    # sampai `terakhir` sudah terlihat oleh query di bawah
+    terakhir = query_db("SELECT IFNULL(MAX(seq), 0) AS seq FROM perubahan", one=True)["seq"]
+    where_sql = "seq > ?" + (" AND tabel = ?" if tabel else "")
+    args = [since] + ([tabel] if tabel else [])
+    edge = query_db(f"SELECT seq FROM perubahan WHERE {where_sql} ORDER BY seq LIMIT 1 OFFSET ?",
+                    args + [limit - 1], one=True)
+    next_since = edge["seq"] if edge else max(since, terakhir)
+    rows = iter_perubahan(f"""SELECT seq, tabel, row_id, op, data, waktu FROM perubahan
+                              WHERE {where_sql} ORDER BY seq LIMIT ?""", args + [limit])
+
+    fmt = request.args.get("format")
+    if fmt is None and request.accept_mimetypes.best == "application/x-ndjson":
+        fmt = "ndjson"
+    if fmt == "ndjson":
+        body, mimetype = stream_ndjson(rows), "application/x-ndjson"
+    elif fmt in (None, "json"):
+        body, mimetype = stream_json(rows, str(next_since)), "application/json"
+    else:
+        raise ApiError("format harus json atau ndjson")
+    resp = Response(stream_with_context(body), mimetype=mimetype)
+    resp.headers["X-Next-Cursor"] = str(next_since)
+    resp.headers["X-Lebih-Banyak"] = "1" if edge else "0"
+    return resp
+
+# ==========================
+# EXPORT (CSV / XLSX / PDF)
+# ==========================
+# Export dibuat di server dari cursor database, baris demi baris. Filter
+# sama dengan API (?kelas=X, ?q=...). Kolom turunan (usia, masa kerja, sisa
+# masa kerja) diambil dari kolom tersimpan yang di-refresh setiap hari.
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+# Di atas ukuran ini file hasil export dipindah dari memori ke disk
+EXPORT_SPOOL_SIZE = 4 * 1024 * 1024
+
+def iter_export_rows(table):
+    """Generator baris export (dict)"""
+    columns = [c for c in API_COLUMNS[table] if c != "foto"]
+    sql, args, _, _ = api_query(table, fields=columns)
+    return iter_rows(sql, args)
+
+def stream_csv(columns, rows):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    # BOM supaya Excel membaca file sebagai UTF-8
+    yield "\ufeff"
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([row[c] for c in columns])
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    yield buf.getvalue()
+
+def build_xlsx(table, columns, rows):
+    """
+    Menulis XLSX dengan openpyxl mode write-only (baris langsung ditulis ke
+    file sementara, tidak disimpan di memori) lalu mengembalikan file-nya.
+    """
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=table.title())
+    ws.append(columns)
+    for row in rows:
+        ws.append([row[c] for c in columns])
+    out = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+    wb.save(out)
+    out.seek(0)
+    return out
+
+def export_response(table):
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_MIMETYPES:
+        raise ApiError("format harus csv atau xlsx")
+    columns = [c for c in API_COLUMNS[table] if c != "foto"]
+    rows = iter_export_rows(table)
+    filename = f"data_{table}_{date.today():%Y%m%d}.{fmt}"
+
+    if fmt == "csv":
+        resp = Response(stream_with_context(stream_csv(columns, rows)),
+                        mimetype=EXPORT_MIMETYPES["csv"])
+        resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return resp
+
+    try:
+        out = build_xlsx(table, columns, rows)
+    except ImportError:
+        flash("Export XLSX membutuhkan paket openpyxl.", "danger")
+        return redirect(request.referrer or url_for("main.dashboard"))
+    return send_file(out, mimetype=EXPORT_MIMETYPES["xlsx"], as_attachment=True,
+                     download_name=filename)
+
+@siswa_bp.route("/siswa/export")
+def siswa_export():
+    return export_response("siswa")
+
+@bp.route("/export")
+def guru_export():
+    return export_response("guru")
+
+# ---------- Kartu guru (PDF) ----------
+KARTU_W_MM, KARTU_H_MM = 85.6, 54.0   # ukuran kartu ID (ISO/IEC 7810 ID-1)
+KARTU_FOTO_PX = 160                     # thumbnail foto yang disematkan ke PDF
+
+def foto_kartu(filename):
+    """Memakai thumbnail foto supaya PDF tidak membawa file kamera utuh"""
+    from reportlab.lib.utils import ImageReader
+    path = buat_thumbnail(foto_dirs()["guru"], filename, KARTU_FOTO_PX)
+    return ImageReader(path) if path else None
+
+def build_kartu_pdf(rows):
+    """
+    Menyusun semua kartu guru (2 kolom x 5 baris per halaman A4) ke file PDF
+    sementara. Baris diambil satu per satu dari cursor.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
+    out = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+    pdf = canvas.Canvas(out, pagesize=A4)
+    pdf.setTitle("Kartu Guru")
+    page_w, page_h = A4
+    w, h = KARTU_W_MM * mm, KARTU_H_MM * mm
+    margin_x = (page_w - 2 * w) / 3
+    margin_y = (page_h - 5 * h) / 6
+    per_page = 10
+
+    for i, guru in enumerate(rows):
+        if i and i % per_page == 0:
+            pdf.showPage()
+        col, baris = i % 2, (i % per_page) // 2
+        x = margin_x + col * (w + margin_x)
+        y = page_h - (baris + 1) * (h + margin_y)
+
+        pdf.setStrokeColorRGB(0, 0.48, 1)
+        pdf.roundRect(x, y, w, h, 3 * mm)
+
+        foto = foto_kartu(guru["foto"]) if guru["foto"] else None
+        foto_size = 24 * mm
+        if foto:
+            pdf.drawImage(foto, x + 4 * mm, y + h - foto_size - 6 * mm,
+                          foto_size, foto_size, preserveAspectRatio=True, anchor="c")
+        else:
+            pdf.rect(x + 4 * mm, y + h - foto_size - 6 * mm, foto_size, foto_size)
+
+        tx = x + foto_size + 8 * mm
+        ty = y + h - 10 * mm
+        pdf.setFont("Helvetica-Bold", 9)
+        pdf.drawString(tx, ty, (guru["nama"] or "")[:40])
+        pdf.setFont("Helvetica", 7)
+        for label, value in (("Jabatan", guru["jabatan"]),
+                             ("NIP", guru["nip"]),
+                             ("NUPTK", guru["nuptk"]),
+                             ("TTL", f"{guru['tempat_lahir'] or ''}, {guru['tanggal_lahir'] or ''}"),
+                             ("Pendidikan", guru["pendidikan"]),
+                             ("Masa Kerja", f"{guru['mk_total_tahun']} th {guru['mk_total_bulan']} bln")):
+            ty -= 4.5 * mm
+            pdf.drawString(tx, ty, f"{label}: {value or '-'}"[:48])
+
+    pdf.save()
+    out.seek(0)
+    return out
+
+@bp.route("/kartu/pdf")
+def guru_kartu_pdf():
+    sql, args, _, _ = api_query("guru", fields=list(API_COLUMNS["guru"]))
+    try:
+        out = build_kartu_pdf(iter_rows(sql, args))
+    except ImportError:
+        flash("Cetak kartu PDF membutuhkan paket reportlab dan Pillow.", "danger")
+        return redirect(url_for("guru.guru_index"))
+    return send_file(out, mimetype="application/pdf", as_attachment=True,
+                     download_name=f"kartu_guru_{date.today():%Y%m%d}.pdf")
+
+# ==========================
+# LAPORAN (pensiun & masa kerja)
+# ==========================
+# Semua angka dihitung di SQL: rentang pensiun memakai index
+# guru.tanggal_pensiun, distribusi masa kerja memakai kolom mk_total_tahun
+# yang di-refresh harian. Tidak ada perulangan per guru di Python.
+LAPORAN_HORIZON_DEFAULT = 24   # bulan
+LAPORAN_HORIZON_MAX = 240
+LAPORAN_BUCKET_MK = 5          # lebar kelompok histogram masa kerja (tahun)
+LAPORAN_KELOMPOK = ("jabatan", "pendidikan")
+
+def laporan_pensiun(bulan, sekarang=None):
+    """Guru yang pensiun dalam `bulan` bulan ke depan, plus jumlah per bulan"""
+    acuan = tanggal_acuan(sekarang).isoformat()
+    batas = f"+{int(bulan)} months"
+    daftar = query_db("""SELECT id, nama, nip, jabatan, pendidikan, tanggal_lahir, tanggal_pensiun
+                         FROM guru
+                         WHERE tanggal_pensiun BETWEEN ? AND date(?, ?)
+                         ORDER BY tanggal_pensiun, id""", (acuan, acuan, batas))
+    per_bulan = query_db("""SELECT substr(tanggal_pensiun, 1, 7) AS bulan, COUNT(*) AS jumlah
+                            FROM guru
+                            WHERE tanggal_pensiun BETWEEN ? AND date(?, ?)
+                            GROUP BY bulan ORDER BY bulan""", (acuan, acuan, batas))
+    return {
+        "daftar": [dict(r) for r in daftar],
+        "per_bulan": [dict(r) for r in per_bulan],
+    }
+
+def laporan_pensiun_tahunan(tahun=10, sekarang=None):
+    """Jumlah guru pensiun per tahun untuk `tahun` tahun ke depan"""
+    acuan = tanggal_acuan(sekarang).isoformat()
+    rows = query_db("""SELECT substr(tanggal_pensiun, 1, 4) AS tahun, COUNT(*) AS jumlah
+                       FROM guru
+                       WHERE tanggal_pensiun BETWEEN ? AND date(?, ?)
+                       GROUP BY tahun ORDER BY tahun""", (acuan, acuan, f"+{int(tahun)} years"))
+    return [dict(r) for r in rows]
+
+def laporan_masa_kerja():
+    """Histogram masa kerja total (kelompok LAPORAN_BUCKET_MK tahun)"""
+    rows = query_db("""SELECT (mk_total_tahun / ?) * ? AS dari, COUNT(*) AS jumlah
+                       FROM guru
+                       WHERE sk_pertama IS NOT NULL AND sk_pertama != ''
+                       GROUP BY dari ORDER BY dari""", (LAPORAN_BUCKET_MK, LAPORAN_BUCKET_MK))
+    return [{"kelompok": f"{r['dari']}-{r['dari'] + LAPORAN_BUCKET_MK - 1} th",
+             "jumlah": r["jumlah"]} for r in rows]
+
+def laporan_per_kelompok(kolom, sekarang=None):
+    """Rekap per jabatan/pendidikan: jumlah, rata-rata masa kerja, pensiun 5 tahun ke depan"""
+    if kolom not in LAPORAN_KELOMPOK:
+        raise ValueError(kolom)
+    acuan = tanggal_acuan(sekarang).isoformat()
+    rows = query_db(f"""SELECT IFNULL(NULLIF({kolom}, ''), '(kosong)') AS kelompok,
+                               COUNT(*) AS jumlah,
+                               ROUND(AVG(mk_total_tahun + mk_total_bulan / 12.0), 1) AS rata_mk,
+                               MAX(mk_total_tahun) AS mk_terlama,
+                               SUM(tanggal_pensiun BETWEEN ? AND date(?, '+5 years')) AS pensiun_5th
+                        FROM guru GROUP BY kelompok ORDER BY jumlah DESC, kelompok""",
+                    (acuan, acuan))
+    return [dict(r) for r in rows]
+
+def get_horizon():
+    try:
+        bulan = int(request.args.get("bulan", LAPORAN_HORIZON_DEFAULT))
+    except ValueError:
+        bulan = LAPORAN_HORIZON_DEFAULT
+    return max(1, min(bulan, LAPORAN_HORIZON_MAX))
+
+def kumpulkan_laporan():
+    bulan = get_horizon()
+    return {
+        "bulan": bulan,
+        "pensiun": laporan_pensiun(bulan),
+        "pensiun_tahunan": laporan_pensiun_tahunan(),
+        "masa_kerja": laporan_masa_kerja(),
+        "per_jabatan": laporan_per_kelompok("jabatan"),
+        "per_pendidikan": laporan_per_kelompok("pendidikan"),
+    }
+
+@laporan_bp.route("/")
+def laporan_index():
+    return render_template("laporan/index.html", title="Laporan Guru", **kumpulkan_laporan())
+
+@laporan_bp.route("/data")
+def laporan_data():
+    return jsonify(kumpulkan_laporan())
 
-app.register_blueprint(bp)
+# ==========================
+# BACKUP & RESTORE
+# ==========================
+# Snapshot dibuat tanpa menghentikan aplikasi (mis. dari cron):
+#   - database disalin lewat backup API SQLite per BACKUP_HALAMAN halaman
+#     dengan jeda di antara langkah, sehingga request lain tetap berjalan.
+#     Bila penulis lain terus memaksa backup mengulang dari awal, salinan
+#     dibuat sekali jalan (di mode WAL hanya memegang transaksi baca).
+#   - foto (tanpa thumbnail, bisa dibuat ulang) di-hardlink ke folder
+#     snapshot: file foto hash tidak pernah diubah isinya sehingga link
+#     sudah merupakan salinan yang konsisten dan tidak memakan ruang.
+#   - manifest.json mencatat versi skema, jumlah baris dan ukuran + hash
+#     isi setiap foto untuk verifikasi.
+# Folder snapshot ditulis dengan nama sementara lalu di-rename, jadi
+# snapshot yang terlihat selalu lengkap.
+BACKUP_HALAMAN = 256
+BACKUP_JEDA = 0.02             # detik antar langkah
+BACKUP_MAX_ULANG = 5
+BACKUP_MANIFEST = "manifest.json"
+BACKUP_DATABASES = {"DATABASE": "sekolah.db", "INVENTARIS_DATABASE": "inventaris.db"}
+BACKUP_FOTO = {"siswa": "UPLOAD_FOLDER", "guru": "UPLOAD_FOLDER_GURU"}
+
+class BackupError(Exception):
+    pass
+
+class _BackupDiulang(Exception):
+    pass
+
+def salin_db_online(src_path, dst_path, halaman=BACKUP_HALAMAN, jeda=BACKUP_JEDA):
+    """Salinan konsisten `src_path` ke `dst_path` (ditulis atomik); mengembalikan jumlah halaman"""
+    tmp = dst_path + ".tmp"
+    src = sqlite3.connect(src_path, timeout=DB_BUSY_TIMEOUT_MS / 1000)
+    try:
+        state = {"sisa": None, "ulang": 0, "total": 0}
+
+        def progress(status, sisa, total):
+            # Sisa halaman bertambah = backup diulang karena ada penulis lain
+            if state["sisa"] is not None and sisa > state["sisa"]:
+                state["ulang"] += 1
+                if state["ulang"] >= BACKUP_MAX_ULANG:
+                    raise _BackupDiulang()
+            state["sisa"], state["total"] = sisa, total
+            time.sleep(jeda)
+
+        for langkah in (halaman, -1):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            dst = sqlite3.connect(tmp)
+            try:
+                src.backup(dst, pages=langkah, progress=progress if langkah > 0 else None)
+                # Snapshot cukup satu file, tanpa -wal/-shm
+                dst.execute("PRAGMA journal_mode=DELETE")
+                total = dst.execute("PRAGMA page_count").fetchone()[0]
+                break
+            except _BackupDiulang:
+                log.warning("backup %s terus diulang oleh penulis lain, disalin sekali jalan", src_path)
+            finally:
+                dst.close()
+    finally:
+        src.close()
+    os.replace(tmp, dst_path)
+    return total
+
+def tautkan(src, dst):
+    """Hardlink (atau salin bila beda filesystem) src ke dst"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def hash_file(path):
+    with open(path, "rb") as f:
+        return hash_upload(f)
+
+def iter_foto(folder):
+    """Path relatif semua foto di folder upload (thumbnail dilewati)"""
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = [d for d in dirs if d != "thumbs"]
+        for name in files:
+            if not name.endswith(".tmp"):
+                yield os.path.relpath(os.path.join(root, name), folder).replace(os.sep, "/")
+
+def info_db(path):
+    """Versi skema dan jumlah baris siswa/guru sebuah file database"""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        return {
+            "versi_skema": conn.execute("PRAGMA user_version").fetchone()[0],
+            "baris": {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                      for t in VERSI_TABLES if t in tables},
+        }
+    finally:
+        conn.close()
+
+def buat_backup(folder=None, halaman=BACKUP_HALAMAN, jeda=BACKUP_JEDA):
+    """Membuat satu snapshot di `folder` (bawaan BACKUP_FOLDER); mengembalikan path-nya"""
+    folder = folder or lokasi("BACKUP_FOLDER")
+    nama = dasar = datetime.now().strftime("%Y%m%d-%H%M%S")
+    ke = 1
+    while os.path.exists(os.path.join(folder, nama)):
+        ke += 1
+        nama = f"{dasar}-{ke}"
+    tujuan = os.path.join(folder, nama)
+    tmp = os.path.join(folder, f".{nama}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    manifest = {"dibuat": datetime.now().isoformat(timespec="seconds"),
+                "sekolah": tenant_aktif(), "database": {}, "foto": {}}
+    try:
+        for key, nama_file in BACKUP_DATABASES.items():
+            src = lokasi(key)
+            if not os.path.exists(src):
+                continue
+            dst = os.path.join(tmp, nama_file)
+            halaman_db = salin_db_online(src, dst, halaman, jeda)
+            manifest["database"][nama_file] = {"halaman": halaman_db,
+                                               "ukuran": os.path.getsize(dst)}
+        manifest.update(info_db(os.path.join(tmp, BACKUP_DATABASES["DATABASE"])))
+        for kind, key in BACKUP_FOTO.items():
+            src_dir = lokasi(key)
+            files = manifest["foto"][kind] = {}
+            for rel in iter_foto(src_dir):
+                src = os.path.join(src_dir, rel)
+                tautkan(src, os.path.join(tmp, "foto", kind, rel))
+                # Nama foto hash berasal dari isi upload sebelum diproses,
+                # jadi isi file yang tersimpan tetap di-hash sendiri
+                files[rel] = [os.path.getsize(src), hash_file(src)]
+        with open(os.path.join(tmp, BACKUP_MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.rename(tmp, tujuan)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return tujuan
+
+def baca_manifest_snapshot(snapshot):
+    try:
+        with open(os.path.join(snapshot, BACKUP_MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise BackupError(f"manifest tidak bisa dibaca: {e}")
+
+def verifikasi_backup(snapshot):
+    """Memeriksa snapshot; mengembalikan daftar masalah (kosong = baik)"""
+    manifest = baca_manifest_snapshot(snapshot)
+    masalah = []
+    for nama_file, info in manifest["database"].items():
+        path = os.path.join(snapshot, nama_file)
+        if not os.path.exists(path):
+            masalah.append(f"{nama_file}: tidak ada")
+            continue
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            hasil = [r[0] for r in conn.execute("PRAGMA integrity_check")]
+        except sqlite3.DatabaseError as e:
+            hasil = [str(e)]
+        finally:
+            conn.close()
+        if hasil != ["ok"]:
+            masalah.append(f"{nama_file}: integrity_check: {'; '.join(hasil[:5])}")
+    db = os.path.join(snapshot, BACKUP_DATABASES["DATABASE"])
+    if os.path.exists(db) and not masalah:
+        info = info_db(db)
+        if info["baris"] != manifest.get("baris"):
+            masalah.append(f"jumlah baris {info['baris']} tidak sama dengan manifest {manifest.get('baris')}")
+    for kind, files in manifest["foto"].items():
+        for rel, (ukuran, digest) in files.items():
+            path = os.path.join(snapshot, "foto", kind, rel)
+            if not os.path.exists(path):
+                masalah.append(f"foto {kind}/{rel}: tidak ada")
+            elif os.path.getsize(path) != ukuran or hash_file(path) != digest:
+                masalah.append(f"foto {kind}/{rel}: isi berubah")
+    return masalah
+
+def restore_backup(snapshot):
+    """
+    Mengembalikan database & foto dari snapshot ke sekolah aktif. Versi data
+    (ETag) dan nomor urut log perubahan dinaikkan melewati nilai sebelum
+    restore, sehingga cache tidak memakai isi lama dan klien sinkronisasi
+    diminta sinkron ulang penuh. Foto yang ada sekarang tidak dihapus.
+    """
+    masalah = verifikasi_backup(snapshot)
+    if masalah:
+        raise BackupError("snapshot rusak: " + "; ".join(masalah[:5]))
+    manifest = baca_manifest_snapshot(snapshot)
+
+    init_db()
+    versi_lama = {r["tabel"]: r["versi"] for r in query_db("SELECT tabel, versi FROM data_versi")}
+    seq_lama = query_db("SELECT IFNULL(MAX(seq), 0) AS seq FROM perubahan", one=True)["seq"]
+    close_db()
+
+    for key, nama_file in BACKUP_DATABASES.items():
+        if nama_file not in manifest["database"]:
+            continue
+        src = sqlite3.connect(f"file:{os.path.join(snapshot, nama_file)}?mode=ro", uri=True)
+        dst = sqlite3.connect(lokasi(key), timeout=DB_BUSY_TIMEOUT_MS / 1000)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+
+    # Snapshot dari versi skema lama ikut dimigrasi
+    _skema_siap.discard(db_path())
+    init_db()
+    with transaction() as conn:
+        for tabel, versi in versi_lama.items():
+            conn.execute("UPDATE data_versi SET versi = MAX(versi, ?) + 1 WHERE tabel = ?",
+                         (versi, tabel))
+        conn.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'perubahan'",
+                     (seq_lama,))
+        set_meta(PERUBAHAN_META_KEY, str(seq_lama + 1), conn)
+
+    dipulihkan = 0
+    for kind, files in manifest["foto"].items():
+        folder = lokasi(BACKUP_FOTO[kind])
+        for rel in files:
+            dst = os.path.join(folder, rel)
+            if not os.path.exists(dst):
+                tautkan(os.path.join(snapshot, "foto", kind, rel), dst)
+                dipulihkan += 1
+    _page_cache.clear()
+    return manifest, dipulihkan
+
+def daftar_backup(folder=None):
+    folder = folder or lokasi("BACKUP_FOLDER")
+    if not os.path.isdir(folder):
+        return []
+    return sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                  if not name.startswith(".") and os.path.exists(os.path.join(folder, name, BACKUP_MANIFEST)))
+
+def opsi_sekolah(fn):
+    """Opsi --sekolah: perintah dijalankan untuk shard sekolah tersebut"""
+    @click.option("--sekolah", help="Shard sekolah (multi sekolah); tanpa ini database utama.")
+    @wraps(fn)
+    def wrapper(sekolah, **kwargs):
+        with konteks_tenant(current_app._get_current_object(), sekolah):
+            if sekolah is not None:
+                cek_tenant_cli(sekolah)
+            return fn(**kwargs)
+    return wrapper
+
+def cek_tenant_cli(sekolah):
+    if sekolah not in daftar_tenant():
+        raise click.BadParameter(f"sekolah {sekolah} tidak terdaftar", param_hint="--sekolah")
+
+@main_bp.cli.group("backup")
+def backup_cli():
+    """Backup online, verifikasi dan restore database + foto."""
+
+@backup_cli.command("buat")
+@click.option("--folder", help="Folder tujuan snapshot (bawaan: BACKUP_FOLDER).")
+@click.option("--halaman", default=BACKUP_HALAMAN, show_default=True, help="Halaman per langkah salin.")
+@click.option("--jeda", default=BACKUP_JEDA, show_default=True, help="Detik jeda antar langkah.")
+@click.option("--simpan", type=int, help="Hanya simpan N snapshot terbaru.")
+@opsi_sekolah
+def backup_buat_command(folder, halaman, jeda, simpan):
+    """Membuat snapshot tanpa menghentikan aplikasi."""
+    init_db()
+    mulai = time.perf_counter()
+    tujuan = buat_backup(folder, halaman, jeda)
+    manifest = baca_manifest_snapshot(tujuan)
+    jumlah_foto = sum(len(files) for files in manifest["foto"].values())
+    print(f"Snapshot {tujuan} ({time.perf_counter() - mulai:.1f} detik): "
+          f"{manifest['baris']}, {jumlah_foto} foto")
+    if simpan:
+        for lama in daftar_backup(folder)[:-simpan]:
+            shutil.rmtree(lama)
+            print(f"Dihapus: {lama}")
+
+@backup_cli.command("daftar")
+@click.option("--folder", help="Folder snapshot (bawaan: BACKUP_FOLDER).")
+@opsi_sekolah
+def backup_daftar_command(folder):
+    """Daftar snapshot yang tersedia."""
+    for snapshot in daftar_backup(folder):
+        manifest = baca_manifest_snapshot(snapshot)
+        print(f"{snapshot}  {manifest['dibuat']}  skema v{manifest['versi_skema']}  {manifest['baris']}")
+
+@backup_cli.command("verifikasi")
+@click.argument("snapshot")
+def backup_verifikasi_command(snapshot):
+    """Memeriksa integritas database dan foto sebuah snapshot."""
+    try:
+        masalah = verifikasi_backup(snapshot)
+    except BackupError as e:
+        raise click.ClickException(str(e))
+    if masalah:
+        for m in masalah:
+            print(m)
+        raise click.ClickException(f"{len(masalah)} masalah ditemukan")
+    print("Snapshot baik.")
+
+@backup_cli.command("restore")
+@click.argument("snapshot")
+@click.option("--tanpa-cadangan", is_flag=True, help="Jangan buat snapshot keadaan sekarang dulu.")
+@click.confirmation_option(prompt="Data sekarang akan ditimpa isi snapshot. Lanjutkan?")
+@opsi_sekolah
+def backup_restore_command(snapshot, tanpa_cadangan):
+    """Mengembalikan database & foto dari snapshot."""
+    try:
+        if not tanpa_cadangan:
+            init_db()
+            print(f"Cadangan keadaan sekarang: {buat_backup()}")
+        manifest, dipulihkan = restore_backup(snapshot)
+    except BackupError as e:
+        raise click.ClickException(str(e))
+    print(f"Dipulihkan dari {manifest['dibuat']}: {manifest['baris']}, {dipulihkan} foto dikembalikan")
+
+# ==========================
+# LAPORAN LINTAS SEKOLAH
+# ==========================
+# Rekap dan export gabungan dijalankan paralel di setiap shard. Thread pool
+# dipakai ulang antar request sehingga koneksi per shard (per thread) juga
+# ikut dipakai ulang.
+SHARD_POOL_SIZE = 4
+
+_shard_pool = {}   # pid -> ThreadPoolExecutor
+_shard_pool_lock = threading.Lock()
+
+def shard_pool():
+    pid = os.getpid()
+    with _shard_pool_lock:
+        pool = _shard_pool.get(pid)
+        if pool is None:
+            pool = _shard_pool[pid] = ThreadPoolExecutor(SHARD_POOL_SIZE,
+                                                         thread_name_prefix="shard")
+    return pool
+
+def untuk_semua_sekolah(fungsi, *args, skema=True):
+    """
+    Menjalankan fungsi(*args) di setiap shard secara paralel; {sekolah: hasil}.
+    Shard yang skemanya tertinggal menimbulkan SkemaUsang kecuali skema=False.
+    """
+    app = current_app._get_current_object()
+
+    def satu(tenant):
+        with konteks_tenant(app, tenant):
+            if skema:
+                pastikan_skema()
+            return fungsi(*args)
+
+    tenants = daftar_tenant()
+    return dict(zip(tenants, shard_pool().map(satu, tenants)))
+
+@main_bp.app_template_global()
+def url_sekolah(tenant, endpoint="main.dashboard", **values):
+    """URL `endpoint` milik sekolah `tenant` dari halaman sekolah mana pun"""
+    root = request.script_root
+    aktif = request.environ.get(TENANT_ENVIRON_KEY)
+    if aktif and root.endswith(f"{TENANT_PREFIX}/{aktif}"):
+        root = root[: -len(f"{TENANT_PREFIX}/{aktif}")]
+    path = url_for(endpoint, **values)[len(request.script_root):]
+    return f"{root}{TENANT_PREFIX}/{tenant}{path}"
+
+@main_bp.route("/sekolah")
+def sekolah_index():
+    if not current_app.config["TENANT_FOLDER"]:
+        abort(404)
+    per_sekolah = untuk_semua_sekolah(get_dashboard_stats)
+    total = {"total_siswa": 0, "total_guru": 0}
+    per_jurusan = {}
+    for stats in per_sekolah.values():
+        total["total_siswa"] += stats["total_siswa"]
+        total["total_guru"] += stats["total_guru"]
+        for label, jumlah in zip(stats["chart_labels"], stats["chart_values"]):
+            per_jurusan[label] = per_jurusan.get(label, 0) + jumlah
+    return render_template("sekolah/index.html", title="Semua Sekolah",
+                           per_sekolah=per_sekolah, total=total,
+                           per_jurusan=sorted(per_jurusan.items()))
+
+def export_shard_csv(table, columns):
+    """Baris `table` shard aktif sebagai CSV (tanpa header) di file sementara"""
+    out = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE, mode="w+",
+                                        encoding="utf-8", newline="")
+    writer = csv.writer(out)
+    tenant = tenant_aktif()
+    sql = f"SELECT {', '.join(columns)} FROM {table} ORDER BY {SORT_KEY}, id"
+    for row in iter_rows(sql, ()):
+        writer.writerow([tenant] + [row[c] for c in columns])
+    out.seek(0)
+    return out
+
+def stream_gabungan(header, files):
+    buf = io.StringIO()
+    csv.writer(buf).writerow(header)
+    yield "\ufeff" + buf.getvalue()
+    for out in files:
+        with out:
+            for chunk in iter(lambda: out.read(FOTO_CHUNK_SIZE), ""):
+                yield chunk
+
+@main_bp.route("/sekolah/export/<table>")
+def sekolah_export(table):
+    if not current_app.config["TENANT_FOLDER"] or table not in VERSI_TABLES:
+        abort(404)
+    columns = [c for c in API_COLUMNS[table] if c != "foto"]
+    files = untuk_semua_sekolah(export_shard_csv, table, columns)
+    resp = Response(stream_gabungan(["sekolah"] + columns, files.values()),
+                    mimetype=EXPORT_MIMETYPES["csv"])
+    filename = f"data_{table}_semua_sekolah_{date.today():%Y%m%d}.csv"
+    resp.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return resp
+
+@main_bp.cli.group("sekolah")
+@with_appcontext
+def sekolah_cli():
+    """Kelola shard multi sekolah (config TENANT_FOLDER)."""
+    if not current_app.config["TENANT_FOLDER"]:
+        raise click.UsageError("TENANT_FOLDER belum diatur (mis. SEKOLAH_TENANT_FOLDER=...)")
+
+@sekolah_cli.command("daftar")
+def sekolah_daftar_command():
+    """Daftar sekolah beserta jumlah siswa & guru."""
+    for tenant, stats in untuk_semua_sekolah(get_dashboard_stats).items():
+        print(f"{tenant}: {stats['total_siswa']} siswa, {stats['total_guru']} guru")
+
+@sekolah_cli.command("tambah")
+@click.argument("sekolah")
+@click.option("--dari-bawaan", is_flag=True,
+              help="Salin database & foto bawaan (config DATABASE / UPLOAD_FOLDER) ke shard baru.")
+def sekolah_tambah_command(sekolah, dari_bawaan):
+    """Membuat shard untuk sekolah baru."""
+    if not TENANT_RE.match(sekolah):
+        raise click.BadParameter("hanya huruf kecil, angka, - dan _", param_hint="SEKOLAH")
+    folder = os.path.join(current_app.config["TENANT_FOLDER"], sekolah)
+    if os.path.exists(folder):
+        raise click.UsageError(f"{folder} sudah ada")
+    os.makedirs(folder)
+    app = current_app._get_current_object()
+    with konteks_tenant(app, sekolah):
+        if dari_bawaan:
+            for key in ("DATABASE", "INVENTARIS_DATABASE"):
+                if os.path.exists(app.config[key]):
+                    src = sqlite3.connect(app.config[key])
+                    dst = sqlite3.connect(lokasi(key))
+                    try:
+                        src.backup(dst)
+                    finally:
+                        dst.close()
+                        src.close()
+            for key in ("UPLOAD_FOLDER", "UPLOAD_FOLDER_GURU"):
+                shutil.copytree(app.config[key], lokasi(key),
+                                ignore=shutil.ignore_patterns("thumbs"))
+        for key in TENANT_DIRS:
+            os.makedirs(lokasi(key), exist_ok=True)
+        init_db()
+        close_db()
+    print(f"Sekolah {sekolah} dibuat di {folder}")
+
+@sekolah_cli.command("migrasi")
+def sekolah_migrasi_command():
+    """Menerapkan migrasi skema di semua shard."""
+    for tenant, diterapkan in untuk_semua_sekolah(init_db, skema=False).items():
+        print(f"{tenant}: {', '.join(map(str, diterapkan)) if diterapkan else 'sudah terbaru'}")
+
+# ==========================
+# APP FACTORY
+# ==========================
+def create_app(config=None):
+    """
+    Membuat instance Flask. Tidak ada kerja database di sini: skema dibuat /
+    diperbarui lewat `flask init-db` sebelum aplikasi dijalankan.
+    Contoh gunicorn: gunicorn "app:create_app()"
+    """
+    app = Flask(__name__)
+    app.config.from_mapping(DEFAULT_CONFIG)
+    app.config.from_prefixed_env("SEKOLAH")
+    if config:
+        app.config.update(config)
+
+    for key in TENANT_DIRS:
+        os.makedirs(app.config[key], exist_ok=True)
+
+    app.teardown_appcontext(teardown_db)
+    if app.config["PROFILER_ENABLED"]:
+        app.wsgi_app = ProfilerToggle(app.wsgi_app)
+    if app.config["TENANT_FOLDER"]:
+        app.wsgi_app = TenantMiddleware(app.wsgi_app, app.config["TENANT_HEADER"])
+    app.register_blueprint(main_bp)
+    app.register_blueprint(siswa_bp)
+    app.register_blueprint(bp)
+    app.register_blueprint(api_bp)
+    app.register_blueprint(laporan_bp)
+    return app
 
 # ---------- run ----------
 if __name__ == "__main__":
+    app = create_app()
+    with app.app_context():
+        init_db()
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,340 @@
+"""
+Benchmark route utama: throughput dan latensi p50/p95/p99.
+
+Dua mode:
+  - bawaan: Flask test client di proses ini, memakai salinan database
+    (database asli tidak ikut berubah oleh route tulis)
+  - --url: server yang sudah berjalan, mis. gunicorn "app:create_app()" -w 4
+
+Isi database dulu dengan seed_data.py, lalu misalnya:
+
+    python seed_data.py --db /tmp/bench.db --siswa 10000
+    python benchmark.py --db /tmp/bench.db -n 300
+    python benchmark.py --db /tmp/bench.db --cold --route cari_siswa
+    python benchmark.py --url http://127.0.0.1:8000 --db /tmp/bench.db -c 8
+
+Setiap run ditambahkan ke benchmark_hasil.jsonl (commit git, jumlah baris,
+angka per route) dan dibandingkan dengan run sebelumnya yang sebanding.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+HASIL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_hasil.jsonl")
+KATA_CARI = ("Ahmad", "Putri", "Siregar", "Galang", "Nur", "Medan", "Wijaya", "Sri")
+
+
+class Skenario:
+    """Satu route yang diukur; `buat(rng, ids)` -> (method, path, data form)"""
+
+    def __init__(self, nama, buat, tulis=False):
+        self.nama = nama
+        self.buat = buat
+        self.tulis = tulis
+
+
+def _form_siswa(rng):
+    return {
+        "nama": f"Bench Siswa {rng.randrange(10**6)}",
+        "kelas": rng.choice(("X", "XI", "XII")),
+        "jurusan": rng.choice(("TKJ", "TKR", "AT")),
+        "tempat_lahir": "Galang",
+        "tanggal_lahir": "2008-05-17",
+        "asal_sekolah": "SMP Negeri 1 Galang",
+        "alamat": "Dusun 3",
+    }
+
+
+def _form_guru(rng):
+    nomor = rng.randrange(10**9)
+    return {
+        "nama": f"Bench Guru {nomor}",
+        # Awalan 99 tidak dipakai seed_data.py sehingga tidak bentrok
+        "nip": f"99{nomor:016d}",
+        "nuptk": f"99{nomor:014d}",
+        "tempat_lahir": "Medan",
+        "tanggal_lahir": "1985-03-12",
+        "agama": "Islam",
+        "jabatan": "Guru",
+        "pendidikan": "S1 Pendidikan Matematika",
+        "sk_pertama": "2010-01-01",
+        "sk_terakhir": "2022-04-01",
+    }
+
+
+SKENARIO = [
+    Skenario("dashboard", lambda rng, ids: ("GET", "/dashboard", None)),
+    Skenario("siswa_index", lambda rng, ids: ("GET", "/siswa", None)),
+    Skenario("cari_siswa", lambda rng, ids: (
+        "GET", "/cari_siswa?" + urllib.parse.urlencode({"keyword": rng.choice(KATA_CARI)}), None)),
+    Skenario("guru_index", lambda rng, ids: ("GET", "/guru/", None)),
+    Skenario("guru_kartu", lambda rng, ids: ("GET", f"/guru/kartu/{rng.choice(ids['guru'])}", None)),
+    Skenario("siswa_tambah", lambda rng, ids: ("POST", "/siswa/tambah", _form_siswa(rng)), tulis=True),
+    Skenario("siswa_edit", lambda rng, ids: (
+        "POST", f"/siswa/edit/{rng.choice(ids['siswa'])}", _form_siswa(rng)), tulis=True),
+    Skenario("guru_tambah", lambda rng, ids: ("POST", "/guru/tambah", _form_guru(rng)), tulis=True),
+]
+
+
+def persentil(nilai_urut, p):
+    """Persentil nearest-rank dari list yang sudah diurutkan"""
+    if not nilai_urut:
+        return 0.0
+    k = max(0, min(len(nilai_urut) - 1, round(p / 100 * len(nilai_urut) + 0.5) - 1))
+    return nilai_urut[k]
+
+
+def ringkas(latensi, durasi, gagal):
+    urut = sorted(latensi)
+    return {
+        "n": len(urut),
+        "gagal": gagal,
+        "rps": round(len(urut) / durasi, 1) if durasi else 0.0,
+        "mean_ms": round(sum(urut) / len(urut) * 1000, 2) if urut else 0.0,
+        "p50_ms": round(persentil(urut, 50) * 1000, 2),
+        "p95_ms": round(persentil(urut, 95) * 1000, 2),
+        "p99_ms": round(persentil(urut, 99) * 1000, 2),
+    }
+
+
+# ---------- Klien ----------
+
+class KlienTest:
+    """Flask test client; satu client per thread"""
+
+    def __init__(self, app, cold):
+        import app as aplikasi
+
+        self.app = app
+        self.cold = cold
+        self.cache = (aplikasi._page_cache, aplikasi._stats_cache)
+        self.lokal = threading.local()
+
+    def kirim(self, method, path, data):
+        client = getattr(self.lokal, "client", None)
+        if client is None:
+            client = self.lokal.client = self.app.test_client()
+        if self.cold:
+            for cache in self.cache:
+                cache.clear()
+        resp = client.open(path, method=method, data=data)
+        resp.get_data()
+        resp.close()
+        return resp.status_code
+
+
+class _TanpaRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class KlienHttp:
+    """Server yang berjalan (gunicorn / flask run) lewat urllib"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.opener = urllib.request.build_opener(_TanpaRedirect)
+
+    def kirim(self, method, path, data):
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        req = urllib.request.Request(self.base_url + path, data=body, method=method)
+        try:
+            with self.opener.open(req, timeout=30) as resp:
+                resp.read()
+                return resp.status
+        except urllib.error.HTTPError as e:
+            e.read()
+            return e.code
+
+
+# ---------- Runner ----------
+
+def jalankan(klien, skenario, ids, jumlah, konkurensi, pemanasan, seed):
+    rng = random.Random(seed)
+    kunci = threading.Lock()
+    permintaan = [skenario.buat(rng, ids) for _ in range(pemanasan + jumlah)]
+    for method, path, data in permintaan[:pemanasan]:
+        klien.kirim(method, path, data)
+
+    latensi = []
+    gagal = 0
+
+    def satu(req):
+        nonlocal gagal
+        mulai = time.perf_counter()
+        status = klien.kirim(*req)
+        lama = time.perf_counter() - mulai
+        with kunci:
+            latensi.append(lama)
+            if status >= 400:
+                gagal += 1
+
+    mulai = time.perf_counter()
+    if konkurensi > 1:
+        with ThreadPoolExecutor(konkurensi) as pool:
+            list(pool.map(satu, permintaan[pemanasan:]))
+    else:
+        for req in permintaan[pemanasan:]:
+            satu(req)
+    return ringkas(latensi, time.perf_counter() - mulai, gagal)
+
+
+def ambil_ids(path):
+    con = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return {t: [r[0] for r in con.execute(f"SELECT id FROM {t}")] for t in ("siswa", "guru")}
+    finally:
+        con.close()
+
+
+def salin_db(path, tujuan):
+    """Salinan konsisten (termasuk isi WAL) lewat backup API SQLite"""
+    src = sqlite3.connect(path)
+    dst = sqlite3.connect(tujuan)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+
+
+def versi_git():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+
+def run_sebelumnya(catatan):
+    """Run terakhir di HASIL_FILE dengan mode, konkurensi dan ukuran data yang sama"""
+    if not os.path.exists(HASIL_FILE):
+        return None
+    cocok = None
+    kunci = ("mode", "cold", "konkurensi", "siswa", "guru")
+    with open(HASIL_FILE, encoding="utf-8") as f:
+        for line in f:
+            try:
+                lama = json.loads(line)
+            except ValueError:
+                continue
+            if all(lama.get(k) == catatan[k] for k in kunci):
+                cocok = lama
+    return cocok
+
+
+def cetak(catatan, sebelumnya):
+    print(f"\n{'route':<14}{'n':>6}{'gagal':>7}{'rps':>9}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+          + ("   p50 vs sebelumnya" if sebelumnya else ""))
+    for nama, r in catatan["hasil"].items():
+        line = (f"{nama:<14}{r['n']:>6}{r['gagal']:>7}{r['rps']:>9}{r['mean_ms']:>9}"
+                f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}")
+        lama = (sebelumnya or {}).get("hasil", {}).get(nama)
+        if lama and lama["p50_ms"]:
+            selisih = (r["p50_ms"] - lama["p50_ms"]) / lama["p50_ms"] * 100
+            line += f"   {lama['p50_ms']} -> {r['p50_ms']} ms ({selisih:+.1f}%)"
+        print(line)
+    print("(latensi dalam ms)")
+    if sebelumnya:
+        print(f"Dibandingkan dengan run {sebelumnya['waktu']} (commit {sebelumnya['commit'] or '-'})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark route aplikasi data sekolah.")
+    parser.add_argument("--db", help="Database sumber (bawaan: config DATABASE / sekolah.db)")
+    parser.add_argument("--url", help="Base URL server yang sudah berjalan; tanpa ini memakai test client")
+    parser.add_argument("-n", "--jumlah", type=int, default=200, help="Request per route")
+    parser.add_argument("-c", "--konkurensi", type=int, default=1, help="Jumlah thread klien")
+    parser.add_argument("--pemanasan", type=int, default=5, help="Request pemanasan per route")
+    parser.add_argument("--route", action="append", choices=[s.nama for s in SKENARIO],
+                        help="Hanya route ini (boleh diulang)")
+    parser.add_argument("--tanpa-tulis", action="store_true", help="Lewati route tulis")
+    parser.add_argument("--cold", action="store_true",
+                        help="Kosongkan cache halaman & dashboard sebelum tiap request (test client)")
+    parser.add_argument("--in-place", action="store_true",
+                        help="Test client langsung ke --db, bukan ke salinannya")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--catatan", default="", help="Keterangan bebas untuk run ini")
+    parser.add_argument("--tanpa-simpan", action="store_true", help="Jangan tulis ke " + os.path.basename(HASIL_FILE))
+    args = parser.parse_args()
+
+    if args.url and args.cold:
+        parser.error("--cold hanya untuk mode test client")
+
+    skenario = [s for s in SKENARIO
+                if (not args.route or s.nama in args.route) and not (args.tanpa_tulis and s.tulis)]
+    tmpdir = None
+    try:
+        if args.url:
+            if not args.db:
+                parser.error("--url butuh --db (file database yang dipakai server) untuk mengambil id")
+            db = os.path.abspath(args.db)
+            klien = KlienHttp(args.url)
+            mode = "http"
+        else:
+            from app import create_app, init_db
+
+            sumber = os.path.abspath(args.db or create_app().config["DATABASE"])
+            if args.in_place:
+                db = sumber
+            else:
+                tmpdir = tempfile.mkdtemp(prefix="bench_")
+                db = os.path.join(tmpdir, os.path.basename(sumber))
+                salin_db(sumber, db)
+                inventaris = os.path.join(os.path.dirname(sumber), "inventaris.db")
+                if os.path.exists(inventaris):
+                    salin_db(inventaris, os.path.join(tmpdir, "inventaris.db"))
+            app = create_app({"DATABASE": db,
+                              "INVENTARIS_DATABASE": os.path.join(os.path.dirname(db), "inventaris.db"),
+                              "REFRESH_TURUNAN_OTOMATIS": False})
+            with app.app_context():
+                init_db()
+            klien = KlienTest(app, args.cold)
+            mode = "test_client"
+
+        ids = ambil_ids(db)
+        if not ids["siswa"] or not ids["guru"]:
+            parser.error("database kosong; isi dulu dengan seed_data.py")
+
+        catatan = {
+            "waktu": datetime.now().isoformat(timespec="seconds"),
+            "commit": versi_git(),
+            "mode": mode,
+            "cold": args.cold,
+            "konkurensi": args.konkurensi,
+            "siswa": len(ids["siswa"]),
+            "guru": len(ids["guru"]),
+            "catatan": args.catatan,
+            "hasil": {},
+        }
+        print(f"{mode}, {catatan['siswa']} siswa, {catatan['guru']} guru, "
+              f"{args.jumlah} request/route, konkurensi {args.konkurensi}")
+        for s in skenario:
+            catatan["hasil"][s.nama] = jalankan(klien, s, ids, args.jumlah, args.konkurensi,
+                                                args.pemanasan, args.seed)
+            print(f"  {s.nama} selesai")
+
+        sebelumnya = run_sebelumnya(catatan)
+        cetak(catatan, sebelumnya)
+        if not args.tanpa_simpan:
+            with open(HASIL_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(catatan) + "\n")
+    finally:
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
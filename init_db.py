@@ -2,8 +2,8 @@ import sqlite3
 import os
 
 # Define the database file path
-# Nama database adalah 'sekolah.db'
-DB_NAME = 'sekolah.db'
+# Nama database adalah 'inventaris.db' (terpisah dari sekolah.db milik app.py)
+DB_NAME = 'inventaris.db'
 
 def setup_database():
     """Initializes the database and creates a table with 3 columns."""
@@ -77,7 +77,7 @@ def lihat_semua_item():
 
 # --- Main execution ---
 if __name__ == "__main__":
-    # 1. Setup: Creates or opens sekolah.db
+    # 1. Setup: Creates or opens inventaris.db
     setup_database()
     print("Pengaturan database selesai.")
     
@@ -94,5 +94,5 @@ if __name__ == "__main__":
     # 3. View the results
     lihat_semua_item()
     
-    # 4. Cleanup step is REMOVED to keep sekolah.db persistent.
+    # 4. Cleanup step is REMOVED to keep inventaris.db persistent.
     print(f"\nSelesai. File database {DB_NAME} dipertahankan dan data ditampilkan.")
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Generator data dummy siswa & guru untuk uji beban dan benchmark.
+
+Data dibuat dengan seed tetap sehingga hasilnya sama di setiap mesin, lalu
+disimpan lewat pipeline import aplikasi (validasi, kolom turunan, insert per
+potongan). Contoh:
+
+    python seed_data.py --db /tmp/bench.db --siswa 10000 --foto 50
+    python seed_data.py --siswa 100000 --guru 2000 --reset   # isi sekolah.db
+
+Foto dummy disimpan ke folder upload aplikasi (config UPLOAD_FOLDER /
+UPLOAD_FOLDER_GURU, bisa diatur lewat SEKOLAH_UPLOAD_FOLDER dst).
+"""
+import argparse
+import io
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from app import (LOOKUP_TABLES, create_app, import_rows, init_db, query_db, simpan_foto,
+                 transaction)
+
+NAMA_DEPAN = (
+    "Ahmad", "Budi", "Citra", "Dewi", "Eka", "Fajar", "Gita", "Hendra", "Indah", "Joko",
+    "Kartika", "Lestari", "Muhammad", "Nur", "Oki", "Putri", "Rizky", "Siti", "Teguh",
+    "Utami", "Wahyu", "Yuni", "Zainal", "Agus", "Bayu", "Dian", "Fitri", "Hadi", "Intan",
+    "Rahmat", "Sri", "Yogi", "Ayu", "Dimas", "Nanda", "Rina", "Surya", "Wulan",
+)
+NAMA_BELAKANG = (
+    "Pratama", "Saputra", "Lestari", "Wijaya", "Hidayat", "Kurniawan", "Siregar",
+    "Nasution", "Lubis", "Harahap", "Simanjuntak", "Rahmawati", "Permata", "Santoso",
+    "Setiawan", "Gunawan", "Ramadhan", "Maharani", "Sari", "Putra", "Ginting", "Tarigan",
+)
+TEMPAT_LAHIR = (
+    "Galang", "Lubuk Pakam", "Medan", "Deli Serdang", "Tebing Tinggi", "Perbaungan",
+    "Pematang Siantar", "Binjai", "Serdang Bedagai", "Bandar Khalipah",
+)
+ASAL_SEKOLAH = tuple(f"SMP Negeri {i} Galang" for i in range(1, 6)) + (
+    "MTs Negeri Galang", "SMP Swasta Budi Utomo", "SMP Swasta Nusantara",
+)
+AGAMA = ("Islam", "Islam", "Islam", "Kristen Protestan", "Katolik", "Buddha", "Hindu")
+JABATAN = ("Guru",) * 12 + ("Wakil Kepala Sekolah", "Kepala Laboratorium", "Kepala Sekolah")
+PENDIDIKAN = (
+    "S1 Pendidikan Matematika", "S1 Pendidikan Bahasa Indonesia", "S1 Pendidikan Bahasa Inggris",
+    "S1 Teknik Informatika", "S1 Pendidikan PPKN", "S1 Agroteknologi", "S1 Peternakan",
+    "S2 Manajemen Pendidikan", "S1 Pendidikan Fisika", "D4 Teknik Otomotif",
+)
+FOTO_WARNA = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#17a2b8")
+
+
+def nama_acak(rng):
+    return f"{rng.choice(NAMA_DEPAN)} {rng.choice(NAMA_DEPAN)} {rng.choice(NAMA_BELAKANG)}"
+
+
+def geser_tahun(tanggal, tahun):
+    """tanggal + `tahun` tahun; 29 Februari menjadi 28 Februari di tahun biasa"""
+    try:
+        return tanggal.replace(year=tanggal.year + tahun)
+    except ValueError:
+        return tanggal.replace(year=tanggal.year + tahun, day=28)
+
+
+def tanggal_acak(rng, awal, akhir):
+    return awal + timedelta(days=rng.randrange((akhir - awal).days + 1))
+
+
+def baris_siswa(rng, jumlah, hari_ini):
+    kelas = LOOKUP_TABLES["kelas"]
+    jurusan = LOOKUP_TABLES["jurusan"]
+    for _ in range(jumlah):
+        lahir = tanggal_acak(rng, geser_tahun(hari_ini, -19),
+                             geser_tahun(hari_ini, -15))
+        yield {
+            "nama": nama_acak(rng),
+            "kelas": rng.choice(kelas),
+            "jurusan": rng.choice(jurusan),
+            "tempat_lahir": rng.choice(TEMPAT_LAHIR),
+            "tanggal_lahir": lahir.isoformat(),
+            "asal_sekolah": rng.choice(ASAL_SEKOLAH),
+            "alamat": f"Dusun {rng.randint(1, 12)}, Desa {rng.choice(TEMPAT_LAHIR)}",
+        }
+
+
+def baris_guru(rng, jumlah, hari_ini, nomor_awal, nip_terpakai):
+    for i in range(nomor_awal, nomor_awal + jumlah):
+        lahir = tanggal_acak(rng, geser_tahun(hari_ini, -59),
+                             geser_tahun(hari_ini, -24))
+        sk_pertama = tanggal_acak(rng, geser_tahun(lahir, 22),
+                                  min(hari_ini, geser_tahun(lahir, 35)))
+        sk_pertama = sk_pertama.replace(day=1)
+        sk_terakhir = tanggal_acak(rng, sk_pertama, hari_ini).replace(day=1)
+        # NIP: tgl lahir (8) + TMT (6) + jenis kelamin (1) + nomor urut (3)
+        awalan = f"{lahir:%Y%m%d}{sk_pertama:%Y%m}{rng.randint(1, 2)}"
+        urut = 1
+        while f"{awalan}{urut:03d}" in nip_terpakai:
+            urut += 1
+        nip = f"{awalan}{urut:03d}"
+        nip_terpakai.add(nip)
+        yield {
+            "nama": nama_acak(rng),
+            "nip": nip,
+            "tempat_lahir": rng.choice(TEMPAT_LAHIR),
+            "tanggal_lahir": lahir.isoformat(),
+            "agama": rng.choice(AGAMA),
+            "jabatan": rng.choice(JABATAN),
+            "nuptk": f"{9 * 10**15 + i}",
+            "sk_pertama": sk_pertama.isoformat(),
+            "sk_terakhir": sk_terakhir.isoformat(),
+            "pendidikan": rng.choice(PENDIDIKAN),
+        }
+
+
+def buat_foto_dummy(rng, kind, jumlah):
+    """Membuat `jumlah` foto berbeda (kotak warna + inisial) lewat simpan_foto"""
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        print("Pillow tidak terpasang, foto dummy dilewati.")
+        return []
+    from werkzeug.datastructures import FileStorage
+
+    hasil = []
+    for i in range(jumlah):
+        img = Image.new("RGB", (600, 800), rng.choice(FOTO_WARNA))
+        draw = ImageDraw.Draw(img)
+        draw.ellipse((150, 150, 450, 450), fill="#f0d9b5")
+        draw.rectangle((100, 500, 500, 800), fill="#333333")
+        draw.text((20, 20), f"{kind} #{i}", fill="white")
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=85)
+        buf.seek(0)
+        nama = simpan_foto(FileStorage(buf, filename=f"dummy_{i}.jpg"), kind)
+        if nama:
+            hasil.append(nama)
+    return hasil
+
+
+def pasang_foto(rng, kind, fotos, persen):
+    """Memberi foto acak ke sebagian baris `kind`"""
+    if not fotos:
+        return 0
+    ids = [r["id"] for r in query_db(f"SELECT id FROM {kind} WHERE foto IS NULL")]
+    terpilih = [i for i in ids if rng.random() * 100 < persen]
+    with transaction() as conn:
+        conn.executemany(f"UPDATE {kind} SET foto=? WHERE id=?",
+                         [(rng.choice(fotos), i) for i in terpilih])
+    return len(terpilih)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Isi database dengan data siswa & guru dummy.")
+    parser.add_argument("--db", help="File database (bawaan: config DATABASE / sekolah.db)")
+    parser.add_argument("--siswa", type=int, default=1000, help="Jumlah siswa (1000/10000/100000)")
+    parser.add_argument("--guru", type=int, help="Jumlah guru (bawaan: siswa / 20, minimal 10)")
+    parser.add_argument("--foto", type=int, default=20, help="Jumlah foto dummy berbeda per jenis")
+    parser.add_argument("--persen-foto", type=float, default=60, help="Persen baris yang diberi foto")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--reset", action="store_true", help="Kosongkan tabel siswa & guru dulu")
+    args = parser.parse_args()
+
+    config = {"REFRESH_TURUNAN_OTOMATIS": False}
+    if args.db:
+        config["DATABASE"] = os.path.abspath(args.db)
+    app = create_app(config)
+    rng = random.Random(args.seed)
+    jumlah_guru = args.guru if args.guru is not None else max(10, args.siswa // 20)
+    hari_ini = date.today()
+
+    with app.app_context():
+        init_db()
+        if args.reset:
+            with transaction() as conn:
+                conn.execute("DELETE FROM siswa")
+                conn.execute("DELETE FROM guru")
+            print("Tabel siswa & guru dikosongkan.")
+
+        nomor_awal = query_db("SELECT COALESCE(MAX(id), 0) AS c FROM guru", one=True)["c"] + 1
+        nip_terpakai = {r["nip"] for r in query_db("SELECT nip FROM guru WHERE nip IS NOT NULL")}
+        mulai = time.perf_counter()
+        for table, rows in (("siswa", baris_siswa(rng, args.siswa, hari_ini)),
+                            ("guru", baris_guru(rng, jumlah_guru, hari_ini, nomor_awal,
+                                                  nip_terpakai))):
+            hasil = import_rows(table, rows)
+            print(f"{table}: {hasil['tersimpan']} dari {hasil['total']} baris tersimpan")
+            for baris, pesan in hasil["errors"][:5]:
+                print(f"  baris {baris}: {pesan}")
+
+        for kind in ("siswa", "guru"):
+            fotos = buat_foto_dummy(rng, kind, args.foto)
+            n = pasang_foto(rng, kind, fotos, args.persen_foto)
+            print(f"{kind}: {len(fotos)} foto dummy, dipasang ke {n} baris")
+
+        total = {t: query_db(f"SELECT COUNT(*) AS c FROM {t}", one=True)["c"] for t in ("siswa", "guru")}
+        print(f"Selesai dalam {time.perf_counter() - mulai:.1f} detik. "
+              f"Isi database: {total['siswa']} siswa, {total['guru']} guru ({app.config['DATABASE']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,132 +0,0 @@
-/*!
- SearchPanes 1.4.0
- 2019-2020 SpryMedia Ltd - datatables.net/license
-*/
-var $jscomp=$jscomp||{};$jscomp.scope={};$jscomp.getGlobal=function(n){n=["object"==typeof globalThis&&globalThis,n,"object"==typeof window&&window,"object"==typeof self&&self,"object"==typeof global&&global];for(var q=0;q<n.length;++q){var l=n[q];if(l&&l.Math==Math)return l}throw Error("Cannot find global object");};$jscomp.global=$jscomp.getGlobal(this);
-$jscomp.checkEs6ConformanceViaProxy=function(){try{var n={},q=Object.create(new $jscomp.global.Proxy(n,{get:function(l,r,t){return l==n&&"q"==r&&t==q}}));return!0===q.q}catch(l){return!1}};$jscomp.USE_PROXY_FOR_ES6_CONFORMANCE_CHECKS=!1;$jscomp.ES6_CONFORMANCE=$jscomp.USE_PROXY_FOR_ES6_CONFORMANCE_CHECKS&&$jscomp.checkEs6ConformanceViaProxy();$jscomp.arrayIteratorImpl=function(n){var q=0;return function(){return q<n.length?{done:!1,value:n[q++]}:{done:!0}}};$jscomp.arrayIterator=function(n){return{next:$jscomp.arrayIteratorImpl(n)}};
-$jscomp.ASSUME_ES5=!1;$jscomp.ASSUME_NO_NATIVE_MAP=!1;$jscomp.ASSUME_NO_NATIVE_SET=!1;$jscomp.SIMPLE_FROUND_POLYFILL=!1;$jscomp.ISOLATE_POLYFILLS=!1;$jscomp.defineProperty=$jscomp.ASSUME_ES5||"function"==typeof Object.defineProperties?Object.defineProperty:function(n,q,l){if(n==Array.prototype||n==Object.prototype)return n;n[q]=l.value;return n};$jscomp.IS_SYMBOL_NATIVE="function"===typeof Symbol&&"symbol"===typeof Symbol("x");$jscomp.TRUST_ES6_POLYFILLS=!$jscomp.ISOLATE_POLYFILLS||$jscomp.IS_SYMBOL_NATIVE;
-$jscomp.polyfills={};$jscomp.propertyToPolyfillSymbol={};$jscomp.POLYFILL_PREFIX="$jscp$";var $jscomp$lookupPolyfilledValue=function(n,q){var l=$jscomp.propertyToPolyfillSymbol[q];if(null==l)return n[q];l=n[l];return void 0!==l?l:n[q]};$jscomp.polyfill=function(n,q,l,r){q&&($jscomp.ISOLATE_POLYFILLS?$jscomp.polyfillIsolated(n,q,l,r):$jscomp.polyfillUnisolated(n,q,l,r))};
-$jscomp.polyfillUnisolated=function(n,q,l,r){l=$jscomp.global;n=n.split(".");for(r=0;r<n.length-1;r++){var t=n[r];if(!(t in l))return;l=l[t]}n=n[n.length-1];r=l[n];q=q(r);q!=r&&null!=q&&$jscomp.defineProperty(l,n,{configurable:!0,writable:!0,value:q})};
-$jscomp.polyfillIsolated=function(n,q,l,r){var t=n.split(".");n=1===t.length;r=t[0];r=!n&&r in $jscomp.polyfills?$jscomp.polyfills:$jscomp.global;for(var v=0;v<t.length-1;v++){var A=t[v];if(!(A in r))return;r=r[A]}t=t[t.length-1];l=$jscomp.IS_SYMBOL_NATIVE&&"es6"===l?r[t]:null;q=q(l);null!=q&&(n?$jscomp.defineProperty($jscomp.polyfills,t,{configurable:!0,writable:!0,value:q}):q!==l&&($jscomp.propertyToPolyfillSymbol[t]=$jscomp.IS_SYMBOL_NATIVE?$jscomp.global.Symbol(t):$jscomp.POLYFILL_PREFIX+t,t=
-$jscomp.propertyToPolyfillSymbol[t],$jscomp.defineProperty(r,t,{configurable:!0,writable:!0,value:q})))};$jscomp.initSymbol=function(){};
-$jscomp.polyfill("Symbol",function(n){if(n)return n;var q=function(t,v){this.$jscomp$symbol$id_=t;$jscomp.defineProperty(this,"description",{configurable:!0,writable:!0,value:v})};q.prototype.toString=function(){return this.$jscomp$symbol$id_};var l=0,r=function(t){if(this instanceof r)throw new TypeError("Symbol is not a constructor");return new q("jscomp_symbol_"+(t||"")+"_"+l++,t)};return r},"es6","es3");$jscomp.initSymbolIterator=function(){};
-$jscomp.polyfill("Symbol.iterator",function(n){if(n)return n;n=Symbol("Symbol.iterator");for(var q="Array Int8Array Uint8Array Uint8ClampedArray Int16Array Uint16Array Int32Array Uint32Array Float32Array Float64Array".split(" "),l=0;l<q.length;l++){var r=$jscomp.global[q[l]];"function"===typeof r&&"function"!=typeof r.prototype[n]&&$jscomp.defineProperty(r.prototype,n,{configurable:!0,writable:!0,value:function(){return $jscomp.iteratorPrototype($jscomp.arrayIteratorImpl(this))}})}return n},"es6",
-"es3");$jscomp.initSymbolAsyncIterator=function(){};$jscomp.iteratorPrototype=function(n){n={next:n};n[Symbol.iterator]=function(){return this};return n};$jscomp.makeIterator=function(n){var q="undefined"!=typeof Symbol&&Symbol.iterator&&n[Symbol.iterator];return q?q.call(n):$jscomp.arrayIterator(n)};$jscomp.owns=function(n,q){return Object.prototype.hasOwnProperty.call(n,q)};
-$jscomp.polyfill("WeakMap",function(n){function q(){if(!n||!Object.seal)return!1;try{var a=Object.seal({}),b=Object.seal({}),c=new n([[a,2],[b,3]]);if(2!=c.get(a)||3!=c.get(b))return!1;c.delete(a);c.set(b,4);return!c.has(a)&&4==c.get(b)}catch(e){return!1}}function l(){}function r(a){var b=typeof a;return"object"===b&&null!==a||"function"===b}function t(a){if(!$jscomp.owns(a,A)){var b=new l;$jscomp.defineProperty(a,A,{value:b})}}function v(a){if(!$jscomp.ISOLATE_POLYFILLS){var b=Object[a];b&&(Object[a]=
-function(c){if(c instanceof l)return c;Object.isExtensible(c)&&t(c);return b(c)})}}if($jscomp.USE_PROXY_FOR_ES6_CONFORMANCE_CHECKS){if(n&&$jscomp.ES6_CONFORMANCE)return n}else if(q())return n;var A="$jscomp_hidden_"+Math.random();v("freeze");v("preventExtensions");v("seal");var F=0,h=function(a){this.id_=(F+=Math.random()+1).toString();if(a){a=$jscomp.makeIterator(a);for(var b;!(b=a.next()).done;)b=b.value,this.set(b[0],b[1])}};h.prototype.set=function(a,b){if(!r(a))throw Error("Invalid WeakMap key");
-t(a);if(!$jscomp.owns(a,A))throw Error("WeakMap key fail: "+a);a[A][this.id_]=b;return this};h.prototype.get=function(a){return r(a)&&$jscomp.owns(a,A)?a[A][this.id_]:void 0};h.prototype.has=function(a){return r(a)&&$jscomp.owns(a,A)&&$jscomp.owns(a[A],this.id_)};h.prototype.delete=function(a){return r(a)&&$jscomp.owns(a,A)&&$jscomp.owns(a[A],this.id_)?delete a[A][this.id_]:!1};return h},"es6","es3");$jscomp.MapEntry=function(){};
-$jscomp.polyfill("Map",function(n){function q(){if($jscomp.ASSUME_NO_NATIVE_MAP||!n||"function"!=typeof n||!n.prototype.entries||"function"!=typeof Object.seal)return!1;try{var h=Object.seal({x:4}),a=new n($jscomp.makeIterator([[h,"s"]]));if("s"!=a.get(h)||1!=a.size||a.get({x:4})||a.set({x:4},"t")!=a||2!=a.size)return!1;var b=a.entries(),c=b.next();if(c.done||c.value[0]!=h||"s"!=c.value[1])return!1;c=b.next();return c.done||4!=c.value[0].x||"t"!=c.value[1]||!b.next().done?!1:!0}catch(e){return!1}}
-if($jscomp.USE_PROXY_FOR_ES6_CONFORMANCE_CHECKS){if(n&&$jscomp.ES6_CONFORMANCE)return n}else if(q())return n;var l=new WeakMap,r=function(h){this.data_={};this.head_=A();this.size=0;if(h){h=$jscomp.makeIterator(h);for(var a;!(a=h.next()).done;)a=a.value,this.set(a[0],a[1])}};r.prototype.set=function(h,a){h=0===h?0:h;var b=t(this,h);b.list||(b.list=this.data_[b.id]=[]);b.entry?b.entry.value=a:(b.entry={next:this.head_,previous:this.head_.previous,head:this.head_,key:h,value:a},b.list.push(b.entry),
-this.head_.previous.next=b.entry,this.head_.previous=b.entry,this.size++);return this};r.prototype.delete=function(h){h=t(this,h);return h.entry&&h.list?(h.list.splice(h.index,1),h.list.length||delete this.data_[h.id],h.entry.previous.next=h.entry.next,h.entry.next.previous=h.entry.previous,h.entry.head=null,this.size--,!0):!1};r.prototype.clear=function(){this.data_={};this.head_=this.head_.previous=A();this.size=0};r.prototype.has=function(h){return!!t(this,h).entry};r.prototype.get=function(h){return(h=
-t(this,h).entry)&&h.value};r.prototype.entries=function(){return v(this,function(h){return[h.key,h.value]})};r.prototype.keys=function(){return v(this,function(h){return h.key})};r.prototype.values=function(){return v(this,function(h){return h.value})};r.prototype.forEach=function(h,a){for(var b=this.entries(),c;!(c=b.next()).done;)c=c.value,h.call(a,c[1],c[0],this)};r.prototype[Symbol.iterator]=r.prototype.entries;var t=function(h,a){var b=a&&typeof a;"object"==b||"function"==b?l.has(a)?b=l.get(a):
-(b=""+ ++F,l.set(a,b)):b="p_"+a;var c=h.data_[b];if(c&&$jscomp.owns(h.data_,b))for(h=0;h<c.length;h++){var e=c[h];if(a!==a&&e.key!==e.key||a===e.key)return{id:b,list:c,index:h,entry:e}}return{id:b,list:c,index:-1,entry:void 0}},v=function(h,a){var b=h.head_;return $jscomp.iteratorPrototype(function(){if(b){for(;b.head!=h.head_;)b=b.previous;for(;b.next!=b.head;)return b=b.next,{done:!1,value:a(b)};b=null}return{done:!0,value:void 0}})},A=function(){var h={};return h.previous=h.next=h.head=h},F=0;
-return r},"es6","es3");$jscomp.findInternal=function(n,q,l){n instanceof String&&(n=String(n));for(var r=n.length,t=0;t<r;t++){var v=n[t];if(q.call(l,v,t,n))return{i:t,v:v}}return{i:-1,v:void 0}};$jscomp.polyfill("Array.prototype.find",function(n){return n?n:function(q,l){return $jscomp.findInternal(this,q,l).v}},"es6","es3");
-$jscomp.iteratorFromArray=function(n,q){n instanceof String&&(n+="");var l=0,r={next:function(){if(l<n.length){var t=l++;return{value:q(t,n[t]),done:!1}}r.next=function(){return{done:!0,value:void 0}};return r.next()}};r[Symbol.iterator]=function(){return r};return r};$jscomp.polyfill("Array.prototype.keys",function(n){return n?n:function(){return $jscomp.iteratorFromArray(this,function(q){return q})}},"es6","es3");
-$jscomp.polyfill("Object.is",function(n){return n?n:function(q,l){return q===l?0!==q||1/q===1/l:q!==q&&l!==l}},"es6","es3");$jscomp.polyfill("Array.prototype.includes",function(n){return n?n:function(q,l){var r=this;r instanceof String&&(r=String(r));var t=r.length;l=l||0;for(0>l&&(l=Math.max(l+t,0));l<t;l++){var v=r[l];if(v===q||Object.is(v,q))return!0}return!1}},"es7","es3");
-$jscomp.checkStringArgs=function(n,q,l){if(null==n)throw new TypeError("The 'this' value for String.prototype."+l+" must not be null or undefined");if(q instanceof RegExp)throw new TypeError("First argument to String.prototype."+l+" must not be a regular expression");return n+""};$jscomp.polyfill("String.prototype.includes",function(n){return n?n:function(q,l){return-1!==$jscomp.checkStringArgs(this,q,"includes").indexOf(q,l||0)}},"es6","es3");
-$jscomp.polyfill("Array.prototype.findIndex",function(n){return n?n:function(q,l){return $jscomp.findInternal(this,q,l).i}},"es6","es3");
-(function(){function n(h){l=h;r=h.fn.dataTable}function q(h){v=h;A=h.fn.dataTable}var l,r,t=function(){function h(a,b,c,e,d,f){var g=this;void 0===f&&(f=null);if(!r||!r.versionCheck||!r.versionCheck("1.10.0"))throw Error("SearchPane requires DataTables 1.10 or newer");if(!r.select)throw Error("SearchPane requires Select");a=new r.Api(a);this.classes=l.extend(!0,{},h.classes);this.c=l.extend(!0,{},h.defaults,b);void 0!==b&&void 0!==b.hideCount&&void 0===b.viewCount&&(this.c.viewCount=!this.c.hideCount);
-this.customPaneSettings=f;this.s={cascadeRegen:!1,clearing:!1,colOpts:[],deselect:!1,displayed:!1,dt:a,dtPane:void 0,filteringActive:!1,firstSet:!0,forceViewTotal:!1,index:c,indexes:[],lastCascade:!1,lastSelect:!1,listSet:!1,name:void 0,redraw:!1,rowData:{arrayFilter:[],arrayOriginal:[],arrayTotals:[],bins:{},binsOriginal:{},binsTotal:{},filterMap:new Map,totalOptions:0},scrollTop:0,searchFunction:void 0,selectPresent:!1,serverSelect:[],serverSelecting:!1,showFiltered:!1,tableLength:null,updating:!1};
-b=a.columns().eq(0).toArray().length;this.colExists=this.s.index<b;this.c.layout=e;b=parseInt(e.split("-")[1],10);this.dom={buttonGroup:l("<div/>").addClass(this.classes.buttonGroup),clear:l('<button type="button">&#215;</button>').addClass(this.classes.disabledButton).attr("disabled","true").addClass(this.classes.paneButton).addClass(this.classes.clearButton),collapseButton:l('<button type="button"><span class="dtsp-caret">&#x5e;</span></button>').addClass(this.classes.paneButton).addClass(this.classes.collapseButton),
-container:l("<div/>").addClass(this.classes.container).addClass(this.classes.layout+(10>b?e:e.split("-")[0]+"-9")),countButton:l('<button type="button"></button>').addClass(this.classes.paneButton).addClass(this.classes.countButton),dtP:l("<table><thead><tr><th>"+(this.colExists?l(a.column(this.colExists?this.s.index:0).header()).text():this.customPaneSettings.header||"Custom Pane")+"</th><th/></tr></thead></table>"),lower:l("<div/>").addClass(this.classes.subRow2).addClass(this.classes.narrowButton),
-nameButton:l('<button type="button"></button>').addClass(this.classes.paneButton).addClass(this.classes.nameButton),panesContainer:d,searchBox:l("<input/>").addClass(this.classes.paneInputButton).addClass(this.classes.search),searchButton:l('<button type = "button" class="'+this.classes.searchIcon+'"></button>').addClass(this.classes.paneButton),searchCont:l("<div/>").addClass(this.classes.searchCont),searchLabelCont:l("<div/>").addClass(this.classes.searchLabelCont),topRow:l("<div/>").addClass(this.classes.topRow),
-upper:l("<div/>").addClass(this.classes.subRow1).addClass(this.classes.narrowSearch)};this.s.displayed=!1;a=this.s.dt;this.selections=[];this.s.colOpts=this.colExists?this._getOptions():this._getBonusOptions();var k=this.s.colOpts;e=l('<button type="button">X</button>').addClass(this.classes.paneButton);e.text(a.i18n("searchPanes.clearPane",this.c.i18n.clearPane));this.dom.container.addClass(k.className);this.dom.container.addClass(null!==this.customPaneSettings&&void 0!==this.customPaneSettings.className?
-this.customPaneSettings.className:"");this.s.name=void 0!==this.s.colOpts.name?this.s.colOpts.name:null!==this.customPaneSettings&&void 0!==this.customPaneSettings.name?this.customPaneSettings.name:this.colExists?l(a.column(this.s.index).header()).text():this.customPaneSettings.header||"Custom Pane";l(d).append(this.dom.container);var p=a.table(0).node();this.s.searchFunction=function(m,x,z,y){if(0===g.selections.length||m.nTable!==p)return!0;m=null;g.colExists&&(m=x[g.s.index],"filter"!==k.orthogonal.filter&&
-(m=g.s.rowData.filterMap.get(z),m instanceof l.fn.dataTable.Api&&(m=m.toArray())));return g._search(m,z)};l.fn.dataTable.ext.search.push(this.s.searchFunction);if(this.c.clear)e.on("click",function(){g.dom.container.find("."+g.classes.search.replace(/\s+/g,".")).each(function(){l(this).val("");l(this).trigger("input")});g.clearPane()});a.on("draw.dtsp",function(){g.adjustTopRow()});a.on("buttons-action",function(){g.adjustTopRow()});a.on("column-reorder.dtsp",function(m,x,z){g.s.index=z.mapping[g.s.index]});
-return this}h.prototype.addRow=function(a,b,c,e,d,f,g){for(var k,p=0,m=this.s.indexes;p<m.length;p++){var x=m[p];x.filter===b&&(k=x.index)}void 0===k&&(k=this.s.indexes.length,this.s.indexes.push({filter:b,index:k}));return this.s.dtPane.row.add({className:g,display:""!==a?a:this.emptyMessage(),filter:b,index:k,shown:c,sort:d,total:e,type:f})};h.prototype.adjustTopRow=function(){var a=this.dom.container.find("."+this.classes.subRowsContainer.replace(/\s+/g,".")),b=this.dom.container.find("."+this.classes.subRow1.replace(/\s+/g,
-".")),c=this.dom.container.find("."+this.classes.subRow2.replace(/\s+/g,".")),e=this.dom.container.find("."+this.classes.topRow.replace(/\s+/g,"."));(252>l(a[0]).width()||252>l(e[0]).width())&&0!==l(a[0]).width()?(l(a[0]).addClass(this.classes.narrow),l(b[0]).addClass(this.classes.narrowSub).removeClass(this.classes.narrowSearch),l(c[0]).addClass(this.classes.narrowSub).removeClass(this.classes.narrowButton)):(l(a[0]).removeClass(this.classes.narrow),l(b[0]).removeClass(this.classes.narrowSub).addClass(this.classes.narrowSearch),
-l(c[0]).removeClass(this.classes.narrowSub).addClass(this.classes.narrowButton))};h.prototype.clearData=function(){this.s.rowData={arrayFilter:[],arrayOriginal:[],arrayTotals:[],bins:{},binsOriginal:{},binsTotal:{},filterMap:new Map,totalOptions:0}};h.prototype.clearPane=function(){this.s.dtPane.rows({selected:!0}).deselect();this.updateTable();return this};h.prototype.collapse=function(){var a=this;this.s.displayed&&(this.c.collapse||!0===this.s.colOpts.collapse)&&!1!==this.s.colOpts.collapse&&(this.dom.collapseButton.addClass(this.classes.rotated),
-l(this.s.dtPane.table().container()).addClass(this.classes.hidden),this.dom.topRow.addClass(this.classes.bordered),this.dom.countButton.addClass(this.classes.disabledButton),this.dom.nameButton.addClass(this.classes.disabledButton),this.dom.searchButton.addClass(this.classes.disabledButton),this.dom.topRow.one("click",function(){a.show()}))};h.prototype.destroy=function(){void 0!==this.s.dtPane&&this.s.dtPane.off(".dtsp");this.dom.nameButton.off(".dtsp");this.dom.collapseButton.off(".dtsp");this.dom.countButton.off(".dtsp");
-this.dom.clear.off(".dtsp");this.dom.searchButton.off(".dtsp");this.dom.container.remove();for(var a=l.fn.dataTable.ext.search.indexOf(this.s.searchFunction);-1!==a;)l.fn.dataTable.ext.search.splice(a,1),a=l.fn.dataTable.ext.search.indexOf(this.s.searchFunction);void 0!==this.s.dtPane&&this.s.dtPane.destroy();this.s.listSet=!1};h.prototype.emptyMessage=function(){var a=this.c.i18n.emptyMessage;this.c.emptyMessage&&(a=this.c.emptyMessage);!1!==this.s.colOpts.emptyMessage&&null!==this.s.colOpts.emptyMessage&&
-(a=this.s.colOpts.emptyMessage);return this.s.dt.i18n("searchPanes.emptyMessage",a)};h.prototype.getPaneCount=function(){return void 0!==this.s.dtPane?this.s.dtPane.rows({selected:!0}).data().toArray().length:0};h.prototype.rebuildPane=function(a,b,c,e){void 0===a&&(a=!1);void 0===b&&(b=null);void 0===c&&(c=null);void 0===e&&(e=!1);this.clearData();var d=[];this.s.serverSelect=[];var f=null;void 0!==this.s.dtPane&&(e&&(this.s.dt.page.info().serverSide?this.s.serverSelect=this.s.dtPane.rows({selected:!0}).data().toArray():
-d=this.s.dtPane.rows({selected:!0}).data().toArray()),this.s.dtPane.clear().destroy(),f=this.dom.container.prev(),this.destroy(),this.s.dtPane=void 0,l.fn.dataTable.ext.search.push(this.s.searchFunction));this.dom.container.removeClass(this.classes.hidden);this.s.displayed=!1;this._buildPane(this.s.dt.page.info().serverSide?this.s.serverSelect:d,a,b,c,f);return this};h.prototype.removePane=function(){this.s.displayed=!1;this.dom.container.hide()};h.prototype.resize=function(a){this.c.layout=a;var b=
-parseInt(a.split("-")[1],10);this.dom.container.removeClass().addClass(this.classes.container).addClass(this.classes.layout+(10>b?a:a.split("-")[0]+"-9")).addClass(this.s.colOpts.className).addClass(null!==this.customPaneSettings&&void 0!==this.customPaneSettings.className?this.customPaneSettings.className:"").addClass(this.classes.show);this.adjustTopRow()};h.prototype.setCascadeRegen=function(a){this.s.cascadeRegen=a};h.prototype.setClear=function(a){this.s.clearing=a};h.prototype.show=function(){this.s.displayed&&
-(this.dom.collapseButton.removeClass(this.classes.rotated),l(this.s.dtPane.table().container()).removeClass(this.classes.hidden),this.dom.topRow.removeClass(this.classes.bordered),this.dom.countButton.removeClass(this.classes.disabledButton),this.dom.nameButton.removeClass(this.classes.disabledButton),this.dom.searchButton.removeClass(this.classes.disabledButton))};h.prototype.updatePane=function(a){void 0===a&&(a=!1);this.s.updating=!0;this._updateCommon(a);this.s.updating=!1};h.prototype.updateTable=
-function(){this.selections=this.s.dtPane.rows({selected:!0}).data().toArray();this._searchExtras();(this.c.cascadePanes||this.c.viewTotal)&&this.updatePane()};h.prototype._setListeners=function(){var a=this,b=this.s.rowData,c;this.s.dtPane.off("select.dtsp");this.s.dtPane.on("select.dtsp",function(){clearTimeout(c);a.s.dt.page.info().serverSide&&!a.s.updating?a.s.serverSelecting||(a.s.serverSelect=a.s.dtPane.rows({selected:!0}).data().toArray(),a.s.scrollTop=l(a.s.dtPane.table().node()).parent()[0].scrollTop,
-a.s.selectPresent=!0,a.s.dt.draw(!1)):a.s.updating||(a.s.selectPresent=!0,a._makeSelection(),a.s.selectPresent=!1);a.dom.clear.removeClass(a.classes.disabledButton).removeAttr("disabled")});this.s.dtPane.off("deselect.dtsp");this.s.dtPane.on("deselect.dtsp",function(){c=setTimeout(function(){a.s.scrollTop=l(a.s.dtPane.table().node()).parent()[0].scrollTop;a.s.dt.page.info().serverSide&&!a.s.updating?a.s.serverSelecting||(a.s.serverSelect=a.s.dtPane.rows({selected:!0}).data().toArray(),a.s.deselect=
-!0,a.s.dt.draw(!1)):(a.s.deselect=!0,a._makeSelection(),a.s.deselect=!1);0===a.s.dtPane.rows({selected:!0}).data().toArray().length&&a.dom.clear.addClass(a.classes.disabledButton).attr("disabled","true")},50)});this.s.firstSet&&(this.s.firstSet=!1,this.s.dt.on("stateSaveParams.dtsp",function(e,d,f){if(l.isEmptyObject(f))a.s.dtPane.state.clear();else{e=[];if(void 0!==a.s.dtPane){e=a.s.dtPane.rows({selected:!0}).data().map(function(z){return z.filter.toString()}).toArray();var g=a.dom.searchBox.val();
-var k=a.s.dtPane.order();var p=b.binsOriginal;var m=b.arrayOriginal;var x=a.dom.collapseButton.hasClass(a.classes.rotated)}void 0===f.searchPanes&&(f.searchPanes={});void 0===f.searchPanes.panes&&(f.searchPanes.panes=[]);for(d=0;d<f.searchPanes.panes.length;d++)f.searchPanes.panes[d].id===a.s.index&&(f.searchPanes.panes.splice(d,1),d--);f.searchPanes.panes.push({arrayFilter:m,bins:p,collapsed:x,id:a.s.index,order:k,searchTerm:g,selected:e})}}));this.s.dtPane.off("user-select.dtsp");this.s.dtPane.on("user-select.dtsp",
-function(e,d,f,g,k){k.stopPropagation()});this.s.dtPane.off("draw.dtsp");this.s.dtPane.on("draw.dtsp",function(){a.adjustTopRow()});this.dom.nameButton.off("click.dtsp");this.dom.nameButton.on("click.dtsp",function(){var e=a.s.dtPane.order()[0][1];a.s.dtPane.order([0,"asc"===e?"desc":"asc"]).draw();a.s.dt.state.save()});this.dom.countButton.off("click.dtsp");this.dom.countButton.on("click.dtsp",function(){var e=a.s.dtPane.order()[0][1];a.s.dtPane.order([1,"asc"===e?"desc":"asc"]).draw();a.s.dt.state.save()});
-this.dom.collapseButton.off("click.dtsp");this.dom.collapseButton.on("click.dtsp",function(e){e.stopPropagation();e=l(a.s.dtPane.table().container());a.dom.collapseButton.toggleClass(a.classes.rotated);e.toggleClass(a.classes.hidden);a.dom.topRow.toggleClass(a.classes.bordered);a.dom.countButton.toggleClass(a.classes.disabledButton);a.dom.nameButton.toggleClass(a.classes.disabledButton);a.dom.searchButton.toggleClass(a.classes.disabledButton);if(e.hasClass(a.classes.hidden))a.dom.topRow.on("click",
-function(){return a.dom.collapseButton.click()});else a.dom.topRow.off("click");a.s.dt.state.save()});this.dom.clear.off("click.dtsp");this.dom.clear.on("click.dtsp",function(){a.dom.container.find("."+a.classes.search.replace(/ /g,".")).each(function(){l(this).val("");l(this).trigger("input")});a.clearPane()});this.dom.searchButton.off("click.dtsp");this.dom.searchButton.on("click.dtsp",function(){a.dom.searchBox.focus()});this.dom.searchBox.off("click.dtsp");this.dom.searchBox.on("input.dtsp",function(){var e=
-a.dom.searchBox.val();a.s.dtPane.search(e).draw();"string"===typeof e&&(0<e.length||0===e.length&&0<a.s.dtPane.rows({selected:!0}).data().toArray().length)?a.dom.clear.removeClass(a.classes.disabledButton).removeAttr("disabled"):a.dom.clear.addClass(a.classes.disabledButton).attr("disabled","true");a.s.dt.state.save()});return!0};h.prototype._addOption=function(a,b,c,e,d,f){if(Array.isArray(a)||a instanceof r.Api)if(a instanceof r.Api&&(a=a.toArray(),b=b.toArray()),a.length===b.length)for(var g=0;g<
-a.length;g++)f[a[g]]?f[a[g]]++:(f[a[g]]=1,d.push({display:b[g],filter:a[g],sort:c[g],type:e[g]})),this.s.rowData.totalOptions++;else throw Error("display and filter not the same length");else"string"===typeof this.s.colOpts.orthogonal?(f[a]?f[a]++:(f[a]=1,d.push({display:b,filter:a,sort:c,type:e})),this.s.rowData.totalOptions++):d.push({display:b,filter:a,sort:c,type:e})};h.prototype._buildPane=function(a,b,c,e,d){var f=this;void 0===a&&(a=[]);void 0===b&&(b=!1);void 0===c&&(c=null);void 0===e&&(e=
-null);void 0===d&&(d=null);this.selections=[];var g=this.s.dt,k=g.column(this.colExists?this.s.index:0),p=this.s.colOpts,m=this.s.rowData,x=g.i18n("searchPanes.count",this.c.i18n.count),z=g.i18n("searchPanes.countFiltered",this.c.i18n.countFiltered),y=g.state.loaded();this.s.listSet&&(y=g.state());if(this.colExists){var w=-1;if(y&&y.searchPanes&&y.searchPanes.panes)for(var u=0;u<y.searchPanes.panes.length;u++)if(y.searchPanes.panes[u].id===this.s.index){w=u;break}if((!1===p.show||void 0!==p.show&&
-!0!==p.show)&&-1===w)return this.dom.container.addClass(this.classes.hidden),this.s.displayed=!1;if(!0===p.show||-1!==w)this.s.displayed=!0;if(!this.s.dt.page.info().serverSide&&(null===c||null===c.searchPanes||null===c.searchPanes.options)){0===m.arrayFilter.length&&(this._populatePane(b),this.s.rowData.totalOptions=0,this._detailsPane(),m.arrayOriginal=m.arrayTotals,m.binsOriginal=m.binsTotal);u=Object.keys(m.binsOriginal).length;b=this._uniqueRatio(u,g.rows()[0].length);if(!1===this.s.displayed&&
-((void 0===p.show&&null===p.threshold?b>this.c.threshold:b>p.threshold)||!0!==p.show&&1>=u)){this.dom.container.addClass(this.classes.hidden);this.s.displayed=!1;return}this.c.viewTotal&&0===m.arrayTotals.length?(this.s.rowData.totalOptions=0,this._detailsPane()):m.binsTotal=m.bins;this.dom.container.addClass(this.classes.show);this.s.displayed=!0}else if(null!==c&&null!==c.searchPanes&&null!==c.searchPanes.options){if(void 0!==c.tableLength)this.s.tableLength=c.tableLength,this.s.rowData.totalOptions=
-this.s.tableLength;else if(null===this.s.tableLength||g.rows()[0].length>this.s.tableLength)this.s.tableLength=g.rows()[0].length,this.s.rowData.totalOptions=this.s.tableLength;b=g.column(this.s.index).dataSrc();if(void 0!==c.searchPanes.options[b])for(u=0,b=c.searchPanes.options[b];u<b.length;u++)w=b[u],this.s.rowData.arrayFilter.push({display:w.label,filter:w.value,sort:w.label,type:w.label}),this.s.rowData.bins[w.value]=this.c.viewTotal||this.c.cascadePanes?w.count:w.total,this.s.rowData.binsTotal[w.value]=
-w.total;u=Object.keys(m.binsTotal).length;b=this._uniqueRatio(u,this.s.tableLength);if(!1===this.s.displayed&&((void 0===p.show&&null===p.threshold?b>this.c.threshold:b>p.threshold)||!0!==p.show&&1>=u)){this.dom.container.addClass(this.classes.hidden);this.s.displayed=!1;return}this.s.rowData.arrayOriginal=this.s.rowData.arrayFilter;this.s.rowData.binsOriginal=this.s.rowData.bins;this.s.displayed=!0}}else this.s.displayed=!0;this._displayPane();if(!this.s.listSet)this.dom.dtP.on("stateLoadParams.dt",
-function(C,G,D){l.isEmptyObject(g.state.loaded())&&l.each(D,function(E,I){delete D[E]})});null!==d&&0<this.dom.panesContainer.has(d).length?this.dom.container.insertAfter(d):this.dom.panesContainer.prepend(this.dom.container);u=l.fn.dataTable.ext.errMode;l.fn.dataTable.ext.errMode="none";d=r.Scroller;this.s.dtPane=this.dom.dtP.DataTable(l.extend(!0,{columnDefs:[{className:"dtsp-nameColumn",data:"display",render:function(C,G,D){if("sort"===G)return D.sort;if("type"===G)return D.type;var E=(f.s.filteringActive||
-f.s.showFiltered)&&f.c.viewTotal||f.c.viewTotal&&f.s.forceViewTotal?z.replace(/{total}/,D.total):x.replace(/{total}/,D.total);for(E=E.replace(/{shown}/,D.shown);E.includes("{total}");)E=E.replace(/{total}/,D.total);for(;E.includes("{shown}");)E=E.replace(/{shown}/,D.shown);D='<span class="'+f.classes.pill+'">'+E+"</span>";f.c.viewCount&&p.viewCount||(D="");return"filter"===G?"string"===typeof C&&null!==C.match(/<[^>]*>/)?C.replace(/<[^>]*>/g,""):C:'<div class="'+f.classes.nameCont+'"><span title="'+
-("string"===typeof C&&null!==C.match(/<[^>]*>/)?C.replace(/<[^>]*>/g,""):C)+'" class="'+f.classes.name+'">'+C+"</span>"+D+"</div>"},targets:0,type:void 0!==g.settings()[0].aoColumns[this.s.index]?g.settings()[0].aoColumns[this.s.index]._sManualType:null},{className:"dtsp-countColumn "+this.classes.badgePill,data:"shown",orderData:[1,2],searchable:!1,targets:1,visible:!1},{data:"total",searchable:!1,targets:2,visible:!1}],deferRender:!0,dom:"t",info:!1,language:this.s.dt.settings()[0].oLanguage,paging:d?
-!0:!1,scrollX:!1,scrollY:"200px",scroller:d?!0:!1,select:!0,stateSave:g.settings()[0].oFeatures.bStateSave?!0:!1},this.c.dtOpts,void 0!==p?p.dtOpts:{},void 0===this.s.colOpts.options&&this.colExists?void 0:{createdRow:function(C,G,D){l(C).addClass(G.className)}},null!==this.customPaneSettings&&void 0!==this.customPaneSettings.dtOpts?this.customPaneSettings.dtOpts:{},l.fn.dataTable.versionCheck("2")?{layout:{bottomLeft:null,bottomRight:null,topLeft:null,topRight:null}}:{}));this.dom.dtP.addClass(this.classes.table);
-d="Custom Pane";this.customPaneSettings&&this.customPaneSettings.header?d=this.customPaneSettings.header:p.header?d=p.header:this.colExists&&(d=l.fn.dataTable.versionCheck("2")?g.column(this.s.index).title():g.settings()[0].aoColumns[this.s.index].sTitle);this.dom.searchBox.attr("placeholder",d);l.fn.dataTable.select.init(this.s.dtPane);l.fn.dataTable.ext.errMode=u;if(this.colExists){k=(k=k.search())?k.substr(1,k.length-2).split("|"):[];var B=0;m.arrayFilter.forEach(function(C){""===C.filter&&B++});
-u=0;for(d=m.arrayFilter.length;u<d;u++){k=!1;w=0;for(var H=this.s.serverSelect;w<H.length;w++)b=H[w],b.filter===m.arrayFilter[u].filter&&(k=!0);if(this.s.dt.page.info().serverSide&&(!this.c.cascadePanes||this.c.cascadePanes&&0!==m.bins[m.arrayFilter[u].filter]||this.c.cascadePanes&&null!==e||k))for(k=this.addRow(m.arrayFilter[u].display,m.arrayFilter[u].filter,e?m.binsTotal[m.arrayFilter[u].filter]:m.bins[m.arrayFilter[u].filter],this.c.viewTotal||e?String(m.binsTotal[m.arrayFilter[u].filter]):m.bins[m.arrayFilter[u].filter],
-m.arrayFilter[u].sort,m.arrayFilter[u].type),w=0,H=this.s.serverSelect;w<H.length;w++)b=H[w],b.filter===m.arrayFilter[u].filter&&(this.s.serverSelecting=!0,k.select(),this.s.serverSelecting=!1);else this.s.dt.page.info().serverSide||!m.arrayFilter[u]||void 0===m.bins[m.arrayFilter[u].filter]&&this.c.cascadePanes?this.s.dt.page.info().serverSide||this.addRow("",B,B,"","",""):this.addRow(m.arrayFilter[u].display,m.arrayFilter[u].filter,m.bins[m.arrayFilter[u].filter],m.binsTotal[m.arrayFilter[u].filter],
-m.arrayFilter[u].sort,m.arrayFilter[u].type)}}r.select.init(this.s.dtPane);(void 0!==p.options||null!==this.customPaneSettings&&void 0!==this.customPaneSettings.options)&&this._getComparisonRows();this.s.dtPane.draw();this.s.dtPane.table().node().parentNode.scrollTop=this.s.scrollTop;this.adjustTopRow();this.s.listSet||(this._setListeners(),this.s.listSet=!0);for(e=0;e<a.length;e++)if(m=a[e],void 0!==m)for(u=0,d=this.s.dtPane.rows().indexes().toArray();u<d.length;u++)k=d[u],void 0!==this.s.dtPane.row(k).data()&&
-m.filter===this.s.dtPane.row(k).data().filter&&(this.s.dt.page.info().serverSide?(this.s.serverSelecting=!0,this.s.dtPane.row(k).select(),this.s.serverSelecting=!1):this.s.dtPane.row(k).select());this.s.dt.page.info().serverSide&&this.s.dtPane.search(this.dom.searchBox.val()).draw();(this.c.initCollapsed&&!1!==this.s.colOpts.initCollapsed||this.s.colOpts.initCollapsed)&&(this.c.collapse&&!1!==this.s.colOpts.collapse||this.s.colOpts.collapse)&&this.collapse();if(y&&y.searchPanes&&y.searchPanes.panes&&
-(null===c||1===c.draw))for(this.c.cascadePanes||this._reloadSelect(y),c=0,y=y.searchPanes.panes;c<y.length;c++)a=y[c],a.id===this.s.index&&(a.searchTerm&&0<a.searchTerm.length&&(this.dom.searchBox.val(a.searchTerm),this.dom.searchBox.trigger("input")),this.s.dtPane.order(a.order).draw(),a.collapsed?this.collapse():this.show());return!0};h.prototype._detailsPane=function(){var a=this.s.dt;this.s.rowData.arrayTotals=[];this.s.rowData.binsTotal={};var b=this.s.dt.settings()[0];a=a.rows().indexes();if(!this.s.dt.page.info().serverSide)for(var c=
-0;c<a.length;c++)this._populatePaneArray(a[c],this.s.rowData.arrayTotals,b,this.s.rowData.binsTotal)};h.prototype._displayPane=function(){var a=this.dom.container,b=this.s.colOpts,c=parseInt(this.c.layout.split("-")[1],10);this.dom.topRow.empty();this.dom.dtP.empty();this.dom.topRow.addClass(this.classes.topRow);3<c&&this.dom.container.addClass(this.classes.smallGap);this.dom.topRow.addClass(this.classes.subRowsContainer);this.dom.upper.appendTo(this.dom.topRow);this.dom.lower.appendTo(this.dom.topRow);
-this.dom.searchCont.appendTo(this.dom.upper);this.dom.buttonGroup.appendTo(this.dom.lower);(!1===this.c.dtOpts.searching||void 0!==b.dtOpts&&!1===b.dtOpts.searching||!this.c.controls||!b.controls||null!==this.customPaneSettings&&void 0!==this.customPaneSettings.dtOpts&&void 0!==this.customPaneSettings.dtOpts.searching&&!this.customPaneSettings.dtOpts.searching)&&this.dom.searchBox.removeClass(this.classes.paneInputButton).addClass(this.classes.disabledButton).attr("disabled","true");this.dom.searchBox.appendTo(this.dom.searchCont);
-this._searchContSetup();this.c.clear&&this.c.controls&&b.controls&&this.dom.clear.appendTo(this.dom.buttonGroup);this.c.orderable&&b.orderable&&this.c.controls&&b.controls&&this.dom.nameButton.appendTo(this.dom.buttonGroup);this.c.viewCount&&b.viewCount&&this.c.orderable&&b.orderable&&this.c.controls&&b.controls&&this.dom.countButton.appendTo(this.dom.buttonGroup);(this.c.collapse&&!1!==this.s.colOpts.collapse||this.s.colOpts.collapse)&&this.c.controls&&b.controls&&this.dom.collapseButton.appendTo(this.dom.buttonGroup);
-this.dom.topRow.prependTo(this.dom.container);a.append(this.dom.dtP);a.show()};h.prototype._getBonusOptions=function(){return l.extend(!0,{},h.defaults,{orthogonal:{threshold:null},threshold:null},void 0!==this.c?this.c:{})};h.prototype._getComparisonRows=function(){var a=this.s.colOpts;a=void 0!==a.options?a.options:null!==this.customPaneSettings&&void 0!==this.customPaneSettings.options?this.customPaneSettings.options:void 0;if(void 0!==a){var b=this.s.dt.rows({search:"applied"}).data().toArray(),
-c=this.s.dt.rows({search:"applied"}),e=this.s.dt.rows().data().toArray(),d=this.s.dt.rows(),f=[];this.s.dtPane.clear();for(var g=0;g<a.length;g++){var k=a[g],p=""!==k.label?k.label:this.emptyMessage(),m=k.className,x=p,z="function"===typeof k.value?k.value:[],y=0,w=p,u=0;if("function"===typeof k.value){for(var B=0;B<b.length;B++)k.value.call(this.s.dt,b[B],c[0][B])&&y++;for(B=0;B<e.length;B++)k.value.call(this.s.dt,e[B],d[0][B])&&u++;"function"!==typeof z&&z.push(k.filter)}(!this.c.cascadePanes||
-this.c.cascadePanes&&0!==y)&&f.push(this.addRow(x,z,y,u,w,p,m))}return f}};h.prototype._getOptions=function(){var a=this.s.dt.settings()[0].aoColumns[this.s.index].searchPanes,b=l.extend(!0,{},h.defaults,{collapse:null,emptyMessage:!1,initCollapsed:null,orthogonal:{threshold:null},threshold:null},a);void 0!==a&&void 0!==a.hideCount&&void 0===a.viewCount&&(b.viewCount=!a.hideCount);return b};h.prototype._makeSelection=function(){this.updateTable();this.s.updating=!0;this.s.dt.draw();this.s.updating=
-!1};h.prototype._populatePane=function(a){void 0===a&&(a=!1);var b=this.s.dt;this.s.rowData.arrayFilter=[];this.s.rowData.bins={};var c=this.s.dt.settings()[0];if(!this.s.dt.page.info().serverSide){var e=0;for(a=(!this.c.cascadePanes&&!this.c.viewTotal||this.s.clearing||a?b.rows().indexes():b.rows({search:"applied"}).indexes()).toArray();e<a.length;e++)this._populatePaneArray(a[e],this.s.rowData.arrayFilter,c)}};h.prototype._populatePaneArray=function(a,b,c,e){void 0===e&&(e=this.s.rowData.bins);
-var d=this.s.colOpts;if("string"===typeof d.orthogonal)c=c.oApi._fnGetCellData(c,a,this.s.index,d.orthogonal),this.s.rowData.filterMap.set(a,c),this._addOption(c,c,c,c,b,e);else{var f=c.oApi._fnGetCellData(c,a,this.s.index,d.orthogonal.search);null===f&&(f="");"string"===typeof f&&(f=f.replace(/<[^>]*>/g,""));this.s.rowData.filterMap.set(a,f);e[f]?e[f]++:(e[f]=1,this._addOption(f,c.oApi._fnGetCellData(c,a,this.s.index,d.orthogonal.display),c.oApi._fnGetCellData(c,a,this.s.index,d.orthogonal.sort),
-c.oApi._fnGetCellData(c,a,this.s.index,d.orthogonal.type),b,e));this.s.rowData.totalOptions++}};h.prototype._reloadSelect=function(a){if(void 0!==a){for(var b,c=0;c<a.searchPanes.panes.length;c++)if(a.searchPanes.panes[c].id===this.s.index){b=c;break}if(void 0!==b){c=this.s.dtPane;var e=c.rows({order:"index"}).data().map(function(g){return null!==g.filter?g.filter.toString():null}).toArray(),d=0;for(a=a.searchPanes.panes[b].selected;d<a.length;d++){b=a[d];var f=-1;null!==b&&(f=e.indexOf(b.toString()));
--1<f&&(this.s.serverSelecting=!0,c.row(f).select(),this.s.serverSelecting=!1)}}}};h.prototype._search=function(a,b){for(var c=this.s.colOpts,e=this.s.dt,d=0,f=this.selections;d<f.length;d++){var g=f[d];"string"===typeof g.filter&&"string"===typeof a&&(g.filter=g.filter.replace(/&amp;/g,"&").replace(/&lt;/g,"<").replace(/&gt;/g,">").replace(/&quot;/g,'"'));if(Array.isArray(a)){if(a.includes(g.filter))return!0}else if("function"===typeof g.filter)if(g.filter.call(e,e.row(b).data(),b)){if("or"===c.combiner)return!0}else{if("and"===
-c.combiner)return!1}else if(a===g.filter||("string"!==typeof a||0!==a.length)&&a==g.filter||null===g.filter&&"string"===typeof a&&""===a)return!0}return"and"===c.combiner?!0:!1};h.prototype._searchContSetup=function(){this.c.controls&&this.s.colOpts.controls&&this.dom.searchButton.appendTo(this.dom.searchLabelCont);!1===this.c.dtOpts.searching||!1===this.s.colOpts.dtOpts.searching||null!==this.customPaneSettings&&void 0!==this.customPaneSettings.dtOpts&&void 0!==this.customPaneSettings.dtOpts.searching&&
-!this.customPaneSettings.dtOpts.searching||this.dom.searchLabelCont.appendTo(this.dom.searchCont)};h.prototype._searchExtras=function(){var a=this.s.updating;this.s.updating=!0;var b=this.s.dtPane.rows({selected:!0}).data().pluck("filter").toArray(),c=b.indexOf(this.emptyMessage()),e=l(this.s.dtPane.table().container());-1<c&&(b[c]="");0<b.length?e.addClass(this.classes.selected):0===b.length&&e.removeClass(this.classes.selected);this.s.updating=a};h.prototype._uniqueRatio=function(a,b){return 0<
-b&&(0<this.s.rowData.totalOptions&&!this.s.dt.page.info().serverSide||this.s.dt.page.info().serverSide&&0<this.s.tableLength)?a/this.s.rowData.totalOptions:1};h.prototype._updateCommon=function(a){void 0===a&&(a=!1);if(!(this.s.dt.page.info().serverSide||void 0===this.s.dtPane||this.s.filteringActive&&!this.c.cascadePanes&&!0!==a||!0===this.c.cascadePanes&&!0===this.s.selectPresent||this.s.lastSelect&&this.s.lastCascade)){a=this.s.colOpts;var b=this.s.dtPane.rows({selected:!0}).data().toArray(),c=
-this.s.rowData;this.s.dtPane.clear();if(this.colExists){0===c.arrayFilter.length?this._populatePane(!this.s.filteringActive):this.c.cascadePanes&&this.s.dt.rows().data().toArray().length===this.s.dt.rows({search:"applied"}).data().toArray().length?(c.arrayFilter=c.arrayOriginal,c.bins=c.binsOriginal):(this.c.viewTotal||this.c.cascadePanes)&&this._populatePane(!this.s.filteringActive);this.c.viewTotal?this._detailsPane():c.binsTotal=c.bins;this.c.viewTotal&&!this.c.cascadePanes&&(c.arrayFilter=c.arrayTotals);
-for(var e=function(k){if(k&&(void 0!==c.bins[k.filter]&&0!==c.bins[k.filter]&&d.c.cascadePanes||!d.c.cascadePanes||d.s.clearing)){var p=d.addRow(k.display,k.filter,d.c.viewTotal?void 0!==c.bins[k.filter]?c.bins[k.filter]:0:c.bins[k.filter],d.c.viewTotal?String(c.binsTotal[k.filter]):c.bins[k.filter],k.sort,k.type),m=b.findIndex(function(x){return x.filter===k.filter});-1!==m&&(p.select(),b.splice(m,1))}},d=this,f=0,g=c.arrayFilter;f<g.length;f++)e(g[f])}if(void 0!==a.searchPanes&&void 0!==a.searchPanes.options||
-void 0!==a.options||null!==this.customPaneSettings&&void 0!==this.customPaneSettings.options)for(e=function(k){var p=b.findIndex(function(m){if(m.display===k.data().display)return!0});-1!==p&&(k.select(),b.splice(p,1))},f=0,g=this._getComparisonRows();f<g.length;f++)a=g[f],e(a);for(e=0;e<b.length;e++)a=b[e],a=this.addRow(a.display,a.filter,0,this.c.viewTotal?a.total:0,a.display,a.display),this.s.updating=!0,a.select(),this.s.updating=!1;this.s.dtPane.draw();this.s.dtPane.table().node().parentNode.scrollTop=
-this.s.scrollTop}};h.version="1.3.0";h.classes={bordered:"dtsp-bordered",buttonGroup:"dtsp-buttonGroup",buttonSub:"dtsp-buttonSub",clear:"dtsp-clear",clearAll:"dtsp-clearAll",clearButton:"clearButton",collapseAll:"dtsp-collapseAll",collapseButton:"dtsp-collapseButton",container:"dtsp-searchPane",countButton:"dtsp-countButton",disabledButton:"dtsp-disabledButton",hidden:"dtsp-hidden",hide:"dtsp-hide",layout:"dtsp-",name:"dtsp-name",nameButton:"dtsp-nameButton",nameCont:"dtsp-nameCont",narrow:"dtsp-narrow",
-paneButton:"dtsp-paneButton",paneInputButton:"dtsp-paneInputButton",pill:"dtsp-pill",rotated:"dtsp-rotated",search:"dtsp-search",searchCont:"dtsp-searchCont",searchIcon:"dtsp-searchIcon",searchLabelCont:"dtsp-searchButtonCont",selected:"dtsp-selected",smallGap:"dtsp-smallGap",subRow1:"dtsp-subRow1",subRow2:"dtsp-subRow2",subRowsContainer:"dtsp-subRowsContainer",title:"dtsp-title",topRow:"dtsp-topRow"};h.defaults={cascadePanes:!1,clear:!0,collapse:!0,combiner:"or",container:function(a){return a.table().container()},
-controls:!0,dtOpts:{},emptyMessage:null,hideCount:!1,i18n:{clearPane:"&times;",count:"{total}",countFiltered:"{shown} ({total})",emptyMessage:"<em>No data</em>"},initCollapsed:!1,layout:"auto",name:void 0,orderable:!0,orthogonal:{display:"display",filter:"filter",hideCount:!1,search:"filter",show:void 0,sort:"sort",threshold:.6,type:"type",viewCount:!0},preSelect:[],threshold:.6,viewCount:!0,viewTotal:!1};return h}(),v,A,F=function(){function h(a,b,c){var e=this;void 0===c&&(c=!1);this.regenerating=
-!1;if(!A||!A.versionCheck||!A.versionCheck("1.10.0"))throw Error("SearchPane requires DataTables 1.10 or newer");if(!A.select)throw Error("SearchPane requires Select");var d=new A.Api(a);this.classes=v.extend(!0,{},h.classes);this.c=v.extend(!0,{},h.defaults,b);this.dom={clearAll:v('<button type="button">Clear All</button>').addClass(this.classes.clearAll),collapseAll:v('<button type="button">Collapse All</button>').addClass(this.classes.collapseAll),container:v("<div/>").addClass(this.classes.panes).text(d.i18n("searchPanes.loadMessage",
-this.c.i18n.loadMessage)),emptyMessage:v("<div/>").addClass(this.classes.emptyMessage),options:v("<div/>").addClass(this.classes.container),panes:v("<div/>").addClass(this.classes.container),showAll:v('<button type="button">Show All</button>').addClass(this.classes.showAll).addClass(this.classes.disabledButton).attr("disabled","true"),title:v("<div/>").addClass(this.classes.title),titleRow:v("<div/>").addClass(this.classes.titleRow),wrapper:v("<div/>")};this.s={colOpts:[],dt:d,filterCount:0,filterPane:-1,
-page:0,paging:!1,panes:[],selectionList:[],serverData:{},stateRead:!1,updating:!1};if(void 0===d.settings()[0]._searchPanes){this._getState();if(this.s.dt.page.info().serverSide)d.on("preXhr.dt",function(f,g,k){void 0===k.searchPanes&&(k.searchPanes={});void 0===k.searchPanes_null&&(k.searchPanes_null={});f=0;for(g=e.s.selectionList;f<g.length;f++){var p=g[f],m=e.s.dt.column(p.index).dataSrc();void 0===k.searchPanes[m]&&(k.searchPanes[m]={});void 0===k.searchPanes_null[m]&&(k.searchPanes_null[m]=
-{});for(var x=0;x<p.rows.length;x++)k.searchPanes[m][x]=p.rows[x].filter,null===k.searchPanes[m][x]&&(k.searchPanes_null[m][x]=!0)}});d.on("xhr",function(f,g,k,p){k&&k.searchPanes&&k.searchPanes.options&&(e.s.serverData=k,e.s.serverData.tableLength=k.recordsTotal,e._serverTotals())});d.settings()[0]._searchPanes=this;this.dom.clearAll.text(d.i18n("searchPanes.clearMessage",this.c.i18n.clearMessage));this.dom.collapseAll.text(d.i18n("searchPanes.collapseMessage",this.c.i18n.collapseMessage));this.dom.showAll.text(d.i18n("searchPanes.showMessage",
-this.c.i18n.showMessage));if(this.s.dt.settings()[0]._bInitComplete||c)this._paneDeclare(d,a,b);else d.one("preInit.dt",function(f){e._paneDeclare(d,a,b)});return this}}h.prototype.clearSelections=function(){this.dom.container.find("."+this.classes.search.replace(/\s+/g,".")).each(function(){v(this).val("");v(this).trigger("input")});var a=[];this.s.selectionList=[];for(var b=0,c=this.s.panes;b<c.length;b++){var e=c[b];void 0!==e.s.dtPane&&a.push(e.clearPane())}return a};h.prototype.getNode=function(){return this.dom.container};
-h.prototype.rebuild=function(a,b){void 0===a&&(a=!1);void 0===b&&(b=!1);this.dom.emptyMessage.remove();var c=[];!1===a&&this.dom.panes.empty();for(var e=0,d=this.s.panes;e<d.length;e++){var f=d[e];if(!1===a||f.s.index===a)f.clearData(),c.push(f.rebuildPane(void 0!==this.s.selectionList[this.s.selectionList.length-1]?f.s.index===this.s.selectionList[this.s.selectionList.length-1].index:!1,this.s.dt.page.info().serverSide?this.s.serverData:void 0,null,b)),this.dom.panes.append(f.dom.container)}this.c.cascadePanes||
-this.c.viewTotal?this.redrawPanes(!0):this._updateSelection();this._updateFilterCount();this._attachPaneContainer();this.s.dt.draw(!b);this.resizePanes();return 1===c.length?c[0]:c};h.prototype.redrawPanes=function(a){void 0===a&&(a=!1);var b=this.s.dt;if(!this.s.updating&&!this.s.dt.page.info().serverSide){for(var c=!0,e=this.s.filterPane,d=null,f=0,g=this.s.panes;f<g.length;f++){var k=g[f];void 0!==k.s.dtPane&&(d+=k.s.dtPane.rows({selected:!0}).data().toArray().length)}if(0===d&&b.rows({search:"applied"}).data().toArray().length===
-b.rows().data().toArray().length)c=!1;else if(this.c.viewTotal){b=0;for(f=this.s.panes;b<f.length;b++)if(k=f[b],void 0!==k.s.dtPane){g=k.s.dtPane.rows({selected:!0}).data().toArray().length;if(0===g)for(var p=0,m=this.s.selectionList;p<m.length;p++){var x=m[p];x.index===k.s.index&&0!==x.rows.length&&(g=x.rows.length)}0<g&&-1===e?e=k.s.index:0<g&&(e=null)}0===d&&(e=null)}f=void 0;b=[];if(this.regenerating)for(f=-1,1===b.length&&null!==d&&0!==d&&(f=b[0].index),a=0,b=this.s.panes;a<b.length;a++){if(k=
-b[a],void 0!==k.s.dtPane){g=!0;k.s.filteringActive=!0;if(-1!==e&&null!==e&&e===k.s.index||!1===c||k.s.index===f)g=!1,k.s.filteringActive=!1;k.updatePane(g?c:g)}}else{g=0;for(p=this.s.panes;g<p.length;g++)if(k=p[g],k.s.selectPresent){this.s.selectionList.push({index:k.s.index,protect:!1,rows:k.s.dtPane.rows({selected:!0}).data().toArray()});break}else k.s.deselect&&(f=k.s.index,m=k.s.dtPane.rows({selected:!0}).data().toArray(),0<m.length&&this.s.selectionList.push({index:k.s.index,protect:!0,rows:m}));
-if(0<this.s.selectionList.length)for(g=this.s.selectionList[this.s.selectionList.length-1].index,p=0,m=this.s.panes;p<m.length;p++)k=m[p],k.s.lastSelect=k.s.index===g;for(k=0;k<this.s.selectionList.length;k++)if(this.s.selectionList[k].index!==f||!0===this.s.selectionList[k].protect){g=!1;for(p=k+1;p<this.s.selectionList.length;p++)this.s.selectionList[p].index===this.s.selectionList[k].index&&(g=!0);g||(b.push(this.s.selectionList[k]),this.s.selectionList[k].protect=!1)}f=-1;1===b.length&&null!==
-d&&0!==d&&(f=b[0].index);p=0;for(m=this.s.panes;p<m.length;p++)if(k=m[p],void 0!==k.s.dtPane){g=!0;k.s.filteringActive=!0;if(-1!==e&&null!==e&&e===k.s.index||!1===c||k.s.index===f)g=!1,k.s.filteringActive=!1;k.updatePane(g?c:!1)}if(0<b.length&&(b.length<this.s.selectionList.length||a))for(this._cascadeRegen(b,d),g=b[b.length-1].index,e=0,a=this.s.panes;e<a.length;e++)k=a[e],k.s.lastSelect=k.s.index===g;else if(0<b.length)for(k=0,a=this.s.panes;k<a.length;k++)if(b=a[k],void 0!==b.s.dtPane){g=!0;b.s.filteringActive=
-!0;if(-1!==e&&null!==e&&e===b.s.index||!1===c||b.s.index===f)g=!1,b.s.filteringActive=!1;b.updatePane(g?c:g)}}this._updateFilterCount();c&&0!==d||(this.s.selectionList=[])}};h.prototype.resizePanes=function(){if("auto"===this.c.layout){var a=v(this.s.dt.searchPanes.container()).width(),b=Math.floor(a/260);a=1;for(var c=0,e=[],d=0,f=this.s.panes;d<f.length;d++){var g=f[d];g.s.displayed&&e.push(g.s.index)}g=e.length;if(b===g)a=b;else for(;1<b;b--)if(d=g%b,0===d){a=b;c=0;break}else d>c&&(a=b,c=d);e=
-0!==c?e.slice(e.length-c,e.length):[];b=0;for(d=this.s.panes;b<d.length;b++)g=d[b],g.s.displayed&&(f="columns-"+(e.includes(g.s.index)?c:a),g.resize(f))}else for(a=0,c=this.s.panes;a<c.length;a++)g=c[a],g.adjustTopRow();return this};h.prototype._attach=function(){var a=this;this.dom.container.removeClass(this.classes.hide);this.dom.titleRow.removeClass(this.classes.hide);this.dom.titleRow.remove();this.dom.title.appendTo(this.dom.titleRow);this.c.clear&&(this.dom.clearAll.appendTo(this.dom.titleRow),
-this.dom.clearAll.on("click.dtsps",function(){a.clearSelections()}));this.c.collapse&&this._setCollapseListener();this.dom.titleRow.appendTo(this.dom.container);for(var b=0,c=this.s.panes;b<c.length;b++)c[b].dom.container.appendTo(this.dom.panes);this.dom.panes.appendTo(this.dom.container);0===v("div."+this.classes.container).length&&this.dom.container.prependTo(this.s.dt);return this.dom.container};h.prototype._attachExtras=function(){this.dom.container.removeClass(this.classes.hide);this.dom.titleRow.removeClass(this.classes.hide);
-this.dom.titleRow.remove();this.dom.title.appendTo(this.dom.titleRow);this.c.clear&&this.dom.clearAll.appendTo(this.dom.titleRow);this.c.collapse&&(this.dom.showAll.appendTo(this.dom.titleRow),this.dom.collapseAll.appendTo(this.dom.titleRow));this.dom.titleRow.appendTo(this.dom.container);return this.dom.container};h.prototype._attachMessage=function(){try{var a=this.s.dt.i18n("searchPanes.emptyPanes",this.c.i18n.emptyPanes)}catch(b){a=null}if(null===a)this.dom.container.addClass(this.classes.hide),
-this.dom.titleRow.removeClass(this.classes.hide);else return this.dom.container.removeClass(this.classes.hide),this.dom.titleRow.addClass(this.classes.hide),this.dom.emptyMessage.text(a),this.dom.emptyMessage.appendTo(this.dom.container),this.dom.container};h.prototype._attachPaneContainer=function(){for(var a=0,b=this.s.panes;a<b.length;a++)if(!0===b[a].s.displayed)return this._attach();return this._attachMessage()};h.prototype._cascadeRegen=function(a,b){this.regenerating=!0;var c=-1;1===a.length&&
-null!==b&&0!==b&&(c=a[0].index);for(var e=0,d=this.s.panes;e<d.length;e++)b=d[e],b.setCascadeRegen(!0),b.setClear(!0),(void 0!==b.s.dtPane&&b.s.index===c||void 0!==b.s.dtPane)&&b.clearPane(),b.setClear(!1);this.s.dt.draw();c=this.s.dt.rows({search:"applied"}).data().toArray().length;e=this.s.dt.rows().data().toArray().length;if(e!==c){d=0;for(var f=this.s.panes;d<f.length;d++)b=f[d],b.s.forceViewTotal=!0}d=0;for(f=this.s.panes;d<f.length;d++)b=f[d],b.updatePane(!0);this._makeCascadeSelections(a);
-this.s.selectionList=a;a=0;for(d=this.s.panes;a<d.length;a++)b=d[a],b.setCascadeRegen(!1);this.regenerating=!1;if(e!==c)for(a=0,c=this.s.panes;a<c.length;a++)b=c[a],b.s.forceViewTotal=!1};h.prototype._checkMessage=function(){for(var a=0,b=this.s.panes;a<b.length;a++)if(!0===b[a].s.displayed){this.dom.emptyMessage.remove();this.dom.titleRow.removeClass(this.classes.hide);return}return this._attachMessage()};h.prototype._checkCollapse=function(){for(var a=!0,b=!0,c=0,e=this.s.panes;c<e.length;c++){var d=
-e[c];d.s.displayed&&(d.dom.collapseButton.hasClass(d.classes.rotated)?(this.dom.showAll.removeClass(this.classes.disabledButton).removeAttr("disabled"),b=!1):(this.dom.collapseAll.removeClass(this.classes.disabledButton).removeAttr("disabled"),a=!1))}a&&this.dom.collapseAll.addClass(this.classes.disabledButton).attr("disabled","true");b&&this.dom.showAll.addClass(this.classes.disabledButton).attr("disabled","true")};h.prototype._collapseAll=function(){for(var a=0,b=this.s.panes;a<b.length;a++)b[a].collapse()};
-h.prototype._getState=function(){var a=this.s.dt.state.loaded();a&&a.searchPanes&&void 0!==a.searchPanes.selectionList&&(this.s.selectionList=a.searchPanes.selectionList)};h.prototype._makeCascadeSelections=function(a){for(var b=0;b<a.length;b++)for(var c=function(f){if(f.s.index===a[b].index&&void 0!==f.s.dtPane){b===a.length-1&&(f.s.lastCascade=!0);0<f.s.dtPane.rows({selected:!0}).data().toArray().length&&void 0!==f.s.dtPane&&(f.setClear(!0),f.clearPane(),f.setClear(!1));for(var g=function(m){var x=
-!1;f.s.dtPane.rows().every(function(z){void 0!==f.s.dtPane.row(z).data()&&void 0!==m&&f.s.dtPane.row(z).data().filter===m.filter&&(x=!0,f.s.dtPane.row(z).select())});x||f.addRow(m.display,m.filter,0,m.total,m.sort,m.type,m.className).select()},k=0,p=a[b].rows;k<p.length;k++)g(p[k]);f.s.scrollTop=v(f.s.dtPane.table().node()).parent()[0].scrollTop;f.s.dtPane.draw();f.s.dtPane.table().node().parentNode.scrollTop=f.s.scrollTop;f.s.lastCascade=!1}},e=0,d=this.s.panes;e<d.length;e++)c(d[e])};h.prototype._paneDeclare=
-function(a,b,c){var e=this;a.columns(0<this.c.columns.length?this.c.columns:void 0).eq(0).each(function(k){e.s.panes.push(new t(b,c,k,e.c.layout,e.dom.panes))});for(var d=a.columns().eq(0).toArray().length,f=this.c.panes.length,g=0;g<f;g++)this.s.panes.push(new t(b,c,d+g,this.c.layout,this.dom.panes,this.c.panes[g]));if(0<this.c.order.length)for(d=this.c.order.map(function(k,p,m){return e._findPane(k)}),this.dom.panes.empty(),this.s.panes=d,d=0,f=this.s.panes;d<f.length;d++)this.dom.panes.append(f[d].dom.container);
-this.s.dt.settings()[0]._bInitComplete?this._startup(a):this.s.dt.settings()[0].aoInitComplete.push({fn:function(){e._startup(a)}})};h.prototype._findPane=function(a){for(var b=0,c=this.s.panes;b<c.length;b++){var e=c[b];if(a===e.s.name)return e}};h.prototype._serverTotals=function(){for(var a=!1,b=!1,c=0,e=this.s.panes;c<e.length;c++){var d=e[c];if(d.s.selectPresent){this.s.selectionList.push({index:d.s.index,protect:!1,rows:d.s.dtPane.rows({selected:!0}).data().toArray()});d.s.selectPresent=!1;
-a=!0;break}else d.s.deselect&&(b=d.s.dtPane.rows({selected:!0}).data().toArray(),0<b.length&&this.s.selectionList.push({index:d.s.index,protect:!0,rows:b}),b=a=!0)}if(a){c=[];for(e=0;e<this.s.selectionList.length;e++){d=!1;for(a=e+1;a<this.s.selectionList.length;a++)this.s.selectionList[a].index===this.s.selectionList[e].index&&(d=!0);if(!d){a=!1;for(var f=0,g=this.s.panes;f<g.length;f++)d=g[f],d.s.index===this.s.selectionList[e].index&&0<d.s.dtPane.rows({selected:!0}).data().toArray().length&&(a=
-!0);a&&c.push(this.s.selectionList[e])}}this.s.selectionList=c}else this.s.selectionList=[];c=-1;if(b&&1===this.s.selectionList.length)for(b=0,e=this.s.panes;b<e.length;b++)d=e[b],d.s.lastSelect=!1,d.s.deselect=!1,void 0!==d.s.dtPane&&0<d.s.dtPane.rows({selected:!0}).data().toArray().length&&(c=d.s.index);else if(0<this.s.selectionList.length)for(b=this.s.selectionList[this.s.selectionList.length-1].index,e=0,a=this.s.panes;e<a.length;e++)d=a[e],d.s.lastSelect=d.s.index===b,d.s.deselect=!1;else if(0===
-this.s.selectionList.length)for(b=0,e=this.s.panes;b<e.length;b++)d=e[b],d.s.lastSelect=!1,d.s.deselect=!1;this.dom.panes.empty();b=0;for(e=this.s.panes;b<e.length;b++)d=e[b],d.s.lastSelect?d._setListeners():d.rebuildPane(void 0,this.s.dt.page.info().serverSide?this.s.serverData:void 0,d.s.index===c?!0:null,!0),this.dom.panes.append(d.dom.container),void 0!==d.s.dtPane&&(v(d.s.dtPane.table().node()).parent()[0].scrollTop=d.s.scrollTop,v.fn.dataTable.select.init(d.s.dtPane));this._updateSelection()};
-h.prototype._setCollapseListener=function(){var a=this;this.dom.collapseAll.on("click.dtsps",function(){a._collapseAll();a.dom.collapseAll.addClass(a.classes.disabledButton).attr("disabled","true");a.dom.showAll.removeClass(a.classes.disabledButton).removeAttr("disabled");a.s.dt.state.save()});this.dom.showAll.on("click.dtsps",function(){a._showAll();a.dom.showAll.addClass(a.classes.disabledButton).attr("disabled","true");a.dom.collapseAll.removeClass(a.classes.disabledButton).removeAttr("disabled");
-a.s.dt.state.save()});for(var b=0,c=this.s.panes;b<c.length;b++)c[b].dom.collapseButton.on("click",function(){return a._checkCollapse()});this._checkCollapse()};h.prototype._showAll=function(){for(var a=0,b=this.s.panes;a<b.length;a++)b[a].show()};h.prototype._startup=function(a){var b=this;this.dom.container.text("");this._attachExtras();this.dom.container.append(this.dom.panes);this.dom.panes.empty();var c=this.s.dt.state.loaded();if(this.c.viewTotal&&!this.c.cascadePanes&&null!==c&&void 0!==c&&
-void 0!==c.searchPanes&&void 0!==c.searchPanes.panes){for(var e=!1,d=0,f=c.searchPanes.panes;d<f.length;d++){var g=f[d];if(0<g.selected.length){e=!0;break}}if(e)for(e=0,d=this.s.panes;e<d.length;e++)g=d[e],g.s.showFiltered=!0}e=0;for(d=this.s.panes;e<d.length;e++)g=d[e],g.rebuildPane(void 0,0<Object.keys(this.s.serverData).length?this.s.serverData:void 0),this.dom.panes.append(g.dom.container);"auto"===this.c.layout&&this.resizePanes();this.s.stateRead||null===c||void 0===c||(this.s.dt.page(c.start/
-this.s.dt.page.len()),this.s.dt.draw("page"));this.s.stateRead=!0;if(this.c.viewTotal&&!this.c.cascadePanes)for(c=0,e=this.s.panes;c<e.length;c++)g=e[c],g.updatePane();this._checkMessage();a.on("preDraw.dtsps",function(){b.s.updating||b.s.paging||(!b.c.cascadePanes&&!b.c.viewTotal||b.s.dt.page.info().serverSide?(b._updateFilterCount(),b._updateSelection()):b.redrawPanes(b.c.viewTotal),b.s.filterPane=-1);b.s.paging=!1});v(window).on("resize.dtsp",A.util.throttle(function(){b.resizePanes()}));this.s.dt.on("stateSaveParams.dtsp",
-function(k,p,m){void 0===m.searchPanes&&(m.searchPanes={});m.searchPanes.selectionList=b.s.selectionList});a.off("page");a.on("page",function(){b.s.paging=!0;b.s.page=b.s.dt.page()});if(this.s.dt.page.info().serverSide)a.off("preXhr.dt"),a.on("preXhr.dt",function(k,p,m){void 0===m.searchPanes&&(m.searchPanes={});void 0===m.searchPanes_null&&(m.searchPanes_null={});p=k=0;for(var x=b.s.panes;p<x.length;p++){var z=x[p],y=b.s.dt.column(z.s.index).dataSrc();void 0===m.searchPanes[y]&&(m.searchPanes[y]=
-{});void 0===m.searchPanes_null[y]&&(m.searchPanes_null[y]={});if(void 0!==z.s.dtPane){z=z.s.dtPane.rows({selected:!0}).data().toArray();for(var w=0;w<z.length;w++)m.searchPanes[y][w]=z[w].filter,null===m.searchPanes[y][w]&&(m.searchPanes_null[y][w]=!0),k++}}b.c.viewTotal&&b._prepViewTotal(k);0<k&&(k!==b.s.filterCount?(m.start=0,b.s.page=0):m.start=b.s.page*b.s.dt.page.len(),b.s.dt.page(b.s.page),b.s.filterCount=k)});else a.on("preXhr.dt",function(k,p,m){k=0;for(p=b.s.panes;k<p.length;k++)p[k].clearData()});
-this.s.dt.on("xhr",function(k,p,m,x){if(p.nTable===b.s.dt.table().node()){var z=!1;if(!b.s.dt.page.info().serverSide)b.s.dt.one("preDraw",function(){if(!z){var y=b.s.dt.page();z=!0;b.s.updating=!0;b.dom.panes.empty();for(var w=0,u=b.s.panes;w<u.length;w++){var B=u[w];B.clearData();B.rebuildPane(void 0!==b.s.selectionList[b.s.selectionList.length-1]?B.s.index===b.s.selectionList[b.s.selectionList.length-1].index:!1,void 0,void 0,!0);b.dom.panes.append(B.dom.container)}b.s.dt.page.info().serverSide||
-b.s.dt.draw();b.s.updating=!1;b.c.cascadePanes||b.c.viewTotal?b.redrawPanes(b.c.cascadePanes):b._updateSelection();b._checkMessage();b.s.dt.one("draw",function(){b.s.updating=!0;b.s.dt.page(y).draw(!1);b.s.updating=!1})}})}});c=0;for(e=this.s.panes;c<e.length;c++)if(g=e[c],void 0!==g&&void 0!==g.s.dtPane&&(void 0!==g.s.colOpts.preSelect&&0<g.s.colOpts.preSelect.length||null!==g.customPaneSettings&&void 0!==g.customPaneSettings.preSelect&&0<g.customPaneSettings.preSelect.length)){d=g.s.dtPane.rows().data().toArray().length;
-for(f=0;f<d;f++)(g.s.colOpts.preSelect.includes(g.s.dtPane.cell(f,0).data())||null!==g.customPaneSettings&&void 0!==g.customPaneSettings.preSelect&&g.customPaneSettings.preSelect.includes(g.s.dtPane.cell(f,0).data()))&&g.s.dtPane.row(f).select();g.updateTable()}if(void 0!==this.s.selectionList&&0<this.s.selectionList.length)for(c=this.s.selectionList[this.s.selectionList.length-1].index,e=0,d=this.s.panes;e<d.length;e++)g=d[e],g.s.lastSelect=g.s.index===c;0<this.s.selectionList.length&&this.c.cascadePanes&&
-this._cascadeRegen(this.s.selectionList,this.s.selectionList.length);this._updateFilterCount();a.on("destroy.dtsps",function(){for(var k=0,p=b.s.panes;k<p.length;k++)p[k].destroy();a.off(".dtsps");b.dom.collapseAll.off(".dtsps");b.dom.showAll.off(".dtsps");b.dom.clearAll.off(".dtsps");b.dom.container.remove();b.clearSelections()});this.c.collapse&&this._setCollapseListener();if(this.c.clear)this.dom.clearAll.on("click.dtsps",function(){b.clearSelections()});a.settings()[0]._searchPanes=this;this.s.dt.state.save()};
-h.prototype._prepViewTotal=function(a){for(var b=this.s.filterPane,c=!1,e=0,d=this.s.panes;e<d.length;e++){var f=d[e];if(void 0!==f.s.dtPane){var g=f.s.dtPane.rows({selected:!0}).data().toArray().length;0<g&&-1===b?(b=f.s.index,c=!0):0<g&&(b=null)}}null!==a&&0!==a&&(b=null);a=0;for(e=this.s.panes;a<e.length;a++)if(f=e[a],void 0!==f.s.dtPane&&(f.s.filteringActive=!0,-1!==b&&null!==b&&b===f.s.index||!1===c))f.s.filteringActive=!1};h.prototype._updateFilterCount=function(){for(var a=0,b=0,c=this.s.panes;b<
-c.length;b++){var e=c[b];void 0!==e.s.dtPane&&(a+=e.getPaneCount())}b=this.s.dt.i18n("searchPanes.title",this.c.i18n.title,a);this.dom.title.text(b);void 0!==this.c.filterChanged&&"function"===typeof this.c.filterChanged&&this.c.filterChanged.call(this.s.dt,a);0===a?this.dom.clearAll.addClass(this.classes.disabledButton).attr("disabled","true"):this.dom.clearAll.removeClass(this.classes.disabledButton).removeAttr("disabled")};h.prototype._updateSelection=function(){this.s.selectionList=[];for(var a=
-0,b=this.s.panes;a<b.length;a++){var c=b[a];void 0!==c.s.dtPane&&this.s.selectionList.push({index:c.s.index,protect:!1,rows:c.s.dtPane.rows({selected:!0}).data().toArray()})}};h.version="1.4.0";h.classes={clear:"dtsp-clear",clearAll:"dtsp-clearAll",collapseAll:"dtsp-collapseAll",container:"dtsp-searchPanes",disabledButton:"dtsp-disabledButton",emptyMessage:"dtsp-emptyMessage",hide:"dtsp-hidden",panes:"dtsp-panesContainer",search:"dtsp-search",showAll:"dtsp-showAll",title:"dtsp-title",titleRow:"dtsp-titleRow"};
-h.defaults={cascadePanes:!1,clear:!0,collapse:!0,columns:[],container:function(a){return a.table().container()},filterChanged:void 0,i18n:{clearMessage:"Clear All",clearPane:"&times;",collapse:{0:"SearchPanes",_:"SearchPanes (%d)"},collapseMessage:"Collapse All",count:"{total}",countFiltered:"{shown} ({total})",emptyMessage:"<em>No data</em>",emptyPanes:"No SearchPanes",loadMessage:"Loading Search Panes...",showMessage:"Show All",title:"Filters Active - %d"},layout:"auto",order:[],panes:[],viewTotal:!1};
-return h}();(function(h){"function"===typeof define&&define.amd?define(["jquery","datatables.net"],function(a){return h(a,window,document)}):"object"===typeof exports?module.exports=function(a,b){a||(a=window);b&&b.fn.dataTable||(b=require("datatables.net")(a,b).$);return h(b,a,a.document)}:h(window.jQuery,window,document)})(function(h,a,b){function c(d,f,g){void 0===f&&(f=null);void 0===g&&(g=!1);d=new e.Api(d);f=f?f:d.init().searchPanes||e.defaults.searchPanes;return(new F(d,f,g)).getNode()}n(h);
-q(h);var e=h.fn.dataTable;h.fn.dataTable.SearchPanes=F;h.fn.DataTable.SearchPanes=F;h.fn.dataTable.SearchPane=t;h.fn.DataTable.SearchPane=t;a=h.fn.dataTable.Api.register;a("searchPanes()",function(){return this});a("searchPanes.clearSelections()",function(){return this.iterator("table",function(d){d._searchPanes&&d._searchPanes.clearSelections()})});a("searchPanes.rebuildPane()",function(d,f){return this.iterator("table",function(g){g._searchPanes&&g._searchPanes.rebuild(d,f)})});a("searchPanes.resizePanes()",
-function(){var d=this.context[0];return d._searchPanes?d._searchPanes.resizePanes():null});a("searchPanes.container()",function(){var d=this.context[0];return d._searchPanes?d._searchPanes.getNode():null});h.fn.dataTable.ext.buttons.searchPanesClear={action:function(d,f,g,k){f.searchPanes.clearSelections()},text:"Clear Panes"};h.fn.dataTable.ext.buttons.searchPanes={action:function(d,f,g,k){d.stopPropagation();this.popover(k._panes.getNode(),{align:"dt-container"});k._panes.rebuild(void 0,!0)},config:{},
-init:function(d,f,g){var k=new h.fn.dataTable.SearchPanes(d,h.extend({filterChanged:function(m){d.button(f).text(d.i18n("searchPanes.collapse",void 0!==d.context[0].oLanguage.searchPanes?d.context[0].oLanguage.searchPanes.collapse:d.context[0]._searchPanes.c.i18n.collapse,m))}},g.config)),p=d.i18n("searchPanes.collapse",k.c.i18n.collapse,0);d.button(f).text(p);g._panes=k},text:"Search Panes"};h(b).on("preInit.dt.dtsp",function(d,f,g){"dt"===d.namespace&&(f.oInit.searchPanes||e.defaults.searchPanes)&&
-(f._searchPanes||c(f,null,!0))});e.ext.feature.push({cFeature:"P",fnInit:c});e.ext.features&&e.ext.features.register("searchPanes",c)})})();
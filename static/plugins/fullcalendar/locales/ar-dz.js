@@ -1,28 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var arDz = {
-    code: 'ar-dz',
-    week: {
-      dow: 0, // Sunday is the first day of the week.
-      doy: 4, // The week that contains Jan 1st is the first week of the year.
-    },
-    direction: 'rtl',
-    buttonText: {
-      prev: 'السابق',
-      next: 'التالي',
-      today: 'اليوم',
-      month: 'شهر',
-      week: 'أسبوع',
-      day: 'يوم',
-      list: 'أجندة',
-    },
-    weekText: 'أسبوع',
-    allDayText: 'اليوم كله',
-    moreLinkText: 'أخرى',
-    noEventsText: 'أي أحداث لعرض',
-  };
-
-  return arDz;
-
-}());
@@ -1,27 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var esUs = {
-    code: 'es',
-    week: {
-      dow: 0, // Sunday is the first day of the week.
-      doy: 6, // The week that contains Jan 1st is the first week of the year.
-    },
-    buttonText: {
-      prev: 'Ant',
-      next: 'Sig',
-      today: 'Hoy',
-      month: 'Mes',
-      week: 'Semana',
-      day: 'Día',
-      list: 'Agenda',
-    },
-    weekText: 'Sm',
-    allDayText: 'Todo el día',
-    moreLinkText: 'más',
-    noEventsText: 'No hay eventos para mostrar',
-  };
-
-  return esUs;
-
-}());
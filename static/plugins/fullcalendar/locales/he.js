@@ -1,24 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var he = {
-    code: 'he',
-    direction: 'rtl',
-    buttonText: {
-      prev: 'הקודם',
-      next: 'הבא',
-      today: 'היום',
-      month: 'חודש',
-      week: 'שבוע',
-      day: 'יום',
-      list: 'סדר יום',
-    },
-    allDayText: 'כל היום',
-    moreLinkText: 'אחר',
-    noEventsText: 'אין אירועים להצגה',
-    weekText: 'שבוע',
-  };
-
-  return he;
-
-}());
@@ -1,29 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var hyAm = {
-    code: 'hy-am',
-    week: {
-      dow: 1, // Monday is the first day of the week.
-      doy: 4, // The week that contains Jan 4th is the first week of the year.
-    },
-    buttonText: {
-      prev: 'Նախորդ',
-      next: 'Հաջորդ',
-      today: 'Այսօր',
-      month: 'Ամիս',
-      week: 'Շաբաթ',
-      day: 'Օր',
-      list: 'Օրվա ցուցակ',
-    },
-    weekText: 'Շաբ',
-    allDayText: 'Ամբողջ օր',
-    moreLinkText: function(n) {
-      return '+ ևս ' + n
-    },
-    noEventsText: 'Բացակայում է իրադարձությունը ցուցադրելու',
-  };
-
-  return hyAm;
-
-}());
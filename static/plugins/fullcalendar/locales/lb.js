@@ -1,27 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var lb = {
-    code: 'lb',
-    week: {
-      dow: 1, // Monday is the first day of the week.
-      doy: 4, // The week that contains Jan 4th is the first week of the year.
-    },
-    buttonText: {
-      prev: 'Zréck',
-      next: 'Weider',
-      today: 'Haut',
-      month: 'Mount',
-      week: 'Woch',
-      day: 'Dag',
-      list: 'Terminiwwersiicht',
-    },
-    weekText: 'W',
-    allDayText: 'Ganzen Dag',
-    moreLinkText: 'méi',
-    noEventsText: 'Nee Evenementer ze affichéieren',
-  };
-
-  return lb;
-
-}());
@@ -1,27 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var pl = {
-    code: 'pl',
-    week: {
-      dow: 1, // Monday is the first day of the week.
-      doy: 4, // The week that contains Jan 4th is the first week of the year.
-    },
-    buttonText: {
-      prev: 'Poprzedni',
-      next: 'Następny',
-      today: 'Dziś',
-      month: 'Miesiąc',
-      week: 'Tydzień',
-      day: 'Dzień',
-      list: 'Plan dnia',
-    },
-    weekText: 'Tydz',
-    allDayText: 'Cały dzień',
-    moreLinkText: 'więcej',
-    noEventsText: 'Brak wydarzeń do wyświetlenia',
-  };
-
-  return pl;
-
-}());
@@ -1,17 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var ug = {
-    code: 'ug',
-    buttonText: {
-      month: 'ئاي',
-      week: 'ھەپتە',
-      day: 'كۈن',
-      list: 'كۈنتەرتىپ',
-    },
-    allDayText: 'پۈتۈن كۈن',
-  };
-
-  return ug;
-
-}());
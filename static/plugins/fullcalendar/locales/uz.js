@@ -1,21 +0,0 @@
-FullCalendar.globalLocales.push(function () {
-  'use strict';
-
-  var uz = {
-    code: 'uz',
-    buttonText: {
-      month: 'Oy',
-      week: 'Xafta',
-      day: 'Kun',
-      list: 'Kun tartibi',
-    },
-    allDayText: "Kun bo'yi",
-    moreLinkText: function(n) {
-      return '+ yana ' + n
-    },
-    noEventsText: "Ko'rsatish uchun voqealar yo'q",
-  };
-
-  return uz;
-
-}());
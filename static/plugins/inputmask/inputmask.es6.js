@@ -1,5 +0,0 @@
-import "./inputmask.js";
-
-const inputmask = window.Inputmask;
-window.Inputmask = undefined;
-export default inputmask;
\ No newline at end of file
@@ -1,2985 +0,0 @@
-/*!
- * dist/jquery.inputmask
- * https://github.com/RobinHerbots/Inputmask
- * Copyright (c) 2010 - 2021 Robin Herbots
- * Licensed under the MIT license
- * Version: 5.0.7
- */
-!function(e, t) {
-    if ("object" == typeof exports && "object" == typeof module) module.exports = t(require("jquery")); else if ("function" == typeof define && define.amd) define([ "jquery" ], t); else {
-        var i = "object" == typeof exports ? t(require("jquery")) : t(e.jQuery);
-        for (var a in i) ("object" == typeof exports ? exports : e)[a] = i[a];
-    }
-}(self, (function(e) {
-    return function() {
-        "use strict";
-        var t = {
-            3046: function(e, t, i) {
-                var a;
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = void 0, i(3851), i(219), i(207), i(5296);
-                var n = ((a = i(2394)) && a.__esModule ? a : {
-                    default: a
-                }).default;
-                t.default = n;
-            },
-            8741: function(e, t) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = void 0;
-                var i = !("undefined" == typeof window || !window.document || !window.document.createElement);
-                t.default = i;
-            },
-            3976: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = void 0;
-                var a, n = (a = i(5581)) && a.__esModule ? a : {
-                    default: a
-                };
-                var r = {
-                    _maxTestPos: 500,
-                    placeholder: "_",
-                    optionalmarker: [ "[", "]" ],
-                    quantifiermarker: [ "{", "}" ],
-                    groupmarker: [ "(", ")" ],
-                    alternatormarker: "|",
-                    escapeChar: "\\",
-                    mask: null,
-                    regex: null,
-                    oncomplete: function() {},
-                    onincomplete: function() {},
-                    oncleared: function() {},
-                    repeat: 0,
-                    greedy: !1,
-                    autoUnmask: !1,
-                    removeMaskOnSubmit: !1,
-                    clearMaskOnLostFocus: !0,
-                    insertMode: !0,
-                    insertModeVisual: !0,
-                    clearIncomplete: !1,
-                    alias: null,
-                    onKeyDown: function() {},
-                    onBeforeMask: null,
-                    onBeforePaste: function(e, t) {
-                        return "function" == typeof t.onBeforeMask ? t.onBeforeMask.call(this, e, t) : e;
-                    },
-                    onBeforeWrite: null,
-                    onUnMask: null,
-                    showMaskOnFocus: !0,
-                    showMaskOnHover: !0,
-                    onKeyValidation: function() {},
-                    skipOptionalPartCharacter: " ",
-                    numericInput: !1,
-                    rightAlign: !1,
-                    undoOnEscape: !0,
-                    radixPoint: "",
-                    _radixDance: !1,
-                    groupSeparator: "",
-                    keepStatic: null,
-                    positionCaretOnTab: !0,
-                    tabThrough: !1,
-                    supportsInputType: [ "text", "tel", "url", "password", "search" ],
-                    ignorables: [ n.default.BACKSPACE, n.default.TAB, n.default["PAUSE/BREAK"], n.default.ESCAPE, n.default.PAGE_UP, n.default.PAGE_DOWN, n.default.END, n.default.HOME, n.default.LEFT, n.default.UP, n.default.RIGHT, n.default.DOWN, n.default.INSERT, n.default.DELETE, 93, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 0, 229 ],
-                    isComplete: null,
-                    preValidation: null,
-                    postValidation: null,
-                    staticDefinitionSymbol: void 0,
-                    jitMasking: !1,
-                    nullable: !0,
-                    inputEventOnly: !1,
-                    noValuePatching: !1,
-                    positionCaretOnClick: "lvp",
-                    casing: null,
-                    inputmode: "text",
-                    importDataAttributes: !0,
-                    shiftPositions: !0,
-                    usePrototypeDefinitions: !0,
-                    validationEventTimeOut: 3e3,
-                    substitutes: {}
-                };
-                t.default = r;
-            },
-            7392: function(e, t) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = void 0;
-                t.default = {
-                    9: {
-                        validator: "[0-9\uff10-\uff19]",
-                        definitionSymbol: "*"
-                    },
-                    a: {
-                        validator: "[A-Za-z\u0410-\u044f\u0401\u0451\xc0-\xff\xb5]",
-                        definitionSymbol: "*"
-                    },
-                    "*": {
-                        validator: "[0-9\uff10-\uff19A-Za-z\u0410-\u044f\u0401\u0451\xc0-\xff\xb5]"
-                    }
-                };
-            },
-            3287: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = void 0;
-                var a, n = (a = i(2047)) && a.__esModule ? a : {
-                    default: a
-                };
-                if (void 0 === n.default) throw "jQuery not loaded!";
-                var r = n.default;
-                t.default = r;
-            },
-            9845: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.ua = t.mobile = t.iphone = t.iemobile = t.ie = void 0;
-                var a, n = (a = i(9380)) && a.__esModule ? a : {
-                    default: a
-                };
-                var r = n.default.navigator && n.default.navigator.userAgent || "", o = r.indexOf("MSIE ") > 0 || r.indexOf("Trident/") > 0, s = "ontouchstart" in n.default, l = /iemobile/i.test(r), u = /iphone/i.test(r) && !l;
-                t.iphone = u, t.iemobile = l, t.mobile = s, t.ie = o, t.ua = r;
-            },
-            7184: function(e, t) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = function(e) {
-                    return e.replace(i, "\\$1");
-                };
-                var i = new RegExp("(\\" + [ "/", ".", "*", "+", "?", "|", "(", ")", "[", "]", "{", "}", "\\", "$", "^" ].join("|\\") + ")", "gim");
-            },
-            6030: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.EventHandlers = void 0;
-                var a, n = i(8711), r = (a = i(5581)) && a.__esModule ? a : {
-                    default: a
-                }, o = i(9845), s = i(7215), l = i(7760), u = i(4713);
-                function c(e, t) {
-                    var i = "undefined" != typeof Symbol && e[Symbol.iterator] || e["@@iterator"];
-                    if (!i) {
-                        if (Array.isArray(e) || (i = function(e, t) {
-                            if (!e) return;
-                            if ("string" == typeof e) return f(e, t);
-                            var i = Object.prototype.toString.call(e).slice(8, -1);
-                            "Object" === i && e.constructor && (i = e.constructor.name);
-                            if ("Map" === i || "Set" === i) return Array.from(e);
-                            if ("Arguments" === i || /^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)) return f(e, t);
-                        }(e)) || t && e && "number" == typeof e.length) {
-                            i && (e = i);
-                            var a = 0, n = function() {};
-                            return {
-                                s: n,
-                                n: function() {
-                                    return a >= e.length ? {
-                                        done: !0
-                                    } : {
-                                        done: !1,
-                                        value: e[a++]
-                                    };
-                                },
-                                e: function(e) {
-                                    throw e;
-                                },
-                                f: n
-                            };
-                        }
-                        throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.");
-                    }
-                    var r, o = !0, s = !1;
-                    return {
-                        s: function() {
-                            i = i.call(e);
-                        },
-                        n: function() {
-                            var e = i.next();
-                            return o = e.done, e;
-                        },
-                        e: function(e) {
-                            s = !0, r = e;
-                        },
-                        f: function() {
-                            try {
-                                o || null == i.return || i.return();
-                            } finally {
-                                if (s) throw r;
-                            }
-                        }
-                    };
-                }
-                function f(e, t) {
-                    (null == t || t > e.length) && (t = e.length);
-                    for (var i = 0, a = new Array(t); i < t; i++) a[i] = e[i];
-                    return a;
-                }
-                var d = {
-                    keydownEvent: function(e) {
-                        var t = this.inputmask, i = t.opts, a = t.dependencyLib, c = t.maskset, f = this, d = a(f), p = e.keyCode, h = n.caret.call(t, f), m = i.onKeyDown.call(this, e, n.getBuffer.call(t), h, i);
-                        if (void 0 !== m) return m;
-                        if (p === r.default.BACKSPACE || p === r.default.DELETE || o.iphone && p === r.default.BACKSPACE_SAFARI || e.ctrlKey && p === r.default.X && !("oncut" in f)) e.preventDefault(), 
-                        s.handleRemove.call(t, f, p, h), (0, l.writeBuffer)(f, n.getBuffer.call(t, !0), c.p, e, f.inputmask._valueGet() !== n.getBuffer.call(t).join("")); else if (p === r.default.END || p === r.default.PAGE_DOWN) {
-                            e.preventDefault();
-                            var v = n.seekNext.call(t, n.getLastValidPosition.call(t));
-                            n.caret.call(t, f, e.shiftKey ? h.begin : v, v, !0);
-                        } else p === r.default.HOME && !e.shiftKey || p === r.default.PAGE_UP ? (e.preventDefault(), 
-                        n.caret.call(t, f, 0, e.shiftKey ? h.begin : 0, !0)) : i.undoOnEscape && p === r.default.ESCAPE && !0 !== e.altKey ? ((0, 
-                        l.checkVal)(f, !0, !1, t.undoValue.split("")), d.trigger("click")) : p !== r.default.INSERT || e.shiftKey || e.ctrlKey || void 0 !== t.userOptions.insertMode ? !0 === i.tabThrough && p === r.default.TAB ? !0 === e.shiftKey ? (h.end = n.seekPrevious.call(t, h.end, !0), 
-                        !0 === u.getTest.call(t, h.end - 1).match.static && h.end--, h.begin = n.seekPrevious.call(t, h.end, !0), 
-                        h.begin >= 0 && h.end > 0 && (e.preventDefault(), n.caret.call(t, f, h.begin, h.end))) : (h.begin = n.seekNext.call(t, h.begin, !0), 
-                        h.end = n.seekNext.call(t, h.begin, !0), h.end < c.maskLength && h.end--, h.begin <= c.maskLength && (e.preventDefault(), 
-                        n.caret.call(t, f, h.begin, h.end))) : e.shiftKey || i.insertModeVisual && !1 === i.insertMode && (p === r.default.RIGHT ? setTimeout((function() {
-                            var e = n.caret.call(t, f);
-                            n.caret.call(t, f, e.begin);
-                        }), 0) : p === r.default.LEFT && setTimeout((function() {
-                            var e = n.translatePosition.call(t, f.inputmask.caretPos.begin);
-                            n.translatePosition.call(t, f.inputmask.caretPos.end);
-                            t.isRTL ? n.caret.call(t, f, e + (e === c.maskLength ? 0 : 1)) : n.caret.call(t, f, e - (0 === e ? 0 : 1));
-                        }), 0)) : s.isSelection.call(t, h) ? i.insertMode = !i.insertMode : (i.insertMode = !i.insertMode, 
-                        n.caret.call(t, f, h.begin, h.begin));
-                        t.ignorable = i.ignorables.includes(p);
-                    },
-                    keypressEvent: function(e, t, i, a, o) {
-                        var u = this.inputmask || this, c = u.opts, f = u.dependencyLib, d = u.maskset, p = u.el, h = f(p), m = e.keyCode;
-                        if (!(!0 === t || e.ctrlKey && e.altKey) && (e.ctrlKey || e.metaKey || u.ignorable)) return m === r.default.ENTER && u.undoValue !== u._valueGet(!0) && (u.undoValue = u._valueGet(!0), 
-                        setTimeout((function() {
-                            h.trigger("change");
-                        }), 0)), u.skipInputEvent = !0, !0;
-                        if (m) {
-                            44 !== m && 46 !== m || 3 !== e.location || "" === c.radixPoint || (m = c.radixPoint.charCodeAt(0));
-                            var v, g = t ? {
-                                begin: o,
-                                end: o
-                            } : n.caret.call(u, p), k = String.fromCharCode(m);
-                            k = c.substitutes[k] || k, d.writeOutBuffer = !0;
-                            var y = s.isValid.call(u, g, k, a, void 0, void 0, void 0, t);
-                            if (!1 !== y && (n.resetMaskSet.call(u, !0), v = void 0 !== y.caret ? y.caret : n.seekNext.call(u, y.pos.begin ? y.pos.begin : y.pos), 
-                            d.p = v), v = c.numericInput && void 0 === y.caret ? n.seekPrevious.call(u, v) : v, 
-                            !1 !== i && (setTimeout((function() {
-                                c.onKeyValidation.call(p, m, y);
-                            }), 0), d.writeOutBuffer && !1 !== y)) {
-                                var b = n.getBuffer.call(u);
-                                (0, l.writeBuffer)(p, b, v, e, !0 !== t);
-                            }
-                            if (e.preventDefault(), t) return !1 !== y && (y.forwardPosition = v), y;
-                        }
-                    },
-                    keyupEvent: function(e) {
-                        var t = this.inputmask;
-                        !t.isComposing || e.keyCode !== r.default.KEY_229 && e.keyCode !== r.default.ENTER || t.$el.trigger("input");
-                    },
-                    pasteEvent: function(e) {
-                        var t, i = this.inputmask, a = i.opts, r = i._valueGet(!0), o = n.caret.call(i, this);
-                        i.isRTL && (t = o.end, o.end = n.translatePosition.call(i, o.begin), o.begin = n.translatePosition.call(i, t));
-                        var s = r.substr(0, o.begin), u = r.substr(o.end, r.length);
-                        if (s == (i.isRTL ? n.getBufferTemplate.call(i).slice().reverse() : n.getBufferTemplate.call(i)).slice(0, o.begin).join("") && (s = ""), 
-                        u == (i.isRTL ? n.getBufferTemplate.call(i).slice().reverse() : n.getBufferTemplate.call(i)).slice(o.end).join("") && (u = ""), 
-                        window.clipboardData && window.clipboardData.getData) r = s + window.clipboardData.getData("Text") + u; else {
-                            if (!e.clipboardData || !e.clipboardData.getData) return !0;
-                            r = s + e.clipboardData.getData("text/plain") + u;
-                        }
-                        var f = r;
-                        if (i.isRTL) {
-                            f = f.split("");
-                            var d, p = c(n.getBufferTemplate.call(i));
-                            try {
-                                for (p.s(); !(d = p.n()).done; ) {
-                                    var h = d.value;
-                                    f[0] === h && f.shift();
-                                }
-                            } catch (e) {
-                                p.e(e);
-                            } finally {
-                                p.f();
-                            }
-                            f = f.join("");
-                        }
-                        if ("function" == typeof a.onBeforePaste) {
-                            if (!1 === (f = a.onBeforePaste.call(i, f, a))) return !1;
-                            f || (f = r);
-                        }
-                        (0, l.checkVal)(this, !0, !1, f.toString().split(""), e), e.preventDefault();
-                    },
-                    inputFallBackEvent: function(e) {
-                        var t = this.inputmask, i = t.opts, a = t.dependencyLib;
-                        var s = this, c = s.inputmask._valueGet(!0), f = (t.isRTL ? n.getBuffer.call(t).slice().reverse() : n.getBuffer.call(t)).join(""), p = n.caret.call(t, s, void 0, void 0, !0);
-                        if (f !== c) {
-                            c = function(e, i, a) {
-                                if (o.iemobile) {
-                                    var r = i.replace(n.getBuffer.call(t).join(""), "");
-                                    if (1 === r.length) {
-                                        var s = i.split("");
-                                        s.splice(a.begin, 0, r), i = s.join("");
-                                    }
-                                }
-                                return i;
-                            }(0, c, p);
-                            var h = function(e, a, r) {
-                                for (var o, s, l, c = e.substr(0, r.begin).split(""), f = e.substr(r.begin).split(""), d = a.substr(0, r.begin).split(""), p = a.substr(r.begin).split(""), h = c.length >= d.length ? c.length : d.length, m = f.length >= p.length ? f.length : p.length, v = "", g = [], k = "~"; c.length < h; ) c.push(k);
-                                for (;d.length < h; ) d.push(k);
-                                for (;f.length < m; ) f.unshift(k);
-                                for (;p.length < m; ) p.unshift(k);
-                                var y = c.concat(f), b = d.concat(p);
-                                for (s = 0, o = y.length; s < o; s++) switch (l = u.getPlaceholder.call(t, n.translatePosition.call(t, s)), 
-                                v) {
-                                  case "insertText":
-                                    b[s - 1] === y[s] && r.begin == y.length - 1 && g.push(y[s]), s = o;
-                                    break;
-
-                                  case "insertReplacementText":
-                                  case "deleteContentBackward":
-                                    y[s] === k ? r.end++ : s = o;
-                                    break;
-
-                                  default:
-                                    y[s] !== b[s] && (y[s + 1] !== k && y[s + 1] !== l && void 0 !== y[s + 1] || (b[s] !== l || b[s + 1] !== k) && b[s] !== k ? b[s + 1] === k && b[s] === y[s + 1] ? (v = "insertText", 
-                                    g.push(y[s]), r.begin--, r.end--) : y[s] !== l && y[s] !== k && (y[s + 1] === k || b[s] !== y[s] && b[s + 1] === y[s + 1]) ? (v = "insertReplacementText", 
-                                    g.push(y[s]), r.begin--) : y[s] === k ? (v = "deleteContentBackward", (n.isMask.call(t, n.translatePosition.call(t, s), !0) || b[s] === i.radixPoint) && r.end++) : s = o : (v = "insertText", 
-                                    g.push(y[s]), r.begin--, r.end--));
-                                }
-                                return {
-                                    action: v,
-                                    data: g,
-                                    caret: r
-                                };
-                            }(c, f, p);
-                            switch ((s.inputmask.shadowRoot || s.ownerDocument).activeElement !== s && s.focus(), 
-                            (0, l.writeBuffer)(s, n.getBuffer.call(t)), n.caret.call(t, s, p.begin, p.end, !0), 
-                            h.action) {
-                              case "insertText":
-                              case "insertReplacementText":
-                                h.data.forEach((function(e, i) {
-                                    var n = new a.Event("keypress");
-                                    n.keyCode = e.charCodeAt(0), t.ignorable = !1, d.keypressEvent.call(s, n);
-                                })), setTimeout((function() {
-                                    t.$el.trigger("keyup");
-                                }), 0);
-                                break;
-
-                              case "deleteContentBackward":
-                                var m = new a.Event("keydown");
-                                m.keyCode = r.default.BACKSPACE, d.keydownEvent.call(s, m);
-                                break;
-
-                              default:
-                                (0, l.applyInputValue)(s, c);
-                            }
-                            e.preventDefault();
-                        }
-                    },
-                    compositionendEvent: function(e) {
-                        var t = this.inputmask;
-                        t.isComposing = !1, t.$el.trigger("input");
-                    },
-                    setValueEvent: function(e) {
-                        var t = this.inputmask, i = this, a = e && e.detail ? e.detail[0] : arguments[1];
-                        void 0 === a && (a = i.inputmask._valueGet(!0)), (0, l.applyInputValue)(i, a), (e.detail && void 0 !== e.detail[1] || void 0 !== arguments[2]) && n.caret.call(t, i, e.detail ? e.detail[1] : arguments[2]);
-                    },
-                    focusEvent: function(e) {
-                        var t = this.inputmask, i = t.opts, a = this, r = a.inputmask._valueGet();
-                        i.showMaskOnFocus && r !== n.getBuffer.call(t).join("") && (0, l.writeBuffer)(a, n.getBuffer.call(t), n.seekNext.call(t, n.getLastValidPosition.call(t))), 
-                        !0 !== i.positionCaretOnTab || !1 !== t.mouseEnter || s.isComplete.call(t, n.getBuffer.call(t)) && -1 !== n.getLastValidPosition.call(t) || d.clickEvent.apply(a, [ e, !0 ]), 
-                        t.undoValue = t._valueGet(!0);
-                    },
-                    invalidEvent: function(e) {
-                        this.inputmask.validationEvent = !0;
-                    },
-                    mouseleaveEvent: function() {
-                        var e = this.inputmask, t = e.opts, i = this;
-                        e.mouseEnter = !1, t.clearMaskOnLostFocus && (i.inputmask.shadowRoot || i.ownerDocument).activeElement !== i && (0, 
-                        l.HandleNativePlaceholder)(i, e.originalPlaceholder);
-                    },
-                    clickEvent: function(e, t) {
-                        var i = this.inputmask, a = this;
-                        if ((a.inputmask.shadowRoot || a.ownerDocument).activeElement === a) {
-                            var r = n.determineNewCaretPosition.call(i, n.caret.call(i, a), t);
-                            void 0 !== r && n.caret.call(i, a, r);
-                        }
-                    },
-                    cutEvent: function(e) {
-                        var t = this.inputmask, i = t.maskset, a = this, o = n.caret.call(t, a), u = t.isRTL ? n.getBuffer.call(t).slice(o.end, o.begin) : n.getBuffer.call(t).slice(o.begin, o.end), c = t.isRTL ? u.reverse().join("") : u.join("");
-                        window.navigator.clipboard ? window.navigator.clipboard.writeText(c) : window.clipboardData && window.clipboardData.getData && window.clipboardData.setData("Text", c), 
-                        s.handleRemove.call(t, a, r.default.DELETE, o), (0, l.writeBuffer)(a, n.getBuffer.call(t), i.p, e, t.undoValue !== t._valueGet(!0));
-                    },
-                    blurEvent: function(e) {
-                        var t = this.inputmask, i = t.opts, a = (0, t.dependencyLib)(this), r = this;
-                        if (r.inputmask) {
-                            (0, l.HandleNativePlaceholder)(r, t.originalPlaceholder);
-                            var o = r.inputmask._valueGet(), u = n.getBuffer.call(t).slice();
-                            "" !== o && (i.clearMaskOnLostFocus && (-1 === n.getLastValidPosition.call(t) && o === n.getBufferTemplate.call(t).join("") ? u = [] : l.clearOptionalTail.call(t, u)), 
-                            !1 === s.isComplete.call(t, u) && (setTimeout((function() {
-                                a.trigger("incomplete");
-                            }), 0), i.clearIncomplete && (n.resetMaskSet.call(t), u = i.clearMaskOnLostFocus ? [] : n.getBufferTemplate.call(t).slice())), 
-                            (0, l.writeBuffer)(r, u, void 0, e)), t.undoValue !== t._valueGet(!0) && (t.undoValue = t._valueGet(!0), 
-                            a.trigger("change"));
-                        }
-                    },
-                    mouseenterEvent: function() {
-                        var e = this.inputmask, t = e.opts, i = this;
-                        if (e.mouseEnter = !0, (i.inputmask.shadowRoot || i.ownerDocument).activeElement !== i) {
-                            var a = (e.isRTL ? n.getBufferTemplate.call(e).slice().reverse() : n.getBufferTemplate.call(e)).join("");
-                            e.placeholder !== a && i.placeholder !== e.originalPlaceholder && (e.originalPlaceholder = i.placeholder), 
-                            t.showMaskOnHover && (0, l.HandleNativePlaceholder)(i, a);
-                        }
-                    },
-                    submitEvent: function() {
-                        var e = this.inputmask, t = e.opts;
-                        e.undoValue !== e._valueGet(!0) && e.$el.trigger("change"), -1 === n.getLastValidPosition.call(e) && e._valueGet && e._valueGet() === n.getBufferTemplate.call(e).join("") && e._valueSet(""), 
-                        t.clearIncomplete && !1 === s.isComplete.call(e, n.getBuffer.call(e)) && e._valueSet(""), 
-                        t.removeMaskOnSubmit && (e._valueSet(e.unmaskedvalue(), !0), setTimeout((function() {
-                            (0, l.writeBuffer)(e.el, n.getBuffer.call(e));
-                        }), 0));
-                    },
-                    resetEvent: function() {
-                        var e = this.inputmask;
-                        e.refreshValue = !0, setTimeout((function() {
-                            (0, l.applyInputValue)(e.el, e._valueGet(!0));
-                        }), 0);
-                    }
-                };
-                t.EventHandlers = d;
-            },
-            9716: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.EventRuler = void 0;
-                var a = s(i(2394)), n = s(i(5581)), r = i(8711), o = i(7760);
-                function s(e) {
-                    return e && e.__esModule ? e : {
-                        default: e
-                    };
-                }
-                var l = {
-                    on: function(e, t, i) {
-                        var s = e.inputmask.dependencyLib, l = function(t) {
-                            t.originalEvent && (t = t.originalEvent || t, arguments[0] = t);
-                            var l, u = this, c = u.inputmask, f = c ? c.opts : void 0;
-                            if (void 0 === c && "FORM" !== this.nodeName) {
-                                var d = s.data(u, "_inputmask_opts");
-                                s(u).off(), d && new a.default(d).mask(u);
-                            } else {
-                                if ([ "submit", "reset", "setvalue" ].includes(t.type) || "FORM" === this.nodeName || !(u.disabled || u.readOnly && !("keydown" === t.type && t.ctrlKey && 67 === t.keyCode || !1 === f.tabThrough && t.keyCode === n.default.TAB))) {
-                                    switch (t.type) {
-                                      case "input":
-                                        if (!0 === c.skipInputEvent || t.inputType && "insertCompositionText" === t.inputType) return c.skipInputEvent = !1, 
-                                        t.preventDefault();
-                                        break;
-
-                                      case "keydown":
-                                        c.skipKeyPressEvent = !1, c.skipInputEvent = c.isComposing = t.keyCode === n.default.KEY_229;
-                                        break;
-
-                                      case "keyup":
-                                      case "compositionend":
-                                        c.isComposing && (c.skipInputEvent = !1);
-                                        break;
-
-                                      case "keypress":
-                                        if (!0 === c.skipKeyPressEvent) return t.preventDefault();
-                                        c.skipKeyPressEvent = !0;
-                                        break;
-
-                                      case "click":
-                                      case "focus":
-                                        return c.validationEvent ? (c.validationEvent = !1, e.blur(), (0, o.HandleNativePlaceholder)(e, (c.isRTL ? r.getBufferTemplate.call(c).slice().reverse() : r.getBufferTemplate.call(c)).join("")), 
-                                        setTimeout((function() {
-                                            e.focus();
-                                        }), f.validationEventTimeOut), !1) : (l = arguments, setTimeout((function() {
-                                            e.inputmask && i.apply(u, l);
-                                        }), 0), !1);
-                                    }
-                                    var p = i.apply(u, arguments);
-                                    return !1 === p && (t.preventDefault(), t.stopPropagation()), p;
-                                }
-                                t.preventDefault();
-                            }
-                        };
-                        [ "submit", "reset" ].includes(t) ? (l = l.bind(e), null !== e.form && s(e.form).on(t, l)) : s(e).on(t, l), 
-                        e.inputmask.events[t] = e.inputmask.events[t] || [], e.inputmask.events[t].push(l);
-                    },
-                    off: function(e, t) {
-                        if (e.inputmask && e.inputmask.events) {
-                            var i = e.inputmask.dependencyLib, a = e.inputmask.events;
-                            for (var n in t && ((a = [])[t] = e.inputmask.events[t]), a) {
-                                for (var r = a[n]; r.length > 0; ) {
-                                    var o = r.pop();
-                                    [ "submit", "reset" ].includes(n) ? null !== e.form && i(e.form).off(n, o) : i(e).off(n, o);
-                                }
-                                delete e.inputmask.events[n];
-                            }
-                        }
-                    }
-                };
-                t.EventRuler = l;
-            },
-            219: function(e, t, i) {
-                var a = d(i(2394)), n = d(i(5581)), r = d(i(7184)), o = i(8711), s = i(4713);
-                function l(e) {
-                    return l = "function" == typeof Symbol && "symbol" == typeof Symbol.iterator ? function(e) {
-                        return typeof e;
-                    } : function(e) {
-                        return e && "function" == typeof Symbol && e.constructor === Symbol && e !== Symbol.prototype ? "symbol" : typeof e;
-                    }, l(e);
-                }
-                function u(e, t) {
-                    return function(e) {
-                        if (Array.isArray(e)) return e;
-                    }(e) || function(e, t) {
-                        var i = null == e ? null : "undefined" != typeof Symbol && e[Symbol.iterator] || e["@@iterator"];
-                        if (null == i) return;
-                        var a, n, r = [], o = !0, s = !1;
-                        try {
-                            for (i = i.call(e); !(o = (a = i.next()).done) && (r.push(a.value), !t || r.length !== t); o = !0) ;
-                        } catch (e) {
-                            s = !0, n = e;
-                        } finally {
-                            try {
-                                o || null == i.return || i.return();
-                            } finally {
-                                if (s) throw n;
-                            }
-                        }
-                        return r;
-                    }(e, t) || function(e, t) {
-                        if (!e) return;
-                        if ("string" == typeof e) return c(e, t);
-                        var i = Object.prototype.toString.call(e).slice(8, -1);
-                        "Object" === i && e.constructor && (i = e.constructor.name);
-                        if ("Map" === i || "Set" === i) return Array.from(e);
-                        if ("Arguments" === i || /^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)) return c(e, t);
-                    }(e, t) || function() {
-                        throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.");
-                    }();
-                }
-                function c(e, t) {
-                    (null == t || t > e.length) && (t = e.length);
-                    for (var i = 0, a = new Array(t); i < t; i++) a[i] = e[i];
-                    return a;
-                }
-                function f(e, t) {
-                    for (var i = 0; i < t.length; i++) {
-                        var a = t[i];
-                        a.enumerable = a.enumerable || !1, a.configurable = !0, "value" in a && (a.writable = !0), 
-                        Object.defineProperty(e, a.key, a);
-                    }
-                }
-                function d(e) {
-                    return e && e.__esModule ? e : {
-                        default: e
-                    };
-                }
-                var p = a.default.dependencyLib, h = function() {
-                    function e(t, i, a) {
-                        !function(e, t) {
-                            if (!(e instanceof t)) throw new TypeError("Cannot call a class as a function");
-                        }(this, e), this.mask = t, this.format = i, this.opts = a, this._date = new Date(1, 0, 1), 
-                        this.initDateObject(t, this.opts);
-                    }
-                    var t, i, a;
-                    return t = e, (i = [ {
-                        key: "date",
-                        get: function() {
-                            return void 0 === this._date && (this._date = new Date(1, 0, 1), this.initDateObject(void 0, this.opts)), 
-                            this._date;
-                        }
-                    }, {
-                        key: "initDateObject",
-                        value: function(e, t) {
-                            var i;
-                            for (P(t).lastIndex = 0; i = P(t).exec(this.format); ) {
-                                var a = new RegExp("\\d+$").exec(i[0]), n = a ? i[0][0] + "x" : i[0], r = void 0;
-                                if (void 0 !== e) {
-                                    if (a) {
-                                        var o = P(t).lastIndex, s = O(i.index, t);
-                                        P(t).lastIndex = o, r = e.slice(0, e.indexOf(s.nextMatch[0]));
-                                    } else r = e.slice(0, n.length);
-                                    e = e.slice(r.length);
-                                }
-                                Object.prototype.hasOwnProperty.call(g, n) && this.setValue(this, r, n, g[n][2], g[n][1]);
-                            }
-                        }
-                    }, {
-                        key: "setValue",
-                        value: function(e, t, i, a, n) {
-                            if (void 0 !== t && (e[a] = "ampm" === a ? t : t.replace(/[^0-9]/g, "0"), e["raw" + a] = t.replace(/\s/g, "_")), 
-                            void 0 !== n) {
-                                var r = e[a];
-                                ("day" === a && 29 === parseInt(r) || "month" === a && 2 === parseInt(r)) && (29 !== parseInt(e.day) || 2 !== parseInt(e.month) || "" !== e.year && void 0 !== e.year || e._date.setFullYear(2012, 1, 29)), 
-                                "day" === a && (v = !0, 0 === parseInt(r) && (r = 1)), "month" === a && (v = !0), 
-                                "year" === a && (v = !0, r.length < 4 && (r = w(r, 4, !0))), "" === r || isNaN(r) || n.call(e._date, r), 
-                                "ampm" === a && n.call(e._date, r);
-                            }
-                        }
-                    }, {
-                        key: "reset",
-                        value: function() {
-                            this._date = new Date(1, 0, 1);
-                        }
-                    }, {
-                        key: "reInit",
-                        value: function() {
-                            this._date = void 0, this.date;
-                        }
-                    } ]) && f(t.prototype, i), a && f(t, a), Object.defineProperty(t, "prototype", {
-                        writable: !1
-                    }), e;
-                }(), m = (new Date).getFullYear(), v = !1, g = {
-                    d: [ "[1-9]|[12][0-9]|3[01]", Date.prototype.setDate, "day", Date.prototype.getDate ],
-                    dd: [ "0[1-9]|[12][0-9]|3[01]", Date.prototype.setDate, "day", function() {
-                        return w(Date.prototype.getDate.call(this), 2);
-                    } ],
-                    ddd: [ "" ],
-                    dddd: [ "" ],
-                    m: [ "[1-9]|1[012]", function(e) {
-                        var t = e ? parseInt(e) : 0;
-                        return t > 0 && t--, Date.prototype.setMonth.call(this, t);
-                    }, "month", function() {
-                        return Date.prototype.getMonth.call(this) + 1;
-                    } ],
-                    mm: [ "0[1-9]|1[012]", function(e) {
-                        var t = e ? parseInt(e) : 0;
-                        return t > 0 && t--, Date.prototype.setMonth.call(this, t);
-                    }, "month", function() {
-                        return w(Date.prototype.getMonth.call(this) + 1, 2);
-                    } ],
-                    mmm: [ "" ],
-                    mmmm: [ "" ],
-                    yy: [ "[0-9]{2}", Date.prototype.setFullYear, "year", function() {
-                        return w(Date.prototype.getFullYear.call(this), 2);
-                    } ],
-                    yyyy: [ "[0-9]{4}", Date.prototype.setFullYear, "year", function() {
-                        return w(Date.prototype.getFullYear.call(this), 4);
-                    } ],
-                    h: [ "[1-9]|1[0-2]", Date.prototype.setHours, "hours", Date.prototype.getHours ],
-                    hh: [ "0[1-9]|1[0-2]", Date.prototype.setHours, "hours", function() {
-                        return w(Date.prototype.getHours.call(this), 2);
-                    } ],
-                    hx: [ function(e) {
-                        return "[0-9]{".concat(e, "}");
-                    }, Date.prototype.setHours, "hours", function(e) {
-                        return Date.prototype.getHours;
-                    } ],
-                    H: [ "1?[0-9]|2[0-3]", Date.prototype.setHours, "hours", Date.prototype.getHours ],
-                    HH: [ "0[0-9]|1[0-9]|2[0-3]", Date.prototype.setHours, "hours", function() {
-                        return w(Date.prototype.getHours.call(this), 2);
-                    } ],
-                    Hx: [ function(e) {
-                        return "[0-9]{".concat(e, "}");
-                    }, Date.prototype.setHours, "hours", function(e) {
-                        return function() {
-                            return w(Date.prototype.getHours.call(this), e);
-                        };
-                    } ],
-                    M: [ "[1-5]?[0-9]", Date.prototype.setMinutes, "minutes", Date.prototype.getMinutes ],
-                    MM: [ "0[0-9]|1[0-9]|2[0-9]|3[0-9]|4[0-9]|5[0-9]", Date.prototype.setMinutes, "minutes", function() {
-                        return w(Date.prototype.getMinutes.call(this), 2);
-                    } ],
-                    s: [ "[1-5]?[0-9]", Date.prototype.setSeconds, "seconds", Date.prototype.getSeconds ],
-                    ss: [ "0[0-9]|1[0-9]|2[0-9]|3[0-9]|4[0-9]|5[0-9]", Date.prototype.setSeconds, "seconds", function() {
-                        return w(Date.prototype.getSeconds.call(this), 2);
-                    } ],
-                    l: [ "[0-9]{3}", Date.prototype.setMilliseconds, "milliseconds", function() {
-                        return w(Date.prototype.getMilliseconds.call(this), 3);
-                    } ],
-                    L: [ "[0-9]{2}", Date.prototype.setMilliseconds, "milliseconds", function() {
-                        return w(Date.prototype.getMilliseconds.call(this), 2);
-                    } ],
-                    t: [ "[ap]", y, "ampm", b, 1 ],
-                    tt: [ "[ap]m", y, "ampm", b, 2 ],
-                    T: [ "[AP]", y, "ampm", b, 1 ],
-                    TT: [ "[AP]M", y, "ampm", b, 2 ],
-                    Z: [ ".*", void 0, "Z", function() {
-                        var e = this.toString().match(/\((.+)\)/)[1];
-                        e.includes(" ") && (e = (e = e.replace("-", " ").toUpperCase()).split(" ").map((function(e) {
-                            return u(e, 1)[0];
-                        })).join(""));
-                        return e;
-                    } ],
-                    o: [ "" ],
-                    S: [ "" ]
-                }, k = {
-                    isoDate: "yyyy-mm-dd",
-                    isoTime: "HH:MM:ss",
-                    isoDateTime: "yyyy-mm-dd'T'HH:MM:ss",
-                    isoUtcDateTime: "UTC:yyyy-mm-dd'T'HH:MM:ss'Z'"
-                };
-                function y(e) {
-                    var t = this.getHours();
-                    e.toLowerCase().includes("p") ? this.setHours(t + 12) : e.toLowerCase().includes("a") && t >= 12 && this.setHours(t - 12);
-                }
-                function b() {
-                    var e = this.getHours();
-                    return (e = e || 12) >= 12 ? "PM" : "AM";
-                }
-                function x(e) {
-                    var t = new RegExp("\\d+$").exec(e[0]);
-                    if (t && void 0 !== t[0]) {
-                        var i = g[e[0][0] + "x"].slice("");
-                        return i[0] = i[0](t[0]), i[3] = i[3](t[0]), i;
-                    }
-                    if (g[e[0]]) return g[e[0]];
-                }
-                function P(e) {
-                    if (!e.tokenizer) {
-                        var t = [], i = [];
-                        for (var a in g) if (/\.*x$/.test(a)) {
-                            var n = a[0] + "\\d+";
-                            -1 === i.indexOf(n) && i.push(n);
-                        } else -1 === t.indexOf(a[0]) && t.push(a[0]);
-                        e.tokenizer = "(" + (i.length > 0 ? i.join("|") + "|" : "") + t.join("+|") + ")+?|.", 
-                        e.tokenizer = new RegExp(e.tokenizer, "g");
-                    }
-                    return e.tokenizer;
-                }
-                function E(e, t, i) {
-                    if (!v) return !0;
-                    if (void 0 === e.rawday || !isFinite(e.rawday) && new Date(e.date.getFullYear(), isFinite(e.rawmonth) ? e.month : e.date.getMonth() + 1, 0).getDate() >= e.day || "29" == e.day && (!isFinite(e.rawyear) || void 0 === e.rawyear || "" === e.rawyear) || new Date(e.date.getFullYear(), isFinite(e.rawmonth) ? e.month : e.date.getMonth() + 1, 0).getDate() >= e.day) return t;
-                    if ("29" == e.day) {
-                        var a = O(t.pos, i);
-                        if ("yyyy" === a.targetMatch[0] && t.pos - a.targetMatchIndex == 2) return t.remove = t.pos + 1, 
-                        t;
-                    } else if ("02" == e.month && "30" == e.day && void 0 !== t.c) return e.day = "03", 
-                    e.date.setDate(3), e.date.setMonth(1), t.insert = [ {
-                        pos: t.pos,
-                        c: "0"
-                    }, {
-                        pos: t.pos + 1,
-                        c: t.c
-                    } ], t.caret = o.seekNext.call(this, t.pos + 1), t;
-                    return !1;
-                }
-                function S(e, t, i, a) {
-                    var n, o, s = "";
-                    for (P(i).lastIndex = 0; n = P(i).exec(e); ) {
-                        if (void 0 === t) if (o = x(n)) s += "(" + o[0] + ")"; else switch (n[0]) {
-                          case "[":
-                            s += "(";
-                            break;
-
-                          case "]":
-                            s += ")?";
-                            break;
-
-                          default:
-                            s += (0, r.default)(n[0]);
-                        } else if (o = x(n)) if (!0 !== a && o[3]) s += o[3].call(t.date); else o[2] ? s += t["raw" + o[2]] : s += n[0]; else s += n[0];
-                    }
-                    return s;
-                }
-                function w(e, t, i) {
-                    for (e = String(e), t = t || 2; e.length < t; ) e = i ? e + "0" : "0" + e;
-                    return e;
-                }
-                function _(e, t, i) {
-                    return "string" == typeof e ? new h(e, t, i) : e && "object" === l(e) && Object.prototype.hasOwnProperty.call(e, "date") ? e : void 0;
-                }
-                function M(e, t) {
-                    return S(t.inputFormat, {
-                        date: e
-                    }, t);
-                }
-                function O(e, t) {
-                    var i, a, n = 0, r = 0;
-                    for (P(t).lastIndex = 0; a = P(t).exec(t.inputFormat); ) {
-                        var o = new RegExp("\\d+$").exec(a[0]);
-                        if ((n += r = o ? parseInt(o[0]) : a[0].length) >= e + 1) {
-                            i = a, a = P(t).exec(t.inputFormat);
-                            break;
-                        }
-                    }
-                    return {
-                        targetMatchIndex: n - r,
-                        nextMatch: a,
-                        targetMatch: i
-                    };
-                }
-                a.default.extendAliases({
-                    datetime: {
-                        mask: function(e) {
-                            return e.numericInput = !1, g.S = e.i18n.ordinalSuffix.join("|"), e.inputFormat = k[e.inputFormat] || e.inputFormat, 
-                            e.displayFormat = k[e.displayFormat] || e.displayFormat || e.inputFormat, e.outputFormat = k[e.outputFormat] || e.outputFormat || e.inputFormat, 
-                            e.placeholder = "" !== e.placeholder ? e.placeholder : e.inputFormat.replace(/[[\]]/, ""), 
-                            e.regex = S(e.inputFormat, void 0, e), e.min = _(e.min, e.inputFormat, e), e.max = _(e.max, e.inputFormat, e), 
-                            null;
-                        },
-                        placeholder: "",
-                        inputFormat: "isoDateTime",
-                        displayFormat: null,
-                        outputFormat: null,
-                        min: null,
-                        max: null,
-                        skipOptionalPartCharacter: "",
-                        i18n: {
-                            dayNames: [ "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday" ],
-                            monthNames: [ "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December" ],
-                            ordinalSuffix: [ "st", "nd", "rd", "th" ]
-                        },
-                        preValidation: function(e, t, i, a, n, r, o, s) {
-                            if (s) return !0;
-                            if (isNaN(i) && e[t] !== i) {
-                                var l = O(t, n);
-                                if (l.nextMatch && l.nextMatch[0] === i && l.targetMatch[0].length > 1) {
-                                    var u = g[l.targetMatch[0]][0];
-                                    if (new RegExp(u).test("0" + e[t - 1])) return e[t] = e[t - 1], e[t - 1] = "0", 
-                                    {
-                                        fuzzy: !0,
-                                        buffer: e,
-                                        refreshFromBuffer: {
-                                            start: t - 1,
-                                            end: t + 1
-                                        },
-                                        pos: t + 1
-                                    };
-                                }
-                            }
-                            return !0;
-                        },
-                        postValidation: function(e, t, i, a, n, r, o, l) {
-                            var u, c;
-                            if (o) return !0;
-                            if (!1 === a && (((u = O(t + 1, n)).targetMatch && u.targetMatchIndex === t && u.targetMatch[0].length > 1 && void 0 !== g[u.targetMatch[0]] || (u = O(t + 2, n)).targetMatch && u.targetMatchIndex === t + 1 && u.targetMatch[0].length > 1 && void 0 !== g[u.targetMatch[0]]) && (c = g[u.targetMatch[0]][0]), 
-                            void 0 !== c && (void 0 !== r.validPositions[t + 1] && new RegExp(c).test(i + "0") ? (e[t] = i, 
-                            e[t + 1] = "0", a = {
-                                pos: t + 2,
-                                caret: t
-                            }) : new RegExp(c).test("0" + i) && (e[t] = "0", e[t + 1] = i, a = {
-                                pos: t + 2
-                            })), !1 === a)) return a;
-                            if (a.fuzzy && (e = a.buffer, t = a.pos), (u = O(t, n)).targetMatch && u.targetMatch[0] && void 0 !== g[u.targetMatch[0]]) {
-                                var f = g[u.targetMatch[0]];
-                                c = f[0];
-                                var d = e.slice(u.targetMatchIndex, u.targetMatchIndex + u.targetMatch[0].length);
-                                if (!1 === new RegExp(c).test(d.join("")) && 2 === u.targetMatch[0].length && r.validPositions[u.targetMatchIndex] && r.validPositions[u.targetMatchIndex + 1] && (r.validPositions[u.targetMatchIndex + 1].input = "0"), 
-                                "year" == f[2]) for (var p = s.getMaskTemplate.call(this, !1, 1, void 0, !0), h = t + 1; h < e.length; h++) e[h] = p[h], 
-                                delete r.validPositions[h];
-                            }
-                            var v = a, k = _(e.join(""), n.inputFormat, n);
-                            return v && k.date.getTime() == k.date.getTime() && (n.prefillYear && (v = function(e, t, i) {
-                                if (e.year !== e.rawyear) {
-                                    var a = m.toString(), n = e.rawyear.replace(/[^0-9]/g, ""), r = a.slice(0, n.length), o = a.slice(n.length);
-                                    if (2 === n.length && n === r) {
-                                        var s = new Date(m, e.month - 1, e.day);
-                                        e.day == s.getDate() && (!i.max || i.max.date.getTime() >= s.getTime()) && (e.date.setFullYear(m), 
-                                        e.year = a, t.insert = [ {
-                                            pos: t.pos + 1,
-                                            c: o[0]
-                                        }, {
-                                            pos: t.pos + 2,
-                                            c: o[1]
-                                        } ]);
-                                    }
-                                }
-                                return t;
-                            }(k, v, n)), v = function(e, t, i, a, n) {
-                                if (!t) return t;
-                                if (t && i.min && i.min.date.getTime() == i.min.date.getTime()) {
-                                    var r;
-                                    for (e.reset(), P(i).lastIndex = 0; r = P(i).exec(i.inputFormat); ) {
-                                        var o;
-                                        if ((o = x(r)) && o[3]) {
-                                            for (var s = o[1], l = e[o[2]], u = i.min[o[2]], c = i.max ? i.max[o[2]] : u, f = [], d = !1, p = 0; p < u.length; p++) void 0 !== a.validPositions[p + r.index] || d ? (f[p] = l[p], 
-                                            d = d || l[p] > u[p]) : (f[p] = u[p], "year" === o[2] && l.length - 1 == p && u != c && (f = (parseInt(f.join("")) + 1).toString().split("")), 
-                                            "ampm" === o[2] && u != c && i.min.date.getTime() > e.date.getTime() && (f[p] = c[p]));
-                                            s.call(e._date, f.join(""));
-                                        }
-                                    }
-                                    t = i.min.date.getTime() <= e.date.getTime(), e.reInit();
-                                }
-                                return t && i.max && i.max.date.getTime() == i.max.date.getTime() && (t = i.max.date.getTime() >= e.date.getTime()), 
-                                t;
-                            }(k, v = E.call(this, k, v, n), n, r)), void 0 !== t && v && a.pos !== t ? {
-                                buffer: S(n.inputFormat, k, n).split(""),
-                                refreshFromBuffer: {
-                                    start: t,
-                                    end: a.pos
-                                },
-                                pos: a.caret || a.pos
-                            } : v;
-                        },
-                        onKeyDown: function(e, t, i, a) {
-                            e.ctrlKey && e.keyCode === n.default.RIGHT && (this.inputmask._valueSet(M(new Date, a)), 
-                            p(this).trigger("setvalue"));
-                        },
-                        onUnMask: function(e, t, i) {
-                            return t ? S(i.outputFormat, _(e, i.inputFormat, i), i, !0) : t;
-                        },
-                        casing: function(e, t, i, a) {
-                            return 0 == t.nativeDef.indexOf("[ap]") ? e.toLowerCase() : 0 == t.nativeDef.indexOf("[AP]") ? e.toUpperCase() : e;
-                        },
-                        onBeforeMask: function(e, t) {
-                            return "[object Date]" === Object.prototype.toString.call(e) && (e = M(e, t)), e;
-                        },
-                        insertMode: !1,
-                        shiftPositions: !1,
-                        keepStatic: !1,
-                        inputmode: "numeric",
-                        prefillYear: !0
-                    }
-                });
-            },
-            3851: function(e, t, i) {
-                var a, n = (a = i(2394)) && a.__esModule ? a : {
-                    default: a
-                }, r = i(8711), o = i(4713);
-                n.default.extendDefinitions({
-                    A: {
-                        validator: "[A-Za-z\u0410-\u044f\u0401\u0451\xc0-\xff\xb5]",
-                        casing: "upper"
-                    },
-                    "&": {
-                        validator: "[0-9A-Za-z\u0410-\u044f\u0401\u0451\xc0-\xff\xb5]",
-                        casing: "upper"
-                    },
-                    "#": {
-                        validator: "[0-9A-Fa-f]",
-                        casing: "upper"
-                    }
-                });
-                var s = new RegExp("25[0-5]|2[0-4][0-9]|[01][0-9][0-9]");
-                function l(e, t, i, a, n) {
-                    return i - 1 > -1 && "." !== t.buffer[i - 1] ? (e = t.buffer[i - 1] + e, e = i - 2 > -1 && "." !== t.buffer[i - 2] ? t.buffer[i - 2] + e : "0" + e) : e = "00" + e, 
-                    s.test(e);
-                }
-                n.default.extendAliases({
-                    cssunit: {
-                        regex: "[+-]?[0-9]+\\.?([0-9]+)?(px|em|rem|ex|%|in|cm|mm|pt|pc)"
-                    },
-                    url: {
-                        regex: "(https?|ftp)://.*",
-                        autoUnmask: !1,
-                        keepStatic: !1,
-                        tabThrough: !0
-                    },
-                    ip: {
-                        mask: "i{1,3}.j{1,3}.k{1,3}.l{1,3}",
-                        definitions: {
-                            i: {
-                                validator: l
-                            },
-                            j: {
-                                validator: l
-                            },
-                            k: {
-                                validator: l
-                            },
-                            l: {
-                                validator: l
-                            }
-                        },
-                        onUnMask: function(e, t, i) {
-                            return e;
-                        },
-                        inputmode: "decimal",
-                        substitutes: {
-                            ",": "."
-                        }
-                    },
-                    email: {
-                        mask: function(e) {
-                            var t = "*{1,64}[.*{1,64}][.*{1,64}][.*{1,63}]@-{1,63}.-{1,63}[.-{1,63}][.-{1,63}]", i = t;
-                            if (e.separator) for (var a = 0; a < e.quantifier; a++) i += "[".concat(e.separator).concat(t, "]");
-                            return i;
-                        },
-                        greedy: !1,
-                        casing: "lower",
-                        separator: null,
-                        quantifier: 5,
-                        skipOptionalPartCharacter: "",
-                        onBeforePaste: function(e, t) {
-                            return (e = e.toLowerCase()).replace("mailto:", "");
-                        },
-                        definitions: {
-                            "*": {
-                                validator: "[0-9\uff11-\uff19A-Za-z\u0410-\u044f\u0401\u0451\xc0-\xff\xb5!#$%&'*+/=?^_`{|}~-]"
-                            },
-                            "-": {
-                                validator: "[0-9A-Za-z-]"
-                            }
-                        },
-                        onUnMask: function(e, t, i) {
-                            return e;
-                        },
-                        inputmode: "email"
-                    },
-                    mac: {
-                        mask: "##:##:##:##:##:##"
-                    },
-                    vin: {
-                        mask: "V{13}9{4}",
-                        definitions: {
-                            V: {
-                                validator: "[A-HJ-NPR-Za-hj-npr-z\\d]",
-                                casing: "upper"
-                            }
-                        },
-                        clearIncomplete: !0,
-                        autoUnmask: !0
-                    },
-                    ssn: {
-                        mask: "999-99-9999",
-                        postValidation: function(e, t, i, a, n, s, l) {
-                            var u = o.getMaskTemplate.call(this, !0, r.getLastValidPosition.call(this), !0, !0);
-                            return /^(?!219-09-9999|078-05-1120)(?!666|000|9.{2}).{3}-(?!00).{2}-(?!0{4}).{4}$/.test(u.join(""));
-                        }
-                    }
-                });
-            },
-            207: function(e, t, i) {
-                var a = s(i(2394)), n = s(i(5581)), r = s(i(7184)), o = i(8711);
-                function s(e) {
-                    return e && e.__esModule ? e : {
-                        default: e
-                    };
-                }
-                var l = a.default.dependencyLib;
-                function u(e, t) {
-                    for (var i = "", n = 0; n < e.length; n++) a.default.prototype.definitions[e.charAt(n)] || t.definitions[e.charAt(n)] || t.optionalmarker[0] === e.charAt(n) || t.optionalmarker[1] === e.charAt(n) || t.quantifiermarker[0] === e.charAt(n) || t.quantifiermarker[1] === e.charAt(n) || t.groupmarker[0] === e.charAt(n) || t.groupmarker[1] === e.charAt(n) || t.alternatormarker === e.charAt(n) ? i += "\\" + e.charAt(n) : i += e.charAt(n);
-                    return i;
-                }
-                function c(e, t, i, a) {
-                    if (e.length > 0 && t > 0 && (!i.digitsOptional || a)) {
-                        var n = e.indexOf(i.radixPoint), r = !1;
-                        i.negationSymbol.back === e[e.length - 1] && (r = !0, e.length--), -1 === n && (e.push(i.radixPoint), 
-                        n = e.length - 1);
-                        for (var o = 1; o <= t; o++) isFinite(e[n + o]) || (e[n + o] = "0");
-                    }
-                    return r && e.push(i.negationSymbol.back), e;
-                }
-                function f(e, t) {
-                    var i = 0;
-                    if ("+" === e) {
-                        for (i in t.validPositions) ;
-                        i = o.seekNext.call(this, parseInt(i));
-                    }
-                    for (var a in t.tests) if ((a = parseInt(a)) >= i) for (var n = 0, r = t.tests[a].length; n < r; n++) if ((void 0 === t.validPositions[a] || "-" === e) && t.tests[a][n].match.def === e) return a + (void 0 !== t.validPositions[a] && "-" !== e ? 1 : 0);
-                    return i;
-                }
-                function d(e, t) {
-                    var i = -1;
-                    for (var a in t.validPositions) {
-                        var n = t.validPositions[a];
-                        if (n && n.match.def === e) {
-                            i = parseInt(a);
-                            break;
-                        }
-                    }
-                    return i;
-                }
-                function p(e, t, i, a, n) {
-                    var r = t.buffer ? t.buffer.indexOf(n.radixPoint) : -1, o = (-1 !== r || a && n.jitMasking) && new RegExp(n.definitions[9].validator).test(e);
-                    return n._radixDance && -1 !== r && o && null == t.validPositions[r] ? {
-                        insert: {
-                            pos: r === i ? r + 1 : r,
-                            c: n.radixPoint
-                        },
-                        pos: i
-                    } : o;
-                }
-                a.default.extendAliases({
-                    numeric: {
-                        mask: function(e) {
-                            e.repeat = 0, e.groupSeparator === e.radixPoint && e.digits && "0" !== e.digits && ("." === e.radixPoint ? e.groupSeparator = "," : "," === e.radixPoint ? e.groupSeparator = "." : e.groupSeparator = ""), 
-                            " " === e.groupSeparator && (e.skipOptionalPartCharacter = void 0), e.placeholder.length > 1 && (e.placeholder = e.placeholder.charAt(0)), 
-                            "radixFocus" === e.positionCaretOnClick && "" === e.placeholder && (e.positionCaretOnClick = "lvp");
-                            var t = "0", i = e.radixPoint;
-                            !0 === e.numericInput && void 0 === e.__financeInput ? (t = "1", e.positionCaretOnClick = "radixFocus" === e.positionCaretOnClick ? "lvp" : e.positionCaretOnClick, 
-                            e.digitsOptional = !1, isNaN(e.digits) && (e.digits = 2), e._radixDance = !1, i = "," === e.radixPoint ? "?" : "!", 
-                            "" !== e.radixPoint && void 0 === e.definitions[i] && (e.definitions[i] = {}, e.definitions[i].validator = "[" + e.radixPoint + "]", 
-                            e.definitions[i].placeholder = e.radixPoint, e.definitions[i].static = !0, e.definitions[i].generated = !0)) : (e.__financeInput = !1, 
-                            e.numericInput = !0);
-                            var a, n = "[+]";
-                            if (n += u(e.prefix, e), "" !== e.groupSeparator ? (void 0 === e.definitions[e.groupSeparator] && (e.definitions[e.groupSeparator] = {}, 
-                            e.definitions[e.groupSeparator].validator = "[" + e.groupSeparator + "]", e.definitions[e.groupSeparator].placeholder = e.groupSeparator, 
-                            e.definitions[e.groupSeparator].static = !0, e.definitions[e.groupSeparator].generated = !0), 
-                            n += e._mask(e)) : n += "9{+}", void 0 !== e.digits && 0 !== e.digits) {
-                                var o = e.digits.toString().split(",");
-                                isFinite(o[0]) && o[1] && isFinite(o[1]) ? n += i + t + "{" + e.digits + "}" : (isNaN(e.digits) || parseInt(e.digits) > 0) && (e.digitsOptional || e.jitMasking ? (a = n + i + t + "{0," + e.digits + "}", 
-                                e.keepStatic = !0) : n += i + t + "{" + e.digits + "}");
-                            } else e.inputmode = "numeric";
-                            return n += u(e.suffix, e), n += "[-]", a && (n = [ a + u(e.suffix, e) + "[-]", n ]), 
-                            e.greedy = !1, function(e) {
-                                void 0 === e.parseMinMaxOptions && (null !== e.min && (e.min = e.min.toString().replace(new RegExp((0, 
-                                r.default)(e.groupSeparator), "g"), ""), "," === e.radixPoint && (e.min = e.min.replace(e.radixPoint, ".")), 
-                                e.min = isFinite(e.min) ? parseFloat(e.min) : NaN, isNaN(e.min) && (e.min = Number.MIN_VALUE)), 
-                                null !== e.max && (e.max = e.max.toString().replace(new RegExp((0, r.default)(e.groupSeparator), "g"), ""), 
-                                "," === e.radixPoint && (e.max = e.max.replace(e.radixPoint, ".")), e.max = isFinite(e.max) ? parseFloat(e.max) : NaN, 
-                                isNaN(e.max) && (e.max = Number.MAX_VALUE)), e.parseMinMaxOptions = "done");
-                            }(e), "" !== e.radixPoint && (e.substitutes["." == e.radixPoint ? "," : "."] = e.radixPoint), 
-                            n;
-                        },
-                        _mask: function(e) {
-                            return "(" + e.groupSeparator + "999){+|1}";
-                        },
-                        digits: "*",
-                        digitsOptional: !0,
-                        enforceDigitsOnBlur: !1,
-                        radixPoint: ".",
-                        positionCaretOnClick: "radixFocus",
-                        _radixDance: !0,
-                        groupSeparator: "",
-                        allowMinus: !0,
-                        negationSymbol: {
-                            front: "-",
-                            back: ""
-                        },
-                        prefix: "",
-                        suffix: "",
-                        min: null,
-                        max: null,
-                        SetMaxOnOverflow: !1,
-                        step: 1,
-                        inputType: "text",
-                        unmaskAsNumber: !1,
-                        roundingFN: Math.round,
-                        inputmode: "decimal",
-                        shortcuts: {
-                            k: "1000",
-                            m: "1000000"
-                        },
-                        placeholder: "0",
-                        greedy: !1,
-                        rightAlign: !0,
-                        insertMode: !0,
-                        autoUnmask: !1,
-                        skipOptionalPartCharacter: "",
-                        usePrototypeDefinitions: !1,
-                        stripLeadingZeroes: !0,
-                        definitions: {
-                            0: {
-                                validator: p
-                            },
-                            1: {
-                                validator: p,
-                                definitionSymbol: "9"
-                            },
-                            9: {
-                                validator: "[0-9\uff10-\uff19\u0660-\u0669\u06f0-\u06f9]",
-                                definitionSymbol: "*"
-                            },
-                            "+": {
-                                validator: function(e, t, i, a, n) {
-                                    return n.allowMinus && ("-" === e || e === n.negationSymbol.front);
-                                }
-                            },
-                            "-": {
-                                validator: function(e, t, i, a, n) {
-                                    return n.allowMinus && e === n.negationSymbol.back;
-                                }
-                            }
-                        },
-                        preValidation: function(e, t, i, a, n, r, o, s) {
-                            if (!1 !== n.__financeInput && i === n.radixPoint) return !1;
-                            var l = e.indexOf(n.radixPoint), u = t;
-                            if (t = function(e, t, i, a, n) {
-                                return n._radixDance && n.numericInput && t !== n.negationSymbol.back && e <= i && (i > 0 || t == n.radixPoint) && (void 0 === a.validPositions[e - 1] || a.validPositions[e - 1].input !== n.negationSymbol.back) && (e -= 1), 
-                                e;
-                            }(t, i, l, r, n), "-" === i || i === n.negationSymbol.front) {
-                                if (!0 !== n.allowMinus) return !1;
-                                var c = !1, p = d("+", r), h = d("-", r);
-                                return -1 !== p && (c = [ p, h ]), !1 !== c ? {
-                                    remove: c,
-                                    caret: u - n.negationSymbol.back.length
-                                } : {
-                                    insert: [ {
-                                        pos: f.call(this, "+", r),
-                                        c: n.negationSymbol.front,
-                                        fromIsValid: !0
-                                    }, {
-                                        pos: f.call(this, "-", r),
-                                        c: n.negationSymbol.back,
-                                        fromIsValid: void 0
-                                    } ],
-                                    caret: u + n.negationSymbol.back.length
-                                };
-                            }
-                            if (i === n.groupSeparator) return {
-                                caret: u
-                            };
-                            if (s) return !0;
-                            if (-1 !== l && !0 === n._radixDance && !1 === a && i === n.radixPoint && void 0 !== n.digits && (isNaN(n.digits) || parseInt(n.digits) > 0) && l !== t) return {
-                                caret: n._radixDance && t === l - 1 ? l + 1 : l
-                            };
-                            if (!1 === n.__financeInput) if (a) {
-                                if (n.digitsOptional) return {
-                                    rewritePosition: o.end
-                                };
-                                if (!n.digitsOptional) {
-                                    if (o.begin > l && o.end <= l) return i === n.radixPoint ? {
-                                        insert: {
-                                            pos: l + 1,
-                                            c: "0",
-                                            fromIsValid: !0
-                                        },
-                                        rewritePosition: l
-                                    } : {
-                                        rewritePosition: l + 1
-                                    };
-                                    if (o.begin < l) return {
-                                        rewritePosition: o.begin - 1
-                                    };
-                                }
-                            } else if (!n.showMaskOnHover && !n.showMaskOnFocus && !n.digitsOptional && n.digits > 0 && "" === this.__valueGet.call(this.el)) return {
-                                rewritePosition: l
-                            };
-                            return {
-                                rewritePosition: t
-                            };
-                        },
-                        postValidation: function(e, t, i, a, n, r, o) {
-                            if (!1 === a) return a;
-                            if (o) return !0;
-                            if (null !== n.min || null !== n.max) {
-                                var s = n.onUnMask(e.slice().reverse().join(""), void 0, l.extend({}, n, {
-                                    unmaskAsNumber: !0
-                                }));
-                                if (null !== n.min && s < n.min && (s.toString().length > n.min.toString().length || s < 0)) return !1;
-                                if (null !== n.max && s > n.max) return !!n.SetMaxOnOverflow && {
-                                    refreshFromBuffer: !0,
-                                    buffer: c(n.max.toString().replace(".", n.radixPoint).split(""), n.digits, n).reverse()
-                                };
-                            }
-                            return a;
-                        },
-                        onUnMask: function(e, t, i) {
-                            if ("" === t && !0 === i.nullable) return t;
-                            var a = e.replace(i.prefix, "");
-                            return a = (a = a.replace(i.suffix, "")).replace(new RegExp((0, r.default)(i.groupSeparator), "g"), ""), 
-                            "" !== i.placeholder.charAt(0) && (a = a.replace(new RegExp(i.placeholder.charAt(0), "g"), "0")), 
-                            i.unmaskAsNumber ? ("" !== i.radixPoint && -1 !== a.indexOf(i.radixPoint) && (a = a.replace(r.default.call(this, i.radixPoint), ".")), 
-                            a = (a = a.replace(new RegExp("^" + (0, r.default)(i.negationSymbol.front)), "-")).replace(new RegExp((0, 
-                            r.default)(i.negationSymbol.back) + "$"), ""), Number(a)) : a;
-                        },
-                        isComplete: function(e, t) {
-                            var i = (t.numericInput ? e.slice().reverse() : e).join("");
-                            return i = (i = (i = (i = (i = i.replace(new RegExp("^" + (0, r.default)(t.negationSymbol.front)), "-")).replace(new RegExp((0, 
-                            r.default)(t.negationSymbol.back) + "$"), "")).replace(t.prefix, "")).replace(t.suffix, "")).replace(new RegExp((0, 
-                            r.default)(t.groupSeparator) + "([0-9]{3})", "g"), "$1"), "," === t.radixPoint && (i = i.replace((0, 
-                            r.default)(t.radixPoint), ".")), isFinite(i);
-                        },
-                        onBeforeMask: function(e, t) {
-                            var i = t.radixPoint || ",";
-                            isFinite(t.digits) && (t.digits = parseInt(t.digits)), "number" != typeof e && "number" !== t.inputType || "" === i || (e = e.toString().replace(".", i));
-                            var a = "-" === e.charAt(0) || e.charAt(0) === t.negationSymbol.front, n = e.split(i), o = n[0].replace(/[^\-0-9]/g, ""), s = n.length > 1 ? n[1].replace(/[^0-9]/g, "") : "", l = n.length > 1;
-                            e = o + ("" !== s ? i + s : s);
-                            var u = 0;
-                            if ("" !== i && (u = t.digitsOptional ? t.digits < s.length ? t.digits : s.length : t.digits, 
-                            "" !== s || !t.digitsOptional)) {
-                                var f = Math.pow(10, u || 1);
-                                e = e.replace((0, r.default)(i), "."), isNaN(parseFloat(e)) || (e = (t.roundingFN(parseFloat(e) * f) / f).toFixed(u)), 
-                                e = e.toString().replace(".", i);
-                            }
-                            if (0 === t.digits && -1 !== e.indexOf(i) && (e = e.substring(0, e.indexOf(i))), 
-                            null !== t.min || null !== t.max) {
-                                var d = e.toString().replace(i, ".");
-                                null !== t.min && d < t.min ? e = t.min.toString().replace(".", i) : null !== t.max && d > t.max && (e = t.max.toString().replace(".", i));
-                            }
-                            return a && "-" !== e.charAt(0) && (e = "-" + e), c(e.toString().split(""), u, t, l).join("");
-                        },
-                        onBeforeWrite: function(e, t, i, a) {
-                            function n(e, t) {
-                                if (!1 !== a.__financeInput || t) {
-                                    var i = e.indexOf(a.radixPoint);
-                                    -1 !== i && e.splice(i, 1);
-                                }
-                                if ("" !== a.groupSeparator) for (;-1 !== (i = e.indexOf(a.groupSeparator)); ) e.splice(i, 1);
-                                return e;
-                            }
-                            var o, s;
-                            if (a.stripLeadingZeroes && (s = function(e, t) {
-                                var i = new RegExp("(^" + ("" !== t.negationSymbol.front ? (0, r.default)(t.negationSymbol.front) + "?" : "") + (0, 
-                                r.default)(t.prefix) + ")(.*)(" + (0, r.default)(t.suffix) + ("" != t.negationSymbol.back ? (0, 
-                                r.default)(t.negationSymbol.back) + "?" : "") + "$)").exec(e.slice().reverse().join("")), a = i ? i[2] : "", n = !1;
-                                return a && (a = a.split(t.radixPoint.charAt(0))[0], n = new RegExp("^[0" + t.groupSeparator + "]*").exec(a)), 
-                                !(!n || !(n[0].length > 1 || n[0].length > 0 && n[0].length < a.length)) && n;
-                            }(t, a))) for (var u = t.join("").lastIndexOf(s[0].split("").reverse().join("")) - (s[0] == s.input ? 0 : 1), f = s[0] == s.input ? 1 : 0, d = s[0].length - f; d > 0; d--) delete this.maskset.validPositions[u + d], 
-                            delete t[u + d];
-                            if (e) switch (e.type) {
-                              case "blur":
-                              case "checkval":
-                                if (null !== a.min) {
-                                    var p = a.onUnMask(t.slice().reverse().join(""), void 0, l.extend({}, a, {
-                                        unmaskAsNumber: !0
-                                    }));
-                                    if (null !== a.min && p < a.min) return {
-                                        refreshFromBuffer: !0,
-                                        buffer: c(a.min.toString().replace(".", a.radixPoint).split(""), a.digits, a).reverse()
-                                    };
-                                }
-                                if (t[t.length - 1] === a.negationSymbol.front) {
-                                    var h = new RegExp("(^" + ("" != a.negationSymbol.front ? (0, r.default)(a.negationSymbol.front) + "?" : "") + (0, 
-                                    r.default)(a.prefix) + ")(.*)(" + (0, r.default)(a.suffix) + ("" != a.negationSymbol.back ? (0, 
-                                    r.default)(a.negationSymbol.back) + "?" : "") + "$)").exec(n(t.slice(), !0).reverse().join(""));
-                                    0 == (h ? h[2] : "") && (o = {
-                                        refreshFromBuffer: !0,
-                                        buffer: [ 0 ]
-                                    });
-                                } else if ("" !== a.radixPoint) {
-                                    t.indexOf(a.radixPoint) === a.suffix.length && (o && o.buffer ? o.buffer.splice(0, 1 + a.suffix.length) : (t.splice(0, 1 + a.suffix.length), 
-                                    o = {
-                                        refreshFromBuffer: !0,
-                                        buffer: n(t)
-                                    }));
-                                }
-                                if (a.enforceDigitsOnBlur) {
-                                    var m = (o = o || {}) && o.buffer || t.slice().reverse();
-                                    o.refreshFromBuffer = !0, o.buffer = c(m, a.digits, a, !0).reverse();
-                                }
-                            }
-                            return o;
-                        },
-                        onKeyDown: function(e, t, i, a) {
-                            var r, o, s = l(this), u = String.fromCharCode(e.keyCode).toLowerCase();
-                            if ((o = a.shortcuts && a.shortcuts[u]) && o.length > 1) return this.inputmask.__valueSet.call(this, parseFloat(this.inputmask.unmaskedvalue()) * parseInt(o)), 
-                            s.trigger("setvalue"), !1;
-                            if (e.ctrlKey) switch (e.keyCode) {
-                              case n.default.UP:
-                                return this.inputmask.__valueSet.call(this, parseFloat(this.inputmask.unmaskedvalue()) + parseInt(a.step)), 
-                                s.trigger("setvalue"), !1;
-
-                              case n.default.DOWN:
-                                return this.inputmask.__valueSet.call(this, parseFloat(this.inputmask.unmaskedvalue()) - parseInt(a.step)), 
-                                s.trigger("setvalue"), !1;
-                            }
-                            if (!e.shiftKey && (e.keyCode === n.default.DELETE || e.keyCode === n.default.BACKSPACE || e.keyCode === n.default.BACKSPACE_SAFARI) && i.begin !== t.length) {
-                                if (t[e.keyCode === n.default.DELETE ? i.begin - 1 : i.end] === a.negationSymbol.front) return r = t.slice().reverse(), 
-                                "" !== a.negationSymbol.front && r.shift(), "" !== a.negationSymbol.back && r.pop(), 
-                                s.trigger("setvalue", [ r.join(""), i.begin ]), !1;
-                                if (!0 === a._radixDance) {
-                                    var f = t.indexOf(a.radixPoint);
-                                    if (a.digitsOptional) {
-                                        if (0 === f) return (r = t.slice().reverse()).pop(), s.trigger("setvalue", [ r.join(""), i.begin >= r.length ? r.length : i.begin ]), 
-                                        !1;
-                                    } else if (-1 !== f && (i.begin < f || i.end < f || e.keyCode === n.default.DELETE && i.begin === f)) return i.begin !== i.end || e.keyCode !== n.default.BACKSPACE && e.keyCode !== n.default.BACKSPACE_SAFARI || i.begin++, 
-                                    (r = t.slice().reverse()).splice(r.length - i.begin, i.begin - i.end + 1), r = c(r, a.digits, a).join(""), 
-                                    s.trigger("setvalue", [ r, i.begin >= r.length ? f + 1 : i.begin ]), !1;
-                                }
-                            }
-                        }
-                    },
-                    currency: {
-                        prefix: "",
-                        groupSeparator: ",",
-                        alias: "numeric",
-                        digits: 2,
-                        digitsOptional: !1
-                    },
-                    decimal: {
-                        alias: "numeric"
-                    },
-                    integer: {
-                        alias: "numeric",
-                        inputmode: "numeric",
-                        digits: 0
-                    },
-                    percentage: {
-                        alias: "numeric",
-                        min: 0,
-                        max: 100,
-                        suffix: " %",
-                        digits: 0,
-                        allowMinus: !1
-                    },
-                    indianns: {
-                        alias: "numeric",
-                        _mask: function(e) {
-                            return "(" + e.groupSeparator + "99){*|1}(" + e.groupSeparator + "999){1|1}";
-                        },
-                        groupSeparator: ",",
-                        radixPoint: ".",
-                        placeholder: "0",
-                        digits: 2,
-                        digitsOptional: !1
-                    }
-                });
-            },
-            9380: function(e, t, i) {
-                var a;
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = void 0;
-                var n = ((a = i(8741)) && a.__esModule ? a : {
-                    default: a
-                }).default ? window : {};
-                t.default = n;
-            },
-            7760: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.HandleNativePlaceholder = function(e, t) {
-                    var i = e ? e.inputmask : this;
-                    if (l.ie) {
-                        if (e.inputmask._valueGet() !== t && (e.placeholder !== t || "" === e.placeholder)) {
-                            var a = o.getBuffer.call(i).slice(), n = e.inputmask._valueGet();
-                            if (n !== t) {
-                                var r = o.getLastValidPosition.call(i);
-                                -1 === r && n === o.getBufferTemplate.call(i).join("") ? a = [] : -1 !== r && f.call(i, a), 
-                                p(e, a);
-                            }
-                        }
-                    } else e.placeholder !== t && (e.placeholder = t, "" === e.placeholder && e.removeAttribute("placeholder"));
-                }, t.applyInputValue = c, t.checkVal = d, t.clearOptionalTail = f, t.unmaskedvalue = function(e) {
-                    var t = e ? e.inputmask : this, i = t.opts, a = t.maskset;
-                    if (e) {
-                        if (void 0 === e.inputmask) return e.value;
-                        e.inputmask && e.inputmask.refreshValue && c(e, e.inputmask._valueGet(!0));
-                    }
-                    var n = [], r = a.validPositions;
-                    for (var s in r) r[s] && r[s].match && (1 != r[s].match.static || Array.isArray(a.metadata) && !0 !== r[s].generatedInput) && n.push(r[s].input);
-                    var l = 0 === n.length ? "" : (t.isRTL ? n.reverse() : n).join("");
-                    if ("function" == typeof i.onUnMask) {
-                        var u = (t.isRTL ? o.getBuffer.call(t).slice().reverse() : o.getBuffer.call(t)).join("");
-                        l = i.onUnMask.call(t, u, l, i);
-                    }
-                    return l;
-                }, t.writeBuffer = p;
-                var a, n = (a = i(5581)) && a.__esModule ? a : {
-                    default: a
-                }, r = i(4713), o = i(8711), s = i(7215), l = i(9845), u = i(6030);
-                function c(e, t) {
-                    var i = e ? e.inputmask : this, a = i.opts;
-                    e.inputmask.refreshValue = !1, "function" == typeof a.onBeforeMask && (t = a.onBeforeMask.call(i, t, a) || t), 
-                    d(e, !0, !1, t = t.toString().split("")), i.undoValue = i._valueGet(!0), (a.clearMaskOnLostFocus || a.clearIncomplete) && e.inputmask._valueGet() === o.getBufferTemplate.call(i).join("") && -1 === o.getLastValidPosition.call(i) && e.inputmask._valueSet("");
-                }
-                function f(e) {
-                    e.length = 0;
-                    for (var t, i = r.getMaskTemplate.call(this, !0, 0, !0, void 0, !0); void 0 !== (t = i.shift()); ) e.push(t);
-                    return e;
-                }
-                function d(e, t, i, a, n) {
-                    var l = e ? e.inputmask : this, c = l.maskset, f = l.opts, d = l.dependencyLib, h = a.slice(), m = "", v = -1, g = void 0, k = f.skipOptionalPartCharacter;
-                    f.skipOptionalPartCharacter = "", o.resetMaskSet.call(l), c.tests = {}, v = f.radixPoint ? o.determineNewCaretPosition.call(l, {
-                        begin: 0,
-                        end: 0
-                    }, !1, !1 === f.__financeInput ? "radixFocus" : void 0).begin : 0, c.p = v, l.caretPos = {
-                        begin: v
-                    };
-                    var y = [], b = l.caretPos;
-                    if (h.forEach((function(e, t) {
-                        if (void 0 !== e) {
-                            var a = new d.Event("_checkval");
-                            a.keyCode = e.toString().charCodeAt(0), m += e;
-                            var n = o.getLastValidPosition.call(l, void 0, !0);
-                            !function(e, t) {
-                                for (var i = r.getMaskTemplate.call(l, !0, 0).slice(e, o.seekNext.call(l, e, !1, !1)).join("").replace(/'/g, ""), a = i.indexOf(t); a > 0 && " " === i[a - 1]; ) a--;
-                                var n = 0 === a && !o.isMask.call(l, e) && (r.getTest.call(l, e).match.nativeDef === t.charAt(0) || !0 === r.getTest.call(l, e).match.static && r.getTest.call(l, e).match.nativeDef === "'" + t.charAt(0) || " " === r.getTest.call(l, e).match.nativeDef && (r.getTest.call(l, e + 1).match.nativeDef === t.charAt(0) || !0 === r.getTest.call(l, e + 1).match.static && r.getTest.call(l, e + 1).match.nativeDef === "'" + t.charAt(0)));
-                                if (!n && a > 0 && !o.isMask.call(l, e, !1, !0)) {
-                                    var s = o.seekNext.call(l, e);
-                                    l.caretPos.begin < s && (l.caretPos = {
-                                        begin: s
-                                    });
-                                }
-                                return n;
-                            }(v, m) ? (g = u.EventHandlers.keypressEvent.call(l, a, !0, !1, i, l.caretPos.begin)) && (v = l.caretPos.begin + 1, 
-                            m = "") : g = u.EventHandlers.keypressEvent.call(l, a, !0, !1, i, n + 1), g ? (void 0 !== g.pos && c.validPositions[g.pos] && !0 === c.validPositions[g.pos].match.static && void 0 === c.validPositions[g.pos].alternation && (y.push(g.pos), 
-                            l.isRTL || (g.forwardPosition = g.pos + 1)), p.call(l, void 0, o.getBuffer.call(l), g.forwardPosition, a, !1), 
-                            l.caretPos = {
-                                begin: g.forwardPosition,
-                                end: g.forwardPosition
-                            }, b = l.caretPos) : void 0 === c.validPositions[t] && h[t] === r.getPlaceholder.call(l, t) && o.isMask.call(l, t, !0) ? l.caretPos.begin++ : l.caretPos = b;
-                        }
-                    })), y.length > 0) {
-                        var x, P, E = o.seekNext.call(l, -1, void 0, !1);
-                        if (!s.isComplete.call(l, o.getBuffer.call(l)) && y.length <= E || s.isComplete.call(l, o.getBuffer.call(l)) && y.length > 0 && y.length !== E && 0 === y[0]) for (var S = E; void 0 !== (x = y.shift()); ) {
-                            var w = new d.Event("_checkval");
-                            if ((P = c.validPositions[x]).generatedInput = !0, w.keyCode = P.input.charCodeAt(0), 
-                            (g = u.EventHandlers.keypressEvent.call(l, w, !0, !1, i, S)) && void 0 !== g.pos && g.pos !== x && c.validPositions[g.pos] && !0 === c.validPositions[g.pos].match.static) y.push(g.pos); else if (!g) break;
-                            S++;
-                        }
-                    }
-                    t && p.call(l, e, o.getBuffer.call(l), g ? g.forwardPosition : l.caretPos.begin, n || new d.Event("checkval"), n && ("input" === n.type && l.undoValue !== o.getBuffer.call(l).join("") || "paste" === n.type)), 
-                    f.skipOptionalPartCharacter = k;
-                }
-                function p(e, t, i, a, r) {
-                    var l = e ? e.inputmask : this, u = l.opts, c = l.dependencyLib;
-                    if (a && "function" == typeof u.onBeforeWrite) {
-                        var f = u.onBeforeWrite.call(l, a, t, i, u);
-                        if (f) {
-                            if (f.refreshFromBuffer) {
-                                var d = f.refreshFromBuffer;
-                                s.refreshFromBuffer.call(l, !0 === d ? d : d.start, d.end, f.buffer || t), t = o.getBuffer.call(l, !0);
-                            }
-                            void 0 !== i && (i = void 0 !== f.caret ? f.caret : i);
-                        }
-                    }
-                    if (void 0 !== e && (e.inputmask._valueSet(t.join("")), void 0 === i || void 0 !== a && "blur" === a.type || o.caret.call(l, e, i, void 0, void 0, void 0 !== a && "keydown" === a.type && (a.keyCode === n.default.DELETE || a.keyCode === n.default.BACKSPACE)), 
-                    !0 === r)) {
-                        var p = c(e), h = e.inputmask._valueGet();
-                        e.inputmask.skipInputEvent = !0, p.trigger("input"), setTimeout((function() {
-                            h === o.getBufferTemplate.call(l).join("") ? p.trigger("cleared") : !0 === s.isComplete.call(l, t) && p.trigger("complete");
-                        }), 0);
-                    }
-                }
-            },
-            2394: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = void 0, i(7149), i(3194);
-                var a = i(157), n = v(i(3287)), r = v(i(9380)), o = i(2391), s = i(4713), l = i(8711), u = i(7215), c = i(7760), f = i(9716), d = v(i(7392)), p = v(i(3976)), h = v(i(8741));
-                function m(e) {
-                    return m = "function" == typeof Symbol && "symbol" == typeof Symbol.iterator ? function(e) {
-                        return typeof e;
-                    } : function(e) {
-                        return e && "function" == typeof Symbol && e.constructor === Symbol && e !== Symbol.prototype ? "symbol" : typeof e;
-                    }, m(e);
-                }
-                function v(e) {
-                    return e && e.__esModule ? e : {
-                        default: e
-                    };
-                }
-                var g = r.default.document, k = "_inputmask_opts";
-                function y(e, t, i) {
-                    if (h.default) {
-                        if (!(this instanceof y)) return new y(e, t, i);
-                        this.dependencyLib = n.default, this.el = void 0, this.events = {}, this.maskset = void 0, 
-                        !0 !== i && ("[object Object]" === Object.prototype.toString.call(e) ? t = e : (t = t || {}, 
-                        e && (t.alias = e)), this.opts = n.default.extend(!0, {}, this.defaults, t), this.noMasksCache = t && void 0 !== t.definitions, 
-                        this.userOptions = t || {}, b(this.opts.alias, t, this.opts)), this.refreshValue = !1, 
-                        this.undoValue = void 0, this.$el = void 0, this.skipKeyPressEvent = !1, this.skipInputEvent = !1, 
-                        this.validationEvent = !1, this.ignorable = !1, this.maxLength, this.mouseEnter = !1, 
-                        this.originalPlaceholder = void 0, this.isComposing = !1;
-                    }
-                }
-                function b(e, t, i) {
-                    var a = y.prototype.aliases[e];
-                    return a ? (a.alias && b(a.alias, void 0, i), n.default.extend(!0, i, a), n.default.extend(!0, i, t), 
-                    !0) : (null === i.mask && (i.mask = e), !1);
-                }
-                y.prototype = {
-                    dataAttribute: "data-inputmask",
-                    defaults: p.default,
-                    definitions: d.default,
-                    aliases: {},
-                    masksCache: {},
-                    get isRTL() {
-                        return this.opts.isRTL || this.opts.numericInput;
-                    },
-                    mask: function(e) {
-                        var t = this;
-                        return "string" == typeof e && (e = g.getElementById(e) || g.querySelectorAll(e)), 
-                        (e = e.nodeName ? [ e ] : Array.isArray(e) ? e : Array.from(e)).forEach((function(e, i) {
-                            var s = n.default.extend(!0, {}, t.opts);
-                            if (function(e, t, i, a) {
-                                function o(t, n) {
-                                    var o = "" === a ? t : a + "-" + t;
-                                    null !== (n = void 0 !== n ? n : e.getAttribute(o)) && ("string" == typeof n && (0 === t.indexOf("on") ? n = r.default[n] : "false" === n ? n = !1 : "true" === n && (n = !0)), 
-                                    i[t] = n);
-                                }
-                                if (!0 === t.importDataAttributes) {
-                                    var s, l, u, c, f = e.getAttribute(a);
-                                    if (f && "" !== f && (f = f.replace(/'/g, '"'), l = JSON.parse("{" + f + "}")), 
-                                    l) for (c in u = void 0, l) if ("alias" === c.toLowerCase()) {
-                                        u = l[c];
-                                        break;
-                                    }
-                                    for (s in o("alias", u), i.alias && b(i.alias, i, t), t) {
-                                        if (l) for (c in u = void 0, l) if (c.toLowerCase() === s.toLowerCase()) {
-                                            u = l[c];
-                                            break;
-                                        }
-                                        o(s, u);
-                                    }
-                                }
-                                n.default.extend(!0, t, i), ("rtl" === e.dir || t.rightAlign) && (e.style.textAlign = "right");
-                                ("rtl" === e.dir || t.numericInput) && (e.dir = "ltr", e.removeAttribute("dir"), 
-                                t.isRTL = !0);
-                                return Object.keys(i).length;
-                            }(e, s, n.default.extend(!0, {}, t.userOptions), t.dataAttribute)) {
-                                var l = (0, o.generateMaskSet)(s, t.noMasksCache);
-                                void 0 !== l && (void 0 !== e.inputmask && (e.inputmask.opts.autoUnmask = !0, e.inputmask.remove()), 
-                                e.inputmask = new y(void 0, void 0, !0), e.inputmask.opts = s, e.inputmask.noMasksCache = t.noMasksCache, 
-                                e.inputmask.userOptions = n.default.extend(!0, {}, t.userOptions), e.inputmask.el = e, 
-                                e.inputmask.$el = (0, n.default)(e), e.inputmask.maskset = l, n.default.data(e, k, t.userOptions), 
-                                a.mask.call(e.inputmask));
-                            }
-                        })), e && e[0] && e[0].inputmask || this;
-                    },
-                    option: function(e, t) {
-                        return "string" == typeof e ? this.opts[e] : "object" === m(e) ? (n.default.extend(this.userOptions, e), 
-                        this.el && !0 !== t && this.mask(this.el), this) : void 0;
-                    },
-                    unmaskedvalue: function(e) {
-                        if (this.maskset = this.maskset || (0, o.generateMaskSet)(this.opts, this.noMasksCache), 
-                        void 0 === this.el || void 0 !== e) {
-                            var t = ("function" == typeof this.opts.onBeforeMask && this.opts.onBeforeMask.call(this, e, this.opts) || e).split("");
-                            c.checkVal.call(this, void 0, !1, !1, t), "function" == typeof this.opts.onBeforeWrite && this.opts.onBeforeWrite.call(this, void 0, l.getBuffer.call(this), 0, this.opts);
-                        }
-                        return c.unmaskedvalue.call(this, this.el);
-                    },
-                    remove: function() {
-                        if (this.el) {
-                            n.default.data(this.el, k, null);
-                            var e = this.opts.autoUnmask ? (0, c.unmaskedvalue)(this.el) : this._valueGet(this.opts.autoUnmask);
-                            e !== l.getBufferTemplate.call(this).join("") ? this._valueSet(e, this.opts.autoUnmask) : this._valueSet(""), 
-                            f.EventRuler.off(this.el), Object.getOwnPropertyDescriptor && Object.getPrototypeOf ? Object.getOwnPropertyDescriptor(Object.getPrototypeOf(this.el), "value") && this.__valueGet && Object.defineProperty(this.el, "value", {
-                                get: this.__valueGet,
-                                set: this.__valueSet,
-                                configurable: !0
-                            }) : g.__lookupGetter__ && this.el.__lookupGetter__("value") && this.__valueGet && (this.el.__defineGetter__("value", this.__valueGet), 
-                            this.el.__defineSetter__("value", this.__valueSet)), this.el.inputmask = void 0;
-                        }
-                        return this.el;
-                    },
-                    getemptymask: function() {
-                        return this.maskset = this.maskset || (0, o.generateMaskSet)(this.opts, this.noMasksCache), 
-                        l.getBufferTemplate.call(this).join("");
-                    },
-                    hasMaskedValue: function() {
-                        return !this.opts.autoUnmask;
-                    },
-                    isComplete: function() {
-                        return this.maskset = this.maskset || (0, o.generateMaskSet)(this.opts, this.noMasksCache), 
-                        u.isComplete.call(this, l.getBuffer.call(this));
-                    },
-                    getmetadata: function() {
-                        if (this.maskset = this.maskset || (0, o.generateMaskSet)(this.opts, this.noMasksCache), 
-                        Array.isArray(this.maskset.metadata)) {
-                            var e = s.getMaskTemplate.call(this, !0, 0, !1).join("");
-                            return this.maskset.metadata.forEach((function(t) {
-                                return t.mask !== e || (e = t, !1);
-                            })), e;
-                        }
-                        return this.maskset.metadata;
-                    },
-                    isValid: function(e) {
-                        if (this.maskset = this.maskset || (0, o.generateMaskSet)(this.opts, this.noMasksCache), 
-                        e) {
-                            var t = ("function" == typeof this.opts.onBeforeMask && this.opts.onBeforeMask.call(this, e, this.opts) || e).split("");
-                            c.checkVal.call(this, void 0, !0, !1, t);
-                        } else e = this.isRTL ? l.getBuffer.call(this).slice().reverse().join("") : l.getBuffer.call(this).join("");
-                        for (var i = l.getBuffer.call(this), a = l.determineLastRequiredPosition.call(this), n = i.length - 1; n > a && !l.isMask.call(this, n); n--) ;
-                        return i.splice(a, n + 1 - a), u.isComplete.call(this, i) && e === (this.isRTL ? l.getBuffer.call(this).slice().reverse().join("") : l.getBuffer.call(this).join(""));
-                    },
-                    format: function(e, t) {
-                        this.maskset = this.maskset || (0, o.generateMaskSet)(this.opts, this.noMasksCache);
-                        var i = ("function" == typeof this.opts.onBeforeMask && this.opts.onBeforeMask.call(this, e, this.opts) || e).split("");
-                        c.checkVal.call(this, void 0, !0, !1, i);
-                        var a = this.isRTL ? l.getBuffer.call(this).slice().reverse().join("") : l.getBuffer.call(this).join("");
-                        return t ? {
-                            value: a,
-                            metadata: this.getmetadata()
-                        } : a;
-                    },
-                    setValue: function(e) {
-                        this.el && (0, n.default)(this.el).trigger("setvalue", [ e ]);
-                    },
-                    analyseMask: o.analyseMask
-                }, y.extendDefaults = function(e) {
-                    n.default.extend(!0, y.prototype.defaults, e);
-                }, y.extendDefinitions = function(e) {
-                    n.default.extend(!0, y.prototype.definitions, e);
-                }, y.extendAliases = function(e) {
-                    n.default.extend(!0, y.prototype.aliases, e);
-                }, y.format = function(e, t, i) {
-                    return y(t).format(e, i);
-                }, y.unmask = function(e, t) {
-                    return y(t).unmaskedvalue(e);
-                }, y.isValid = function(e, t) {
-                    return y(t).isValid(e);
-                }, y.remove = function(e) {
-                    "string" == typeof e && (e = g.getElementById(e) || g.querySelectorAll(e)), (e = e.nodeName ? [ e ] : e).forEach((function(e) {
-                        e.inputmask && e.inputmask.remove();
-                    }));
-                }, y.setValue = function(e, t) {
-                    "string" == typeof e && (e = g.getElementById(e) || g.querySelectorAll(e)), (e = e.nodeName ? [ e ] : e).forEach((function(e) {
-                        e.inputmask ? e.inputmask.setValue(t) : (0, n.default)(e).trigger("setvalue", [ t ]);
-                    }));
-                }, y.dependencyLib = n.default, r.default.Inputmask = y;
-                var x = y;
-                t.default = x;
-            },
-            5296: function(e, t, i) {
-                function a(e) {
-                    return a = "function" == typeof Symbol && "symbol" == typeof Symbol.iterator ? function(e) {
-                        return typeof e;
-                    } : function(e) {
-                        return e && "function" == typeof Symbol && e.constructor === Symbol && e !== Symbol.prototype ? "symbol" : typeof e;
-                    }, a(e);
-                }
-                var n = h(i(9380)), r = h(i(2394)), o = h(i(8741));
-                function s(e, t) {
-                    for (var i = 0; i < t.length; i++) {
-                        var a = t[i];
-                        a.enumerable = a.enumerable || !1, a.configurable = !0, "value" in a && (a.writable = !0), 
-                        Object.defineProperty(e, a.key, a);
-                    }
-                }
-                function l(e, t) {
-                    if (t && ("object" === a(t) || "function" == typeof t)) return t;
-                    if (void 0 !== t) throw new TypeError("Derived constructors may only return object or undefined");
-                    return function(e) {
-                        if (void 0 === e) throw new ReferenceError("this hasn't been initialised - super() hasn't been called");
-                        return e;
-                    }(e);
-                }
-                function u(e) {
-                    var t = "function" == typeof Map ? new Map : void 0;
-                    return u = function(e) {
-                        if (null === e || (i = e, -1 === Function.toString.call(i).indexOf("[native code]"))) return e;
-                        var i;
-                        if ("function" != typeof e) throw new TypeError("Super expression must either be null or a function");
-                        if (void 0 !== t) {
-                            if (t.has(e)) return t.get(e);
-                            t.set(e, a);
-                        }
-                        function a() {
-                            return c(e, arguments, p(this).constructor);
-                        }
-                        return a.prototype = Object.create(e.prototype, {
-                            constructor: {
-                                value: a,
-                                enumerable: !1,
-                                writable: !0,
-                                configurable: !0
-                            }
-                        }), d(a, e);
-                    }, u(e);
-                }
-                function c(e, t, i) {
-                    return c = f() ? Reflect.construct : function(e, t, i) {
-                        var a = [ null ];
-                        a.push.apply(a, t);
-                        var n = new (Function.bind.apply(e, a));
-                        return i && d(n, i.prototype), n;
-                    }, c.apply(null, arguments);
-                }
-                function f() {
-                    if ("undefined" == typeof Reflect || !Reflect.construct) return !1;
-                    if (Reflect.construct.sham) return !1;
-                    if ("function" == typeof Proxy) return !0;
-                    try {
-                        return Boolean.prototype.valueOf.call(Reflect.construct(Boolean, [], (function() {}))), 
-                        !0;
-                    } catch (e) {
-                        return !1;
-                    }
-                }
-                function d(e, t) {
-                    return d = Object.setPrototypeOf || function(e, t) {
-                        return e.__proto__ = t, e;
-                    }, d(e, t);
-                }
-                function p(e) {
-                    return p = Object.setPrototypeOf ? Object.getPrototypeOf : function(e) {
-                        return e.__proto__ || Object.getPrototypeOf(e);
-                    }, p(e);
-                }
-                function h(e) {
-                    return e && e.__esModule ? e : {
-                        default: e
-                    };
-                }
-                var m = n.default.document;
-                if (o.default && m && m.head && m.head.attachShadow && n.default.customElements && void 0 === n.default.customElements.get("input-mask")) {
-                    var v = function(e) {
-                        !function(e, t) {
-                            if ("function" != typeof t && null !== t) throw new TypeError("Super expression must either be null or a function");
-                            Object.defineProperty(e, "prototype", {
-                                value: Object.create(t && t.prototype, {
-                                    constructor: {
-                                        value: e,
-                                        writable: !0,
-                                        configurable: !0
-                                    }
-                                }),
-                                writable: !1
-                            }), t && d(e, t);
-                        }(c, e);
-                        var t, i, a, n, o, u = (t = c, i = f(), function() {
-                            var e, a = p(t);
-                            if (i) {
-                                var n = p(this).constructor;
-                                e = Reflect.construct(a, arguments, n);
-                            } else e = a.apply(this, arguments);
-                            return l(this, e);
-                        });
-                        function c() {
-                            var e;
-                            !function(e, t) {
-                                if (!(e instanceof t)) throw new TypeError("Cannot call a class as a function");
-                            }(this, c);
-                            var t = (e = u.call(this)).getAttributeNames(), i = e.attachShadow({
-                                mode: "closed"
-                            }), a = m.createElement("input");
-                            for (var n in a.type = "text", i.appendChild(a), t) Object.prototype.hasOwnProperty.call(t, n) && a.setAttribute(t[n], e.getAttribute(t[n]));
-                            var o = new r.default;
-                            return o.dataAttribute = "", o.mask(a), a.inputmask.shadowRoot = i, e;
-                        }
-                        return a = c, n && s(a.prototype, n), o && s(a, o), Object.defineProperty(a, "prototype", {
-                            writable: !1
-                        }), a;
-                    }(u(HTMLElement));
-                    n.default.customElements.define("input-mask", v);
-                }
-            },
-            443: function(e, t, i) {
-                var a = o(i(2047)), n = o(i(2394));
-                function r(e) {
-                    return r = "function" == typeof Symbol && "symbol" == typeof Symbol.iterator ? function(e) {
-                        return typeof e;
-                    } : function(e) {
-                        return e && "function" == typeof Symbol && e.constructor === Symbol && e !== Symbol.prototype ? "symbol" : typeof e;
-                    }, r(e);
-                }
-                function o(e) {
-                    return e && e.__esModule ? e : {
-                        default: e
-                    };
-                }
-                void 0 === a.default.fn.inputmask && (a.default.fn.inputmask = function(e, t) {
-                    var i, o = this[0];
-                    if (void 0 === t && (t = {}), "string" == typeof e) switch (e) {
-                      case "unmaskedvalue":
-                        return o && o.inputmask ? o.inputmask.unmaskedvalue() : (0, a.default)(o).val();
-
-                      case "remove":
-                        return this.each((function() {
-                            this.inputmask && this.inputmask.remove();
-                        }));
-
-                      case "getemptymask":
-                        return o && o.inputmask ? o.inputmask.getemptymask() : "";
-
-                      case "hasMaskedValue":
-                        return !(!o || !o.inputmask) && o.inputmask.hasMaskedValue();
-
-                      case "isComplete":
-                        return !o || !o.inputmask || o.inputmask.isComplete();
-
-                      case "getmetadata":
-                        return o && o.inputmask ? o.inputmask.getmetadata() : void 0;
-
-                      case "setvalue":
-                        n.default.setValue(o, t);
-                        break;
-
-                      case "option":
-                        if ("string" != typeof t) return this.each((function() {
-                            if (void 0 !== this.inputmask) return this.inputmask.option(t);
-                        }));
-                        if (o && void 0 !== o.inputmask) return o.inputmask.option(t);
-                        break;
-
-                      default:
-                        return t.alias = e, i = new n.default(t), this.each((function() {
-                            i.mask(this);
-                        }));
-                    } else {
-                        if (Array.isArray(e)) return t.alias = e, i = new n.default(t), this.each((function() {
-                            i.mask(this);
-                        }));
-                        if ("object" == r(e)) return i = new n.default(e), void 0 === e.mask && void 0 === e.alias ? this.each((function() {
-                            if (void 0 !== this.inputmask) return this.inputmask.option(e);
-                            i.mask(this);
-                        })) : this.each((function() {
-                            i.mask(this);
-                        }));
-                        if (void 0 === e) return this.each((function() {
-                            (i = new n.default(t)).mask(this);
-                        }));
-                    }
-                });
-            },
-            2391: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.analyseMask = function(e, t, i) {
-                    var a, o, s, l, u, c, f = /(?:[?*+]|\{[0-9+*]+(?:,[0-9+*]*)?(?:\|[0-9+*]*)?\})|[^.?*+^${[]()|\\]+|./g, d = /\[\^?]?(?:[^\\\]]+|\\[\S\s]?)*]?|\\(?:0(?:[0-3][0-7]{0,2}|[4-7][0-7]?)?|[1-9][0-9]*|x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|c[A-Za-z]|[\S\s]?)|\((?:\?[:=!]?)?|(?:[?*+]|\{[0-9]+(?:,[0-9]*)?\})\??|[^.?*+^${[()|\\]+|./g, p = !1, h = new n.default, m = [], v = [], g = !1;
-                    function k(e, a, n) {
-                        n = void 0 !== n ? n : e.matches.length;
-                        var o = e.matches[n - 1];
-                        if (t) 0 === a.indexOf("[") || p && /\\d|\\s|\\w/i.test(a) || "." === a ? e.matches.splice(n++, 0, {
-                            fn: new RegExp(a, i.casing ? "i" : ""),
-                            static: !1,
-                            optionality: !1,
-                            newBlockMarker: void 0 === o ? "master" : o.def !== a,
-                            casing: null,
-                            def: a,
-                            placeholder: void 0,
-                            nativeDef: a
-                        }) : (p && (a = a[a.length - 1]), a.split("").forEach((function(t, a) {
-                            o = e.matches[n - 1], e.matches.splice(n++, 0, {
-                                fn: /[a-z]/i.test(i.staticDefinitionSymbol || t) ? new RegExp("[" + (i.staticDefinitionSymbol || t) + "]", i.casing ? "i" : "") : null,
-                                static: !0,
-                                optionality: !1,
-                                newBlockMarker: void 0 === o ? "master" : o.def !== t && !0 !== o.static,
-                                casing: null,
-                                def: i.staticDefinitionSymbol || t,
-                                placeholder: void 0 !== i.staticDefinitionSymbol ? t : void 0,
-                                nativeDef: (p ? "'" : "") + t
-                            });
-                        }))), p = !1; else {
-                            var s = i.definitions && i.definitions[a] || i.usePrototypeDefinitions && r.default.prototype.definitions[a];
-                            s && !p ? e.matches.splice(n++, 0, {
-                                fn: s.validator ? "string" == typeof s.validator ? new RegExp(s.validator, i.casing ? "i" : "") : new function() {
-                                    this.test = s.validator;
-                                } : new RegExp("."),
-                                static: s.static || !1,
-                                optionality: s.optional || !1,
-                                newBlockMarker: void 0 === o || s.optional ? "master" : o.def !== (s.definitionSymbol || a),
-                                casing: s.casing,
-                                def: s.definitionSymbol || a,
-                                placeholder: s.placeholder,
-                                nativeDef: a,
-                                generated: s.generated
-                            }) : (e.matches.splice(n++, 0, {
-                                fn: /[a-z]/i.test(i.staticDefinitionSymbol || a) ? new RegExp("[" + (i.staticDefinitionSymbol || a) + "]", i.casing ? "i" : "") : null,
-                                static: !0,
-                                optionality: !1,
-                                newBlockMarker: void 0 === o ? "master" : o.def !== a && !0 !== o.static,
-                                casing: null,
-                                def: i.staticDefinitionSymbol || a,
-                                placeholder: void 0 !== i.staticDefinitionSymbol ? a : void 0,
-                                nativeDef: (p ? "'" : "") + a
-                            }), p = !1);
-                        }
-                    }
-                    function y() {
-                        if (m.length > 0) {
-                            if (k(l = m[m.length - 1], o), l.isAlternator) {
-                                u = m.pop();
-                                for (var e = 0; e < u.matches.length; e++) u.matches[e].isGroup && (u.matches[e].isGroup = !1);
-                                m.length > 0 ? (l = m[m.length - 1]).matches.push(u) : h.matches.push(u);
-                            }
-                        } else k(h, o);
-                    }
-                    function b(e) {
-                        var t = new n.default(!0);
-                        return t.openGroup = !1, t.matches = e, t;
-                    }
-                    function x() {
-                        if ((s = m.pop()).openGroup = !1, void 0 !== s) if (m.length > 0) {
-                            if ((l = m[m.length - 1]).matches.push(s), l.isAlternator) {
-                                for (var e = (u = m.pop()).matches[0].matches ? u.matches[0].matches.length : 1, t = 0; t < u.matches.length; t++) u.matches[t].isGroup = !1, 
-                                u.matches[t].alternatorGroup = !1, null === i.keepStatic && e < (u.matches[t].matches ? u.matches[t].matches.length : 1) && (i.keepStatic = !0), 
-                                e = u.matches[t].matches ? u.matches[t].matches.length : 1;
-                                m.length > 0 ? (l = m[m.length - 1]).matches.push(u) : h.matches.push(u);
-                            }
-                        } else h.matches.push(s); else y();
-                    }
-                    function P(e) {
-                        var t = e.pop();
-                        return t.isQuantifier && (t = b([ e.pop(), t ])), t;
-                    }
-                    t && (i.optionalmarker[0] = void 0, i.optionalmarker[1] = void 0);
-                    for (;a = t ? d.exec(e) : f.exec(e); ) {
-                        if (o = a[0], t) {
-                            switch (o.charAt(0)) {
-                              case "?":
-                                o = "{0,1}";
-                                break;
-
-                              case "+":
-                              case "*":
-                                o = "{" + o + "}";
-                                break;
-
-                              case "|":
-                                if (0 === m.length) {
-                                    var E = b(h.matches);
-                                    E.openGroup = !0, m.push(E), h.matches = [], g = !0;
-                                }
-                            }
-                            if ("\\d" === o) o = "[0-9]";
-                        }
-                        if (p) y(); else switch (o.charAt(0)) {
-                          case "$":
-                          case "^":
-                            t || y();
-                            break;
-
-                          case i.escapeChar:
-                            p = !0, t && y();
-                            break;
-
-                          case i.optionalmarker[1]:
-                          case i.groupmarker[1]:
-                            x();
-                            break;
-
-                          case i.optionalmarker[0]:
-                            m.push(new n.default(!1, !0));
-                            break;
-
-                          case i.groupmarker[0]:
-                            m.push(new n.default(!0));
-                            break;
-
-                          case i.quantifiermarker[0]:
-                            var S = new n.default(!1, !1, !0), w = (o = o.replace(/[{}?]/g, "")).split("|"), _ = w[0].split(","), M = isNaN(_[0]) ? _[0] : parseInt(_[0]), O = 1 === _.length ? M : isNaN(_[1]) ? _[1] : parseInt(_[1]), T = isNaN(w[1]) ? w[1] : parseInt(w[1]);
-                            "*" !== M && "+" !== M || (M = "*" === O ? 0 : 1), S.quantifier = {
-                                min: M,
-                                max: O,
-                                jit: T
-                            };
-                            var A = m.length > 0 ? m[m.length - 1].matches : h.matches;
-                            if ((a = A.pop()).isAlternator) {
-                                A.push(a), A = a.matches;
-                                var C = new n.default(!0), D = A.pop();
-                                A.push(C), A = C.matches, a = D;
-                            }
-                            a.isGroup || (a = b([ a ])), A.push(a), A.push(S);
-                            break;
-
-                          case i.alternatormarker:
-                            if (m.length > 0) {
-                                var j = (l = m[m.length - 1]).matches[l.matches.length - 1];
-                                c = l.openGroup && (void 0 === j.matches || !1 === j.isGroup && !1 === j.isAlternator) ? m.pop() : P(l.matches);
-                            } else c = P(h.matches);
-                            if (c.isAlternator) m.push(c); else if (c.alternatorGroup ? (u = m.pop(), c.alternatorGroup = !1) : u = new n.default(!1, !1, !1, !0), 
-                            u.matches.push(c), m.push(u), c.openGroup) {
-                                c.openGroup = !1;
-                                var B = new n.default(!0);
-                                B.alternatorGroup = !0, m.push(B);
-                            }
-                            break;
-
-                          default:
-                            y();
-                        }
-                    }
-                    g && x();
-                    for (;m.length > 0; ) s = m.pop(), h.matches.push(s);
-                    h.matches.length > 0 && (!function e(a) {
-                        a && a.matches && a.matches.forEach((function(n, r) {
-                            var o = a.matches[r + 1];
-                            (void 0 === o || void 0 === o.matches || !1 === o.isQuantifier) && n && n.isGroup && (n.isGroup = !1, 
-                            t || (k(n, i.groupmarker[0], 0), !0 !== n.openGroup && k(n, i.groupmarker[1]))), 
-                            e(n);
-                        }));
-                    }(h), v.push(h));
-                    (i.numericInput || i.isRTL) && function e(t) {
-                        for (var a in t.matches = t.matches.reverse(), t.matches) if (Object.prototype.hasOwnProperty.call(t.matches, a)) {
-                            var n = parseInt(a);
-                            if (t.matches[a].isQuantifier && t.matches[n + 1] && t.matches[n + 1].isGroup) {
-                                var r = t.matches[a];
-                                t.matches.splice(a, 1), t.matches.splice(n + 1, 0, r);
-                            }
-                            void 0 !== t.matches[a].matches ? t.matches[a] = e(t.matches[a]) : t.matches[a] = ((o = t.matches[a]) === i.optionalmarker[0] ? o = i.optionalmarker[1] : o === i.optionalmarker[1] ? o = i.optionalmarker[0] : o === i.groupmarker[0] ? o = i.groupmarker[1] : o === i.groupmarker[1] && (o = i.groupmarker[0]), 
-                            o);
-                        }
-                        var o;
-                        return t;
-                    }(v[0]);
-                    return v;
-                }, t.generateMaskSet = function(e, t) {
-                    var i;
-                    function n(e, i, n) {
-                        var o, s, l = !1;
-                        if (null !== e && "" !== e || ((l = null !== n.regex) ? e = (e = n.regex).replace(/^(\^)(.*)(\$)$/, "$2") : (l = !0, 
-                        e = ".*")), 1 === e.length && !1 === n.greedy && 0 !== n.repeat && (n.placeholder = ""), 
-                        n.repeat > 0 || "*" === n.repeat || "+" === n.repeat) {
-                            var u = "*" === n.repeat ? 0 : "+" === n.repeat ? 1 : n.repeat;
-                            e = n.groupmarker[0] + e + n.groupmarker[1] + n.quantifiermarker[0] + u + "," + n.repeat + n.quantifiermarker[1];
-                        }
-                        return s = l ? "regex_" + n.regex : n.numericInput ? e.split("").reverse().join("") : e, 
-                        null !== n.keepStatic && (s = "ks_" + n.keepStatic + s), void 0 === r.default.prototype.masksCache[s] || !0 === t ? (o = {
-                            mask: e,
-                            maskToken: r.default.prototype.analyseMask(e, l, n),
-                            validPositions: {},
-                            _buffer: void 0,
-                            buffer: void 0,
-                            tests: {},
-                            excludes: {},
-                            metadata: i,
-                            maskLength: void 0,
-                            jitOffset: {}
-                        }, !0 !== t && (r.default.prototype.masksCache[s] = o, o = a.default.extend(!0, {}, r.default.prototype.masksCache[s]))) : o = a.default.extend(!0, {}, r.default.prototype.masksCache[s]), 
-                        o;
-                    }
-                    "function" == typeof e.mask && (e.mask = e.mask(e));
-                    if (Array.isArray(e.mask)) {
-                        if (e.mask.length > 1) {
-                            null === e.keepStatic && (e.keepStatic = !0);
-                            var o = e.groupmarker[0];
-                            return (e.isRTL ? e.mask.reverse() : e.mask).forEach((function(t) {
-                                o.length > 1 && (o += e.alternatormarker), void 0 !== t.mask && "function" != typeof t.mask ? o += t.mask : o += t;
-                            })), n(o += e.groupmarker[1], e.mask, e);
-                        }
-                        e.mask = e.mask.pop();
-                    }
-                    i = e.mask && void 0 !== e.mask.mask && "function" != typeof e.mask.mask ? n(e.mask.mask, e.mask, e) : n(e.mask, e.mask, e);
-                    null === e.keepStatic && (e.keepStatic = !1);
-                    return i;
-                };
-                var a = o(i(3287)), n = o(i(9695)), r = o(i(2394));
-                function o(e) {
-                    return e && e.__esModule ? e : {
-                        default: e
-                    };
-                }
-            },
-            157: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.mask = function() {
-                    var e = this, t = this.opts, i = this.el, a = this.dependencyLib;
-                    s.EventRuler.off(i);
-                    var f = function(t, i) {
-                        "textarea" !== t.tagName.toLowerCase() && i.ignorables.push(n.default.ENTER);
-                        var l = t.getAttribute("type"), u = "input" === t.tagName.toLowerCase() && i.supportsInputType.includes(l) || t.isContentEditable || "textarea" === t.tagName.toLowerCase();
-                        if (!u) if ("input" === t.tagName.toLowerCase()) {
-                            var c = document.createElement("input");
-                            c.setAttribute("type", l), u = "text" === c.type, c = null;
-                        } else u = "partial";
-                        return !1 !== u ? function(t) {
-                            var n, l;
-                            function u() {
-                                return this.inputmask ? this.inputmask.opts.autoUnmask ? this.inputmask.unmaskedvalue() : -1 !== r.getLastValidPosition.call(e) || !0 !== i.nullable ? (this.inputmask.shadowRoot || this.ownerDocument).activeElement === this && i.clearMaskOnLostFocus ? (e.isRTL ? o.clearOptionalTail.call(e, r.getBuffer.call(e).slice()).reverse() : o.clearOptionalTail.call(e, r.getBuffer.call(e).slice())).join("") : n.call(this) : "" : n.call(this);
-                            }
-                            function c(e) {
-                                l.call(this, e), this.inputmask && (0, o.applyInputValue)(this, e);
-                            }
-                            if (!t.inputmask.__valueGet) {
-                                if (!0 !== i.noValuePatching) {
-                                    if (Object.getOwnPropertyDescriptor) {
-                                        var f = Object.getPrototypeOf ? Object.getOwnPropertyDescriptor(Object.getPrototypeOf(t), "value") : void 0;
-                                        f && f.get && f.set ? (n = f.get, l = f.set, Object.defineProperty(t, "value", {
-                                            get: u,
-                                            set: c,
-                                            configurable: !0
-                                        })) : "input" !== t.tagName.toLowerCase() && (n = function() {
-                                            return this.textContent;
-                                        }, l = function(e) {
-                                            this.textContent = e;
-                                        }, Object.defineProperty(t, "value", {
-                                            get: u,
-                                            set: c,
-                                            configurable: !0
-                                        }));
-                                    } else document.__lookupGetter__ && t.__lookupGetter__("value") && (n = t.__lookupGetter__("value"), 
-                                    l = t.__lookupSetter__("value"), t.__defineGetter__("value", u), t.__defineSetter__("value", c));
-                                    t.inputmask.__valueGet = n, t.inputmask.__valueSet = l;
-                                }
-                                t.inputmask._valueGet = function(t) {
-                                    return e.isRTL && !0 !== t ? n.call(this.el).split("").reverse().join("") : n.call(this.el);
-                                }, t.inputmask._valueSet = function(t, i) {
-                                    l.call(this.el, null == t ? "" : !0 !== i && e.isRTL ? t.split("").reverse().join("") : t);
-                                }, void 0 === n && (n = function() {
-                                    return this.value;
-                                }, l = function(e) {
-                                    this.value = e;
-                                }, function(t) {
-                                    if (a.valHooks && (void 0 === a.valHooks[t] || !0 !== a.valHooks[t].inputmaskpatch)) {
-                                        var n = a.valHooks[t] && a.valHooks[t].get ? a.valHooks[t].get : function(e) {
-                                            return e.value;
-                                        }, s = a.valHooks[t] && a.valHooks[t].set ? a.valHooks[t].set : function(e, t) {
-                                            return e.value = t, e;
-                                        };
-                                        a.valHooks[t] = {
-                                            get: function(t) {
-                                                if (t.inputmask) {
-                                                    if (t.inputmask.opts.autoUnmask) return t.inputmask.unmaskedvalue();
-                                                    var a = n(t);
-                                                    return -1 !== r.getLastValidPosition.call(e, void 0, void 0, t.inputmask.maskset.validPositions) || !0 !== i.nullable ? a : "";
-                                                }
-                                                return n(t);
-                                            },
-                                            set: function(e, t) {
-                                                var i = s(e, t);
-                                                return e.inputmask && (0, o.applyInputValue)(e, t), i;
-                                            },
-                                            inputmaskpatch: !0
-                                        };
-                                    }
-                                }(t.type), function(t) {
-                                    s.EventRuler.on(t, "mouseenter", (function() {
-                                        var t = this.inputmask._valueGet(!0);
-                                        t !== (e.isRTL ? r.getBuffer.call(e).reverse() : r.getBuffer.call(e)).join("") && (0, 
-                                        o.applyInputValue)(this, t);
-                                    }));
-                                }(t));
-                            }
-                        }(t) : t.inputmask = void 0, u;
-                    }(i, t);
-                    if (!1 !== f) {
-                        e.originalPlaceholder = i.placeholder, e.maxLength = void 0 !== i ? i.maxLength : void 0, 
-                        -1 === e.maxLength && (e.maxLength = void 0), "inputMode" in i && null === i.getAttribute("inputmode") && (i.inputMode = t.inputmode, 
-                        i.setAttribute("inputmode", t.inputmode)), !0 === f && (t.showMaskOnFocus = t.showMaskOnFocus && -1 === [ "cc-number", "cc-exp" ].indexOf(i.autocomplete), 
-                        l.iphone && (t.insertModeVisual = !1), s.EventRuler.on(i, "submit", c.EventHandlers.submitEvent), 
-                        s.EventRuler.on(i, "reset", c.EventHandlers.resetEvent), s.EventRuler.on(i, "blur", c.EventHandlers.blurEvent), 
-                        s.EventRuler.on(i, "focus", c.EventHandlers.focusEvent), s.EventRuler.on(i, "invalid", c.EventHandlers.invalidEvent), 
-                        s.EventRuler.on(i, "click", c.EventHandlers.clickEvent), s.EventRuler.on(i, "mouseleave", c.EventHandlers.mouseleaveEvent), 
-                        s.EventRuler.on(i, "mouseenter", c.EventHandlers.mouseenterEvent), s.EventRuler.on(i, "paste", c.EventHandlers.pasteEvent), 
-                        s.EventRuler.on(i, "cut", c.EventHandlers.cutEvent), s.EventRuler.on(i, "complete", t.oncomplete), 
-                        s.EventRuler.on(i, "incomplete", t.onincomplete), s.EventRuler.on(i, "cleared", t.oncleared), 
-                        !0 !== t.inputEventOnly && (s.EventRuler.on(i, "keydown", c.EventHandlers.keydownEvent), 
-                        s.EventRuler.on(i, "keypress", c.EventHandlers.keypressEvent), s.EventRuler.on(i, "keyup", c.EventHandlers.keyupEvent)), 
-                        (l.mobile || t.inputEventOnly) && i.removeAttribute("maxLength"), s.EventRuler.on(i, "input", c.EventHandlers.inputFallBackEvent), 
-                        s.EventRuler.on(i, "compositionend", c.EventHandlers.compositionendEvent)), s.EventRuler.on(i, "setvalue", c.EventHandlers.setValueEvent), 
-                        r.getBufferTemplate.call(e).join(""), e.undoValue = e._valueGet(!0);
-                        var d = (i.inputmask.shadowRoot || i.ownerDocument).activeElement;
-                        if ("" !== i.inputmask._valueGet(!0) || !1 === t.clearMaskOnLostFocus || d === i) {
-                            (0, o.applyInputValue)(i, i.inputmask._valueGet(!0), t);
-                            var p = r.getBuffer.call(e).slice();
-                            !1 === u.isComplete.call(e, p) && t.clearIncomplete && r.resetMaskSet.call(e), t.clearMaskOnLostFocus && d !== i && (-1 === r.getLastValidPosition.call(e) ? p = [] : o.clearOptionalTail.call(e, p)), 
-                            (!1 === t.clearMaskOnLostFocus || t.showMaskOnFocus && d === i || "" !== i.inputmask._valueGet(!0)) && (0, 
-                            o.writeBuffer)(i, p), d === i && r.caret.call(e, i, r.seekNext.call(e, r.getLastValidPosition.call(e)));
-                        }
-                    }
-                };
-                var a, n = (a = i(5581)) && a.__esModule ? a : {
-                    default: a
-                }, r = i(8711), o = i(7760), s = i(9716), l = i(9845), u = i(7215), c = i(6030);
-            },
-            9695: function(e, t) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.default = function(e, t, i, a) {
-                    this.matches = [], this.openGroup = e || !1, this.alternatorGroup = !1, this.isGroup = e || !1, 
-                    this.isOptional = t || !1, this.isQuantifier = i || !1, this.isAlternator = a || !1, 
-                    this.quantifier = {
-                        min: 1,
-                        max: 1
-                    };
-                };
-            },
-            3194: function() {
-                Array.prototype.includes || Object.defineProperty(Array.prototype, "includes", {
-                    value: function(e, t) {
-                        if (null == this) throw new TypeError('"this" is null or not defined');
-                        var i = Object(this), a = i.length >>> 0;
-                        if (0 === a) return !1;
-                        for (var n = 0 | t, r = Math.max(n >= 0 ? n : a - Math.abs(n), 0); r < a; ) {
-                            if (i[r] === e) return !0;
-                            r++;
-                        }
-                        return !1;
-                    }
-                });
-            },
-            7149: function() {
-                function e(t) {
-                    return e = "function" == typeof Symbol && "symbol" == typeof Symbol.iterator ? function(e) {
-                        return typeof e;
-                    } : function(e) {
-                        return e && "function" == typeof Symbol && e.constructor === Symbol && e !== Symbol.prototype ? "symbol" : typeof e;
-                    }, e(t);
-                }
-                "function" != typeof Object.getPrototypeOf && (Object.getPrototypeOf = "object" === e("test".__proto__) ? function(e) {
-                    return e.__proto__;
-                } : function(e) {
-                    return e.constructor.prototype;
-                });
-            },
-            8711: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.caret = function(e, t, i, a, n) {
-                    var r, o = this, s = this.opts;
-                    if (void 0 === t) return "selectionStart" in e && "selectionEnd" in e ? (t = e.selectionStart, 
-                    i = e.selectionEnd) : window.getSelection ? (r = window.getSelection().getRangeAt(0)).commonAncestorContainer.parentNode !== e && r.commonAncestorContainer !== e || (t = r.startOffset, 
-                    i = r.endOffset) : document.selection && document.selection.createRange && (r = document.selection.createRange(), 
-                    t = 0 - r.duplicate().moveStart("character", -e.inputmask._valueGet().length), i = t + r.text.length), 
-                    {
-                        begin: a ? t : u.call(o, t),
-                        end: a ? i : u.call(o, i)
-                    };
-                    if (Array.isArray(t) && (i = o.isRTL ? t[0] : t[1], t = o.isRTL ? t[1] : t[0]), 
-                    void 0 !== t.begin && (i = o.isRTL ? t.begin : t.end, t = o.isRTL ? t.end : t.begin), 
-                    "number" == typeof t) {
-                        t = a ? t : u.call(o, t), i = "number" == typeof (i = a ? i : u.call(o, i)) ? i : t;
-                        var l = parseInt(((e.ownerDocument.defaultView || window).getComputedStyle ? (e.ownerDocument.defaultView || window).getComputedStyle(e, null) : e.currentStyle).fontSize) * i;
-                        if (e.scrollLeft = l > e.scrollWidth ? l : 0, e.inputmask.caretPos = {
-                            begin: t,
-                            end: i
-                        }, s.insertModeVisual && !1 === s.insertMode && t === i && (n || i++), e === (e.inputmask.shadowRoot || e.ownerDocument).activeElement) if ("setSelectionRange" in e) e.setSelectionRange(t, i); else if (window.getSelection) {
-                            if (r = document.createRange(), void 0 === e.firstChild || null === e.firstChild) {
-                                var c = document.createTextNode("");
-                                e.appendChild(c);
-                            }
-                            r.setStart(e.firstChild, t < e.inputmask._valueGet().length ? t : e.inputmask._valueGet().length), 
-                            r.setEnd(e.firstChild, i < e.inputmask._valueGet().length ? i : e.inputmask._valueGet().length), 
-                            r.collapse(!0);
-                            var f = window.getSelection();
-                            f.removeAllRanges(), f.addRange(r);
-                        } else e.createTextRange && ((r = e.createTextRange()).collapse(!0), r.moveEnd("character", i), 
-                        r.moveStart("character", t), r.select());
-                    }
-                }, t.determineLastRequiredPosition = function(e) {
-                    var t, i, r = this, s = this.maskset, l = this.dependencyLib, u = a.getMaskTemplate.call(r, !0, o.call(r), !0, !0), c = u.length, f = o.call(r), d = {}, p = s.validPositions[f], h = void 0 !== p ? p.locator.slice() : void 0;
-                    for (t = f + 1; t < u.length; t++) i = a.getTestTemplate.call(r, t, h, t - 1), h = i.locator.slice(), 
-                    d[t] = l.extend(!0, {}, i);
-                    var m = p && void 0 !== p.alternation ? p.locator[p.alternation] : void 0;
-                    for (t = c - 1; t > f && (((i = d[t]).match.optionality || i.match.optionalQuantifier && i.match.newBlockMarker || m && (m !== d[t].locator[p.alternation] && 1 != i.match.static || !0 === i.match.static && i.locator[p.alternation] && n.checkAlternationMatch.call(r, i.locator[p.alternation].toString().split(","), m.toString().split(",")) && "" !== a.getTests.call(r, t)[0].def)) && u[t] === a.getPlaceholder.call(r, t, i.match)); t--) c--;
-                    return e ? {
-                        l: c,
-                        def: d[c] ? d[c].match : void 0
-                    } : c;
-                }, t.determineNewCaretPosition = function(e, t, i) {
-                    var n = this, u = this.maskset, c = this.opts;
-                    t && (n.isRTL ? e.end = e.begin : e.begin = e.end);
-                    if (e.begin === e.end) {
-                        switch (i = i || c.positionCaretOnClick) {
-                          case "none":
-                            break;
-
-                          case "select":
-                            e = {
-                                begin: 0,
-                                end: r.call(n).length
-                            };
-                            break;
-
-                          case "ignore":
-                            e.end = e.begin = l.call(n, o.call(n));
-                            break;
-
-                          case "radixFocus":
-                            if (function(e) {
-                                if ("" !== c.radixPoint && 0 !== c.digits) {
-                                    var t = u.validPositions;
-                                    if (void 0 === t[e] || t[e].input === a.getPlaceholder.call(n, e)) {
-                                        if (e < l.call(n, -1)) return !0;
-                                        var i = r.call(n).indexOf(c.radixPoint);
-                                        if (-1 !== i) {
-                                            for (var o in t) if (t[o] && i < o && t[o].input !== a.getPlaceholder.call(n, o)) return !1;
-                                            return !0;
-                                        }
-                                    }
-                                }
-                                return !1;
-                            }(e.begin)) {
-                                var f = r.call(n).join("").indexOf(c.radixPoint);
-                                e.end = e.begin = c.numericInput ? l.call(n, f) : f;
-                                break;
-                            }
-
-                          default:
-                            var d = e.begin, p = o.call(n, d, !0), h = l.call(n, -1 !== p || s.call(n, 0) ? p : -1);
-                            if (d <= h) e.end = e.begin = s.call(n, d, !1, !0) ? d : l.call(n, d); else {
-                                var m = u.validPositions[p], v = a.getTestTemplate.call(n, h, m ? m.match.locator : void 0, m), g = a.getPlaceholder.call(n, h, v.match);
-                                if ("" !== g && r.call(n)[h] !== g && !0 !== v.match.optionalQuantifier && !0 !== v.match.newBlockMarker || !s.call(n, h, c.keepStatic, !0) && v.match.def === g) {
-                                    var k = l.call(n, h);
-                                    (d >= k || d === h) && (h = k);
-                                }
-                                e.end = e.begin = h;
-                            }
-                        }
-                        return e;
-                    }
-                }, t.getBuffer = r, t.getBufferTemplate = function() {
-                    var e = this.maskset;
-                    void 0 === e._buffer && (e._buffer = a.getMaskTemplate.call(this, !1, 1), void 0 === e.buffer && (e.buffer = e._buffer.slice()));
-                    return e._buffer;
-                }, t.getLastValidPosition = o, t.isMask = s, t.resetMaskSet = function(e) {
-                    var t = this.maskset;
-                    t.buffer = void 0, !0 !== e && (t.validPositions = {}, t.p = 0);
-                }, t.seekNext = l, t.seekPrevious = function(e, t) {
-                    var i = this, n = e - 1;
-                    if (e <= 0) return 0;
-                    for (;n > 0 && (!0 === t && (!0 !== a.getTest.call(i, n).match.newBlockMarker || !s.call(i, n, void 0, !0)) || !0 !== t && !s.call(i, n, void 0, !0)); ) n--;
-                    return n;
-                }, t.translatePosition = u;
-                var a = i(4713), n = i(7215);
-                function r(e) {
-                    var t = this.maskset;
-                    return void 0 !== t.buffer && !0 !== e || (t.buffer = a.getMaskTemplate.call(this, !0, o.call(this), !0), 
-                    void 0 === t._buffer && (t._buffer = t.buffer.slice())), t.buffer;
-                }
-                function o(e, t, i) {
-                    var a = this.maskset, n = -1, r = -1, o = i || a.validPositions;
-                    for (var s in void 0 === e && (e = -1), o) {
-                        var l = parseInt(s);
-                        o[l] && (t || !0 !== o[l].generatedInput) && (l <= e && (n = l), l >= e && (r = l));
-                    }
-                    return -1 === n || n == e ? r : -1 == r || e - n < r - e ? n : r;
-                }
-                function s(e, t, i) {
-                    var n = this, r = this.maskset, o = a.getTestTemplate.call(n, e).match;
-                    if ("" === o.def && (o = a.getTest.call(n, e).match), !0 !== o.static) return o.fn;
-                    if (!0 === i && void 0 !== r.validPositions[e] && !0 !== r.validPositions[e].generatedInput) return !0;
-                    if (!0 !== t && e > -1) {
-                        if (i) {
-                            var s = a.getTests.call(n, e);
-                            return s.length > 1 + ("" === s[s.length - 1].match.def ? 1 : 0);
-                        }
-                        var l = a.determineTestTemplate.call(n, e, a.getTests.call(n, e)), u = a.getPlaceholder.call(n, e, l.match);
-                        return l.match.def !== u;
-                    }
-                    return !1;
-                }
-                function l(e, t, i) {
-                    var n = this;
-                    void 0 === i && (i = !0);
-                    for (var r = e + 1; "" !== a.getTest.call(n, r).match.def && (!0 === t && (!0 !== a.getTest.call(n, r).match.newBlockMarker || !s.call(n, r, void 0, !0)) || !0 !== t && !s.call(n, r, void 0, i)); ) r++;
-                    return r;
-                }
-                function u(e) {
-                    var t = this.opts, i = this.el;
-                    return !this.isRTL || "number" != typeof e || t.greedy && "" === t.placeholder || !i || (e = Math.abs(this._valueGet().length - e)), 
-                    e;
-                }
-            },
-            4713: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.determineTestTemplate = u, t.getDecisionTaker = o, t.getMaskTemplate = function(e, t, i, a, n) {
-                    var r = this, o = this.opts, c = this.maskset, f = o.greedy;
-                    n && o.greedy && (o.greedy = !1, r.maskset.tests = {});
-                    t = t || 0;
-                    var p, h, m, v, g = [], k = 0;
-                    do {
-                        if (!0 === e && c.validPositions[k]) m = n && c.validPositions[k].match.optionality && void 0 === c.validPositions[k + 1] && (!0 === c.validPositions[k].generatedInput || c.validPositions[k].input == o.skipOptionalPartCharacter && k > 0) ? u.call(r, k, d.call(r, k, p, k - 1)) : c.validPositions[k], 
-                        h = m.match, p = m.locator.slice(), g.push(!0 === i ? m.input : !1 === i ? h.nativeDef : s.call(r, k, h)); else {
-                            m = l.call(r, k, p, k - 1), h = m.match, p = m.locator.slice();
-                            var y = !0 !== a && (!1 !== o.jitMasking ? o.jitMasking : h.jit);
-                            (v = (v && h.static && h.def !== o.groupSeparator && null === h.fn || c.validPositions[k - 1] && h.static && h.def !== o.groupSeparator && null === h.fn) && c.tests[k] && 1 === c.tests[k].length) || !1 === y || void 0 === y || "number" == typeof y && isFinite(y) && y > k ? g.push(!1 === i ? h.nativeDef : s.call(r, k, h)) : v = !1;
-                        }
-                        k++;
-                    } while (!0 !== h.static || "" !== h.def || t > k);
-                    "" === g[g.length - 1] && g.pop();
-                    !1 === i && void 0 !== c.maskLength || (c.maskLength = k - 1);
-                    return o.greedy = f, g;
-                }, t.getPlaceholder = s, t.getTest = c, t.getTestTemplate = l, t.getTests = d, t.isSubsetOf = f;
-                var a, n = (a = i(2394)) && a.__esModule ? a : {
-                    default: a
-                };
-                function r(e, t) {
-                    var i = (null != e.alternation ? e.mloc[o(e)] : e.locator).join("");
-                    if ("" !== i) for (;i.length < t; ) i += "0";
-                    return i;
-                }
-                function o(e) {
-                    var t = e.locator[e.alternation];
-                    return "string" == typeof t && t.length > 0 && (t = t.split(",")[0]), void 0 !== t ? t.toString() : "";
-                }
-                function s(e, t, i) {
-                    var a = this.opts, n = this.maskset;
-                    if (void 0 !== (t = t || c.call(this, e).match).placeholder || !0 === i) return "function" == typeof t.placeholder ? t.placeholder(a) : t.placeholder;
-                    if (!0 === t.static) {
-                        if (e > -1 && void 0 === n.validPositions[e]) {
-                            var r, o = d.call(this, e), s = [];
-                            if (o.length > 1 + ("" === o[o.length - 1].match.def ? 1 : 0)) for (var l = 0; l < o.length; l++) if ("" !== o[l].match.def && !0 !== o[l].match.optionality && !0 !== o[l].match.optionalQuantifier && (!0 === o[l].match.static || void 0 === r || !1 !== o[l].match.fn.test(r.match.def, n, e, !0, a)) && (s.push(o[l]), 
-                            !0 === o[l].match.static && (r = o[l]), s.length > 1 && /[0-9a-bA-Z]/.test(s[0].match.def))) return a.placeholder.charAt(e % a.placeholder.length);
-                        }
-                        return t.def;
-                    }
-                    return a.placeholder.charAt(e % a.placeholder.length);
-                }
-                function l(e, t, i) {
-                    return this.maskset.validPositions[e] || u.call(this, e, d.call(this, e, t ? t.slice() : t, i));
-                }
-                function u(e, t) {
-                    var i = this.opts, a = function(e, t) {
-                        var i = 0, a = !1;
-                        t.forEach((function(e) {
-                            e.match.optionality && (0 !== i && i !== e.match.optionality && (a = !0), (0 === i || i > e.match.optionality) && (i = e.match.optionality));
-                        })), i && (0 == e || 1 == t.length ? i = 0 : a || (i = 0));
-                        return i;
-                    }(e, t);
-                    e = e > 0 ? e - 1 : 0;
-                    var n, o, s, l = r(c.call(this, e));
-                    i.greedy && t.length > 1 && "" === t[t.length - 1].match.def && t.pop();
-                    for (var u = 0; u < t.length; u++) {
-                        var f = t[u];
-                        n = r(f, l.length);
-                        var d = Math.abs(n - l);
-                        (void 0 === o || "" !== n && d < o || s && !i.greedy && s.match.optionality && s.match.optionality - a > 0 && "master" === s.match.newBlockMarker && (!f.match.optionality || f.match.optionality - a < 1 || !f.match.newBlockMarker) || s && !i.greedy && s.match.optionalQuantifier && !f.match.optionalQuantifier) && (o = d, 
-                        s = f);
-                    }
-                    return s;
-                }
-                function c(e, t) {
-                    var i = this.maskset;
-                    return i.validPositions[e] ? i.validPositions[e] : (t || d.call(this, e))[0];
-                }
-                function f(e, t, i) {
-                    function a(e) {
-                        for (var t, i = [], a = -1, n = 0, r = e.length; n < r; n++) if ("-" === e.charAt(n)) for (t = e.charCodeAt(n + 1); ++a < t; ) i.push(String.fromCharCode(a)); else a = e.charCodeAt(n), 
-                        i.push(e.charAt(n));
-                        return i.join("");
-                    }
-                    return e.match.def === t.match.nativeDef || !(!(i.regex || e.match.fn instanceof RegExp && t.match.fn instanceof RegExp) || !0 === e.match.static || !0 === t.match.static) && -1 !== a(t.match.fn.toString().replace(/[[\]/]/g, "")).indexOf(a(e.match.fn.toString().replace(/[[\]/]/g, "")));
-                }
-                function d(e, t, i) {
-                    var a, r, o = this, s = this.dependencyLib, l = this.maskset, c = this.opts, d = this.el, p = l.maskToken, h = t ? i : 0, m = t ? t.slice() : [ 0 ], v = [], g = !1, k = t ? t.join("") : "";
-                    function y(t, i, r, o) {
-                        function s(r, o, u) {
-                            function p(e, t) {
-                                var i = 0 === t.matches.indexOf(e);
-                                return i || t.matches.every((function(a, n) {
-                                    return !0 === a.isQuantifier ? i = p(e, t.matches[n - 1]) : Object.prototype.hasOwnProperty.call(a, "matches") && (i = p(e, a)), 
-                                    !i;
-                                })), i;
-                            }
-                            function m(e, t, i) {
-                                var a, n;
-                                if ((l.tests[e] || l.validPositions[e]) && (l.tests[e] || [ l.validPositions[e] ]).every((function(e, r) {
-                                    if (e.mloc[t]) return a = e, !1;
-                                    var o = void 0 !== i ? i : e.alternation, s = void 0 !== e.locator[o] ? e.locator[o].toString().indexOf(t) : -1;
-                                    return (void 0 === n || s < n) && -1 !== s && (a = e, n = s), !0;
-                                })), a) {
-                                    var r = a.locator[a.alternation];
-                                    return (a.mloc[t] || a.mloc[r] || a.locator).slice((void 0 !== i ? i : a.alternation) + 1);
-                                }
-                                return void 0 !== i ? m(e, t) : void 0;
-                            }
-                            function b(e, t) {
-                                var i = e.alternation, a = void 0 === t || i === t.alternation && -1 === e.locator[i].toString().indexOf(t.locator[i]);
-                                if (!a && i > t.alternation) for (var n = t.alternation; n < i; n++) if (e.locator[n] !== t.locator[n]) {
-                                    i = n, a = !0;
-                                    break;
-                                }
-                                if (a) {
-                                    e.mloc = e.mloc || {};
-                                    var r = e.locator[i];
-                                    if (void 0 !== r) {
-                                        if ("string" == typeof r && (r = r.split(",")[0]), void 0 === e.mloc[r] && (e.mloc[r] = e.locator.slice()), 
-                                        void 0 !== t) {
-                                            for (var o in t.mloc) "string" == typeof o && (o = o.split(",")[0]), void 0 === e.mloc[o] && (e.mloc[o] = t.mloc[o]);
-                                            e.locator[i] = Object.keys(e.mloc).join(",");
-                                        }
-                                        return !0;
-                                    }
-                                    e.alternation = void 0;
-                                }
-                                return !1;
-                            }
-                            function x(e, t) {
-                                if (e.locator.length !== t.locator.length) return !1;
-                                for (var i = e.alternation + 1; i < e.locator.length; i++) if (e.locator[i] !== t.locator[i]) return !1;
-                                return !0;
-                            }
-                            if (h > e + c._maxTestPos) throw "Inputmask: There is probably an error in your mask definition or in the code. Create an issue on github with an example of the mask you are using. " + l.mask;
-                            if (h === e && void 0 === r.matches) {
-                                if (v.push({
-                                    match: r,
-                                    locator: o.reverse(),
-                                    cd: k,
-                                    mloc: {}
-                                }), !r.optionality || void 0 !== u || !(c.definitions && c.definitions[r.nativeDef] && c.definitions[r.nativeDef].optional || n.default.prototype.definitions[r.nativeDef] && n.default.prototype.definitions[r.nativeDef].optional)) return !0;
-                                g = !0, h = e;
-                            } else if (void 0 !== r.matches) {
-                                if (r.isGroup && u !== r) {
-                                    if (r = s(t.matches[t.matches.indexOf(r) + 1], o, u)) return !0;
-                                } else if (r.isOptional) {
-                                    var P = r, E = v.length;
-                                    if (r = y(r, i, o, u)) {
-                                        if (v.forEach((function(e, t) {
-                                            t >= E && (e.match.optionality = e.match.optionality ? e.match.optionality + 1 : 1);
-                                        })), a = v[v.length - 1].match, void 0 !== u || !p(a, P)) return !0;
-                                        g = !0, h = e;
-                                    }
-                                } else if (r.isAlternator) {
-                                    var S, w = r, _ = [], M = v.slice(), O = o.length, T = !1, A = i.length > 0 ? i.shift() : -1;
-                                    if (-1 === A || "string" == typeof A) {
-                                        var C, D = h, j = i.slice(), B = [];
-                                        if ("string" == typeof A) B = A.split(","); else for (C = 0; C < w.matches.length; C++) B.push(C.toString());
-                                        if (void 0 !== l.excludes[e]) {
-                                            for (var R = B.slice(), L = 0, I = l.excludes[e].length; L < I; L++) {
-                                                var F = l.excludes[e][L].toString().split(":");
-                                                o.length == F[1] && B.splice(B.indexOf(F[0]), 1);
-                                            }
-                                            0 === B.length && (delete l.excludes[e], B = R);
-                                        }
-                                        (!0 === c.keepStatic || isFinite(parseInt(c.keepStatic)) && D >= c.keepStatic) && (B = B.slice(0, 1));
-                                        for (var N = 0; N < B.length; N++) {
-                                            C = parseInt(B[N]), v = [], i = "string" == typeof A && m(h, C, O) || j.slice();
-                                            var V = w.matches[C];
-                                            if (V && s(V, [ C ].concat(o), u)) r = !0; else if (0 === N && (T = !0), V && V.matches && V.matches.length > w.matches[0].matches.length) break;
-                                            S = v.slice(), h = D, v = [];
-                                            for (var G = 0; G < S.length; G++) {
-                                                var H = S[G], K = !1;
-                                                H.match.jit = H.match.jit || T, H.alternation = H.alternation || O, b(H);
-                                                for (var U = 0; U < _.length; U++) {
-                                                    var $ = _[U];
-                                                    if ("string" != typeof A || void 0 !== H.alternation && B.includes(H.locator[H.alternation].toString())) {
-                                                        if (H.match.nativeDef === $.match.nativeDef) {
-                                                            K = !0, b($, H);
-                                                            break;
-                                                        }
-                                                        if (f(H, $, c)) {
-                                                            b(H, $) && (K = !0, _.splice(_.indexOf($), 0, H));
-                                                            break;
-                                                        }
-                                                        if (f($, H, c)) {
-                                                            b($, H);
-                                                            break;
-                                                        }
-                                                        if (Z = $, !0 === (W = H).match.static && !0 !== Z.match.static && Z.match.fn.test(W.match.def, l, e, !1, c, !1)) {
-                                                            x(H, $) || void 0 !== d.inputmask.userOptions.keepStatic ? b(H, $) && (K = !0, _.splice(_.indexOf($), 0, H)) : c.keepStatic = !0;
-                                                            break;
-                                                        }
-                                                    }
-                                                }
-                                                K || _.push(H);
-                                            }
-                                        }
-                                        v = M.concat(_), h = e, g = v.length > 0, r = _.length > 0, i = j.slice();
-                                    } else r = s(w.matches[A] || t.matches[A], [ A ].concat(o), u);
-                                    if (r) return !0;
-                                } else if (r.isQuantifier && u !== t.matches[t.matches.indexOf(r) - 1]) for (var q = r, z = i.length > 0 ? i.shift() : 0; z < (isNaN(q.quantifier.max) ? z + 1 : q.quantifier.max) && h <= e; z++) {
-                                    var Q = t.matches[t.matches.indexOf(q) - 1];
-                                    if (r = s(Q, [ z ].concat(o), Q)) {
-                                        if ((a = v[v.length - 1].match).optionalQuantifier = z >= q.quantifier.min, a.jit = (z + 1) * (Q.matches.indexOf(a) + 1) > q.quantifier.jit, 
-                                        a.optionalQuantifier && p(a, Q)) {
-                                            g = !0, h = e;
-                                            break;
-                                        }
-                                        return a.jit && (l.jitOffset[e] = Q.matches.length - Q.matches.indexOf(a)), !0;
-                                    }
-                                } else if (r = y(r, i, o, u)) return !0;
-                            } else h++;
-                            var W, Z;
-                        }
-                        for (var u = i.length > 0 ? i.shift() : 0; u < t.matches.length; u++) if (!0 !== t.matches[u].isQuantifier) {
-                            var p = s(t.matches[u], [ u ].concat(r), o);
-                            if (p && h === e) return p;
-                            if (h > e) break;
-                        }
-                    }
-                    if (e > -1) {
-                        if (void 0 === t) {
-                            for (var b, x = e - 1; void 0 === (b = l.validPositions[x] || l.tests[x]) && x > -1; ) x--;
-                            void 0 !== b && x > -1 && (m = function(e, t) {
-                                var i, a = [];
-                                return Array.isArray(t) || (t = [ t ]), t.length > 0 && (void 0 === t[0].alternation || !0 === c.keepStatic ? 0 === (a = u.call(o, e, t.slice()).locator.slice()).length && (a = t[0].locator.slice()) : t.forEach((function(e) {
-                                    "" !== e.def && (0 === a.length ? (i = e.alternation, a = e.locator.slice()) : e.locator[i] && -1 === a[i].toString().indexOf(e.locator[i]) && (a[i] += "," + e.locator[i]));
-                                }))), a;
-                            }(x, b), k = m.join(""), h = x);
-                        }
-                        if (l.tests[e] && l.tests[e][0].cd === k) return l.tests[e];
-                        for (var P = m.shift(); P < p.length; P++) {
-                            if (y(p[P], m, [ P ]) && h === e || h > e) break;
-                        }
-                    }
-                    return (0 === v.length || g) && v.push({
-                        match: {
-                            fn: null,
-                            static: !0,
-                            optionality: !1,
-                            casing: null,
-                            def: "",
-                            placeholder: ""
-                        },
-                        locator: [],
-                        mloc: {},
-                        cd: k
-                    }), void 0 !== t && l.tests[e] ? r = s.extend(!0, [], v) : (l.tests[e] = s.extend(!0, [], v), 
-                    r = l.tests[e]), v.forEach((function(e) {
-                        e.match.optionality = !1;
-                    })), r;
-                }
-            },
-            7215: function(e, t, i) {
-                Object.defineProperty(t, "__esModule", {
-                    value: !0
-                }), t.alternate = l, t.checkAlternationMatch = function(e, t, i) {
-                    for (var a, n = this.opts.greedy ? t : t.slice(0, 1), r = !1, o = void 0 !== i ? i.split(",") : [], s = 0; s < o.length; s++) -1 !== (a = e.indexOf(o[s])) && e.splice(a, 1);
-                    for (var l = 0; l < e.length; l++) if (n.includes(e[l])) {
-                        r = !0;
-                        break;
-                    }
-                    return r;
-                }, t.handleRemove = function(e, t, i, a, s) {
-                    var u = this, c = this.maskset, f = this.opts;
-                    if ((f.numericInput || u.isRTL) && (t === r.default.BACKSPACE ? t = r.default.DELETE : t === r.default.DELETE && (t = r.default.BACKSPACE), 
-                    u.isRTL)) {
-                        var d = i.end;
-                        i.end = i.begin, i.begin = d;
-                    }
-                    var p, h = o.getLastValidPosition.call(u, void 0, !0);
-                    i.end >= o.getBuffer.call(u).length && h >= i.end && (i.end = h + 1);
-                    t === r.default.BACKSPACE ? i.end - i.begin < 1 && (i.begin = o.seekPrevious.call(u, i.begin)) : t === r.default.DELETE && i.begin === i.end && (i.end = o.isMask.call(u, i.end, !0, !0) ? i.end + 1 : o.seekNext.call(u, i.end) + 1);
-                    if (!1 !== (p = v.call(u, i))) {
-                        if (!0 !== a && !1 !== f.keepStatic || null !== f.regex && -1 !== n.getTest.call(u, i.begin).match.def.indexOf("|")) {
-                            var m = l.call(u, !0);
-                            if (m) {
-                                var g = void 0 !== m.caret ? m.caret : m.pos ? o.seekNext.call(u, m.pos.begin ? m.pos.begin : m.pos) : o.getLastValidPosition.call(u, -1, !0);
-                                (t !== r.default.DELETE || i.begin > g) && i.begin;
-                            }
-                        }
-                        !0 !== a && (c.p = t === r.default.DELETE ? i.begin + p : i.begin, c.p = o.determineNewCaretPosition.call(u, {
-                            begin: c.p,
-                            end: c.p
-                        }, !1, !1 === f.insertMode && t === r.default.BACKSPACE ? "none" : void 0).begin);
-                    }
-                }, t.isComplete = c, t.isSelection = f, t.isValid = d, t.refreshFromBuffer = h, 
-                t.revalidateMask = v;
-                var a, n = i(4713), r = (a = i(5581)) && a.__esModule ? a : {
-                    default: a
-                }, o = i(8711), s = i(6030);
-                function l(e, t, i, a, r, s) {
-                    var u, c, f, p, h, m, v, g, k, y, b, x = this, P = this.dependencyLib, E = this.opts, S = x.maskset, w = P.extend(!0, {}, S.validPositions), _ = P.extend(!0, {}, S.tests), M = !1, O = !1, T = void 0 !== r ? r : o.getLastValidPosition.call(x);
-                    if (s && (y = s.begin, b = s.end, s.begin > s.end && (y = s.end, b = s.begin)), 
-                    -1 === T && void 0 === r) u = 0, c = (p = n.getTest.call(x, u)).alternation; else for (;T >= 0; T--) if ((f = S.validPositions[T]) && void 0 !== f.alternation) {
-                        if (p && p.locator[f.alternation] !== f.locator[f.alternation]) break;
-                        u = T, c = S.validPositions[u].alternation, p = f;
-                    }
-                    if (void 0 !== c) {
-                        v = parseInt(u), S.excludes[v] = S.excludes[v] || [], !0 !== e && S.excludes[v].push((0, 
-                        n.getDecisionTaker)(p) + ":" + p.alternation);
-                        var A = [], C = -1;
-                        for (h = v; h < o.getLastValidPosition.call(x, void 0, !0) + 1; h++) -1 === C && e <= h && void 0 !== t && (A.push(t), 
-                        C = A.length - 1), (m = S.validPositions[h]) && !0 !== m.generatedInput && (void 0 === s || h < y || h >= b) && A.push(m.input), 
-                        delete S.validPositions[h];
-                        for (-1 === C && void 0 !== t && (A.push(t), C = A.length - 1); void 0 !== S.excludes[v] && S.excludes[v].length < 10; ) {
-                            for (S.tests = {}, o.resetMaskSet.call(x, !0), M = !0, h = 0; h < A.length && (g = M.caret || o.getLastValidPosition.call(x, void 0, !0) + 1, 
-                            k = A[h], M = d.call(x, g, k, !1, a, !0)); h++) h === C && (O = M), 1 == e && M && (O = {
-                                caretPos: h
-                            });
-                            if (M) break;
-                            if (o.resetMaskSet.call(x), p = n.getTest.call(x, v), S.validPositions = P.extend(!0, {}, w), 
-                            S.tests = P.extend(!0, {}, _), !S.excludes[v]) {
-                                O = l.call(x, e, t, i, a, v - 1, s);
-                                break;
-                            }
-                            var D = (0, n.getDecisionTaker)(p);
-                            if (-1 !== S.excludes[v].indexOf(D + ":" + p.alternation)) {
-                                O = l.call(x, e, t, i, a, v - 1, s);
-                                break;
-                            }
-                            for (S.excludes[v].push(D + ":" + p.alternation), h = v; h < o.getLastValidPosition.call(x, void 0, !0) + 1; h++) delete S.validPositions[h];
-                        }
-                    }
-                    return O && !1 === E.keepStatic || delete S.excludes[v], O;
-                }
-                function u(e, t, i) {
-                    var a = this.opts, n = this.maskset;
-                    switch (a.casing || t.casing) {
-                      case "upper":
-                        e = e.toUpperCase();
-                        break;
-
-                      case "lower":
-                        e = e.toLowerCase();
-                        break;
-
-                      case "title":
-                        var o = n.validPositions[i - 1];
-                        e = 0 === i || o && o.input === String.fromCharCode(r.default.SPACE) ? e.toUpperCase() : e.toLowerCase();
-                        break;
-
-                      default:
-                        if ("function" == typeof a.casing) {
-                            var s = Array.prototype.slice.call(arguments);
-                            s.push(n.validPositions), e = a.casing.apply(this, s);
-                        }
-                    }
-                    return e;
-                }
-                function c(e) {
-                    var t = this, i = this.opts, a = this.maskset;
-                    if ("function" == typeof i.isComplete) return i.isComplete(e, i);
-                    if ("*" !== i.repeat) {
-                        var r = !1, s = o.determineLastRequiredPosition.call(t, !0), l = o.seekPrevious.call(t, s.l);
-                        if (void 0 === s.def || s.def.newBlockMarker || s.def.optionality || s.def.optionalQuantifier) {
-                            r = !0;
-                            for (var u = 0; u <= l; u++) {
-                                var c = n.getTestTemplate.call(t, u).match;
-                                if (!0 !== c.static && void 0 === a.validPositions[u] && !0 !== c.optionality && !0 !== c.optionalQuantifier || !0 === c.static && e[u] !== n.getPlaceholder.call(t, u, c)) {
-                                    r = !1;
-                                    break;
-                                }
-                            }
-                        }
-                        return r;
-                    }
-                }
-                function f(e) {
-                    var t = this.opts.insertMode ? 0 : 1;
-                    return this.isRTL ? e.begin - e.end > t : e.end - e.begin > t;
-                }
-                function d(e, t, i, a, r, s, p) {
-                    var g = this, k = this.dependencyLib, y = this.opts, b = g.maskset;
-                    i = !0 === i;
-                    var x = e;
-                    function P(e) {
-                        if (void 0 !== e) {
-                            if (void 0 !== e.remove && (Array.isArray(e.remove) || (e.remove = [ e.remove ]), 
-                            e.remove.sort((function(e, t) {
-                                return t.pos - e.pos;
-                            })).forEach((function(e) {
-                                v.call(g, {
-                                    begin: e,
-                                    end: e + 1
-                                });
-                            })), e.remove = void 0), void 0 !== e.insert && (Array.isArray(e.insert) || (e.insert = [ e.insert ]), 
-                            e.insert.sort((function(e, t) {
-                                return e.pos - t.pos;
-                            })).forEach((function(e) {
-                                "" !== e.c && d.call(g, e.pos, e.c, void 0 === e.strict || e.strict, void 0 !== e.fromIsValid ? e.fromIsValid : a);
-                            })), e.insert = void 0), e.refreshFromBuffer && e.buffer) {
-                                var t = e.refreshFromBuffer;
-                                h.call(g, !0 === t ? t : t.start, t.end, e.buffer), e.refreshFromBuffer = void 0;
-                            }
-                            void 0 !== e.rewritePosition && (x = e.rewritePosition, e = !0);
-                        }
-                        return e;
-                    }
-                    function E(t, i, r) {
-                        var s = !1;
-                        return n.getTests.call(g, t).every((function(l, c) {
-                            var d = l.match;
-                            if (o.getBuffer.call(g, !0), !1 !== (s = (!d.jit || void 0 !== b.validPositions[o.seekPrevious.call(g, t)]) && (null != d.fn ? d.fn.test(i, b, t, r, y, f.call(g, e)) : (i === d.def || i === y.skipOptionalPartCharacter) && "" !== d.def && {
-                                c: n.getPlaceholder.call(g, t, d, !0) || d.def,
-                                pos: t
-                            }))) {
-                                var p = void 0 !== s.c ? s.c : i, h = t;
-                                return p = p === y.skipOptionalPartCharacter && !0 === d.static ? n.getPlaceholder.call(g, t, d, !0) || d.def : p, 
-                                !0 !== (s = P(s)) && void 0 !== s.pos && s.pos !== t && (h = s.pos), !0 !== s && void 0 === s.pos && void 0 === s.c ? !1 : (!1 === v.call(g, e, k.extend({}, l, {
-                                    input: u.call(g, p, d, h)
-                                }), a, h) && (s = !1), !1);
-                            }
-                            return !0;
-                        })), s;
-                    }
-                    void 0 !== e.begin && (x = g.isRTL ? e.end : e.begin);
-                    var S = !0, w = k.extend(!0, {}, b.validPositions);
-                    if (!1 === y.keepStatic && void 0 !== b.excludes[x] && !0 !== r && !0 !== a) for (var _ = x; _ < (g.isRTL ? e.begin : e.end); _++) void 0 !== b.excludes[_] && (b.excludes[_] = void 0, 
-                    delete b.tests[_]);
-                    if ("function" == typeof y.preValidation && !0 !== a && !0 !== s && (S = P(S = y.preValidation.call(g, o.getBuffer.call(g), x, t, f.call(g, e), y, b, e, i || r))), 
-                    !0 === S) {
-                        if (S = E(x, t, i), (!i || !0 === a) && !1 === S && !0 !== s) {
-                            var M = b.validPositions[x];
-                            if (!M || !0 !== M.match.static || M.match.def !== t && t !== y.skipOptionalPartCharacter) {
-                                if (y.insertMode || void 0 === b.validPositions[o.seekNext.call(g, x)] || e.end > x) {
-                                    var O = !1;
-                                    if (b.jitOffset[x] && void 0 === b.validPositions[o.seekNext.call(g, x)] && !1 !== (S = d.call(g, x + b.jitOffset[x], t, !0, !0)) && (!0 !== r && (S.caret = x), 
-                                    O = !0), e.end > x && (b.validPositions[x] = void 0), !O && !o.isMask.call(g, x, y.keepStatic && 0 === x)) for (var T = x + 1, A = o.seekNext.call(g, x, !1, 0 !== x); T <= A; T++) if (!1 !== (S = E(T, t, i))) {
-                                        S = m.call(g, x, void 0 !== S.pos ? S.pos : T) || S, x = T;
-                                        break;
-                                    }
-                                }
-                            } else S = {
-                                caret: o.seekNext.call(g, x)
-                            };
-                        }
-                        !1 !== S || !y.keepStatic || !c.call(g, o.getBuffer.call(g)) && 0 !== x || i || !0 === r ? f.call(g, e) && b.tests[x] && b.tests[x].length > 1 && y.keepStatic && !i && !0 !== r && (S = l.call(g, !0)) : S = l.call(g, x, t, i, a, void 0, e), 
-                        !0 === S && (S = {
-                            pos: x
-                        });
-                    }
-                    if ("function" == typeof y.postValidation && !0 !== a && !0 !== s) {
-                        var C = y.postValidation.call(g, o.getBuffer.call(g, !0), void 0 !== e.begin ? g.isRTL ? e.end : e.begin : e, t, S, y, b, i, p);
-                        void 0 !== C && (S = !0 === C ? S : C);
-                    }
-                    S && void 0 === S.pos && (S.pos = x), !1 === S || !0 === s ? (o.resetMaskSet.call(g, !0), 
-                    b.validPositions = k.extend(!0, {}, w)) : m.call(g, void 0, x, !0);
-                    var D = P(S);
-                    void 0 !== g.maxLength && (o.getBuffer.call(g).length > g.maxLength && !a && (o.resetMaskSet.call(g, !0), 
-                    b.validPositions = k.extend(!0, {}, w), D = !1));
-                    return D;
-                }
-                function p(e, t, i) {
-                    for (var a = this.maskset, r = !1, o = n.getTests.call(this, e), s = 0; s < o.length; s++) {
-                        if (o[s].match && (o[s].match.nativeDef === t.match[i.shiftPositions ? "def" : "nativeDef"] && (!i.shiftPositions || !t.match.static) || o[s].match.nativeDef === t.match.nativeDef || i.regex && !o[s].match.static && o[s].match.fn.test(t.input))) {
-                            r = !0;
-                            break;
-                        }
-                        if (o[s].match && o[s].match.def === t.match.nativeDef) {
-                            r = void 0;
-                            break;
-                        }
-                    }
-                    return !1 === r && void 0 !== a.jitOffset[e] && (r = p.call(this, e + a.jitOffset[e], t, i)), 
-                    r;
-                }
-                function h(e, t, i) {
-                    var a, n, r = this, l = this.maskset, u = this.opts, c = this.dependencyLib, f = u.skipOptionalPartCharacter, d = r.isRTL ? i.slice().reverse() : i;
-                    if (u.skipOptionalPartCharacter = "", !0 === e) o.resetMaskSet.call(r), l.tests = {}, 
-                    e = 0, t = i.length, n = o.determineNewCaretPosition.call(r, {
-                        begin: 0,
-                        end: 0
-                    }, !1).begin; else {
-                        for (a = e; a < t; a++) delete l.validPositions[a];
-                        n = e;
-                    }
-                    var p = new c.Event("keypress");
-                    for (a = e; a < t; a++) {
-                        p.keyCode = d[a].toString().charCodeAt(0), r.ignorable = !1;
-                        var h = s.EventHandlers.keypressEvent.call(r, p, !0, !1, !1, n);
-                        !1 !== h && void 0 !== h && (n = h.forwardPosition);
-                    }
-                    u.skipOptionalPartCharacter = f;
-                }
-                function m(e, t, i) {
-                    var a = this, r = this.maskset, s = this.dependencyLib;
-                    if (void 0 === e) for (e = t - 1; e > 0 && !r.validPositions[e]; e--) ;
-                    for (var l = e; l < t; l++) {
-                        if (void 0 === r.validPositions[l] && !o.isMask.call(a, l, !1)) if (0 == l ? n.getTest.call(a, l) : r.validPositions[l - 1]) {
-                            var u = n.getTests.call(a, l).slice();
-                            "" === u[u.length - 1].match.def && u.pop();
-                            var c, f = n.determineTestTemplate.call(a, l, u);
-                            if (f && (!0 !== f.match.jit || "master" === f.match.newBlockMarker && (c = r.validPositions[l + 1]) && !0 === c.match.optionalQuantifier) && ((f = s.extend({}, f, {
-                                input: n.getPlaceholder.call(a, l, f.match, !0) || f.match.def
-                            })).generatedInput = !0, v.call(a, l, f, !0), !0 !== i)) {
-                                var p = r.validPositions[t].input;
-                                return r.validPositions[t] = void 0, d.call(a, t, p, !0, !0);
-                            }
-                        }
-                    }
-                }
-                function v(e, t, i, a) {
-                    var r = this, s = this.maskset, l = this.opts, u = this.dependencyLib;
-                    function c(e, t, i) {
-                        var a = t[e];
-                        if (void 0 !== a && !0 === a.match.static && !0 !== a.match.optionality && (void 0 === t[0] || void 0 === t[0].alternation)) {
-                            var n = i.begin <= e - 1 ? t[e - 1] && !0 === t[e - 1].match.static && t[e - 1] : t[e - 1], r = i.end > e + 1 ? t[e + 1] && !0 === t[e + 1].match.static && t[e + 1] : t[e + 1];
-                            return n && r;
-                        }
-                        return !1;
-                    }
-                    var f = 0, h = void 0 !== e.begin ? e.begin : e, m = void 0 !== e.end ? e.end : e, v = !0;
-                    if (e.begin > e.end && (h = e.end, m = e.begin), a = void 0 !== a ? a : h, h !== m || l.insertMode && void 0 !== s.validPositions[a] && void 0 === i || void 0 === t || t.match.optionalQuantifier || t.match.optionality) {
-                        var g, k = u.extend(!0, {}, s.validPositions), y = o.getLastValidPosition.call(r, void 0, !0);
-                        for (s.p = h, g = y; g >= h; g--) delete s.validPositions[g], void 0 === t && delete s.tests[g + 1];
-                        var b, x, P = a, E = P;
-                        for (t && (s.validPositions[a] = u.extend(!0, {}, t), E++, P++), g = t ? m : m - 1; g <= y; g++) {
-                            if (void 0 !== (b = k[g]) && !0 !== b.generatedInput && (g >= m || g >= h && c(g, k, {
-                                begin: h,
-                                end: m
-                            }))) {
-                                for (;"" !== n.getTest.call(r, E).match.def; ) {
-                                    if (!1 !== (x = p.call(r, E, b, l)) || "+" === b.match.def) {
-                                        "+" === b.match.def && o.getBuffer.call(r, !0);
-                                        var S = d.call(r, E, b.input, "+" !== b.match.def, !0);
-                                        if (v = !1 !== S, P = (S.pos || E) + 1, !v && x) break;
-                                    } else v = !1;
-                                    if (v) {
-                                        void 0 === t && b.match.static && g === e.begin && f++;
-                                        break;
-                                    }
-                                    if (!v && o.getBuffer.call(r), E > s.maskLength) break;
-                                    E++;
-                                }
-                                "" == n.getTest.call(r, E).match.def && (v = !1), E = P;
-                            }
-                            if (!v) break;
-                        }
-                        if (!v) return s.validPositions = u.extend(!0, {}, k), o.resetMaskSet.call(r, !0), 
-                        !1;
-                    } else t && n.getTest.call(r, a).match.cd === t.match.cd && (s.validPositions[a] = u.extend(!0, {}, t));
-                    return o.resetMaskSet.call(r, !0), f;
-                }
-            },
-            2047: function(t) {
-                t.exports = e;
-            },
-            5581: function(e) {
-                e.exports = JSON.parse('{"BACKSPACE":8,"BACKSPACE_SAFARI":127,"DELETE":46,"DOWN":40,"END":35,"ENTER":13,"ESCAPE":27,"HOME":36,"INSERT":45,"LEFT":37,"PAGE_DOWN":34,"PAGE_UP":33,"RIGHT":39,"SPACE":32,"TAB":9,"UP":38,"X":88,"Z":90,"CONTROL":17,"PAUSE/BREAK":19,"WINDOWS_LEFT":91,"WINDOWS_RIGHT":92,"KEY_229":229}');
-            }
-        }, i = {};
-        function a(e) {
-            var n = i[e];
-            if (void 0 !== n) return n.exports;
-            var r = i[e] = {
-                exports: {}
-            };
-            return t[e](r, r.exports, a), r.exports;
-        }
-        var n = {};
-        return function() {
-            var e = n;
-            Object.defineProperty(e, "__esModule", {
-                value: !0
-            }), e.default = void 0;
-            var t, i = (t = a(3046)) && t.__esModule ? t : {
-                default: t
-            };
-            a(443);
-            var r = i.default;
-            e.default = r;
-        }(), n;
-    }();
-}));
\ No newline at end of file
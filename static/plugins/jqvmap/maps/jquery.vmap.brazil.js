@@ -1,2 +0,0 @@
-/** Add Brazil Map Data Points */
-jQuery.fn.vectorMap('addMap', 'brazil_br', {"width":600,"height":550,"paths":{"ro": {"name": "Rondônia","path": "M 179,197 L 182,197 L 186,197 L 186,198 L 187,198 L 188,198 L 188,199 L 188,200 L 189,200 L 189,201 L 189,202 L 190,201 L 190,202 L 190,203 L 191,203 L 191,202 L 191,203 L 192,203 L 193,203 L 193,204 L 193,205 L 193,206 L 194,207 L 194,206 L 195,206 L 195,207 L 195,208 L 196,208 L 196,209 L 197,209 L 198,209 L 198,210 L 199,210 L 200,210 L 200,209 L 200,208 L 201,208 L 201,207 L 202,207 L 202,208 L 203,208 L 203,209 L 204,209 L 204,210 L 205,210 L 205,211 L 204,211 L 204,212 L 204,213 L 204,214 L 204,215 L 203,215 L 203,216 L 203,215 L 203,216 L 203,217 L 204,217 L 204,218 L 204,219 L 205,219 L 205,220 L 205,221 L 204,221 L 204,222 L 204,221 L 204,222 L 204,223 L 205,223 L 205,224 L 204,224 L 204,225 L 204,226 L 204,227 L 203,227 L 203,228 L 204,228 L 204,229 L 204,230 L 205,230 L 205,231 L 205,232 L 205,233 L 205,234 L 205,235 L 205,236 L 205,237 L 205,236 L 205,237 L 204,237 L 204,238 L 204,239 L 205,239 L 206,239 L 212,239 L 213,239 L 214,239 L 219,239 L 219,240 L 220,240 L 220,241 L 221,241 L 221,240 L 221,241 L 221,240 L 222,240 L 222,241 L 223,241 L 224,241 L 225,241 L 226,241 L 226,242 L 226,243 L 226,244 L 227,244 L 227,245 L 226,245 L 226,246 L 225,246 L 225,247 L 224,247 L 224,248 L 224,249 L 224,250 L 224,251 L 224,252 L 225,252 L 224,252 L 225,252 L 226,252 L 226,253 L 226,254 L 227,254 L 227,255 L 227,256 L 227,257 L 229,258 L 228,258 L 228,259 L 228,260 L 227,260 L 226,260 L 226,261 L 225,261 L 225,262 L 224,262 L 224,263 L 224,264 L 225,264 L 224,264 L 224,265 L 224,266 L 224,267 L 223,267 L 223,268 L 222,268 L 222,269 L 222,270 L 221,270 L 221,271 L 220,271 L 221,271 L 220,271 L 221,272 L 220,272 L 220,273 L 220,274 L 219,274 L 218,274 L 218,275 L 217,275 L 217,276 L 217,275 L 216,276 L 216,277 L 215,277 L 215,276 L 214,276 L 213,276 L 213,275 L 212,275 L 211,275 L 212,275 L 212,274 L 211,274 L 210,274 L 210,275 L 210,274 L 210,275 L 210,274 L 210,275 L 209,274 L 209,275 L 208,275 L 208,274 L 207,274 L 207,275 L 207,274 L 206,274 L 206,275 L 205,275 L 204,275 L 204,274 L 204,275 L 204,274 L 203,274 L 204,274 L 203,274 L 202,274 L 202,275 L 201,274 L 201,275 L 201,274 L 201,275 L 201,274 L 201,275 L 200,275 L 200,274 L 199,274 L 199,273 L 198,273 L 198,272 L 197,272 L 197,271 L 196,271 L 196,270 L 196,269 L 196,270 L 196,269 L 195,269 L 194,269 L 193,269 L 192,269 L 192,268 L 191,268 L 190,268 L 189,268 L 189,267 L 188,267 L 188,268 L 187,268 L 187,267 L 187,268 L 187,267 L 186,267 L 187,267 L 187,266 L 186,266 L 186,267 L 186,266 L 185,266 L 185,265 L 184,265 L 184,264 L 183,264 L 183,263 L 183,264 L 183,263 L 182,263 L 183,263 L 183,262 L 182,262 L 182,263 L 182,262 L 181,262 L 182,262 L 181,262 L 181,263 L 180,263 L 181,263 L 180,263 L 179,263 L 179,262 L 179,263 L 179,262 L 178,262 L 178,261 L 177,261 L 176,261 L 176,260 L 175,260 L 174,260 L 174,259 L 173,259 L 173,260 L 172,260 L 171,260 L 171,261 L 170,261 L 170,260 L 170,261 L 170,260 L 169,260 L 169,261 L 169,260 L 168,260 L 167,260 L 168,260 L 167,260 L 166,260 L 165,260 L 164,260 L 164,259 L 163,259 L 163,258 L 163,257 L 163,256 L 163,257 L 162,257 L 162,256 L 161,256 L 160,256 L 160,255 L 160,256 L 159,256 L 159,255 L 158,255 L 158,254 L 159,254 L 158,254 L 158,253 L 158,254 L 157,254 L 157,253 L 156,253 L 156,254 L 156,253 L 155,253 L 156,253 L 156,252 L 155,252 L 155,251 L 155,250 L 155,249 L 154,249 L 153,249 L 153,250 L 154,250 L 153,250 L 153,249 L 152,249 L 153,249 L 153,248 L 153,247 L 152,247 L 152,246 L 152,245 L 151,245 L 151,244 L 152,244 L 151,244 L 151,243 L 151,242 L 152,242 L 151,242 L 151,241 L 152,241 L 152,240 L 152,239 L 153,239 L 152,239 L 152,238 L 152,237 L 151,237 L 151,236 L 151,235 L 151,234 L 150,234 L 150,233 L 150,232 L 151,232 L 151,231 L 151,230 L 152,230 L 152,229 L 152,228 L 152,227 L 151,227 L 151,226 L 152,226 L 152,225 L 151,225 L 151,224 L 152,224 L 152,223 L 151,223 L 151,222 L 151,221 L 150,221 L 149,222 L 149,221 L 149,222 L 149,223 L 149,222 L 149,223 L 148,223 L 147,223 L 147,222 L 147,223 L 146,223 L 146,222 L 147,222 L 146,222 L 145,222 L 145,223 L 145,222 L 144,222 L 144,223 L 144,222 L 143,222 L 142,222 L 142,223 L 143,223 L 142,223 L 141,223 L 141,222 L 141,223 L 140,223 L 139,223 L 140,223 L 139,223 L 138,223 L 137,223 L 137,224 L 136,224 L 135,224 L 134,224 L 133,224 L 131,223 L 131,222 L 132,222 L 133,222 L 133,221 L 134,221 L 135,221 L 135,220 L 136,220 L 136,219 L 137,219 L 137,218 L 136,218 L 136,217 L 137,217 L 137,218 L 137,217 L 137,218 L 138,217 L 138,218 L 138,217 L 139,218 L 140,218 L 140,217 L 141,217 L 142,217 L 143,217 L 143,218 L 144,218 L 144,219 L 145,219 L 145,220 L 145,219 L 145,220 L 145,219 L 146,219 L 147,219 L 147,218 L 147,217 L 148,217 L 148,218 L 149,218 L 150,218 L 150,217 L 150,216 L 151,216 L 152,216 L 152,215 L 153,215 L 153,216 L 153,217 L 154,217 L 153,217 L 153,218 L 154,218 L 155,218 L 155,217 L 156,217 L 156,216 L 157,216 L 157,215 L 157,214 L 157,213 L 157,212 L 158,212 L 158,211 L 159,211 L 159,212 L 160,212 L 160,211 L 160,212 L 161,212 L 162,212 L 162,211 L 163,211 L 164,211 L 165,211 L 166,211 L 165,211 L 165,212 L 166,212 L 166,211 L 167,211 L 168,211 L 168,210 L 168,209 L 168,208 L 169,208 L 170,208 L 169,207 L 170,207 L 170,206 L 171,206 L 171,205 L 170,205 L 170,204 L 171,204 L 170,204 L 170,203 L 171,203 L 171,202 L 172,202 L 173,202 L 173,201 L 174,201 L 173,201 L 173,200 L 174,200 L 174,199 L 175,199 L 175,198 L 175,197 L 176,197 L 177,197 L 178,197 L 179,197 "},"ac": {"name": "Acre","path": "M 42,188 L 43,189 L 44,189 L 46,190 L 49,191 L 50,191 L 51,191 L 52,192 L 53,192 L 54,192 L 55,192 L 56,192 L 58,192 L 59,192 L 59,193 L 60,193 L 62,193 L 64,193 L 67,193 L 71,194 L 74,194 L 75,194 L 76,194 L 77,194 L 77,195 L 79,195 L 82,195 L 83,195 L 84,195 L 86,196 L 87,196 L 87,197 L 92,201 L 93,202 L 94,202 L 94,203 L 95,203 L 95,204 L 96,204 L 96,205 L 97,205 L 97,206 L 98,206 L 99,207 L 100,208 L 101,208 L 101,209 L 105,212 L 109,214 L 111,215 L 114,216 L 115,217 L 116,217 L 117,217 L 119,219 L 121,219 L 124,220 L 125,220 L 126,221 L 127,221 L 130,223 L 131,223 L 133,224 L 133,225 L 133,224 L 133,225 L 132,225 L 132,226 L 132,225 L 131,225 L 131,226 L 130,226 L 130,227 L 129,227 L 129,228 L 129,227 L 129,228 L 128,228 L 129,228 L 128,228 L 128,229 L 127,229 L 128,229 L 127,229 L 127,230 L 127,229 L 127,230 L 127,229 L 127,230 L 126,230 L 125,230 L 124,230 L 124,231 L 123,231 L 122,231 L 122,232 L 121,232 L 120,232 L 120,233 L 120,232 L 120,233 L 119,233 L 119,234 L 118,235 L 117,235 L 116,235 L 116,234 L 116,235 L 116,234 L 116,235 L 116,234 L 115,234 L 115,235 L 114,235 L 113,235 L 113,236 L 113,237 L 112,237 L 112,238 L 111,238 L 111,239 L 110,239 L 110,240 L 110,239 L 110,240 L 109,240 L 109,239 L 109,240 L 108,240 L 107,240 L 107,241 L 106,241 L 104,241 L 104,240 L 104,239 L 104,240 L 104,239 L 103,239 L 103,240 L 103,239 L 103,240 L 103,239 L 102,239 L 102,240 L 102,239 L 102,240 L 101,240 L 101,239 L 101,240 L 101,239 L 101,240 L 100,240 L 100,239 L 100,240 L 100,239 L 99,239 L 98,239 L 97,239 L 96,239 L 95,239 L 95,238 L 95,239 L 95,238 L 95,239 L 95,238 L 94,238 L 94,239 L 94,238 L 94,239 L 93,239 L 92,239 L 91,239 L 90,239 L 90,238 L 90,239 L 89,239 L 89,238 L 88,238 L 87,238 L 87,239 L 87,238 L 87,239 L 86,239 L 85,239 L 85,240 L 85,239 L 85,240 L 84,240 L 83,240 L 82,240 L 81,240 L 80,240 L 80,239 L 79,239 L 79,238 L 79,239 L 78,239 L 78,238 L 78,237 L 78,235 L 78,233 L 78,232 L 78,231 L 78,229 L 78,227 L 78,223 L 78,222 L 79,222 L 79,223 L 79,222 L 79,221 L 78,221 L 78,220 L 78,219 L 79,220 L 79,219 L 79,218 L 79,219 L 79,218 L 80,218 L 80,217 L 80,218 L 79,218 L 79,217 L 79,218 L 78,218 L 78,219 L 78,218 L 77,218 L 77,219 L 78,219 L 77,219 L 76,219 L 76,220 L 76,219 L 76,220 L 76,219 L 76,220 L 75,220 L 76,220 L 75,220 L 76,220 L 75,220 L 75,221 L 75,220 L 75,221 L 74,221 L 74,222 L 73,222 L 73,223 L 72,223 L 71,223 L 70,224 L 70,225 L 69,225 L 68,225 L 67,225 L 67,226 L 64,226 L 63,226 L 62,226 L 61,226 L 59,226 L 58,226 L 56,226 L 56,225 L 56,224 L 57,224 L 56,224 L 56,223 L 57,223 L 56,223 L 56,222 L 55,222 L 55,221 L 55,220 L 55,219 L 54,219 L 54,218 L 54,219 L 54,218 L 53,218 L 52,218 L 53,218 L 52,218 L 51,218 L 50,218 L 49,218 L 49,217 L 48,217 L 47,217 L 45,217 L 42,217 L 43,216 L 43,215 L 44,215 L 45,214 L 44,214 L 45,214 L 45,213 L 46,213 L 46,212 L 45,212 L 46,212 L 46,211 L 45,211 L 45,210 L 44,210 L 44,209 L 43,209 L 43,208 L 42,207 L 41,207 L 41,206 L 40,207 L 40,206 L 40,205 L 40,204 L 39,204 L 39,203 L 38,203 L 37,203 L 37,202 L 37,201 L 36,201 L 36,200 L 37,200 L 36,200 L 37,200 L 37,199 L 36,199 L 36,198 L 35,198 L 35,197 L 34,197 L 34,196 L 35,196 L 35,195 L 35,194 L 34,194 L 33,194 L 33,193 L 32,193 L 32,192 L 31,192 L 31,191 L 32,191 L 32,190 L 32,189 L 31,189 L 32,189 L 33,189 L 33,188 L 34,189 L 34,188 L 34,189 L 35,188 L 35,187 L 34,187 L 34,186 L 34,185 L 34,186 L 35,186 L 38,187 L 39,187 L 42,188 "},"am": {"name": "Amazonas","path": "M 124,58 L 124,59 L 124,60 L 125,60 L 125,61 L 126,61 L 127,62 L 127,63 L 127,64 L 127,65 L 127,66 L 127,67 L 127,68 L 127,69 L 127,70 L 128,70 L 130,69 L 134,73 L 138,76 L 139,76 L 140,76 L 141,76 L 141,75 L 142,75 L 143,75 L 143,74 L 144,74 L 144,73 L 145,73 L 146,73 L 146,72 L 146,73 L 146,72 L 146,73 L 147,73 L 147,72 L 147,73 L 147,72 L 148,72 L 148,73 L 149,73 L 149,74 L 149,75 L 148,75 L 148,76 L 148,77 L 149,77 L 150,77 L 150,76 L 151,76 L 150,76 L 150,75 L 151,75 L 151,74 L 151,73 L 152,73 L 152,74 L 153,74 L 153,73 L 153,74 L 154,73 L 154,72 L 154,71 L 154,70 L 155,70 L 155,71 L 156,71 L 156,70 L 157,70 L 156,70 L 156,69 L 157,69 L 157,70 L 157,69 L 158,69 L 158,68 L 159,68 L 159,69 L 160,69 L 160,68 L 160,69 L 161,68 L 162,68 L 162,67 L 163,67 L 163,66 L 164,66 L 164,65 L 165,65 L 165,66 L 164,67 L 165,67 L 165,66 L 166,66 L 166,65 L 167,65 L 168,64 L 168,65 L 168,64 L 169,64 L 169,63 L 169,62 L 169,61 L 169,60 L 169,59 L 170,59 L 171,59 L 172,59 L 173,59 L 174,59 L 173,58 L 174,58 L 175,58 L 175,57 L 176,57 L 177,57 L 178,57 L 178,56 L 179,56 L 180,56 L 181,56 L 182,56 L 182,57 L 183,58 L 184,58 L 185,58 L 186,58 L 186,59 L 187,59 L 188,59 L 188,60 L 188,61 L 188,62 L 188,63 L 187,63 L 187,64 L 187,65 L 188,65 L 188,66 L 189,66 L 189,67 L 189,68 L 190,69 L 190,70 L 190,71 L 191,71 L 191,72 L 191,73 L 192,73 L 191,73 L 191,74 L 191,75 L 191,76 L 190,76 L 190,77 L 190,78 L 191,78 L 190,78 L 190,79 L 190,80 L 191,80 L 191,81 L 192,81 L 191,81 L 191,82 L 191,83 L 191,84 L 192,84 L 192,85 L 192,86 L 193,86 L 193,87 L 193,88 L 194,88 L 194,89 L 194,90 L 194,91 L 195,91 L 195,92 L 194,92 L 194,93 L 193,94 L 194,94 L 193,94 L 193,95 L 194,95 L 193,96 L 192,96 L 192,97 L 192,96 L 191,96 L 191,97 L 191,98 L 192,98 L 193,98 L 192,98 L 193,98 L 193,99 L 194,99 L 194,100 L 195,100 L 195,101 L 196,101 L 196,102 L 197,102 L 198,102 L 198,103 L 198,104 L 198,105 L 199,105 L 199,106 L 200,106 L 201,106 L 202,106 L 203,106 L 203,107 L 204,107 L 204,108 L 205,108 L 205,107 L 204,107 L 204,106 L 203,106 L 203,105 L 204,105 L 203,105 L 203,104 L 203,103 L 204,103 L 204,102 L 204,101 L 204,100 L 203,99 L 204,99 L 204,98 L 204,97 L 205,97 L 205,96 L 206,96 L 206,95 L 207,95 L 207,94 L 208,94 L 209,94 L 209,93 L 209,94 L 209,93 L 210,93 L 211,93 L 211,94 L 212,94 L 213,94 L 213,95 L 214,95 L 214,96 L 215,96 L 215,97 L 214,97 L 215,97 L 215,98 L 216,99 L 216,98 L 216,99 L 217,99 L 217,98 L 217,99 L 217,98 L 217,99 L 217,98 L 218,98 L 218,99 L 218,98 L 218,99 L 218,98 L 219,98 L 218,98 L 219,98 L 219,97 L 220,97 L 221,97 L 221,96 L 221,95 L 220,95 L 220,94 L 220,93 L 221,93 L 221,92 L 221,91 L 222,90 L 221,90 L 221,89 L 222,89 L 222,88 L 223,87 L 223,86 L 224,86 L 224,85 L 224,84 L 225,84 L 225,83 L 226,83 L 228,83 L 236,83 L 237,83 L 241,83 L 241,86 L 241,87 L 241,88 L 241,89 L 241,90 L 241,91 L 242,91 L 242,92 L 243,92 L 243,93 L 243,94 L 243,95 L 244,95 L 243,96 L 244,96 L 245,96 L 245,97 L 246,97 L 246,98 L 247,98 L 247,99 L 247,98 L 247,99 L 247,100 L 248,100 L 247,100 L 248,100 L 247,101 L 248,101 L 248,102 L 249,102 L 250,102 L 250,103 L 251,103 L 251,104 L 251,103 L 252,103 L 252,102 L 253,102 L 254,102 L 254,103 L 254,104 L 254,105 L 253,105 L 254,105 L 254,106 L 255,106 L 256,106 L 256,107 L 257,107 L 257,108 L 258,108 L 257,108 L 258,108 L 258,109 L 258,108 L 258,109 L 258,108 L 259,108 L 259,109 L 260,109 L 261,109 L 261,110 L 262,110 L 262,111 L 262,110 L 263,110 L 264,110 L 265,110 L 265,111 L 266,111 L 266,112 L 267,112 L 267,113 L 268,113 L 268,114 L 269,114 L 269,115 L 270,115 L 270,114 L 271,114 L 271,115 L 271,116 L 270,116 L 271,117 L 272,117 L 273,117 L 273,116 L 274,116 L 274,117 L 275,117 L 275,116 L 275,117 L 276,117 L 276,116 L 277,116 L 278,115 L 279,115 L 280,115 L 279,115 L 279,116 L 279,117 L 278,117 L 277,118 L 276,118 L 275,119 L 275,120 L 276,120 L 276,121 L 275,121 L 275,122 L 275,123 L 274,123 L 274,125 L 273,125 L 273,126 L 273,127 L 272,128 L 271,130 L 271,131 L 270,132 L 270,133 L 269,135 L 268,136 L 268,137 L 267,139 L 266,141 L 266,142 L 265,143 L 264,145 L 264,146 L 262,149 L 261,153 L 260,154 L 259,156 L 258,158 L 258,159 L 255,164 L 255,165 L 253,170 L 250,176 L 250,177 L 249,177 L 249,178 L 248,178 L 247,178 L 247,179 L 247,180 L 247,181 L 247,182 L 247,183 L 248,183 L 249,183 L 249,184 L 249,185 L 250,185 L 250,186 L 251,186 L 251,187 L 251,188 L 251,189 L 251,190 L 250,190 L 250,191 L 250,192 L 251,192 L 250,193 L 250,194 L 249,194 L 249,195 L 248,195 L 248,196 L 248,197 L 249,197 L 249,198 L 249,199 L 249,200 L 249,201 L 249,202 L 249,203 L 248,203 L 249,203 L 248,203 L 248,204 L 248,205 L 248,206 L 248,207 L 247,207 L 247,208 L 248,208 L 248,207 L 249,208 L 248,208 L 248,209 L 247,209 L 246,209 L 239,209 L 238,209 L 233,209 L 226,209 L 225,209 L 220,209 L 218,209 L 214,209 L 206,209 L 204,209 L 203,209 L 203,208 L 202,208 L 202,207 L 201,207 L 201,208 L 200,208 L 200,209 L 200,210 L 199,210 L 198,210 L 198,209 L 197,209 L 196,209 L 196,208 L 195,208 L 195,207 L 195,206 L 194,206 L 194,207 L 193,206 L 193,205 L 193,204 L 193,203 L 192,203 L 191,203 L 191,202 L 191,203 L 190,203 L 190,202 L 190,201 L 189,202 L 189,201 L 189,200 L 188,200 L 188,199 L 188,198 L 187,198 L 186,198 L 186,197 L 182,197 L 178,197 L 177,197 L 175,197 L 175,198 L 175,199 L 174,199 L 174,200 L 173,200 L 173,201 L 174,201 L 173,201 L 173,202 L 172,202 L 171,202 L 171,203 L 170,203 L 170,204 L 171,204 L 170,204 L 170,205 L 171,205 L 171,206 L 170,206 L 170,207 L 169,207 L 170,208 L 169,208 L 168,208 L 168,209 L 168,210 L 168,211 L 167,211 L 166,211 L 166,212 L 165,212 L 165,211 L 166,211 L 165,211 L 164,211 L 163,211 L 162,211 L 162,212 L 161,212 L 160,212 L 160,211 L 160,212 L 159,212 L 159,211 L 158,211 L 158,212 L 157,212 L 157,213 L 157,214 L 157,215 L 157,216 L 156,216 L 156,217 L 155,217 L 155,218 L 154,218 L 153,218 L 153,217 L 154,217 L 153,217 L 153,216 L 153,215 L 152,215 L 152,216 L 151,216 L 150,216 L 150,217 L 150,218 L 149,218 L 148,218 L 148,217 L 147,217 L 147,218 L 147,219 L 146,219 L 145,219 L 145,220 L 145,219 L 145,220 L 145,219 L 144,219 L 144,218 L 143,218 L 143,217 L 142,217 L 141,217 L 140,217 L 140,218 L 139,218 L 138,217 L 138,218 L 138,217 L 137,218 L 137,217 L 137,218 L 137,217 L 136,217 L 136,218 L 137,218 L 137,219 L 136,219 L 136,220 L 135,220 L 135,221 L 134,221 L 133,221 L 133,222 L 132,222 L 131,222 L 131,223 L 130,223 L 127,221 L 126,221 L 125,220 L 124,220 L 121,219 L 119,219 L 117,217 L 116,217 L 115,217 L 114,216 L 111,215 L 105,212 L 104,212 L 101,209 L 101,208 L 100,208 L 99,207 L 98,206 L 97,206 L 97,205 L 96,205 L 96,204 L 95,204 L 95,203 L 94,203 L 94,202 L 93,202 L 92,201 L 89,199 L 86,196 L 84,195 L 83,195 L 82,195 L 79,195 L 77,195 L 77,194 L 76,194 L 75,194 L 74,194 L 71,194 L 67,193 L 64,193 L 62,193 L 60,193 L 59,193 L 59,192 L 58,192 L 56,192 L 55,192 L 54,192 L 53,192 L 52,192 L 51,191 L 50,191 L 49,191 L 46,190 L 44,189 L 43,189 L 42,188 L 35,186 L 34,186 L 34,185 L 34,184 L 35,184 L 34,184 L 34,183 L 34,182 L 35,182 L 35,181 L 36,181 L 36,180 L 37,180 L 37,179 L 38,179 L 39,179 L 39,178 L 40,178 L 41,178 L 42,178 L 42,177 L 43,177 L 43,176 L 43,175 L 43,174 L 42,174 L 42,173 L 42,172 L 41,172 L 41,171 L 41,170 L 42,170 L 42,169 L 42,168 L 43,168 L 42,168 L 43,168 L 43,167 L 44,167 L 44,166 L 45,166 L 45,165 L 45,164 L 45,163 L 45,162 L 46,162 L 46,161 L 46,160 L 47,160 L 46,160 L 47,160 L 46,159 L 47,159 L 46,159 L 47,159 L 46,159 L 46,158 L 47,158 L 47,157 L 48,158 L 48,157 L 49,157 L 50,157 L 50,156 L 51,156 L 51,155 L 52,155 L 53,155 L 53,154 L 53,153 L 54,153 L 55,153 L 56,153 L 56,152 L 57,152 L 58,152 L 57,151 L 58,151 L 59,151 L 59,150 L 59,151 L 59,150 L 60,150 L 60,149 L 60,150 L 60,149 L 61,149 L 62,149 L 63,149 L 64,149 L 65,149 L 66,149 L 65,149 L 65,148 L 66,148 L 67,149 L 67,148 L 68,148 L 69,148 L 69,147 L 69,148 L 69,147 L 70,147 L 70,148 L 70,147 L 70,148 L 70,147 L 71,147 L 71,148 L 71,147 L 71,148 L 72,147 L 72,148 L 72,147 L 73,147 L 74,147 L 74,146 L 75,146 L 74,146 L 75,145 L 75,146 L 75,145 L 76,144 L 76,145 L 77,145 L 77,144 L 78,144 L 78,145 L 78,144 L 79,144 L 79,145 L 80,144 L 80,145 L 80,144 L 81,144 L 82,145 L 82,144 L 82,145 L 82,146 L 83,146 L 83,147 L 83,146 L 83,147 L 84,147 L 84,146 L 85,146 L 85,147 L 86,147 L 87,147 L 87,146 L 87,145 L 88,144 L 88,143 L 88,142 L 88,141 L 88,139 L 89,138 L 89,137 L 89,135 L 90,130 L 90,128 L 91,127 L 91,126 L 92,121 L 92,120 L 93,114 L 93,113 L 94,110 L 94,108 L 94,107 L 94,106 L 95,106 L 95,105 L 95,104 L 94,104 L 94,103 L 95,103 L 95,102 L 94,101 L 94,100 L 93,100 L 93,99 L 93,98 L 92,98 L 93,98 L 92,98 L 92,97 L 92,96 L 92,95 L 93,95 L 92,95 L 92,94 L 92,93 L 91,93 L 90,93 L 90,92 L 89,92 L 89,91 L 88,91 L 87,91 L 87,90 L 86,90 L 86,89 L 86,88 L 86,87 L 86,86 L 86,85 L 86,83 L 86,80 L 86,79 L 87,79 L 86,78 L 87,78 L 87,79 L 88,78 L 89,78 L 90,78 L 90,77 L 91,77 L 92,78 L 92,77 L 93,77 L 93,76 L 94,76 L 94,77 L 95,77 L 95,78 L 96,78 L 96,77 L 96,78 L 97,78 L 98,78 L 98,77 L 99,78 L 99,77 L 98,77 L 98,76 L 98,75 L 98,74 L 98,73 L 97,73 L 98,73 L 97,72 L 96,72 L 96,71 L 95,71 L 95,72 L 94,72 L 94,71 L 93,71 L 92,71 L 91,71 L 90,71 L 91,71 L 90,71 L 89,71 L 89,72 L 89,71 L 89,68 L 89,66 L 89,64 L 89,62 L 89,63 L 90,62 L 91,62 L 92,62 L 93,62 L 93,61 L 93,62 L 94,62 L 95,62 L 98,62 L 100,62 L 105,62 L 112,62 L 111,62 L 111,61 L 111,60 L 111,59 L 112,59 L 113,59 L 113,60 L 114,60 L 114,61 L 115,61 L 116,60 L 115,60 L 116,60 L 117,59 L 117,58 L 118,58 L 119,58 L 120,58 L 120,57 L 121,57 L 121,56 L 122,56 L 122,55 L 123,55 L 123,56 L 123,57 L 124,57 L 124,58 "},"rr": {"name": "Roraima","path": "M 223,13 L 223,14 L 224,13 L 224,14 L 224,15 L 225,15 L 225,16 L 226,16 L 225,16 L 226,16 L 225,16 L 225,17 L 226,17 L 226,18 L 225,18 L 225,19 L 225,20 L 225,21 L 225,22 L 224,22 L 225,22 L 224,22 L 225,22 L 224,22 L 224,23 L 223,23 L 223,24 L 224,24 L 224,23 L 224,24 L 225,24 L 226,24 L 227,24 L 227,25 L 228,25 L 228,24 L 228,25 L 228,24 L 228,25 L 228,24 L 228,25 L 229,25 L 230,25 L 230,26 L 230,25 L 230,26 L 230,27 L 229,27 L 230,27 L 229,27 L 229,28 L 230,28 L 230,29 L 231,29 L 231,30 L 230,30 L 231,30 L 231,31 L 231,30 L 231,31 L 231,30 L 231,31 L 232,31 L 232,32 L 231,32 L 231,33 L 231,34 L 231,33 L 231,34 L 230,34 L 230,35 L 229,35 L 229,36 L 228,36 L 228,37 L 227,37 L 228,37 L 227,37 L 228,37 L 228,38 L 228,39 L 228,40 L 228,41 L 227,41 L 227,42 L 227,43 L 226,43 L 226,44 L 226,45 L 226,46 L 226,47 L 226,48 L 226,49 L 226,50 L 226,51 L 227,51 L 226,51 L 227,51 L 226,51 L 227,51 L 227,52 L 227,53 L 227,54 L 228,54 L 228,55 L 229,55 L 229,54 L 229,55 L 229,56 L 229,57 L 229,58 L 229,59 L 229,60 L 229,61 L 230,61 L 230,60 L 230,61 L 230,62 L 230,61 L 230,62 L 231,62 L 231,63 L 231,62 L 232,62 L 232,63 L 233,63 L 233,64 L 234,64 L 233,64 L 233,65 L 234,65 L 235,65 L 235,66 L 236,66 L 235,66 L 236,66 L 236,67 L 237,67 L 237,68 L 238,68 L 239,68 L 240,68 L 241,68 L 241,69 L 241,74 L 241,78 L 241,83 L 237,83 L 236,83 L 233,83 L 228,83 L 226,83 L 225,83 L 225,84 L 224,84 L 224,85 L 224,86 L 223,86 L 223,87 L 222,88 L 222,89 L 221,89 L 221,90 L 222,90 L 221,91 L 221,92 L 221,93 L 220,93 L 220,94 L 220,95 L 221,95 L 221,96 L 221,97 L 220,97 L 219,97 L 219,98 L 218,98 L 219,98 L 218,98 L 218,99 L 218,98 L 218,99 L 218,98 L 217,98 L 217,99 L 217,98 L 217,99 L 217,98 L 217,99 L 216,99 L 216,98 L 216,99 L 215,98 L 215,97 L 214,97 L 215,97 L 215,96 L 214,96 L 214,95 L 213,95 L 213,94 L 212,94 L 211,94 L 211,93 L 210,93 L 209,93 L 209,94 L 209,93 L 209,94 L 208,94 L 207,94 L 207,95 L 206,95 L 206,96 L 205,96 L 205,97 L 204,97 L 204,98 L 204,99 L 203,99 L 204,100 L 204,101 L 204,102 L 204,103 L 203,103 L 203,104 L 203,105 L 204,105 L 203,105 L 203,106 L 204,106 L 204,107 L 205,107 L 205,108 L 204,108 L 204,107 L 203,107 L 203,106 L 202,106 L 201,106 L 200,106 L 199,106 L 199,105 L 198,105 L 198,104 L 198,103 L 198,102 L 197,102 L 196,102 L 196,101 L 195,101 L 195,100 L 194,100 L 194,99 L 193,99 L 193,98 L 192,98 L 193,98 L 192,98 L 191,98 L 191,97 L 191,96 L 192,96 L 192,97 L 192,96 L 193,96 L 194,95 L 193,95 L 193,94 L 194,94 L 193,94 L 194,93 L 194,92 L 195,92 L 195,91 L 194,91 L 194,90 L 194,89 L 194,88 L 193,88 L 193,87 L 193,86 L 192,86 L 192,85 L 192,84 L 191,84 L 191,83 L 191,82 L 191,81 L 192,81 L 191,81 L 191,80 L 190,80 L 190,79 L 190,78 L 191,78 L 190,78 L 190,77 L 190,76 L 191,76 L 191,75 L 191,74 L 191,73 L 192,73 L 191,73 L 191,72 L 191,71 L 190,71 L 190,70 L 190,69 L 189,68 L 189,67 L 189,66 L 188,66 L 188,65 L 187,65 L 187,64 L 187,63 L 188,63 L 188,62 L 188,61 L 188,60 L 188,59 L 187,59 L 186,59 L 186,58 L 185,58 L 184,58 L 183,58 L 182,57 L 182,56 L 181,56 L 180,56 L 179,56 L 178,55 L 178,54 L 178,53 L 178,52 L 177,52 L 177,53 L 176,53 L 175,53 L 174,53 L 173,53 L 172,53 L 171,53 L 171,52 L 170,52 L 169,52 L 169,51 L 170,51 L 170,50 L 170,49 L 170,48 L 170,47 L 169,47 L 169,46 L 169,45 L 168,45 L 168,44 L 167,44 L 167,43 L 167,42 L 167,41 L 167,40 L 167,39 L 166,39 L 167,39 L 167,38 L 167,37 L 167,36 L 166,36 L 166,35 L 165,35 L 165,34 L 164,34 L 163,34 L 163,33 L 162,33 L 162,32 L 161,32 L 161,31 L 160,31 L 160,30 L 160,29 L 159,29 L 159,28 L 158,28 L 158,27 L 159,27 L 160,27 L 161,28 L 161,29 L 162,29 L 163,29 L 164,29 L 165,29 L 166,29 L 167,29 L 168,29 L 168,30 L 169,30 L 169,31 L 169,32 L 170,32 L 170,33 L 170,32 L 171,32 L 172,32 L 172,31 L 172,32 L 172,31 L 172,32 L 173,32 L 174,32 L 173,32 L 174,32 L 175,32 L 174,32 L 174,31 L 174,30 L 174,31 L 175,31 L 175,32 L 176,32 L 176,33 L 177,33 L 178,33 L 178,32 L 178,31 L 179,31 L 180,31 L 181,31 L 181,32 L 181,33 L 182,33 L 182,34 L 182,33 L 182,34 L 183,34 L 183,35 L 183,36 L 184,36 L 185,36 L 185,35 L 186,35 L 186,34 L 186,35 L 186,34 L 187,35 L 188,35 L 188,34 L 187,34 L 188,34 L 188,33 L 187,33 L 187,32 L 187,31 L 187,30 L 188,30 L 189,30 L 190,30 L 190,31 L 190,30 L 190,29 L 191,29 L 191,28 L 191,29 L 191,28 L 192,28 L 193,28 L 193,29 L 193,28 L 193,29 L 194,29 L 195,29 L 195,30 L 195,29 L 195,30 L 196,30 L 196,29 L 197,29 L 198,29 L 198,28 L 198,29 L 199,29 L 200,29 L 199,29 L 199,28 L 200,28 L 200,29 L 200,28 L 201,28 L 201,27 L 202,27 L 201,27 L 202,27 L 203,27 L 204,27 L 204,26 L 205,26 L 204,26 L 204,25 L 205,25 L 206,25 L 205,25 L 206,25 L 207,25 L 207,24 L 208,24 L 207,24 L 207,23 L 208,23 L 209,23 L 209,24 L 210,24 L 210,23 L 210,24 L 211,24 L 211,23 L 211,24 L 212,24 L 212,23 L 213,23 L 213,22 L 212,22 L 213,22 L 212,22 L 213,22 L 213,21 L 214,21 L 214,20 L 215,20 L 216,20 L 215,20 L 216,20 L 216,19 L 217,19 L 216,19 L 216,18 L 217,18 L 217,17 L 217,16 L 217,15 L 216,15 L 216,14 L 215,14 L 216,14 L 217,14 L 218,14 L 219,14 L 220,14 L 221,14 L 222,14 L 222,13 L 223,13 "},"pa": {"name": "Pará","path": "M 296,50 L 296,51 L 296,52 L 297,53 L 297,54 L 298,54 L 298,55 L 298,56 L 298,57 L 298,58 L 298,59 L 299,59 L 298,59 L 299,59 L 298,59 L 298,60 L 299,60 L 299,61 L 299,62 L 300,62 L 301,62 L 302,62 L 303,62 L 304,62 L 305,62 L 305,63 L 306,63 L 306,64 L 306,63 L 307,63 L 307,64 L 308,64 L 307,64 L 307,65 L 308,65 L 308,66 L 308,65 L 309,66 L 309,65 L 309,66 L 310,66 L 311,66 L 311,67 L 312,67 L 311,67 L 312,67 L 313,67 L 313,66 L 313,67 L 314,67 L 314,68 L 315,68 L 316,68 L 315,68 L 315,69 L 316,69 L 315,69 L 315,70 L 316,70 L 316,69 L 317,69 L 317,70 L 317,71 L 317,72 L 317,73 L 317,74 L 318,74 L 319,74 L 319,75 L 320,75 L 320,76 L 321,76 L 321,77 L 321,78 L 321,79 L 321,80 L 321,81 L 320,81 L 321,81 L 321,82 L 321,83 L 322,83 L 321,83 L 322,83 L 322,84 L 322,85 L 323,85 L 323,86 L 323,87 L 324,87 L 324,88 L 324,89 L 324,88 L 325,88 L 325,89 L 326,89 L 326,90 L 327,90 L 327,91 L 327,92 L 327,93 L 327,94 L 328,94 L 328,95 L 329,95 L 329,94 L 330,95 L 330,96 L 330,97 L 330,98 L 329,98 L 330,98 L 331,98 L 331,99 L 331,100 L 331,101 L 332,101 L 332,102 L 333,102 L 334,102 L 335,102 L 335,103 L 336,104 L 336,103 L 337,103 L 337,102 L 337,103 L 338,103 L 338,102 L 338,103 L 339,103 L 340,102 L 341,102 L 341,101 L 341,100 L 341,99 L 341,98 L 341,97 L 342,97 L 342,96 L 342,95 L 343,95 L 343,94 L 344,94 L 344,93 L 345,93 L 345,92 L 346,92 L 346,91 L 346,90 L 347,90 L 347,89 L 347,88 L 348,88 L 349,88 L 350,88 L 350,87 L 351,87 L 351,86 L 352,85 L 353,85 L 354,85 L 354,84 L 355,84 L 356,84 L 356,83 L 357,83 L 357,82 L 357,81 L 358,81 L 358,80 L 358,79 L 358,78 L 359,78 L 359,77 L 360,77 L 361,77 L 362,77 L 363,77 L 363,78 L 364,78 L 364,79 L 364,80 L 364,81 L 364,82 L 365,82 L 366,82 L 367,82 L 368,82 L 368,81 L 369,81 L 369,82 L 370,82 L 370,83 L 371,83 L 371,84 L 371,85 L 372,85 L 372,86 L 372,85 L 373,85 L 373,86 L 375,87 L 376,88 L 377,88 L 378,89 L 379,89 L 380,90 L 380,89 L 381,89 L 381,90 L 381,89 L 382,89 L 382,90 L 383,90 L 384,90 L 385,90 L 386,90 L 387,90 L 387,91 L 387,92 L 386,92 L 386,93 L 389,94 L 390,95 L 392,96 L 393,96 L 392,96 L 393,96 L 393,95 L 394,95 L 394,94 L 395,94 L 394,94 L 394,95 L 395,95 L 394,96 L 395,96 L 395,95 L 395,94 L 395,95 L 396,95 L 396,94 L 396,95 L 396,94 L 397,94 L 397,95 L 397,94 L 397,95 L 398,95 L 398,96 L 397,96 L 398,96 L 397,96 L 398,96 L 398,95 L 398,94 L 398,95 L 399,95 L 400,95 L 401,95 L 400,95 L 400,96 L 400,95 L 401,95 L 401,96 L 401,95 L 402,95 L 403,95 L 402,95 L 403,95 L 404,95 L 404,96 L 403,96 L 404,96 L 404,97 L 404,96 L 404,97 L 404,96 L 405,96 L 404,96 L 405,96 L 405,97 L 405,96 L 405,97 L 406,97 L 405,97 L 406,97 L 406,96 L 406,97 L 406,98 L 406,97 L 406,98 L 406,97 L 406,96 L 407,96 L 407,97 L 407,98 L 408,98 L 408,97 L 408,96 L 409,96 L 409,97 L 409,98 L 409,99 L 409,98 L 410,98 L 410,99 L 410,98 L 411,98 L 411,97 L 411,98 L 411,97 L 411,98 L 412,98 L 412,99 L 411,99 L 411,98 L 411,99 L 412,99 L 411,99 L 412,99 L 411,99 L 411,100 L 411,99 L 411,100 L 412,100 L 412,99 L 413,99 L 412,99 L 413,99 L 412,99 L 413,99 L 413,100 L 413,99 L 414,99 L 414,98 L 414,99 L 414,100 L 413,100 L 414,100 L 414,101 L 415,101 L 414,101 L 415,101 L 415,100 L 414,100 L 415,100 L 415,101 L 415,100 L 416,100 L 415,100 L 416,100 L 416,101 L 415,101 L 416,101 L 416,100 L 417,100 L 416,100 L 417,100 L 416,100 L 417,100 L 417,99 L 417,100 L 417,99 L 418,99 L 417,99 L 417,100 L 417,101 L 417,102 L 416,103 L 417,103 L 417,102 L 417,101 L 418,101 L 418,100 L 418,101 L 418,102 L 417,102 L 418,102 L 418,101 L 418,102 L 418,101 L 419,101 L 419,102 L 419,103 L 418,103 L 418,104 L 419,104 L 419,105 L 419,106 L 418,106 L 418,107 L 418,108 L 418,109 L 418,110 L 417,110 L 416,110 L 416,111 L 416,112 L 416,111 L 417,111 L 417,112 L 417,113 L 417,114 L 417,115 L 417,116 L 416,116 L 416,117 L 415,117 L 415,118 L 415,117 L 414,118 L 415,118 L 414,118 L 414,119 L 414,120 L 414,119 L 415,119 L 415,120 L 414,120 L 414,121 L 414,122 L 413,122 L 414,122 L 413,122 L 413,123 L 412,123 L 412,124 L 411,124 L 412,124 L 411,124 L 411,125 L 412,125 L 411,125 L 412,125 L 412,126 L 411,126 L 412,126 L 411,126 L 411,127 L 411,126 L 411,127 L 411,128 L 411,127 L 411,128 L 411,129 L 411,130 L 410,130 L 411,130 L 410,130 L 410,131 L 409,131 L 409,132 L 409,131 L 409,132 L 409,133 L 408,133 L 407,133 L 407,134 L 407,135 L 407,134 L 407,135 L 407,136 L 406,136 L 406,137 L 406,138 L 406,139 L 405,139 L 406,139 L 405,139 L 406,139 L 405,139 L 406,139 L 405,139 L 406,139 L 405,139 L 405,140 L 404,140 L 405,140 L 405,141 L 404,141 L 404,142 L 403,142 L 403,143 L 403,142 L 403,143 L 402,143 L 402,144 L 402,145 L 401,145 L 401,146 L 400,146 L 400,147 L 399,147 L 399,148 L 399,149 L 398,149 L 398,150 L 397,150 L 397,151 L 397,150 L 396,150 L 395,150 L 395,151 L 392,153 L 391,154 L 390,155 L 388,156 L 387,157 L 386,157 L 386,158 L 385,159 L 384,159 L 382,161 L 383,161 L 384,161 L 384,162 L 385,162 L 386,162 L 387,162 L 387,161 L 387,162 L 388,162 L 388,163 L 389,163 L 389,164 L 390,164 L 391,164 L 391,165 L 390,165 L 390,166 L 389,166 L 388,166 L 388,167 L 388,168 L 389,168 L 389,169 L 388,169 L 388,170 L 388,171 L 389,171 L 388,171 L 388,172 L 387,172 L 386,172 L 386,173 L 387,173 L 387,174 L 387,175 L 386,175 L 385,175 L 385,176 L 384,176 L 384,177 L 383,177 L 384,177 L 383,177 L 383,178 L 383,179 L 382,179 L 382,180 L 381,180 L 380,180 L 380,181 L 379,181 L 378,181 L 377,182 L 376,182 L 376,183 L 376,184 L 376,185 L 376,186 L 376,187 L 376,188 L 375,188 L 375,189 L 374,189 L 374,190 L 373,191 L 373,192 L 374,192 L 374,193 L 375,194 L 376,195 L 377,195 L 376,195 L 376,196 L 376,197 L 376,198 L 376,199 L 376,200 L 376,201 L 375,201 L 375,202 L 375,203 L 374,203 L 374,204 L 373,204 L 373,205 L 373,206 L 372,206 L 372,207 L 372,208 L 371,208 L 371,209 L 370,209 L 369,210 L 368,210 L 368,211 L 367,211 L 367,212 L 367,213 L 366,213 L 366,214 L 365,214 L 365,215 L 364,215 L 364,216 L 364,217 L 363,218 L 363,219 L 363,220 L 363,221 L 362,221 L 362,222 L 362,223 L 360,223 L 358,223 L 355,223 L 353,223 L 350,223 L 347,222 L 337,222 L 332,221 L 328,221 L 323,221 L 321,221 L 315,220 L 314,220 L 310,220 L 309,220 L 308,220 L 305,219 L 300,219 L 289,218 L 288,218 L 287,218 L 284,218 L 279,217 L 272,217 L 271,217 L 270,217 L 270,216 L 270,215 L 269,215 L 268,215 L 267,215 L 267,214 L 266,214 L 267,214 L 266,214 L 266,213 L 267,213 L 266,213 L 266,212 L 265,212 L 265,211 L 264,211 L 264,210 L 263,210 L 262,210 L 261,210 L 261,209 L 262,209 L 261,209 L 261,208 L 260,208 L 259,208 L 259,207 L 259,206 L 258,206 L 258,205 L 258,204 L 258,203 L 258,202 L 258,201 L 258,200 L 257,200 L 257,199 L 256,198 L 256,197 L 256,196 L 255,195 L 255,194 L 255,193 L 254,193 L 254,192 L 254,191 L 253,191 L 253,190 L 253,189 L 252,189 L 251,189 L 251,188 L 251,187 L 251,186 L 250,186 L 250,185 L 249,185 L 249,184 L 249,183 L 248,183 L 247,183 L 247,182 L 247,181 L 247,180 L 247,179 L 247,178 L 248,178 L 249,178 L 249,177 L 250,177 L 250,176 L 253,170 L 255,165 L 255,164 L 257,160 L 258,159 L 259,156 L 260,154 L 261,153 L 264,146 L 264,145 L 266,142 L 266,141 L 267,139 L 268,137 L 268,136 L 269,135 L 270,133 L 270,132 L 271,132 L 271,131 L 271,130 L 272,128 L 273,127 L 273,126 L 273,125 L 274,123 L 275,121 L 276,121 L 276,120 L 275,120 L 275,119 L 276,118 L 277,118 L 278,117 L 279,117 L 279,116 L 279,115 L 280,115 L 279,115 L 278,115 L 277,116 L 276,116 L 276,117 L 275,117 L 275,116 L 275,117 L 274,117 L 274,116 L 273,116 L 273,117 L 272,117 L 271,117 L 270,116 L 271,116 L 271,115 L 271,114 L 270,114 L 270,115 L 269,115 L 269,114 L 268,114 L 268,113 L 267,113 L 267,112 L 266,112 L 266,111 L 265,111 L 265,110 L 264,110 L 263,110 L 262,110 L 262,111 L 262,110 L 261,110 L 261,109 L 260,109 L 259,109 L 259,108 L 258,108 L 258,109 L 258,108 L 258,109 L 258,108 L 257,108 L 258,108 L 257,108 L 257,107 L 256,107 L 256,106 L 255,106 L 254,106 L 254,105 L 253,105 L 254,105 L 254,104 L 254,103 L 254,102 L 253,102 L 252,102 L 252,103 L 251,103 L 251,104 L 251,103 L 250,103 L 250,102 L 249,102 L 248,102 L 248,101 L 247,101 L 248,100 L 247,100 L 248,100 L 247,100 L 247,99 L 247,98 L 247,99 L 247,98 L 246,98 L 246,97 L 245,97 L 245,96 L 244,96 L 243,96 L 244,95 L 243,95 L 243,94 L 243,93 L 243,92 L 242,92 L 242,91 L 241,91 L 241,90 L 241,89 L 241,88 L 241,87 L 241,86 L 241,83 L 241,78 L 241,76 L 241,74 L 241,69 L 241,70 L 242,70 L 243,70 L 243,69 L 243,68 L 244,68 L 244,69 L 244,68 L 244,69 L 245,68 L 245,69 L 245,68 L 246,68 L 246,69 L 247,68 L 246,68 L 247,68 L 247,67 L 246,67 L 246,66 L 247,66 L 248,66 L 248,65 L 249,65 L 249,64 L 249,65 L 250,65 L 251,65 L 252,66 L 252,65 L 253,65 L 254,65 L 253,65 L 254,65 L 254,64 L 253,64 L 253,63 L 254,63 L 254,64 L 255,63 L 256,63 L 256,62 L 257,62 L 257,63 L 257,62 L 258,62 L 258,63 L 259,63 L 260,63 L 260,62 L 260,61 L 261,61 L 261,60 L 262,60 L 262,59 L 263,59 L 264,59 L 263,59 L 264,59 L 265,59 L 265,58 L 266,58 L 266,59 L 267,59 L 267,60 L 268,60 L 269,60 L 270,60 L 270,61 L 270,60 L 271,60 L 272,60 L 272,59 L 273,59 L 273,60 L 274,60 L 274,59 L 275,59 L 275,60 L 276,60 L 276,59 L 277,59 L 277,60 L 278,60 L 279,60 L 279,61 L 280,61 L 281,61 L 282,61 L 282,60 L 283,60 L 282,60 L 282,59 L 282,58 L 283,58 L 282,58 L 283,58 L 282,58 L 282,57 L 282,58 L 282,57 L 281,57 L 282,57 L 281,57 L 281,56 L 280,56 L 281,56 L 281,55 L 280,55 L 279,55 L 280,54 L 280,53 L 280,54 L 281,54 L 281,53 L 281,52 L 281,53 L 281,52 L 282,52 L 281,52 L 281,51 L 282,51 L 283,51 L 283,52 L 284,52 L 285,52 L 284,52 L 284,53 L 285,53 L 286,53 L 287,53 L 287,52 L 287,53 L 288,53 L 288,52 L 289,52 L 290,53 L 290,52 L 291,51 L 292,52 L 292,51 L 293,51 L 294,51 L 295,50 L 296,50 "},"ap": {"name": "Amapá","path": "M 348,31 L 348,32 L 349,32 L 350,32 L 350,33 L 350,34 L 350,35 L 349,35 L 350,35 L 349,35 L 350,35 L 350,36 L 350,37 L 350,38 L 349,38 L 350,39 L 350,40 L 350,41 L 350,42 L 350,43 L 351,43 L 351,44 L 351,45 L 351,46 L 352,46 L 352,47 L 351,47 L 352,47 L 352,48 L 352,49 L 353,49 L 353,50 L 353,51 L 353,52 L 353,51 L 353,52 L 354,52 L 354,53 L 354,54 L 355,54 L 355,55 L 355,56 L 355,57 L 355,56 L 356,56 L 357,56 L 358,56 L 359,56 L 359,57 L 360,57 L 360,58 L 360,59 L 361,59 L 361,60 L 361,61 L 362,61 L 363,61 L 363,62 L 364,62 L 365,62 L 365,63 L 366,63 L 366,64 L 366,65 L 366,66 L 366,67 L 366,68 L 366,69 L 366,70 L 366,71 L 365,71 L 365,72 L 365,73 L 365,74 L 364,74 L 364,75 L 363,75 L 363,76 L 363,77 L 362,77 L 361,77 L 360,77 L 359,77 L 359,78 L 358,78 L 358,79 L 358,80 L 358,81 L 357,81 L 357,82 L 357,83 L 356,83 L 356,84 L 355,84 L 354,84 L 354,85 L 353,85 L 352,85 L 351,86 L 351,87 L 350,87 L 350,88 L 349,88 L 348,88 L 347,88 L 347,89 L 347,90 L 346,90 L 346,91 L 346,92 L 345,92 L 345,93 L 344,93 L 344,94 L 343,94 L 343,95 L 342,95 L 342,96 L 342,97 L 341,97 L 341,98 L 341,99 L 341,100 L 341,101 L 341,102 L 340,102 L 339,103 L 338,103 L 338,102 L 338,103 L 337,103 L 337,102 L 337,103 L 336,103 L 336,104 L 335,103 L 335,102 L 334,102 L 333,102 L 332,102 L 332,101 L 331,101 L 331,100 L 331,99 L 331,98 L 330,98 L 329,98 L 330,98 L 330,97 L 330,96 L 330,95 L 329,94 L 329,95 L 328,95 L 328,94 L 327,94 L 327,93 L 327,92 L 327,91 L 327,90 L 326,90 L 326,89 L 325,89 L 325,88 L 324,88 L 324,89 L 324,88 L 324,87 L 323,87 L 323,86 L 323,85 L 322,85 L 322,84 L 322,83 L 321,83 L 322,83 L 321,83 L 321,82 L 321,81 L 320,81 L 321,81 L 321,80 L 321,79 L 321,78 L 321,77 L 321,76 L 320,76 L 320,75 L 319,75 L 319,74 L 318,74 L 317,74 L 317,73 L 317,72 L 317,71 L 317,70 L 317,69 L 316,69 L 316,70 L 315,70 L 315,69 L 316,69 L 315,69 L 315,68 L 316,68 L 315,68 L 314,68 L 314,67 L 313,67 L 313,66 L 313,67 L 312,67 L 311,67 L 312,67 L 311,67 L 311,66 L 310,66 L 309,66 L 309,65 L 309,66 L 308,65 L 308,66 L 308,65 L 307,65 L 307,64 L 308,64 L 307,64 L 307,63 L 306,63 L 306,64 L 306,63 L 305,63 L 305,62 L 304,62 L 303,62 L 302,62 L 301,62 L 300,62 L 299,62 L 299,61 L 299,60 L 298,60 L 298,59 L 299,59 L 298,59 L 299,59 L 298,59 L 298,58 L 298,57 L 298,56 L 298,55 L 298,54 L 297,54 L 297,53 L 298,52 L 299,52 L 299,53 L 299,54 L 300,54 L 301,54 L 303,56 L 306,56 L 309,55 L 310,55 L 310,54 L 310,55 L 311,55 L 311,54 L 312,54 L 311,54 L 312,54 L 312,53 L 313,53 L 312,54 L 313,54 L 312,54 L 313,54 L 314,54 L 314,55 L 315,55 L 316,55 L 317,55 L 316,55 L 317,55 L 317,54 L 318,54 L 319,54 L 319,55 L 320,55 L 319,55 L 319,56 L 320,56 L 321,56 L 322,56 L 323,56 L 324,56 L 325,56 L 324,55 L 325,55 L 324,55 L 325,55 L 326,54 L 327,54 L 327,53 L 328,53 L 328,52 L 329,52 L 329,51 L 329,50 L 329,49 L 330,49 L 330,48 L 330,47 L 331,47 L 331,46 L 332,46 L 331,46 L 331,45 L 332,45 L 332,44 L 332,43 L 332,42 L 333,42 L 333,41 L 334,41 L 334,40 L 335,40 L 335,39 L 335,38 L 336,38 L 335,38 L 336,38 L 335,38 L 336,38 L 336,37 L 336,36 L 337,36 L 337,35 L 337,34 L 337,35 L 338,35 L 338,34 L 338,33 L 339,33 L 339,32 L 340,32 L 340,31 L 341,31 L 341,30 L 342,30 L 342,29 L 342,28 L 343,27 L 343,26 L 343,25 L 344,25 L 345,25 L 345,26 L 346,26 L 346,27 L 347,27 L 347,28 L 348,29 L 348,30 L 348,31 "},"to": {"name": "Tocantins","path": "M 387,158 L 388,158 L 388,159 L 389,159 L 390,159 L 390,160 L 391,160 L 392,160 L 392,159 L 393,159 L 394,159 L 394,160 L 394,161 L 395,161 L 396,161 L 396,162 L 397,162 L 398,162 L 398,163 L 398,162 L 399,162 L 399,163 L 400,163 L 400,164 L 400,165 L 400,166 L 400,167 L 400,168 L 400,169 L 400,170 L 400,171 L 400,172 L 401,172 L 401,173 L 401,174 L 401,175 L 400,176 L 401,176 L 401,177 L 400,177 L 400,178 L 400,179 L 399,179 L 400,179 L 399,180 L 400,180 L 399,181 L 399,182 L 399,183 L 399,184 L 398,184 L 398,185 L 398,186 L 397,186 L 396,186 L 396,187 L 397,187 L 397,188 L 398,188 L 398,187 L 399,187 L 399,188 L 400,188 L 400,189 L 399,189 L 398,190 L 399,190 L 400,191 L 400,192 L 401,192 L 401,193 L 402,193 L 401,193 L 401,192 L 402,192 L 402,193 L 402,194 L 402,193 L 402,194 L 403,194 L 403,195 L 404,195 L 403,195 L 404,195 L 404,196 L 404,197 L 405,197 L 405,198 L 406,198 L 406,199 L 406,198 L 406,199 L 406,198 L 406,199 L 406,198 L 407,198 L 407,197 L 408,197 L 408,198 L 408,197 L 409,197 L 410,197 L 410,196 L 410,197 L 410,196 L 411,196 L 411,197 L 411,196 L 411,197 L 411,196 L 412,196 L 412,197 L 413,197 L 414,198 L 414,199 L 413,199 L 414,199 L 413,199 L 413,200 L 414,200 L 414,201 L 413,201 L 413,202 L 412,202 L 411,202 L 411,203 L 410,203 L 409,203 L 409,204 L 408,204 L 408,205 L 409,205 L 408,205 L 409,205 L 408,205 L 409,205 L 408,205 L 409,205 L 408,205 L 408,206 L 408,207 L 408,208 L 407,208 L 408,208 L 408,209 L 408,210 L 407,210 L 406,210 L 407,210 L 407,211 L 406,211 L 406,212 L 405,212 L 406,212 L 405,212 L 406,213 L 407,213 L 407,212 L 407,213 L 408,213 L 407,213 L 408,213 L 408,214 L 409,214 L 408,214 L 409,214 L 409,215 L 409,216 L 409,217 L 410,217 L 411,217 L 411,218 L 412,218 L 413,218 L 412,219 L 413,219 L 413,220 L 412,220 L 412,221 L 411,221 L 411,222 L 412,222 L 412,223 L 413,223 L 414,223 L 414,224 L 413,224 L 414,224 L 414,225 L 414,226 L 414,227 L 415,227 L 415,228 L 416,228 L 417,228 L 418,228 L 419,228 L 420,228 L 420,229 L 421,229 L 422,229 L 423,229 L 424,229 L 424,228 L 424,229 L 425,229 L 424,229 L 424,230 L 423,230 L 423,231 L 423,232 L 422,232 L 422,233 L 421,233 L 420,233 L 420,234 L 419,234 L 418,234 L 418,235 L 417,235 L 418,235 L 418,236 L 417,236 L 417,237 L 416,237 L 416,238 L 416,239 L 415,239 L 415,240 L 414,240 L 414,241 L 414,242 L 413,242 L 413,243 L 412,243 L 412,244 L 412,245 L 413,245 L 413,246 L 414,246 L 414,247 L 415,247 L 416,247 L 417,247 L 417,248 L 418,248 L 419,248 L 418,248 L 418,249 L 418,248 L 418,249 L 418,248 L 418,249 L 417,248 L 416,248 L 416,249 L 416,250 L 415,250 L 416,250 L 416,251 L 415,251 L 415,252 L 416,252 L 417,252 L 418,252 L 417,252 L 417,253 L 416,253 L 415,253 L 415,254 L 415,255 L 415,256 L 415,257 L 416,257 L 416,258 L 415,258 L 416,258 L 416,259 L 417,259 L 417,260 L 418,260 L 418,261 L 417,261 L 416,261 L 416,262 L 417,262 L 416,262 L 417,262 L 417,263 L 416,263 L 417,263 L 417,264 L 416,264 L 416,265 L 417,265 L 416,265 L 416,266 L 416,267 L 416,266 L 417,266 L 418,266 L 419,266 L 418,266 L 418,267 L 417,267 L 416,267 L 415,267 L 415,266 L 415,265 L 414,265 L 414,266 L 414,267 L 411,267 L 410,267 L 409,267 L 409,268 L 408,268 L 407,268 L 407,269 L 406,269 L 405,269 L 405,270 L 404,270 L 405,270 L 404,270 L 403,270 L 403,271 L 402,271 L 401,271 L 401,270 L 401,271 L 400,271 L 400,270 L 399,270 L 399,269 L 398,269 L 399,269 L 398,269 L 397,269 L 397,270 L 397,271 L 397,272 L 398,272 L 398,273 L 397,273 L 397,274 L 395,272 L 394,272 L 394,271 L 393,271 L 393,272 L 393,271 L 393,272 L 393,271 L 392,271 L 391,271 L 390,271 L 390,272 L 390,271 L 390,272 L 390,271 L 390,272 L 390,271 L 390,270 L 390,269 L 390,270 L 389,270 L 388,270 L 388,271 L 388,270 L 388,271 L 387,271 L 386,271 L 386,270 L 386,269 L 385,269 L 385,270 L 385,271 L 385,272 L 384,272 L 384,271 L 384,270 L 384,269 L 384,268 L 384,269 L 384,268 L 384,267 L 383,267 L 382,267 L 382,266 L 381,266 L 381,265 L 380,265 L 379,267 L 379,266 L 378,266 L 377,266 L 377,265 L 378,265 L 377,265 L 377,264 L 377,265 L 376,265 L 376,266 L 375,266 L 375,267 L 374,267 L 374,268 L 374,269 L 374,270 L 374,271 L 373,271 L 372,270 L 371,270 L 367,268 L 367,267 L 366,267 L 365,267 L 365,266 L 364,266 L 363,266 L 362,266 L 362,265 L 362,266 L 362,265 L 361,265 L 360,265 L 360,264 L 361,264 L 360,264 L 361,264 L 361,263 L 360,263 L 361,263 L 360,263 L 361,263 L 361,262 L 361,261 L 362,261 L 361,261 L 362,261 L 362,260 L 362,259 L 363,259 L 362,259 L 362,260 L 361,260 L 360,260 L 360,261 L 360,260 L 360,261 L 359,261 L 359,262 L 359,263 L 358,263 L 358,264 L 358,265 L 357,265 L 356,265 L 357,265 L 357,264 L 356,264 L 356,265 L 356,264 L 356,263 L 356,262 L 355,262 L 355,261 L 355,260 L 356,260 L 356,259 L 356,258 L 356,257 L 356,256 L 355,256 L 355,255 L 355,254 L 355,253 L 356,253 L 355,252 L 356,252 L 355,251 L 355,250 L 355,249 L 355,248 L 356,248 L 355,248 L 355,247 L 354,247 L 354,246 L 354,245 L 355,245 L 355,244 L 355,243 L 356,243 L 356,242 L 355,242 L 355,241 L 356,241 L 356,240 L 356,239 L 356,238 L 356,237 L 356,236 L 357,236 L 357,235 L 356,235 L 357,235 L 356,235 L 357,234 L 357,233 L 358,232 L 358,231 L 359,231 L 359,230 L 359,229 L 359,228 L 359,227 L 360,227 L 360,226 L 361,226 L 361,225 L 361,224 L 362,223 L 361,223 L 362,223 L 362,222 L 362,221 L 363,221 L 363,220 L 363,219 L 363,218 L 364,217 L 364,216 L 364,215 L 365,215 L 365,214 L 366,214 L 366,213 L 367,213 L 367,212 L 367,211 L 368,211 L 368,210 L 369,210 L 370,209 L 371,209 L 371,208 L 372,208 L 372,207 L 372,206 L 373,206 L 373,205 L 373,204 L 374,204 L 374,203 L 375,203 L 375,202 L 375,201 L 376,201 L 376,200 L 376,199 L 376,198 L 376,197 L 376,196 L 376,195 L 377,195 L 376,195 L 375,194 L 374,193 L 374,192 L 373,192 L 373,191 L 374,190 L 374,189 L 375,189 L 375,188 L 376,188 L 376,187 L 376,186 L 376,185 L 376,184 L 376,183 L 376,182 L 377,182 L 378,181 L 379,181 L 380,181 L 380,180 L 381,180 L 382,180 L 382,179 L 383,179 L 383,178 L 383,177 L 384,177 L 383,177 L 384,177 L 384,176 L 385,176 L 385,175 L 386,175 L 387,175 L 387,174 L 387,173 L 386,173 L 386,172 L 387,172 L 388,172 L 388,171 L 389,171 L 388,171 L 388,170 L 388,169 L 389,169 L 389,168 L 388,168 L 388,167 L 388,166 L 389,166 L 390,166 L 390,165 L 391,165 L 391,164 L 390,164 L 389,164 L 389,163 L 388,163 L 388,162 L 387,162 L 387,161 L 387,162 L 386,162 L 385,162 L 384,162 L 384,161 L 383,161 L 382,161 L 383,161 L 383,160 L 384,160 L 384,161 L 384,160 L 385,160 L 385,159 L 386,159 L 386,158 L 387,158 "},"ma": {"name": "Maranhão","path": "M 423,101 L 422,101 L 423,101 L 423,102 L 422,102 L 422,103 L 421,103 L 422,103 L 421,103 L 422,103 L 422,102 L 422,103 L 422,104 L 422,103 L 422,104 L 422,103 L 422,104 L 423,104 L 423,103 L 423,104 L 423,103 L 423,104 L 423,105 L 423,104 L 423,103 L 424,103 L 424,102 L 425,102 L 425,103 L 425,102 L 425,103 L 424,103 L 424,104 L 425,104 L 424,104 L 424,105 L 425,105 L 424,105 L 424,106 L 424,105 L 424,106 L 424,105 L 424,106 L 425,106 L 424,106 L 425,106 L 425,105 L 425,106 L 425,105 L 426,105 L 426,104 L 426,105 L 426,104 L 426,105 L 426,104 L 427,104 L 426,104 L 427,105 L 426,105 L 427,105 L 426,105 L 427,105 L 426,105 L 426,106 L 426,105 L 427,105 L 426,105 L 427,105 L 427,104 L 427,105 L 427,106 L 427,105 L 427,106 L 428,106 L 428,105 L 428,104 L 429,104 L 429,105 L 428,105 L 428,106 L 427,106 L 428,106 L 428,107 L 427,107 L 428,107 L 428,108 L 427,108 L 428,108 L 428,107 L 428,106 L 428,107 L 429,107 L 428,107 L 428,106 L 429,106 L 429,107 L 429,106 L 429,105 L 430,105 L 429,105 L 430,105 L 430,106 L 430,105 L 430,106 L 430,107 L 429,107 L 429,108 L 429,107 L 429,108 L 429,107 L 430,107 L 430,108 L 430,107 L 430,108 L 429,108 L 430,109 L 429,109 L 430,109 L 429,109 L 429,110 L 429,111 L 429,110 L 430,110 L 430,109 L 431,109 L 431,108 L 431,107 L 432,107 L 432,108 L 432,107 L 432,108 L 432,107 L 432,108 L 433,108 L 432,108 L 433,107 L 432,107 L 433,107 L 433,106 L 433,107 L 433,106 L 433,107 L 433,108 L 433,107 L 434,107 L 435,107 L 435,108 L 435,107 L 436,107 L 435,107 L 436,107 L 436,106 L 436,107 L 436,106 L 436,107 L 436,106 L 437,106 L 437,107 L 436,107 L 435,107 L 436,107 L 436,108 L 435,108 L 436,108 L 436,109 L 437,109 L 437,108 L 437,109 L 437,108 L 438,108 L 438,109 L 437,109 L 438,109 L 437,109 L 438,109 L 438,108 L 438,109 L 439,109 L 439,108 L 439,109 L 439,110 L 439,109 L 438,109 L 438,110 L 437,110 L 438,110 L 438,111 L 437,111 L 438,111 L 438,110 L 437,110 L 438,110 L 438,111 L 437,111 L 437,112 L 437,111 L 437,112 L 437,111 L 437,112 L 436,112 L 437,112 L 437,111 L 438,111 L 438,112 L 438,111 L 439,111 L 438,111 L 438,112 L 439,112 L 439,111 L 439,112 L 439,111 L 439,110 L 440,111 L 439,111 L 439,112 L 440,112 L 439,112 L 440,112 L 441,112 L 440,112 L 440,113 L 441,113 L 441,114 L 441,113 L 441,114 L 441,115 L 442,115 L 442,114 L 442,115 L 441,115 L 441,116 L 442,116 L 442,117 L 443,117 L 442,117 L 443,117 L 443,118 L 443,119 L 443,120 L 442,120 L 443,121 L 444,121 L 445,121 L 446,121 L 446,120 L 447,120 L 448,120 L 448,121 L 448,120 L 447,120 L 447,121 L 447,120 L 447,121 L 446,121 L 447,121 L 448,121 L 449,121 L 448,122 L 449,122 L 449,121 L 450,121 L 450,120 L 450,119 L 451,119 L 452,119 L 451,119 L 452,119 L 452,118 L 453,118 L 453,117 L 454,117 L 454,118 L 455,119 L 456,119 L 457,119 L 458,119 L 459,119 L 460,120 L 461,120 L 462,120 L 462,121 L 463,121 L 464,121 L 464,122 L 465,122 L 466,122 L 465,122 L 466,122 L 466,123 L 466,122 L 467,122 L 467,123 L 468,123 L 468,124 L 469,124 L 470,124 L 471,124 L 472,124 L 473,124 L 474,124 L 475,124 L 475,125 L 476,125 L 476,124 L 477,124 L 478,124 L 479,125 L 478,125 L 478,126 L 478,127 L 479,127 L 479,128 L 478,128 L 478,129 L 477,129 L 477,130 L 477,131 L 476,131 L 476,132 L 475,132 L 474,132 L 475,132 L 474,132 L 474,133 L 474,134 L 473,134 L 472,134 L 471,134 L 470,134 L 470,135 L 470,134 L 470,135 L 469,135 L 469,134 L 469,135 L 468,135 L 468,136 L 467,136 L 467,137 L 467,138 L 466,138 L 467,138 L 467,139 L 466,139 L 467,139 L 466,139 L 466,140 L 466,141 L 465,141 L 465,142 L 464,142 L 464,143 L 464,144 L 463,144 L 464,144 L 463,144 L 463,145 L 462,145 L 462,146 L 462,147 L 463,147 L 463,148 L 464,148 L 464,149 L 464,150 L 464,151 L 463,151 L 463,152 L 463,153 L 463,154 L 464,154 L 463,154 L 464,154 L 464,155 L 464,156 L 464,157 L 465,157 L 465,158 L 465,159 L 464,159 L 465,160 L 465,161 L 464,161 L 463,161 L 463,162 L 462,162 L 462,163 L 462,164 L 461,164 L 461,165 L 461,166 L 461,167 L 461,168 L 461,169 L 461,170 L 461,171 L 462,171 L 462,172 L 463,172 L 463,173 L 464,173 L 464,174 L 464,175 L 464,174 L 464,175 L 464,176 L 464,177 L 464,178 L 463,178 L 463,179 L 463,180 L 462,180 L 461,180 L 461,181 L 460,181 L 459,181 L 459,180 L 459,181 L 458,181 L 457,181 L 456,181 L 456,182 L 455,182 L 455,181 L 454,181 L 454,180 L 453,180 L 452,180 L 451,180 L 450,180 L 449,180 L 449,181 L 449,180 L 448,180 L 448,181 L 447,181 L 447,182 L 446,181 L 446,182 L 446,183 L 445,183 L 445,184 L 444,184 L 444,185 L 443,185 L 443,186 L 442,186 L 441,186 L 441,187 L 440,187 L 440,188 L 439,188 L 439,189 L 438,189 L 437,189 L 436,189 L 436,190 L 435,190 L 435,191 L 435,190 L 434,190 L 434,191 L 433,191 L 432,191 L 431,191 L 431,192 L 431,191 L 431,192 L 430,192 L 429,192 L 429,193 L 428,193 L 428,194 L 427,194 L 428,194 L 427,194 L 427,195 L 427,196 L 427,197 L 426,197 L 427,197 L 426,197 L 426,198 L 427,198 L 426,198 L 426,199 L 426,200 L 426,201 L 425,201 L 425,202 L 425,203 L 424,203 L 424,204 L 424,205 L 424,206 L 423,206 L 424,206 L 423,206 L 423,207 L 423,208 L 422,208 L 421,208 L 421,209 L 421,210 L 420,210 L 421,210 L 420,210 L 420,211 L 421,211 L 421,212 L 421,213 L 421,214 L 422,214 L 422,215 L 422,216 L 422,217 L 423,217 L 423,218 L 423,219 L 422,220 L 423,220 L 423,221 L 423,222 L 423,223 L 422,223 L 422,224 L 422,225 L 422,226 L 422,227 L 422,228 L 421,228 L 421,229 L 420,229 L 420,228 L 419,228 L 418,228 L 417,228 L 416,228 L 415,228 L 415,227 L 414,227 L 414,226 L 414,225 L 414,224 L 413,224 L 414,224 L 414,223 L 413,223 L 412,223 L 412,222 L 411,222 L 411,221 L 412,221 L 412,220 L 413,220 L 413,219 L 412,219 L 413,218 L 412,218 L 411,218 L 411,217 L 410,217 L 409,217 L 409,216 L 409,215 L 409,214 L 408,214 L 409,214 L 408,214 L 408,213 L 407,213 L 408,213 L 407,213 L 407,212 L 407,213 L 406,213 L 405,212 L 406,212 L 405,212 L 406,212 L 406,211 L 407,211 L 407,210 L 406,210 L 407,210 L 408,210 L 408,209 L 408,208 L 407,208 L 408,208 L 408,207 L 408,206 L 408,205 L 409,205 L 408,205 L 409,205 L 408,205 L 409,205 L 408,205 L 409,205 L 408,205 L 408,204 L 409,204 L 409,203 L 410,203 L 411,203 L 411,202 L 412,202 L 413,202 L 413,201 L 414,201 L 414,200 L 413,200 L 413,199 L 414,199 L 413,199 L 414,199 L 414,198 L 413,197 L 412,197 L 412,196 L 411,196 L 411,197 L 411,196 L 411,197 L 411,196 L 410,196 L 410,197 L 410,196 L 410,197 L 409,197 L 408,197 L 408,198 L 408,197 L 407,197 L 407,198 L 406,198 L 406,199 L 406,198 L 406,199 L 406,198 L 406,199 L 406,198 L 405,198 L 405,197 L 404,197 L 404,196 L 404,195 L 403,195 L 404,195 L 403,195 L 403,194 L 402,194 L 402,193 L 402,194 L 402,193 L 402,192 L 401,192 L 401,193 L 402,193 L 401,193 L 401,192 L 400,192 L 400,191 L 399,190 L 398,190 L 399,189 L 400,189 L 400,188 L 399,188 L 399,187 L 398,187 L 398,188 L 397,188 L 397,187 L 396,187 L 396,186 L 397,186 L 398,186 L 398,185 L 398,184 L 399,184 L 399,183 L 399,182 L 399,181 L 400,180 L 399,180 L 400,179 L 399,179 L 400,179 L 400,178 L 400,177 L 401,177 L 401,176 L 400,176 L 401,175 L 401,174 L 401,173 L 401,172 L 400,172 L 400,171 L 400,170 L 400,169 L 400,168 L 400,167 L 400,166 L 400,165 L 400,164 L 400,163 L 399,163 L 399,162 L 398,162 L 398,163 L 398,162 L 397,162 L 396,162 L 396,161 L 395,161 L 394,161 L 394,160 L 394,159 L 393,159 L 392,159 L 392,160 L 391,160 L 390,160 L 390,159 L 389,159 L 388,159 L 388,158 L 387,158 L 386,158 L 386,159 L 385,159 L 385,160 L 384,160 L 384,161 L 384,160 L 383,160 L 383,161 L 382,161 L 384,159 L 385,159 L 386,158 L 386,157 L 387,157 L 388,156 L 390,155 L 391,154 L 392,153 L 394,152 L 395,151 L 395,150 L 396,150 L 397,150 L 397,151 L 397,150 L 398,150 L 398,149 L 399,149 L 399,148 L 399,147 L 400,147 L 400,146 L 401,146 L 401,145 L 402,145 L 402,144 L 402,143 L 403,143 L 403,142 L 403,143 L 403,142 L 404,142 L 404,141 L 405,141 L 405,140 L 404,140 L 405,140 L 405,139 L 406,139 L 405,139 L 406,139 L 405,139 L 406,139 L 405,139 L 406,139 L 405,139 L 406,139 L 406,138 L 406,137 L 406,136 L 407,136 L 407,135 L 407,134 L 407,135 L 407,134 L 407,133 L 408,133 L 409,133 L 409,132 L 409,131 L 409,132 L 409,131 L 410,131 L 410,130 L 411,130 L 410,130 L 411,130 L 411,129 L 411,128 L 411,127 L 411,128 L 411,127 L 411,126 L 411,127 L 411,126 L 412,126 L 411,126 L 412,126 L 412,125 L 411,125 L 412,125 L 411,125 L 411,124 L 412,124 L 411,124 L 412,124 L 412,123 L 413,123 L 413,122 L 414,122 L 413,122 L 414,122 L 414,121 L 414,120 L 415,120 L 415,119 L 414,119 L 414,120 L 414,119 L 414,118 L 415,118 L 414,118 L 415,117 L 415,118 L 415,117 L 416,117 L 416,116 L 417,116 L 417,115 L 417,114 L 417,113 L 417,112 L 417,111 L 416,111 L 416,112 L 416,111 L 416,110 L 417,110 L 418,110 L 418,109 L 418,108 L 418,107 L 418,106 L 419,106 L 419,105 L 419,104 L 418,104 L 418,103 L 419,103 L 419,102 L 419,103 L 419,102 L 420,102 L 420,103 L 420,102 L 420,101 L 420,102 L 420,101 L 420,102 L 420,101 L 421,101 L 421,102 L 421,101 L 421,102 L 420,102 L 421,102 L 420,102 L 421,102 L 420,102 L 420,103 L 420,102 L 421,103 L 421,102 L 421,103 L 421,104 L 421,103 L 421,102 L 422,102 L 422,101 L 423,101 "},"pi": {"name": "Piauí","path": "M 479,125 L 480,125 L 480,126 L 481,126 L 481,127 L 482,127 L 483,127 L 484,127 L 485,127 L 485,128 L 486,128 L 486,129 L 486,130 L 485,130 L 485,131 L 485,132 L 484,132 L 484,133 L 484,134 L 485,134 L 485,135 L 486,135 L 485,135 L 485,136 L 485,137 L 485,138 L 486,138 L 487,138 L 486,138 L 486,139 L 486,140 L 486,141 L 487,141 L 487,142 L 486,142 L 487,142 L 486,142 L 486,143 L 487,142 L 487,143 L 488,143 L 488,142 L 488,143 L 488,144 L 489,144 L 488,145 L 488,146 L 488,147 L 488,148 L 487,148 L 487,149 L 487,150 L 486,150 L 487,150 L 487,151 L 487,152 L 486,152 L 486,153 L 487,153 L 486,153 L 486,154 L 487,154 L 486,154 L 487,154 L 487,155 L 488,155 L 488,156 L 488,157 L 489,157 L 490,157 L 490,158 L 491,158 L 491,159 L 491,160 L 491,161 L 491,162 L 491,163 L 491,164 L 491,165 L 491,166 L 491,167 L 491,168 L 491,169 L 492,169 L 492,170 L 491,170 L 491,171 L 492,171 L 492,172 L 492,173 L 492,174 L 493,174 L 493,175 L 493,176 L 493,177 L 493,178 L 494,178 L 494,179 L 495,179 L 495,180 L 496,180 L 497,180 L 497,181 L 498,181 L 499,181 L 498,181 L 498,182 L 498,183 L 498,184 L 498,185 L 497,185 L 497,186 L 497,187 L 497,188 L 496,188 L 496,189 L 495,190 L 494,190 L 494,191 L 494,192 L 495,192 L 495,193 L 495,194 L 494,194 L 495,195 L 496,195 L 496,196 L 496,197 L 496,198 L 495,199 L 496,199 L 496,200 L 495,200 L 494,200 L 494,201 L 493,201 L 493,202 L 492,202 L 492,203 L 491,203 L 491,204 L 490,204 L 490,203 L 490,204 L 489,204 L 489,205 L 488,205 L 488,206 L 487,206 L 487,207 L 486,207 L 485,207 L 485,208 L 484,208 L 484,209 L 483,209 L 483,210 L 482,211 L 481,211 L 481,212 L 480,212 L 480,213 L 479,213 L 479,214 L 478,214 L 478,215 L 477,215 L 476,215 L 475,215 L 475,216 L 474,216 L 473,216 L 472,216 L 471,216 L 471,217 L 470,217 L 470,218 L 469,218 L 469,219 L 468,219 L 467,219 L 466,219 L 466,220 L 465,220 L 464,220 L 464,219 L 463,219 L 463,218 L 463,217 L 462,217 L 461,217 L 460,217 L 459,217 L 458,217 L 458,218 L 458,217 L 457,217 L 457,216 L 456,216 L 456,215 L 455,215 L 455,216 L 454,216 L 453,217 L 452,217 L 452,218 L 451,218 L 451,219 L 450,219 L 450,220 L 450,221 L 451,221 L 451,222 L 452,223 L 453,223 L 453,224 L 452,224 L 452,225 L 453,225 L 453,226 L 452,226 L 452,227 L 451,227 L 451,228 L 451,229 L 450,229 L 450,230 L 450,231 L 449,231 L 449,232 L 448,232 L 448,231 L 448,232 L 447,233 L 447,234 L 446,234 L 445,234 L 444,234 L 444,233 L 443,233 L 443,234 L 442,234 L 441,234 L 441,235 L 441,234 L 440,234 L 440,235 L 439,235 L 439,236 L 438,236 L 438,237 L 437,237 L 437,238 L 436,238 L 435,238 L 434,238 L 434,237 L 433,237 L 432,237 L 431,237 L 431,236 L 430,236 L 429,236 L 429,235 L 428,235 L 428,234 L 428,233 L 428,232 L 429,232 L 428,232 L 428,231 L 428,230 L 427,230 L 427,229 L 426,229 L 426,228 L 426,227 L 425,227 L 425,228 L 424,228 L 424,229 L 423,229 L 422,229 L 421,229 L 421,228 L 422,228 L 422,227 L 422,226 L 422,225 L 422,224 L 422,223 L 423,223 L 423,222 L 423,221 L 423,220 L 422,220 L 423,219 L 423,218 L 423,217 L 422,217 L 422,216 L 422,215 L 422,214 L 421,214 L 421,213 L 421,212 L 421,211 L 420,211 L 420,210 L 421,210 L 420,210 L 421,210 L 421,209 L 421,208 L 422,208 L 423,208 L 423,207 L 423,206 L 424,206 L 423,206 L 424,206 L 424,205 L 424,204 L 424,203 L 425,203 L 425,202 L 425,201 L 426,201 L 426,200 L 426,199 L 426,198 L 427,198 L 426,198 L 426,197 L 427,197 L 426,197 L 427,197 L 427,196 L 427,195 L 427,194 L 428,194 L 427,194 L 428,194 L 428,193 L 429,193 L 429,192 L 430,192 L 431,192 L 431,191 L 431,192 L 431,191 L 432,191 L 433,191 L 434,191 L 434,190 L 435,190 L 435,191 L 435,190 L 436,190 L 436,189 L 437,189 L 438,189 L 439,189 L 439,188 L 440,188 L 440,187 L 441,187 L 441,186 L 442,186 L 443,186 L 443,185 L 444,185 L 444,184 L 445,184 L 445,183 L 446,183 L 446,182 L 446,181 L 447,182 L 447,181 L 448,181 L 448,180 L 449,180 L 449,181 L 449,180 L 450,180 L 451,180 L 452,180 L 453,180 L 454,180 L 454,181 L 455,181 L 455,182 L 456,182 L 456,181 L 457,181 L 458,181 L 459,181 L 459,180 L 459,181 L 460,181 L 461,181 L 461,180 L 462,180 L 463,180 L 463,179 L 463,178 L 464,178 L 464,177 L 464,176 L 464,175 L 464,174 L 464,175 L 464,174 L 464,173 L 463,173 L 463,172 L 462,172 L 462,171 L 461,171 L 461,170 L 461,169 L 461,168 L 461,167 L 461,166 L 461,165 L 461,164 L 462,164 L 462,163 L 462,162 L 463,162 L 463,161 L 464,161 L 465,161 L 465,160 L 464,159 L 465,159 L 465,158 L 465,157 L 464,157 L 464,156 L 464,155 L 464,154 L 463,154 L 464,154 L 463,154 L 463,153 L 463,152 L 463,151 L 464,151 L 464,150 L 464,149 L 464,148 L 463,148 L 463,147 L 462,147 L 462,146 L 462,145 L 463,145 L 463,144 L 464,144 L 463,144 L 464,144 L 464,143 L 464,142 L 465,142 L 465,141 L 466,141 L 466,140 L 466,139 L 467,139 L 466,139 L 467,139 L 467,138 L 466,138 L 467,138 L 467,137 L 467,136 L 468,136 L 468,135 L 469,135 L 469,134 L 469,135 L 470,135 L 470,134 L 470,135 L 470,134 L 471,134 L 472,134 L 473,134 L 474,134 L 474,133 L 474,132 L 475,132 L 474,132 L 475,132 L 476,132 L 476,131 L 477,131 L 477,130 L 477,129 L 478,129 L 478,128 L 479,128 L 479,127 L 478,127 L 478,126 L 478,125 L 479,125 "},"ce": {"name": "Ceará","path": "M 488,149 L 487,149 L 487,148 L 488,148 L 488,147 L 488,146 L 488,145 L 489,144 L 488,144 L 488,143 L 488,142 L 488,143 L 487,143 L 487,142 L 486,143 L 486,142 L 487,142 L 486,142 L 487,142 L 487,141 L 486,141 L 486,140 L 486,139 L 486,138 L 487,138 L 486,138 L 485,138 L 485,137 L 485,136 L 485,135 L 486,135 L 485,135 L 485,134 L 484,134 L 484,133 L 484,132 L 485,132 L 485,131 L 485,130 L 486,130 L 486,129 L 486,128 L 485,128 L 485,127 L 486,127 L 487,127 L 488,127 L 489,127 L 490,127 L 490,126 L 491,126 L 492,126 L 492,127 L 492,126 L 493,126 L 494,126 L 495,126 L 496,126 L 496,125 L 497,125 L 498,125 L 498,126 L 499,126 L 499,125 L 500,125 L 500,126 L 500,125 L 500,126 L 501,126 L 502,126 L 503,126 L 504,126 L 503,126 L 504,126 L 505,126 L 505,127 L 506,127 L 507,127 L 507,128 L 508,128 L 509,128 L 509,129 L 510,129 L 510,130 L 511,130 L 512,130 L 512,131 L 513,131 L 514,131 L 514,132 L 515,132 L 515,133 L 516,133 L 517,134 L 518,134 L 519,134 L 519,135 L 520,135 L 520,136 L 521,136 L 521,137 L 522,137 L 522,138 L 523,138 L 524,138 L 525,138 L 525,139 L 526,139 L 526,140 L 527,140 L 527,141 L 528,141 L 528,142 L 529,142 L 529,143 L 530,143 L 530,144 L 530,145 L 531,145 L 531,146 L 532,146 L 533,146 L 533,147 L 534,147 L 534,148 L 535,148 L 535,149 L 536,149 L 536,150 L 537,150 L 537,151 L 538,151 L 539,151 L 540,151 L 540,152 L 541,152 L 542,153 L 542,154 L 541,154 L 539,154 L 538,155 L 537,155 L 536,155 L 536,156 L 536,157 L 535,157 L 535,158 L 535,159 L 535,160 L 534,160 L 535,160 L 534,160 L 534,161 L 533,161 L 534,161 L 534,162 L 533,162 L 533,163 L 532,163 L 532,164 L 531,164 L 531,165 L 530,165 L 530,166 L 531,166 L 531,167 L 530,167 L 530,168 L 530,169 L 529,169 L 529,170 L 528,170 L 528,171 L 527,171 L 526,171 L 525,171 L 525,172 L 525,173 L 524,173 L 524,174 L 523,174 L 524,174 L 523,174 L 524,175 L 523,175 L 524,175 L 523,175 L 524,175 L 524,176 L 524,177 L 523,177 L 523,178 L 523,179 L 522,179 L 523,179 L 522,179 L 522,180 L 523,180 L 523,181 L 522,181 L 522,182 L 521,182 L 521,183 L 521,184 L 522,184 L 522,185 L 522,186 L 523,186 L 523,187 L 524,187 L 524,188 L 524,189 L 523,189 L 523,190 L 523,191 L 522,191 L 523,191 L 522,191 L 523,191 L 522,191 L 522,192 L 522,193 L 522,192 L 522,193 L 521,193 L 520,193 L 520,194 L 519,194 L 518,194 L 518,195 L 519,195 L 518,195 L 518,196 L 518,195 L 517,195 L 517,196 L 516,196 L 516,195 L 516,194 L 515,194 L 515,193 L 514,193 L 514,194 L 514,193 L 513,193 L 513,192 L 512,192 L 511,192 L 511,191 L 511,190 L 510,190 L 510,191 L 510,190 L 509,190 L 509,189 L 508,189 L 508,188 L 507,188 L 506,188 L 505,188 L 505,189 L 505,188 L 505,189 L 504,189 L 503,189 L 502,189 L 501,189 L 501,188 L 500,188 L 499,188 L 499,189 L 498,189 L 497,189 L 497,188 L 496,188 L 497,188 L 497,187 L 497,186 L 497,185 L 498,185 L 498,184 L 498,183 L 498,182 L 498,181 L 499,181 L 498,181 L 497,181 L 497,180 L 496,180 L 495,180 L 495,179 L 494,179 L 494,178 L 493,178 L 493,177 L 493,176 L 493,175 L 493,174 L 492,174 L 492,173 L 492,172 L 492,171 L 491,171 L 491,170 L 492,170 L 492,169 L 491,169 L 491,168 L 491,167 L 491,166 L 491,165 L 491,164 L 491,163 L 491,162 L 491,161 L 491,160 L 491,159 L 491,158 L 490,158 L 490,157 L 489,157 L 488,157 L 488,156 L 488,155 L 487,155 L 487,154 L 486,154 L 487,154 L 486,154 L 486,153 L 487,153 L 486,153 L 486,152 L 487,152 L 487,151 L 487,150 L 486,150 L 487,150 L 487,149 L 488,149 "},"rn": {"name": "Rio Grande do Norte","path": "M 542,154 L 543,154 L 543,155 L 544,155 L 545,155 L 546,155 L 547,155 L 547,156 L 548,156 L 548,157 L 549,157 L 550,157 L 551,157 L 552,157 L 553,157 L 554,157 L 555,157 L 556,157 L 557,157 L 558,157 L 559,157 L 560,157 L 561,157 L 562,157 L 563,157 L 564,157 L 564,158 L 565,158 L 566,158 L 567,158 L 567,159 L 568,159 L 568,160 L 568,161 L 569,161 L 569,162 L 569,163 L 570,163 L 570,164 L 570,165 L 570,166 L 571,166 L 570,166 L 571,166 L 571,167 L 571,168 L 571,169 L 572,169 L 572,170 L 572,171 L 572,172 L 572,173 L 573,173 L 573,174 L 573,175 L 574,175 L 574,176 L 574,177 L 573,177 L 572,177 L 571,177 L 571,178 L 570,177 L 569,177 L 568,177 L 567,177 L 566,177 L 566,176 L 566,177 L 565,177 L 565,176 L 564,176 L 563,176 L 563,177 L 562,177 L 561,177 L 560,177 L 559,177 L 559,176 L 558,176 L 557,176 L 556,176 L 556,175 L 556,176 L 556,175 L 555,175 L 556,175 L 556,174 L 555,174 L 554,174 L 554,175 L 553,175 L 552,175 L 552,176 L 552,177 L 553,177 L 553,178 L 553,179 L 553,178 L 552,178 L 552,179 L 552,180 L 552,181 L 552,182 L 551,182 L 552,182 L 551,182 L 552,182 L 551,182 L 551,183 L 550,183 L 550,184 L 549,184 L 549,183 L 549,182 L 549,181 L 549,182 L 549,181 L 548,180 L 547,180 L 546,181 L 546,180 L 545,180 L 544,180 L 544,181 L 543,181 L 542,181 L 542,180 L 541,180 L 542,180 L 541,179 L 541,180 L 540,180 L 539,180 L 539,179 L 539,178 L 539,177 L 540,177 L 540,176 L 540,175 L 540,174 L 541,174 L 542,174 L 542,173 L 543,173 L 543,172 L 543,171 L 543,170 L 542,170 L 542,171 L 541,171 L 540,171 L 539,171 L 539,172 L 538,172 L 539,172 L 538,172 L 537,172 L 537,173 L 536,173 L 536,172 L 535,172 L 535,173 L 535,174 L 534,174 L 534,175 L 533,175 L 533,176 L 532,176 L 532,175 L 532,176 L 531,176 L 530,176 L 530,177 L 529,177 L 528,177 L 527,177 L 527,176 L 526,176 L 525,176 L 525,175 L 525,174 L 525,175 L 524,175 L 523,174 L 524,174 L 523,174 L 524,174 L 524,173 L 525,173 L 525,172 L 525,171 L 526,171 L 527,171 L 528,171 L 528,170 L 529,170 L 529,169 L 530,169 L 530,168 L 530,167 L 531,167 L 531,166 L 530,166 L 530,165 L 531,165 L 531,164 L 532,164 L 532,163 L 533,163 L 533,162 L 534,162 L 534,161 L 533,161 L 534,161 L 534,160 L 535,160 L 534,160 L 535,160 L 535,159 L 535,158 L 535,157 L 536,157 L 536,156 L 536,155 L 537,155 L 538,155 L 539,154 L 541,154 L 542,154 "},"pb": {"name": "Paraíba","path": "M 542,170 L 543,170 L 543,171 L 543,172 L 543,173 L 542,173 L 542,174 L 541,174 L 540,174 L 540,175 L 540,176 L 540,177 L 539,177 L 539,178 L 539,179 L 539,180 L 540,180 L 541,180 L 541,179 L 542,180 L 541,180 L 542,180 L 542,181 L 543,181 L 544,181 L 544,180 L 545,180 L 546,180 L 546,181 L 547,180 L 548,180 L 548,181 L 549,181 L 549,182 L 549,181 L 549,182 L 549,183 L 549,184 L 550,184 L 550,183 L 551,183 L 551,182 L 552,182 L 551,182 L 552,182 L 551,182 L 552,182 L 552,181 L 552,180 L 552,179 L 552,178 L 553,178 L 553,179 L 553,178 L 553,177 L 552,177 L 552,176 L 552,175 L 553,175 L 554,175 L 554,174 L 555,174 L 556,174 L 556,175 L 555,175 L 556,175 L 556,176 L 556,175 L 556,176 L 557,176 L 558,176 L 559,176 L 559,177 L 560,177 L 561,177 L 562,177 L 563,177 L 563,176 L 564,176 L 565,176 L 565,177 L 566,177 L 566,176 L 566,177 L 567,177 L 568,177 L 569,177 L 570,177 L 571,178 L 571,177 L 572,177 L 573,177 L 574,177 L 574,178 L 574,179 L 574,180 L 574,181 L 575,181 L 575,182 L 575,183 L 575,184 L 576,184 L 576,183 L 576,184 L 576,185 L 576,186 L 576,187 L 576,188 L 576,189 L 576,190 L 576,191 L 575,191 L 574,191 L 573,191 L 573,190 L 574,190 L 573,190 L 572,189 L 571,189 L 570,189 L 569,189 L 569,190 L 569,189 L 569,190 L 568,190 L 567,190 L 566,190 L 566,191 L 566,192 L 566,193 L 565,193 L 564,193 L 564,194 L 564,193 L 563,193 L 563,194 L 562,194 L 561,194 L 561,195 L 560,195 L 559,195 L 558,195 L 557,195 L 556,194 L 556,195 L 555,195 L 554,195 L 553,195 L 553,196 L 553,197 L 552,197 L 552,196 L 551,196 L 551,197 L 551,198 L 551,199 L 550,199 L 551,199 L 550,199 L 550,200 L 549,200 L 548,200 L 548,201 L 547,201 L 546,201 L 546,202 L 545,202 L 545,201 L 544,201 L 545,201 L 544,201 L 544,200 L 543,200 L 543,199 L 544,199 L 543,199 L 544,199 L 543,199 L 543,198 L 543,197 L 542,197 L 541,197 L 541,196 L 542,196 L 542,195 L 543,195 L 543,194 L 544,194 L 543,194 L 543,193 L 543,192 L 544,192 L 544,191 L 545,191 L 546,191 L 546,190 L 545,190 L 545,189 L 544,189 L 543,188 L 542,188 L 541,188 L 541,189 L 540,189 L 539,189 L 539,190 L 538,190 L 538,191 L 537,191 L 536,191 L 536,192 L 535,192 L 535,193 L 535,192 L 534,192 L 534,193 L 534,192 L 534,193 L 533,193 L 533,194 L 532,194 L 532,195 L 531,195 L 531,194 L 531,195 L 530,195 L 529,195 L 528,195 L 527,195 L 527,194 L 527,193 L 526,193 L 526,194 L 525,194 L 524,194 L 523,194 L 523,193 L 522,193 L 522,192 L 522,191 L 523,191 L 522,191 L 523,191 L 522,191 L 523,191 L 523,190 L 523,189 L 524,189 L 524,188 L 524,187 L 523,187 L 523,186 L 522,186 L 522,185 L 522,184 L 521,184 L 521,183 L 521,182 L 522,182 L 522,181 L 523,181 L 523,180 L 522,180 L 522,179 L 523,179 L 522,179 L 523,179 L 523,178 L 523,177 L 524,177 L 524,176 L 524,175 L 523,175 L 524,175 L 523,175 L 524,175 L 525,175 L 525,174 L 525,175 L 525,176 L 526,176 L 527,176 L 527,177 L 528,177 L 529,177 L 530,177 L 530,176 L 531,176 L 532,176 L 532,175 L 532,176 L 533,176 L 533,175 L 534,175 L 534,174 L 535,174 L 535,173 L 535,172 L 536,172 L 536,173 L 537,173 L 537,172 L 538,172 L 539,172 L 538,172 L 539,172 L 539,171 L 540,171 L 541,171 L 542,171 L 542,170 "},"pe": {"name": "Pernambuco","path": "M 542,188 L 543,188 L 544,189 L 545,189 L 545,190 L 546,190 L 546,191 L 545,191 L 544,191 L 544,192 L 543,192 L 543,193 L 543,194 L 544,194 L 543,194 L 543,195 L 542,195 L 542,196 L 541,196 L 541,197 L 542,197 L 543,197 L 543,198 L 543,199 L 544,199 L 543,199 L 544,199 L 543,199 L 543,200 L 544,200 L 544,201 L 545,201 L 544,201 L 545,201 L 545,202 L 546,202 L 546,201 L 547,201 L 548,201 L 548,200 L 549,200 L 550,200 L 550,199 L 551,199 L 550,199 L 551,199 L 551,198 L 551,197 L 551,196 L 552,196 L 552,197 L 553,197 L 553,196 L 553,195 L 554,195 L 555,195 L 556,195 L 556,194 L 557,195 L 558,195 L 559,195 L 560,195 L 561,195 L 561,194 L 562,194 L 563,194 L 563,193 L 564,193 L 564,194 L 564,193 L 565,193 L 566,193 L 566,192 L 566,191 L 566,190 L 567,190 L 568,190 L 569,190 L 569,189 L 569,190 L 569,189 L 570,189 L 571,189 L 572,189 L 573,190 L 574,190 L 573,190 L 573,191 L 574,191 L 575,191 L 576,191 L 576,192 L 576,193 L 575,193 L 576,193 L 576,194 L 576,195 L 575,195 L 576,195 L 575,195 L 576,195 L 576,196 L 576,197 L 576,198 L 575,198 L 575,199 L 575,200 L 574,200 L 574,201 L 574,202 L 574,203 L 574,204 L 573,204 L 573,205 L 573,206 L 573,205 L 573,206 L 572,206 L 572,207 L 572,208 L 572,209 L 571,209 L 571,210 L 572,210 L 571,210 L 570,210 L 569,210 L 568,210 L 568,209 L 567,209 L 566,209 L 565,209 L 565,210 L 564,210 L 563,210 L 562,210 L 563,210 L 562,210 L 562,209 L 562,210 L 561,210 L 560,210 L 559,210 L 558,210 L 558,211 L 558,212 L 557,212 L 557,213 L 556,213 L 556,214 L 555,214 L 554,214 L 555,215 L 554,215 L 553,215 L 554,215 L 553,215 L 552,215 L 552,216 L 551,216 L 552,216 L 551,216 L 550,216 L 549,215 L 548,216 L 548,215 L 547,215 L 547,216 L 546,216 L 546,217 L 545,217 L 545,216 L 545,215 L 544,215 L 543,215 L 542,215 L 542,214 L 541,214 L 541,213 L 540,213 L 540,212 L 539,212 L 539,211 L 538,211 L 537,211 L 537,212 L 536,212 L 536,211 L 536,212 L 536,211 L 536,212 L 536,211 L 536,210 L 535,210 L 534,210 L 534,211 L 534,212 L 533,212 L 533,213 L 532,213 L 532,214 L 531,214 L 530,214 L 530,215 L 529,215 L 529,216 L 528,216 L 528,215 L 528,214 L 527,214 L 527,213 L 527,212 L 528,212 L 527,212 L 527,211 L 527,212 L 526,212 L 525,212 L 525,211 L 524,211 L 525,210 L 525,209 L 524,209 L 523,210 L 523,211 L 522,211 L 522,210 L 521,209 L 520,209 L 519,209 L 518,209 L 518,208 L 517,208 L 516,208 L 515,208 L 515,207 L 515,208 L 514,208 L 514,207 L 514,206 L 514,205 L 513,205 L 512,205 L 512,206 L 511,206 L 510,206 L 510,207 L 509,207 L 508,207 L 508,208 L 508,209 L 507,209 L 506,209 L 505,209 L 505,210 L 505,211 L 506,211 L 505,211 L 505,212 L 504,212 L 503,212 L 503,213 L 502,213 L 501,213 L 501,212 L 500,212 L 500,213 L 500,214 L 500,215 L 499,215 L 499,216 L 499,217 L 498,217 L 497,217 L 496,217 L 496,218 L 495,218 L 494,218 L 493,218 L 493,217 L 493,216 L 494,216 L 493,216 L 494,216 L 494,215 L 494,214 L 494,213 L 493,213 L 492,213 L 492,212 L 492,211 L 492,210 L 491,210 L 491,209 L 490,209 L 489,209 L 490,209 L 489,209 L 488,209 L 488,208 L 488,207 L 488,208 L 488,207 L 488,208 L 487,208 L 487,207 L 487,208 L 486,208 L 485,208 L 485,207 L 486,207 L 487,207 L 487,206 L 488,206 L 488,205 L 489,205 L 489,204 L 490,204 L 490,203 L 490,204 L 491,204 L 491,203 L 492,203 L 492,202 L 493,202 L 493,201 L 494,201 L 494,200 L 495,200 L 496,200 L 496,199 L 495,199 L 496,198 L 496,197 L 496,196 L 496,195 L 495,195 L 494,194 L 495,194 L 495,193 L 495,192 L 494,192 L 494,191 L 494,190 L 495,190 L 496,189 L 496,188 L 497,188 L 497,189 L 498,189 L 499,189 L 499,188 L 500,188 L 501,188 L 501,189 L 502,189 L 503,189 L 504,189 L 505,189 L 505,188 L 505,189 L 505,188 L 506,188 L 507,188 L 508,188 L 508,189 L 509,189 L 509,190 L 510,190 L 510,191 L 510,190 L 511,190 L 511,191 L 511,192 L 512,192 L 513,192 L 513,193 L 514,193 L 514,194 L 514,193 L 515,193 L 515,194 L 516,194 L 516,195 L 516,196 L 517,196 L 517,195 L 518,195 L 518,196 L 518,195 L 519,195 L 518,195 L 518,194 L 519,194 L 520,194 L 520,193 L 521,193 L 522,193 L 522,192 L 522,193 L 522,192 L 522,193 L 523,193 L 523,194 L 524,194 L 525,194 L 526,194 L 526,193 L 527,193 L 527,194 L 527,195 L 528,195 L 529,195 L 530,195 L 531,195 L 531,194 L 531,195 L 532,195 L 532,194 L 533,194 L 533,193 L 534,193 L 534,192 L 534,193 L 534,192 L 535,192 L 535,193 L 535,192 L 536,192 L 536,191 L 537,191 L 538,191 L 538,190 L 539,190 L 539,189 L 540,189 L 541,189 L 541,188 L 542,188 "},"al": {"name": "Alagoas","path": "M 567,209 L 568,209 L 568,210 L 569,210 L 570,210 L 571,210 L 571,211 L 571,212 L 570,212 L 570,213 L 569,213 L 569,214 L 569,215 L 568,215 L 568,216 L 567,216 L 568,216 L 567,216 L 567,217 L 566,217 L 566,218 L 565,218 L 565,219 L 564,219 L 564,220 L 564,221 L 563,221 L 562,221 L 562,222 L 562,221 L 562,222 L 561,222 L 561,223 L 561,224 L 560,224 L 560,225 L 559,225 L 559,226 L 559,227 L 558,227 L 558,228 L 557,228 L 556,229 L 555,229 L 555,230 L 555,231 L 555,232 L 554,232 L 553,232 L 553,231 L 552,231 L 552,232 L 552,231 L 552,230 L 551,230 L 551,229 L 550,229 L 549,229 L 548,229 L 548,228 L 547,228 L 547,227 L 546,227 L 546,226 L 546,225 L 545,225 L 544,225 L 544,224 L 543,224 L 542,224 L 542,223 L 541,223 L 540,223 L 540,222 L 539,222 L 538,222 L 537,222 L 537,221 L 536,221 L 536,220 L 535,220 L 535,221 L 535,220 L 534,220 L 533,219 L 532,219 L 532,218 L 531,218 L 530,218 L 529,218 L 529,217 L 528,216 L 529,216 L 529,215 L 530,215 L 530,214 L 531,214 L 532,214 L 532,213 L 533,213 L 533,212 L 534,212 L 534,211 L 534,210 L 535,210 L 536,210 L 536,211 L 536,212 L 536,211 L 536,212 L 536,211 L 536,212 L 537,212 L 537,211 L 538,211 L 539,211 L 539,212 L 540,212 L 540,213 L 541,213 L 541,214 L 542,214 L 542,215 L 543,215 L 544,215 L 545,215 L 545,216 L 545,217 L 546,217 L 546,216 L 547,216 L 547,215 L 548,215 L 548,216 L 549,215 L 549,216 L 550,216 L 551,216 L 552,216 L 551,216 L 552,216 L 552,215 L 553,215 L 554,215 L 553,215 L 554,215 L 555,215 L 554,214 L 555,214 L 556,214 L 556,213 L 557,213 L 557,212 L 558,212 L 558,211 L 558,210 L 559,210 L 560,210 L 561,210 L 562,210 L 562,209 L 562,210 L 563,210 L 562,210 L 563,210 L 564,210 L 565,210 L 565,209 L 566,209 L 567,209 "},"se": {"name": "Sergipe","path": "M 532,219 L 533,219 L 534,220 L 535,220 L 535,221 L 535,220 L 536,220 L 536,221 L 537,221 L 537,222 L 538,222 L 539,222 L 540,222 L 540,223 L 541,223 L 542,223 L 542,224 L 543,224 L 544,224 L 544,225 L 545,225 L 546,225 L 546,226 L 546,227 L 547,227 L 547,228 L 548,228 L 548,229 L 549,229 L 550,229 L 551,229 L 551,230 L 552,230 L 552,231 L 552,232 L 552,231 L 553,231 L 553,232 L 554,232 L 554,233 L 553,233 L 552,233 L 551,233 L 551,234 L 550,234 L 549,235 L 548,235 L 548,236 L 547,236 L 547,237 L 546,237 L 546,238 L 545,238 L 545,239 L 545,240 L 544,240 L 544,241 L 543,241 L 543,242 L 543,243 L 542,243 L 542,244 L 541,244 L 541,245 L 541,246 L 540,246 L 539,247 L 538,247 L 537,247 L 536,247 L 535,247 L 534,247 L 534,246 L 533,246 L 534,246 L 533,246 L 533,245 L 533,246 L 533,245 L 532,245 L 532,244 L 532,243 L 532,244 L 531,244 L 531,243 L 532,243 L 532,242 L 531,242 L 531,241 L 530,241 L 531,241 L 531,240 L 530,240 L 530,239 L 529,239 L 529,238 L 528,238 L 528,237 L 528,236 L 529,236 L 529,235 L 530,235 L 530,236 L 530,235 L 530,236 L 530,235 L 530,236 L 530,235 L 531,235 L 531,236 L 532,236 L 533,236 L 533,235 L 534,235 L 534,234 L 534,233 L 534,232 L 534,231 L 534,230 L 535,230 L 535,228 L 535,227 L 534,227 L 534,226 L 534,225 L 533,225 L 532,225 L 532,224 L 532,223 L 531,223 L 531,222 L 531,221 L 532,221 L 532,220 L 531,220 L 531,219 L 532,219 "},"ba": {"name": "Bahia","path": "M 513,205 L 514,205 L 514,206 L 514,207 L 514,208 L 515,208 L 515,207 L 515,208 L 516,208 L 517,208 L 518,208 L 518,209 L 519,209 L 520,209 L 521,209 L 522,210 L 522,211 L 523,211 L 523,210 L 524,209 L 525,209 L 525,210 L 524,211 L 525,211 L 525,212 L 526,212 L 527,212 L 527,211 L 527,212 L 528,212 L 527,212 L 527,213 L 527,214 L 528,214 L 528,215 L 528,216 L 529,217 L 529,218 L 530,218 L 531,218 L 532,218 L 532,219 L 531,219 L 531,220 L 532,220 L 532,221 L 531,221 L 531,222 L 531,223 L 532,223 L 532,224 L 532,225 L 533,225 L 534,225 L 534,226 L 534,227 L 535,227 L 535,228 L 535,230 L 534,230 L 534,231 L 534,232 L 534,233 L 534,234 L 534,235 L 533,235 L 533,236 L 532,236 L 531,236 L 531,235 L 530,235 L 530,236 L 530,235 L 530,236 L 530,235 L 530,236 L 530,235 L 529,235 L 529,236 L 528,236 L 528,237 L 528,238 L 529,238 L 529,239 L 530,239 L 530,240 L 531,240 L 531,241 L 530,241 L 531,241 L 531,242 L 532,242 L 532,243 L 531,243 L 531,244 L 532,244 L 532,243 L 532,244 L 532,245 L 533,245 L 533,246 L 533,245 L 533,246 L 534,246 L 533,246 L 534,246 L 534,247 L 535,247 L 536,247 L 537,247 L 538,247 L 539,247 L 540,246 L 541,246 L 540,246 L 540,247 L 540,248 L 539,248 L 539,249 L 538,250 L 538,251 L 538,252 L 537,252 L 537,253 L 537,254 L 536,254 L 536,255 L 535,255 L 535,256 L 535,257 L 534,257 L 534,258 L 533,258 L 533,259 L 533,260 L 532,260 L 532,261 L 531,261 L 531,262 L 531,263 L 530,263 L 530,264 L 529,264 L 529,265 L 528,265 L 528,266 L 527,266 L 527,267 L 526,267 L 525,267 L 524,267 L 523,267 L 523,268 L 522,268 L 523,268 L 522,268 L 521,268 L 521,269 L 521,268 L 521,269 L 521,268 L 521,269 L 520,269 L 520,270 L 519,270 L 518,271 L 518,272 L 518,273 L 519,273 L 519,272 L 519,273 L 519,274 L 519,275 L 519,276 L 519,275 L 519,276 L 519,275 L 519,276 L 519,277 L 519,276 L 518,276 L 518,277 L 518,278 L 518,279 L 518,280 L 519,280 L 519,281 L 518,281 L 518,282 L 518,283 L 518,284 L 518,285 L 518,286 L 518,287 L 517,287 L 517,288 L 517,289 L 517,290 L 517,291 L 517,292 L 517,293 L 517,294 L 518,294 L 518,295 L 518,296 L 518,297 L 518,298 L 518,299 L 518,300 L 518,301 L 518,302 L 518,303 L 519,303 L 519,304 L 519,305 L 519,306 L 519,307 L 520,307 L 519,307 L 519,308 L 519,309 L 519,310 L 518,310 L 518,311 L 518,312 L 517,312 L 517,313 L 517,314 L 518,314 L 517,314 L 517,315 L 517,316 L 517,317 L 516,317 L 516,318 L 516,319 L 516,320 L 516,321 L 516,322 L 516,323 L 515,323 L 515,324 L 515,325 L 515,326 L 515,327 L 515,328 L 515,329 L 515,330 L 515,331 L 515,332 L 516,332 L 516,333 L 515,333 L 515,334 L 514,334 L 514,335 L 513,335 L 513,336 L 512,336 L 511,336 L 511,337 L 510,337 L 510,338 L 510,339 L 509,339 L 509,340 L 509,341 L 508,341 L 508,342 L 508,341 L 507,341 L 506,340 L 505,339 L 504,339 L 503,338 L 502,338 L 502,337 L 501,337 L 501,336 L 500,336 L 501,335 L 501,334 L 501,333 L 500,333 L 500,332 L 499,332 L 499,331 L 499,332 L 499,331 L 498,331 L 498,332 L 498,331 L 497,331 L 497,330 L 497,329 L 496,329 L 495,329 L 495,328 L 496,328 L 495,328 L 495,327 L 496,327 L 496,326 L 496,325 L 496,324 L 496,323 L 496,322 L 497,322 L 497,321 L 498,321 L 499,321 L 499,322 L 499,321 L 500,321 L 500,322 L 500,321 L 500,320 L 499,320 L 499,319 L 500,319 L 499,319 L 499,318 L 500,318 L 500,317 L 501,317 L 502,317 L 501,317 L 501,316 L 502,316 L 502,315 L 503,315 L 503,314 L 504,314 L 504,313 L 504,314 L 504,313 L 505,313 L 505,312 L 505,311 L 506,311 L 506,310 L 505,310 L 505,309 L 504,309 L 503,309 L 503,308 L 502,308 L 501,308 L 501,307 L 501,306 L 500,306 L 499,306 L 499,307 L 499,306 L 499,307 L 499,306 L 498,306 L 497,306 L 496,306 L 495,306 L 495,305 L 494,305 L 494,304 L 494,305 L 493,305 L 494,305 L 493,305 L 493,304 L 492,304 L 492,305 L 491,305 L 491,304 L 490,304 L 490,305 L 489,305 L 488,305 L 488,306 L 487,306 L 487,305 L 486,305 L 485,305 L 485,303 L 485,302 L 484,302 L 484,301 L 483,301 L 483,300 L 479,297 L 479,296 L 479,297 L 478,297 L 477,297 L 477,298 L 477,297 L 476,297 L 475,297 L 475,298 L 475,297 L 474,297 L 474,296 L 473,296 L 473,297 L 473,296 L 473,297 L 473,296 L 473,297 L 472,297 L 472,296 L 471,296 L 470,296 L 470,295 L 469,295 L 468,295 L 468,294 L 467,294 L 466,294 L 466,293 L 465,293 L 464,292 L 463,292 L 463,291 L 462,291 L 461,291 L 460,291 L 460,290 L 459,290 L 458,290 L 458,291 L 458,290 L 458,291 L 457,291 L 456,291 L 456,292 L 455,292 L 456,292 L 455,292 L 455,293 L 455,292 L 454,292 L 453,292 L 453,291 L 452,291 L 451,291 L 450,291 L 450,290 L 450,289 L 450,288 L 450,287 L 451,287 L 451,286 L 451,285 L 451,286 L 450,286 L 450,285 L 450,286 L 450,285 L 450,286 L 450,285 L 450,286 L 450,285 L 450,286 L 450,285 L 449,285 L 448,285 L 447,285 L 446,285 L 445,285 L 445,284 L 445,285 L 444,285 L 443,285 L 442,285 L 442,286 L 442,285 L 442,286 L 441,286 L 440,286 L 439,286 L 439,287 L 438,287 L 438,288 L 437,288 L 436,288 L 437,288 L 437,289 L 436,289 L 436,290 L 436,289 L 436,290 L 435,290 L 436,290 L 435,290 L 434,290 L 435,290 L 434,290 L 434,291 L 433,291 L 433,292 L 432,292 L 432,291 L 432,292 L 432,291 L 432,292 L 432,291 L 432,292 L 431,292 L 430,292 L 430,293 L 429,293 L 429,294 L 428,294 L 427,294 L 427,295 L 427,294 L 426,294 L 426,295 L 425,295 L 425,296 L 425,295 L 425,296 L 424,296 L 424,297 L 423,297 L 422,297 L 421,297 L 421,298 L 420,298 L 420,299 L 419,299 L 419,298 L 419,299 L 419,298 L 420,297 L 420,296 L 421,296 L 421,295 L 421,294 L 420,294 L 420,293 L 420,292 L 420,291 L 420,290 L 421,290 L 420,290 L 420,289 L 421,289 L 420,289 L 421,289 L 420,288 L 420,287 L 421,287 L 421,286 L 422,286 L 421,286 L 421,285 L 420,285 L 420,284 L 419,284 L 420,284 L 419,284 L 419,283 L 418,283 L 417,283 L 417,282 L 417,281 L 417,280 L 417,279 L 417,278 L 416,278 L 417,278 L 417,277 L 417,276 L 418,276 L 418,275 L 417,275 L 417,274 L 417,273 L 418,273 L 418,272 L 419,272 L 420,272 L 420,271 L 419,271 L 418,271 L 418,272 L 417,272 L 416,272 L 416,271 L 416,270 L 416,269 L 416,268 L 416,267 L 417,267 L 418,267 L 419,267 L 419,266 L 418,266 L 417,266 L 416,266 L 416,267 L 416,266 L 416,265 L 417,265 L 416,265 L 416,264 L 417,264 L 417,263 L 416,263 L 417,263 L 417,262 L 416,262 L 417,262 L 416,262 L 416,261 L 417,261 L 418,261 L 418,260 L 417,260 L 417,259 L 416,259 L 416,258 L 415,258 L 416,258 L 416,257 L 415,257 L 415,256 L 415,255 L 415,254 L 415,253 L 416,253 L 417,253 L 417,252 L 418,252 L 417,252 L 416,252 L 415,252 L 415,251 L 416,251 L 416,250 L 415,250 L 416,250 L 416,249 L 416,248 L 417,248 L 418,249 L 418,248 L 418,249 L 418,248 L 418,249 L 418,248 L 419,248 L 418,248 L 417,248 L 417,247 L 416,247 L 415,247 L 414,247 L 414,246 L 413,246 L 413,245 L 412,245 L 412,244 L 412,243 L 413,243 L 413,242 L 414,242 L 414,241 L 414,240 L 415,240 L 415,239 L 416,239 L 416,238 L 416,237 L 417,237 L 417,236 L 418,236 L 418,235 L 417,235 L 418,235 L 418,234 L 419,234 L 420,234 L 420,233 L 421,233 L 422,233 L 422,232 L 423,232 L 423,231 L 423,230 L 424,230 L 424,229 L 425,229 L 424,229 L 424,228 L 425,228 L 425,227 L 426,227 L 426,228 L 426,229 L 427,229 L 427,230 L 428,230 L 428,231 L 428,232 L 429,232 L 428,232 L 428,233 L 428,234 L 428,235 L 429,235 L 429,236 L 430,236 L 431,236 L 431,237 L 432,237 L 433,237 L 434,237 L 434,238 L 435,238 L 436,238 L 437,238 L 437,237 L 438,237 L 438,236 L 439,236 L 439,235 L 440,235 L 440,234 L 441,234 L 441,235 L 441,234 L 442,234 L 443,234 L 443,233 L 444,233 L 444,234 L 445,234 L 446,234 L 447,234 L 447,233 L 448,232 L 448,231 L 448,232 L 449,232 L 449,231 L 450,231 L 450,230 L 450,229 L 451,229 L 451,228 L 451,227 L 452,227 L 452,226 L 453,226 L 453,225 L 452,225 L 452,224 L 453,224 L 453,223 L 452,223 L 451,222 L 451,221 L 450,221 L 450,220 L 450,219 L 451,219 L 451,218 L 452,218 L 452,217 L 453,217 L 454,216 L 455,216 L 455,215 L 456,215 L 456,216 L 457,216 L 457,217 L 458,217 L 458,218 L 458,217 L 459,217 L 460,217 L 461,217 L 462,217 L 463,217 L 463,218 L 463,219 L 464,219 L 464,220 L 465,220 L 466,220 L 466,219 L 467,219 L 468,219 L 469,219 L 469,218 L 470,218 L 470,217 L 471,217 L 471,216 L 472,216 L 473,216 L 474,216 L 475,216 L 475,215 L 476,215 L 477,215 L 478,215 L 478,214 L 479,214 L 479,213 L 480,213 L 480,212 L 481,212 L 481,211 L 482,211 L 483,210 L 483,209 L 484,209 L 484,208 L 485,208 L 486,208 L 487,208 L 487,207 L 487,208 L 488,208 L 488,207 L 488,208 L 488,207 L 488,208 L 488,209 L 489,209 L 490,209 L 489,209 L 490,209 L 491,209 L 491,210 L 492,210 L 492,211 L 492,212 L 492,213 L 493,213 L 494,213 L 494,214 L 494,215 L 494,216 L 493,216 L 494,216 L 493,216 L 493,217 L 493,218 L 494,218 L 495,218 L 496,218 L 496,217 L 497,217 L 498,217 L 499,217 L 499,216 L 499,215 L 500,215 L 500,214 L 500,213 L 500,212 L 501,212 L 501,213 L 502,213 L 503,213 L 503,212 L 504,212 L 505,212 L 505,211 L 506,211 L 505,211 L 505,210 L 505,209 L 506,209 L 507,209 L 508,209 L 508,208 L 508,207 L 509,207 L 510,207 L 510,206 L 511,206 L 512,206 L 512,205 L 513,205 "},"mg": {"name": "Minas Gerais","path": "M 478,375 L 478,376 L 477,376 L 477,377 L 476,377 L 477,377 L 476,377 L 476,378 L 476,377 L 476,378 L 475,378 L 474,378 L 474,379 L 475,379 L 474,379 L 474,380 L 473,380 L 473,381 L 473,382 L 473,383 L 473,384 L 472,384 L 473,384 L 472,384 L 472,385 L 472,386 L 471,386 L 471,387 L 471,388 L 471,387 L 471,388 L 472,388 L 472,389 L 471,389 L 470,389 L 469,389 L 469,390 L 468,390 L 467,390 L 467,391 L 466,391 L 465,391 L 465,392 L 464,392 L 463,392 L 463,393 L 462,393 L 461,393 L 462,393 L 461,393 L 461,394 L 460,394 L 460,393 L 459,393 L 458,393 L 457,393 L 457,392 L 457,393 L 457,392 L 457,393 L 456,393 L 455,393 L 455,394 L 454,394 L 454,393 L 454,394 L 453,394 L 453,393 L 453,394 L 453,393 L 453,394 L 453,393 L 452,393 L 452,394 L 452,393 L 452,394 L 452,393 L 452,394 L 451,394 L 452,394 L 451,394 L 451,393 L 451,394 L 450,394 L 449,394 L 448,394 L 448,395 L 447,395 L 446,395 L 446,396 L 446,395 L 446,396 L 445,396 L 444,396 L 445,396 L 444,396 L 443,396 L 442,396 L 441,396 L 442,396 L 441,396 L 441,397 L 440,397 L 439,397 L 439,398 L 438,398 L 438,397 L 438,398 L 437,398 L 436,398 L 436,399 L 435,399 L 434,399 L 433,399 L 432,399 L 432,400 L 431,400 L 431,401 L 430,401 L 429,401 L 429,402 L 428,401 L 429,401 L 428,401 L 429,401 L 428,401 L 427,401 L 427,402 L 426,402 L 426,401 L 425,401 L 425,402 L 425,401 L 425,400 L 425,401 L 424,401 L 424,400 L 424,401 L 425,401 L 425,402 L 424,402 L 423,402 L 423,403 L 424,403 L 424,402 L 424,403 L 424,402 L 424,403 L 424,402 L 424,403 L 424,404 L 424,403 L 424,404 L 423,404 L 424,404 L 423,404 L 422,404 L 422,405 L 422,404 L 421,404 L 421,405 L 420,405 L 419,405 L 418,405 L 418,404 L 418,405 L 418,404 L 418,405 L 417,405 L 416,405 L 415,405 L 415,404 L 415,403 L 416,403 L 415,403 L 414,403 L 414,402 L 415,402 L 415,401 L 414,401 L 415,401 L 414,401 L 415,401 L 414,401 L 414,400 L 415,400 L 414,400 L 413,400 L 413,399 L 412,399 L 411,398 L 411,397 L 410,397 L 410,396 L 411,396 L 410,396 L 411,396 L 411,395 L 412,395 L 412,394 L 411,394 L 410,394 L 410,393 L 410,394 L 411,393 L 412,393 L 412,392 L 411,392 L 411,391 L 411,390 L 411,389 L 412,389 L 412,388 L 413,388 L 413,387 L 413,386 L 413,385 L 412,385 L 412,384 L 412,385 L 412,384 L 411,384 L 410,384 L 409,384 L 408,384 L 407,384 L 406,384 L 406,383 L 406,382 L 405,382 L 405,381 L 406,381 L 405,381 L 405,382 L 405,381 L 405,380 L 404,380 L 404,379 L 404,378 L 403,377 L 403,376 L 403,375 L 404,375 L 404,374 L 405,374 L 405,373 L 404,373 L 404,372 L 403,372 L 403,371 L 402,371 L 402,370 L 402,369 L 403,369 L 403,368 L 403,367 L 402,367 L 402,366 L 401,366 L 400,365 L 400,364 L 399,364 L 399,365 L 398,365 L 397,365 L 397,364 L 396,364 L 395,364 L 395,365 L 395,364 L 394,364 L 394,365 L 394,366 L 393,366 L 393,365 L 393,366 L 392,366 L 392,367 L 391,367 L 391,366 L 390,366 L 390,365 L 389,365 L 389,366 L 389,367 L 388,367 L 388,366 L 387,366 L 386,366 L 386,367 L 385,367 L 385,366 L 384,366 L 384,367 L 383,367 L 382,367 L 381,367 L 381,368 L 380,368 L 380,369 L 380,370 L 380,371 L 380,370 L 379,370 L 379,369 L 379,368 L 379,367 L 378,367 L 377,367 L 377,368 L 377,369 L 376,369 L 375,369 L 375,368 L 375,367 L 374,367 L 374,366 L 374,365 L 375,365 L 375,364 L 374,364 L 373,364 L 372,364 L 372,363 L 371,363 L 370,363 L 370,364 L 369,364 L 368,364 L 367,364 L 366,364 L 365,364 L 364,364 L 364,363 L 363,363 L 362,363 L 361,363 L 360,363 L 360,362 L 359,362 L 358,362 L 357,362 L 356,362 L 356,363 L 355,363 L 355,364 L 354,364 L 353,364 L 352,364 L 352,365 L 351,365 L 351,366 L 351,365 L 350,365 L 351,365 L 351,364 L 350,364 L 351,364 L 351,363 L 350,363 L 350,362 L 350,361 L 350,360 L 351,360 L 351,359 L 352,359 L 352,358 L 351,358 L 351,357 L 352,357 L 353,358 L 353,357 L 352,357 L 352,356 L 353,356 L 353,355 L 354,355 L 354,354 L 354,353 L 355,353 L 356,353 L 357,353 L 357,352 L 358,352 L 358,351 L 358,350 L 358,349 L 359,349 L 359,348 L 360,348 L 360,347 L 360,346 L 361,346 L 362,346 L 363,346 L 364,346 L 364,345 L 365,345 L 366,345 L 367,345 L 367,346 L 368,346 L 368,345 L 369,345 L 370,345 L 369,345 L 370,345 L 370,344 L 371,344 L 372,344 L 372,345 L 373,345 L 373,346 L 373,345 L 374,345 L 375,345 L 375,344 L 375,343 L 376,343 L 376,342 L 377,342 L 377,343 L 378,343 L 378,342 L 379,342 L 379,341 L 380,341 L 381,341 L 381,342 L 382,342 L 383,342 L 384,342 L 384,341 L 385,341 L 385,342 L 386,342 L 387,342 L 388,342 L 389,342 L 389,341 L 389,342 L 390,342 L 390,343 L 391,343 L 392,343 L 393,343 L 393,344 L 394,343 L 395,343 L 395,342 L 395,343 L 396,343 L 396,342 L 397,342 L 397,341 L 397,342 L 397,341 L 398,341 L 398,340 L 399,340 L 399,339 L 399,340 L 399,339 L 399,340 L 400,340 L 400,339 L 401,339 L 401,338 L 402,338 L 402,337 L 402,336 L 402,335 L 401,335 L 401,334 L 402,334 L 401,334 L 402,334 L 401,334 L 402,334 L 402,333 L 402,332 L 403,332 L 402,332 L 403,332 L 402,332 L 403,332 L 403,331 L 402,331 L 402,330 L 401,330 L 400,330 L 399,330 L 399,329 L 399,328 L 399,327 L 399,328 L 400,328 L 400,327 L 401,327 L 400,327 L 401,327 L 400,327 L 401,327 L 401,326 L 402,326 L 401,326 L 401,325 L 401,326 L 401,325 L 402,325 L 402,326 L 402,325 L 401,325 L 402,325 L 401,325 L 402,325 L 403,325 L 402,325 L 403,325 L 402,325 L 402,324 L 403,324 L 404,324 L 403,324 L 404,324 L 404,323 L 404,324 L 404,323 L 405,323 L 404,323 L 405,323 L 404,323 L 404,322 L 404,321 L 403,321 L 404,321 L 404,320 L 403,321 L 403,320 L 404,320 L 403,320 L 403,319 L 403,318 L 403,319 L 403,318 L 402,318 L 402,317 L 402,318 L 402,317 L 401,317 L 400,317 L 400,316 L 400,315 L 400,314 L 401,314 L 401,313 L 402,313 L 402,312 L 402,311 L 401,311 L 402,311 L 402,310 L 402,309 L 403,309 L 404,309 L 403,309 L 404,309 L 403,309 L 404,309 L 404,308 L 405,308 L 406,308 L 407,308 L 408,307 L 409,307 L 409,306 L 409,305 L 408,305 L 408,304 L 408,303 L 407,303 L 407,302 L 407,301 L 408,301 L 408,300 L 409,300 L 409,299 L 408,299 L 408,298 L 408,299 L 407,299 L 407,298 L 408,297 L 408,296 L 407,296 L 408,296 L 408,295 L 409,295 L 410,295 L 410,296 L 411,296 L 412,296 L 413,296 L 413,295 L 413,294 L 413,293 L 413,292 L 412,292 L 413,292 L 413,291 L 414,291 L 414,292 L 415,292 L 416,292 L 416,293 L 416,294 L 417,294 L 418,294 L 419,294 L 420,294 L 420,293 L 420,294 L 421,294 L 421,295 L 421,296 L 420,296 L 420,297 L 419,298 L 419,299 L 419,298 L 419,299 L 420,299 L 420,298 L 421,298 L 421,297 L 422,297 L 423,297 L 424,297 L 424,296 L 425,296 L 425,295 L 425,296 L 425,295 L 426,295 L 426,294 L 427,294 L 427,295 L 427,294 L 428,294 L 429,294 L 429,293 L 430,293 L 430,292 L 431,292 L 432,292 L 432,291 L 432,292 L 432,291 L 432,292 L 432,291 L 432,292 L 433,292 L 433,291 L 434,291 L 434,290 L 435,290 L 434,290 L 435,290 L 436,290 L 435,290 L 436,290 L 436,289 L 436,290 L 436,289 L 437,289 L 437,288 L 436,288 L 437,288 L 438,288 L 438,287 L 439,287 L 439,286 L 440,286 L 441,286 L 442,286 L 442,285 L 442,286 L 442,285 L 443,285 L 444,285 L 445,285 L 445,284 L 445,285 L 446,285 L 447,285 L 448,285 L 449,285 L 450,285 L 450,286 L 450,285 L 450,286 L 450,285 L 450,286 L 450,285 L 450,286 L 450,285 L 450,286 L 451,286 L 451,285 L 451,286 L 451,287 L 450,287 L 450,288 L 450,289 L 450,290 L 450,291 L 451,291 L 452,291 L 453,291 L 453,292 L 454,292 L 455,292 L 455,293 L 455,292 L 456,292 L 455,292 L 456,292 L 456,291 L 457,291 L 458,291 L 458,290 L 458,291 L 458,290 L 459,290 L 460,290 L 460,291 L 461,291 L 462,291 L 463,291 L 463,292 L 464,292 L 465,293 L 466,293 L 466,294 L 467,294 L 468,294 L 468,295 L 469,295 L 470,295 L 470,296 L 471,296 L 472,296 L 472,297 L 473,297 L 473,296 L 473,297 L 473,296 L 473,297 L 473,296 L 474,296 L 474,297 L 475,297 L 475,298 L 475,297 L 476,297 L 477,297 L 477,298 L 477,297 L 478,297 L 479,297 L 479,296 L 479,297 L 480,298 L 481,298 L 483,300 L 483,301 L 484,301 L 484,302 L 485,302 L 485,303 L 485,304 L 485,305 L 486,305 L 487,305 L 487,306 L 488,306 L 488,305 L 489,305 L 490,305 L 490,304 L 491,304 L 491,305 L 492,305 L 492,304 L 493,304 L 493,305 L 494,305 L 493,305 L 494,305 L 494,304 L 494,305 L 495,305 L 495,306 L 496,306 L 497,306 L 498,306 L 499,306 L 499,307 L 499,306 L 499,307 L 499,306 L 500,306 L 501,306 L 501,307 L 501,308 L 502,308 L 503,308 L 503,309 L 504,309 L 505,309 L 505,310 L 506,310 L 506,311 L 505,311 L 505,312 L 505,313 L 504,313 L 504,314 L 504,313 L 504,314 L 503,314 L 503,315 L 502,315 L 502,316 L 501,316 L 501,317 L 502,317 L 501,317 L 500,317 L 500,318 L 499,318 L 499,319 L 500,319 L 499,319 L 499,320 L 500,320 L 500,321 L 500,322 L 500,321 L 499,321 L 499,322 L 499,321 L 498,321 L 497,321 L 497,322 L 496,322 L 496,323 L 496,324 L 496,325 L 496,326 L 496,327 L 495,327 L 495,328 L 496,328 L 495,328 L 495,329 L 496,329 L 497,329 L 497,330 L 497,331 L 498,331 L 498,332 L 498,331 L 499,331 L 499,332 L 499,331 L 499,332 L 500,332 L 500,333 L 501,333 L 501,334 L 501,335 L 500,336 L 501,336 L 501,337 L 501,336 L 500,336 L 499,336 L 498,336 L 497,336 L 497,335 L 496,335 L 496,336 L 495,336 L 495,337 L 494,337 L 493,337 L 493,336 L 493,337 L 493,336 L 492,336 L 492,337 L 492,336 L 491,336 L 491,337 L 493,338 L 493,339 L 492,339 L 492,338 L 492,339 L 491,339 L 491,338 L 491,339 L 490,339 L 489,339 L 489,340 L 488,340 L 489,340 L 488,340 L 489,340 L 488,340 L 488,341 L 488,342 L 488,343 L 487,343 L 489,343 L 490,343 L 490,344 L 489,344 L 489,345 L 489,346 L 490,346 L 491,346 L 491,347 L 491,348 L 490,348 L 490,349 L 490,348 L 489,348 L 489,349 L 488,349 L 488,348 L 487,348 L 486,348 L 487,348 L 486,348 L 486,349 L 487,349 L 486,349 L 487,349 L 488,349 L 488,350 L 489,350 L 490,350 L 489,351 L 489,352 L 490,352 L 490,353 L 491,353 L 491,354 L 491,355 L 491,356 L 490,356 L 490,357 L 491,357 L 490,357 L 490,358 L 489,358 L 489,357 L 489,358 L 489,359 L 488,359 L 488,360 L 487,360 L 487,361 L 487,362 L 488,362 L 487,362 L 487,363 L 487,364 L 486,364 L 485,364 L 486,365 L 485,365 L 486,365 L 485,365 L 485,366 L 485,367 L 484,367 L 484,368 L 483,368 L 482,368 L 481,368 L 480,368 L 479,368 L 479,369 L 478,369 L 478,370 L 479,370 L 479,371 L 478,371 L 478,372 L 479,372 L 478,372 L 478,373 L 479,374 L 479,373 L 479,374 L 478,374 L 479,374 L 478,374 L 478,375 "},"es": {"name": "Espírito Santo","path": "M 478,375 L 478,374 L 479,374 L 478,374 L 479,374 L 479,373 L 479,374 L 478,373 L 478,372 L 479,372 L 478,372 L 478,371 L 479,371 L 479,370 L 478,370 L 478,369 L 479,369 L 479,368 L 480,368 L 481,368 L 482,368 L 483,368 L 484,368 L 484,367 L 485,367 L 485,366 L 485,365 L 486,365 L 485,365 L 486,365 L 485,364 L 486,364 L 487,364 L 487,363 L 487,362 L 488,362 L 487,362 L 487,361 L 487,360 L 488,360 L 488,359 L 489,359 L 489,358 L 489,357 L 489,358 L 490,358 L 490,357 L 491,357 L 490,357 L 490,356 L 491,356 L 491,355 L 491,354 L 491,353 L 490,353 L 490,352 L 489,352 L 489,351 L 490,350 L 489,350 L 488,350 L 488,349 L 487,349 L 486,349 L 487,349 L 486,349 L 486,348 L 487,348 L 486,348 L 487,348 L 488,348 L 488,349 L 489,349 L 489,348 L 490,348 L 490,349 L 490,348 L 491,348 L 491,347 L 491,346 L 490,346 L 489,346 L 489,345 L 489,344 L 490,344 L 490,343 L 489,343 L 487,343 L 488,343 L 488,342 L 488,341 L 488,340 L 489,340 L 488,340 L 489,340 L 488,340 L 489,340 L 489,339 L 490,339 L 491,339 L 491,338 L 491,339 L 492,339 L 492,338 L 492,339 L 493,339 L 493,338 L 491,337 L 491,336 L 492,336 L 492,337 L 492,336 L 493,336 L 493,337 L 493,336 L 493,337 L 494,337 L 495,337 L 495,336 L 496,336 L 496,335 L 497,335 L 497,336 L 498,336 L 499,336 L 500,336 L 501,336 L 501,337 L 502,337 L 502,338 L 503,338 L 505,339 L 506,340 L 507,340 L 508,341 L 508,342 L 508,343 L 508,344 L 507,345 L 508,345 L 507,346 L 507,347 L 507,348 L 507,349 L 507,350 L 507,351 L 508,351 L 508,352 L 508,353 L 508,354 L 508,355 L 508,356 L 508,357 L 507,357 L 507,358 L 507,359 L 506,359 L 506,360 L 505,360 L 505,361 L 504,361 L 503,362 L 503,363 L 502,363 L 503,363 L 502,363 L 502,364 L 502,365 L 501,365 L 501,366 L 501,367 L 501,368 L 501,369 L 500,369 L 500,368 L 500,369 L 500,370 L 499,370 L 499,371 L 499,372 L 498,372 L 498,373 L 498,374 L 498,373 L 498,374 L 498,373 L 498,374 L 497,373 L 498,373 L 497,373 L 497,374 L 497,373 L 497,374 L 497,375 L 496,375 L 497,375 L 496,375 L 496,376 L 495,376 L 494,376 L 494,377 L 494,376 L 493,376 L 493,377 L 493,378 L 492,378 L 493,378 L 493,379 L 492,379 L 492,380 L 492,381 L 491,381 L 491,382 L 490,382 L 490,383 L 490,382 L 490,383 L 490,382 L 489,382 L 488,382 L 487,382 L 486,382 L 485,382 L 485,381 L 485,382 L 485,381 L 484,381 L 484,382 L 484,381 L 483,381 L 482,381 L 481,381 L 481,380 L 480,380 L 480,379 L 480,378 L 480,377 L 479,377 L 479,376 L 480,376 L 479,376 L 478,376 L 478,375 L 478,376 L 478,375 L 478,376 L 478,375 "},"rj": {"name": "Rio de Janeiro","path": "M 478,375 L 478,376 L 478,375 L 478,376 L 478,375 L 478,376 L 479,376 L 480,376 L 479,376 L 479,377 L 480,377 L 480,378 L 480,379 L 480,380 L 481,380 L 481,381 L 482,381 L 483,381 L 484,381 L 484,382 L 484,381 L 485,381 L 485,382 L 485,381 L 485,382 L 486,382 L 487,382 L 488,382 L 489,382 L 490,382 L 490,383 L 490,382 L 490,383 L 490,384 L 490,385 L 489,385 L 489,386 L 489,387 L 490,387 L 490,388 L 490,389 L 490,390 L 490,391 L 490,392 L 490,393 L 489,393 L 488,394 L 487,394 L 486,395 L 485,395 L 484,395 L 483,395 L 483,396 L 482,396 L 481,396 L 480,396 L 480,397 L 479,397 L 479,398 L 478,398 L 478,399 L 477,399 L 477,400 L 476,400 L 476,401 L 476,402 L 476,403 L 477,403 L 478,403 L 477,403 L 478,403 L 477,403 L 477,404 L 476,404 L 476,405 L 476,404 L 476,405 L 476,404 L 476,405 L 475,405 L 475,406 L 476,406 L 475,406 L 474,406 L 473,406 L 472,406 L 472,405 L 471,405 L 470,405 L 469,405 L 469,406 L 469,405 L 468,405 L 467,405 L 467,406 L 466,406 L 465,406 L 464,406 L 463,406 L 462,406 L 461,406 L 460,406 L 460,405 L 460,406 L 460,405 L 461,405 L 460,405 L 461,405 L 460,405 L 461,405 L 460,405 L 460,404 L 460,405 L 460,404 L 461,404 L 460,404 L 461,404 L 461,403 L 462,403 L 462,402 L 461,402 L 460,402 L 460,403 L 459,403 L 458,403 L 458,404 L 459,404 L 459,405 L 460,405 L 460,406 L 459,406 L 458,406 L 458,407 L 457,407 L 456,407 L 455,407 L 456,407 L 455,407 L 454,407 L 453,407 L 452,407 L 451,407 L 450,407 L 449,407 L 449,408 L 448,408 L 448,407 L 449,407 L 450,407 L 449,407 L 450,407 L 451,407 L 452,407 L 453,407 L 454,407 L 453,407 L 453,406 L 452,406 L 451,405 L 450,405 L 449,405 L 448,405 L 448,406 L 447,406 L 448,406 L 447,406 L 448,406 L 447,406 L 447,407 L 446,407 L 445,407 L 445,406 L 444,406 L 444,407 L 444,406 L 444,407 L 443,407 L 443,406 L 444,406 L 443,406 L 444,406 L 443,406 L 444,406 L 444,405 L 443,405 L 443,406 L 442,406 L 442,407 L 442,406 L 441,406 L 441,407 L 440,407 L 439,407 L 439,408 L 438,408 L 439,408 L 438,408 L 438,409 L 438,410 L 439,409 L 440,409 L 439,409 L 439,410 L 439,409 L 439,410 L 438,410 L 439,410 L 440,410 L 439,410 L 439,411 L 439,410 L 439,411 L 439,410 L 440,410 L 441,410 L 441,411 L 441,410 L 441,411 L 440,411 L 439,411 L 438,411 L 437,411 L 437,410 L 436,410 L 436,409 L 437,409 L 437,408 L 437,407 L 437,406 L 438,406 L 438,405 L 439,405 L 440,405 L 441,405 L 441,404 L 442,404 L 441,404 L 441,405 L 442,405 L 441,405 L 442,405 L 442,404 L 443,404 L 444,404 L 445,404 L 445,403 L 445,402 L 446,402 L 445,401 L 446,401 L 445,401 L 444,401 L 443,401 L 443,400 L 443,401 L 443,400 L 443,401 L 442,401 L 443,401 L 442,401 L 441,401 L 440,401 L 439,401 L 439,400 L 438,400 L 438,399 L 438,398 L 437,398 L 438,398 L 438,397 L 438,398 L 439,398 L 439,397 L 440,397 L 441,397 L 441,396 L 442,396 L 441,396 L 442,396 L 443,396 L 444,396 L 445,396 L 444,396 L 445,396 L 446,396 L 446,395 L 446,396 L 446,395 L 447,395 L 448,395 L 448,394 L 449,394 L 450,394 L 451,394 L 451,393 L 451,394 L 452,394 L 451,394 L 452,394 L 452,393 L 452,394 L 452,393 L 452,394 L 452,393 L 453,393 L 453,394 L 453,393 L 453,394 L 453,393 L 453,394 L 454,394 L 454,393 L 454,394 L 455,394 L 455,393 L 456,393 L 457,393 L 457,392 L 457,393 L 457,392 L 457,393 L 458,393 L 459,393 L 460,393 L 460,394 L 461,394 L 461,393 L 462,393 L 461,393 L 462,393 L 463,393 L 463,392 L 464,392 L 465,392 L 465,391 L 466,391 L 467,391 L 467,390 L 468,390 L 469,390 L 469,389 L 470,389 L 471,389 L 472,389 L 472,388 L 471,388 L 471,387 L 471,388 L 471,387 L 471,386 L 472,386 L 472,385 L 472,384 L 473,384 L 472,384 L 473,384 L 473,383 L 473,382 L 473,381 L 473,380 L 474,380 L 474,379 L 475,379 L 474,379 L 474,378 L 475,378 L 476,378 L 476,377 L 476,378 L 476,377 L 477,377 L 476,377 L 477,377 L 477,376 L 478,376 L 478,375 "},"sp": {"name": "São Paulo","path": "M 416,420 L 416,421 L 416,420 L 416,421 L 416,420 L 415,420 L 415,421 L 415,420 L 415,421 L 415,420 L 414,420 L 414,421 L 413,421 L 412,421 L 412,422 L 411,422 L 410,422 L 410,423 L 409,423 L 408,423 L 408,424 L 407,424 L 407,425 L 406,425 L 406,426 L 405,426 L 405,427 L 404,427 L 404,428 L 403,428 L 403,429 L 402,429 L 401,429 L 401,430 L 400,430 L 399,430 L 399,431 L 398,431 L 398,432 L 397,432 L 396,432 L 396,433 L 395,433 L 395,434 L 394,434 L 394,435 L 394,436 L 394,437 L 394,436 L 393,436 L 393,437 L 392,437 L 392,438 L 391,438 L 391,439 L 391,438 L 392,438 L 392,437 L 392,438 L 391,438 L 390,437 L 390,436 L 390,435 L 389,435 L 390,435 L 389,435 L 390,435 L 389,435 L 390,435 L 389,435 L 389,434 L 389,435 L 388,435 L 388,434 L 387,434 L 386,434 L 386,435 L 385,435 L 385,436 L 385,435 L 384,435 L 384,434 L 385,434 L 385,433 L 385,432 L 385,433 L 385,432 L 385,431 L 386,431 L 385,431 L 385,430 L 385,431 L 385,430 L 384,430 L 383,430 L 382,430 L 381,430 L 381,429 L 381,430 L 381,429 L 381,430 L 380,430 L 379,430 L 379,429 L 378,429 L 379,429 L 378,429 L 378,430 L 377,430 L 376,430 L 375,430 L 374,430 L 374,429 L 374,428 L 375,428 L 374,428 L 375,428 L 375,427 L 374,427 L 375,427 L 375,426 L 375,425 L 376,425 L 375,425 L 375,424 L 374,424 L 374,423 L 374,422 L 373,422 L 374,422 L 373,422 L 373,421 L 373,422 L 373,421 L 372,421 L 372,420 L 371,420 L 372,420 L 371,420 L 371,419 L 371,420 L 371,419 L 372,419 L 371,419 L 370,419 L 370,418 L 371,418 L 371,417 L 371,416 L 370,416 L 370,415 L 370,414 L 370,413 L 370,412 L 371,412 L 371,413 L 371,412 L 370,412 L 371,412 L 370,412 L 370,411 L 370,410 L 369,410 L 369,409 L 369,408 L 369,409 L 369,408 L 368,408 L 367,408 L 367,407 L 366,407 L 366,406 L 365,406 L 365,405 L 364,405 L 363,405 L 363,406 L 363,405 L 362,406 L 361,406 L 361,405 L 360,405 L 360,406 L 360,405 L 359,405 L 359,406 L 358,406 L 358,405 L 358,406 L 357,406 L 357,405 L 356,405 L 355,405 L 355,406 L 354,406 L 353,406 L 353,405 L 354,405 L 353,405 L 353,404 L 352,404 L 352,403 L 352,404 L 351,404 L 351,403 L 350,403 L 349,403 L 348,403 L 348,402 L 347,402 L 346,402 L 345,402 L 344,402 L 343,402 L 342,402 L 341,402 L 341,401 L 340,401 L 339,401 L 338,401 L 338,400 L 337,400 L 336,400 L 335,400 L 335,401 L 334,402 L 334,401 L 333,401 L 332,401 L 331,401 L 330,401 L 329,401 L 329,400 L 328,400 L 328,401 L 327,401 L 326,401 L 325,401 L 324,400 L 323,400 L 323,401 L 322,401 L 322,402 L 322,401 L 321,401 L 322,401 L 322,400 L 323,400 L 323,399 L 324,399 L 325,399 L 325,398 L 326,398 L 326,397 L 327,397 L 328,397 L 328,396 L 329,396 L 330,396 L 330,395 L 331,395 L 331,394 L 332,394 L 332,393 L 332,392 L 333,392 L 333,391 L 334,391 L 334,390 L 334,389 L 335,389 L 336,389 L 336,388 L 336,387 L 335,387 L 335,386 L 336,386 L 337,386 L 337,385 L 338,385 L 338,384 L 339,384 L 339,383 L 339,382 L 339,381 L 339,380 L 340,380 L 340,379 L 340,378 L 341,378 L 342,378 L 342,377 L 342,376 L 342,375 L 342,374 L 343,373 L 344,373 L 344,372 L 344,371 L 345,371 L 345,370 L 346,370 L 346,369 L 347,369 L 348,369 L 349,369 L 349,368 L 350,368 L 350,367 L 350,366 L 351,366 L 351,365 L 352,365 L 352,364 L 353,364 L 354,364 L 355,364 L 355,363 L 356,363 L 356,362 L 357,362 L 358,362 L 359,362 L 360,362 L 360,363 L 361,363 L 362,363 L 363,363 L 364,363 L 364,364 L 365,364 L 366,364 L 367,364 L 368,364 L 369,364 L 370,364 L 370,363 L 371,363 L 372,363 L 372,364 L 373,364 L 374,364 L 375,364 L 375,365 L 374,365 L 374,366 L 374,367 L 375,367 L 375,368 L 375,369 L 376,369 L 377,369 L 377,368 L 377,367 L 378,367 L 379,367 L 379,368 L 379,369 L 379,370 L 380,370 L 380,371 L 380,370 L 380,369 L 380,368 L 381,368 L 381,367 L 382,367 L 383,367 L 384,367 L 384,366 L 385,366 L 385,367 L 386,367 L 386,366 L 387,366 L 388,366 L 388,367 L 389,367 L 389,366 L 389,365 L 390,365 L 390,366 L 391,366 L 391,367 L 392,367 L 392,366 L 393,366 L 393,365 L 393,366 L 394,366 L 394,365 L 394,364 L 395,364 L 395,365 L 395,364 L 396,364 L 397,364 L 397,365 L 398,365 L 399,365 L 399,364 L 400,364 L 400,365 L 401,366 L 402,366 L 402,367 L 403,367 L 403,368 L 403,369 L 402,369 L 402,370 L 402,371 L 403,371 L 403,372 L 404,372 L 404,373 L 405,373 L 405,374 L 404,374 L 404,375 L 403,375 L 403,376 L 403,377 L 404,378 L 404,379 L 404,380 L 405,380 L 405,381 L 405,382 L 405,381 L 406,381 L 405,381 L 405,382 L 406,382 L 406,383 L 406,384 L 407,384 L 408,384 L 409,384 L 410,384 L 411,384 L 412,384 L 412,385 L 412,384 L 412,385 L 413,385 L 413,386 L 413,387 L 413,388 L 412,388 L 412,389 L 411,389 L 411,390 L 411,391 L 411,392 L 412,392 L 412,393 L 411,393 L 410,394 L 410,393 L 410,394 L 411,394 L 412,394 L 412,395 L 411,395 L 411,396 L 410,396 L 411,396 L 410,396 L 410,397 L 411,397 L 411,398 L 412,399 L 413,399 L 413,400 L 414,400 L 415,400 L 414,400 L 414,401 L 415,401 L 414,401 L 415,401 L 414,401 L 415,401 L 415,402 L 414,402 L 414,403 L 415,403 L 416,403 L 415,403 L 415,404 L 415,405 L 416,405 L 417,405 L 418,405 L 418,404 L 418,405 L 418,404 L 418,405 L 419,405 L 420,405 L 421,405 L 421,404 L 422,404 L 422,405 L 422,404 L 423,404 L 424,404 L 423,404 L 424,404 L 424,403 L 424,404 L 424,403 L 424,402 L 424,403 L 424,402 L 424,403 L 424,402 L 424,403 L 423,403 L 423,402 L 424,402 L 425,402 L 425,401 L 424,401 L 424,400 L 424,401 L 425,401 L 425,400 L 425,401 L 425,402 L 425,401 L 426,401 L 426,402 L 427,402 L 427,401 L 428,401 L 429,401 L 428,401 L 429,401 L 428,401 L 429,402 L 429,401 L 430,401 L 431,401 L 431,400 L 432,400 L 432,399 L 433,399 L 434,399 L 435,399 L 436,399 L 436,398 L 437,398 L 438,398 L 438,399 L 438,400 L 439,400 L 439,401 L 440,401 L 441,401 L 442,401 L 443,401 L 442,401 L 443,401 L 443,400 L 443,401 L 443,400 L 443,401 L 444,401 L 445,401 L 446,401 L 445,401 L 446,402 L 445,402 L 445,403 L 445,404 L 444,404 L 443,404 L 442,404 L 442,405 L 441,405 L 442,405 L 441,405 L 441,404 L 442,404 L 441,404 L 441,405 L 440,405 L 439,405 L 438,405 L 438,406 L 437,406 L 437,407 L 437,408 L 437,409 L 436,409 L 436,410 L 437,410 L 437,411 L 438,411 L 438,412 L 438,411 L 438,412 L 437,412 L 436,412 L 436,411 L 436,412 L 436,411 L 435,411 L 435,412 L 434,412 L 435,412 L 434,412 L 433,412 L 433,413 L 434,413 L 433,413 L 434,413 L 433,413 L 433,414 L 433,413 L 433,414 L 432,414 L 432,413 L 432,414 L 432,413 L 432,414 L 432,413 L 432,414 L 431,414 L 431,415 L 430,415 L 430,414 L 430,415 L 429,415 L 428,415 L 428,416 L 429,416 L 429,417 L 428,417 L 429,417 L 429,418 L 428,418 L 427,418 L 428,418 L 427,418 L 426,418 L 427,418 L 427,417 L 426,417 L 426,418 L 426,417 L 427,417 L 426,417 L 426,418 L 426,417 L 425,417 L 426,417 L 425,417 L 426,417 L 425,417 L 424,417 L 423,417 L 422,417 L 421,417 L 420,417 L 420,418 L 420,417 L 420,418 L 419,418 L 418,418 L 419,418 L 418,418 L 418,419 L 418,420 L 417,420 L 416,420 "},"pr": {"name": "Paraná","path": "M 336,400 L 337,400 L 338,400 L 338,401 L 339,401 L 340,401 L 341,401 L 341,402 L 342,402 L 343,402 L 344,402 L 345,402 L 346,402 L 347,402 L 348,402 L 348,403 L 349,403 L 350,403 L 351,403 L 351,404 L 352,404 L 352,403 L 352,404 L 353,404 L 353,405 L 354,405 L 353,405 L 353,406 L 354,406 L 355,406 L 355,405 L 356,405 L 357,405 L 357,406 L 358,406 L 358,405 L 358,406 L 359,406 L 359,405 L 360,405 L 360,406 L 360,405 L 361,405 L 361,406 L 362,406 L 363,405 L 363,406 L 363,405 L 364,405 L 365,405 L 365,406 L 366,406 L 366,407 L 367,407 L 367,408 L 368,408 L 369,408 L 369,409 L 369,408 L 369,409 L 369,410 L 370,410 L 370,411 L 370,412 L 371,412 L 370,412 L 371,412 L 371,413 L 371,412 L 370,412 L 370,413 L 370,414 L 370,415 L 370,416 L 371,416 L 371,417 L 371,418 L 370,418 L 370,419 L 371,419 L 372,419 L 371,419 L 371,420 L 371,419 L 371,420 L 372,420 L 371,420 L 372,420 L 372,421 L 373,421 L 373,422 L 373,421 L 373,422 L 374,422 L 373,422 L 374,422 L 374,423 L 374,424 L 375,424 L 375,425 L 376,425 L 375,425 L 375,426 L 375,427 L 374,427 L 375,427 L 375,428 L 374,428 L 375,428 L 374,428 L 374,429 L 374,430 L 375,430 L 376,430 L 377,430 L 378,430 L 378,429 L 379,429 L 378,429 L 379,429 L 379,430 L 380,430 L 381,430 L 381,429 L 381,430 L 381,429 L 381,430 L 382,430 L 383,430 L 384,430 L 385,430 L 385,431 L 385,430 L 385,431 L 386,431 L 385,431 L 385,432 L 385,433 L 385,432 L 385,433 L 385,434 L 384,434 L 384,435 L 385,435 L 385,436 L 385,435 L 386,435 L 386,434 L 387,434 L 388,434 L 388,435 L 389,435 L 389,434 L 389,435 L 390,435 L 389,435 L 390,435 L 389,435 L 390,435 L 389,435 L 390,435 L 390,436 L 390,437 L 391,438 L 392,438 L 392,437 L 392,438 L 391,438 L 391,439 L 391,438 L 391,439 L 390,439 L 390,440 L 390,441 L 389,441 L 388,441 L 389,441 L 388,442 L 387,442 L 387,443 L 386,443 L 386,444 L 386,445 L 385,445 L 385,446 L 385,447 L 384,447 L 384,448 L 384,447 L 383,447 L 383,448 L 381,448 L 380,448 L 379,448 L 378,448 L 379,448 L 378,448 L 377,448 L 378,448 L 377,448 L 376,448 L 375,448 L 375,449 L 375,448 L 375,449 L 374,449 L 375,449 L 374,449 L 375,449 L 374,449 L 375,449 L 375,450 L 374,450 L 373,450 L 372,450 L 372,451 L 372,450 L 372,451 L 371,451 L 370,451 L 371,451 L 370,451 L 369,451 L 369,450 L 368,450 L 368,449 L 368,450 L 368,449 L 368,450 L 367,450 L 367,449 L 366,449 L 367,449 L 366,449 L 366,448 L 366,449 L 366,448 L 366,449 L 366,448 L 365,448 L 366,448 L 365,448 L 365,449 L 365,448 L 364,448 L 365,448 L 365,449 L 364,449 L 364,448 L 364,449 L 364,448 L 363,448 L 363,449 L 363,448 L 362,448 L 362,449 L 363,449 L 362,449 L 361,449 L 360,449 L 360,450 L 360,449 L 359,449 L 358,449 L 359,449 L 358,449 L 358,448 L 358,449 L 358,448 L 358,449 L 358,448 L 357,448 L 357,449 L 357,448 L 356,448 L 356,449 L 357,449 L 356,449 L 356,450 L 355,450 L 355,451 L 354,451 L 355,451 L 355,452 L 354,452 L 354,451 L 353,451 L 353,452 L 353,451 L 353,452 L 352,452 L 352,451 L 352,452 L 351,452 L 351,451 L 350,451 L 350,452 L 349,452 L 348,452 L 348,453 L 347,453 L 347,454 L 347,455 L 347,454 L 347,455 L 347,456 L 348,456 L 347,456 L 347,457 L 348,457 L 347,457 L 348,457 L 347,457 L 346,457 L 345,457 L 345,458 L 345,457 L 344,457 L 344,456 L 343,456 L 342,456 L 341,456 L 340,456 L 339,456 L 338,456 L 337,456 L 336,456 L 336,455 L 335,455 L 336,455 L 335,455 L 334,455 L 334,454 L 334,455 L 333,455 L 333,454 L 333,455 L 333,454 L 332,454 L 331,454 L 330,454 L 329,454 L 328,454 L 328,453 L 327,453 L 326,453 L 325,453 L 324,453 L 323,453 L 322,453 L 322,454 L 322,453 L 322,454 L 322,453 L 321,453 L 320,453 L 320,452 L 319,452 L 318,452 L 318,451 L 318,452 L 317,452 L 316,452 L 315,452 L 314,452 L 314,451 L 314,450 L 313,450 L 313,449 L 312,449 L 312,448 L 311,448 L 311,447 L 312,447 L 311,447 L 312,447 L 311,447 L 312,447 L 311,447 L 311,446 L 311,445 L 311,446 L 312,446 L 312,445 L 311,445 L 311,444 L 311,445 L 311,444 L 311,443 L 310,443 L 311,443 L 310,443 L 309,443 L 309,442 L 308,442 L 308,443 L 307,443 L 307,442 L 308,442 L 308,441 L 307,441 L 307,442 L 306,442 L 307,442 L 306,442 L 306,443 L 306,442 L 305,442 L 304,442 L 304,443 L 304,442 L 304,443 L 303,443 L 303,444 L 303,443 L 302,443 L 302,442 L 301,442 L 301,441 L 300,441 L 300,440 L 301,440 L 301,439 L 302,439 L 302,438 L 302,437 L 303,437 L 303,436 L 303,435 L 303,434 L 303,433 L 303,432 L 304,431 L 304,430 L 304,429 L 305,429 L 305,428 L 304,428 L 304,427 L 305,427 L 305,426 L 305,425 L 305,424 L 304,423 L 305,423 L 304,423 L 304,422 L 305,422 L 305,421 L 306,421 L 306,420 L 307,420 L 308,420 L 308,419 L 308,418 L 308,417 L 308,416 L 309,415 L 309,414 L 309,413 L 310,413 L 310,412 L 311,412 L 312,412 L 312,411 L 313,411 L 313,410 L 313,409 L 314,409 L 314,408 L 314,407 L 314,406 L 315,406 L 315,405 L 316,405 L 316,404 L 317,404 L 318,404 L 318,403 L 319,403 L 320,403 L 320,402 L 321,402 L 321,401 L 322,401 L 322,402 L 322,401 L 323,401 L 323,400 L 324,400 L 325,401 L 326,401 L 327,401 L 328,401 L 328,400 L 329,400 L 329,401 L 330,401 L 331,401 L 332,401 L 333,401 L 334,401 L 334,402 L 335,401 L 335,400 L 336,400 "},"sc": {"name": "Santa Catarina","path": "M 384,448 L 384,449 L 384,450 L 385,450 L 385,451 L 386,451 L 385,451 L 386,451 L 385,451 L 385,452 L 385,453 L 384,453 L 384,454 L 384,455 L 383,456 L 383,457 L 383,458 L 383,459 L 384,459 L 384,460 L 384,461 L 384,462 L 385,462 L 384,462 L 385,462 L 384,462 L 384,463 L 384,464 L 385,464 L 386,464 L 386,465 L 385,465 L 386,465 L 385,465 L 384,465 L 384,466 L 385,466 L 385,467 L 385,468 L 384,468 L 385,468 L 385,467 L 386,467 L 387,467 L 387,468 L 387,469 L 387,470 L 386,470 L 386,471 L 386,472 L 385,472 L 386,472 L 386,473 L 385,473 L 385,474 L 384,474 L 385,474 L 384,474 L 384,475 L 384,476 L 384,477 L 384,478 L 383,478 L 383,479 L 384,479 L 383,479 L 383,480 L 383,481 L 382,481 L 382,482 L 382,483 L 382,484 L 381,484 L 380,485 L 379,485 L 378,486 L 377,486 L 377,487 L 376,487 L 375,487 L 375,488 L 374,488 L 374,489 L 373,489 L 373,490 L 372,490 L 372,491 L 371,491 L 371,492 L 370,492 L 370,493 L 369,493 L 369,494 L 368,494 L 367,494 L 367,493 L 366,493 L 365,493 L 364,493 L 363,493 L 363,494 L 364,494 L 364,495 L 364,494 L 363,494 L 363,493 L 362,493 L 363,493 L 362,493 L 363,493 L 362,493 L 363,493 L 363,492 L 363,493 L 364,493 L 363,493 L 363,492 L 363,493 L 363,492 L 364,492 L 363,492 L 364,492 L 363,492 L 364,492 L 364,493 L 364,492 L 365,492 L 364,492 L 365,492 L 365,491 L 365,492 L 365,491 L 365,492 L 365,491 L 365,490 L 366,490 L 366,489 L 365,489 L 365,488 L 366,488 L 365,488 L 365,487 L 365,486 L 366,486 L 367,486 L 367,485 L 367,486 L 367,485 L 367,484 L 368,484 L 368,485 L 368,484 L 368,485 L 369,485 L 369,484 L 368,484 L 368,483 L 368,482 L 368,483 L 367,483 L 367,482 L 367,483 L 366,483 L 367,483 L 367,482 L 366,482 L 367,482 L 366,482 L 366,483 L 365,483 L 365,482 L 364,482 L 364,483 L 364,482 L 363,482 L 363,483 L 363,482 L 363,483 L 363,482 L 362,482 L 363,482 L 363,483 L 362,483 L 362,482 L 361,482 L 360,482 L 359,482 L 358,482 L 357,482 L 357,481 L 356,481 L 355,481 L 355,480 L 355,479 L 354,479 L 354,478 L 353,478 L 352,478 L 353,478 L 353,477 L 352,477 L 352,476 L 352,475 L 351,475 L 350,475 L 351,475 L 350,475 L 350,474 L 349,474 L 349,473 L 348,473 L 347,473 L 347,472 L 346,472 L 347,472 L 346,472 L 346,471 L 345,471 L 346,471 L 345,471 L 344,471 L 344,470 L 343,470 L 343,469 L 342,469 L 342,470 L 342,469 L 341,469 L 340,469 L 339,469 L 338,469 L 339,469 L 338,469 L 338,468 L 338,469 L 337,469 L 337,468 L 338,468 L 337,468 L 337,467 L 337,468 L 338,467 L 337,467 L 336,467 L 335,467 L 335,466 L 334,466 L 335,466 L 334,466 L 334,467 L 334,466 L 333,466 L 334,466 L 333,466 L 332,466 L 331,466 L 331,465 L 331,466 L 331,465 L 330,465 L 330,466 L 329,466 L 329,465 L 329,466 L 328,466 L 328,465 L 327,465 L 327,466 L 327,465 L 327,466 L 326,466 L 326,465 L 325,465 L 325,464 L 325,465 L 324,465 L 324,464 L 323,464 L 323,465 L 323,464 L 322,464 L 323,464 L 323,463 L 322,463 L 322,464 L 321,464 L 321,465 L 321,464 L 320,464 L 320,465 L 320,464 L 319,464 L 319,465 L 318,465 L 319,465 L 319,464 L 318,464 L 318,463 L 317,463 L 317,464 L 316,464 L 316,465 L 315,465 L 315,464 L 315,465 L 314,465 L 314,464 L 313,464 L 313,465 L 312,465 L 312,464 L 311,464 L 312,464 L 311,464 L 312,464 L 312,463 L 312,464 L 312,463 L 312,462 L 312,463 L 312,462 L 313,462 L 312,462 L 313,462 L 313,461 L 313,462 L 313,461 L 314,461 L 313,461 L 314,461 L 313,461 L 314,461 L 313,460 L 314,460 L 313,460 L 313,459 L 313,458 L 312,458 L 313,458 L 312,458 L 313,458 L 313,457 L 312,457 L 313,457 L 313,456 L 313,455 L 313,454 L 313,453 L 313,454 L 313,453 L 314,453 L 313,453 L 314,453 L 314,452 L 315,452 L 316,452 L 317,452 L 318,452 L 318,451 L 318,452 L 319,452 L 320,452 L 320,453 L 321,453 L 322,453 L 322,454 L 322,453 L 322,454 L 322,453 L 323,453 L 324,453 L 325,453 L 326,453 L 327,453 L 328,453 L 328,454 L 329,454 L 330,454 L 331,454 L 332,454 L 333,454 L 333,455 L 333,454 L 333,455 L 334,455 L 334,454 L 334,455 L 335,455 L 336,455 L 335,455 L 336,455 L 336,456 L 337,456 L 338,456 L 339,456 L 340,456 L 341,456 L 342,456 L 343,456 L 344,456 L 344,457 L 345,457 L 345,458 L 345,457 L 346,457 L 347,457 L 348,457 L 347,457 L 348,457 L 347,457 L 347,456 L 348,456 L 347,456 L 347,455 L 347,454 L 347,455 L 347,454 L 347,453 L 348,453 L 348,452 L 349,452 L 350,452 L 350,451 L 351,451 L 351,452 L 352,452 L 352,451 L 352,452 L 353,452 L 353,451 L 353,452 L 353,451 L 354,451 L 354,452 L 355,452 L 355,451 L 354,451 L 355,451 L 355,450 L 356,450 L 356,449 L 357,449 L 356,449 L 356,448 L 357,448 L 357,449 L 357,448 L 358,448 L 358,449 L 358,448 L 358,449 L 358,448 L 358,449 L 359,449 L 358,449 L 359,449 L 360,449 L 360,450 L 360,449 L 361,449 L 362,449 L 363,449 L 362,449 L 362,448 L 363,448 L 363,449 L 363,448 L 364,448 L 364,449 L 364,448 L 364,449 L 365,449 L 365,448 L 364,448 L 365,448 L 365,449 L 365,448 L 366,448 L 365,448 L 366,448 L 366,449 L 366,448 L 366,449 L 366,448 L 366,449 L 367,449 L 366,449 L 367,449 L 367,450 L 368,450 L 368,449 L 368,450 L 368,449 L 368,450 L 369,450 L 369,451 L 370,451 L 371,451 L 370,451 L 371,451 L 372,451 L 372,450 L 372,451 L 372,450 L 373,450 L 374,450 L 375,450 L 375,449 L 374,449 L 375,449 L 374,449 L 375,449 L 374,449 L 375,449 L 375,448 L 375,449 L 375,448 L 376,448 L 377,448 L 378,448 L 377,448 L 378,448 L 379,448 L 378,448 L 379,448 L 380,448 L 381,448 L 383,448 L 383,447 L 384,447 L 384,448 "},"rs": {"name": "Rio Grande do Sul","path": "M 338,468 L 338,469 L 339,469 L 338,469 L 339,469 L 340,469 L 341,469 L 342,469 L 342,470 L 342,469 L 343,469 L 343,470 L 344,470 L 344,471 L 345,471 L 346,471 L 345,471 L 346,471 L 346,472 L 347,472 L 346,472 L 347,472 L 347,473 L 348,473 L 349,473 L 349,474 L 350,474 L 350,475 L 351,475 L 350,475 L 351,475 L 352,475 L 352,476 L 352,477 L 353,477 L 353,478 L 352,478 L 353,478 L 354,478 L 354,479 L 355,479 L 355,480 L 355,481 L 356,481 L 357,481 L 357,482 L 358,482 L 359,482 L 360,482 L 361,482 L 362,482 L 362,483 L 363,483 L 363,482 L 362,482 L 363,482 L 363,483 L 363,482 L 363,483 L 363,482 L 364,482 L 364,483 L 364,482 L 365,482 L 365,483 L 366,483 L 366,482 L 367,482 L 366,482 L 367,482 L 367,483 L 366,483 L 367,483 L 367,482 L 367,483 L 368,483 L 368,482 L 368,483 L 368,484 L 369,484 L 369,485 L 368,485 L 368,484 L 368,485 L 368,484 L 367,484 L 367,485 L 367,486 L 367,485 L 367,486 L 366,486 L 365,486 L 365,487 L 365,488 L 366,488 L 365,488 L 365,489 L 366,489 L 366,490 L 365,490 L 365,491 L 365,492 L 365,491 L 365,492 L 365,491 L 365,492 L 364,492 L 365,492 L 364,492 L 364,493 L 364,492 L 363,492 L 364,492 L 363,492 L 364,492 L 363,492 L 363,493 L 363,492 L 363,493 L 364,493 L 363,493 L 363,492 L 363,493 L 362,493 L 363,493 L 362,493 L 363,493 L 362,493 L 363,493 L 363,494 L 364,494 L 364,495 L 364,494 L 363,494 L 363,493 L 364,493 L 365,493 L 366,493 L 367,493 L 367,494 L 368,494 L 369,494 L 369,495 L 368,495 L 368,496 L 367,496 L 367,497 L 366,497 L 366,498 L 366,499 L 365,499 L 365,500 L 364,500 L 364,501 L 364,502 L 363,502 L 363,503 L 363,504 L 363,505 L 362,505 L 362,506 L 362,507 L 361,507 L 361,508 L 361,509 L 361,510 L 360,510 L 360,511 L 359,512 L 358,513 L 358,514 L 357,514 L 357,515 L 356,516 L 356,517 L 355,517 L 355,518 L 354,519 L 354,520 L 353,520 L 352,521 L 352,522 L 351,522 L 350,523 L 349,523 L 349,524 L 348,524 L 348,525 L 347,525 L 347,526 L 346,526 L 346,527 L 345,527 L 344,528 L 343,528 L 342,529 L 341,529 L 341,530 L 340,530 L 339,530 L 339,531 L 338,531 L 338,532 L 337,532 L 337,533 L 336,533 L 336,534 L 336,533 L 336,532 L 336,531 L 337,531 L 336,530 L 336,529 L 335,529 L 336,529 L 335,529 L 336,529 L 335,529 L 336,529 L 337,529 L 338,529 L 338,530 L 339,530 L 339,529 L 340,529 L 339,529 L 340,529 L 339,529 L 340,529 L 341,529 L 341,528 L 342,528 L 342,527 L 343,527 L 343,526 L 344,526 L 344,525 L 344,526 L 345,526 L 344,526 L 344,525 L 345,525 L 344,525 L 345,525 L 345,524 L 345,525 L 346,525 L 347,525 L 347,524 L 348,524 L 348,523 L 348,522 L 349,522 L 349,521 L 348,521 L 348,520 L 348,519 L 349,519 L 350,519 L 350,518 L 351,518 L 351,517 L 351,516 L 352,516 L 353,516 L 353,515 L 354,515 L 355,515 L 355,514 L 355,513 L 355,512 L 355,511 L 355,510 L 355,509 L 356,509 L 356,508 L 356,509 L 356,510 L 356,511 L 357,511 L 357,510 L 357,509 L 357,508 L 357,507 L 356,507 L 356,506 L 356,507 L 356,506 L 356,507 L 356,506 L 355,507 L 356,508 L 355,508 L 354,508 L 353,508 L 352,508 L 352,509 L 352,510 L 351,510 L 351,509 L 350,509 L 350,508 L 350,509 L 350,508 L 350,507 L 350,508 L 350,507 L 349,507 L 348,507 L 349,507 L 348,507 L 348,506 L 347,506 L 348,506 L 347,506 L 347,505 L 348,505 L 348,504 L 347,504 L 347,505 L 347,504 L 347,505 L 347,504 L 346,505 L 346,506 L 346,507 L 347,507 L 347,508 L 348,508 L 348,509 L 349,509 L 349,510 L 349,511 L 349,510 L 349,509 L 348,509 L 348,510 L 347,510 L 347,511 L 347,512 L 347,513 L 347,514 L 347,515 L 346,515 L 347,515 L 347,514 L 346,514 L 346,513 L 345,513 L 345,514 L 345,515 L 345,516 L 346,516 L 345,516 L 344,516 L 344,517 L 344,518 L 344,519 L 345,519 L 344,519 L 343,519 L 342,519 L 342,520 L 342,521 L 341,521 L 341,522 L 340,522 L 340,521 L 340,522 L 339,522 L 338,522 L 339,522 L 338,522 L 337,522 L 337,523 L 338,523 L 337,523 L 337,524 L 337,525 L 337,526 L 337,527 L 336,527 L 335,527 L 335,528 L 334,528 L 334,529 L 333,529 L 333,530 L 334,530 L 335,530 L 335,531 L 334,531 L 334,532 L 333,532 L 334,532 L 334,531 L 335,531 L 335,532 L 336,532 L 335,532 L 334,532 L 334,533 L 333,533 L 334,533 L 334,532 L 335,532 L 336,532 L 335,532 L 335,533 L 335,532 L 336,532 L 336,533 L 335,533 L 335,534 L 334,534 L 334,535 L 333,535 L 333,536 L 333,537 L 332,537 L 332,538 L 331,539 L 331,540 L 331,541 L 331,542 L 330,542 L 330,543 L 330,544 L 329,545 L 329,546 L 328,546 L 328,547 L 328,548 L 327,548 L 327,549 L 326,549 L 326,550 L 325,550 L 324,551 L 323,552 L 322,552 L 322,553 L 321,553 L 321,554 L 320,554 L 320,555 L 319,555 L 318,555 L 318,556 L 317,556 L 317,555 L 316,555 L 315,555 L 316,555 L 315,555 L 315,554 L 316,554 L 315,554 L 316,554 L 316,553 L 317,553 L 316,553 L 317,553 L 317,552 L 317,553 L 317,552 L 317,551 L 317,550 L 316,549 L 317,549 L 317,548 L 317,547 L 317,548 L 318,547 L 318,546 L 319,546 L 318,546 L 318,547 L 319,547 L 320,546 L 320,545 L 321,545 L 321,544 L 321,543 L 322,543 L 323,543 L 323,542 L 323,543 L 324,544 L 325,544 L 326,544 L 327,543 L 327,542 L 328,542 L 328,541 L 328,540 L 329,539 L 329,538 L 328,538 L 328,537 L 327,536 L 327,535 L 328,535 L 328,534 L 327,534 L 326,534 L 327,534 L 326,534 L 326,535 L 326,534 L 326,535 L 326,534 L 327,534 L 326,534 L 327,534 L 327,535 L 326,535 L 326,536 L 325,536 L 326,536 L 326,537 L 326,536 L 326,537 L 327,537 L 326,537 L 326,538 L 325,538 L 324,538 L 323,538 L 323,539 L 323,540 L 322,540 L 322,541 L 321,541 L 321,540 L 321,541 L 320,541 L 320,540 L 319,540 L 318,540 L 318,539 L 318,540 L 317,540 L 317,539 L 316,539 L 316,538 L 315,538 L 315,537 L 314,537 L 314,536 L 314,535 L 313,535 L 314,535 L 313,535 L 313,534 L 313,533 L 312,533 L 312,532 L 311,532 L 311,531 L 311,532 L 311,531 L 310,531 L 309,531 L 310,531 L 310,530 L 309,530 L 308,530 L 308,531 L 308,530 L 307,530 L 306,529 L 303,527 L 303,526 L 302,526 L 302,525 L 301,525 L 301,524 L 300,524 L 299,524 L 298,524 L 297,524 L 297,523 L 296,523 L 297,523 L 296,523 L 296,522 L 295,522 L 295,521 L 295,522 L 294,522 L 293,522 L 293,521 L 292,521 L 292,520 L 291,520 L 290,519 L 290,520 L 290,519 L 291,519 L 290,519 L 291,519 L 290,519 L 291,519 L 290,519 L 290,518 L 289,518 L 289,517 L 288,517 L 288,516 L 287,516 L 287,515 L 287,516 L 287,515 L 286,515 L 286,516 L 286,517 L 285,517 L 285,518 L 284,518 L 283,518 L 283,519 L 282,519 L 281,519 L 281,518 L 281,517 L 281,516 L 281,515 L 280,515 L 280,514 L 279,514 L 279,513 L 279,512 L 278,512 L 278,511 L 277,511 L 277,512 L 277,511 L 276,511 L 276,510 L 275,510 L 275,509 L 274,509 L 274,508 L 273,508 L 273,507 L 272,507 L 273,507 L 272,507 L 272,506 L 272,507 L 272,506 L 272,507 L 271,507 L 271,506 L 270,506 L 270,505 L 269,505 L 268,505 L 269,505 L 268,505 L 267,505 L 266,505 L 266,506 L 266,505 L 266,506 L 265,506 L 265,507 L 265,508 L 264,508 L 264,507 L 264,508 L 263,508 L 263,507 L 263,508 L 262,508 L 261,508 L 262,508 L 261,508 L 261,507 L 260,507 L 260,508 L 260,507 L 259,507 L 260,507 L 259,507 L 259,506 L 258,506 L 259,506 L 260,506 L 261,505 L 261,504 L 262,504 L 263,504 L 263,503 L 263,502 L 263,501 L 264,501 L 265,501 L 266,500 L 267,500 L 267,499 L 268,498 L 269,497 L 270,497 L 270,496 L 270,495 L 271,495 L 272,495 L 272,494 L 272,493 L 272,492 L 273,492 L 273,491 L 274,491 L 275,491 L 276,490 L 275,490 L 275,489 L 276,489 L 277,489 L 277,488 L 277,487 L 278,487 L 279,487 L 279,486 L 279,485 L 280,485 L 281,485 L 281,484 L 281,483 L 282,483 L 283,483 L 283,482 L 283,481 L 284,481 L 285,481 L 285,482 L 286,482 L 285,481 L 286,481 L 286,480 L 285,480 L 284,480 L 284,479 L 285,479 L 286,479 L 286,478 L 287,478 L 288,478 L 288,477 L 289,477 L 290,477 L 290,476 L 290,475 L 291,475 L 292,475 L 292,474 L 293,474 L 294,474 L 295,474 L 295,473 L 294,473 L 295,473 L 296,473 L 296,472 L 296,471 L 297,471 L 297,470 L 298,470 L 298,469 L 298,470 L 299,470 L 300,470 L 300,469 L 300,470 L 300,469 L 301,469 L 301,468 L 301,469 L 302,469 L 303,469 L 303,468 L 302,468 L 303,468 L 304,468 L 304,469 L 304,468 L 305,468 L 306,467 L 306,466 L 307,466 L 308,466 L 309,466 L 309,465 L 310,465 L 310,464 L 311,464 L 312,464 L 312,465 L 313,465 L 313,464 L 314,464 L 314,465 L 315,465 L 315,464 L 315,465 L 316,465 L 316,464 L 317,464 L 317,463 L 318,463 L 318,464 L 319,464 L 319,465 L 318,465 L 319,465 L 319,464 L 320,464 L 320,465 L 320,464 L 321,464 L 321,465 L 321,464 L 322,464 L 322,463 L 323,463 L 323,464 L 322,464 L 323,464 L 323,465 L 323,464 L 324,464 L 324,465 L 325,465 L 325,464 L 325,465 L 326,465 L 326,466 L 327,466 L 327,465 L 327,466 L 327,465 L 328,465 L 328,466 L 329,466 L 329,465 L 329,466 L 330,466 L 330,465 L 331,465 L 331,466 L 331,465 L 331,466 L 332,466 L 333,466 L 334,466 L 333,466 L 334,466 L 334,467 L 334,466 L 335,466 L 334,466 L 335,466 L 335,467 L 336,467 L 337,467 L 338,467 L 337,468 L 337,467 L 337,468 L 338,468 L 337,468 L 337,469 L 338,469 L 338,468 "},"ms": {"name": "Mato Grosso do Sul","path": "M 280,325 L 281,325 L 281,326 L 282,326 L 282,327 L 282,326 L 282,327 L 283,327 L 284,327 L 284,328 L 284,327 L 285,327 L 285,328 L 286,328 L 287,328 L 287,329 L 288,329 L 288,330 L 289,330 L 290,330 L 290,331 L 290,330 L 290,331 L 290,330 L 290,331 L 291,331 L 291,330 L 291,331 L 292,331 L 292,332 L 293,332 L 294,332 L 295,332 L 295,331 L 295,332 L 296,332 L 296,331 L 297,332 L 297,331 L 297,332 L 297,331 L 298,331 L 298,330 L 299,330 L 300,330 L 301,330 L 301,329 L 301,330 L 301,329 L 301,330 L 302,330 L 303,330 L 303,331 L 304,331 L 304,332 L 305,332 L 306,332 L 306,331 L 307,331 L 307,332 L 307,331 L 307,332 L 307,331 L 308,331 L 308,332 L 308,331 L 308,330 L 309,330 L 309,329 L 310,329 L 310,328 L 311,328 L 311,327 L 312,327 L 312,326 L 313,326 L 313,330 L 313,332 L 312,332 L 311,332 L 311,333 L 310,333 L 310,334 L 310,335 L 310,336 L 311,336 L 312,336 L 312,337 L 312,336 L 312,337 L 313,337 L 314,337 L 313,337 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 315,337 L 316,337 L 317,337 L 318,337 L 319,337 L 320,337 L 321,337 L 322,337 L 322,338 L 321,338 L 321,339 L 321,340 L 321,341 L 322,341 L 321,341 L 322,341 L 322,342 L 323,342 L 323,341 L 324,341 L 325,341 L 326,341 L 326,342 L 326,343 L 325,343 L 324,343 L 324,344 L 323,344 L 323,345 L 324,345 L 324,346 L 325,346 L 326,346 L 327,346 L 328,346 L 329,346 L 330,346 L 331,346 L 331,347 L 331,348 L 332,348 L 333,348 L 334,349 L 335,349 L 334,349 L 335,349 L 335,350 L 336,350 L 337,350 L 338,350 L 337,350 L 338,350 L 338,351 L 339,351 L 339,352 L 339,351 L 339,352 L 340,352 L 341,352 L 341,353 L 342,353 L 342,352 L 342,353 L 343,352 L 343,353 L 343,352 L 343,353 L 344,353 L 345,353 L 346,353 L 346,354 L 347,354 L 346,354 L 347,354 L 347,355 L 347,354 L 348,354 L 348,355 L 349,355 L 350,355 L 350,356 L 351,356 L 351,357 L 352,357 L 351,357 L 351,358 L 352,358 L 352,359 L 351,359 L 351,360 L 350,360 L 350,361 L 350,362 L 350,363 L 351,363 L 351,364 L 350,364 L 351,364 L 351,365 L 350,365 L 351,365 L 351,366 L 350,366 L 350,367 L 350,368 L 349,368 L 349,369 L 348,369 L 347,369 L 346,369 L 346,370 L 345,370 L 345,371 L 344,371 L 344,372 L 344,373 L 343,373 L 342,374 L 342,375 L 342,376 L 342,377 L 342,378 L 341,378 L 340,378 L 340,379 L 340,380 L 339,380 L 339,381 L 339,382 L 339,383 L 339,384 L 338,384 L 338,385 L 337,385 L 337,386 L 336,386 L 335,386 L 335,387 L 336,387 L 336,388 L 336,389 L 335,389 L 334,389 L 334,390 L 334,391 L 333,391 L 333,392 L 332,392 L 332,393 L 332,394 L 331,394 L 331,395 L 330,395 L 330,396 L 329,396 L 328,396 L 328,397 L 327,397 L 326,397 L 326,398 L 325,398 L 325,399 L 324,399 L 323,399 L 323,400 L 322,400 L 322,401 L 321,401 L 321,402 L 320,402 L 320,403 L 319,403 L 318,403 L 318,404 L 317,404 L 316,404 L 316,405 L 315,405 L 315,406 L 314,406 L 314,407 L 314,408 L 314,409 L 313,409 L 313,410 L 313,411 L 312,411 L 312,412 L 311,412 L 310,412 L 310,413 L 309,413 L 309,414 L 309,415 L 308,416 L 308,417 L 308,418 L 308,419 L 308,420 L 307,420 L 306,420 L 306,421 L 305,421 L 305,420 L 304,420 L 303,420 L 303,419 L 302,419 L 302,418 L 302,419 L 302,418 L 301,418 L 301,419 L 301,418 L 300,418 L 299,418 L 298,418 L 298,419 L 297,419 L 296,419 L 296,420 L 295,420 L 294,420 L 293,420 L 292,420 L 291,420 L 290,420 L 289,420 L 290,420 L 289,420 L 289,419 L 289,418 L 289,417 L 289,416 L 288,416 L 289,416 L 289,415 L 288,415 L 288,414 L 287,414 L 287,413 L 288,413 L 288,412 L 288,411 L 287,411 L 287,410 L 288,410 L 288,409 L 287,409 L 287,408 L 287,407 L 286,407 L 286,406 L 286,405 L 286,404 L 286,403 L 287,403 L 286,403 L 287,403 L 287,402 L 286,402 L 286,401 L 285,400 L 285,399 L 285,398 L 284,398 L 284,397 L 283,397 L 283,396 L 282,396 L 282,397 L 282,396 L 282,397 L 282,396 L 282,397 L 282,396 L 281,396 L 282,396 L 281,396 L 282,396 L 281,396 L 281,397 L 281,396 L 280,396 L 279,396 L 278,396 L 277,396 L 277,395 L 276,395 L 277,395 L 276,395 L 276,394 L 276,393 L 276,394 L 275,394 L 274,394 L 274,395 L 274,394 L 274,395 L 273,395 L 274,395 L 273,395 L 273,396 L 272,396 L 272,395 L 272,396 L 272,395 L 271,395 L 271,396 L 271,395 L 271,396 L 272,396 L 271,396 L 270,396 L 270,397 L 269,397 L 269,396 L 269,397 L 269,396 L 268,396 L 267,396 L 266,396 L 265,396 L 265,395 L 264,395 L 264,396 L 264,395 L 264,396 L 263,396 L 263,395 L 263,396 L 262,396 L 262,395 L 261,395 L 260,395 L 259,395 L 259,394 L 258,394 L 257,394 L 256,394 L 256,395 L 256,394 L 255,394 L 254,394 L 253,394 L 254,394 L 254,393 L 253,393 L 254,393 L 254,392 L 254,391 L 255,391 L 254,391 L 254,390 L 255,390 L 255,389 L 254,389 L 255,388 L 254,388 L 254,387 L 255,387 L 254,387 L 254,386 L 254,385 L 255,385 L 255,384 L 255,383 L 254,382 L 255,382 L 255,381 L 255,380 L 256,380 L 255,380 L 255,379 L 256,379 L 256,378 L 255,378 L 255,377 L 254,377 L 255,377 L 255,376 L 255,377 L 255,376 L 254,376 L 254,375 L 255,375 L 255,374 L 254,374 L 254,373 L 253,373 L 253,372 L 253,371 L 253,370 L 252,370 L 252,369 L 252,368 L 251,368 L 252,368 L 252,367 L 251,367 L 252,367 L 252,366 L 253,366 L 253,365 L 254,365 L 255,365 L 255,364 L 252,361 L 253,358 L 253,357 L 254,356 L 255,354 L 255,353 L 256,351 L 257,351 L 258,351 L 257,351 L 257,350 L 257,349 L 260,340 L 261,340 L 260,340 L 259,339 L 259,338 L 259,337 L 258,337 L 258,336 L 257,335 L 257,334 L 258,334 L 257,334 L 257,333 L 257,332 L 256,332 L 257,332 L 257,331 L 256,331 L 257,331 L 256,331 L 257,331 L 257,330 L 257,331 L 258,331 L 257,331 L 258,331 L 258,332 L 258,333 L 259,333 L 259,334 L 260,334 L 260,335 L 261,335 L 262,335 L 262,334 L 262,335 L 262,334 L 262,335 L 263,335 L 263,334 L 264,334 L 265,334 L 266,334 L 266,333 L 267,333 L 267,332 L 268,332 L 268,331 L 268,330 L 269,330 L 269,329 L 270,329 L 269,329 L 270,329 L 269,329 L 270,329 L 270,328 L 271,328 L 270,328 L 271,328 L 271,327 L 272,327 L 272,328 L 272,327 L 272,328 L 272,327 L 272,328 L 272,327 L 273,327 L 273,328 L 273,327 L 273,328 L 273,327 L 274,327 L 275,327 L 275,328 L 275,327 L 276,327 L 277,327 L 277,326 L 278,326 L 279,326 L 279,325 L 279,326 L 279,325 L 280,325 "},"mt": {"name": "Mato Grosso","path": "M 297,332 L 297,331 L 297,332 L 296,331 L 296,332 L 295,332 L 295,331 L 295,332 L 294,332 L 293,332 L 292,332 L 292,331 L 291,331 L 291,330 L 291,331 L 290,331 L 290,330 L 290,331 L 290,330 L 290,331 L 290,330 L 289,330 L 288,330 L 288,329 L 287,329 L 287,328 L 286,328 L 285,328 L 285,327 L 284,327 L 284,328 L 284,327 L 283,327 L 282,327 L 282,326 L 282,327 L 282,326 L 281,326 L 281,325 L 280,325 L 279,325 L 279,326 L 279,325 L 279,326 L 278,326 L 277,326 L 277,327 L 276,327 L 275,327 L 275,328 L 275,327 L 274,327 L 273,327 L 273,328 L 273,327 L 273,328 L 273,327 L 272,327 L 272,328 L 272,327 L 272,328 L 272,327 L 272,328 L 272,327 L 271,327 L 271,328 L 270,328 L 271,328 L 270,328 L 270,329 L 269,329 L 270,329 L 269,329 L 270,329 L 269,329 L 269,330 L 268,330 L 268,331 L 268,332 L 267,332 L 267,333 L 266,333 L 266,334 L 265,334 L 264,334 L 263,334 L 263,335 L 262,335 L 262,334 L 262,335 L 262,334 L 262,335 L 261,335 L 260,335 L 260,334 L 259,334 L 259,333 L 258,333 L 258,332 L 258,331 L 257,331 L 258,331 L 257,331 L 257,330 L 257,331 L 255,329 L 254,330 L 253,330 L 253,329 L 252,329 L 251,329 L 251,328 L 250,328 L 250,327 L 249,327 L 250,327 L 249,327 L 249,326 L 248,326 L 248,325 L 248,324 L 247,324 L 248,324 L 247,324 L 247,323 L 248,323 L 247,323 L 247,322 L 247,321 L 247,320 L 247,319 L 247,318 L 247,317 L 248,317 L 248,316 L 249,316 L 249,315 L 248,315 L 249,315 L 249,314 L 249,313 L 248,313 L 247,313 L 245,313 L 243,313 L 242,313 L 241,313 L 240,313 L 239,313 L 238,313 L 237,313 L 233,313 L 232,313 L 230,313 L 229,313 L 228,313 L 227,313 L 226,313 L 225,313 L 224,313 L 223,313 L 223,312 L 223,311 L 223,309 L 223,308 L 223,307 L 223,306 L 222,304 L 222,303 L 222,302 L 219,298 L 218,297 L 219,296 L 222,296 L 222,293 L 222,292 L 222,290 L 221,290 L 221,289 L 221,288 L 220,288 L 221,288 L 220,288 L 221,288 L 220,288 L 220,287 L 220,286 L 220,287 L 220,286 L 219,286 L 219,285 L 219,284 L 219,283 L 219,282 L 220,282 L 220,281 L 220,280 L 219,280 L 219,279 L 219,278 L 218,278 L 217,278 L 218,278 L 217,278 L 217,277 L 217,278 L 217,277 L 217,278 L 216,277 L 216,278 L 216,277 L 216,276 L 217,275 L 217,276 L 217,275 L 218,275 L 218,274 L 219,274 L 220,274 L 220,273 L 220,272 L 221,272 L 220,271 L 221,271 L 220,271 L 221,271 L 221,270 L 222,270 L 222,269 L 222,270 L 222,269 L 222,268 L 223,268 L 223,267 L 224,267 L 224,266 L 224,265 L 224,264 L 225,264 L 224,264 L 224,263 L 224,262 L 225,262 L 225,261 L 226,261 L 226,260 L 227,260 L 228,260 L 228,259 L 228,258 L 229,258 L 227,257 L 227,256 L 227,255 L 227,254 L 226,254 L 226,253 L 226,252 L 225,252 L 224,252 L 225,252 L 224,252 L 224,251 L 224,250 L 224,249 L 224,248 L 224,247 L 225,247 L 225,246 L 226,246 L 226,245 L 227,245 L 227,244 L 226,244 L 226,243 L 226,242 L 226,241 L 225,241 L 224,241 L 223,241 L 222,241 L 222,240 L 221,240 L 221,241 L 221,240 L 221,241 L 220,241 L 220,240 L 219,240 L 219,239 L 214,239 L 212,239 L 210,239 L 206,239 L 205,239 L 204,239 L 204,238 L 204,237 L 205,237 L 205,236 L 205,237 L 205,236 L 205,235 L 205,234 L 205,233 L 205,232 L 205,231 L 205,230 L 204,230 L 204,229 L 204,228 L 203,228 L 203,227 L 204,227 L 204,226 L 204,225 L 204,224 L 205,224 L 205,223 L 204,223 L 204,222 L 204,221 L 204,222 L 204,221 L 205,221 L 205,220 L 205,219 L 204,219 L 204,218 L 204,217 L 203,217 L 203,216 L 203,215 L 203,216 L 203,215 L 204,215 L 204,214 L 204,213 L 204,212 L 204,211 L 205,211 L 205,210 L 204,210 L 204,209 L 205,209 L 208,209 L 209,209 L 211,209 L 214,209 L 220,209 L 226,209 L 233,209 L 234,209 L 235,209 L 238,209 L 239,209 L 246,209 L 247,209 L 248,209 L 248,208 L 249,208 L 248,207 L 248,208 L 247,208 L 247,207 L 248,207 L 248,206 L 248,205 L 248,204 L 248,203 L 249,203 L 248,203 L 249,203 L 249,202 L 249,201 L 249,200 L 249,199 L 249,198 L 249,197 L 248,197 L 248,196 L 248,195 L 249,195 L 249,194 L 250,194 L 250,193 L 251,192 L 250,192 L 250,191 L 250,190 L 251,190 L 251,189 L 252,189 L 253,189 L 253,190 L 253,191 L 254,191 L 254,192 L 254,193 L 255,193 L 255,194 L 255,195 L 256,196 L 256,197 L 256,198 L 257,199 L 257,200 L 258,200 L 258,201 L 258,202 L 258,203 L 258,204 L 258,205 L 258,206 L 259,206 L 259,207 L 259,208 L 260,208 L 261,208 L 261,209 L 262,209 L 261,209 L 261,210 L 262,210 L 263,210 L 264,210 L 264,211 L 265,211 L 265,212 L 266,212 L 266,213 L 267,213 L 266,213 L 266,214 L 267,214 L 266,214 L 267,214 L 267,215 L 268,215 L 269,215 L 270,215 L 270,216 L 270,217 L 271,217 L 272,217 L 277,217 L 283,218 L 284,218 L 287,218 L 288,218 L 293,218 L 295,219 L 297,219 L 299,219 L 300,219 L 305,219 L 308,220 L 309,220 L 310,220 L 311,220 L 314,220 L 315,220 L 317,220 L 320,221 L 321,221 L 323,221 L 324,221 L 325,221 L 328,221 L 332,221 L 333,221 L 337,222 L 344,222 L 347,222 L 350,223 L 353,223 L 355,223 L 358,223 L 360,223 L 362,223 L 361,223 L 362,223 L 361,224 L 361,225 L 361,226 L 360,226 L 360,227 L 359,227 L 359,228 L 359,229 L 359,230 L 359,231 L 358,231 L 358,232 L 357,233 L 357,234 L 356,235 L 357,235 L 356,235 L 357,235 L 357,236 L 356,236 L 356,237 L 356,238 L 356,239 L 356,240 L 356,241 L 355,241 L 355,242 L 356,242 L 356,243 L 355,243 L 355,244 L 355,245 L 354,245 L 354,246 L 354,247 L 355,247 L 355,248 L 356,248 L 355,248 L 355,249 L 355,250 L 355,251 L 356,252 L 355,252 L 356,253 L 355,253 L 355,254 L 355,255 L 355,256 L 356,256 L 356,257 L 356,258 L 356,259 L 356,260 L 355,260 L 355,261 L 355,262 L 356,262 L 356,263 L 356,264 L 356,265 L 356,264 L 357,264 L 357,265 L 356,265 L 357,265 L 358,265 L 358,266 L 357,266 L 357,267 L 356,267 L 356,268 L 357,268 L 356,268 L 356,269 L 356,270 L 357,270 L 356,270 L 356,271 L 356,272 L 355,272 L 355,273 L 355,274 L 354,274 L 354,275 L 354,276 L 354,277 L 353,277 L 353,278 L 353,279 L 353,280 L 353,281 L 353,282 L 353,283 L 352,283 L 352,284 L 351,284 L 351,285 L 351,286 L 351,287 L 351,288 L 351,289 L 351,290 L 350,290 L 350,291 L 350,292 L 350,293 L 349,293 L 350,293 L 349,293 L 349,294 L 350,294 L 349,294 L 349,295 L 348,295 L 347,295 L 347,296 L 347,295 L 346,295 L 345,295 L 344,296 L 343,296 L 343,297 L 342,297 L 342,298 L 341,298 L 341,299 L 342,299 L 341,299 L 341,300 L 341,301 L 341,302 L 340,302 L 341,302 L 341,303 L 340,303 L 340,302 L 340,303 L 340,304 L 340,305 L 339,305 L 339,306 L 339,307 L 338,307 L 338,306 L 337,306 L 337,307 L 336,307 L 335,307 L 335,308 L 335,307 L 334,307 L 333,307 L 333,308 L 333,309 L 332,309 L 332,310 L 331,310 L 331,311 L 330,311 L 329,311 L 329,312 L 329,313 L 329,312 L 329,313 L 328,313 L 327,313 L 327,314 L 327,315 L 328,315 L 328,316 L 328,317 L 327,317 L 328,317 L 327,317 L 327,318 L 326,318 L 327,318 L 326,318 L 326,319 L 325,319 L 325,320 L 324,320 L 324,321 L 323,321 L 323,322 L 322,322 L 323,322 L 322,322 L 322,323 L 322,324 L 321,324 L 322,324 L 321,324 L 321,325 L 321,326 L 320,326 L 320,327 L 320,328 L 320,329 L 320,330 L 319,330 L 320,330 L 319,330 L 320,330 L 319,330 L 320,330 L 320,331 L 319,331 L 320,331 L 319,331 L 319,332 L 320,332 L 319,332 L 320,332 L 319,332 L 319,333 L 320,333 L 320,334 L 321,334 L 321,335 L 321,336 L 322,336 L 322,337 L 321,337 L 320,337 L 319,337 L 318,337 L 317,337 L 316,337 L 315,337 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 314,336 L 314,337 L 313,337 L 314,337 L 313,337 L 312,337 L 312,336 L 312,337 L 312,336 L 311,336 L 310,336 L 310,335 L 310,334 L 310,333 L 311,333 L 311,332 L 312,332 L 313,332 L 313,330 L 313,327 L 313,326 L 312,326 L 312,327 L 311,327 L 311,328 L 310,328 L 310,329 L 309,329 L 309,330 L 308,330 L 308,331 L 308,332 L 308,331 L 307,331 L 307,332 L 307,331 L 307,332 L 307,331 L 306,331 L 306,332 L 305,332 L 304,332 L 304,331 L 303,331 L 303,330 L 302,330 L 301,330 L 301,329 L 301,330 L 301,329 L 301,330 L 300,330 L 299,330 L 298,330 L 298,331 L 297,331 L 297,332 L 297,331 L 297,332 "},"go": {"name": "Goiás","path": "M 362,259 L 362,260 L 362,261 L 361,261 L 362,261 L 361,261 L 361,262 L 361,263 L 360,263 L 361,263 L 360,263 L 361,263 L 361,264 L 360,264 L 361,264 L 360,264 L 360,265 L 361,265 L 362,265 L 362,266 L 362,265 L 362,266 L 363,266 L 364,266 L 365,266 L 365,267 L 366,267 L 367,267 L 368,268 L 369,268 L 372,270 L 373,271 L 374,271 L 374,270 L 374,269 L 374,268 L 374,267 L 375,267 L 375,266 L 376,266 L 376,265 L 377,265 L 377,264 L 377,265 L 378,265 L 377,265 L 377,266 L 378,266 L 379,266 L 379,267 L 380,265 L 381,265 L 381,266 L 382,266 L 382,267 L 383,267 L 384,267 L 384,268 L 384,269 L 384,268 L 384,269 L 384,270 L 384,271 L 384,272 L 385,272 L 385,271 L 385,270 L 385,269 L 386,269 L 386,270 L 386,271 L 387,271 L 388,271 L 388,270 L 388,271 L 388,270 L 389,270 L 390,270 L 390,269 L 390,270 L 390,271 L 390,272 L 390,271 L 390,272 L 390,271 L 390,272 L 390,271 L 391,271 L 392,271 L 393,271 L 393,272 L 393,271 L 393,272 L 393,271 L 394,271 L 394,272 L 395,272 L 396,272 L 397,274 L 397,273 L 398,273 L 398,272 L 397,272 L 397,271 L 397,270 L 397,269 L 398,269 L 399,269 L 398,269 L 399,269 L 399,270 L 400,270 L 400,271 L 401,271 L 401,270 L 401,271 L 402,271 L 403,271 L 403,270 L 404,270 L 405,270 L 404,270 L 405,270 L 405,269 L 406,269 L 407,269 L 407,268 L 408,268 L 409,268 L 409,267 L 410,267 L 411,267 L 413,267 L 414,267 L 414,266 L 414,265 L 415,265 L 415,266 L 415,267 L 416,267 L 417,267 L 418,267 L 418,266 L 419,266 L 419,267 L 418,267 L 417,267 L 416,267 L 416,268 L 416,269 L 416,270 L 416,271 L 416,272 L 417,272 L 418,272 L 418,271 L 419,271 L 420,271 L 420,272 L 419,272 L 418,272 L 418,273 L 417,273 L 417,274 L 417,275 L 418,275 L 418,276 L 417,276 L 417,277 L 417,278 L 416,278 L 417,278 L 417,279 L 417,280 L 417,281 L 417,282 L 417,283 L 418,283 L 419,283 L 419,284 L 420,284 L 419,284 L 420,284 L 420,285 L 421,285 L 421,286 L 422,286 L 421,286 L 421,287 L 420,287 L 420,288 L 421,289 L 420,289 L 421,289 L 420,289 L 420,290 L 421,290 L 420,290 L 420,291 L 420,292 L 420,293 L 420,294 L 419,294 L 418,294 L 417,294 L 416,294 L 416,293 L 416,292 L 415,292 L 414,292 L 414,291 L 413,291 L 413,292 L 412,292 L 413,292 L 413,293 L 413,294 L 413,295 L 413,296 L 412,296 L 411,296 L 410,296 L 410,295 L 409,295 L 408,295 L 408,296 L 407,296 L 408,296 L 408,297 L 407,298 L 407,299 L 408,299 L 408,298 L 408,299 L 409,299 L 409,300 L 408,300 L 408,301 L 407,301 L 407,302 L 407,303 L 408,303 L 408,304 L 408,305 L 409,305 L 409,306 L 409,307 L 408,307 L 407,308 L 406,308 L 405,308 L 404,308 L 404,309 L 403,309 L 404,309 L 403,309 L 404,309 L 403,309 L 402,309 L 402,310 L 402,309 L 401,309 L 401,308 L 401,307 L 401,306 L 401,307 L 401,306 L 402,306 L 402,305 L 402,304 L 402,303 L 401,303 L 401,302 L 399,302 L 398,302 L 397,302 L 392,302 L 391,302 L 390,302 L 390,303 L 390,304 L 389,304 L 389,305 L 390,305 L 389,305 L 390,305 L 389,305 L 390,305 L 390,306 L 389,306 L 389,307 L 389,308 L 389,309 L 389,310 L 391,310 L 392,310 L 393,310 L 395,310 L 397,310 L 398,310 L 399,310 L 401,310 L 402,310 L 402,311 L 401,311 L 402,311 L 402,312 L 402,313 L 401,313 L 401,314 L 400,314 L 400,315 L 400,316 L 400,317 L 401,317 L 402,317 L 402,318 L 402,317 L 402,318 L 403,318 L 403,319 L 403,318 L 403,319 L 403,320 L 404,320 L 403,320 L 403,321 L 404,320 L 404,321 L 403,321 L 404,321 L 404,322 L 404,323 L 405,323 L 404,323 L 405,323 L 404,323 L 404,324 L 404,323 L 404,324 L 403,324 L 404,324 L 403,324 L 402,324 L 402,325 L 403,325 L 402,325 L 403,325 L 402,325 L 401,325 L 402,325 L 401,325 L 402,325 L 402,326 L 402,325 L 401,325 L 401,326 L 401,325 L 401,326 L 402,326 L 401,326 L 401,327 L 400,327 L 401,327 L 400,327 L 401,327 L 400,327 L 400,328 L 399,328 L 399,327 L 399,328 L 399,329 L 399,330 L 400,330 L 401,330 L 402,330 L 402,331 L 403,331 L 403,332 L 402,332 L 403,332 L 402,332 L 403,332 L 402,332 L 402,333 L 402,334 L 401,334 L 402,334 L 401,334 L 402,334 L 401,334 L 401,335 L 402,335 L 402,336 L 402,337 L 402,338 L 401,338 L 401,339 L 400,339 L 400,340 L 399,340 L 399,339 L 399,340 L 399,339 L 399,340 L 398,340 L 398,341 L 397,341 L 397,342 L 397,341 L 397,342 L 396,342 L 396,343 L 395,343 L 395,342 L 395,343 L 394,343 L 393,344 L 393,343 L 392,343 L 391,343 L 390,343 L 390,342 L 389,342 L 389,341 L 389,342 L 388,342 L 387,342 L 386,342 L 385,342 L 385,341 L 384,341 L 384,342 L 383,342 L 382,342 L 381,342 L 381,341 L 380,341 L 379,341 L 379,342 L 378,342 L 378,343 L 377,343 L 377,342 L 376,342 L 376,343 L 375,343 L 375,344 L 375,345 L 374,345 L 373,345 L 373,346 L 373,345 L 372,345 L 372,344 L 371,344 L 370,344 L 370,345 L 369,345 L 370,345 L 369,345 L 368,345 L 368,346 L 367,346 L 367,345 L 366,345 L 365,345 L 364,345 L 364,346 L 363,346 L 362,346 L 361,346 L 360,346 L 360,347 L 360,348 L 359,348 L 359,349 L 358,349 L 358,350 L 358,351 L 358,352 L 357,352 L 357,353 L 356,353 L 355,353 L 354,353 L 354,354 L 354,355 L 353,355 L 353,356 L 352,356 L 352,357 L 353,357 L 353,358 L 352,357 L 351,357 L 351,356 L 350,356 L 350,355 L 349,355 L 348,355 L 348,354 L 347,354 L 347,355 L 347,354 L 346,354 L 347,354 L 346,354 L 346,353 L 345,353 L 344,353 L 343,353 L 343,352 L 343,353 L 343,352 L 342,353 L 342,352 L 342,353 L 341,353 L 341,352 L 340,352 L 339,352 L 339,351 L 339,352 L 339,351 L 338,351 L 338,350 L 337,350 L 338,350 L 337,350 L 336,350 L 335,350 L 335,349 L 334,349 L 335,349 L 334,349 L 333,348 L 332,348 L 331,348 L 331,347 L 331,346 L 330,346 L 329,346 L 328,346 L 327,346 L 326,346 L 325,346 L 324,346 L 324,345 L 323,345 L 323,344 L 324,344 L 324,343 L 325,343 L 326,343 L 326,342 L 326,341 L 325,341 L 324,341 L 323,341 L 323,342 L 322,342 L 322,341 L 321,341 L 322,341 L 321,341 L 321,340 L 321,339 L 321,338 L 322,338 L 322,337 L 322,336 L 321,336 L 321,335 L 321,334 L 320,334 L 320,333 L 319,333 L 319,332 L 320,332 L 319,332 L 320,332 L 319,332 L 319,331 L 320,331 L 319,331 L 320,331 L 320,330 L 319,330 L 320,330 L 319,330 L 320,330 L 319,330 L 320,330 L 320,329 L 320,328 L 320,327 L 320,326 L 321,326 L 321,325 L 321,324 L 322,324 L 321,324 L 322,324 L 322,323 L 322,322 L 323,322 L 322,322 L 323,322 L 323,321 L 324,321 L 324,320 L 325,320 L 325,319 L 326,319 L 326,318 L 327,318 L 326,318 L 327,318 L 327,317 L 328,317 L 327,317 L 328,317 L 328,316 L 328,315 L 327,315 L 327,314 L 327,313 L 328,313 L 329,313 L 329,312 L 329,313 L 329,312 L 329,311 L 330,311 L 331,311 L 331,310 L 332,310 L 332,309 L 333,309 L 333,308 L 333,307 L 334,307 L 335,307 L 335,308 L 335,307 L 336,307 L 337,307 L 337,306 L 338,306 L 338,307 L 339,307 L 339,306 L 339,305 L 340,305 L 340,304 L 340,303 L 340,302 L 340,303 L 341,303 L 341,302 L 340,302 L 341,302 L 341,301 L 341,300 L 341,299 L 342,299 L 341,299 L 341,298 L 342,298 L 342,297 L 343,297 L 343,296 L 344,296 L 345,295 L 346,295 L 347,295 L 347,296 L 347,295 L 348,295 L 349,295 L 349,294 L 350,294 L 349,294 L 349,293 L 350,293 L 349,293 L 350,293 L 350,292 L 350,291 L 350,290 L 351,290 L 351,289 L 351,288 L 351,287 L 351,286 L 351,285 L 351,284 L 352,284 L 352,283 L 353,283 L 353,282 L 353,281 L 353,280 L 353,279 L 353,278 L 353,277 L 354,277 L 354,276 L 354,275 L 354,274 L 355,274 L 355,273 L 355,272 L 356,272 L 356,271 L 356,270 L 357,270 L 356,270 L 356,269 L 356,268 L 357,268 L 356,268 L 356,267 L 357,267 L 357,266 L 358,266 L 358,265 L 358,264 L 358,263 L 359,263 L 359,262 L 359,261 L 360,261 L 360,260 L 360,261 L 360,260 L 361,260 L 362,260 L 362,259 L 363,259 L 362,259 "},"df": {"name": "Distrito Federal","path": "M 398,302 L 399,302 L 400,302 L 401,302 L 401,303 L 402,303 L 402,304 L 402,305 L 402,306 L 401,306 L 401,307 L 401,306 L 401,307 L 401,308 L 401,309 L 402,309 L 402,310 L 402,309 L 402,310 L 401,310 L 400,310 L 399,310 L 398,310 L 397,310 L 396,310 L 395,310 L 394,310 L 393,310 L 392,310 L 391,310 L 390,310 L 389,310 L 389,309 L 389,308 L 389,307 L 389,306 L 390,306 L 390,305 L 389,305 L 390,305 L 389,305 L 390,305 L 389,305 L 389,304 L 390,304 L 390,303 L 390,302 L 391,302 L 392,302 L 393,302 L 395,302 L 396,302 L 397,302 L 398,302 "}} });
@@ -1 +0,0 @@
-﻿$.fn.vectorMap("addMap","croatia",{insets:[{width:900,top:0,height:804.9967209703165,bbox:[{y:-5593673.991091945,x:1502415.0468362367},{y:-5001378.619193797,x:2164611.327668031}],left:0}],paths:{"hr-ob":{path:"M665.24,144.46l1.59,-0.94l9.9,-0.11l4.17,-1.18l2.45,3.31l4.5,1.63l5.28,0.68l2.05,-0.08l8.22,-4.46l3.56,1.7l7.19,-0.66l3.88,4.82l14.9,2.06l4.41,-2.98l3.07,0.35l3.21,3.52l3.05,0.25l6.3,-2.13l3.56,-6.02l1.31,-0.69l4.07,2.25l5.28,-3.3l2.6,-0.37l0.07,-0.78l-1.91,-0.62l5.14,-3.06l4.17,-9.6l2.05,0.46l3.36,-5.15l6.7,-1.69l2.83,0.36l3.69,1.24l6.55,3.97l2.17,-1.19l0.2,-1.15l1.02,2.03l4.29,3.32l-1.44,7.82l6.42,9.14l2.07,10.68l8.1,5.08l0.43,1.76l-1.4,2.97l-3.53,4.1l-4.05,2.42l1.16,3.66l-1.95,3.54l0.52,2.49l5.27,5.76l2.52,0.67l4.79,-0.69l2.95,-4.06l2.76,-0.23l0.95,3.78l10.56,3.57l0.1,3.63l-2.44,2.54l-2.48,0.48l-2.6,0.11l-5.47,-1.87l-1.45,2.16l-0.97,6.49l2.11,3.04l-4.28,-0.53l-2.98,1.18l-0.29,-2.05l-3.14,-2.63l-1.65,-3.16l-3.98,-2.23l-2.58,-0.12l-2.91,0.61l-1.39,2.48l-3.21,1.47l-4.27,0.42l1.05,1.89l-2.37,3.1l1.84,2.43l-0.3,1.9l-3.53,1.04l-0.88,-1.67l-3.18,-0.59l-5.2,1.02l-5.11,2.96l-5.25,0.27l-0.54,1.21l0.76,5.76l-4.63,1.48l2.78,5.74l-6.67,-0.46l-3.18,3.89l-4.71,-0.94l-4.61,2.58l0.51,6.61l-1.07,2.23l1.96,2.07l2.49,0.09l-1.06,3.05l-1.92,0.96l-2.36,-0.86l-3.03,0.92l-2.01,-1.7l-3.15,0.53l-3.09,-2.29l-4.34,-0.82l-1.46,-2.09l-4.5,-1.41l-8.18,0.27l-5.38,3.32l-4.45,0.74l-1.83,1.36l-4.67,-2.07l-2.23,-3.03l-5.39,-0.71l-1.07,-1.54l-5.28,-0.28l-4.5,-1.91l6.29,-6.74l-3.47,-5.97l-2.87,-1.35l1.18,-1.55l3.95,-1.51l1.22,-1.41l0.04,-2.16l-2.99,-3.67l-10.16,0.18l-1.99,-3.57l-4.33,0.4l-7.63,-6.32l-5.25,-0.22l-2.66,-1.7l1.45,-3.34l7.38,-3.63l2.24,-5.84l3.48,-4.38l1.38,-0.47l2.57,-5.09l2.29,-1.88l4.33,-7.23l2.57,0.8l0.77,-2.06l-0.97,-1.42l-4.27,0.18l-2.29,-2.98l-1.7,-3.31l-1.59,-7.41l-4.93,-0.24l-0.5,-1.87l-4.22,-0.34l-0.26,-3.65l-3.5,-4.5l-2.92,-1.08Z",name:"Osječko-Baranjska"},"hr-zg":{path:"M397.4,143.34l-0.14,-1.67l1.63,0.06l8.51,3.43l0.96,-2.25l0.42,-6.53l3.93,-2.65l-1.13,-1.81l0.05,-2.77l-3.81,-5.16l-2.53,-0.65l-1.61,-8.78l-2.83,-5.15l1.35,-4.58l1.81,-0.9l3.27,0.2l-2.92,-3.86l6.29,-0.97l-1.36,-3.65l2.14,-2.44l2.78,-1.05l0.95,-1.21l1.45,3.96l2.0,0.71l0.09,3.99l2.79,1.98l1.67,0.08l2.82,-2.26l2.03,-0.22l2.18,1.01l3.07,-0.19l4.56,3.32l3.24,-0.28l1.82,1.61l0.24,3.05l3.33,0.33l1.05,1.32l-0.21,5.25l6.87,-4.21l1.91,1.35l3.31,-0.31l1.63,2.48l4.21,2.15l0.8,1.91l1.76,1.18l2.63,-0.8l1.32,1.12l3.0,0.08l5.63,-1.56l2.68,1.75l-0.37,6.82l2.56,4.85l-1.3,2.23l-3.17,0.71l-1.43,1.74l-1.59,-0.63l-1.87,0.88l-0.67,-2.59l-1.73,-0.3l-2.81,3.68l-1.92,0.73l0.18,5.55l-2.21,0.27l-5.34,-3.23l-4.12,2.04l-2.29,-0.29l-0.53,3.32l-2.06,0.54l-0.17,0.7l3.93,2.83l-2.39,1.56l-0.05,4.72l3.19,0.77l1.67,3.22l5.31,-0.96l2.27,2.51l0.59,2.6l2.3,0.69l0.94,2.83l-0.52,2.05l-2.13,1.43l0.07,2.64l-2.4,1.16l-4.01,-0.13l-2.31,2.77l-4.77,1.51l-3.73,5.28l-0.8,0.0l-4.19,-4.89l-4.82,-1.03l-0.91,-2.14l-2.81,-2.3l-3.65,-0.49l-3.95,1.13l1.26,-3.01l-0.75,-1.33l-2.96,0.45l-3.52,1.87l-1.77,-6.79l-5.73,0.23l-0.4,-3.66l-2.82,-1.4l-0.06,-2.09l-2.46,-2.96l2.16,-1.9l-0.03,-2.48l-3.81,-1.42l-3.0,0.73l-3.96,-3.0l-3.78,-4.43ZM279.45,148.69l5.43,-2.43l7.18,-1.86l3.71,0.88l1.85,-1.99l0.09,-5.23l2.18,-3.01l1.32,1.35l4.75,-0.33l2.1,-1.03l3.71,-3.93l8.12,2.09l5.78,3.68l3.53,-2.03l5.59,-4.29l-2.96,-1.79l-2.15,-7.18l4.33,-6.91l-0.35,-2.21l1.42,-3.13l6.2,-0.92l1.88,2.61l2.5,-0.24l2.29,1.43l0.79,1.84l1.37,0.27l1.36,-2.89l3.12,-3.17l1.46,0.17l8.77,3.46l3.47,3.7l-1.71,0.84l-6.06,-0.76l-6.58,1.49l-2.82,-0.66l-1.95,2.32l-0.85,2.05l1.25,2.15l0.22,2.5l6.39,-0.18l2.67,3.42l-1.1,1.13l-2.66,0.43l-1.19,2.18l-3.17,0.54l-0.5,2.26l2.3,7.32l-3.65,4.86l-1.34,4.56l-2.73,1.85l-1.35,4.01l0.81,3.81l6.0,3.49l8.06,3.1l4.5,4.18l-0.17,2.38l4.9,2.78l-0.1,4.51l-4.89,9.03l-3.83,0.59l-0.62,-3.16l-3.3,-0.66l-3.57,1.55l-1.47,2.77l-3.74,0.98l-0.23,-2.77l-1.88,-0.61l-2.32,-2.69l-3.68,-2.42l-0.75,-3.86l-4.26,-2.81l-5.64,0.13l-2.98,-2.47l-3.85,-1.38l-4.55,3.03l-1.84,2.63l-1.58,-1.91l-3.55,-1.56l-1.93,0.03l-0.36,-5.77l-5.38,-2.55l-3.77,-5.66l-3.17,-0.99l-2.21,0.9l-1.41,-2.45l-5.08,-1.94l-7.5,-4.83l1.32,-4.63Z",name:"Zagrebačka"},"hr-gz":{path:"M350.4,124.97l-0.02,-2.15l-1.21,-2.18l2.02,-3.27l2.89,0.6l7.46,-1.55l5.11,0.83l2.42,-1.12l1.03,1.26l-0.24,4.52l0.59,0.43l13.62,-7.82l6.3,-2.53l3.32,0.09l1.6,-2.07l4.87,-0.15l2.76,4.99l1.63,8.84l2.75,0.93l3.69,5.04l-0.2,2.43l0.93,1.54l-3.66,2.41l-1.13,8.49l-8.6,-3.68l-1.83,0.52l0.14,2.37l3.98,4.64l4.15,3.13l3.26,-0.66l3.35,1.19l-0.15,1.6l-1.93,1.47l-0.19,1.35l2.46,2.74l0.18,2.26l2.7,1.22l0.63,3.92l5.44,-0.31l2.2,7.29l-0.75,1.6l-3.27,0.46l-0.47,1.88l-3.48,1.94l-1.98,-2.09l-5.13,-0.23l-2.17,-5.31l-2.26,-0.59l-2.37,0.54l-3.13,3.58l-3.5,0.15l-3.13,3.64l0.15,3.19l-3.99,2.37l0.91,2.98l4.29,3.48l-0.45,4.15l-3.07,-0.06l-1.8,1.91l0.51,2.79l-2.15,1.76l-2.12,-1.45l-3.68,-0.8l-2.98,2.57l-2.29,0.82l-7.73,-0.51l-1.04,-1.8l0.73,-2.69l-0.66,-3.19l-2.39,-3.11l5.08,-9.54l-0.11,-4.74l-5.02,-2.94l0.21,-2.34l-4.69,-4.35l-8.16,-3.16l-5.96,-4.1l-0.39,-2.43l1.23,-3.62l2.65,-1.71l1.41,-4.68l3.75,-5.09l-2.29,-7.74l0.42,-1.66l2.88,-0.24l1.25,-2.21l2.57,-0.37l1.59,-1.94l-3.22,-4.05l-6.13,0.35Z",name:"Grad Zagreb"},"hr-is":{path:"M1.14,201.86l-0.66,-1.24l0.86,-0.03l0.15,-1.37l1.7,-1.23l6.98,2.86l5.56,5.03l3.44,0.54l5.59,2.55l12.48,-5.86l3.38,1.57l7.44,-0.38l8.36,4.37l2.52,3.79l8.67,-6.64l6.12,0.01l3.66,-1.52l2.22,-5.06l2.78,-0.51l7.01,3.21l8.87,0.83l-0.29,4.09l3.11,5.13l9.22,4.85l-2.81,2.36l-0.42,1.35l0.58,1.58l2.06,1.32l0.07,3.88l1.06,2.72l-2.49,1.1l-1.83,4.18l1.16,5.28l-0.78,3.47l2.23,6.31l-1.38,9.96l3.85,2.78l-0.73,3.35l-1.03,0.52l-1.27,3.31l-3.73,-3.14l-0.99,0.4l2.78,3.22l0.25,1.68l-3.49,5.06l-1.22,0.91l-1.37,-1.11l-0.86,0.35l-0.46,2.24l1.51,1.88l-0.61,0.99l-1.18,-0.83l-0.73,0.5l1.71,2.21l0.22,2.58l1.89,3.23l0.34,5.62l-2.99,4.06l-1.65,-1.78l-2.11,0.95l-0.99,-1.71l-1.32,-0.1l-3.48,2.15l-1.59,2.47l-0.57,0.16l0.71,-3.88l3.55,-0.15l0.39,-0.67l-1.72,-1.01l-0.44,-1.68l-0.63,0.18l-0.78,-3.91l-1.52,0.99l-1.67,-0.48l0.79,-2.55l-1.76,-2.97l-0.53,-0.44l-1.54,1.02l1.09,3.11l-1.35,2.6l5.07,1.65l0.78,2.44l-1.82,0.12l0.06,1.78l-2.03,2.48l0.5,1.03l-3.2,-0.9l2.56,3.03l-1.01,0.69l-0.71,2.81l-1.2,-1.5l-0.69,0.36l0.3,0.71l-1.26,1.0l1.34,0.79l-0.69,1.56l-3.75,1.79l-2.06,-1.95l-0.75,0.46l0.04,1.71l3.36,1.88l-1.6,0.87l0.94,2.61l-2.54,2.32l-0.46,2.13l1.51,2.05l-1.93,1.89l0.82,0.71l1.5,-0.67l1.67,2.83l-7.74,-0.21l-2.5,-3.01l-3.36,-2.08l-0.35,1.52l-1.65,-0.03l0.5,0.81l-1.62,-1.21l-1.45,0.76l1.2,1.44l4.12,0.76l0.82,1.39l-1.34,2.06l0.85,2.16l-1.06,1.06l1.07,1.02l0.42,-0.09l0.26,0.09l0.21,0.24l-2.31,-0.47l0.18,-2.89l-0.98,-0.99l0.47,-2.61l-0.78,-0.92l-5.17,-0.05l-0.33,-0.54l1.82,-1.32l-1.43,-0.68l-1.01,1.3l-0.61,-0.05l0.38,-0.61l-1.63,-1.03l2.0,0.06l0.28,-1.28l-2.61,0.01l0.5,-0.84l-1.2,-1.55l-0.61,1.67l-1.22,0.0l1.09,-1.05l-0.14,-1.39l-2.52,-2.33l3.01,-0.35l1.83,-1.85l-0.08,-1.77l-1.83,-0.76l-1.22,1.45l-1.72,0.22l-1.87,-1.11l0.25,-1.41l-0.73,-0.45l1.86,-2.56l-1.39,-1.24l-0.33,-3.06l-1.82,-1.75l-1.18,-2.07l0.34,-0.92l-2.15,-2.06l-1.35,-3.5l-4.0,-0.35l0.23,-0.69l-1.93,-1.32l-0.55,-1.7l-1.12,-0.31l0.24,-2.29l-3.71,-0.56l0.18,-2.67l-1.39,-1.11l1.1,-0.89l-0.44,-0.59l-4.75,-2.67l-3.8,0.34l1.06,-0.9l-0.46,-0.94l0.79,-0.79l-0.96,-0.64l1.25,-0.74l0.0,-1.77l-2.9,-1.08l-2.14,-2.44l2.12,0.12l0.82,-1.46l-1.77,-2.41l-1.92,0.23l-0.71,-2.29l1.72,-2.49l-1.8,-1.66l0.21,-0.74l-1.4,-0.58l2.21,-0.87l-3.36,-3.24l2.55,-1.29l-1.33,-1.47l1.58,-5.97l-1.4,-0.96l0.72,-0.79l-0.56,-0.68l-2.17,-0.1l0.63,-1.02l-0.59,-0.84l0.72,-1.34l2.5,-0.06l0.27,-1.91l-2.39,-0.19l-2.21,-2.12l2.56,0.27l0.36,-1.57l3.74,-1.75l-2.8,-2.02l-1.57,0.57l0.04,0.84l-4.09,0.1l0.8,-0.8l-0.53,-0.71l-3.22,-1.03l0.76,-2.12l-0.85,-1.79l2.48,-1.5l-2.09,-0.76l0.5,-1.89l-0.8,-0.5l0.81,-0.54l-1.9,-1.49l1.09,-0.87l-1.11,-1.11l0.65,-0.91l-3.15,-2.58l1.3,-1.77l-0.84,-0.88l0.84,-1.61l-2.23,-0.85l1.13,-2.03l-0.88,-1.15l-0.08,-2.61l-2.41,-1.83ZM21.74,277.06l0.0,0.0l0.0,0.0l0.0,0.0ZM47.5,312.19l-0.11,0.11l-0.04,0.01l0.12,-0.13l0.03,0.01ZM48.96,319.16l0.06,0.05l-0.01,0.06l-0.08,-0.07l0.04,-0.04ZM49.17,319.42l-0.04,-0.04l0.0,-0.02l0.07,0.06l-0.03,-0.01ZM49.01,318.11l-2.06,0.03l-0.68,-2.16l0.96,0.11l1.78,2.03ZM56.36,326.21l0.01,0.0l0.0,0.0l-0.01,0.0ZM100.81,283.17l0.13,-0.03l0.0,0.17l-0.08,-0.08l-0.05,-0.06ZM101.48,283.92l0.0,0.07l0.04,0.05l-0.08,-0.08l0.04,-0.04ZM101.27,283.78l0.07,0.08l-0.07,-0.07l0.0,-0.01ZM66.5,328.37l0.0,-0.16l0.09,-0.09l0.0,0.07l-0.09,0.18ZM65.84,326.31l0.17,0.1l0.08,0.0l-0.3,0.04l0.05,-0.15ZM50.88,318.86l0.0,-0.02l0.01,0.02l-0.01,0.0ZM46.63,312.57l0.01,0.02l-0.03,0.0l0.0,0.0l0.02,-0.02ZM46.72,312.59l0.05,-0.08l0.25,-0.05l-0.18,0.13l-0.12,0.0ZM14.99,254.27l-0.01,-0.01l0.01,0.0l0.0,0.01ZM6.8,218.09l0.0,0.0l0.0,0.0l0.0,0.01ZM78.04,321.27l0.53,-0.39l0.01,0.8l-0.53,-0.01l-0.01,-0.4ZM77.64,324.42l0.53,0.04l0.01,1.23l-0.53,-0.44l-0.01,-0.83ZM69.23,335.15l-0.04,-0.05l0.0,-0.04l0.08,0.09l-0.03,0.0ZM58.09,337.9l0.18,-0.23l0.05,0.0l-0.23,0.23ZM53.25,324.41l0.0,-0.01l0.16,0.14l-0.12,0.04l-0.04,-0.16ZM52.53,316.17l-0.08,0.01l0.03,-0.05l0.04,0.03ZM37.76,306.77l-0.06,-0.13l-0.11,-0.11l0.37,0.1l-0.19,0.14ZM38.22,306.59l0.77,-0.26l1.3,1.3l1.4,-0.26l0.53,1.09l1.12,-0.29l0.28,0.27l-1.46,1.62l-0.82,-0.73l-0.99,0.76l0.0,1.56l-1.08,-1.41l1.2,-0.6l0.09,-1.68l-2.34,-1.36ZM40.34,312.07l0.05,-0.17l0.13,0.29l-0.11,-0.11l-0.06,-0.01ZM39.55,312.4l-0.21,0.08l-0.06,0.0l0.02,-0.08l0.25,0.0ZM43.2,309.63l0.16,-0.1l0.63,0.15l-0.27,0.46l-0.52,-0.52ZM41.94,310.51l0.05,0.05l-0.05,0.0l0.0,-0.05ZM37.23,304.43l-0.02,-0.02l0.19,-0.2l0.0,-0.14l0.08,0.08l-0.25,0.28ZM38.61,304.8l0.25,0.51l-0.13,0.11l-0.43,-0.11l0.3,-0.51ZM38.54,304.24l-0.05,-0.05l0.01,0.0l0.04,0.05Z",name:"Istarska"},"hr-zd":{path:"M246.27,430.42l1.92,-2.62l1.84,-0.75l5.54,6.91l3.78,-0.77l2.0,-2.31l-3.41,-4.63l0.97,-0.39l1.96,1.29l0.56,-1.77l6.93,5.85l3.26,2.01l2.11,-0.03l0.84,-2.18l-1.9,-1.74l-1.01,-2.5l2.74,0.56l1.12,-1.9l-6.94,-6.19l0.5,-1.5l1.0,-0.13l0.34,1.02l8.15,4.38l-0.16,1.8l10.89,6.25l2.59,0.72l3.82,-1.6l11.48,3.2l0.11,2.06l1.4,2.04l-8.58,1.8l-0.48,1.64l8.3,5.4l2.62,-1.96l0.84,1.03l0.8,-2.05l2.33,0.35l3.52,2.11l1.85,2.17l-0.72,3.91l2.92,3.03l2.12,-1.21l0.25,-2.13l-3.86,-4.55l-0.88,-0.06l-0.47,-1.65l1.34,-1.32l-2.22,-2.36l-0.12,-1.5l-0.53,-0.4l-0.53,0.93l-6.6,-3.14l-2.28,-2.55l-0.03,-2.07l2.02,-0.19l0.0,-2.52l-2.05,-1.9l-2.69,-0.83l-4.3,0.93l-1.75,-2.58l-2.03,0.52l-7.16,-6.97l-10.1,-3.71l-5.23,-3.56l-4.11,-1.6l3.22,-7.97l1.23,-0.49l3.52,1.13l7.01,4.89l20.43,5.79l5.87,10.76l2.22,-0.61l6.48,2.07l4.04,-0.29l4.41,2.94l14.33,0.22l4.4,-2.24l4.24,-5.5l-1.59,-8.82l-1.31,-0.41l-3.15,0.88l-2.54,-1.38l3.45,-4.88l-2.23,-3.19l0.64,-4.25l2.0,-1.48l7.89,-2.72l3.8,-5.01l4.45,-0.92l5.07,-5.01l5.83,-0.2l3.34,1.39l3.33,3.09l1.94,2.28l0.91,4.04l2.96,3.09l1.5,-1.26l-1.08,-6.04l3.84,3.42l3.85,-0.33l4.95,-2.31l-0.09,4.04l-1.53,3.12l5.36,3.03l-0.62,1.63l-2.35,0.89l-0.96,1.52l1.49,1.95l3.97,0.23l6.57,4.55l-2.25,8.0l0.03,4.99l0.91,2.43l4.62,4.45l0.93,6.75l-8.69,1.33l-5.46,-0.47l-2.19,4.39l0.1,3.77l-1.43,4.34l-5.85,2.83l-1.49,1.78l-5.13,-3.2l-8.94,-3.12l-1.54,-4.86l-2.3,-1.83l-1.12,0.29l-5.37,5.52l-1.5,3.11l-3.5,1.92l-4.6,5.3l-2.26,-0.16l-2.55,4.06l-5.76,-0.54l-0.99,0.61l0.54,1.68l7.05,2.59l2.38,2.48l-4.16,5.79l1.76,2.61l-6.99,3.61l1.28,3.26l3.68,2.78l-0.87,1.71l-1.58,0.93l-2.13,-2.05l-3.61,-0.25l-0.98,2.04l2.16,1.96l-2.21,4.24l-3.35,0.23l0.13,1.06l1.97,1.06l-2.13,5.1l-7.91,-5.1l-3.87,3.97l-4.13,1.87l-2.31,-1.13l-4.41,-4.26l-1.31,-0.01l-2.2,1.85l-2.61,-1.44l-0.62,-0.72l0.51,-1.06l-3.03,-2.64l-2.76,-0.6l-2.86,-1.92l-1.44,0.59l-4.09,-3.97l0.78,-1.31l-1.07,-1.53l-5.0,-2.85l-9.8,-11.97l-4.8,-1.03l0.37,-2.33l-2.67,-0.56l-1.62,-1.43l-0.93,-4.14l-3.09,-2.77l-1.54,0.3l-2.09,-1.67l-1.58,-1.79l1.58,0.77l-1.23,-2.35l-2.6,-1.28l1.04,-1.15l-0.42,-1.39l-5.2,-5.13l-2.43,-1.1l-0.13,-1.53l-2.42,-1.31l2.24,-1.02l0.09,-2.82l1.17,-0.34l0.0,-1.86l-3.31,-2.83l-1.91,0.1l0.26,-1.13l-1.31,-0.52l0.5,-0.79l-2.17,-0.92ZM259.33,424.23l-0.63,-0.05l-0.42,-0.44l0.47,0.15l0.58,0.34ZM260.91,425.03l0.31,0.05l0.04,0.12l-0.04,-0.05l-0.32,-0.12ZM306.34,509.7l-0.12,-0.22l1.33,0.71l-0.53,-0.02l-0.68,-0.47ZM300.45,532.7l0.12,0.13l0.05,0.38l-0.12,-0.15l-0.04,-0.36ZM303.22,534.57l-0.08,-0.09l0.7,0.35l-0.29,0.09l-0.34,-0.35ZM305.1,535.61l0.64,-0.05l1.15,0.53l-0.62,-0.05l-1.18,-0.43ZM302.77,505.01l1.72,0.14l1.99,1.22l-2.2,0.36l-1.51,-1.71ZM304.07,504.59l0.28,0.11l0.01,0.14l-0.29,-0.24ZM299.95,528.79l0.89,-0.52l0.37,0.93l-0.76,0.36l-0.5,-0.77ZM300.41,529.66l0.0,-0.01l0.04,-0.04l-0.04,0.05ZM296.92,529.68l1.13,0.49l0.21,0.76l-1.24,-0.95l-0.1,-0.31ZM201.81,450.12l1.39,0.67l0.48,1.27l2.46,0.46l0.49,1.1l-3.76,-1.69l-1.05,-1.81ZM209.08,455.12l-1.91,-1.31l1.03,-0.99l2.2,0.42l0.48,-0.71l-1.96,-2.29l-1.78,-3.48l7.57,5.6l0.0,1.56l2.12,2.41l3.3,0.56l-0.84,1.2l1.41,1.99l7.61,4.33l0.57,-0.5l-0.54,-1.21l1.29,0.68l0.04,1.03l-1.13,0.58l0.85,1.18l1.67,0.02l1.64,5.76l3.2,5.15l2.04,1.89l1.14,-0.06l4.11,4.02l0.57,-1.7l2.58,1.29l-0.57,1.5l2.5,2.56l2.71,0.89l1.79,2.66l1.01,-0.1l1.55,2.83l6.75,3.41l0.33,1.07l-1.55,0.11l0.53,1.19l-2.06,-0.02l-3.78,-2.48l-2.68,0.13l0.72,-1.2l-3.86,-3.16l-1.77,1.53l2.44,1.17l0.99,2.35l-0.47,0.44l-2.65,-1.94l-8.8,-9.62l-11.76,-17.51l-8.17,-5.65l-3.02,-4.17l-4.38,-3.68l-2.78,-1.42l-0.27,1.7ZM262.72,502.13l1.56,-0.46l0.79,1.18l3.47,0.36l-1.98,1.19l11.66,8.41l4.76,5.14l5.52,3.72l-8.63,-4.37l-1.08,0.46l-2.74,-2.57l-1.22,-0.12l-0.58,-0.63l0.71,-0.7l-1.77,-0.55l-0.26,-1.18l-1.0,0.4l-0.2,-1.19l-1.27,-0.69l-1.18,0.35l-3.75,-3.95l0.64,-0.69l-0.64,-0.91l-3.1,-2.49l0.28,-0.73ZM291.92,523.85l0.01,0.0l0.03,0.03l-0.02,0.0l-0.02,-0.03ZM292.37,524.08l-0.34,-0.18l0.15,0.0l1.25,0.65l-1.06,-0.47ZM275.68,511.05l0.01,-0.03l0.0,0.0l0.0,0.0l-0.02,0.03ZM270.6,504.63l0.02,0.02l0.05,0.02l-0.07,0.0l0.0,-0.04ZM295.48,525.86l0.97,0.15l0.46,0.47l-0.42,0.32l-1.01,-0.95ZM297.58,526.94l0.61,0.2l-0.09,0.33l-0.18,-0.05l-0.34,-0.48ZM262.53,501.04l-1.09,-0.37l0.26,-1.34l1.0,0.68l-0.17,1.04ZM261.47,498.72l-0.03,-0.03l0.03,0.02l0.0,0.01ZM252.98,499.16l1.13,-1.14l0.88,1.9l3.26,1.14l0.41,0.9l-0.96,0.72l-4.71,-3.51ZM207.15,446.7l0.0,0.06l-0.13,-0.24l0.11,-0.17l0.02,0.35ZM206.97,451.87l-0.61,-0.15l-0.77,-0.8l2.62,0.95l-1.24,0.0ZM238.84,451.02l-0.39,-1.44l5.84,4.12l0.64,1.34l1.89,1.13l0.83,-0.62l3.88,4.17l0.83,-0.46l1.53,1.96l0.8,0.21l0.36,-0.84l1.34,0.93l-0.42,1.52l2.92,3.39l6.37,3.92l0.38,1.96l1.86,2.12l-1.26,0.45l0.03,1.02l-0.96,0.2l0.59,-2.1l-2.04,-0.6l-0.19,-1.92l-2.66,-2.3l-0.37,1.86l-1.32,-0.68l-0.48,1.66l-1.52,-0.94l-8.99,-9.06l-2.25,-3.61l-2.38,-0.4l-3.78,-3.62l-1.07,-3.37ZM267.19,476.38l1.64,-0.68l3.09,1.02l1.55,2.01l4.14,1.23l3.49,2.81l1.75,2.59l2.22,-0.72l1.04,2.16l1.09,0.01l-0.46,1.24l1.17,2.77l4.92,3.04l4.46,4.03l-0.15,1.02l-1.55,-1.14l-1.31,1.03l-1.39,-0.31l-5.87,-4.42l-2.1,0.1l-0.02,1.34l-1.18,-0.57l-0.88,-1.18l1.22,-1.09l-0.61,-0.92l-2.31,-1.64l-1.27,0.26l0.07,-1.46l-4.45,-2.03l-1.11,-2.84l-4.76,-4.53l-0.24,-1.9l-2.19,-1.23ZM286.48,495.52l-0.28,-0.05l0.0,-0.07l0.15,-0.11l0.13,0.23ZM268.83,475.7l-0.21,-0.5l0.06,-0.07l0.41,0.25l-0.26,0.32ZM238.76,454.02l-0.04,-0.07l-0.05,-0.05l0.2,0.05l-0.12,0.06ZM293.89,502.99l1.05,0.21l0.75,0.7l-0.21,0.15l-1.59,-1.06ZM294.99,530.71l0.0,-0.12l-0.16,-0.22l0.5,0.39l-0.35,-0.05ZM293.77,507.84l-0.45,-0.77l1.48,0.37l0.0,0.39l-1.03,0.01ZM294.42,529.09l0.16,0.0l0.2,0.08l-0.09,0.09l-0.26,-0.17ZM292.17,500.12l1.02,-0.35l0.63,0.51l-0.87,0.86l-0.77,-1.02ZM293.82,500.3l0.01,-0.01l0.01,0.01l-0.02,0.0ZM291.28,528.85l0.65,-0.35l0.6,0.3l-0.25,0.2l-1.0,-0.15ZM289.0,486.14l0.81,0.39l0.41,0.76l-0.75,-0.21l-0.48,-0.94ZM289.61,499.71l0.47,0.15l0.18,0.15l-0.66,-0.08l-0.53,-0.44l-0.04,-0.15l0.59,0.37ZM288.77,498.83l-0.01,0.07l-0.13,-0.17l0.0,-0.05l0.14,0.15ZM287.9,526.17l-0.02,0.02l0.0,-0.04l0.02,0.02ZM286.56,525.7l-0.07,-0.09l0.16,-0.3l0.17,-0.2l-0.27,0.58ZM277.8,520.85l-0.66,-0.15l-0.44,-0.58l1.43,0.36l-0.33,0.37ZM278.82,521.03l1.85,0.92l2.59,0.54l-1.48,0.45l-2.95,-1.92ZM283.97,523.24l0.57,0.92l1.45,-0.41l-1.06,1.78l-1.51,-0.8l0.55,-1.49ZM268.04,500.76l1.04,-2.11l1.0,0.91l2.35,0.05l-0.94,1.04l1.81,1.48l0.98,-0.62l2.24,1.13l0.87,-1.14l-0.01,1.42l4.04,4.22l0.17,1.62l1.05,0.82l-4.56,-3.38l-2.02,-0.34l-4.85,-4.56l-3.17,-0.56ZM278.97,502.59l0.02,0.0l0.14,-0.11l-0.08,0.19l-0.08,-0.07ZM276.49,500.4l0.09,-0.32l0.08,-0.06l0.08,0.22l-0.24,0.16ZM284.37,510.42l0.1,0.04l0.19,0.23l-0.22,-0.02l-0.07,-0.24ZM281.45,520.0l0.21,0.04l0.04,0.06l-0.02,0.19l-0.23,-0.29ZM278.15,495.34l0.31,0.0l-0.1,0.23l-0.09,-0.01l-0.12,-0.23ZM272.2,491.2l-0.17,-0.91l3.44,2.1l0.88,1.59l-4.15,-2.77ZM276.56,494.19l0.18,0.18l-0.02,0.0l-0.17,-0.18ZM276.78,494.36l0.04,-0.04l0.0,0.04l-0.04,0.0ZM272.65,517.69l0.03,0.01l-0.02,0.02l0.0,-0.02l-0.01,-0.01ZM271.37,492.69l-0.06,0.0l0.0,-0.02l0.07,0.0l-0.02,0.02ZM268.89,515.02l0.01,0.02l-0.05,0.0l0.02,-0.02l0.01,0.0ZM268.93,515.04l-0.02,-0.03l0.05,-0.05l0.04,0.08l-0.07,0.0ZM268.29,492.69l-0.15,-0.23l0.46,0.43l-0.27,0.0l-0.04,-0.2ZM264.67,510.52l1.55,0.44l0.13,0.48l-0.81,0.36l-0.87,-1.29ZM266.92,512.04l-0.06,0.39l-0.13,0.05l-0.08,-0.22l0.27,-0.22ZM267.73,511.76l0.0,-0.38l0.61,0.21l-0.05,0.33l-0.56,-0.16ZM267.13,513.66l-0.1,0.0l0.0,-0.07l0.13,0.05l-0.02,0.02ZM267.5,513.71l-0.02,-0.02l0.1,0.0l0.0,0.04l-0.08,-0.02ZM214.0,381.14l-0.62,-0.65l2.42,-1.46l2.45,0.37l17.35,17.64l1.36,-0.91l-1.33,-6.02l0.9,0.26l6.86,5.84l2.6,0.68l3.83,5.73l5.0,2.53l2.07,3.93l2.2,-0.21l6.73,5.17l1.56,3.82l-11.12,-6.22l-0.35,1.03l7.96,6.76l-3.02,-0.77l-0.62,0.97l0.7,1.1l-3.58,-1.6l-1.21,0.36l-5.48,-2.68l-2.12,0.31l0.13,1.75l6.97,5.56l-0.26,0.13l-2.73,-0.83l-6.84,-4.44l-2.57,-3.26l1.51,0.1l0.42,-1.96l-2.73,-2.53l0.79,-1.41l3.1,-0.17l-0.09,-2.16l-5.05,-3.47l-2.52,-0.21l-0.16,2.01l-3.99,-0.93l0.26,-2.44l-2.41,-3.49l-6.02,-5.33l-4.04,-2.75l-1.07,0.73l-2.49,-0.32l-3.87,-3.08l-1.09,-2.01l2.4,0.0l0.8,-0.94l-0.9,-2.72l-2.09,-1.79ZM261.85,421.74l-0.24,-0.52l0.83,0.55l-0.43,0.15l-0.16,-0.17ZM266.74,497.58l-0.38,-0.43l0.07,-0.11l0.63,0.31l-0.31,0.23ZM263.62,499.01l0.34,-0.02l0.18,0.17l-0.25,0.01l-0.27,-0.15ZM262.7,505.44l0.38,-0.43l0.72,0.75l-0.17,0.41l-0.92,-0.73ZM258.36,488.9l1.55,0.79l1.92,2.59l-2.08,-1.07l-1.4,-2.31ZM260.5,503.05l-0.08,-0.1l-0.01,-0.04l0.22,0.22l-0.13,-0.07ZM260.33,464.49l0.13,-0.07l0.13,0.38l-0.19,-0.26l-0.07,-0.05ZM259.98,464.39l-0.01,0.01l-0.01,0.0l0.02,-0.01l0.0,0.0ZM239.94,463.76l4.46,3.03l0.42,2.33l3.02,2.41l0.53,1.42l2.17,0.95l0.27,1.03l0.99,-0.26l-0.8,0.99l0.74,1.78l-0.15,0.15l-4.7,-3.4l-2.97,-3.86l-3.3,-1.75l-0.68,-4.8ZM239.82,463.6l-0.11,-0.11l0.08,0.0l0.03,0.11ZM249.73,484.98l-0.36,-0.21l0.22,-0.22l0.15,0.15l-0.01,0.28ZM248.9,471.31l0.12,-0.3l0.23,0.56l-0.28,-0.17l-0.07,-0.09ZM231.71,419.38l0.13,-0.95l3.81,0.04l1.46,1.76l1.46,-0.67l2.49,1.91l2.53,-0.17l3.91,3.52l1.28,0.03l-1.86,1.38l-0.31,-2.06l-5.51,-1.14l-1.4,2.17l-3.42,0.26l-3.4,-3.24l-1.18,-2.85ZM238.86,473.95l1.5,0.93l1.01,2.03l-3.07,-1.85l-0.52,-1.11l1.07,0.01ZM237.27,473.97l-0.01,0.0l-0.09,0.02l0.12,-0.04l-0.02,0.02ZM237.79,472.78l0.01,-0.01l0.01,0.0l0.0,0.01l-0.01,0.0ZM237.54,471.86l0.16,-0.41l0.41,-0.02l-0.39,0.57l-0.18,-0.13ZM232.0,448.06l0.34,-0.46l3.05,2.76l1.19,0.05l0.33,1.73l-2.66,-1.29l-2.25,-2.79ZM220.59,441.9l6.88,7.19l1.88,-0.03l1.63,2.27l1.39,0.41l1.18,1.38l-0.42,1.84l-2.3,-2.1l-2.88,-0.63l-2.49,-3.25l-0.82,0.07l-0.46,-1.68l-3.49,-3.5l-0.1,-1.98ZM229.57,453.27l0.0,-0.03l0.01,0.01l-0.01,0.02ZM230.57,450.7l0.0,0.0l0.0,-0.01l0.0,0.0ZM223.35,444.35l-0.01,0.0l0.0,-0.01l0.01,0.01ZM227.86,404.9l0.14,0.05l0.04,0.08l-0.14,-0.05l-0.05,-0.08ZM226.96,461.97l0.16,-0.16l-0.04,0.16l-0.12,0.0ZM211.65,394.49l2.04,0.27l2.47,3.67l4.6,2.69l2.82,2.6l-7.38,-3.61l0.19,-0.86l-3.45,-2.49l-1.3,-2.27ZM215.04,448.42l-2.8,-1.98l2.97,0.97l3.42,2.33l1.7,1.78l-5.29,-3.09ZM214.63,443.5l1.79,0.52l1.91,1.59l0.88,1.32l-4.59,-3.43ZM189.24,427.31l0.78,-0.57l2.36,0.82l0.33,-0.73l-1.47,-2.14l0.63,-0.33l4.43,3.82l1.05,0.11l0.37,0.09l0.2,0.18l-1.84,0.98l-3.14,-1.75l0.41,2.99l-0.83,-0.05l-2.53,-1.65l-0.76,-1.77ZM197.24,430.5l0.99,0.3l0.57,-1.16l5.09,5.04l2.42,0.31l4.06,3.46l0.94,-1.63l1.45,0.19l1.62,2.32l-2.02,2.29l-1.95,-1.44l-1.31,0.05l0.49,-0.8l-1.66,-1.31l-2.43,0.0l-1.39,-1.86l-3.41,-1.55l0.11,2.32l-3.56,-6.52ZM203.82,441.37l-0.96,-0.29l-1.83,-3.68l3.32,4.01l-0.52,-0.05ZM205.93,388.74l1.33,0.13l1.65,2.66l-2.61,-2.03l-0.37,-0.77ZM207.84,409.16l-1.23,-1.05l-0.08,-0.63l1.81,2.05l-0.49,-0.37ZM206.64,445.11l0.0,0.0l0.0,0.01l0.0,0.0ZM190.82,410.49l-0.64,-0.39l3.08,-0.46l1.91,-1.33l-1.55,-2.77l0.5,-1.48l-0.65,-1.86l2.28,-1.55l1.29,0.31l2.68,3.49l-1.56,0.66l0.67,1.23l-1.72,1.04l4.24,5.61l-0.56,1.95l-2.37,-0.53l-0.58,0.62l-4.81,-3.92l-2.21,-0.63ZM197.71,437.79l0.01,-0.01l0.05,0.0l0.0,0.03l-0.06,-0.01ZM194.44,437.59l-0.35,-0.33l0.65,-0.57l0.5,0.74l-0.81,0.16ZM188.61,398.54l0.0,0.02l-0.02,-0.02l0.02,0.0ZM177.63,404.67l0.38,-1.54l1.42,-0.87l3.0,0.74l1.37,1.63l-0.92,1.88l0.42,3.0l2.86,1.49l1.14,2.65l-1.0,0.26l-2.22,-1.97l-1.26,-0.06l-1.87,-5.63l-3.01,-0.61l-0.32,-0.98ZM181.92,425.61l-0.53,-0.61l0.86,-0.33l0.91,0.67l1.51,-0.4l2.08,2.02l-1.49,-0.45l0.01,1.45l-3.36,-2.34ZM165.97,413.68l1.42,-0.57l1.9,2.74l4.31,1.65l3.53,3.86l-2.51,-0.37l-3.4,-2.46l0.49,-0.43l-0.7,-0.85l-3.65,-1.4l-1.39,-2.17ZM164.26,411.04l0.05,0.04l-0.06,0.04l-0.03,-0.03l0.05,-0.04Z",name:"Zadarska"},"hr-kz":{path:"M358.03,52.3l0.16,7.73l7.06,1.81l2.25,1.76l0.87,2.49l6.08,0.27l1.57,2.42l6.0,0.01l8.21,-1.89l2.08,0.68l0.83,2.61l5.8,-0.28l3.54,-3.83l3.86,-1.84l1.11,0.53l-1.11,1.88l0.53,1.09l6.27,0.59l-0.96,2.54l2.41,3.67l-0.54,1.42l0.71,0.78l-1.77,3.43l1.3,2.89l-1.36,2.32l0.68,1.85l1.42,0.57l-0.25,2.26l-6.2,5.23l-0.09,1.44l1.29,2.03l-6.09,0.77l0.33,1.83l2.5,2.38l-2.62,-0.61l-2.23,1.09l-1.54,4.82l-5.03,0.17l-1.73,2.12l-3.21,-0.12l-6.46,2.58l-12.88,7.39l-0.44,-4.99l-4.82,-4.75l-4.75,-2.43l-6.37,-1.56l-3.61,3.53l-0.9,2.56l-3.9,-3.45l-2.34,0.28l-0.22,-1.21l-1.93,-1.49l-6.34,0.89l-1.39,-5.42l2.62,-7.92l-4.29,-4.1l-10.44,-4.86l-2.55,-4.09l-0.33,-7.15l1.57,-2.68l4.44,-4.33l0.85,-2.34l-0.35,-1.71l7.44,-0.13l3.39,2.04l5.37,-0.11l4.24,-2.34l1.4,-2.09l0.45,-6.34l6.34,-0.25l4.06,-2.45Z",name:"Krapinsko-Zagorska"},"hr-sp":{path:"M577.88,224.57l3.48,-0.48l0.11,-2.81l3.61,0.3l4.65,-1.57l3.74,2.19l4.81,4.98l3.82,1.22l0.41,2.75l2.5,3.87l6.39,1.88l2.49,2.63l4.64,2.3l15.02,-0.21l1.92,3.12l0.0,4.27l1.28,2.09l-1.86,2.91l3.39,2.49l5.14,0.76l2.0,-0.6l0.66,-2.47l1.77,-1.05l0.79,-1.73l3.33,0.63l3.87,-1.64l1.12,-2.52l6.26,-4.88l1.52,-5.17l3.71,-0.96l15.59,1.1l12.8,4.51l5.21,0.3l1.15,1.53l5.27,0.66l2.12,2.97l5.02,2.24l2.18,-1.44l4.54,-0.78l5.44,-3.29l8.01,-0.18l3.91,1.31l1.46,2.06l4.46,0.87l1.58,1.76l3.18,0.83l1.83,-0.78l2.06,1.76l1.62,-0.92l3.44,0.83l2.4,-1.02l1.56,-3.81l2.94,1.27l1.49,-0.31l-0.36,5.39l-3.32,1.1l-1.78,1.74l-6.27,10.47l2.0,4.36l3.4,2.12l2.72,3.04l-2.41,4.48l-2.02,-2.51l-5.98,-0.45l-5.86,-5.17l-0.75,-2.12l-2.84,-1.82l-14.52,0.97l-1.06,-1.69l-4.6,-0.38l-2.78,-4.38l-4.98,0.46l-2.4,2.03l0.68,5.32l-1.11,2.04l-2.29,1.56l-2.84,0.61l-3.77,-1.65l-6.93,-0.08l-2.57,-3.33l-2.23,-1.11l0.48,-2.44l-2.18,-3.38l-2.16,-0.11l-2.19,2.32l-3.26,-3.53l-2.28,-0.75l-3.26,1.8l-3.63,5.32l-2.86,1.06l-1.62,6.19l-9.12,5.89l-2.52,0.19l-2.87,-0.77l-8.06,-5.8l-3.11,0.07l-11.7,-8.53l-4.06,0.49l-4.91,3.8l-3.97,-0.64l-3.36,0.66l-1.14,-0.65l-0.28,-2.22l-0.67,-0.21l-3.1,3.54l-1.68,0.61l-6.12,-1.65l1.22,-3.68l-3.01,1.29l-2.78,-0.54l-1.14,-4.92l-3.16,3.82l-7.65,-0.41l-4.44,-1.61l-1.35,-1.83l-3.25,-1.71l-0.63,-2.01l-2.34,-0.19l-2.16,-1.39l-3.91,6.86l-13.32,-1.52l-5.18,-5.55l-0.04,-1.42l-4.69,-3.36l-1.93,-0.45l2.15,-4.79l6.37,-3.39l3.7,-5.45l3.47,-1.06l0.0,-1.34l-1.63,-2.05l0.74,-1.6l1.85,-0.39l0.5,-1.06l-2.69,-3.2l7.26,-6.95l4.34,-0.46l3.37,2.65l4.98,1.7Z",name:"Brodsko-Posavska"},"hr-pg":{path:"M99.09,202.76l11.96,-0.25l35.81,-8.86l4.13,-3.72l1.22,-11.57l5.83,-2.48l1.43,-1.66l2.15,-7.4l3.0,0.96l2.0,-0.49l4.02,1.75l-2.47,3.81l-0.81,2.94l4.87,2.6l0.17,2.51l5.17,1.82l1.24,1.54l1.39,3.3l-1.16,4.53l2.35,1.78l3.49,-0.64l3.03,2.46l9.46,0.66l1.43,2.59l0.03,3.54l1.67,1.39l7.02,-0.94l4.42,-1.7l1.86,-3.85l-0.13,-4.85l1.94,-0.94l2.47,0.47l7.46,5.72l2.51,-0.04l3.82,1.51l2.71,-1.05l2.35,0.43l3.07,1.87l1.41,3.5l6.31,3.1l2.54,3.21l2.24,1.38l8.37,-1.21l0.85,-2.29l1.75,-1.21l0.54,2.81l-0.55,3.96l-2.39,6.11l-5.12,6.06l-0.39,6.0l-2.29,1.21l-5.98,0.8l-1.93,3.05l-1.88,1.1l-1.22,-0.56l-1.03,-2.35l-5.79,0.05l-2.01,-0.72l-2.34,-3.64l-4.66,1.34l-1.79,3.86l0.79,2.19l-3.36,2.37l3.66,4.72l-0.06,2.63l-1.3,1.35l1.98,5.27l-1.58,6.18l0.09,3.47l5.06,5.93l1.54,6.43l-3.18,3.15l-5.0,-0.92l-3.18,1.16l-1.73,-2.32l-2.04,0.08l-5.87,3.14l-0.89,2.12l-4.35,-8.37l0.32,-3.86l-2.0,1.05l-0.06,-1.56l-2.78,0.27l-4.18,-2.35l-6.95,-1.87l-3.32,-2.8l-0.03,-1.01l-4.61,-2.86l-4.75,-4.91l-6.82,-3.46l0.74,-1.01l-0.61,-1.48l-4.67,-3.24l-1.04,0.14l0.21,-1.42l-1.8,-1.54l0.2,-2.77l1.88,0.55l0.74,-0.58l-2.22,-2.63l-4.99,-2.81l0.01,1.56l3.19,3.15l-2.41,0.86l-6.42,-3.07l-1.53,-2.5l-4.4,-2.51l-15.27,-4.12l-3.78,-1.62l-0.49,-0.99l-7.89,10.0l-2.52,10.0l-2.98,7.72l0.13,3.76l-1.65,3.11l0.33,1.06l-0.86,1.5l-3.32,-2.13l1.34,-9.92l-2.23,-6.38l0.8,-3.51l-1.16,-5.51l1.65,-3.28l2.68,-1.68l-1.08,-2.83l-0.12,-4.03l-2.29,-1.64l-0.29,-1.32l3.25,-3.36l-9.45,-5.35l-2.94,-4.84l0.34,-3.84ZM177.68,332.67l-0.93,-1.29l1.17,-1.34l2.66,0.53l3.68,2.37l0.53,-0.97l-1.43,-3.44l3.43,1.92l0.98,-0.7l-2.68,-3.85l-2.44,-1.04l-2.35,-3.15l3.46,0.49l3.0,1.87l0.61,-0.76l-0.8,-0.87l0.09,-1.84l1.74,1.14l1.53,-0.69l1.07,1.68l0.79,-0.16l-0.31,2.05l-2.21,0.58l-0.57,1.15l13.58,11.67l5.8,7.33l0.24,1.79l-2.14,1.08l-1.88,-0.27l-7.92,-8.55l-3.72,-1.4l-3.85,-2.85l-0.74,0.87l1.19,1.22l-1.84,-0.27l-0.66,0.73l-1.98,-1.35l-1.3,1.91l0.01,0.99l0.39,0.39l-0.03,0.0l-1.28,-1.21l0.97,-1.05l-3.01,-1.44l-0.59,-1.35l-0.65,0.42l-1.6,-2.33ZM183.88,339.64l0.03,0.0l0.0,0.03l-0.03,-0.03ZM189.48,337.38l-0.08,0.0l-0.13,-0.13l0.03,-0.04l0.19,0.16ZM192.02,322.33l0.04,0.04l-0.1,0.03l0.06,-0.07ZM200.03,345.49l1.88,1.66l2.65,3.69l-1.85,-0.88l-3.73,-5.3l1.05,0.83ZM199.01,320.95l4.49,0.23l0.45,1.52l-1.23,-0.36l-0.95,1.8l-0.46,-1.41l-1.35,-0.09l-0.94,-1.7ZM193.99,307.89l-0.21,-2.86l6.2,2.77l2.54,2.42l0.93,3.15l-7.54,-3.38l-1.93,-2.1ZM203.45,313.38l0.03,0.04l-0.01,0.0l-0.03,-0.04ZM142.89,277.87l0.39,-2.47l5.34,-1.4l-0.67,-3.65l1.56,-1.63l4.22,2.35l3.06,-1.14l0.57,-5.26l2.91,-3.73l-1.64,-2.56l-0.2,-3.2l1.67,-0.66l-2.73,-4.16l3.18,3.79l0.57,-3.73l-1.77,-1.94l1.2,0.26l0.9,-1.67l0.86,0.03l2.44,2.16l0.27,-1.68l2.75,2.15l-1.62,-0.8l-1.13,0.39l7.14,11.13l-2.87,-0.39l-2.04,4.02l2.08,0.69l4.39,-2.13l4.61,2.81l0.65,-0.79l-0.47,1.28l1.02,1.27l-1.65,2.23l-1.27,0.14l1.09,2.1l-0.34,3.73l1.39,2.34l4.65,2.84l1.26,0.05l0.95,-1.32l1.87,1.69l0.78,-1.22l-0.21,1.81l1.56,0.98l-0.72,2.24l0.55,1.29l4.41,4.62l3.87,1.82l-0.46,0.9l0.9,1.13l0.56,-1.03l0.97,0.82l1.3,2.93l-2.54,-2.33l-0.53,0.71l1.82,2.23l-0.39,1.07l-8.18,-1.09l-1.24,2.21l2.44,3.23l-3.98,0.94l-6.74,-2.6l0.17,-1.04l-2.04,-2.02l-3.7,0.26l-3.49,-2.14l-2.42,-0.32l-0.4,-1.25l2.81,-0.73l-0.76,-3.65l1.01,-5.03l-0.85,-1.18l-1.26,0.32l-1.88,2.31l2.2,2.25l-6.22,-2.44l-2.52,2.65l-5.61,-0.67l-2.28,-1.46l-1.46,0.52l-0.5,-1.19l-0.68,0.6l-2.24,-2.86l-2.1,-0.85l-3.64,-3.7l-0.89,-2.18ZM178.86,277.12l-0.01,0.0l0.0,0.0l0.0,0.0ZM172.52,261.41l-0.01,0.0l0.0,0.0l0.01,0.01ZM189.24,316.49l1.51,-0.7l-0.21,-1.35l4.83,4.42l-4.72,-0.35l-1.41,-2.01ZM181.28,350.29l-0.28,-0.26l0.04,-0.23l0.38,0.44l-0.13,0.06ZM177.66,304.34l1.02,0.45l0.0,0.4l-0.57,0.01l-0.45,-0.85ZM168.52,394.8l0.01,1.19l-0.08,0.0l-0.45,-1.19l0.53,0.01ZM165.59,376.88l-0.28,-0.39l-0.13,-0.52l0.48,0.83l-0.07,0.07ZM164.87,354.46l-0.23,-0.29l0.0,-0.05l0.29,0.27l-0.07,0.08ZM158.08,394.28l1.24,-1.62l3.98,1.8l0.71,1.22l-2.25,-0.51l-1.41,1.19l-1.53,-0.57l-0.73,-1.49ZM161.75,303.04l0.52,-0.01l1.31,1.18l-1.43,0.07l-0.41,-1.24ZM160.94,385.25l1.09,0.23l-0.05,1.14l-0.54,0.0l-0.51,-1.37ZM162.79,387.4l0.0,-0.14l0.04,0.1l-0.04,0.03ZM161.78,245.21l0.49,-0.48l0.54,0.26l-0.28,0.74l-0.75,-0.52ZM159.9,391.59l0.24,-0.23l0.29,0.5l-0.22,0.0l-0.31,-0.26ZM161.45,392.76l0.42,-0.45l0.62,0.73l-0.86,-0.15l-0.18,-0.12ZM153.18,297.32l-1.87,-1.28l2.34,0.62l2.6,-1.47l4.59,5.15l-2.26,0.36l-5.4,-3.38ZM159.55,390.07l0.0,0.07l-0.03,-0.11l0.03,0.03ZM119.94,271.21l-1.05,-1.35l3.62,-4.08l0.52,-3.46l1.46,-1.61l1.98,-0.78l0.27,1.46l2.77,-0.36l2.3,1.11l1.3,3.09l-2.27,2.84l0.5,7.81l1.43,1.84l4.16,11.68l4.64,6.48l1.69,1.15l4.56,-1.11l2.27,3.71l0.08,0.73l-1.09,-0.1l-0.88,1.4l-1.39,0.01l0.5,1.81l-1.39,3.65l0.78,2.1l-2.34,6.67l3.57,12.57l-0.04,2.75l-2.33,-0.73l-0.78,1.85l4.32,6.08l0.44,2.69l-1.4,0.35l-0.92,2.69l2.06,5.45l5.33,6.05l-1.5,4.05l1.43,-0.48l1.45,2.27l0.97,-0.91l2.45,0.7l-2.08,0.19l-0.19,1.8l-1.5,-0.92l-0.24,2.69l-3.11,-2.49l-0.44,0.61l1.81,2.08l-1.22,0.98l-2.64,-1.7l-2.1,-3.02l-1.14,0.54l0.26,-1.38l-1.91,-0.98l-2.74,-4.85l-1.52,-1.31l-0.99,0.49l0.63,-1.12l-1.18,-0.35l-0.3,-1.62l-1.81,-1.42l1.01,-3.19l-1.35,-2.66l1.09,-3.35l-2.17,-1.59l-0.58,1.05l-1.21,-1.62l0.0,-4.21l-1.09,-1.77l0.68,-2.94l-2.12,-3.0l-1.12,-0.26l-0.67,1.45l-0.65,-0.21l0.05,-1.82l-1.27,-0.62l0.41,-4.98l-2.14,-3.83l0.38,-2.04l-1.76,-4.27l-1.52,-0.11l0.63,-0.75l-0.34,-3.96l0.0,-0.19l0.1,-0.11l0.16,-0.5l-0.03,-0.03l1.77,-1.8l4.28,6.65l1.12,0.0l1.5,1.92l1.08,-0.86l3.17,1.12l1.37,-0.88l0.59,-2.32l-1.4,-3.95l-1.14,-0.99l1.09,-1.73l2.88,1.97l0.69,-0.76l-1.32,-2.53l-2.31,-0.16l0.26,-1.14l-1.75,-2.18l-0.31,-2.02l-2.64,-0.95l-1.68,-1.66l0.09,-1.92l1.35,-1.64l-1.17,-4.98l-2.25,-2.27l-4.82,-1.56l-1.58,-4.8l-2.88,-1.9l0.43,-1.47ZM136.21,350.19l1.21,1.63l-0.54,1.73l0.75,3.38l-0.62,1.54l0.5,1.6l-1.18,1.5l0.42,1.92l1.3,0.71l1.91,5.39l2.59,2.8l-1.48,0.68l0.49,0.99l-1.95,-2.38l-0.96,-0.1l0.02,2.85l-1.45,-0.26l-0.43,1.19l-3.46,-1.59l1.26,-2.12l-0.54,-2.38l0.66,-0.58l0.74,0.69l1.58,-2.78l-1.44,-1.81l-0.29,-2.54l-3.24,-2.59l-2.44,-4.54l-0.81,-8.5l1.11,0.11l1.4,2.15l1.85,0.83l1.41,-1.04l1.6,1.53ZM143.19,373.74l1.22,0.7l0.12,1.01l-0.17,0.0l-1.17,-1.71ZM144.94,375.56l-0.04,-0.04l0.08,0.04l-0.04,0.0ZM145.68,376.16l-0.2,-0.19l-0.34,-0.34l0.74,0.52l0.0,0.1l-0.2,-0.09ZM145.9,376.28l0.03,0.03l0.0,0.02l-0.03,-0.05ZM147.92,378.32l1.52,1.66l0.91,-0.06l-0.13,1.31l4.38,0.77l1.67,1.71l-0.17,1.31l2.86,2.72l-0.76,1.63l-2.26,0.88l-1.79,-2.69l-0.61,0.4l-0.05,-0.96l-1.25,-0.22l0.4,-1.2l-1.1,0.26l0.02,-1.48l-6.0,-3.32l1.21,-0.8l-0.98,-0.9l-0.86,0.64l-0.19,-2.22l3.23,2.28l-0.05,-1.71ZM146.18,376.79l0.0,0.0l0.01,0.01l-0.01,0.0ZM146.18,376.77l0.0,0.01l-0.04,-0.05l0.04,0.04ZM146.01,376.51l0.0,0.0l0.0,0.0l0.0,0.0ZM146.14,376.72l0.0,0.01l-0.03,-0.03l0.0,0.0l0.03,0.03ZM146.1,376.68l0.0,0.0l0.0,0.0l0.0,0.0ZM145.97,376.41l-0.01,-0.02l0.01,0.01l0.0,0.01ZM142.76,377.06l-0.26,-0.26l-0.11,-1.38l0.96,1.07l-0.6,0.57ZM142.19,376.97l0.0,-0.04l0.04,-0.07l0.04,0.04l-0.08,0.06ZM143.08,373.46l0.0,0.0l0.0,0.0l0.0,0.0ZM123.51,304.04l0.02,-0.02l0.03,0.03l-0.04,-0.01ZM159.57,403.91l-0.45,-0.39l0.0,-0.79l0.57,-0.01l-0.12,1.19ZM157.54,337.13l0.2,-0.2l0.08,-0.44l0.01,0.84l-0.28,-0.21ZM122.44,369.11l0.84,0.78l1.41,0.97l-1.55,-0.89l-0.71,-0.86ZM125.25,371.34l0.03,0.26l-0.56,-0.7l0.37,0.34l0.16,0.1ZM126.8,373.51l0.21,-0.2l1.09,0.8l-0.37,0.16l-0.94,-0.76ZM126.03,372.41l-0.04,-0.09l-0.04,-0.05l0.04,0.0l0.03,0.14ZM120.74,382.27l0.07,-0.07l0.32,-0.06l2.05,0.67l0.9,1.71l0.78,-0.12l-1.18,1.49l-1.98,-1.55l-0.97,-2.08ZM126.0,384.24l0.01,-0.01l0.0,0.01l-0.01,0.0ZM123.3,336.9l1.05,-2.54l-0.4,-0.83l1.5,-1.8l-1.1,4.79l-0.6,0.86l-0.45,-0.48ZM125.45,331.72l-0.01,0.02l0.0,-0.03l0.01,0.01ZM112.95,362.45l-0.24,-0.79l2.35,-0.92l-1.18,-1.8l-0.21,-2.56l1.81,-1.26l1.88,-3.14l2.11,-1.14l-0.63,1.25l1.18,0.4l-0.38,1.63l0.93,0.57l-1.73,1.62l-1.95,-1.76l0.22,2.02l-0.94,-0.78l-0.69,0.5l1.78,3.04l-1.76,-1.52l-0.44,0.71l4.67,7.47l-4.02,-2.74l-2.49,0.09l-0.26,-0.88Z",name:"Primorsko-Goranska"},"hr-ps":{path:"M613.39,188.81l4.87,1.88l2.01,1.9l0.65,2.1l2.99,1.21l6.05,1.02l2.78,-0.51l5.45,2.98l2.6,-1.42l6.58,1.09l5.03,3.78l2.77,-0.04l2.77,-2.28l2.37,-0.07l3.09,2.13l-0.23,1.96l2.06,1.51l6.17,0.76l7.75,6.37l4.21,-0.46l2.11,3.63l3.33,0.49l2.78,-1.03l3.66,0.12l2.95,3.56l-0.08,1.54l-5.26,2.79l-1.11,1.99l3.1,1.85l3.1,5.85l-6.12,5.92l-13.19,-3.09l-9.67,-0.32l-4.01,0.64l-2.37,3.93l-0.01,1.93l-6.18,4.78l-1.02,2.42l-3.48,1.51l-3.65,-0.53l-4.18,5.68l-5.27,-0.57l-3.03,-2.09l1.77,-2.76l-1.28,-2.12l-0.04,-4.39l-2.32,-3.58l-5.22,-0.47l-9.69,0.76l-4.65,-2.3l-2.57,-2.68l-6.21,-1.75l-2.33,-3.61l-0.56,-2.99l-3.99,-1.35l-4.72,-4.92l-3.99,-2.33l-5.01,1.55l-3.77,-0.26l-0.73,1.06l0.34,1.78l-2.53,0.43l-5.0,-1.64l-3.1,-2.57l-4.22,-0.15l-3.53,2.24l-4.5,5.05l-2.48,-0.32l-3.92,1.42l-1.58,-4.47l-11.3,-4.93l0.89,-3.86l1.53,-1.47l-0.21,-2.49l-2.65,-0.31l-0.98,1.07l0.26,1.77l-2.45,0.08l-2.08,-1.54l0.22,-2.49l-2.14,-2.36l-7.13,-0.13l-2.71,-4.04l-1.45,-5.7l3.13,-5.86l2.88,3.78l6.59,3.12l6.04,-2.68l4.67,3.64l3.33,-3.21l2.99,-0.41l4.62,1.41l1.58,-1.7l0.87,-3.23l3.05,1.1l0.83,1.45l4.45,3.1l17.13,-2.36l6.1,2.88l3.8,-0.05l3.77,-4.22l0.03,-2.13l1.85,-3.75l-1.07,-2.5l1.47,-0.04l0.98,1.26l2.26,0.44l0.94,1.4l1.97,0.78l1.16,-0.75l0.84,-3.2l1.92,-0.31l5.49,3.91Z",name:"Požesko-Slavonska"},"hr-bb":{path:"M513.43,95.48l3.12,1.36l-1.04,2.5l0.23,3.55l-2.16,2.75l0.28,0.65l5.5,0.26l3.67,-0.9l5.76,3.75l0.4,1.14l-1.54,6.42l0.53,0.45l2.89,-0.99l3.36,0.95l3.28,-1.87l1.39,1.67l-0.15,2.26l0.9,1.86l4.3,1.55l1.83,3.45l8.61,2.29l1.1,1.69l2.14,0.78l1.82,3.83l4.25,1.86l2.16,2.37l4.94,1.08l0.17,4.6l2.26,2.94l4.46,0.77l-0.83,2.18l0.54,1.16l2.41,0.23l1.78,-2.72l1.58,1.15l0.34,2.83l-1.84,3.61l1.65,1.17l2.4,-0.62l0.95,3.84l2.51,-0.6l1.15,-2.16l4.38,-2.34l2.07,1.71l-0.73,2.1l4.17,1.17l1.65,1.45l-0.03,2.94l-2.04,1.41l-0.28,3.79l-3.34,4.11l0.6,4.17l-3.69,0.71l-0.81,1.25l-0.4,1.93l0.87,1.97l2.52,0.82l1.16,2.01l-1.81,3.56l-0.01,2.05l-2.5,3.48l-4.13,0.31l-3.55,-1.28l-1.0,-1.45l-3.7,-0.21l-9.55,2.13l-5.49,0.28l-4.99,-4.44l-3.75,-1.39l-2.37,5.13l-4.29,-1.42l-3.24,0.42l-1.99,1.02l-1.14,2.05l-4.87,-3.53l-5.82,2.71l-6.19,-2.97l-3.4,-3.96l-1.42,1.0l-2.43,4.92l1.38,6.54l-2.89,1.8l-3.25,-6.09l-2.59,-1.83l-2.29,-0.44l1.47,-2.19l-1.93,-2.26l-0.32,-2.28l-3.37,-1.15l-0.74,-2.3l-2.39,-0.38l-1.11,-1.37l-1.95,-9.56l-5.98,1.54l-3.52,-1.16l-2.15,-3.82l-2.72,-2.45l-3.24,0.95l-1.59,-0.4l-1.44,-2.77l-5.83,0.56l-1.83,-0.95l-1.36,-2.28l-2.04,-0.44l-0.44,-2.39l-2.53,-2.8l-5.54,0.79l-1.4,-3.01l-3.08,-0.67l0.19,-3.88l2.43,-1.65l-3.56,-3.12l1.79,-0.8l0.2,-2.97l2.1,0.36l4.35,-2.01l4.67,3.18l2.78,-0.29l0.74,-0.95l-0.76,-1.34l0.21,-3.51l1.81,-0.67l2.45,-3.45l0.92,0.07l0.81,2.75l2.34,-0.8l1.79,0.68l1.59,-1.9l3.35,-0.81l1.34,-2.09l-0.01,-1.46l-2.39,-4.28l1.04,-13.26l-0.54,-2.62l2.13,-6.63l1.83,-2.06l-0.57,-4.57l9.17,-3.93l1.52,0.48l0.02,1.91l2.29,-0.31l4.97,-3.15l-0.2,-4.6l0.83,-0.08l5.1,1.47l-0.24,2.63l1.65,1.09l0.97,2.68Z",name:"Bjelovarska-Bilogorska"},"hr-ka":{path:"M222.87,240.55l3.3,-2.02l-0.73,-2.38l1.56,-3.39l3.17,-1.19l1.25,0.49l1.65,3.11l2.32,0.81l5.64,-0.08l0.59,2.04l1.85,0.9l1.97,-0.81l2.28,-3.45l5.76,-0.72l2.56,-1.32l0.83,-1.38l-0.14,-4.99l4.58,-5.04l2.84,-6.88l0.68,-4.48l-0.58,-3.08l4.18,-0.94l7.53,0.89l6.86,-2.82l3.33,-3.42l-0.11,-2.23l-5.94,-2.08l-5.9,-6.76l-0.72,-3.65l0.62,-2.63l-2.75,-4.23l0.36,-1.24l2.07,-0.83l0.87,-3.14l4.53,-2.2l-0.3,-1.19l0.98,-0.63l6.63,0.61l1.62,-3.09l-2.55,-3.09l-2.14,-0.97l-3.38,-5.88l-2.29,0.14l-5.25,5.35l-2.23,-3.39l-3.64,-0.26l-1.31,-0.92l-0.41,-1.57l0.75,-2.24l12.72,-5.15l-1.28,3.06l0.46,1.67l7.67,4.96l5.08,1.94l1.44,2.47l1.4,0.14l1.2,-0.95l2.59,0.92l3.77,5.52l5.25,2.38l-0.23,4.77l0.92,1.31l2.07,0.02l3.44,1.54l1.83,2.0l2.48,-2.88l4.36,-2.78l3.09,1.23l3.06,2.51l5.25,-0.29l4.38,2.87l0.75,3.77l3.74,2.48l2.35,2.72l1.79,0.54l0.44,3.04l4.51,-1.1l1.58,-2.84l4.0,-1.43l1.83,0.52l-0.25,2.16l0.69,0.95l4.62,-0.34l2.28,2.89l0.62,2.94l-0.64,3.45l-2.31,-2.75l-3.91,-2.29l-6.77,3.15l-0.05,5.22l2.69,0.99l-1.53,6.05l-2.52,3.41l0.37,2.53l-3.09,2.09l-3.55,-0.28l-2.22,2.91l0.42,2.15l2.79,2.91l0.88,4.26l1.54,1.04l-1.84,2.7l0.16,2.43l-1.54,2.25l-0.06,1.77l1.92,4.12l3.61,1.36l2.74,4.7l-3.12,1.32l-4.76,4.65l-1.77,2.99l1.31,8.88l-0.82,3.31l-4.06,5.74l1.75,1.93l1.95,7.07l2.23,3.09l-1.92,4.47l-3.68,1.43l-1.32,2.19l-0.07,2.83l-3.71,3.15l-2.18,-0.74l-5.26,-4.15l-2.91,0.89l-3.05,3.17l-2.57,-1.65l-2.25,1.97l-2.73,0.69l-1.78,-0.28l-2.03,-1.82l-1.59,0.89l-1.43,2.93l-1.51,-1.16l-6.43,0.51l-4.94,-2.19l-3.15,-6.59l-6.2,-7.57l-0.38,-2.01l-3.59,0.16l-0.91,0.74l-1.67,-0.99l-4.76,-5.24l-4.09,-3.08l-3.86,-1.66l-2.82,-3.09l-4.79,-3.2l-4.86,1.29l-2.98,2.73l-4.4,-0.16l-9.62,-4.61l-4.82,0.55l-0.68,-1.96l-4.8,-5.44l-0.07,-3.14l1.59,-6.32l-1.97,-5.22l1.25,-1.09l0.1,-3.0l-3.66,-4.65ZM307.37,308.02l3.65,1.46l2.87,3.62l-2.24,-0.16l-4.28,-4.92Z",name:"Karlovačka"},"hr-dn":{path:"M532.26,654.53l0.22,-0.02l0.27,0.26l2.17,0.05l0.8,0.29l0.95,1.34l6.24,3.21l14.12,-0.91l14.07,2.95l1.79,-0.31l1.7,1.38l2.56,0.1l13.33,6.42l7.51,2.55l1.3,2.0l-0.17,2.41l3.15,1.6l0.15,1.07l1.39,0.25l0.0,-1.23l1.72,1.89l3.45,-0.26l2.89,1.44l0.53,-0.72l-1.45,-3.1l2.94,2.08l8.12,3.36l1.5,-0.19l6.19,4.57l2.61,0.61l0.15,-1.07l1.38,0.46l0.71,1.73l8.15,5.14l1.74,-0.71l-6.12,-3.95l-0.16,-2.07l2.16,-1.52l-1.66,-1.67l-1.58,1.06l-0.61,1.84l-6.2,-3.4l0.34,-0.68l6.47,-4.74l9.22,0.9l6.76,3.92l4.09,-4.81l5.24,4.56l-0.01,6.35l5.35,3.33l1.26,3.1l8.0,2.85l8.47,5.75l0.71,2.25l5.82,1.32l2.3,3.46l6.01,2.98l-0.26,2.82l7.73,3.35l0.67,2.29l12.34,8.12l2.52,2.06l1.02,2.12l8.18,-2.58l9.68,1.3l2.49,3.41l7.14,5.84l0.16,5.02l3.18,12.14l3.87,3.14l0.21,1.95l3.35,3.18l-1.97,0.4l-1.27,2.19l-6.33,-6.52l-2.01,-1.13l-1.53,0.81l-0.86,-1.27l-1.64,0.76l-1.54,-1.07l2.11,0.26l-1.2,-2.02l-13.78,-8.35l-7.43,-3.31l-1.24,-1.75l-5.63,-3.78l-1.09,-2.42l-1.47,-0.88l1.45,-1.1l-0.27,-2.3l0.97,-0.39l-1.33,-2.6l-3.12,-2.04l-3.43,1.42l-4.68,-2.73l-2.42,-0.41l-1.26,-1.36l-2.38,0.18l-2.24,-1.36l-2.49,0.3l-1.36,-0.91l0.54,-0.85l-1.89,-0.97l2.47,-0.03l1.7,1.68l0.43,-0.59l-1.24,-1.85l4.1,-0.87l1.92,0.47l0.53,-0.64l-3.73,-0.88l-4.36,0.87l-2.8,-2.36l-1.27,-3.49l-1.08,1.22l0.53,1.78l-10.96,-4.98l-2.27,-2.95l-7.14,-3.05l-4.17,-3.04l-0.41,-1.6l1.17,0.05l1.15,-1.87l-0.62,-1.26l-3.44,1.98l-0.64,-1.32l-1.87,-0.7l0.71,-1.09l-1.05,-0.44l-0.4,-1.54l-3.7,0.86l-3.4,-1.43l-2.21,3.67l-4.47,-4.22l-6.07,-2.65l-2.68,-2.08l-0.82,0.85l0.29,1.31l3.71,1.13l4.67,3.41l0.54,1.42l-1.11,-0.9l-2.36,0.86l-1.58,-1.5l-1.13,0.68l-0.59,-1.07l-3.05,-0.46l-1.29,-2.14l-1.27,0.87l-3.65,-0.67l-7.94,-3.28l-12.28,-2.87l-10.39,-3.84l-0.16,-1.87l1.41,-0.05l0.9,-1.88l-4.55,-2.36l-0.94,-1.3l-2.78,-1.17l-0.69,0.78l-5.1,-0.07l-4.18,-3.36l-12.51,-4.79l-5.26,-4.32l-2.73,-0.05l-3.67,1.56l-10.66,-1.11l-1.44,-1.07l-4.15,0.15l-4.55,-3.36l-2.76,-0.31l0.97,-2.77l1.6,-0.75l-1.18,-1.4l-1.8,0.64l0.0,-2.3l-0.4,-0.4l-0.65,0.0l-0.72,-0.36ZM646.2,705.41l0.27,0.91l-1.6,-1.58l1.18,-0.82l-0.72,-2.46l2.33,2.57l-1.46,1.38ZM760.45,772.47l-0.42,-0.51l0.89,0.63l0.2,0.2l0.16,0.1l0.3,0.26l-1.14,-0.69ZM748.01,764.77l0.02,0.01l-0.02,0.02l0.0,-0.03ZM693.0,726.82l-0.09,0.06l-0.63,-0.05l0.38,-0.16l0.34,0.15ZM701.26,732.07l-0.11,-0.11l0.05,-0.14l0.2,0.2l-0.14,0.06ZM701.01,731.14l0.05,0.0l0.14,0.13l-0.03,0.03l-0.16,-0.16ZM700.65,730.85l-0.32,-0.11l0.05,-0.42l0.12,0.04l0.16,0.49ZM681.34,722.42l3.26,-0.57l1.39,2.06l-0.38,0.45l-0.85,-1.23l-3.41,-0.71ZM685.44,724.6l0.0,-0.01l0.15,-0.17l0.01,0.0l-0.15,0.18ZM673.08,720.95l1.74,-2.26l3.19,2.75l-2.4,-0.45l-0.94,1.27l-1.59,-1.31ZM671.79,716.64l0.14,-0.25l0.26,0.04l-0.24,0.24l-0.16,-0.03ZM651.74,708.65l-0.26,-0.26l-0.03,0.0l-0.01,-0.02l0.32,0.11l1.33,0.97l1.37,0.26l0.41,0.63l-1.47,-0.16l-1.65,-1.52ZM657.2,712.0l-1.0,-0.88l1.96,-0.05l-0.64,0.57l0.46,0.73l-0.78,-0.36ZM655.0,710.41l0.49,-0.15l0.6,0.84l-0.52,-0.41l-0.57,-0.27ZM662.56,713.93l-1.02,-0.72l0.78,-0.45l-4.65,-4.74l3.42,0.51l1.48,1.62l4.49,1.99l3.17,3.05l-0.92,0.26l0.2,1.2l-1.05,0.81l-5.9,-3.54ZM657.96,712.44l0.09,0.07l-0.02,0.0l-0.07,-0.07ZM647.64,706.32l1.0,-0.24l0.59,0.79l-0.41,0.04l-1.18,-0.59ZM582.09,703.29l0.08,-0.76l4.33,-2.54l1.58,0.46l1.77,-1.02l0.5,0.41l-0.89,1.18l-1.98,0.2l1.03,1.26l9.21,0.05l1.39,1.32l1.08,-0.33l20.64,5.32l1.12,2.54l6.88,0.04l0.65,1.38l2.93,-1.17l0.39,2.03l2.01,-0.86l8.95,3.95l-1.82,1.81l-2.84,-0.88l-0.44,0.91l-2.46,-1.81l-8.11,-2.59l-11.47,-0.81l-4.86,-2.14l-3.1,0.29l-1.85,-1.51l-5.89,-1.89l-2.48,0.99l-1.06,-1.5l-3.32,-0.05l-2.4,-2.08l-1.6,-0.25l-0.99,1.83l-7.6,-3.05l0.63,-0.73ZM644.21,718.8l0.87,0.21l-0.31,0.8l-1.51,-0.06l0.95,-0.96ZM585.53,647.07l8.2,-4.85l-3.04,-3.68l-1.53,-3.55l-1.24,-0.56l-3.69,0.54l0.28,-0.99l3.72,-0.37l6.29,1.28l4.18,-1.48l2.27,-4.81l2.95,0.82l7.8,6.6l4.16,1.26l9.66,5.89l6.39,5.87l3.72,8.56l4.93,7.37l0.92,3.31l-2.33,1.08l-21.12,4.01l-4.37,-0.69l-0.99,0.72l-3.49,-2.33l-1.0,-2.4l-2.18,-0.56l0.18,-1.33l-2.87,-1.72l0.96,-2.39l-1.2,-0.87l-0.9,0.62l0.46,-1.96l-2.15,-2.23l0.84,-1.9l-2.21,-0.2l-0.66,1.43l-1.13,-0.61l4.16,-2.41l1.62,0.51l-0.21,-1.46l-1.56,-0.25l-5.48,3.47l0.96,-3.64l-1.28,-2.08l-1.12,1.72l-0.09,2.45l-1.07,0.07l-1.38,-2.35l-6.38,-5.88ZM600.49,658.22l-0.32,0.34l-0.07,0.0l0.39,-0.34ZM599.96,658.57l-0.03,0.03l-0.01,0.0l0.04,-0.05l0.01,0.01ZM607.61,677.32l-0.14,-0.16l0.07,-0.07l0.14,0.27l-0.08,-0.03ZM592.18,700.25l0.0,0.0l0.0,0.0l0.0,0.0ZM583.18,700.84l0.05,-0.12l0.2,0.19l-0.25,0.0l0.01,-0.08ZM476.03,666.05l-0.61,-0.07l1.65,-0.92l1.6,0.75l-0.83,1.15l-0.96,-1.22l-0.85,0.3ZM479.73,665.86l-0.11,-0.72l1.58,0.43l1.99,-1.07l0.5,0.56l1.32,-0.54l2.0,1.36l2.66,-0.67l1.5,1.68l6.88,1.38l0.65,1.12l3.39,-0.15l6.96,1.89l7.32,-1.12l2.29,-1.48l1.83,0.61l2.57,-1.11l9.85,-0.67l1.63,0.87l0.47,-0.87l2.64,-0.36l0.85,1.38l8.16,1.89l0.75,-0.46l0.77,1.12l3.01,-0.76l1.49,2.19l0.81,-1.0l0.35,0.32l2.11,3.38l-0.27,1.53l0.91,-0.46l0.39,1.12l2.62,0.42l-1.4,1.07l-6.64,0.81l-0.96,-0.61l-0.99,0.74l-10.78,-2.26l-0.5,-0.76l-10.77,-0.66l-10.42,4.89l-6.02,1.27l-1.81,-0.47l1.5,-1.47l-1.66,-0.71l-2.43,1.05l-8.62,-0.38l-17.33,-4.53l-0.19,2.47l-3.33,-1.55l0.93,-2.16l3.62,-1.07l-1.39,-1.53l5.71,-1.17l1.42,0.46l1.49,-1.28l-0.77,-1.3l-1.02,1.11l-0.8,-1.27l-3.4,0.16l-1.64,-2.14l-1.6,-0.49ZM522.09,679.14l0.0,-0.03l0.03,0.03l-0.03,0.0ZM558.39,678.61l0.0,0.0l0.0,0.0l0.0,0.0ZM559.68,677.68l1.4,-0.08l0.28,0.32l-1.22,0.87l-0.46,-1.11ZM561.36,677.88l0.0,0.0l-0.01,0.0l0.0,0.0ZM480.46,664.82l0.0,-0.01l0.0,0.0l0.0,0.01ZM555.15,671.55l-0.39,-0.63l2.02,0.42l-0.17,0.41l-1.45,-0.2ZM560.44,670.47l0.06,0.04l-0.02,0.02l0.0,-0.01l-0.03,-0.04ZM557.12,674.86l-0.15,-0.15l-0.19,-0.11l0.29,0.1l0.05,0.17ZM556.87,673.13l-0.3,-0.21l0.0,-0.06l0.19,0.04l0.12,0.22ZM528.44,705.21l0.46,-0.18l0.08,0.45l-0.27,0.11l-0.27,-0.38ZM525.96,706.95l0.41,-0.25l0.69,0.15l-0.83,0.27l-0.26,-0.17ZM526.04,704.77l0.09,0.0l-0.1,0.1l-0.01,-0.02l0.02,-0.08ZM501.28,706.36l0.74,-1.39l1.4,-0.41l0.95,0.73l-1.72,0.35l-0.22,1.57l-1.14,-0.85ZM502.52,707.68l-0.02,0.01l0.0,-0.03l0.02,0.03ZM504.95,706.01l1.24,-0.08l1.55,-1.51l0.58,1.17l1.28,-1.55l1.83,1.24l7.44,0.25l0.97,-0.65l2.35,1.06l-2.54,5.0l-5.35,2.44l1.05,-1.24l-0.96,-1.4l-0.68,1.01l-2.42,-0.96l-3.41,1.02l-0.15,1.38l-1.28,-1.59l-1.24,0.1l-1.19,-1.95l1.49,-0.86l-0.58,-2.89ZM503.34,709.58l0.0,-0.03l0.06,0.06l-0.03,0.0l-0.03,-0.03ZM498.99,704.41l0.94,-0.1l0.17,2.06l-1.14,0.06l0.03,-2.02ZM489.38,708.25l0.0,-0.05l0.22,-0.25l0.03,0.04l-0.26,0.26ZM482.02,678.58l0.08,-0.07l0.11,0.16l-0.22,0.0l0.04,-0.1ZM472.71,665.88l0.27,-0.2l0.19,0.13l-0.29,0.25l-0.17,-0.18ZM454.97,707.63l2.09,-2.81l2.75,0.51l0.84,0.97l-1.49,0.47l-2.14,-0.76l-2.05,1.63ZM420.73,773.12l-1.33,-0.77l4.01,0.82l-0.91,0.36l-1.77,-0.41ZM416.82,774.61l-1.35,-0.74l4.38,0.49l-0.62,0.61l-2.41,-0.36Z",name:"Dubrovačko-Neretvanska"},"hr-kk":{path:"M498.62,94.93l-0.15,-1.8l-2.09,-0.56l-9.73,4.1l0.49,4.99l-1.85,2.04l-2.1,6.35l0.05,8.94l-2.84,-1.77l-5.77,1.56l-2.7,-0.06l-1.49,-1.15l-2.45,0.81l-2.28,-2.93l-4.21,-2.15l-1.68,-2.59l-3.58,0.27l-1.96,-1.36l-6.5,4.02l0.41,-4.69l-1.41,-1.64l-3.12,-0.42l-0.05,-2.57l-2.02,-1.86l-1.02,-0.65l-2.53,0.77l-4.49,-3.31l-3.85,-0.29l1.44,-3.36l-0.99,-1.96l0.04,-5.03l1.97,-1.08l0.34,-1.7l2.59,-2.62l0.0,-3.61l6.37,-3.13l3.02,2.67l3.91,-0.45l3.5,-1.93l0.41,-3.64l8.61,-0.82l0.56,-2.41l3.81,-3.3l2.61,-1.09l6.31,1.42l8.01,-1.05l2.79,-2.03l1.14,-2.26l2.31,-0.48l2.58,-3.32l2.34,-0.82l1.79,-1.94l-0.52,-2.27l1.66,-1.49l-0.74,-2.57l0.64,-2.48l4.82,0.49l1.11,2.93l2.29,0.24l5.52,-7.95l-1.04,-1.82l1.32,-1.77l2.67,2.69l-0.76,1.24l0.2,3.07l1.81,5.82l9.25,7.43l3.44,0.41l0.43,3.25l4.46,0.18l12.02,6.45l5.98,1.72l0.93,1.22l4.48,0.26l-0.05,1.68l2.97,1.61l-0.35,0.88l1.17,2.11l-1.31,1.37l0.69,1.12l-0.64,2.21l1.81,1.05l4.03,-1.04l-0.2,2.29l2.07,0.35l-3.76,2.44l-0.27,1.0l5.02,0.25l0.93,2.24l-1.47,-0.54l-0.21,1.46l5.71,1.12l-1.51,1.6l0.2,3.32l5.49,-0.23l-0.73,1.18l-4.15,1.52l0.05,1.21l2.84,1.89l3.89,-0.2l-3.64,2.04l-11.63,-0.28l-3.05,1.73l-0.83,1.9l-4.98,4.53l-1.41,2.68l-3.82,3.03l-0.06,1.21l1.09,0.89l-0.94,4.29l-0.59,-0.01l-1.16,-0.58l-1.71,-3.27l-4.12,-1.39l-0.61,-3.86l-1.81,-2.14l-3.75,1.8l-3.2,-0.96l-2.52,0.8l1.28,-6.89l-6.37,-4.57l-8.79,0.58l1.81,-2.43l-0.2,-3.7l1.15,-2.63l-3.65,-2.06l-0.7,-2.41l-1.56,-0.94l0.38,-2.36l-1.14,-1.18l-6.2,-0.89l0.11,4.85l-6.06,3.14Z",name:"Koprivničko-Križevačka"},"hr-sm":{path:"M352.05,249.18l-2.35,-3.08l-2.79,-0.68l-1.76,-3.84l1.61,-3.55l-0.16,-2.43l1.91,-3.05l-1.69,-1.32l-0.84,-4.18l-2.84,-3.01l-0.33,-1.4l1.86,-2.52l3.35,0.34l3.61,-2.52l-0.32,-2.67l2.49,-3.33l1.59,-6.28l-0.7,-1.2l-1.98,-0.05l-0.39,-4.17l6.32,-3.21l7.95,6.11l8.02,0.47l2.57,-0.95l2.56,-2.42l6.01,2.28l2.72,-2.4l-0.45,-2.85l1.34,-1.33l2.89,0.17l0.66,-1.13l0.12,-4.74l-4.23,-3.09l-0.79,-2.15l3.91,-2.22l-0.09,-3.3l2.94,-3.36l3.3,-0.07l2.94,-3.44l1.76,-0.61l2.56,0.69l1.85,5.05l5.39,0.36l2.2,2.13l4.19,-2.21l0.18,-1.73l3.16,-0.33l2.15,-3.48l4.8,-1.59l-1.11,3.21l0.42,1.03l4.5,-0.98l3.21,0.41l2.56,2.09l1.04,2.27l4.9,1.08l3.96,4.72l1.31,0.34l3.38,-3.17l0.91,-2.28l4.76,-1.5l2.2,-2.72l3.84,0.18l2.78,-1.33l0.2,-3.01l2.07,-1.3l0.61,-2.89l2.73,1.04l4.63,-0.8l1.06,2.54l2.09,0.67l2.94,-1.02l2.5,2.23l2.45,4.05l3.83,1.22l5.63,-1.53l1.61,9.14l1.4,1.67l2.2,0.23l0.88,2.42l3.23,1.02l0.21,2.13l1.83,1.98l-1.45,1.15l0.07,1.31l5.03,2.46l2.81,5.88l1.88,0.42l2.4,-1.84l3.13,4.12l6.8,-0.04l1.78,1.96l-0.16,2.61l2.55,1.9l3.25,-0.21l0.1,-2.48l1.95,-0.28l0.17,1.89l-1.45,1.21l-0.81,4.84l11.44,5.06l0.96,1.59l-0.21,2.02l0.94,0.92l4.95,-1.34l3.71,3.71l-2.06,0.77l-0.99,1.99l1.78,3.1l-3.32,0.93l-3.74,5.48l-6.04,3.01l-2.77,5.41l0.46,1.17l1.88,0.36l4.34,3.12l0.08,1.37l2.76,3.22l-11.24,-5.41l-5.24,-5.14l-3.33,0.77l0.28,-3.28l-2.18,2.04l-0.84,-0.27l-1.29,-3.65l-1.34,-0.89l-0.59,0.44l0.55,4.04l-6.16,-0.74l-0.06,-2.62l1.77,-3.45l-2.05,-2.03l-5.45,6.06l-4.79,2.74l-2.52,0.38l-1.26,5.25l-3.1,1.62l-4.51,-0.67l-9.01,-3.04l-4.17,0.93l-6.67,-0.63l-8.98,-4.25l-12.43,1.22l-3.28,2.5l-3.37,9.48l-9.02,6.04l-2.46,2.75l-1.59,8.46l-1.64,1.8l-2.45,-0.14l-2.12,1.38l-1.05,1.59l0.46,3.53l-1.6,1.93l-11.55,-0.57l-2.11,-0.86l-1.09,-2.19l-3.67,-1.71l-0.83,-2.5l-4.18,-2.49l-0.92,-1.47l-9.85,-3.46l-2.01,-2.16l-2.31,-9.03l-4.05,-3.36l-0.48,-1.64l-1.97,-0.51l-0.55,-2.7l1.3,-2.57l-1.16,-1.36l-6.31,-0.32l-3.78,-3.51l-4.38,2.59l-8.87,0.34l-4.27,1.27l-2.22,-1.08l-1.01,1.03l-1.14,-2.11Z",name:"Sisačko-Moslavačka"},"hr-ls":{path:"M210.98,285.67l-0.74,-0.82l0.49,-3.12l5.84,-3.26l1.75,0.07l1.72,2.21l3.22,-1.16l2.61,0.93l3.48,-0.22l2.9,-3.6l-1.23,-4.51l4.72,-0.57l9.57,4.59l4.64,0.2l3.07,-2.68l2.92,-0.46l1.17,-1.13l4.94,3.25l2.87,3.13l7.92,4.72l4.82,5.28l2.03,1.2l4.06,-1.17l0.2,1.79l6.23,7.61l3.66,7.2l5.12,1.97l6.72,-0.46l3.78,5.32l2.74,2.11l2.01,-0.22l0.52,-1.44l-3.49,-3.79l-3.57,-1.42l1.79,-3.11l4.21,1.92l3.17,-0.78l1.98,-1.88l2.58,1.65l3.39,-3.3l2.69,-0.74l2.66,2.75l4.46,2.19l4.51,-3.65l1.68,2.06l-0.42,2.84l1.39,4.6l5.73,7.1l0.29,1.63l-2.71,2.84l-4.2,2.11l-1.02,2.12l3.49,9.04l4.9,2.53l2.6,2.46l2.03,0.04l3.14,-2.23l4.02,-0.84l1.96,-2.21l2.22,2.82l4.97,-0.49l1.9,6.03l3.31,0.65l1.77,4.53l11.0,7.82l1.81,2.51l-0.63,4.57l-3.29,3.47l-3.26,0.86l-0.78,1.46l0.1,3.2l1.96,1.37l11.34,3.5l5.38,7.29l-0.36,4.82l-4.45,1.92l-3.59,0.3l-2.53,-2.98l-1.72,-0.35l-0.61,1.09l1.24,5.19l-0.52,0.96l-2.46,-2.73l-1.17,-4.45l-5.15,-5.14l-3.75,-1.58l-4.35,-0.06l-2.1,0.4l-5.54,5.28l-3.95,0.65l-3.74,4.98l-9.23,3.51l-1.15,1.53l-0.54,4.17l2.24,3.02l-3.16,3.73l-0.27,1.46l3.23,1.97l3.94,-0.74l1.4,8.24l-3.98,4.96l-3.99,2.04l-14.07,-0.22l-4.35,-2.93l-4.12,0.28l-6.49,-2.07l-1.79,0.68l-5.91,-10.69l-20.66,-5.9l-9.19,-5.68l-2.22,-0.36l-1.2,0.75l-3.38,7.5l-9.23,-10.57l-3.13,-1.49l-1.0,-0.91l0.3,-0.76l-3.68,-2.21l-0.32,-0.97l-1.56,-0.12l-2.21,-1.83l0.45,-0.58l-1.93,-1.18l-4.01,-5.65l-4.02,-2.34l-3.83,-4.26l-4.07,-2.99l-0.81,0.71l-1.64,-1.93l-2.21,-0.63l-3.42,-5.48l-1.06,-4.79l-4.15,-3.8l-0.89,-1.53l0.67,-0.91l-0.42,-1.07l-4.71,-5.09l-1.02,-3.8l1.19,-0.64l-0.8,-1.73l1.01,-1.8l-1.35,-2.36l-0.63,-5.84l-0.97,-1.52l0.36,-9.05l0.44,-2.58l1.01,-0.29l0.59,-1.87l-0.42,-2.56l1.89,-4.58l1.22,-0.66l0.29,-3.42l1.9,-5.09l-1.65,-4.29l-2.75,-2.41l0.19,-1.93l-2.81,-7.05ZM212.39,342.72l-0.03,-0.01l0.05,-0.02l-0.02,0.03ZM231.34,374.14l0.0,-0.02l0.02,0.0l-0.01,0.01ZM190.31,350.0l20.18,22.25l1.31,0.64l0.48,-1.18l-2.9,-5.76l5.37,-0.77l0.04,1.86l1.57,-0.1l3.92,4.24l1.79,0.44l1.13,3.68l3.21,4.1l2.47,1.51l5.4,1.24l2.15,1.86l0.0,1.36l3.08,3.96l-2.04,-1.1l-1.15,-2.18l-1.14,0.37l-3.03,-1.24l-1.42,0.82l-0.95,-0.95l0.8,-0.85l-2.32,-2.02l-4.58,-1.14l-1.78,-2.34l-5.12,-2.53l-1.03,0.1l-0.53,2.21l-2.32,1.37l-1.85,-0.68l-0.06,-1.12l-1.62,-1.49l1.71,-0.12l0.44,-0.84l-3.15,-2.07l-0.66,-2.01l-3.81,-2.23l-0.26,-1.62l-6.81,-6.3l-8.17,-11.18l0.0,-1.75l1.66,1.56ZM239.6,389.43l-0.14,-0.04l0.05,-0.05l0.1,0.09Z",name:"Ličko-Senjska"},"hr-vp":{path:"M574.69,106.4l1.24,1.81l5.32,-1.83l1.91,1.05l0.27,1.67l-1.81,4.7l2.63,1.2l4.0,-1.09l3.66,2.93l2.75,-0.24l1.91,-1.86l2.69,-0.58l16.8,2.31l7.86,6.49l5.42,9.47l2.7,2.03l9.5,1.19l3.6,2.65l9.78,1.99l6.52,7.16l2.02,-0.39l0.88,-1.78l2.78,0.48l3.93,4.79l0.34,3.8l4.41,0.43l0.68,1.93l4.54,0.01l1.4,7.09l1.82,3.55l2.66,3.27l4.54,-0.09l0.05,1.7l-1.83,-0.84l-1.22,0.49l-4.33,7.22l-2.36,1.97l-2.46,4.91l-1.34,0.47l-3.61,4.54l-2.19,5.78l-6.67,3.07l-1.74,2.02l-2.34,-1.8l-2.49,-0.51l-1.94,0.61l-1.54,1.74l-2.87,0.17l-4.96,-3.76l-6.85,-1.13l-2.29,1.4l-5.49,-2.92l-2.95,0.49l-7.2,-1.35l-4.07,-4.73l-3.57,-0.96l-7.05,-4.95l-2.72,0.54l-1.43,3.69l-5.84,-3.84l-4.11,0.38l-1.12,-2.03l0.37,-1.58l4.46,-1.87l-0.55,-4.3l3.3,-4.0l0.34,-3.93l2.01,-1.26l-0.1,-3.74l-1.98,-1.71l-3.89,-0.98l0.98,-1.78l-2.59,-2.25l-5.2,2.47l-0.85,1.93l-1.58,0.83l-1.15,-3.8l-3.81,-0.15l1.95,-4.16l-1.22,-3.27l-2.17,-0.63l-1.56,2.65l-1.53,-0.12l0.36,-3.28l-1.51,-0.95l-3.16,0.02l-1.96,-2.64l-0.4,-4.96l-4.9,-0.99l-2.23,-2.37l-4.23,-1.85l-1.64,-3.66l-2.26,-0.91l-0.96,-1.62l-6.41,-1.99l0.94,-4.35l-1.14,-1.64l3.71,-2.88l1.44,-2.71l4.97,-4.51l0.74,-1.81l2.62,-1.55l12.58,-0.17Z",name:"Virovitičko-Podravska"},"hr-sb":{path:"M313.57,503.12l-0.15,-0.83l2.03,-1.62l4.43,4.24l3.02,1.26l4.35,-1.99l3.44,-3.82l2.07,2.0l6.19,3.13l2.56,-5.93l-0.56,-1.26l-1.64,-0.47l3.11,0.03l2.52,-4.68l-2.12,-2.36l0.77,-1.33l2.67,0.45l2.62,2.15l2.34,-1.72l0.69,-2.21l-3.5,-2.48l-1.44,-2.85l3.21,-0.88l3.64,-2.47l0.13,-1.17l-1.64,-1.82l4.08,-5.58l-2.69,-3.46l-6.57,-2.28l-0.7,-1.07l4.77,0.89l1.64,-0.57l2.59,-4.05l2.13,0.22l4.79,-5.45l3.51,-1.93l1.58,-3.21l5.54,-5.51l2.29,1.99l1.46,4.6l9.01,3.16l4.71,3.17l1.52,-0.06l1.17,-1.75l6.15,-3.06l1.49,-4.7l-0.13,-3.65l2.29,-4.14l4.64,0.81l8.75,-1.3l0.5,2.66l9.51,6.83l1.68,6.33l3.3,1.0l1.17,4.76l4.02,2.11l13.54,11.37l9.24,2.48l1.85,1.57l1.87,4.19l-10.22,-0.1l-4.5,2.1l-2.72,2.58l-4.62,0.77l-1.9,2.19l0.99,1.74l-0.65,0.57l-3.25,0.82l-4.28,-1.32l-2.5,5.76l0.85,2.59l8.71,5.52l5.93,6.69l-2.7,0.78l-4.65,3.91l-6.7,3.71l0.0,1.56l1.65,1.74l-3.61,3.47l2.74,3.39l-1.46,3.23l-1.9,1.04l-5.86,-0.73l-2.12,0.93l-4.13,-1.43l-2.78,4.68l-6.49,-2.1l-1.68,-1.34l-4.12,-0.52l-4.64,10.66l-2.39,1.7l-0.54,3.08l-4.03,-0.93l-3.45,1.94l-0.9,1.77l1.04,4.14l2.42,2.76l0.45,2.17l2.9,1.18l-1.46,1.12l-2.79,-0.87l-3.56,1.0l0.35,1.7l3.86,1.83l-0.63,0.8l-5.9,0.21l-1.61,1.5l-1.86,-0.08l-0.56,-1.07l-1.32,1.85l-0.43,-1.79l-1.33,0.76l-1.09,-0.65l1.16,-0.53l-0.35,-0.68l2.35,0.46l1.77,-1.32l-0.99,-3.24l1.3,-0.6l-2.38,-0.91l-1.07,0.71l0.52,0.88l-1.55,-0.2l-0.4,0.66l-0.02,-1.68l-3.74,-1.02l-1.2,-1.44l2.61,-1.09l0.13,-1.79l-1.16,-0.25l-0.58,1.02l-2.13,-1.28l2.32,-1.38l-0.45,-1.33l-1.08,-0.19l0.59,-1.46l-1.09,-1.62l1.18,-1.2l-1.3,-1.12l-0.15,-2.43l8.51,0.16l-4.74,-1.53l-1.06,-1.23l-4.32,0.1l3.42,-0.92l2.81,2.13l0.44,-2.71l-1.85,-2.51l-2.44,-1.37l-4.35,-4.92l-2.09,0.77l-4.31,-4.88l-8.29,-4.36l-2.6,-2.41l-5.01,1.23l-1.71,-1.59l-5.88,-1.64l-5.93,-5.77l-2.55,0.31l-3.6,-2.87l0.11,-0.56l1.61,1.82l1.2,-1.27l1.95,0.2l3.49,1.64l0.94,1.8l0.71,-1.43l-1.16,-2.45l-1.88,-0.29l-6.08,-4.95l-5.23,-0.92l-1.87,-1.79l-0.4,-1.71l-0.77,0.9l-1.34,-0.63ZM313.57,504.3l0.14,-0.06l0.15,-0.13l-0.16,0.21l-0.14,-0.01ZM325.64,515.96l1.27,2.08l-0.47,0.74l2.9,2.92l-1.57,0.17l-4.07,-1.69l-2.05,-3.66l-2.82,-0.91l-4.35,-5.81l0.91,-0.22l2.37,2.31l1.13,-2.16l0.27,1.39l1.01,-0.23l-0.12,2.34l1.41,1.74l1.27,0.15l0.79,1.8l2.13,-0.96ZM373.91,565.14l0.29,0.6l-0.88,0.13l0.0,-0.12l0.59,-0.61ZM379.97,571.91l0.57,0.72l-0.7,0.41l-0.4,-0.46l0.53,-0.66ZM375.5,567.0l0.09,-0.27l0.08,-0.1l0.0,0.37l-0.18,0.0ZM375.68,566.57l0.04,-0.04l-0.04,0.05l0.0,-0.01ZM375.79,566.45l-0.07,0.07l0.0,-0.15l0.07,0.07ZM366.55,539.22l0.04,-0.34l0.29,-0.05l0.05,0.07l-0.39,0.31ZM364.55,557.93l-0.25,-0.05l-0.15,-0.12l0.21,-0.05l0.18,0.23ZM364.11,542.76l0.0,-0.04l0.26,0.02l-0.18,0.2l-0.08,-0.18ZM354.04,535.31l-1.02,-1.2l1.86,0.77l0.5,-2.14l0.97,0.54l3.08,3.75l-0.25,2.48l0.75,1.27l-0.59,-0.55l-0.39,-1.15l-4.89,-3.78ZM359.91,540.8l0.04,0.04l0.0,0.11l-0.04,-0.09l0.0,-0.06ZM351.46,531.01l-0.17,-0.26l0.0,-0.04l0.37,0.4l-0.2,-0.1ZM351.42,540.5l-0.04,-0.1l0.0,-0.08l0.09,0.06l-0.05,0.12ZM348.13,528.17l-0.99,-1.15l0.19,-0.56l3.07,3.21l-1.89,-0.16l-0.38,-1.34ZM348.51,529.56l0.63,0.65l0.07,0.12l-0.5,-0.47l-0.21,-0.3ZM349.04,538.57l0.03,-0.03l0.0,-0.19l0.05,0.31l-0.07,-0.09ZM347.64,537.25l0.0,0.68l-0.07,0.07l-0.15,-0.86l0.22,0.11ZM343.11,529.78l-0.57,-0.84l0.59,-0.67l2.9,2.18l0.19,0.66l-1.53,-0.16l0.0,0.31l0.8,0.96l0.0,0.17l0.09,0.11l0.0,0.05l-2.46,-2.78ZM340.9,534.44l0.22,-0.99l4.79,3.29l-0.36,0.61l-1.26,-1.26l-1.26,0.56l-2.13,-2.21ZM343.85,539.95l-0.19,-0.19l0.14,0.1l0.05,0.09ZM340.44,539.3l0.14,0.0l0.08,0.06l-0.2,-0.04l-0.02,-0.02ZM341.06,547.73l-0.45,-0.1l-0.1,-0.18l0.19,0.0l0.37,0.28ZM320.75,538.89l1.76,1.18l2.39,-0.45l2.93,1.63l0.89,-0.61l3.85,4.1l2.21,0.15l0.49,0.53l-0.74,0.98l-2.15,-0.96l-0.45,1.03l-3.58,-1.51l-5.41,-4.82l-0.36,0.82l-1.88,-0.72l0.06,-1.35ZM335.32,545.47l-0.02,-0.02l0.99,0.05l1.62,1.05l-2.59,-1.08ZM336.1,546.81l-0.03,-0.08l0.02,-0.02l0.01,0.01l0.0,0.08ZM337.97,546.58l0.67,0.1l0.25,0.33l-0.59,-0.2l-0.33,-0.23ZM331.09,531.15l-0.23,-0.22l0.02,-0.03l0.46,0.2l-0.25,0.05ZM331.9,531.19l3.66,2.73l1.31,2.3l1.74,-0.37l-0.95,0.74l0.21,0.88l-1.09,0.3l0.38,0.7l-2.78,-1.17l-0.12,-0.72l1.87,0.77l0.57,-0.55l-4.62,-3.24l0.83,-0.48l-1.01,-1.89ZM325.68,532.75l0.72,0.34l0.25,0.89l-0.8,-0.8l-0.16,-0.43ZM327.62,534.76l0.47,-0.18l1.12,1.12l-0.11,0.09l-1.48,-1.03ZM329.71,535.99l1.12,-0.47l0.42,0.97l1.62,0.56l0.38,0.73l-1.89,-0.04l-1.65,-1.74ZM328.93,533.95l-0.05,-0.11l0.0,-0.23l0.12,0.1l-0.08,0.24ZM318.38,529.7l0.38,0.0l0.19,0.23l-0.42,0.05l-0.15,-0.28ZM316.36,508.09l0.07,0.0l0.04,0.12l-0.11,-0.12ZM316.66,509.36l-0.16,-0.02l0.07,-0.12l0.17,0.0l-0.08,0.14ZM314.05,507.64l0.22,-0.48l0.71,0.33l-0.58,0.44l-0.36,-0.29ZM310.71,505.33l-1.1,-1.12l0.06,-0.29l2.06,0.93l0.08,1.0l-1.1,-0.52ZM313.7,505.95l-0.05,0.03l-0.25,-0.26l0.42,-0.06l-0.11,0.29Z",name:"Šibensko-Kninska"},"hr-va":{path:"M356.44,52.92l0.39,-0.46l0.11,-0.09l-0.31,0.41l-0.19,0.14ZM358.04,51.5l21.64,-7.09l3.03,-3.93l4.18,-1.13l1.25,-1.12l-1.15,-6.89l1.04,-1.32l11.56,-3.2l2.63,0.24l6.49,2.63l5.41,0.71l3.76,-0.44l3.58,2.09l1.32,-0.26l6.99,7.36l1.2,3.31l3.97,2.47l4.13,-1.57l6.93,1.24l1.96,-2.02l1.11,1.05l7.13,2.15l4.57,-0.85l1.7,-2.35l1.66,-0.69l7.32,4.03l4.32,0.01l1.45,-1.41l1.92,0.66l2.23,-1.04l7.42,-0.18l1.11,1.11l2.01,-1.48l-0.83,1.73l3.86,1.92l0.55,3.89l-1.59,1.22l0.48,2.36l-1.13,1.34l-2.78,1.19l-2.53,3.28l-2.42,0.54l-1.15,2.32l-2.55,1.84l-7.62,0.96l-6.58,-1.39l-4.82,2.73l-2.05,2.02l-0.24,2.1l-6.31,0.04l-2.37,0.82l-0.72,0.91l0.04,3.01l-3.09,1.58l-3.35,0.43l-3.36,-2.71l-6.76,3.26l-0.86,1.29l0.6,2.65l-2.57,2.56l-0.26,1.6l-2.12,1.41l-0.05,5.31l0.95,1.69l-1.32,3.16l-3.03,-0.07l-3.49,2.47l-2.94,-1.67l-0.15,-4.02l-2.12,-0.91l-1.66,-4.35l0.28,-2.55l-2.09,-1.76l1.31,-2.71l-1.31,-2.76l1.9,-3.52l-0.73,-0.81l0.37,-1.71l-2.36,-3.51l0.81,-3.24l-6.47,-0.43l0.92,-2.5l-1.93,-1.14l-4.3,2.0l-3.21,3.67l-5.33,0.24l-0.55,-2.3l-2.65,-0.95l-8.38,1.91l-5.6,0.02l-1.39,-2.39l-6.06,-0.21l-0.66,-2.28l-2.5,-1.99l-6.78,-1.79l0.47,-4.24l-0.42,-3.14l-0.89,-0.48Z",name:"Varaždinska"},"hr-vs":{path:"M768.47,277.13l-3.6,-4.49l-3.56,0.06l-2.08,-1.16l-2.38,-3.61l1.95,-4.82l4.09,-6.05l1.53,-1.53l3.57,-1.16l0.79,-5.39l-0.6,-1.37l-7.89,-1.12l-1.28,-1.18l0.9,-2.36l-0.6,-6.25l4.05,-2.15l4.86,0.89l1.64,-1.07l1.47,-2.79l7.14,0.51l-2.31,-6.37l4.21,-1.36l-0.52,-6.61l5.03,-0.17l5.07,-2.93l5.15,-1.04l2.64,0.48l1.19,1.78l3.97,-1.09l0.77,-2.8l-1.83,-2.33l2.34,-2.78l-0.91,-1.8l2.8,0.28l3.78,-1.57l2.16,-2.86l4.03,-0.43l4.11,2.17l1.55,3.03l3.15,2.63l0.79,2.64l3.24,-1.42l5.23,0.23l1.39,3.76l-4.78,1.51l-1.83,1.96l-0.1,2.46l2.3,2.63l5.35,3.65l9.0,1.88l2.36,7.21l10.59,5.5l16.74,6.21l19.72,1.36l1.8,1.58l0.32,2.37l2.42,1.79l-1.88,1.75l-0.29,2.05l-2.16,0.95l-6.04,-0.8l-2.93,2.2l-0.93,-0.2l-2.87,-5.49l-6.9,-2.4l-0.52,0.46l0.92,4.67l-8.04,-0.75l-5.51,-5.05l-4.42,-0.59l-0.54,2.98l3.31,1.02l-1.4,4.22l-4.64,5.32l-9.33,-0.94l-0.86,3.49l0.4,2.71l1.34,4.79l1.6,1.05l-1.43,3.03l0.71,3.38l2.04,2.73l-0.47,2.72l0.91,1.89l-2.91,3.04l-4.99,3.29l1.13,1.62l4.72,-0.33l2.41,0.76l4.58,-1.64l1.11,3.61l2.18,0.87l-9.8,6.47l-2.55,-0.07l-2.3,2.83l-5.2,-2.81l-5.36,3.13l5.95,6.95l-5.88,1.41l-19.19,-0.73l-2.63,-0.93l-12.35,-8.51l-0.78,-1.54l0.52,-1.85l-2.02,-2.1l0.41,-0.85l5.35,1.38l1.6,-0.84l-2.99,-6.57l2.44,-3.75l-7.6,-1.48l-2.9,0.55l0.66,-4.46l-3.96,-3.56l-2.98,-0.88l-3.08,-3.71l2.44,-2.86l-0.95,-2.91l-2.27,-0.13l-2.34,1.34l-0.53,1.76l1.21,2.96l-0.95,0.55l-6.02,-0.81l3.78,-3.87l-0.45,-1.71l-1.83,0.21l-2.43,1.93l-1.61,-0.6l-1.46,-1.88l-1.91,-0.07l-0.99,1.38l2.0,1.96l-0.24,1.76Z",name:"Vukovarsko-Srijemska"},"hr-me":{path:"M423.72,31.52l1.41,-0.59l0.27,-1.4l-0.57,-2.02l-3.95,-5.07l-1.71,-4.79l-0.26,-10.78l1.37,-2.18l2.21,-1.41l2.71,-0.24l6.69,-2.63l4.14,2.0l3.32,-1.52l4.36,2.91l4.37,0.36l5.36,2.26l2.45,1.51l2.59,3.96l4.16,0.59l2.35,1.36l6.21,0.28l1.28,1.6l7.6,1.81l-0.51,2.52l1.12,0.49l1.01,-0.6l1.11,1.19l6.0,9.36l1.01,0.05l1.28,-1.85l0.68,2.12l1.22,0.84l1.27,-0.57l0.89,1.48l1.72,-0.9l1.24,0.97l1.43,-1.29l1.61,0.07l2.43,2.78l1.11,-0.31l1.33,0.89l0.55,-1.09l-0.19,1.72l1.95,0.53l1.4,1.69l-1.64,2.2l1.08,1.8l-5.71,7.73l-1.07,-0.52l-1.17,-2.88l-3.53,0.15l-1.55,-0.78l-0.94,1.11l-2.24,-0.54l-1.02,-0.73l0.89,-1.52l-0.88,-0.89l-1.94,1.36l-1.23,-1.0l-7.5,0.18l-2.26,1.04l-2.12,-0.62l-1.32,1.38l-4.11,-0.03l-7.41,-4.05l-2.12,0.9l-1.47,2.19l-4.34,0.82l-6.87,-2.12l-1.26,-1.1l-2.17,2.05l-6.83,-1.26l-3.95,1.57l-3.55,-2.23l-1.15,-3.25l-6.66,-7.1ZM510.14,37.53l0.34,-0.1l0.33,0.01l-0.12,0.3l-0.55,-0.21Z",name:"Međimurska"},"hr-sd":{path:"M380.8,571.81l0.95,-1.66l4.49,0.13l2.73,-1.24l-0.1,-1.28l-3.7,-1.7l-0.38,-0.89l2.88,-0.58l2.85,0.86l2.03,-1.48l-0.21,-1.18l-2.69,-0.87l-0.39,-2.08l-2.41,-2.72l-1.01,-3.62l0.77,-1.47l3.04,-1.68l4.59,0.79l0.46,-3.35l2.3,-1.52l4.6,-10.6l11.67,4.23l3.12,-4.81l3.77,1.48l2.19,-0.92l6.93,0.43l1.42,-0.98l1.68,-3.25l-0.77,-2.2l-1.87,-1.58l3.48,-3.44l-1.79,-3.01l6.5,-3.52l4.63,-3.89l3.1,-0.8l0.23,-0.65l-6.45,-7.29l-8.59,-5.37l-0.74,-1.92l2.28,-5.23l2.89,1.31l2.92,-0.23l2.49,-1.39l-0.95,-1.85l1.94,-2.11l4.22,-0.54l2.8,-2.62l4.33,-2.01l8.78,-0.4l3.19,2.74l4.37,1.16l2.91,4.65l7.98,6.59l7.56,3.95l1.97,3.68l0.22,6.98l1.61,1.72l2.33,0.77l1.11,3.73l8.86,2.63l4.09,3.59l1.95,2.31l1.65,4.43l4.24,1.91l5.98,8.53l14.92,15.71l9.29,3.95l3.07,3.84l2.0,1.07l7.52,2.1l5.78,0.48l12.57,6.56l-2.98,2.53l-1.7,4.04l-0.3,7.1l11.49,24.18l13.08,7.23l1.58,1.66l-0.82,3.94l2.84,1.59l-2.07,4.37l-3.78,1.25l-6.02,-1.31l-4.28,0.5l-0.46,2.17l4.88,-0.05l1.56,3.52l2.93,3.31l-7.75,4.09l-2.45,-3.97l-7.43,-3.15l-0.98,-2.04l-3.47,-2.35l-2.82,-0.41l-5.54,-2.91l-2.85,0.05l-2.81,-1.43l-2.33,-3.01l-2.1,-0.12l-3.81,-2.43l-0.63,-3.28l-4.46,-1.48l-0.35,-1.51l-1.84,-1.17l-1.43,-3.77l-5.26,-3.24l0.06,-1.24l-9.38,-9.19l-1.47,-2.58l-7.9,-5.75l-1.5,-2.35l-8.68,0.0l-15.86,-2.35l-2.06,-1.22l-2.75,-4.16l-7.89,0.81l-2.64,-2.72l-6.58,-2.24l-6.34,-4.86l-1.2,-2.41l-1.55,0.91l-3.75,-0.55l-5.78,0.61l-2.2,-0.26l-1.02,-1.43l-1.56,1.33l-4.95,-1.23l4.66,-0.89l0.57,-0.86l-0.58,-0.67l2.17,-0.98l0.33,0.77l0.95,-0.82l3.43,0.51l1.39,-1.22l-0.97,-1.11l-4.78,-0.36l-1.45,-1.3l-12.82,-1.06l-5.3,2.05l-1.94,2.31l-3.1,0.2l-4.31,1.99l0.52,0.76l7.41,0.32l10.97,4.77l-9.16,0.25l-6.08,-1.89l-0.75,1.4l-3.79,0.8l-4.34,-1.07l-1.4,-1.4l2.84,-0.16l1.83,1.33l0.68,-0.61l2.18,0.36l0.99,-0.96l-0.59,-2.52l-1.75,-0.17l-0.13,-1.13l-3.19,-0.53l-6.02,1.89l-1.02,-0.98l-2.62,0.11l-4.38,-1.38l-0.95,0.72l-1.18,-0.36l-0.73,1.85l8.73,2.07l0.56,1.16l-0.57,0.86l-4.98,0.77l-4.08,-1.28l0.0,1.31l2.02,1.02l-1.6,0.89l-3.07,-0.31l-3.94,-2.25l-1.37,1.79l-1.58,-1.02l-1.04,0.31l0.68,-1.6l-3.77,-0.6l-0.65,-1.8l-1.73,1.27ZM437.37,573.6l0.37,-0.23l0.96,-0.2l0.25,0.02l-1.58,0.41ZM436.82,627.34l2.53,-0.28l0.73,1.23l0.65,-0.58l2.5,0.99l1.07,-1.52l0.44,1.11l0.97,-0.15l1.04,-1.82l2.36,-0.07l0.24,-0.97l1.57,0.61l1.04,-1.02l3.27,0.36l0.44,0.71l0.96,-0.66l2.84,0.71l2.35,2.61l3.86,1.94l2.23,-0.36l2.08,-1.21l-2.57,-1.17l-0.48,-2.3l-1.03,0.37l-0.8,-0.71l-0.86,-2.78l-2.86,1.08l-2.11,-1.57l0.62,-0.74l0.99,1.16l0.41,-0.76l1.9,0.61l-0.07,-1.67l2.67,0.65l0.45,-0.67l-0.47,3.39l1.98,0.14l0.19,1.58l3.89,-2.41l1.54,1.34l4.2,-0.2l0.86,-0.93l2.44,0.96l-0.79,2.24l4.08,3.16l-2.02,0.39l2.78,1.83l0.26,1.63l2.12,-0.11l2.25,1.14l3.3,-1.13l4.77,0.88l5.42,0.0l1.55,-0.71l2.02,0.26l0.56,0.92l3.66,-0.15l0.2,-0.92l1.18,-0.05l1.74,2.45l1.31,-1.28l0.58,0.82l9.36,-0.26l8.28,1.98l1.52,-0.5l1.44,0.92l11.06,0.82l5.76,-0.92l4.87,1.02l0.88,0.25l0.88,0.36l0.21,0.18l-11.36,2.23l-2.11,-0.87l-6.53,0.87l-1.46,-0.77l-6.25,0.77l-3.93,-0.77l-1.73,0.86l-5.22,0.1l-23.16,-2.75l-17.92,1.12l-11.49,-2.35l-3.21,-1.39l-3.36,0.47l-8.71,-4.24l-2.8,0.9l-2.87,-0.8l-1.31,-1.79l-9.85,-3.82ZM560.13,639.59l-0.01,-0.01l0.0,-0.01l0.01,0.01l-0.01,0.0ZM446.74,626.3l0.01,0.0l0.0,0.01l0.0,-0.01l0.0,0.0ZM446.66,626.18l0.0,0.0l0.0,0.0l0.0,0.0ZM477.1,623.7l-0.16,-0.23l-0.04,-0.24l0.29,0.1l-0.08,0.37ZM484.86,629.58l0.0,0.0l0.0,0.0l0.0,0.0ZM442.31,602.13l2.13,1.94l2.31,-0.87l-0.78,-3.58l4.08,-1.3l-2.33,-1.34l0.81,-1.67l-1.57,-1.76l-0.99,0.02l-0.69,-1.76l1.38,-0.67l10.82,1.74l5.2,-0.87l5.02,1.43l2.5,-0.26l0.19,0.92l1.7,-0.8l5.3,0.85l1.07,0.87l0.56,-0.65l1.8,0.96l1.97,-0.31l8.31,1.74l-0.19,2.71l1.96,-0.4l-0.33,-2.27l5.33,0.77l0.61,1.53l0.61,-0.98l1.84,0.06l2.62,1.24l-2.76,0.31l-0.61,0.71l0.57,0.71l2.17,-0.36l0.65,0.77l0.72,-0.63l1.86,0.99l1.21,-1.43l3.3,1.9l0.44,1.17l4.69,1.81l-1.8,1.38l0.34,0.86l-1.78,2.6l0.43,0.61l-2.31,-0.78l0.08,1.09l-2.21,1.9l-1.13,-0.66l-0.89,1.02l-3.34,-0.1l-4.69,1.22l-4.57,-0.51l-17.82,1.31l-18.4,-3.17l-2.77,-3.0l-0.72,0.7l-1.06,-1.26l-1.15,0.05l-1.43,-2.4l-1.53,1.47l0.55,-1.07l-0.57,-0.71l-1.74,-0.46l-0.01,1.14l-1.01,-0.07l-0.27,-1.48l-1.29,0.64l-2.37,-1.08l0.01,-2.49ZM456.08,611.11l-0.11,0.14l-0.07,0.07l-0.03,-0.05l0.21,-0.16ZM512.17,603.46l0.0,0.0l0.0,0.0l0.0,0.0ZM470.31,593.15l-0.01,0.0l0.01,-0.01l0.0,0.0ZM480.77,646.81l3.38,-1.68l1.75,1.48l1.83,-1.07l2.89,0.38l1.11,0.95l-4.68,1.04l-6.27,-1.1ZM443.08,634.75l-0.26,-0.2l0.6,-0.29l-0.13,0.27l-0.21,0.22ZM443.46,634.22l-0.02,0.02l0.02,-0.02l0.0,0.0ZM430.97,631.71l0.04,0.0l-0.04,0.04l0.0,-0.04ZM431.64,631.31l1.36,-0.28l2.57,2.05l1.07,-0.67l1.11,1.13l0.77,-0.77l1.38,0.82l-1.55,0.54l-1.63,-1.29l-0.63,0.81l-2.05,-1.27l-1.05,0.6l0.02,-1.01l-1.38,-0.67ZM433.06,630.98l-0.03,0.02l0.03,-0.03l0.0,0.0ZM436.13,633.68l-0.01,-0.01l0.02,-0.01l0.0,0.01l-0.01,0.01ZM440.4,633.39l0.1,0.06l0.1,0.2l-0.24,-0.23l0.04,-0.02ZM440.35,633.43l0.0,0.0l0.01,-0.01l0.0,0.01ZM430.54,632.24l-0.01,0.0l0.01,-0.01l0.0,0.01ZM411.73,588.4l-1.04,-0.88l11.13,0.3l2.75,1.27l1.04,1.84l0.93,-1.06l1.23,0.6l-0.42,2.51l2.04,-0.49l0.48,-1.49l3.13,3.87l1.36,-0.05l0.6,2.46l3.22,3.26l1.03,-0.05l0.8,1.91l-0.99,-1.43l-1.31,1.79l-0.57,-1.45l-1.37,0.53l-0.35,-1.63l-1.23,0.97l-6.23,-2.56l-1.07,-2.02l-3.0,-0.96l-0.84,-1.33l-0.96,0.77l-2.45,-1.69l-4.1,-0.71l-0.38,-0.91l-2.91,0.45l-0.47,-0.61l0.69,-1.03l-1.39,-0.32l0.65,-1.86ZM429.67,590.63l0.0,0.15l0.08,0.08l-0.12,-0.12l0.04,-0.11ZM427.69,631.32l-0.04,-0.04l0.0,-0.08l0.13,0.14l-0.09,-0.02ZM389.26,654.07l-1.26,-1.05l4.27,-2.69l5.45,-1.08l2.23,0.52l2.93,-1.12l3.87,-0.15l0.94,1.12l1.3,0.01l-1.28,2.14l1.44,1.0l2.62,-2.54l2.37,-0.61l0.57,0.56l1.19,-0.77l0.62,2.13l0.93,-1.27l0.93,0.89l-0.45,2.44l-3.01,1.53l-0.63,2.14l-0.99,1.22l-1.28,-0.22l-0.45,1.19l-1.86,-1.22l-0.26,1.07l-3.48,-0.46l-0.31,0.82l-1.02,-0.37l-7.61,2.04l-6.19,0.27l0.15,-0.88l3.36,-2.16l0.17,-2.21l-1.66,-2.54l-3.2,1.38l-0.39,-1.12ZM410.49,658.8l0.01,0.01l-0.01,0.01l-0.01,-0.01ZM414.17,659.76l0.07,0.0l0.03,0.04l-0.08,-0.02l-0.02,-0.02ZM409.4,590.91l0.0,-0.13l0.29,-0.05l-0.11,0.23l-0.17,-0.05ZM406.08,588.65l0.43,-0.22l0.66,0.71l-0.92,0.07l-0.17,-0.56ZM397.05,583.58l1.17,-1.56l1.3,-0.29l-0.43,-1.44l1.99,0.57l1.17,-0.56l-1.61,-1.39l3.65,0.15l1.86,1.72l-0.81,2.42l-2.06,-1.21l-1.57,0.81l0.05,0.83l-4.7,-0.05ZM398.52,586.1l-0.13,-0.28l0.84,0.45l-0.09,0.08l-0.62,-0.25ZM388.5,580.55l0.0,-0.26l0.42,0.12l-0.22,0.16l-0.2,-0.01ZM389.97,580.74l-0.45,-0.5l1.78,-0.67l1.99,0.05l0.31,2.43l-0.95,0.35l-0.4,-1.69l-2.29,0.03ZM384.16,576.11l0.01,-0.12l0.72,-0.2l0.0,0.12l-0.73,0.2ZM379.84,670.78l0.05,-0.18l0.34,-0.13l-0.17,0.37l-0.21,-0.06ZM380.51,670.03l-0.24,-4.83l0.49,-0.87l1.93,1.55l0.54,1.64l-0.53,2.6l-2.19,-0.1ZM339.01,659.08l3.26,-2.07l2.39,0.3l-2.61,1.96l-3.04,-0.19Z",name:"Splitsko-Dalmatinska"}},height:804.9967209703165,projection:{type:"mill",centralMeridian:0},width:900});
\ No newline at end of file
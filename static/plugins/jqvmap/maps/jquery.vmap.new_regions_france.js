@@ -1,32 +0,0 @@
-jQuery.fn.vectorMap('addMap','france_fr',
-  {"width":520,"height":550,
-    "pathes":{
-
-      "21":{"path":"M 174.2,23.3 L 174.5,21.8 L 172.5,19.6 L 169.6,19.9 L 166.8,21.8 L 165.3,21.1 L 163.9,18.6 L 162.2,18.6 L 161.6,17.2 L 162.1,14.3 L 160.9,11.3 L 159.5,10.5 L 151.2,12.6 L 144.5,14.7 L 141.6,17.1 L 141.6,26.1 L 143,27.9 L 141.6,27.1 L 141.3,30 L 141.5,31.9 L 142.7,32.7 L 140.8,33.4 L 140.6,34.9 L 142.2,37.7 L 140.8,36.9 L 137.5,41.4 L 143.8,46.7 L 145.5,50.9 L 144,53.3 L 144.7,57.6 L 144,61.6 L 145.7,65.8 L 143.7,67.1 L 144.5,68.7 L 147.3,69.3 L 150.5,68.4 L 155.1,69.5 L 156.2,68.7 L 161.6,71.9 L 165.1,72.4 L 166.1,71.3 L 167.3,72.1 L 171.4,70.6 L 172.7,71 L 173.6,72.2 L 173.3,73.6 L 175.2,75.7 L 179.9,78.7 L 183.7,73.6 L 182.4,73 L 182.9,71.6 L 182.1,70.4 L 184.8,69.3 L 183.2,65.3 L 183.8,63.9 L 187.8,61.9 L 190.5,62.9 L 190.9,61.4 L 190.8,54.3 L 192.2,54.2 L 194.7,50.6 L 194,49 L 194.7,47.3 L 194.3,44.4 L 194.1,44.4 L 192.3,43.8 L 193.9,40.7 L 192.4,38.1 L 193.4,34.8 L 192,35.1 L 190,32.7 L 187,33.2 L 184.2,32.6 L 183.1,33.6 L 182.1,29.1 L 179.3,28.4 L 178.8,27.1 L 177.3,28.1 L 175.8,27.6 L 174.2,23.3 z "
-        ,"name":"Hauts-de-France"},
-      "2":{"path":"M 137.5,41.4 L 137.4,41.5 L 132,45.3 L 120.9,48 L 113.8,51.9 L 110.9,58.2 L 111.8,59.3 L 116.2,60.3 L 116.3,60.3 L 115.5,60.6 L 115.4,60.6 L 112,61.4 L 109.6,63.5 L 104.8,64.9 L 100.5,63.1 L 94.3,62.4 L 89.5,60.8 L 86.9,61.9 L 83.7,56.7 L 84.9,52.7 L 84.4,51.4 L 81.1,51 L 79.9,51.9 L 76.6,52.1 L 70.9,49.8 L 70.8,51.2 L 72.5,52.1 L 72.7,54.6 L 71.8,55.6 L 73,60.7 L 77.3,65.3 L 76.6,70.3 L 77.6,71.7 L 77.4,74.7 L 76.2,77.5 L 78.3,82.2 L 79.6,82.9 L 80.9,82.1 L 80.4,83.6 L 76.8,83.9 L 79.2,88.7 L 80.5,89.2 L 84.1,86.8 L 86.8,88 L 91.1,88.4 L 92.8,90.2 L 94,89.4 L 95.2,90.3 L 98.6,88.6 L 103.2,88.6 L 103.5,87.3 L 104.9,87.4 L 105.8,90.4 L 107.5,91.2 L 107.5,92.7 L 109,92.7 L 114.5,89.8 L 115.8,90.5 L 116.6,94.7 L 120.3,97.2 L 121.7,96.7 L 123.3,98.5 L 124.9,98.8 L 124.8,98.8 L 124.3,95.1 L 128.1,92.5 L 127.8,90.2 L 127.9,88 L 125.5,85.8 L 125.5,84.2 L 126.7,82.9 L 129.6,82.3 L 132.3,80.7 L 133.7,81.5 L 136.7,80.9 L 136.6,79.5 L 139.6,76 L 138.7,73.1 L 139.8,71.8 L 141.8,71.9 L 143.7,67.1 L 145.7,65.8 L 144,61.6 L 144.7,57.6 L 144,53.3 L 145.5,50.9 L 143.8,46.7 L 137.5,41.4 z "
-        ,"name":"Normandie"},
-      "4":{"path":"M 173.3,73.6 L 173.6,72.2 L 172.7,71 L 171.4,70.6 L 167.3,72.1 L 166.1,71.3 L 165.1,72.4 L 161.6,71.9 L 156.2,68.7 L 155.1,69.5 L 150.5,68.4 L 147.3,69.3 L 144.5,68.7 L 143.7,67.1 L 141.8,71.9 L 139.8,71.8 L 138.7,73.1 L 139.6,76 L 141.4,79.3 L 141.7,84.8 L 144.7,87.5 L 145.3,90.3 L 146.5,91.4 L 148,91 L 149.4,96.3 L 149.5,96.3 L 152.9,95.9 L 153.9,94.5 L 154.6,95.9 L 156,95 L 157.9,95.3 L 158.2,96.8 L 160.3,98.9 L 160,100.3 L 158.7,101.1 L 163.3,101.4 L 168.9,100.1 L 170.8,97.4 L 170.9,94.5 L 178.6,93 L 178.4,88.7 L 179.9,88.3 L 181.4,85.8 L 180.1,85 L 178.4,80.8 L 179.6,79.7 L 179.9,78.7 L 175.2,75.7 L 173.3,73.6 z "
-        ,"name":"Île-de-France"},
-      "5":{"path":"M 86,95.2 L 86.8,94 L 86.8,88 L 84.1,86.8 L 80.5,89.2 L 79.2,88.7 L 76.8,83.9 L 71,84 L 71.2,81.1 L 69.5,81.5 L 67.6,83.4 L 68.7,86.1 L 67.7,85.3 L 66.9,83.1 L 65.4,83.1 L 65.4,84 L 63.4,84.2 L 62.9,82.6 L 61.3,83.3 L 60.8,82 L 59,82.2 L 53.7,86.6 L 53.2,84.8 L 51.2,83.5 L 51.2,81.9 L 48.9,78 L 47.4,77.7 L 47.7,76.3 L 46.2,76.5 L 45.4,78 L 46.1,74.7 L 43.7,76.3 L 43.4,74.5 L 39,76.3 L 38.3,75.1 L 36,76.9 L 35.9,80 L 34.3,80.2 L 34.2,80.2 L 31.8,78.8 L 30.4,79.1 L 30.1,80.8 L 29,79.4 L 28.2,81 L 28.1,77.8 L 20.9,79.9 L 20.2,78.6 L 15.1,81.4 L 16.4,82 L 12.2,81.6 L 11.2,82.8 L 10.5,87.3 L 11.4,88.5 L 12.8,87.9 L 14.1,88.5 L 20.2,86.7 L 18.4,87.5 L 18.1,89.2 L 21.1,88.5 L 20.9,90 L 22.3,90.6 L 20.8,90.9 L 23.9,92.2 L 20.9,91.5 L 20.3,90.3 L 18.4,90.8 L 15.5,90.2 L 14.6,89 L 13.9,90.9 L 15.1,93.5 L 16,92.1 L 17.4,92.2 L 20.1,93.8 L 20.5,95.4 L 19.7,96.6 L 18.4,96 L 12.2,96.6 L 11.4,97.8 L 16.2,99.6 L 18,102.7 L 17.5,105.5 L 21.2,105.8 L 23,103.7 L 23,103.5 L 23,103.5 L 22.6,102.1 L 23.1,102 L 23.3,100.4 L 24,101.9 L 23.1,102 L 23,103.5 L 24.5,104.5 L 26.8,103.7 L 29.1,106.6 L 30.5,106.3 L 30.5,104.9 L 30.7,106.3 L 32,105.9 L 31.7,107.3 L 33.1,107.6 L 35,106.8 L 35.1,105.3 L 35.5,109.2 L 36.8,109.9 L 38.1,109.3 L 37.9,106.3 L 38.1,107.8 L 39.7,108.1 L 38.6,109.2 L 39.3,110.5 L 41.2,111.3 L 42.5,110.7 L 41.3,111.3 L 41.4,112.7 L 42.5,114.1 L 42.1,116 L 43.2,117.1 L 42.6,115.7 L 43.9,114.5 L 45.5,114.1 L 46.7,115 L 46.1,112.1 L 47.7,114.5 L 48.4,113.3 L 50.3,113.6 L 51.3,114.8 L 50.3,116 L 47.2,115.6 L 49.6,117.5 L 55.8,117 L 57.1,117.8 L 55.6,117.8 L 56.4,119.1 L 64.1,116.9 L 64.3,113.9 L 66.9,112.2 L 73.5,112 L 74.3,110.5 L 78.8,108.6 L 82.2,110.4 L 82.4,109.3 L 84.2,105 L 86.9,103.9 L 86,95.2 z M 41.5,122.9 L 43.4,122.3 L 40.9,120.6 L 39.5,120.8 L 39.9,122.5 L 41.5,122.9 z "
-        ,"name":"Bretagne"},
-      "6":{"path":"M 275.2,70.9 L 270.9,69.4 L 263.6,69.1 L 259.4,65.4 L 256.3,67.5 L 252.8,66.9 L 251.5,67.5 L 250.4,65.5 L 248.9,64.8 L 247.5,65.6 L 247.4,67.1 L 246,66.7 L 242,62.2 L 241.1,59.2 L 239.6,58.2 L 234.1,56.9 L 231.9,58.7 L 230.5,58.7 L 227.8,57.5 L 226.1,56.1 L 222.7,56.1 L 222.1,57.5 L 219.3,57.8 L 217.5,54.2 L 216,54.4 L 216,52.8 L 213,52 L 209.6,49.1 L 206.6,49.1 L 207.1,45.9 L 205.7,43.1 L 205.7,41 L 207,38.4 L 205.6,37.7 L 203.6,39.8 L 202.7,43.1 L 198.4,45 L 195.7,44.1 L 194.3,44.4 L 194.7,47.3 L 194,49 L 194.7,50.6 L 192.2,54.2 L 190.8,54.3 L 190.9,61.4 L 190.5,62.9 L 187.8,61.9 L 183.8,63.9 L 183.2,65.3 L 184.8,69.3 L 182.1,70.4 L 182.9,71.6 L 182.4,73 L 183.7,73.6 L 179.9,78.7 L 179.6,79.7 L 178.4,80.8 L 180.1,85 L 181.4,85.8 L 179.9,88.3 L 178.4,88.7 L 178.6,93 L 180.5,93.7 L 182.7,96.5 L 183.9,100.6 L 184.9,99.5 L 186.7,101.6 L 189.2,107 L 195.5,106.2 L 197,106.9 L 198.1,105.9 L 201.2,105.5 L 203.5,103.5 L 205.4,103.8 L 207.2,104.1 L 207.5,105.5 L 208.8,106 L 208.6,107.4 L 210.1,107.6 L 210.9,108.7 L 211.5,110.2 L 210.1,111.4 L 211.2,113.8 L 215.8,114.8 L 217.3,115.6 L 217.3,117 L 219.7,116.1 L 220.3,114.8 L 223.6,112.9 L 224.7,113.8 L 226.2,113.3 L 226.4,109.1 L 227.4,107.9 L 228.9,108.1 L 230,106.5 L 229.9,105.8 L 233.9,102.9 L 237.4,105 L 240.3,104.2 L 242.7,106 L 245.3,104.9 L 249.5,108.2 L 250,107.9 L 253.8,110.4 L 254,114.9 L 255.4,114.8 L 256.4,117.4 L 254.5,117.6 L 254.5,117.7 L 256.3,117.4 L 257.7,117.8 L 257.3,119.2 L 261.1,119.3 L 262.4,118.8 L 262.7,117.2 L 264.2,117.2 L 264.3,115.6 L 265.4,114.6 L 263.9,110.7 L 265.3,103 L 264.3,97.9 L 267.3,90.9 L 268,83.1 L 273.3,76.2 L 275.2,70.9 z  "
-        ,"name":"Grand-Est"},
-      "8":{"path":"M 86.8,94 L 86,95.2 L 86.9,103.9 L 84.2,105 L 82.4,109.3 L 82.2,110.4 L 78.8,108.6 L 74.3,110.5 L 73.5,112 L 66.9,112.2 L 64.3,113.9 L 64.1,116.9 L 56.4,119.1 L 54.2,121.3 L 55.4,124.4 L 58.4,124.9 L 59.4,125.9 L 61.9,124.1 L 65.5,123.8 L 62.1,125 L 61.8,128.4 L 60.3,129 L 63.3,130.1 L 65.7,132.6 L 61.8,136.7 L 62,138.9 L 67.2,145 L 68.2,148.6 L 72.3,151.9 L 74.7,152.5 L 75.5,154.2 L 78.4,154.8 L 80.8,156.7 L 81.1,155.3 L 82.6,155.6 L 87,153.9 L 86.3,155.3 L 89.5,155.2 L 90.7,156.1 L 95.2,153.8 L 94,152.8 L 94.1,149.2 L 91.7,140.2 L 89.6,138.1 L 88.5,135.3 L 94.6,134.9 L 96.5,132.5 L 99.3,132.1 L 104.1,132 L 105.2,133.1 L 108.6,130.2 L 108.6,130.1 L 111.4,122.5 L 112.3,117.8 L 112.7,116.6 L 115.7,117.9 L 115.5,116.3 L 116.9,116.4 L 120.7,114.2 L 121,112.4 L 122.6,111.9 L 125.7,106.6 L 125.6,103.8 L 124.7,102.7 L 125.7,101.7 L 125.7,101.6 L 125.9,100.7 L 124.9,98.8 L 123.3,98.5 L 121.7,96.7 L 120.3,97.2 L 116.6,94.7 L 115.8,90.5 L 114.5,89.8 L 109,92.7 L 107.5,92.7 L 107.5,91.2 L 105.8,90.4 L 104.9,87.4 L 103.5,87.3 L 103.2,88.6 L 98.6,88.6 L 95.2,90.3 L 94,89.4 L 92.8,90.2 L 91.1,88.4 L 86.8,88 L 86.8,94 z "
-        ,"name":"Pays de la Loire"},
-      "9":{"path":"M 172.4,106.7 L 172.2,103.8 L 168.9,100.1 L 163.3,101.4 L 158.7,101.1 L 160,100.3 L 160.3,98.9 L 158.2,96.8 L 157.9,95.3 L 156,95 L 154.6,95.9 L 153.9,94.5 L 152.9,95.9 L 149.5,96.3 L 149.4,96.3 L 148,91 L 146.5,91.4 L 145.3,90.3 L 144.7,87.5 L 141.7,84.8 L 141.4,79.3 L 139.6,76 L 136.6,79.5 L 136.7,80.9 L 133.7,81.5 L 132.3,80.7 L 129.6,82.3 L 126.7,82.9 L 125.5,84.2 L 125.5,85.8 L 127.9,88 L 127.8,90.2 L 128.1,92.5 L 124.3,95.1 L 124.8,98.8 L 124.9,98.8 L 125.9,100.7 L 125.7,101.6 L 125.7,101.7 L 124.7,102.7 L 125.6,103.8 L 125.7,106.6 L 122.6,111.9 L 121,112.4 L 120.7,114.2 L 116.9,116.4 L 115.5,116.3 L 115.7,117.9 L 112.7,116.6 L 112.3,117.8 L 111.4,122.5 L 108.6,130.1 L 108.6,130.2 L 111.3,131.8 L 111.4,133.4 L 112.9,133.2 L 113.6,136.3 L 115,137 L 120,136.8 L 119.2,135.3 L 121.9,136.8 L 122,138.4 L 126.6,144.9 L 126.2,147.8 L 128.6,150 L 130,150 L 131.3,152.7 L 132.6,153.3 L 131.8,154.7 L 133.1,155.3 L 136,154.7 L 136.8,156 L 138.3,154.5 L 144,154 L 144.9,152.7 L 151.5,154.1 L 152.9,153.7 L 155.4,153.8 L 155.3,153.7 L 157.1,150.8 L 161.5,150.3 L 162.3,149.1 L 161.5,146.4 L 162.6,145.5 L 166.8,144 L 169.2,142.2 L 171.2,142.2 L 172,134.8 L 170.9,133.8 L 170.8,130.9 L 169.2,127.1 L 167.8,126 L 168.7,123.1 L 167.7,119.9 L 168.4,118.7 L 169.9,118.3 L 168.7,114.9 L 167.2,113.5 L 169.9,111.8 L 170.7,110.6 L 170.1,109.2 L 172.4,106.7 z "
-        ,"name":"Centre-Val-de-loire"},
-      "10":{"path":"M 170.9,94.5 L 170.8,97.4 L 168.9,100.1 L 172.2,103.8 L 172.4,106.7 L 170.1,109.2 L 170.7,110.6 L 169.9,111.8 L 167.2,113.5 L 168.7,114.9 L 169.9,118.3 L 168.4,118.7 L 167.7,119.9 L 168.7,123.1 L 167.8,126 L 169.2,127.1 L 170.8,130.9 L 170.9,133.8 L 172,134.8 L 171.2,142.2 L 174.1,145.3 L 177.3,145.4 L 178.7,144.6 L 180.9,146.4 L 183.9,143.4 L 187.2,150.2 L 191.1,151.7 L 192,152.8 L 191.7,155.6 L 189.9,157.9 L 189.9,159.4 L 192.4,161 L 196.4,160.3 L 197.5,161.3 L 200.3,159.4 L 200.5,157.9 L 201.7,157 L 202.7,157.8 L 203.9,157 L 205.1,157.8 L 205.9,156.7 L 208.8,160.5 L 211.7,150 L 214.6,150.8 L 217.3,150.2 L 219.8,151.8 L 221.9,155.7 L 223.4,155.7 L 223.4,157.2 L 224.9,157.1 L 226.9,154.9 L 228.5,155.7 L 228.7,157.1 L 230.7,157 L 233.4,155.4 L 235.8,152.1 L 235.7,152 L 237.5,146 L 243.3,140.6 L 242.9,135.8 L 247.2,132.8 L 253.1,125.6 L 253,124.1 L 254.1,123.1 L 252,121.3 L 252.4,119.8 L 252.5,119.7 L 254.3,117.7 L 254.5,117.7 L 254.5,117.6 L 256.4,117.4 L 255.4,114.8 L 254,114.9 L 253.8,110.4 L 250,107.9 L 249.5,108.2 L 245.3,104.9 L 242.7,106 L 240.3,104.2 L 237.4,105 L 233.9,102.9 L 229.9,105.8 L 230,106.5 L 228.9,108.1 L 227.4,107.9 L 226.4,109.1 L 226.2,113.3 L 224.7,113.8 L 223.6,112.9 L 220.3,114.8 L 219.7,116.1 L 217.3,117 L 217.3,115.6 L 215.8,114.8 L 211.2,113.8 L 210.1,111.4 L 211.5,110.2 L 210.9,108.7 L 210.1,107.6 L 208.6,107.4 L 208.8,106 L 207.5,105.5 L 207.2,104.1 L 205.4,103.8 L 203.5,103.5 L 201.2,105.5 L 198.1,105.9 L 197,106.9 L 195.5,106.2 L 189.2,107 L 186.7,101.6 L 184.9,99.5 L 183.9,100.6 L 182.7,96.5 L 180.5,93.7 L 178.6,93 L 170.9,94.5 z  "
-        ,"name":"Bourgogne-Franche-Comté"},
-      "11":{"path":"M 166.8,144 L 162.6,145.5 L 161.5,146.4 L 162.3,149.1 L 161.5,150.3 L 157.1,150.8 L 155.3,153.7 L 155.4,153.8 L 155.9,155.7 C 157.2,156.5 158.4,157.3 159.6,158.2 L 161.4,162.3 L 161.2,164.4 L 162.3,167.7 L 157.6,172 L 159.9,174.8 L 160.5,177.6 L 159.6,178.8 L 160.6,185.7 L 157.5,184.7 L 157.1,186.5 L 153.3,191.2 L 154.3,192.3 L 153.1,193.3 L 153,195 L 151.4,195.6 L 152.2,197.3 L 150.5,198.2 L 151,200.9 L 152.9,203.9 L 152,206.8 L 153.7,209.3 L 156.3,207.7 L 159.4,208.5 L 161.3,206.1 L 162.8,201.5 L 165.2,199.4 L 167.8,201.4 L 168.4,203.5 L 169.6,204.3 L 169.4,205.8 L 170.7,208.4 L 174.1,200.4 L 175,201.6 L 178.9,198.2 L 180,199.1 L 180.8,201.9 L 184,202.5 L 184.1,201.1 L 185.5,201.2 L 190,205.1 L 191,209.6 L 194.5,216.7 L 198.4,219.2 L 201.9,217 L 202,218.6 L 203.3,217.5 L 204.6,217.5 L 207.7,219.2 L 207.6,217.4 L 210.5,217.7 L 212.3,219.8 L 216.6,217.9 L 217.8,218.6 L 219.1,217.5 L 219.3,220.4 L 224,220.8 L 224.1,222.2 L 226.7,223.4 L 228.8,221 L 230,220.9 L 230.5,220.8 L 230.6,218.5 L 225.6,215.6 L 224.8,214.3 L 226.4,211.8 L 228.5,212.5 L 229.8,211.2 L 228.3,210.1 L 229.5,206.7 L 232.4,206.5 L 232.6,204.9 L 233,203.3 L 235.8,202.7 L 236.2,201.3 L 242.5,199.4 L 244.1,199.9 L 244.3,197 L 242.1,195.5 L 241.2,193.4 L 242,191.5 L 245.9,193.2 L 246.9,192.2 L 249.9,191.6 L 249.9,191.6 L 259.6,187.5 L 260.6,185.6 L 259.9,184.3 L 261.4,181.7 L 257.7,179.2 L 256.6,176.4 L 256.9,174.9 L 254.2,173.7 L 252.7,172.4 L 252.5,170.9 L 252.5,170.8 L 252.6,170.7 L 256.7,166.7 L 257.2,165.2 L 255.5,162.9 L 251.6,159.2 L 252.8,156.1 L 250.9,153.4 L 251.1,152 L 249.5,151.7 L 245.2,151.9 L 242.7,154 L 241,153.3 L 239.6,156.2 L 240.8,157.7 L 237.3,160.4 L 233.8,160.9 L 234.1,158.3 L 236.9,156.6 L 237.5,153.1 L 235.8,152.1 L 233.4,155.4 L 230.7,157 L 228.7,157.1 L 228.5,155.7 L 226.9,154.9 L 224.9,157.1 L 223.4,157.2 L 223.4,155.7 L 221.9,155.7 L 219.8,151.8 L 217.3,150.2 L 214.6,150.8 L 211.7,150 L 208.8,160.5 L 205.9,156.7 L 205.1,157.8 L 203.9,157 L 202.7,157.8 L 201.7,157 L 200.5,157.9 L 200.3,159.4 L 197.5,161.3 L 196.4,160.3 L 192.4,161 L 189.9,159.4 L 189.9,157.9 L 191.7,155.6 L 192,152.8 L 191.1,151.7 L 187.2,150.2 L 183.9,143.4 L 180.9,146.4 L 178.7,144.6 L 177.3,145.4 L 174.1,145.3 L 171.2,142.2 L 169.2,142.2 L 166.8,144 z M 216.9,215.5 L 215.7,217.2 L 213.7,217.8 L 212.7,216.7 L 213.3,215.2 L 214.6,214.1 L 216.9,215.5 z  "
-        ,"name":"Auvergne-Rhône-Alpes"},
-      "12":{"path":"M 79.4,172.2 L 80,174.4 L 83.9,176.8 L 89.1,182.4 L 90.2,186.1 L 90.2,186.2 L 90.5,187.6 L 89.4,189.2 L 88.1,185.3 L 82.8,180.1 L 82.3,178.7 L 80.9,181.5 L 77.8,206.6 L 79.8,202.7 L 82,205.3 L 82.1,206.7 L 78.9,206.3 L 77.3,209.7 L 77.3,212.1 L 71.9,237.1 L 69.9,240.6 L 67.6,243.8 L 64.5,246.1 L 67.4,247.5 L 67.6,249 L 68.8,248 L 72,248.6 L 72.8,250.1 L 71.8,253 L 70.5,254.2 L 71.1,255.6 L 73.1,256.1 L 73.3,254.3 L 74.8,253.8 L 74.9,255.5 L 77.9,257.1 L 82.7,258.9 L 85.8,258.8 L 87.1,261.1 L 91,264.4 L 92.2,263.5 L 93.4,264.2 L 96.3,262.7 L 96.4,262.7 L 97,258.4 L 97.8,257 L 99.5,256.6 L 99.3,255.1 L 103.3,250.5 L 102.9,248.9 L 104.2,248.2 L 104,244.6 L 102.6,244.6 L 103.3,243.2 L 102.1,240.3 L 102,240.3 L 98.7,240.2 L 98,238.8 L 100.1,233.3 L 99.8,230.1 L 104.5,228.7 L 104.8,230.2 L 106.1,229.6 L 106.2,228.1 L 106.2,228.1 L 108.1,228.5 L 108.8,227.2 L 113,227.5 L 115.5,226.1 L 119.8,226.6 L 121.1,226 L 122.9,223.6 L 124.3,223.7 L 123.6,222.3 L 125.8,219.6 L 124.6,218.9 L 124.6,217.4 L 128.3,216.4 L 127.1,211.9 L 128.8,210.3 L 131.1,207.1 L 134.1,205.4 L 133.8,203.6 L 136.1,202 L 137.1,196.8 L 141.1,196.4 L 144.5,199.5 L 147.1,198.1 L 150.5,198.2 L 152.2,197.3 L 151.4,195.6 L 153,195 L 153.1,193.3 L 154.3,192.3 L 153.3,191.2 L 157.1,186.5 L 157.5,184.7 L 160.6,185.7 L 159.6,178.8 L 160.5,177.6 L 159.9,174.8 L 157.6,172 L 162.3,167.7 L 161.2,164.4 L 161.4,162.3 L 159.6,158.2 C 158.4,157.3 157.2,156.5 155.9,155.7 L 155.4,153.8 L 152.9,153.7 L 151.5,154.1 L 144.9,152.7 L 144,154 L 138.3,154.5 L 136.8,156 L 136,154.7 L 133.1,155.3 L 131.8,154.7 L 132.6,153.3 L 131.3,152.7 L 130,150 L 128.6,150 L 126.2,147.8 L 126.6,144.9 L 122,138.4 L 121.9,136.8 L 119.2,135.3 L 120,136.8 L 115,137 L 113.6,136.3 L 112.9,133.2 L 111.4,133.4 L 111.3,131.8 L 108.6,130.2 L 105.2,133.1 L 104.1,132 L 99.3,132.1 L 96.5,132.5 L 94.6,134.9 L 88.5,135.3 L 89.6,138.1 L 91.7,140.2 L 94.1,149.2 L 94,152.8 L 95.2,153.8 L 90.7,156.1 L 89.5,155.2 L 86.3,155.3 L 87,153.9 L 82.6,155.6 L 80.3,160.4 L 81.7,160.8 L 83.8,164.8 L 82.4,165.1 L 83.2,167.7 L 81.7,170.7 L 79.4,172.2 z M 101.9,249 L 102,250.4 L 100.8,249.6 L 101.9,249 z M 74.2,157.2 L 74.2,157.1 L 74.7,158.3 L 75.3,158.2 L 77.6,160.2 L 79,159.5 L 76.3,157.8 L 76.3,157.8 L 74.2,157.2 z M 79.9,165.8 L 77.3,164.2 L 76.4,165.5 L 79.7,171.1 L 80.3,169.5 L 79.9,165.8 z "
-        ,"name":"Nouvelle-Aquitaine"},
-      "13":{"path":"M 242,191.5 L 241.2,193.4 L 242.1,195.5 L 244.3,197 L 244.1,199.9 L 242.5,199.4 L 236.2,201.3 L 235.8,202.7 L 233,203.3 L 232.6,204.9 L 232.4,206.5 L 229.5,206.7 L 228.3,210.1 L 229.8,211.2 L 228.5,212.5 L 226.4,211.8 L 224.8,214.3 L 225.6,215.6 L 230.6,218.5 L 230.5,220.8 L 230,220.9 L 228.8,221 L 226.7,223.4 L 224.1,222.2 L 224,220.8 L 219.3,220.4 L 219.1,217.5 L 217.8,218.6 L 216.6,217.9 L 212.3,219.8 L 210.5,217.7 L 207.6,217.4 L 207.7,219.2 L 209,221.4 L 209,224.2 L 212.2,227.4 L 208,232 L 207,237.2 L 205.4,236.8 L 203.3,239.2 L 203.8,240.5 L 200.9,241.4 L 199,244.4 L 206.1,244.6 L 207.1,245.8 L 206.9,247.2 L 208.7,247.6 L 213.6,247.1 L 212.5,245.9 L 213.1,244.7 L 214.5,244.8 L 216.8,247.5 L 223.4,246.8 L 225.3,251.2 L 230.2,252.4 L 231.6,252 L 234.7,253.8 L 234.6,255.2 L 239,253.9 L 242,254.7 L 242.6,256.1 L 243.6,253.4 L 247.3,254 L 247.3,252.6 L 250.1,251.9 L 251.5,250.7 L 253.4,250.9 L 254.5,248.2 L 252.7,247.3 L 255.8,243.3 L 258.5,242.9 L 260.7,239.1 L 263.5,237.7 L 264.1,235.7 L 271.3,231.7 L 271.5,228.1 L 274.6,223.8 L 275.7,221.6 L 273.7,219 L 267.7,221.1 L 263.1,218.7 L 259.9,218 L 256.8,214.3 L 257.8,211.8 L 255.8,209.1 L 256.9,208.2 L 257.6,205.2 L 257.6,205.2 L 257.7,205.1 L 258.6,204 L 260.4,204.1 L 258.5,199.4 L 255.5,199.2 L 252.9,197.6 L 252.5,194.3 L 251.1,194.2 L 249.9,191.6 L 246.9,192.2 L 245.9,193.2 L 242,191.5 z M 218.4,241.8 L 219.5,243.8 L 221.1,243.1 L 220,245 L 218.4,245.6 L 216.1,243.4 L 216.4,241.8 L 218.4,241.8 z M215.7,217.2l1.2-1.7l-2.3-1.4l-1.3,1.1l-0.6,1.5l1,1.1L215.7,217.2z "
-        ,"name":"Provence-Alpes-Côte d'Azur"},
-      "14":{"path":"M 280.3,246.2 L 279.4,241.7 L 277.9,241.1 L 276.8,242.1 L 277,250.8 L 272.7,250.2 L 270.9,252.6 L 265.6,254.7 L 265.2,256.2 L 263.8,256.3 L 262.7,257.7 L 262.8,259.4 L 260.9,261.9 L 260.6,263.4 L 261.9,262.9 L 263.8,265 L 261.2,266.9 L 261.7,269.6 L 265.6,271.8 L 264.4,272.6 L 262.9,276.8 L 266.4,275.5 L 266.9,278.4 L 265.6,281.9 L 270.4,282.9 L 267.9,284.6 L 267.8,286 L 270.2,288.2 L 275.8,289.9 L 276.4,291.3 L 277.9,291.9 L 280.9,284.6 L 279.2,284.4 L 280.5,283.4 L 281.6,280.7 L 281.2,273.3 L 283.9,267.4 L 282,254.3 L 279.9,251.5 L 280.3,246.2 z "
-        ,"name":"Corse"},
-      "15":{"path":"M 141.1,196.4 L 137.1,196.8 L 136.1,202 L 133.8,203.6 L 134.1,205.4 L 131.1,207.1 L 128.8,210.3 L 127.1,211.9 L 128.3,216.4 L 124.6,217.4 L 124.6,218.9 L 125.8,219.6 L 123.6,222.3 L 124.3,223.7 L 122.9,223.6 L 121.1,226 L 119.8,226.6 L 115.5,226.1 L 113,227.5 L 108.8,227.2 L 108.1,228.5 L 106.2,228.1 L 106.2,228.1 L 106.1,229.6 L 104.8,230.2 L 104.5,228.7 L 99.8,230.1 L 100.1,233.3 L 98,238.8 L 98.7,240.2 L 102,240.3 L 102.1,240.3 L 103.3,243.2 L 102.6,244.6 L 104,244.6 L 104.2,248.2 L 102.9,248.9 L 103.3,250.5 L 99.3,255.1 L 99.5,256.6 L 97.8,257 L 97,258.4 L 96.4,262.7 L 102,267.7 L 108.1,266.9 L 109.3,267.9 L 117.4,268 L 118.5,266.9 L 118.4,263.6 L 119.6,263 L 127.9,265.4 L 130.3,267.6 L 133.5,267.4 L 136.3,271.2 L 136.9,269.7 L 138.6,269.6 L 143.8,272.2 L 142.9,274.6 L 147.3,275.9 L 148.5,278.7 L 150.1,278.8 L 152.3,276.8 L 153.9,276.8 L 158.6,277.8 L 160.9,279.6 L 164,279.4 L 164,277.9 L 168.1,275.8 L 171.2,275.2 L 175.5,276.4 L 172.6,272.8 L 172.7,259.1 L 175.5,253.7 L 176.8,252.4 L 176.8,252.4 L 179.5,250.4 L 182.9,250.4 L 186.2,246.7 L 191.7,242.7 L 195.9,241.6 L 197.4,244 L 198.9,244.4 L 199,244.4 L 200.9,241.4 L 203.8,240.5 L 203.3,239.2 L 205.4,236.8 L 207,237.2 L 208,232 L 212.2,227.4 L 209,224.2 L 209,221.4 L 207.7,219.2 L 204.6,217.5 L 203.3,217.5 L 202,218.6 L 201.9,217 L 198.4,219.2 L 194.5,216.7 L 191,209.6 L 190,205.1 L 185.5,201.2 L 184.1,201.1 L 184,202.5 L 180.8,201.9 L 180,199.1 L 178.9,198.2 L 175,201.6 L 174.1,200.4 L 170.7,208.4 L 169.4,205.8 L 169.6,204.3 L 168.4,203.5 L 167.8,201.4 L 165.2,199.4 L 162.8,201.5 L 161.3,206.1 L 159.4,208.5 L 156.3,207.7 L 153.7,209.3 L 152,206.8 L 152.9,203.9 L 151,200.9 L 150.5,198.2 L 147.1,198.1 L 144.5,199.5 L 141.1,196.4 z M102,250.4l-0.1-1.4l-1.1,0.6L102,250.4z "
-        ,"name":"Occitanie"}
-    }
-  });
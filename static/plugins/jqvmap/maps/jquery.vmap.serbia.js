@@ -1,6 +0,0 @@
-/*
- * Map of Serbia
- * @author: Đorđe Jocić <http://www.djordjejocic.com/>
- * @source: https://upload.wikimedia.org/wikipedia/commons/2/29/Serbia_location_map_%28with_Kosovo%29.svg
- */
-jQuery.fn.vectorMap("addMap", "serbia", { "width" : 1041, "height" : 726, paths : { "1" : { path : "m 81.383968,195.26246 c -1.823902,-2.05385 -3.527788,-2.48647 -7.350116,-1.86619 -3.243695,0.52638 -4.97581,0.25634 -4.97581,-0.77574 0,-0.87077 -0.867873,-1.58321 -1.928607,-1.58321 -1.060735,0 -2.676438,-0.90108 -3.590451,-2.00239 -1.329163,-1.60155 -1.083213,-2.31208 1.228596,-3.54932 1.939672,-1.03808 2.89044,-2.93576 2.89044,-5.76916 0,-3.50736 -0.835116,-4.57118 -4.932351,-6.28312 -2.712792,-1.13347 -6.177847,-3.30636 -7.700122,-4.82864 -3.493756,-3.49375 -5.095129,-3.48667 -7.292746,0.0323 -2.274158,3.6415 -6.675203,3.68737 -6.675203,0.0696 0,-1.50176 -0.947575,-3.26076 -2.105722,-3.90889 -1.767308,-0.98904 -1.823558,-1.78596 -0.350006,-4.95873 0.965644,-2.07916 2.616708,-3.78521 3.66903,-3.79122 1.222386,-0.007 1.648896,-1.02207 1.181087,-2.81097 -0.481493,-1.84123 -0.04295,-2.80004 1.280675,-2.80004 2.859541,0 3.819238,-3.46074 1.935677,-6.98021 -1.034084,-1.9322 -1.129416,-3.58959 -0.268009,-4.65947 0.735334,-0.91329 1.386069,-4.65308 1.446076,-8.31064 0.102944,-6.27442 -0.105505,-6.66264 -3.689856,-6.87193 -2.08943,-0.122 -4.954049,-0.12012 -6.365821,0.004 -1.411771,0.12431 -3.616806,-0.38672 -4.900077,-1.13562 -2.159425,-1.26022 -2.154392,-1.36482 0.06756,-1.40422 3.240997,-0.0575 5.562276,-4.78812 5.033215,-10.25742 -0.360048,-3.72209 -1.089069,-4.56078 -4.283945,-4.92839 -4.498279,-0.51758 -5.072381,-2.41084 -1.050017,-3.46271 3.148018,-0.82323 3.712813,-5.066916 1.050017,-7.88948 -1.400022,-1.484023 -1.400022,-1.983365 0,-2.496705 0.962515,-0.352924 1.750028,-1.743748 1.750028,-3.090722 0,-2.173398 0.901753,-2.326671 8.011908,-1.361803 4.406551,0.597982 8.344113,0.751553 8.750139,0.341268 0.406028,-0.410283 0.738231,-2.422513 0.738231,-4.471622 0,-3.387082 0.545066,-3.764986 5.997993,-4.158496 l 5.997994,-0.432843 -0.90488,-4.823417 c -0.632567,-3.371879 -0.207157,-5.888274 1.413629,-8.361907 2.668451,-4.072569 4.995542,-3.396732 4.995542,1.450812 0,4.644893 1.63622,5.266505 13.499039,5.128383 12.912352,-0.150342 16.123706,1.035628 20.062856,7.409306 2.54071,4.110946 2.79388,5.429681 1.37144,7.143614 -1.34036,1.61504 -1.37247,2.918411 -0.13861,5.626433 0.88322,1.938458 1.60585,5.93559 1.60585,8.882509 0,4.49765 0.99322,6.3206 6.18518,11.35226 3.65722,3.54431 6.52483,7.76481 7.01621,10.32633 0.56123,2.92564 2.46374,5.38985 5.85995,7.59005 l 5.02892,3.25793 3.00511,-2.80244 c 2.93321,-2.7354 3.0812,-2.7404 6.18525,-0.20911 1.86039,1.5171 2.58665,2.96015 1.75003,3.4772 -2.40765,1.48802 -1.58952,6.07942 1.2435,6.97859 5.85103,1.85704 6.23198,4.47541 1.50665,10.35546 -3.67212,4.56945 -4.28872,6.30405 -3.50667,9.86471 0.81733,3.72129 0.55434,4.32034 -1.89669,4.32034 -1.87586,0 -3.63801,1.66988 -5.17084,4.90008 -2.50374,5.27624 -3.48321,5.70666 -7.76796,3.41353 -3.94025,-2.10876 -11.0385,1.17311 -11.0385,5.10364 0,1.80138 -1.40628,3.57431 -3.64373,4.59376 -3.17851,1.44823 -3.57738,2.35595 -3.12405,7.1095 0.49976,5.2405 0.34434,5.46976 -4.0564,5.98352 -2.51684,0.29383 -4.576068,0.0732 -4.576068,-0.49032 0,-1.79731 -5.906301,-2.98306 -6.89449,-1.38414 -1.810947,2.93017 -9.043306,3.05257 -11.580074,0.19597 z", name : "Западна Бачка" }, "2" : { path : "m 156.11128,153.54035 c -4.69128,-2.21669 -6.82217,-3.90406 -5.75956,-4.56079 2.8389,-1.75454 0.30363,-8.1903 -3.61377,-9.1735 -3.62269,-0.90924 -4.47918,-2.58604 -2.07871,-4.06962 2.64652,-1.63563 1.39262,-4.6298 -3.14097,-7.50026 -4.07353,-2.57918 -4.86045,-2.66585 -7.64405,-0.84196 -2.46648,1.61609 -3.83257,1.7008 -6.65918,0.41291 -3.23275,-1.47294 -4.18524,-3.40427 -3.72306,-7.54912 0.0906,-0.81301 -2.98474,-4.49665 -6.83423,-8.18586 -5.8145,-5.57241 -7.01572,-7.57324 -7.09746,-11.822 -0.0541,-2.812893 -0.60627,-6.37437 -1.227,-7.914395 -0.62278,-1.545102 -0.54132,-3.536818 0.18174,-4.443946 1.69083,-2.12123 -0.0728,-11.648795 -2.1622,-11.680503 -0.87682,-0.0133 -3.02859,-2.060838 -4.7817,-4.550072 l -3.187487,-4.525879 3.755687,-3.026621 c 2.7491,-2.215437 4.96352,-2.830617 8.26226,-2.295304 3.76926,0.611665 5.45148,-0.122348 10.28197,-4.486407 3.17647,-2.869746 5.77539,-5.972741 5.77539,-6.895543 0,-0.922802 2.20504,-2.729331 4.90008,-4.014506 5.09017,-2.427332 6.09392,-4.828206 3.22005,-7.70207 -1.30668,-1.306688 -1.19935,-1.680027 0.48303,-1.680027 1.18968,0 3.2444,-1.194881 4.56605,-2.65529 1.83731,-2.030202 3.65837,-2.486911 7.73561,-1.940039 3.16448,0.424447 5.72459,0.08099 6.29674,-0.844765 1.85595,-3.003006 8.78899,-1.666427 13.32231,2.56833 2.43068,2.270591 5.80486,4.552732 7.49818,5.071425 1.69332,0.518693 3.86312,1.570505 4.82178,2.337362 1.20062,0.9604 2.87058,0.655482 5.36642,-0.979855 3.43037,-2.247666 3.72669,-2.237843 5.56257,0.184397 2.49419,3.290814 2.47993,3.940839 -0.13405,6.110247 -1.49939,1.244381 -1.88827,3.042102 -1.26848,5.863984 0.91492,4.165571 -1.54395,12.284649 -3.72041,12.284649 -2.71457,0 -5.57227,10.525781 -4.93475,18.176116 0.53917,6.470088 0.1633,8.241909 -2.31487,10.912126 -2.91734,3.143431 -2.92223,3.249327 -0.35043,7.603026 1.43446,2.42835 3.01702,6.34891 3.5168,8.71235 0.56274,2.6612 1.68074,4.16983 2.93662,3.9627 1.11537,-0.18396 2.86992,1.56769 3.899,3.89255 2.42167,5.47092 0.63085,7.72769 -6.93775,8.74285 -3.13223,0.42012 -6.08056,1.14945 -6.55183,1.62073 -0.83951,0.8395 -1.8573,7.50231 -1.8791,12.30119 -0.006,1.33236 -0.60093,2.78707 -1.32194,3.23268 -0.72101,0.44561 -1.31094,2.87693 -1.31094,5.40293 0,7.12551 -4.36667,8.37875 -13.74836,3.94578 z", name : "Северна Бачка" }, "3" : { path : "m 270.27719,158.19471 c -2.97345,-2.17424 -3.09633,-3.55797 -0.31596,-3.55797 1.15502,0 2.10004,-1.13401 2.10004,-2.52004 0,-3.0977 2.62067,-5.88009 5.53833,-5.88009 3.24993,0 6.41793,-7.90221 4.22655,-10.54266 -0.93918,-1.13165 -2.45879,-2.05754 -3.37691,-2.05754 -1.97313,0 -6.38797,-8.71674 -6.38797,-12.61253 0,-2.57469 -0.89057,-2.68455 -16.95907,-2.09217 -9.79779,0.36121 -17.77879,1.30552 -18.9003,2.23629 -2.23264,1.85293 -2.62785,6.86832 -0.54121,6.86832 2.02061,0 1.7258,3.8535 -0.35001,4.57501 -0.96251,0.33456 -3.53089,-0.87296 -5.7075,-2.68337 -2.86016,-2.37896 -5.70009,-3.29166 -10.2422,-3.29166 -3.4566,0 -7.47818,-0.63872 -8.93685,-1.41937 -1.45867,-0.78066 -6.29512,-1.67679 -10.74768,-1.99141 -5.45991,-0.3858 -8.11784,-1.17715 -8.16402,-2.43069 -0.12405,-3.36757 -3.86597,-9.55877 -5.77726,-9.55877 -1.03142,0 -1.8753,-0.92979 -1.8753,-2.0662 0,-1.13641 -1.25767,-4.12895 -2.79482,-6.6501 -3.49323,-5.729439 -3.48458,-6.279659 0.11679,-7.422688 2.6779,-0.849932 2.84252,-1.6128 1.97009,-9.129728 -1.059,-9.124386 1.08538,-18.131978 4.31657,-18.131978 1.0953,0 1.99145,-1.222838 1.99145,-2.717419 0,-1.494581 0.70201,-3.151284 1.56002,-3.681563 0.92813,-0.573613 1.26861,-3.136781 0.84058,-6.327959 -0.48611,-3.624225 -0.0839,-5.891231 1.24003,-6.99003 2.57874,-2.140167 2.493,-6.097804 -0.18017,-8.316342 -1.85407,-1.538741 -1.43365,-2.209778 3.15005,-5.027809 3.26173,-2.005296 7.53349,-3.268819 11.14241,-3.295762 5.01948,-0.03747 5.91641,0.404772 6.3001,3.106356 0.58335,4.107479 7.84773,5.268715 10.47581,1.674596 1.64065,-2.243724 2.01367,-2.253645 5.24046,-0.139372 2.17462,1.424865 4.95563,1.979992 7.43497,1.484123 2.91555,-0.583109 4.65629,-0.02379 6.59575,2.119301 1.44917,1.601314 3.23445,2.91148 3.96729,2.91148 0.73284,0 4.32757,3.190214 7.98829,7.089363 6.0492,6.443207 9.84562,14.136688 9.84562,19.952246 0,3.626909 8.76498,9.358969 14.31095,9.358969 5.58759,0 7.02349,1.322535 9.37858,8.638149 2.22708,6.917964 4.42858,8.580365 9.04069,6.826841 3.31819,-1.261571 3.67035,-1.078269 3.67035,1.910419 0,2.394165 1.33498,3.939367 4.84061,5.602907 6.68155,3.1706 7.69529,5.23019 7.77827,15.80292 0.0133,1.69436 0.6513,3.46825 1.41779,3.94196 0.86535,0.53482 0.59189,2.00591 -0.72144,3.88096 -1.16328,1.66081 -2.11505,4.81777 -2.11505,7.01547 0,3.70444 -0.35301,3.96541 -4.8411,3.57873 -3.81304,-0.32851 -5.92799,0.54518 -9.95927,4.11421 -5.18282,4.58852 -5.33867,5.3632 -2.73696,13.60475 0.81614,2.58534 0.36448,2.77446 -5.51008,2.30724 -3.62912,-0.28864 -8.67646,0.40228 -11.66021,1.59614 -4.27772,1.7116 -5.7127,1.77487 -7.6771,0.33847 z", name : "Северни Банат" }, "4" : { path : "m 140.46136,260.78201 c -2.69384,-0.77215 -5.24516,-1.96581 -5.6696,-2.65256 -0.42444,-0.68676 -3.04515,-1.4157 -5.82381,-1.61987 -4.41211,-0.3242 -5.14148,-0.90328 -5.7577,-4.57129 -1.84156,-10.96187 -2.41936,-11.4224 -15.34277,-12.22866 -9.648251,-0.60193 -13.97112,-1.70023 -23.562717,-5.98649 -13.179998,-5.88983 -16.646743,-8.38936 -16.646743,-12.00231 0,-3.85303 -3.942665,-6.88313 -8.956102,-6.88313 -2.952184,0 -5.627636,-1.14067 -7.600121,-3.24028 -3.947771,-4.20221 -3.8567,-4.64732 1.155979,-5.64986 3.249004,-0.6498 4.200066,-1.59136 4.200066,-4.15808 0,-1.82494 -1.26002,-4.45838 -2.800044,-5.85208 -1.753236,-1.58666 -2.739329,-4.15395 -2.63764,-6.86709 0.08932,-2.3832 0.423662,-3.37004 0.742978,-2.19299 0.319315,1.17706 1.905691,2.96766 3.52528,3.97911 2.440067,1.52384 3.170743,1.51698 4.263685,-0.0401 1.029267,-1.46634 1.474949,-1.49468 2.029072,-0.12904 0.390553,0.96251 1.622382,1.75003 2.737399,1.75003 1.115017,0 2.405715,0.98611 2.868215,2.19137 0.545199,1.42077 2.375961,2.10937 5.206143,1.95819 6.826192,-0.36465 7.86529,-0.0915 7.86529,2.06791 0,1.10958 0.51053,2.33293 1.13451,2.71857 1.779056,1.09952 12.865713,-2.10888 12.865713,-3.72324 0,-0.79569 1.102517,-0.48058 2.450039,0.70025 1.813891,1.58951 4.085848,1.91301 8.750138,1.24591 l 6.3001,-0.90105 -0.43104,-5.80894 c -0.35928,-4.84183 0.0486,-5.96117 2.45004,-6.72336 1.79444,-0.56953 2.88108,-2.11417 2.88108,-4.0954 0,-4.47947 5.64575,-6.94272 9.58642,-4.18258 3.70723,2.59665 7.93769,0.30605 9.91606,-5.3691 0.85207,-2.44424 2.35863,-3.87891 4.07329,-3.87891 2.75757,0 5.32711,-5.80732 3.72007,-8.40757 -0.92285,-1.4932 2.21365,-6.99268 3.9881,-6.99268 0.66547,0 4.33143,1.56784 8.14658,3.48408 6.46376,3.24656 7.26501,3.34687 11.7535,1.47146 4.18531,-1.74873 4.81687,-2.65362 4.81687,-6.90151 0,-2.68889 0.62037,-5.2723 1.3786,-5.74091 0.75822,-0.46861 1.36551,-2.23832 1.34952,-3.93268 -0.0763,-8.07943 0.77917,-10.0165 4.972,-11.25878 2.31004,-0.68443 6.33986,-2.15071 8.95517,-3.25839 4.98674,-2.11206 19.02579,-1.36048 20.54642,1.09996 0.42027,0.68002 4.09437,1.23639 8.16465,1.23639 5.62249,0 8.00932,0.67273 9.93452,2.80005 2.11995,2.34252 2.184,2.80004 0.39199,2.80004 -2.73223,0 -4.49088,8.0917 -2.32569,10.7006 1.6384,1.97416 0.89103,2.40472 -3.39987,1.95868 -3.35623,-0.34889 -6.56662,2.44389 -6.56662,5.71244 0,1.75988 1.04107,2.66515 3.15005,2.73914 1.73252,0.0608 2.36253,0.4283 1.40002,0.81669 -4.24365,1.71234 -1.20165,7.88101 4.55007,9.22678 2.396,0.56061 2.17988,0.89246 -1.49766,2.29967 -4.19998,1.60713 -4.3018,1.86623 -4.47852,11.3957 -0.0994,5.36314 0.40981,9.75117 1.13166,9.75117 2.13145,0 6.94455,-4.66296 6.94455,-6.72791 0,-2.8577 2.84927,-1.35077 6.571,3.47528 l 3.31175,4.29442 -4.94137,2.34484 c -6.47145,3.07089 -6.65089,7.20992 -0.38756,8.9393 5.04576,1.39321 9.3786,1.34669 11.76189,-0.12626 0.89628,-0.55394 1.86759,0.18431 2.27071,1.72588 0.4055,1.55066 -0.1211,3.01068 -1.24085,3.44037 -2.19367,0.84179 -2.68208,5.03444 -0.58647,5.03444 0.78253,0 1.02663,2.37514 0.57556,5.60009 -0.68019,4.86287 -0.42902,5.60008 1.90787,5.60008 3.80086,0 4.64561,1.2975 2.78472,4.27725 -1.36024,2.17811 -0.82394,3.33715 3.47699,7.51416 6.20877,6.02988 7.67468,9.98699 4.87485,13.15932 -1.14059,1.29234 -2.51523,5.04174 -3.05474,8.33201 l -0.98092,5.9823 -4.56903,-4.01166 c -3.58532,-3.14795 -6.46798,-4.21014 -13.38903,-4.93353 -7.77672,-0.81283 -9.04723,-0.59746 -10.74103,1.82078 -2.28363,3.26034 -6.04447,2.30599 -6.04447,-1.53386 0,-1.48181 -0.89412,-3.03731 -1.98692,-3.45666 -2.79793,-1.07366 -9.21326,3.4643 -9.21326,6.5171 0,1.39958 -1.10251,2.8577 -2.45004,3.24028 -4.38528,1.24504 -23.93233,0.0169 -25.91457,-1.6282 -1.47416,-1.22345 -3.64723,-0.94946 -9.19815,1.15972 -7.91108,3.00597 -21.2671,3.50404 -29.63612,1.10517 z", name : "Јужна Бачка" }, "5" : { path : "m 262.43859,273.50349 c -2.09283,-1.94975 -2.80938,-3.78919 -2.21078,-5.6752 0.53245,-1.6776 -0.006,-3.77617 -1.35117,-5.26212 -2.56027,-2.82907 -1.7244,-10.2308 1.45316,-12.86794 1.06222,-0.88157 1.92896,-2.62822 1.92608,-3.88146 -0.007,-3.09361 -5.17218,-11.53 -8.87602,-14.49768 l -3.01894,-2.4189 3.13306,-0.0311 c 2.65178,-0.0263 3.07808,-0.70905 2.77517,-4.44431 -0.2178,-2.68574 -1.44417,-5.01478 -3.13306,-5.9501 -1.52634,-0.84529 -3.03798,-1.69472 -3.35919,-1.88759 -0.32122,-0.19288 -0.66605,-1.46398 -0.76629,-2.82466 -0.10025,-1.36069 -0.66213,-3.25041 -1.24863,-4.19939 -0.60646,-0.98127 -0.37895,-1.72541 0.52752,-1.72541 1.06155,0 1.27368,-1.51967 0.63514,-4.55007 -1.33145,-6.31889 -2.34404,-6.98968 -7.05546,-4.67389 -3.89798,1.91596 -11.80858,1.60113 -11.80858,-0.46997 0,-0.53206 2.52004,-2.07922 5.60009,-3.43814 3.08005,-1.35891 5.60009,-2.95036 5.60009,-3.53654 0,-0.58618 -2.42327,-3.69065 -5.38503,-6.89882 -5.02315,-5.44104 -11.17034,-7.79221 -11.59024,-4.43301 -0.0962,0.77001 -0.25376,1.97753 -0.35001,2.68337 -0.0962,0.70585 -0.58678,1.69513 -1.09006,2.19842 -0.50329,0.50328 -0.81829,-2.27858 -0.70001,-6.18191 0.13206,-4.35817 0.84662,-7.09756 1.85162,-7.0985 0.90011,-8.3e-4 3.57367,-1.10404 5.94124,-2.45156 6.56256,-3.73513 5.24207,-10.8394 -1.35818,-7.30705 -1.61611,0.86491 -3.99166,1.16406 -5.27901,0.66476 -2.10478,-0.81632 -2.05848,-1.11807 0.4594,-2.99441 2.7668,-2.06183 2.76778,-2.11051 0.0824,-4.10008 -1.49469,-1.10741 -3.2644,-2.01347 -3.93269,-2.01347 -0.66828,0 -0.82569,-0.63001 -0.3498,-1.40002 0.4759,-0.77001 2.92812,-1.40002 5.44938,-1.40002 5.94129,0 6.93544,-1.15187 4.37148,-5.06497 -2.41276,-3.68233 -1.46306,-7.51413 1.87911,-7.58181 5.79493,-0.11734 11.5539,-9.8373 6.85033,-11.56194 -1.38397,-0.50745 -1.36924,-1.04434 0.0704,-2.56671 2.13497,-2.25763 31.08008,-2.84608 31.08008,-0.63185 0,3.60909 6.03783,13.20226 8.80263,13.98602 3.04468,0.86309 3.02692,0.93619 -1.04061,4.28194 -3.07048,2.52563 -4.60567,3.01587 -5.95009,1.9001 -1.30441,-1.08256 -2.40015,-1.01559 -3.91196,0.23911 -2.79816,2.32226 -2.65509,5.13766 0.35,6.88797 2.15791,1.25686 2.17738,1.43209 0.16329,1.46959 -1.25771,0.0234 -2.6654,1.46009 -3.1282,3.19262 -1.27052,4.75631 2.65865,7.02414 10.31503,5.95361 5.21039,-0.72853 11.04438,-1.24397 22.90926,-2.02406 1.26365,-0.0831 0.6023,-6.11801 -1.10517,-10.08495 -0.66677,-1.5491 0.30161,-3.61578 2.95204,-6.3001 3.31358,-3.35595 4.89583,-3.92592 9.89442,-3.56426 l 5.9501,0.43051 0,-5.59797 c 0,-3.07887 0.63001,-5.98732 1.40002,-6.46322 0.77001,-0.47589 1.45684,-2.87561 1.52629,-5.33271 l 0.12626,-4.46744 1.29593,4.48114 c 1.69241,5.85216 2.31245,6.12521 10.84573,4.77628 l 7.22443,-1.14202 -0.25091,9.94252 c -0.17006,6.73875 -1.09915,11.46492 -2.88331,14.66712 -3.36316,6.03617 -2.93327,14.8701 0.7245,14.88795 3.00439,0.0147 5.14062,3.03179 5.17002,7.30193 0.0142,2.05633 -1.4052,3.85183 -4.17863,5.28603 -3.23851,1.6747 -4.20007,3.12526 -4.20007,6.33605 0,3.81484 0.40549,4.16412 4.83421,4.16412 7.17987,0 12.19675,2.66772 11.15997,5.93431 -1.02323,3.22393 2.95266,8.06591 6.62317,8.06591 1.42067,0 2.58305,0.95851 2.58305,2.13003 0,1.17151 3.15005,5.3134 7.00011,9.20419 3.85007,3.89079 7.00012,7.3138 7.00012,7.60669 0,0.29289 -2.18837,0.94306 -4.86301,1.44483 -2.67466,0.50177 -7.87023,3.05036 -11.54571,5.66353 -3.67549,2.61317 -7.47223,4.75122 -8.4372,4.75122 -2.12437,0 -2.33817,3.67409 -0.28756,4.94144 1.77099,1.09453 -3.22405,6.13028 -8.99931,9.07265 -2.21777,1.12991 -4.65956,3.43105 -5.42621,5.11366 -1.37648,3.02104 -1.47762,2.9931 -8.09171,-2.23504 -10.17159,-8.04017 -22.3034,-8.94635 -22.37185,-1.67105 -0.0173,1.83952 -0.25693,1.90682 -1.24349,0.34923 -0.67213,-1.06117 -1.87897,-1.5234 -2.68187,-1.02718 -0.80289,0.49621 -1.85553,0.26192 -2.33918,-0.52065 -1.63528,-2.64593 -3.64806,-1.44436 -5.66443,3.38148 -1.10406,2.64239 -2.69799,5.23116 -3.54206,5.75283 -0.84407,0.52166 -1.1731,2.38909 -0.73118,4.14984 0.54782,2.18268 0.0879,3.47595 -1.44542,4.06433 -1.42724,0.54769 -1.98201,1.88365 -1.51839,3.65653 1.00056,3.82615 -3.83597,7.05798 -9.01296,6.02258 -2.19623,-0.43924 -4.8331,-0.1015 -5.85972,0.7505 -1.41099,1.17102 -2.62234,0.84501 -4.963,-1.33565 l 0,0 z", name : "Средњи Банат" }, "6" : { path : "m 197.43148,376.34499 c -1.55471,-1.5547 0.46953,-3.30478 3.82248,-3.30478 1.77575,0 4.91233,-1.3244 6.97018,-2.9431 5.51048,-4.33454 2.68201,-6.85705 -7.6887,-6.85705 -7.7199,0 -8.58491,-0.35786 -15.31672,-6.33666 -6.90218,-6.13011 -7.35561,-6.30736 -13.91083,-5.43778 -6.03635,0.80075 -6.9563,0.56215 -8.42682,-2.18554 -2.45341,-4.58424 -0.37939,-16.11038 4.33882,-24.11248 2.22188,-3.76831 4.02352,-7.29626 4.00366,-7.83988 -0.0199,-0.54362 -2.3824,-2.04802 -5.25009,-3.34311 -5.20415,-2.35026 -13.69953,-2.51004 -21.76523,-0.40934 -2.47083,0.64352 -5.23997,0.33925 -7.39143,-0.81218 -2.94157,-1.57428 -3.76845,-1.51315 -5.70322,0.42162 -2.08378,2.08378 -2.49977,1.91037 -5.25687,-2.19135 -3.25815,-4.84714 -9.19791,-6.88233 -9.19791,-3.15155 0,1.20857 -0.94502,2.1974 -2.10003,2.1974 -1.15502,0 -2.10004,0.56118 -2.10004,1.24707 0,0.68588 -5.19758,1.10103 -11.55018,0.92255 -6.352603,-0.17847 -12.586549,0.19212 -13.853215,0.82355 -1.494314,0.74492 -2.90647,0.42096 -4.021487,-0.92255 -2.231995,-2.68939 -8.233458,-2.67035 -9.269454,0.0294 -0.443222,1.15501 -1.703242,2.10003 -2.800044,2.10003 -1.096803,0 -2.356823,0.94501 -2.800045,2.10003 -0.443222,1.15502 -1.348163,2.10004 -2.010979,2.10004 -2.580892,0 1.052054,-5.58042 5.704761,-8.76285 3.663815,-2.50603 4.800535,-4.20626 4.50553,-6.73908 -0.616286,-5.29123 -3.539584,-7.5139 -7.262148,-5.52165 -3.597543,1.92535 -5.330683,0.92012 -3.083011,-1.78816 2.698545,-3.25155 3.350273,-19.67286 0.962488,-24.2514 -2.938757,-5.63501 -2.733686,-6.06077 2.509385,-5.20994 4.019214,0.65223 5.223716,0.0782 9.100145,-4.3368 2.457284,-2.79869 4.467789,-5.62293 4.467789,-6.27608 0,-0.65316 2.588863,-0.29562 5.753031,0.79452 7.327955,2.52469 11.482904,1.40823 10.317974,-2.77251 -0.818763,-2.93839 -0.760002,-2.92999 1.80735,0.2585 1.91201,2.37458 4.57763,3.50585 9.53791,4.04784 3.78636,0.41371 7.38809,1.60822 8.00386,2.65446 1.45183,2.46676 5.05892,2.44816 6.01026,-0.031 0.8785,-2.28936 9.03889,-0.91411 12.7265,2.14477 2.91748,2.42005 24.68332,2.21346 33.73256,-0.32017 3.76857,-1.05514 6.622,-1.26153 6.8767,-0.49741 0.23944,0.71834 6.57794,1.27565 14.08557,1.23848 13.75294,-0.0681 19.95033,-1.74878 19.95033,-5.41033 0,-1.03365 0.98464,-2.69652 2.18807,-3.69529 1.91079,-1.58581 2.07519,-1.36619 1.29733,1.73307 -0.79226,3.15661 -0.37633,3.65303 3.76203,4.48992 3.69166,0.74655 5.12765,0.35965 6.95172,-1.87302 2.00985,-2.46006 3.26238,-2.68584 9.95993,-1.79539 6.07254,0.80736 8.84096,2.08776 13.35214,6.17541 6.35501,5.75837 8.68951,9.4046 8.68951,13.572 0,1.54699 1.16964,3.63594 2.5992,4.64211 5.72602,4.03019 5.39524,12.18923 -0.60502,14.92312 -1.95365,0.89014 -3.20518,2.17976 -2.78117,2.86581 0.424,0.68605 -0.17048,1.60861 -1.32108,2.05014 -2.51316,0.96439 -2.74654,5.27617 -0.41197,7.61076 1.30669,1.30668 1.09785,1.68002 -0.93977,1.68002 -1.44089,0 -3.74613,1.01931 -5.12274,2.26513 -1.37663,1.24582 -4.57628,2.68667 -7.11035,3.20189 -3.50277,0.71217 -4.72349,1.76349 -5.09157,4.38498 -0.26629,1.89652 -0.98257,4.07822 -1.59173,4.84824 -0.60918,0.77001 -1.54288,4.04017 -2.07492,7.26703 -0.75374,4.57158 -1.63562,5.96263 -3.99405,6.3001 -3.77386,0.53999 -4.85253,5.26846 -1.72377,7.55626 1.50004,1.09686 1.80321,2.03749 0.84712,2.62838 -0.81892,0.50612 -1.12475,2.37124 -0.67964,4.14472 0.58096,2.31477 0.0886,3.50374 -1.74489,4.21426 -2.44188,0.94623 -2.44476,1.07033 -0.0655,2.82234 2.27427,1.67475 2.0331,2.03394 -2.80004,4.17027 -7.90593,3.49454 -11.07882,5.5056 -15.21992,9.64669 -3.50843,3.50842 -8.7568,4.89638 -10.79768,2.85549 l -4e-5,0 z", name : "Срем" }, "7" : { path : "m 333.06436,370.69876 c -0.34701,-0.90279 -2.06993,-1.8478 -3.82873,-2.10003 -2.03424,-0.29173 -4.3146,-2.49628 -6.26702,-6.05868 -1.68805,-3.08005 -4.83012,-7.30696 -6.98236,-9.39314 -3.18779,-3.08993 -3.92347,-5.03634 -3.96876,-10.50017 -0.0463,-5.58737 -0.58236,-6.93822 -3.21089,-8.09138 -1.73542,-0.76134 -2.96328,-1.70636 -2.72859,-2.10003 0.2347,-0.39368 1.85889,-3.74748 3.60931,-7.45289 2.99265,-6.33503 3.04668,-6.94455 0.90534,-10.21265 -1.25249,-1.91154 -3.97568,-4.12127 -6.05153,-4.91051 -5.21249,-1.98179 -8.67949,-5.37754 -8.67949,-8.50113 0,-1.44484 -1.10251,-3.04162 -2.45003,-3.54839 -1.34753,-0.50677 -5.12759,-3.66123 -8.40014,-7.00991 -6.23736,-6.38247 -8.0385,-13.2802 -3.88401,-14.87443 2.49249,-0.95646 8.3096,-12.84312 7.1798,-14.67117 -1.5133,-2.44858 3.31125,-9.70132 6.91113,-10.38948 1.93057,-0.36905 3.84728,-0.12548 4.25935,0.54126 1.39195,2.25223 3.44589,1.2318 4.82574,-2.39747 1.21365,-3.19215 1.89799,-3.49577 5.91544,-2.62448 6.4274,1.39394 14.64352,6.37632 16.62935,10.08428 2.27762,4.25281 5.17195,3.96884 6.93976,-0.68085 1.5612,-4.10625 5.88398,-8.7693 8.1294,-8.7693 0.75469,0 3.43395,-1.88315 5.95391,-4.18479 3.42527,-3.1285 4.17956,-4.58699 2.98832,-5.77822 -1.19123,-1.19124 0.0594,-2.71809 4.9548,-6.04905 7.2149,-4.90921 22.86873,-9.22765 23.75974,-6.55462 0.28716,0.86149 1.18767,1.56635 2.00113,1.56635 0.81346,0 2.18782,0.96934 3.05413,2.1541 1.41732,1.93829 2.19101,1.9368 7.72285,-0.0149 3.38125,-1.19298 6.22783,-2.00482 6.32572,-1.80409 1.34638,2.76066 3.48322,7.84898 4.03563,9.60977 1.05542,3.3641 11.98777,8.59969 15.9043,7.6167 1.81672,-0.45597 4.66781,-0.0987 6.33574,0.79397 1.66792,0.89264 5.17965,1.91233 7.80383,2.26597 5.02622,0.67735 10.90862,4.19572 17.67601,10.57236 4.28635,4.03886 4.20838,4.66635 -0.89466,7.20036 -1.76855,0.87821 -3.3537,3.11135 -3.57863,5.04154 -0.68741,5.899 -5.0432,13.93202 -7.56371,13.94912 -1.30208,0.009 -2.75679,0.64607 -3.23268,1.41608 -0.4759,0.77001 -2.0207,1.40002 -3.4329,1.40002 -1.4122,0 -2.9515,1.00034 -3.42066,2.22297 -1.08363,2.82388 11.09841,17.37735 14.54578,17.37735 3.34935,0 15.40814,5.44011 15.40814,6.95112 0,0.671 0.38241,2.21654 0.8498,3.43454 0.63788,1.66229 -0.0398,2.21454 -2.71741,2.21454 -1.96198,0 -3.91166,0.55731 -4.33265,1.23848 -0.42099,0.68116 -3.82016,1.23848 -7.55372,1.23848 -10.88662,0 -15.64419,1.53478 -17.16611,5.53775 -0.74345,1.95542 -1.03088,4.5746 -0.63873,5.82042 0.88512,2.81191 -6.33677,7.88482 -13.24189,9.30158 -7.48316,1.53536 -14.57929,5.61388 -16.71693,9.6081 -1.42062,2.65446 -2.70641,3.40214 -4.9027,2.85091 -1.8209,-0.45702 -4.20207,0.31527 -6.13145,1.9886 -2.35692,2.04415 -4.48643,2.55713 -8.42326,2.02909 -4.13042,-0.554 -6.43949,0.0877 -10.68655,2.96983 -2.97972,2.02209 -6.23919,4.84941 -7.24327,6.28294 -2.06649,2.95033 -7.6366,4.40202 -18.33047,4.77731 -4.53312,0.15908 -7.57453,-0.36946 -7.96452,-1.38408 l 0,0 z", name : "Јужни Банат" }, "8" : { path : "m 130.99579,493.46112 c -0.95523,-1.52958 -1.73679,-4.06938 -1.73679,-5.64403 0,-3.59621 -3.53793,-5.06749 -6.42463,-2.67175 -1.806,1.49885 -2.41141,1.46501 -3.46079,-0.19337 -0.69954,-1.10551 -1.28153,-2.4469 -1.29332,-2.98087 -0.0118,-0.53398 -1.86128,-2.05768 -4.10996,-3.38602 -2.84917,-1.68305 -4.37044,-3.93507 -5.01854,-7.42926 -0.51151,-2.75777 -1.75668,-5.95914 -2.76705,-7.11416 -1.01038,-1.15502 -2.06752,-3.36005 -2.34922,-4.90008 -0.40321,-2.20426 -1.75944,-2.87037 -6.37407,-3.13055 -3.224037,-0.18176 -6.245826,0.29075 -6.71509,1.05002 -1.285632,2.0802 -3.487999,1.657 -3.487999,-0.67026 0,-2.44508 -4.141928,-4.84174 -6.754834,-3.90855 -2.373858,0.84779 -7.245388,-4.33098 -7.245388,-7.70235 0,-1.41822 -0.54867,-3.17709 -1.219268,-3.9086 -0.670597,-0.73151 -1.602058,-2.96072 -2.069913,-4.9538 -0.648611,-2.7631 -0.02651,-4.34035 2.61929,-6.64084 4.094676,-3.56028 4.533707,-9.46866 1.369902,-18.43584 -2.630564,-7.45581 -2.711222,-7.00011 1.239006,-7.00011 4.228752,0 8.374699,-6.02115 7.455803,-10.82805 -0.500133,-2.61627 0.0076,-3.6964 1.979867,-4.21217 2.562897,-0.67021 5.515957,-5.69683 7.613924,-12.96022 0.556028,-1.92503 3.149449,-6.0032 5.763158,-9.0626 2.613702,-3.0594 5.112212,-6.99696 5.552232,-8.75014 0.44002,-1.75318 1.28773,-3.1876 1.8838,-3.1876 0.59607,0 1.53571,-4.88257 2.08809,-10.85017 0.55239,-5.96759 1.69631,-11.69522 2.54206,-12.72805 1.86404,-2.27639 1.43873,-11.2859 -0.65167,-13.80467 -1.15624,-1.39318 -0.81457,-1.81773 1.46289,-1.81773 1.63431,0 2.97147,-0.70715 2.97147,-1.57145 0,-1.10673 0.60289,-1.07109 2.03871,0.12053 2.34518,1.94633 4.96141,0.82222 4.96141,-2.13176 0,-3.35834 2.68584,-2.25986 3.62515,1.48265 0.61963,2.4688 1.83062,3.50005 4.11007,3.50005 1.77739,0 3.44302,-0.6342 3.7014,-1.40935 0.30433,-0.913 2.02989,-0.82047 4.89964,0.26274 3.45686,1.30482 5.60874,1.29244 9.79705,-0.0564 5.27335,-1.69822 13.58121,-1.54985 15.4062,0.27514 0.5103,0.5103 2.02225,0.92782 3.35988,0.92782 2.10662,0 1.88867,1.00324 -1.6288,7.49756 -3.08918,5.70356 -4.14569,9.67061 -4.41542,16.57923 -0.47349,12.12768 1.26795,14.27471 10.79129,13.3047 6.75454,-0.688 7.30587,-0.47515 12.96906,5.00704 5.95643,5.76607 7.42498,6.21866 21.20723,6.53582 2.79099,0.0642 3.04311,0.41184 1.5786,2.17647 -0.95858,1.15501 -3.53359,2.10003 -5.72225,2.10003 -4.84905,0 -8.04495,4.60704 -5.40365,7.78961 1.92534,2.3199 9.87959,2.69684 12.00743,0.56902 0.98868,-0.98869 1.40649,0.66057 1.33002,5.25008 l -0.11152,6.69161 -5.11943,0 c -3.22118,0 -6.40607,1.11276 -8.5894,3.00103 -3.06574,2.65144 -3.34686,3.67428 -2.41316,8.78029 0.59277,3.24163 0.49719,6.12513 -0.21768,6.56694 -0.70098,0.43323 -0.88582,2.0123 -0.41078,3.50905 0.59002,1.85898 -0.16833,3.56478 -2.39309,5.38289 -2.6128,2.13523 -2.91076,3.01339 -1.50678,4.44093 0.96251,0.97867 1.75002,2.91342 1.75002,4.29944 0,3.78485 -7.32154,3.41447 -9.11816,-0.46127 -0.79734,-1.72004 -4.34345,-4.08872 -8.38211,-5.59895 -8.45399,-3.1613 -10.03351,-3.21108 -15.26819,-0.48121 -3.77859,1.97052 -4.2556,1.92011 -6.70465,-0.70863 -2.98238,-3.20122 -5.18606,-3.437 -12.67771,-1.35646 -5.84306,1.6227 -5.90578,1.71449 -3.64526,5.33416 2.24984,3.60257 0.40706,9.99247 -2.88174,9.99247 -1.44297,0 -2.98622,0.94501 -3.42944,2.10003 -1.08925,2.83856 0.37967,6.3001 2.67348,6.3001 3.60585,0 3.63149,2.94086 0.0502,5.75791 -1.98957,1.56499 -3.61741,3.74474 -3.61741,4.84387 0,1.09913 -0.55656,1.99842 -1.23681,1.99842 -0.68024,0 -1.54114,1.59202 -1.91311,3.53783 -0.51702,2.70461 0.23734,4.18838 3.20296,6.3001 2.1336,1.51925 4.51729,2.76227 5.2971,2.76227 0.77981,0 4.31744,1.24292 7.8614,2.76204 5.14894,2.20709 6.61387,3.61354 7.29119,7.00011 0.46619,2.33094 1.57386,4.23808 2.4615,4.23808 0.88764,0 2.58706,1.13658 3.7765,2.52573 1.68982,1.97357 1.79046,2.87338 0.46032,4.11592 -0.93626,0.87459 -2.02587,1.26658 -2.42137,0.87107 -1.15669,-1.15668 -8.96238,3.38131 -9.86585,5.7357 -1.20963,3.15226 -8.28328,2.72334 -10.37699,-0.62923 z", name : "Мачва" }, "9" : { path : "m 181.94973,501.40042 c -1.1581,-4.61422 -4.93168,-8.40099 -11.35538,-11.39502 -3.06097,-1.42669 -6.41352,-3.44211 -7.45012,-4.47871 -1.0366,-1.03659 -2.88604,-1.88472 -4.10988,-1.88472 -2.4947,0 -10.17504,-7.98668 -10.17504,-10.5809 0,-2.6333 -3.14831,-4.61945 -12.77357,-8.05835 -6.91059,-2.46901 -9.02782,-3.88633 -9.37415,-6.27527 -0.24606,-1.69726 0.22645,-3.08592 1.05001,-3.08592 0.82357,0 1.4974,-0.89247 1.4974,-1.98327 0,-1.09079 1.66783,-3.19819 3.70628,-4.6831 2.99074,-2.1786 3.52618,-3.41747 2.77338,-6.41687 -0.61687,-2.4578 -1.87246,-3.71703 -3.70629,-3.71703 -1.52535,0 -2.77337,-0.63001 -2.77337,-1.40002 0,-0.77002 1.18359,-1.40003 2.63019,-1.40003 2.8327,0 5.91435,-5.80651 6.2642,-11.80313 0.28277,-4.84663 7.2309,-6.58383 10.07757,-2.51963 1.94678,2.77942 8.14948,2.87744 9.83181,0.15538 2.32,-3.75384 19.28002,2.1095 20.58983,7.11822 0.68023,2.6012 1.63135,2.96019 6.84866,2.5849 6.02326,-0.43326 6.05779,-0.46655 5.89904,-5.6859 -0.10025,-3.29596 0.47853,-5.25008 1.55501,-5.25008 2.25118,0 3.65451,-12.02881 2.17081,-18.60731 -0.9953,-4.41306 -0.73174,-5.35221 2.00539,-7.14564 2.39419,-1.56874 3.54224,-1.67387 4.77852,-0.43759 1.17837,1.17837 2.28595,1.21169 4.01538,0.1208 1.89857,-1.19759 2.67997,-0.92616 3.81153,1.32396 3.03729,6.03974 15.32332,10.26 17.01733,5.84548 1.15505,-3.01 4.25162,-2.5901 5.11016,0.69294 1.233,4.71501 5.27681,5.13902 8.65121,0.90712 3.11356,-3.90477 4.9452,-3.65893 4.9452,0.66374 0,1.37343 1.01983,3.06787 2.26629,3.76542 1.68031,0.94035 2.12323,2.76829 1.71303,7.06968 -0.30429,3.19077 -0.0641,5.8014 0.53376,5.8014 2.09188,0 1.05552,3.39499 -2.68325,8.79004 -2.913,4.20347 -3.43645,5.9697 -2.30213,7.76797 1.02563,1.62595 1.02183,3.04213 -0.0126,4.69852 -1.99601,3.19613 0.85676,8.5246 8.66353,16.18193 6.4103,6.28761 8.62164,7.28948 8.62164,3.90614 0,-1.16652 0.83049,-1.73741 1.91952,-1.31951 2.04684,0.78545 5.57666,-2.11954 7.93906,-6.53373 0.79206,-1.47998 2.83881,-2.69087 4.54834,-2.69087 4.59875,0 6.93909,8.12468 3.90327,13.55052 -1.21546,2.17236 -2.99745,4.45357 -3.95996,5.06934 -0.96252,0.61577 -1.75003,2.19891 -1.75003,3.51808 0,1.31917 -1.34606,3.02039 -2.99124,3.78049 -1.64518,0.7601 -2.7477,1.86009 -2.45004,2.44442 0.29766,0.58433 -1.50633,2.3076 -4.00887,3.82948 -2.50254,1.52189 -4.55007,3.27134 -4.55007,3.88766 0,0.61633 -1.10252,1.20117 -2.45004,1.29963 -8.4835,0.61993 -15.1063,1.98919 -15.51229,3.20715 -0.25921,0.77764 -1.99382,1.4139 -3.85468,1.4139 -2.07411,0 -3.38339,0.81265 -3.38339,2.10003 0,2.57484 -1.86392,2.56657 -9.10015,-0.0404 -7.20345,-2.59513 -10.41271,-2.57277 -13.35844,0.0931 -3.08727,2.79394 -9.40028,0.23187 -10.01969,-4.0664 -0.60979,-4.23148 -7.78024,-6.56302 -10.16289,-3.30456 -1.94786,2.66386 -5.70741,3.20608 -7.05962,1.01816 -1.06528,-1.72366 -3.55496,-1.7655 -6.17998,-0.10387 -1.61831,1.02438 -1.29868,2.06289 1.75002,5.68607 3.61985,4.30195 5.01415,9.81804 2.4817,9.81804 -0.68654,0 -1.6144,-1.45884 -2.06191,-3.24188 z", name : "Колубара" }, "10" : { path : "m 254.4364,454.92067 c -6.33525,-6.18328 -8.19657,-10.14413 -6.00689,-12.78253 1.37997,-1.66276 1.3985,-2.70781 0.0853,-4.81059 -0.92271,-1.47749 -1.10394,-2.68636 -0.40273,-2.68636 4.03157,0 6.28691,-26.721 2.44608,-28.98089 -1.04654,-0.61577 -2.47624,-3.59119 -3.17711,-6.61203 -1.67278,-7.20989 -3.96113,-7.73061 -6.886,-1.56691 -3.1326,6.60147 -4.0912,7.00205 -6.81352,2.84727 -2.61686,-3.99384 -5.28543,-4.42357 -8.36238,-1.34662 -1.3717,1.3717 -3.38352,1.82967 -5.59705,1.27411 -6.08839,-1.52809 -7.7745,-4.85082 -8.12402,-16.00952 -0.31679,-10.11412 -0.23276,-10.39562 3.81922,-12.79555 8.05669,-4.77185 12.29529,-6.81097 14.15755,-6.81097 1.24249,0 1.80079,-1.54949 1.63945,-4.55007 -0.13456,-2.50254 0.24969,-6.90596 0.85389,-9.78537 0.88112,-4.19916 0.65262,-5.40641 -1.15453,-6.09988 -3.07555,-1.1802 -2.83099,-2.88736 0.53991,-3.76886 1.53613,-0.40171 3.07131,-1.57771 3.41149,-2.61333 0.34018,-1.03562 1.74301,-5.82051 3.1174,-10.63308 2.14224,-7.50128 2.9625,-8.75014 5.74719,-8.75014 1.78657,0 4.60078,-1.26002 6.2538,-2.80005 1.65302,-1.54002 4.10954,-2.80004 5.45892,-2.80004 3.45215,0 4.4247,-2.22552 2.5243,-5.77646 -1.32573,-2.47713 -1.20908,-3.26642 0.63526,-4.29856 1.24255,-0.69536 2.25917,-1.92983 2.25917,-2.74326 0,-0.81344 1.64154,-2.77021 3.64788,-4.34839 3.62208,-2.84913 4.02599,-6.91488 1.35472,-13.6367 -1.0528,-2.64922 4.05297,-6.02222 7.47288,-4.93678 1.61856,0.51371 2.54186,2.25911 2.61836,4.94976 0.0856,3.00938 2.0241,6.09248 7.02533,11.17321 3.79894,3.85934 7.62135,7.01698 8.49425,7.01698 0.8729,0 1.58709,1.23061 1.58709,2.73468 0,2.6893 1.4426,4.02143 11.20018,10.34247 5.56449,3.60473 5.92266,7.37269 1.31336,13.81658 -3.54599,4.95738 -3.42787,6.1741 0.87297,8.99212 3.16677,2.07495 3.4788,2.98653 2.66699,7.7916 -0.83428,4.93805 -0.47199,5.86367 3.91411,10.0003 2.65842,2.50721 5.98743,6.99031 7.3978,9.96245 1.58346,3.33688 4.06963,5.97208 6.49975,6.88934 2.16449,0.81701 3.93544,1.97735 3.93544,2.57855 0,0.6012 1.26002,1.09309 2.80004,1.09309 1.8667,0 2.80005,0.93334 2.80005,2.80004 0,1.54002 0.67246,2.80004 1.49437,2.80004 0.85847,0 1.11527,1.19443 0.60347,2.80695 -0.59209,1.86553 -0.15419,3.08963 1.30568,3.64984 2.6884,1.03163 2.90326,3.34337 0.31075,3.34337 -1.0372,0 -3.28017,1.20932 -4.98438,2.68737 -2.81218,2.439 -2.95639,3.21536 -1.56028,8.40013 1.03071,3.82773 2.32892,5.72548 3.93437,5.75131 2.59077,0.0417 9.39619,8.27495 9.39619,11.36763 0,1.14547 -1.65997,1.93968 -4.20007,2.00953 -8.12475,0.22341 -9.10015,0.57734 -9.10015,3.30193 0,1.49458 -0.63001,3.10679 -1.40002,3.58269 -2.29196,1.41651 -1.60017,5.66805 1.58018,9.7112 4.07482,5.18029 1.73978,7.55193 -4.41323,4.48239 -3.28525,-1.63889 -5.18058,-1.8495 -7.15156,-0.79466 -3.27587,1.75319 -6.81565,-1.17742 -6.81565,-5.64275 0,-4.05794 -2.72208,-4.73079 -8.82416,-2.18118 -5.15937,2.15573 -5.17607,2.15148 -5.17607,-1.31512 0,-2.83795 -1.40768,-4.14378 -7.65083,-7.09726 l -7.65083,-3.61942 -4.24936,3.14167 c -4.88682,3.61298 -5.16516,4.88275 -1.86877,8.52521 2.21837,2.45128 2.22382,2.93577 0.08,7.11035 -1.2653,2.4639 -2.5096,5.73986 -2.7651,7.27988 -0.31097,1.87441 -1.38367,2.67402 -3.24489,2.41882 -1.93236,-0.26495 -3.56316,1.07235 -5.34695,4.38464 -1.94786,3.61698 -3.24447,4.58861 -5.37856,4.03053 -1.54659,-0.40444 -3.22,-0.1725 -3.71869,0.51543 -0.49869,0.68793 -2.8528,-0.64863 -5.23136,-2.97013 l -1e-5,0 z", name : "Београд" }, "11" : { path : "m 392.07708,470.15064 c -2.1342,-1.11822 -4.51269,-1.64233 -5.28554,-1.16469 -2.39811,1.48212 -14.03971,-5.05407 -15.40698,-8.65026 -1.2922,-3.39873 -2.03173,-3.47068 -11.12189,-1.08204 -1.15502,0.30351 -3.90458,-0.38506 -6.11013,-1.53015 -2.20555,-1.14509 -4.92555,-2.08197 -6.04444,-2.08197 -1.40583,0 -1.75625,-0.8762 -1.13423,-2.83601 0.71732,-2.26008 0.0485,-3.13288 -3.29347,-4.29789 -5.14506,-1.79359 -6.84136,-5.45564 -3.61865,-7.81215 2.95399,-2.16001 1.62066,-6.05429 -2.07287,-6.05429 -4.13472,0 -4.83896,-2.39274 -2.28704,-7.7705 2.38416,-5.02424 4.64135,-5.98888 7.44748,-3.18275 1.26257,1.26258 2.30814,1.04857 4.48007,-0.917 1.55822,-1.41017 2.83312,-3.46816 2.83312,-4.57331 0,-2.84632 -7.24932,-12.76683 -9.999,-13.68338 -1.26438,-0.42146 -2.68231,-1.84793 -3.15095,-3.16995 -0.46864,-1.32202 -1.22216,-3.20015 -1.67449,-4.17362 -0.51313,-1.10432 1.06673,-2.55928 4.20097,-3.86885 5.76399,-2.40835 6.12415,-4.2164 2.22334,-11.16147 -3.28613,-5.85068 -3.54376,-7.89763 -0.86459,-6.86954 2.90549,1.11494 18.10719,-3.22686 19.90464,-5.68502 4.44679,-6.08135 18.4313,-12.16518 16.52113,-7.18737 -0.41333,1.07713 -0.0113,2.41591 0.89342,2.97505 1.25526,0.77579 1.24889,1.2614 -0.0269,2.04988 -1.24068,0.76679 -0.90915,2.70746 1.28555,7.52512 1.62656,3.57053 3.55188,6.49187 4.27848,6.49187 0.7266,0 0.94945,0.96848 0.49522,2.15217 -1.0286,2.68048 3.28953,7.64798 6.6482,7.64798 3.53332,0 4.67508,2.54551 2.75281,6.1373 -1.69462,3.16643 -1.09427,5.53213 3.40608,13.42178 1.31465,2.30475 1.48642,3.75951 0.51479,4.36 -0.80198,0.49566 -1.28241,2.40425 -1.06761,4.24131 0.2148,1.83706 -1.02623,6.06566 -2.75783,9.3969 -3.36695,6.47728 -2.45372,10.04347 2.57192,10.04347 1.3264,0 3.49796,1.20037 4.82569,2.66749 2.31764,2.56097 2.24308,2.70505 -1.867,3.60777 -5.03236,1.10529 -6.86056,3.33842 -4.14251,5.06001 1.39717,0.88494 1.44665,1.22797 0.17937,1.24349 -2.01506,0.0247 -2.47976,10.60537 -0.519,11.81718 1.70937,1.05646 2.80923,5.79786 1.74453,7.52058 -0.5722,0.92584 -2.24231,0.71289 -4.76168,-0.60714 z", name : "Подунавље" }, "12" : { path : "m 505.08278,497.5092 c -0.50781,-0.82165 -2.3639,-1.13233 -4.12465,-0.69042 -2.19081,0.54986 -3.47623,0.0872 -4.07214,-1.46574 -0.66237,-1.72611 -2.04266,-2.07906 -5.76703,-1.47468 -3.95788,0.64227 -5.55082,0.14 -8.31169,-2.62088 -2.50677,-2.50677 -4.93834,-3.41544 -9.1396,-3.41544 -5.07588,0 -6.45443,-0.79278 -12.17236,-7.00011 -3.54651,-3.85007 -7.53724,-7.00012 -8.86828,-7.00012 -1.33105,0 -3.20438,-0.94501 -4.16296,-2.10003 -2.18164,-2.62872 -3.85641,-2.6271 -8.91017,0.009 -4.93089,2.57163 -7.74597,2.78728 -5.37006,0.41138 2.37945,-2.37945 2.08555,-6.72011 -0.45501,-6.72011 -1.25779,0 -2.48426,-1.74615 -2.98499,-4.24979 -1.32272,-6.61361 -9.8131,-9.73905 -11.27458,-4.15034 -1.01692,3.88868 -5.48181,3.50116 -8.24472,-0.71557 -1.26693,-1.93359 -4.53761,-4.57577 -7.26817,-5.8715 l -4.96466,-2.35589 3.73585,-1.24528 c 2.05471,-0.6849 3.73584,-2.02797 3.73584,-2.9846 0,-2.37858 -5.99157,-7.8275 -8.60703,-7.8275 -1.16956,0 -2.52135,-0.39488 -3.00398,-0.87751 -1.41343,-1.41343 3.08644,-8.92264 5.34686,-8.92264 2.52482,0 2.63146,-1.92255 0.31406,-5.6618 -1.42022,-2.29161 -1.39199,-3.04663 0.14982,-4.00629 2.02609,-1.2611 1.1665,-6.20197 -1.70009,-9.77197 -1.70566,-2.12419 -2.10536,-6.05428 -0.72823,-7.16036 0.47936,-0.38501 0.56535,-2.74755 0.1911,-5.25009 -0.4543,-3.03784 -1.4547,-4.55007 -3.01007,-4.55007 -1.2813,0 -3.75987,-1.00178 -5.50793,-2.22617 -2.46948,-1.72968 -2.82431,-2.65271 -1.59101,-4.13874 1.95587,-2.35668 0.37556,-5.2996 -2.29543,-4.27464 -1.8456,0.70822 -2.70237,-2.28651 -2.06293,-7.21073 0.12499,-0.96252 -0.27287,-1.75129 -0.88414,-1.75284 -0.61126,-0.002 -1.25092,-2.04907 -1.42146,-4.55007 -0.27246,-3.9955 0.32705,-4.85363 4.94073,-7.07207 2.88795,-1.38865 6.29245,-2.1251 7.56556,-1.63656 1.63594,0.62777 2.94139,-0.32353 4.45158,-3.24392 2.28963,-4.42766 10.7044,-9.08405 19.21057,-10.63034 2.78183,-0.50569 6.18501,-2.16491 7.56263,-3.68716 2.88478,-3.18764 5.49738,-1.8855 6.82428,3.40129 0.97416,3.88138 5.30464,5.02128 19.07573,5.02128 12.74311,0 15.27084,2.08282 16.64214,13.71289 0.56677,4.80686 1.77793,9.48716 2.69145,10.40069 1.00135,1.00134 7.07901,1.79385 15.30411,1.99561 12.79965,0.31396 21.5321,1.10371 29.74342,2.68995 1.92503,0.37187 5.8501,1.04178 8.72239,1.48867 4.02174,0.62575 5.71392,1.79795 7.36063,5.09884 1.95894,3.9268 1.93192,4.48692 -0.32227,6.67846 -5.14608,5.00307 -8.05012,9.13402 -8.32049,11.83575 -1.25905,12.58183 -2.30213,16.10026 -4.77304,16.10026 -1.41279,0 -3.2195,1.21602 -4.01492,2.70226 -0.79542,1.48625 -2.86511,2.90378 -4.59933,3.15005 -2.0566,0.29207 -3.3126,1.57301 -3.61172,3.68345 -0.25222,1.77961 -1.35474,3.57954 -2.45003,3.99984 -2.06958,0.79417 -2.76445,7.62508 -0.95929,9.43024 0.56769,0.56769 1.0402,2.08566 1.05002,3.37328 0.0113,1.48496 2.06585,3.01242 5.61795,4.17675 7.36576,2.41438 7.98807,3.18398 8.34982,10.32619 0.16878,3.33227 0.78906,7.1612 1.3784,8.50872 1.22722,2.80605 4.94973,3.32549 5.01653,0.70001 0.0276,-1.0854 0.73766,-0.83762 1.86958,0.65242 1.92609,2.53547 1.95655,4.17235 0.2357,12.66314 -0.67493,3.33017 -0.49874,5.95033 0.47941,7.12892 2.01686,2.43018 0.61449,3.7059 -4.07377,3.7059 -2.07786,0 -5.5531,1.39636 -7.72277,3.10303 -4.53879,3.57021 -8.48265,4.52012 -9.81516,2.36407 l 0,0 z", name : "Браничево" }, "13" : { path : "m 550.33656,538.48345 c -1.33604,-0.52944 -3.85608,-3.79272 -5.60009,-7.25173 -3.15613,-6.25975 -8.071,-9.29949 -8.071,-4.99172 0,1.21147 -0.21821,2.20268 -0.48492,2.20268 -1.86166,0 -9.62431,-4.8904 -12.80126,-8.0647 -2.67768,-2.67543 -5.37753,-3.87991 -8.92648,-3.98234 -13.37257,-0.38598 -12.92297,-0.21959 -11.89796,-4.40322 0.5188,-2.11753 1.51653,-4.07363 2.21718,-4.34689 0.70064,-0.27327 1.86707,-2.05699 2.59206,-3.96387 0.72499,-1.90685 2.1018,-3.18099 3.05958,-2.8314 0.95777,0.34958 3.14523,-0.64117 4.86101,-2.20168 1.71579,-1.56051 5.42728,-3.21285 8.24778,-3.67187 5.83354,-0.94937 9.4804,-5.03623 6.27703,-7.03438 -1.58051,-0.98587 -1.66332,-2.37267 -0.43147,-7.22577 0.83843,-3.30316 1.18307,-6.55805 0.76588,-7.2331 -0.4172,-0.67504 -0.75855,-3.3906 -0.75855,-6.03458 0,-5.09513 -3.01038,-6.55693 -6.4401,-3.12722 -0.92401,0.92402 -1.70805,1.39653 -1.7423,1.05002 -0.0343,-0.34651 -0.28715,-3.75546 -0.56198,-7.57546 -0.55429,-7.70415 -4.12094,-11.95485 -10.03101,-11.95485 -2.37771,0 -3.34496,-0.78579 -3.34496,-2.71742 0,-1.49458 -0.63001,-3.10679 -1.40002,-3.58268 -1.73521,-1.07242 -1.86115,-6.3001 -0.15177,-6.3001 0.68653,0 1.62892,-1.51673 2.09419,-3.37051 0.59802,-2.3827 1.585,-3.17725 3.36764,-2.71108 1.68048,0.43946 3.16245,-0.53783 4.44248,-2.92959 1.24504,-2.32637 3.10665,-3.58902 5.29153,-3.58902 2.93207,0 3.33109,-0.59216 3.06597,-4.55007 -0.16764,-2.50254 0.43982,-6.39125 1.34989,-8.64157 0.91008,-2.25032 1.33374,-4.92786 0.94147,-5.95009 -0.39327,-1.02485 0.20914,-1.8586 1.34288,-1.8586 1.13086,0 2.0561,-0.84862 2.0561,-1.88582 0,-1.0372 1.26002,-3.33863 2.80004,-5.1143 l 2.80005,-3.22847 0,3.78112 c 0,2.10356 1.41799,5.14904 3.19606,6.86432 1.75784,1.69576 4.19987,4.67451 5.42675,6.61945 3.17205,5.02858 11.08719,8.99134 15.66448,7.84251 2.87775,-0.72227 4.63404,-2.97105 7.83654,-10.034 2.27015,-5.00671 5.37925,-10.86097 6.9091,-13.00945 1.52986,-2.14849 3.20027,-5.5746 3.71202,-7.61358 0.51175,-2.03898 1.87929,-4.49471 3.03898,-5.45716 1.15968,-0.96245 2.6573,-3.19333 3.32804,-4.9575 0.838,-2.20412 2.35413,-3.20759 4.84627,-3.20759 4.42005,0 9.11759,-2.36346 11.57218,-5.82227 3.02843,-4.26741 6.24708,-2.99654 15.01468,5.92848 9.12177,9.28556 14.08489,12.49399 19.32693,12.49399 4.80249,0 9.80728,2.88896 14.34298,8.27935 l 3.89324,4.62685 -3.40324,2.61591 c -4.2217,3.24503 -6.02659,3.32191 -8.48191,0.36128 -3.09165,-3.72795 -10.14077,-6.07665 -14.63243,-4.87539 -3.21313,0.85932 -4.3748,2.30361 -5.79319,7.20262 -2.32514,8.03083 -3.55048,9.05987 -10.21518,8.57866 -4.06265,-0.29333 -5.81815,0.19964 -6.43497,1.80705 -1.22965,3.2044 0.50072,8.85121 3.68943,12.03992 1.52044,1.52044 2.76444,4.06358 2.76444,5.65143 0,5.10432 4.24625,15.89266 7.91056,20.09813 2.42286,2.78069 6.30974,4.84871 12.17453,6.47749 8.61073,2.39138 8.6152,2.39537 8.31349,7.41124 -0.18546,3.08327 -2.14647,7.6429 -5.08522,11.8239 -4.49497,6.39503 -4.76814,7.43425 -4.53105,17.23721 l 0.25231,10.43188 -9.55503,2.95472 c -9.31919,2.88179 -9.58991,2.88954 -10.96851,0.31359 -1.09026,-2.03716 -0.76147,-3.341 1.43773,-5.70156 1.56818,-1.68324 2.85123,-3.61307 2.85123,-4.28851 0,-2.57942 -2.98373,-6.64408 -4.8772,-6.64408 -1.08826,0 -3.67813,-1.57503 -5.75527,-3.50006 -3.76208,-3.48658 -13.16791,-5.03446 -13.16791,-2.16699 0,2.04598 -13.04714,-2.33561 -15.03015,-5.04755 -1.99717,-2.73129 -1.8469,-2.82622 -6.59002,4.16316 -4.02326,5.92861 -4.4895,8.70299 -1.64592,9.79417 1.06387,0.40825 2.29399,2.83819 2.73361,5.39987 0.43961,2.56169 1.2157,6.70514 1.72465,9.20768 0.55844,2.74596 0.36349,4.55007 -0.49169,4.55007 -2.0502,0 -10.10094,16.05904 -10.10094,20.14863 0,2.23349 -0.99418,3.77861 -2.80005,4.35176 -1.54002,0.48879 -2.80004,1.47626 -2.80004,2.19438 0,1.48702 -1.05943,1.52124 -4.5292,0.14627 l 0,0 z", name : "Бор" }, "14" : { path : "m 214.35063,734.93986 c -2.73764,-1.86028 -5.61521,-5.21156 -6.39459,-7.4473 -1.23749,-3.54985 -2.10921,-4.06496 -6.87918,-4.06496 -10.69747,0 -22.17377,-5.91152 -23.09252,-11.89512 -0.53346,-3.47435 -9.15897,-6.6369 -18.18051,-6.66591 -5.54805,-0.0179 -6.70855,-0.50247 -7.54972,-3.15277 -1.75753,-5.53746 -7.89484,-13.66858 -10.31697,-13.66858 -4.28418,0 -8.47807,-5.33251 -8.47807,-10.77984 0,-3.81226 -0.99946,-5.97027 -4.02727,-8.69559 -2.21499,-1.99372 -4.46381,-5.64391 -4.99738,-8.11155 -0.5994,-2.77216 -2.07582,-4.83755 -3.86369,-5.405 -1.59146,-0.50511 -5.63014,-3.00724 -8.97483,-5.56031 -3.3447,-2.55307 -7.51139,-5.09544 -9.25932,-5.64971 -1.74793,-0.55428 -5.407238,-2.41447 -8.131789,-4.13379 -4.894916,-3.08889 -5.84712,-6.11339 -3.735519,-11.86517 0.424031,-1.15502 1.192252,-4.61528 1.707158,-7.68946 1.248692,-7.45518 1.593997,-7.82702 5.787697,-6.23258 2.608873,0.99189 4.685613,0.8329 7.507293,-0.57473 3.65509,-1.8234 3.99792,-1.73264 5.44402,1.44121 0.84881,1.86294 1.54329,4.6373 1.54329,6.16526 0,4.44726 3.95958,4.84453 8.16147,0.81886 2.67712,-2.56485 4.71571,-3.39414 6.92399,-2.81667 1.72136,0.45015 4.0714,0.0369 5.22232,-0.91823 2.51002,-2.08313 2.76093,-6.5378 0.41234,-7.32067 -1.3031,-0.43437 -1.29155,-2.29689 0.0515,-8.29824 1.00571,-4.49399 1.32318,-10.29306 0.75725,-13.83222 -1.31898,-8.24842 -11.83258,-23.27212 -17.92077,-25.60838 -1.24937,-0.47943 -2.69606,-1.97784 -3.21485,-3.32981 -0.5188,-1.35196 -3.65456,-6.33665 -6.96836,-11.07708 -3.3138,-4.74044 -6.025088,-9.04569 -6.025088,-9.56724 0,-0.52155 -1.457348,-2.95376 -3.238552,-5.40493 -1.781203,-2.45116 -3.977162,-6.19891 -4.879909,-8.32833 -1.598511,-3.7706 -1.541378,-3.84685 2.188534,-2.92085 6.189155,1.53653 12.328455,4.38073 14.122785,6.54277 1.17088,1.41083 5.06541,2.07377 13.03337,2.21857 6.24993,0.11359 11.80024,0.47644 12.33402,0.80633 0.53379,0.3299 3.26894,-1.89997 6.07811,-4.95527 2.80918,-3.05529 6.69494,-6.27832 8.63503,-7.16229 2.88795,-1.31584 3.52743,-2.5923 3.52743,-7.04111 0,-6.13225 -3.80038,-11.33035 -7.90852,-10.81713 -1.4254,0.17807 -4.16667,-0.36161 -6.0917,-1.19929 -3.36252,-1.4632 -3.37817,-1.52654 -0.39827,-1.61179 1.70598,-0.0488 4.98306,-1.92776 7.28241,-4.17545 2.75153,-2.6897 5.11997,-3.84106 6.92851,-3.36811 1.84021,0.48122 3.2662,-0.2499 4.31703,-2.2134 1.7875,-3.33997 4.99672,-3.83879 6.65115,-1.0338 0.61577,1.044 3.63962,3.03658 6.71967,4.42796 6.25746,2.82675 10.42213,7.13268 10.46904,10.82413 0.0213,1.67993 1.1451,2.45004 3.57512,2.45004 4.35481,0 5.60554,-2.8361 3.68294,-8.35127 -1.25218,-3.59201 -1.12344,-4.1592 0.90695,-3.99576 5.00139,0.40259 7.26636,-0.33092 7.26636,-2.35321 0,-1.15502 0.94502,-2.10003 2.10004,-2.10003 1.15502,0 2.10003,1.21712 2.10003,2.70471 0,3.03605 6.81573,8.49547 10.60605,8.49547 1.36053,0 3.60042,-1.01969 4.97755,-2.26597 2.86478,-2.59259 8.85806,-1.73066 10.07837,1.44943 0.42373,1.10423 0.13674,4.30269 -0.63776,7.10769 -0.94563,3.42482 -0.94434,5.6589 0.004,6.8015 0.88484,1.06616 0.92726,2.4681 0.11361,3.75457 -2.01212,3.1814 -1.61522,5.01284 2.02352,9.33725 2.32985,2.76886 3.15124,5.11653 2.67035,7.63217 -0.49414,2.58498 0.22691,4.4917 2.49919,6.60864 1.75657,1.63647 2.52363,2.97541 1.70458,2.97541 -0.81902,0 -2.4939,2.04753 -3.72195,4.55007 -1.94573,3.96503 -1.971,4.74788 -0.19662,6.08852 1.11989,0.84615 1.62983,1.94481 1.13317,2.44146 -0.49665,0.49665 0.0112,2.00938 1.12828,3.36162 1.18824,1.43822 1.9574,5.07338 1.85325,8.75873 -0.14774,5.22848 0.49823,6.9422 3.79776,10.07507 3.59208,3.41064 3.81183,4.13483 2.27697,7.50349 -1.4248,3.12708 -1.33628,3.9936 0.54874,5.37196 3.00684,2.19866 0.001,6.9575 -3.13896,4.97049 -1.1107,-0.70274 -3.71207,-1.28736 -5.78081,-1.29915 -3.22562,-0.0184 -3.82384,0.62663 -4.20007,4.52863 -0.34955,3.62539 -1.00775,4.47465 -3.23875,4.17896 -1.70667,-0.2262 -5.20807,1.90253 -8.96684,5.45153 -5.21719,4.92603 -6.56166,5.57603 -8.73114,4.22117 -4.19202,-2.61796 -6.80241,-1.93415 -6.80241,1.78192 0,1.86087 -0.78751,3.66567 -1.75003,4.01068 -2.45755,0.88089 2.11825,8.53917 5.5043,9.21226 1.40021,0.27834 3.04964,1.38085 3.66541,2.45004 0.61578,1.06918 2.66331,1.94397 4.55008,1.94397 3.06032,0 3.43048,0.59536 3.43048,5.51746 0,3.0346 0.61316,5.89642 1.36256,6.35957 0.74941,0.46316 2.44933,3.17788 3.7776,6.03273 1.32827,2.85484 3.54732,6.76563 4.93123,8.69066 1.3839,1.92503 2.74643,5.50499 3.02784,7.95546 0.28142,2.45047 1.56265,5.50639 2.84717,6.79092 2.18066,2.18066 2.97733,2.17822 12.01586,-0.0368 5.32418,-1.30477 10.29337,-1.99342 11.04263,-1.53036 1.74619,1.0792 -2.14751,11.64314 -5.81916,15.78785 -2.69346,3.04048 -2.69075,3.10861 0.31861,7.97784 1.66939,2.70115 4.26401,5.30116 5.7658,5.77781 1.50179,0.47665 2.73053,1.32763 2.73053,1.89107 0,1.42959 -8.58737,4.38697 -12.73846,4.38697 -3.71498,0 -8.76843,4.78977 -7.87038,7.45971 0.30347,0.90224 -1.26141,2.40843 -3.47752,3.3471 -2.82375,1.19603 -5.08629,4.01546 -7.56212,9.42337 -1.94305,4.24419 -4.01692,8.01591 -4.6086,8.38158 -0.59167,0.36569 -3.31566,-0.85718 -6.05331,-2.71745 l 0,4e-5 z", name : "Златибор" }, "15" : { path : "m 262.61112,678.71788 c -0.96252,-0.38838 -1.75003,-1.36892 -1.75003,-2.17897 0,-1.78095 -6.60808,-8.094 -8.47227,-8.094 -0.73034,0 -1.32789,0.63001 -1.32789,1.40002 0,0.77001 -1.73668,1.40002 -3.8593,1.40002 -2.12262,0 -5.78286,0.55166 -8.13387,1.22593 -4.24145,1.21642 -10.11064,-1.0558 -8.04994,-3.11649 0.82141,-0.82142 -0.63048,-4.87558 -3.83538,-10.70964 -5.97642,-10.87924 -9.67989,-18.70911 -9.11599,-19.27301 1.46186,-1.46187 -3.60997,-8.72744 -6.09231,-8.72744 -1.43786,0 -2.97694,-0.94501 -3.42016,-2.10003 -0.44322,-1.15502 -2.06348,-2.10003 -3.60058,-2.10003 -1.5371,0 -3.46907,-1.26002 -4.29327,-2.80005 -1.016,-1.89841 -1.03186,-2.80004 -0.0493,-2.80004 0.79711,0 1.44928,-1.38602 1.44928,-3.08005 0,-2.39559 0.37334,-2.7067 1.68003,-1.40002 3.00522,3.00522 6.94169,1.78787 12.63777,-3.90822 3.07353,-3.07352 6.1551,-5.2379 6.84793,-4.80971 2.97952,1.84145 6.83472,-1.03337 6.83472,-5.09663 0,-4.489 2.23057,-5.25829 7.33132,-2.52844 2.40712,1.28824 3.28818,1.11094 4.80804,-0.9676 2.16157,-2.95612 2.49449,-9.00982 0.49549,-9.00982 -0.86157,0 -0.89544,-1.23602 -0.0918,-3.3498 1.4953,-3.93292 0.42068,-9.2504 -1.86942,-9.2504 -3.06903,0 -5.30426,-5.69137 -4.38113,-11.1553 0.67171,-3.97585 0.37816,-5.47181 -1.19197,-6.07432 -1.30383,-0.50033 -1.80085,-1.87895 -1.32854,-3.68507 0.53228,-2.03543 0.0877,-2.88569 -1.50869,-2.88569 -2.71897,0 -2.80653,-1.26713 -0.31443,-4.55007 1.02292,-1.34752 3.20792,-2.45004 4.85556,-2.45004 4.26985,0 3.70226,-3.15112 -1.22358,-6.79295 -3.60845,-2.66784 -3.99645,-3.53583 -2.6801,-5.99546 1.22577,-2.29036 1.01586,-3.49057 -1.03079,-5.89397 -4.24739,-4.98774 -6.15062,-9.10302 -4.64135,-10.0358 1.64793,-1.01848 1.83232,-5.85749 0.24827,-6.51571 -0.61769,-0.25667 -0.57084,-3.19365 0.10411,-6.52661 0.99203,-4.89872 1.67671,-5.87431 3.57311,-5.09124 6.4808,2.67606 7.7114,2.58189 6.89817,-0.52791 -0.64188,-2.45457 -0.18011,-3.02115 2.46228,-3.02115 1.78877,0 3.46232,-0.60077 3.71899,-1.33505 0.25667,-0.73428 2.67171,-1.66975 5.36675,-2.07883 11.10861,-1.68614 14.00022,-2.59874 14.00022,-4.41847 0,-1.05295 1.57503,-2.30977 3.50006,-2.79292 2.13134,-0.53493 3.50005,-1.876 3.50005,-3.42935 0,-1.57947 1.1996,-2.72127 3.15005,-2.99828 2.02438,-0.28751 3.30993,-1.57306 3.59743,-3.59743 0.24606,-1.73253 1.05388,-3.15005 1.79514,-3.15005 0.74127,0 1.87871,-1.41752 2.52763,-3.15005 1.07147,-2.86065 1.34493,-2.6034 2.97654,2.80005 0.98817,3.27255 2.32696,5.95009 2.97509,5.95009 0.64813,0 1.10381,0.47251 1.01262,1.05002 -0.46931,2.97229 0.48664,4.32705 3.60565,5.10987 3.72183,0.93412 8.71669,9.54566 7.99872,13.79043 -0.23488,1.38863 0.45684,2.45004 1.5967,2.45004 2.34835,0 14.94148,11.12198 12.86451,11.36167 -0.76967,0.0888 -2.29161,0.24632 -3.3821,0.35 -1.09049,0.10369 -3.44351,2.94714 -5.22893,6.3188 -1.78542,3.37166 -4.35826,6.95181 -5.71742,7.95588 -1.97999,1.46272 -2.12334,2.17826 -0.72116,3.59987 0.96251,0.97585 1.75002,2.96727 1.75002,4.42539 0,1.4581 1.2377,2.97477 2.75045,3.37036 1.51274,0.39559 3.97478,2.79435 5.47119,5.33058 l 2.72075,4.61132 -4.11525,3.94266 c -2.26339,2.16846 -3.92245,4.9083 -3.68681,6.08853 0.23564,1.18024 -1.00454,3.59204 -2.75596,5.35957 -1.75143,1.76753 -3.18441,4.76008 -3.18441,6.65011 0,2.47547 -0.76457,3.43641 -2.73417,3.43641 -5.6815,0 -9.86603,3.06431 -9.86603,7.22484 0,2.18644 0.47251,3.9766 1.05002,3.97815 0.5775,0.002 1.19481,2.04907 1.37178,4.55007 0.30344,4.2882 0.0641,4.53747 -4.20006,4.37538 -2.48701,-0.0946 -6.25713,0.83044 -8.37803,2.0555 -3.31527,1.91495 -3.73817,2.85655 -3.01478,6.71255 1.4104,7.51806 -0.45988,12.46438 -5.80048,15.34049 -2.65585,1.43028 -4.82883,2.8177 -4.82883,3.08317 0,0.26547 2.99255,3.63957 6.65011,7.49799 8.85222,9.33834 9.23815,10.19001 9.41022,20.76597 0.0816,5.01449 0.66475,10.84977 1.29592,12.9673 0.91056,3.05488 0.69267,3.85006 -1.05496,3.85006 -1.2114,0 -2.95821,1.41197 -3.8818,3.13772 -1.61457,3.01683 -8.91824,10.97982 -9.86176,10.75197 -0.25173,-0.0608 -1.24521,-0.42829 -2.20772,-0.81667 l 0,0 z", name : "Моравица" }, "16" : { path : "m 328.65696,563.77181 c -0.82787,-0.56572 -2.7179,-3.61522 -4.20007,-6.77667 -1.48216,-3.16145 -4.64854,-7.23448 -7.03641,-9.0512 -2.38786,-1.81671 -5.10498,-5.02777 -6.03803,-7.13569 -0.93306,-2.10791 -2.84736,-4.19785 -4.25402,-4.6443 -3.2544,-1.03291 -4.51911,-7.26883 -1.98761,-9.80033 1.05655,-1.05655 1.921,-2.70391 1.921,-3.66079 0,-2.63169 4.23254,-6.76001 6.16887,-6.01697 0.93815,0.36 2.55327,-0.92912 3.58917,-2.86472 1.72316,-3.21974 1.55356,-3.84946 -1.9927,-7.39906 -2.13188,-2.1339 -5.48208,-4.93508 -7.44489,-6.22485 -1.99278,-1.30947 -4.46369,-5.01897 -5.59536,-8.40013 -2.02309,-6.04455 -5.90795,-10.95517 -8.66677,-10.95517 -0.80221,0 -1.45856,-0.91371 -1.45856,-2.03047 0,-1.11676 -0.95186,-2.56315 -2.11524,-3.21421 -1.16338,-0.65106 -2.41241,-3.67492 -2.77561,-6.71968 -0.95214,-7.98182 -3.96455,-18.83613 -5.22762,-18.83613 -2.09786,0 -0.98564,-6.34333 1.71833,-9.80016 3.41651,-4.36775 3.41576,-4.46174 -0.068,-8.47858 l -2.86808,-3.30692 3.21525,-2.42528 c 3.07995,-2.32321 3.3477,-2.30084 6.36262,0.53153 1.73105,1.62623 3.54768,2.55646 4.03697,2.06718 1.83725,-1.83725 5.87327,1.7589 5.13641,4.57662 -1.02393,3.91552 2.42122,4.84288 8.52182,2.29388 l 5.06351,-2.11566 0,4.12863 c 0,2.6286 0.7206,4.12862 1.98337,4.12862 1.09085,0 2.2434,0.78011 2.56122,1.73357 0.4542,1.3626 1.36722,1.3739 4.26673,0.0528 2.29402,-1.04522 4.00373,-1.17134 4.52152,-0.33354 0.45795,0.74098 1.98807,1.34723 3.40027,1.34723 1.41219,0 2.92041,0.91932 3.35158,2.04294 0.43117,1.12362 2.86111,2.6077 5.39987,3.29796 2.53876,0.69027 4.44717,2.00973 4.24091,2.93214 -0.48211,2.15611 3.0743,5.72718 5.70367,5.72718 1.11574,0 2.77088,0.89438 3.6781,1.98751 1.63254,1.9671 7.91667,2.07301 13.71962,0.23122 2.07411,-0.65829 3.01743,-0.16874 3.54229,1.83832 0.91035,3.48118 12.85546,9.52607 19.0953,9.66328 5.50192,0.12098 7.37552,2.26995 5.73684,6.57999 -0.63439,1.66858 -0.6372,3.86907 -0.006,4.88999 0.63096,1.02091 0.82,2.70887 0.42009,3.75102 -0.39991,1.04215 0.0505,2.83181 1.00097,3.97702 2.24372,2.70352 -0.0892,5.6908 -6.55345,8.39175 -5.47199,2.28635 -6.00582,5.2287 -1.33478,7.35697 2.58921,1.17973 3.17379,2.31588 2.63683,5.12481 -0.37939,1.98497 -1.60642,3.60903 -2.72667,3.60903 -1.12025,0 -3.04944,1.01262 -4.28709,2.25027 -1.82553,1.82553 -1.96173,3.01466 -0.72162,6.3001 1.27117,3.3677 1.16791,4.04983 -0.61307,4.04983 -1.41316,0 -1.90561,0.90283 -1.44765,2.65405 0.4707,1.79999 -0.37779,3.22768 -2.63676,4.43664 -3.57376,1.91262 -4.42387,6.65649 -1.68386,9.39649 1.26258,1.26258 1.05554,2.30044 -0.88712,4.44706 -1.39374,1.54006 -3.00381,2.5098 -3.57793,2.15497 -0.57412,-0.35483 -2.63768,0.94869 -4.58569,2.8967 l -3.54184,3.54183 -3.56369,-3.56369 c -3.53498,-3.53498 -10.69108,-4.92793 -10.69108,-2.08105 0,0.81546 -0.67089,1.06802 -1.49086,0.56125 -0.81998,-0.50677 -3.71758,-0.50367 -6.43912,0.007 -4.7253,0.88647 -4.90896,1.13773 -4.07626,5.57642 0.66221,3.52987 0.33129,4.85562 -1.37551,5.51058 -2.93675,1.12693 -5.16582,1.0606 -7.02378,-0.20901 l 0,3e-5 z", name : "Шумадија" }, "17" : { path : "m 394.05035,581.27019 c -0.94942,-0.94968 -3.11246,-1.83758 -4.80675,-1.9731 -1.69429,-0.13552 -4.97055,-0.63987 -7.28059,-1.12077 -2.31003,-0.48091 -5.93863,-1.0952 -8.06354,-1.3651 -3.68402,-0.46792 -9.26977,-5.49484 -9.40928,-8.4679 -0.0361,-0.77002 -0.44557,-2.81755 -0.90987,-4.55008 -0.6008,-2.24188 -0.23874,-3.15005 1.25585,-3.15005 1.15502,0 2.42954,-1.26002 2.83226,-2.80004 0.41138,-1.57312 1.90966,-2.80005 3.4193,-2.80005 3.11831,0 8.77525,-5.51841 8.77525,-8.56036 0,-1.14389 -0.72931,-2.80912 -1.62069,-3.7005 -1.22758,-1.22757 -1.1891,-2.14073 0.15863,-3.76464 0.97863,-1.17918 2.3424,-1.79596 3.0306,-1.37062 0.6882,0.42533 1.61896,-0.36912 2.06835,-1.76545 0.44939,-1.39632 1.45427,-3.87754 2.23306,-5.51382 0.95988,-2.01674 0.95046,-3.84491 -0.0293,-5.67552 -1.72142,-3.2165 -0.54744,-5.53479 3.15877,-6.23771 2.77769,-0.52682 5.55269,-7.38932 4.32505,-10.69576 -0.36424,-0.98102 -2.09373,-2.3162 -3.84333,-2.96708 -3.00868,-1.11927 -2.87757,-1.32714 2.41901,-3.83543 l 5.60009,-2.65203 0.0658,-10.48115 c 0.0362,-5.76464 0.80801,-12.21342 1.71514,-14.33062 1.75429,-4.09446 0.85619,-12.2508 -1.34896,-12.2508 -2.56918,0 -0.50559,-7.66221 2.20204,-8.17625 3.30632,-0.62769 9.26614,2.46616 9.26614,4.81023 0,0.96851 2.03749,2.77736 4.52777,4.01967 4.1941,2.0923 4.65467,2.08522 6.24961,-0.096 0.94701,-1.29511 1.91408,-2.93148 2.14904,-3.63636 0.87908,-2.63724 4.99035,0.6111 5.78177,4.56823 0.47821,2.39104 1.71524,4.11056 2.95715,4.11056 2.57865,0 2.64428,0.62259 0.438,4.1554 -2.13362,3.41648 -1.07324,4.47974 5.15176,5.16573 3.73502,0.41159 4.94541,0.0229 4.94541,-1.58803 0,-2.76155 3.34888,-2.74551 5.64992,0.0271 0.98599,1.18804 2.77746,1.97043 3.98105,1.73864 2.21806,-0.42717 11.36936,8.55394 11.36936,11.15791 0,2.02703 5.44839,3.55814 11.44573,3.21647 4.20791,-0.23973 5.59365,0.39062 7.60414,3.45903 2.10089,3.20635 3.15792,3.63868 7.26634,2.97198 3.29791,-0.53518 5.48209,-0.10594 6.95479,1.36677 1.18084,1.18083 3.35162,1.83195 4.82396,1.44693 3.44847,-0.9018 4.98258,2.85569 2.08218,5.09996 -2.2483,1.73969 -5.92049,13.30572 -4.63325,14.59296 0.40005,0.40005 -1.41228,3.52957 -4.02739,6.95448 -2.61512,3.42492 -4.4432,7.03903 -4.0624,8.03137 0.4084,1.06428 -1.12151,2.55558 -3.73033,3.63619 -4.2944,1.7788 -4.39719,2.02414 -3.54372,8.45793 0.76463,5.76401 0.41751,7.17441 -2.66821,10.84159 -3.00677,3.57334 -4.50351,4.20113 -9.82433,4.12069 -3.99263,-0.0604 -7.21083,0.75007 -8.8426,2.2268 -1.41099,1.27694 -3.21135,2.3217 -4.0008,2.3217 -0.78944,0 -3.01988,1.41752 -4.95652,3.15005 -1.93664,1.73253 -5.45496,4.20103 -7.81847,5.48557 l -4.2973,2.33552 -0.96982,-4.41555 c -1.63735,-7.45481 -6.16593,-8.6531 -16.56878,-4.38418 -2.44075,1.00159 -2.58898,0.61127 -1.75305,-4.61633 0.50222,-3.14074 1.29487,-6.70521 1.76143,-7.92105 1.0748,-2.8009 -2.9825,-4.52467 -5.57859,-2.37011 -1.04536,0.86757 -2.2306,4.03733 -2.63387,7.04392 -0.52031,3.87925 -2.09528,6.68353 -5.42413,9.65786 -2.58001,2.30524 -5.00931,3.679 -5.39844,3.0528 -0.38913,-0.6262 -1.94093,-1.35902 -3.44843,-1.62848 -2.28461,-0.40838 -2.81658,0.43048 -3.1954,5.03882 -0.53875,6.55398 -0.72841,6.84696 -2.97668,4.59807 z", name : "Поморавље" }, "18" : { path : "m 618.08098,664.43062 c -1.65785,-1.43784 -3.01427,-3.32787 -3.01427,-4.20007 0,-0.87218 -1.26002,-1.5858 -2.80004,-1.5858 -1.55558,0 -2.80004,0.93335 -2.80004,2.10003 0,2.67158 -2.88266,2.6917 -6.38252,0.0445 -1.4947,-1.13051 -4.05801,-2.07553 -5.69625,-2.10003 -4.49368,-0.0672 -6.42557,-3.30022 -5.36144,-8.97248 0.79272,-4.22556 0.37018,-5.45597 -2.92114,-8.50625 -3.8458,-3.56418 -9.03912,-4.80867 -9.03912,-2.1661 0,2.15136 -2.33398,1.66608 -5.05015,-1.05002 -1.76415,-1.7641 -4.34483,-2.36717 -9.2176,-2.15407 -5.23156,0.2288 -7.93692,-0.49763 -11.92013,-3.20071 -2.83395,-1.92316 -6.13365,-3.29722 -7.33266,-3.05344 -1.30411,0.26513 -3.02381,-1.29596 -4.28006,-3.88532 -1.15502,-2.38069 -4.15339,-6.80302 -6.66305,-9.82739 -3.8267,-4.61154 -4.95627,-5.24416 -7.00011,-3.92041 -2.39036,1.54818 -2.62629,2.75472 -1.56533,8.00536 0.29054,1.43789 -0.55732,3.31401 -1.88412,4.16915 -2.75613,1.77635 -5.28337,-0.6913 -8.73963,-8.53352 -2.05353,-4.65944 -4.20758,-5.40292 -13.58063,-4.68741 -2.69252,0.20554 -3.98869,-0.52292 -4.65263,-2.6148 -0.50618,-1.59484 -2.76421,-4.9185 -5.01784,-7.38591 -2.25363,-2.46741 -4.09751,-5.50081 -4.09751,-6.7409 0,-1.24008 -0.43624,-2.69094 -0.96942,-3.22412 -1.78559,-1.78559 -1.90799,-6.9843 -0.18945,-8.04642 1.30567,-0.80695 1.32469,-1.87349 0.082,-4.60078 -1.01072,-2.2183 -1.11217,-3.86271 -0.2704,-4.38295 2.34454,-1.44902 1.47739,-4.10092 -2.91268,-8.90742 -3.66036,-4.00759 -3.96479,-4.88891 -2.16307,-6.26211 1.15326,-0.87896 2.77311,-3.41875 3.59968,-5.64397 1.18427,-3.18819 1.06425,-4.53051 -0.56614,-6.33208 -2.50595,-2.76903 -1.46263,-4.63658 4.08944,-7.32015 3.01825,-1.45885 4.10623,-2.89845 3.86657,-5.1162 -0.18342,-1.69737 0.28908,-3.08612 1.05002,-3.08612 0.76093,0 1.40342,-0.78752 1.42776,-1.75003 0.0243,-0.96252 1.63746,-3.56199 3.58473,-5.77661 2.90939,-3.30882 4.8271,-4.09599 10.75832,-4.41602 6.48627,-0.34998 7.68699,0.0662 11.84677,4.10664 2.54593,2.47285 6.9111,5.32132 9.7004,6.32994 4.55071,1.64556 5.21578,1.57595 6.47715,-0.67799 1.2083,-2.15912 1.74507,-1.64387 3.8224,3.66923 3.44592,8.81344 12.82173,14.12878 14.66695,8.31499 0.48879,-1.54002 2.10627,-2.80004 3.5944,-2.80004 2.11879,0 2.70617,-0.98699 2.70788,-4.55007 0.001,-2.50254 1.23502,-6.75511 2.74183,-9.45016 1.50681,-2.69504 3.15434,-6.00259 3.66117,-7.35011 0.50683,-1.34752 1.79304,-2.45004 2.85825,-2.45004 1.26438,0 1.9153,-1.57963 1.87496,-4.55007 -0.0879,-6.47191 -3.41503,-18.30921 -5.32519,-18.94593 -2.31089,-0.7703 -1.99125,-4.05978 0.4869,-5.01073 1.15502,-0.44322 2.10003,-1.76053 2.10003,-2.92736 0,-1.76048 0.95825,-1.62204 5.63098,0.81353 4.60223,2.39881 7.00782,2.763 13.16729,1.99343 6.2853,-0.7853 7.96508,-0.51035 10.11928,1.65632 1.42062,1.42886 4.31548,3.34324 6.43302,4.25419 4.56998,1.96596 4.74388,3.02894 1.13011,6.90787 -2.57442,2.76332 -3.14159,9.01387 -1.01121,11.14425 1.95142,1.95141 0.81082,4.6645 -1.96097,4.6645 -5.47727,0 -8.30809,2.6094 -8.30809,7.65824 0,2.61782 -0.70408,6.53322 -1.56462,8.70088 -0.86054,2.16766 -1.76173,6.14624 -2.00264,8.84128 -0.90304,10.1019 -2.2362,16.7607 -3.51375,17.55027 -2.23672,1.38237 -1.46623,7.47698 1.72641,13.656 1.67505,3.24187 3.13378,7.15434 3.24162,8.69436 0.10784,1.54003 0.31236,4.19565 0.45451,5.90138 0.30738,3.68864 8.11695,12.99892 10.90364,12.99892 1.07525,0 1.9957,0.47251 2.04543,1.05002 0.0498,0.57751 0.36337,4.51507 0.69695,8.75014 1.10619,14.04378 2.17881,18.82837 5.96331,26.60042 2.66707,5.47722 4.65885,7.82928 6.89953,8.1475 1.73253,0.24605 3.15005,1.32641 3.15005,2.40079 0,2.49303 4.37956,4.85196 9.00811,4.85196 1.97565,0 3.59209,0.48816 3.59209,1.0848 0,1.44378 -13.87113,15.71546 -15.27438,15.71546 -0.60361,0 -2.45386,-1.17641 -4.11171,-2.61426 z", name : "Зајечар" }, "19" : { path : "m 277.15835,780.19301 c -1.38892,-0.77727 -3.68377,-1.11028 -5.09966,-0.74002 -3.0908,0.80826 -3.97324,-2.31355 -3.37972,-11.95651 0.26747,-4.34573 -0.16715,-6.72604 -1.25425,-6.86924 -0.91495,-0.12054 -3.33993,-0.34083 -5.38883,-0.48957 -2.0489,-0.14874 -8.90392,-2.91713 -15.23337,-6.15198 -8.4273,-4.30701 -12.51253,-5.66093 -15.26007,-5.05748 -2.98114,0.65477 -4.06795,0.16601 -5.29,-2.37902 -2.54777,-5.30594 -3.13223,-7.97483 -1.91162,-8.72922 0.63692,-0.39363 1.51052,-2.47807 1.94131,-4.63206 1.06253,-5.31262 6.17917,-11.54216 9.48016,-11.54216 1.48414,0 2.77718,-0.63001 2.87344,-1.40002 0.65856,-5.26854 2.86189,-8.40014 5.91016,-8.40014 1.64206,0 5.6875,-1.10251 8.98988,-2.45003 6.54225,-2.66954 7.56746,-6.41425 2.54808,-9.30717 -1.47246,-0.84865 -3.93622,-2.74676 -5.47504,-4.218 -2.79537,-2.67263 -2.79517,-2.67717 0.22716,-5.12449 1.66375,-1.34723 3.025,-3.42139 3.025,-4.60925 0,-2.99511 2.99848,-9.29161 4.42479,-9.29161 0.64641,0 1.1753,0.71806 1.1753,1.59568 0,2.10336 4.29807,5.30372 7.19834,5.3599 1.30431,0.0253 2.67818,-1.46918 3.17672,-3.45553 0.48315,-1.92503 1.71035,-3.50005 2.7271,-3.50005 1.01675,0 2.56626,-1.57503 3.44336,-3.50006 0.87711,-1.92503 2.45213,-3.50005 3.50006,-3.50005 2.40737,0 5.53488,-6.66124 4.15753,-8.85505 -0.56808,-0.90482 -0.85148,-2.74764 -0.6298,-4.09516 0.22169,-1.34752 -0.12745,-2.45004 -0.77588,-2.45004 -0.64841,0 -1.13777,-3.62255 -1.08744,-8.05013 0.0777,-6.84041 -0.53845,-8.89166 -4.1005,-13.65021 -2.3056,-3.08005 -5.3209,-6.42333 -6.70068,-7.42951 -3.27478,-2.38808 -3.19848,-5.46308 0.16203,-6.52966 2.8824,-0.91484 4.00877,-2.94864 5.81148,-10.49332 0.75948,-3.17861 0.61416,-5.50911 -0.42134,-6.75681 -1.83417,-2.21004 0.59137,-4.3432 5.23936,-4.60779 10.62316,-0.60473 9.83242,0.025 9.4328,-7.5117 -0.20205,-3.81052 -1.1418,-7.40684 -2.08834,-7.99183 -2.57627,-1.59223 0.20044,-3.70088 6.63339,-5.03745 4.69456,-0.97539 5.66302,-1.80238 6.41471,-5.47773 0.48694,-2.3809 2.19413,-5.73371 3.79374,-7.4507 1.59962,-1.71698 2.59718,-3.9328 2.21681,-4.92402 -0.38037,-0.99123 1.02674,-3.39555 3.1269,-5.34293 3.65116,-3.38555 3.9601,-3.43788 7.05056,-1.19425 1.77764,1.29055 3.25187,3.232 3.27607,4.31434 0.0744,3.3282 7.03122,11.33232 9.84952,11.33232 1.46461,0 4.30279,-0.74717 6.30706,-1.66037 2.95128,-1.3447 3.56272,-2.47598 3.21593,-5.9501 -0.41214,-4.12872 -0.22251,-4.28971 5.05292,-4.28971 3.01462,0 5.73389,-0.7552 6.04282,-1.67821 1.21356,-3.62587 8.46445,5.21837 9.40158,11.46751 0.50162,3.3451 1.82618,6.84066 2.94346,7.76792 2.49296,2.06898 2.65611,4.26806 0.28139,3.79311 -1.74115,-0.34823 -1.98049,0.44657 -2.28855,7.60012 -0.0888,2.06254 -1.10651,4.69508 -2.26152,5.8501 -2.61065,2.61064 -2.75593,7.90012 -0.21699,7.90012 1.03568,0 3.02932,1.26662 4.43033,2.81472 2.47152,2.73101 2.45397,2.91404 -0.59059,6.15483 -2.69287,2.86642 -3.00044,4.25662 -2.16876,9.8027 0.53303,3.55442 1.52644,6.80702 2.20761,7.22801 2.56973,1.58818 1.07068,3.30481 -3.66111,4.1925 -4.08774,0.76686 -5.34714,0.37142 -7.60074,-2.3866 -2.10279,-2.57345 -3.07855,-2.93489 -4.40474,-1.63157 -0.94346,0.92719 -3.41072,1.33276 -5.52967,0.90897 -4.70226,-0.94045 -6.26824,1.2181 -3.94515,5.43803 2.26381,4.11224 2.30158,6.0866 0.2576,13.46508 -0.92727,3.34732 -1.34007,6.98738 -0.91733,8.08902 1.04719,2.72894 5.38519,4.88837 7.88953,3.92736 1.58047,-0.60648 2.17015,0.68382 2.56155,5.60511 0.27965,3.51613 0.0314,6.39296 -0.55165,6.39296 -0.58306,0 -1.06011,0.94501 -1.06011,2.10003 0,1.15502 -0.67818,2.10003 -1.50708,2.10003 -0.90672,0 -1.33619,2.36673 -1.07811,5.94121 0.4051,5.61054 0.19677,5.985 -3.743,6.72794 -2.48512,0.46863 -4.00435,1.54115 -3.75741,2.65258 0.31094,1.39949 -0.8526,1.66022 -4.65516,1.04316 -4.50691,-0.73137 -5.54041,-0.28661 -9.30973,4.0064 -3.72547,4.24309 -5.05372,4.82911 -10.94531,4.82911 -4.49473,0 -6.9563,0.65413 -7.46669,1.98417 -0.41876,1.09129 0.0949,2.31278 1.14157,2.7144 1.08509,0.4164 1.59896,1.89272 1.19563,3.43504 -0.53175,2.03342 0.20253,2.93316 2.95824,3.6248 2.01606,0.506 4.20765,2.34581 4.87021,4.08849 0.66256,1.74266 2.21531,4.00724 3.45054,5.03239 3.2016,2.65709 2.82337,7.23228 -0.67348,8.14673 -2.43607,0.63704 -2.78066,1.50282 -2.0815,5.22968 0.64449,3.43542 0.0935,5.33248 -2.38704,8.21932 -2.23769,2.60417 -3.67173,3.30626 -4.68451,2.29348 -2.12382,-2.12382 -5.22641,-0.47185 -8.03114,4.27619 -1.35031,2.28588 -3.58187,4.15616 -4.95901,4.15616 -4.40138,0 -10.67305,10.246 -7.60544,12.42498 0.6777,0.48137 2.33995,2.61582 3.69389,4.74321 2.41156,3.78916 2.39663,3.89279 -0.73234,5.0855 -1.75674,0.66964 -4.78658,2.8125 -6.73299,4.76193 -2.77836,2.78267 -4.08164,3.24069 -6.06423,2.13117 z", name : "Рашка" }, "20" : { path : "m 354.16257,709.74556 c -1.15502,-1.15502 -2.98505,-2.10003 -4.06673,-2.10003 -2.84944,0 -3.62519,-1.19376 -2.80756,-4.3204 0.52952,-2.0249 1.47029,-2.52051 3.53842,-1.86411 2.50883,0.79627 2.70773,0.45583 1.81741,-3.11079 -0.54985,-2.2027 -2.00965,-5.12549 -3.24399,-6.49509 -2.54605,-2.82502 -4.01924,-17.81015 -1.75092,-17.81015 0.77731,0 1.41329,-0.94501 1.41329,-2.10003 0,-1.15502 0.60033,-2.10003 1.33406,-2.10003 1.20289,0 0.45277,-13.79835 -0.83089,-15.28426 -0.43351,-0.50181 -2.65549,-0.88891 -8.03222,-1.39934 -0.67946,-0.0645 -0.74776,-2.7771 -0.15276,-6.06676 1.67937,-9.28501 1.79955,-12.76564 0.52642,-15.24622 -0.94903,-1.84912 -0.29924,-2.43143 3.33851,-2.99179 2.80586,-0.43222 5.37753,0.0609 6.78887,1.30184 2.73323,2.40317 11.93965,2.06154 14.08433,-0.52264 1.1048,-1.3312 0.85172,-3.93924 -0.93281,-9.61273 l -2.44896,-7.78588 3.70643,-3.86868 c 3.48816,-3.64085 3.87173,-8.52465 0.66952,-8.52465 -0.68763,0 -2.459,-1.20877 -3.93637,-2.68614 -2.58945,-2.58945 -2.59492,-2.7687 -0.15188,-4.97963 1.40795,-1.27417 2.23472,-3.43896 1.86028,-4.87085 -0.3707,-1.41756 0.002,-3.84011 0.82777,-5.38345 1.18119,-2.20709 2.62762,-2.70257 6.77596,-2.32113 12.71287,1.16895 18.78669,2.45319 20.71304,4.37954 3.121,3.121 7.03881,1.7253 6.57548,-2.34248 -0.61078,-5.36234 0.69845,-7.66079 3.18719,-5.59532 1.69234,1.40452 2.9698,0.92452 7.03226,-2.64237 5.46232,-4.79598 6.37393,-5.09158 8.65799,-2.80753 1.13483,1.13483 2.95375,1.08823 6.77727,-0.17365 4.53337,-1.49614 5.39582,-1.42159 6.5061,0.56237 1.44533,2.58266 7.89111,9.26032 8.93876,9.26032 0.3771,0 2.20795,-0.99746 4.06857,-2.21658 3.12136,-2.0452 3.6554,-2.01813 6.90685,0.35001 3.7781,2.75171 5.05209,7.93143 1.62758,6.61732 -1.28899,-0.49463 -2.81818,0.99575 -4.36392,4.25313 -1.94001,4.08828 -2.05202,5.40928 -0.60635,7.1512 0.97527,1.17514 1.89541,3.84858 2.04475,5.94097 0.14933,2.0924 0.37013,4.89488 0.49066,6.22773 0.12052,1.33285 1.79416,2.81867 3.71919,3.30183 2.19024,0.54971 3.50005,1.8695 3.50005,3.52672 0,1.45655 0.73502,2.64827 1.63336,2.64827 0.89835,0 1.20759,0.42577 0.68721,0.94616 -0.52039,0.52038 0.33744,2.31247 1.90627,3.98242 2.6921,2.86561 2.64015,7.67162 -0.0829,7.67162 -1.81095,0 -1.17349,8.69107 0.94477,12.88069 2.57543,5.09383 2.52319,5.252 -2.28864,6.92941 -2.31004,0.80529 -4.20007,2.33553 -4.20007,3.40056 0,1.99419 -6.18338,4.27983 -9.65963,3.5706 -1.07773,-0.21988 -2.73822,-1.17851 -3.69,-2.13028 -2.8463,-2.8463 -19.34196,-1.66346 -25.22726,1.80895 -2.74112,1.6173 -5.79521,2.94054 -6.78687,2.94054 -2.44818,0 -6.43706,4.59247 -6.43706,7.4111 0,1.2598 -1.18755,2.9261 -2.639,3.70289 -1.45145,0.7768 -3.07472,3.14837 -3.60725,5.27017 -0.85561,3.409 -8.27069,11.61629 -10.49503,11.61629 -0.4602,0 -1.91559,-1.26002 -3.2342,-2.80005 -2.6119,-3.05047 -5.93371,-3.6511 -7.36697,-1.33204 -0.62536,1.01186 -1.49328,0.98167 -2.79318,-0.0972 -2.55537,-2.12077 -7.86888,0.66881 -6.76304,3.55059 0.43872,1.14326 0.10025,2.07867 -0.75214,2.07867 -0.92643,0 -1.54981,2.81568 -1.54981,7.00011 0,3.85006 -0.61384,7.00011 -1.36407,7.00011 -0.75024,0 -2.34145,1.89003 -3.53601,4.20007 -2.44379,4.72577 -3.76603,5.1341 -6.80011,2.10003 z", name : "Расина" }, "21" : { path : "m 562.56588,727.45629 c -6.54562,-2.12837 -21.70034,-15.10154 -21.70034,-18.57653 0,-0.85761 -1.03079,-1.13826 -2.33811,-0.63659 -1.28596,0.49347 -2.80226,0.14622 -3.36954,-0.77168 -0.77568,-1.25506 -2.24451,-1.09325 -5.92361,0.65259 -5.99597,2.84528 -6.24138,2.84915 -8.94959,0.14094 -1.29525,-1.29525 -3.10196,-1.77704 -4.45007,-1.18668 -1.24823,0.54662 -4.15955,1.23896 -6.46958,1.53851 -3.77957,0.49012 -4.47553,-0.0568 -6.95142,-5.46342 -1.51325,-3.30444 -2.8314,-8.11451 -2.92923,-10.68904 -0.18354,-4.83025 -2.31044,-7.16051 -6.56962,-7.19778 -1.34752,-0.0118 -2.45003,-0.65145 -2.45003,-1.42146 0,-0.77001 -0.91647,-1.40002 -2.0366,-1.40002 -1.2272,0 -2.40973,1.98898 -2.97547,5.00465 -0.66943,3.56833 -1.3707,4.57284 -2.44348,3.50006 -0.82753,-0.82753 -2.56147,-1.5046 -3.85321,-1.5046 -1.29174,0 -3.12672,-0.93756 -4.07774,-2.08347 -1.40034,-1.6873 -1.29983,-2.2482 0.52859,-2.94983 3.13192,-1.20183 2.83834,-4.76686 -0.39255,-4.76686 -3.35473,0 -4.97362,-3.3778 -5.01633,-10.4665 -0.0233,-3.86569 -0.67517,-5.65646 -2.13357,-5.86112 -1.15502,-0.16208 -5.16265,-0.69885 -8.90584,-1.19281 -6.76775,-0.8931 -6.78733,-0.91074 -3.50006,-3.15453 1.81817,-1.24102 3.80957,-3.08194 4.42534,-4.09093 0.61577,-1.00899 2.04889,-1.83453 3.1847,-1.83453 2.81287,0 5.32554,-6.77499 3.38145,-9.11748 -2.53573,-3.05537 -2.94864,-11.40474 -0.65803,-13.30578 2.6657,-2.21233 2.65272,-6.15276 -0.0276,-8.37723 -1.15502,-0.95858 -2.10004,-2.57944 -2.10004,-3.60191 0,-1.02247 -0.78751,-2.36286 -1.75003,-2.97863 -0.96251,-0.61577 -1.75002,-2.0646 -1.75002,-3.21961 0,-1.15502 -1.41753,-2.30136 -3.15005,-2.54742 -3.5123,-0.49882 -3.95063,-1.69209 -1.51592,-4.12679 1.24549,-1.2455 1.08092,-1.84642 -0.69197,-2.52674 -1.27936,-0.49094 -2.04696,-1.34428 -1.70578,-1.89631 0.34117,-0.55203 -0.22887,-2.64051 -1.26677,-4.64105 -1.6706,-3.2201 -1.57582,-3.97146 0.8262,-6.54973 1.49231,-1.6018 3.31875,-2.91236 4.05877,-2.91236 1.5113,0 1.78708,-4.22031 0.49569,-7.58562 -0.46739,-1.218 -1.72741,-2.21454 -2.80005,-2.21454 -1.07263,0 -1.95025,-1.20016 -1.95025,-2.66701 0,-3.87044 11.25477,-10.02675 19.44539,-10.63656 5.6487,-0.42055 7.30605,0.0659 10.58604,3.10731 3.37975,3.13388 3.59299,3.77149 1.62894,4.87063 -2.81988,1.57808 -2.86964,3.51587 -0.15986,6.22564 1.86669,1.8667 1.86132,2.33874 -0.0483,4.2484 -1.3566,1.35659 -1.68186,2.73865 -0.88257,3.75006 0.69619,0.88093 1.68074,3.90687 2.18789,6.7243 0.54042,3.00226 2.70696,6.86765 5.23423,9.33853 2.37169,2.31876 3.93434,4.82725 3.47256,5.57443 -1.16089,1.87836 5.50861,6.0179 8.0961,5.02499 1.15849,-0.44456 2.92403,-0.27995 3.92342,0.36579 0.99939,0.64574 3.0456,1.17408 4.54714,1.17408 1.57349,0 3.05628,1.22121 3.50006,2.88261 0.42349,1.58544 2.11862,4.57538 3.76695,6.64431 2.71532,3.40817 3.60344,3.67856 9.45015,2.87718 3.54925,-0.48648 6.45318,-1.45439 6.45318,-2.15092 0,-0.69653 -1.37276,-3.12319 -3.0506,-5.39258 -1.67783,-2.26938 -2.64873,-4.52801 -2.15757,-5.01918 1.14293,-1.14293 8.65492,7.71903 8.68531,10.24614 0.0126,1.04819 0.96794,2.50521 2.12295,3.2378 1.15502,0.7326 1.55039,1.34164 0.87859,1.35343 -0.67179,0.0118 -0.42534,0.98068 0.54767,2.15309 1.04419,1.25816 2.86272,1.78454 4.43799,1.28457 1.71829,-0.54537 4.4376,0.502 7.63476,2.9406 4.21702,3.21647 5.87326,3.66329 10.98281,2.96295 5.29154,-0.72528 6.10943,-0.47095 6.78429,2.10971 0.50253,1.92167 1.5055,2.65117 2.90608,2.11371 1.1763,-0.45138 2.51108,-0.2182 2.96619,0.51818 1.30713,2.11498 4.86229,1.55845 4.86229,-0.76116 0,-2.71167 1.3572,-2.61268 5.2255,0.38114 l 3.12547,2.41891 -2.37003,11.4314 c -2.34133,11.29293 -2.42555,11.43789 -6.95251,11.96638 -2.59907,0.30343 -6.8215,-0.5541 -9.75556,-1.98125 -2.8452,-1.38393 -7.66627,-2.51623 -10.71349,-2.51623 l -5.5404,0 0.89214,6.50886 c 0.49068,3.57987 1.61481,7.37963 2.49808,8.44389 1.23518,1.4883 1.09037,2.32895 -0.62724,3.6413 -1.22824,0.93845 -3.14957,4.41721 -4.26962,7.73057 -1.92475,5.69386 -1.87596,6.17382 0.8894,8.75014 1.60921,1.49921 3.59456,2.75145 4.41188,2.78274 0.81732,0.0314 3.66727,1.92132 6.33323,4.20006 2.90784,2.4855 6.44181,4.14317 8.83276,4.14317 2.19207,0 3.62311,0.58649 3.1801,1.30328 -0.44301,0.71681 -0.16519,1.69901 0.61739,2.18267 2.51366,1.55352 1.52459,4.38659 -2.23363,6.39793 -2.01106,1.07628 -4.2005,3.38777 -4.86542,5.13665 -1.23243,3.24153 -2.61408,3.60437 -7.57835,1.99019 l 0,0 z", name : "Нишава" }, "22" : { path : "m 622.11135,770.99653 c -0.0288,-1.13026 -2.24341,-1.75002 -6.25348,-1.75002 -7.7494,0 -12.07125,-1.60721 -16.65929,-6.19526 -3.47425,-3.47424 -3.50024,-3.63051 -0.8408,-5.0538 2.11617,-1.13254 2.43374,-2.04901 1.38747,-4.00399 -1.61987,-3.02676 -19.33547,-11.77881 -21.87201,-10.80545 -0.97648,0.37471 -2.12279,-0.22394 -2.54736,-1.33034 -0.42456,-1.1064 -2.10423,-2.01163 -3.73258,-2.01163 -3.68622,0 -2.95573,-2.99865 1.18649,-4.87051 4.13371,-1.86802 5.0037,-4.83748 2.2944,-7.83123 -2.10809,-2.32941 -1.96968,-2.64649 2.06628,-4.73356 4.56745,-2.36193 5.28333,-5.06408 2.96034,-11.17402 -1.05029,-2.76246 -2.3426,-3.59119 -5.60009,-3.59119 -2.32909,0 -4.23472,-0.63001 -4.23472,-1.40002 0,-0.77002 -0.59842,-1.40003 -1.32983,-1.40003 -1.89918,0 -14.07041,-8.38244 -14.07041,-9.69042 0,-3.06017 3.24402,-9.78834 4.58962,-9.51898 2.56266,0.51298 2.78922,-4.46518 0.42953,-9.43787 -2.66893,-5.62435 -2.84375,-9.09578 -0.46908,-9.31455 3.72761,-0.3434 7.3902,0.5142 8.27637,1.93791 0.50944,0.81847 5.21682,1.54105 10.46084,1.60575 8.50073,0.10486 9.58271,-0.18599 9.97843,-2.68243 1.48706,-9.38134 1.43897,-9.32505 5.96651,-6.98377 2.29266,1.18558 4.16847,1.78869 4.16847,1.34025 0,-0.44844 1.4002,0.16539 3.11156,1.36407 3.64225,2.55113 9.02459,2.87154 9.78756,0.58265 0.31513,-0.9454 2.15943,-0.0887 4.52117,2.10004 4.4089,4.08603 14.35327,5.4519 12.94338,1.77779 -1.08117,-2.81747 9.01473,-11.96453 11.64724,-10.55261 1.14938,0.61645 4.37658,1.48406 7.17155,1.928 3.89086,0.61802 5.98605,2.11208 8.94054,6.37541 2.12233,3.06253 4.37355,5.56823 5.00272,5.56823 0.62916,0 2.17093,2.36254 3.42616,5.25008 1.25522,2.88755 2.86131,6.1951 3.56908,7.35012 0.70777,1.15502 1.87236,3.44547 2.58798,5.08988 1.90109,4.36853 11.45306,13.23198 14.00245,12.99314 1.20451,-0.11284 2.84992,-0.13262 3.65647,-0.0439 1.26657,0.13925 1.61811,6.10004 0.85479,14.49389 -0.12166,1.33786 -2.66576,3.97565 -5.65355,5.86176 -2.98778,1.88611 -6.06327,5.20156 -6.83442,7.36768 -1.5499,4.35361 -10.14727,13.79392 -15.99392,17.56207 -2.89143,1.86351 -3.97786,3.96624 -4.70183,9.10014 -1.28674,9.12454 -3.93846,13.01984 -8.60057,12.63399 -2.04641,-0.16936 -3.95826,0.40462 -4.24856,1.27553 -0.36692,1.10076 -1.89051,0.90366 -4.99806,-0.64659 -5.52754,-2.7575 -12.04128,-2.39598 -14.47124,0.80318 -1.13259,1.49112 -1.84806,1.74313 -1.8756,0.66067 l 0,-10e-6 z", name : "Пирот" }, "23" : { path : "m 431.3138,773.87752 c -1.34753,-0.34994 -2.45004,-1.77133 -2.45004,-3.15864 0,-2.88654 -8.0357,-5.19686 -10.27766,-2.9549 -1.74863,1.74863 -8.1202,-9.99845 -7.7536,-14.29508 0.50635,-5.93442 -0.17738,-9.23114 -2.36907,-11.42283 -3.10478,-3.10478 -6.07685,-2.73113 -7.55649,0.95002 -1.23071,3.06185 -1.26865,3.04552 -1.35491,-0.58334 -0.0488,-2.05337 -0.71669,-3.9434 -1.48419,-4.20007 -0.7675,-0.25667 -1.66997,-4.08055 -2.00549,-8.49751 -0.68495,-9.01708 -1.54616,-11.11828 -4.32676,-10.55659 -1.05405,0.21293 -2.8887,-0.87288 -4.07699,-2.41291 -2.14654,-2.78193 -2.17689,-2.77917 -4.69182,0.42655 l -2.5313,3.22658 -2.60327,-2.87658 c -2.78644,-3.07898 -11.10913,-4.00123 -12.71148,-1.40858 -0.62314,1.00827 -1.50968,0.96806 -2.83082,-0.12839 -1.61881,-1.3435 -1.54748,-2.18598 0.45031,-5.31806 1.30562,-2.04692 3.46724,-4.53084 4.8036,-5.51983 1.75969,-1.30227 2.20121,-2.94084 1.60104,-5.94171 -0.45579,-2.27895 -0.0258,-6.08184 0.95544,-8.45087 1.45065,-3.50217 2.38295,-4.15703 4.9876,-3.5033 1.76507,0.443 3.65225,0.0779 4.20297,-0.81324 0.69873,-1.13057 1.5468,-0.8688 2.81815,0.86988 1.00024,1.36792 3.4189,2.48712 5.3748,2.48712 4.65247,0 12.81097,-6.29437 13.9282,-10.74576 0.48394,-1.92817 2.50514,-5.13101 4.49155,-7.11743 1.99206,-1.99205 3.26346,-4.51908 2.83518,-5.63517 -0.52081,-1.3572 0.47498,-2.32592 3.02415,-2.94194 2.09035,-0.50515 5.52644,-2.1247 7.63575,-3.59901 4.63562,-3.24009 21.60648,-4.33217 22.70677,-1.46119 0.36887,0.96252 2.23417,1.75003 4.14511,1.75003 1.91093,0 4.0523,1.0326 4.75859,2.29467 0.86112,1.53874 3.76017,2.49317 8.8002,2.89721 8.5784,0.68771 9.24635,1.02691 7.1044,3.6078 -1.9021,2.29189 2.12151,12.20066 4.95427,12.20066 1.44407,0 1.47352,0.55512 0.14255,2.68636 -1.31494,2.10554 -1.29301,3.14984 0.10143,4.83003 1.67966,2.02387 12.52775,7.88385 14.59472,7.88385 0.5269,0 1.00774,-2.67754 1.06853,-5.95009 0.0608,-3.27256 0.42829,-5.16259 0.81668,-4.20007 0.38838,0.96251 2.1552,1.75003 3.92625,1.75003 3.51984,0 5.60016,4.38662 3.21259,6.77418 -0.94694,0.94694 -0.34069,2.91224 1.84545,5.98239 1.79063,2.51469 3.13774,5.99706 2.99361,7.7386 -0.14413,1.74154 0.35131,3.54552 1.10098,4.00884 2.31779,1.43247 -2.62808,7.31092 -6.86384,8.15808 -2.17319,0.43464 -5.86269,2.39862 -8.19889,4.3644 -2.3362,1.96578 -5.64105,3.57415 -7.3441,3.57415 -1.70306,0 -4.33538,1.57503 -5.84961,3.50006 -2.05998,2.61884 -4.07156,3.50005 -7.98969,3.50005 -3.99083,0 -6.19379,0.99915 -9.26046,4.20007 -2.21315,2.31004 -4.69356,4.2201 -5.51201,4.24459 -0.81846,0.0245 -2.67038,0.93978 -4.1154,2.03399 -2.5621,1.94009 -2.55625,2.10986 0.23577,6.84198 2.79843,4.74299 2.80368,4.90627 0.23282,7.23286 -1.44663,1.30918 -2.53523,2.77783 -2.4191,3.26365 0.11613,0.48583 -0.27394,2.93085 -0.86682,5.43339 -0.73273,3.0929 -1.90238,4.55007 -3.65225,4.55007 -1.41587,0 -3.41334,0.24012 -4.43883,0.5336 -1.0255,0.29348 -2.96705,0.24729 -4.31457,-0.10265 z", name : "Топлица" }, "24" : { path : "m 476.20735,816.49726 c -0.33557,-2.3391 -1.27156,-3.06245 -3.63577,-2.80976 -2.24692,0.24015 -3.55917,-0.64682 -4.45919,-3.01405 -1.66328,-4.37477 -3.55701,-5.43491 -10.45387,-5.85225 -8.64949,-0.5234 -22.60286,-4.10946 -20.66061,-5.30983 0.92857,-0.57389 1.41,-2.57817 1.06985,-4.45397 -0.34015,-1.87579 -0.0302,-3.41054 0.68886,-3.41054 0.71902,0 1.30731,-1.58357 1.30731,-3.51905 0,-1.93548 0.57705,-4.61302 1.28233,-5.9501 2.75759,-5.22786 5.71823,-12.74592 5.72701,-14.54281 0.005,-1.03865 1.22415,-3.73144 2.70906,-5.98399 2.45768,-3.72821 2.5145,-4.45392 0.63357,-8.09124 -2.1524,-4.16228 -1.63219,-6.71352 1.36892,-6.71352 0.96551,0 3.56624,-1.89003 5.77939,-4.20007 2.90695,-3.0342 5.32905,-4.20006 8.72571,-4.20006 3.04018,0 5.8403,-1.13852 7.92342,-3.22164 1.7719,-1.77191 3.99487,-2.96391 4.93992,-2.64889 0.94505,0.31502 4.03424,-1.27672 6.86488,-3.5372 2.83063,-2.26047 7.23591,-4.83032 9.7895,-5.71078 4.67983,-1.61355 9.92458,-6.62895 10.01076,-9.57299 0.0256,-0.87512 1.77911,-1.88853 3.89664,-2.25203 2.11753,-0.3635 4.84036,-1.08936 6.05073,-1.61302 1.53814,-0.66547 2.7119,0.16993 3.89881,2.77491 1.5356,3.37027 1.92799,3.52745 4.09943,1.64215 5.53966,-4.80969 16.11134,-3.57054 19.48198,2.28356 2.62812,4.5645 15.89149,13.43416 21.40808,14.3163 l 5.74398,0.9185 -3.07155,3.26952 c -2.54346,2.70739 -2.76605,3.63764 -1.29463,5.4106 0.97732,1.17759 2.88268,2.14107 4.23413,2.14107 1.35146,0 3.23573,0.93808 4.18727,2.08462 0.95156,1.14654 2.32674,1.71587 3.05597,1.26517 1.89476,-1.17102 9.20775,2.12076 10.14655,4.56725 0.4349,1.13333 1.41216,1.67652 2.1717,1.2071 1.68025,-1.03845 7.03894,1.64535 7.03894,3.52532 0,0.74292 -1.26002,1.35077 -2.80005,1.35077 -4.07698,0 -3.41254,2.87618 1.84389,7.98172 5.02141,4.87729 10.41577,7.41852 15.74753,7.41852 1.8749,0 3.40891,0.52019 3.40891,1.15598 0,2.14767 -6.25719,6.66894 -14.00019,10.11615 -4.23504,1.88546 -9.17363,5.16063 -10.97462,7.27817 -1.80099,2.11753 -4.41115,3.85006 -5.80033,3.85006 -1.3892,0 -2.88845,0.94501 -3.33168,2.10003 -1.38157,3.60034 -8.42351,2.4581 -13.95038,-2.26283 -2.80922,-2.39957 -4.76082,-4.92406 -4.33691,-5.60997 1.27905,-2.06955 -3.79008,-3.18643 -6.57328,-1.4483 -3.11651,1.94629 -4.48608,2.08571 -3.41168,0.3473 1.51649,-2.45373 -0.95302,-5.72643 -4.32103,-5.72643 -1.86974,0 -4.96853,1.02805 -6.88619,2.28455 -3.1075,2.03611 -3.74922,2.05598 -5.90084,0.18269 -2.99479,-2.60739 -5.91422,-1.70759 -5.91422,1.82282 0,2.8233 -2.09084,3.62148 -12.39677,4.73246 -10.14271,1.0934 -15.24088,3.34159 -16.19459,7.1415 -0.47435,1.88996 -1.48046,3.43629 -2.2358,3.43629 -0.75535,0 -1.37335,1.8543 -1.37335,4.12068 0,4.8577 -4.31895,8.47952 -10.11167,8.47952 -2.13871,0 -5.14858,1.26002 -6.6886,2.80004 -3.53381,3.53381 -3.90423,3.50472 -4.45723,-0.35 z", name : "Јабланица" }, "25" : { path : "m 476.46451,912.39718 c -9.62204,-3.22982 -10.35053,-3.72717 -12.52234,-8.54937 -1.14633,-2.54526 -2.78282,-4.19806 -3.77839,-3.81602 -2.11637,0.81212 -3.71058,-3.48323 -2.48153,-6.68609 0.48485,-1.26349 2.09394,-2.29726 3.57574,-2.29726 1.48181,0 3.021,-0.85162 3.42041,-1.89248 0.4335,-1.12966 2.05584,-1.63831 4.0249,-1.2619 2.6727,0.51092 3.74202,-0.30368 5.63491,-4.29264 2.07705,-4.37705 2.10982,-5.3553 0.29548,-8.81811 -1.95001,-3.72171 -1.81699,-4.16257 2.99156,-9.91514 2.76776,-3.31113 5.92265,-6.02024 7.01086,-6.02024 1.45989,0 1.75419,-1.12187 1.12265,-4.27956 -0.75802,-3.79012 -0.39379,-4.44064 3.1848,-5.68815 4.23482,-1.47626 6.53013,-6.27102 4.29263,-8.96704 -1.83164,-2.20699 1.41752,-10.27351 4.53691,-11.26357 3.20169,-1.01617 3.11193,-3.22983 -0.30825,-7.60228 -3.47567,-4.44338 -3.47567,-5.90464 0,-8.07523 1.69772,-1.06024 2.80004,-3.26489 2.80004,-5.60009 0,-2.38675 1.10939,-4.54426 2.9172,-5.67325 1.60446,-1.002 2.59142,-2.6708 2.19324,-3.70845 -0.82815,-2.15812 3.21761,-3.45783 13.78133,-4.42726 6.99483,-0.64191 13.30874,-3.56452 13.30874,-6.16039 0,-0.82754 1.02177,-0.74151 2.55339,0.215 1.99189,1.24396 3.66969,1.0649 7.62974,-0.81427 5.75178,-2.7294 8.09267,-2.04777 7.02243,2.04482 -0.59404,2.27161 -0.042,2.79865 2.93148,2.79865 2.01484,0 3.66334,-0.58234 3.66334,-1.29408 0,-1.18653 3.59725,1.40875 9.70408,7.00112 5.25551,4.81278 13.35102,5.74952 16.35067,1.89196 0.8549,-1.0994 2.53143,-1.99891 3.72561,-1.99891 1.19419,0 3.69435,-1.8101 5.55591,-4.02245 4.04088,-4.8023 9.46444,-8.07585 9.46444,-5.71253 0,0.86004 2.17452,5.27396 4.83226,9.8087 2.65773,4.53475 4.27266,8.59084 3.58871,9.01355 -2.76318,1.70774 -5.63081,9.51422 -4.15026,11.29817 0.86408,1.04116 0.93723,2.09203 0.17827,2.56109 -0.70789,0.4375 -1.68351,3.80114 -2.16805,7.47476 -0.48455,3.67361 -1.25519,8.95868 -1.71255,11.74458 -0.73478,4.47575 -0.44963,5.16121 2.45007,5.88946 1.80491,0.45329 6.06047,3.65604 9.4568,7.11722 l 6.17516,6.29304 -2.46565,10.46999 c -1.53224,6.50647 -3.07492,10.24761 -4.07511,9.88255 -0.88522,-0.32308 -2.2405,-0.12153 -3.01173,0.44788 -1.87595,1.38504 -4.96638,7.51431 -5.44991,10.80879 -0.5847,3.98382 -15.86709,6.97631 -19.4513,3.80881 -1.83806,-1.62437 -2.26128,-3.31297 -1.59295,-6.35582 0.90794,-4.13383 0.89717,-4.14168 -4.49704,-3.27949 -3.38111,0.54043 -6.47602,2.19237 -8.25979,4.40874 -1.56895,1.94946 -4.26626,3.54447 -5.99403,3.54447 -1.72777,0 -3.51793,0.98123 -3.97813,2.1805 -0.47403,1.2353 -1.74566,1.8317 -2.93356,1.37586 -1.15325,-0.44254 -2.89528,-0.14196 -3.87117,0.66796 -0.9759,0.80992 -4.91983,1.84512 -8.76429,2.30044 -6.26887,0.74245 -7.6603,0.36662 -13.48863,-3.64338 -7.60559,-5.23278 -11.13475,-5.14857 -11.76139,0.28064 -0.49877,4.32121 -4.34818,5.24313 -7.25713,1.73806 -2.84597,-3.42919 -7.96334,-2.63092 -8.97504,1.40002 -0.56283,2.2425 -1.86333,3.50006 -3.61956,3.50006 -1.5076,0 -3.77309,1.57502 -5.03442,3.50005 -1.35429,2.06691 -3.62191,3.50006 -5.53802,3.50006 -2.01511,0 -3.58147,1.06108 -4.13339,2.80004 -1.01074,3.18456 -0.68771,3.17219 -9.10015,0.34841 l 0,0 z", name : "Пчиња" }, "26" : { path : "m 280.81141,905.76146 c -2.50254,-1.08771 -4.55008,-2.59562 -4.55008,-3.35091 0,-0.7553 -1.38235,-1.81201 -3.0719,-2.34825 -1.68954,-0.53624 -4.10096,-2.24581 -5.35869,-3.79906 -1.71929,-2.12323 -2.88609,-2.48869 -4.70167,-1.47264 -1.32817,0.74328 -4.27184,1.07888 -6.54149,0.74576 -3.73066,-0.54754 -4.12662,-1.1113 -4.12662,-5.87542 0,-3.011 -0.91368,-6.02804 -2.13165,-7.03887 -1.1724,-0.973 -1.80115,-2.81038 -1.39722,-4.08306 0.40393,-1.27268 -1.75586,-7.39455 -4.79955,-13.60417 -4.36059,-8.89632 -6.46212,-11.67466 -9.9114,-13.1034 -4.62987,-1.91775 -9.13341,-7.40071 -7.82184,-9.52289 0.42907,-0.69424 0.24287,-3.13555 -0.41376,-5.42512 -0.92098,-3.21126 -0.59879,-4.937 1.40945,-7.54944 5.17062,-6.72624 3.56124,-8.58551 -13.08464,-15.11625 -6.03427,-2.36745 -4.28627,-10.95119 2.96695,-14.56957 3.71865,-1.85511 4.64947,-1.85654 8.141,-0.0126 2.16826,1.14512 7.56485,2.42365 11.99242,2.84118 6.83433,0.6445 8.05012,0.41262 8.05012,-1.53533 0,-1.26196 0.63001,-2.29448 1.40003,-2.29448 0.77001,0 1.40002,-0.65552 1.40002,-1.45671 0,-0.80119 1.3785,-3.32123 3.06333,-5.60009 2.32187,-3.1405 4.18563,-4.14337 7.70012,-4.14337 2.55024,0 4.63679,-0.63001 4.63679,-1.40003 0,-0.77001 1.57503,-1.40002 3.50006,-1.40002 1.92503,0 3.50005,-0.63001 3.50005,-1.40002 0,-1.93493 3.66684,-1.75334 7.06746,0.35 2.49327,1.54214 3.30292,1.2095 6.81547,-2.80004 2.19235,-2.50254 4.96845,-4.55007 6.16913,-4.55007 1.20068,0 2.48918,-0.49533 2.86334,-1.10073 1.73886,-2.81354 13.48518,0.85342 13.48518,4.2098 0,0.8858 1.20811,2.91116 2.68469,4.50082 2.40324,2.58727 2.52496,3.68916 1.16105,10.51074 -1.14744,5.73892 -1.11896,7.75536 0.11536,8.1668 2.61994,0.87331 1.89987,3.99831 -1.43089,6.20985 -2.98629,1.98283 -3.00605,2.17283 -0.72584,6.97801 3.02385,6.37229 5.39747,8.33984 8.04275,6.66679 3.45814,-2.18715 4.51162,-1.50922 3.76051,2.41996 -0.81081,4.24145 0.0492,7.43885 2.00094,7.43885 0.71983,0 2.62634,1.22749 4.23669,2.72776 2.17029,2.02193 4.05704,2.50423 7.29157,1.86391 3.98092,-0.78807 4.19195,-0.65509 2.4059,1.51607 -1.70007,2.06664 -1.62608,2.62244 0.5621,4.22248 1.81601,1.3279 2.05366,2.1307 0.8508,2.87411 -0.95534,0.59043 -1.28123,2.25346 -0.76211,3.88908 0.58273,1.83601 0.37796,2.53061 -0.57282,1.943 -0.81387,-0.503 -2.16355,0.36312 -2.99929,1.92471 -0.83574,1.56159 -2.63858,2.83925 -4.00632,2.83925 -2.68445,0 -8.61487,-4.85637 -8.61487,-7.05464 0,-1.66803 -7.95692,-1.79523 -8.97774,-0.14352 -0.40857,0.66108 -4.49896,1.54256 -9.08975,1.95884 -12.22696,1.1087 -17.4657,7.67759 -14.01567,17.57434 0.94028,2.69731 1.01028,5.2045 0.19028,6.81606 -2.40135,4.71942 0.72521,11.4483 7.5569,16.26372 5.92526,4.17651 6.13128,4.52589 3.09193,5.24338 -1.79098,0.4228 -3.25633,1.48061 -3.25633,2.35069 0,1.23644 -9.66475,8.97468 -10.91235,8.73716 -0.15831,-0.0301 -2.33536,-0.94474 -4.8379,-2.03245 z", name : "Пећ" }, "27" : { path : "m 328.76217,832.24751 c -1.39371,-1.54003 -3.36563,-2.80005 -4.38206,-2.80005 -1.30636,0 -1.60203,-1.23006 -1.00872,-4.19659 1.09508,-5.47542 -1.53656,-8.91571 -5.28533,-6.90942 -1.47509,0.78944 -3.29896,1.05402 -4.05306,0.58796 -1.79577,-1.10984 -1.77341,-8.66836 0.0289,-9.78227 1.72912,-1.06866 1.86797,-7.70012 0.16122,-7.70012 -0.68134,0 -0.92129,-3.95563 -0.53321,-8.79029 0.56175,-6.99821 0.24346,-9.17382 -1.56124,-10.67159 -1.24676,-1.03472 -2.26683,-2.70628 -2.26683,-3.71458 0,-2.36856 -7.91258,-8.02059 -10.17057,-7.26493 -0.95129,0.31835 -3.46215,-1.27386 -5.57968,-3.53825 -5.88576,-6.29396 -4.65433,-13.55943 2.10958,-12.44654 1.36478,0.22455 2.873,-0.72576 3.38836,-2.13497 0.51082,-1.39682 1.93794,-3.85958 3.17138,-5.47281 1.74845,-2.28685 2.75866,-2.60764 4.58463,-1.45584 3.26337,2.05848 12.47397,-7.22996 11.367,-11.46305 -0.41334,-1.5806 0.2567,-4.31327 1.48899,-6.0726 3.02573,-4.31984 2.81977,-8.61767 -0.55954,-11.6759 -1.54002,-1.3937 -2.80004,-3.68438 -2.80004,-5.09039 0,-1.5306 -1.34788,-2.89468 -3.3591,-3.39946 -2.04627,-0.51358 -3.60246,-2.11617 -3.98179,-4.10051 -0.55492,-2.90286 0.0328,-3.35573 5.39931,-4.16049 4.22082,-0.63295 7.03286,-2.10438 9.40164,-4.91952 3.02054,-3.5897 3.91199,-3.8964 8.38986,-2.88648 5.55004,1.25174 6.55043,0.7971 6.55043,-2.97692 0,-3.85997 2.05317,-3.1102 6.13394,2.23996 4.42401,5.80017 4.43069,5.86703 0.68434,6.84672 -1.99184,0.52088 -2.70368,1.50476 -2.14397,2.96333 0.46085,1.20095 0.22767,2.18355 -0.51818,2.18355 -0.74584,0 -1.35608,1.23147 -1.35608,2.73661 0,2.03072 1.29275,2.97912 5.01185,3.67683 2.75652,0.51713 5.34397,1.8057 5.74988,2.86348 0.40591,1.05779 1.61563,1.92326 2.68827,1.92326 1.07263,0 1.95024,0.52355 1.95024,1.16345 0,0.63989 1.69882,2.05741 3.77516,3.15005 5.34545,2.81294 10.22507,7.5538 10.22507,9.9343 0,2.86339 5.25115,13.3905 7.34883,14.73237 2.76169,1.76664 6.65139,9.61171 6.65139,13.41509 0,1.90444 -0.94502,4.24692 -2.10004,5.20549 -1.15501,0.95858 -2.10003,2.89502 -2.10003,4.30319 0,4.73724 4.18583,18.68294 6.21755,20.71466 1.75112,1.75112 1.52887,2.52665 -1.70634,5.95437 -2.38687,2.52889 -3.83632,5.76414 -4.04519,9.02905 -0.31368,4.90336 -1.33684,6.26284 -8.50534,11.30109 -3.53592,2.48516 -7.36092,1.67576 -7.36092,-1.55763 0,-2.9874 -5.52772,-2.67534 -9.72281,0.54889 -2.62332,2.01621 -4.22221,2.32663 -6.84591,1.3291 -3.94738,-1.50079 -8.63168,1.69235 -8.63168,5.88394 0,1.59043 -1.45091,2.7905 -4.06899,3.36552 -4.25227,0.93396 -6.51883,5.44731 -4.88012,9.7177 1.14762,2.99066 0.0989,2.78143 -2.95108,-0.58876 l 0,0 z", name : "Косовска Митровица" }, "28" : { path : "m 408.79677,946.11598 c -0.51334,-0.51334 -0.93335,-1.92134 -0.93335,-3.1289 0,-1.20755 -1.73252,-5.81314 -3.85006,-10.23465 -3.20322,-6.68848 -4.67331,-8.27843 -8.75014,-9.46351 -7.01127,-2.03807 -7.2798,-1.96533 -13.37663,3.62301 -10.33148,9.46983 -10.49168,9.50994 -13.52202,3.38508 -2.30666,-4.66217 -3.63345,-5.64024 -9.58954,-7.06907 -5.27643,-1.2658 -6.9125,-2.28796 -6.9125,-4.31869 0,-1.46322 0.72805,-2.66041 1.61788,-2.66041 0.88984,0 3.56738,-1.4639 5.9501,-3.25312 2.38272,-1.78921 5.36015,-3.63084 6.61653,-4.09253 2.96366,-1.08906 3.88825,-9.1092 2.07216,-17.97472 -1.1168,-5.45187 -2.00591,-6.91385 -4.28295,-7.04254 -2.45798,-0.13889 -2.50934,-0.25691 -0.35515,-0.81584 1.39332,-0.36151 2.34711,-1.69624 2.13497,-2.98765 -0.21089,-1.28382 0.0558,-3.03323 0.59272,-3.88758 1.36999,-2.18008 -1.95225,-8.79132 -4.89611,-9.74326 -1.34752,-0.43574 -2.45003,-1.69481 -2.45003,-2.79794 0,-1.10312 -0.51654,-2.00569 -1.14787,-2.00569 -0.63133,0 -3.26484,-1.89003 -5.85225,-4.20006 -2.5874,-2.31004 -6.16593,-4.20007 -7.95227,-4.20007 -2.91021,0 -3.27097,-0.69143 -3.46973,-6.65011 -0.122,-3.65755 -0.13616,-7.71466 -0.0315,-9.01578 0.1047,-1.30112 -0.9973,-2.74263 -2.44889,-3.20334 -5.9025,-1.87339 -4.59366,-8.05068 2.05958,-9.72054 2.0447,-0.51319 3.44263,-1.87651 3.44263,-3.35741 0,-4.06797 2.68266,-5.84688 6.31886,-4.19011 2.55798,1.16549 4.00271,0.83506 7.43099,-1.69958 l 4.25567,-3.14635 3.25608,3.78542 c 2.98965,3.47568 3.55095,3.63244 6.85976,1.91581 8.03244,-4.16729 12.38584,-9.14126 13.36609,-15.27145 0.56866,-3.55617 2.29134,-7.22906 4.23589,-9.0312 3.98407,-3.69231 4.00907,-4.14462 0.47739,-8.63442 -1.54002,-1.95783 -2.80004,-4.76603 -2.80004,-6.24045 0,-1.47442 -0.91802,-4.45601 -2.04004,-6.62577 -1.76793,-3.4188 -1.77387,-4.29654 -0.0445,-6.58058 4.13919,-5.46685 1.79412,-19.34834 -4.09418,-24.2352 -2.95095,-2.44907 -6.42146,-9.67147 -6.42146,-13.36355 0,-1.66787 -1.73253,-4.56362 -3.85006,-6.43501 l -3.85006,-3.40253 3.44682,-0.48626 c 2.23524,-0.31535 4.2826,0.54586 5.8245,2.45003 2.83054,3.49557 5.82035,3.7449 8.82896,0.73628 1.21002,-1.21002 2.20004,-1.50943 2.20004,-0.66536 0,0.84407 1.52509,2.11451 3.38908,2.8232 2.46567,0.93744 3.19069,2.04718 2.66095,4.07292 -0.40048,1.53142 -0.0171,4.93877 0.85187,7.57188 0.86901,2.63312 1.8409,6.14216 2.15976,7.79788 0.31886,1.65572 0.96766,3.63804 1.44176,4.40515 1.48043,2.39539 5.12462,1.5261 5.89119,-1.40528 0.40273,-1.54003 1.25915,-2.80005 1.90316,-2.80005 1.64706,0 3.99945,9.19212 3.16702,12.37533 -0.72421,2.76941 5.97427,17.02514 7.99978,17.02514 0.64387,0 1.56004,-0.63001 2.03593,-1.40002 1.486,-2.4044 6.52295,-1.55028 7.24984,1.22936 0.90801,3.47223 6.71432,6.00884 11.18552,4.88664 3.26789,-0.82019 3.48051,-0.61047 2.47739,2.4435 -0.60352,1.83738 -1.14571,4.60071 -1.20487,6.14073 -0.0592,1.54003 -0.89508,3.30386 -1.8576,3.91963 -0.96251,0.61577 -1.75002,2.85231 -1.75002,4.97008 0,2.11777 -0.71367,4.56416 -1.58593,5.43642 -0.87225,0.87225 -1.18778,2.62345 -0.70116,3.89155 0.67444,1.75756 1.89706,2.08329 5.14332,1.37029 2.55925,-0.5621 5.04919,-0.27917 6.23993,0.70905 1.08975,0.90441 2.63896,1.23796 3.44271,0.74122 2.10238,-1.29935 1.79845,1.07022 -0.54443,4.24458 -1.60764,2.17818 -2.35798,2.37025 -3.78006,0.9676 -2.34668,-2.3146 -4.93449,-2.21981 -5.86881,0.21497 -1.1272,2.93744 0.52003,7.83516 2.63516,7.83516 2.56943,0 3.75708,2.3306 2.77096,5.43761 -0.52426,1.65179 -2.14434,2.61251 -4.40549,2.61251 -4.56288,0 -10.34632,3.06696 -10.34632,5.48666 0,1.02491 -0.48061,1.86346 -1.06803,1.86346 -0.58742,0 -1.68994,1.41752 -2.45004,3.15005 -0.7601,1.73253 -2.82581,3.78006 -4.59047,4.55007 -4.03263,1.75965 -5.24159,6.33461 -3.21228,12.15589 1.29341,3.71027 1.19558,4.715 -0.55444,5.69437 -2.92071,1.6345 -2.94091,13.42501 -0.0249,14.54398 1.29574,0.49723 2.10003,2.62518 2.10003,5.55615 0,3.71367 -0.57362,4.75029 -2.62862,4.75029 -4.11725,0 -6.21889,3.56803 -5.14645,8.73732 0.52065,2.50959 0.91352,6.54514 0.87305,8.96788 -0.0445,2.66601 0.75061,4.72125 2.01419,5.20614 1.14828,0.44064 2.08778,1.76594 2.08778,2.94514 0,1.53595 1.45763,2.14397 5.13985,2.14397 2.82691,0 6.25509,1.00927 7.61816,2.24285 2.35776,2.13373 2.31205,2.39693 -0.93978,5.41062 -1.87995,1.74227 -3.41809,3.76472 -3.41809,4.4943 0,0.72959 -1.3192,4.05695 -2.93156,7.39414 -2.27084,4.70009 -2.60905,6.77548 -1.50061,9.20823 1.28436,2.81886 0.99305,3.22818 -2.84353,3.99549 -5.38052,1.0761 -6.04388,1.06887 -7.1912,-0.0784 l 0,-5e-5 z", name : "Косово" }, "29" : { path : "m 429.73938,913.73294 c -0.4442,-0.71872 -2.98068,-1.65941 -5.63663,-2.09041 -4.35902,-0.70737 -10.63924,-5.1544 -10.63924,-7.53364 0,-0.51688 1.00673,-2.05221 2.23718,-3.41184 2.46495,-2.72374 1.37431,-6.0595 -1.60711,-4.91542 -1.07791,0.41364 -2.272,-0.4898 -2.78541,-2.1074 -0.99555,-3.13672 2.53328,-6.70551 6.70541,-6.78133 1.96637,-0.0357 2.45004,-1.29693 2.45004,-6.38857 0,-4.34763 -0.66085,-6.59763 -2.10003,-7.14989 -2.8089,-1.07788 -2.83074,-10.11392 -0.027,-11.1898 2.13357,-0.81873 2.12641,-5.75621 -0.0158,-10.86773 -0.85031,-2.02895 -0.0693,-3.50713 3.3286,-6.3001 2.44176,-2.00704 4.43388,-4.16667 4.42694,-4.79918 -0.007,-0.63251 0.87615,-2.03878 1.96241,-3.12505 1.08627,-1.08626 2.19851,-2.64547 2.47166,-3.46489 0.27314,-0.81942 3.00693,-1.79152 6.07509,-2.16023 6.14018,-0.73786 9.07853,-3.5533 9.07853,-8.69875 0,-2.18612 -0.98017,-3.61986 -2.80004,-4.09577 -1.54003,-0.40273 -2.80005,-1.54478 -2.80005,-2.53791 0,-1.118 1.06921,-1.52607 2.80751,-1.0715 3.44314,0.90041 6.99265,-1.82432 6.99265,-5.3678 0,-2.67574 1.53263,-3.42937 3.32636,-1.63564 0.54614,0.54614 3.54529,0.80871 6.66477,0.58347 5.18618,-0.37445 5.59256,-0.1599 4.74644,2.50599 -0.73009,2.30029 -0.12599,3.21941 2.86288,4.35577 2.08352,0.79216 4.13134,1.09716 4.55071,0.67779 0.41937,-0.41937 1.56161,1.13802 2.5383,3.46088 1.98805,4.7282 4.34251,5.46033 5.70284,1.77334 2.65801,-7.20411 12.45998,-5.89447 14.96544,1.99954 0.62418,1.96661 0.22767,3.1871 -1.21532,3.74082 -1.17796,0.45203 -2.14175,1.87471 -2.14175,3.16151 0,1.2868 -1.07874,3.12842 -2.39719,4.0925 -1.98889,1.45431 -2.08982,2.12324 -0.59254,3.92735 1.64511,1.98224 1.82027,9.40847 0.18968,8.04211 -1.79506,-1.50419 -7.00011,3.05828 -7.00011,6.13593 0,1.84293 -0.78751,4.22073 -1.75003,5.28399 -0.96251,1.06326 -3.81374,4.1475 -6.33605,6.85386 -4.44548,4.76985 -4.52526,5.0652 -2.60302,9.63685 2.67134,6.35325 0.56738,11.50058 -4.21066,10.30137 -2.2706,-0.56988 -3.54223,-0.12397 -4.14796,1.45454 -0.55163,1.43753 -2.18028,2.13713 -4.41969,1.89852 -2.85931,-0.30465 -3.62988,0.30009 -3.9784,3.12222 -0.82581,6.68695 0.8093,12.6002 3.48415,12.6002 3.26851,0 6.17729,6.02419 3.97308,8.22839 -2.23084,2.23084 -5.21182,1.94715 -5.21182,-0.49599 0,-1.13727 -1.59485,-3.11275 -3.54412,-4.38996 -4.7606,-3.11926 -12.35259,-1.16083 -13.00351,3.35439 -0.27736,1.92396 -1.43097,3.10333 -3.03555,3.10333 -1.42349,0 -3.52098,0.35795 -4.66109,0.79545 -1.14011,0.4375 -2.43636,0.20741 -2.88055,-0.51131 z", name : "Косовo-Поморавље" }, "30" : { path : "m 308.44861,996.71531 c -1.95157,-5.13301 -1.77005,-6.20613 1.49725,-8.85183 1.68472,-1.3642 2.92588,-4.07741 2.98465,-6.52451 0.12686,-5.28201 -5.4194,-23.34655 -7.57746,-24.6803 -0.91591,-0.56606 -1.71036,-4.96471 -1.83201,-10.14327 -0.11814,-5.02907 -0.88322,-9.95883 -1.70018,-10.95502 -0.81696,-0.9962 -2.24105,-4.63653 -3.16465,-8.08963 -0.92359,-3.45311 -3.62763,-8.7384 -6.00898,-11.74509 l -4.32971,-5.46671 4.12207,-3.2982 c 2.26713,-1.81401 4.56594,-3.30133 5.10844,-3.30516 1.70207,-0.012 8.11747,-7.05233 8.03775,-8.82073 -0.0418,-0.92751 -3.03435,-3.57926 -6.6501,-5.89278 -5.08923,-3.25631 -6.47516,-4.91645 -6.13608,-7.35011 0.2409,-1.72905 -0.23694,-3.14373 -1.06188,-3.14373 -1.00391,0 -0.94423,-0.88975 0.18046,-2.69067 1.26053,-2.01843 1.29634,-3.94189 0.14333,-7.69875 -0.84536,-2.75444 -0.99369,-5.34387 -0.32961,-5.7543 0.66408,-0.41042 0.8862,-1.58327 0.49362,-2.60634 -0.96303,-2.50962 7.26616,-6.27441 17.31108,-7.91968 10.24629,-1.67825 10.12542,-1.68551 10.12542,0.60831 0,2.45305 6.01461,6.46112 9.6957,6.46112 1.53676,0 3.52948,-0.78751 4.42826,-1.75003 0.98482,-1.05464 4.06644,-1.55493 7.75532,-1.25905 4.7438,0.3805 6.12117,1.04994 6.12117,2.97505 0,1.63631 1.42372,2.76881 4.17173,3.31841 2.73376,0.54676 3.92156,1.48628 3.44596,2.72568 -0.42396,1.10482 0.75222,2.56475 2.82838,3.51071 1.95478,0.89066 3.6329,2.26289 3.72915,3.04941 0.72044,5.88709 0.28164,9.83017 -1.09395,9.83017 -0.93715,0 -1.30626,1.19575 -0.87646,2.83931 0.48955,1.87205 1.53591,2.58749 3.07149,2.10011 1.87287,-0.59443 2.37076,0.30806 2.54224,4.60804 0.11728,2.94098 0.32575,5.9335 0.46328,6.65003 1.03875,5.41202 -0.58104,8.55444 -6.26437,12.15297 -3.34434,2.11753 -7.1014,3.85006 -8.34902,3.85006 -1.43029,0 -2.346,1.29318 -2.47841,3.50005 -0.11551,1.92503 -0.27301,4.28312 -0.35001,5.24019 -0.0777,0.9653 2.66528,2.36794 6.1601,3.15005 8.43018,1.88661 10.7954,3.48317 11.94049,8.06002 0.85184,3.40476 0.57141,3.85006 -2.42458,3.85006 -3.39882,0 -9.51591,4.53493 -9.51591,7.05465 0,0.74002 -1.81289,1.34549 -4.02864,1.34549 -2.21576,0 -4.81294,0.94501 -5.77152,2.10003 -0.95858,1.15502 -3.12228,2.10003 -4.80821,2.10003 -1.83304,0 -4.42145,1.8292 -6.43863,4.55008 -2.76796,3.73358 -3.36514,6.18304 -3.32798,13.65021 0.0249,5.00508 0.42532,11.98409 0.88979,15.5089 0.75702,5.74486 0.41851,6.86456 -3.26763,10.80874 -3.32972,3.56279 -4.87259,4.24787 -8.10893,3.6006 -2.19824,-0.43965 -5.33974,-0.0806 -6.98111,0.7978 -2.61374,1.3988 -3.15652,1.14423 -4.37111,-2.05039 l 0,0 z", name : "Призрен" } }, height: 1041.4434, width: 726.97412 });
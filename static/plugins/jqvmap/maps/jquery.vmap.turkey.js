@@ -1,11 +0,0 @@
-/*
- * Map of Turkey
- * @author: Burak Özdemir <https://github.com/ozdemirburak>
- * @source: https://upload.wikimedia.org/wikipedia/commons/2/2e/BlankMapTurkishProvincesRegions.svg
- */
-jQuery.fn.vectorMap("addMap","turkey",{"width": 1052, "height": 744, paths:{"01":{path:"M 518.88945,536.62132 C 518.88945,536.07132 518.26346,535.62132 517.49836,535.62132 C 516.73326,535.62132 511.97173,533.17756 506.91718,530.19074 L 497.7271,524.76016 L 501.55827,523.69631 C 503.66542,523.1112 506.19107,522.62996 507.17083,522.6269 C 510.07497,522.61781 510.41243,519.58393 507.9795,515.35663 C 505.99039,511.90047 505.87157,511.07869 506.9756,508.41335 C 508.08759,505.72874 508.0129,505.26315 506.30864,504.25575 C 505.25309,503.63182 503.29662,502.89632 501.96094,502.62132 C 498.69356,501.94861 497.3983,497.30054 499.55919,494.0026 C 500.97835,491.83669 500.97132,491.39521 499.48141,489.12132 C 498.25083,487.24322 496.97309,486.62132 494.34496,486.62132 C 491.57224,486.62132 490.60734,486.09626 489.69325,484.09005 C 488.65658,481.81481 488.85957,481.28377 491.7001,478.84005 C 494.56985,476.37118 494.8846,475.52394 495.12487,469.62132 L 495.38945,463.12132 L 500.38945,462.59575 C 505.10181,462.10041 508.51769,460.80828 513.5626,457.61273 C 515.42541,456.43279 516.84105,456.47608 523.4757,457.91585 C 533.26028,460.03919 534.18,459.47061 533.72544,451.57937 C 533.37519,445.49913 534.72929,442.62132 537.94047,442.62132 C 538.93384,442.62132 540.40086,441.96705 541.20052,441.16739 C 542.00018,440.36773 544.84483,438.67919 547.52195,437.41509 C 550.58589,435.96833 552.95627,434.00597 553.9192,432.11902 C 557.78299,424.54754 561.3206,419.45051 564.07115,417.49194 C 567.03396,415.38223 567.09906,415.37974 570.6275,417.2412 C 575.02417,419.5607 577.57844,425.50888 575.66434,428.97063 C 574.35858,431.33217 572.9019,440.31251 572.55796,448.12132 C 572.43683,450.87132 571.67098,454.47132 570.85607,456.12132 C 569.54224,458.78151 568.75989,459.17796 563.9492,459.62132 L 558.52399,460.12132 L 555.80427,465.62132 C 554.30842,468.64632 552.54714,473.14632 551.8903,475.62132 C 551.23347,478.09632 550.28631,480.79632 549.7855,481.62132 C 547.00063,486.20892 546.53081,487.82921 547.52738,489.40909 C 548.23447,490.53007 548.23167,491.90371 547.51844,493.79327 C 546.11779,497.50402 546.97837,498.02883 551.42039,496.17284 C 556.13315,494.20372 557.88945,495.4026 557.88945,500.58873 C 557.88945,503.20394 556.75378,506.06835 554.07157,510.21825 C 548.46337,518.89522 545.2349,521.98503 540.59278,523.11814 C 536.68177,524.07279 536.43215,524.36322 535.43313,529.12132 L 534.38332,534.12132 L 528.71947,534.41874 C 525.30384,534.59811 522.5771,535.29276 521.85009,536.16874 C 520.46102,537.84247 518.88945,538.08271 518.88945,536.62132 z",name:"Adana"},"02":{path:"M 666.88945,476.95274 C 666.06445,476.67186 663.97144,475.80739 662.23832,475.03169 C 660.5052,474.25599 657.5228,473.62132 655.61077,473.62132 C 653.69873,473.62132 651.57414,472.94632 650.88945,472.12132 C 649.37398,470.29529 646.73637,470.18304 645.01481,471.87132 C 643.99109,472.87525 643.30454,472.57996 641.52725,470.37132 C 640.31014,468.85882 638.75289,467.62132 638.0667,467.62132 C 637.38051,467.62132 635.74671,466.91867 634.43603,466.05989 C 632.2339,464.61699 632.15764,464.29435 633.43156,461.80989 C 634.18978,460.33117 635.05624,457.99632 635.35704,456.62132 C 635.65783,455.24632 637.36318,453.21524 639.14669,452.10781 C 641.25068,450.80139 642.49811,449.15885 642.69885,447.43054 C 642.98999,444.92408 643.18743,444.82924 646.04233,445.82446 C 652.43377,448.05253 669.01974,444.05131 670.61399,439.89677 C 670.91365,439.11587 670.18127,437.15474 668.98649,435.5387 L 666.81414,432.60045 L 669.4169,431.61088 C 670.84841,431.06662 672.24538,430.62132 672.52127,430.62132 C 672.79716,430.62132 674.49784,429.49632 676.30056,428.12132 C 678.10328,426.74632 680.21076,425.62974 680.98384,425.64003 C 681.75693,425.65031 685.48113,427.22531 689.25984,429.14003 C 693.03856,431.05474 696.59609,432.62132 697.16545,432.62132 C 697.73482,432.62132 699.67562,433.74632 701.47834,435.12132 C 703.28106,436.49632 705.25099,437.62132 705.85597,437.62132 C 708.50398,437.62132 716.7703,432.46632 719.17241,429.31698 C 723.83428,423.20496 730.41515,424.18895 726.27539,430.37904 C 725.26671,431.88729 724.42974,433.57132 724.41544,434.12132 C 724.40115,434.67132 722.25195,435.53424 719.63945,436.03892 C 716.80857,436.58579 714.88945,437.49484 714.88945,438.28892 C 714.88945,439.02174 715.33945,439.62132 715.88945,439.62132 C 717.73094,439.62132 716.91458,442.47857 714.88945,443.12132 C 713.78945,443.47045 712.88945,444.57329 712.88945,445.57208 C 712.88945,446.57087 712.05043,447.60747 711.02495,447.87563 C 709.81346,448.19245 708.9153,449.67002 708.46047,452.09445 C 708.07548,454.14663 707.4965,455.5617 707.17384,455.23905 C 706.85119,454.9164 705.99452,455.43291 705.27013,456.38686 C 704.37561,457.56485 703.94285,457.69737 703.92125,456.79989 C 703.88536,455.30834 701.47729,452.62132 700.17649,452.62132 C 699.70578,452.62132 698.5048,451.24016 697.50762,449.55209 C 696.51045,447.86401 695.53454,446.6429 695.33892,446.83851 C 694.61971,447.55773 698.17937,458.17898 699.73193,459.9463 C 701.24572,461.66949 701.18301,461.7331 698.60768,461.08674 C 696.34834,460.51968 695.24712,461.01712 692.19148,463.98506 C 690.16267,465.95564 688.34717,467.41237 688.15704,467.22225 C 687.96692,467.03212 688.43937,465.05373 689.20694,462.82584 C 690.60417,458.77035 689.7533,454.20658 688.30408,457.98319 C 687.78523,459.3353 687.41399,459.47004 686.8265,458.51947 C 686.19356,457.49535 685.74198,457.49882 684.49059,458.53738 C 683.17521,459.62905 682.75827,459.42753 681.74888,457.21215 C 680.56958,454.62387 680.54133,454.61786 678.72396,456.56858 C 677.71498,457.65159 676.88945,459.00651 676.88945,459.57951 C 676.88945,460.1525 675.76445,460.62132 674.38945,460.62132 C 671.53457,460.62132 671.17773,461.78575 673.45374,463.67467 C 674.44666,464.49872 674.80495,465.82185 674.43468,467.29712 C 674.02052,468.94726 674.2817,469.62132 675.33521,469.62132 C 676.15134,469.62132 677.27887,470.48044 677.84083,471.53047 C 678.7041,473.14351 678.31293,473.76392 675.31885,475.53047 C 671.80966,477.60095 669.79288,477.94123 666.88945,476.95274 z",name:"Adıyaman"},"03":{path:"M 224.92847,443.31 C 224.30556,442.31377 222.21895,440.56825 220.29155,439.43105 C 217.1445,437.57425 216.8545,437.0452 217.44742,434.24237 C 218.1982,430.69335 222.15135,426.8825 225.97707,426.01979 C 227.40026,425.69885 230.66276,423.6429 233.22707,421.45099 C 238.2035,417.19726 238.86115,414.94511 236.38945,410.62132 C 235.60343,409.24632 234.94437,406.96226 234.92489,405.54563 C 234.88846,402.89813 232.18062,399.79632 228.03806,397.65683 L 225.68666,396.44242 L 228.28806,393.72715 C 229.85657,392.08997 230.90265,389.84247 230.9227,388.0666 C 230.95005,385.64339 232.38963,383.88053 239.04421,378.12132 C 249.67456,368.92127 250.87006,367.62651 251.4909,364.64122 C 251.77912,363.25527 252.22786,361.07862 252.48809,359.80421 C 252.74879,358.52753 254.37359,356.73144 256.10663,355.80421 C 257.83659,354.87862 260.27798,353.06194 261.53195,351.76714 L 263.81189,349.41296 L 266.77509,352.65726 C 269.26173,355.37978 270.2267,355.80387 272.7751,355.29419 C 274.44534,354.96014 276.08091,355.12209 276.40969,355.65407 C 276.73848,356.18606 278.99009,356.62132 281.41328,356.62132 C 284.83009,356.62132 286.06513,356.16158 286.91517,354.57326 C 287.69809,353.11036 288.59375,352.71008 290.05003,353.17228 C 291.37664,353.59333 294.35372,352.66975 298.57281,350.52825 C 305.76054,346.87995 308.13707,347.21351 308.70375,351.95018 C 309.01044,354.51376 313.04723,358.61576 315.27431,358.6269 C 315.88764,358.62996 318.07695,359.10112 320.13945,359.6739 C 323.64193,360.64659 323.88945,360.96909 323.88945,364.55992 C 323.88945,367.82682 324.2651,368.49879 326.38945,369.03196 C 329.33588,369.77147 329.6831,371.60102 327.00969,372.30013 C 325.69288,372.64448 324.96783,374.00031 324.58863,376.82746 C 324.23201,379.48622 322.99678,381.94711 320.96838,384.03988 C 317.23591,387.89082 317.11434,389.31104 320.38945,390.80327 C 321.76445,391.42977 322.88945,392.23045 322.88945,392.58257 C 322.88945,392.93469 320.97695,394.19091 318.63945,395.37418 C 316.30195,396.55744 311.63435,399.32153 308.267,401.5166 L 302.14455,405.50764 L 300.017,403.52552 C 298.84685,402.43536 297.88945,401.05169 297.88945,400.4507 C 297.88945,399.74387 296.40135,399.55758 293.67559,399.92318 C 290.69517,400.32294 288.90852,401.24781 287.57179,403.08285 C 286.53232,404.5098 284.26606,406.40137 282.53565,407.28633 C 280.80524,408.17129 277.66796,410.24843 275.56392,411.90219 C 273.45988,413.55595 268.73488,416.12015 265.06392,417.60042 C 259.99789,419.64323 257.6665,421.27208 255.38945,424.35961 C 253.73945,426.59689 250.63585,429.24418 248.49257,430.24247 C 245.69266,431.54659 243.42581,433.88341 240.43978,438.54379 L 236.28386,445.03004 L 231.17244,445.07568 C 227.28884,445.11036 225.78896,444.68622 224.92847,443.31 z",name:"Afyonkarahisar"},"04":{path:"M 909.70981,362.4615 C 908.21002,360.16428 907.88403,358.98236 906.08458,349.31747 C 905.44731,345.89471 904.15783,343.45099 901.59935,340.81747 C 899.6244,338.78459 897.5398,335.87575 896.96692,334.35339 C 896.39404,332.83102 894.76791,331.14541 893.3533,330.60757 L 890.78128,329.6297 L 893.33536,326.28112 C 896.61733,321.97824 896.75445,317.13456 893.63945,315.53971 C 891.10099,314.24005 882.88945,306.57728 882.88945,305.50813 C 882.88945,304.15935 891.70514,299.66507 896.51918,298.55963 C 904.77777,296.66324 915.26475,293.53323 917.88945,292.18134 C 922.6369,289.73609 929.29446,289.51535 933.72567,291.65628 C 935.96261,292.73705 938.23425,293.62132 938.77376,293.62132 C 940.31317,293.62132 941.05996,297.19551 940.33167,301.07761 C 939.68878,304.50452 939.76706,304.62132 942.70673,304.62132 C 944.37865,304.62132 946.39035,303.97756 947.17718,303.19074 C 948.40686,301.96105 949.15414,301.95489 952.4986,303.14684 C 954.63857,303.90952 958.21195,304.55329 960.43945,304.57743 C 962.66695,304.60157 964.94281,305.07468 965.49693,305.6288 C 966.05104,306.18291 971.43824,306.69762 977.46849,306.7726 C 985.88913,306.87731 989.17,306.5276 991.61136,305.26513 C 993.35968,304.36103 995.16279,303.62132 995.61826,303.62132 C 996.70935,303.62132 996.25132,311.4637 995.07291,312.95863 C 994.56883,313.59811 994.13649,316.29235 994.11215,318.94583 C 994.05445,325.23815 992.50056,326.33249 983.5439,326.38856 C 977.51786,326.42628 976.30801,326.74069 974.87412,328.64164 C 973.44515,330.53607 972.62434,330.75233 969.11399,330.15926 C 965.2749,329.51065 964.92292,329.65591 963.45487,332.49481 C 962.59389,334.15977 961.88945,336.12935 961.88945,336.87166 C 961.88945,340.12957 959.59331,340.63282 956.27538,338.10211 C 954.48651,336.73768 952.73784,335.62132 952.38945,335.62132 C 952.04106,335.62132 950.28106,334.49632 948.47834,333.12132 C 944.80329,330.31822 939.78144,329.84161 937.89327,332.11672 C 937.21068,332.93919 934.85874,334.14945 932.66673,334.80619 C 927.05854,336.48645 926.49069,339.21403 931.38945,340.94143 C 932.69885,341.40315 930.31575,346.08684 926.41681,350.71454 C 920.67697,357.52724 919.88945,358.64876 919.88945,360.01031 C 919.88945,361.90941 917.73676,363.50186 914.21824,364.20556 C 911.8196,364.68529 910.93934,364.34477 909.70981,362.4615 z",name:"Ağrı"},"05":{path:"M 522.9393,286.52818 C 523.55542,285.37695 523.8006,283.40344 523.48415,282.1426 C 523.12994,280.73134 523.48165,279.37473 524.39912,278.6133 C 525.2188,277.93302 525.88945,276.83497 525.88945,276.17319 C 525.88945,275.51141 527.01445,273.91307 528.38945,272.62132 C 529.76445,271.32957 530.88945,269.66979 530.88945,268.93291 C 530.88945,267.34178 524.91279,261.69268 523.1849,261.65063 C 522.5224,261.63451 520.80133,260.44229 519.3603,259.00126 C 517.06383,256.70479 516.132,256.43964 511.81542,256.85441 C 506.40335,257.37444 505.3449,256.69616 503.94355,251.80994 C 503.36525,249.79355 503.49434,248.00929 504.33587,246.38724 C 505.02568,245.05763 505.83157,241.82723 506.12673,239.20857 C 506.8781,232.54239 508.18885,231.57592 511.79397,235.02984 C 514.6054,237.72337 514.8988,237.78504 519.84978,236.72325 C 527.29327,235.12691 527.79254,235.23338 527.57771,238.37132 C 527.41543,240.7419 527.80336,241.1644 530.38945,241.43354 C 532.03945,241.60526 533.94765,242.47288 534.62989,243.36159 C 535.31213,244.2503 538.01213,245.27896 540.62989,245.64751 C 543.24765,246.01606 548.19693,246.92493 551.6283,247.66723 L 557.86715,249.01687 L 560.79739,246.20951 C 562.40903,244.66547 564.00789,242.28556 564.35042,240.92082 C 564.77908,239.2129 565.45318,238.62367 566.51311,239.0304 C 567.36006,239.35541 569.23122,239.62132 570.67124,239.62132 C 572.70762,239.62132 573.02278,239.88799 572.08945,240.82132 C 570.16542,242.74535 570.69531,244.53449 573.38945,245.21068 C 575.18432,245.66116 575.88945,246.51269 575.88945,248.22973 C 575.88945,249.95465 576.44696,250.62132 577.88945,250.62132 C 580.52696,250.62132 580.45952,252.23898 577.79294,252.93631 C 575.93232,253.42287 575.73541,254.09212 576.04294,258.88408 L 576.38945,264.28359 L 571.63945,263.82523 C 567.35615,263.4119 566.88945,263.57007 566.88945,265.43507 C 566.88945,266.57259 567.36744,267.7987 567.95164,268.15976 C 568.57467,268.54481 567.66746,269.80955 565.75736,271.21877 C 562.22978,273.82134 555.88945,274.53893 555.88945,272.33561 C 555.88945,271.44383 554.20426,271.04989 550.38945,271.04989 C 545.88369,271.04989 544.88945,271.35663 544.88945,272.74671 C 544.88945,275.22105 539.55738,279.30863 533.67031,281.34731 C 530.2447,282.5336 528.02443,284.03029 526.96851,285.865 C 525.03016,289.23295 521.14995,289.87161 522.9393,286.52818 z",name:"Amasya"},"06":{path:"M 431.49319,391.03108 C 431.15757,390.15644 431.13002,389.04109 431.43198,388.5525 C 432.02275,387.59663 428.00264,381.62132 426.76878,381.62132 C 426.35927,381.62132 425.72636,382.5598 425.36231,383.70683 L 424.70039,385.79234 L 422.29492,383.53252 C 419.85242,381.23791 418.80886,374.62132 420.88945,374.62132 C 422.26057,374.62132 422.0853,370.5788 420.60401,368.03805 C 418.52775,364.47675 415.14808,360.62132 414.10252,360.62132 C 413.55302,360.62132 412.84441,361.29632 412.52782,362.12132 C 411.65226,364.403 410.78757,364.03114 404.38945,358.62132 C 398.5272,353.6646 394.59272,352.34624 393.57526,354.99771 C 393.23983,355.87182 392.106,356.19421 390.46827,355.88114 C 388.51763,355.50825 387.88945,355.80069 387.88945,357.08167 C 387.88945,359.16148 382.59151,364.62132 380.57336,364.62132 C 379.7649,364.62132 378.85703,365.26343 378.55587,366.04824 C 377.98478,367.53646 369.67785,371.62132 367.22249,371.62132 C 366.4455,371.62132 363.96376,370.67955 361.70751,369.5285 C 358.72326,368.00605 356.62198,367.6052 353.99735,368.05769 C 352.01301,368.39979 349.03945,368.9136 347.38945,369.19949 C 344.79337,369.64929 344.08651,369.24333 342.13945,366.18432 C 340.90195,364.2401 339.88945,362.21542 339.88945,361.68503 C 339.88945,361.15465 339.15119,360.30755 338.24887,359.80259 C 336.86466,359.02794 337.21346,358.47325 340.48101,356.2529 C 342.611,354.80553 345.13343,353.62132 346.0864,353.62132 C 347.03938,353.62132 348.32347,352.67886 348.93994,351.52697 C 349.86686,349.79501 349.67136,349.01808 347.81011,347.03686 C 345.86936,344.97103 345.71985,344.28897 346.72443,342.08416 C 348.38498,338.43963 348.19434,336.56216 345.54733,330.49216 C 341.84491,322.00193 340.98644,320.2365 339.65868,318.38219 C 338.60904,316.9163 338.76501,316.39678 340.65142,315.07549 C 343.75043,312.90486 343.4507,311.14295 339.67106,309.31241 C 337.61216,308.31526 335.71621,306.1987 334.40849,303.43751 C 332.38805,299.17143 332.2909,299.11321 326.04105,298.42253 C 322.56325,298.03819 319.049,297.1687 318.23162,296.49033 C 316.45012,295.01182 301.23169,294.37598 296.95848,295.60152 C 292.50322,296.87927 290.00477,295.82396 289.03378,292.25423 C 288.2363,289.32242 288.41294,289.01067 291.78553,287.39754 C 293.76768,286.44947 296.10721,285.66197 296.98446,285.64754 C 299.29687,285.60953 301.88945,282.35625 301.88945,279.49258 C 301.88945,274.80457 305.02708,273.89801 309.11393,277.40521 C 310.34053,278.45784 311.99766,278.69973 314.85374,278.24302 C 318.13373,277.71853 319.25323,277.9851 320.96674,279.69861 C 322.73196,281.46383 323.88257,281.71112 328.22693,281.25893 C 341.8244,279.84363 345.50279,278.93809 350.33523,275.81631 C 353.05541,274.05907 355.68878,272.62132 356.18717,272.62132 C 357.89905,272.62132 370.87233,264.12102 370.88089,262.99376 C 370.8856,262.37361 370.17382,261.27229 369.29915,260.54638 C 366.54053,258.25692 370.30932,256.62075 378.33058,256.62551 C 383.87051,256.62879 386.44803,257.16674 390.30893,259.12551 C 393.01464,260.4982 396.14214,261.62132 397.25893,261.62132 C 398.83822,261.62132 399.02278,261.88799 398.08945,262.82132 C 396.04503,264.86574 396.75943,267.50273 399.78103,269.06526 C 401.3714,269.88767 403.13425,271.88481 403.69848,273.50334 C 404.85999,276.83524 410.48281,282.62132 412.5592,282.62132 C 413.31442,282.62132 414.46831,281.44497 415.1234,280.0072 C 416.21644,277.60825 416.68796,277.43783 420.85196,277.93674 C 423.34758,278.23576 427.24153,279.31295 429.50518,280.3305 L 433.62092,282.18059 L 430.72732,287.15095 C 427.9434,291.93292 427.62577,295.16464 429.46786,299.96505 C 430.03915,301.4538 424.43147,304.94765 420.38945,305.62132 C 418.11725,306.00002 417.30826,306.72782 417.05477,308.62132 C 416.8707,309.99632 416.3082,311.54882 415.80477,312.07132 C 415.30135,312.59382 414.88945,314.63617 414.88945,316.60988 C 414.88945,318.58359 413.98945,321.96373 412.88945,324.12132 C 411.78945,326.27891 410.88945,328.41708 410.88945,328.87282 C 410.88945,329.32855 412.69171,331.41588 414.89446,333.51131 C 418.39168,336.83813 418.81989,337.7191 418.2718,340.45957 C 417.85101,342.56351 418.17897,344.41424 419.26679,346.07446 C 420.15925,347.43653 420.88945,349.01679 420.88945,349.58614 C 420.88945,351.91086 436.61206,367.57567 438.97278,367.60299 C 442.04921,367.6386 441.83802,368.97175 438.38413,371.31872 C 434.67267,373.84073 433.92543,376.57637 436.38945,378.62132 C 438.41989,380.30643 438.2832,381.97947 435.6453,387.72954 C 433.2543,392.94143 432.46661,393.56776 431.49319,391.03108 z",name:"Ankara"},"07":{path:"M 358.69746,559.88281 C 355.56686,557.26399 352.97936,554.7297 352.94746,554.25105 C 352.88285,553.2817 349.1951,547.29935 343.88945,539.55694 C 340.92578,535.23212 339.39341,534.05619 333.88945,531.88296 C 330.31445,530.47138 326.31626,528.48504 325.00459,527.46888 C 323.69292,526.45272 322.21957,525.62132 321.73048,525.62132 C 321.2414,525.62132 318.59018,524.07287 315.83889,522.18031 C 313.0876,520.28776 309.83595,518.43604 308.613,518.06538 C 307.39005,517.69472 305.47495,516.55679 304.35722,515.53666 C 301.61782,513.03643 290.36605,510.51439 279.38945,509.94022 C 272.73687,509.59224 270.06646,509.05232 269.15109,507.87017 C 268.08302,506.49082 267.56826,506.45525 265.4077,507.61155 C 261.29423,509.81302 259.88467,513.02983 259.50113,521.09122 C 259.2772,525.79782 258.53963,529.50627 257.51707,531.06689 C 256.62188,532.43312 255.88945,534.24179 255.88945,535.08614 C 255.88945,535.93049 255.38838,536.62132 254.77595,536.62132 C 254.08247,536.62132 253.85349,537.84725 254.16891,539.87132 C 254.45716,541.72109 254.02613,544.52155 253.16846,546.37132 C 251.65269,549.64047 249.91059,550.69514 249.86485,548.37132 C 249.82911,546.55582 243.36717,543.62132 239.40505,543.62132 C 237.2289,543.62132 235.53196,544.28936 234.69615,545.4751 C 233.47386,547.20912 228.88053,548.65693 224.46392,548.70028 C 223.40487,548.71067 222.05487,549.36163 221.46392,550.14687 C 220.87296,550.9321 217.78272,551.8743 214.59673,552.24064 C 209.47698,552.82934 208.57209,552.65779 206.80777,550.76402 C 205.70984,549.58554 203.81657,548.60537 202.60049,548.58588 C 201.38442,548.5664 199.26445,547.90734 197.88945,547.12132 C 196.51445,546.3353 194.44669,545.67624 193.29444,545.65676 C 190.72361,545.61327 186.75637,541.55055 188.64104,540.89136 C 189.32942,540.65059 190.17519,538.68661 190.52053,536.52697 C 191.07944,533.0317 191.65599,532.37668 195.76893,530.56423 C 202.30055,527.68595 209.50755,520.28718 211.43643,514.47986 C 212.30332,511.8699 213.82299,508.69652 214.81346,507.4279 C 217.29018,504.25567 218.21035,500.93768 216.84704,500.09511 C 216.14661,499.66222 216.8737,498.70098 218.77714,497.54343 C 221.35035,495.97856 221.80925,495.10811 221.69289,492.01274 C 221.53169,487.72482 222.77531,486.55602 230.62318,483.61976 C 233.56753,482.51813 237.26968,480.66075 238.85018,479.49223 C 242.38818,476.87647 246.92224,477.45663 251.95399,481.16894 C 254.44046,483.00339 256.60603,483.68592 259.88216,483.66767 C 262.36117,483.65386 266.97695,483.90443 270.13945,484.22449 C 273.54186,484.56883 275.88945,484.41542 275.88945,483.84873 C 275.88945,483.322 276.81336,481.71647 277.94259,480.28089 C 279.70725,478.03749 280.26976,477.84188 281.94605,478.88874 C 283.48361,479.84897 284.26599,479.84323 285.64291,478.86164 C 288.64828,476.71914 292.21718,475.49442 297.17558,474.90404 C 301.41382,474.39942 302.45756,474.69027 306.29311,477.44475 C 311.71269,481.3368 317.47655,482.40332 321.59135,480.27547 C 324.52107,478.76046 324.67044,478.80095 327.664,481.92179 C 329.35199,483.68153 331.82433,487.59632 333.1581,490.62132 C 336.02495,497.12336 342.35065,503.7356 349.63945,507.84925 C 352.57698,509.50712 354.88945,511.52244 354.88945,512.42462 C 354.88945,513.31142 356.43133,515.63097 358.31586,517.57916 C 362.34144,521.74073 364.16879,528.37884 364.30187,539.32424 C 364.37466,545.31045 364.72728,546.77475 366.38945,547.99295 C 368.07429,549.22777 368.38945,550.61402 368.38945,556.79004 C 368.38945,563.36749 368.1838,564.14821 366.38945,564.38281 C 365.19907,564.53845 362.08526,562.71679 358.69746,559.88281 z",name:"Antalya"},"08":{path:"M 830.49644,257.03953 C 830.16259,256.16955 829.88945,253.49061 829.88945,251.08633 C 829.88945,246.86526 829.73427,246.64627 825.37764,244.71912 C 822.89614,243.62144 820.59372,242.01423 820.26114,241.14756 C 819.57255,239.3531 822.66825,234.56056 829.45824,226.90926 L 834.08358,221.6972 L 830.34708,218.27412 C 828.29201,216.39142 826.04174,213.19637 825.34648,211.174 C 824.09141,207.52325 824.1067,207.48536 827.48591,205.87393 C 829.35786,204.98126 830.88945,203.96604 830.88945,203.61789 C 830.88945,203.26974 832.29081,201.16156 834.00358,198.93305 C 837.39852,194.51584 837.67791,194.50082 846.67338,198.25193 C 851.29024,200.17715 852.45531,199.98831 854.66364,196.95675 C 856.30204,194.70759 857.44531,194.25706 861.99704,194.06687 C 873.19428,193.599 884.76253,196.76283 887.73933,201.10719 C 890.67372,205.38964 890.47788,206.795 886.13945,212.58823 C 884.07695,215.34234 881.03945,220.77818 879.38945,224.66786 L 876.38945,231.74001 L 867.87373,231.09305 C 857.14359,230.27784 855.68793,231.39546 855.45008,240.63161 C 855.3223,245.59299 854.8553,247.11002 852.83326,249.13205 C 850.62207,251.34324 849.99456,251.48913 846.6576,250.56775 C 842.14597,249.32203 838.53318,250.87253 835.10951,255.52385 C 832.55983,258.98779 831.39138,259.3717 830.49644,257.03953 z",name:"Artvin"},"09":{path:"M 83.81018,461.37132 C 83.766581,461.23382 83.654081,457.14728 83.56018,452.29011 C 83.399687,443.9884 83.239556,443.37596 80.88945,442.07555 C 79.51445,441.3147 77.60195,440.67624 76.63945,440.65676 C 75.67695,440.63727 74.88945,440.141 74.88945,439.55393 C 74.88945,438.96687 75.67695,438.72798 76.63945,439.02306 C 79.347196,439.8532 86.182473,437.93667 87.684021,435.92629 C 88.487514,434.85051 88.824457,432.79438 88.518058,430.83675 C 88.007195,427.57278 88.02538,427.55619 91.417328,428.19253 C 94.460114,428.76336 95.285412,428.38713 99.019205,424.7271 C 103.74971,420.09004 105.74602,419.71607 109.79379,422.70872 C 112.27251,424.54131 113.51874,424.72255 120.0033,424.19344 C 124.06568,423.86197 129.86445,423.45997 132.88945,423.30011 C 141.3862,422.85109 141.41508,422.83929 143.20472,419.08639 C 144.65082,416.05389 145.16526,415.69856 146.82419,416.58639 C 147.88777,417.1556 150.55826,417.62132 152.75861,417.62132 C 158.178,417.62132 160.64166,418.71927 165.63444,423.35956 L 169.87943,427.30485 L 167.38444,428.44165 C 165.31522,429.38445 164.88945,430.27783 164.88945,433.6768 C 164.88945,436.87097 165.53279,438.4185 167.80543,440.69115 C 169.40923,442.29494 170.30923,443.86188 169.80543,444.17324 C 169.30164,444.4846 168.88945,445.56878 168.88945,446.58251 C 168.88945,447.72852 167.76265,448.81847 165.91034,449.46419 C 162.22775,450.74795 155.88952,455.70525 155.88948,457.30177 C 155.88943,459.39676 151.47548,459.23899 148.38945,457.03371 C 144.67713,454.38087 137.94193,454.02805 133.27634,456.24202 C 128.54134,458.48892 113.59907,457.3248 109.90861,454.42148 C 106.44443,451.69618 101.20748,449.62132 97.793006,449.62132 C 95.645981,449.62132 94.563604,450.35076 93.41513,452.57166 C 92.576006,454.19435 91.88945,456.16759 91.88945,456.95665 C 91.88945,458.60256 87.705714,461.62132 85.424633,461.62132 C 84.580282,461.62132 83.853778,461.50882 83.81018,461.37132 z",name:"Aydın"},10:{path:"M 141.46624,347.76982 C 140.65523,346.20149 138.88495,344.19317 137.53229,343.30687 C 134.64135,341.41265 131.88945,336.32757 131.88945,332.87978 C 131.88945,330.60453 131.63487,330.48854 127.99208,331.10398 C 125.59855,331.50836 123.8394,331.34935 123.43306,330.69188 C 123.06915,330.10307 121.15295,329.62132 119.17482,329.62132 C 116.87917,329.62132 114.39265,328.71703 112.30056,327.12132 C 108.80148,324.45244 105.95898,323.95179 104.21379,325.69698 C 103.44623,326.46454 101.62355,326.32287 97.850526,325.2024 C 92.07415,323.487 86.237687,324.29187 83.883494,327.1285 C 83.20208,327.94955 81.879823,328.62132 80.945145,328.62132 C 80.010466,328.62132 77.478066,329.9588 75.317589,331.5935 C 70.580585,335.1777 70.118789,335.24512 69.709001,332.41231 C 69.51335,331.05981 68.420121,329.93114 66.88945,329.50135 L 64.38945,328.79938 L 66.63945,328.09372 C 67.87695,327.70561 68.88945,327.04514 68.88945,326.62601 C 68.88945,326.20688 70.23945,325.30477 71.88945,324.62132 C 73.53945,323.93787 74.88945,322.75827 74.88945,322 C 74.88945,321.24173 75.56445,320.62132 76.38945,320.62132 C 77.21445,320.62132 77.88945,319.94632 77.88945,319.12132 C 77.88945,318.29632 78.717218,317.62132 79.728935,317.62132 C 81.801855,317.62132 84.128399,313.40759 83.278437,311.19262 C 82.842679,310.05705 80.994307,309.8022 74.805275,310.02434 C 65.938717,310.34259 65.280293,309.71684 69.077508,304.58083 C 70.88161,302.14065 71.983174,301.62132 75.355002,301.62132 C 77.604192,301.62132 80.437188,300.92597 81.650549,300.0761 C 83.644259,298.67965 84.314676,298.68638 88.613831,300.14598 C 91.230274,301.03429 94.180181,302.62963 95.16918,303.6912 C 97.655126,306.35955 100.5256,306.09801 106.52611,302.65644 C 110.09632,300.60876 111.99503,298.7572 112.75232,296.58486 C 114.26515,292.24513 113.13163,281.75403 110.78878,278.41181 C 109.74415,276.92158 108.88945,275.4009 108.88945,275.03252 C 108.88945,273.73627 118.12599,265.7788 120.24486,265.2496 C 121.42438,264.955 124.13885,265.10969 126.277,265.59336 C 129.58662,266.34201 130.73876,266.11027 134.027,264.03449 C 136.1645,262.68515 137.88945,262.10611 137.88945,262.73794 C 137.88945,263.5435 139.67538,263.6776 143.95519,263.19339 C 149.69246,262.54429 149.96617,262.60944 149.00979,264.39647 C 148.45366,265.43561 147.30139,266.86447 146.4492,267.57173 C 144.40986,269.26424 145.36658,278.8271 148.01669,283.23935 C 149.04671,284.95427 149.89933,287.42927 149.91141,288.73935 C 149.92349,290.04944 150.77934,292.98435 151.8133,295.26139 C 153.25337,298.43278 154.53917,299.68064 157.30873,300.59468 C 159.62281,301.3584 161.48329,302.869 162.47736,304.79133 C 163.94093,307.62156 164.32682,307.77534 169.16915,307.45804 C 174.28162,307.12304 174.3129,307.13916 175.30677,310.62132 C 176.88213,316.14081 179.01964,317.87512 183.26529,317.07864 C 187.84674,316.21915 188.99747,318.39724 185.98516,322.22678 C 184.82613,323.70024 183.88945,326.35536 183.88945,328.16729 C 183.88945,331.81276 179.66393,336.22414 175.31238,337.12161 C 173.97977,337.39645 171.76445,337.85489 170.38945,338.14037 C 167.705,338.69772 167.24071,340.54061 168.97047,343.77271 C 169.56503,344.88366 169.84886,345.99524 169.60121,346.24289 C 169.35356,346.49055 164.9296,347.15944 159.77019,347.72933 C 154.61078,348.29921 149.96195,349.18305 149.43945,349.6934 C 148.91695,350.20376 147.24101,350.62132 145.71513,350.62132 C 143.67607,350.62132 142.55001,349.8656 141.46624,347.76982 z M 133.88945,259.94269 C 131.93243,259.35998 127.74982,252.82565 128.88483,252.12418 C 130.0351,251.41327 138.43378,253.31869 141.70516,255.03275 L 144.2796,256.38163 L 140.12436,258.50148 C 137.83898,259.66739 135.8387,260.56912 135.67929,260.50532 C 135.51988,260.44152 134.71445,260.18833 133.88945,259.94269 z M 121.23453,245.07819 C 120.90884,244.22947 120.87675,243.30069 121.16321,243.01423 C 122.17755,241.99988 127.99922,242.33109 129.13595,243.46782 C 130.00728,244.33915 129.76573,244.62132 128.14847,244.62132 C 126.97093,244.62132 125.72937,245.07132 125.38945,245.62132 C 124.44705,247.14615 121.90033,246.81325 121.23453,245.07819 z",name:"Balıkesir"},11:{path:"M 236.86925,316.25782 L 230.38945,314.02059 L 230.4832,308.57095 C 230.53476,305.57366 230.93513,301.40921 231.37291,299.31664 C 231.85808,296.99757 231.75645,294.65475 231.11263,293.31664 C 228.67771,288.25587 228.89804,286.42921 232.44293,282.28781 C 235.4485,278.77647 235.88945,277.57085 235.88945,272.8644 C 235.88945,268.23271 236.30392,267.05301 238.81253,264.5444 C 242.49878,260.85814 243.48962,260.87219 244.23945,264.62132 C 244.68083,266.82823 245.40271,267.62132 246.97009,267.62132 C 248.14195,267.62132 250.45125,268.7577 252.10187,270.1466 C 254.51988,272.18123 255.76101,272.54844 258.48965,272.03654 C 262.60019,271.2654 266.88664,272.21055 266.89715,273.89037 C 266.90139,274.56739 268.70139,276.14726 270.89715,277.40118 C 273.49968,278.88739 274.88945,280.38976 274.88945,281.71692 C 274.88945,282.83666 275.33649,284.58811 275.88288,285.60905 C 276.72162,287.17625 276.43161,287.56297 274.02039,288.09256 C 270.66116,288.83037 266.60161,293.08129 265.88053,296.61614 C 265.56308,298.17229 264.15307,299.68633 262.13294,300.64018 C 260.35168,301.48125 258.19268,303.17109 257.33516,304.39536 C 256.0939,306.16751 254.80379,306.62132 251.00706,306.62132 C 247.31507,306.62132 245.74705,307.144 244.06376,308.93577 C 241.69258,311.45978 241.14386,316.18837 243.13945,316.90108 C 243.82695,317.14662 244.15536,317.60571 243.86925,317.92128 C 243.58314,318.23685 240.43314,317.4883 236.86925,316.25782 z",name:"Bilecik"},12:{path:"M 782.63945,402.53939 C 781.67695,401.97979 780.88945,400.65467 780.88945,399.59468 C 780.88945,398.53469 779.76445,396.9303 778.38945,396.02936 C 775.58728,394.19331 775.12342,391.8525 777.38945,390.98295 C 778.21445,390.66636 778.88945,389.82494 778.88945,389.11311 C 778.88945,388.40128 780.46445,386.8896 782.38945,385.75382 C 786.63411,383.24941 786.84292,380.76392 783.02361,378.20528 C 781.20334,376.98584 780.32716,375.66352 780.61361,374.56814 C 780.86115,373.62153 780.60411,372.56301 780.04241,372.21586 C 778.92365,371.52442 779.47651,365.66024 781.05626,361.46205 C 782.29502,358.17005 780.66548,354.62132 777.91509,354.62132 C 776.86789,354.62132 773.93135,356.42132 771.38945,358.62132 C 768.84755,360.82132 766.17127,362.62132 765.44217,362.62132 C 764.64743,362.62132 763.85905,360.9043 763.4736,358.33389 C 762.63734,352.75735 764.96191,347.566 767.94581,348.34631 C 769.05098,348.63532 770.72792,348.22744 771.67233,347.43991 C 772.61675,346.65238 774.6729,345.45974 776.24156,344.7896 C 778.54948,343.80363 778.98124,343.12317 778.50441,341.22333 C 777.65751,337.849 783.94267,333.64873 790.79066,333.01262 C 795.72378,332.55439 795.88945,332.62259 795.88945,335.11155 C 795.88945,336.56485 796.5972,337.95568 797.51621,338.30833 C 798.41092,338.65167 803.6812,338.26717 809.22794,337.4539 L 819.31293,335.97521 L 821.46586,338.29827 C 822.64997,339.57595 824.46719,340.63934 825.50412,340.66136 C 826.98729,340.69285 826.80285,341.01963 824.63945,342.19329 C 821.24787,344.03326 821.24127,344.59715 824.53258,351.32435 C 826.49364,355.33261 828.171,357.23447 831.03258,358.69434 C 835.60071,361.02482 835.86313,362.24603 832.13945,363.84524 C 830.62695,364.49481 829.27007,365.09205 829.12415,365.17243 C 828.97824,365.25281 828.19074,367.88365 827.37415,371.01874 C 825.61234,377.7828 825.47213,382.24537 826.99191,383.18464 C 827.64543,383.58854 826.81806,384.48413 824.96009,385.38397 C 823.23624,386.21886 820.90949,388.1888 819.78954,389.76163 C 818.66959,391.33446 816.94048,392.62132 815.94708,392.62132 C 814.95368,392.62132 812.39683,393.22912 810.26518,393.97198 C 807.44487,394.95484 804.41137,395.10718 799.12548,394.53141 C 792.25529,393.78306 791.73071,393.87097 789.44866,396.15301 C 788.1216,397.48008 786.89039,399.55559 786.71263,400.76526 C 786.32962,403.37183 785.0385,403.9342 782.63945,402.53939 z",
-    name:"Bingöl"},13:{path:"M 908.88945,432.51896 C 907.51445,430.93174 903.84966,428.29807 900.74548,426.66635 C 897.64129,425.03462 892.97401,421.85824 890.37375,419.60773 C 886.3295,416.10746 885.19372,415.60718 882.51772,416.14738 C 880.79717,416.49471 878.23872,417.59275 876.83228,418.58747 C 874.5023,420.23538 873.92481,420.26742 870.33228,418.94809 C 868.16372,418.1517 864.99441,417.07485 863.28936,416.5551 C 858.73675,415.16732 857.2847,412.92082 855.89899,405.12132 C 854.2551,395.86868 854.18001,395.65282 852.41213,395.09864 C 847.31368,393.50041 847.27804,393.46381 849.8564,392.47313 C 851.21323,391.9518 855.93823,391.29314 860.3564,391.00943 C 872.46733,390.23176 872.2898,390.31241 873.7283,384.93402 C 874.8496,380.74163 874.80612,380.03356 873.36259,378.97802 C 871.87143,377.88765 871.90542,377.68314 873.74113,376.7007 C 874.85039,376.10704 876.81389,375.62132 878.10447,375.62132 C 879.79339,375.62132 880.76831,374.7806 881.58335,372.62132 C 882.29043,370.74804 883.42438,369.62132 884.60259,369.62132 C 885.64036,369.62132 887.0423,369.06847 887.718,368.39277 C 888.41549,367.69528 892.06819,367.07276 896.168,366.95265 C 906.55006,366.64849 917.66728,365.05059 919.39868,363.61366 C 920.2186,362.93318 920.88945,361.47643 920.88945,360.37643 C 920.88945,358.91607 921.22673,358.64306 922.13945,359.3646 C 922.82695,359.9081 924.73945,360.82767 926.38945,361.4081 C 928.33426,362.09224 928.7329,362.49119 927.52282,362.54237 C 926.08652,362.60312 925.7952,363.14004 926.25916,364.87132 C 926.5908,366.10882 926.86829,367.42893 926.8758,367.8049 C 926.88331,368.18087 928.12695,368.63703 929.63945,368.81861 L 932.38945,369.14874 L 929.18686,370.88619 C 926.96448,372.09187 923.10548,372.72346 916.57847,372.94978 C 908.97389,373.21346 905.9008,373.81647 900.53106,376.09863 C 895.09635,378.40842 893.88945,379.33767 893.88945,381.21232 C 893.88945,382.47235 894.33945,383.7814 894.88945,384.12132 C 896.35194,385.02519 896.11018,386.62132 894.51077,386.62132 C 893.7525,386.62132 892.5863,387.93899 891.91921,389.54946 C 891.25213,391.15994 890.07254,392.72082 889.29789,393.01808 C 888.52325,393.31534 887.88945,394.3062 887.88945,395.21999 C 887.88945,396.59532 888.65733,396.79487 892.3486,396.37881 C 895.14882,396.06319 896.94549,396.28945 897.17801,396.987 C 897.44344,397.7833 898.31771,397.74722 900.26592,396.85956 C 904.04106,395.13949 907.88945,395.27163 907.88945,397.12132 C 907.88945,398.05465 908.83389,398.62132 910.38945,398.62132 C 912.54434,398.62132 912.88945,399.07088 912.88945,401.87792 C 912.88945,403.66905 913.30804,406.59405 913.81964,408.37792 C 914.55946,410.95752 914.45713,411.62132 913.31964,411.62132 C 912.39721,411.62132 911.88945,412.6864 911.88945,414.62132 C 911.88945,416.81177 912.36169,417.62134 913.63945,417.6214 C 915.15314,417.62146 915.38945,418.65133 915.38945,425.24799 C 915.38945,431.78613 915.10403,433.05506 913.38945,434.13965 C 911.6362,435.24871 911.08102,435.04876 908.88945,432.51896 z",name:"Bitlis"},14:{path:"M 281.88945,287.07033 C 278.20841,286.15848 277.23155,285.42471 276.52182,283.03846 C 276.04463,281.43403 275.26634,279.35468 274.7923,278.41768 C 274.26028,277.36607 274.34134,276.46007 275.0041,276.05046 C 275.59463,275.6855 275.85423,274.21741 275.58099,272.78805 C 275.26032,271.11056 275.7878,269.29086 277.06884,267.65526 C 278.70385,265.56775 280.14017,265.03323 285.22147,264.62132 L 291.38945,264.12132 L 291.69695,259.87132 L 292.00445,255.62132 L 299.44695,255.62132 C 303.74195,255.62132 306.88945,256.04423 306.88945,256.62132 C 306.88945,257.90175 312.97963,257.91773 316.32435,256.64607 C 318.44571,255.83953 318.8933,255.01783 318.91169,251.89607 C 318.94279,246.61656 321.40533,243.99839 327.0121,243.28372 C 333.88275,242.40795 336.92332,240.70196 337.59447,237.34623 C 337.91312,235.75299 338.67234,234.2971 339.28164,234.11093 C 339.89094,233.92475 345.66654,233.48156 352.11631,233.12606 L 363.84317,232.47969 L 364.51844,236.70264 C 365.29331,241.54841 367.87332,244.62132 371.16694,244.62132 C 372.41957,244.62132 374.46918,245.33908 375.72164,246.21634 C 377.51322,247.47121 377.93387,248.59081 377.69415,251.46634 C 377.40724,254.90789 377.15587,255.15256 373.38945,255.65638 C 366.93884,256.51924 365.02819,258.83173 368.43191,261.65656 C 369.76206,262.76049 369.03941,263.53082 363.18191,267.25299 C 359.44606,269.62696 355.91505,271.581 355.33523,271.59531 C 354.75541,271.60961 352.05541,273.05907 349.33523,274.81631 C 346.03306,276.94953 342.3955,278.29113 338.38945,278.85333 C 323.23193,280.9805 324.15719,281.01326 321.60479,278.25917 C 319.42583,275.90804 318.94067,275.7928 315.5729,276.8264 C 312.55731,277.75191 311.59966,277.67734 310.15001,276.40414 C 305.58983,272.39903 300.88945,273.50789 300.88945,278.58878 C 300.88945,281.44142 298.23504,284.60582 295.81071,284.64328 C 295.02902,284.65536 292.58945,285.4572 290.38945,286.42515 C 287.02623,287.9049 285.67307,288.00761 281.88945,287.07033 z",name:"Bolu"},15:{path:"M 197.88945,502.68034 C 197.88945,502.1628 198.33945,501.46124 198.88945,501.12132 C 200.59038,500.07009 199.99425,497.16787 197.79533,495.79461 C 195.94866,494.64135 195.87028,494.28796 197.13203,492.80407 C 197.91898,491.87856 200.26375,487.97132 202.34264,484.12132 C 204.42152,480.27132 207.42,475.48156 209.00594,473.47742 C 212.46813,469.10224 212.62989,467.25734 209.66723,465.93536 C 207.76798,465.0879 207.4316,464.12098 207.35277,459.28255 C 207.26426,453.84972 207.364,453.62115 209.82499,453.61699 C 211.23544,453.61461 215.98945,451.78486 220.38945,449.55088 C 226.19075,446.60543 229.21396,445.61979 231.38945,445.96459 C 234.91105,446.52275 248.59571,444.84889 250.99094,443.56701 C 252.30875,442.86173 253.37194,443.77447 256.20787,448.04569 C 259.06493,452.34873 260.72138,453.76192 264.57956,455.18794 C 270.83916,457.50154 271.88945,458.37424 271.88945,461.26184 C 271.88945,462.57943 273.64408,466.54564 275.78863,470.07564 C 279.57332,476.30537 279.6328,476.54361 277.81416,478.18946 C 276.78365,479.12205 275.66042,480.76758 275.31808,481.84619 C 274.77499,483.55733 274.10255,483.72447 270.04255,483.15751 C 267.48334,482.80012 263.36901,482.51968 260.89958,482.53429 C 257.68264,482.55333 255.3644,481.83646 252.72267,480.00574 C 247.4622,476.36023 241.55519,475.753 237.86844,478.47873 C 236.27789,479.65467 232.56753,481.51813 229.62318,482.61976 C 221.93215,485.49734 220.59856,486.72678 220.44743,491.07893 C 220.27831,495.94896 217.73176,497.93694 212.74082,497.09516 C 209.60115,496.56562 208.43965,496.97787 204.41422,500.05055 C 199.67573,503.66752 197.88945,504.38748 197.88945,502.68034 z",name:"Burdur"},16:{path:"M 193.88945,318.92086 C 193.06445,318.62245 190.91957,317.70321 189.12306,316.87809 C 187.29081,316.03656 184.62196,315.62482 183.04453,315.9403 C 179.7279,316.60363 177.81542,314.80917 176.29594,309.60818 C 175.28515,306.14837 175.23742,306.12377 170.14303,306.43706 C 165.32151,306.73357 164.91487,306.57115 163.46652,303.77035 C 162.48325,301.86892 160.61376,300.35541 158.30873,299.59468 C 155.53917,298.68064 154.25337,297.43278 152.8133,294.26139 C 151.77934,291.98435 150.92349,288.98395 150.91141,287.59383 C 150.89933,286.2037 150.12141,283.9698 149.18269,282.62959 C 148.24397,281.28937 147.18562,277.92992 146.8308,275.16413 C 146.24299,270.58223 146.46036,269.77941 149.27721,266.12838 C 150.97755,263.92449 152.41581,262.0039 152.47335,261.8604 C 152.75914,261.1476 168.83332,264.05867 171.78331,265.35747 C 174.42856,266.5221 175.97261,266.61972 178.78331,265.80003 C 182.5115,264.71277 187.51012,265.19854 188.46324,266.74072 C 189.42381,268.29495 197.61591,267.77653 198.25108,266.12132 C 198.56766,265.29632 199.7408,264.62132 200.85807,264.62132 C 201.97533,264.62132 202.88945,264.24106 202.88945,263.77631 C 202.88945,262.36763 199.34407,259.62132 197.52553,259.62132 C 196.13812,259.62132 196.01603,259.25333 196.87249,257.653 C 197.68648,256.13205 198.43315,255.87263 200.15768,256.51161 C 201.38515,256.96642 207.89842,257.3572 214.6316,257.38002 C 225.2314,257.41594 227.20143,257.16376 229.31626,255.50023 C 231.74597,253.58902 231.78791,253.59325 237.32411,256.30846 C 243.32369,259.25093 243.98694,260.13822 240.91554,261.11304 C 237.20337,262.29124 234.88945,266.5009 234.88945,272.07618 C 234.88945,276.57077 234.41651,277.81385 231.33827,281.41007 C 228.17623,285.10421 227.86178,285.97316 228.46866,289.34007 C 228.84353,291.41976 229.59256,293.67889 230.13319,294.36036 C 230.67381,295.04183 230.81975,297.17933 230.45748,299.11036 C 229.80351,302.59633 229.76178,302.62109 224.59414,302.58952 C 221.61235,302.5713 218.5604,301.93065 217.44832,301.08952 C 214.15125,298.59574 211.88945,299.2139 211.88945,302.60878 C 211.88945,305.01596 211.09766,306.09606 207.81302,308.16957 C 205.28874,309.76308 203.15176,312.14761 202.20063,314.43211 C 200.12186,319.42508 198.18118,320.47322 193.88945,318.92086 z",name:"Bursa"},17:{path:"M 37.70422,313.12212 C 36.925933,312.32184 39.867496,305.62132 40.99711,305.62132 C 42.269906,305.62132 43.737719,299.3488 43.805194,293.62132 C 43.840831,290.59632 44.451435,286.11435 45.162091,283.6614 C 46.382966,279.44733 46.660376,279.19431 50.194444,279.07159 C 53.876077,278.94374 56.786379,276.67241 56.857647,273.87132 C 56.875138,273.18382 57.56445,272.62132 58.38945,272.62132 C 59.358976,272.62132 59.8897,271.64878 59.890156,269.87132 C 59.890743,267.58541 60.349095,267.09471 62.606176,266.96366 C 64.102532,266.87677 66.172962,265.75447 67.218201,264.46366 C 68.261391,263.17537 69.471095,262.12132 69.906432,262.12132 C 70.341768,262.12132 72.545412,260.46282 74.803418,258.43577 C 78.419643,255.18942 79.354606,254.81865 82.649167,255.32453 C 84.706323,255.6404 86.933518,256.3262 87.598491,256.84853 C 89.079884,258.01215 94.361865,256.96195 95.81119,255.21562 C 96.454752,254.44017 98.937077,253.98954 102.13029,254.06848 C 107.23335,254.19463 107.38084,254.27937 107.09947,256.92349 C 106.85591,259.21229 107.53117,260.08653 111.31786,262.38491 C 113.79747,263.88993 115.84046,265.43761 115.85784,265.8242 C 115.87523,266.21078 114.08945,267.97359 111.88945,269.74156 C 107.56123,273.21981 106.88968,275.85911 109.57726,278.82885 C 110.53095,279.88267 111.58264,283.3872 111.9952,286.88611 C 112.9917,295.33754 111.58546,298.38038 105.03567,301.94522 C 99.840846,304.7726 96.578907,304.8604 95.558142,302.20033 C 95.274303,301.46066 92.493601,300.05388 89.378804,299.07415 C 84.075186,297.40596 83.536621,297.39853 80.898202,298.95708 C 79.348667,299.87241 76.274499,300.62132 74.066717,300.62132 C 70.587767,300.62132 69.775039,301.07037 67.971009,303.98935 C 66.826152,305.84177 65.88945,308.00402 65.88945,308.79435 C 65.88945,309.80304 63.72864,310.58287 58.63945,311.41086 C 47.946961,313.15048 38.484048,313.92399 37.70422,313.12212 z M 47.907647,273.94624 C 47.917656,273.49254 49.267656,271.1411 50.907647,268.72084 C 53.868453,264.35135 54.57813,261.64333 53.13945,260.20465 C 51.530495,258.5957 52.513472,257.03832 56.369446,255.08723 C 58.580448,253.96847 61.28945,252.56091 62.38945,251.95931 C 67.13933,249.36155 72.167441,247.62132 74.923377,247.62132 C 76.554717,247.62132 77.88945,247.17132 77.88945,246.62132 C 77.88945,246.07132 78.67695,245.60701 79.63945,245.58952 C 84.587412,245.4996 86.553568,239.51814 82.38945,237.22345 C 81.28945,236.61728 80.212825,236.01969 79.996949,235.89549 C 79.781074,235.77128 80.173674,234.98378 80.869394,234.14549 C 81.652694,233.20167 83.813104,232.62132 86.54328,232.62132 C 91.907524,232.62132 93.161557,234.63832 89.933588,238.07434 C 88.610534,239.48266 87.858211,241.36716 88.05762,242.77346 C 88.348624,244.82571 87.572084,245.44776 81.889996,247.71408 C 78.314696,249.1401 75.50195,250.8276 75.63945,251.46408 C 75.77695,252.10056 75.203312,252.62132 74.364699,252.62132 C 73.526086,252.62132 72.403949,253.76809 71.87106,255.16969 C 71.314735,256.63293 69.438243,258.32973 67.464192,259.15454 C 65.573303,259.9446 63.715506,261.09375 63.335754,261.7082 C 62.956002,262.32265 61.131166,263.45803 59.280564,264.23126 C 56.753301,265.28722 55.974773,266.18191 56.152641,267.82588 C 56.33108,269.47514 55.341883,270.60084 52.13945,272.3929 C 49.80195,273.70095 47.897639,274.39995 47.907647,273.94624 z M 23.0294,267.28995 C 21.942416,265.98021 22.197542,265.51336 24.710383,264.21392 C 26.339735,263.37135 29.634078,262.55583 32.031145,262.40165 C 36.122471,262.13849 36.372815,262.27068 36.117889,264.55955 C 35.75289,267.83671 35.657021,267.89312 29.599006,268.3955 C 25.648575,268.7231 23.98671,268.44344 23.0294,267.28995 z",name:"Çanakkale"},18:{path:"M 442.38945,283.69166 C 440.18945,282.63121 436.81445,281.30884 434.88945,280.75305 C 432.96445,280.19727 429.58945,279.06001 427.38945,278.22582 C 423.12293,276.60805 414.88945,276.08398 414.88945,277.43019 C 414.88945,277.87507 414.29004,279.0588 413.55744,280.0607 C 412.30048,281.77968 412.04346,281.70446 408.99635,278.72582 C 407.22036,276.98973 405.29598,274.21733 404.71995,272.56492 C 404.14391,270.91252 402.3714,268.88767 400.78103,268.06526 C 397.79237,266.51976 397.15589,265.19272 398.88945,264.12132 C 400.57948,263.07682 399.99681,260.62132 398.05893,260.62132 C 397.05214,260.62132 394.01464,259.4982 391.30893,258.12551 C 388.60322,256.75281 384.70195,255.62781 382.63945,255.62551 C 379.05135,255.6215 378.88945,255.47633 378.88945,252.2629 C 378.88945,249.30287 379.53953,248.47285 384.36966,245.26582 C 387.73767,243.02959 390.09005,240.67024 390.47302,239.14437 C 391.01118,237.00018 391.37494,236.81078 393.14027,237.75556 C 396.01397,239.29351 402.48673,237.26933 403.18067,234.61568 C 403.62294,232.92444 404.54846,232.62132 409.27015,232.62132 C 414.54621,232.62132 414.92473,232.79169 416.49095,235.87132 C 417.40002,237.65882 418.32364,239.32089 418.54345,239.56481 C 418.76326,239.80873 420.25566,238.57123 421.8599,236.81481 C 424.68323,233.72366 425.03771,233.62132 432.92098,233.62132 L 441.06525,233.62132 L 440.41128,237.87132 C 440.0516,240.20882 439.51196,243.58382 439.21209,245.37132 L 438.66687,248.62132 L 443.55565,248.62132 C 449.45327,248.62132 452.34472,250.44074 453.89047,255.12442 C 454.52522,257.04772 455.35905,258.62132 455.74343,258.62132 C 456.12781,258.62132 456.27064,260.42132 456.06084,262.62132 C 455.80494,265.30467 456.07975,266.62132 456.89571,266.62132 C 457.7491,266.62132 457.91187,267.68827 457.44121,270.19712 C 457.03912,272.34042 457.2143,274.30781 457.87847,275.1081 C 458.68941,276.08521 458.68883,276.62727 457.87633,277.12943 C 457.26569,277.50682 456.35981,278.88417 455.86326,280.19021 C 455.35675,281.52244 453.35485,283.23568 451.30282,284.09307 C 446.76818,285.98776 447.1926,286.00688 442.38945,283.69166 z",name:"Çankırı"},19:{path:"M 458.13945,304.30261 C 456.90195,302.48483 455.88945,300.38236 455.88945,299.63044 C 455.88945,296.64789 453.25617,291.02108 450.88945,288.94641 L 448.38945,286.7549 L 452.18296,285.15651 C 454.26939,284.2774 456.25029,282.78484 456.58496,281.83972 C 456.91963,280.8946 457.89257,279.30865 458.74706,278.31538 C 459.89927,276.97604 460.03091,276.07175 459.25657,274.81538 C 458.68232,273.88365 458.41402,271.43382 458.66037,269.37132 C 458.96541,266.81731 458.71368,265.62132 457.87105,265.62132 C 456.98769,265.62132 456.81678,264.47727 457.27346,261.62132 C 457.63625,259.35253 457.50873,257.62132 456.97882,257.62132 C 456.46497,257.62132 455.52522,256.04772 454.89047,254.12442 C 454.25573,252.20113 452.7707,249.95113 451.59042,249.12442 C 449.52879,247.6804 449.52197,247.61751 451.41694,247.52443 C 452.50182,247.47114 455.11844,247.50854 457.23166,247.60755 C 459.34487,247.70656 462.43157,247.22519 464.09098,246.53784 C 466.84361,245.39767 467.06429,244.96152 466.60838,241.56248 C 466.33354,239.51338 465.1124,236.48932 463.89473,234.84233 C 461.01821,230.95164 461.77966,227.52575 466.79569,221.79037 C 470.28793,217.7973 471.04396,217.41843 476.48644,216.93414 C 481.98429,216.44492 482.91568,216.69359 490.05626,220.55709 C 495.69243,223.6066 497.98078,225.44455 498.69604,227.49634 C 499.27685,229.16246 500.90891,230.80096 502.74538,231.56165 C 505.69416,232.78307 505.79849,233.02852 505.26056,237.47862 C 504.95189,240.03211 504.05421,243.56654 503.26571,245.33291 C 501.73034,248.7724 502.17401,252.59453 504.55039,256.40019 C 505.82292,258.43809 506.48991,258.61055 510.85781,258.03113 C 515.24112,257.44966 516.01093,257.65189 518.36129,260.00225 C 519.80178,261.44274 521.5224,262.63451 522.1849,262.65063 C 522.8474,262.66676 524.90059,264.05387 526.74753,265.73311 L 530.10561,268.78626 L 527.67967,271.45379 C 523.71535,275.81291 521.67567,279.69582 522.23221,281.82405 C 522.51967,282.92327 522.27298,284.88021 521.68403,286.17282 C 520.82211,288.06453 519.71468,288.58138 516.00733,288.82217 L 511.40145,289.12132 L 510.39545,296.01278 C 509.32272,303.36136 509.16092,303.53888 502.13945,305.07104 C 499.46435,305.65478 498.88945,305.47805 498.88945,304.07194 C 498.88945,302.58988 498.1958,302.45568 493.65147,303.0585 C 490.77058,303.44066 486.93249,304.45612 485.12239,305.31507 C 482.11254,306.74334 481.36479,306.73007 476.37271,305.15987 C 471.04256,303.48334 470.83461,303.49209 467.53376,305.53213 C 462.85774,308.42207 460.75668,308.14708 458.13945,304.30261 z",name:"Çorum"},20:{path:"M 184.76463,500.8011 C 182.04115,498.36768 181.50748,497.22334 181.70794,494.24679 C 182.0552,489.0904 179.68384,485.28166 173.91684,481.73319 C 171.15178,480.03183 168.88945,478.18565 168.88945,477.63056 C 168.88945,477.07548 168.28419,476.62132 167.54444,476.62132 C 165.6156,476.62132 162.88945,473.30986 162.88945,470.96689 C 162.88945,469.86857 161.80738,467.9534 160.48485,466.71095 C 159.16233,465.4685 157.78176,462.86084 157.41694,460.91616 C 156.8258,457.76511 157.11466,457.07142 160.07154,454.54116 C 161.89639,452.9796 164.85195,451.19892 166.63945,450.58409 C 168.42695,449.96926 169.88945,448.82001 169.88945,448.0302 C 169.88945,447.24039 170.39278,445.78823 171.00795,444.80318 C 171.93145,443.32443 171.58275,442.46847 169.00795,439.89367 C 164.97949,435.86521 164.69881,431.12094 168.38945,429.43937 C 171.68377,427.93838 171.51957,426.72589 167.5364,423.14023 L 164.22482,420.15914 L 167.56879,415.50458 C 169.55699,412.73715 171.90799,410.65977 173.36747,410.38077 C 174.71756,410.12268 180.39371,410.29808 185.98112,410.77054 C 195.26979,411.55596 196.41786,411.45786 199.38279,409.62543 C 203.536,407.05861 204.11363,407.09763 207.79283,410.19348 C 209.6057,411.7189 211.77339,412.63453 213.11956,412.44348 C 215.00304,412.17616 215.54819,411.22759 216.32194,406.87132 C 216.83481,403.98382 217.78662,401.62132 218.43708,401.62132 C 219.08754,401.62132 220.79269,400.69867 222.2263,399.57099 C 224.40768,397.85512 225.2045,397.71238 227.11116,398.69596 C 231.06483,400.73551 233.88945,403.88828 233.88945,406.26171 C 233.88945,407.52217 234.67521,410.20121 235.63557,412.21513 L 237.3817,415.87679 L 232.53131,420.14491 C 229.8636,422.49237 226.49034,424.68084 225.03519,425.00816 C 220.51861,426.02414 217.05545,429.71349 216.32566,434.28656 C 215.70849,438.15387 215.86598,438.55782 218.52756,439.93418 C 220.10419,440.74949 222.20104,442.30814 223.18722,443.39786 C 224.94013,445.3348 224.85162,445.45175 219.23356,448.62239 C 216.07287,450.40617 211.83368,452.08737 209.81315,452.35838 L 206.13945,452.85113 L 206.13945,459.26794 C 206.13945,464.79763 206.43323,465.83734 208.26445,466.78849 C 209.4332,467.39555 210.5562,468.03552 210.76,468.21066 C 210.96381,468.3858 209.77873,470.23734 208.12649,472.32521 C 206.47425,474.41307 203.42152,479.27132 201.34264,483.12132 C 199.26375,486.97132 196.9664,490.82616 196.2374,491.68763 C 195.5084,492.54911 194.31026,494.99188 193.57486,497.11601 C 192.83947,499.24015 191.29872,501.60159 190.15098,502.36366 C 188.27005,503.61256 187.73867,503.45841 184.76463,500.8011 z",name:"Denizli"},21:{path:"M 765.88945,467.92092 C 761.30638,467.02037 760.59452,465.68898 761.1979,459.1463 C 761.89967,451.53681 760.86434,446.24017 758.58953,445.80208 C 757.64331,445.61985 755.34496,446.41275 753.48207,447.56407 L 750.09502,449.65739 L 744.74633,445.09183 C 741.58332,442.39194 737.65926,440.08855 735.14355,439.45508 C 732.80379,438.86593 730.88945,438.19648 730.88945,437.96742 C 730.88945,437.73836 731.66841,436.36212 732.62046,434.90909 C 734.32037,432.31471 734.31205,432.27755 732.15723,432.84104 C 729.19515,433.61564 727.39447,431.41471 728.81647,428.75768 C 730.68539,425.26557 727.88791,421.74294 724.79877,423.69853 C 721.8473,425.56695 721.12372,424.66119 722.76592,421.15389 C 723.66125,419.24169 725.1479,417.67184 726.08043,417.65389 C 727.01047,417.63597 728.04953,417.17132 728.38945,416.62132 C 729.28938,415.1652 732.95431,415.39348 738.7553,417.26699 C 743.83296,418.90689 743.86466,418.9035 747.8004,416.29895 C 749.97268,414.8614 753.80637,413.16743 756.31972,412.53456 C 760.42245,411.50148 760.88945,411.08944 760.88945,408.50261 C 760.88945,406.9179 761.22695,405.61567 761.63945,405.60877 C 768.72744,405.49016 786.49599,404.36449 787.09169,403.99633 C 787.53046,403.72515 787.88945,402.6503 787.88945,401.60776 C 787.88945,400.56522 788.95522,398.64646 790.25783,397.34385 C 792.47968,395.12199 793.06968,395.02285 799.79385,395.74132 C 805.11845,396.31026 808.01309,396.13616 811.0512,395.06425 C 813.30054,394.27064 815.81199,393.62132 816.6322,393.62132 C 817.45241,393.62132 819.8261,391.8669 821.90706,389.72261 C 826.32147,385.17386 831.29335,383.59665 833.6835,385.9868 C 835.47012,387.77342 838.88741,396.23239 838.88864,398.87132 C 838.88908,399.83382 838.32695,400.63093 837.63945,400.64267 C 835.72642,400.67535 830.83429,408.18639 830.20656,412.0546 C 829.7963,414.58276 830.2446,416.4599 831.89727,419.13397 C 833.66943,422.00138 833.9297,423.23391 833.12481,424.94713 C 828.2115,435.40514 826.27878,438.84638 824.24589,440.75619 C 821.30429,443.51968 821.11206,447.60527 823.88945,448.33157 C 824.98945,448.61923 825.88945,449.2121 825.88945,449.64906 C 825.88945,450.72655 820.02692,455.59387 818.56272,455.73201 C 815.15496,456.05351 812.09439,455.28665 809.57084,453.479 C 805.84381,450.80928 803.88945,451.68424 803.88945,456.02255 C 803.88945,459.96667 801.80407,461.20075 796.94327,460.13314 C 794.49789,459.59604 793.68742,459.97556 791.78512,462.54856 C 789.01168,466.29984 787.05358,467.03339 779.38945,467.19221 C 776.08945,467.26059 772.26445,467.56306 770.88945,467.86435 C 769.51445,468.16565 767.26445,468.19111 765.88945,467.92092 z",name:"Diyarbakır"},22:{path:"M 67.514349,238.91289 C 67.163412,238.56195 63.091855,238.17004 58.466445,238.04198 C 47.052527,237.72598 45.88945,237.27093 45.88945,233.12132 C 45.88945,230.63435 46.411411,229.59043 47.88945,229.12132 C 48.98945,228.77219 49.88945,228.01885 49.88945,227.44722 C 49.88945,226.06237 59.994244,216.62132 61.476454,216.62132 C 63.03967,216.62132 64.158182,210.65005 62.882818,209.11333 C 62.325175,208.44141 62.07271,205.91833 62.321784,203.50649 C 62.570858,201.09465 62.800477,198.3927 62.832048,197.50216 C 62.869904,196.43434 64.117452,195.68373 66.495862,195.29776 C 68.479389,194.97588 70.660209,193.9495 71.342129,193.01692 C 72.052809,192.04501 74.034711,191.27864 75.985717,191.22132 L 79.38945,191.12132 L 79.38945,181.37228 C 79.38945,174.75482 79.024082,171.62293 78.252012,171.62228 C 77.626421,171.62175 76.051421,170.2754 74.752012,168.63039 C 73.452603,166.98539 71.710196,165.63538 70.879997,165.63039 C 70.049798,165.6254 68.808484,164.72132 68.121523,163.62132 C 67.121901,162.02067 67.123789,161.20767 68.130976,159.54973 C 69.177497,157.82704 70.039852,157.57941 73.251213,158.07942 C 77.690502,158.77062 79.88945,157.45948 79.88945,154.12132 C 79.88945,150.55115 82.162752,149.52646 90.812158,149.1979 L 98.88945,148.89107 L 98.88945,157.17947 C 98.88945,164.56147 98.616057,165.79278 96.38945,168.43895 C 93.365207,172.03306 93.248456,173.44865 95.895511,174.42786 C 97.810095,175.13611 97.741694,175.41811 94.395511,180.61191 C 90.622421,186.46835 90.014633,190.56006 92.072474,196.25092 C 92.974297,198.74487 92.979144,200.12905 92.092866,202.07421 C 90.781252,204.9529 85.770114,208.40477 81.618641,209.28929 C 78.217572,210.01393 77.087455,211.593 79.145592,212.74479 C 80.365538,213.4275 80.50254,214.38003 79.809847,217.36311 C 78.559845,222.74624 78.692893,228.02476 80.114409,229.44628 C 81.081022,230.41289 81.081022,231.08492 80.114409,232.63271 C 79.440682,233.71152 78.88945,235.27529 78.88945,236.10775 C 78.88945,237.17619 77.840797,237.62132 75.323709,237.62132 C 73.362551,237.62132 70.946718,238.05549 69.955191,238.58614 C 68.963665,239.11679 67.865286,239.26382 67.514349,238.91289 z",name:"Edirne"},23:{path:"M 741.65956,417.05809 C 741.34978,416.74832 738.72235,415.86862 735.82081,415.10321 C 731.10962,413.86043 730.24565,413.88855 727.74435,415.3661 C 725.05283,416.95603 724.84492,416.92812 722.42168,414.6516 C 720.17193,412.53806 719.51958,412.39927 716.37353,413.36482 C 713.059,414.38208 712.62403,414.2367 709.13373,410.94492 C 705.68658,407.69384 705.25363,407.54388 703.09529,408.85348 C 701.052,410.09328 699.82041,410.01288 692.93178,408.19 C 688.62061,407.04918 684.14743,405.25978 682.99137,404.21356 C 680.31875,401.79486 680.29259,397.47144 682.93612,395.07908 C 684.06179,394.06037 685.66056,391.79858 686.48895,390.05289 C 687.92245,387.03201 688.21503,386.90369 692.55428,387.39279 L 697.11346,387.90667 L 696.41356,383.764 C 695.93182,380.91261 696.07038,379.62132 696.85809,379.62132 C 697.58766,379.62132 697.38398,378.57421 696.29622,376.73279 C 694.06547,372.95641 694.99701,370.07333 697.93918,371.64793 C 699.56711,372.51918 699.76951,373.06091 698.8714,374.14307 C 698.1786,374.97784 698.03055,376.43555 698.49761,377.82333 C 699.25629,380.07757 699.43117,380.86031 699.73714,383.37132 C 699.96376,385.23119 702.88945,384.88552 702.88945,382.99888 C 702.88945,381.62638 703.13545,381.58059 704.48623,382.70164 C 705.83053,383.81731 706.22937,383.7653 707.0087,382.37272 C 708.15099,380.33156 714.80386,380.86633 716.49969,383.13563 C 718.02811,385.1809 718.88945,384.99553 718.88945,382.62132 C 718.88945,380.18623 720.18695,380.06168 722.40877,382.2835 C 723.60374,383.47847 724.27283,383.61903 724.78917,382.78357 C 725.31787,381.92812 726.01959,382.00888 727.44842,383.08959 C 728.51599,383.89706 730.17695,384.57202 731.13945,384.58952 C 732.10195,384.60701 732.88945,385.06601 732.88945,385.60953 C 732.88945,386.15305 733.90049,386.49055 735.13622,386.35953 C 738.91912,385.95845 738.71959,390.28264 734.80437,393.55121 C 728.85227,398.52024 734.14593,399.8241 742.65641,395.48522 C 747.11488,393.21216 751.48752,393.08069 752.66475,395.1843 C 754.00924,397.58676 758.5673,396.04101 759.35146,392.91666 C 760.03222,390.20429 759.2319,388.5021 758.08508,390.22322 C 756.9498,391.92702 753.72788,392.73212 752.41272,391.64064 C 751.73995,391.08228 749.74362,390.79379 747.97644,390.99955 C 746.20925,391.20531 743.67026,390.86688 742.33422,390.24749 C 737.12278,387.83145 740.92866,382.42202 749.06808,380.67643 C 751.77398,380.09612 754.52824,379.61825 755.18867,379.61449 C 756.89925,379.60475 760.88945,373.41712 760.88945,370.77426 C 760.88945,369.55144 760.20431,367.5053 759.36692,366.22728 C 757.99952,364.14036 758.00383,363.77128 759.4093,362.60484 C 760.59463,361.62111 761.25501,361.58688 762.13183,362.4637 C 764.27427,364.60614 767.73932,363.64598 772.38945,359.62132 C 774.93135,357.42132 777.41789,355.62132 777.91509,355.62132 C 779.3979,355.62132 780.78008,359.05983 779.93531,360.64714 C 778.64204,363.07722 777.76428,372.42592 778.77097,373.0481 C 779.28287,373.36447 779.50299,374.41036 779.26013,375.37232 C 778.97302,376.5095 779.87938,377.82094 781.85113,379.12132 C 783.51904,380.22132 784.88499,381.474 784.88657,381.90505 C 784.88816,382.33609 783.31445,383.61804 781.38945,384.75382 C 779.46445,385.8896 777.88945,387.44942 777.88945,388.2201 C 777.88945,388.99077 777.45528,389.62132 776.92463,389.62132 C 776.39398,389.62132 775.43674,390.59869 774.79743,391.79326 C 773.78386,393.68714 774.02028,394.29526 776.64416,396.54326 C 778.29917,397.96119 779.8768,400.08607 780.14999,401.26521 C 780.61302,403.26368 780.14876,403.45575 773.30504,404.09706 C 769.26712,404.47545 765.4927,404.49415 764.91746,404.13863 C 762.70912,402.7738 759.88945,404.69808 759.88945,407.56999 C 759.88945,410.08109 759.39253,410.50902 755.2715,411.5467 C 752.73163,412.18625 749.02717,413.81467 747.03937,415.16542 C 743.24638,417.74282 742.57905,417.97759 741.65956,417.05809 z",name:"Elazığ"},24:{path:"M 695.36395,365.87656 C 693.25556,362.41176 689.15655,360.95478 684.18887,361.90441 C 682.71891,362.18542 681.03769,362.23175 680.45283,362.00739 C 678.94607,361.42935 679.19682,345.3522 680.72051,344.8443 C 682.44343,344.26999 682.14215,340.65552 680.31285,339.95355 C 677.98527,339.06038 676.68193,334.92648 678.04152,332.74943 C 678.82913,331.48825 678.85903,330.38938 678.14065,329.10571 C 677.0433,327.14484 679.60317,319.70086 682.46093,316.54258 C 684.58953,314.19014 684.19596,312.08201 681.38945,310.80327 C 678.58566,309.52578 678.16582,307.46677 680.34101,305.66152 C 681.47567,304.71984 682.56712,304.73691 685.34036,305.73973 C 688.10082,306.73792 689.15459,306.75618 690.0888,305.82197 C 690.74916,305.16161 693.0107,304.62132 695.11445,304.62132 C 698.55625,304.62132 698.99899,304.32364 699.53372,301.64997 C 700.0546,299.04559 700.37411,298.81033 702.12078,299.74512 C 703.21681,300.3317 705.23885,300.59652 706.61419,300.33361 C 708.97803,299.88173 718.68346,303.67347 728.15652,308.74981 C 730.2284,309.86007 733.1534,310.65687 734.65652,310.52046 C 736.15963,310.38405 738.88217,310.61833 740.70661,311.04109 C 743.09031,311.59343 744.49733,311.3944 745.70661,310.33381 C 746.63217,309.52205 748.28945,308.57771 749.38945,308.23527 C 750.48945,307.89284 752.41718,306.02268 753.67331,304.07937 C 754.92943,302.13606 756.98371,300.15578 758.23837,299.67876 C 764.93654,297.13212 780.61042,297.30035 778.0197,299.89107 C 774.87024,303.04053 779.38574,307.62132 785.63979,307.62132 C 789.1306,307.62132 790.88945,309.24023 790.88945,312.45329 C 790.88945,315.25134 794.26904,321.16927 796.31539,321.95453 C 797.0774,322.24694 797.99798,323.83898 798.36114,325.49241 C 798.8065,327.52012 799.89506,328.81841 801.70543,329.48103 L 804.38945,330.46343 L 801.88945,330.61538 C 800.51445,330.69895 796.97371,331.11063 794.02115,331.53022 C 789.23605,332.21024 788.35127,332.03935 785.87679,329.95722 C 782.42667,327.05413 773.81233,326.73672 768.40863,329.31356 C 765.05695,330.91187 764.58274,330.90612 759.86588,329.20996 C 754.2185,327.17919 751.40729,327.66953 752.16154,330.55379 C 752.5289,331.95859 752.00875,332.62555 750.18976,333.08208 C 748.83084,333.42315 746.65541,334.84982 745.35549,336.25247 C 742.81501,338.99369 740.88945,338.69612 740.88945,335.5623 C 740.88945,333.20891 739.60691,333.10512 736.41006,335.19977 C 735.08509,336.06792 731.83842,336.89367 729.19524,337.03477 C 726.55206,337.17587 723.12266,337.81557 721.57435,338.45632 C 720.02605,339.09707 718.12702,339.62132 717.35429,339.62132 C 716.58156,339.62132 714.95123,340.97132 713.73133,342.62132 C 712.51143,344.27132 710.92296,345.62132 710.20139,345.62132 C 709.47982,345.62132 708.88945,346.10164 708.88945,346.68871 C 708.88945,347.29417 708.04027,347.48658 706.92722,347.13331 C 703.99819,346.20367 700.70931,348.3438 701.07877,350.93898 C 701.29795,352.47858 702.19938,353.21451 704.13945,353.43774 C 707.89951,353.87038 707.59045,355.23838 703.38945,356.75748 C 701.46445,357.45357 699.88945,358.31337 699.88945,358.66815 C 699.88945,359.02292 698.22155,359.21193 696.18301,359.08817 C 693.66643,358.93538 692.20754,358.2602 691.63851,356.98496 C 690.71834,354.92279 684.88945,351.16021 684.88945,352.6284 C 684.88945,353.13114 685.60684,354.12271 686.48364,354.83189 C 687.36045,355.54108 689.13511,357.17219 690.42733,358.45658 C 692.05749,360.07687 693.4079,360.59155 694.83806,360.13763 C 697.32436,359.34851 698.1749,361.03339 697.68441,365.77612 L 697.33845,369.12132 L 695.36395,365.87656 z",name:"Erzincan"},25:{path:"M 847.97054,347.74073 C 843.44593,341.07795 841.39517,340.16434 833.24872,341.18217 C 829.57312,341.64141 827.88945,341.50141 827.88945,340.73654 C 827.88945,340.12317 827.15355,339.62132 826.25412,339.62132 C 825.35469,339.62132 823.53544,338.45237 822.21135,337.02365 C 820.53167,335.21124 819.13667,334.58611 817.59668,334.95569 C 809.89764,336.8034 798.66206,337.79393 797.58781,336.71968 C 795.77833,334.9102 798.09433,332.17076 801.7403,331.80796 C 805.52153,331.43171 805.99134,328.93598 802.44834,328.04674 C 800.77856,327.62766 799.80084,326.49437 799.35405,324.46012 C 798.99479,322.82445 798.0774,321.24694 797.31539,320.95453 C 795.26904,320.16927 791.88945,314.25134 791.88945,311.45329 C 791.88945,308.24023 790.1306,306.62132 786.63979,306.62132 C 783.63398,306.62132 777.88945,304.10979 777.88945,302.79564 C 777.88945,301.0846 780.46404,299.62132 783.47457,299.62132 C 788.57754,299.62132 800.88945,288.68806 800.88945,284.1565 C 800.88945,282.37928 798.78698,282.12379 797.20232,283.70845 C 796.41947,284.4913 795.92712,284.4913 795.4433,283.70845 C 795.07376,283.11053 793.68881,282.62132 792.36562,282.62132 C 791.01053,282.62132 789.50771,281.77655 788.92463,280.68706 C 787.47818,277.98434 787.63401,276.62132 789.38945,276.62132 C 791.1294,276.62132 791.39778,273.52965 789.79681,271.92868 C 789.00662,271.13849 789.03984,270.1835 789.9168,268.47868 C 791.69825,265.01556 797.06008,259.62132 798.72095,259.62132 C 800.46392,259.62132 804.88945,255.02996 804.88945,253.22167 C 804.88945,251.91705 810.67582,248.98164 814.38184,248.40622 C 815.47765,248.23607 816.93334,246.9303 817.6167,245.50451 L 818.85918,242.91216 L 823.87432,245.39412 C 828.72967,247.79701 828.88945,248.01279 828.88945,252.16692 C 828.88945,254.52687 829.16259,257.16955 829.49644,258.03953 C 830.47517,260.59006 833.65099,259.8637 836.10951,256.52701 C 839.49662,251.93006 842.40403,250.71077 847.12249,251.90844 C 850.71337,252.8199 851.28849,252.67682 853.691,250.27432 C 855.88834,248.07698 856.36586,246.61497 856.57674,241.43909 C 856.94515,232.39652 858.34097,231.30698 868.39042,232.21764 C 875.29405,232.84323 876.64722,233.30837 879.80594,236.14166 C 881.77687,237.90952 884.35178,239.65506 885.52796,240.02064 C 886.70414,240.38621 888.81748,241.75205 890.22427,243.05582 C 892.56698,245.22697 892.6932,245.74821 891.72516,249.25417 C 891.14385,251.35949 890.93765,255.37431 891.26693,258.176 C 891.81329,262.8247 891.62629,263.49044 889.12754,265.79228 C 884.55593,270.00363 881.59166,271.62066 878.41694,271.63497 C 870.88374,271.66895 869.06432,274.03133 872.85747,278.85354 C 874.11789,280.4559 876.26905,281.58631 878.84037,281.99748 C 881.5103,282.42442 883.37999,283.44034 884.42168,285.03016 C 885.28321,286.34503 887.74669,288.58461 889.89606,290.007 C 892.04543,291.42938 894.26905,293.46209 894.83743,294.52411 C 895.75598,296.24045 895.12287,296.82553 889.14111,299.7882 C 885.02719,301.82575 882.27313,303.84464 882.05573,304.9822 C 881.65291,307.08995 887.8096,313.95703 892.13945,316.22942 C 893.78893,317.0951 894.88945,318.50105 894.88945,319.74263 C 894.88945,322.70015 891.30295,327.3352 886.82925,330.15933 C 883.89475,332.01179 882.55829,333.80799 881.18672,337.74287 C 879.03423,343.91807 874.96582,348.61244 871.73824,348.64506 C 870.44641,348.65811 866.68945,349.78103 863.38945,351.14042 C 854.11526,354.96083 852.65496,354.63885 847.97054,347.74073 z",
-    name:"Erzurum"},26:{path:"M 326.88945,360.68457 C 326.06445,360.20281 322.75998,359.12326 319.54617,358.28556 C 312.94718,356.56548 309.88945,354.31124 309.88945,351.16633 C 309.88945,345.93439 305.52156,345.34358 297.60987,349.50537 C 294.12509,351.33847 291.20513,352.21316 289.59684,351.90572 C 287.74102,351.55095 286.76693,351.98173 285.94278,353.52166 C 284.7128,355.81992 278.57519,356.53988 277.33395,354.53151 C 276.93086,353.8793 275.31988,353.69319 273.3219,354.06801 C 270.49797,354.59779 269.73116,354.30937 268.34696,352.19682 C 267.44692,350.82319 265.81723,349.41579 264.72542,349.06926 C 262.21442,348.2723 258.3707,339.74007 259.85432,338.25645 C 260.42364,337.68713 260.88945,335.65577 260.88945,333.74232 C 260.88945,331.04364 260.10443,329.54428 257.38945,327.05745 C 255.17188,325.02624 253.88945,322.93258 253.88945,321.34344 C 253.88945,318.67875 252.28341,317.62132 248.23623,317.62132 C 245.49738,317.62132 242.88945,315.54628 242.88945,313.36706 C 242.88945,310.38761 247.34659,307.62132 252.1472,307.62132 C 255.79905,307.62132 257.10512,307.1515 258.33516,305.39536 C 259.19268,304.17109 261.3557,302.48116 263.14187,301.63997 C 265.2738,300.63595 266.50923,299.26308 266.73813,297.64363 C 268.06834,288.23249 286.43858,284.61697 288.19915,293.4198 C 288.89661,296.90714 292.41766,298.20343 297.38945,296.80324 C 301.7485,295.57563 315.50739,296.05935 317.24484,297.5013 C 318.05495,298.17364 321.56325,299.03819 325.04105,299.42253 C 331.2909,300.11321 331.38805,300.17143 333.40849,304.43751 C 334.73321,307.2346 336.60969,309.31406 338.74008,310.34584 L 342.0275,311.93799 L 339.45848,314.32012 C 336.38643,317.16868 336.35768,317.41153 338.77934,320.05687 C 341.3014,322.81188 346.18566,334.48521 346.12851,337.62132 C 346.10346,338.99632 345.75895,341.37459 345.36293,342.90636 C 344.84376,344.91446 345.12958,346.22917 346.38746,347.61912 C 348.65015,350.11937 347.79154,352.1909 344.19433,352.91034 C 342.61748,353.22571 339.24725,355.3147 336.70494,357.55253 C 332.1046,361.60191 329.74806,362.35387 326.88945,360.68457 z",name:"Eskişehir"},27:{path:"M 635.88945,523.62132 C 631.6241,521.28614 629.88945,521.14158 629.88945,523.12132 C 629.88945,525.9649 627.04207,524.6138 625.92936,521.24224 C 624.49761,516.904 622.38858,515.07332 617.24534,513.70432 C 613.98132,512.83552 612.95533,512.01937 612.41421,509.86129 C 612.03635,508.35431 610.80439,506.26103 609.67652,505.20957 C 607.09885,502.80653 604.60914,504.08878 603.88594,508.19184 C 603.4983,510.39107 602.61344,511.26902 600.04096,512.0068 C 598.20316,512.53387 595.41239,514.25222 593.83926,515.82535 C 591.10919,518.55543 590.82909,518.62215 587.68424,517.29147 C 585.87211,516.52471 583.57308,514.98042 582.57531,513.85972 C 578.2058,508.95192 585.15521,497.83699 595.72108,492.83429 C 599.07782,491.24495 601.4004,489.40762 601.98007,487.88297 C 603.26893,484.49302 605.00974,485.43537 607.68077,490.9689 C 610.72404,497.27361 612.22568,497.66705 616.71,493.33461 C 622.24459,487.98747 630.98613,482.62132 634.1621,482.62132 C 637.48166,482.62132 641.88945,478.65435 641.88945,475.66677 C 641.88945,474.36374 642.54278,473.62132 643.68945,473.62132 C 644.67945,473.62132 646.01882,473.09195 646.66582,472.44495 C 647.56765,471.54312 648.2745,471.65981 649.69456,472.94495 C 650.71337,473.86695 652.8615,474.62746 654.46819,474.63497 C 659.36659,474.65787 661.88945,475.72002 661.88945,477.75939 C 661.88945,478.81059 660.79112,480.16463 659.43857,480.7809 C 658.00142,481.4357 656.72873,483.07658 656.36163,484.74799 C 656.0173,486.31571 655.3202,487.8551 654.81251,488.16887 C 653.36043,489.06631 653.73383,497.00463 655.4177,501.03469 C 656.30351,503.15474 657.98501,505.08735 659.4177,505.63206 C 660.77716,506.14893 661.88945,507.20652 661.88945,507.98226 C 661.88945,508.75801 662.56168,510.68164 663.38329,512.25701 C 665.20909,515.75783 665.29807,517.62125 663.63945,517.62155 C 662.95195,517.62167 659.91445,518.95382 656.88945,520.58187 C 653.73074,522.28188 649.81824,523.55885 647.69847,523.58164 C 645.66843,523.60346 643.72937,524.07132 643.38945,524.62132 C 642.46412,526.11853 639.80256,525.76366 635.88945,523.62132 z",name:"Gaziantep"},28:{path:"M 702.38945,298.61617 C 701.28945,298.13779 698.21951,297.4608 695.56737,297.11177 C 692.7633,296.74274 689.90646,295.63833 688.7409,294.47277 C 687.56378,293.29565 685.01399,292.31831 682.56299,292.10476 C 680.26754,291.90476 676.36445,291.0958 673.88945,290.30706 L 669.38945,288.87298 L 669.71278,284.33929 C 669.90949,281.58102 669.41998,278.61415 668.46278,276.76312 C 667.59745,275.08976 666.88945,271.4768 666.88945,268.73434 C 666.88945,263.83971 666.8297,263.74228 663.63945,263.43468 C 660.87037,263.16769 660.33973,262.68441 660.05348,260.1687 C 659.86869,258.54475 659.07918,256.74475 658.29902,256.1687 C 657.08959,255.27568 657.17635,254.34494 658.88775,249.85333 C 662.1496,241.29253 662.72393,240.70582 667.56686,240.98719 C 669.91529,241.12363 672.14859,241.54713 672.52976,241.92829 C 672.91092,242.30946 676.00304,242.62132 679.40113,242.62132 C 684.29269,242.62132 685.9534,242.20814 687.37481,240.63749 C 688.63888,239.24072 689.89222,238.83489 691.61023,239.26609 C 693.26543,239.68152 694.97639,239.19382 696.92939,237.74991 C 698.51288,236.57919 700.41169,235.62132 701.14896,235.62132 C 701.88623,235.62132 702.91695,235.2241 703.43945,234.73861 C 703.96195,234.25313 706.71663,233.64758 709.56096,233.39295 L 714.73246,232.92999 L 715.18895,239.02565 C 715.44002,242.37827 715.81285,246.00403 716.01745,247.0829 C 716.27798,248.45668 715.49048,249.50679 713.38945,250.58729 C 709.09195,252.79738 699.06787,263.06224 698.32787,266.01067 C 697.48398,269.37297 698.28965,270.38272 702.78133,271.59221 C 704.87542,272.15609 708.01183,273.9774 709.75112,275.63956 L 712.91348,278.66168 L 710.45377,279.59687 C 707.09892,280.87238 704.73848,284.7811 704.14537,290.04312 C 703.74152,293.62608 704.0316,294.76261 705.71861,296.20707 C 709.01993,299.03375 706.89139,300.57404 702.38945,298.61617 z",name:"Giresun"},29:{path:"M 741.88945,309.63415 C 741.88945,309.05883 739.95177,308.84304 737.24498,309.11694 C 733.87519,309.45791 731.61097,309.05779 728.99498,307.65902 C 727.01194,306.59869 722.01445,304.18229 717.88945,302.28925 C 707.75342,297.63763 704.4948,294.44066 705.23572,289.87492 C 706.00687,285.12292 708.47687,281.66111 711.9635,280.44566 C 713.57277,279.88467 714.88945,279.19288 714.88945,278.90837 C 714.88945,277.3846 706.93735,271.44203 703.7497,270.58369 C 697.4118,268.87707 697.96403,266.39012 706.54009,258.01721 C 709.51307,255.11466 713.30507,252.0616 714.96676,251.23264 C 717.90848,249.76512 718.1687,249.84231 724.84988,254.16434 C 728.6239,256.60574 732.93549,259.06853 734.4312,259.63719 C 735.9269,260.20586 738.39886,261.55992 739.92443,262.64623 C 744.82627,266.13665 747.72171,264.59022 748.809,257.90104 C 749.13222,255.91254 750.00502,254.0828 750.74854,253.83496 C 751.78181,253.49053 751.93899,254.11929 751.41548,256.50283 C 750.82421,259.19486 751.00811,259.62132 752.7603,259.62132 C 753.87668,259.62132 755.19369,260.34255 755.68701,261.22406 C 757.02012,263.6062 760.44317,262.53753 760.15124,259.83033 C 759.80511,256.62058 761.49541,257.12507 763.31621,260.77496 C 765.35954,264.87091 765.35709,267.01475 763.30999,266.2292 C 756.53505,263.62941 748.95977,276.27864 752.89174,283.6256 C 753.7322,285.19602 753.08636,286.17944 748.89174,289.7164 C 744.58856,293.34489 743.88945,294.43977 743.88945,297.55045 C 743.88945,300.6574 744.38222,301.43189 747.38945,303.05139 C 751.51892,305.27525 751.79036,306.3571 748.43047,307.20038 C 747.07803,307.53982 745.44793,308.4484 744.80802,309.21943 C 743.45996,310.84375 741.88945,311.06691 741.88945,309.63415 z",name:"Gümüşhane"},30:{path:"M 1001.2037,487.37132 C 997.67738,481.88705 997.3506,477.62132 1000.4568,477.62132 C 1004.1355,477.62132 1000.8939,469.93895 996.42793,468.07295 C 989.75631,465.28537 983.97482,466.62627 982.48964,471.30566 C 981.69701,473.803 978.88162,474.59274 970.88945,474.5596 C 959.87631,474.51394 955.80503,473.40301 952.26441,469.47742 C 948.56938,465.38061 947.72487,463.0028 949.45492,461.56698 C 950.46292,460.73042 950.77807,459.3907 950.38637,457.60731 C 949.90036,455.3945 950.42946,454.35437 953.34191,451.7972 C 955.45285,449.94378 956.89097,447.75889 956.8932,446.40187 C 956.89808,443.43174 963.44482,440.62517 970.39996,440.61155 C 975.66798,440.60124 984.28972,437.26908 986.75276,434.29147 C 988.88457,431.71427 990.10343,433.39531 989.34743,437.87002 C 988.68799,441.77322 988.74624,441.88844 991.02687,441.19198 C 992.32629,440.79517 995.38014,440.05342 997.8132,439.54366 C 1000.2463,439.03389 1002.9463,438.00459 1003.8132,437.25633 C 1006.5624,434.88348 1011.5174,434.49945 1013.9517,436.47057 C 1015.8806,438.03256 1015.9835,438.49795 1014.8137,440.37104 C 1013.7094,442.13935 1013.7094,442.9163 1014.8138,444.97979 C 1015.6288,446.50269 1015.8964,448.7712 1015.5062,450.85073 C 1014.9775,453.66904 1015.3502,454.77711 1017.7192,457.43054 C 1019.286,459.18547 1020.9778,460.63343 1021.4787,460.64822 C 1021.9796,460.66302 1023.9645,462.00736 1025.8895,463.63564 C 1028.2218,465.60844 1029.0061,466.85058 1028.2403,467.35874 C 1027.6083,467.77816 1026.9333,469.24632 1026.7403,470.62132 C 1026.4395,472.76529 1025.8717,473.12132 1022.7535,473.12132 C 1019.7591,473.12132 1018.259,473.96382 1014.2535,477.89501 C 1006.452,485.55163 1003.0983,488.62132 1002.5345,488.62132 C 1002.2446,488.62132 1001.6458,488.05882 1001.2037,487.37132 z",name:"Hakkari"},31:{path:"M 562.76082,585.97743 C 562.36305,584.6209 560.98585,583.58177 559.01082,583.14798 C 556.76653,582.65505 555.88945,581.89229 555.88945,580.43346 C 555.88945,578.7243 555.46028,578.51222 553.1666,579.08789 C 550.48271,579.76151 550.4701,579.74217 552.28513,577.7366 C 553.61763,576.2642 553.93643,574.93081 553.43873,572.91161 C 552.64154,569.6774 546.30507,557.99622 544.8651,557.10627 C 543.18758,556.06951 543.78287,554.10497 546.85132,550.55143 C 548.48036,548.66487 550.16786,546.80435 550.60132,546.41694 C 555.72077,541.84146 559.95446,538.60501 562.56858,537.26856 C 566.23541,535.39392 566.7814,534.00014 566.54595,527.11517 C 566.31936,520.48909 563.19586,515.22318 558.48087,513.51822 C 554.33537,512.01918 554.22265,511.71417 556.79418,508.95396 C 558.40411,507.2259 559.4094,507.0173 563.28947,507.60615 C 565.81428,507.98932 568.76415,509.10294 569.84475,510.08086 C 571.27474,511.37499 572.70516,511.69087 575.10048,511.24151 C 577.99164,510.69912 578.72234,511.03873 581.11435,514.03654 C 582.61191,515.91338 585.42395,517.97265 587.36332,518.6127 C 591.36912,519.93473 591.48916,520.16447 589.3118,522.34182 C 588.4441,523.20953 587.94764,524.73584 588.20857,525.73363 C 588.4695,526.73141 588.04016,528.08128 587.25448,528.73333 C 586.45977,529.39289 585.86688,531.51663 585.91815,533.5201 C 585.96885,535.50077 585.70513,538.98718 585.33212,541.26767 C 584.63061,545.55651 586.12993,549.52181 590.17012,554.06286 C 593.0918,557.34675 591.95046,559.1133 586.86401,559.18 C 582.59366,559.236 580.20618,559.80531 576.88945,561.55851 C 575.8508,562.10753 575.37144,564.01862 575.33089,567.77209 C 575.26154,574.19247 574.5762,575.61367 571.88845,574.91081 C 570.49856,574.54734 569.88945,574.88066 569.88945,576.00469 C 569.88945,576.91951 569.07437,577.62132 568.01189,577.62132 C 565.35165,577.62132 564.08819,579.53585 563.71396,584.134 C 563.47021,587.12898 563.233,587.58776 562.76082,585.97743 z",name:"Hatay"},32:{path:"M 281.07356,475.87132 C 276.72711,469.74826 272.88945,462.3996 272.88945,460.19976 C 272.88945,457.37605 271.81547,456.49278 265.57956,454.18794 C 261.70196,452.75474 260.06672,451.35144 257.14295,446.94791 C 254.18021,442.48571 253.13845,441.60205 251.45283,442.12141 C 239.42608,445.82697 238.18344,445.39827 241.94046,438.83973 C 244.12225,435.03103 246.14052,432.97443 249.17772,431.46502 C 251.49417,430.31381 254.73945,427.55388 256.38945,425.33186 C 258.67527,422.25358 261.02866,420.63073 266.27522,418.51483 C 270.06239,416.98748 274.78739,414.43112 276.77522,412.83403 C 278.76304,411.23693 281.80524,409.19831 283.53565,408.30377 C 285.26606,407.40922 287.51606,405.54597 288.53565,404.16322 C 290.48176,401.52394 296.88945,399.47241 296.88945,401.48861 C 296.88945,402.10311 298.19607,403.7701 299.79306,405.19302 C 301.40274,406.62726 302.9769,409.27393 303.32553,411.13227 C 303.78689,413.59155 305.89144,416.30053 311.22685,421.30286 C 315.22671,425.05301 318.85084,428.70353 319.28047,429.41512 C 320.42526,431.3112 318.05135,433.62132 314.95813,433.62132 C 313.4806,433.62132 311.3982,434.28201 310.33058,435.08952 C 309.26296,435.89702 307.58783,436.57202 306.60807,436.58952 C 303.51207,436.64479 303.57476,439.45582 306.78349,444.45619 C 308.49177,447.11831 309.88945,450.08204 309.88945,451.04224 C 309.88945,452.00244 308.26602,454.36463 306.28182,456.29155 C 303.22041,459.26458 302.76651,460.2566 303.2839,462.84359 C 303.61924,464.52029 303.42533,467.63121 302.85299,469.75673 C 301.93671,473.15953 301.45166,473.62132 298.79373,473.62132 C 294.36583,473.62132 287.12432,475.63339 285.79724,477.23242 C 284.1436,479.22494 283.27683,478.97518 281.07356,475.87132 z M 283.88945,440.69275 C 283.88945,439.63203 284.65099,438.00264 285.58176,437.07187 C 286.72201,435.93162 287.27407,433.74199 287.27407,430.35965 C 287.27407,426.09606 286.86459,425.01323 284.55629,423.17266 C 283.06152,421.98077 282.14821,420.6959 282.52671,420.31739 C 282.90521,419.93889 283.36146,418.29047 283.54058,416.65424 C 284.02628,412.21763 280.99856,410.93559 277.37944,414.04541 C 274.9911,416.09765 274.71669,416.88691 275.30368,420.0158 C 275.6757,421.99883 276.52219,423.62821 277.18476,423.63663 C 277.84734,423.64505 279.01144,424.04588 279.77164,424.52735 C 280.94629,425.2713 280.94717,425.86963 279.77753,428.51204 C 279.02056,430.22214 278.06108,431.62132 277.64534,431.62132 C 277.2296,431.62132 276.88945,432.97132 276.88945,434.62132 C 276.88945,436.27132 277.3491,437.62132 277.91089,437.62132 C 278.47268,437.62132 279.44491,438.74632 280.0714,440.12132 C 281.41808,443.07695 283.88945,443.44683 283.88945,440.69275 z",name:"Isparta"},33:{path:"M 372.38945,568.09404 L 369.38945,566.61229 L 369.46502,556.87262 L 369.5406,547.13295 L 375.96502,545.33436 C 379.49846,544.34513 384.05812,543.55104 386.0976,543.56971 C 391.33125,543.61761 394.76984,542.06611 395.87555,539.15789 C 396.68607,537.02604 397.27153,536.74774 399.85761,537.26495 C 404.56195,538.20582 403.71308,535.40397 397.94268,530.94438 C 395.00307,528.67253 392.36569,525.59154 391.44268,523.35108 C 388.96827,517.34482 389.28507,516.62132 394.38945,516.62132 C 396.86445,516.62132 398.88945,517.07132 398.88945,517.62132 C 398.88945,519.76816 401.50741,518.47181 402.50402,515.83148 C 403.37314,513.52893 404.63147,512.74292 409.70816,511.33148 C 413.09126,510.39089 417.60536,509.62132 419.73949,509.62132 C 422.13728,509.62132 424.61557,508.83799 426.2263,507.57099 C 428.27048,505.96304 429.2563,505.74729 430.79542,506.57099 C 434.44294,508.52309 437.22242,507.63959 445.91837,501.76394 C 452.71445,497.17199 456.16607,495.55003 461.8952,494.25623 C 470.09601,492.40425 471.88886,491.32674 471.89077,488.24888 C 471.89175,486.65401 473.16388,485.55766 476.9716,483.87008 C 485.82022,479.94838 486.58402,479.95455 488.25811,483.96122 C 489.52378,486.9904 490.26186,487.53596 493.45998,487.80629 C 498.09756,488.1983 499.82662,490.50168 498.01888,493.87948 C 496.28504,497.11919 497.78603,503.00407 500.45262,503.42134 C 501.51788,503.58803 503.34555,504.19708 504.51412,504.77477 C 506.39333,505.70378 506.50999,506.16637 505.52389,508.77885 C 504.57571,511.29086 504.75056,512.32609 506.69313,515.70137 C 509.20065,520.05827 508.91512,521.59186 505.58043,521.67776 C 504.37539,521.70881 501.81445,522.28076 499.88945,522.94878 C 496.75946,524.03495 496.03111,523.92326 492.9999,521.89233 C 487.83209,518.42987 481.10468,518.99667 475.85846,523.33654 C 470.66288,527.63452 466.8577,530.53636 463.13945,533.0361 C 460.80195,534.60757 458.88945,536.17748 458.88945,536.52479 C 458.88945,536.8721 456.86445,539.26954 454.38945,541.85243 C 451.26471,545.11337 449.88752,547.40014 449.88313,549.33495 C 449.87843,551.40436 449.075,552.57772 446.76073,553.89506 C 443.90144,555.52263 443.54711,555.5354 442.46102,554.05009 C 440.82943,551.81876 436.69652,552.60378 435.30314,555.40969 C 433.58677,558.86602 430.79024,560.55424 426.72278,560.58952 C 424.70612,560.60701 422.88159,561.14489 422.66829,561.7848 C 422.40952,562.56112 418.1774,563.05673 409.9502,563.27419 C 403.01196,563.45758 397.04477,564.07745 396.30466,564.69169 C 395.58125,565.29206 392.49451,565.89973 389.44522,566.04205 C 385.98952,566.20335 383.21,566.92624 382.06652,567.96108 C 379.81098,570.00231 376.34932,570.04988 372.38945,568.09404 z",name:"Mersin"},34:{path:"M 210.10993,235.38932 C 208.9156,234.14192 205.90749,231.32132 203.42522,229.12132 C 200.94296,226.92132 198.90694,224.77488 198.90073,224.35145 C 198.89453,223.92802 199.98889,221.83996 201.33264,219.71131 C 202.6764,217.58266 203.50416,215.56936 203.17211,215.23731 C 202.84006,214.90526 203.38536,213.73082 204.3839,212.62745 C 206.8154,209.94068 211.35909,210.05385 220.22148,213.02191 C 224.16386,214.34224 230.65195,216.19072 234.63945,217.12963 C 238.62695,218.06855 241.88945,219.04287 241.88945,219.29478 C 241.88945,220.67795 239.64444,223.62132 238.58946,223.62132 C 237.91316,223.62132 235.69864,224.51167 233.6683,225.59986 C 230.21668,227.44982 229.79451,227.47381 227.1725,225.96898 C 224.53559,224.4556 224.15998,224.48505 220.87884,226.46242 C 218.51455,227.88725 216.90467,229.91818 215.88594,232.76114 C 214.06427,237.84489 212.94753,238.35303 210.10993,235.38932 z M 199.96203,233.98646 C 197.69977,231.11046 197.33386,229.62132 198.88945,229.62132 C 199.43945,229.62132 199.88945,230.041 199.88945,230.55393 C 199.88945,231.06687 200.78945,231.77219 201.88945,232.12132 C 202.98945,232.47045 203.88945,233.62577 203.88945,234.68871 C 203.88945,237.36701 202.41359,237.10312 199.96203,233.98646 z M 182.13945,224.86951 C 178.27874,224.61014 176.88945,224.11706 176.88945,223.0062 C 176.88945,222.12872 176.156,221.61166 175.13945,221.77251 C 174.17695,221.92481 172.23728,221.28225 170.82908,220.3446 C 165.04233,216.49154 154.60535,214.63824 149.53963,216.56422 C 147.6245,217.29235 146.92634,217.15983 146.47453,215.98243 C 145.3296,212.9988 145.93925,210.83785 149.84855,204.02299 C 157.13638,191.31851 157.40464,190.67592 156.21539,188.77163 C 155.40835,187.47935 155.44994,186.57529 156.37457,185.31078 C 157.54854,183.70528 157.71183,183.70387 159.0078,185.28807 C 163.27953,190.50982 192.89483,207.2103 200.07165,208.44454 C 204.00229,209.12051 204.00469,209.1238 202.07323,211.19533 C 201.00965,212.33604 200.13945,214.51372 200.13945,216.03462 C 200.13945,219.12818 196.97525,222.99952 196.18622,220.87132 C 195.4244,218.81651 193.6137,219.45885 194.1701,221.58653 C 194.90659,224.40288 191.01222,225.4656 182.13945,224.86951 z",name:"İstanbul"},35:{path:"M 91.220802,426.84727 C 90.578046,426.43838 89.903046,424.54866 89.720802,422.64789 C 89.432845,419.64453 88.96087,419.10503 86.116896,418.52831 C 84.316991,418.16332 81.655726,416.58216 80.202974,415.01461 C 78.091643,412.73645 76.692134,412.16019 73.228714,412.14292 C 70.207533,412.12786 68.894857,411.70038 68.892636,410.73085 C 68.890884,409.96609 67.909685,407.37859 66.712195,404.98085 C 64.728088,401.00806 64.205433,400.62132 60.820603,400.62132 C 57.692633,400.62132 57.007212,401.01598 56.478806,403.12132 C 55.741191,406.06021 51.902423,406.68465 51.868099,403.87132 C 51.844459,401.93377 44.407043,396.1834 43.027463,397.03602 C 42.548567,397.332 41.41025,396.74929 40.497868,395.74112 C 38.978711,394.06247 38.973874,393.79614 40.440437,392.579 C 41.735157,391.50448 42.193397,391.49508 42.832965,392.52992 C 44.387192,395.04472 52.88945,388.75332 52.88945,385.08845 C 52.88945,384.25795 51.821878,383.09202 50.517067,382.49751 C 49.065665,381.83621 47.706933,379.9555 47.017067,377.65293 C 45.480376,372.52391 45.596597,370.88459 47.575421,369.77718 C 50.217886,368.29839 53.601515,370.44443 55.293078,374.67207 C 56.124741,376.7506 57.27415,378.74104 57.847321,379.09528 C 59.366803,380.03437 59.122586,382.62132 57.51445,382.62132 C 56.71445,382.62132 56.13945,383.66677 56.13945,385.12132 C 56.13945,386.49632 56.5332,387.62132 57.01445,387.62132 C 57.4957,387.62132 57.88945,388.71976 57.88945,390.0623 C 57.88945,391.40484 58.33945,392.7814 58.88945,393.12132 C 59.452266,393.46916 59.88945,392.66737 59.88945,391.28733 C 59.88945,387.26123 64.803063,386.96599 64.874137,390.98782 C 64.882559,391.46439 67.92695,391.57459 71.63945,391.23272 C 75.35195,390.89084 79.51445,390.62277 80.88945,390.63699 C 83.989789,390.66907 87.88945,388.68919 87.88945,387.08305 C 87.88945,386.29459 85.780769,385.83508 81.743689,385.74382 C 75.087455,385.59336 73.533606,384.53367 72.349852,379.33744 C 72.001044,377.8063 70.629759,375.84204 69.302552,374.97243 C 67.555821,373.82792 66.88945,372.47679 66.88945,370.07963 C 66.88945,366.3555 68.833883,365.32827 72.711063,367.00412 C 75.375308,368.15571 77.215785,366.37279 76.489015,363.34433 C 76.156977,361.96072 77.039596,361.30603 80.476012,360.38693 C 82.903403,359.7377 84.88945,358.6766 84.88945,358.02893 C 84.88945,356.20798 80.287057,353.62132 77.047078,353.62132 C 75.445072,353.62132 73.592061,352.96791 72.929276,352.16931 C 71.352091,350.26892 72.473394,346.88815 74.940602,346.10508 C 77.670455,345.23866 77.366239,342.0072 74.262641,338.9036 L 71.635831,336.27679 L 75.012641,333.45032 C 76.869886,331.89575 79.51445,330.32423 80.88945,329.95805 C 82.26445,329.59186 84.51445,328.46831 85.88945,327.46126 C 89.079136,325.12515 92.214191,324.89235 98.14035,326.55158 C 102.19558,327.68697 103.15716,328.47097 104.82233,331.99957 C 105.97877,334.45013 106.94341,339.09811 107.20148,343.46314 C 107.78331,353.3041 106.04553,355.53004 96.819943,356.76095 C 91.586475,357.45922 89.971541,358.13106 88.144417,360.37013 C 85.268089,363.89495 85.312571,365.68242 88.38945,370.21646 C 89.76445,372.24263 90.88945,374.9922 90.88945,376.32661 C 90.88945,380.23258 92.593606,382.34324 96.310283,383.04049 C 98.221549,383.39905 101.60845,385.21559 103.83672,387.07726 C 106.06499,388.93893 109.26883,390.76537 110.95636,391.13602 C 112.64388,391.50666 114.28573,392.55498 114.6049,393.46562 C 115.62875,396.38678 119.94724,401.62132 121.33335,401.62132 C 122.82746,401.62132 123.88945,399.48451 123.88945,396.47826 C 123.88945,394.68826 124.34414,394.56369 128.63945,395.1769 C 133.9748,395.9386 134.5468,396.29039 135.0528,399.12132 C 135.3385,400.7197 136.41233,401.22258 140.40036,401.62556 C 145.54463,402.14538 151.07743,405.23553 152.87386,408.59219 C 154.40738,411.4576 152.16174,416.95208 149.76254,416.20476 C 148.73234,415.88387 147.00523,415.34796 145.92452,415.01386 C 144.38131,414.53678 143.59036,415.18066 142.2393,418.01386 C 141.29315,419.99796 139.81487,421.68943 138.95424,421.77268 C 138.0936,421.85593 134.91445,422.05886 131.88945,422.22364 C 128.86445,422.38842 123.5204,422.81313 120.01379,423.16744 C 114.49718,423.72483 113.25631,423.52934 110.80429,421.71648 C 106.40156,418.4614 102.846,418.99566 98.127115,423.62132 C 93.900486,427.76446 93.186707,428.09786 91.220802,426.84727 z",name:"İzmir"},36:{path:"M 896.08991,294.16195 C 895.4736,292.80929 893.17357,290.51418 890.97873,289.0617 C 888.78389,287.60923 886.29893,285.36901 885.45659,284.08345 C 884.48139,282.59511 882.41075,281.44659 879.75618,280.92163 C 875.77809,280.13492 870.6467,275.53073 872.11338,274.06405 C 872.43788,273.73956 875.14273,273.14303 878.12415,272.73844 C 883.46734,272.01336 887.59468,269.82319 891.25888,265.76853 C 892.77469,264.09121 892.99816,262.83191 892.44023,259.11141 C 892.06179,256.58775 892.03269,253.24563 892.37558,251.68448 C 892.973,248.96442 893.30606,248.81726 900.36105,248.15615 L 907.7231,247.46627 L 908.3592,242.29379 C 909.6435,231.85033 909.69328,231.75031 914.21506,230.52656 C 925.43996,227.4887 926.59065,226.69362 928.02894,220.98163 C 928.77013,218.03812 929.65693,216.63165 930.75816,216.65312 C 932.80973,216.69312 935.88945,218.97946 935.88945,220.46251 C 935.88945,221.0789 937.12695,221.87794 938.63945,222.23816 C 943.14291,223.31071 946.88945,225.92141 946.88945,227.98701 C 946.88945,229.05098 948.08558,232.28377 949.54752,235.17101 C 952.05218,240.11754 952.13048,240.68879 950.90422,245.06857 C 950.18846,247.625 948.31733,251.09277 946.74615,252.77473 C 943.50392,256.24554 943.21035,257.81283 945.45374,259.67467 C 946.45943,260.50933 946.80573,261.81877 946.42351,263.34165 C 945.85604,265.60263 948.46114,271.62132 950.00723,271.62132 C 950.38484,271.62132 951.14036,272.90233 951.68616,274.46801 C 952.58506,277.0466 952.39255,277.48363 949.64209,279.10837 C 947.81001,280.19061 944.48046,280.93275 941.24755,280.97948 C 936.3579,281.05016 935.88945,281.25646 935.88945,283.33913 C 935.88945,285.1068 935.32583,285.62132 933.38945,285.62132 C 931.88988,285.62132 930.88945,286.19278 930.88945,287.04936 C 930.88945,288.04065 929.13083,288.68987 925.13945,289.17206 C 921.97695,289.55412 918.26445,290.44626 916.88945,291.15459 C 913.30401,293.00161 901.61075,296.62132 899.22947,296.62132 C 898.05519,296.62132 896.74165,295.59235 896.08991,294.16195 z",name:"Kars"},37:{path:"M 440.22047,246.00424 C 440.52306,244.96863 441.07421,241.53382 441.44526,238.37132 L 442.1199,232.62132 L 432.95692,232.62132 C 424.39557,232.62132 423.63721,232.79045 421.40665,235.19726 L 419.01935,237.7732 L 417.42872,234.69726 C 415.94789,231.83365 415.46197,231.62132 410.38945,231.62132 C 405.37183,231.62132 404.82057,231.38881 403.42084,228.68202 C 402.58486,227.06541 400.93521,225.06635 399.75496,224.23968 C 397.9942,223.00639 397.71527,222.08209 398.20086,219.08974 C 398.95941,214.41533 400.39972,212.73509 405.63945,210.41201 C 410.31347,208.33974 410.8682,207.2155 407.97955,205.66954 C 406.83595,205.05751 405.80293,203.06869 405.40489,200.7127 C 404.6311,196.13267 403.41841,195.45001 397.49777,196.26153 C 392.2058,196.98687 390.77595,195.43549 393.78468,192.23284 C 396.38803,189.46171 396.39923,188.5409 393.88945,183.62132 C 391.19639,178.3425 391.34477,177.62656 395.13945,177.59005 C 396.92695,177.57285 400.63945,176.45196 403.38945,175.09919 C 406.13945,173.74642 408.89596,172.63549 409.51502,172.63046 C 410.13408,172.62543 413.1209,171.52441 416.1524,170.18374 C 421.51414,167.81252 421.83745,167.78667 428.02683,169.23419 C 431.52627,170.05261 440.68945,171.10711 448.38945,171.57754 C 456.08945,172.04796 463.11277,172.72378 463.99682,173.07934 C 466.26617,173.99208 468.15847,181.06952 467.37424,185.71133 L 466.71768,189.5975 L 473.76148,189.35941 C 479.26464,189.1734 481.17632,189.49097 482.50167,190.81134 C 484.07732,192.38107 484.08163,192.67907 482.56227,194.9979 C 481.66259,196.371 479.69683,198.08549 478.19393,198.80788 C 474.74188,200.46716 473.16487,206.10403 474.82244,210.85895 C 475.78203,213.61163 475.6925,214.29217 474.23004,215.36154 C 473.28247,216.05442 471.78849,216.62132 470.91008,216.62132 C 468.45825,216.62132 461.83367,225.19022 461.18228,229.20423 C 460.74586,231.89358 461.12911,233.4542 462.77148,235.67563 C 463.96185,237.28569 465.19223,239.8852 465.50565,241.45231 C 465.9933,243.89058 465.66245,244.4727 463.21218,245.48764 C 461.63734,246.13996 458.33298,246.62733 455.86915,246.57069 C 453.40531,246.51405 448.75264,246.78708 445.52988,247.17743 C 440.09655,247.83553 439.71032,247.75018 440.22047,246.00424 z",name:"Kastamonu"},38:{path:"M 525.38945,457.03474 C 522.63945,456.36296 518.8825,455.77011 517.04067,455.71732 L 513.6919,455.62132 L 515.7045,452.21021 C 517.40349,449.33064 517.64208,447.57758 517.2356,440.96021 C 516.66815,431.72201 515.16583,429.56111 508.7082,428.69459 C 505.03944,428.2023 504.3077,427.69755 503.52799,425.12132 C 501.23483,417.54455 500.66353,416.62132 498.26813,416.62132 C 494.26673,416.62132 495.47541,413.53496 501.63945,408.01263 L 507.38945,402.86125 L 506.01406,399.49129 C 505.25759,397.63781 504.4227,394.67459 504.15874,392.90636 C 503.89479,391.13813 503.1242,389.23111 502.44633,388.66852 C 501.28454,387.70432 501.68568,384.82081 504.50484,373.87132 C 504.8703,372.45192 508.88945,372.13674 508.88945,373.52748 C 508.88945,374.02587 511.17775,374.74837 513.97457,375.13303 C 518.55594,375.76313 519.32367,375.5806 521.72457,373.29048 C 523.19025,371.89242 525.62695,370.28107 527.13945,369.70969 C 529.9106,368.66283 530.92702,365.3806 528.87314,364.11124 C 527.00222,362.95495 528.89406,361.74304 533.66276,361.04303 C 536.99375,360.55405 539.4976,359.35588 542.14233,356.98525 C 544.20642,355.13509 546.27417,353.62132 546.73734,353.62132 C 548.19246,353.62132 550.88701,357.1941 550.94478,359.20006 C 550.97521,360.25675 552.41917,362.24632 554.15359,363.62132 C 556.82761,365.74121 558.57114,366.17507 565.62103,366.47487 C 570.48335,366.68164 574.45841,366.39402 575.19575,365.78207 C 575.99203,365.12123 576.99681,365.07743 577.92299,365.66321 C 580.30214,367.16794 584.15987,366.75382 587.66362,364.61758 C 592.17874,361.86471 594.17446,362.10902 595.72149,365.60399 C 596.66157,367.72779 598.15659,368.92068 600.91334,369.74662 C 605.70483,371.18219 606.60948,373.25408 603.89342,376.57182 C 602.74549,377.97405 601.03749,380.78576 600.09786,382.82008 C 599.15824,384.8544 597.37032,386.98527 596.12472,387.55535 C 594.87912,388.12543 593.35947,389.6904 592.74771,391.03305 C 591.8395,393.02636 592.00276,394.08402 593.63754,396.79778 C 595.73425,400.27835 595.58063,402.54159 593.15054,403.97265 C 592.11646,404.58161 591.88641,405.79158 592.34248,408.22265 C 592.95155,411.46928 592.84689,411.62132 590.00286,411.62132 C 586.73402,411.62132 584.30018,414.28622 581.55487,420.87132 C 579.6428,425.45775 577.4856,425.69115 576.26736,421.44341 C 575.33525,418.19334 570.98899,414.83084 567.54382,414.69441 C 563.43266,414.5316 558.63331,419.92166 552.9192,431.11902 C 551.95627,433.00597 549.58589,434.96833 546.52195,436.41509 C 543.84483,437.67919 541.00018,439.36773 540.20052,440.16739 C 539.40086,440.96705 538.02667,441.62132 537.14676,441.62132 C 536.26686,441.62132 534.73696,442.35433 533.747,443.25024 C 532.26213,444.59402 532.05043,445.86808 532.53757,450.52878 C 533.29502,457.77575 532.26405,458.7141 525.38945,457.03474 z",name:"Kayseri"},39:{path:"M 114.21348,198.00342 C 111.83937,195.48613 110.17556,194.61975 107.7066,194.61516 C 105.88217,194.61177 103.04328,193.90708 101.39796,193.04917 C 99.486478,192.05249 97.230043,191.71004 95.147955,192.10065 C 92.093767,192.67362 91.88945,192.53456 91.88945,189.88291 C 91.88945,188.32694 93.46445,184.60923 95.38945,181.62132 C 99.461058,175.30154 99.664686,174.05731 96.752021,173.29563 C 94.633154,172.74154 94.637496,172.70946 97.252021,169.60228 C 99.657998,166.74293 99.889557,165.70673 99.890671,157.7946 C 99.891737,150.22948 100.17921,148.79363 102.14067,146.55661 C 104.10732,144.31367 105.14221,144.0029 110.38945,144.0796 C 116.81673,144.17355 120.88945,146.00034 120.88945,148.78929 C 120.88945,149.71707 122.12695,151.40392 123.63945,152.53786 C 125.15195,153.67179 126.95203,155.07227 127.63963,155.65003 C 128.52143,156.39098 130.14206,156.29553 133.13963,155.32612 C 137.28825,153.98445 150.82271,153.84401 152.88922,155.12118 C 154.63131,156.19785 153.96982,159.36704 151.88945,159.91107 C 149.13027,160.63261 149.30384,164.41722 152.38945,170.81338 C 153.76445,173.66361 154.88945,176.78485 154.88945,177.74946 C 154.88945,178.71406 155.33945,179.7814 155.88945,180.12132 C 157.99127,181.42032 156.74526,182.62132 153.29575,182.62132 C 148.17277,182.62132 130.46043,188.33291 128.34935,190.66564 C 127.37266,191.74486 126.30056,194.30733 125.96691,196.36 C 125.40883,199.79336 125.04176,200.14391 121.38174,200.73883 C 117.76972,201.32594 117.10937,201.07395 114.21348,198.00342 z",name:"Kırklareli"},40:{path:"M 454.98447,378.62132 C 453.29238,375.87132 451.52601,373.62132 451.05921,373.62132 C 450.59241,373.62132 449.74158,372.59219 449.16847,371.33436 C 448.45307,369.76423 446.57172,368.62403 443.16622,367.69669 C 439.34991,366.65747 436.72811,364.89982 431.79772,360.07523 C 424.3265,352.76436 421.88945,349.97004 421.88945,348.71444 C 421.88945,346.85506 431.69984,339.62132 434.22153,339.62132 C 435.62651,339.62132 437.36406,338.81541 438.08275,337.8304 C 438.80143,336.84539 440.8407,335.02276 442.61445,333.78011 C 444.74361,332.28846 446.20501,330.16315 446.91527,327.52542 C 448.63656,321.13306 457.43305,317.03149 459.82717,321.50495 C 460.40076,322.57671 462.46323,323.68612 464.61235,324.07892 C 469.18405,324.9145 472.88945,327.15676 472.88945,329.08767 C 472.88945,329.8688 473.82257,331.1615 474.96306,331.96032 C 476.78615,333.23727 476.87676,333.67417 475.71306,335.57678 C 474.496,337.56662 474.74484,338.04563 478.80412,341.52693 C 483.12848,345.23558 483.18474,345.36165 481.55412,347.68968 C 480.63855,348.99684 479.88945,351.0912 479.88945,352.34383 C 479.88945,354.23934 480.42615,354.62132 483.08945,354.62132 C 485.57834,354.62132 486.02278,354.88799 485.08945,355.82132 C 484.42945,356.48132 483.88945,357.77957 483.88945,358.70631 C 483.88945,359.63305 482.75932,361.13179 481.37806,362.03683 C 479.42208,363.31843 479.00374,364.2285 479.48647,366.15184 C 480.00645,368.22361 479.74793,368.62132 477.88123,368.62132 C 476.18974,368.62132 475.775,369.07566 476.15166,370.51601 C 476.49391,371.82478 475.91149,372.74588 474.26829,373.49457 C 472.95993,374.0907 471.88945,375.19335 471.88945,375.94489 C 471.88945,376.69644 471.02688,378.09196 469.97264,379.04604 C 468.4699,380.40599 467.62001,380.54749 466.03838,379.70102 C 463.00333,378.07671 461.93496,378.37141 460.88945,381.12132 C 460.36668,382.49632 459.51641,383.62132 458.99998,383.62132 C 458.48354,383.62132 456.67656,381.37132 454.98447,378.62132 z",
-    name:"Kırşehir"},41:{path:"M 237.88945,255.07701 C 232.33314,252.15647 231.35417,252.11061 228.16232,254.62132 C 226.58898,255.85891 224.10554,256.62132 221.6476,256.62132 C 218.25683,256.62132 217.78092,256.36519 218.39591,254.87132 C 218.79216,253.90882 219.34188,252.33728 219.61753,251.379 C 220.3043,248.99143 226.74223,247.38554 236.38355,247.19685 C 243.0538,247.06631 244.43216,246.7573 244.70687,245.33086 C 244.98109,243.90697 244.22182,243.62132 240.16277,243.62132 C 237.48245,243.62132 234.76742,243.09929 234.12938,242.46125 C 233.41773,241.7496 229.4749,241.30734 223.92938,241.31713 C 218.95742,241.32591 214.88945,240.92 214.88945,240.4151 C 214.88945,239.91021 215.61062,237.29227 216.49205,234.59746 C 217.658,231.03277 218.9791,229.17596 221.34082,227.78251 C 224.36464,225.99842 224.76846,225.97732 227.23606,227.47457 C 229.72026,228.98189 230.14972,228.94713 234.13728,226.91594 C 236.47597,225.72465 239.18776,224.50599 240.16347,224.20781 C 241.13919,223.90962 242.31253,222.65186 242.77089,221.41277 C 243.54817,219.31158 244.10309,219.18071 251.01228,219.46905 C 257.34934,219.73352 258.81314,219.46918 261.13786,217.64056 C 263.11287,216.08702 264.31476,215.75996 265.5364,216.44362 C 267.03658,217.28316 266.91838,217.6833 264.43725,220.16443 C 260.64473,223.95695 259.56421,228.0917 261.42519,231.69044 C 263.38515,235.48058 263.2715,236.90163 260.88945,238.38925 C 259.53725,239.23371 258.88945,240.72127 258.88945,242.98191 C 258.88945,248.37601 255.15751,252.90861 249.86808,253.93874 C 247.40483,254.41847 244.71445,255.40303 243.88945,256.12665 C 242.63399,257.22784 241.65584,257.05672 237.88945,255.07701 z",name:"Kocaeli"},42:{path:"M 359.63945,517.07544 C 357.57695,514.78046 355.88945,512.20738 355.88945,511.35749 C 355.88945,510.5076 353.52695,508.47889 350.63945,506.84925 C 343.25428,502.68121 337.05846,496.13309 333.86533,489.12132 C 332.36252,485.82132 329.72875,481.80019 328.01251,480.18548 L 324.89207,477.24965 L 321.25345,478.98478 C 316.72593,481.14381 312.88198,480.4347 307.24578,476.40073 C 303.23219,473.5281 303.13306,473.32291 304.08802,469.86434 C 304.63026,467.90048 304.81328,464.99048 304.49472,463.39767 C 304.03892,461.11869 304.4722,459.98575 306.52829,458.08023 C 309.77449,455.07175 311.25818,455.84226 310.45571,460.11982 C 309.62068,464.57089 312.48955,465.83433 315.38383,462.29014 C 316.68309,460.69913 318.92285,459.58345 321.74336,459.12229 C 325.99148,458.42771 326.08205,458.33401 325.47071,455.26587 C 325.12611,453.53637 324.40435,451.97132 323.86681,451.78799 C 323.32926,451.60465 322.88945,450.81715 322.88945,450.03799 C 322.88945,449.25882 322.22302,448.62132 321.4085,448.62132 C 320.59398,448.62132 319.64375,447.49057 319.29689,446.10855 C 318.95002,444.72652 318.15395,443.26402 317.52784,442.85855 C 315.65919,441.6484 311.94836,435.89574 312.60975,435.23435 C 312.94692,434.89719 314.40778,434.62132 315.85612,434.62132 C 318.92893,434.62132 320.88945,432.97562 320.88945,430.39624 C 320.88945,429.39244 317.27164,425.09494 312.84988,420.84624 C 306.56049,414.803 304.68983,412.35578 304.25692,409.60475 C 303.71334,406.15055 303.83378,406.00576 311.04649,401.4423 C 315.08512,398.88706 319.62695,396.23479 321.13945,395.54835 C 324.62376,393.96703 324.66945,391.29774 321.23896,389.73471 L 318.58847,388.52706 L 321.81789,385.19515 C 323.98832,382.95583 325.22482,380.53982 325.58863,377.82746 C 325.96783,375.00031 326.69288,373.64448 328.00969,373.30013 C 330.8591,372.55499 330.41602,368.79158 327.38945,368.03196 C 325.47582,367.55167 324.88945,366.7551 324.88945,364.63575 C 324.88945,361.95802 325.03311,361.88319 329.25913,362.35952 C 331.91044,362.65836 333.8999,362.41343 334.31815,361.73668 C 335.52134,359.78989 337.69597,360.52829 339.13224,363.37132 C 343.05377,371.13376 345.18107,372.09174 352.56654,369.42112 C 355.45503,368.37663 356.47314,368.50637 360.41429,370.42112 C 362.90505,371.63123 365.99871,372.62132 367.28908,372.62132 C 370.486,372.62132 378.88083,368.80735 379.55587,367.04824 C 379.85703,366.26343 380.7649,365.62132 381.57336,365.62132 C 383.54343,365.62132 388.88945,360.1832 388.88945,358.17919 C 388.88945,356.97775 389.50517,356.73775 391.38013,357.20834 C 393.15324,357.65336 394.04837,357.37075 394.48712,356.22739 C 395.45548,353.70389 397.11624,354.28608 402.80762,359.14415 C 405.72187,361.63171 408.99557,364.14293 410.08251,364.72464 C 411.16945,365.30636 412.71814,367.3604 413.52404,369.28919 C 415.40932,373.80132 414.19626,375.34859 408.77347,375.34859 C 404.4109,375.34859 402.93032,376.61574 402.90476,380.37132 C 402.89634,381.60882 402.49191,382.62132 402.00603,382.62132 C 400.53193,382.62132 399.90108,388.03047 401.24796,389.12132 C 401.92705,389.67132 403.07879,391.58382 403.80738,393.37132 C 404.53597,395.15882 405.71603,396.62132 406.42973,396.62132 C 407.14343,396.62132 409.12712,397.40882 410.83792,398.37132 C 413.37145,399.79669 413.83819,400.57261 413.35402,402.55414 C 413.02708,403.89218 411.75275,406.1835 410.52218,407.64595 C 409.29161,409.1084 407.68258,412.81518 406.94656,415.88324 C 405.39988,422.33053 406.32624,425.60947 412.63311,436.01132 L 416.20435,441.90132 L 426.2969,441.17564 C 431.8478,440.77652 440.10748,440.26173 444.65174,440.03168 C 452.83689,439.6173 452.93025,439.63987 454.65174,442.44941 C 455.60748,444.00922 459.20195,447.88448 462.63945,451.06109 C 467.82964,455.85737 468.88945,457.3857 468.88945,460.07405 C 468.88945,462.04135 468.10485,464.0214 466.88945,465.12132 C 465.46187,466.41326 464.88945,468.20129 464.88945,471.36858 C 464.88945,474.29167 465.57194,476.6735 466.88945,478.34845 C 467.98945,479.74687 468.88945,481.73646 468.88945,482.76975 C 468.88945,483.80304 469.42488,485.50581 470.07929,486.55369 C 471.94331,489.53846 469.68349,491.28155 461.57051,493.11686 C 457.62093,494.01033 452.90399,495.61272 451.08843,496.67771 L 447.78741,498.61407 L 448.40373,491.13573 L 449.02006,483.65738 L 444.87737,481.99981 C 441.46659,480.63509 440.32052,479.43679 438.39049,475.2173 C 437.10118,472.39859 435.44851,468.14937 434.71787,465.7746 C 433.40449,461.50572 433.34681,461.46358 429.62396,462.05337 C 421.97789,463.26468 418.38947,465.41243 416.08431,470.15713 C 413.99009,474.46768 411.73226,475.79404 410.33561,473.5342 C 409.96608,472.93629 408.78699,472.67636 407.71542,472.95658 C 406.5689,473.2564 405.54249,472.88072 405.22129,472.0437 C 404.08802,469.09044 400.19255,470.58972 395.27629,475.87132 C 391.33023,480.11063 389.6194,481.21758 386.38945,481.62132 C 382.75356,482.07581 382.41458,482.36482 382.66554,484.79634 C 382.83572,486.44511 382.26026,487.98134 381.16554,488.80067 C 380.18869,489.53179 378.38294,491.56421 377.15275,493.31716 C 373.86978,497.99524 374.93606,501.76447 380.58122,505.4366 L 385.04002,508.33701 L 380.21473,512.49952 C 377.56083,514.78891 374.26445,516.93141 372.88945,517.26065 C 371.51445,517.58988 369.48945,518.40186 368.38945,519.06505 C 364.37963,521.48255 363.39991,521.25978 359.63945,517.07544 z",name:"Konya"},43:{path:"M 235.57867,372.88972 L 234.19663,368.12132 L 226.55126,367.21781 C 219.43097,366.37635 218.47607,366.49674 212.64767,368.97068 C 209.20565,370.43169 205.48945,371.64172 204.38945,371.65963 C 203.28945,371.67754 201.26445,372.3353 199.88945,373.12132 C 196.58106,375.01257 188.88945,375.10687 188.88945,373.25618 C 188.88945,372.50535 187.98945,370.74687 186.88945,369.34845 C 185.78945,367.95003 184.88945,365.85022 184.88945,364.68221 C 184.88945,363.5142 184.28116,362.32513 183.5377,362.03983 C 182.70226,361.71925 182.36856,360.56585 182.66404,359.02015 C 183.40277,355.15575 179.39827,351.43389 174.91566,351.81865 C 171.43279,352.1176 171.38212,352.06601 170.79284,347.62132 C 170.4647,345.14632 169.86128,342.35266 169.45192,341.41319 C 168.88046,340.10174 169.3093,339.57922 171.29853,339.16319 C 172.72354,338.86516 174.97977,338.39645 176.31238,338.12161 C 180.66393,337.22414 184.88945,332.81276 184.88945,329.16729 C 184.88945,327.36535 185.78945,324.74687 186.88945,323.34845 C 187.98945,321.95003 188.88945,320.36219 188.88945,319.81992 C 188.88945,319.17581 190.26718,319.18369 192.86324,319.84264 C 198.76154,321.33978 201.31347,320.3153 203.11595,315.72663 C 204.14566,313.10524 206.03693,310.92204 208.77593,309.19298 C 212.09652,307.09678 212.88945,306.02037 212.88945,303.60878 C 212.88945,300.26136 213.61933,299.94978 216.44832,302.08952 C 217.55987,302.93025 220.61181,303.57131 223.58955,303.58952 L 228.78964,303.62132 L 229.08955,309.33119 L 229.38945,315.04106 L 235.88945,317.30336 C 240.01659,318.7398 243.54414,319.35862 245.55251,318.99851 C 250.24839,318.15651 252.88945,319.31688 252.88945,322.22204 C 252.88945,323.70693 254.2819,326.08043 256.38945,328.18799 C 260.16231,331.96085 260.78805,334.97089 258.35776,337.65633 C 256.97994,339.17882 256.99693,339.68897 258.52696,342.73507 C 262.38372,350.4134 262.31537,350.85322 256.83064,353.65132 C 252.68329,355.76714 250.88945,358.18259 250.88945,361.65129 C 250.88945,364.99272 248.16443,368.72211 242.31231,373.38972 L 236.9607,377.65813 L 235.57867,372.88972 z",name:"Kütahya"},44:{path:"M 645.91768,444.50812 C 640.76471,442.45169 640.56384,438.47754 645.38945,434.05745 C 649.62134,430.1812 649.98123,426.10697 646.61649,420.16644 C 644.89906,417.13426 643.2836,415.82057 639.69228,414.5357 C 637.116,413.61397 633.84318,411.94348 632.41935,410.8235 C 630.99552,409.70352 628.00819,408.47928 625.78084,408.10297 L 621.73111,407.41877 L 623.73547,405.27005 C 624.83786,404.08825 626.94298,400.7174 628.4135,397.77927 C 630.10966,394.3903 632.33065,391.70354 634.48831,390.43049 C 638.11115,388.29296 638.72839,386.00365 636.67896,382.30558 C 636.01318,381.10424 635.40963,377.98382 635.33772,375.37132 C 635.20866,370.68224 635.24739,370.62132 638.35709,370.62132 C 640.08964,370.62132 642.3807,371.28201 643.44832,372.08952 C 646.5896,374.46546 648.51454,373.92138 649.5272,370.37132 L 650.45426,367.12132 L 661.10219,366.08936 C 669.01383,365.32259 672.27541,364.582 673.79426,363.20747 C 675.55708,361.61213 676.24465,361.52581 678.79021,362.58021 C 680.4137,363.25269 682.71431,363.4943 683.90267,363.11712 C 687.67082,361.92116 692.47693,363.42053 693.73651,366.18499 C 695.25115,369.50926 695.19132,370.62132 693.49786,370.62132 C 691.10542,370.62132 690.62087,375.42992 692.71179,378.42224 C 693.74909,379.90674 694.91065,382.41325 695.29303,383.99227 L 695.98827,386.86323 L 691.57238,386.20102 C 687.30086,385.56047 687.1046,385.64815 685.56964,388.88284 C 684.69687,390.72206 683.06179,393.06037 681.93612,394.07908 C 679.05799,396.68376 679.16588,402.62726 682.13945,405.27972 C 683.37695,406.38358 688.16776,408.27066 692.7857,409.47322 C 700.45609,411.47067 701.38542,411.52637 703.5357,410.11745 C 704.83026,409.26922 705.88945,409.01269 705.88945,409.54738 C 705.88945,410.08206 707.456,411.7144 709.37068,413.1748 C 712.4791,415.54571 713.19696,415.70977 716.07403,414.70682 C 718.87497,413.73041 719.56369,413.85129 721.3428,415.63157 C 723.32262,417.6127 723.33231,417.77922 721.63945,420.73148 C 720.67695,422.41004 719.88945,424.23996 719.88945,424.79799 C 719.88945,427.18786 715.34848,431.86176 710.77486,434.17939 L 705.83581,436.68219 L 702.51824,434.15176 C 700.69358,432.76002 698.73482,431.62132 698.16545,431.62132 C 697.59609,431.62132 694.03856,430.05474 690.25984,428.14003 C 682.08353,423.99701 679.6285,423.82024 675.37051,427.06797 C 673.60627,428.41362 670.93995,429.82153 669.44536,430.19664 C 665.77129,431.11878 665.27299,433.02215 667.84846,436.29634 L 669.99889,439.03017 L 667.72673,440.74406 C 662.38714,444.77172 651.35105,446.67646 645.91768,444.50812 z",name:"Malatya"},45:{path:"M 158.27138,417.23326 C 153.387,416.17209 153.1953,416.00824 154.07294,413.64483 C 155.44629,409.94651 154.29164,407.02987 150.22678,403.92945 C 147.75725,402.04585 144.94788,400.98194 141.526,400.63448 C 137.15781,400.19092 136.39313,399.7836 135.88819,397.63134 C 135.42824,395.67086 134.46248,394.99199 131.34673,394.43897 C 124.23393,393.1765 122.89093,393.40354 122.87414,395.87132 C 122.84289,400.46219 121.30981,401.04557 118.66561,397.47278 C 117.30139,395.62948 115.92407,393.37625 115.6049,392.46562 C 115.28573,391.55498 113.64388,390.50666 111.95636,390.13602 C 110.26883,389.76537 107.06499,387.93893 104.83672,386.07726 C 102.60845,384.21559 99.221549,382.39905 97.310283,382.04049 C 93.593606,381.34324 91.88945,379.23258 91.88945,375.32661 C 91.88945,373.9922 90.76445,371.24263 89.38945,369.21646 C 86.354127,364.74366 86.355506,364.78782 89.144417,361.37013 C 90.971541,359.13106 92.586475,358.45922 97.819943,357.76095 C 102.91396,357.08129 104.7224,356.35427 106.52132,354.26291 C 108.62723,351.81465 108.74874,350.98712 108.19389,342.87209 C 107.86482,338.05916 106.9867,333.23369 106.24251,332.14881 C 104.47297,329.56916 104.5187,326.70082 106.34052,326.00172 C 107.13861,325.69547 109.31858,326.60959 111.18491,328.03311 C 113.38166,329.70865 115.84648,330.62132 118.17482,330.62132 C 120.15295,330.62132 122.08131,331.12275 122.46008,331.7356 C 122.87161,332.40146 124.70628,332.64097 127.0191,332.33076 C 130.52048,331.86112 130.88945,332.02625 130.88945,334.06284 C 130.88945,337.34686 133.70167,342.45218 136.53229,344.30687 C 137.88495,345.19317 139.65523,347.20149 140.46624,348.76982 C 141.70667,351.16854 142.5625,351.62132 145.85611,351.62132 C 148.00953,351.62132 150.03007,351.20281 150.3462,350.69131 C 150.66232,350.1798 153.50138,349.49135 156.65521,349.16142 C 159.80904,348.83149 164.04701,348.34947 166.07291,348.09026 C 169.48453,347.65375 169.77974,347.82201 170.07291,350.37014 C 170.35348,352.80872 170.8022,353.12132 174.02208,353.12132 C 178.89306,353.12132 182.174,356.04927 181.37573,359.6838 C 180.95889,361.58164 181.24068,362.54212 182.33784,362.96314 C 183.19123,363.29062 183.88945,364.4909 183.88945,365.63043 C 183.88945,366.76996 184.83471,368.98084 185.99003,370.54349 C 187.98167,373.23733 188.00425,373.51648 186.42547,375.92601 C 185.31707,377.61763 183.47533,378.68444 180.91712,379.11665 C 174.96903,380.12157 173.85593,381.43525 173.26851,388.14355 C 172.98061,391.43132 172.04409,395.78689 171.18735,397.82259 C 169.67177,401.42378 169.70094,401.60858 172.26624,404.65726 C 175.07691,407.99755 174.95007,409.62132 171.87847,409.62132 C 170.76033,409.62132 168.71827,411.46322 166.88945,414.12132 C 165.18661,416.59632 163.70249,418.55919 163.59141,418.48326 C 163.48033,418.40732 161.08632,417.84482 158.27138,417.23326 z",name:"Manisa"},46:{path:"M 610.71397,493.48136 C 609.9628,492.18334 608.66744,489.77132 607.8354,488.12132 C 605.87038,484.22451 602.23989,483.56939 600.9796,486.88419 C 600.47742,488.20505 598.56465,490.01313 596.72902,490.90216 C 593.43829,492.4959 593.37224,492.4818 592.01738,489.89596 C 588.54858,483.27551 586.05226,481.36748 581.72835,482.03165 C 569.16528,483.96139 569.96271,483.99358 569.04761,481.51983 C 568.57755,480.24914 568.56393,477.61465 569.01735,475.6654 C 570.39575,469.73961 570.0756,465.90746 568.13945,465.15689 C 566.57931,464.55208 566.5571,464.35061 567.93475,463.2999 C 570.57353,461.28734 573.91089,452.84929 573.84235,448.36337 C 573.74949,442.2863 575.26685,432.49851 576.70567,429.89342 C 577.38244,428.66807 579.05066,426.55102 580.41281,425.18887 C 581.77496,423.82672 582.88945,422.12124 582.88945,421.39891 C 582.88945,420.67658 584.03067,418.40613 585.4255,416.35345 C 587.42049,413.41757 588.6106,412.62132 591.0037,412.62132 C 593.90113,412.62132 594.03024,412.44641 593.71765,408.9447 C 593.39174,405.29376 593.42437,405.2594 598.38945,404.02392 C 604.14587,402.59153 624.88945,400.7659 624.88945,401.69166 C 624.88945,402.03249 623.98945,403.12583 622.88945,404.12132 C 619.86681,406.85678 620.46531,408.37387 624.86001,409.11635 C 627.04382,409.4853 629.99552,410.70352 631.41935,411.8235 C 632.84318,412.94348 636.116,414.61397 638.69228,415.5357 C 642.2836,416.82057 643.89906,418.13426 645.61649,421.16644 C 648.78891,426.76743 648.50875,429.28432 644.28192,433.15595 C 640.70665,436.43076 640.68055,436.51337 641.36291,442.39264 L 642.05143,448.32497 L 637.97044,451.55718 C 635.61937,453.41926 633.88945,455.64212 633.88945,456.80106 C 633.88945,457.90748 633.10215,460.14553 632.1399,461.77449 C 630.41752,464.69025 630.42916,464.76606 632.8899,466.65655 C 634.26465,467.71271 636.16112,468.58685 637.10427,468.59908 C 639.06996,468.62457 640.88945,471.50963 640.88945,474.60103 C 640.88945,477.645 636.51265,481.62132 633.1621,481.62132 C 629.99188,481.62132 621.24763,486.98466 615.7346,492.31058 L 612.07975,495.84139 L 610.71397,493.48136 z",name:"Kahramanmaraş"},47:{path:"M 780.81376,505.04126 C 779.20985,503.3343 778.36215,501.21927 778.30876,498.79126 C 778.2533,496.26862 776.92467,493.11898 774.05876,488.71628 C 771.76564,485.19351 769.88945,481.75171 769.88945,481.06783 C 769.88945,480.38395 768.6002,477.37351 767.02446,474.37797 L 764.15947,468.93154 L 769.27446,468.78216 C 772.0877,468.7 776.86445,468.61516 779.88945,468.59364 C 786.74237,468.54487 790.02115,467.28703 792.68407,463.68524 C 794.27611,461.53189 795.35763,460.98816 797.30738,461.36088 C 798.70719,461.62847 800.98581,461.56297 802.37097,461.21531 C 804.42854,460.6989 804.88945,459.97666 804.88945,457.26893 C 804.88945,453.063 805.76468,452.19843 807.98673,454.20935 C 808.9545,455.08517 811.63029,456.22506 813.93294,456.74243 C 817.41886,457.52566 818.67865,457.35323 821.46002,455.71219 L 824.80047,453.74127 L 826.73708,456.9313 C 827.80222,458.68581 828.983,461.58382 829.36103,463.37132 L 830.04836,466.62132 L 839.03465,466.62132 C 848.71816,466.62132 850.04021,466.20569 855.08343,461.57592 C 858.44533,458.48962 866.81145,453.16716 867.3325,453.78316 C 869.09832,455.87074 869.93246,458.97831 868.98209,459.92868 C 868.38114,460.52963 867.88945,462.17307 867.88945,463.58077 C 867.88945,466.61357 865.48283,468.34289 860.05418,469.21097 C 856.28349,469.81393 856.10752,470.0137 855.51051,474.36934 C 855.16893,476.86146 854.88945,480.22341 854.88945,481.84035 C 854.88945,484.60809 855.07108,484.74034 857.99127,484.09896 C 861.07218,483.42227 861.08824,483.44027 860.37445,486.7695 C 859.9792,488.613 859.59589,490.13466 859.52263,490.15098 C 859.44938,490.16729 857.75453,490.92243 855.75629,491.82908 C 851.14138,493.92297 838.00841,494.3299 827.6326,492.7005 C 818.20478,491.21996 810.88059,492.43343 803.98823,496.61789 C 801.4589,498.15348 797.89654,499.72488 796.07188,500.10989 C 794.24722,500.4949 792.51507,501.43337 792.22266,502.19538 C 791.65808,503.66665 785.80769,507.62132 784.19573,507.62132 C 783.66902,507.62132 782.14714,506.46029 780.81376,505.04126 z",name:"Mardin"},48:{path:"M 182.76506,537.2068 C 180.3339,534.9525 180.21664,534.44104 180.99789,529.49889 C 181.84327,524.15105 181.2282,522.67447 178.13945,522.63663 C 176.19703,522.61284 176.66719,520.24122 178.88945,518.85339 C 181.35636,517.31278 181.48102,515.04219 179.13945,514.2996 C 178.17695,513.99436 176.17663,512.95262 174.6943,511.98463 C 172.31153,510.42864 171.69417,510.38787 169.36785,511.63288 C 167.44641,512.6612 166.85131,513.64149 167.16197,515.26657 C 167.39595,516.49057 167.21224,518.08362 166.75373,518.80667 C 166.15228,519.75514 165.91581,519.54713 165.90476,518.05988 C 165.88242,515.05235 162.56165,511.97001 158.52872,511.21342 C 155.46512,510.63869 154.97099,510.13842 154.70028,507.33742 C 154.44601,504.70656 153.93452,504.09376 151.88945,503.96986 C 150.51445,503.88656 148.82695,503.77406 148.13945,503.71986 C 147.45195,503.66566 146.88945,502.72132 146.88945,501.62132 C 146.88945,500.51021 146.22278,499.62132 145.38945,499.62132 C 144.55612,499.62132 143.88945,500.51021 143.88945,501.62132 C 143.88945,502.73243 143.22278,503.62132 142.38945,503.62132 C 141.56445,503.62132 139.98945,502.72132 138.88945,501.62132 C 137.78945,500.52132 136.44802,499.62132 135.9085,499.62132 C 134.42466,499.62132 133.47917,504.61104 134.72663,505.8585 C 135.51429,506.64616 135.22913,507.45942 133.7004,508.78528 C 132.53607,509.7951 131.08978,510.62417 130.48644,510.62764 C 129.8831,510.63112 128.65911,511.91799 127.76648,513.48735 C 126.07711,516.45746 121.28657,518.41844 119.66981,516.80168 C 119.096,516.22787 119.75503,515.87132 121.38945,515.87132 C 122.84695,515.87132 124.51545,515.39532 125.09723,514.81354 C 126.70071,513.21006 125.24439,510.63409 122.67083,510.52164 C 120.46976,510.42547 120.47745,510.39763 122.88945,509.73065 C 124.42463,509.30613 125.51277,508.18681 125.709,506.83033 C 125.99743,504.83645 125.59781,504.62132 121.60569,504.62132 C 119.17312,504.62132 114.43549,504.33417 111.07763,503.9832 C 105.32087,503.3815 104.91021,503.48137 103.88204,505.7332 C 102.92677,507.8254 102.03821,508.14971 96.711238,508.35042 C 89.535126,508.6208 88.517237,508.19019 90.150475,505.57496 C 91.073193,504.09745 92.48988,503.62132 95.96333,503.62132 C 98.489363,503.62132 100.85196,503.32547 101.21355,502.96388 C 102.33986,501.83758 113.13241,501.72819 118.71876,502.78646 C 124.69196,503.91802 125.87615,503.43093 124.09312,500.57584 C 123.28321,499.27897 123.23298,498.62132 123.94383,498.62132 C 124.53307,498.62132 124.87438,497.60882 124.70231,496.37132 C 124.42276,494.36084 124.81527,494.12132 128.38945,494.12132 C 131.20426,494.12132 133.05612,493.45465 134.63945,491.87132 C 135.87695,490.63382 137.78945,489.62132 138.88945,489.62132 C 139.98945,489.62132 140.88945,488.97228 140.88945,488.17901 C 140.88945,486.95643 137.49979,486.78443 118.63945,487.04994 C 101.82792,487.28662 96.022812,487.05529 94.88945,486.10354 C 94.06445,485.41074 91.95824,484.53994 90.208984,484.16843 C 87.613821,483.61726 86.825215,483.87283 85.9238,485.55714 C 84.361405,488.4765 83.189514,488.11915 82.667767,484.56425 C 81.817013,478.7677 89.931768,475.56177 93.41099,480.31989 C 94.444251,481.73296 94.816452,481.71526 97.222756,480.13859 C 98.689438,479.17758 99.88945,477.59815 99.88945,476.62875 C 99.88945,475.65935 100.56445,474.30601 101.38945,473.62132 C 103.33964,472.00281 103.3262,468.62132 101.36958,468.62132 C 100.53365,468.62132 98.017513,467.46471 95.778166,466.05107 C 91.992253,463.66113 91.818267,463.35746 93.298038,461.72233 C 95.164951,459.65941 95.347994,457.94083 93.757274,457.41059 C 92.014877,456.8298 95.602515,450.61701 97.66513,450.64328 C 99.807379,450.67057 107.82555,454.25518 109.87147,456.10026 C 110.79291,456.93125 115.2045,457.74824 121.09735,458.17919 C 129.00017,458.75715 131.43266,458.59143 134.17948,457.28798 C 138.48215,455.24623 144.22884,455.75679 147.95532,458.5119 C 149.97771,460.00711 151.63563,460.47215 153.38162,460.03393 C 155.57872,459.48249 155.97242,459.78618 156.5036,462.44208 C 156.83791,464.11361 158.18649,466.49119 159.50044,467.72559 C 160.8144,468.95999 161.88945,470.94676 161.88945,472.14065 C 161.88945,474.28843 164.67961,477.62132 166.47764,477.62132 C 166.98954,477.62132 167.95328,478.49389 168.61931,479.56036 C 169.28533,480.62683 171.4717,482.27831 173.47791,483.23032 C 178.32196,485.52897 181.13709,490.09951 180.36836,494.41737 C 179.86411,497.24968 180.28251,498.21438 183.34222,501.27409 C 186.30618,504.23805 187.36228,504.71946 189.64412,504.14676 C 193.03008,503.29694 192.79523,503.55174 194.43781,498.94573 C 195.18793,496.8423 195.82142,495.68382 195.84556,496.37132 C 195.8697,497.05882 196.56445,497.62132 197.38945,497.62132 C 199.25582,497.62132 199.2471,498.56436 197.35765,501.06245 C 195.29628,503.78781 195.52,504.62132 198.31285,504.62132 C 199.64573,504.62132 202.88466,502.9814 205.51049,500.97706 C 209.9907,497.55725 210.44149,497.42079 212.83002,498.76144 C 216.13737,500.61781 216.52139,503.00249 214.0242,506.17714 C 212.91782,507.58368 211.30332,510.8699 210.43643,513.47986 C 208.50967,519.28081 201.37867,526.53392 194.63945,529.54735 C 191.21835,531.07709 189.88945,532.24224 189.88945,533.71205 C 189.88945,536.437 188.11366,539.62132 186.59405,539.62132 C 185.92028,539.62132 184.19724,538.53479 182.76506,537.2068 z",name:"Muğla"},49:{path:"M 838.4379,392.51486 C 836.38316,386.08417 834.65543,383.9838 830.99158,383.4625 C 826.28373,382.79265 826.0461,380.31017 829.47235,367.5915 C 829.69901,366.7501 831.23558,365.55169 832.88696,364.92836 C 837.24775,363.28235 836.88579,360.17026 832.0464,357.70139 C 829.23288,356.26604 827.50124,354.32209 825.58248,350.44499 C 823.93642,347.11891 823.31318,344.79759 823.90686,344.20391 C 825.1761,342.93467 836.69287,341.53835 840.15907,342.23344 C 842.12229,342.62714 844.09847,344.51142 846.94633,348.70509 C 850.64111,354.14589 851.26233,354.62095 854.67671,354.61669 C 856.71872,354.61414 861.08945,353.49982 864.38945,352.14042 C 867.68945,350.78103 871.44641,349.65811 872.73824,349.64506 C 875.9637,349.61246 880.03386,344.91919 882.18238,338.75509 C 884.35549,332.52042 887.54858,330.01205 891.60741,331.35115 C 893.16062,331.86359 894.99587,333.56149 895.76237,335.19516 C 896.51748,336.80455 898.72265,339.78459 900.66274,341.81747 C 904.086,345.40446 904.58446,346.80552 906.55544,358.38059 C 906.86068,360.17319 907.51071,361.88724 907.99994,362.18961 C 911.18881,364.16043 905.62191,365.75296 894.6726,366.00215 C 890.8816,366.08843 887.41859,366.69218 886.7226,367.38817 C 886.04437,368.0664 884.64036,368.62132 883.60259,368.62132 C 882.42438,368.62132 881.29043,369.74804 880.58335,371.62132 C 879.76831,373.7806 878.79339,374.62132 877.10447,374.62132 C 872.304,374.62132 868.7122,378.57185 872.27103,379.9375 C 873.38866,380.36638 873.44292,381.25323 872.55505,384.57965 C 871.31337,389.23163 871.28452,389.2435 859.3564,390.00943 C 849.68637,390.63037 847.15691,391.46605 845.58531,394.55907 C 844.92759,395.85353 843.47333,397.24693 842.35364,397.65552 C 840.55825,398.31067 840.09581,397.70358 838.4379,392.51486 z",name:"Muş"},50:{path:"M 483.38945,417.70832 C 480.5344,417.37314 476.81246,416.05458 474.7134,414.63468 C 471.1848,412.24778 471.04441,411.93063 471.2134,406.7275 C 471.38767,401.36169 471.34906,401.28558 467.38945,399.18995 C 463.47047,397.11583 463.38945,396.96248 463.38945,391.6188 C 463.38945,387.35298 463.03067,386.09381 461.74275,385.83955 C 460.27114,385.54903 460.24723,385.2114 461.51792,382.66425 C 462.8307,380.03272 463.16417,379.89874 465.86452,380.91801 C 468.31218,381.8419 469.12365,381.71934 470.83935,380.16666 C 471.96691,379.14624 472.88945,377.69644 472.88945,376.94489 C 472.88945,376.19335 474.04447,375.05218 475.45616,374.40897 C 477.20829,373.61065 477.87272,372.66536 477.54978,371.43041 C 477.21551,370.15216 477.63608,369.62132 478.98307,369.62132 C 480.42958,369.62132 480.88945,368.90612 480.88945,366.6565 C 480.88945,364.71514 481.57985,363.3222 482.88945,362.62132 C 483.98945,362.03262 484.88945,360.72189 484.88945,359.70858 C 484.88945,358.69528 485.56445,357.30601 486.38945,356.62132 C 488.80281,354.61841 488.13809,353.62132 484.38945,353.62132 C 480.48004,353.62132 480.13658,352.70441 482.52896,348.65444 L 484.16846,345.87898 L 489.69474,349.75015 C 492.73419,351.87929 495.73105,353.62132 496.35443,353.62132 C 497.05394,353.62132 497.33633,354.91921 497.09206,357.01153 C 496.7655,359.80873 497.34154,361.11597 500.38524,364.48498 C 503.78752,368.2509 504.02292,368.90059 503.4142,372.84478 C 503.0512,375.19688 502.08316,379.53164 501.263,382.47758 C 499.92544,387.28197 499.93241,388.01131 501.33062,389.55632 C 502.18798,390.50368 502.88945,392.27822 502.88945,393.49972 C 502.88945,394.72123 503.62839,397.14959 504.53154,398.89609 L 506.17363,402.07155 L 500.53154,407.11778 C 496.83755,410.42165 494.88945,412.94207 494.88945,414.41742 C 494.88945,416.45336 491.25677,418.97771 489.07435,418.45832 C 488.69766,418.36868 486.13945,418.03118 483.38945,417.70832 z",name:"Nevşehir"},51:{path:"M 469.88945,482.25618 C 469.88945,480.95535 468.98945,478.74687 467.88945,477.34845 C 466.77049,475.92593 465.88945,473.29167 465.88945,471.36858 C 465.88945,469.20129 466.6284,467.26255 467.88945,466.12132 C 469.29271,464.85139 469.88945,463.04135 469.88945,460.05492 C 469.88945,456.10686 469.42971,455.37553 463.54335,449.95991 C 460.05299,446.74869 456.64857,443.08344 455.97797,441.81491 C 455.30738,440.54639 453.81582,439.15971 452.6634,438.7334 C 450.73875,438.02143 450.93905,437.67988 455.12265,434.53981 C 457.62766,432.65964 462.42496,429.43229 465.78333,427.36792 C 470.9078,424.21794 471.88945,423.16494 471.88945,420.81792 C 471.88945,419.27979 471.38866,417.52053 470.77658,416.90845 C 470.16451,416.29638 469.97999,415.28384 470.36654,414.65838 C 470.8474,413.88035 472.09795,414.30571 474.32606,416.00517 C 477.02109,418.06077 478.85952,418.52932 484.98609,418.72201 C 489.05794,418.85008 493.98471,418.61091 495.93447,418.19051 C 499.1393,417.49951 499.59513,417.67995 500.68447,420.07079 C 501.34721,421.52534 501.88945,423.50824 501.88945,424.47724 C 501.88945,427.61371 504.32222,429.74233 508.26433,430.05512 C 514.13654,430.52105 515.7816,432.87799 515.98813,441.12132 C 516.31497,454.16667 511.34857,460.28826 499.38945,461.58088 L 494.38945,462.12132 L 494.09641,468.75529 C 493.751,476.57459 492.28457,478.43207 485.44866,479.70916 C 482.96657,480.17286 479.04083,481.4678 476.72479,482.58679 C 471.27673,485.219 469.88945,485.1519 469.88945,482.25618 z",name:"Niğde"},52:{path:"M 639.57482,277.8148 C 637.13394,275.26708 637.02155,274.82908 638.35592,273.0648 C 641.48588,268.92646 640.40729,267.62132 633.85733,267.62132 C 625.78107,267.62132 621.35522,265.67183 619.53357,261.31201 C 617.69571,256.91339 617.53665,256.8303 608.5665,255.58266 C 601.83235,254.64603 600.63607,254.13497 597.21429,250.73292 C 595.11063,248.64139 592.71445,246.6873 591.88945,246.39048 C 590.6488,245.94413 590.73525,245.57713 592.38945,244.26788 C 593.48945,243.39725 595.34126,242.67062 596.50459,242.65312 C 599.6028,242.60654 603.60003,239.0637 605.03656,235.09104 C 605.73081,233.17112 606.98316,231.61857 607.84034,231.61516 C 608.69235,231.61177 610.67839,230.93677 612.25376,230.11516 C 615.54322,228.39958 619.48645,228.16023 620.38945,229.62132 C 620.72937,230.17132 622.01042,230.62132 623.23624,230.62132 C 624.46206,230.62132 627.023,231.95303 628.92722,233.58068 C 633.46932,237.46307 635.3952,237.36276 638.13026,233.10133 C 640.81324,228.92105 645.1577,228.49069 645.70632,232.35084 C 646.15114,235.48068 650.52591,238.21546 656.31042,238.97974 C 659.01695,239.33734 661.41541,239.81395 661.64032,240.03886 C 661.86524,240.26377 661.39584,241.49934 660.59721,242.78456 C 659.79859,244.06978 658.3085,247.52621 657.28589,250.46552 C 655.56662,255.4073 655.55052,255.90032 657.07206,257.0129 C 657.97705,257.67464 658.86869,259.54475 659.05348,261.1687 C 659.34118,263.69715 659.86499,264.16698 662.69971,264.43917 C 667.33417,264.88418 666.58011,267.72318 661.44475,269.16401 C 657.31693,270.32216 656.37699,271.37032 655.42996,275.87132 C 654.95854,278.11186 654.31004,278.62132 651.92941,278.62132 C 650.32235,278.62132 648.72937,278.17132 648.38945,277.62132 C 647.30196,275.86172 644.88945,276.55101 644.88945,278.62132 C 644.88945,281.43467 642.72873,281.10678 639.57482,277.8148 z",name:"Ordu"},53:{path:"M 786.00665,263.69375 C 784.66592,262.86514 784.39015,258.41437 785.42703,254.3391 C 786.42779,250.40582 783.2607,239.72116 780.09916,236.36473 C 776.92313,232.9929 777.85581,231.69316 784.01837,230.90311 C 789.63968,230.18246 795.41175,227.26269 799.30582,223.17004 C 801.42385,220.944 803.69416,219.72487 806.55601,219.27676 C 809.46452,218.82135 812.3149,217.26518 815.99624,214.12285 C 818.89676,211.64701 821.87056,209.62132 822.60468,209.62132 C 823.3388,209.62132 824.21271,210.98761 824.54669,212.65752 C 824.90038,214.42595 826.62851,216.90919 828.68544,218.60469 L 832.21695,221.51566 L 828.3032,226.12235 C 821.66581,233.93489 818.89252,237.85143 818.81636,239.51999 C 818.69085,242.2698 815.31744,247.10741 813.30854,247.41844 C 809.66741,247.98218 803.88945,250.92863 803.88945,252.22167 C 803.88945,254.05111 799.4549,258.62132 797.67977,258.62132 C 796.86558,258.62132 795.41099,259.49253 794.44735,260.55734 C 792.30277,262.92708 787.596,264.67603 786.00665,263.69375 z",name:"Rize"},54:{path:"M 270.13945,275.34616 C 268.90195,274.7794 267.88945,273.73978 267.88945,273.03589 C 267.88945,271.28838 264.88801,270.47748 259.45984,270.75846 C 255.94978,270.94016 254.38483,270.49589 252.58766,268.80753 C 251.30775,267.60511 249.28562,266.62132 248.09405,266.62132 C 245.98048,266.62132 245.7666,266.19999 244.43245,259.40809 C 243.97588,257.08377 245.56443,255.98171 250.86808,254.94335 C 256.14126,253.91096 259.88945,249.37674 259.88945,244.03014 C 259.88945,241.80438 260.57877,240.25191 262.01311,239.24726 C 263.74344,238.03529 264.01247,237.14503 263.46566,234.44055 C 261.5909,225.16831 261.5828,225.23883 264.92496,221.74157 L 268.12461,218.39345 L 273.12186,220.00739 C 275.87035,220.89505 278.72859,221.62132 279.47349,221.62132 C 280.2184,221.62132 282.52922,222.4908 284.60866,223.5535 C 286.68809,224.6162 290.52695,225.79229 293.13945,226.16704 C 295.75195,226.54179 297.94277,227.35981 298.00793,227.98486 C 298.30976,230.8799 297.55451,232.34831 294.23042,235.3294 C 291.394,237.87314 290.54721,239.47802 290.14129,243.0794 C 289.73267,246.70465 289.93674,247.62132 291.15241,247.62132 C 293.24358,247.62132 294.19358,250.54994 292.69008,252.36155 C 292.01145,253.17925 291.21618,255.93471 290.92283,258.4848 L 290.38945,263.12132 L 284.22147,263.62132 C 278.97188,264.04687 277.72864,264.53592 275.87173,266.90585 C 274.4075,268.77461 273.88403,270.46359 274.28004,272.04143 C 275.06018,275.14974 273.10968,276.70649 270.13945,275.34616 z",
-    name:"Sakarya"},55:{path:"M 549.38945,246.05119 C 546.63945,245.28598 542.94448,244.65122 541.17841,244.64061 C 539.32661,244.62949 537.21008,243.81158 536.17841,242.70843 C 535.19448,241.65634 533.03945,240.64384 531.38945,240.45843 C 528.76903,240.16397 528.43014,239.77337 528.71102,237.37132 C 528.99524,234.94068 528.70491,234.62409 526.21102,234.64518 C 524.65915,234.6583 521.59078,235.08598 519.3924,235.59558 C 515.83271,236.42075 515.1155,236.25401 512.83769,234.07173 C 511.43097,232.724 509.31331,231.62132 508.13178,231.62132 C 504.27632,231.62132 500.78538,229.308 499.30914,225.77487 C 498.08539,222.84602 498.07212,222.06315 499.22341,220.71558 C 499.97253,219.83874 500.86374,218.3364 501.20387,217.37704 C 501.78037,215.75099 507.46107,211.63342 509.13945,211.62506 C 509.55195,211.623 509.88945,212.15963 509.88945,212.81757 C 509.88945,213.47551 511.07565,215.72551 512.52545,217.81757 C 515.95915,222.7724 519.79365,223.00589 523.98824,218.51556 C 527.1148,215.16857 527.47937,213.5921 525.83663,210.52263 C 525.07922,209.1074 525.13914,207.51248 526.05018,204.83838 C 528.19189,198.55194 530.69162,195.62132 533.91206,195.62132 C 535.49958,195.62132 539.85644,194.46681 543.59396,193.05574 C 547.33148,191.64467 551.18486,190.24011 552.15704,189.93451 C 553.34586,189.56079 555.06488,190.58788 557.40704,193.07129 C 560.42133,196.26737 560.88945,197.43193 560.88945,201.73456 C 560.88945,205.76346 561.5053,207.54841 564.13945,211.15413 C 565.92695,213.60093 568.30586,215.85668 569.42592,216.16691 C 570.54599,216.47713 571.89599,217.71879 572.42592,218.92614 C 573.4341,221.22305 577.34326,222.24067 581.26028,221.22587 C 582.43132,220.92248 584.38381,218.91721 585.59915,216.7697 L 587.80884,212.86515 L 593.44857,214.17615 C 601.04235,215.94138 606.88945,219.85991 606.88945,223.18378 C 606.88945,225.09422 607.68928,226.05603 610.13945,227.09195 L 613.38945,228.46602 L 610.57435,229.54367 C 609.02605,230.13638 607.20395,230.62132 606.52524,230.62132 C 605.84653,230.62132 604.72663,232.1827 604.03656,234.09104 C 602.56063,238.17264 598.56574,241.62132 595.31361,241.62132 C 594.04524,241.62132 592.72835,242.07297 592.38718,242.62499 C 592.04602,243.17701 590.6774,243.35522 589.34582,243.02101 C 588.01424,242.68681 584.65887,242.95695 581.88945,243.62132 C 579.12003,244.28569 575.73841,244.54924 574.37475,244.20699 C 572.20856,243.66331 572.04811,243.34013 573.10456,241.64849 C 574.62954,239.20661 574.39713,239.02375 568.72234,238.20061 C 564.43984,237.57942 563.99794,237.71308 563.36,239.82248 C 562.42269,242.92175 557.88667,247.64257 555.95236,247.5319 C 555.09276,247.48272 552.13945,246.8164 549.38945,246.05119 z",name:"Samsun"},56:{path:"M 870.97959,454.12132 C 869.99393,453.02132 868.89601,451.29856 868.53978,450.29297 C 868.03639,448.87198 867.05628,448.53777 864.14077,448.79297 L 860.38945,449.12132 L 860.38945,444.68359 L 860.38945,440.24585 L 854.38945,439.12852 C 844.6494,437.3147 841.1033,434.18279 845.88945,431.62132 C 846.98945,431.03262 847.88945,429.89179 847.88945,429.08614 C 847.88945,428.20917 848.84658,427.62132 850.27444,427.62132 C 852.76487,427.62132 855.88945,423.98727 855.88945,421.09076 C 855.88945,420.21025 856.33533,418.65671 856.88028,417.63845 C 857.84081,415.84369 858.03201,415.84813 863.13028,417.78346 C 873.26265,421.62976 874.90726,421.91517 876.84308,420.16328 C 877.81701,419.28189 880.03258,418.15386 881.76656,417.65657 C 884.60711,416.84191 885.37318,417.14526 889.50412,420.72056 C 892.0258,422.90306 896.40659,425.86009 899.23922,427.29175 C 902.07185,428.7234 905.89618,431.48717 907.73774,433.43346 L 911.08603,436.97216 L 915.27689,434.68281 C 921.13989,431.48001 923.05783,432.12994 924.99925,437.97739 C 926.51136,442.53176 926.4977,443.05649 924.77422,446.62368 L 922.93939,450.42134 L 918.66442,449.38122 C 916.31319,448.80915 913.46045,447.50415 912.325,446.48121 C 907.88707,442.48303 900.1025,444.82039 895.43767,451.55173 C 892.20265,456.21988 893.07302,455.93786 881.58058,456.04172 C 873.97569,456.11044 872.52677,455.84796 870.97959,454.12132 z",name:"Siirt"},57:{path:"M 490.03647,219.04738 C 486.52557,217.10147 482.43996,215.62132 480.57963,215.62132 C 477.55993,215.62132 477.21354,215.28211 476.14202,211.27583 C 474.63654,205.64703 475.75225,201.49364 479.2226,199.80788 C 480.70973,199.08549 482.6304,197.42012 483.49076,196.10705 C 487.00784,190.7393 482.75707,187.19525 473.88945,188.10203 L 468.38945,188.66445 L 468.38945,183.39289 C 468.38945,180.49352 468.00374,177.05247 467.53232,175.74609 C 466.94134,174.10842 467.01181,173.57891 467.75924,174.04085 C 468.35548,174.40934 470.60801,174.23565 472.76487,173.65487 C 475.55833,172.90267 478.17821,172.91882 481.87214,173.71103 C 491.39476,175.75326 498.54611,173.11653 502.48603,166.11058 C 503.53537,164.24466 503.714,164.29203 506.63196,167.20999 C 508.97004,169.54806 509.56194,170.88376 509.16956,172.93637 C 508.70445,175.36942 509.65125,177.99725 513.21245,184.15726 C 515.30723,187.78073 518.31168,190.32994 521.88945,191.5195 C 523.81445,192.15953 526.2398,193.32734 527.27912,194.11463 C 528.97666,195.40053 529.02222,195.77864 527.7272,197.83369 C 524.80791,202.46629 523.47783,208.4225 524.7427,211.19857 C 525.73744,213.3818 525.59925,214.22013 523.83655,216.69561 C 520.71395,221.0809 517.23184,221.55917 514.29532,218.00608 C 512.98403,216.41946 511.63249,214.10882 511.29189,212.87132 C 510.9513,211.63382 509.93392,210.623 509.03104,210.62506 C 506.64057,210.6305 500.92697,214.34594 500.18565,216.37704 C 499.8355,217.3364 498.79952,219.10055 497.88347,220.29738 L 496.21793,222.47344 L 490.03647,219.04738 z",name:"Sinop"},58:{path:"M 596.46788,401.27752 C 596.80672,400.39453 596.10969,398.09571 594.91893,396.16902 L 592.75391,392.66595 L 595.1285,390.29136 C 596.43452,388.98534 597.92752,387.7378 598.44627,387.51905 C 598.96502,387.3003 600.17106,385.54632 601.12635,383.62132 C 602.08165,381.69632 603.82776,378.92299 605.00661,377.45837 C 608.14628,373.55758 607.00492,370.2721 601.98795,368.76898 C 599.15671,367.92072 597.66872,366.74394 596.72149,364.60399 C 595.09014,360.91853 591.65508,360.64703 586.33931,363.78341 C 583.08678,365.70244 582.28801,365.80561 579.23371,364.70116 C 576.56547,363.73631 575.4699,363.72463 574.35594,364.64913 C 573.43149,365.41635 570.31094,365.70971 565.60306,365.47197 C 559.65607,365.17166 557.69852,364.6364 555.14346,362.61192 C 553.41462,361.24209 551.97521,359.25032 551.94478,358.18577 C 551.91435,357.12122 550.96272,355.26376 549.83005,354.05809 L 547.77065,351.86596 L 552.58005,348.8943 C 556.78399,346.29673 557.80235,344.95515 560.66928,338.23756 C 563.68825,331.16372 563.85433,330.23614 562.75744,326.57503 C 562.10201,324.38743 560.96359,322.09781 560.2276,321.487 C 559.49162,320.87619 558.88945,319.07188 558.88945,317.47744 C 558.88945,315.3556 558.21926,314.27308 556.38945,313.43937 C 553.47196,312.11007 553.29838,311.35676 555.49038,309.53755 C 556.64927,308.57577 561.22758,308.1769 572.07142,308.093 C 588.8847,307.96292 588.34632,308.20581 589.43947,300.25764 C 589.88717,297.00244 590.94882,294.47104 592.52906,292.8908 C 594.68583,290.73404 595.49241,290.55274 600.27355,291.15011 C 604.18774,291.63915 606.40531,291.40592 608.59182,290.27523 C 611.28789,288.88104 611.72436,288.8848 613.15414,290.31459 C 614.62468,291.78512 622.1001,293.64318 627.88945,293.97712 C 629.90973,294.09365 630.44954,293.60016 630.70259,291.40534 C 630.90344,289.66327 632.42742,287.57128 634.95259,285.57131 C 637.11786,283.85638 638.88945,281.72607 638.88945,280.83729 C 638.88945,279.58042 639.15612,279.48799 640.08945,280.42132 C 640.74945,281.08132 642.32445,281.62132 643.58945,281.62132 C 645.29248,281.62132 645.88945,281.05031 645.88945,279.42132 C 645.88945,277.71021 646.15612,277.48799 647.08945,278.42132 C 647.74945,279.08132 649.95131,279.62132 651.98246,279.62132 C 655.7334,279.62132 656.88945,278.45293 656.88945,274.66198 C 656.88945,272.35137 658.58284,271.02474 662.63945,270.15734 C 665.65823,269.51185 665.88945,269.64946 665.88945,272.09152 C 665.88945,273.53754 666.56349,276.02409 667.38731,277.61719 C 668.23656,279.25945 668.77785,282.50608 668.63731,285.11468 L 668.38945,289.71563 L 673.88945,291.5503 C 676.91445,292.55937 680.82097,293.40718 682.57061,293.43431 C 684.36225,293.46209 686.62394,294.35581 687.74853,295.4804 C 688.84674,296.57861 691.80272,297.78569 694.31737,298.16278 C 696.83201,298.53988 698.88945,299.21051 698.88945,299.65308 C 698.88945,302.41998 697.40392,303.62132 693.98246,303.62132 C 691.95131,303.62132 689.84317,304.0676 689.29771,304.61306 C 688.64205,305.26872 687.21012,305.19117 685.07227,304.38422 C 681.0701,302.87357 678.52673,304.17444 678.07384,307.96373 C 677.83151,309.99137 678.35385,310.87579 680.32384,311.77338 C 683.24179,313.10289 683.48349,313.88342 681.48965,315.53816 C 680.71976,316.17712 679.1082,319.1185 677.90842,322.07458 C 676.20621,326.26855 675.96512,327.89418 676.81093,329.4746 C 677.59362,330.93708 677.5882,331.68947 676.79141,332.18191 C 675.10418,333.22468 676.62128,338.88779 679.08994,340.76198 C 681.14183,342.31976 681.16326,342.49037 679.51419,344.13944 C 678.10806,345.54556 677.90262,346.87855 678.43513,351.14064 C 679.20371,357.29215 678.40156,360.62132 676.1508,360.62132 C 675.26867,360.62132 673.69265,361.39444 672.64852,362.33936 C 671.30463,363.55556 667.65313,364.35883 660.14753,365.08936 C 649.58925,366.11701 649.54093,366.13385 648.5803,369.12132 C 647.30582,373.08484 647.43079,373.02213 644.5579,371.13973 C 642.94634,370.0838 640.50777,369.60945 637.72113,369.80983 C 634.01919,370.07604 633.43962,370.41208 633.73453,372.12132 C 633.92433,373.22132 634.0345,375.61692 633.97935,377.44488 C 633.9242,379.27283 634.55641,381.73546 635.38427,382.91738 C 637.60939,386.09419 637.26658,387.20126 633.34043,389.51774 C 631.27317,390.73745 629.17381,393.08983 628.31218,395.15201 C 626.48358,399.52848 624.82025,400.16139 612.88945,401.02048 C 607.66445,401.39672 601.69348,401.96969 599.62064,402.29375 C 596.43723,402.79143 595.94751,402.63358 596.46788,401.27752 z",name:"Sivas"},59:{path:"M 89.231551,243.07044 C 88.891608,242.18456 89.583572,240.51136 90.845312,239.1683 C 92.167883,237.76049 92.920835,235.87497 92.721825,234.46918 C 92.434736,232.44122 91.75334,232.08024 87.720735,231.81985 C 83.945594,231.57608 82.717634,231.00804 81.304938,228.85199 C 79.772651,226.51343 79.694618,225.38721 80.67024,219.69157 C 81.460502,215.07805 81.473055,212.82452 80.713591,211.90942 C 79.914419,210.94648 80.064175,210.62132 81.306843,210.62132 C 84.111129,210.62132 90.767623,206.73689 92.503663,204.08735 C 93.626251,202.37407 93.981459,200.34396 93.624413,197.68199 C 93.163034,194.24215 93.370653,193.71736 95.393787,193.20959 C 96.654435,192.89319 98.969179,193.30361 100.53766,194.12165 C 102.10615,194.93969 104.88217,195.61177 106.7066,195.61516 C 109.20827,195.6198 110.84905,196.49639 113.38082,199.18085 C 116.42174,202.40516 117.09818,202.68035 120.56367,202.10294 C 126.5368,201.10771 126.88945,200.86714 126.88945,197.78756 C 126.88945,193.6671 130.29736,189.86177 135.1931,188.51557 C 137.50109,187.88093 141.76883,186.5201 144.67696,185.4915 C 147.58509,184.4629 151.30141,183.62132 152.93544,183.62132 C 155.61416,183.62132 155.78853,183.81006 154.70809,185.54012 C 153.7664,187.048 153.78699,187.79293 154.80422,189.01862 C 155.88132,190.31645 155.75556,191.12762 154.05517,193.84983 C 146.80289,205.46026 144.76329,210.15031 145.18738,214.24131 C 145.9314,221.41859 143.11339,223.51583 138.06317,219.54333 C 135.73222,217.7098 134.59604,217.54442 128.40544,218.13752 C 121.24095,218.82392 117.96761,220.84682 117.91169,224.62259 C 117.88055,226.72448 108.16575,236.75071 103.58229,239.41133 C 101.48835,240.62682 98.76186,241.62132 97.523419,241.62132 C 96.284979,241.62132 94.398201,242.28201 93.33058,243.08952 C 90.82834,244.98212 89.963586,244.97809 89.231551,243.07044 z",name:"Tekirdağ"},60:{path:"M 553.8337,305.51715 C 553.31436,304.54676 552.88945,302.91322 552.88945,301.88706 C 552.88945,298.29344 550.94441,297.60815 542.44831,298.20833 L 534.38945,298.77762 L 530.63945,295.25045 C 524.70616,289.66973 526.17342,285.44083 535.17894,282.16693 C 540.7974,280.12438 545.88945,276.13817 545.88945,273.78243 C 545.88945,272.48037 546.86214,272.12132 550.38945,272.12132 C 553.32278,272.12132 554.88945,272.55651 554.88945,273.37132 C 554.88945,274.17234 556.39374,274.62132 559.07757,274.62132 C 565.36748,274.62132 572.36733,269.27077 568.88945,267.12132 C 567.14141,266.04097 567.81092,264.62132 570.06845,264.62132 C 571.2669,264.62132 573.73059,265.15763 575.54332,265.81312 C 579.48542,267.2386 580.84108,266.33034 578.54999,263.79871 C 577.63309,262.78555 576.88945,260.30865 576.88945,258.26783 C 576.88945,255.21451 577.33831,254.40116 579.47073,253.59042 C 582.46147,252.45334 582.22513,250.26734 579.06112,249.80177 C 577.76984,249.61176 576.88945,248.76413 576.88945,247.7109 C 576.88945,246.37179 578.28283,245.62775 582.59985,244.66165 C 586.93626,243.6912 588.40446,243.66634 588.70178,244.55831 C 588.91712,245.20433 589.7821,246.2703 590.62395,246.92711 C 591.4658,247.58393 593.92861,249.78956 596.09686,251.82851 C 599.56,255.08515 600.95396,255.66294 607.5665,256.58266 C 616.53665,257.8303 616.69571,257.91339 618.53357,262.31201 C 620.35522,266.67183 624.78107,268.62132 632.85733,268.62132 C 636.175,268.62132 638.88945,268.86215 638.88945,269.1565 C 638.88945,269.45085 638.13377,270.845 637.21017,272.2546 C 635.8661,274.3059 635.76629,275.19446 636.71017,276.70585 C 638.63176,279.78281 638.10634,281.28148 633.95259,284.57131 C 631.42742,286.57128 629.90344,288.66327 629.70259,290.40534 C 629.46539,292.46262 628.90439,293.05698 627.38945,292.85604 C 619.86197,291.85758 615.60535,290.67418 613.86002,289.09469 C 611.95257,287.36846 611.65896,287.36081 608.32566,288.95035 C 605.70671,290.19924 603.42954,290.46721 599.43006,289.99715 C 594.60311,289.42983 593.80279,289.61707 591.58803,291.83183 C 589.94755,293.47231 588.89313,295.95914 588.43947,299.25764 C 588.06432,301.98527 587.39427,304.8045 586.95047,305.52259 C 586.35233,306.4904 582.08594,306.88684 570.46075,307.05485 C 556.36131,307.25861 554.68262,307.10336 553.8337,305.51715 z",name:"Tokat"},61:{path:"M 769.38945,263.26309 C 766.70118,262.45356 764.96164,261.16704 764.08488,259.33994 C 762.37025,255.76677 758.88945,255.6203 758.88945,259.12132 C 758.88945,261.87131 757.43559,262.48693 756.52782,260.12132 C 756.21124,259.29632 755.11603,258.62132 754.09403,258.62132 C 752.58667,258.62132 752.32135,258.03865 752.68878,255.53524 C 753.09561,252.76332 752.9012,252.48337 750.77905,252.78524 C 748.9038,253.05199 748.28907,253.90896 747.79929,256.93923 C 747.4599,259.03907 746.47977,261.45958 745.62122,262.31812 C 744.20656,263.73278 743.77513,263.67611 741.01907,261.71361 C 739.34643,260.52259 736.4955,259.04088 734.68368,258.42092 C 732.87185,257.80096 731.16445,257.01516 730.88945,256.6747 C 730.61445,256.33425 727.96932,254.52406 725.01138,252.65207 C 718.00768,248.21966 715.89796,244.69772 715.89319,237.43034 C 715.88907,231.16062 716.77526,229.90855 719.85547,231.83217 C 721.5971,232.91984 722.53652,232.77515 726.14615,230.86327 C 731.34016,228.11221 732.09921,228.09064 734.39617,230.62875 C 737.25922,233.79238 741.82537,235.72598 743.86077,234.63667 C 745.10767,233.96935 746.74115,234.28202 749.50263,235.7166 C 752.33381,237.1874 754.44444,237.57541 757.2739,237.14524 C 760.12441,236.71188 761.64888,236.99862 763.00127,238.22252 C 765.35532,240.3529 771.28585,239.537 774.34649,236.66168 L 776.51673,234.62285 L 779.10621,237.37208 C 782.74978,241.24045 785.54018,251.63609 783.95936,255.45253 C 783.30751,257.02625 783.05812,259.44517 783.40516,260.82791 C 783.96149,263.04449 783.6577,263.41767 780.8378,263.98165 C 776.535,264.84221 774.13268,264.69143 769.38945,263.26309 z",name:"Trabzon"},62:{path:"M 732.23574,381.92154 C 730.5012,381.05701 728.55001,379.35559 727.89977,378.1406 C 727.04258,376.53893 726.05759,376.05768 724.31744,376.39034 C 720.55257,377.11003 714.88945,375.71988 714.88945,374.07601 C 714.88945,372.04148 710.91281,372.24759 709.19174,374.37132 C 707.91047,375.95235 707.8113,375.80338 708.1646,372.82837 C 708.46477,370.30082 708.2268,369.66163 707.14077,370.07837 C 706.36258,370.37699 705.51112,370.62132 705.24865,370.62132 C 704.98617,370.62132 705.04953,371.07132 705.38945,371.62132 C 705.72937,372.17132 705.30593,372.62132 704.44847,372.62132 C 703.59101,372.62132 702.88945,371.93049 702.88945,371.08614 C 702.88945,370.24179 702.17468,368.46007 701.30107,367.12678 C 698.83432,363.36204 700.19671,359.2736 704.42783,357.7436 C 708.65306,356.21574 709.36926,352.62132 705.44847,352.62132 C 702.22662,352.62132 701.12152,350.65601 703.40463,348.98656 C 704.82505,347.94793 705.54202,347.91802 706.66562,348.85052 C 707.80835,349.7989 708.36452,349.69211 709.35791,348.33357 C 710.04652,347.39183 711.0382,346.62132 711.56163,346.62132 C 712.08507,346.62132 713.51143,345.27132 714.73133,343.62132 C 715.95123,341.97132 717.58156,340.62132 718.35429,340.62132 C 719.12702,340.62132 721.02605,340.12917 722.57435,339.52766 C 724.12266,338.92614 727.5712,338.2739 730.23779,338.07823 C 732.90437,337.88257 736.1368,337.03405 737.42095,336.19264 C 739.61623,334.75423 739.77472,334.79543 740.07262,336.88184 C 740.52416,340.04437 743.60278,340.22269 746.36139,337.2461 C 747.65807,335.84696 749.91962,334.40087 751.38706,334.03256 C 753.36574,333.53595 753.9288,332.87979 753.56617,331.49312 C 752.85465,328.77226 754.31443,328.35422 758.46756,330.08951 C 762.99105,331.97954 766.62114,331.98965 769.88945,330.12132 C 773.69075,327.9483 782.1888,328.18963 784.30749,330.53075 C 785.94737,332.34281 785.94253,332.4714 784.21248,333.05209 C 783.20981,333.38863 780.8327,334.95721 778.93001,336.53783 C 775.94191,339.02011 775.65203,339.63031 776.80237,341.0164 C 777.96408,342.41617 777.68027,342.81077 774.58019,344.10607 C 772.6255,344.92279 770.74286,346.04949 770.39655,346.60984 C 770.05023,347.17019 768.70901,347.36315 767.41606,347.03864 C 765.45036,346.54528 764.78436,347.04051 763.35081,350.06151 C 762.24299,352.39606 761.83582,354.9034 762.20004,357.14786 C 762.66994,360.04349 762.46183,360.62132 760.94902,360.62132 C 759.95095,360.62132 758.54549,361.33083 757.8258,362.19802 C 756.73579,363.51139 756.81568,364.32887 758.30414,367.09277 C 761.37822,372.80099 758.5021,376.9834 750.71048,378.13535 L 746.03151,378.8271 L 745.71048,375.47421 C 745.45146,372.76892 744.90711,372.05334 742.8922,371.76937 C 740.48419,371.42999 740.45739,371.48642 742.1422,373.34811 C 744.58424,376.04654 744.32362,378.31444 741.24343,381.16907 C 738.20577,383.98428 736.63719,384.11531 732.23574,381.92154 z",name:"Tunceli"},63:{path:"M 725.38945,525.58657 C 723.73945,525.0698 718.25566,524.73919 713.20325,524.8519 L 704.01706,525.05682 L 699.20325,520.81072 C 696.55566,518.47537 692.36445,515.64166 689.88945,514.51359 C 684.0661,511.8594 673.63848,511.52136 669.30537,513.8463 L 666.22129,515.50108 L 664.55537,511.72518 C 663.63912,509.64843 662.88945,507.41435 662.88945,506.76055 C 662.88945,506.10675 661.77716,505.14893 660.4177,504.63206 C 656.41851,503.11157 652.81743,491.01993 655.81251,489.16887 C 656.3202,488.8551 657.0173,487.31571 657.36163,485.74799 C 657.72873,484.07658 659.00142,482.4357 660.43857,481.7809 C 661.78655,481.16671 662.88945,479.96405 662.88945,479.10832 C 662.88945,477.82785 663.74024,477.6653 667.6957,478.19001 C 671.50498,478.69532 673.17756,478.41671 675.759,476.84685 C 678.50921,475.17434 679.66756,475.0196 683.20275,475.85244 C 685.50544,476.39491 688.31909,477.84359 689.45531,479.07173 C 691.19461,480.95172 692.20788,481.21117 695.86521,480.71301 L 700.20925,480.12132 L 697.54935,478.70234 C 694.8362,477.25495 693.74606,474.24533 696.2883,475.22088 C 698.52583,476.0795 699.27069,473.62535 697.23959,472.08659 C 695.45326,470.73327 695.45268,470.68383 697.22278,470.65312 C 698.23112,470.63563 698.86996,470.06284 698.64243,469.38025 C 697.71352,466.59353 701.79833,464.92436 707.38945,465.80596 C 708.49577,465.98041 709.29203,465.60563 709.17142,464.96723 C 709.0515,464.33248 709.614,463.26488 710.42142,462.59479 C 711.22884,461.92469 711.88945,461.80359 711.88945,462.32568 C 711.88945,462.84777 713.18616,463.08462 714.77103,462.85201 C 716.3559,462.6194 717.95745,462.92234 718.33005,463.5252 C 719.38396,465.23047 720.60369,464.82207 721.19355,462.56643 C 721.59418,461.03441 721.09965,460.27154 719.25001,459.5683 C 716.71529,458.60461 716.84885,456.62132 719.44847,456.62132 C 720.24101,456.62132 720.88945,456.17132 720.88945,455.62132 C 720.88945,455.07132 720.26259,454.62132 719.49644,454.62132 C 717.68822,454.62132 716.64218,451.89217 718.10409,450.98866 C 718.82154,450.54525 718.47034,450.01043 717.1381,449.5176 C 714.62181,448.58676 715.12472,444.99881 717.8947,444.11965 C 719.12405,443.72947 719.51481,442.90469 719.14333,441.48418 C 717.37372,434.71715 734.21232,437.95375 743.92982,446.24846 C 746.74744,448.65353 749.5254,450.62132 750.10307,450.62132 C 750.68074,450.62132 752.70194,449.66426 754.59462,448.49452 C 759.46739,445.48298 760.30475,446.80921 760.08163,457.18503 C 759.90715,465.29897 760.06801,466.02049 763.00229,470.28532 C 764.71021,472.7677 767.13443,477.4189 768.38945,480.62132 C 769.64447,483.82374 772.14064,488.57951 773.9365,491.18971 C 776.26246,494.57037 777.16311,496.96185 777.06756,499.50349 C 776.96459,502.24248 777.65014,503.81094 780.01815,506.25411 C 783.02238,509.35368 783.04962,509.46523 781.0619,510.52903 C 779.93937,511.12979 778.07723,511.62132 776.92381,511.62132 C 775.77039,511.62132 774.56766,512.29632 774.25108,513.12132 C 773.93449,513.94632 773.24575,514.62132 772.72054,514.62132 C 772.19532,514.62132 769.43097,515.69685 766.57752,517.01139 C 763.72408,518.32594 760.26445,519.65147 758.88945,519.95702 C 757.51445,520.26258 753.91445,521.23948 750.88945,522.12792 C 745.88868,523.59664 739.43857,524.90596 731.38945,526.08625 C 729.73945,526.3282 727.03945,526.10335 725.38945,525.58657 z",name:"Şanlıurfa"},64:{path:"M 208.58369,409.10476 C 205.21261,406.12095 202.66687,405.97924 198.50748,408.54386 C 195.73147,410.25551 194.35237,410.38012 185.93481,409.67993 C 180.07901,409.19283 176.3275,408.43548 176.0791,407.69026 C 175.85851,407.0285 174.64434,405.28532 173.38095,403.81654 C 171.35752,401.46417 171.2348,400.84673 172.35078,398.63367 C 173.04758,397.25188 173.86965,393.21528 174.17759,389.66346 C 174.80645,382.41018 175.84269,381.14291 181.99472,380.10353 C 184.33842,379.70757 186.32667,378.67288 186.93767,377.53122 C 187.73867,376.03454 189.08807,375.61365 193.17463,375.58588 C 196.04278,375.5664 199.51445,374.90734 200.88945,374.12132 C 202.26445,373.3353 204.28945,372.67754 205.38945,372.65963 C 206.48945,372.64172 210.17488,371.44477 213.5793,369.99974 C 219.20833,367.61046 220.37711,367.45164 226.47935,368.24687 L 233.18955,369.12132 L 234.63848,374.107 L 236.08741,379.09268 L 232.98843,381.67983 C 230.77332,383.52908 229.88945,385.13177 229.88945,387.29909 C 229.88945,389.67317 228.70881,391.4478 224.44931,395.47626 C 221.45723,398.30604 218.38935,400.62132 217.6318,400.62132 C 216.75545,400.62132 215.91523,402.52995 215.32194,405.8684 C 214.23508,411.98414 212.6804,412.73084 208.58369,409.10476 z",name:"Uşak"},65:{path:"M 941.88945,442.49935 C 939.10531,440.91952 937.26453,440.62956 932.88945,441.08165 L 927.38945,441.64999 L 925.88945,436.88566 C 924.4955,432.45815 924.13314,432.0999 920.76402,431.81838 C 917.34778,431.53292 917.1072,431.28141 916.59457,427.45946 C 916.29535,425.22866 916.29818,421.87749 916.60084,420.0124 C 917.08215,417.04641 916.88402,416.62132 915.02029,416.62132 C 913.55612,416.62132 912.88945,415.99559 912.88945,414.62132 C 912.88945,413.44608 913.55612,412.62132 914.50608,412.62132 C 915.70949,412.62132 915.95573,412.0462 915.46942,410.37132 C 913.81728,404.68117 913.6589,398.05755 915.14548,396.8238 C 915.96524,396.14346 917.25549,395.82763 918.0127,396.12196 C 919.46777,396.68756 921.88945,401.15606 921.88945,403.27537 C 921.88945,404.72465 927.23238,405.93761 931.48152,405.45298 C 933.53044,405.21929 934.34822,404.60317 934.24989,403.36729 C 934.09331,401.3994 939.24332,396.62132 941.52097,396.62132 C 942.65833,396.62132 942.92878,395.53992 942.69424,391.92996 C 942.4149,387.63027 942.13302,387.17257 939.31787,386.4476 C 935.65634,385.50468 932.86871,381.24206 934.70966,379.40111 C 935.35854,378.75223 935.88945,377.36919 935.88945,376.3277 C 935.88945,375.28621 936.76416,374.20534 937.83326,373.92576 C 938.90235,373.64619 939.91631,372.45082 940.08649,371.26938 C 940.31104,369.71054 941.01222,369.18666 942.64268,369.35953 C 943.87841,369.49055 944.88945,369.18794 944.88945,368.68708 C 944.88945,368.18622 946.46445,367.25663 948.38945,366.62132 C 950.31445,365.98601 951.88945,365.10571 951.88945,364.66509 C 951.88945,364.22447 953.23945,363.30477 954.88945,362.62132 C 960.13934,360.44675 957.87176,358.21848 949.24427,357.074 C 944.98321,356.50875 943.49109,356.81037 939.04336,359.13602 C 933.74587,361.906 931.62105,361.99839 925.63945,359.71883 C 924.12695,359.14243 922.88945,358.27304 922.88945,357.78686 C 922.88945,357.30068 924.57695,354.92146 926.63945,352.4997 C 933.33297,344.64026 934.6694,340.32103 930.78879,339.08937 C 928.22104,338.2744 929.22008,337.23634 934.05946,335.69097 C 936.07796,335.04639 938.27056,333.86703 938.9319,333.07017 C 940.71133,330.92609 943.78478,331.3041 947.47834,334.12132 C 949.28106,335.49632 951.04106,336.62132 951.38945,336.62132 C 951.73784,336.62132 953.60862,337.83081 955.54673,339.30908 C 959.77091,342.53102 961.47623,341.86417 963.41199,336.23343 C 965.16639,331.13023 965.5348,330.90909 971.48821,331.38573 C 976.57263,331.7928 976.59091,331.80683 977.98821,336.37521 C 978.75889,338.89491 980.27908,341.44357 981.36641,342.0389 C 982.45374,342.63423 983.90193,343.79632 984.58461,344.62132 C 986.1959,346.56853 986.24824,352.33506 984.65942,352.86466 C 982.93749,353.43864 986.51967,361.18529 989.64312,363.6422 C 991.75755,365.30541 991.95021,366.03335 991.34467,370.07137 C 990.82456,373.5397 991.06783,375.24461 992.36537,377.22492 C 993.38746,378.78482 994.27024,382.68373 994.57217,386.97154 C 995.1159,394.69329 995.90381,395.87085 1000.1584,395.32039 C 1003.7277,394.85859 1005.4195,396.76235 1003.9237,399.5574 C 1003.3161,400.69255 1002.3849,401.62132 1001.8543,401.62132 C 1001.3236,401.62132 1000.8895,403.64632 1000.8895,406.12132 C 1000.8895,408.59632 1000.507,410.62132 1000.0395,410.62132 C 998.56645,410.62132 993.72449,423.31306 994.0645,426.28293 C 994.35397,428.81142 994.82618,429.15481 998.38945,429.42803 C 1001.0348,429.63087 1002.9469,430.45647 1004.0355,431.8659 C 1005.5926,433.88201 1005.553,434.09816 1003.301,435.86954 C 1001.9918,436.8994 999.22606,438.00245 997.155,438.32077 C 995.08395,438.63909 992.64579,439.2793 991.73688,439.74347 C 990.29912,440.4777 990.15344,440.07204 990.61611,436.62256 C 991.27298,431.72525 989.00141,430.2592 985.58857,433.37783 C 981.67953,436.94989 976.54377,438.94747 969.38945,439.67858 C 965.53945,440.07201 960.42478,441.13584 958.02351,442.04264 C 951.15372,444.6369 945.91766,444.78513 941.88945,442.49935 z",name:"Van"},66:{path:"M 512.63945,373.90507 C 511.12695,373.67594 509.88945,373.06837 509.88945,372.5549 C 509.88945,372.04143 508.76445,371.62132 507.38945,371.62132 C 505.5057,371.62132 504.88945,371.09657 504.88945,369.49252 C 504.88945,368.32168 503.27318,365.57471 501.29774,363.38813 C 498.30366,360.07404 497.79985,358.88914 498.26985,356.26693 C 498.78348,353.40134 498.50233,352.96709 495.11156,351.38882 C 493.0644,350.43595 487.83874,346.87613 483.49899,343.47811 C 476.41861,337.93419 475.78723,337.16923 477.34913,336.02715 C 479.23732,334.64646 478.71274,332.9877 475.70066,330.81462 C 474.70449,330.09593 473.88945,328.8688 473.88945,328.08767 C 473.88945,326.15676 470.18405,323.9145 465.61235,323.07892 C 463.46323,322.68612 461.40076,321.57671 460.82717,320.50495 C 460.27272,319.46895 459.18543,318.62132 458.41097,318.62132 C 456.6923,318.62132 453.88945,314.80849 453.88945,312.47053 C 453.88945,311.20268 455.36565,310.45015 459.63945,309.53933 C 462.80195,308.86534 466.73945,307.52088 468.38945,306.55163 C 471.08098,304.97056 471.80074,304.9334 475.38945,306.19028 C 480.46288,307.96716 482.85622,307.97269 486.48581,306.21593 C 488.08281,305.44297 491.30195,304.50341 493.63945,304.12803 C 497.14167,303.56561 497.88945,303.72491 497.88945,305.03342 C 497.88945,306.91679 500.64235,306.99226 506.38945,305.26644 L 510.38945,304.06527 L 511.39648,297.09329 L 512.40351,290.12132 L 518.59031,289.82506 C 524.26098,289.55352 524.88606,289.73113 526.08328,291.95413 C 526.80167,293.28806 528.87865,295.62135 530.69879,297.13921 C 533.85559,299.77176 534.37223,299.87402 541.90719,299.35756 C 547.27092,298.98992 550.0975,299.18609 550.71365,299.96873 C 551.97462,301.57042 553.07385,306.52461 552.98743,310.21662 C 552.93207,312.58183 553.50165,313.57923 555.40221,314.44518 C 557.15549,315.24403 557.88945,316.37303 557.88945,318.27114 C 557.88945,319.75212 558.50073,321.67427 559.24785,322.54258 C 562.7953,326.66546 562.83434,329.94669 559.428,337.68245 C 556.85587,343.52373 555.35335,345.58475 552.20543,347.58971 C 550.01929,348.98209 547.59137,350.66123 546.81004,351.32113 C 546.02872,351.98102 543.58945,354.05729 541.38945,355.93506 C 538.59267,358.32219 535.9431,359.56157 532.5812,360.05526 C 527.52983,360.79704 525.81742,362.62468 527.86366,365.09025 C 529.23543,366.74312 528.4384,368.62132 526.36523,368.62132 C 525.59183,368.62132 523.42148,369.97132 521.54223,371.62132 C 519.66299,373.27132 517.50983,374.5539 516.75743,374.47149 C 516.00504,374.38908 514.15195,374.13419 512.63945,373.90507 z",name:"Yozgat"},67:{path:"M 335.88945,231.62132 C 334.51445,231.18097 330.77658,230.77582 327.58308,230.721 C 322.41408,230.63226 321.46264,230.27746 318.91554,227.48874 L 316.05438,224.35617 L 318.49343,221.73874 C 319.83491,220.29916 321.20142,217.45817 321.53012,215.42544 C 322.04083,212.26714 322.76339,211.43077 326.49771,209.67544 C 328.90118,208.54567 331.2172,207.62132 331.64442,207.62132 C 332.07164,207.62132 335.56405,205.77006 339.40532,203.50741 C 351.44674,196.41456 353.84753,195.62768 358.17745,197.35469 C 360.69285,198.35796 361.88945,199.46666 361.88945,200.79402 C 361.88945,201.87135 362.41445,203.73377 363.05612,204.93274 C 363.69778,206.13171 364.22278,208.60391 364.22278,210.42653 C 364.22278,213.07527 363.5872,214.12691 361.05612,215.66616 C 358.48299,217.23097 357.88945,218.23963 357.88945,221.0476 C 357.88945,222.94823 357.3962,224.80813 356.79333,225.18072 C 356.19047,225.55332 355.88173,227.11537 356.10725,228.65196 C 356.46281,231.07452 356.12678,231.52385 353.57837,232.03354 C 349.53779,232.84165 338.92791,232.5944 335.88945,231.62132 z",name:"Zonguldak"},68:{path:"M 413.63046,435.00695 C 411.66774,431.76985 409.32024,427.26135 408.41379,424.98806 C 406.89558,421.18051 406.89156,420.42187 408.36273,415.36123 C 409.24109,412.33978 410.80346,409.10413 411.83466,408.1709 C 412.86587,407.23768 413.98362,405.38225 414.31857,404.04772 C 414.65351,402.7132 415.28479,401.62132 415.72141,401.62132 C 417.24541,401.62132 422.10254,407.46752 421.45244,408.51939 C 420.3967,410.22762 422.77751,413.62132 425.03162,413.62132 C 426.51589,413.62132 426.93012,413.1697 426.49231,412.02878 C 426.08949,410.97903 426.53637,410.26491 427.80344,409.93356 C 428.86068,409.65709 430.28157,408.08887 430.96098,406.44864 C 431.64038,404.8084 433.25223,402.7745 434.54286,401.92885 C 437.19087,400.1938 437.67772,397.62132 435.35807,397.62132 C 433.54078,397.62132 432.17935,394.70117 433.56269,393.7704 C 435.1441,392.70635 438.88945,384.17325 438.88945,381.63434 C 438.88945,380.33879 438.10436,378.41129 437.14481,377.351 C 435.47002,375.50038 435.52007,375.3262 438.39481,373.00093 C 442.70316,369.51605 445.90295,368.8915 447.49939,371.22386 C 448.21371,372.26746 449.63167,374.02132 450.65042,375.12132 C 451.66917,376.22132 453.73587,379.05615 455.2431,381.42094 C 456.75032,383.78573 458.96888,386.08507 460.17323,386.53059 C 462.05261,387.22582 462.36483,388.10459 462.3762,392.73097 C 462.3888,397.85492 462.55723,398.20508 465.78418,399.81605 C 471.13721,402.48841 471.29751,402.86981 469.94883,409.72503 C 468.98793,414.60918 468.98606,416.43332 469.94011,418.21598 C 471.74451,421.58753 470.8023,422.8403 462.84724,427.64683 C 458.86603,430.05231 454.01258,433.52574 452.06181,435.36555 C 448.84366,438.40066 447.86038,438.74309 441.4522,439.06045 C 437.56769,439.25283 430.52161,439.74376 425.79424,440.1514 L 417.19904,440.89258 L 413.63046,435.00695 z",
-    name:"Aksaray"},69:{path:"M 747.64124,301.77989 C 743.2738,299.1441 743.98117,295.9216 750.11433,290.51339 C 755.08379,286.13133 755.27988,285.77364 754.1147,283.21633 C 752.22596,279.07101 752.64313,275.58427 755.52545,271.42507 C 758.112,267.69268 759.11851,267.21599 763.63945,267.58219 C 765.31341,267.71779 765.88945,267.22922 765.88945,265.67383 C 765.88945,263.87339 766.27114,263.68996 768.63945,264.35227 C 770.15195,264.77525 775.56468,265.1011 780.66774,265.0764 C 788.6622,265.03769 789.85514,265.24524 789.28915,266.5764 C 787.93763,269.75499 787.73563,272.40822 788.79528,273.06312 C 790.38531,274.04581 790.13538,275.62132 788.38945,275.62132 C 786.65264,275.62132 786.40536,278.84827 787.92463,281.68706 C 788.49398,282.7509 789.97898,283.62132 791.22463,283.62132 C 792.47028,283.62132 794.04068,284.17255 794.71441,284.84628 C 795.68102,285.81289 796.35591,285.8111 797.91441,284.83781 C 801.67196,282.49117 799.97676,285.66612 794.75811,290.74925 C 786.43344,298.85774 785.96404,299.05198 778.35129,297.53881 C 769.00682,295.68143 757.36453,297.36769 754.20963,301.03548 C 751.66217,303.99707 751.36993,304.03019 747.64124,301.77989 z",name:"Bayburt"},70:{path:"M 365.80664,545.37132 C 365.7611,544.68382 365.60586,541.19632 365.46166,537.62132 C 365.31747,534.04632 364.7532,529.28017 364.20774,527.02989 L 363.21599,522.93845 L 367.80272,520.90864 C 370.32542,519.79224 373.51445,518.41785 374.88945,517.85444 C 378.16194,516.51352 385.88995,509.79536 385.88766,508.2934 C 385.88668,507.64875 383.8899,505.86035 381.45038,504.31917 C 378.81658,502.65526 376.87859,500.62426 376.67934,499.31917 C 376.32599,497.00472 379.1829,492.03388 382.13945,489.81895 C 383.11278,489.08976 383.88945,487.20165 383.88945,485.56462 C 383.88945,482.85596 384.17434,482.62132 387.4631,482.62132 C 390.51884,482.62132 391.76525,481.82423 396.06344,477.12132 C 401.28019,471.41337 403.24049,470.48777 404.29461,473.23477 C 404.68719,474.25781 405.64081,474.6581 406.90061,474.32865 C 407.99337,474.04289 409.13946,474.21683 409.44747,474.7152 C 409.75548,475.21357 411.11177,475.62132 412.46146,475.62132 C 414.37641,475.62132 415.39185,474.64073 417.08431,471.15713 C 419.28488,466.62771 422.15269,464.77766 429.38945,463.219 C 432.22473,462.60833 432.46239,462.80674 433.71787,466.83261 C 434.44851,469.17548 436.10118,473.39859 437.39049,476.2173 C 439.30204,480.39637 440.47882,481.63998 443.76662,482.95549 C 447.61363,484.49477 447.78035,484.74195 447.40162,488.34504 C 447.1833,490.42199 446.97875,493.75402 446.94707,495.74954 C 446.8955,498.9967 446.31243,499.77517 441.39549,503.1616 C 436.05441,506.84014 435.79225,506.90936 431.97384,505.64917 C 428.38261,504.46396 427.8137,504.53574 425.33293,506.48712 C 423.62164,507.83322 421.18687,508.62132 418.73949,508.62132 C 416.60536,508.62132 412.10632,509.3867 408.74163,510.32217 C 403.61868,511.74648 402.40805,512.51879 401.29587,515.07217 C 400.56539,516.7492 399.95012,517.55882 399.92859,516.87132 C 399.90217,516.02758 398.10191,515.62132 394.38945,515.62132 C 389.17085,515.62132 388.88945,515.75087 388.88945,518.15344 C 388.88945,519.5461 389.51033,522.17153 390.26918,523.98771 C 391.65314,527.29999 396.28239,532.62132 397.77992,532.62132 C 398.21967,532.62132 399.39695,533.52462 400.39608,534.62864 C 402.18415,536.60444 402.16336,536.6261 399.07223,536.00788 C 396.35686,535.4648 395.80191,535.72138 394.9723,537.90341 C 393.70049,541.24852 392.31681,541.98301 386.91661,542.17959 C 384.42667,542.27022 378.91022,543.30669 374.65783,544.48285 C 365.56355,546.99822 365.9121,546.96323 365.80664,545.37132 z",name:"Karaman"},71:{path:"M 419.95679,344.74714 C 419.37924,343.66799 419.18679,341.38462 419.52911,339.673 C 420.07192,336.95895 419.63073,336.06553 416.07933,332.68717 L 412.00713,328.81338 L 413.94829,325.00591 C 415.01593,322.9118 415.88945,319.58359 415.88945,317.60988 C 415.88945,315.63617 416.30135,313.59382 416.80477,313.07132 C 417.3082,312.54882 417.8707,310.99632 418.05477,309.62132 C 418.31121,307.70573 419.06564,307.04413 421.28206,306.79114 C 424.12221,306.46694 431.88945,301.99825 431.88945,300.68843 C 431.88945,300.32152 431.49755,299.59382 431.01856,299.07132 C 428.72918,296.57399 429.02842,292.95443 431.9467,287.84472 C 433.58746,284.97185 435.4833,282.62543 436.15968,282.63046 C 438.16826,282.6454 446.32505,286.9298 449.46911,289.62132 C 452.24261,291.99562 454.88945,297.45799 454.88945,300.80746 C 454.88945,301.65674 455.78945,303.49577 456.88945,304.89419 C 459.47852,308.18566 459.44174,308.34111 455.88945,309.12132 C 453.46371,309.6541 452.89238,310.29143 452.90476,312.45078 C 452.91318,313.91957 453.33619,315.7792 453.84478,316.58328 C 454.54671,317.69303 453.8805,318.54192 451.07946,320.10688 C 448.3319,321.64197 447.04601,323.24779 446.04477,326.39425 C 445.19792,329.05551 443.53191,331.43807 441.54477,332.82972 C 439.80934,334.04509 437.80143,335.84539 437.08275,336.8304 C 436.36406,337.81541 434.62651,338.62132 433.22153,338.62132 C 431.69956,338.62132 428.71468,340.25591 425.83694,342.66528 C 421.26503,346.49311 420.95075,346.60438 419.95679,344.74714 z",name:"Kırıkkale"},72:{path:"M 830.36103,462.37132 C 829.983,460.58382 828.85968,457.77132 827.86477,456.12132 C 826.74151,454.25847 826.25802,452.07894 826.58922,450.37132 C 826.99717,448.26803 826.73506,447.62132 825.47464,447.62132 C 822.51534,447.62132 822.58243,444.73503 825.62221,441.27291 C 827.24177,439.42833 829.57169,435.71462 830.79981,433.02022 C 832.02792,430.32583 833.4505,427.33993 833.96109,426.38489 C 835.37625,423.73793 835.09027,421.68232 832.7888,417.95846 C 831.32758,415.59416 830.89048,413.75334 831.35286,411.91107 C 832.21943,408.45838 837.03652,401.67005 838.63945,401.64267 C 839.32695,401.63093 839.88945,401.21534 839.88945,400.71915 C 839.88945,400.22295 841.24538,399.34429 842.90264,398.76657 C 844.55989,398.18885 846.16501,397.0668 846.46957,396.27313 C 847.15443,394.48841 851.884,395.50978 852.9509,397.6728 C 854.83974,401.50225 856.61211,414.91145 855.63295,417.96433 C 853.74736,423.84332 852.09359,426.11391 849.46139,426.43774 C 848.04682,426.61177 846.88945,427.26987 846.88945,427.90018 C 846.88945,428.53049 845.73637,429.96562 844.32706,431.08937 C 839.61355,434.84779 842.96846,438.19202 853.38945,440.12291 L 859.38945,441.23464 L 859.38945,445.67798 L 859.38945,450.12132 L 863.29857,450.12132 C 868.74527,450.12132 868.64858,451.71084 863.03581,454.44102 C 860.41291,455.71685 856.58832,458.29851 854.5367,460.17803 C 849.07575,465.18092 847.82154,465.62132 839.03465,465.62132 L 831.04836,465.62132 L 830.36103,462.37132 z",name:"Batman"},73:{path:"M 861.60522,485.98538 C 862.19031,482.37991 862.16883,482.35332 859.04235,482.81219 C 855.52347,483.32865 855.44941,483.11093 856.51051,475.36934 C 857.10752,471.0137 857.28349,470.81393 861.05418,470.21097 C 866.57653,469.32791 868.88945,467.6243 868.88945,464.43979 C 868.88945,462.95455 869.33945,461.46124 869.88945,461.12132 C 870.43945,460.7814 870.88945,459.71811 870.88945,458.75846 C 870.88945,457.20017 871.93184,457.04149 880.63945,457.27424 C 886.00195,457.41757 891.12543,457.31533 892.02497,457.04703 C 892.9245,456.77873 894.9199,454.74187 896.45919,452.52068 C 901.01303,445.9495 907.79944,443.6544 911.28558,447.50654 C 912.22394,448.54342 914.26618,449.64667 915.8239,449.95821 C 917.38162,450.26975 919.81105,450.81452 921.22262,451.16881 C 923.51278,451.7436 924.01645,451.32935 925.90035,447.32153 C 927.83108,443.21407 928.39482,442.77262 932.49456,442.15783 C 936.02505,441.6284 937.93798,441.95049 941.49775,443.67375 C 945.11798,445.42627 947.00065,445.73158 950.9537,445.20719 C 957.13742,444.38689 957.5822,446.19617 952.33039,450.80732 C 949.63172,453.17678 948.84029,454.58965 949.05659,456.65175 C 949.21348,458.14749 948.71702,460.12416 947.95334,461.04433 C 946.76258,462.47912 946.79669,463.2036 948.19291,466.13149 C 950.20406,470.34892 949.21856,471.0746 944.28145,469.01175 C 939.81305,467.14473 933.7249,467.64301 931.29314,470.07477 C 930.10119,471.26673 928.77263,471.53848 926.51574,471.05199 C 924.79628,470.68134 923.23945,469.98281 923.05612,469.4997 C 922.30983,467.53312 918.88536,468.82217 916.75572,471.87132 C 915.50727,473.65882 914.20531,475.34632 913.86248,475.62132 C 913.51965,475.89632 912.37297,477.97313 911.3143,480.23645 C 909.63148,483.83415 908.70834,484.56208 903.97267,486.02562 C 897.96855,487.88116 896.93314,487.36376 896.90476,482.49376 C 896.88642,479.34646 895.50685,478.11474 891.0539,477.26992 C 888.09687,476.70891 887.30251,477.07915 884.0539,480.5325 C 881.33465,483.42313 878.43553,485.09769 872.81427,487.02461 C 868.64792,488.4528 864.28871,489.62132 863.12714,489.62132 C 861.25693,489.62132 861.08273,489.20515 861.60522,485.98538 z",name:"Şırnak"},74:{path:"M 365.38392,211.61237 C 365.04096,211.05745 365.04323,209.71217 365.38896,208.62287 C 365.74773,207.49247 365.34619,205.6838 364.45351,204.40931 C 363.59328,203.18116 362.88945,201.19957 362.88945,200.00577 C 362.88945,198.44078 361.84326,197.40129 359.13945,196.2798 C 357.04441,195.41082 356.19627,194.70164 357.21764,194.67285 C 358.22315,194.64451 360.73992,192.80458 362.81047,190.58411 C 365.09264,188.13671 368.11371,186.12307 370.48228,185.47062 C 372.63122,184.87867 375.51445,183.60137 376.88945,182.63217 C 378.26445,181.66297 380.96445,180.55545 382.88945,180.171 C 384.81445,179.78655 387.15718,179.25655 388.09552,178.99322 C 389.3521,178.64058 390.49082,179.87455 392.41754,183.67676 L 395.03349,188.83909 L 392.83228,191.18217 C 391.45554,192.64765 390.82894,194.28193 391.15936,195.54546 C 391.58011,197.15442 390.87447,197.92443 387.69289,199.32814 C 385.43107,200.32605 383.06219,202.32038 382.23219,203.92544 C 381.22349,205.87604 378.72898,207.6743 374.23463,209.69078 C 367.02964,212.92344 366.29304,213.08337 365.38392,211.61237 z",name:"Bartın"},75:{path:"M 893.28248,244.85161 C 892.55211,242.91666 890.69163,241.21988 887.72646,239.78446 C 885.27458,238.59753 881.98789,236.28974 880.4227,234.65603 L 877.57691,231.68566 L 880.48318,225.18023 C 882.08163,221.60224 885.30014,216.08653 887.63544,212.9231 C 892.31249,206.58746 892.35045,205.57743 888.14517,199.35944 C 885.76965,195.84695 885.70999,195.47711 887.24522,193.7807 C 888.14954,192.78143 888.88945,190.97563 888.88945,189.76783 C 888.88945,187.03575 892.47138,185.51694 897.13126,186.27313 C 900.19914,186.77098 900.4742,187.09054 900.08972,189.71015 C 899.77939,191.82455 900.14855,192.78351 901.46767,193.28971 C 902.5507,193.70531 903.43377,193.48837 903.68125,192.74592 C 903.93246,191.9923 905.5631,192.99438 907.86348,195.31601 C 909.93724,197.40893 913.71645,200.23692 916.26171,201.60043 C 919.48726,203.32839 920.88945,204.70971 920.88945,206.15931 C 920.88945,207.30317 921.52809,209.11245 922.30865,210.17993 C 923.55721,211.88744 924.10811,211.97726 926.89063,210.92698 C 931.10951,209.33453 934.88945,210.73746 934.88945,213.89577 C 934.88945,215.93587 934.48654,216.17268 931.5907,215.83461 C 928.41783,215.46419 928.23657,215.63404 926.8407,220.28541 C 925.27433,225.50492 922.15226,227.78779 914.88945,229.02422 C 909.46461,229.94776 908.83997,230.79505 907.74324,238.71784 C 907.17958,242.78975 906.64438,246.18322 906.55392,246.25887 C 906.46346,246.33452 903.68744,246.70338 900.38499,247.07856 C 894.42914,247.75518 894.37165,247.73715 893.28248,244.85161 z",name:"Ardahan"},76:{path:"M 974.38945,305.82039 C 970.53945,305.65489 966.96195,305.09239 966.43945,304.57039 C 965.91695,304.0484 963.83113,303.62132 961.80428,303.62132 C 959.77744,303.62132 955.84482,302.8868 953.06512,301.98906 C 948.39066,300.47938 947.88853,300.47938 946.37885,301.98906 C 945.48111,302.8868 943.97202,303.62132 943.02532,303.62132 C 941.61613,303.62132 941.3118,302.69558 941.34675,298.51543 L 941.38945,293.40954 L 936.88945,291.63804 C 931.74131,289.61138 930.20756,286.62132 934.31613,286.62132 C 936.35404,286.62132 936.88945,286.13002 936.88945,284.25999 C 936.88945,282.35155 937.32098,281.98043 939.13945,282.32501 C 940.37695,282.55951 943.40603,282.29655 945.87074,281.74067 C 949.44126,280.93539 950.6767,281.02379 951.94948,282.17565 C 952.82808,282.97077 954.17145,283.62132 954.93476,283.62132 C 955.69806,283.62132 958.28101,284.36925 960.67465,285.28339 C 964.74047,286.83614 965.66777,286.83326 974.77305,285.23961 C 984.28948,283.574 984.624,283.58088 988.95442,285.53117 C 993.54832,287.60012 997.8411,290.81981 997.95471,292.28161 C 997.9906,292.74345 999.2281,294.12642 1000.7047,295.35487 C 1009.1023,302.34118 1011.8871,304.95703 1011.4221,305.42209 C 1011.1359,305.70826 1010.1115,305.26355 1009.1456,304.43386 C 1008.1797,303.60416 1006.602,302.64604 1005.6395,302.3047 C 1004.677,301.96337 1003.8895,301.21997 1003.8895,300.6527 C 1003.8895,299.05239 1000.8971,299.4378 1000.2511,301.12132 C 999.91889,301.98698 998.42423,302.62132 996.71672,302.62132 C 995.08941,302.62132 992.77505,303.15425 991.57371,303.80562 C 988.49846,305.47301 982.54516,306.171 974.38945,305.82039 z",name:"Iğdır"},77:{path:"M 187.63945,257.29779 C 184.42207,254.66351 184.1699,253.62132 186.7499,253.62132 C 187.77315,253.62132 190.26814,252.49632 192.29431,251.12132 C 195.54101,248.91805 197.03422,248.62132 204.87484,248.62132 C 209.76796,248.62132 214.02342,248.21357 214.33143,247.7152 C 214.63944,247.21683 215.79339,247.04494 216.89577,247.33322 C 217.99815,247.6215 219.53264,247.33241 220.30575,246.69079 C 221.1876,245.95891 221.9363,245.8881 222.31494,246.50077 C 222.64689,247.03787 222.12446,247.74079 221.15397,248.0628 C 220.18348,248.3848 218.71445,250.1047 217.88945,251.88479 C 216.56601,254.74035 215.75044,255.22193 210.96069,255.97605 C 207.28071,256.55544 204.23935,256.44351 201.51939,255.62859 C 197.70731,254.48647 197.41235,254.55616 195.61475,257.02387 C 193.3108,260.18668 191.25408,260.25732 187.63945,257.29779 z",name:"Yalova"},78:{path:"M 376.44832,245.08952 C 375.3807,244.28201 373.4682,243.62132 372.19832,243.62132 C 368.88987,243.62132 366.29669,240.56955 365.52977,235.77346 C 364.90119,231.84253 364.68357,231.62132 361.44502,231.62132 C 358.84784,231.62132 357.8637,231.11555 357.3575,229.52066 C 356.9908,228.36529 357.18548,226.92529 357.79011,226.32066 C 358.39475,225.71602 358.88945,223.74669 358.88945,221.94437 C 358.88945,218.04859 359.85661,217.32983 372.29791,211.97954 C 378.82781,209.17141 381.68565,207.36042 383.00141,205.19682 C 385.13494,201.68851 390.67651,198.66272 396.87689,197.62057 C 402.82066,196.62154 403.61898,197.06094 404.41445,201.76929 C 404.78533,203.9645 405.71893,206.00239 406.48911,206.29794 C 408.73565,207.16001 408.12848,208.13311 404.53276,209.43334 C 399.78194,211.15126 397.73168,213.8414 397.13437,219.14076 C 396.69492,223.03956 396.9406,223.96884 398.7449,225.23262 C 403.83736,228.79952 403.81312,234.75507 398.69888,236.53791 C 396.70685,237.23234 395.07263,237.25454 393.85652,236.6037 C 391.0492,235.10126 390.16152,235.40116 389.4894,238.0791 C 388.93334,240.29463 381.23455,246.66808 379.20927,246.58952 C 378.75837,246.57202 377.51594,245.89702 376.44832,245.08952 z",name:"Karabük"},79:{path:"M 612.38578,530.28771 C 611.83377,529.6462 611.51917,528.1729 611.68667,527.01372 C 612.01371,524.75056 609.54699,523.36251 602.88945,522.06341 C 598.28065,521.16408 593.67526,518.7639 594.102,517.48367 C 594.50149,516.28521 598.24997,514.02994 602.13945,512.64794 C 604.07063,511.96176 604.88945,510.97862 604.88945,509.34607 C 604.88945,508.06746 605.39512,506.51565 606.01316,505.89761 C 607.50621,504.40456 610.48066,507.13813 611.41421,510.86129 C 611.95533,513.01937 612.98132,513.83552 616.24534,514.70432 C 621.38858,516.07332 623.49761,517.904 624.92936,522.24224 C 625.78807,524.84417 626.60169,525.62132 628.467,525.62132 C 629.96802,525.62132 630.88945,525.04303 630.88945,524.101 C 630.88945,522.82439 631.52342,522.9041 634.84424,524.59826 L 638.79903,526.61584 L 636.50226,529.09409 C 634.47325,531.28344 633.80896,531.45862 630.80407,530.59683 C 626.50512,529.36391 615.5969,529.32474 614.33945,530.53771 C 613.76103,531.09567 612.99687,530.99788 612.38578,530.28771 z",name:"Kilis"},80:{path:"M 570.02867,508.61782 C 568.73023,507.51975 566.40454,506.62132 564.86045,506.62132 C 559.72489,506.62132 558.88945,505.78399 558.88945,500.63678 C 558.88945,494.49178 557.1188,492.775 552.50262,494.44424 C 548.02486,496.06342 547.77384,495.96917 549.05791,493.15093 C 549.9241,491.24985 549.88295,490.31841 548.87933,489.10912 C 547.78861,487.79488 547.90193,487.09446 549.57174,484.82951 C 550.66986,483.34 551.86557,480.88382 552.22888,479.37132 C 552.59219,477.85882 553.18528,475.38382 553.54684,473.87132 C 553.90841,472.35882 555.41301,468.87132 556.8904,466.12132 C 559.48836,461.28551 559.73565,461.11106 564.42094,460.80885 L 569.2653,460.49639 L 566.82738,462.62311 C 565.48652,463.7928 564.83945,464.95323 565.38945,465.20183 C 569.16941,466.91038 569.30007,467.31154 568.1285,473.61134 C 566.53928,482.15694 567.58886,484.62132 572.81765,484.62132 C 575.00538,484.62132 577.90833,484.11421 579.26866,483.4944 C 583.04447,481.77403 586.10905,483.18561 589.17192,488.05596 L 591.95438,492.48044 L 586.92418,497.1856 C 583.59274,500.30178 581.54249,503.19611 580.85317,505.75604 C 580.16247,508.32112 579.23666,509.62591 578.10091,509.63497 C 577.15961,509.64248 575.48945,509.86591 574.38945,510.13148 C 573.24874,510.40687 571.37515,509.75653 570.02867,508.61782 z",name:"Osmaniye"},81:{path:"M 307.88945,255.62132 C 307.88945,255.04898 304.86699,254.62132 300.82206,254.62132 C 294.20975,254.62132 293.79555,254.49254 294.38945,252.62132 C 295.26487,249.86311 294.07717,246.62132 292.19122,246.62132 C 289.20133,246.62132 291.36155,239.78961 295.4761,236.23286 C 298.19807,233.8799 299.18518,232.21735 299.27205,229.83944 C 299.3625,227.36343 299.84847,226.60599 301.38945,226.53922 C 302.48945,226.49155 305.97313,226.12973 309.13096,225.73518 C 314.74121,225.0342 314.9393,225.09328 317.79563,228.31956 C 320.36225,231.21861 321.32378,231.62132 325.67912,231.62132 C 333.99154,231.62132 336.88945,232.53993 336.88945,235.17489 C 336.88945,236.44186 336.19927,238.16865 335.35571,239.0122 C 333.60821,240.7597 327.65948,242.60748 323.75446,242.61574 C 320.42442,242.62279 317.88945,246.29455 317.88945,251.11089 C 317.88945,254.01211 317.41482,254.85128 315.32435,255.64607 C 311.9967,256.91124 307.88945,256.89757 307.88945,255.62132 z",name:"Düzce"}},height:744.09448,width:1052.3622});
@@ -1,2 +0,0 @@
-/** Add Ukraine Map Data Points */ /** @author: DariyGRAY <https://github.com/dariygray> <dariy.gray@gmail.com> */
-jQuery.fn.vectorMap('addMap', 'ukraine_ua', {"width":1350,"height":950,"paths":{"05":{"path":"M517.4,446.91c-0.273-0.71-0.666-1.749-0.883-2.313-0.292-0.784-1.021-2.306-1.158-3.125-0.127-0.756,0.082-2.287,0.082-3.044,0-0.673-0.082-2.687-0.082-2.687l-0.638-4.485,2.725-1.758s-1.494-4.318-1.803-5.813c-0.438-2.079-0.866-6.325-0.921-8.446-0.054-2.124,0.474-8.493,0.474-8.493l5.887-5.768s0.766-0.229,0.884-0.438c0.236-0.409-0.173-1.412-0.118-1.885,0.055-0.438,0.528-1.24,0.519-1.676-0.009-0.447-0.584-1.241-0.602-1.687-0.009-0.328,0.365-1.285,0.365-1.285l5.203-2.324h1.039l0.082-1.676,3.965,0.557,4.091,1.084,4.565,2.241,2.761-4.164,3.563,1.247,1.44-2.969-3.763-1.523,0.164-7.043,0.72-3.773-2.287-4.118,3.69-2.489-1.321-3.006-4.492-0.556-1.677-3.245,3.244-1.804,0.238-5.204-3.163-1.603,4.565-6.853,2.562,0.127,0.519-1.403-3.517-1.486,0.602-4.046,2.998-1.485-0.848-3.444,0.646-0.191s0.911-0.975,1.285-1.203c0.629-0.401,2.051-0.884,2.761-1.085,0.701-0.2,2.123-0.546,2.844-0.519,0.747,0.027,2.159,0.583,2.888,0.755,1.084,0.274,3.244,0.922,4.365,1.049,1.767,0.191,5.358,0.108,7.126-0.127,1.412-0.183,4.228-0.83,5.53-1.395,0.902-0.401,3.317-2.169,3.317-2.169l6.771,3.363,1.567-0.274,0.355-5.166,1.85,0.556,1.358,2.888,4.127,0.237,2.962,4.247,1.721-5.403,4.284-0.047,1.44,3.208,4.008,0.437-0.801-5.321,3.363-0.2,4.893-6.653,7.125,7.928-2.122,4.009,2.561,4.966-4.047,5.368,4.612,4.283-2.37,3.881,0.884,1.531,14.781,0.036,3.161,0.921,1.64-0.921-1.12-2.076,4.774-1.933,1.641,1.723,0.802-0.839-0.282-3.928,5.548,2.169,2.296,3.143-2.079,2.297,6.353,15.172-6.516,4.703,6.033,8.483,3.792-0.474,0.108,4.802,1.021,1.713,3.945-0.054,0.11,2.24-0.591,0.091-2.506,0.392,3.043,8.064-3.791,3.892-3.152,1.659-0.055,6.57,2.889-0.218,1.011,4.063-5.495,3.791,1.914,4.273,4.921-2.834,1.494,0.592,0.374,7.737,9.395,9.832-3.098,2.934,6.46,5.13,0.164,2.288,1.175,2.515,1.495,0.856v3.518l1.386,4.811-2.351,1.869,0.255,2.104,0.018,0.138-1.175,0.911-2.461,3.627-3.253-1.596-2.459,2.079,0.593,2.562-8.494,11.272,2.989,2.296,0.182,2.905,0.027,0.456-3.144,3.583-2.625-2.087-2.715,2.45,4.219,4.604,0.045,6.14-2.989-0.429-0.045-4.064-6.197-1.011-0.856,4.01-5.23-0.273-1.549-3.361-11.91,2.987-4.811-6.241-2.133-0.22-7.053-7.526-3.735,5.659-4.165,0.164-2.187,7.689-5.001,0.265c-0.055-0.237-0.119-0.464-0.183-0.638-0.265-0.802-0.847-2.414-1.331-3.098-0.265-0.373-0.947-1.003-1.34-1.23-0.655-0.391-2.159-0.783-2.879-1.012-1.139-0.373-3.481-0.902-4.593-1.34-0.782-0.3-2.231-1.147-2.988-1.493-0.71-0.33-2.104-1.175-2.89-1.231-0.664-0.045-1.921,0.512-2.56,0.693-0.684,0.199-2.05,0.627-2.725,0.857-0.401,0.135-1.322,0.264-1.603,0.583-0.248,0.291-0.248,1.12-0.32,1.502-0.109,0.612,0.009,1.969-0.374,2.451-0.237,0.31-1.058,0.619-1.439,0.594-0.82-0.073-2.278-1.111-2.779-1.77-0.418-0.535-0.683-1.938-0.803-2.614-0.099-0.601,0.265-1.97-0.108-2.451-0.256-0.345-1.222-0.474-1.65-0.539-0.528-0.072-1.641,0.238-2.142,0.057-0.52-0.192-1.485-0.921-1.649-1.44-0.137-0.418,0.346-1.274,0.418-1.712,0.129-0.704,0.63-2.215,0.274-2.836-0.255-0.418-1.321-0.729-1.822-0.791-0.565-0.084-1.787,0.028-2.288,0.319-0.492,0.273-0.847,1.61-1.393,1.757-0.419,0.111-1.276-0.354-1.605-0.637-0.555-0.493-0.957-2.05-1.494-2.561-0.474-0.464-1.704-1.086-2.352-1.231-0.629-0.156-1.959,0.02-2.614,0.048-0.611,0.026-1.868,0.362-2.451,0.162-0.455-0.154-1.186-0.873-1.45-1.284-0.419-0.665-0.574-2.314-0.901-3.043-0.274-0.574-0.938-1.676-1.394-2.133-0.656-0.667-2.379-1.531-3.145-2.078-0.847-0.609-2.487-1.876-3.262-2.569-0.892-0.802-2.542-2.579-3.362-3.471-0.711-0.767-1.968-2.479-2.78-3.153-0.582-0.483-1.904-1.266-2.614-1.542-0.775-0.308-2.442-0.508-3.253-0.7-1.103-0.254-3.363-0.629-4.384-1.121-0.456-0.218-1.238-0.875-1.603-1.23-0.501-0.482-1.185-1.787-1.758-2.188-0.557-0.372-1.896-0.729-2.571-0.801-0.446-0.045-1.394-0.017-1.813,0.164-0.457,0.2-1.048,0.975-1.495,1.368-0.52-0.612-1.348-1.594-1.658-2.06-0.539-0.838-1.568-2.597-1.795-3.572-0.219-0.912,0.2-2.833,0.036-3.763-0.1-0.546-0.602-1.558-0.802-2.078-0.02-0.14-0.06-0.26-0.1-0.37","name":"Вінницька область"},"07":{"path":"M447.53,198.26c0.062,0.584,0.044,1.768-0.028,2.351-0.054,0.475-0.164,1.469-0.428,1.868-0.693,1.04-3.071,2.152-4.055,2.908-0.455,0.354-1.466,0.983-1.768,1.475-0.374,0.611-0.555,2.087-0.638,2.797-0.072,0.63-0.199,1.915-0.027,2.516,0.127,0.428,0.692,1.138,0.967,1.494,0.336,0.438,1.33,1.102,1.521,1.631,0.118,0.329,0.045,1.074-0.055,1.412-0.091,0.283-0.383,0.857-0.638,1.012-0.391,0.237-1.367,0.073-1.822,0.11-0.939,0.073-2.825,0.245-3.765,0.373-0.673,0.09-2.058,0.164-2.669,0.456-0.52,0.246-1.457,1.01-1.731,1.521-0.374,0.674-0.318,2.287-0.456,3.044-0.164,0.902-0.501,2.715-0.747,3.608-0.238,0.856-0.875,2.524-1.176,3.362-0.218,0.61-0.766,1.796-0.912,2.425-0.081,0.364-0.091,1.102-0.127,1.467-0.054,0.483-0.155,1.457-0.272,1.922-0.083,0.365-0.137,1.259-0.474,1.421-0.31,0.146-0.976-0.31-1.258-0.482-0.246-0.146-0.729-0.493-0.855-0.747-0.21-0.401-0.019-1.395-0.183-1.814-0.164-0.4-0.656-1.175-1.048-1.367-0.355-0.173-1.204,0-1.604,0-0.519,0-1.658,0.255-2.104-0.027-0.383-0.236-0.674-1.194-0.803-1.631-0.108-0.383,0-1.23-0.154-1.595-0.183-0.419-0.83-1.084-1.185-1.368-0.473-0.382-1.613-0.856-2.16-1.147-0.519-0.273-1.503-1.204-2.077-1.094-0.21,0.045-0.474,0.447-0.565,0.638-0.173,0.393-0.118,1.275-0.237,1.686-0.109,0.374-0.373,1.158-0.656,1.431-0.41,0.383-1.53,0.691-2.086,0.802-0.757,0.146-2.306,0.045-3.081,0.036-0.982,0-2.942-0.073-3.926-0.082-0.72,0-2.188-0.173-2.88,0.046-0.611,0.182-1.741,0.893-2.124,1.403-0.383,0.501-0.538,1.813-0.765,2.396-0.127,0.337-0.273,1.148-0.601,1.285-0.384,0.164-1.176-0.509-1.604-0.564-0.475-0.055-1.532-0.091-1.915,0.2-0.373,0.282-0.601,1.275-0.683,1.731-0.11,0.564,0.108,1.75,0,2.314-0.083,0.456-0.411,1.349-0.684,1.722-0.209,0.292-0.783,0.757-1.121,0.884-0.466,0.173-1.514,0.209-2.005,0.082-0.666-0.173-1.75-1.121-2.359-1.44-0.447-0.237-1.35-0.702-1.842-0.802-0.656-0.137-2.077-0.254-2.687,0.037-0.42,0.2-1.112,0.984-1.194,1.44-0.091,0.491,0.438,1.448,0.676,1.885,0.29,0.52,1.21,1.35,1.483,1.887,0.247,0.464,0.584,1.504,0.602,2.041,0.019,0.52-0.319,1.531-0.447,2.041-0.163,0.702-0.728,2.078-0.756,2.797-0.018,0.557,0.146,1.705,0.437,2.168,0.283,0.438,1.331,0.857,1.686,1.241,0.283,0.309,0.793,1.029,0.884,1.439,0.064,0.301,0.019,0.965-0.164,1.204-0.164,0.217-0.729,0.427-1.002,0.436-0.273,0.019-0.766-0.318-1.039-0.318-0.209,0-0.802,0.245-0.802,0.245l1.084,3.363-3.891,1.002v3.9l-3.281-0.703-0.484-4.802s-0.318-1.194-0.601-1.484c-0.282-0.283-1.111-0.475-1.476-0.639-0.538-0.236-1.604-0.711-2.123-0.957-0.328-0.154-0.938-0.573-1.285-0.646-0.483-0.101-1.476,0.037-1.959,0.118-0.619,0.11-1.786,0.602-2.406,0.683-0.336,0.045-1.038-0.091-1.366,0-0.492,0.137-1.294,0.82-1.758,1.048-0.301,0.137-0.912,0.429-1.24,0.474-1.504,0.209-4.693,0.091-6.05-0.602-0.32-0.164-0.848-0.738-0.958-1.076-0.127-0.382,0.155-1.202,0.155-1.604,0.01-0.49-0.155-1.967-0.155-1.967l-4.572-2.598-3.163-1.402s-0.483-0.965-0.52-1.322c-0.063-0.656,0.392-1.922,0.483-2.569,0.109-0.784,0.381-2.37,0.319-3.162-0.027-0.393-0.155-1.211-0.401-1.522-0.201-0.246-0.92-0.347-1.121-0.601-0.456-0.575-0.501-2.151-0.757-2.844-0.127-0.319-0.346-1.012-0.61-1.239-0.546-0.474-2.059-0.639-2.761-0.838-0.792-0.238-2.442-0.557-3.199-0.884-0.4-0.174-1.194-0.592-1.485-0.92-0.347-0.391-0.793-1.376-0.875-1.886-0.055-0.246,0.163-0.756,0.072-1.003-0.155-0.427-0.938-1.001-1.276-1.321-0.3-0.273-0.838-1.011-1.248-1.039-0.555-0.026-1.438,0.884-1.876,1.24-0.402,0.33-1.085,1.084-1.45,1.449-0.319,0.319-0.819,1.294-1.276,1.276-0.355-0.01-0.674-0.829-0.92-1.077-1.713-1.73-5.495-4.783-7.335-6.367-0.939-0.813-2.908-2.343-3.763-3.245-0.448-0.484-1.331-1.485-1.605-2.087-0.337-0.766-0.364-2.498-0.637-3.28-0.146-0.419-0.538-1.204-0.912-1.896,0-0.593-0.063-1.468-0.208-1.915-0.183-0.546-0.966-1.44-1.203-1.958-0.264-0.584-0.692-1.814-0.757-2.442-0.064-0.658,0-2.015,0.274-2.607,0.264-0.565,1.211-1.458,1.721-1.805,0.393-0.254,1.286-0.528,1.722-0.683,0.885-0.301,2.644-0.948,3.564-1.075,0.765-0.11,2.341,0.228,3.089,0.036,0.355-0.091,1.157-0.374,1.284-0.72,0.238-0.665-0.61-2.049-1.002-2.643-0.511-0.765-1.969-1.949-2.688-2.523-0.775-0.619-2.542-1.577-3.28-2.241-0.765-0.693-2.104-2.288-2.642-3.162-0.393-0.647-0.912-2.06-1.167-2.77-0.292-0.802-0.839-2.433-0.993-3.281-0.183-0.957-0.01-2.953-0.284-3.882-0.173-0.592-0.893-1.612-1.167-2.168-0.4-0.802-1.222-2.416-1.476-3.281-0.31-1.039-0.474-3.225-0.684-4.283-0.245-1.211-0.647-3.69-1.167-4.812-0.537-1.185-2.195-3.253-3.043-4.246-0.748-0.875-2.522-2.37-3.28-3.245-0.62-0.719-1.851-2.215-2.242-3.08-0.264-0.593-0.61-1.878-0.564-2.524,0.063-0.984,0.829-2.861,1.367-3.682,0.483-0.756,2.014-1.813,2.561-2.524,0.309-0.409,0.865-1.303,1.002-1.804,0.19-0.711,0.2-2.204,0.036-2.925-0.164-0.748-1.066-2.042-1.321-2.762-0.128-0.382-0.292-1.165-0.355-1.566-0.128-0.711-0.21-2.168-0.328-2.88-0.064-0.437-0.555-1.33-0.356-1.722,0.192-0.374,1.203-0.418,1.523-0.684,0.354-0.291,0.91-1.078,1.038-1.519,0.182-0.604,0.018-1.896-0.036-2.524-0.074-0.879-0.483-2.607-0.565-3.483-0.064-0.687-0.282-2.106-0.073-2.763,0.165-0.525,0.902-1.404,1.321-1.762,0.51-0.45,1.759-1.087,2.396-1.322,0.428-0.156,1.321-0.393,1.769-0.363,0.573,0.04,1.695,0.429,2.16,0.763,0.41,0.29,0.856,1.25,1.238,1.561,0.356,0.288,1.212,0.655,1.649,0.801,0.437,0.15,1.404,0.185,1.841,0.361,0.73,0.296,2.05,1.197,2.643,1.722,0.438,0.39,1.23,1.274,1.486,1.802,0.172,0.389,0,1.398,0.31,1.681,0.437,0.386,1.786,0.377,2.333,0.162,0.729-0.293,1.531-1.795,2.124-2.321,0.546-0.497,1.694-1.442,2.359-1.764,0.803-0.391,2.671-0.476,3.444-0.921,0.684-0.396,1.75-1.616,2.242-2.244,0.265-0.34,0.52-1.248,0.884-1.481,0.757-0.493,2.716-0.198,3.6-0.4,0.938-0.215,2.789-0.833,3.646-1.282,0.892-0.468,2.587-1.608,3.244-2.363,0.637-0.728,1.503-2.5,1.839-3.405,0.393-1.027,0.72-3.224,1.002-4.288,0.192-0.684,0.539-2.078,0.848-2.719,0.301-0.632,0.975-1.943,1.559-2.325,0.975-0.631,3.408-0.708,4.564-0.801,1.358-0.107,4.092-0.025,5.45,0.081,1.057,0.083,3.143,0.605,4.2,0.6,0.739-0.002,2.187-0.471,2.925-0.44,0.838,0.034,2.415,0.662,3.245,0.762,1.958,0.237,5.923,0.08,7.891,0.08,1.913,0,5.741,0.023,7.655-0.08,1.951-0.104,5.85-0.362,7.763-0.762,1.176-0.245,3.417-1.131,4.565-1.481,0.884-0.269,2.624-0.876,3.526-1.002,0.519-0.071,1.567-0.071,2.087,0,0.556,0.076,1.676,0.319,2.16,0.602,0.591,0.35,1.375,1.552,1.922,1.962,0.939,0.695,2.999,1.875,4.128,2.162,0.656,0.169,2.042,0,2.725,0.041,1.431,0.087,4.283,0.528,5.723,0.603,0.793,0.039,1.905,0.044,3.081,0.033,0.082,0.698,0.336,1.68,0.619,2.143,0.273,0.453,1.121,1.152,1.576,1.415,0.346,0.195,1.131,0.415,1.522,0.482,0.747,0.125,2.288,0.158,3.044,0.079,0.592-0.063,1.859-0.939,2.323-0.561,0.301,0.247,0.064,1.182-0.056,1.547-0.155,0.469-0.738,1.323-1.12,1.631-0.41,0.325-1.531,0.458-1.95,0.774-0.383,0.29-1.003,1.072-1.176,1.521-0.146,0.38-0.027,1.233-0.137,1.629-0.154,0.577-0.847,1.59-1.038,2.161-0.138,0.409-0.511,1.298-0.32,1.684,0.109,0.214,0.638,0.322,0.856,0.427,0.2,0.101,0.675,0.232,0.83,0.401,0.291,0.328,0.527,1.22,0.609,1.655,0.128,0.677,0.192,2.077,0.055,2.75-0.146,0.683-0.838,1.923-1.176,2.538-0.273,0.505-0.975,1.433-1.23,1.949-0.201,0.402-0.501,1.251-0.637,1.682-0.118,0.372-0.247,1.158-0.402,1.522-0.172,0.392-0.619,1.121-0.911,1.44-0.3,0.327-0.984,0.957-1.412,1.094-0.319,0.108-1.03,0.045-1.368-0.027-0.354-0.083-0.993-0.647-1.357-0.584-0.173,0.026-0.475,0.311-0.51,0.482-0.073,0.419,0.574,1.158,0.774,1.541,0.4,0.747,1.367,2.141,1.685,2.916,0.22,0.537,0.674,1.686,0.583,2.268-0.045,0.337-0.519,0.885-0.72,1.176-0.136,0.209-0.51,0.556-0.583,0.802-0.146,0.482,0.045,1.502,0.11,1.996,0.044,0.447,0.063,1.375,0.318,1.74,0.218,0.318,1.03,0.529,1.303,0.802,0.237,0.227,0.574,0.793,0.692,1.094,0.155,0.382,0.282,1.212,0.328,1.631,0.063,0.693,0.037,2.077-0.036,2.779-0.037,0.411-0.401,1.239-0.319,1.65,0.109,0.501,0.865,1.256,1.158,1.686,0.254,0.391,0.792,1.166,1.038,1.576,0.21,0.355,0.428,1.239,0.775,1.467,0.236,0.155,0.865,0.146,1.147,0.082,0.356-0.09,0.921-0.665,1.277-0.756,0.282-0.064,0.893-0.055,1.157,0.064,0.328,0.146,0.766,0.784,1.039,1.038,0.209,0.192,0.592,0.793,0.875,0.748,0.329-0.055,0.484-0.875,0.675-1.148,0.3-0.438,0.912-1.385,1.385-1.631,0.337-0.174,1.175-0.328,1.522-0.165,0.191,0.102,0.373,0.52,0.428,0.73,0.127,0.482-0.046,1.493-0.055,1.995-0.008,0.939-0.155,2.826,0.028,3.746,0.091,0.456,0.474,1.321,0.692,1.73,0.393,0.711,1.394,2.006,1.896,2.644,0.465,0.583,1.577,1.612,1.977,2.242,0.33,0.529,0.822,1.695,0.958,2.296,0.128,0.547,0.072,1.668,0.11,2.215,0.027,0.374,0,1.166,0.164,1.494,0.237,0.492,1.212,1.094,1.576,1.495,0.675,0.765,1.887,2.414,2.451,3.263,0.201,0.29,0.593,0.874,0.721,1.202,0.2,0.475,0.583,1.494,0.483,2.004-0.073,0.375-0.665,0.948-0.901,1.249-0.302,0.375-0.894,1.121-1.258,1.421-0.355,0.293-1.121,0.903-1.577,0.957-0.347,0.046-0.993-0.346-1.34-0.4-0.373-0.055-1.166-0.137-1.512,0-0.219,0.083-0.575,0.392-0.675,0.592-0.191,0.365-0.172,1.222-0.182,1.622-0.018,0.502-0.109,1.55,0.127,1.978,0.22,0.392,1.048,0.875,1.45,1.066,0.547,0.283,1.741,0.601,2.342,0.702,0.445,0.063,1.357-0.065,1.795,0.055,0.546,0.146,1.649,0.609,1.995,1.065,0.39,0.46,0.5,1.62,0.55,2.18","name":"Волинська область"},"12":{"path":"M885.82,555.97c-0.558-0.117-1.141-0.265-1.504-0.365-0.447-0.117-1.731-0.592-1.731-0.592l-1.678-6.133-0.518-6.807,5.767-4.41-1.321-6.123,1.796-0.883-0.035-1.923-2.344-3.737s0.53-0.411,0.566-0.609c0.036-0.247-0.22-0.731-0.401-0.885-0.201-0.183-0.775-0.282-1.038-0.319-0.237-0.036-0.966,0-0.966,0l-0.613-7.965,0.837-3.807c0.074,0.018,0.13,0.026,0.195,0.018,0.272-0.018,0.672-0.502,0.919-0.637,0.694-0.395,2.196-0.96,2.925-1.287,0.768-0.336,2.271-1.049,3.043-1.357,0.794-0.318,2.416-0.885,3.243-1.121,0.356-0.099,1.15-0.089,1.442-0.319,0.273-0.228,0.527-0.938,0.601-1.284,0.056-0.265,0.01-0.811-0.045-1.076-0.083-0.475-0.457-1.358-0.602-1.804-0.202-0.664-0.721-1.985-0.758-2.688-0.02-0.383,0.037-1.222,0.282-1.521,0.248-0.299,1.057-0.575,1.442-0.556,0.264,0.008,0.782,0.282,0.964,0.473,0.357,0.401,0.592,1.494,0.758,2.004,0.182,0.602,0.346,1.869,0.602,2.443,0.154,0.347,0.464,1.222,0.847,1.24,0.301,0.017,0.603-0.712,0.792-0.959,0.199-0.254,0.574-0.782,0.765-1.039,0.211-0.299,0.758-0.848,0.84-1.201,0.092-0.39-0.347-1.213-0.236-1.604,0.09-0.337,0.592-0.874,0.874-1.083,0.31-0.221,1.029-0.484,1.403-0.559,0.711-0.135,2.168,0.02,2.887,0,0.539-0.017,1.733,0.212,2.162-0.118,0.235-0.189,0.19-0.91,0.365-1.163,0.228-0.355,0.9-0.922,1.273-1.122,0.476-0.266,1.568-0.429,2.088-0.603,0.52-0.173,1.867-0.246,2.041-0.757,0.109-0.347-0.838-0.846-0.802-1.202,0.037-0.427,0.802-1.064,1.202-1.239,0.311-0.146,1.066,0.119,1.358-0.044,0.42-0.238,0.957-1.131,1.04-1.604,0.117-0.666-0.511-1.969-0.594-2.642-0.109-0.821,0.117-2.527-0.128-3.327-0.117-0.401-0.557-1.165-0.874-1.44-0.248-0.199-0.901-0.347-1.203-0.436-0.174-0.057-0.546-0.057-0.683-0.164-0.319-0.266-0.631-1.103-0.639-1.522-0.009-0.455,0.475-1.285,0.639-1.723,0.208-0.547,0.774-1.612,0.839-2.196,0.19-1.694-0.729-5.048-0.958-6.735-0.128-0.955-0.411-2.879-0.482-3.843-0.037-0.557-0.192-1.705-0.037-2.243,0.146-0.52,0.855-1.358,1.157-1.804,0.191-0.283,0.737-0.773,0.801-1.12,0.074-0.348-0.381-1.012-0.362-1.358,0.027-0.328,0.28-0.984,0.527-1.203,0.229-0.209,0.883-0.265,1.158-0.4,0.263-0.137,0.684-0.603,0.964-0.684,0.355-0.102,1.141-0.066,1.486,0.081,0.61,0.264,1.96,1.841,1.96,1.841l6.89-4.529,6.442-6.562-0.885-0.765-1.915-0.081-4.69-4.483-6.524,0.246-1.004-5.213s0.84-0.911,1.204-1.085c0.254-0.109,0.847-0.054,1.12-0.118s0.819-0.218,1.039-0.4c0.254-0.211,0.418-0.93,0.683-1.122,0.339-0.228,1.212-0.19,1.602-0.318,0.412-0.127,1.169-0.52,1.559-0.684,0.221-0.082,0.667-0.41,0.885-0.32,0.384,0.165,0.612,1.113,0.685,1.522,0.083,0.511-0.354,1.568-0.165,2.042,0.147,0.346,1.122,0.967,1.122,0.967l8.894,0.154,0.757-1.24-1.796-6.843h3.08l0.073-2.789c0.602,0.393,1.186,0.785,1.558,1.077,0.803,0.628,2.251,2.077,2.988,2.778,0.785,0.738,2.215,2.37,3.101,2.99,0.755,0.527,2.486,1.192,3.309,1.603,0.7,0.339,2.058,1.103,2.777,1.386,0.828,0.319,2.597,0.639,3.418,0.965,0.645,0.256,1.929,0.83,2.459,1.276,0.748,0.646,1.696,2.46,2.342,3.208,0.666,0.756,2.158,2.096,2.889,2.779,0.609,0.565,1.877,1.648,2.459,2.241,0.674,0.684,1.842,2.241,2.562,2.879,0.659,0.592,2.133,1.576,2.881,2.033,0.7,0.418,2.34,0.893,2.888,1.494,0.684,0.766,0.775,3.107,1.495,3.846,0.482,0.492,1.878,0.955,2.56,1.065,0.767,0.126,2.415,0.146,3.098-0.209,0.456-0.218,1.276-1.039,1.185-1.495-0.092-0.509-1.483-0.583-1.931-0.856-0.41-0.253-1.203-0.838-1.494-1.23-0.429-0.583-0.775-2.031-1.123-2.67-0.416-0.765-1.42-2.205-1.976-2.878-0.958-1.185-3.18-3.273-4.22-4.383-1.203-1.286-3.344-4.111-4.702-5.231-0.618-0.521-1.849-1.094-2.869-1.659-0.057-0.856-0.147-1.959-0.057-2.579,0.103-0.583,0.229-2.096,0.803-2.242,0.338-0.082,0.712,0.756,1.003,0.922,0.319,0.181,1.113,0.609,1.402,0.4,0.603-0.418,0.12-2.196,0.202-2.925s0.465-2.177,0.445-2.923c-0.009-0.229-0.082-0.712-0.208-0.921-0.229-0.393-1.102-0.819-1.359-1.193-0.309-0.465-0.619-1.577-0.719-2.124-0.191-1.002-0.246-3.033-0.201-4.045,0.026-0.691,0.11-2.086,0.365-2.725,0.181-0.491,1.021-1.229,1.192-1.722,0.475-1.33-0.52-4.52,0.364-5.604,0.282-0.355,1.386-0.191,1.724-0.484,1.039-0.892,0.976-4.473,2.243-5.011,2.021-0.855,6.186,3.654,8.291,3.008,0.801-0.247,1.376-2.123,2.005-2.725,0.364-0.419,1.274-1.111,1.821-1.439,0.64-0.464,2.098-1.249,2.825-1.686,0.455-0.311,1.457-0.975,1.914-1.276,0.729-0.428,2.277-1.111,3.007-1.603,0.273-0.265,0.82-0.976,1.274-1.203,0.548-0.329,1.823-0.529,2.368-0.801,0.547-0.273,1.46-1.076,2.007-1.367,0.546-0.256,1.55-0.784,2.097-0.793,0.546-0.008,1.548,0.355,1.911,0.683,0.365,0.256,0.456,1.34,0.913,1.395,0.364,0.055,0.729-0.765,1.003-1.002,0.271-0.255,0.909-0.849,1.272-0.957,0.458-0.136,1.459,0.009,1.918,0.2,0.453,0.191,1,1.066,1.456,1.276,0.548,0.282,1.823,0.638,2.461,0.529,0.364-0.063,0.909-0.546,1.275-0.775,0-0.027,0.09-0.054,0.09-0.073,0.366-0.2,1.187-0.593,1.64-0.675,0.275-0.055,0.822-0.1,1.004,0,0.364,0.128,0.819,0.903,1.184,0.994,0.365,0.119,1.186-0.282,1.643-0.355,0.453-0.072,1.274-0.291,1.638-0.236,0.638,0.063,1.915,0.547,2.37,0.911,0.547,0.355,1.276,1.294,1.548,1.849,0.184,0.583-0.271,1.896,0,2.479,0.094,0.41,0.73,1.085,1.095,1.322,0.456,0.292,1.549,0.428,2.003,0.601,0.731,0.247,2.189,0.684,2.826,1.085,0.64,0.408,1.642,1.584,2.187,2.123,0.639,0.583,1.734,1.876,2.461,2.36,1.002,0.674,3.281,1.394,4.374,2.004,0.729,0.465,2.095,1.75,2.824,2.206,0.457,0.246,1.366,0.684,1.914,0.755,0.912,0.137,2.644-0.29,3.553-0.318,1.004-0.027,2.917,0.008,3.919,0.119,1.005,0.118,2.915,0.602,3.827,0.801,0.911,0.192,2.734,0.53,3.646,0.766,0.638,0.165,1.913,0.793,2.553,0.803,1.184,0.009,3.279-0.92,4.373-1.33,1.458-0.557,4.374-1.805,5.648-2.635,0.821-0.5,2.096-1.94,2.918-2.37,0.818-0.409,2.641-0.719,3.463-0.956,0.271-0.073,0.819-0.474,1.002-0.283,0.182,0.192-0.183,0.784-0.273,1.04-0.184,0.456-0.729,1.303-0.821,1.767-0.183,0.62-0.455,1.915-0.363,2.561,0,0.373,0.273,1.092,0.547,1.403,0.272,0.41,1.185,0.92,1.548,1.276,0.365,0.41,1.275,1.248,1.459,1.804,0.09,0.392,0,1.249-0.184,1.604-0.091,0.183-0.547,0.337-0.637,0.52-0.182,0.282-0.182,0.984-0.091,1.284,0.091,0.301,0.637,0.72,0.911,0.958,0.637,0.691,2.55,2.723,2.55,2.723l-0.181,1.968,4.646,2.599,0.273,3.289s0.183,2.241,0.456,2.924c0.183,0.383,1.096,1.312,1.096,1.312l3.096,2.77s1.369,1.205,1.914,1.44c0.638,0.291,2.28,0.037,2.824,0.519,0.639,0.52,1.094,2.214,1.004,3.008,0,0.374-0.731,0.937-0.731,1.32,0,0.593,1.096,1.422,1.276,1.96,0.274,0.492,0.547,1.548,0.547,2.086,0,0.52-0.453,1.577-0.272,2.078,0.093,0.401,0.73,1.103,1.094,1.238,0.454,0.138,1.64-0.236,1.64-0.236l10.389-11.491,3.28,2.561,4.009,2.041,2.915-3.163,3.191,1.212,0.364,0.145,5.74,0.648-0.092,3.408s0.548,0.428,0.82,0.511c0.548,0.218,1.912,0.063,2.552,0.328,0.455,0.193,1.003,1.039,1.367,1.24,0.365,0.164,1.183,0.027,1.549,0.237,0.092,0.082,0.365,0.373,0.365,0.52-0.092,0.419-0.731,1.029-1.003,1.366-0.272,0.355-0.911,0.994-1,1.401-0.183,0.458,0,1.533-0.183,1.961-0.185,0.227-0.73,0.437-0.821,0.637-0.365,0.365-0.73,1.256-0.914,1.687-0.27,0.546-0.91,2.24-0.91,2.24l0.094,10.134-2.19,1.239,0.64,2.442,8.657,0.364,1.549,9.814-2.733,1.44,0.728,6.569,1.185,3.362-5.831,5.167s-1.366-0.574-1.731-0.757c-1.275-0.528-3.736-1.657-5.01-2.004-1.277-0.348-3.829-1.021-5.106-0.765-1.001,0.199-2.733,1.396-3.461,2.041-0.547,0.509-1.641,1.703-1.912,2.405-0.548,1.048-0.821,4.527-0.821,4.527l-0.092,3.326s4.558-0.565,5.376,0.52c0.458,0.656-0.728,3.199-0.728,3.199l-4.011-0.2,0.093,2.853,3.279,4.319,0.456,0.244-6.742,0.055-0.366,2.051-11.116-0.347-1.274,2.726-1.734,0.318v-2.806l-14.761,0.483-1.003-4.321,3.646,0.211,2.097-4.593-2.553-3.309-5.377-3.471,2.28-1.658-1.002-4.164-7.2,2.833-0.912-4.063-7.836,1.286-0.273-3.319-5.285,1.287-1.732-4.594-11.298,7.582-4.829-3.418-8.839-3.479c0.089-0.356,0.183-0.759,0.183-1.002-0.094-0.548-0.91-1.524-1.459-1.688-0.365-0.128-1.274,0.363-1.639,0.482-0.458,0.118-1.277,0.483-1.733,0.483-0.636-0.009-2.095-0.31-2.551-0.803-0.365-0.362-0.272-1.439-0.365-1.92-0.182-0.94-0.638-2.818-0.548-3.764,0-0.566,0.548-1.605,0.641-2.17,0-0.611-0.274-1.888-0.641-2.396-0.363-0.529-1.639-0.948-2.004-1.449-0.456-0.52-0.909-1.822-1.003-2.479-0.183-1.021,0.184-3.152-0.09-4.163-0.183-0.975-1.368-2.67-1.731-3.61-0.365-0.81-0.91-2.487-1.002-3.361,0-0.83,0.271-2.479,0.546-3.282,0.183-0.755,0.819-2.169,1.094-2.888,0.273-0.729,0.729-2.287,1.277-2.88,0.453-0.526,1.821-1.002,2.368-1.438,0.639-0.503,1.729-1.631,2.097-2.325,0.272-0.509,0.637-1.694,0.454-2.241-0.089-0.411-0.729-1.093-1.184-1.212-0.547-0.154-1.824,0.264-2.278,0.564-0.638,0.365-1.641,1.458-2.006,2.087-0.363,0.574-0.363,2.042-0.729,2.562-0.364,0.399-1.548,0.528-1.822,0.957-0.364,0.472-0.183,1.684-0.274,2.241-0.09,0.564-0.09,1.758-0.363,2.25-0.273,0.374-1.003,0.975-1.367,1.121-0.546,0.182-1.822,0.182-2.278-0.081-0.456-0.238-0.817-1.258-1.184-1.605-0.547-0.455-1.642-1.148-2.278-1.44-0.638-0.3-1.912-0.737-2.643-0.884-0.729-0.163-2.279-0.191-3.007-0.318-0.729-0.119-2.006-0.61-2.733-0.638-0.821-0.038-2.462,0.218-3.19,0.473-0.455,0.165-1.64,0.492-1.823,0.966-0.09,0.356,0.365,1.139,0.64,1.358,0.546,0.328,1.73,0.217,2.278,0.245,0.454,0.02,1.365-0.027,1.823,0,0.817,0.037,2.549-0.027,3.278,0.319,0.547,0.255,1.276,1.431,1.824,1.687,0.454,0.218,1.639,0.017,2.094,0.154,0.547,0.146,1.643,0.666,2.096,0.965,0.549,0.338,1.642,1.094,2.096,1.604,0.457,0.483,1.003,1.622,1.186,2.242,0.183,0.71-0.092,2.269,0.183,2.961,0.273,0.566,1.365,1.276,1.64,1.841,0.272,0.811,0,2.679,0.184,3.526,0.272,0.747,1.184,2.05,1.547,2.716,0.549,0.92,2.004,2.589,2.28,3.609,0.181,0.855-0.276,2.649-0.093,3.523,0.093,0.822,1.093,2.298,1.093,3.128,0,0.802-0.272,2.476-0.819,3.124-0.364,0.52-1.548,1.186-2.187,1.359-0.638,0.183-2.005-0.165-2.644,0-0.637,0.162-1.912,0.767-2.369,1.284-0.546,0.667-1.002,2.424-1.002,3.28,0,0.3,0,0.703,0.09,1.121l-7.653,1.632-2.278-5.286-2.004,0.319,0.455,8.648s0.184,1.75,0.456,2.268c0.091,0.338,0.638,0.829,0.913,1.102,0.272,0.284,0.91,0.769,1.001,1.123,0.182,0.454-0.182,1.513,0,1.977,0.182,0.501,1.184,1.121,1.457,1.621,0.184,0.502,0.184,1.622,0.091,2.17,0,0.31-0.364,1.204-0.364,1.204l-5.375-2.06-0.092,8.783s0.456,0.773,0.729,0.957c0.366,0.291,1.185,0.747,1.641,0.747,0.457,0.008,1.274-0.654,1.732-0.721,0.272-0.034,0.911,0.066,1.186,0.164,0.637,0.229,1.911,0.866,2.367,1.413,0.273,0.365,0.547,1.32,0.454,1.769-0.088,0.263-0.546,0.618-0.728,0.793-0.183,0.173-0.729,0.336-0.911,0.563-0.273,0.519-0.091,1.805-0.091,2.405,0,0.475,0.091,1.467,0.364,1.896,0.092,0.31,0.638,0.783,1.002,0.956,0.363,0.235,1.367,0.235,1.731,0.565,0.455,0.456,0.729,1.824,0.82,2.45,0.183,0.676,0.457,2.06,0.364,2.726-0.091,0.346-0.455,0.993-0.819,1.204-0.273,0.235-1.185,0.207-1.458,0.427-0.275,0.146-0.639,0.545-0.729,0.802,0,0.318,0.273,0.966,0.454,1.284,0.093,0.467,0.549,1.377,0.549,1.869,0,0.666-0.273,1.985-0.549,2.615-0.181,0.573-1.092,1.532-1.092,2.131-0.092,0.456,0.182,1.396,0.364,1.759,0.364,0.466,1.457,0.938,1.914,1.231,0.364,0.199,1.094,0.619,1.641,0.893-0.182,0.064-0.274,0.117-0.456,0.155-1.276,0.328-3.918,0.155-5.192,0-0.73-0.1-2.189-0.629-2.918-0.748-0.82-0.117-2.277-0.181-3.007-0.218-1.002-0.038-2.915,0.117-3.827-0.055-1.094-0.191-3.1-0.893-4.01-1.438-0.638-0.329-1.55-1.26-2.004-1.716-0.364-0.381-0.911-1.384-1.458-1.593-0.364-0.174-1.368-0.137-1.732,0.046-0.455,0.19-0.818,1.047-1.184,1.283-0.274,0.211-1.003,0.447-1.367,0.483-0.638,0.073-1.913-0.238-2.644-0.317-0.682-0.101-2.114-0.512-2.842-0.428-0.492,0.054-1.512,0.345-1.869,0.691-0.281,0.281-0.409,1.139-0.581,1.493-0.265,0.53-0.776,1.613-1.186,2.032-0.256,0.274-0.901,0.738-1.275,0.802-0.503,0.082-1.514-0.293-1.979-0.482-0.574-0.236-1.559-1.059-2.143-1.285-0.581-0.218-1.829-0.501-2.449-0.474-0.484,0.019-1.468,0.256-1.869,0.528-0.399,0.273-0.993,1.103-1.174,1.55-0.164,0.409,0.073,1.421-0.219,1.767-0.176,0.21-0.786,0.274-1.059,0.321-0.419,0.054-1.275-0.147-1.655,0-0.293,0.098-0.685,0.665-0.969,0.8-0.291,0.136-0.958,0.218-1.275,0.21-0.41-0.01-1.266-0.101-1.604-0.317-0.529-0.338-1.057-1.578-1.506-2.033-0.499-0.512-1.602-1.531-2.285-1.759-0.521-0.175-1.659-0.055-2.197,0.054-0.345,0.074-1.073,0.275-1.331,0.526-0.198,0.204-0.198,0.868-0.427,1.024-0.264,0.181-0.957,0.055-1.286,0.055-0.299,0-0.957-0.211-1.22-0.055-0.336,0.198-0.437,1.094-0.69,1.384-0.186,0.2-0.648,0.629-0.913,0.584-0.319-0.037-0.556-0.848-0.856-0.958-0.263-0.09-0.9,0.027-1.119,0.219-0.339,0.292-0.521,1.258-0.586,1.705-0.108,0.7-0.055,2.142,0.101,2.833,0.074,0.318,0.375,0.848,0.548,1.239l-1.678-1.269-7.727,2.646-14.542,0.602-1.04-1.887s0.475-1.039,0.601-1.403c0.129-0.393,0.338-1.192,0.393-1.604,0.056-0.375,0.083-1.14,0.047-1.523-0.029-0.282-0.339-0.847-0.248-1.119,0.111-0.311,0.812-0.573,1.004-0.839,0.181-0.236,0.481-0.783,0.481-1.085,0.01-0.327-0.346-0.946-0.519-1.238-0.146-0.246-0.456-0.794-0.719-0.92-0.339-0.156-1.122-0.045-1.486,0.046-0.492,0.108-1.377,0.628-1.841,0.836-0.337,0.147-1.012,0.494-1.358,0.604-0.402,0.116-1.649,0.28-1.649,0.28l0.684,4.724-0.875,0.801-9.222,0.199s-0.673,0.548-0.793,0.802c-0.108,0.238,0.02,0.802-0.081,1.039-0.127,0.291-0.549,0.838-0.838,0.967-0.283,0.119-0.912,0.027-1.202-0.046-0.632-0.146-1.778-0.774-2.372-1.04-0.474-0.209-1.421-0.617-1.876-0.883-0.4-0.229-1.157-0.757-1.521-1.038-0.711-0.549-2.124-1.669-2.688-2.361-0.229-0.292-0.438-1.039-0.721-1.285-0.546-0.482-1.995-0.955-2.725-1.084-0.792-0.135-2.433,0.19-3.235,0.129-0.32,0-0.68-0.07-1.06-0.14","name":"Дніпропетровська область"},"14":{"path":"M1120.9,521.29l-0.456-0.244-3.279-4.319-0.093-2.853,4.011,0.2s1.186-2.543,0.728-3.199c-0.818-1.085-5.376-0.52-5.376-0.52l0.092-3.326s0.273-3.479,0.821-4.527c0.271-0.702,1.365-1.896,1.912-2.405,0.728-0.646,2.46-1.842,3.461-2.041,1.277-0.256,3.829,0.417,5.106,0.765,1.273,0.347,3.734,1.476,5.01,2.004,0.365,0.183,1.731,0.757,1.731,0.757l5.831-5.167-1.185-3.362-0.728-6.569,2.733-1.44-1.549-9.814-8.657-0.364-0.64-2.442,2.19-1.239-0.094-10.134s0.641-1.693,0.91-2.24c0.184-0.431,0.549-1.322,0.914-1.687,0.091-0.2,0.637-0.401,0.821-0.637,0.183-0.429,0-1.504,0.183-1.961,0.089-0.407,0.728-1.046,1-1.401,0.271-0.337,0.911-0.947,0.911-1.366,0.092-0.146-0.182-0.43-0.273-0.52-0.366-0.21-1.184-0.073-1.549-0.237-0.364-0.202-0.912-1.047-1.367-1.24-0.64-0.265-2.004-0.11-2.552-0.328-0.272-0.083-0.82-0.511-0.82-0.511l0.092-3.408-5.74-0.648-0.364-0.145,1.274-9.103s-1.547-2.752-2.097-3.645c-0.453-0.767-1.64-2.17-1.911-2.998-0.184-0.365-0.458-1.167-0.272-1.531,0.089-0.365,1.184-0.993,1.184-0.993l5.101-0.247,2.826,2.561,1.914-1.322,0.638-1.959,6.105,0.201,4.556,5.367,1.457-1.003-3.735-5.522,3.099-2.687,1.093,2.287,1.186-4.41,3.279-0.037,0.182,4.848,3.374-0.163-0.184-6.771,3.008-3.727,7.107-0.274-2.643-4.41s-0.273-1.257-0.092-1.64c0.184-0.638,1.458-1.468,2.006-1.84,0.638-0.438,2.37-0.739,2.914-1.286,0.365-0.328,0.729-1.276,0.914-1.722,0.18-0.519,0.271-1.686,0.637-2.16,0.455-0.683,1.73-1.722,2.46-2.122,0.455-0.283,1.73-0.401,2.186-0.72,0.273-0.192,0.729-0.685,0.821-1.003,0.091-0.482-0.365-1.467-0.365-1.959,0-0.3,0-0.967,0.273-1.166,0.183-0.201,0.821-0.164,1.095-0.155,0.727,0.018,2.004,0.473,2.643,0.52,0.728,0.045,2.096,0.1,2.641-0.166,0.548-0.199,1.277-0.947,1.552-1.402,0.271-0.445,0.364-1.494,0.364-2.005,0-0.4-0.456-1.559-0.456-1.559l-5.834-2.004-0.455-2.241,1.55-3.645,4.19,0.336,1.277-1.63,11.844,2.296,1.733-2.661,3.098,1.139,0.91,6.086,2.005,1.176,5.65,1.814s0.911-1.204,1.186-1.604c0.183-0.265,0.546-0.984,0.91-1.066,0.184-0.064,0.73,0.347,1.002,0.483,0.182,0.118,0.73,0.309,0.82,0.538,0.274,0.529,0.092,1.813-0.09,2.397-0.091,0.583-0.821,1.594-1.002,2.141-0.274,0.51-0.912,1.521-0.912,2.078,0.091,0.856,1.093,2.36,1.459,3.097,0.455,0.793,2.095,2.999,2.095,2.999l-6.743,4.966s0.911,0.875,1.275,1.066c0.729,0.338,2.279,0.548,3.007,0.692,1.186,0.22,3.464,0.73,4.556,0.693,1.003-0.027,2.827-0.511,3.737-0.802,0.638-0.173,1.642-0.766,2.188-0.912,0.271-0.072,1.002-0.3,1.185-0.1,0.363,0.255,0.183,1.249,0.272,1.648,0.091,0.411,0.548,1.139,0.64,1.549,0,0.383-0.274,1.122-0.274,1.504,0.091,0.401,0.274,1.193,0.454,1.595,0.093,0.5,0.184,1.549,0.457,1.977,0.272,0.31,0.819,0.919,1.185,0.966,0.275,0.036,0.818-0.62,1.187-0.593,0.546,0.046,1.729,0.738,1.729,1.286,0,0.41-1.275,1.066-1.275,1.066l0.545,3.899-3.005,3.892,5.648,2.569,0.182,3.043-2.916,3.846s0,2.451,0.183,3.252c0.092,0.83,0.82,2.388,0.911,3.208,0.183,0.765,0,2.387,0.364,3.1,0.364,0.782,1.641,2.021,2.278,2.559,0.729,0.556,2.37,1.193,3.1,1.768,0.273,0.274,1.001,1.332,1.001,1.332l-2.096,4.19,3.007,2.726s1.275-0.875,1.824-1.039c0.272-0.109,0.91-0.255,1.275-0.165,0.272,0.092,0.819,0.604,1.002,0.857,0.639,0.701,1.822,3.208,1.822,3.208l2.188,2.587h1.457l0.912,1.869-2.644,1.257-0.091,6.033,2.915,0.026,6.652,2.588s0.545,1.722,0.729,2.296c0.091,0.465,0.272,1.458,0.545,1.867,0.458,0.704,1.823,1.733,2.461,2.188,0.729,0.466,2.278,1.202,3.007,1.448,1.277,0.385,4.01,0.448,5.286,0.722,1.002,0.198,3.826,1.064,3.826,1.064l-0.091,4.429-0.548,1.869,2.006,0.373,0.911,5.049,3.19-1.651,8.019,0.021,0.275,2.223,5.738,2.672-0.637,1.601-0.365,4.64,2.188,1.849-0.092,1.805c-0.273-0.054-0.455-0.099-0.638-0.126-0.638-0.082-2.097,0.036-2.825,0-1.366-0.064-4.009-0.477-5.377-0.529-1.091-0.056-3.37,0.045-4.556,0.045-0.637,0.008-1.913-0.009-2.552,0-0.363,0.008-0.91-0.101-1.182,0.055-0.275,0.221-0.458,1.049-0.641,1.386-0.273,0.729-1.002,2.141-1.276,2.888-0.363,0.939-0.91,2.86-1.092,3.847-0.184,1.165-0.365,3.518-0.365,4.702,0,0.773,0.273,2.322,0.273,3.098,0,0.547,0.092,1.677-0.092,2.188-0.089,0.345-0.728,0.864-0.912,1.119-0.362,0.328-1,1.03-1.456,1.177-0.547,0.164-1.641-0.093-2.188-0.109-0.454-0.01-1.549-0.12-2.005,0-0.363,0.098-1.274,0.399-1.457,0.747-0.273,0.3-0.091,1.094-0.182,1.447,0,0.439-0.092,1.405-0.456,1.707-0.182,0.189-0.821,0.189-1.094,0.216-0.911,0.085-2.644-0.045-3.554,0-0.911,0.037-2.643,0.092-3.556,0.319-0.818,0.209-2.368,0.975-3.097,1.386-0.819,0.419-2.187,1.515-2.915,1.924-0.822,0.428-2.645,0.982-3.463,1.393-0.729,0.385-2.369,1.13-3.008,1.76-0.455,0.463-1.185,1.647-1.273,2.295-0.185,0.805,0.271,2.443,0.361,3.253,0.092,1.085,0.457,3.246,0.549,4.328,0.09,1.038,0.181,3.126,0.273,4.167,0,0.92,0.273,2.777,0.09,3.681-0.09,0.729-0.82,2.059-1.273,2.669-0.457,0.692-1.732,1.806-2.188,2.46-0.459,0.547-1.367,1.633-1.552,2.296-0.089,0.357-0.273,1.187,0,1.497,0.274,0.479,1.552,0.729,2.097,0.911,0.639,0.198,1.914,0.373,2.553,0.581,0.363,0.13,1.093,0.347,1.367,0.648,0.271,0.355,0.455,1.337,0.455,1.812,0,0.429-0.184,1.266-0.366,1.649-0.363,0.739-1.366,2.042-2.005,2.571-0.546,0.519-2.279,0.938-2.823,1.548-0.273,0.392-0.64,1.458-0.73,1.977-0.091,0.586-0.091,1.806,0,2.398,0.091,0.557,0.457,1.631,0.457,2.196,0.089,0.691,0.456,2.168,0.182,2.798-0.274,0.655-1.823,1.184-2.369,1.685-0.366,0.374-1.093,1.213-1.276,1.721-0.273,0.575,0.092,1.917-0.182,2.444-0.365,0.537-1.459,1.138-2.097,1.403-0.362,0.173-1.184,0.61-1.548,0.437-0.274-0.118-0.548-0.756-0.455-1.038,0-0.374,0.819-0.838,0.819-1.203,0.091-0.465-0.272-1.44-0.547-1.806-0.365-0.392-1.366-0.864-1.822-0.919-0.364-0.036-1.002,0.155-1.276,0.319-0.274,0.199-0.637,0.947-0.91,1.165-0.273,0.202-1.001,0.328-1.367,0.474-0.548,0.247-1.458,1.021-2.003,1.122-0.912,0.18-2.918-0.395-3.83-0.592-0.819-0.165-2.276-0.774-3.006-0.802-0.82-0.028-2.461,0.364-3.189,0.637-1.001,0.354-2.825,1.531-3.737,2.005-0.818,0.383-2.367,1.247-3.277,1.439-0.457,0.109-1.551,0.102-2.007,0.047-1.094-0.138-3.188-0.867-4.19-1.086-1.188-0.255-3.556-0.919-4.74-0.801-1.001,0.09-2.732,0.801-3.462,1.32-0.639,0.438-1.73,1.631-2.187,2.288-0.548,0.919-1.367,3.033-1.823,4.035-0.454,0.939-1.275,2.826-1.822,3.728-0.729,1.285-2.369,3.709-3.188,4.931-0.548,0.785-1.641,2.352-2.186,3.081-0.549,0.582-1.369,1.931-2.098,2.203-0.363,0.146-1.277,0.138-1.55-0.117-0.365-0.301-0.455-1.34-0.545-1.804,0-0.558,0.271-1.762,0-2.243-0.364-0.584-1.643-1.274-2.37-1.356-0.911-0.137-2.916,0.582-3.829,1.038-0.909,0.481-2.366,2.068-3.279,2.678-1.366,1.003-4.375,2.825-5.921,3.609-0.549,0.264-1.276,0.554-2.098,0.856l-2.734-4.631,3.009-3.679,3.098,1.319,3.37-1.957-0.181-3.409-0.73-5.084-2.095-2.078-2.369,1.521-3.191,0.994-2.549-2.562s0.639-1.203,0.639-1.64c0-0.738-0.366-2.232-0.822-2.842-0.456-0.657-1.821-1.505-2.46-1.961-0.638-0.454-2.005-1.164-2.641-1.685-0.548-0.546-1.55-1.833-2.007-2.523-0.183-0.294-0.728-0.956-0.547-1.239,0.455-0.776,2.918,0.573,3.736,0.08,0.273-0.173,0.456-0.819,0.456-1.13,0-0.347-0.456-0.956-0.547-1.274-0.456-0.922-1.276-2.753-1.732-3.692-0.271-0.684-0.637-2.15-1.001-2.797-0.183-0.254-0.638-0.647-0.728-0.919-0.185-0.467-0.275-1.568,0-1.97,0.271-0.419,1.458-0.772,2.002-0.684,0.455,0.101,1.003,1.048,1.459,1.287,0.271,0.146,0.82,0.31,1.185,0.363,0.364,0.083,1.365-0.054,1.732,0.117,0.272,0.102,0.544,0.603,0.819,0.684,0.639,0.174,1.82-0.171,2.461-0.282,0.909-0.172,2.731-0.5,3.554-0.968,0.363-0.197,1.001-0.781,1.184-1.155,0.091-0.328,0.091-1.086,0.091-1.439-0.091-0.72-0.455-2.123-0.455-2.844,0-0.528-0.09-1.685,0.274-2.086,0.181-0.256,0.91-0.4,1.274-0.365,0.365,0.046,1.003,0.484,1.275,0.729,0.364,0.355,1.002,1.25,1.185,1.723,0.183,0.31,0.183,1.186,0.548,1.321,0.272,0.147,1.092-0.399,1.366-0.683,0.272-0.337,0.639-1.257,0.639-1.724,0.09-0.435-0.272-1.282-0.272-1.722,0-0.846,0.729-2.424,0.91-3.242,0.271-0.813,0.729-2.416,0.819-3.245,0-0.429,0.092-1.367-0.09-1.722-0.183-0.263-0.823-0.492-1.095-0.563-0.456-0.093-1.458,0.063-1.914,0.079-0.363,0.02-1.184-0.108-1.548,0.083-0.365,0.173-0.638,0.947-0.82,1.204-0.183,0.172-0.638,0.572-0.913,0.554-0.636-0.026-1.457-1.174-1.912-1.593-0.91-0.768-2.553-2.351-3.281-3.209-0.453-0.473-1.093-1.558-1.548-2.006-0.184-0.162-0.547-0.518-0.82-0.553-0.272-0.057-0.82,0.354-1.187,0.354-0.362,0.009-1.001-0.208-1.273-0.354-0.457-0.211-1.184-0.83-1.641-1.123-0.275-0.272-0.911-0.909-1.274-1.165-0.276-0.183-0.821-0.575-1.096-0.603-0.364-0.018-1.002,0.255-1.275,0.446-0.183,0.192-0.456,0.848-0.728,1.04-0.183,0.136-0.729,0.356-0.911,0.281-0.457-0.154-1.005-1.449-1.005-1.449l-3.644-5.521-6.104,1.723-2.004-5.166,3.004-0.802,0.367-1.241-5.47,0.238,0.093-5.529-2.644-4.002-6.471-3.526,4.557-1.441-2.6-1.34z","name":"Донецька область"},"18":{"path":"M547.06,335.04l-5.121,1.531-0.356-5.485-8.528-7.217-0.082-2.597-2.889-1.485,3.846-8.575-3.044-5.248,2.487-0.794,3.527,1.003,3.882-3.572-3.926-2.36,0.519-7.372,3.845,0.565,0.401-3.043-1.44-0.201-1.64-2.605-1.567-5.487-1.878-0.037-0.246,2.643-3.161-0.127-0.483-2.359-5.122-2.324-0.046-3.326-4.482-4.684-1.003-0.155-0.118-2.324-6.005-2.524,4.92-9.175,0.282-2.124-0.756-1.204-1.887-0.273-2.278-2.524-0.145-0.264,2.041-0.966,0.374-1.549-2.406-1.714-2.296-1.595-0.374-1.767s1.138-0.984,1.496-1.33c0.865-0.848,2.587-2.561,3.307-3.527,0.529-0.702,1.494-2.205,1.768-3.043,0.191-0.602,0.264-1.877,0.264-2.516,0-0.746-0.4-2.242-0.319-2.988,0.055-0.501,0.574-1.413,0.639-1.924,0.073-0.5,0-1.53-0.11-2.021-0.118-0.594-0.802-1.65-0.847-2.243-0.036-0.438,0.201-1.311,0.374-1.712,0.181-0.447,1.011-1.13,1.066-1.605,0.054-0.464-0.446-1.338-0.638-1.758-0.3-0.655-1.029-1.895-1.394-2.515-0.228-0.383-1.039-1.058-0.957-1.494,0.055-0.328,0.92-0.492,1.066-0.802,0.191-0.392,0.019-1.321-0.054-1.759-0.119-0.701-0.538-2.087-0.857-2.725-0.292-0.592-1.522-1.477-1.549-2.132-0.009-0.41,0.547-1.12,0.857-1.395,0.364-0.309,1.322-0.563,1.767-0.747,0.739-0.3,2.196-1.048,2.989-1.174,0.383-0.056,1.194,0.263,1.549,0.108,0.418-0.182,1.065-0.983,1.175-1.439,0.045-0.229-0.191-0.675-0.219-0.911-0.054-0.466-0.191-1.44,0-1.868,0.164-0.356,0.939-0.712,1.175-1.012,0.2-0.256,0.438-0.847,0.583-1.122,0.21-0.364,0.748-1.038,0.857-1.448,0.137-0.501-0.182-1.587,0-2.079,0.163-0.446,1.229-1.439,1.229-1.439l6.779-5.933-0.373-9.658,2.142-0.219s0.729-0.31,0.957-0.429c0.419-0.218,1.358-0.565,1.604-0.956,0.246-0.394,0.281-1.377,0.155-1.823-0.101-0.374-0.611-1.021-0.904-1.276-0.282-0.247-1.193-0.346-1.338-0.702-0.256-0.629,0.647-1.951,0.802-2.616,0.182-0.72,0.173-2.288,0.536-2.934,0.229-0.401,0.932-1.202,1.386-1.229,0.411-0.019,1.058,0.666,1.339,0.965,0.546,0.575,1.249,2.023,1.705,2.669,0.328,0.456,1.395,1.759,1.395,1.759l1.12-1.066,1.23-7.798,1.758-0.375,1.285-2.562,0.938-1.01c0.275,0.555,1.04,1.239,1.404,1.595,0.283,0.281,0.875,0.819,1.23,0.965,0.301,0.127,0.966,0.228,1.286,0.164,0.555-0.128,1.42-0.957,1.922-1.23,0.756-0.418,2.342-1.138,3.153-1.439,0.62-0.238,1.959-0.474,2.561-0.757,0.419-0.191,1.32-0.61,1.548-1.009,0.264-0.475,0.146-1.651,0.055-2.188-0.1-0.566-0.428-1.705-0.801-2.133-0.292-0.337-1.193-0.592-1.549-0.856-0.301-0.228-0.965-0.712-1.066-1.076-0.118-0.401,0.11-1.312,0.374-1.65,0.201-0.253,0.856-0.51,1.175-0.591,0.402-0.092,1.249-0.11,1.649,0,0.684,0.191,1.806,1.083,2.406,1.448,0.865,0.52,2.733,1.385,3.472,2.078,0.31,0.291,0.601,1.166,0.965,1.385,0.511,0.337,1.786,0.428,2.397,0.428,0.437,0.01,1.284-0.182,1.713-0.264,1.002-0.193,3.08-0.42,4-0.856,0.729-0.337,1.913-1.441,2.515-1.978,0.565-0.5,1.603-1.585,2.132-2.132,0.402-0.411,1.049-1.395,1.549-1.659,0.338-0.173,1.139-0.346,1.495-0.208,0.519,0.19,1.14,1.193,1.449,1.657,0.411,0.629,0.938,2.069,1.33,2.716,0.483,0.819,1.804,2.232,2.187,3.097,0.247,0.566,0.319,1.833,0.539,2.406,0.1,0.255,0.282,0.847,0.529,0.957,0.547,0.245,1.73-0.418,2.304-0.582,0.83-0.239,2.469-0.794,3.307-1.012,1.004-0.274,3.027-0.794,4.056-0.911,0.966-0.11,2.925-0.137,3.9-0.055,0.639,0.064,1.877,0.418,2.506,0.483,0.438,0.044,1.339-0.101,1.769,0,0.264,0.063,0.838,0.246,0.956,0.483,0.22,0.419-0.246,1.394-0.263,1.867-0.036,1.139,0.137,3.417,0.318,4.538,0.183,1.129,0.564,3.435,1.121,4.428,0.246,0.438,0.929,1.24,1.394,1.449,0.365,0.165,1.193,0.046,1.595,0.046,0.657,0.018,2.032,0.282,2.625,0,0.373-0.174,0.902-0.894,1.066-1.275,0.191-0.447,0.146-1.45,0.209-1.924,0.091-0.656,0.174-2.004,0.429-2.615,0.346-0.829,1.531-2.224,2.133-2.889,0.729-0.792,2.277-2.351,3.208-2.879,0.537-0.311,1.758-0.584,2.351-0.747,0.883-0.247,2.679-0.648,3.581-0.858,1.012-0.245,3.125-0.492,4.055-0.965,1.312-0.666,3.599-2.661,4.482-3.837,0.256-0.346,0.61-1.139,0.703-1.549,0.081-0.411-0.119-1.257,0-1.658,0.081-0.301,0.363-0.911,0.636-1.066,0.301-0.172,1.049-0.091,1.386,0,0.384,0.092,1.157,0.429,1.387,0.748,0.527,0.71,0.473,2.615,0.7,3.471,0.465,1.74,1.75,5.112,2.295,6.834,0.439,1.366,1.286,4.11,1.65,5.494,0.265,0.976,0.757,2.916,0.912,3.9,0.127,0.793,0.046,2.433,0.264,3.208,0.265,0.911,1.258,2.562,1.768,3.362,0.347,0.557,1.212,1.559,1.595,2.087,0.264,0.346,0.593,1.267,1.003,1.431l3.17,3.8-2.086,7.207-3.308-1.868-3.9,2.188,3.846,14.426,1.339-1.286,9.923,8.539-4.638,2.998-0.055,4-2.406,0.055,0.374,2.67,5.504,6.779s-0.118,1.486-0.164,1.979c-0.046,0.517-0.356,1.584-0.21,2.085,0.192,0.674,1.44,1.594,1.705,2.242,0.2,0.474,0.492,1.567,0.264,2.032-0.172,0.365-1.02,0.666-1.384,0.846-0.474,0.247-1.476,0.611-1.977,0.803-0.393,0.156-1.44,0.191-1.595,0.592-0.137,0.318,0.347,0.975,0.583,1.229,0.336,0.348,1.257,0.739,1.704,0.903,0.647,0.236,1.986,0.601,2.669,0.593,0.675-0.009,1.997-0.411,2.624-0.647,0.293-0.109,0.839-0.729,1.121-0.583,0.292,0.146,0.156,0.957,0.209,1.275,0.119,0.738,0.574,2.206,0.484,2.943-0.092,0.747-0.711,2.178-1.176,2.779-0.647,0.829-2.45,2.031-3.363,2.56-1.03,0.593-3.325,1.276-4.382,1.813-0.602,0.301-2.297,1.394-2.297,1.394l-0.055,2.617,3.426,2.341,0.583,1.712-2.514,2.087,0.801,2.506,2.46,1.869-2.141,3.361-3.626-0.208,3.79,7.854,9.56,7.737-0.319,5.449-1.704-0.165,2.605,2.569-2.451,5.067,0.803,2.78,2.405,0.318,2.132,4.12-2.614,1.44,1.01,2.934-3.627,4.009,7.364,9.131-8.803,4.483-6.733,5.977-7.956,3.58,1.55,5.186-0.912,3.308,3.362,1.603-0.319,5.341-5.548-2.169,0.282,3.928-0.802,0.838-1.649-1.722-4.766,1.933,1.121,2.076-1.64,0.921-3.162-0.921-14.781-0.036-0.883-1.531,2.369-3.881-4.611-4.283,4.047-5.368-2.561-4.966,2.123-4.009-7.135-7.928-4.884,6.653-3.362,0.2,0.801,5.321-4.009-0.437-1.44-3.208-4.284,0.047-1.721,5.403-2.962-4.247-4.127-0.237-1.368-2.888-1.84-0.556-0.355,5.166-1.567,0.274-6.771-3.363s-2.415,1.768-3.315,2.169c-1.313,0.565-4.12,1.211-5.532,1.395-1.769,0.236-5.358,0.319-7.126,0.127-1.121-0.127-3.28-0.775-4.365-1.049-0.729-0.171-2.14-0.728-2.888-0.756-0.721-0.027-2.142,0.32-2.844,0.52-0.709,0.201-2.132,0.684-2.76,1.085-0.374,0.228-1.286,1.203-1.286,1.203l-0.66,0.24z","name":"Житомирська область"},"21":{"path":"M326.34,478.76c0.299,0.48,0.72,1.61,0.692,2.184-0.027,0.604-0.611,1.726-0.903,2.241-0.337,0.586-1.395,1.506-1.604,2.144-0.229,0.665,0.009,2.113,0,2.825-0.019,0.647-0.092,2.187-0.136,3.043-0.966-0.411-2.762-0.611-3.654-0.792-0.957-0.202-2.889-0.511-3.847-0.702-0.564-0.11-1.676-0.521-2.242-0.484-0.418,0.037-1.183,0.402-1.548,0.593-0.729,0.374-2.032,1.395-2.725,1.813-0.783,0.473-2.341,1.465-3.207,1.767-0.665,0.221-2.078,0.412-2.779,0.43-1.158,0.02-3.444-0.374-4.592-0.537-0.912-0.128-2.753-0.319-3.628-0.583-0.537-0.175-1.604-0.592-2.031-0.967-0.492-0.428-0.948-1.759-1.439-2.187-0.884-0.765-3.135-1.547-4.221-1.979-0.929-0.365-2.824-0.993-3.79-1.229-0.92-0.229-2.797-0.692-3.746-0.639-1.084,0.056-3.116,1.13-4.209,1.175-0.802,0.028-2.415-0.328-3.153-0.646-0.628-0.264-1.677-1.166-2.242-1.55-0.811-0.527-2.378-1.678-3.262-2.078-0.793-0.364-2.516-0.784-3.362-1.012-0.957-0.253-2.908-0.592-3.846-0.91-1.002-0.347-2.833-1.459-3.845-1.768-0.675-0.201-2.078-0.475-2.78-0.429-0.655,0.055-1.858,0.683-2.505,0.802-0.794,0.146-2.424,0.329-3.208,0.165-0.702-0.146-1.932-0.931-2.561-1.285-0.875-0.486-2.67-1.413-3.417-2.078-0.583-0.52-1.513-1.795-1.922-2.461-0.411-0.673-1.103-2.122-1.331-2.877-0.192-0.611-0.165-1.933-0.429-2.517-0.273-0.582-1.121-1.621-1.657-1.977-0.839-0.538-2.862-0.929-3.847-1.065-0.665-0.091-2.014-0.136-2.669,0-0.593,0.136-1.722,0.638-2.188,1.021-0.629,0.501-1.448,1.913-1.922,2.561-0.546,0.737-1.53,2.304-2.195,2.934-0.447,0.427-1.495,1.156-2.078,1.394-0.603,0.236-1.923,0.346-2.561,0.419-0.72,0.091-2.196,0.437-2.889,0.218-0.464-0.146-1.039-1.066-1.494-1.231-0.401-0.145-1.321-0.181-1.713,0-0.419,0.201-0.939,1.04-1.167,1.441-0.155,0.273-0.382,0.874-0.428,1.176-0.073,0.436,0.182,1.339,0.055,1.766-0.127,0.393-0.693,1.021-0.966,1.332-0.318,0.364-0.911,1.283-1.385,1.339-0.255,0.026-0.702-0.338-0.857-0.538-0.355-0.473-0.447-1.73-0.638-2.296-0.219-0.629-1.084-1.795-1.02-2.452,0.054-0.574,0.938-1.466,1.284-1.921,0.411-0.548,1.404-1.504,1.76-2.088,0.345-0.565,0.992-1.795,1.021-2.46,0.018-0.529-0.466-1.541-0.693-2.022-0.274-0.574-0.902-1.688-1.339-2.142-0.502-0.519-1.742-1.32-2.406-1.604-0.811-0.337-2.598-0.555-3.472-0.692-0.993-0.145-2.998-0.427-4-0.427-0.738,0-2.214,0.19-2.944,0.327-0.555,0.1-1.64,0.728-2.187,0.583-0.474-0.128-1.139-0.967-1.385-1.385-0.292-0.485-0.537-1.596-0.637-2.142-0.174-0.875-0.165-2.689-0.329-3.582-0.136-0.757-0.564-2.25-0.792-2.988-0.228-0.676-0.665-2.042-1.02-2.671-0.256-0.438-0.856-1.312-1.286-1.596-0.519-0.354-1.776-0.627-2.396-0.745-0.83-0.165-2.534-0.156-3.372-0.274-0.574-0.083-1.759-0.228-2.287-0.483-0.41-0.183-1.112-0.765-1.395-1.122-0.209-0.264-0.509-0.892-0.583-1.22-0.191-0.848,0.127-2.617,0-3.473-0.109-0.693-0.547-2.041-0.857-2.67-0.218-0.437-0.792-1.238-1.12-1.604-0.274-0.3-1.048-0.701-1.23-1.066-0.173-0.354-0.046-1.193-0.11-1.595-0.072-0.483-0.246-1.467-0.437-1.922-0.202-0.464-0.784-1.33-1.122-1.722-0.328-0.364-1.13-0.965-1.522-1.276-0.3-0.245-0.875-0.802-1.239-0.919-0.437-0.156-1.421,0.126-1.85-0.046-0.482-0.183-1.312-0.902-1.558-1.357-0.228-0.438-0.283-1.477-0.237-1.969,0.063-0.747,0.638-2.168,0.875-2.879,0.292-0.839,0.957-2.479,1.248-3.326,0.428-1.276,0.975-3.946,1.558-5.167,0.692-1.449,2.634-4.073,3.645-5.321,0.921-1.149,2.943-3.318,4.047-4.292,0.948-0.83,3.217-2.05,4.082-2.961,1.02-1.067,2.506-3.655,3.244-4.921,0.557-0.948,1.704-2.843,2.005-3.89,0.301-1.058,0.282-3.272,0.364-4.365,0.064-0.976-0.073-2.962,0.238-3.883,0.209-0.629,1.038-1.685,1.44-2.205,0.747-0.966,2.386-2.78,3.244-3.646,0.756-0.765,2.332-2.205,3.162-2.888,0.656-0.529,2.068-1.44,2.724-1.959,0.546-0.428,1.851-1.158,2.123-1.805,0.265-0.61,0.038-2.005-0.155-2.642-0.1-0.311-0.564-0.803-0.646-1.12-0.055-0.247-0.137-0.821,0.045-1.003,0.292-0.292,1.23-0.1,1.64-0.073,0.438,0.018,1.313,0.082,1.724,0.237,0.627,0.246,1.676,1.156,2.241,1.521,0.765,0.492,2.305,1.477,3.125,1.886,0.738,0.355,2.242,1.039,3.044,1.193,0.729,0.146,2.251-0.136,2.961,0.046,0.628,0.154,1.703,0.911,2.286,1.203,0.447,0.219,1.313,0.738,1.805,0.838,0.219,0.045,0.538,0.082,0.884,0.082l6.643,7.127-4.327,2.286,0.919,4.202,3.444,4.164,2.16,6.971,7.537-1.677,5.804,7.563,4.329-0.164,4.364,2.406,2.925,4.282,8.247,1.605,0.702-2.168c0.501,0.364,1.158,0.846,1.449,1.093,0.456,0.375,1.294,1.192,1.713,1.604,0.3,0.283,0.948,0.82,1.175,1.167,0.356,0.555,0.657,1.877,0.957,2.461,0.347,0.664,1.186,1.921,1.658,2.505,0.219,0.273,0.638,0.875,0.958,1.021,0.5,0.218,1.64,0.045,2.196,0.055,0.647,0,1.959-0.083,2.615-0.055,0.556,0.018,1.858-0.209,2.242,0.209,0.264,0.292,0.018,1.167,0,1.549-0.018,0.484-0.128,1.441-0.164,1.923-0.045,0.656-0.155,1.959-0.155,2.615,0,0.474-0.037,1.421,0.1,1.876,0.126,0.384,0.565,1.104,0.856,1.386,0.565,0.538,2.024,1.159,2.726,1.495,0.618,0.301,1.922,0.72,2.515,1.065,0.392,0.237,1.239,0.71,1.44,1.122,0.164,0.364,0,1.211-0.055,1.604-0.074,0.492-0.401,1.43-0.483,1.922-0.128,0.792-0.583,2.47-0.265,3.208,0.137,0.328,0.765,0.865,1.121,0.902,0.365,0.047,1.048-0.4,1.34-0.637,0.382-0.329,0.883-1.24,1.166-1.659,0.192-0.272,0.474-0.93,0.747-1.122,0.228-0.154,0.801-0.2,1.076-0.208,0.482-0.028,1.448,0.318,1.922,0.208,0.602-0.126,1.568-1.029,2.133-1.284,0.483-0.218,1.503-0.538,2.032-0.638,0.473-0.092,1.448-0.256,1.923-0.155,0.437,0.083,1.33,0.483,1.603,0.848,0.329,0.464,0.237,1.695,0.365,2.251,0.109,0.427,0.538,1.256,0.538,1.703,0,0.448-0.328,1.313-0.538,1.704-0.273,0.528-1.248,1.313-1.44,1.878-0.119,0.337-0.063,1.084,0,1.439,0.101,0.555,0.565,1.604,0.747,2.132,0.255,0.73,0.565,2.268,1.021,2.889,0.564,0.785,2.224,1.913,3.088,2.351,0.638,0.311,2.024,0.729,2.725,0.748,0.428,0.008,1.331-0.109,1.659-0.375,0.282-0.228,0.382-1.038,0.638-1.286,0.447-0.418,1.668-0.764,2.25-0.965,0.301-0.101,0.93-0.438,1.221-0.318,0.456,0.19,0.702,1.292,0.966,1.713,0.319,0.509,1.03,1.484,1.385,1.976,0.473,0.639,1.494,1.841,1.922,2.506,0.383,0.603,1.057,1.859,1.34,2.515,0.436,1.021,1.094,3.153,1.439,4.21,0.21,0.656,0.629,1.96,0.801,2.624,0.146,0.573,0.575,1.758,0.484,2.352-0.092,0.537-0.812,1.439-1.075,1.922-0.265,0.483-0.857,1.449-1.066,1.967-0.119,0.302-0.428,0.931-0.32,1.23,0.11,0.32,0.775,0.638,1.066,0.802,0.53,0.31,1.723,0.647,2.242,0.966,0.921,0.556,2.516,2.005,3.317,2.716,0.465,0.42,1.477,1.23,1.814,1.768","name":"Закарпатська область"},"23":{"path":"M 1165.838,556.373 C 1166.018,556.727 1165.928,557.666 1165.928,558.095 1165.838,558.924 1165.38,560.527 1165.109,561.34 1164.927,562.158 1164.197,563.736 1164.197,564.582 1164.197,565.021 1164.561,565.869 1164.471,566.304 1164.471,566.771 1164.105,567.691 1163.832,568.028 1163.558,568.311 1162.738,568.858 1162.466,568.711 1162.101,568.575 1162.101,567.699 1161.918,567.39 1161.735,566.917 1161.098,566.023 1160.733,565.667 1160.461,565.423 1159.822,564.984 1159.458,564.938 1159.094,564.903 1158.364,565.047 1158.184,565.303 1157.819,565.704 1157.91,566.861 1157.91,567.389 1157.91,568.11 1158.273,569.513 1158.365,570.233 1158.365,570.587 1158.365,571.344 1158.273,571.672 1158.091,572.046 1157.454,572.63 1157.089,572.827 1156.268,573.295 1154.445,573.623 1153.536,573.795 1152.895,573.906 1151.714,574.251 1151.075,574.077 1150.8,573.996 1150.526,573.495 1150.255,573.393 1149.889,573.222 1148.887,573.359 1148.524,573.276 1148.16,573.222 1147.611,573.058 1147.338,572.913 1146.881,572.674 1146.335,571.726 1145.88,571.626 1145.336,571.537 1144.149,571.891 1143.877,572.31 1143.603,572.711 1143.692,573.813 1143.877,574.28 1143.968,574.551 1144.423,574.945 1144.605,575.199 1144.97,575.845 1145.336,577.312 1145.607,577.996 1146.063,578.935 1146.881,580.767 1147.338,581.688 1147.43,582.006 1147.886,582.616 1147.886,582.973 1147.886,583.273 1147.703,583.919 1147.43,584.092 1146.61,584.585 1144.149,583.236 1143.693,584.012 1143.513,584.295 1144.058,584.957 1144.241,585.25 1144.698,585.941 1145.7,587.229 1146.248,587.774 1146.882,588.295 1148.251,589.004 1148.888,589.459 1149.528,589.915 1150.893,590.763 1151.349,591.42 1151.805,592.029 1152.171,593.524 1152.171,594.262 1152.171,594.699 1151.532,595.902 1151.532,595.902 L 1154.081,598.463 1157.272,597.47 1159.641,595.949 1161.736,598.027 1162.466,603.111 1162.647,606.52 1159.277,608.477 1156.179,607.158 1153.17,610.837 1155.904,615.468 C 1154.264,616.061 1152.442,616.689 1151.439,617.289 1149.982,618.119 1147.429,620.179 1146.427,621.419 1145.514,622.577 1144.057,625.273 1143.512,626.667 1143.054,627.753 1142.324,630.021 1142.234,631.187 1142.144,632.08 1142.508,633.867 1142.418,634.75 1142.418,635.352 1142.234,636.582 1141.961,637.084 1141.597,637.586 1140.412,638.167 1139.867,638.479 1139.411,638.77 1138.5,639.543 1137.952,639.526 1137.678,639.507 1137.042,639.253 1137.042,639.006 1137.042,638.387 1138.682,638.059 1139.137,637.641 1139.594,637.23 1140.412,636.264 1140.686,635.716 1140.959,635.16 1141.234,633.931 1141.325,633.312 1141.416,632.626 1141.325,631.215 1141.143,630.55 1140.87,629.675 1139.957,628.018 1139.321,627.387 1138.592,626.668 1136.585,625.74 1135.584,625.466 1134.673,625.209 1132.759,625.183 1131.758,625.264 1130.3,625.384 1127.568,626.085 1126.199,626.504 1124.468,627.042 1121.187,628.508 1119.547,629.192 1118.362,629.657 1116.083,630.541 1114.989,631.07 1114.08,631.508 1112.257,632.354 1111.437,633.038 1110.798,633.658 1109.796,635.263 1109.341,636.081 1108.793,637.111 1107.975,639.336 1107.61,640.447 1107.427,641.02 1107.064,642.216 1106.881,642.807 1106.606,643.754 1105.97,645.631 1105.695,646.571 1105.42,647.537 1104.876,649.54 1104.419,650.416 1103.873,651.336 1102.322,652.903 1101.504,653.579 1100.683,654.288 1098.77,655.419 1097.677,655.865 1097.22,656.065 1096.309,656.521 1095.765,656.42 1095.49,656.375 1095.036,656.02 1094.944,655.782 1094.852,655.481 1095.036,654.798 1095.217,654.498 1095.398,654.033 1096.036,653.204 1096.491,652.903 1096.947,652.547 1098.132,652.245 1098.679,652.021 1099.135,651.828 1100.047,651.482 1100.502,651.217 1101.139,650.816 1102.414,649.806 1102.961,649.258 1103.508,648.713 1104.51,647.529 1104.876,646.852 1105.147,646.26 1105.513,644.94 1105.695,644.292 1105.878,643.746 1106.057,642.632 1106.15,642.087 1106.241,641.676 1106.515,640.866 1106.515,640.446 1106.605,640.262 1106.698,639.79 1106.515,639.726 1106.241,639.636 1105.969,640.208 1105.786,640.4 1105.513,640.729 1105.146,641.53 1104.876,641.804 1104.693,641.978 1104.147,642.286 1103.873,642.248 1103.6,642.204 1103.052,641.693 1102.87,641.447 1102.597,641.038 1102.414,640.008 1102.142,639.596 1101.776,639.187 1101.047,638.477 1100.591,638.239 1100.136,638.003 1099.134,637.785 1098.585,637.757 1097.767,637.72 1096.216,638.058 1095.488,638.204 1094.85,638.312 1093.666,638.603 1093.028,638.761 1092.388,638.943 1091.115,639.433 1090.477,639.561 1089.474,639.752 1087.377,639.762 1086.284,639.88 1085.373,639.999 1083.46,640.4 1082.457,640.526 1081.548,640.634 1079.634,640.627 1078.632,640.845 1077.902,641.018 1076.444,641.556 1075.806,641.965 1075.259,642.319 1074.348,643.331 1073.892,643.808 1073.348,644.299 1072.344,645.32 1071.888,645.811 1070.429,647.169 1067.423,649.748 1065.965,651.096 1064.143,652.783 1060.589,656.337 1058.767,657.949 1057.947,658.587 1056.398,659.754 1055.579,660.345 1055.122,660.701 1054.212,661.485 1053.664,661.749 1053.299,661.949 1052.48,662.341 1052.023,662.269 1051.659,662.205 1050.929,661.739 1050.838,661.384 1050.655,660.974 1051.113,660.099 1051.294,659.705 1051.385,659.406 1052.113,658.952 1052.023,658.623 1052.023,658.332 1051.385,657.931 1051.114,657.948 1050.656,657.957 1050.018,658.721 1049.745,659.069 1049.472,659.334 1049.382,660.126 1049.017,660.307 1048.744,660.473 1048.014,660.408 1047.649,660.263 1046.92,659.925 1045.919,658.55 1045.554,657.866 1045.006,657.074 1044.279,655.341 1044.094,654.423 1044.004,653.739 1044.459,652.335 1044.279,651.652 1044.186,651.132 1043.55,650.239 1043.366,649.73 1043.276,649.411 1043.092,648.718 1043.002,648.371 1043.002,647.697 1043.276,646.311 1043.092,645.646 1043.002,645.246 1042.455,644.588 1042.275,644.207 1042.09,643.808 1041.911,642.923 1041.728,642.521 1041.546,642.193 1041.181,641.573 1040.906,641.317 1040.724,641.146 1040.269,640.744 1039.995,640.799 1039.632,640.871 1039.267,641.617 1039.083,641.964 1038.902,642.549 1038.812,643.824 1038.902,644.443 1038.995,645.034 1039.449,646.138 1039.449,646.72 1039.542,647.422 1039.083,648.788 1039.083,649.491 1039.083,650.375 1039.357,652.114 1039.542,652.97 1039.813,653.992 1040.633,655.915 1040.906,656.944 1041,657.865 1040.906,659.777 1041.09,660.71 1041.272,661.601 1042.001,663.297 1042.365,664.152 1042.548,664.764 1042.912,666.096 1043.277,666.595 1043.55,666.839 1044.095,667.215 1044.461,667.279 1044.825,667.341 1045.646,667.205 1045.92,666.994 1046.191,666.832 1046.467,666.265 1046.556,666.031 1046.831,665.738 1047.196,665.145 1047.47,664.874 1047.651,664.69 1047.923,664.235 1048.199,664.189 1048.38,664.152 1048.835,664.354 1048.928,664.554 1049.02,664.919 1048.562,665.657 1048.289,665.993 1048.108,666.348 1047.471,666.94 1047.196,667.278 1046.74,667.904 1045.738,669.173 1045.374,669.875 1044.826,670.833 1044.097,672.917 1043.643,673.921 1043.188,674.898 1042.277,676.837 1041.73,677.766 1041.456,678.256 1040.726,679.162 1040.455,679.653 1040.09,680.155 1039.634,681.203 1039.359,681.73 1039.179,682.224 1038.813,683.243 1038.63,683.734 1038.63,683.781 1038.54,683.837 1038.54,683.889 L 1037.354,683.169 C 1037.719,682.769 1038.173,682.323 1038.449,682.013 1038.72,681.574 1039.268,680.591 1039.543,680.09 1039.814,679.46 1040.271,678.15 1040.544,677.529 1040.818,676.994 1041.455,675.962 1041.819,675.442 1042.002,675.104 1042.548,674.476 1042.639,674.084 1042.73,673.775 1042.73,673.091 1042.548,672.837 1042.365,672.646 1041.819,672.518 1041.547,672.481 1041.182,672.427 1040.361,672.691 1039.905,672.646 1039.449,672.591 1038.539,672.354 1038.173,672.042 1037.901,671.76 1037.627,670.96 1037.627,670.559 1037.536,670.039 1037.9,669.036 1038.083,668.554 1038.267,668.155 1038.812,667.45 1038.902,667.033 1039.083,666.522 1039.267,665.411 1039.083,664.91 1038.902,664.545 1038.448,663.915 1038.083,663.751 1037.81,663.626 1037.263,663.751 1036.898,663.708 1036.534,663.652 1035.713,663.524 1035.349,663.269 1035.076,663.014 1034.802,662.185 1034.62,661.831 1034.438,661.438 1034.075,660.583 1033.8,660.264 1033.527,660.055 1033.071,659.706 1032.706,659.706 1032.343,659.697 1031.522,660.144 1031.25,660.463 1030.976,660.847 1030.61,661.875 1030.702,662.351 1030.794,662.806 1031.704,663.364 1031.977,663.709 1032.432,664.181 1033.345,665.047 1033.617,665.63 1033.8,666.195 1033.8,667.444 1033.71,668.036 1033.617,668.537 1033.254,669.492 1032.981,669.922 1032.617,670.506 1031.705,671.61 1031.066,671.963 1030.795,672.129 1030.155,672.346 1029.792,672.284 1029.336,672.191 1028.517,671.555 1028.243,671.117 1028.06,670.696 1028.15,669.676 1028.243,669.203 1028.243,668.692 1028.516,667.682 1028.425,667.197 1028.335,666.897 1027.876,666.313 1027.607,666.23 1027.334,666.169 1026.786,666.432 1026.602,666.63 1026.239,667.024 1026.147,668.155 1026.054,668.674 1025.964,669.63 1026.054,671.563 1026.054,672.519 1026.054,673.075 1025.6,674.414 1026.054,674.724 1026.239,674.87 1026.785,674.468 1026.967,674.358 1027.239,674.27 1027.696,673.804 1027.876,673.922 1028.15,674.059 1027.969,674.733 1027.969,675.006 1027.876,675.488 1027.787,676.475 1027.607,676.928 1027.422,677.458 1026.877,678.469 1026.513,678.888 1026.328,679.081 1026.147,679.28 1025.873,679.49 1025.144,679.354 1024.415,679.154 1024.051,678.934 1023.595,678.623 1023.14,677.668 1022.866,677.211 1022.593,676.685 1022.047,675.599 1021.955,675.006 1021.955,674.597 1022.047,673.713 1022.226,673.364 1022.5,673.027 1023.412,672.857 1023.594,672.481 1023.867,671.797 1023.139,670.313 1023.049,669.592 1022.774,668.426 1022.32,666.057 1021.954,664.909 1021.863,664.443 1021.497,663.514 1021.225,663.112 1020.86,662.521 1019.858,661.51 1019.31,661.108 1018.673,660.67 1017.307,660.079 1016.669,659.824 1015.939,659.568 1014.391,659.413 1013.753,659.067 1013.387,658.885 1012.75,658.384 1012.567,658.065 1012.113,657.401 1012.113,655.769 1011.838,655.059 1011.655,654.702 1011.289,653.938 1011.019,653.783 1010.653,653.619 1009.833,653.828 1009.467,653.938 1008.83,654.12 1007.737,654.92 1007.099,655.095 1006.736,655.203 1005.914,655.367 1005.55,655.221 1005.094,655.049 1004.549,654.246 1004.276,653.891 1003.911,653.453 1003.363,652.478 1002.999,652.05 1002.633,651.713 1002.088,650.793 1001.633,650.858 1001.36,650.884 1001.268,651.522 1001.086,651.65 1000.904,651.805 1000.266,651.961 999.993,651.851 999.719,651.732 999.353,651.113 999.263,650.811 999.173,650.529 998.992,649.91 999.082,649.609 999.082,649.419 999.263,649.051 999.353,648.889 999.628,648.598 1000.174,648.196 1000.448,647.931 1000.721,647.678 1001.177,647.175 1001.267,646.847 1001.452,646.365 1001.267,645.308 1001.176,644.807 1001.085,644.452 1000.993,643.757 1000.81,643.43 1000.721,643.194 1000.538,642.701 1000.265,642.564 999.993,642.346 999.081,642.365 998.717,642.346 998.351,642.336 997.531,642.592 997.167,642.437 996.894,642.336 996.711,641.863 996.528,641.653 996.437,641.491 996.347,641.061 996.164,640.969 995.891,640.824 995.253,641.007 994.979,641.08 994.796,641.135 994.431,641.5 994.25,641.416 994.066,641.314 993.978,640.741 993.885,640.506 V 639.173 C 993.885,638.882 993.792,638.254 993.978,638.034 994.159,637.762 994.979,637.744 995.344,637.661 995.799,637.534 996.801,637.317 997.347,637.207 997.805,637.105 998.716,636.969 999.171,636.822 999.443,636.734 1000.081,636.577 1000.264,636.324 1000.355,636.158 1000.173,635.729 1000.173,635.539 1000.081,635.221 999.534,634.583 999.717,634.309 999.899,634.054 1000.72,634.253 1000.992,634.201 1001.265,634.164 1001.813,634.192 1001.903,633.99 1002.086,633.781 1001.903,633.208 1001.813,632.951 1001.721,632.588 1001.45,631.904 1001.357,631.539 1001.265,631.203 1001.265,630.518 1001.174,630.19 1001.083,629.807 1000.626,629.061 1000.808,628.706 1000.902,628.46 1001.357,628.212 1001.63,628.104 1001.902,627.976 1002.45,627.884 1002.815,627.812 1003.087,627.721 1003.999,627.766 1004.183,627.447 1004.274,627.219 1003.909,626.718 1003.816,626.491 1003.544,626.073 1003.087,625.289 1002.815,624.915 1002.542,624.597 1001.994,624.074 1001.721,623.737 1001.63,623.52 1001.174,622.983 1001.357,622.763 1001.538,622.5 1002.36,623.001 1002.63,622.791 1002.724,622.707 1002.724,622.418 1002.724,622.3 1002.541,621.862 1001.813,621.27 1001.537,620.923 1001.174,620.494 1000.353,619.655 1000.08,619.21 999.716,618.8 999.17,617.916 998.896,617.506 998.714,617.249 998.348,616.658 998.075,616.531 997.712,616.375 996.982,616.566 996.618,616.531 996.346,616.493 995.798,616.385 995.522,616.256 994.885,615.946 993.976,614.918 993.428,614.472 992.88,614.06 991.879,613.296 991.424,612.813 991.15,612.54 990.695,611.903 990.512,611.566 990.329,611.237 990.147,610.5 989.966,610.198 989.783,609.952 989.237,609.64 989.054,609.397 988.598,608.877 988.235,607.637 988.05,607.027 987.779,606.271 987.505,604.714 987.231,603.957 987.05,603.419 986.869,602.253 986.502,601.842 986.23,601.515 985.226,601.423 984.86,601.132 984.498,600.83 983.951,599.583 983.951,599.583 L 981.464,587.171 984.498,586.251 984.408,583.772 981.39,583.091 981.463,579.161 978.7,579.042 978.218,582.605 970.29,583.044 965.808,574.596 967.894,572.035 965.653,569.419 C 966.383,569.356 967.12,569.254 967.587,569.108 968.441,568.819 970.071,567.924 970.738,567.295 971.274,566.768 971.921,565.355 972.333,564.727 972.698,564.179 973.306,562.986 973.828,562.593 974.254,562.266 975.33,561.993 975.86,561.891 976.323,561.817 977.261,561.828 977.726,561.846 978.239,561.855 979.248,562.021 979.758,562.001 980.305,561.983 981.426,561.882 981.945,561.682 982.584,561.428 983.677,560.469 984.314,560.078 985.045,559.604 986.411,558.574 987.23,558.212 988.049,557.857 989.691,557.263 990.511,557.199 991.149,557.145 992.515,557.262 993.062,557.574 993.518,557.81 994.064,558.72 994.428,559.066 994.703,559.348 995.341,559.905 995.706,560.078 996.067,560.271 996.98,560.333 997.435,560.453 997.982,560.606 999.167,560.881 999.623,561.199 1000.169,561.6 1000.898,562.857 1001.446,563.341 1001.899,563.762 1002.901,564.551 1003.45,564.833 1003.995,565.126 1005.362,565.282 1005.909,565.584 1006.456,565.828 1007.277,566.53 1007.64,566.913 1008.188,567.432 1009.007,568.735 1009.554,569.208 1010.101,569.637 1011.195,570.356 1011.832,570.495 1012.379,570.604 1013.38,570.475 1013.837,570.34 1014.473,570.14 1015.749,569.401 1016.297,568.999 1016.935,568.518 1018.119,567.168 1018.849,566.759 1019.578,566.339 1021.309,565.92 1022.218,565.793 1023.041,565.672 1024.864,565.839 1025.775,565.793 1026.777,565.747 1028.781,565.728 1029.692,565.419 1030.787,565.098 1032.609,563.968 1033.427,563.285 1034.247,562.622 1035.706,561.098 1036.072,560.132 1036.343,559.514 1036.254,558.128 1036.162,557.463 1036.162,556.579 1035.98,554.767 1035.707,553.937 1035.343,553.18 1034.068,552.014 1033.703,551.268 1033.519,550.785 1033.339,549.717 1033.247,549.19 1033.063,548.597 1032.882,547.376 1032.974,546.783 1033.064,546.428 1033.52,545.799 1033.703,545.502 1033.977,545.126 1034.705,544.542 1034.978,544.17 1035.16,543.915 1035.524,543.366 1035.524,543.05 1035.614,542.786 1035.432,542.193 1035.25,542.027 1034.979,541.857 1034.248,541.911 1033.978,542.027 1033.793,542.138 1033.428,542.639 1033.248,542.831 1033.064,543.076 1032.61,543.659 1032.337,543.797 1031.972,543.924 1031.334,543.924 1031.06,543.852 1030.515,543.726 1029.513,543.206 1029.148,542.788 1028.965,542.549 1028.874,541.947 1028.874,541.664 1028.783,541.037 1029.239,539.632 1028.874,539.15 1028.603,538.885 1027.87,538.84 1027.508,538.885 1027.145,538.931 1026.415,539.341 1026.141,539.577 1025.778,539.86 1025.049,540.552 1024.867,540.963 1024.502,541.546 1024.226,542.895 1024.046,543.532 1023.863,544.069 1023.59,545.174 1023.317,545.665 1023.046,546.12 1022.222,546.877 1021.86,547.269 1021.586,547.624 1020.857,548.28 1020.493,548.654 1019.946,549.32 1019.034,550.894 1018.395,551.487 1017.668,552.153 1015.845,553.017 1015.025,553.519 1014.296,553.911 1013.113,554.787 1012.293,555.178 1011.746,554.904 1011.018,554.484 1010.651,554.284 1010.194,553.991 1009.103,553.518 1008.739,553.064 1008.555,552.689 1008.281,551.75 1008.373,551.293 1008.373,550.694 1009.284,549.735 1009.466,549.162 1009.74,548.533 1010.014,547.213 1010.014,546.547 1010.014,546.055 1009.558,545.145 1009.466,544.678 1009.284,544.36 1009.012,543.724 1009.012,543.394 1009.102,543.139 1009.466,542.739 1009.741,542.592 1010.014,542.372 1010.927,542.401 1011.2,542.165 1011.563,541.954 1011.928,541.307 1012.018,540.961 1012.112,540.295 1011.837,538.911 1011.655,538.236 1011.563,537.609 1011.289,536.241 1010.835,535.785 1010.47,535.466 1009.467,535.455 1009.103,535.22 1008.741,535.048 1008.193,534.574 1008.102,534.264 1007.83,533.835 1007.737,532.842 1007.737,532.368 1007.737,531.767 1007.554,530.481 1007.83,529.963 1008.01,529.736 1008.558,529.572 1008.741,529.4 1008.921,529.225 1009.379,528.87 1009.468,528.607 1009.56,528.159 1009.286,527.204 1009.014,526.838 1008.558,526.291 1007.283,525.653 1006.647,525.425 1006.372,525.327 1005.733,525.227 1005.46,525.261 1005.002,525.327 1004.186,525.99 1003.728,525.982 1003.273,525.982 1002.454,525.526 1002.087,525.235 1001.815,525.051 1001.358,524.278 1001.358,524.278 L 1001.452,515.495 1006.825,517.555 C 1006.825,517.555 1007.19,516.66 1007.19,516.351 1007.282,515.805 1007.282,514.683 1007.099,514.181 1006.825,513.682 1005.823,513.061 1005.641,512.56 1005.459,512.096 1005.823,511.038 1005.641,510.583 1005.55,510.229 1004.913,509.744 1004.641,509.461 1004.365,509.188 1003.818,508.696 1003.727,508.358 1003.456,507.84 1003.272,506.09 1003.272,506.09 L 1002.817,497.442 1004.821,497.124 1007.099,502.409 1014.751,500.777 C 1015.026,501.706 1015.391,502.8 1015.575,503.421 1016.027,504.515 1016.94,506.657 1017.58,507.584 1018.125,508.313 1019.765,509.261 1020.13,510.072 1020.401,510.635 1020.313,511.941 1020.219,512.559 1020.13,513.417 1019.491,515.055 1019.402,515.921 1019.402,517.067 1019.583,519.4 1020.039,520.486 1020.22,521.132 1021.225,522.19 1021.496,522.809 1021.77,523.21 1021.861,524.277 1022.225,524.486 1022.499,524.632 1023.228,524.477 1023.411,524.249 1023.867,523.803 1023.777,522.446 1023.685,521.843 1023.593,521.124 1022.955,519.767 1022.865,519.047 1022.773,518.483 1022.773,517.343 1022.955,516.796 1023.139,516.331 1023.777,515.584 1023.959,515.119 1024.141,514.099 1023.867,511.958 1023.594,510.956 1023.411,510.153 1022.318,508.786 1022.046,507.985 1021.863,507.201 1022.046,505.451 1021.681,504.703 1021.407,504.13 1020.221,503.42 1019.95,502.862 1019.676,502.389 1019.221,501.286 1019.404,500.776 1019.585,500.011 1021.226,499.182 1021.955,498.771 1022.866,498.261 1024.78,497.441 1025.783,497.259 1026.692,497.085 1028.608,497.239 1029.519,497.331 1030.155,497.403 1031.43,497.823 1032.069,497.813 1032.617,497.802 1033.8,497.695 1034.256,497.331 1034.44,497.185 1034.621,496.894 1034.804,496.584 L 1043.643,500.056 1048.472,503.474 1059.77,495.892 1061.502,500.486 1066.787,499.199 1067.06,502.518 1074.896,501.232 1075.808,505.295 1083.008,502.462 1084.01,506.626 1081.73,508.284 1087.107,511.755 1089.66,515.064 1087.563,519.657 1083.917,519.446 1084.92,523.767 1099.681,523.284 V 526.09 L 1101.415,525.772 1102.689,523.046 1113.805,523.393 1114.171,521.342 1120.913,521.287 1123.282,522.526 1118.725,523.967 1125.195,527.493 1127.84,531.495 1127.747,537.024 1133.215,536.786 1132.85,538.027 1129.846,538.829 1131.848,543.995 1137.952,542.272 1141.597,547.793 C 1141.597,547.793 1142.145,549.088 1142.6,549.242 1142.783,549.317 1143.33,549.096 1143.512,548.961 1143.784,548.769 1144.058,548.113 1144.241,547.921 1144.514,547.73 1145.152,547.457 1145.515,547.475 1145.79,547.503 1146.335,547.895 1146.61,548.078 1146.975,548.334 1147.611,548.971 1147.886,549.243 1148.343,549.536 1149.07,550.155 1149.527,550.366 1149.799,550.512 1150.438,550.728 1150.8,550.72 1151.165,550.72 1151.714,550.31 1151.987,550.366 1152.259,550.401 1152.624,550.757 1152.807,550.919 1153.262,551.367 1153.901,552.452 1154.353,552.925 1155.083,553.783 1156.726,555.366 1157.636,556.134 1158.091,556.553 1158.912,557.7 1159.548,557.727 1159.822,557.746 1160.278,557.345 1160.461,557.173 1160.644,556.916 1160.916,556.152 1161.281,555.969 1161.645,555.778 1162.466,555.906 1162.828,555.886 1163.284,555.87 1164.287,555.714 1164.743,555.807 1165.014,555.878 1165.655,556.108 1165.836,556.37","name":"Запорізька область"},"26":{"path":"M399.07,429.11l-4.757,2.005s-0.136,1.485-0.155,1.978c-0.044,1.112-0.09,3.326,0,4.438,0.092,1.13,0.629,3.352,0.748,4.482,0.127,1.285,0.1,3.882,0.155,5.176,0.056,1.194,0.073,3.581,0.273,4.757,0.109,0.655,0.774,1.895,0.748,2.56-0.028,0.475-0.356,1.44-0.703,1.769-0.446,0.419-1.73,0.773-2.342,0.746-1.038-0.054-2.833-1.266-3.799-1.657-0.765-0.31-2.269-1.094-3.089-1.176-1.011-0.1-3.062,0.291-4.009,0.646-1.595,0.584-4.41,2.561-5.823,3.516-1.303,0.895-3.892,2.745-5.021,3.846-0.819,0.811-2.124,2.752-2.88,3.627-0.574,0.665-1.731,1.995-2.406,2.569-0.574,0.492-2.022,1.131-2.504,1.705-0.529,0.628-0.867,2.323-1.34,2.998-0.355,0.511-1.321,1.321-1.814,1.703-0.646,0.511-2.141,1.241-2.778,1.76-0.712,0.592-1.741,2.241-2.561,2.669-0.492,0.265-1.659,0.22-2.188,0.384-0.437,0.126-1.33,0.437-1.658,0.737-0.856,0.802-1.695,3.079-2.241,4.118-0.692,1.303-2.214,3.846-2.726,5.231-0.309,0.838-0.728,2.588-0.801,3.472-0.064,0.765,0.054,2.295,0.209,3.044,0.137,0.6,0.592,1.75,0.857,2.295,0.381,0.794,1.604,2.142,1.822,2.99,0.227,0.919-0.082,2.851-0.218,3.799-0.164,1.139-0.665,3.399-1.067,4.482-0.391,1.04-1.63,2.927-2.086,3.948-0.201,0.464-0.574,1.547-0.829,2.275-0.165-0.036-0.311-0.063-0.446-0.081-0.584-0.09-1.832,0.119-2.351-0.163-0.638-0.337-1.331-1.714-1.769-2.295-0.5-0.677-1.558-1.99-1.968-2.727-0.383-0.665-0.737-2.195-1.176-2.836-0.52-0.736-1.986-1.858-2.67-2.449-0.838-0.721-2.642-1.997-3.416-2.779-0.384-0.374-1.059-1.202-1.34-1.648-0.483-0.785-1.203-2.471-1.549-3.317-0.31-0.766-0.766-2.37-1.065-3.153-0.265-0.682-0.757-2.104-1.176-2.715-0.11-0.155-0.373-0.446-0.538-0.538-0.063-0.037-0.145-0.073-0.236-0.109,0.044-0.856,0.118-2.396,0.136-3.043,0.009-0.712-0.229-2.16,0-2.825,0.208-0.638,1.267-1.558,1.594-2.144,0.302-0.516,0.885-1.638,0.913-2.241,0.027-0.573-0.393-1.703-0.692-2.184-0.337-0.539-1.349-1.35-1.814-1.77-0.802-0.711-2.396-2.161-3.318-2.715-0.519-0.32-1.711-0.657-2.241-0.967-0.292-0.164-0.957-0.481-1.066-0.802-0.108-0.3,0.201-0.928,0.32-1.229,0.209-0.519,0.802-1.485,1.066-1.968,0.263-0.483,0.983-1.385,1.075-1.922,0.091-0.592-0.337-1.778-0.484-2.352-0.172-0.664-0.591-1.968-0.801-2.624-0.346-1.057-1.003-3.189-1.439-4.21-0.284-0.656-0.958-1.913-1.34-2.515-0.428-0.665-1.449-1.867-1.923-2.506-0.354-0.491-1.065-1.467-1.384-1.976-0.265-0.421-0.511-1.523-0.966-1.713-0.291-0.119-0.92,0.217-1.221,0.318-0.583,0.201-1.804,0.547-2.25,0.966-0.255,0.247-0.355,1.057-0.638,1.285-0.328,0.265-1.23,0.383-1.659,0.375-0.701-0.019-2.087-0.438-2.725-0.747-0.865-0.438-2.524-1.567-3.088-2.352-0.456-0.621-0.766-2.159-1.021-2.888-0.182-0.53-0.646-1.578-0.747-2.133-0.063-0.355-0.119-1.103,0-1.439,0.191-0.564,1.167-1.35,1.44-1.878,0.21-0.391,0.538-1.256,0.538-1.704,0-0.446-0.429-1.275-0.538-1.703-0.128-0.556-0.036-1.787-0.365-2.251-0.272-0.365-1.166-0.766-1.603-0.848-0.475-0.101-1.45,0.063-1.923,0.155-0.529,0.1-1.549,0.419-2.032,0.638-0.566,0.255-1.531,1.158-2.133,1.284-0.474,0.11-1.44-0.236-1.922-0.208-0.274,0.009-0.848,0.055-1.076,0.208-0.273,0.192-0.555,0.849-0.747,1.122-0.283,0.419-0.784,1.331-1.166,1.659-0.292,0.236-0.975,0.684-1.34,0.638-0.356-0.036-0.984-0.575-1.121-0.903-0.319-0.738,0.137-2.415,0.265-3.208,0.082-0.492,0.41-1.43,0.483-1.922,0.055-0.393,0.218-1.24,0.055-1.604-0.201-0.41-1.048-0.885-1.44-1.122-0.593-0.346-1.896-0.765-2.515-1.065-0.702-0.336-2.161-0.957-2.726-1.495-0.291-0.282-0.729-1.002-0.856-1.386-0.137-0.455-0.1-1.402-0.1-1.875,0-0.657,0.109-1.96,0.155-2.616,0.036-0.482,0.145-1.439,0.164-1.923,0.018-0.382,0.264-1.256,0-1.549-0.383-0.418-1.686-0.191-2.242-0.209-0.656-0.028-1.968,0.055-2.616,0.055-0.556-0.009-1.695,0.164-2.195-0.055-0.319-0.145-0.738-0.748-0.958-1.021-0.473-0.584-1.312-1.842-1.658-2.505-0.3-0.584-0.602-1.905-0.957-2.461-0.227-0.347-0.875-0.884-1.175-1.167-0.419-0.411-1.258-1.229-1.714-1.604-0.291-0.246-0.947-0.729-1.448-1.093l1.585-4.92,1.321-5.641,3.126-0.884,0.036-2.807-1.723-3.199,2.524-7.335,6.89-5.969v-2.241l6.25-3.6,5.122,2.078,3.891-0.756,6.807,0.237,2.041-1.439,3.281,1.476,3.762,0.966,4.576-0.802,4.802-1.923,2.807-1.558h2.925l0.956,2.607,3.089-0.283,1.121-5.887-0.602-1.203-7.536-1.121-0.236-3.243-2.406-2.087,2.205-3.281,3.326,1.64,2.041-3.407,0.283-3.727-1.404-3.043,3.327-3.646-1.121-1.995,2.323-5.249,4.165-0.438,0.603,3.646,1.321,0.675,3.445-1.003,10.178,3.981-0.292,4.794,2.569,5.075,1.649,12.921s1.394,0.784,1.869,1.012c0.702,0.338,2.123,0.931,2.833,1.229,0.465,0.192,1.586,0.33,1.868,0.748,0.137,0.2,0.11,0.748,0,0.966-0.2,0.374-1.057,0.747-1.439,0.958-0.794,0.428-2.57,0.929-3.309,1.438-0.455,0.311-1.348,1.048-1.548,1.549-0.192,0.456-0.1,1.495,0,1.979,0.118,0.601,0.583,1.758,0.956,2.241,0.402,0.528,1.541,1.284,2.086,1.658,0.557,0.383,1.796,0.975,2.352,1.386,0.547,0.41,1.694,1.266,2.023,1.867,0.201,0.383,0.301,1.276,0.265,1.714-0.018,0.292-0.11,0.975-0.374,1.12-0.237,0.137-0.83-0.119-1.066-0.264-0.364-0.228-0.729-1.157-1.122-1.34-0.328-0.154-1.084-0.074-1.439,0-0.373,0.083-1.011,0.565-1.384,0.639-0.42,0.091-1.304-0.173-1.713-0.046-0.301,0.091-0.939,0.438-1.012,0.748-0.119,0.437,0.501,1.266,0.747,1.648,0.219,0.356,0.749,1.022,1.067,1.286,0.337,0.292,1.185,0.647,1.549,0.911,0.492,0.346,1.412,1.148,1.813,1.604,0.411,0.455,0.912,1.63,1.385,2.022,0.666,0.556,2.36,1.047,3.153,1.394,0.71,0.292,2.278,0.647,2.833,1.167,0.311,0.301,0.585,1.157,0.748,1.549,0.21,0.501,0.684,1.495,0.748,2.032,0.072,0.647-0.401,1.923-0.32,2.562,0.055,0.472,0.383,1.411,0.693,1.767,0.302,0.347,1.14,0.875,1.604,0.903,0.355,0.027,1.056-0.31,1.33-0.528,0.3-0.246,0.593-1.013,0.856-1.286,0.257-0.264,0.811-0.884,1.176-0.855,0.438,0.036,1.112,0.81,1.23,1.229,0.118,0.456-0.328,1.375-0.483,1.813-0.101,0.292-0.483,0.82-0.483,1.12,0,0.42,0.282,1.349,0.647,1.55,0.311,0.183,1.076-0.255,1.44-0.209,0.61,0.074,1.767,0.619,2.296,0.957,0.638,0.418,1.641,1.612,2.241,2.086,0.493,0.392,1.504,1.148,2.087,1.385,0.301,0.129,0.966,0.364,1.275,0.274,0.439-0.137,1.012-0.921,1.286-1.285,0.22-0.3,0.446-1.049,0.693-1.34,0.155-0.165,0.52-0.51,0.747-0.529,0.437-0.045,1.267,0.465,1.604,0.748,0.355,0.292,0.856,1.084,1.066,1.494,0.32,0.601,0.583,1.968,0.912,2.561,0.246,0.473,0.883,1.358,1.276,1.713,0.464,0.419,1.549,1.075,2.141,1.285,0.582,0.2,1.877,0.092,2.451,0.319,0.455,0.173,1.331,0.711,1.604,1.121,0.483,0.712,0.656,2.506,0.748,3.363,0.062,0.583-0.147,1.777,0,2.352,0.272,1.084,1.429,3.079,2.131,3.954,0.22,0.16,0.47,0.41,0.75,0.67","name":"Івано-Франківська область"},"32":{"path":"M655.83,179.6l-3.17-3.8c0.009,0,0.009,0.008,0.018,0.008,0.345,0.128,1.121-0.182,1.439-0.373,0.511-0.31,1.083-1.478,1.603-1.758,0.411-0.238,1.396-0.365,1.869-0.329,0.693,0.054,1.951,0.701,2.615,0.857,0.356,0.082,1.102,0.336,1.44,0.209,0.282-0.092,0.629-0.611,0.801-0.849,0.447-0.609,0.994-2.022,1.45-2.615,0.5-0.684,1.758-1.85,2.396-2.405,0.729-0.629,2.323-1.723,3.097-2.296,0.776-0.575,2.343-1.705,3.099-2.297,0.411-0.32,1.139-1.102,1.603-1.341,0.512-0.253,1.668-0.509,2.243-0.528,0.446-0.018,1.476-0.082,1.759,0.264,0.346,0.43-0.137,1.642-0.101,2.188,0.054,0.939,0.22,2.852,0.638,3.691,0.282,0.555,1.157,1.53,1.704,1.813,0.82,0.419,2.725,0.446,3.636,0.483,0.419,0.009,1.256,0.009,1.658-0.109,0.566-0.184,1.521-0.912,2.023-1.232,0.528-0.337,1.932-1.274,2.142-1.274s2.569-0.264,3.417-0.429c0.419-0.083,1.312-0.172,1.659-0.428,0.292-0.228,0.492-1.011,0.747-1.286,0.283-0.318,0.965-0.911,1.385-1.01,0.71-0.173,2.159,0.364,2.889,0.482,1.486,0.228,4.51,0.483,5.977,0.848,0.757,0.192,2.188,0.838,2.934,1.066,0.593,0.191,1.961,0.209,2.407,0.647,0.428,0.411,0.392,1.776,0.691,2.296,0.311,0.547,1.24,1.44,1.713,1.869,0.501,0.456,1.95,0.965,2.188,1.603,0.146,0.383-0.311,1.194-0.374,1.604-0.101,0.594-0.155,1.795-0.209,2.397-0.083,0.765-0.402,2.287-0.328,3.043,0.054,0.528,0.31,1.613,0.647,2.032,0.328,0.41,1.339,0.839,1.814,1.067,0.509,0.254,1.594,0.664,2.132,0.855,0.61,0.21,1.85,0.547,2.458,0.748,0.52,0.173,1.614,0.446,2.079,0.747,0.438,0.283,1.04,1.167,1.45,1.494,0.3,0.255,0.947,0.748,1.33,0.857,0.182,0.054,0.539,0.109,0.784,0.063l-0.538,2.325c-0.391-0.21-0.939-0.393-1.257-0.411-0.683-0.037-1.959,0.775-2.644,0.72-0.292-0.027-0.784-0.356-1.047-0.483-0.527-0.264-1.513-0.965-2.077-1.12-0.565-0.156-1.741-0.092-2.324-0.083-0.72,0.019-2.215,0.512-2.88,0.248-0.4-0.165-0.72-1.158-1.121-1.286-0.473-0.146-1.44,0.547-1.932,0.483-0.427-0.064-1.093-0.757-1.521-0.884-0.456-0.136-1.559-0.4-1.922-0.082-0.355,0.318-0.382,1.503-0.155,1.922,0.409,0.766,2.305,1.229,3.044,1.686,0.602,0.375,1.659,1.358,2.323,1.604,0.528,0.191,1.732,0,2.241,0.237,0.63,0.29,1.86,1.248,2.005,1.922,0.155,0.738-1.039,2.049-1.121,2.806-0.09,0.802,0.365,2.396,0.474,3.199,0.092,0.583,0.192,1.75,0.33,2.324,0.127,0.574,0.828,1.667,0.72,2.241-0.101,0.537-0.912,1.394-1.368,1.685-0.593,0.383-2.033,0.602-2.716,0.72-1.057,0.174-3.262-0.082-4.255,0.32-0.428,0.181-1.267,0.766-1.439,1.202-0.154,0.418-0.055,1.431,0.245,1.759,0.311,0.364,1.377,0.392,1.842,0.483,0.629,0.136,1.949,0.173,2.559,0.401,0.885,0.328,2.535,1.339,3.209,2.005,0.765,0.766,1.858,2.697,2.323,3.681,0.357,0.766,0.993,2.36,1.04,3.207,0.072,1.267-0.612,3.773-1.04,4.966-0.309,0.831-1.357,2.296-1.686,3.126-0.236,0.593-0.264,1.959-0.638,2.479-0.236,0.328-0.985,0.755-1.367,0.884-0.51,0.172-1.749-0.2-2.16,0.164-0.292,0.255-0.446,1.148-0.319,1.513,0.127,0.382,0.957,0.729,1.202,1.047,0.275,0.355,0.839,1.156,0.794,1.604-0.046,0.591-1.257,1.348-1.44,1.922-0.155,0.511-0.237,1.723,0.081,2.16,0.365,0.492,1.896,0.364,2.326,0.802,0.528,0.538,0.81,2.141,0.965,2.879,0.191,0.984,0.008,3.053,0.32,4.01,0.318,1.002,1.293,2.998,2.159,3.599,0.62,0.437,2.215,0.493,2.961,0.565,0.621,0.055,1.997,0.375,2.488,0,0.492-0.383,0.72-1.786,0.638-2.406-0.118-0.912-1.54-2.323-1.841-3.198-0.327-0.957-0.52-2.998-0.564-4.01-0.055-1.439-0.083-4.383,0.327-5.769,0.319-1.085,1.722-2.916,2.242-3.918,0.402-0.792,1.295-2.341,1.44-3.207,0.208-1.23-0.502-3.727-0.402-4.966,0.074-0.949,0.584-2.789,0.885-3.691,0.209-0.638,0.875-1.822,1.039-2.479,0.2-0.818,0.391-2.523,0.317-3.362-0.063-0.646-0.709-1.841-0.718-2.488-0.01-0.2,0.026-0.446,0.082-0.71l1.521,0.026h1.604l1.12,0.73-0.52,5.367,2.479,6.607,1.441,0.875h3.408l0.838,2.806,0.163,4.365-1.048,0.566-2.241-1.522-2.16,4.044,3.526,0.52,2.078,0.838,2.043-0.365,0.847,0.329,0.2,1.558,1.923,1.24,2.516,0.127,4.729-0.565,4.246-1.039,3.289-1.084,1.158,0.118,0.838,1.003,0.117,1.167,1.889,1.521,1.722,1.403,0.237,1.076-0.604,1.203,0.65,0.437,0.8,0.484,0.601,3.125,0.803,3.363-0.364,1.722-1.368,0.438-2.359,0.328,0.082,1.322,0.685,1.402,0.282,1.312,1.273-0.474,1.485-0.52,3.163,3.399,3.928,0.046,4.119-0.365,3.727,0.483,3.727-0.519,3.481,0.355,2.77,1.167,1.075-1.203,1.405-1.404,7.088-0.355,0.601-1.969,4.328-3.645,6.005,2.242,0.684,4.811,6.37,1.039,2.242,2.241-7.856,4.093,4.493,7.244,3.766,0.036-4.293,6.771,5.969-0.154-1.222,10.761-0.956-0.483-2.562,4.22-3.097-2.324-4.165,9.769-2.133,2.087-0.27,2.09,2.854,2.724,1.574,0.456-7.097,3.446-1.229,5.795-2.059-0.19s-0.948,0.947-1.205,1.311c-0.309,0.457-0.774,1.486-0.983,2.005-0.173,0.428-0.519,1.293-0.537,1.758-0.01,0.301,0.374,0.902,0.245,1.175-0.138,0.284-0.828,0.447-1.12,0.565-0.255,0.101-0.866,0.109-1.05,0.319-0.235,0.263-0.173,1.048-0.263,1.384-0.108,0.402-0.564,1.549-0.564,1.549l-6.826-0.165s-0.676-0.665-0.755-0.957c-0.12-0.419,0.207-1.302,0.207-1.73,0.01-0.438,0.019-1.349-0.17-1.741-0.201-0.391-0.851-1.147-1.286-1.203-0.43-0.054-1.175,0.529-1.504,0.802-0.438,0.365-1.03,1.367-1.439,1.769-0.119,0.118-0.365,0.31-0.612,0.492,0.039-0.2,0.065-0.383,0.085-0.557,0.153-1.612-0.156-4.865-0.249-6.478-0.072-1.449-0.035-4.375-0.4-5.767-0.235-0.903-1.021-2.644-1.604-3.373-0.519-0.656-1.887-1.695-2.643-2.078-0.646-0.326-2.077-0.71-2.799-0.802-0.699-0.09-2.103,0.028-2.805,0.082-0.555,0.037-1.785-0.1-2.241,0.238-0.328,0.245-0.593,1.111-0.639,1.522-0.054,0.419,0.43,1.303,0.236,1.685-0.108,0.219-0.628,0.52-0.884,0.483-0.52-0.083-1.082-1.139-1.439-1.53-0.383-0.412-0.984-1.497-1.521-1.679-0.309-0.108-1.076-0.017-1.274,0.238-0.174,0.199-0.11,0.802,0,1.038,0.181,0.447,1.165,0.93,1.356,1.367,0.163,0.382,0.246,1.294,0.073,1.686-0.219,0.528-1.222,1.284-1.758,1.521-0.849,0.365-2.763,0.511-3.682,0.392-1.168-0.136-3.39-1.02-4.412-1.594-1.166-0.674-3.171-2.534-4.163-3.444-1.368-1.275-3.91-4.019-5.203-5.368-1.03-1.075-2.962-3.353-4.082-4.328-1.13-0.976-3.792-2.433-4.894-3.445-0.546-0.51-1.504-1.695-1.923-2.323-0.555-0.847-1.466-2.661-1.841-3.6-0.501-1.266-1.175-3.9-1.521-5.212-0.311-1.175-0.528-3.663-1.122-4.729-0.382-0.683-1.512-1.941-2.242-2.242-0.483-0.2-1.622-0.245-2.087,0-0.61,0.328-1.347,1.65-1.521,2.325-0.318,1.247,0.054,3.891,0.401,5.129,0.3,1.058,1.612,2.898,2.004,3.919,0.42,1.111,1.021,3.408,1.203,4.574,0.119,0.729-0.282,2.37,0.155,2.962,0.283,0.374,1.358,0.409,1.768,0.638,0.693,0.392,1.833,1.549,2.487,2.005,1.314,0.92,4.229,2.332,5.522,3.28,1.458,1.083,4.056,3.644,5.368,4.893,1.494,1.412,4.208,4.52,5.85,5.769,1.303,0.992,4.164,2.66,5.687,3.28,1.477,0.601,4.583,1.403,6.168,1.604,1.285,0.165,3.927,0.264,5.203,0,0.683-0.146,1.986-0.729,2.561-1.121,0.064-0.045,0.138-0.101,0.201-0.165l-0.392,6.17-7.701,2.159-1.64,1.723-0.874,7.573,1.275,1.922-0.119,5.485,0.839,2.89-5.559,7.845,1.395,2.324-2.961,4.127-7.527,7.008,1.157,2.124-0.557,1.285-5.686-0.246-0.082,1.841,1.557,3.491-6.44,3.479-5.933,1.522-4.164-3.598-1.287-0.201-0.162,0.72-1.04-0.046-1.677-1.358-1.048-0.118-6.689,2.679,1.287,2.041-0.521,0.802-3.964-4.046-1.767,0.847,1.649,3.199-3.09,1.768,1.805,5.048-0.282,1.195-3.563-0.037-0.921-1.805-9.613-2.242,0.201-5.886-5.804-0.046-3.327,0.802-3.645-0.355-5.076,2.377-0.819,4.647-1.449,1.148-0.483,4.593-1.996,1.968-6.306-1.094-2.779-3.963,0.593-0.091-0.11-2.24-3.946,0.054-1.021-1.713-0.108-4.802-3.792,0.474-6.033-8.483,6.516-4.703-6.352-15.172,2.079-2.297-2.297-3.143,0.318-5.34-3.361-1.604,0.912-3.308-1.55-5.185,7.956-3.581,6.733-5.977,8.803-4.483-7.364-9.13,3.627-4.01-1.01-2.934,2.613-1.44-2.131-4.12-2.405-0.318-0.803-2.78,2.451-5.067-2.605-2.568,1.704,0.164,0.319-5.449-9.56-7.736-3.791-7.854,3.627,0.208,2.141-3.361-2.461-1.869-0.801-2.506,2.515-2.086-0.583-1.713-3.426-2.341,0.054-2.617s1.696-1.093,2.298-1.394c1.057-0.537,3.352-1.221,4.382-1.813,0.912-0.529,2.716-1.731,3.363-2.56,0.465-0.602,1.083-2.032,1.176-2.779,0.09-0.738-0.365-2.205-0.484-2.943-0.054-0.319,0.083-1.13-0.209-1.274-0.282-0.146-0.828,0.473-1.121,0.582-0.627,0.236-1.949,0.639-2.624,0.647-0.683,0.008-2.022-0.355-2.669-0.593-0.446-0.164-1.367-0.555-1.704-0.902-0.237-0.255-0.72-0.92-0.584-1.23,0.156-0.401,1.203-0.437,1.596-0.591,0.501-0.191,1.503-0.557,1.977-0.803,0.364-0.182,1.211-0.482,1.384-0.847,0.228-0.465-0.063-1.558-0.264-2.032-0.265-0.647-1.513-1.568-1.705-2.242-0.146-0.51,0.164-1.569,0.21-2.086,0.046-0.493,0.164-1.978,0.164-1.978l-5.504-6.78-0.374-2.67,2.406-0.055,0.055-4,4.638-2.998-9.923-8.539-1.339,1.286-3.846-14.426,3.9-2.188,3.308,1.869,2.03-7.18z","name":"Київська область"},"35":{"path":"M882.63,511.41c-0.318-0.093-0.737-0.41-0.975-0.54-0.547-0.312-1.667-0.919-2.123-1.366-0.263-0.263-0.581-0.995-0.837-1.275-0.146-0.174-0.456-0.582-0.684-0.602-0.457-0.046-1.177,0.729-1.605,0.921-0.519,0.236-1.62,0.52-2.158,0.72-0.548,0.199-1.65,0.609-2.16,0.884-0.257,0.137-0.803,0.399-0.966,0.639-0.192,0.3-0.292,1.047-0.273,1.401,0.017,0.766,0.639,2.206,0.711,2.962,0.063,0.51,0.191,1.588-0.037,2.05-0.137,0.283-0.692,0.685-1.002,0.794-0.602,0.219-1.923,0.072-2.561,0.044-0.364-0.018-1.158,0.064-1.441-0.162-0.309-0.256-0.227-1.213-0.48-1.523-0.221-0.264-0.857-0.653-1.204-0.637-0.355,0.019-0.874,0.646-1.203,0.8-0.684,0.321-2.177,0.695-2.914,0.839-0.513,0.102-1.577,0.02-2.051,0.24-0.219,0.106-0.547,0.498-0.72,0.683-0.255,0.281-1.085,0.855-0.921,1.202,0.191,0.401,1.321,0.073,1.758,0.081,0.657,0.011,1.959-0.036,2.606-0.046,0.429,0,1.331-0.227,1.686,0,0.282,0.183,0.502,0.912,0.556,1.24,0.037,0.191,0.082,0.619-0.034,0.765-0.239,0.301-1.096,0.402-1.488,0.448-0.627,0.055-1.887-0.229-2.522-0.246-0.565-0.021-1.777-0.202-2.276,0.079-0.321,0.175-0.806,1.205-0.806,1.205l1.205,1.276s-3.481,10.733-3.362,10.733c-0.138,0.01-3.893,0.046-3.893,0.046l-4.445-1.887-9.57,4.129-2.403-4.85-3.043,0.365-3.245,2.314-2.278,3.444-3.564,0.803-1.046-1.276,0.2-2.287-2.444-4.884-8.929,1.402,0.118,2.277-0.883,1.05-7.006-0.129,1.885-2.277,0.354-4.41,2.206-1.24-1.403-1.119,0.482-1.04-2.441-3.681-0.318-1.97-1.887,0.485-3.645-3.292-1.523-5.805,3.929-1.521-2.561-3.964-3.044,0.201-2.169-1.805-1.724,0.601-2.12-2.004-1.925,1.24-0.035,1.603-3.528,2.041-2.961-0.119,1.442-2.996-0.12-1.522-5.332,0.354-1.84-1.521,0.884-1.757-10.18,0.552-3.563-4.279,1.004-1.924-2.278-2.643-4.895,0.52s-0.481-2.068-1.073-2.204c-0.237-0.056-0.529,0.547-0.767,0.601-0.646,0.173-2.112-0.347-2.679,0-0.155,0.1-0.183,0.528-0.327,0.646-0.146,0.128-0.619,0.091-0.757,0.238-0.364,0.399-0.402,2.122-0.402,2.122l-7.526,3.764-2.442-1.677-12.383,0.155-3.963,1.758-2.76,0.209-1.442,3.234s-0.865-0.817-1.165-1.072c-0.593-0.521-1.759-1.642-2.479-1.969-0.711-0.311-2.306-0.466-3.089-0.521-0.894-0.054-2.725-0.1-3.6,0.119-0.475,0.129-1.349,0.621-1.768,0.884-0.255,0.163-0.784,0.421-1.12,0.711-0.766,0.484-2.087,0.393-2.644,0.31-0.737-0.127-2.131-0.691-2.853-0.883-0.702-0.192-2.15-0.493-2.888-0.51-0.382-0.01-1.139,0.138-1.514,0.19-0.92,0.127-2.715,0.583-3.636,0.583-0.875,0-2.632-0.246-3.443-0.556-0.658-0.265-1.823-1.094-2.351-1.549-0.793-0.691-2.17-2.306-2.752-3.181-0.521-0.791-1.23-2.569-1.66-3.417-0.246-0.51-1.01-2.031-1.01-2.031l-1.787-0.208-0.109,4.262-3.762,0.082-2.151-3.135-3.062,0.091-0.182-2.905-2.989-2.296,8.494-11.272-0.593-2.562,2.459-2.079,3.253,1.596,2.461-3.627,1.175-0.911-0.018-0.138,4.983-1.676,1.121,0.664,1.23,5.505,5.314-6.543,4.774,2.644,13.669-10.598s1.64,1.176,2.25,1.467c0.583,0.283,1.832,0.729,2.478,0.802,0.656,0.063,1.987-0.073,2.607-0.282,0.427-0.147,1.366-0.511,1.557-0.921,0.128-0.273-0.062-0.929-0.2-1.203-0.291-0.61-1.412-1.477-1.804-2.042-0.365-0.529-1.149-1.639-1.193-2.286-0.046-0.51,0.474-1.486,0.673-1.959,0.22-0.511,0.557-1.64,1.003-1.958,0.218-0.156,0.784-0.201,1.047-0.165,0.265,0.045,0.712,0.374,0.958,0.483,0.201,0.091,0.593,0.355,0.803,0.319,0.291-0.046,0.811-0.484,0.919-0.757,0.2-0.501-0.128-1.604-0.236-2.132-0.146-0.657-0.693-1.896-0.849-2.56-0.118-0.556-0.482-1.75-0.272-2.278,0.155-0.42,0.946-0.93,1.322-1.167,0.756-0.473,2.459-1.103,3.315-1.358,0.766-0.237,2.333-0.61,3.126-0.646,0.902-0.027,2.715,0.164,3.562,0.446,0.667,0.219,1.814,1.067,2.453,1.357,0.392,0.184,1.203,0.547,1.64,0.603,1.057,0.145,3.181-0.273,4.247-0.366,0.763-0.053,2.304-0.264,3.078-0.237,0.811,0.028,2.425,0.257,3.208,0.484,0.729,0.219,2.059,1.047,2.797,1.239,0.429,0.109,1.322,0.12,1.769,0.164,0.455,0.046,1.377,0.229,1.84,0.201,0.813-0.055,2.37-0.592,3.162-0.766,1.142-0.236,3.408-0.739,4.566-0.838,1.131-0.101,3.417-0.174,4.529,0.036,0.745,0.146,2.194,0.684,2.842,1.085,0.438,0.282,1.058,1.194,1.521,1.439,0.237,0.128,0.773,0.283,1.038,0.247,0.504-0.092,1.313-0.785,1.725-1.085,0.372-0.272,1.175-0.802,1.403-1.203,0.209-0.355,0.153-1.221,0.318-1.604,0.127-0.291,0.454-0.864,0.719-1.038,0.43-0.273,1.503-0.301,2.006-0.365,0.592-0.073,1.794-0.017,2.368-0.155,0.41-0.1,1.213-0.437,1.558-0.682,0.438-0.302,1.277-1.031,1.475-1.522,0.139-0.302,0.057-0.992,0.048-1.322-0.02-0.565-0.101-1.686-0.2-2.242-0.118-0.582-0.492-1.722-0.685-2.287-0.163-0.493-0.574-1.458-0.719-1.959-0.109-0.374-0.354-1.139-0.318-1.522,0.035-0.346,0.318-1.03,0.565-1.285,0.208-0.228,0.828-0.436,1.12-0.555,0.382-0.164,1.174-0.528,1.594-0.52,0.319,0.01,0.876,0.329,1.168,0.438,0.282,0.1,0.854,0.383,1.155,0.4,0.548,0.037,1.586-0.391,2.124-0.446,0.493-0.036,1.532-0.146,1.969,0.083,0.292,0.165,0.501,0.938,0.802,1.084,0.29,0.146,0.992,0.082,1.32,0,0.42-0.1,1.177-0.583,1.559-0.803,0.63-0.364,1.804-1.247,2.441-1.603,0.428-0.228,1.295-0.675,1.76-0.802,0.428-0.11,1.349-0.283,1.768-0.154,0.327,0.1,0.802,0.673,1.076,0.883,0.317,0.237,0.964,0.693,1.282,0.92,0.412,0.292,1.25,0.858,1.643,1.158,0.254,0.191,0.829,0.519,0.966,0.802,0.118,0.246,0.063,0.811,0.036,1.083-0.027,0.301-0.346,0.903-0.283,1.205,0.055,0.2,0.365,0.509,0.529,0.637,0.192,0.155,0.629,0.464,0.876,0.437,0.418-0.037,1.047-0.72,1.33-1.039,0.326-0.364,0.69-1.321,1.038-1.685,0.337-0.355,1.184-0.93,1.639-1.121,0.34-0.137,1.112-0.119,1.439-0.282,0.393-0.191,0.922-0.975,1.322-1.158,0.556-0.264,1.832-0.391,2.45-0.355,0.521,0.018,1.551,0.318,2.033,0.519,0.512,0.202,1.367,0.931,1.888,1.075,0.345,0.101,1.111,0.191,1.439,0.045,0.228-0.1,0.509-0.556,0.646-0.765,0.183-0.292,0.665-0.901,0.601-1.24-0.073-0.346-0.802-0.674-1.048-0.92-0.246-0.236-0.919-1.003-0.919-1.003l4.044-1.758,2.444-9.331,9.048-1.886,0.081,2.688,3.809,2.643,2.68-2.323,3.125,9.048,3.327-2.642,1.402-1.959,1.158,3.799,4.29,0.319,1.396-2.123,2.168,2.926,10.938-1.004-3.609-5.32,0.737-5.761c0.128-0.044,0.237-0.081,0.336-0.089,0.666-0.11,2.032-0.046,2.717-0.055,0.856-0.01,2.569,0.091,3.416,0,0.583-0.064,1.749-0.264,2.297-0.483,0.355-0.137,0.921-0.684,1.285-0.802,0.721-0.227,2.288-0.227,3.043-0.154,0.575,0.055,1.668,0.583,2.243,0.529,0.39-0.037,1.048-0.602,1.439-0.639,0.354-0.036,1.11,0.1,1.393,0.319,0.292,0.237,0.711,0.967,0.692,1.339-0.016,0.439-0.848,1.067-0.965,1.496-0.218,0.838,0.356,2.604,0.219,3.472-0.085,0.537-0.365,1.704-0.801,2.023-0.528,0.391-2.024-0.109-2.616,0.164-0.273,0.128-0.738,0.574-0.857,0.856-0.082,0.201-0.127,0.674,0,0.857,0.174,0.236,0.829,0.391,1.121,0.373,0.238-0.018,0.621-0.373,0.856-0.427,0.284-0.073,0.876-0.073,1.176-0.055,0.367,0.019,1.103,0.364,1.439,0.209,0.384-0.164,0.711-1.02,0.902-1.385,0.254-0.446,0.773-1.367,0.856-1.869,0.082-0.446-0.309-1.394-0.153-1.813,0.254-0.711,1.503-1.73,2.131-2.141,0.62-0.401,2.05-0.92,2.779-1.066,0.655-0.128,2.014-0.165,2.671-0.056,0.565,0.102,1.621,0.557,2.132,0.802,0.311,0.147,0.839,0.703,1.175,0.694,0.183,0,0.402-0.083,0.638-0.202l0.483,1.968-0.639,2.242-3.309-0.273,5.176,8.658,3.417,1.12,0.222-2.889,3.471,0.055,1.276,2.196,4.866,0.045,1.12,2.033,1.76,0.109,2.122-4.493c0.218,0.419,0.446,0.857,0.711,1.021,0.719,0.473,2.552,0.501,3.418,0.529,0.691,0.028,2.086-0.292,2.768-0.21,0.758,0.091,2.232,0.574,2.89,0.966,0.602,0.355,1.466,1.503,2.031,1.913,0.858,0.648,2.816,1.578,3.736,2.142,0.467,0.282,1.168,0.719,1.86,1.166l-0.073,2.789h-3.08l1.796,6.843-0.757,1.24-8.894-0.155s-0.975-0.62-1.122-0.966c-0.188-0.474,0.248-1.531,0.165-2.042-0.072-0.411-0.301-1.358-0.685-1.522-0.219-0.089-0.664,0.238-0.885,0.32-0.39,0.164-1.146,0.556-1.559,0.684-0.39,0.128-1.264,0.09-1.602,0.318-0.265,0.191-0.43,0.911-0.683,1.122-0.211,0.182-0.766,0.336-1.039,0.4s-0.866,0.009-1.12,0.118c-0.364,0.174-1.204,1.085-1.204,1.085l1.004,5.213,6.523-0.246,4.691,4.483,1.913,0.081,0.886,0.765-6.441,6.562-6.89,4.529s-1.35-1.577-1.96-1.841c-0.346-0.147-1.131-0.183-1.486-0.082-0.281,0.082-0.701,0.547-0.966,0.684-0.273,0.136-0.928,0.191-1.156,0.401-0.247,0.219-0.5,0.875-0.527,1.203-0.021,0.346,0.436,1.011,0.362,1.357-0.063,0.348-0.611,0.838-0.802,1.121-0.302,0.446-1.011,1.285-1.156,1.804-0.155,0.539,0,1.686,0.037,2.243,0.071,0.964,0.354,2.889,0.481,3.843,0.229,1.687,1.149,5.041,0.959,6.735-0.057,0.584-0.631,1.649-0.839,2.196-0.165,0.438-0.648,1.267-0.639,1.721,0.008,0.421,0.329,1.259,0.639,1.524,0.136,0.106,0.509,0.106,0.683,0.164,0.302,0.089,0.955,0.236,1.202,0.436,0.318,0.275,0.756,1.039,0.874,1.44,0.246,0.8,0.02,2.506,0.129,3.327,0.083,0.673,0.709,1.976,0.592,2.64-0.083,0.476-0.618,1.366-1.038,1.606-0.292,0.163-1.049-0.102-1.358,0.044-0.4,0.174-1.165,0.813-1.203,1.239-0.035,0.356,0.911,0.855,0.803,1.202-0.174,0.52-1.521,0.584-2.041,0.757-0.52,0.174-1.612,0.337-2.088,0.603-0.373,0.2-1.047,0.767-1.274,1.121-0.174,0.254-0.129,0.975-0.364,1.164-0.429,0.33-1.623,0.102-2.162,0.118-0.719,0.02-2.176-0.135-2.887,0-0.374,0.074-1.094,0.338-1.403,0.559-0.282,0.209-0.785,0.746-0.874,1.083-0.11,0.392,0.328,1.214,0.236,1.604-0.082,0.354-0.63,0.902-0.84,1.201-0.19,0.257-0.565,0.785-0.765,1.039-0.189,0.247-0.491,0.976-0.792,0.959-0.383-0.019-0.692-0.896-0.847-1.24-0.256-0.574-0.412-1.842-0.602-2.443-0.166-0.51-0.401-1.603-0.758-2.004-0.182-0.19-0.701-0.465-0.966-0.473-0.384-0.02-1.192,0.257-1.441,0.556-0.244,0.3-0.301,1.139-0.281,1.521,0.037,0.702,0.556,2.023,0.758,2.688,0.145,0.445,0.519,1.329,0.602,1.804,0.055,0.266,0.101,0.812,0.045,1.076-0.073,0.347-0.328,1.057-0.601,1.284-0.293,0.23-1.086,0.221-1.442,0.318-0.829,0.237-2.449,0.804-3.243,1.122-0.773,0.309-2.275,1.021-3.043,1.357-0.729,0.327-2.23,0.893-2.925,1.286-0.247,0.136-0.647,0.62-0.92,0.638-0.064,0.009-0.12,0-0.194-0.018","name":"Кіровоградська область"},"09":{"path":"M1345.2,464.34c0,0.639,0.184,1.967,0,2.56-0.182,0.347-0.729,0.947-1.094,1.066-0.366,0.137-1.275-0.2-1.639-0.209-0.365-0.008-1.095-0.074-1.366,0.101-0.275,0.172-0.549,0.819-0.728,1.121-0.186,0.61-0.276,1.967-0.55,2.57-0.274,0.536-1.002,1.439-1.368,1.921-0.272,0.393-1.003,1.113-1.185,1.55-0.271,0.556-0.545,1.785-0.637,2.397-0.182,0.793-0.273,2.406-0.365,3.207-0.091,0.72,0,2.232-0.363,2.889-0.184,0.465-1.096,1.121-1.458,1.494-0.274,0.284-1.003,0.748-1.094,1.122-0.274,0.39-0.274,1.329-0.183,1.757,0.091,0.502,0.911,1.249,1.185,1.713,0.274,0.548,0.82,1.677,0.911,2.287,0.183,1.095-0.091,3.336-0.272,4.438-0.092,1.076-0.364,3.272-0.729,4.274-0.456,0.966-1.731,2.651-2.461,3.417-0.547,0.583-1.731,1.678-2.46,2.022-1.002,0.485-3.188,0.832-4.283,0.967-0.819,0.108-2.551,0.045-3.462,0.108-0.819,0.056-2.552,0.529-3.372,0.374-0.638-0.118-1.641-1.03-2.186-1.175-0.547-0.128-1.55-0.063-2.097,0-0.729,0.099-2.277,0.639-3.099,0.801-0.729,0.155-2.278,0.422-3.099,0.475-0.638,0.065-2.096,0.065-2.824,0-0.819-0.063-2.46-0.52-3.28-0.528-1.094-0.01-3.098,0.409-4.192,0.583-0.818,0.146-2.367,0.511-3.189,0.647-0.82,0.136-2.552,0.475-3.462,0.429-0.456-0.036-1.368-0.328-2.005-0.521l0.092-1.805-2.188-1.849,0.365-4.64,0.637-1.601-5.738-2.672-0.275-2.223-8.018-0.021-3.189,1.651-0.913-5.049-2.006-0.373,0.548-1.869,0.092-4.429s-2.825-0.866-3.827-1.064c-1.276-0.273-4.009-0.337-5.284-0.722-0.73-0.246-2.278-0.992-3.009-1.448-0.638-0.454-2.003-1.483-2.461-2.188-0.272-0.409-0.454-1.402-0.545-1.867-0.183-0.574-0.729-2.296-0.729-2.296l-6.652-2.588-2.915-0.026,0.091-6.033,2.644-1.257-0.912-1.869h-1.457l-2.188-2.587s-1.184-2.507-1.822-3.208c-0.183-0.253-0.729-0.765-1.002-0.857-0.365-0.09-1.003,0.056-1.275,0.164-0.547,0.165-1.824,1.04-1.824,1.04l-3.007-2.726,2.096-4.19s-0.728-1.058-1.001-1.332c-0.729-0.575-2.371-1.212-3.1-1.768-0.638-0.538-1.912-1.777-2.278-2.559-0.364-0.712-0.182-2.334-0.364-3.1-0.091-0.82-0.819-2.378-0.911-3.208-0.181-0.803-0.181-3.252-0.181-3.252l2.914-3.846-0.18-3.044-5.65-2.568,3.005-3.892-0.545-3.899s1.275-0.657,1.275-1.066c0-0.547-1.184-1.239-1.729-1.286-0.368-0.027-0.911,0.629-1.185,0.593-0.367-0.046-0.912-0.656-1.187-0.966-0.273-0.427-0.362-1.476-0.457-1.977-0.18-0.402-0.363-1.194-0.454-1.595,0-0.382,0.274-1.121,0.274-1.504-0.092-0.41-0.549-1.138-0.64-1.549-0.09-0.4,0.091-1.393-0.271-1.648-0.183-0.2-0.912,0.027-1.186,0.099-0.546,0.147-1.549,0.739-2.187,0.912-0.911,0.292-2.734,0.775-3.738,0.803-1.091,0.037-3.37-0.474-4.556-0.693-0.728-0.145-2.277-0.354-3.007-0.692-0.364-0.191-1.275-1.075-1.275-1.075l6.743-4.957s-1.64-2.206-2.095-2.999c-0.366-0.737-1.368-2.241-1.459-3.097,0-0.556,0.638-1.568,0.912-2.078,0.181-0.547,0.911-1.558,1.002-2.141,0.182-0.585,0.364-1.869,0.09-2.397-0.09-0.229-0.639-0.419-0.82-0.538-0.271-0.136-0.729-0.547-1.002-0.483-0.364,0.083-0.728,0.801-0.91,1.066-0.274,0.4-1.186,1.604-1.186,1.604l-5.65-1.814-2.005-1.176-0.91-6.086-3.098-1.139,1.64-2.441-0.09-4.375,3.645,1.896s0.636-0.555,0.73-0.802c0.088-0.272,0.088-0.884-0.093-1.147-0.093-0.328-0.638-0.802-1.003-0.993-0.455-0.283-1.549-0.5-2.005-0.72-0.545-0.218-1.639-0.593-1.912-1.012-0.273-0.292-0.455-1.075-0.548-1.439-0.273-1.094-0.91-3.289-1.093-4.411-0.089-0.664,0-2.031-0.182-2.696-0.093-0.594-0.548-1.723-0.73-2.297-0.271-0.565-0.82-1.641-0.909-2.242-0.091-0.766,0.273-2.314,0.454-3.07,0.091-0.61,0.274-1.969,0.638-2.424,0.273-0.255,1.003-0.292,1.368-0.456,0.273-0.155,0.817-0.501,1.002-0.775,0.182-0.229,0.273-0.811,0.182-1.039-0.089-0.219-0.637-0.329-0.82-0.428-0.273-0.137-1.091-0.228-1.184-0.511-0.183-0.272,0-0.965,0.093-1.229,0.271-0.346,1.091-0.71,1.545-0.847,0.547-0.218,1.823-0.218,2.37-0.428,0.457-0.155,1.368-0.52,1.549-0.884,0.365-0.51,0.365-1.84,0.456-2.461,0.183-0.574,0.274-1.722,0.456-2.295,0.092-0.475,0.092-1.532,0.454-1.869,0.275-0.274,1.276-0.073,1.55-0.347,0.185-0.2,0.273-0.829,0.273-1.121,0-0.373-0.089-1.122-0.273-1.467-0.273-0.793-1.366-2.161-1.823-2.834-0.454-0.511-1.093-1.75-1.731-1.95-0.453-0.128-1.457,0.765-1.729,0.429-0.366-0.419,0.728-1.495,0.818-2.032,0.183-0.492,0.093-1.576,0.274-2.051,0.091-0.282,0.547-0.837,0.82-0.965,0.182-0.084,0.637-0.019,0.819,0.054,0.365,0.119,0.728,0.803,1.093,0.803,0.364,0.008,0.822-0.584,1.094-0.803,0.273-0.264,0.91-0.875,1.186-1.148,0.364-0.346,1.184-1.021,1.64-1.275,0.364-0.193,1.366-0.183,1.457-0.539,0.092-0.182-0.182-0.564-0.363-0.691-0.456-0.402-1.823-0.447-2.458-0.666-0.275-0.128-1.097-0.374-1.277-0.648-0.274-0.3-0.729-1.157-0.548-1.548,0.093-0.237,0.729-0.31,0.82-0.5,0.182-0.229,0.182-0.938,0.365-1.122,0.272-0.228,1.094,0.009,1.456-0.081,0.275-0.072,0.912-0.264,1.004-0.511,0.273-0.573-0.092-1.967-0.275-2.587-0.181-0.51-0.637-1.468-1-1.896-0.366-0.565-1.822-1.284-2.097-1.949-0.092-0.272,0-0.938,0.091-1.376,0.456,0.156,1.366,0.1,1.822,0.018,0.729-0.155,2.097-0.855,2.734-1.285,0.819-0.52,2.097-1.913,2.734-2.561,0.364-0.346,1.184-0.956,1.457-1.394,0.365-0.72,0.457-2.397,0.639-3.198,0.091-0.748-0.093-2.26,0.091-2.998,0.089-0.593,0.362-1.85,0.728-2.296,0.365-0.365,1.367-0.693,1.822-0.792,0.548-0.12,1.641-0.028,2.097-0.056,0.549-0.037,1.641-0.328,2.187-0.218,0.274,0.064,0.911,0.336,1.003,0.592,0.456,0.638,0.456,2.314,0.547,3.089,0.183,0.72,0.092,2.215,0.363,2.888,0.183,0.384,0.64,1.149,1.096,1.34,0.455,0.255,1.731,0,2.277,0,0.638-0.009,1.913-0.055,2.551-0.055,0.639,0,1.914-0.245,2.461,0.055,0.455,0.274,0.912,1.449,1.185,1.922,0.272,0.393,0.729,1.404,1.185,1.541,0.274,0.091,0.82-0.284,1.094-0.42,0.638-0.337,1.73-1.265,2.277-1.658,0.822-0.555,2.552-1.777,3.464-2.087,0.547-0.154,1.549-0.118,2.095-0.154,0.729-0.055,2.187-0.456,2.825-0.164,0.638,0.282,1.367,1.522,1.639,2.141,0.276,0.52,0.185,1.74,0.457,2.242,0.547,0.901,2.277,2.15,3.007,2.825,0.639,0.537,1.824,1.722,2.644,2.031,0.454,0.22,1.641,0.22,2.278,0.264,0.911,0.073,2.825-0.246,3.736,0.164,0.272,0.119,0.546,0.621,0.728,0.857,0.365,0.446,0.821,1.421,1.094,1.922,0.364,0.647,0.821,2.078,1.275,2.67,0.274,0.356,0.911,1.067,1.275,1.175,0.549,0.11,1.552-0.345,2.005-0.537,0.912-0.364,2.552-1.395,3.372-1.868,0.911-0.52,2.825-1.44,3.646-2.087,0.637-0.427,1.548-1.54,2.096-2.022,0.365-0.328,1.002-1.202,1.46-1.23,0.636-0.045,1.638,0.838,2.002,1.23,1.003,0.801,2.371,2.871,3.098,3.791,0.73,0.766,2.006,2.397,2.826,2.989,0.455,0.301,1.458,0.71,2.004,0.856,0.455,0.137,1.549,0.137,2.005,0.264,0.729,0.191,2.096,0.984,2.825,1.122,0.457,0.091,1.367,0.091,1.822,0,0.548-0.109,1.459-0.692,2.005-0.857,0.456-0.127,1.274-0.419,1.731-0.373,0.639,0.063,1.73,0.812,2.278,1.02,0.455,0.174,1.55,0.456,2.005,0.529,0.729,0.092,2.004,0,2.734,0.055,0.455,0.037,1.366,0,1.821,0.264,0.364,0.292,0.729,1.303,0.818,1.767,0.274,0.729,0.55,2.287,0.731,3.044,0.18,0.784,0.545,2.388,1.001,3.099,0.272,0.592,1.276,1.612,1.823,2.022,0.455,0.32,1.367,0.747,1.914,0.966,0.547,0.246,1.64,0.674,2.186,0.901,0.64,0.293,1.914,0.866,2.552,1.185,0.637,0.283,1.823,1.021,2.458,1.222,0.551,0.191,1.916,0.191,2.463,0.319,0.729,0.136,1.915,0.71,2.552,0.747,0.729,0.046,2.095-0.137,2.732-0.418,0.729-0.365,1.915-1.65,2.553-2.252,0.455-0.473,1.274-1.547,1.821-2.022,0.549-0.529,1.55-1.668,2.188-1.977,0.457-0.201,1.459-0.265,1.915-0.265,0.453-0.01,1.276,0.155,1.73,0.21,0.639,0.081,1.913,0.228,2.552,0.319,0.456,0.063,1.275,0.09,1.73,0.273,0.548,0.273,1.55,1.139,1.824,1.704,0.18,0.301,0.272,1.039,0.09,1.339-0.181,0.302-0.821,0.602-1.185,0.639-0.272,0.028-0.729-0.347-1.003-0.264-0.454,0.154-1.001,1.184-1.274,1.594-0.548,0.793-1.731,2.351-2.096,3.263-0.274,0.602-0.457,1.915-0.364,2.562,0,0.746,0.637,2.159,0.91,2.832,0.455,0.976,1.823,2.717,2.461,3.628,0.727,1.22,2.37,3.653,3.099,4.911,0.453,0.82,1.367,2.478,1.639,3.372,0.273,0.619,0.456,1.914,0.548,2.56,0.09,0.792,0.273,2.396,0.273,3.207,0,0.529,0.272,1.623,0.091,2.133-0.364,0.902-1.822,2.196-2.46,2.935-0.819,1.101-2.735,3.244-3.463,4.438-0.638,0.893-1.55,2.806-2.006,3.79-0.272,0.684-0.548,2.188-1.002,2.824-0.274,0.593-1.366,1.477-1.822,2.034-0.548,0.854-1.276,2.915-2.004,3.689-0.456,0.546-1.822,1.385-2.461,1.65-0.82,0.282-2.46,0.228-3.189,0.428-0.547,0.127-1.548,0.5-2.004,0.746-0.364,0.219-1.002,0.93-1.458,1.067-0.64,0.191-1.914-0.109-2.552-0.055-0.729,0.082-2.277,0.456-3.098,0.703-0.638,0.2-2.096,0.492-2.46,1.066-0.274,0.4-0.185,1.485,0,1.922,0.181,0.381,0.908,1.029,1.274,1.176,0.273,0.11,1.002-0.01,1.277-0.111,0.362-0.108,0.909-0.764,1.274-0.746,0.455,0.018,1.093,0.684,1.366,0.966,0.548,0.427,1.276,1.512,1.823,1.967,0.729,0.738,2.46,2.014,3.188,2.725,0.729,0.665,2.279,1.969,2.826,2.779,0.275,0.346,0.363,1.239,0.637,1.549,0.637,0.593,2.277,1.076,3.008,1.44,0.82,0.383,2.279,1.349,3.098,1.548,0.729,0.173,2.277,0.127,3.008,0,0.455-0.09,1.549-0.383,2.003-0.747,0.366-0.319,0.549-1.285,0.819-1.713,0.093-0.319,0.274-1.085,0.549-1.275,0.273-0.165,0.911-0.045,1.184,0,0.274,0.044,0.911,0.163,1.188,0.374,0.363,0.3,0.636,1.204,0.727,1.649,0.091,0.593,0,1.813-0.091,2.406-0.092,0.729-0.272,2.214-0.636,2.833-0.366,0.52-1.369,1.25-1.916,1.605-0.546,0.419-1.823,1.174-2.551,1.44-0.729,0.281-2.278,0.583-3.098,0.691-0.729,0.109-2.46,0.483-3.189,0.164-0.638-0.264-1.275-1.549-1.731-2.031-0.365-0.411-1.095-1.268-1.549-1.55-0.366-0.191-1.183-0.592-1.552-0.429-0.544,0.264-0.727,1.695-1,2.243-0.274,0.546-0.912,1.621-1.184,2.132-0.455,0.638-1.459,1.787-1.822,2.46-0.184,0.52-0.551,1.623-0.639,2.196-0.09,0.776,0.181,2.36,0.181,3.144-0.093,0.739-0.363,2.205-0.638,2.888-0.271,0.575-1.001,1.559-1.366,2.079-0.366,0.574-1.276,1.658-1.55,2.295-0.18,0.491-0.273,1.558-0.273,2.087,0,0.557,0.184,1.686,0.457,2.188,0.272,0.656,1.275,1.84,1.913,2.187,0.454,0.292,1.731,0.401,2.278,0.374,0.73-0.019,1.913-0.556,2.552-0.584,0.819-0.037,2.369,0.091,3.097,0.428,0.822,0.402,2.279,1.769,2.734,2.562,0.455,0.665,0.912,2.223,1.094,2.988,0.184,0.857,0.184,2.616,0.366,3.472,0.179,0.856,0.545,2.587,1,3.363,0.364,0.702,1.367,1.941,1.913,2.459,0.456,0.429,1.642,1.004,2.189,1.332,0.364,0.255,1.276,0.666,1.638,1.021,0.184,0.2,0.456,0.691,0.55,0.956,0.089,0.356,0.18,1.149,0,1.45-0.275,0.336-1.187,0.428-1.55,0.582-0.457,0.201-1.64,0.438-2.005,0.858-0.275,0.382-0.366,1.431-0.366,1.923,0,0.518,0.274,1.612,0.548,2.032,0.364,0.445,1.457,1.111,2.004,1.12,0.545,0,1.369-0.938,1.914-1.075,0.457-0.11,1.458-0.11,1.914,0,0.363,0.108,1.183,0.511,1.457,0.801,0.364,0.355,0.911,1.276,1.003,1.769,1.3,0.89,1.2,2.65,1.2,3.53","name":"Луганська область"},"46":{"path":"M380.54,266.74l4.045,0.865,0.119,2.406-3.718,1.924,0.201,10.05,12.092,14.379s0.228-0.255,0.592-0.638l1.567,4.027-2.879,9.769-3.526,3.152s-0.993,0.557-1.332,0.483c-0.41-0.091-0.992-0.802-1.175-1.174-0.218-0.438,0.055-1.559-0.272-1.922-0.138-0.156-0.593-0.229-0.794-0.219-0.519,0.027-1.458,0.501-1.921,0.701-0.401,0.165-1.13,0.692-1.55,0.748-0.455,0.045-1.32-0.382-1.768-0.374-0.848,0.009-2.478,0.61-3.308,0.793-0.893,0.209-2.843,0.219-3.581,0.755-0.437,0.311-0.984,1.339-1.066,1.868-0.11,0.729,0.409,2.178,0.637,2.88,0.174,0.537,0.912,2.086,0.912,2.086l-1.978,4.219-4.27,0.48-3.891,5.44-6.305,4.646-10.151,3.362,1.166,5.294-0.073,1.129-10.178-3.981-3.445,1.003-1.321-0.675-0.603-3.646-4.164,0.438-2.323,5.249,1.121,1.995-3.327,3.646,1.404,3.053-0.283,3.717-2.041,3.407-3.326-1.64-2.205,3.281,2.406,2.086,0.237,3.245,7.536,1.12,0.601,1.204-1.121,5.887-3.089,0.283-0.956-2.607h-2.925l-2.807,1.558-4.802,1.923-4.576,0.802-3.762-0.966-3.281-1.477-2.041,1.44-6.807-0.237-3.891,0.756-5.122-2.078-6.25,3.6v2.25l-6.89,5.96-2.524,7.335,1.723,3.199-0.036,2.807-3.126,0.884-1.321,5.641-1.585,4.92-0.702,2.168-8.247-1.605-2.925-4.282-4.364-2.396-4.329,0.155-5.804-7.563-7.527,1.677-2.169-6.971-3.444-4.164-0.919-4.202,4.327-2.286-6.643-7.117c0.501,0.008,1.038-0.029,1.358-0.129,0.51-0.172,1.53-0.792,1.758-1.285,0.355-0.774-0.019-2.604-0.319-3.407-0.337-0.903-1.622-2.387-2.241-3.117-0.429-0.51-1.559-1.295-1.841-1.886-0.218-0.456-0.146-1.514-0.246-2.006-0.091-0.455-0.254-1.412-0.52-1.794-0.255-0.394-1.066-0.903-1.439-1.167-0.328-0.237-1.14-0.52-1.368-0.839-0.282-0.401-0.41-1.431-0.4-1.922,0.017-0.701,0.428-2.077,0.683-2.724,0.264-0.675,1.129-1.851,1.367-2.525,0.229-0.675,0.41-2.096,0.475-2.807,0.182-1.904,0.082-5.741,0.127-7.645,0.036-1.723,0.183-5.166,0.2-6.889,0.009-1.148-0.036-3.425-0.044-4.574-0.009-0.684,0.31-2.169-0.038-2.762-0.191-0.309-0.938-0.591-1.284-0.719-0.419-0.155-1.313-0.327-1.759-0.355-0.41-0.036-1.375,0.392-1.649,0.073-0.246-0.292,0.219-1.149,0.328-1.522,0.265-0.92,0.793-2.825,1.358-3.599,0.948-1.294,3.791-2.961,5.011-4.01,0.958-0.819,2.815-2.523,3.718-3.398,1.303-1.276,3.827-3.9,5.048-5.249,2.261-2.479,6.571-7.609,8.775-10.133,1.204-1.387,3.563-4.21,4.839-5.531,2.479-2.56,7.882-7.227,10.379-9.769,1.303-1.331,3.708-4.182,5.002-5.532,1.057-1.093,3.227-3.234,4.365-4.246,0.93-0.811,2.88-2.315,3.846-3.08,1.531-1.221,4.538-3.717,6.133-4.848,2.296-1.622,7.171-4.464,9.531-6.005,1.367-0.901,4.019-2.815,5.404-3.69,0.546-0.336,1.832-0.784,2.242-1.275,0.419-0.511,0.62-1.869,0.847-2.488,0.338-0.929,0.875-2.889,1.476-3.681,0.319-0.411,1.194-0.993,1.641-1.24,0.492-0.264,1.531-0.701,2.087-0.765,0.765-0.082,2.279,0.319,3.043,0.402,1.211,0.137,3.626,0.556,4.848,0.482,0.519-0.027,1.549-0.263,2.041-0.438,0.729-0.265,2.068-1.075,2.761-1.403,0.911-0.437,2.88-1.048,3.69-1.64,0.329-0.246,0.848-0.902,1.077-1.248,0.564-0.83,1.366-2.661,1.803-3.564,0.411-0.847,1.376-2.486,1.568-3.408,0.182-0.902-0.082-2.76-0.119-3.682-0.063-1.284-0.09-3.862-0.329-5.119-0.2-1.122-1.165-3.218-1.357-4.33-0.1-0.601-0.127-1.831-0.082-2.442,0.045-0.51,0.375-1.494,0.401-2.004,0-0.082,0.009-0.182,0.009-0.291,0.375,0.692,0.766,1.476,0.912,1.896,0.272,0.782,0.3,2.514,0.638,3.28,0.273,0.602,1.157,1.603,1.604,2.087,0.855,0.902,2.824,2.432,3.763,3.244,1.84,1.585,5.622,4.638,7.335,6.368,0.246,0.248,0.564,1.067,0.92,1.077,0.457,0.018,0.958-0.957,1.276-1.276,0.365-0.365,1.048-1.121,1.45-1.449,0.438-0.356,1.321-1.267,1.877-1.24,0.409,0.028,0.946,0.766,1.247,1.049,0.338,0.309,1.121,0.883,1.277,1.32,0.09,0.237-0.127,0.748-0.073,0.994,0.082,0.51,0.529,1.495,0.875,1.886,0.291,0.328,1.084,0.747,1.485,0.92,0.757,0.338,2.407,0.646,3.199,0.884,0.702,0.2,2.214,0.364,2.761,0.838,0.265,0.228,0.483,0.92,0.61,1.239,0.256,0.692,0.301,2.269,0.757,2.844,0.201,0.254,0.92,0.354,1.121,0.601,0.246,0.311,0.375,1.129,0.401,1.521,0.063,0.793-0.21,2.379-0.319,3.172-0.092,0.638-0.546,1.914-0.483,2.56,0.037,0.356,0.52,1.322,0.52,1.322l3.163,1.402,4.573,2.607s0.165,1.467,0.155,1.958c0,0.402-0.282,1.222-0.155,1.604,0.11,0.336,0.638,0.912,0.958,1.076,1.357,0.692,4.546,0.811,6.05,0.602,0.328-0.045,0.939-0.337,1.24-0.474,0.464-0.228,1.266-0.911,1.758-1.048,0.329-0.091,1.03,0.045,1.366,0,0.62-0.082,1.787-0.573,2.406-0.683,0.484-0.082,1.476-0.219,1.959-0.118,0.347,0.072,0.957,0.492,1.285,0.646,0.52,0.246,1.585,0.721,2.123,0.957,0.365,0.164,1.193,0.355,1.476,0.639,0.283,0.291,0.602,1.484,0.602,1.484l0.483,4.802,3.26,0.73z","name":"Львівська область"},"48":{"path":"M854.35,535.02c-0.119,0,3.362-10.733,3.362-10.733l-1.205-1.276s0.484-1.03,0.806-1.204c0.499-0.282,1.711-0.101,2.276-0.08,0.636,0.018,1.896,0.301,2.522,0.246,0.393-0.046,1.249-0.14,1.488-0.448,0.116-0.146,0.071-0.573,0.034-0.765-0.054-0.328-0.273-1.048-0.556-1.24-0.354-0.227-1.257,0-1.686,0-0.647,0.011-1.949,0.057-2.605,0.048-0.438-0.01-1.567,0.318-1.759-0.083-0.164-0.347,0.666-0.921,0.921-1.202,0.173-0.185,0.501-0.576,0.72-0.683,0.474-0.221,1.538-0.139,2.051-0.24,0.737-0.144,2.23-0.518,2.914-0.839,0.329-0.154,0.849-0.781,1.203-0.8,0.347-0.017,0.983,0.373,1.204,0.637,0.254,0.311,0.172,1.268,0.48,1.523,0.283,0.227,1.077,0.145,1.441,0.162,0.638,0.028,1.959,0.175,2.561-0.044,0.31-0.109,0.866-0.511,1.002-0.794,0.229-0.462,0.101-1.54,0.037-2.05-0.072-0.756-0.694-2.195-0.711-2.962-0.019-0.354,0.081-1.102,0.273-1.401,0.163-0.239,0.709-0.502,0.966-0.639,0.51-0.274,1.612-0.685,2.16-0.884,0.538-0.2,1.64-0.483,2.158-0.72,0.429-0.192,1.148-0.967,1.605-0.921,0.228,0.02,0.538,0.428,0.684,0.602,0.256,0.28,0.574,1.013,0.837,1.284,0.456,0.438,1.576,1.046,2.123,1.356,0.237,0.131,0.656,0.448,0.975,0.541l-0.838,3.817,0.613,7.954s0.728-0.036,0.965,0c0.263,0.037,0.837,0.137,1.039,0.319,0.181,0.153,0.437,0.638,0.4,0.885-0.036,0.198-0.566,0.608-0.566,0.608l2.344,3.738,0.035,1.922-1.796,0.884,1.321,6.123-5.766,4.41,0.517,6.806,1.678,6.134s1.284,0.474,1.731,0.591c0.363,0.11,0.946,0.257,1.504,0.366l3.254,6.325,2.567,9.375-4.527-0.082-2.89-5.685-2.314,1.365,3.035,7.764,3.691,0.246,1.356,4.237-2.24,2.169,0.208,4.246,2.114,5.083-4.046,2.607-6.359,0.237-3.892,7.49,3.928,4.966,7.208,4.812-3.601,4.64-4.256-1.878-1.795,2.88,3.683,1.521-0.083,2.688-9.768,3.243-0.155,1.604,5.998-0.081,2.285,2.76-17.523,3.7-1.657-4.939-3.9,1.678-2.406-2.435-4.857,0.065,1.147,3.654-4.327,0.638-2.132-2.242-4.384-0.026,0.218,5.267-6.414-4.093-3.198,2.78-2.188,2.323-0.19,2.615-4.374,3.098-2.269-3.152-6.954,1.331,3.556,6.414-1.239,0.866c-0.385-0.455-0.786-1.028-1.03-1.357-0.594-0.811-1.769-2.433-2.196-3.326-0.602-1.24-1.56-3.873-1.687-5.248-0.108-1.131,0.229-3.438,0.564-4.53,0.292-0.966,1.34-2.715,1.842-3.599,0.546-0.976,1.951-2.754,2.314-3.809,0.308-0.874,0.492-2.753,0.483-3.682,0-0.547-0.11-1.657-0.32-2.169-0.163-0.4-0.646-1.165-1.001-1.438-0.32-0.248-1.12-0.483-1.522-0.559-0.219-0.035-0.711,0.139-0.883,0-0.293-0.254-0.265-1.138-0.239-1.52,0.029-0.318,0.247-0.931,0.403-1.203,0.162-0.281,0.8-0.646,0.838-0.966,0.063-0.448-0.483-1.277-0.757-1.642-0.255-0.327-0.884-0.956-1.285-1.075-0.474-0.146-1.466,0.182-1.958,0.237-0.356,0.037-1.06,0.202-1.403,0.12-0.238-0.055-0.694-0.321-0.839-0.521-0.256-0.337-0.475-1.192-0.446-1.603,0.036-0.456,0.537-1.286,0.765-1.688,0.255-0.455,1.021-1.23,1.204-1.712,0.219-0.604,0.372-1.896,0.272-2.524-0.054-0.374-0.356-1.077-0.593-1.367-0.254-0.309-1.021-0.656-1.32-0.92-0.42-0.374-1.257-1.165-1.487-1.686-0.107-0.237,0.074-0.867-0.118-1.038-0.172-0.156-0.71-0.084-0.92,0-0.29,0.108-0.809,0.518-0.93,0.801-0.182,0.483-0.036,1.595,0.21,2.04,0.22,0.42,1.184,0.811,1.44,1.202,0.392,0.612,0.729,2.079,0.757,2.808,0.028,0.547-0.246,1.631-0.402,2.16-0.155,0.547-0.619,1.595-0.838,2.123-0.155,0.382-0.628,1.112-0.639,1.521-0.01,0.402,0.293,1.22,0.557,1.521,0.346,0.382,1.351,0.802,1.842,0.922,0.374,0.091,1.146,0.009,1.521,0.035,0.447,0.046,1.495-0.063,1.769,0.283,0.219,0.281-0.048,1.057-0.118,1.403-0.073,0.337-0.328,0.965-0.446,1.286-0.146,0.399-0.684,1.164-0.674,1.602,0,0.41,0.428,1.185,0.674,1.521,0.218,0.272,0.756,0.776,1.083,0.886,0.309,0.09,0.993-0.092,1.322-0.082,0.329,0,1.029-0.083,1.284,0.116,0.311,0.247,0.458,1.122,0.475,1.523,0.036,0.611-0.228,1.84-0.475,2.406-0.291,0.627-1.203,1.703-1.685,2.195-0.922,0.955-3.228,2.352-4.128,3.324-0.528,0.584-1.576,1.868-1.76,2.645-0.21,0.883,0.175,2.753,0.484,3.608,0.19,0.529,0.965,1.403,1.202,1.923,0.254,0.574,0.748,1.768,0.757,2.396,0.01,0.655-0.639,1.84-0.719,2.486-0.111,0.895,0.307,2.725,0.116,3.609-0.127,0.593-0.683,1.73-1.084,2.196-0.373,0.445-1.367,1.139-1.913,1.32-0.865,0.301-2.743,0.283-3.645,0.209-0.683-0.063-2.016-0.41-2.644-0.645-0.875-0.328-2.414-1.414-3.29-1.724-0.665-0.237-2.059-0.547-2.759-0.565-0.95-0.009-2.846,0.302-3.729,0.647-0.819,0.312-2.157,1.53-2.96,1.876-0.52,0.229-1.614,0.484-2.16,0.565-0.465,0.066-1.403,0.163-1.851,0.038-0.328-0.092-0.975-0.438-1.157-0.721-0.262-0.382-0.446-1.395-0.328-1.841,0.164-0.574,1.358-1.24,1.567-1.804,0.248-0.648-0.229-2.104,0-2.762,0.238-0.692,1.458-1.641,1.806-2.286,0.335-0.629,0.673-2.051,0.919-2.716,0.201-0.575,0.547-1.748,0.884-2.252,0.429-0.646,1.75-1.548,2.243-2.157,0.463-0.574,1.468-1.788,1.557-2.526,0.046-0.374-0.109-1.257-0.437-1.438-0.292-0.163-1.003,0.182-1.285,0.364-0.456,0.281-1.122,1.176-1.403,1.64-0.235,0.401-0.464,1.34-0.675,1.758-0.273,0.521-0.884,1.541-1.284,1.96-0.337,0.355-1.104,0.994-1.559,1.166-0.573,0.209-1.813,0.282-2.404,0.2-0.42-0.056-1.178-0.546-1.605-0.564-0.327-0.01-1.039,0.138-1.283,0.364-0.229,0.219-0.504,0.886-0.438,1.204,0.063,0.309,0.619,0.729,0.874,0.92,0.302,0.209,1.085,0.364,1.332,0.636,0.337,0.395,0.628,1.451,0.637,1.97,0.019,0.638-0.392,1.896-0.684,2.477-0.438,0.904-1.759,2.435-2.405,3.211-0.602,0.719-1.813,2.176-2.562,2.761-0.646,0.52-2.076,1.447-2.879,1.641-0.718,0.171-2.241,0-2.961-0.167-0.885-0.189-2.514-1.008-3.363-1.31-0.729-0.264-2.168-0.847-2.924-0.968-0.484-0.071-1.559,0.275-1.97,0-0.235-0.154-0.372-0.764-0.454-1.038-0.182-0.609-0.437-1.875-0.475-2.516-0.072-1.102-0.036-3.363,0.266-4.428,0.154-0.554,0.946-1.466,1.066-2.032,0.137-0.61,0.035-1.914-0.165-2.505-0.175-0.538-0.912-1.403-1.223-1.868-0.209-0.328-0.802-0.901-0.854-1.285-0.064-0.447,0.509-1.259,0.538-1.712,0.025-0.62-0.164-1.951-0.538-2.453-0.31-0.419-1.433-0.665-1.813-1.021-0.364-0.316-0.883-1.166-1.121-1.601-0.266-0.466-0.557-1.523-0.857-1.972-0.446-0.664-1.638-1.767-2.24-2.294-0.512-0.446-1.759-1.104-2.144-1.658-0.381-0.564-0.636-1.787-0.828-2.688l2.516-2.69s1.074-0.265,1.439-0.244c0.227,0.017,0.684,0.163,0.885,0.281,0.337,0.219,0.737,1.048,1.12,1.168,0.302,0.09,0.929-0.21,1.24-0.282,0.481-0.112,1.429-0.411,1.922-0.449,0.491-0.027,1.559,0.449,1.959,0.165,0.347-0.229,0.263-1.222,0.492-1.559,0.173-0.282,0.692-0.745,0.993-0.882,0.39-0.176,1.259-0.211,1.686-0.248,0.603-0.035,1.805,0.056,2.396,0,0.292-0.017,0.904-0.009,1.131-0.191,0.273-0.237,0.437-1.012,0.521-1.367,0.127-0.618,0.154-1.886,0.154-2.522,0-1.439-0.238-4.319-0.355-5.77-0.119-1.35-0.338-4.063-0.565-5.402-0.118-0.72-0.02-2.525-0.683-2.844-0.364-0.173-1.075,0.628-1.479,0.684-1.127,0.137-4.482-0.803-4.482-0.803v1.886l-5.33,1.111-0.719-2.796,4.728-3.607s0.311-0.712,0.355-0.958c0.082-0.463,0.138-1.449-0.037-1.888-0.127-0.309-0.616-0.829-0.918-0.965-0.548-0.238-1.787-0.173-2.37-0.074-0.483,0.084-1.457,0.411-1.843,0.722-0.29,0.236-0.607,0.946-0.835,1.239-0.164,0.2-0.43,0.72-0.685,0.765-0.482,0.082-1.267-0.765-1.723-0.966-0.318-0.135-1.002-0.3-1.32-0.438-0.547-0.236-1.706-0.693-2.125-1.121-0.246-0.255-0.565-0.93-0.638-1.283-0.082-0.402,0.201-1.249,0.082-1.641-0.108-0.338-0.573-0.948-0.883-1.121-0.255-0.146-0.876-0.172-1.166-0.118-0.447,0.082-1.213,0.664-1.641,0.839-0.438,0.173-1.331,0.592-1.804,0.566-0.383-0.029-1.149-0.357-1.403-0.649-0.575-0.674-0.693-2.579-0.911-3.445-0.202-0.773-0.639-2.331-0.767-3.125-0.082-0.491-0.337-1.53-0.164-1.994,0.109-0.274,0.647-0.584,0.847-0.803,0.22-0.256,0.72-0.756,0.793-1.084,0.119-0.467-0.063-1.449-0.274-1.887-0.164-0.328-0.719-0.895-1.039-1.075-0.438-0.254-1.541-0.173-1.922-0.483-0.265-0.211-0.51-0.883-0.601-1.203-0.137-0.429-0.411-1.375-0.246-1.802,0.1-0.238,0.583-0.513,0.802-0.639,0.245-0.139,0.839-0.209,1.048-0.402,0.264-0.246,0.51-0.974,0.637-1.319,0.101-0.284,0.064-0.959,0.283-1.159,0.229-0.219,0.984-0.027,1.239-0.2,0.319-0.238,0.72-1.011,0.756-1.402,0.047-0.429-0.209-1.313-0.481-1.65-0.237-0.282-1.031-0.446-1.322-0.674-0.3-0.246-0.847-0.849-0.992-1.203-0.11-0.235-0.065-0.784-0.12-1.038-0.072-0.285-0.172-0.92-0.409-1.085-0.31-0.219-1.138-0.038-1.513,0-0.419,0.046-1.238,0.455-1.649,0.363-0.346-0.091-0.901-0.637-1.121-0.929-0.292-0.384-0.584-1.339-0.756-1.795-0.155-0.392-0.702-1.176-0.565-1.567,0.064-0.184,0.51-0.3,0.683-0.4,0.256-0.146,0.839-0.383,1.039-0.602,0.219-0.237,0.574-0.838,0.565-1.159-0.019-0.427-0.473-1.265-0.847-1.483-0.675-0.394-2.369-0.21-3.125,0-0.539,0.153-1.568,0.766-1.914,1.202-0.265,0.338-0.41,1.212-0.565,1.604-0.127,0.328-0.336,1.021-0.564,1.285-0.264,0.311-0.984,0.818-1.394,0.875-0.283,0.045-0.875-0.13-1.085-0.32-0.302-0.271-0.52-1.12-0.602-1.521s0.128-1.287-0.082-1.643c-0.209-0.372-1.03-0.8-1.441-0.918-0.928-0.273-2.916-0.035-3.881,0-1.139,0.046-3.398,0.2-4.528,0.356-0.82,0.116-2.415,0.608-3.244,0.646-0.464,0.018-1.431,0.008-1.841-0.201-0.365-0.182-0.902-0.836-1.084-1.204-0.355-0.711-0.455-2.34-0.6-3.125-0.21-1.12-0.648-3.353-0.803-4.482-0.073-0.555-0.401-1.723-0.2-2.241,0.173-0.438,1.011-0.958,1.367-1.247,0.446-0.366,1.476-0.938,1.877-1.358,0.282-0.292,0.774-0.94,0.884-1.322,0.191-0.646,0.09-2.023-0.036-2.678-0.101-0.484-0.301-1.569-0.72-1.806-0.739-0.418-2.489,0.61-3.327,0.557-0.4-0.019-1.521-0.438-1.521-0.438l-3.043-11.973-3.844-1.769-0.72-4.838,2.477-1.531-2.806-4.838s-0.073-1.45,0.283-1.685c0.492-0.331,1.695,0.525,2.288,0.563,0.31,0.019,0.938-0.071,1.238-0.164,0.374-0.108,1.02-0.601,1.403-0.683,0.283-0.064,0.866,0.046,1.158,0.046,0.51,0,1.649,0.238,2.049-0.083,0.274-0.219,0.265-1.02,0.355-1.366,0.073-0.274,0.338-0.829,0.32-1.121-0.019-0.365-0.657-1.003-0.556-1.358,0.028-0.126,0.137-0.254,0.273-0.373,0.336-0.29,0.866-0.548,1.121-0.711,0.419-0.263,1.293-0.755,1.767-0.884,0.875-0.219,2.707-0.173,3.6-0.119,0.784,0.056,2.379,0.211,3.09,0.521,0.718,0.327,1.885,1.448,2.479,1.969,0.3,0.253,1.165,1.083,1.165,1.083l1.441-3.245,2.76-0.209,3.964-1.758,12.384-0.155,2.442,1.677,7.525-3.764s0.038-1.723,0.403-2.122c0.137-0.147,0.61-0.11,0.757-0.238,0.145-0.118,0.171-0.547,0.326-0.646,0.566-0.347,2.033,0.173,2.68,0,0.236-0.054,0.529-0.657,0.766-0.601,0.592,0.135,1.075,2.204,1.075,2.204l4.893-0.52,2.278,2.643-1.002,1.923,3.563,4.28,10.179-0.552-0.885,1.757,1.841,1.521,5.332-0.354,0.119,1.522-1.441,2.996,2.961,0.119,3.527-2.041,0.035-1.603,1.926-1.24,2.12,2.004,1.723-0.601,2.17,1.805,3.044-0.201,2.56,3.964-3.928,1.521,1.523,5.805,3.646,3.291,1.885-0.484,0.319,1.97,2.44,3.681-0.481,1.04,1.402,1.119-2.206,1.249-0.354,4.401-1.886,2.277,7.007,0.129,0.883-1.05-0.117-2.277,8.929-1.402,2.443,4.884-0.201,2.287,1.047,1.285,3.565-0.812,2.276-3.444,3.246-2.314,3.042-0.365,2.405,4.85,9.57-4.129,4.446,1.887c-0.06-0.06,3.69-0.1,3.83-0.11","name":"Миколаївська область"},"51":{"path":"M671.2,739.65c0.173-0.338,0.126-1.12,0.109-1.496-0.019-0.428-0.201-1.265-0.265-1.686-0.064-0.41-0.056-1.275-0.246-1.654-0.083-0.168-0.374-0.433-0.529-0.533-0.228-0.144-0.811-0.209-0.993-0.399-0.229-0.245-0.155-1.075-0.419-1.285-0.208-0.163-0.811-0.163-1.075-0.109-0.21,0.056-0.529,0.438-0.748,0.456-0.427,0.055-1.212-0.546-1.648-0.556-0.32-0.009-0.948,0.163-1.204,0.346-0.456,0.317-1.121,1.275-1.34,1.787-0.255,0.628-0.474,2.005-0.401,2.669,0.056,0.43,0.438,1.23,0.647,1.604,0.183,0.347,0.766,0.92,0.93,1.285,0.183,0.383,0.384,1.231,0.428,1.65,0.045,0.401-0.146,1.21-0.054,1.602,0.082,0.347,0.328,1.177,0.665,1.261,0.338,0.07,0.839-0.585,1.103-0.804,0.3-0.256,0.848-0.83,1.148-1.095,0.329-0.29,1.002-0.884,1.358-1.146,0.401-0.302,1.256-0.82,1.658-1.121,0.23-0.19,0.75-0.52,0.87-0.78m12.33-11.22c0.009-0.329-0.364-0.923-0.446-1.24-0.027-0.146,0.037-0.501-0.073-0.603-0.318-0.301-1.358,0-1.768-0.163-0.464-0.182-1.067-1.139-1.559-1.239-0.71-0.136-2.142,0.447-2.761,0.803-0.456,0.264-1.275,0.984-1.531,1.438-0.254,0.485-0.063,1.724-0.4,2.169-0.219,0.292-0.956,0.721-1.313,0.639-0.337-0.082-0.773-0.745-0.846-1.084-0.065-0.311,0.52-0.993,0.318-1.238-0.163-0.209-0.856-0.111-1.075,0.036-0.438,0.31-0.702,1.449-0.802,1.969-0.129,0.673-0.064,2.076,0.037,2.762,0.091,0.608,0.61,1.756,0.683,2.358,0.082,0.639-0.128,1.923-0.081,2.568,0.026,0.329-0.073,1.194,0.245,1.322,0.174,0.073,0.482-0.317,0.638-0.446,0.501-0.401,1.403-1.331,1.876-1.759,0.411-0.365,1.241-1.047,1.641-1.404,0.54-0.465,1.585-1.42,2.124-1.876,0.673-0.574,2.059-1.639,2.726-2.204,0.473-0.401,1.476-1.148,1.849-1.643,0.17-0.27,0.49-0.86,0.51-1.18m18.7-228.87c0.557,0.083,1.878,0.175,2.644-0.309-0.137,0.119-0.247,0.246-0.273,0.372-0.101,0.356,0.538,0.995,0.555,1.358,0.019,0.292-0.246,0.848-0.319,1.122-0.091,0.346-0.082,1.146-0.357,1.367-0.399,0.319-1.538,0.081-2.049,0.081-0.283,0-0.875-0.11-1.157-0.045-0.383,0.082-1.029,0.573-1.404,0.683-0.3,0.092-0.929,0.183-1.238,0.163-0.592-0.037-1.796-0.892-2.288-0.563-0.354,0.234-0.282,1.685-0.282,1.685l2.806,4.838-2.478,1.523,0.719,4.847,3.846,1.768,3.043,11.973s1.121,0.421,1.521,0.438c0.838,0.045,2.588-0.974,3.326-0.556,0.419,0.236,0.621,1.32,0.72,1.796,0.127,0.663,0.227,2.041,0.036,2.688-0.11,0.382-0.601,1.03-0.884,1.322-0.401,0.419-1.431,0.993-1.876,1.357-0.356,0.29-1.195,0.811-1.367,1.247-0.202,0.52,0.127,1.687,0.2,2.241,0.155,1.131,0.592,3.364,0.802,4.482,0.146,0.786,0.246,2.416,0.601,3.126,0.183,0.367,0.72,1.021,1.083,1.203,0.41,0.21,1.377,0.219,1.842,0.201,0.829-0.036,2.424-0.528,3.243-0.646,1.13-0.156,3.39-0.311,4.529-0.356,0.965-0.035,2.952-0.272,3.881,0,0.411,0.118,1.231,0.546,1.441,0.918,0.209,0.357,0,1.242,0.082,1.644,0.081,0.399,0.3,1.248,0.602,1.521,0.209,0.191,0.802,0.356,1.084,0.319,0.409-0.057,1.129-0.564,1.394-0.875,0.228-0.273,0.438-0.956,0.565-1.285,0.155-0.392,0.3-1.267,0.565-1.604,0.346-0.437,1.375-1.049,1.913-1.202,0.756-0.21,2.451-0.393,3.125,0,0.374,0.22,0.829,1.057,0.848,1.483,0.009,0.323-0.346,0.922-0.565,1.159-0.2,0.219-0.784,0.455-1.039,0.603-0.173,0.1-0.62,0.216-0.683,0.399-0.137,0.392,0.41,1.176,0.564,1.567,0.173,0.456,0.465,1.403,0.756,1.796,0.219,0.291,0.776,0.838,1.122,0.928,0.411,0.092,1.229-0.316,1.649-0.363,0.374-0.036,1.204-0.217,1.512,0,0.238,0.165,0.337,0.801,0.41,1.085,0.054,0.254,0.009,0.793,0.119,1.038,0.146,0.355,0.692,0.958,0.993,1.203,0.291,0.228,1.085,0.392,1.321,0.675,0.282,0.338,0.529,1.221,0.482,1.649-0.036,0.392-0.438,1.164-0.756,1.402-0.256,0.174-1.012-0.018-1.239,0.201-0.219,0.2-0.182,0.875-0.283,1.158-0.128,0.346-0.373,1.073-0.638,1.32-0.208,0.193-0.802,0.263-1.047,0.401-0.219,0.127-0.702,0.4-0.802,0.639-0.164,0.427,0.109,1.365,0.247,1.803,0.09,0.319,0.336,0.992,0.601,1.202,0.382,0.312,1.485,0.229,1.922,0.483,0.319,0.181,0.874,0.748,1.039,1.075,0.21,0.438,0.393,1.421,0.282,1.887-0.081,0.328-0.582,0.828-0.801,1.085-0.2,0.218-0.739,0.528-0.847,0.802-0.173,0.464,0.082,1.503,0.164,1.994,0.127,0.794,0.565,2.352,0.766,3.126,0.218,0.866,0.337,2.761,0.911,3.444,0.255,0.292,1.021,0.621,1.404,0.639,0.472,0.036,1.367-0.383,1.804-0.556,0.427-0.175,1.193-0.756,1.641-0.838,0.289-0.055,0.911-0.027,1.165,0.118,0.311,0.172,0.775,0.773,0.884,1.12,0.119,0.392-0.164,1.239-0.083,1.641,0.074,0.355,0.393,1.028,0.638,1.283,0.419,0.428,1.578,0.885,2.125,1.123,0.319,0.136,1.003,0.301,1.321,0.436,0.456,0.201,1.24,1.049,1.722,0.968,0.256-0.047,0.52-0.565,0.685-0.767,0.227-0.293,0.546-1.011,0.836-1.238,0.386-0.311,1.358-0.639,1.843-0.722,0.583-0.1,1.822-0.163,2.369,0.074,0.302,0.135,0.791,0.655,0.919,0.964,0.174,0.439,0.119,1.425,0.037,1.889-0.046,0.245-0.355,0.957-0.355,0.957l-4.728,3.607,0.719,2.797,5.33-1.12v-1.878s3.354,0.939,4.482,0.803c0.403-0.055,1.113-0.865,1.486-0.684,0.655,0.318,0.557,2.124,0.675,2.844,0.228,1.339,0.446,4.054,0.565,5.402,0.117,1.438,0.354,4.33,0.354,5.77,0,0.637-0.027,1.904-0.155,2.523-0.082,0.354-0.245,1.129-0.521,1.367-0.226,0.174-0.837,0.174-1.129,0.19-0.591,0.056-1.793-0.034-2.396,0-0.428,0.038-1.297,0.073-1.686,0.248-0.301,0.137-0.82,0.6-0.993,0.883-0.229,0.336-0.146,1.33-0.492,1.56-0.4,0.282-1.468-0.193-1.96-0.167-0.492,0.038-1.44,0.337-1.921,0.449-0.312,0.072-0.939,0.373-1.241,0.282-0.383-0.12-0.784-0.949-1.119-1.167-0.202-0.118-0.659-0.265-0.886-0.282-0.364-0.019-1.438,0.245-1.438,0.245l-2.517,2.69c-0.044-0.239-0.089-0.45-0.125-0.621-0.22-0.949-0.604-2.871-0.647-3.845-0.028-0.858,0.281-2.561,0.271-3.419-0.008-0.6,0.037-1.887-0.271-2.405-0.139-0.237-0.631-0.674-0.903-0.637-0.33,0.045-0.666,0.736-0.858,1.01-0.3,0.429-1.019,1.295-1.065,1.813-0.054,0.602,0.702,1.668,0.857,2.242,0.172,0.645,0.346,1.959,0.427,2.624,0.101,0.931,0.173,2.798,0.265,3.736,0.101,1.066-0.009,3.315,0.483,4.273,0.301,0.593,1.503,1.341,1.969,1.815,0.784,0.79,2.268,2.431,2.941,3.307,0.677,0.892,1.915,2.761,2.452,3.745,0.421,0.736,1.258,2.259,1.45,3.088,0.155,0.712,0.063,2.168,0,2.89-0.073,0.783-0.583,2.304-0.594,3.099,0,0.637,0.211,1.904,0.431,2.503,0.163,0.458,0.745,1.231,0.955,1.66,0.238,0.475,0.729,1.449,0.802,1.979,0.075,0.5,0.165,1.676-0.209,2.022-0.244,0.237-1.013-0.019-1.339,0.054-0.611,0.146-1.74,0.711-2.297,1.02-0.646,0.367-1.759,1.44-2.45,1.706-0.885,0.336-2.808,0.364-3.736,0.482-1.003,0.137-3.027,0.301-4.011,0.538-0.592,0.136-1.84,0.392-2.296,0.802-0.555,0.501-1.03,2.003-1.284,2.717-0.457,1.311-1.004,4.044-1.331,5.394-0.43,1.739-1.131,5.256-1.705,6.942-0.61,1.778-2.141,5.24-3.043,6.889-0.829,1.495-2.707,4.357-3.799,5.66-0.938,1.139-3.208,3.044-4.22,4.108-0.911,0.977-2.505,3.136-3.471,4.064-0.794,0.775-2.752,1.922-3.464,2.78-0.628,0.746-1.412,2.55-1.877,3.417-0.5,0.956-1.384,2.935-1.967,3.845-0.729,1.132-2.433,3.208-3.317,4.21-0.337,0.4-0.957,1.694-1.44,1.504-0.254-0.109-0.1-0.857,0-1.12,0.183-0.457,1.195-0.976,1.331-1.442,0.155-0.525-0.445-1.602-0.373-2.141,0.09-0.593,0.938-1.547,1.075-2.132,0.155-0.691,0.173-2.159-0.055-2.833-0.229-0.675-1.157-1.787-1.658-2.297-0.429-0.437-1.604-1.002-1.978-1.492-0.254-0.349-0.573-1.179-0.638-1.605-0.091-0.594,0.009-1.822,0.164-2.406,0.119-0.456,0.766-1.23,0.803-1.704,0.036-0.573-0.365-1.694-0.647-2.186-0.172-0.311-0.646-0.866-0.957-1.022-0.556-0.263-1.896,0.046-2.46-0.21-0.51-0.236-1.294-1.083-1.604-1.549-0.283-0.42-0.684-1.376-0.748-1.867-0.099-0.757,0.438-2.279,0.374-3.045-0.037-0.527-0.191-1.676-0.583-2.031-0.32-0.291-1.331-0.526-1.713-0.317-0.228,0.128-0.347,0.701-0.373,0.956-0.046,0.556,0.483,1.64,0.428,2.196-0.037,0.437-0.273,1.401-0.638,1.649-0.3,0.21-1.148,0.21-1.44,0-0.401-0.276-0.537-1.341-0.646-1.813-0.184-0.829-0.136-2.552-0.374-3.362-0.1-0.355-0.41-1.048-0.637-1.341-0.356-0.437-1.231-1.203-1.76-1.385-0.993-0.336-3.162-0.254-4.173,0-0.627,0.155-1.84,0.756-2.296,1.23-0.52,0.547-1.121,1.987-1.276,2.717-0.208,0.981-0.208,3.061,0.101,4.008,0.345,1.038,1.749,2.797,2.514,3.581,0.903,0.931,3.089,2.37,4.165,3.098,0.947,0.639,2.951,1.75,3.899,2.397,0.884,0.603,2.607,1.867,3.418,2.569,1.092,0.929,3.416,2.751,4.108,4,0.483,0.866,0.519,2.926,0.856,3.845,0.32,0.876,1.467,2.417,1.704,3.31,0.219,0.792,0.155,2.451,0.166,3.262,0.009,0.511,0.126,1.56-0.056,2.031-0.172,0.448-0.883,1.149-1.23,1.495-0.355,0.355-1.194,0.92-1.549,1.276-0.5,0.52-1.313,1.731-1.813,2.241-0.692,0.729-2.351,1.896-3.043,2.624-0.492,0.512-1.176,1.832-1.759,2.242-0.336,0.236-1.24,0.263-1.549,0.538-0.583,0.48-0.967,2.078-1.439,2.66-1.02,1.267-3.746,3.097-4.921,4.219-1.185,1.14-3.28,3.69-4.483,4.812-1.859,1.732-5.951,4.783-7.9,6.405-1.84,1.532-5.432,4.667-7.262,6.196-1.331,1.104-3.929,3.391-5.34,4.385-1.166,0.81-3.672,2.196-4.921,2.878-1.412,0.785-4.364,2.169-5.758,2.989-0.829,0.492-2.452,1.54-3.208,2.144-0.573,0.455-1.677,1.447-2.132,2.021-0.528,0.657-1.44,2.096-1.713,2.889-0.136,0.392-0.183,1.239-0.209,1.648-0.055,0.63-0.41,1.998-0.055,2.518,0.256,0.363,1.257,0.546,1.705,0.581,0.282,0.028,0.903,0.009,1.121-0.153,0.318-0.236,0.318-1.23,0.647-1.448,0.446-0.293,1.603-0.147,2.132-0.057,0.538,0.102,1.648,0.421,2.031,0.812,0.466,0.476,0.838,1.84,0.912,2.507,0.019,0.272-0.173,0.801-0.164,1.066,0.027,0.627,0.509,1.83,0.583,2.459,0.109,0.821-0.046,2.488,0.055,3.308,0.118,0.885,0.747,2.589,0.856,3.473,0.091,0.711,0.173,2.187,0,2.88-0.201,0.812-1.258,2.168-1.549,2.941-0.227,0.592-0.438,1.841-0.593,2.452-0.109,0.455-0.082,1.566-0.474,1.823-0.209,0.127-0.72-0.147-0.965-0.165-0.329-0.027-1.001-0.035-1.33,0-0.383,0.044-1.112,0.383-1.495,0.375-0.255,0-0.793-0.083-0.966-0.264-0.501-0.531-0.455-2.134-0.638-2.835-0.292-1.104-1.467-3.254-1.285-4.383,0.092-0.557,1.121-1.322,1.285-1.868,0.183-0.583,0.218-1.877,0-2.45-0.255-0.649-1.331-1.598-1.869-2.034-0.928-0.747-3.026-1.924-4.109-2.404-1.23-0.53-3.845-1.158-5.13-1.541-1.048-0.319-3.108-1.011-4.165-1.284-1.357-0.346-4.109-0.976-5.504-1.122-1.302-0.136-3.927-0.11-5.23-0.054-1.03,0.035-3.144,0.019-4.11,0.373-0.874,0.32-2.306,1.577-3.042,2.131-0.793,0.594-2.25,1.961-3.098,2.463-0.711,0.418-2.26,1.048-3.044,1.283-0.602,0.174-1.841,0.347-2.46,0.43-0.438,0.045-1.376-0.121-1.758,0.1-0.501,0.293-0.912,1.485-1.286,1.922-0.208,0.246-0.738,0.612-0.939,0.856-0.482,0.593-1.011,2.143-1.594,2.644-0.445,0.383-1.604,0.747-2.168,0.883-0.665,0.156-2.087,0.493-2.725,0.236-0.556-0.228-1.084-1.51-1.604-1.839-0.445-0.3-1.539-0.574-2.076-0.639-0.657-0.081-2.042-0.127-2.643,0.154-0.419,0.201-1.122,0.922-1.285,1.368-0.301,0.82,0.419,2.671,0.164,3.518-0.228,0.757-1.211,2.096-1.84,2.567-0.61,0.447-2.132,0.859-2.888,0.96-1.213,0.153-3.701-0.02-4.885-0.319-0.701-0.175-2.041-0.803-2.642-1.205-0.593-0.391-1.439-1.63-2.086-1.92-0.365-0.165-1.204-0.229-1.605-0.156-0.364,0.064-0.983,0.609-1.357,0.638-0.92,0.063-2.679-0.747-3.526-1.121-1.175-0.519-3.473-1.758-4.484-2.568-1.029-0.813-2.724-2.853-3.608-3.838-0.719-0.81-2.27-2.352-2.797-3.288-0.492-0.858-1.039-2.798-1.286-3.764-0.236-0.95-0.227-2.962-0.638-3.846-0.309-0.665-1.421-1.704-1.922-2.242-0.319-0.336-1.111-0.865-1.312-1.285-0.155-0.319-0.173-1.075-0.155-1.438,0.027-0.558,0.164-1.723,0.475-2.188,0.392-0.583,1.693-1.256,2.295-1.604,0.803-0.454,2.469-1.313,3.372-1.492,0.492-0.102,1.522,0.008,2.022,0.055,0.61,0.044,1.805,0.346,2.406,0.317,0.574-0.028,1.667-0.619,2.242-0.536,0.373,0.054,0.966,0.555,1.284,0.746,0.32,0.2,0.911,0.728,1.276,0.8,0.537,0.11,1.694-0.055,2.141-0.372,0.311-0.22,0.629-0.963,0.747-1.329,0.192-0.595,0.119-1.859,0.266-2.464,0.089-0.362,0.2-1.228,0.536-1.383,0.33-0.154,1.049,0.62,1.386,0.482,0.318-0.137,0.482-0.911,0.592-1.229,0.227-0.701,0.619-2.148,0.583-2.888-0.019-0.564-0.592-1.624-0.638-2.188-0.046-0.565,0.328-1.676,0.264-2.241-0.046-0.446-0.365-1.31-0.583-1.713-0.201-0.347-0.884-0.847-1.02-1.222-0.127-0.354-0.091-1.139,0-1.493,0.136-0.529,0.738-1.449,1.074-1.878,0.311-0.391,1.012-1.213,1.495-1.385,0.365-0.128,1.175,0,1.549,0.11,0.128,0.036,0.337,0.245,0.474,0.265,0.482,0.062,1.521-0.147,1.867-0.485,0.457-0.438,0.457-1.82,0.702-2.395,0.154-0.384,0.455-1.224,0.802-1.452,0.429-0.28,1.604,0.02,2.078-0.208,0.564-0.273,1.285-1.394,1.769-1.813,0.355-0.328,1.075-1.03,1.539-1.177,0.639-0.198,2.023,0.255,2.68,0.101,0.437-0.101,1.285-0.519,1.594-0.847,0.821-0.884,1.887-3.18,1.978-4.383,0.045-0.556-0.438-1.603-0.583-2.133-0.146-0.52-0.54-1.55-0.593-2.088-0.064-0.746,0.091-2.259,0.273-2.987,0.165-0.676,0.556-2.087,1.066-2.561,0.666-0.638,2.597-0.921,3.462-1.23,0.985-0.355,2.934-1.076,3.901-1.439,1.047-0.392,3.144-1.156,4.165-1.604,0.674-0.293,2.232-0.666,2.624-1.285,0.301-0.481,0.127-1.73,0-2.296-0.137-0.583-0.81-1.594-1.076-2.132-0.246-0.52-0.848-1.521-0.957-2.087-0.1-0.511-0.118-1.612,0.109-2.079,0.282-0.591,1.485-1.272,1.969-1.712,0.765-0.675,2.287-2.04,2.998-2.781,0.802-0.817,2.424-2.495,3.044-3.461,0.246-0.401,0.71-1.248,0.748-1.714,0.027-0.382-0.146-1.183-0.375-1.493-0.291-0.391-1.265-0.736-1.657-1.013-0.766-0.546-2.351-1.63-2.879-2.405-0.401-0.574-0.757-1.941-0.912-2.615-0.274-1.165-0.474-3.563-0.593-4.758-0.137-1.564-0.09-4.745-0.374-6.303-0.155-0.903-0.756-2.653-1.066-3.519-0.201-0.575-0.775-1.656-0.903-2.251-0.063-0.272-0.209-0.883-0.054-1.12,0.19-0.3,0.976-0.492,1.33-0.527,0.738-0.093,2.196,0.453,2.944,0.427,0.71-0.029,2.131-0.336,2.769-0.637,0.921-0.439,2.26-2.104,3.208-2.461,0.602-0.229,1.959,0.046,2.56-0.164,0.711-0.236,1.887-1.229,2.517-1.648,0.464-0.321,1.357-1.04,1.867-1.287,0.456-0.218,1.44-0.729,1.923-0.582,0.41,0.109,0.966,0.884,1.121,1.275,0.265,0.657,0.154,2.125,0.109,2.836-0.063,0.873-0.52,2.585-0.593,3.471-0.09,1.075-0.099,3.242,0,4.319,0.064,0.627,0.046,2.014,0.483,2.461,0.227,0.236,0.966,0.345,1.285,0.264,0.701-0.165,1.777-1.258,2.242-1.814,0.409-0.499,1.021-1.676,1.22-2.297,0.174-0.5,0.138-1.585,0.329-2.085,0.246-0.621,0.92-1.876,1.493-2.242,0.384-0.247,1.386-0.438,1.814-0.265,0.446,0.175,0.929,1.083,1.175,1.495,0.311,0.526,0.729,1.675,0.957,2.241,0.173,0.41,0.237,1.477,0.646,1.659,0.173,0.072,0.574-0.147,0.702-0.284,0.355-0.382,0.511-1.483,0.602-1.996,0.092-0.5-0.082-1.546,0.118-2.004,0.174-0.372,0.83-0.901,1.167-1.122,0.501-0.327,1.613-0.955,2.206-0.883,0.5,0.066,1.285,0.83,1.64,1.204,0.629,0.655,1.477,2.296,2.005,3.043,0.784,1.128,2.442,3.346,3.281,4.448,0.519,0.673,1.356,2.285,2.122,2.678,0.365,0.191,1.249,0.209,1.641,0.082,0.574-0.183,1.43-1.094,1.886-1.485,0.528-0.467,1.677-1.349,2.041-1.958,0.292-0.494,0.602-1.632,0.602-2.206,0-0.428-0.447-1.247-0.438-1.678,0.01-0.482,0.238-1.484,0.557-1.85,0.218-0.247,0.875-0.593,1.203-0.558,0.555,0.056,1.375,0.959,1.803,1.323,0.684,0.602,1.905,1.968,2.562,2.606,0.792,0.747,2.815,1.915,3.244,2.914,0.137,0.33,0.027,1.068-0.037,1.404-0.091,0.429-0.701,1.177-0.647,1.605,0.083,0.565,0.939,1.429,1.368,1.803,0.491,0.43,1.684,1.004,2.277,1.286,0.574,0.264,1.768,1.121,2.369,0.92,0.428-0.147,0.747-1.129,0.957-1.522,0.292-0.537,0.656-1.713,1.002-2.204,0.292-0.41,0.948-1.295,1.44-1.404,0.528-0.109,1.484,0.594,2.004,0.72,0.602,0.146,1.832,0.267,2.442,0.319,0.675,0.063,2.013,0.128,2.688,0.128,0.893-0.02,2.707-0.045,3.572-0.254,0.529-0.13,1.505-0.604,1.979-0.858,0.438-0.228,1.431-0.638,1.658-1.066,0.164-0.317,0.154-1.157-0.055-1.438-0.236-0.331-1.11-0.457-1.493-0.54-0.684-0.136-2.161,0.146-2.779-0.163-0.521-0.256-1.175-1.275-1.496-1.759-0.428-0.637-0.883-2.151-1.385-2.725-0.537-0.61-2.012-1.394-2.668-1.867-0.475-0.349-1.396-1.06-1.878-1.396-0.52-0.365-1.66-1.003-2.133-1.439-0.427-0.392-1.395-1.24-1.439-1.813-0.036-0.438,0.538-1.229,0.857-1.548,0.464-0.467,1.868-0.785,2.287-1.276,0.51-0.602,0.974-2.169,1.074-2.944,0.119-0.893-0.273-2.678-0.318-3.581-0.045-0.72-0.129-2.159-0.056-2.878,0.064-0.694,0.484-2.032,0.584-2.726,0.109-0.737,0.437-2.26,0.272-2.988-0.146-0.612-0.883-1.658-1.285-2.142-0.419-0.483-1.603-1.12-1.978-1.65-0.272-0.381-0.83-1.329-0.638-1.767,0.173-0.393,1.203-0.521,1.603-0.693,0.329-0.146,1.158-0.265,1.332-0.582,0.164-0.312-0.128-1.066-0.265-1.396-0.201-0.473-0.72-1.467-1.175-1.703-0.393-0.2-1.358,0.236-1.759,0.055-0.483-0.221-1.047-1.167-1.34-1.604-0.319-0.493-0.646-1.675-1.066-2.086-0.218-0.2-0.783-0.438-1.065-0.474-0.529-0.073-1.568,0.227-2.087,0.316-0.492,0.084-1.486,0.456-1.978,0.375-0.346-0.064-0.966-0.454-1.229-0.691-0.647-0.594-1.495-2.187-2.032-2.889-0.584-0.784-1.649-2.479-2.451-3.044-0.575-0.399-2.024-0.62-2.67-0.911-0.675-0.293-1.931-1.058-2.56-1.441-0.357-0.208-0.993-0.792-1.396-0.9-0.309-0.091-0.975,0.154-1.274,0.044-0.401-0.127-1.24-0.645-1.285-1.065-0.055-0.519,1.039-1.185,1.285-1.647,0.191-0.374,0.465-1.185,0.482-1.606,0.009-0.481-0.51-1.392-0.427-1.867,0.108-0.674,1.13-1.695,1.439-2.295,0.354-0.693,1.075-2.116,1.176-2.89,0.063-0.502,0.055-1.632-0.274-2.022-0.282-0.355-1.258-0.511-1.704-0.591-0.655-0.121-2.005-0.094-2.67-0.11-0.537-0.011-1.668,0.264-2.141,0-0.3-0.166-0.646-0.839-0.747-1.167-0.137-0.51-0.228-1.649,0.055-2.087,0.256-0.391,1.239-0.61,1.658-0.802,0.502-0.238,1.658-0.491,2.033-0.91,0.255-0.282,0.446-1.059,0.483-1.44,0.063-0.775-0.328-2.323-0.429-3.099-0.127-0.865-0.546-2.597-0.482-3.473,0.045-0.646,0.364-1.949,0.692-2.505,0.31-0.538,1.395-1.268,1.759-1.759,0.309-0.418,0.874-1.312,0.966-1.821,0.1-0.566-0.119-1.75-0.329-2.297-0.219-0.593-0.975-1.64-1.385-2.133-0.445-0.546-1.394-1.659-2.023-1.979-0.546-0.272-1.803-0.519-2.404-0.428-0.448,0.064-1.24,0.538-1.604,0.803-0.538,0.382-1.403,1.395-1.868,1.866-0.528,0.548-1.413,1.853-2.086,2.197-0.465,0.237-1.631,0.537-2.079,0.264-0.427-0.272-0.483-1.447-0.637-1.921-0.229-0.676-0.848-1.97-0.911-2.671-0.065-0.702,0.464-2.078,0.427-2.779-0.036-0.639-0.327-1.941-0.692-2.461-0.22-0.302-0.939-0.619-1.23-0.847-0.948-0.766-2.907-2.296-3.582-3.316-0.382-0.574-0.5-2.097-0.956-2.618-0.328-0.372-1.267-0.881-1.768-0.91-0.492-0.018-1.367,0.538-1.813,0.758-0.438,0.2-1.23,0.829-1.705,0.902-0.382,0.063-1.193-0.046-1.504-0.266-0.318-0.228-0.637-1.01-0.746-1.395-0.119-0.427-0.355-1.429-0.101-1.813,0.229-0.337,1.139-0.465,1.549-0.528,0.4-0.074,1.349,0.282,1.649,0,0.374-0.345,0.301-1.54,0.165-2.032-0.109-0.401-0.584-1.186-0.967-1.331-0.373-0.153-1.193,0.32-1.603,0.311-0.529,0-1.677-0.073-2.077-0.418-0.419-0.365-0.666-1.541-0.749-2.089-0.063-0.464-0.146-1.474,0.109-1.867,0.329-0.52,1.586-1.001,2.188-1.177,0.427-0.117,1.33,0.012,1.758-0.108,0.445-0.109,1.366-0.437,1.659-0.802,0.245-0.293,0.337-1.109,0.374-1.494,0.082-0.903-0.21-2.715-0.266-3.627-0.072-1.111-0.409-3.324-0.272-4.438,0.1-0.763,0.674-2.214,0.965-2.934,0.274-0.674,0.894-2.005,1.276-2.615,0.464-0.718,1.567-2.041,2.142-2.67,0.41-0.453,1.631-1.111,1.758-1.702,0.064-0.283-0.192-0.903-0.418-1.076-0.438-0.319-1.604-0.129-2.143-0.156-0.528-0.026-1.739,0.303-2.131-0.055-0.301-0.273-0.329-1.22-0.219-1.603,0.154-0.521,1.103-1.203,1.394-1.658,0.364-0.565,1.057-1.777,1.176-2.451,0.127-0.813,0.009-2.543-0.375-3.263-0.283-0.511-1.467-1.029-1.822-1.493-0.382-0.512-0.792-1.751-1.012-2.352-0.355-0.967-0.592-3.099-1.176-3.946-0.301-0.455-1.185-1.211-1.712-1.34-0.51-0.117-1.567,0.292-2.078,0.429-0.383,0.102-1.176,0.255-1.495,0.481-0.601,0.42-1.212,1.869-1.768,2.354-0.355,0.309-1.175,0.883-1.649,0.899-0.602,0.028-1.677-0.653-2.196-0.954-0.974-0.576-2.697-2.078-3.626-2.726-0.529-0.363-1.65-0.984-2.142-1.384-0.519-0.438-1.467-1.432-1.868-1.979-0.529-0.738-1.375-2.359-1.704-3.209-0.273-0.691-0.492-2.032-0.729-2.988l5.001-0.265,2.188-7.689,4.164-0.164,3.736-5.659,7.052,7.526,2.133,0.22,4.811,6.241,11.91-2.987,1.549,3.361,5.23,0.273,0.856-4.01,6.197,1.011,0.045,4.064,2.989,0.429-0.045-6.14-4.219-4.604,2.715-2.45,2.625,2.087,3.144-3.583-0.027-0.456,3.062-0.091,2.151,3.137,3.762-0.084,0.109-4.262,1.787,0.208s0.764,1.521,1.012,2.031c0.428,0.848,1.138,2.626,1.658,3.417,0.583,0.875,1.958,2.489,2.752,3.181,0.528,0.455,1.693,1.284,2.351,1.549,0.811,0.31,2.568,0.556,3.443,0.556,0.921,0,2.716-0.456,3.636-0.583,0.375-0.053,1.131-0.2,1.514-0.19,0.738,0.017,2.187,0.317,2.888,0.51,0.93,0.14,2.32,0.7,3.06,0.83m-46.88,250.63c0.601-0.338,1.85-0.949,2.451-1.276,0.583-0.319,1.722-0.976,2.295-1.286,0.337-0.182,1.084-0.419,1.341-0.692,0.118-0.126,0.392-0.529,0.264-0.646-0.264-0.236-0.921,0.674-1.276,0.701-0.428,0.019-1.194-0.527-1.604-0.647-0.218-0.063-0.756,0.009-0.911-0.154-0.301-0.327-0.19-1.32-0.21-1.767-0.027-0.639,0.201-1.925,0.101-2.563-0.073-0.499-0.411-1.494-0.693-1.921-0.475-0.703-2.132-1.532-2.506-2.297-0.328-0.674-0.3-2.241-0.264-2.988,0.036-0.804,0.391-2.38,0.583-3.152,0.173-0.703,0.692-2.07,0.857-2.781,0.155-0.665,0.538-2.04,0.429-2.724-0.064-0.364-0.33-1.267-0.702-1.329-0.446-0.083-0.92,1.037-1.332,1.229-0.209,0.091-0.72,0.235-0.911,0.099-0.2-0.137,0-0.82-0.21-0.956-0.401-0.266-1.54,0.035-1.867,0.373-0.156,0.156-0.166,0.639-0.166,0.856,0.01,0.42,0.338,1.23,0.375,1.649,0.063,0.71,0.008,2.135-0.101,2.834-0.127,0.73-0.72,2.104-0.856,2.834-0.2,1.066,0.037,3.3-0.319,4.328-0.255,0.712-1.349,1.841-1.713,2.507-0.237,0.429-0.71,1.33-0.802,1.813-0.146,0.748-0.018,2.297,0.109,3.043,0.11,0.693,0.73,1.979,0.802,2.671,0.082,0.838-0.464,2.532-0.319,3.361,0.055,0.348,0.366,1.013,0.583,1.286,0.273,0.355,0.949,1.086,1.387,1.119,0.354,0.029,0.938-0.49,1.229-0.691,0.482-0.337,1.338-1.157,1.813-1.495,0.51-0.36,1.59-1.02,2.14-1.33","name":"Одеська область"},"53":{"path":"M834.27,303.92v-1.468l-6.516-1.567-4.564-7.007,0.018-0.127,1.222-10.761,2.687-1.368,2.324,1.885,4.565-5.73,4.283-3.799,2.241,1.675,6.204,0.047,0.895,4.766,9.122,0.438v-2.525l1.767,0.046,1.439,1.922,6.606-0.529,8.212-7.81,1.202-2.878,3.363-0.801,2.843-5.888-0.01-0.346c0.239-0.054,0.474-0.09,0.619-0.127,0.311-0.064,0.957-0.127,1.275-0.102,0.575,0.047,1.725,0.312,2.242,0.557,0.665,0.318,1.724,1.42,2.378,1.768,0.492,0.255,1.561,0.673,2.114,0.693,0.409,0.018,1.295-0.137,1.621-0.402,0.283-0.219,0.521-0.947,0.64-1.284,0.129-0.337,0.181-1.094,0.356-1.414,0.09-0.171,0.338-0.574,0.525-0.583,0.284-0.027,0.677,0.51,0.885,0.692,0.356,0.31,1.012,0.966,1.332,1.304,0.454,0.473,1.192,1.568,1.711,1.95,0.401,0.291,1.322,0.746,1.815,0.803,0.683,0.081,2.049-0.366,2.724-0.476,0.372-0.063,1.121-0.272,1.495-0.245,0.327,0.028,0.964,0.245,1.257,0.4,0.256,0.146,0.812,0.492,0.902,0.774,0.127,0.356-0.438,1.095-0.319,1.44,0.127,0.374,0.83,0.866,1.202,0.993,0.412,0.138,1.303-0.09,1.732-0.054,0.684,0.046,1.995,0.482,2.67,0.482,0.31,0,0.93-0.054,1.184-0.218,0.258-0.164,0.53-0.756,0.692-1.011,0.146-0.237,0.329-0.793,0.528-0.994,0.294-0.282,1.066-0.683,1.478-0.719,0.283-0.019,0.829,0.237,1.095,0.346,0.554,0.255,1.576,0.965,2.13,1.23,0.802,0.382,2.46,1.049,3.308,1.313,1.068,0.319,3.245,0.884,4.358,0.929,0.946,0.046,2.896-0.091,3.763-0.482,0.402-0.174,1.175-0.73,1.338-1.139,0.146-0.402-0.354-1.285-0.218-1.687,0.1-0.282,0.574-0.701,0.828-0.856,0.274-0.164,0.912-0.374,1.23-0.374,0.283,0,0.813,0.319,1.095,0.319,0.519,0.009,1.512-0.374,2.005-0.529,0.576-0.191,1.677-0.729,2.268-0.857,0.537-0.117,1.668-0.245,2.216-0.164,0.501,0.083,1.376,0.684,1.867,0.776,0.574,0.11,1.742-0.128,2.323-0.072,0.42,0.036,1.25,0.19,1.632,0.363,0.348,0.165,0.948,0.647,1.23,0.912,0.355,0.346,0.819,1.266,1.221,1.549,0.165,0.109,0.575,0.319,0.755,0.237,0.265-0.108,0.403-0.783,0.476-1.066,0.127-0.473,0.264-1.466,0.162-1.949-0.081-0.402-0.737-1.048-0.8-1.468-0.055-0.336-0.027-1.139,0.236-1.357,0.536-0.465,2.124-0.045,2.835-0.055,0.919-0.01,2.77-0.109,3.681-0.027,0.627,0.064,1.868,0.292,2.461,0.484,0.362,0.117,1.147,0.337,1.384,0.637,0.21,0.265,0.283,0.976,0.265,1.313-0.018,0.456-0.428,1.304-0.49,1.758-0.111,0.838-0.074,2.543,0,3.381,0.071,0.774,0.299,2.332,0.545,3.071,0.236,0.729,0.93,2.123,1.357,2.761,0.564,0.829,1.978,2.269,2.688,2.98,0.476,0.491,1.568,1.339,1.995,1.868,0.256,0.309,0.739,0.993,0.85,1.385,0.055,0.2,0.045,0.636-0.028,0.838-0.1,0.291-0.611,0.71-0.755,0.974-0.174,0.312-0.521,0.958-0.503,1.305,0.019,0.354,0.366,1.093,0.684,1.265,0.284,0.154,0.956-0.136,1.276-0.1,0.41,0.044,1.175,0.355,1.567,0.502,0.618,0.227,1.904,0.655,2.462,1.021,0.398,0.254,1.191,0.847,1.384,1.275,0.146,0.355-0.202,1.203-0.02,1.548,0.165,0.338,0.874,0.766,1.241,0.903,0.392,0.146,1.347-0.082,1.677,0.172,0.218,0.174,0.272,0.792,0.381,1.049,0.146,0.318,0.656,0.884,0.685,1.239,0.017,0.311-0.274,0.912-0.466,1.157-0.311,0.419-1.185,1.057-1.658,1.267-0.382,0.165-1.448-0.091-1.641,0.274-0.254,0.482,0.655,1.485,0.901,1.968,0.365,0.738,1.031,2.278,1.559,2.898,0.337,0.4,1.149,1.103,1.641,1.266,0.566,0.192,1.814-0.081,2.405,0,0.701,0.101,2.022,0.547,2.751,0.803,0.64,0.236,1.732,1.129,2.37,1.157,0.549,0.028,2.005-0.775,2.005-0.775l1.367-5.986,1.731,0.619,0.365,1.604,2.733,0.692,2.822-3.044,5.927,2.17s1.73,5.093,0.637,6.625c-0.273,0.391-1.458,0.229-1.823,0.483-0.272,0.155-0.729,0.619-0.819,0.911-0.182,0.556,0.091,1.803,0,2.396,0,0.83-0.274,2.516-0.639,3.262-0.183,0.247-0.637,0.584-0.729,0.849-0.182,0.491-0.182,1.576,0,2.086,0.093,0.628,0.822,1.713,1.094,2.296,0.274,0.556,0.548,1.758,0.91,2.242,0.457,0.619,1.822,1.494,2.371,1.978,0.729,0.61,2.187,2.05,3.098,2.405,0.273,0.128,1.004,0.238,1.367,0.109,0.273-0.136,0.548-1.047,0.911-1.075,0.729-0.065,1.55,1.941,2.278,1.923,0.365-0.009,1.093-1.012,1.093-1.012l0.821,2.296h5.923l2.004,1.176,1.094,10.999s0.364,1.04,0.639,1.204c0.455,0.236,1.549-0.155,2.004-0.119,0.457,0.027,1.548-0.027,1.823,0.319,0.274,0.319-0.185,1.267,0,1.638,0.183,0.384,1.275,1.04,1.275,1.04l7.837,0.566,5.192,8.291s0,1.469-0.181,1.924c-0.183,0.445-0.912,1.138-1.004,1.603-0.09,0.427,0,1.367,0.185,1.758,0.181,0.293,1,0.556,1,0.885,0.183,0.446-0.455,1.257-0.637,1.677-0.275,0.62-0.548,2.095-1.094,2.486-0.456,0.273-1.458,0.247-1.913,0.119-0.638-0.156-1.367-1.139-2.007-1.321-0.637-0.227-2.092-0.145-2.823-0.082-0.546,0.046-1.64,0.101-2.003,0.438-0.456,0.4-0.821,1.649-0.821,2.251-0.091,0.5,0.091,1.521,0.274,1.995,0.181,0.529,0.91,1.458,1.275,1.886,0.456,0.521,1.639,1.277,2.006,1.841,0.361,0.62,1.185,2.086,1,2.807-0.183,0.72-1.731,1.395-2.277,1.876-0.457,0.393-1.457,1.129-1.823,1.603-0.546,0.666-1.55,2.124-1.55,2.962,0,0.556,1.004,1.45,0.912,2.005,0,0.457-0.638,1.24-1.094,1.44-0.455,0.199-1.367,0.1-1.822,0-0.457-0.091-1.185-0.62-1.549-0.721-0.73-0.155-2.187,0.101-2.825-0.036-0.546-0.11-1.457-0.693-2.003-0.802-0.639-0.146-2.007,0-2.734-0.082-1.005-0.101-2.825-0.557-3.828-0.721-0.819-0.146-2.551-0.912-3.278-0.52-1.186,0.629-1.916,3.582-2.279,4.885-0.183,0.675-0.364,2.808-0.364,2.808l4.556,8.637c-0.366,0.238-0.911,0.712-1.275,0.775-0.637,0.109-1.913-0.236-2.461-0.52-0.455-0.22-1.003-1.094-1.456-1.285-0.459-0.191-1.46-0.336-1.916-0.2-0.365,0.108-1.003,0.701-1.274,0.957-0.274,0.236-0.639,1.057-1.003,1.002-0.457-0.055-0.548-1.139-0.912-1.395-0.364-0.328-1.365-0.691-1.912-0.683-0.547,0.009-1.549,0.546-2.097,0.802-0.547,0.282-1.458,1.094-2.007,1.358-0.545,0.282-1.82,0.481-2.368,0.801-0.454,0.228-1.001,0.947-1.274,1.203-0.729,0.492-2.278,1.175-3.007,1.603-0.457,0.302-1.459,0.966-1.914,1.275-0.728,0.438-2.186,1.222-2.825,1.687-0.547,0.327-1.457,1.021-1.821,1.439-0.629,0.602-1.204,2.479-2.005,2.724-2.105,0.646-6.27-3.862-8.291-3.007-1.268,0.537-1.203,4.12-2.243,5.011-0.338,0.293-1.441,0.128-1.724,0.484-0.883,1.084,0.11,4.274-0.364,5.604-0.17,0.493-1.012,1.231-1.192,1.722-0.255,0.638-0.339,2.033-0.365,2.725-0.045,1.011,0.01,3.043,0.201,4.045,0.1,0.547,0.41,1.659,0.719,2.124,0.258,0.374,1.13,0.801,1.359,1.193,0.127,0.209,0.199,0.693,0.209,0.921,0.019,0.747-0.364,2.194-0.446,2.932-0.082,0.729,0.4,2.499-0.202,2.917-0.289,0.209-1.083-0.219-1.402-0.401-0.291-0.165-0.665-1.002-1.003-0.921-0.573,0.146-0.699,1.659-0.803,2.242-0.091,0.619,0,1.723,0.058,2.579-0.52-0.292-0.994-0.574-1.295-0.856-0.747-0.674-2.16-2.27-2.406-3.253-0.146-0.638,0.439-1.915,0.427-2.561,0-0.601-0.08-1.869-0.427-2.352-0.182-0.264-0.794-0.62-1.121-0.638-0.438-0.037-1.238,0.803-1.648,0.638-0.236-0.091-0.374-0.666-0.429-0.911-0.09-0.418,0.245-1.331,0.055-1.703-0.12-0.237-0.601-0.629-0.856-0.593-0.364,0.054-0.655,0.902-0.912,1.176-0.491,0.556-1.458,1.777-2.132,2.086-0.291,0.129-0.993,0.257-1.284,0.102-0.311-0.165-0.739-0.876-0.693-1.221,0.027-0.255,0.63-0.502,0.693-0.749,0.063-0.245-0.028-0.8-0.209-0.966-0.281-0.255-1.122-0.199-1.497-0.154-0.49,0.045-1.382,0.529-1.866,0.583-0.711,0.081-2.142-0.055-2.834-0.219-0.839-0.192-2.441-0.884-3.198-1.277-0.837-0.427-2.407-1.465-3.152-2.031-0.812-0.602-2.25-2.005-3.044-2.615-0.812-0.619-2.505-1.758-3.363-2.297-0.864-0.538-2.688-1.412-3.526-1.978-0.347-0.228-0.901-0.883-1.286-1.011-0.254-0.091-0.827-0.118-1.064,0-0.273,0.127-0.464,0.838-0.745,0.956-0.35,0.146-1.14-0.036-1.497-0.155-0.51-0.173-1.366-0.838-1.822-1.12-0.52-0.346-1.549-1.058-2.077-1.395-0.885-0.563-2.68-1.694-3.581-2.242-0.319-0.191-0.911-0.783-1.275-0.746-0.491,0.045-1.341,0.811-1.495,1.284-0.209,0.593,0.246,1.897,0.527,2.451,0.202,0.402,0.831,1.058,1.179,1.34,0.519,0.419,1.757,0.947,2.294,1.33,0.547,0.393,1.585,1.258,2.031,1.768,0.146,0.175,0.311,0.484,0.466,0.793l-2.122,4.493-1.76-0.109-1.12-2.033-4.866-0.045-1.276-2.196-3.471-0.055-0.222,2.888-3.417-1.119-5.176-8.658,3.309,0.273,0.639-2.242-0.492-1.968c0.502-0.254,1.03-0.71,1.24-1.03,0.211-0.3,0.274-1.075,0.274-1.439,0-0.428-0.009-1.403-0.319-1.704-0.457-0.438-1.85-0.254-2.461-0.374-0.028-0.01-0.065-0.018-0.092-0.018l1.376-0.894-1.922-2.824-3.327,0.136c-0.019-0.027-0.026-0.055-0.035-0.091-0.211-0.383-0.676-1.12-1.021-1.385-0.503-0.382-1.786-0.62-2.352-0.911-0.676-0.347-1.96-1.185-2.562-1.65-0.601-0.465-1.793-1.422-2.241-2.032-0.773-1.057-1.603-3.581-2.188-4.757-0.281-0.556-0.672-1.832-1.176-2.188-0.601-0.419-2.187-0.199-2.889-0.428-0.554-0.174-1.63-0.694-2.085-1.066-0.674-0.575-1.495-2.215-2.132-2.834-0.702-0.683-2.342-1.813-3.209-2.297-0.209-0.118-0.746-0.181-0.902-0.373-0.199-0.228-0.438-0.92-0.263-1.167,0.226-0.355,1.285-0.073,1.648-0.272,0.456-0.248,1.149-1.085,1.394-1.551,0.373-0.71,0.584-2.358,0.748-3.152,0.163-0.802,1.065-2.625,0.528-3.254-0.229-0.273-1.102-0.136-1.44,0-0.481,0.192-1.129,1.066-1.493,1.44-0.511,0.52-1.595,1.522-1.979,2.133-0.218,0.355-0.237,1.339-0.582,1.558-0.356,0.218-1.386,0.154-1.659-0.164-0.272-0.328,0.135-1.285,0.101-1.713-0.037-0.565-0.191-1.741-0.474-2.242-0.265-0.456-1.075-1.203-1.55-1.439-0.555-0.283-1.83-0.428-2.461-0.484-0.729-0.063-2.222,0.237-2.934,0.056-0.363-0.092-1.094-0.447-1.34-0.748-0.336-0.418-0.665-1.541-0.638-2.078,0.027-0.629,0.646-1.768,0.967-2.296,0.399-0.684,1.585-1.776,1.977-2.46,0.594-1.049,1.376-3.363,1.65-4.539,0.227-0.966,0.474-2.962,0.427-3.955-0.019-0.474-0.009-1.567-0.372-1.868-0.302-0.246-1.212-0.191-1.551,0-0.311,0.174-0.436,1.039-0.746,1.229-0.246,0.156-0.911,0.238-1.174,0.109-0.203-0.099-0.348-0.573-0.485-0.755-0.155-0.219-0.409-0.674-0.665-0.921l0.21-3.024-5.066-1.021-3.472-0.984-0.886-2.005,0.622-1.122-0.11-2.268-4.676-3.919-1.603,0.875-6.532-9.02,3.014-2.515-0.427-5.231-2.697-1.065,0.401-6.679-1.395-2.05-4.702-0.22-1.412-1.758,0.665-6.061,0.85-0.15z","name":"Полтавська область"},"56":{"path":"M514.57,251.32l-0.21,0.1-3.198-0.155-1.604-4.329-3.153,1.175-1.067,2.671-3.898,0.154-2.133,2.196-4.438-2.779-3.737,2.078s-0.136,1.568-0.529,1.822c-0.364,0.229-1.283-0.263-1.713-0.272-0.71,0-2.186,0.063-2.824,0.383-0.501,0.236-1.35,1.046-1.604,1.539-0.311,0.593-0.283,1.977-0.428,2.625-0.209,0.884-0.72,2.624-1.076,3.463-0.137,0.337-0.374,1.102-0.691,1.285-0.32,0.191-1.14-0.174-1.495-0.055-1.212,0.41-3.017,2.387-4,3.208-0.684,0.564-2.151,1.585-2.671,2.295-0.401,0.537-0.692,1.904-1.065,2.452-0.548,0.792-1.988,2.077-2.725,2.677-0.875,0.703-2.698,2.088-3.746,2.507-0.738,0.292-2.352,0.438-3.144,0.528-0.482,0.064-1.477-0.018-1.923,0.164-0.638,0.255-1.64,1.249-2.141,1.713-0.893,0.829-2.424,2.735-3.308,3.572-0.857,0.819-2.579,2.506-3.635,3.043-0.802,0.419-2.862,0.893-4.165,1.167l0.292-6.088s1.238-1.449,1.604-1.968c0.228-0.31,0.857-0.938,0.802-1.321-0.037-0.311-0.638-0.72-0.92-0.874-0.282-0.166-0.919-0.33-1.24-0.33-0.4,0.009-1.139,0.346-1.521,0.447-0.355,0.091-1.075,0.318-1.439,0.318-0.802-0.008-2.351-0.473-3.089-0.766-0.438-0.173-1.194-0.765-1.641-0.919-0.418-0.146-1.322-0.347-1.758-0.275-0.419,0.065-1.112,0.565-1.485,0.757-0.347,0.183-1.011,0.756-1.403,0.72-0.411-0.036-1.022-0.709-1.323-1.001-0.463-0.456-1.102-1.668-1.64-2.042-0.31-0.219-1.066-0.501-1.44-0.483-0.492,0.037-1.385,0.539-1.767,0.848-0.384,0.311-0.92,1.149-1.204,1.559-0.365,0.546-1.021,1.695-1.321,2.288-0.201,0.401-0.437,1.293-0.72,1.639-0.383,0.474-1.485,1.076-1.996,1.404-0.492,0.3-1.477,0.912-2.004,1.12-0.62,0.237-1.923,0.738-2.57,0.603-0.584-0.137-1.394-1.139-1.877-1.486-0.202-0.137-0.803-0.519-0.803-0.519l-5.804,0.155s-1.239,1.266-1.649,1.686c-0.273,0.291-0.721,1.102-1.121,1.166-0.684,0.091-1.832-0.975-2.397-1.367-0.546-0.364-1.494-1.284-2.049-1.64-0.346-0.228-1.084-0.638-1.477-0.765-0.41-0.128-1.302-0.429-1.686-0.237-0.482,0.237-0.901,1.358-1.039,1.886-0.145,0.556-0.117,1.75,0,2.324,0.092,0.437,0.511,1.249,0.721,1.64,0.272,0.492,0.983,1.377,1.239,1.877,0.21,0.4,0.583,1.24,0.647,1.686,0.054,0.382,0.082,1.231-0.119,1.558-0.282,0.456-1.312,0.929-1.805,1.13-0.719,0.273-2.351,0.21-3.043,0.556-1.112,0.556-3.29,2.779-4.337,3.891-0.364,0.382-0.592,0.638-0.592,0.638l-12.092-14.379-0.201-10.06,3.718-1.914-0.119-2.406-4.046-0.865v-3.9l3.891-1.002-1.084-3.363s0.593-0.245,0.802-0.245c0.273,0,0.765,0.336,1.038,0.318,0.273-0.009,0.839-0.219,1.003-0.437,0.183-0.238,0.229-0.902,0.164-1.203-0.091-0.41-0.602-1.13-0.884-1.439-0.355-0.384-1.403-0.802-1.686-1.241-0.291-0.464-0.455-1.612-0.437-2.168,0.028-0.719,0.593-2.095,0.756-2.797,0.128-0.51,0.466-1.521,0.447-2.041-0.018-0.537-0.355-1.577-0.602-2.041-0.273-0.537-1.193-1.367-1.483-1.887-0.239-0.437-0.767-1.394-0.676-1.885,0.082-0.457,0.774-1.24,1.194-1.44,0.61-0.292,2.031-0.174,2.687-0.037,0.493,0.1,1.395,0.565,1.842,0.802,0.61,0.319,1.694,1.267,2.359,1.44,0.491,0.127,1.539,0.091,2.005-0.082,0.336-0.127,0.911-0.593,1.121-0.884,0.282-0.374,0.601-1.266,0.684-1.722,0.108-0.564-0.11-1.75,0-2.314,0.091-0.456,0.31-1.449,0.683-1.731,0.382-0.291,1.44-0.255,1.923-0.2,0.419,0.055,1.211,0.728,1.595,0.564,0.328-0.137,0.474-0.948,0.601-1.285,0.237-0.583,0.382-1.895,0.765-2.396,0.382-0.51,1.512-1.222,2.124-1.403,0.692-0.219,2.16-0.046,2.88-0.046,0.983,0.009,2.943,0.082,3.926,0.082,0.775,0.009,2.324,0.109,3.08-0.036,0.557-0.11,1.677-0.419,2.087-0.802,0.283-0.273,0.547-1.057,0.656-1.431,0.119-0.411,0.064-1.293,0.237-1.686,0.091-0.19,0.355-0.593,0.564-0.638,0.575-0.11,1.559,0.821,2.078,1.094,0.547,0.292,1.687,0.766,2.169,1.147,0.346,0.283,0.993,0.949,1.176,1.368,0.154,0.365,0.046,1.212,0.154,1.595,0.128,0.437,0.419,1.395,0.802,1.631,0.446,0.282,1.585,0.027,2.114,0.027,0.391,0,1.24-0.173,1.595,0,0.392,0.192,0.883,0.967,1.048,1.367,0.163,0.42-0.028,1.413,0.183,1.813,0.127,0.255,0.61,0.602,0.855,0.748,0.283,0.173,0.948,0.629,1.258,0.482,0.337-0.162,0.392-1.057,0.482-1.421,0.109-0.465,0.21-1.439,0.264-1.922,0.037-0.365,0.046-1.103,0.127-1.467,0.146-0.629,0.693-1.815,0.912-2.425,0.301-0.838,0.938-2.506,1.176-3.362,0.245-0.893,0.583-2.707,0.747-3.608,0.137-0.757,0.082-2.37,0.456-3.044,0.274-0.511,1.211-1.275,1.731-1.522,0.612-0.291,2.004-0.364,2.669-0.455,0.939-0.128,2.826-0.3,3.765-0.373,0.455-0.037,1.431,0.126,1.822-0.11,0.255-0.155,0.547-0.729,0.638-1.012,0.1-0.337,0.173-1.083,0.055-1.412-0.191-0.529-1.185-1.194-1.521-1.631-0.274-0.355-0.839-1.066-0.967-1.494-0.172-0.602-0.045-1.886,0.027-2.516,0.083-0.71,0.265-2.186,0.648-2.797,0.292-0.492,1.303-1.121,1.758-1.475,0.984-0.756,3.372-1.869,4.055-2.908,0.273-0.399,0.374-1.393,0.428-1.868,0.073-0.583,0.09-1.767,0.028-2.351-0.056-0.555-0.165-1.722-0.502-2.16-0.347-0.456-1.458-0.92-2.004-1.065-0.438-0.12-1.35,0.008-1.786-0.055-0.61-0.102-1.804-0.419-2.351-0.702-0.401-0.192-1.23-0.675-1.449-1.066-0.236-0.428-0.145-1.476-0.127-1.978,0.009-0.4-0.009-1.257,0.182-1.622,0.1-0.2,0.465-0.509,0.675-0.592,0.346-0.137,1.139-0.055,1.513,0,0.347,0.055,0.993,0.447,1.339,0.4,0.456-0.054,1.222-0.664,1.577-0.957,0.364-0.3,0.956-1.046,1.258-1.421,0.236-0.301,0.828-0.874,0.901-1.249,0.101-0.51-0.283-1.531-0.482-2.004-0.128-0.328-0.52-0.912-0.721-1.202-0.564-0.849-1.776-2.498-2.451-3.263-0.364-0.401-1.339-1.003-1.576-1.495-0.164-0.328-0.127-1.121-0.164-1.494-0.037-0.546,0.019-1.668-0.1-2.215-0.138-0.601-0.638-1.767-0.968-2.296-0.4-0.629-1.512-1.659-1.977-2.242-0.501-0.637-1.503-1.932-1.896-2.644-0.218-0.41-0.601-1.274-0.692-1.73-0.184-0.921-0.037-2.807-0.028-3.746,0.009-0.502,0.183-1.513,0.055-1.996-0.055-0.21-0.236-0.628-0.428-0.729-0.338-0.163-1.185-0.009-1.521,0.165-0.474,0.246-1.076,1.193-1.386,1.631-0.191,0.273-0.337,1.093-0.675,1.148-0.282,0.045-0.665-0.556-0.875-0.748-0.272-0.254-0.711-0.892-1.038-1.038-0.265-0.12-0.875-0.128-1.148-0.064-0.365,0.091-0.93,0.667-1.286,0.756-0.282,0.064-0.911,0.074-1.147-0.082-0.348-0.228-0.565-1.113-0.775-1.467-0.246-0.41-0.784-1.186-1.038-1.576-0.283-0.429-1.049-1.186-1.148-1.686-0.091-0.412,0.272-1.239,0.319-1.65,0.063-0.702,0.09-2.086,0.027-2.779-0.036-0.419-0.172-1.249-0.328-1.631-0.119-0.3-0.455-0.867-0.692-1.094-0.273-0.273-1.085-0.483-1.303-0.802-0.255-0.365-0.274-1.293-0.318-1.74-0.065-0.493-0.256-1.513-0.11-1.996,0.073-0.246,0.447-0.593,0.583-0.802,0.202-0.292,0.675-0.838,0.72-1.176,0.092-0.583-0.363-1.731-0.583-2.269-0.318-0.774-1.285-2.168-1.685-2.915-0.2-0.383-0.848-1.122-0.774-1.541,0.036-0.172,0.337-0.456,0.51-0.482,0.364-0.063,1.002,0.501,1.357,0.584,0.338,0.072,1.048,0.136,1.368,0.026,0.427-0.136,1.111-0.766,1.412-1.093,0.292-0.32,0.739-1.048,0.911-1.44,0.155-0.365,0.284-1.151,0.402-1.522,0.136-0.431,0.437-1.28,0.637-1.682,0.255-0.517,0.957-1.444,1.23-1.949,0.337-0.615,1.03-1.854,1.176-2.538,0.146-0.674,0.073-2.073-0.055-2.75-0.082-0.435-0.318-1.327-0.609-1.655-0.155-0.169-0.63-0.3-0.83-0.401-0.219-0.105-0.748-0.213-0.856-0.427-0.191-0.386,0.182-1.275,0.32-1.684,0.19-0.571,0.883-1.584,1.048-2.161,0.1-0.396-0.019-1.25,0.127-1.629,0.173-0.448,0.793-1.231,1.176-1.521,0.419-0.317,1.54-0.449,1.95-0.774,0.392-0.308,0.965-1.162,1.12-1.631,0.12-0.366,0.356-1.302,0.056-1.547-0.464-0.378-1.731,0.498-2.323,0.561-0.757,0.08-2.297,0.047-3.044-0.079-0.392-0.067-1.176-0.287-1.522-0.482-0.455-0.263-1.302-0.962-1.576-1.415-0.283-0.463-0.537-1.445-0.619-2.143,1.722-0.013,3.571-0.059,4.729-0.076,1.914-0.024,5.75-0.342,7.654-0.16,0.519,0.05,1.559,0.239,2.041,0.442,0.538,0.225,1.395,1.131,1.958,1.28,0.647,0.172,1.996-0.3,2.644-0.16,0.709,0.154,1.903,1.067,2.569,1.359,0.656,0.299,1.995,0.923,2.724,1.006,0.538,0.059,1.613-0.325,2.16-0.281,0.665,0.052,1.941,0.529,2.56,0.761,0.785,0.29,2.287,1.014,3.044,1.362,1.148,0.521,3.508,1.443,4.565,2.121,0.957,0.609,2.397,2.503,3.445,2.924,0.792,0.315,2.551,0.188,3.409,0.199,0.992,0.017,2.979-0.193,3.962-0.119,0.866,0.062,2.624,0.223,3.409,0.601,0.719,0.355,1.859,1.565,2.397,2.163,0.61,0.673,1.549,2.256,2.168,2.923,0.583,0.631,1.794,1.934,2.597,2.244,0.346,0.132,1.121,0.088,1.485,0.039,0.474-0.064,1.403-0.372,1.841-0.56,0.774-0.323,2.114-1.401,2.925-1.6,0.884-0.223,2.788-0.271,3.645,0.039,0.857,0.307,2.151,1.692,2.843,2.281,0.765,0.649,2.142,2.125,2.961,2.686,0.474,0.317,1.522,0.783,2.051,0.998,0.801,0.335,2.515,0.773,3.316,1.121,0.812,0.356,2.25,1.423,3.09,1.686,0.627,0.197,1.977,0.305,2.642,0.276,1.039-0.036,3.053-0.604,4.082-0.759,1.222-0.182,3.663-0.533,4.894-0.56,1.275-0.028,3.918-0.101,5.121,0.359,0.383,0.146,1.066,0.654,1.285,1.004,0.3,0.495,0.418,1.701,0.438,2.275,0.027,1.076-0.739,3.189-0.574,4.257,0.146,0.92,0.837,2.833,1.604,3.361,0.565,0.383,2.296-0.328,2.725,0.21,0.31,0.391-0.31,1.477-0.32,1.977-0.018,0.401-0.1,1.294,0.155,1.604,0.246,0.302,1.139,0.265,1.495,0.428,0.438,0.201,1.148,0.911,1.604,1.066,0.756,0.246,2.415-0.009,3.208,0.154,1.02,0.219,2.853,1.504,3.891,1.495,0.7,0,1.95-0.81,2.624-1.011,0.729-0.219,2.223-0.656,2.989-0.638,0.911,0.018,2.661,0.62,3.527,0.91,0.938,0.31,2.724,1.232,3.681,1.496,0.702,0.191,2.242,0.073,2.879,0.428,0.438,0.237,1.257,1.001,1.284,1.494,0.046,0.776-1.32,1.924-1.759,2.562-0.509,0.737-1.613,2.149-2.032,2.934-0.191,0.355-0.646,1.103-0.583,1.494,0.009,0.091,0.037,0.183,0.082,0.274l-0.938,1.01-1.285,2.562-1.759,0.375-1.23,7.798-1.12,1.066s-1.067-1.303-1.395-1.768c-0.456-0.637-1.158-2.085-1.705-2.66-0.282-0.301-0.92-0.985-1.339-0.965-0.455,0.027-1.157,0.828-1.386,1.229-0.364,0.646-0.354,2.214-0.536,2.934-0.154,0.665-1.058,1.986-0.802,2.616,0.155,0.355,1.056,0.445,1.338,0.692,0.293,0.264,0.803,0.912,0.904,1.286,0.126,0.445,0.091,1.429-0.155,1.823-0.247,0.391-1.185,0.738-1.604,0.956-0.227,0.119-0.957,0.429-0.957,0.429l-2.142,0.209,0.373,9.667-6.779,5.932s-1.066,0.994-1.229,1.44c-0.174,0.492,0.136,1.577,0,2.079-0.109,0.41-0.647,1.075-0.857,1.439-0.146,0.282-0.383,0.874-0.583,1.13-0.236,0.3-1.012,0.656-1.175,1.011-0.191,0.429-0.055,1.403,0,1.869,0.027,0.235,0.264,0.682,0.219,0.911-0.11,0.456-0.757,1.257-1.175,1.439-0.356,0.155-1.167-0.164-1.549-0.108-0.793,0.126-2.25,0.874-2.989,1.174-0.446,0.182-1.403,0.438-1.767,0.747-0.312,0.275-0.867,0.985-0.857,1.395,0.027,0.656,1.257,1.541,1.549,2.132,0.319,0.638,0.738,2.024,0.856,2.725,0.073,0.438,0.247,1.367,0.055,1.759-0.146,0.301-1.011,0.474-1.066,0.801-0.082,0.438,0.729,1.112,0.957,1.495,0.365,0.62,1.094,1.859,1.394,2.515,0.192,0.42,0.692,1.294,0.638,1.758-0.055,0.475-0.885,1.158-1.067,1.605-0.172,0.401-0.409,1.274-0.373,1.712,0.045,0.593,0.729,1.649,0.847,2.243,0.11,0.491,0.183,1.521,0.11,2.021-0.065,0.51-0.584,1.422-0.639,1.924-0.081,0.746,0.319,2.242,0.319,2.988,0,0.639-0.074,1.915-0.265,2.516-0.273,0.829-1.238,2.332-1.767,3.043-0.72,0.966-2.442,2.679-3.307,3.527-0.358,0.346-1.496,1.33-1.496,1.33l0.374,1.767,2.296,1.595,2.406,1.714-0.374,1.549-2.02,0.94z","name":"Рівненська область"},"59":{"path":"M1047.7,276.95c-0.092,0.528-0.272,1.204-0.364,1.585-0.093,0.41-0.273,1.267-0.547,1.604-0.275,0.273-0.819,0.793-1.186,0.774-0.272-0.009-0.728-0.545-0.91-0.737-0.274-0.191-0.548-0.71-0.821-0.801-0.547-0.155-1.549,0.154-2.003,0.265-0.548,0.099-1.458,0.382-1.916,0.555-0.453,0.154-1.456,0.355-1.64,0.765-0.089,0.337,0.64,1.021,0.547,1.376-0.091,0.265-0.547,0.574-0.819,0.72-0.183,0.119-0.547,0.373-0.729,0.348-0.546-0.073-1.185-1.049-1.64-1.423-0.457-0.51-1.459-1.612-1.914-2.169-0.273-0.327-0.729-1.321-1.184-1.34-0.275-0.008-0.456,0.574-0.639,0.72-0.455,0.302-1.367,0.685-1.823,0.885-0.636,0.272-1.82,0.747-2.459,0.984-0.274,0.11-1.004,0.228-1.184,0.438-0.185,0.155-0.459,0.61-0.459,0.837,0,0.291,0.185,0.866,0.367,1.103,0.181,0.272,0.818,0.573,0.912,0.866,0.089,0.218,0.181,0.746,0.089,0.957-0.089,0.218-0.637,0.437-0.82,0.501-0.548,0.137-1.458,0.064-2.004,0.082-0.547,0.008-1.731-0.274-2.187,0.019-0.274,0.154-0.547,0.728-0.547,1.02-0.092,0.383,0.547,1.039,0.547,1.421,0,0.274-0.274,0.803-0.364,1.021-0.183,0.273-0.729,0.693-1.003,0.884-0.183,0.146-0.64,0.438-0.822,0.482-0.454,0.074-1.275-0.21-1.729-0.3-0.64-0.146-1.915-0.52-2.644-0.682-0.271-0.074-0.911-0.347-1.185-0.284-0.364,0.082-0.91,0.629-1.186,0.884-0.455,0.41-1.275,1.294-1.549,1.822-0.181,0.409-0.364,1.312-0.456,1.758,0,0.483,0.092,1.45,0.092,1.923-0.092,0.318-0.182,1.011-0.455,1.202-0.183,0.146-0.729,0.065-0.913,0.082-0.543,0.037-1.639,0.247-2.187,0.119-0.363-0.073-0.819-0.474-1.092-0.638-0.365-0.173-0.819-0.748-1.186-0.702-1.367,0.2-3.552,4.028-3.552,4.028l-5.927-2.17-2.823,3.044-2.733-0.692-0.364-1.604-1.732-0.619-1.366,5.986s-1.456,0.803-2.005,0.775c-0.638-0.028-1.73-0.921-2.37-1.157-0.729-0.255-2.05-0.702-2.751-0.803-0.591-0.081-1.84,0.192-2.407,0-0.49-0.164-1.302-0.866-1.639-1.266-0.528-0.62-1.193-2.16-1.559-2.898-0.246-0.482-1.155-1.486-0.902-1.968,0.192-0.365,1.259-0.109,1.642-0.274,0.474-0.209,1.348-0.847,1.657-1.267,0.192-0.245,0.483-0.847,0.466-1.156-0.027-0.356-0.538-0.922-0.685-1.24-0.108-0.256-0.162-0.875-0.381-1.049-0.329-0.254-1.284-0.026-1.678-0.172-0.365-0.137-1.074-0.565-1.24-0.903-0.182-0.345,0.166-1.193,0.021-1.548-0.192-0.428-0.985-1.021-1.386-1.275-0.556-0.366-1.842-0.793-2.46-1.021-0.394-0.147-1.158-0.458-1.568-0.502-0.319-0.037-0.992,0.254-1.275,0.1-0.318-0.172-0.666-0.911-0.684-1.265-0.019-0.347,0.328-0.994,0.503-1.305,0.144-0.263,0.653-0.683,0.755-0.974,0.073-0.201,0.083-0.638,0.028-0.838-0.11-0.393-0.595-1.076-0.85-1.385-0.428-0.529-1.521-1.377-1.995-1.868-0.702-0.711-2.123-2.151-2.688-2.98-0.428-0.638-1.121-2.032-1.357-2.761-0.246-0.739-0.474-2.296-0.545-3.071-0.074-0.838-0.111-2.543,0-3.381,0.062-0.454,0.471-1.302,0.49-1.758,0.018-0.337-0.056-1.048-0.265-1.313-0.237-0.3-1.021-0.52-1.385-0.637-0.592-0.192-1.833-0.429-2.46-0.483-0.911-0.083-2.762,0.008-3.682,0.026-0.71,0.009-2.288-0.41-2.834,0.055-0.264,0.218-0.292,1.021-0.236,1.357,0.062,0.421,0.719,1.067,0.8,1.468,0.102,0.482-0.035,1.476-0.162,1.949-0.074,0.284-0.211,0.958-0.476,1.067-0.181,0.082-0.591-0.128-0.755-0.238-0.401-0.283-0.865-1.203-1.221-1.548-0.283-0.265-0.883-0.748-1.23-0.912-0.382-0.174-1.212-0.328-1.633-0.364-0.582-0.056-1.749,0.182-2.322,0.072-0.492-0.092-1.368-0.693-1.869-0.776-0.546-0.081-1.677,0.047-2.214,0.164-0.592,0.128-1.693,0.667-2.268,0.857-0.494,0.155-1.486,0.538-2.006,0.529-0.281,0-0.811-0.319-1.094-0.319-0.318,0-0.948,0.209-1.23,0.374-0.255,0.156-0.729,0.574-0.828,0.856-0.136,0.401,0.364,1.285,0.218,1.687-0.163,0.409-0.938,0.965-1.338,1.139-0.866,0.391-2.816,0.529-3.763,0.482-1.114-0.045-3.291-0.61-4.358-0.929-0.848-0.264-2.506-0.931-3.308-1.313-0.556-0.265-1.576-0.975-2.13-1.23-0.266-0.109-0.813-0.365-1.095-0.346-0.411,0.036-1.184,0.437-1.478,0.719-0.199,0.2-0.382,0.757-0.528,0.994-0.162,0.255-0.436,0.847-0.692,1.012-0.255,0.164-0.874,0.217-1.185,0.217-0.674,0-1.986-0.436-2.669-0.482-0.43-0.036-1.32,0.192-1.732,0.054-0.363-0.126-1.076-0.619-1.202-0.993-0.118-0.345,0.446-1.084,0.318-1.44-0.09-0.283-0.646-0.628-0.901-0.774-0.293-0.156-0.931-0.373-1.257-0.401-0.374-0.027-1.123,0.182-1.496,0.245-0.675,0.11-2.04,0.556-2.724,0.476-0.493-0.057-1.413-0.512-1.814-0.803-0.519-0.382-1.258-1.477-1.712-1.95-0.319-0.337-0.975-0.994-1.332-1.304-0.207-0.183-0.6-0.72-0.884-0.692-0.188,0.009-0.436,0.411-0.526,0.583-0.175,0.32-0.228,1.076-0.355,1.414-0.118,0.337-0.356,1.066-0.64,1.284-0.327,0.265-1.212,0.419-1.621,0.402-0.554-0.02-1.622-0.438-2.114-0.693-0.655-0.347-1.705-1.45-2.378-1.768-0.519-0.246-1.668-0.51-2.242-0.557-0.318-0.026-0.966,0.038-1.276,0.102-0.146,0.037-0.38,0.073-0.618,0.127l-0.064-1.541,2.042-3.48,1.604-2.807-0.766-2.042,1.924-2.279,0.838-2.805,4.966,0.165,0.163-1.722-4.766-2.808-1.238-4.045,1.959-2.405-0.483-6.453,2.487,0.046,0.839-1.122-0.237-6.651-12.895-13.531-1.156-0.501-0.957,0.692-1.012-0.045v-1.021l0.155-1.978,1.12-1.541,0.21-1.339-0.638-1.705-0.055-1.395,0.912-1.065,1.493-0.374,1.387-0.801,0.063-1.276,0.154-1.714,1.067-1.549,0.967-2.296-0.304-2.059,0.11-3.471-0.983-1.332-0.983-0.829-1.287-2.779-0.938-1.413-0.083-1.229,0.784-1.147,0.929-0.348,0.984,0.32,0.484,0.938,0.375,1.603,0.371,1.759,1.66,1.631,1.84,0.374,1.204-0.83,0.982-1.867,0.164-1.367-1.412-1.868-0.856-1.468-0.801-1.494-0.184-2.406,0.748-0.929,1.921-0.911,1.732-1.066,0.292-1.494-0.829-1.231-0.901-1.521-0.913-1.631,1.313-0.583,1.923,0.082,0.792-0.456-0.235-1.631-1.067-2.806-1.257-2.078-1.12-1.011-0.291-2.998-0.348-2.188-1.549-1.977-2.032-1.814-0.025-3.181,1.119-4.2,1.485-2.525,0.956-1.686,0.128-1.919-0.128-1.241,0.72-1.241,1.851-1.404,0.519,0.644,1.32,1.16,1.241-0.399,0.437-1.281-0.602-1.205,0.448-0.598,1.356,0.078,1.203,0.604,1.687,0.157,0.755-0.717,1.366,0.319,1.679,0.72,0.646-1.642,0.958-2.564-1.205-2.602-0.836-1.403-1.96-0.919-2.168-2.323-0.686-1.402,1.568-0.521,2.206-0.402,1.759-0.48,0.602,1.16,1.521,0.802,1.357-0.479h1.605l1.767-0.681,0.082-1.404-1.211-1.881-1.03-0.16-0.93-1.241-0.283-1.723-1.238-1.282-2.442-0.962-2.277-1.721-1.969-1.843-0.482-2.483,0.965-2.685,1.805-2.521,0.273-2.925,0.484-3.204,1.236-2.683,1.014-2.884c1.01,0.057,2.241,0.119,2.96,0.148,0.529,0.02,1.649-0.17,2.132,0.052,0.365,0.167,0.866,0.838,1.068,1.175,0.3,0.488,0.572,1.616,0.8,2.137,0.128,0.289,0.291,1.019,0.585,1.12,0.464,0.159,1.319-0.615,1.767-0.8,0.857-0.351,2.607-0.942,3.473-1.281,1.075-0.42,3.144-1.505,4.271-1.763,0.903-0.206,2.763-0.305,3.683-0.213,1.313,0.13,3.892,0.768,5.077,1.334,1.211,0.583,3.371,2.253,4.328,3.205,0.582,0.586,1.492,1.989,1.968,2.669,0.474,0.681,1.303,2.129,1.822,2.779,0.702,0.886,2.269,2.543,3.146,3.256,0.526,0.429,1.749,1.054,2.294,1.441,0.684,0.478,2.151,1.349,2.625,2.032,0.448,0.655,0.774,2.257,0.901,3.044,0.128,0.804,0.146,2.441,0.109,3.256-0.063,1.158-0.555,3.438-0.637,4.594-0.074,0.865-0.219,2.616-0.056,3.47,0.209,1.093,1.103,3.177,1.703,4.111,0.431,0.661,1.578,1.75,2.143,2.296,0.838,0.828,2.827,2.195,3.526,3.152,0.527,0.732,1.148,2.454,1.44,3.312,0.2,0.6,0.118,2.034,0.583,2.457,0.365,0.326,1.44,0.244,1.923,0.267,0.774,0.032,2.323-0.181,3.097-0.162,0.521,0.014,1.641-0.064,2.088,0.214,0.475,0.299,0.984,1.39,1.165,1.922,0.319,0.916,0.184,2.909,0.428,3.846,0.211,0.775,0.912,2.224,1.288,2.935,0.337,0.637,1.403,1.75,1.548,2.461,0.128,0.601-0.02,1.95-0.374,2.451-0.364,0.528-1.649,0.993-2.24,1.229-0.939,0.384-2.944,0.739-3.902,1.067-1.119,0.382-3.296,1.33-4.383,1.821-0.9,0.411-2.614,1.496-3.57,1.76-0.867,0.246-2.717,0.073-3.583,0.319-0.719,0.209-2.242,0.72-2.67,1.338-0.135,0.191-0.209,0.739-0.107,0.958,0.226,0.445,1.301,0.737,1.711,1.011,1.403,0.947,4.303,2.779,5.396,4.063,0.691,0.812,1.367,2.908,1.978,3.792,0.611,0.883,2.112,2.451,2.879,3.197,0.684,0.675,2.633,1.595,2.89,2.516,0.182,0.692-0.576,2.087-0.911,2.725-0.529,0.966-2.305,2.451-2.725,3.472-0.238,0.583-0.43,1.895-0.264,2.505,0.154,0.565,0.965,1.467,1.384,1.868,0.921,0.875,3.473,1.813,4.219,2.834,0.31,0.419,0.657,1.466,0.583,1.977-0.071,0.637-0.847,1.767-1.329,2.187-0.529,0.456-2.032,0.666-2.562,1.121-0.401,0.338-1.047,1.249-1.12,1.768-0.08,0.602,0.446,1.786,0.692,2.343,0.283,0.628,0.911,1.903,1.44,2.351,0.335,0.282,1.174,0.582,1.603,0.646,0.674,0.091,2.06-0.1,2.726-0.272,0.647-0.165,1.795-0.949,2.45-1.066,0.575-0.092,1.741,0.009,2.298,0.163,0.474,0.119,1.358,0.583,1.768,0.848,0.545,0.365,1.339,1.549,1.966,1.713,0.602,0.156,1.815-0.355,2.408-0.482,0.884-0.183,2.632-0.702,3.523-0.749,0.459-0.017,1.396,0.047,1.814,0.221,0.648,0.263,1.66,1.256,2.197,1.704,0.736,0.619,2.115,1.94,2.842,2.561,0.548,0.418,1.458,1.393,2.006,1.603,0.547,0.21,1.822,0.11,2.46,0,1.003-0.164,2.733-1.001,3.735-1.33,1.185-0.437,3.555-1.348,4.74-1.767,1.366-0.448,3.917-1.368,5.284-1.705,0.912-0.237,2.824-0.739,3.828-0.692,0.546,0.018,1.639,0.345,2.095,0.583,0.82,0.392,2.461,1.403,3.007,2.142,0.548,0.674,0.911,2.379,1.094,3.199,0.364,1.285,0.546,3.973,1.001,5.229,0.275,0.894,1.004,2.698,1.643,3.373,0.453,0.492,1.729,1.12,2.368,1.274,0.639,0.147,1.913-0.063,2.461-0.054,1.092,0.027,3.278,0.019,4.282,0.275,0.729,0.182,2.277,0.802,2.826,1.283,0.546,0.384,1.638,1.34,1.638,1.969,0,0.418-0.544,1.157-0.91,1.394-0.639,0.428-2.279,0.329-2.915,0.693-0.549,0.292-1.643,1.121-1.824,1.704-0.18,0.702,0.457,2.178,0.729,2.833,0.456,0.93,1.824,2.497,2.552,3.252,0.365,0.43,1.367,1.058,1.642,1.55,0.364,0.593,0.455,2.013,0.636,2.671,0.364,0.982,1.002,2.951,1.459,3.844,0.456,0.711,1.641,1.876,2.005,2.57,0.546,0.81,1.457,2.532,1.732,3.472,0.18,1.011,0.09,3.116,0.18,4.164,0,0.811,0.366,2.458,0.184,3.253-0.184,0.793-1.093,2.178-1.456,2.889-0.366,0.646-1.278,1.84-1.46,2.561-0.274,0.729-0.182,2.287-0.091,3.043,0.091,1.167,0.365,3.518,0.728,4.646,0.274,1.211,1.276,3.555,1.916,4.648,0.363,0.702,1.365,1.987,1.911,2.615,0.185,0.237,0.548,0.738,0.822,0.902,0.272,0.166,0.91,0.247,1.184,0.374,0.456,0.228,1.368,0.83,1.731,1.13,0.639,0.447,2.096,1.25,2.553,1.914,0.363,0.575,0.363,1.987,0.545,2.625,0.183,0.546,0.548,1.649,0.911,2.132,0.365,0.51,1.276,1.285,1.73,1.713,0.64,0.565,1.733,1.95,2.462,2.241,0.3,0.13,0.7,0.15,1,0.15","name":"Сумська область"},"61":{"path":"M448.25,286.55l-0.064,1.401,3.28,1.076,0.365,2.087-3.289,0.802-1.076,4.129,2.241,1.558-0.564,2.324-0.675,2.76-4.446-0.082s-0.329,1.868-0.483,2.488c-0.118,0.455-0.337,1.384-0.556,1.795-0.283,0.528-1.35,1.276-1.531,1.85-0.1,0.338,0.101,1.085,0.127,1.439,0.036,0.675-0.009,2.023,0.119,2.679,0.1,0.565,0.474,1.658,0.72,2.169,0.355,0.72,1.348,1.995,1.759,2.679,0.382,0.628,1.238,1.858,1.439,2.57,0.218,0.72,0.228,2.25,0.209,2.998-0.027,0.828-0.492,2.46-0.447,3.288,0.064,1.04,0.692,3.063,1.048,4.047,0.182,0.51,0.747,1.449,0.912,1.958,0.264,0.784,0.665,2.416,0.646,3.244-0.009,0.492-0.227,1.495-0.482,1.923-0.237,0.401-1.084,0.901-1.358,1.286-0.392,0.537-0.957,1.758-1.121,2.396-0.11,0.419,0.119,1.367-0.128,1.723-0.236,0.373-1.193,0.555-1.558,0.801-0.419,0.292-1.33,0.894-1.522,1.367-0.255,0.621,0.101,2.015,0.201,2.679,0.145,0.938,0.655,2.762,0.838,3.692,0.146,0.72,0.391,2.186,0.483,2.915,0.128,1.048,0.337,3.152,0.32,4.21-0.019,1.048-0.429,3.116-0.438,4.165-0.01,1.066,0.118,3.207,0.355,4.247,0.218,0.92,1.221,2.587,1.367,3.526,0.136,0.875,0.054,2.687-0.246,3.517-0.165,0.474-0.83,1.239-1.158,1.604-0.365,0.4-1.24,1.046-1.604,1.448-0.4,0.437-1.212,1.349-1.403,1.923-0.364,1.112-0.118,3.518-0.036,4.684,0.091,1.313,0.729,3.89,0.802,5.204,0.072,1.338-0.155,4.027-0.201,5.367-0.018,0.61,0.118,1.867-0.082,2.441-0.192,0.556-1.047,1.414-1.403,1.887-0.428,0.574-1.403,1.668-1.722,2.324-0.356,0.739-0.784,2.342-0.838,3.163-0.055,0.802,0.018,2.487,0.401,3.198,0.209,0.4,1.139,0.782,1.357,1.166,0.311,0.528,0.557,1.794,0.483,2.405-0.064,0.538-0.82,1.432-0.921,1.96-0.199,1.075,0.265,3.271,0.282,4.364,0.02,1.121-0.155,3.363-0.163,4.492,0,1.322-0.174,4,0.163,5.285,0.247,0.957,1.313,2.68,1.842,3.526,0.246,0.392,0.966,1.075,1.12,1.521,0.183,0.529-0.154,1.732,0.083,2.241,0.156,0.33,0.884,0.656,1.084,0.958,0.366,0.583,0.593,1.987,0.793,2.643,0.218,0.71,0.529,2.186,0.883,2.844,0.565,1.057,2.296,2.76,3.044,3.689,0.41,0.501,1.267,1.594,1.941,2.442-0.957,0.064-2.315,0.355-3.062,0.427-1.03,0.102-3.08,0.338-4.109,0.321-1.204-0.028-3.619-0.228-4.757-0.593-0.775-0.246-2.278-0.993-2.88-1.549-0.446-0.4-0.957-1.548-1.338-2.022-0.347-0.437-1.066-1.322-1.55-1.604-0.236-0.137-0.801-0.346-1.067-0.264-0.345,0.09-0.7,0.83-1.01,1.012-0.556,0.318-1.831,0.811-2.46,0.693-0.438-0.083-1.13-0.74-1.44-1.066-0.255-0.274-0.748-0.867-0.802-1.232-0.119-0.855,0.984-2.441,1.021-3.307,0.019-0.565-0.182-1.713-0.484-2.196-0.199-0.311-0.838-0.756-1.175-0.901-0.328-0.138-1.039-0.247-1.394-0.219-0.319,0.037-0.939,0.282-1.222,0.428-0.564,0.292-1.549,1.122-2.085,1.45-0.466,0.272-1.396,0.875-1.923,1.011-0.493,0.128-1.541,0.2-2.032,0.055-0.52-0.164-1.395-0.875-1.759-1.285-0.483-0.538-1.011-1.921-1.439-2.504-0.328-0.439-1.093-1.24-1.495-1.605-0.364-0.327-1.093-1.029-1.549-1.175-0.793-0.255-2.488,0.018-3.317,0.109-0.701,0.073-2.069,0.547-2.77,0.484-0.656-0.074-1.896-0.63-2.462-0.967-0.482-0.282-1.229-0.875-1.812-1.421-0.283-0.254-0.53-0.509-0.703-0.711-0.702-0.875-1.858-2.86-2.131-3.954-0.147-0.575,0.062-1.768,0-2.352-0.092-0.856-0.265-2.652-0.748-3.363-0.273-0.409-1.149-0.947-1.604-1.121-0.574-0.227-1.868-0.119-2.451-0.319-0.592-0.21-1.677-0.866-2.141-1.285-0.393-0.355-1.03-1.24-1.276-1.713-0.328-0.593-0.592-1.959-0.912-2.561-0.209-0.411-0.71-1.203-1.066-1.494-0.337-0.284-1.167-0.793-1.604-0.748-0.227,0.019-0.592,0.364-0.746,0.529-0.247,0.291-0.474,1.04-0.693,1.339-0.273,0.365-0.847,1.149-1.286,1.286-0.31,0.09-0.974-0.146-1.284-0.274-0.575-0.237-1.586-0.993-2.079-1.385-0.6-0.474-1.603-1.668-2.241-2.086-0.528-0.328-1.686-0.884-2.296-0.958-0.364-0.045-1.129,0.393-1.44,0.21-0.365-0.201-0.647-1.13-0.647-1.55,0-0.3,0.383-0.829,0.483-1.12,0.155-0.438,0.601-1.357,0.483-1.813-0.119-0.419-0.792-1.195-1.23-1.23-0.365-0.027-0.919,0.593-1.176,0.856-0.263,0.273-0.556,1.039-0.855,1.286-0.274,0.218-0.975,0.555-1.331,0.528-0.465-0.028-1.303-0.556-1.604-0.903-0.31-0.355-0.638-1.294-0.693-1.768-0.081-0.637,0.392-1.913,0.32-2.561-0.064-0.537-0.538-1.531-0.748-2.032-0.163-0.393-0.437-1.248-0.748-1.549-0.555-0.52-2.131-0.874-2.833-1.167-0.792-0.347-2.488-0.838-3.153-1.395-0.473-0.391-0.974-1.566-1.385-2.021-0.401-0.457-1.32-1.25-1.813-1.604-0.364-0.264-1.212-0.62-1.549-0.911-0.319-0.264-0.848-0.931-1.067-1.286-0.246-0.383-0.865-1.211-0.747-1.649,0.072-0.311,0.71-0.656,1.012-0.748,0.41-0.127,1.284,0.137,1.713,0.046,0.373-0.074,1.011-0.558,1.384-0.639,0.356-0.074,1.112-0.154,1.439,0,0.393,0.183,0.757,1.111,1.122,1.34,0.236,0.146,0.829,0.401,1.066,0.263,0.264-0.145,0.355-0.828,0.374-1.119,0.037-0.438-0.064-1.331-0.265-1.714-0.328-0.601-1.476-1.458-2.023-1.867-0.556-0.411-1.794-1.003-2.352-1.386-0.555-0.375-1.685-1.131-2.086-1.659-0.373-0.482-0.838-1.64-0.956-2.242-0.1-0.482-0.192-1.521,0-1.977,0.201-0.501,1.093-1.239,1.548-1.55,0.738-0.509,2.515-1.01,3.309-1.438,0.382-0.211,1.239-0.574,1.439-0.958,0.11-0.217,0.137-0.765,0-0.965-0.281-0.418-1.403-0.556-1.868-0.748-0.71-0.3-2.131-0.892-2.833-1.229-0.475-0.228-1.869-1.012-1.869-1.012l-1.658-12.921-2.561-5.075,0.292-4.794,0.073-1.129-1.166-5.294,10.151-3.362,6.296-4.646,3.899-5.451,4.274-0.473,1.978-4.219s-0.738-1.549-0.912-2.086c-0.229-0.702-0.748-2.151-0.637-2.88,0.082-0.529,0.629-1.558,1.066-1.868,0.737-0.537,2.688-0.546,3.581-0.755,0.83-0.184,2.46-0.786,3.308-0.793,0.447-0.009,1.313,0.419,1.768,0.374,0.419-0.055,1.149-0.583,1.55-0.748,0.464-0.2,1.402-0.674,1.921-0.701,0.201-0.009,0.656,0.063,0.794,0.219,0.328,0.364,0.054,1.484,0.264,1.922,0.192,0.373,0.774,1.083,1.184,1.174,0.338,0.073,1.332-0.483,1.332-0.483l3.526-3.152,2.879-9.769-1.567-4.027c1.048-1.112,3.226-3.335,4.337-3.891,0.692-0.347,2.324-0.283,3.043-0.556,0.494-0.201,1.523-0.674,1.796-1.13,0.209-0.327,0.182-1.176,0.128-1.558-0.074-0.447-0.438-1.285-0.647-1.686-0.255-0.5-0.975-1.385-1.239-1.877-0.22-0.392-0.629-1.203-0.721-1.64-0.117-0.573-0.145-1.768,0-2.324,0.138-0.52,0.557-1.649,1.039-1.886,0.384-0.192,1.276,0.109,1.686,0.237,0.393,0.127,1.13,0.538,1.477,0.765,0.556,0.356,1.503,1.275,2.049,1.64,0.565,0.392,1.714,1.458,2.397,1.367,0.4-0.064,0.848-0.875,1.121-1.166,0.411-0.42,1.649-1.686,1.649-1.686l5.804-0.155s0.601,0.382,0.803,0.519c0.483,0.346,1.293,1.349,1.877,1.486,0.646,0.136,1.95-0.365,2.57-0.602,0.527-0.208,1.512-0.82,1.995-1.12,0.52-0.329,1.622-0.93,2.005-1.404,0.283-0.346,0.52-1.239,0.72-1.639,0.3-0.593,0.956-1.741,1.321-2.288,0.283-0.41,0.82-1.249,1.204-1.559,0.382-0.31,1.275-0.811,1.767-0.848,0.374-0.018,1.13,0.274,1.44,0.483,0.538,0.374,1.176,1.585,1.64,2.042,0.301,0.291,0.912,0.965,1.323,1.001,0.392,0.037,1.046-0.537,1.403-0.72,0.364-0.191,1.066-0.691,1.485-0.757,0.437-0.072,1.34,0.129,1.758,0.275,0.446,0.154,1.203,0.746,1.641,0.919,0.738,0.292,2.287,0.757,3.089,0.766,0.364,0.009,1.084-0.227,1.439-0.318,0.383-0.101,1.122-0.438,1.521-0.447,0.32,0,0.958,0.164,1.24,0.329,0.282,0.154,0.884,0.564,0.92,0.874,0.055,0.384-0.574,1.012-0.802,1.322-0.365,0.52-1.604,1.968-1.604,1.968l-0.28,6.06z","name":"Тернопільська область"},"63":{"path":"M1195.087,379.248l-1.733,2.661l-11.844-2.296l-1.276,1.631l-4.191-0.336l-1.548,3.645l0.454,2.241 l5.833,2.004c0,0,0.456,1.158,0.456,1.559c0,0.511-0.091,1.558-0.364,2.005c-0.274,0.456-1.004,1.203-1.551,1.402 c-0.546,0.265-1.914,0.211-2.642,0.165c-0.639-0.045-1.914-0.501-2.643-0.519c-0.273-0.009-0.911-0.046-1.093,0.155 c-0.273,0.199-0.273,0.866-0.273,1.166c0,0.492,0.455,1.476,0.363,1.959c-0.09,0.318-0.546,0.811-0.82,1.003 c-0.456,0.318-1.731,0.437-2.187,0.72c-0.729,0.4-2.005,1.439-2.46,2.122c-0.366,0.475-0.457,1.641-0.637,2.16 c-0.184,0.446-0.549,1.395-0.914,1.722c-0.544,0.547-2.276,0.848-2.913,1.286c-0.549,0.372-1.823,1.202-2.007,1.84 c-0.182,0.383,0.092,1.64,0.092,1.64l2.643,4.41l-7.106,0.274l-3.009,3.727l0.184,6.771l-3.374,0.163l-0.18-4.848l-3.281,0.037 l-1.186,4.41l-1.093-2.287l-3.098,2.687l3.734,5.522l-1.456,1.003l-4.557-5.367l-6.105-0.201l-0.638,1.959l-1.914,1.322 l-2.824-2.562l-5.103,0.248c0,0-1.095,0.628-1.184,0.993c-0.186,0.364,0.089,1.166,0.272,1.53c0.271,0.829,1.459,2.232,1.912,2.998 c0.549,0.894,2.096,3.645,2.096,3.645l-1.274,9.104l-3.191-1.212l-2.915,3.163l-4.008-2.041l-3.281-2.561l-10.389,11.491 c0,0-1.183,0.374-1.639,0.246c-0.364-0.145-1.002-0.847-1.094-1.24c-0.182-0.51,0.271-1.566,0.271-2.086 c0-0.538-0.271-1.595-0.545-2.086c-0.182-0.538-1.278-1.367-1.278-1.96c0-0.383,0.731-0.938,0.731-1.321 c0.092-0.793-0.363-2.487-1.003-3.007c-0.545-0.473-2.188-0.228-2.825-0.519c-0.545-0.236-1.914-1.44-1.914-1.44l-3.096-2.77 c0,0-0.913-0.929-1.095-1.312c-0.274-0.683-0.455-2.924-0.455-2.924l-0.275-3.29l-4.646-2.598l0.182-1.968 c0,0-1.914-2.032-2.551-2.724c-0.274-0.237-0.82-0.647-0.91-0.958c-0.092-0.3-0.092-1.001,0.09-1.285 c0.09-0.182,0.546-0.336,0.638-0.519c0.183-0.355,0.273-1.212,0.183-1.604c-0.183-0.556-1.093-1.384-1.459-1.804 c-0.362-0.356-1.274-0.866-1.548-1.277c-0.273-0.31-0.547-1.029-0.547-1.403c-0.091-0.646,0.183-1.94,0.364-2.56 c0.092-0.464,0.637-1.313,0.82-1.768c0.091-0.254,0.455-0.846,0.273-1.039c-0.183-0.191-0.73,0.21-1.002,0.283 c-0.822,0.237-2.645,0.547-3.462,0.956c-0.823,0.429-2.096,1.869-2.919,2.37c-1.274,0.83-4.19,2.078-5.648,2.634 c-1.093,0.41-3.189,1.339-4.373,1.331c-0.64-0.01-1.913-0.638-2.552-0.803c-0.911-0.236-2.733-0.574-3.646-0.766 c-0.912-0.199-2.823-0.683-3.828-0.801c-1.002-0.11-2.915-0.146-3.918-0.119c-0.91,0.028-2.642,0.455-3.554,0.318 c-0.547-0.072-1.457-0.509-1.913-0.756c-0.729-0.457-2.096-1.74-2.825-2.205c-1.092-0.611-3.371-1.331-4.374-2.004 c-0.727-0.475-1.822-1.776-2.461-2.361c-0.545-0.537-1.546-1.713-2.186-2.122c-0.638-0.402-2.096-0.839-2.827-1.085 c-0.454-0.173-1.546-0.309-2.002-0.601c-0.365-0.237-1.002-0.912-1.095-1.322c-0.271-0.583,0.183-1.896,0-2.479 c-0.271-0.555-1.001-1.494-1.549-1.839c-0.455-0.374-1.73-0.848-2.369-0.921c-0.364-0.055-1.184,0.164-1.639,0.236 c-0.457,0.073-1.276,0.475-1.643,0.365c-0.363-0.1-0.818-0.875-1.184-1.003c-0.182-0.1-0.729-0.055-1.003,0 c-0.453,0.082-1.274,0.475-1.641,0.674c0,0.028-0.09,0.047-0.09,0.073l-4.556-8.637c0,0,0.182-2.132,0.364-2.808 c0.363-1.303,1.094-4.255,2.279-4.885c0.728-0.392,2.459,0.375,3.278,0.52c1.003,0.164,2.823,0.62,3.828,0.721 c0.728,0.082,2.096-0.064,2.734,0.082c0.546,0.108,1.457,0.691,2.004,0.802c0.638,0.137,2.096-0.119,2.824,0.036 c0.364,0.101,1.093,0.629,1.55,0.721c0.454,0.1,1.459,0.199,1.822,0c0.455-0.201,1.093-0.984,1.093-1.44 c0.092-0.555-0.911-1.449-0.911-2.005c0-0.838,1.003-2.296,1.549-2.962c0.366-0.474,1.366-1.21,1.823-1.603 c0.547-0.482,2.096-1.157,2.277-1.876c0.185-0.721-0.638-2.187-1-2.807c-0.367-0.564-1.55-1.321-2.006-1.841 c-0.364-0.428-1.095-1.357-1.274-1.886c-0.184-0.473-0.366-1.494-0.275-1.995c0-0.602,0.365-1.851,0.821-2.251 c0.364-0.337,1.457-0.392,2.004-0.438c0.73-0.063,2.186-0.145,2.822,0.082c0.64,0.183,1.369,1.166,2.007,1.321 c0.455,0.128,1.457,0.155,1.913-0.119c0.546-0.391,0.82-1.867,1.094-2.486c0.183-0.42,0.819-1.231,0.638-1.677 c0-0.329-0.82-0.592-1.001-0.885c-0.185-0.391-0.274-1.331-0.185-1.758c0.092-0.465,0.821-1.158,1.004-1.603 c0.182-0.455,0.182-1.924,0.182-1.924l-5.193-8.291l-7.837-0.566c0,0-1.093-0.656-1.275-1.04c-0.185-0.372,0.274-1.329,0-1.638 c-0.274-0.346-1.366-0.292-1.823-0.319c-0.455-0.036-1.549,0.354-2.004,0.119c-0.274-0.164-0.639-1.204-0.639-1.204l-1.093-10.999 l-2.005-1.176h-5.923l-0.821-2.296c0,0-0.728,1.003-1.092,1.012c-0.729,0.018-1.551-1.988-2.278-1.923 c-0.364,0.028-0.639,0.939-0.911,1.075c-0.364,0.128-1.095,0.019-1.368-0.109c-0.91-0.355-2.368-1.795-3.098-2.405 c-0.548-0.483-1.913-1.359-2.369-1.978c-0.364-0.492-0.637-1.686-0.91-2.242c-0.273-0.583-1.003-1.667-1.095-2.296 c-0.183-0.51-0.183-1.595,0-2.086c0.092-0.264,0.546-0.602,0.729-0.849c0.366-0.747,0.64-2.432,0.64-3.262 c0.09-0.592-0.183-1.84,0-2.396c0.09-0.291,0.546-0.755,0.818-0.911c0.365-0.254,1.55-0.091,1.823-0.482 c1.094-1.531-0.636-6.634-0.636-6.634s2.184-3.818,3.551-4.018c0.366-0.046,0.82,0.528,1.186,0.702 c0.273,0.164,0.729,0.564,1.093,0.637c0.548,0.129,1.643-0.082,2.188-0.118c0.183-0.017,0.729,0.064,0.912-0.082 c0.273-0.191,0.362-0.884,0.455-1.202c0-0.474-0.093-1.44-0.093-1.923c0.093-0.446,0.276-1.349,0.456-1.758 c0.274-0.528,1.095-1.413,1.55-1.822c0.274-0.255,0.821-0.803,1.185-0.884c0.274-0.063,0.913,0.209,1.186,0.284 c0.729,0.162,2.003,0.537,2.643,0.682c0.453,0.09,1.276,0.374,1.729,0.3c0.184-0.045,0.64-0.336,0.821-0.482 c0.274-0.191,0.82-0.611,1.004-0.884c0.089-0.218,0.363-0.747,0.363-1.021c0-0.383-0.638-1.039-0.547-1.421 c0-0.292,0.272-0.865,0.547-1.021c0.455-0.292,1.641-0.01,2.187-0.018c0.546-0.018,1.456,0.054,2.004-0.082 c0.184-0.064,0.731-0.283,0.82-0.501c0.093-0.211,0-0.739-0.089-0.958c-0.093-0.292-0.731-0.592-0.912-0.865 c-0.183-0.238-0.367-0.812-0.367-1.103c0-0.227,0.275-0.682,0.459-0.837c0.18-0.21,0.909-0.328,1.185-0.438 c0.638-0.237,1.823-0.711,2.458-0.984c0.456-0.2,1.368-0.593,1.823-0.885c0.183-0.146,0.365-0.728,0.639-0.72 c0.454,0.019,0.91,1.012,1.184,1.34c0.455,0.557,1.458,1.659,1.915,2.169c0.455,0.374,1.094,1.35,1.639,1.423 c0.184,0.025,0.547-0.229,0.729-0.348c0.274-0.146,0.729-0.455,0.82-0.72c0.092-0.355-0.637-1.04-0.546-1.376 c0.182-0.41,1.186-0.611,1.639-0.765c0.459-0.172,1.368-0.456,1.915-0.555c0.454-0.11,1.457-0.42,2.005-0.265 c0.271,0.091,0.545,0.61,0.82,0.801c0.182,0.192,0.637,0.729,0.91,0.737c0.365,0.02,0.91-0.501,1.186-0.774 c0.272-0.337,0.453-1.193,0.546-1.604c0.092-0.382,0.272-1.057,0.365-1.584c0.637,0.009,1.458-0.11,1.913-0.164 c0.82-0.101,2.552-0.41,3.281-0.747c0.637-0.265,1.64-1.086,2.186-1.495c0.911-0.766,2.553-2.524,3.464-3.317 c0.819-0.683,2.369-2.104,3.279-2.615c1.094-0.627,3.646-1.431,4.921-1.705c0.82-0.172,2.459-0.327,3.281-0.318 c0.729,0,2.278,0.082,2.916,0.318c0.544,0.182,1.549,0.939,2.002,1.176c0.912,0.374,2.917,0.656,3.739,1.066 c0.818,0.365,2.277,1.376,2.914,1.922c0.819,0.693,2.46,2.215,3.099,3.099c0.729,0.965,1.458,3.334,2.277,4.273 c0.457,0.52,1.46,1.484,2.097,1.704c0.729,0.245,2.371,0,3.189-0.109c0.729-0.101,2.005-0.611,2.734-0.692 c0.454-0.045,1.274,0.017,1.641,0.053c0.91,0.073,2.734,0.366,3.645,0.484c0.818,0.1,2.46,0.301,3.189,0.428 c0.456,0.056,1.273,0.01,1.547,0.265c0.364,0.346,0.364,1.484,0.456,1.977c0.183,0.73,0.366,2.288,0.82,2.879 c0.455,0.511,1.642,1.176,2.188,1.339c0.82,0.202,2.463,0.191,3.19-0.108c0.909-0.365,2.277-1.858,2.915-2.615 c0.455-0.638,1.093-2.178,1.549-2.834c0.639-0.856,2.188-2.388,3.008-3.088c0.911-0.766,2.733-2.143,3.735-2.726 c1.001-0.61,3.006-1.721,4.191-2.032c1.275-0.364,4.101-0.4,5.469-0.482c0.91-0.055,2.734,0.099,3.645-0.11 c0.728-0.173,2.005-1.029,2.823-1.277c0.456-0.171,1.551-0.418,2.098-0.481c0.729-0.082,2.276,0.2,3.005,0 c0.64-0.174,1.733-0.966,2.188-1.331c0.912-0.592,2.459-1.959,3.279-2.57c0.821-0.601,2.554-1.804,3.462-2.296 c0.731-0.438,2.462-1.084,3.372-1.441c0.729-0.309,2.097-1.193,2.826-1.23c0.364-0.018,1.094,0.247,1.367,0.429 c0.729,0.41,1.913,1.567,2.368,2.242c0.731,1.002,1.093,3.526,1.824,4.482c0.638,0.894,2.641,2.025,3.552,2.671 c0.821,0.591,2.644,1.576,3.371,2.305c0.365,0.337,0.821,1.166,1.095,1.595c0.273,0.564,0.638,1.74,0.819,2.352 c0.273,1.076,0.273,3.29,0.456,4.383c0.183,1.185,0.549,3.608,1.095,4.692c0.454,1.029,2.094,2.716,2.915,3.582 c0.455,0.592,1.55,1.704,2.095,2.295c0.365,0.456,1.004,1.505,1.458,1.869c0.365,0.264,1.188,0.6,1.551,0.693 c0.729,0.155,2.186-0.11,2.915,0c0.548,0.09,1.55,0.456,2.096,0.692c1.367,0.692,3.828,2.542,5.104,3.526 c1.092,0.911,3.098,2.988,4.101,4.009c0.728,0.728,2.096,2.241,2.824,2.989c0.456,0.51,1.276,1.741,1.913,2.032 c0,0.009,0.091,0.026,0.091,0.036c-0.091,0.438-0.182,1.104-0.091,1.376c0.275,0.665,1.732,1.384,2.097,1.949 c0.363,0.428,0.819,1.385,1.002,1.896c0.183,0.62,0.547,2.014,0.273,2.587c-0.091,0.246-0.729,0.439-1.003,0.51 c-0.363,0.091-1.185-0.146-1.455,0.082c-0.185,0.183-0.185,0.893-0.366,1.122c-0.092,0.191-0.729,0.264-0.821,0.5 c-0.18,0.392,0.273,1.249,0.549,1.548c0.181,0.274,1.001,0.52,1.276,0.648c0.635,0.219,2.002,0.264,2.459,0.666 c0.181,0.127,0.455,0.51,0.363,0.691c-0.092,0.356-1.093,0.346-1.458,0.539c-0.456,0.253-1.274,0.929-1.64,1.275 c-0.271,0.273-0.912,0.884-1.186,1.148c-0.271,0.219-0.728,0.811-1.093,0.803c-0.364,0-0.728-0.684-1.094-0.803 c-0.181-0.073-0.638-0.138-0.817-0.045c-0.274,0.119-0.729,0.673-0.822,0.956c-0.182,0.474-0.091,1.559-0.274,2.06 c-0.089,0.529-1.183,1.604-0.818,2.022c0.271,0.337,1.275-0.556,1.729-0.428c0.64,0.2,1.278,1.439,1.732,1.95 c0.455,0.673,1.548,2.041,1.822,2.834c0.184,0.345,0.273,1.094,0.273,1.467c0,0.291-0.09,0.92-0.273,1.121 c-0.274,0.274-1.274,0.073-1.549,0.346c-0.364,0.337-0.364,1.395-0.456,1.869c-0.181,0.573-0.271,1.721-0.455,2.295 c-0.092,0.62-0.092,1.95-0.455,2.461c-0.183,0.365-1.094,0.729-1.551,0.884c-0.547,0.21-1.821,0.21-2.37,0.427 c-0.452,0.138-1.273,0.502-1.545,0.848c-0.093,0.264-0.275,0.957-0.093,1.229c0.093,0.283,0.91,0.375,1.186,0.511 c0.182,0.1,0.729,0.209,0.818,0.428c0.092,0.236,0,0.81-0.181,1.039c-0.186,0.273-0.729,0.62-1.003,0.775 c-0.365,0.163-1.093,0.2-1.368,0.456c-0.363,0.455-0.547,1.813-0.638,2.424c-0.181,0.766-0.545,2.304-0.454,3.069 c0.089,0.602,0.638,1.678,0.911,2.242c0.181,0.575,0.636,1.704,0.729,2.306c0.181,0.656,0.092,2.023,0.181,2.688 c0.183,1.121,0.821,3.317,1.093,4.411c0.093,0.364,0.275,1.148,0.549,1.439c0.272,0.418,1.367,0.793,1.913,1.012 c0.455,0.219,1.548,0.437,2.005,0.729c0.363,0.182,0.91,0.656,1.001,0.984c0.183,0.264,0.183,0.875,0.093,1.147 c-0.093,0.246-0.73,0.802-0.73,0.802l-3.645-1.896l0.092,4.374L1195.087,379.248L1195.087,379.248z","name":"Харківська область"},"65":{"path":"M1024,678.93c0.272,0.22,1.093,0.42,1.822,0.556-0.729,0.492-1.55,1.011-2.005,1.367-0.818,0.602-2.278,1.995-3.189,2.441-0.637,0.3-2.004,0.701-2.643,0.72-0.636,0.017-1.73-0.409-2.278-0.481-0.546-0.063-1.638-0.293-2.095-0.083-0.456,0.217-1.003,1.24-1.366,1.648-0.366,0.439-1.186,1.294-1.551,1.724-0.548,0.556-1.73,1.603-2.276,2.195-0.273,0.337-0.73,1.094-1.004,1.448-0.181,0.32-0.638,1.012-1.002,1.24-0.363,0.254-1.275,0.611-1.641,0.557-0.729-0.083-1.731-1.167-2.368-1.441-0.638-0.3-2.097-0.817-2.824-0.801-0.822,0.018-2.28,0.62-3.008,0.967-0.367,0.173-0.91,0.746-1.275,0.919-0.365,0.146-1.186,0.054-1.366,0.356-0.093,0.253,0.363,0.784,0.453,1.057,0,0.511-0.181,1.575-0.09,2.077,0.09,0.584,0.911,1.559,1.003,2.142,0.18,0.984,0,3.014-0.184,4.007-0.182,1.031-0.729,3.056-1.183,4.002-0.364,0.701-1.096,2.104-1.642,2.617-0.547,0.455-1.822,1.001-2.551,1.174-0.547,0.137-1.733-0.091-2.188,0.11-0.365,0.12-0.819,0.683-1.094,0.847-0.363,0.202-1.186,0.474-1.549,0.539-0.181,0.025-0.546,0.108-0.639,0-0.454-0.346-0.092-1.604-0.272-2.081-0.182-0.298-0.64-0.773-0.912-0.964-0.454-0.299-1.612-0.41-1.876-0.857-0.192-0.318-0.019-1.137,0.101-1.493,0.183-0.493,0.772-1.421,1.229-1.703,0.364-0.229,1.367-0.019,1.639-0.329,0.185-0.191,0.275-0.802,0.185-1.057-0.093-0.383-1.005-0.756-1.095-1.132-0.183-0.373-0.091-1.219,0.09-1.592,0.093-0.429,0.64-1.224,1.005-1.507,0.271-0.182,0.818-0.445,1.093-0.417,0.274,0.009,0.547,0.373,0.729,0.417,0.272,0.074,0.91,0.083,1.184-0.044,0.183-0.109,0.365-0.665,0.548-0.757,0.363-0.126,1.093,0.064,1.366,0.22,0.273,0.127,0.545,0.757,0.819,0.801,0.274,0.046,0.91-0.31,1.095-0.536,0.364-0.393,0.638-1.459,0.728-1.978,0-0.512-0.274-1.568-0.182-2.078,0.092-0.392,0.456-1.095,0.638-1.44,0.184-0.317,0.911-0.883,0.822-1.229-0.185-0.602-1.553-1.085-2.19-1.23-0.455-0.118-1.547-0.118-1.912,0.111-0.364,0.189-0.91,0.954-1.095,1.328-0.182,0.411-0.182,1.366-0.363,1.77-0.273,0.435-0.91,1.282-1.367,1.494-0.545,0.254-1.912,0.21-2.55,0-1.186-0.409-2.927-2.334-3.899-3.1-0.795-0.61-2.298-1.995-3.21-2.405-0.481-0.218-1.623-0.684-2.086-0.428-0.438,0.245-0.694,1.375-0.694,1.866,0.012,0.42,0.394,1.186,0.584,1.551,0.2,0.384,0.893,0.975,0.968,1.395,0.146,0.766-0.337,2.377-0.749,3.043-0.263,0.429-1.085,1.121-1.548,1.331-0.302,0.146-1.078,0.428-1.341,0.219-0.345-0.291-0.08-1.368-0.044-1.822,0.044-0.655,0.573-1.958,0.473-2.616-0.146-1.021-1.286-2.825-1.868-3.682-0.483-0.72-1.74-1.94-2.296-2.614-0.565-0.693-1.776-2.031-2.188-2.836-0.326-0.636-0.391-2.213-0.856-2.771-0.337-0.418-1.34-0.974-1.867-1.02-0.692-0.053-2.085,0.467-2.617,0.911-0.354,0.291-1.046,1.167-0.9,1.596,0.102,0.338,0.974,0.411,1.275,0.591,0.493,0.302,1.568,0.922,1.821,1.441,0.274,0.602-0.309,2.05-0.063,2.669,0.202,0.483,1.24,0.994,1.505,1.449,0.227,0.393,0.438,1.304,0.475,1.759,0.025,0.292,0.108,0.976-0.102,1.177-0.219,0.198-0.92,0.198-1.177,0.053-0.299-0.171-0.454-0.938-0.638-1.229-0.262-0.4-0.72-1.395-1.185-1.493-0.244-0.057-0.79,0.244-0.9,0.481-0.2,0.429,0.255,1.422,0.43,1.867,0.227,0.583,1.139,1.567,1.22,2.188,0.063,0.419-0.137,1.34-0.419,1.658-0.318,0.348-1.303,0.638-1.769,0.638-0.437,0-1.284-0.356-1.658-0.592-0.348-0.219-0.783-1.021-1.166-1.167-0.294-0.118-0.955-0.082-1.23,0.045-0.31,0.146-0.62,0.85-0.911,1.021-0.311,0.173-1.067,0.456-1.387,0.318-0.453-0.2-0.81-1.256-1.01-1.713-0.355-0.775-0.647-2.487-1.022-3.253-0.317-0.646-1.102-1.896-1.646-2.351-0.666-0.53-2.28-1.157-3.101-1.339-0.818-0.165-2.486-0.027-3.315-0.046-0.655-0.028-2.005,0.136-2.617-0.109-0.609-0.246-1.419-1.404-1.976-1.759-0.411-0.273-1.284-0.729-1.758-0.802-0.493-0.083-1.549-0.037-1.978,0.209-0.503,0.291-1.03,1.413-1.396,1.868-0.29,0.373-0.755,1.394-1.22,1.439-0.429,0.055-1.048-0.756-1.395-1.013-0.336-0.243-0.957-0.817-1.33-1.011-0.513-0.264-1.696-0.982-2.197-0.691-0.254,0.146-0.31,0.874-0.264,1.166,0.036,0.255,0.182,0.603,0.366,0.931l-0.421,1.211-2.278-0.047,2.645,10.736-1.342,0.674c-0.109-0.865-0.527-2.315-0.946-2.952-0.275-0.421-1.067-1.075-1.523-1.286-0.664-0.3-2.168-0.592-2.879-0.437-0.547,0.118-1.55,0.784-1.875,1.237-0.273,0.374-0.586,1.322-0.494,1.76,0.099,0.42,0.893,0.929,1.131,1.286,0.264,0.392,0.767,1.221,0.838,1.686,0.053,0.373,0.018,1.202-0.246,1.477-0.237,0.264-1.02,0.235-1.358,0.327-0.274,0.064-0.884,0.118-1.075,0.318-0.245,0.246-0.355,0.993-0.365,1.34-0.018,0.42,0.447,1.258,0.32,1.658-0.072,0.247-0.477,0.666-0.72,0.703-0.345,0.063-0.965-0.448-1.285-0.62-0.318-0.174-0.875-0.729-1.238-0.758-0.339-0.035-0.976,0.302-1.241,0.503-0.173,0.118-0.327,0.584-0.519,0.655-0.346,0.128-1.202,0.02-1.438-0.254-0.283-0.33,0.062-1.304-0.064-1.704-0.146-0.449-0.748-1.204-1.058-1.552-0.219-0.226-0.821-0.527-0.983-0.791-0.202-0.311-0.247-1.084-0.385-1.431-0.146-0.346-0.436-1.131-0.754-1.34-0.273-0.173-0.968-0.1-1.286-0.091-0.439,0.011-1.295,0.273-1.721,0.236-0.522-0.055-1.541-0.364-1.942-0.683-0.392-0.301-0.748-1.304-1.104-1.64-0.326-0.31-1.092-0.804-1.521-0.921-0.455-0.128-1.449-0.173-1.885,0-0.257,0.101-0.574,0.611-0.803,0.756-0.182,0.129-0.601,0.456-0.803,0.364-0.19-0.091-0.256-0.592-0.235-0.801,0.036-0.447,0.61-1.186,0.765-1.604,0.182-0.548,0.527-1.695,0.518-2.276-0.008-0.476-0.507-1.342-0.48-1.807,0.019-0.327,0.364-0.902,0.48-1.202,0.111-0.29,0.459-0.856,0.439-1.167-0.009-0.162-0.155-0.563-0.319-0.602-0.236-0.044-0.575,0.457-0.764,0.602-0.302,0.257-1.003,0.667-1.205,1.002-0.218,0.384-0.245,1.295-0.317,1.724-0.091,0.602-0.064,1.859-0.32,2.405-0.3,0.637-1.294,1.75-1.922,2.086-0.593,0.319-1.984,0.574-2.644,0.438-0.619-0.137-1.53-1.175-2.123-1.403-0.482-0.181-1.522-0.309-2.04-0.319-0.475-0.008-1.477-0.008-1.887,0.238-0.192,0.119-0.445,0.547-0.52,0.764-0.135,0.439,0.083,1.396-0.037,1.842-0.081,0.319-0.381,0.949-0.636,1.157-0.357,0.301-1.305,0.529-1.769,0.601-0.812,0.146-2.479,0.193-3.28,0.047-0.921-0.163-2.553-1.284-3.49-1.366-0.684-0.055-2.004,0.463-2.679,0.564-0.484,0.073-1.44,0.172-1.923,0.153-0.721-0.017-2.124-0.454-2.843-0.391-0.467,0.028-1.35,0.345-1.77,0.556-0.446,0.228-1.174,1.002-1.639,1.203-0.446,0.191-1.432,0.354-1.923,0.365-0.855,0.008-2.543-0.503-3.399-0.53-0.765-0.017-2.322,0.047-3.053,0.283-0.501,0.166-1.467,0.702-1.841,1.085-0.282,0.293-0.692,1.038-0.803,1.44-0.09,0.381,0.156,1.23,0,1.603-0.073,0.191-0.364,0.521-0.555,0.601-0.366,0.156-1.222,0.12-1.604,0-0.545-0.171-1.394-1.011-1.876-1.32-1.048-0.686-3.161-2.021-4.293-2.561-1.255-0.619-3.854-1.658-5.203-2.006-0.994-0.263-3.035-0.428-4.045-0.6-0.739-0.128-2.241-0.265-2.925-0.565-0.512-0.218-1.559-0.82-1.805-1.32-0.182-0.373-0.108-1.295,0.046-1.678,0.217-0.565,1.292-1.284,1.595-1.804,0.2-0.356,0.52-1.122,0.527-1.522,0-0.447-0.218-1.367-0.527-1.686-0.274-0.272-1.094-0.482-1.479-0.482-0.472,0.01-1.338,0.528-1.802,0.647-0.72,0.163-2.188,0.428-2.927,0.354-0.665-0.063-1.958-0.52-2.558-0.839-0.604-0.317-1.741-1.146-2.162-1.686-0.418-0.519-0.665-1.922-1.12-2.395-0.302-0.312-1.104-0.713-1.522-0.805-0.556-0.127-1.722,0.166-2.286,0.083-0.594-0.101-1.725-0.511-2.242-0.812-0.703-0.392-1.859-1.53-2.488-2.041-0.519-0.419-1.477-1.394-2.077-1.678-0.346-0.163-1.103-0.289-1.485-0.281-0.309,0.011-0.984,0.065-1.202,0.281-0.209,0.203-0.209,0.84-0.273,1.122-0.091,0.328-0.138,1.066-0.364,1.321-0.329,0.364-1.322,0.665-1.806,0.72-0.701,0.083-2.131-0.191-2.797-0.438-0.639-0.236-1.831-0.946-2.288-1.449-0.245-0.266-0.636-0.92-0.684-1.276-0.046-0.417,0.184-1.311,0.446-1.639,0.349-0.455,1.479-0.892,1.998-1.12,0.672-0.301,2.076-0.811,2.807-0.886,0.599-0.063,1.812,0.139,2.403,0.237,0.521,0.092,1.522,0.458,2.043,0.52,0.993,0.129,3.053,0.31,4.008,0,0.757-0.245,2.051-1.295,2.599-1.876,0.365-0.394,0.701-1.477,1.119-1.806,0.266-0.199,0.957-0.244,1.24-0.399,0.392-0.22,1.259-0.72,1.368-1.158,0.154-0.64-0.647-1.877-0.968-2.45-0.428-0.793-1.411-2.353-2.112-2.915-0.63-0.513-2.181-1.121-2.974-1.286-0.718-0.155-2.22,0-2.958,0-0.875,0-2.636,0.127-3.482-0.036-0.828-0.166-2.396-0.83-3.126-1.249-0.657-0.364-1.567-1.186-2.415-1.896l3.135-1.467,0.574-1.148c0.91,0.4,1.905,0.792,2.552,0.983,1.285,0.401,3.946,0.866,5.285,1.049,1.065,0.146,3.208,0.319,4.283,0.319,1.539-0.01,4.594-0.401,6.132-0.519,1.195-0.102,3.609-0.5,4.801-0.365,0.74,0.091,2.162,0.628,2.847,0.92,0.827,0.364,2.377,1.322,3.17,1.767,0.526,0.302,1.55,1.003,2.113,1.241,0.683,0.283,2.115,0.729,2.844,0.764,0.738,0.027,2.159-0.428,2.889-0.48,0.682-0.057,2.058,0.153,2.724,0,0.603-0.148,1.76-0.685,2.205-1.122,0.255-0.264,0.647-0.957,0.674-1.322,0.028-0.463-0.272-1.475-0.637-1.767-0.364-0.283-1.386-0.294-1.842-0.236-0.52,0.054-1.512,0.445-1.967,0.719-0.318,0.191-0.839,0.756-1.121,1.003-0.255,0.217-0.72,0.766-1.038,0.883-0.53,0.191-1.696,0.119-2.244,0-0.28-0.063-0.873-0.245-1.046-0.482-0.238-0.356,0.045-1.321-0.119-1.721-0.1-0.258-0.531-0.612-0.674-0.841-0.247-0.383-0.884-1.166-0.802-1.603,0.073-0.411,0.984-0.792,1.237-1.121,0.448-0.573,1.241-1.85,1.359-2.562,0.117-0.691,0.008-2.205-0.401-2.769-0.327-0.457-1.576-0.657-1.995-1.039-0.22-0.201-0.457-0.765-0.638-1.002-0.201-0.248-0.601-0.768-0.884-0.885-0.246-0.09-0.803-0.09-1.04,0-0.346,0.127-0.856,0.683-1.13,0.919-0.392,0.365-1.03,1.305-1.521,1.521-0.501,0.238-1.667,0.01-2.206,0.167-0.455,0.135-1.291,0.619-1.677,0.92-0.317,0.245-0.737,0.954-1.073,1.156-0.348,0.209-1.149,0.557-1.531,0.446-0.247-0.074-0.565-0.528-0.685-0.764-0.272-0.575-0.181-1.926-0.4-2.525-0.173-0.491-0.702-1.431-1.074-1.795-0.593-0.593-2.115-1.321-2.845-1.724-0.728-0.408-2.314-1.001-2.97-1.521-0.156-0.127-0.338-0.337-0.527-0.565l1.239-0.866-3.556-6.414,6.944-1.331,2.278,3.152,4.374-3.097,0.19-2.615,2.188-2.323,3.198-2.781,6.414,4.093-0.218-5.267,4.384,0.026,2.132,2.242,4.327-0.638-1.147-3.654,4.857-0.065,2.406,2.435,3.9-1.678,1.657,4.939,17.523-3.7-2.286-2.76-6.007,0.081,0.164-1.604,9.769-3.242,0.083-2.689-3.683-1.52,1.795-2.881,4.248,1.878,3.608-4.64-7.209-4.812-3.927-4.966,3.891-7.49,6.36-0.237,4.045-2.604-2.113-5.085-0.209-4.246,2.241-2.159-1.357-4.256-3.691-0.237-3.034-7.765,2.314-1.365,2.889,5.686,4.528,0.081-2.567-9.375-3.254-6.325c0.381,0.072,0.747,0.139,1.012,0.165,0.81,0.062,2.45-0.264,3.242-0.129,0.729,0.129,2.18,0.602,2.725,1.084,0.284,0.246,0.493,0.993,0.721,1.285,0.565,0.692,1.979,1.813,2.688,2.361,0.364,0.281,1.12,0.81,1.521,1.038,0.455,0.266,1.402,0.674,1.875,0.885,0.594,0.264,1.733,0.893,2.363,1.038,0.301,0.073,0.929,0.165,1.212,0.046,0.289-0.129,0.71-0.666,0.838-0.967,0.1-0.236-0.027-0.8,0.082-1.039,0.12-0.254,0.793-0.802,0.793-0.802l9.212-0.199,0.883-0.801-0.684-4.722s1.247-0.166,1.65-0.282c0.347-0.109,1.021-0.456,1.358-0.604,0.464-0.208,1.349-0.728,1.84-0.836,0.365-0.091,1.147-0.202,1.486-0.046,0.263,0.126,0.572,0.674,0.719,0.92,0.165,0.292,0.528,0.911,0.519,1.238,0,0.302-0.3,0.849-0.48,1.086-0.193,0.265-0.893,0.527-1.004,0.848-0.092,0.263,0.218,0.827,0.247,1.119,0.027,0.374,0.009,1.139-0.047,1.521-0.054,0.403-0.264,1.212-0.391,1.596-0.128,0.364-0.602,1.403-0.602,1.403l1.039,1.887,14.542-0.602,7.729-2.645,1.676,1.268c0.038,0.092,0.074,0.173,0.093,0.257,0.18,0.563,0.573,1.767,0.427,2.351-0.101,0.391-0.846,0.901-1.012,1.274-0.265,0.622-0.555,2.024-0.375,2.671,0.146,0.527,1.004,1.321,1.387,1.713,0.301,0.292,1.083,0.701,1.285,1.066,0.338,0.63,0.282,2.114,0.319,2.833,0.056,1.104,0.255,3.363-0.055,4.429-0.265,0.93-1.597,2.443-2.023,3.309-0.347,0.71-0.857,2.207-1.12,2.943-0.22,0.583-0.466,1.822-0.812,2.351-0.482,0.739-1.951,1.813-2.607,2.397-0.756,0.663-2.432,1.831-3.051,2.622-0.63,0.796-1.486,2.68-1.86,3.628-0.408,1.021-0.938,3.162-1.239,4.219-0.227,0.811-0.499,2.514-0.902,3.255-0.435,0.81-1.676,2.222-2.404,2.777-0.61,0.474-2.135,0.92-2.778,1.34-0.638,0.409-1.934,1.319-2.344,1.979-0.301,0.464-0.527,1.575-0.592,2.133-0.09,0.763,0.309,2.351,0.109,3.097-0.136,0.512-0.867,1.341-1.121,1.813-0.265,0.475-0.819,1.44-0.91,1.977-0.119,0.649,0.235,1.96,0.217,2.615-0.025,0.639-0.209,1.904-0.372,2.506-0.146,0.512-0.429,1.567-0.813,1.933-0.291,0.283-1.13,0.519-1.548,0.582-0.847,0.12-2.552-0.209-3.407-0.265-0.71-0.044-2.142-0.299-2.834-0.163-0.805,0.155-2.197,1.057-2.935,1.387-0.574,0.264-1.786,0.654-2.299,1.02-0.572,0.4-1.476,1.485-1.92,2.031-0.338,0.402-0.93,1.276-1.231,1.706-0.228,0.318-1.04,0.91-0.911,1.284,0.146,0.383,1.194,0.374,1.603,0.429,0.503,0.063,1.532,0.099,2.033,0,0.611-0.139,1.767-0.686,2.297-1.022,0.583-0.364,1.502-1.431,2.088-1.813,0.627-0.418,1.994-1.085,2.714-1.328,0.593-0.209,1.831-0.557,2.461-0.538,0.409,0.008,1.212,0.282,1.603,0.426,0.483,0.175,1.376,0.712,1.868,0.857,0.393,0.111,1.205,0.266,1.604,0.208,0.674-0.097,1.978-0.672,2.506-1.12,0.392-0.326,1.047-1.2,1.12-1.712,0.065-0.437-0.482-1.257-0.528-1.703-0.063-0.564-0.026-1.713,0.153-2.241,0.185-0.558,0.967-1.485,1.287-1.978,0.491-0.775,1.65-2.24,1.977-3.1,0.374-0.983,0.412-3.134,0.639-4.163,0.229-1.048,0.675-3.172,1.175-4.119,0.429-0.801,1.668-2.16,2.352-2.771,0.556-0.511,1.95-1.201,2.506-1.714,0.582-0.536,1.741-1.712,2.031-2.452,0.228-0.581,0.083-1.885,0.155-2.514,0.09-0.683,0.173-2.131,0.538-2.723,0.318-0.512,1.376-1.223,1.921-1.497,0.42-0.209,1.432-0.209,1.814-0.482,0.629-0.437,1.258-1.939,1.714-2.56,0.655-0.894,2.233-2.497,2.771-3.472,0.538-0.948,1.221-3.054,1.503-4.109,0.246-0.939,0.284-2.934,0.639-3.846,0.338-0.849,1.312-2.479,2.031-3.045,0.61-0.481,2.16-0.956,2.935-1.064,0.711-0.109,2.16,0.182,2.88,0.163,0.6-0.019,1.867,0.019,2.406-0.272,0.29-0.155,0.738-0.702,0.854-1.012,0.174-0.464,0.282-1.542,0.056-1.979-0.126-0.234-0.647-0.509-0.91-0.592-0.256-0.073-0.813-0.063-1.067,0-0.529,0.153-1.404,0.893-1.868,1.186-0.429,0.255-1.23,0.875-1.713,1.012-0.511,0.136-1.615,0.107-2.133,0-0.372-0.073-1.119-0.321-1.394-0.586-0.273-0.282-0.61-1.056-0.638-1.447-0.037-0.656,0.491-1.906,0.746-2.505,0.32-0.748,0.957-2.342,1.604-2.836,0.491-0.373,1.786-0.508,2.405-0.583,0.857-0.109,2.598,0,3.462,0,1.224,0,3.655,0.075,4.867,0,0.408-0.026,1.028-0.063,1.648-0.119l2.233,2.617-2.078,2.561,4.483,8.447,7.928-0.438,0.482-3.563,2.763,0.119-0.073,3.93,3.017,0.671,0.091,2.489-3.034,0.92,2.487,12.412s0.547,1.247,0.909,1.549c0.365,0.291,1.369,0.383,1.642,0.709,0.366,0.411,0.548,1.578,0.729,2.116,0.274,0.757,0.548,2.314,0.73,3.07,0.273,0.61,0.637,1.851,1.093,2.369,0.183,0.256,0.729,0.556,0.912,0.802,0.181,0.301,0.363,1.039,0.546,1.368,0.183,0.336,0.638,0.974,0.912,1.247,0.455,0.483,1.456,1.239,2.004,1.659,0.548,0.446,1.457,1.475,2.094,1.784,0.275,0.129,0.823,0.237,1.096,0.274,0.364,0.036,1.094-0.156,1.457,0,0.273,0.128,0.64,0.719,0.821,0.976,0.273,0.41,0.819,1.294,1.184,1.704,0.273,0.445,1.094,1.284,1.457,1.713,0.274,0.347,1.004,0.939,1.185,1.375,0,0.119,0,0.409-0.092,0.493-0.271,0.21-1.093-0.291-1.274-0.028-0.183,0.22,0.273,0.757,0.365,0.974,0.272,0.337,0.82,0.859,1.094,1.178,0.272,0.374,0.729,1.158,1.001,1.576,0.093,0.228,0.458,0.729,0.367,0.956-0.185,0.319-1.096,0.274-1.368,0.364-0.364,0.073-0.912,0.165-1.185,0.293-0.273,0.107-0.729,0.355-0.822,0.602-0.182,0.354,0.275,1.102,0.366,1.484,0.091,0.328,0.091,1.013,0.183,1.349,0.093,0.365,0.364,1.049,0.456,1.412,0.09,0.256,0.272,0.83,0.09,1.039-0.09,0.201-0.638,0.174-0.911,0.211-0.272,0.053-1.094-0.146-1.275,0.108-0.183,0.274,0.364,0.912,0.456,1.23,0,0.19,0.182,0.619,0.091,0.793-0.183,0.245-0.82,0.392-1.093,0.49-0.455,0.146-1.366,0.283-1.824,0.385-0.546,0.11-1.548,0.326-2.003,0.454-0.366,0.083-1.186,0.101-1.366,0.373-0.186,0.218-0.093,0.848-0.093,1.139v1.333c0.093,0.235,0.182,0.809,0.365,0.91,0.181,0.084,0.546-0.281,0.729-0.336,0.273-0.073,0.911-0.256,1.185-0.102,0.184,0.082,0.273,0.512,0.364,0.674,0.183,0.21,0.365,0.684,0.639,0.793,0.364,0.146,1.184-0.109,1.55-0.1,0.364,0.019,1.275,0,1.548,0.218,0.272,0.138,0.456,0.629,0.545,0.866,0.184,0.327,0.275,1.021,0.366,1.377,0.091,0.501,0.275,1.558,0.091,2.04-0.091,0.328-0.546,0.831-0.819,1.084-0.273,0.265-0.819,0.667-1.095,0.957-0.091,0.163-0.271,0.529-0.271,0.72-0.091,0.302,0.091,0.921,0.181,1.203,0.091,0.302,0.456,0.921,0.73,1.039,0.272,0.109,0.911-0.045,1.093-0.2,0.182-0.128,0.273-0.766,0.547-0.793,0.455-0.063,1,0.856,1.366,1.193,0.364,0.428,0.912,1.403,1.277,1.841,0.273,0.355,0.818,1.158,1.274,1.33,0.364,0.146,1.186-0.018,1.549-0.126,0.638-0.165,1.731-0.976,2.368-1.158,0.366-0.1,1.186-0.318,1.552-0.154,0.271,0.154,0.636,0.919,0.818,1.276,0.275,0.71,0.275,2.342,0.729,3.006,0.182,0.329,0.819,0.82,1.186,1.002,0.638,0.346,2.186,0.501,2.916,0.757,0.637,0.255,2.003,0.847,2.641,1.283,0.548,0.403,1.55,1.414,1.915,2.005,0.271,0.402,0.637,1.331,0.729,1.796,0.365,1.148,0.819,3.518,1.095,4.684,0.09,0.721,0.818,2.205,0.545,2.889-0.183,0.376-1.094,0.546-1.368,0.883-0.18,0.349-0.271,1.232-0.271,1.642,0.092,0.593,0.637,1.678,0.911,2.204,0.4,0.4,0.9,1.35,1.3,1.66","name":"Херсонська область"},"68":{"path":"M548.83,388l-1.44,2.969-3.563-1.247-2.761,4.164-4.565-2.241-4.091-1.084-3.96-0.56-0.082,1.676h-1.038l-5.21,2.32s-0.374,0.957-0.365,1.285c0.018,0.446,0.593,1.24,0.602,1.677,0.009,0.446-0.464,1.248-0.519,1.686-0.055,0.473,0.355,1.477,0.118,1.885-0.128,0.209-0.884,0.438-0.884,0.438l-5.887,5.768s-0.528,6.369-0.474,8.493c0.055,2.123,0.484,6.368,0.921,8.454,0.309,1.486,1.803,5.805,1.803,5.805l-2.725,1.76,0.638,4.483s0.072,2.014,0.082,2.687c0,0.757-0.208,2.288-0.082,3.044,0.137,0.819,0.866,2.341,1.158,3.125,0.208,0.565,0.61,1.604,0.883,2.313-0.401,0.029-0.829,0-1.058-0.036-0.537-0.081-1.43-0.775-1.921-1.011-0.712-0.355-2.106-1.166-2.881-1.339-0.409-0.082-1.267-0.129-1.658,0-0.301,0.101-0.711,0.674-1.013,0.757-0.482,0.117-1.521-0.476-1.976-0.274-0.356,0.154-0.656,0.947-0.856,1.285-0.174,0.292-0.374,1.011-0.638,1.23-0.337,0.264-1.23,0.528-1.659,0.472-0.684-0.072-1.731-1.156-2.405-1.33-0.528-0.135-1.64-0.027-2.188,0-0.601,0.028-1.832,0.01-2.406,0.21-0.509,0.182-1.357,0.92-1.813,1.229-0.265,0.183-0.757,0.658-1.066,0.748-0.437,0.127-1.476,0.201-1.813-0.109-0.301-0.273,0.009-1.302-0.274-1.595-0.309-0.327-1.311-0.354-1.757-0.382-0.438-0.018-1.341,0.346-1.758,0.218-0.466-0.145-1.013-1.066-1.451-1.283-0.555-0.284-1.84-0.656-2.449-0.529-0.502,0.101-1.213,0.938-1.66,1.176-0.401,0.21-1.257,0.537-1.704,0.637-0.62,0.136-1.904,0.393-2.515,0.21-0.438-0.128-1.148-0.766-1.44-1.12-0.328-0.401-0.492-1.549-0.912-1.868-0.638-0.484-2.351-0.565-3.143-0.583-0.748-0.018-2.251,0.091-2.943,0.374-0.357,0.137-0.894,0.719-1.222,0.902-0.32,0.182-0.995,0.473-1.34,0.593-0.729,0.237-2.414,0.135-2.988,0.637-0.32,0.273-0.429,1.167-0.593,1.55-0.255,0.609-0.72,1.877-1.121,2.405-0.456,0.612-1.576,1.751-2.296,2.033-0.565,0.219-1.868,0.246-2.452,0.045-0.773-0.245-1.94-1.458-2.568-1.968-0.72-0.601-1.996-2.023-2.825-2.459-0.603-0.321-1.941-0.649-2.616-0.694-0.165-0.009-0.356-0.009-0.574,0-0.675-0.848-1.531-1.941-1.941-2.442-0.748-0.93-2.47-2.633-3.044-3.689-0.354-0.658-0.665-2.134-0.883-2.844-0.201-0.655-0.428-2.059-0.794-2.643-0.2-0.302-0.928-0.639-1.083-0.958-0.237-0.509,0.1-1.712-0.083-2.241-0.154-0.446-0.875-1.129-1.12-1.521-0.528-0.846-1.595-2.57-1.842-3.526-0.336-1.285-0.163-3.963-0.163-5.285,0.008-1.122,0.182-3.372,0.163-4.492-0.017-1.094-0.481-3.29-0.282-4.365,0.101-0.528,0.856-1.422,0.921-1.96,0.074-0.611-0.173-1.876-0.483-2.405-0.218-0.383-1.148-0.766-1.357-1.166-0.383-0.703-0.456-2.396-0.401-3.198,0.055-0.812,0.482-2.424,0.838-3.163,0.319-0.655,1.294-1.75,1.722-2.324,0.356-0.473,1.212-1.331,1.403-1.886,0.2-0.575,0.063-1.832,0.082-2.442,0.046-1.34,0.274-4.028,0.201-5.367-0.073-1.313-0.711-3.891-0.802-5.204-0.082-1.167-0.328-3.572,0.036-4.684,0.191-0.564,1.003-1.486,1.403-1.932,0.364-0.393,1.249-1.039,1.604-1.439,0.328-0.365,0.993-1.131,1.166-1.604,0.301-0.829,0.374-2.643,0.238-3.517-0.146-0.939-1.149-2.606-1.367-3.526-0.238-1.039-0.365-3.18-0.355-4.247,0.009-1.049,0.419-3.117,0.438-4.165,0.018-1.057-0.192-3.162-0.32-4.21-0.092-0.729-0.337-2.195-0.483-2.915-0.183-0.93-0.693-2.753-0.838-3.692-0.1-0.665-0.456-2.059-0.201-2.679,0.192-0.473,1.103-1.075,1.522-1.367,0.364-0.246,1.322-0.428,1.558-0.801,0.248-0.356,0.018-1.304,0.128-1.713,0.164-0.647,0.729-1.869,1.121-2.406,0.273-0.384,1.121-0.885,1.358-1.286,0.255-0.428,0.474-1.431,0.482-1.923,0.019-0.828-0.382-2.46-0.646-3.244-0.165-0.519-0.729-1.448-0.912-1.958-0.356-0.984-0.984-3.007-1.048-4.047-0.045-0.828,0.419-2.46,0.446-3.288,0.018-0.748,0.009-2.278-0.201-2.998-0.209-0.711-1.066-1.941-1.448-2.57-0.411-0.684-1.403-1.959-1.758-2.679-0.247-0.511-0.621-1.604-0.72-2.169-0.119-0.656-0.073-2.004-0.119-2.679-0.026-0.354-0.227-1.093-0.127-1.439,0.182-0.574,1.249-1.322,1.531-1.84,0.218-0.42,0.438-1.35,0.556-1.805,0.155-0.62,0.483-2.487,0.483-2.487l4.446,0.081,0.675-2.76,0.565-2.324-2.242-1.558,1.076-4.129,3.289-0.802-0.365-2.087-3.28-1.075,0.064-1.402c1.303-0.275,3.363-0.748,4.165-1.167,1.056-0.537,2.778-2.224,3.635-3.043,0.885-0.837,2.415-2.743,3.308-3.572,0.501-0.465,1.503-1.458,2.141-1.712,0.447-0.173,1.44-0.101,1.924-0.155,0.792-0.1,2.405-0.246,3.143-0.538,1.048-0.419,2.871-1.795,3.746-2.507,0.737-0.601,2.177-1.885,2.725-2.677,0.373-0.548,0.664-1.916,1.065-2.452,0.52-0.71,1.987-1.73,2.671-2.295,0.983-0.821,2.787-2.799,4-3.208,0.355-0.119,1.175,0.246,1.495,0.055,0.318-0.183,0.555-0.948,0.691-1.275,0.357-0.839,0.867-2.598,1.076-3.472,0.146-0.647,0.118-2.032,0.428-2.625,0.254-0.491,1.103-1.303,1.604-1.548,0.638-0.311,2.114-0.374,2.824-0.364,0.43,0,1.349,0.492,1.714,0.263,0.392-0.254,0.528-1.822,0.528-1.822l3.737-2.078,4.438,2.78,2.133-2.197,3.899-0.154,1.066-2.671,3.153-1.175,1.604,4.329,3.198,0.155,0.21-0.1,0.145,0.264,2.278,2.524,1.887,0.273,0.756,1.204-0.282,2.124-4.92,9.175,6.005,2.524,0.118,2.324,1.003,0.155,4.482,4.684,0.046,3.326,5.122,2.324,0.483,2.359,3.161,0.127,0.246-2.642,1.878,0.037,1.567,5.486,1.64,2.605,1.44,0.201-0.401,3.043-3.845-0.565-0.519,7.372,3.926,2.36-3.882,3.573-3.527-1.003-2.487,0.794,3.044,5.248-3.846,8.575,2.89,1.485,0.082,2.597,8.528,7.217,0.356,5.485,5.122-1.54,0.847,3.453-2.998,1.486-0.602,4.045,3.518,1.486-0.52,1.403-2.561-0.127-4.566,6.853,3.163,1.604-0.239,5.204-3.244,1.803,1.677,3.246,4.492,0.555,1.321,3.006-3.69,2.489,2.287,4.118-0.72,3.773-0.164,7.043,3.78,1.53z","name":"Хмельницька область"},"71":{"path":"M834.27,303.92l-0.938,0.136-0.667,6.06,1.414,1.758,4.702,0.22,1.393,2.05-0.399,6.679,2.697,1.065,0.427,5.231-3.015,2.515,6.533,9.021,1.603-0.875,4.676,3.918,0.11,2.269-0.622,1.121,0.886,2.005,3.471,0.984,5.067,1.021-0.21,3.024c-0.063-0.062-0.128-0.108-0.182-0.144-0.292-0.146-0.986-0.174-1.286-0.055-0.463,0.191-1.102,1.038-1.384,1.449-0.355,0.5-0.903,1.603-1.066,2.187-0.2,0.674-0.565,2.115-0.328,2.779,0.166,0.429,1.094,0.884,1.34,1.277,0.327,0.527,0.656,1.74,0.745,2.351,0.11,0.756,0.11,2.305-0.053,3.043-0.118,0.519-0.711,1.421-0.858,1.922-0.198,0.738-0.382,2.278-0.371,3.043,0.009,0.83,0.136,2.516,0.482,3.263,0.31,0.655,1.411,1.667,1.921,2.187,0.486,0.483,1.805,1.175,2.032,1.813,0.137,0.4-0.117,1.266-0.273,1.658-0.126,0.348-0.5,1.011-0.801,1.231-0.565,0.418-2.014,0.72-2.716,0.802-0.737,0.082-2.25,0.09-2.943-0.164-0.902-0.337-2.242-1.814-3.042-2.352-1.113-0.739-3.546-1.896-4.647-2.67-1.386-0.985-3.873-3.335-5.176-4.428-0.867-0.729-2.563-2.224-3.473-2.889-0.848-0.61-2.533-1.923-3.526-2.242-0.93-0.3-2.926-0.146-3.893-0.21-0.847-0.054-2.559-0.045-3.37-0.272-0.909-0.257-2.604-1.14-3.362-1.705-0.794-0.583-1.939-2.241-2.723-2.834-1.096-0.811-3.656-1.859-4.859-2.506-1.411-0.755-4.173-2.386-5.613-3.097-1.12-0.556-3.381-1.695-4.592-2.033-1.037-0.282-3.191-0.501-4.264-0.529-0.793-0.026-2.378,0.084-3.154,0.21-0.528,0.083-1.804,0.083-2.078,0.538-0.246,0.383,0.183,1.349,0.366,1.758,0.283,0.63,1.074,1.795,1.603,2.241,0.794,0.675,2.79,1.386,3.737,1.814,0.692,0.32,2.096,0.865,2.778,1.185,0.92,0.418,2.753,1.312,3.636,1.813,1.057,0.593,3.116,1.904,4.11,2.615,1.156,0.821,3.389,2.561,4.437,3.526,0.775,0.729,2.188,2.334,2.881,3.145,1.002,1.185,2.806,3.709,3.846,4.866,0.854,0.956,2.67,2.824,3.682,3.626,1.047,0.83,3.343,2.225,4.536,2.835,1.341,0.674,4.166,1.695,5.559,2.242,1.021,0.401,3.108,1.11,4.111,1.548,1.374,0.602,4.08,1.922,5.394,2.669,1.421,0.812,4.145,2.652,5.494,3.581,0.857,0.576,2.56,1.76,3.363,2.398,1.312,1.047,3.891,3.198,5.029,4.436,0.894,0.976,2.442,3.145,3.146,4.267,0.382,0.61,0.781,2.068,1.338,2.515,0.394,0.31,1.423,0.536,1.922,0.536,0.347-0.008,0.931-0.291,1.377-0.447l-0.737,5.761,3.609,5.32-10.938,1.004-2.168-2.926-1.395,2.123-4.291-0.319-1.158-3.799-1.402,1.959-3.327,2.642-3.125-9.048-2.68,2.323-3.809-2.643-0.081-2.688-9.048,1.886-2.444,9.331-4.044,1.758s0.673,0.767,0.919,1.003c0.247,0.246,0.975,0.574,1.048,0.92,0.064,0.338-0.418,0.947-0.601,1.24-0.138,0.208-0.419,0.665-0.646,0.765-0.328,0.146-1.095,0.056-1.439-0.045-0.521-0.145-1.376-0.874-1.888-1.075-0.482-0.201-1.513-0.492-2.032-0.519-0.619-0.036-1.895,0.1-2.451,0.355-0.399,0.183-0.93,0.966-1.322,1.167-0.326,0.154-1.1,0.136-1.439,0.273-0.455,0.191-1.302,0.766-1.639,1.13-0.348,0.355-0.712,1.312-1.038,1.676-0.283,0.319-0.912,1.002-1.33,1.039-0.247,0.027-0.684-0.281-0.875-0.437-0.165-0.128-0.476-0.438-0.529-0.637-0.063-0.301,0.256-0.904,0.282-1.205,0.027-0.273,0.082-0.837-0.036-1.083-0.137-0.283-0.712-0.611-0.966-0.802-0.392-0.3-1.23-0.866-1.643-1.158-0.318-0.227-0.965-0.683-1.282-0.92-0.273-0.209-0.749-0.783-1.076-0.883-0.419-0.128-1.34,0.044-1.768,0.154-0.465,0.127-1.332,0.575-1.759,0.811-0.639,0.347-1.813,1.23-2.442,1.594-0.382,0.229-1.139,0.702-1.559,0.803-0.327,0.082-1.03,0.155-1.32,0-0.301-0.146-0.51-0.919-0.802-1.084-0.437-0.228-1.476-0.119-1.969-0.072-0.538,0.045-1.576,0.473-2.124,0.436-0.3-0.017-0.873-0.291-1.155-0.4-0.292-0.109-0.849-0.429-1.168-0.438-0.42-0.008-1.212,0.356-1.594,0.52-0.291,0.119-0.912,0.328-1.12,0.555-0.247,0.255-0.53,0.939-0.565,1.285-0.036,0.384,0.209,1.149,0.318,1.522,0.145,0.501,0.556,1.467,0.719,1.959,0.192,0.565,0.566,1.705,0.685,2.287,0.1,0.556,0.181,1.676,0.2,2.242,0.009,0.33,0.091,1.02-0.048,1.322-0.197,0.491-1.037,1.22-1.475,1.522-0.345,0.245-1.147,0.583-1.558,0.682-0.574,0.138-1.776,0.092-2.368,0.165-0.503,0.055-1.576,0.082-2.006,0.355-0.265,0.174-0.59,0.747-0.719,1.038-0.165,0.384-0.109,1.249-0.318,1.604-0.229,0.401-1.031,0.93-1.403,1.203-0.411,0.301-1.221,0.993-1.724,1.085-0.265,0.045-0.802-0.119-1.039-0.247-0.464-0.245-1.083-1.157-1.521-1.439-0.647-0.401-2.097-0.938-2.842-1.085-1.112-0.209-3.398-0.136-4.529-0.036-1.158,0.1-3.425,0.602-4.566,0.838-0.792,0.173-2.35,0.71-3.162,0.766-0.463,0.027-1.385-0.155-1.84-0.201-0.446-0.044-1.34-0.055-1.769-0.164-0.738-0.191-2.068-1.02-2.797-1.239-0.783-0.227-2.397-0.456-3.208-0.484-0.774-0.027-2.315,0.184-3.078,0.247-1.066,0.083-3.19,0.501-4.247,0.356-0.438-0.056-1.248-0.419-1.64-0.603-0.639-0.291-1.785-1.138-2.453-1.357-0.846-0.282-2.66-0.473-3.562-0.437-0.793,0.027-2.36,0.4-3.126,0.637-0.856,0.255-2.56,0.885-3.315,1.358-0.375,0.237-1.167,0.747-1.331,1.167-0.2,0.537,0.164,1.723,0.282,2.278,0.156,0.665,0.703,1.903,0.849,2.57,0.109,0.518,0.436,1.621,0.236,2.122-0.109,0.273-0.628,0.711-0.919,0.757-0.21,0.036-0.602-0.229-0.802-0.319-0.247-0.11-0.694-0.438-0.959-0.483-0.263-0.036-0.828,0.009-1.047,0.165-0.446,0.318-0.783,1.448-1.003,1.958-0.199,0.474-0.719,1.449-0.673,1.959,0.044,0.647,0.829,1.757,1.193,2.286,0.393,0.564,1.513,1.432,1.805,2.042,0.137,0.273,0.327,0.929,0.199,1.203-0.19,0.41-1.129,0.774-1.557,0.921-0.621,0.209-1.951,0.345-2.607,0.282-0.646-0.073-1.895-0.519-2.478-0.802-0.61-0.292-2.25-1.467-2.25-1.467l-13.669,10.598-4.774-2.644-5.314,6.543-1.229-5.505-1.122-0.664-4.983,1.676-0.255-2.104,2.351-1.869-1.385-4.811v-3.518l-1.496-0.856-1.175-2.515-0.164-2.288-6.46-5.13,3.098-2.934-9.395-9.832-0.374-7.737-1.494-0.592-4.921,2.834-1.914-4.273,5.495-3.791-1.011-4.063-2.889,0.218,0.055-6.57,3.152-1.659,3.791-3.892-3.043-8.064,2.506-0.392,2.779,3.963,6.306,1.094,1.996-1.968,0.482-4.593,1.45-1.148,0.819-4.647,5.076-2.377,3.645,0.355,3.327-0.802,5.803,0.046-0.2,5.886,9.613,2.242,0.921,1.805,3.563,0.037,0.283-1.195-1.805-5.048,3.09-1.768-1.649-3.199,1.767-0.847,3.964,4.046,0.521-0.802-1.287-2.041,6.689-2.679,1.048,0.118,1.677,1.358,1.038,0.046,0.164-0.72,1.287,0.2,4.164,3.599,5.933-1.522,6.44-3.48-1.557-3.49,0.081-1.841,5.687,0.246,0.557-1.285-1.157-2.124,7.527-7.008,2.961-4.127-1.395-2.324,5.559-7.845-0.839-2.89,0.119-5.485-1.275-1.922,0.874-7.573,1.64-1.723,7.701-2.159,0.392-6.17c0.51-0.456,1.166-1.356,1.649-1.677,0.338-0.236,1.102-0.656,1.514-0.646,0.573,0.027,1.62,0.629,2.003,1.048,0.773,0.829,1.641,3.043,1.841,4.164,0.265,1.422-0.155,4.329-0.319,5.759-0.1,0.976-0.499,2.889-0.637,3.855-0.092,0.657-0.501,2.005-0.319,2.642,0.183,0.639,1.049,1.878,1.675,2.078,0.74,0.237,2.397-0.282,2.972-0.801,0.665-0.603,1.013-2.506,1.277-3.364,0.282-0.92,0.765-2.661,0.964-3.854,0.247-0.182,0.493-0.374,0.612-0.492,0.409-0.402,1.002-1.404,1.439-1.769,0.329-0.264,1.074-0.856,1.504-0.802,0.436,0.056,1.085,0.812,1.275,1.203,0.199,0.393,0.19,1.303,0.181,1.741,0,0.428-0.327,1.312-0.207,1.73,0.079,0.292,0.755,0.957,0.755,0.957l6.826,0.165s0.456-1.147,0.564-1.549c0.09-0.336,0.027-1.121,0.263-1.384,0.184-0.21,0.795-0.219,1.05-0.319,0.292-0.119,0.982-0.282,1.12-0.565,0.129-0.273-0.255-0.875-0.245-1.175,0.019-0.465,0.364-1.33,0.537-1.758,0.209-0.52,0.675-1.548,0.983-2.005,0.257-0.364,1.205-1.311,1.205-1.311l2.059,0.19,1.229-5.795,7.097-3.446-1.574-0.456-2.86-2.74,0.292-2.132,2.133-2.087,4.165-9.769,3.097,2.324,2.562-4.22,0.956,0.483-0.018,0.127,4.564,7.007,6.516,1.567v1.467l0.01,0.003z","name":"Черкаська область"},"74":{"path":"M882.17,262.09l0.018,0.346-2.851,5.888-3.363,0.801-1.202,2.878-8.212,7.81-6.606,0.529-1.439-1.922-1.758-0.046v2.525l-9.131-0.438-0.885-4.766-6.214-0.047-2.241-1.675-4.283,3.799-4.565,5.73-2.324-1.885-2.687,1.368-5.97,0.154,4.292-6.771-3.764-0.036-4.493-7.244,7.856-4.093-2.242-2.241-6.37-1.039-0.684-4.811-6.005-2.242-4.328,3.645-0.601,1.969-7.089,0.355-1.394,1.404-1.086,1.203-2.77-1.167-3.482-0.355-3.727,0.519-3.726-0.483-4.119,0.365-3.928-0.046-3.163-3.399-1.485,0.52-1.273,0.483-0.282-1.33-0.685-1.394-0.082-1.322,2.359-0.328,1.368-0.438,0.362-1.722-0.801-3.363-0.601-3.125-0.801-0.484-0.649-0.437,0.611-1.203-0.245-1.076-1.723-1.403-1.888-1.521-0.117-1.167-0.838-1.003-1.158-0.118-3.289,1.084-4.246,1.039-4.721,0.565-2.523-0.118-1.923-1.249-0.2-1.558-0.847-0.329-2.043,0.365-2.078-0.838-3.526-0.52,2.16-4.044,2.241,1.522,1.048-0.566-0.164-4.365-0.838-2.806h-3.407l-1.441-0.875-2.479-6.607,0.521-5.367-1.121-0.73h-1.604l-1.522-0.026c0.174-0.885,0.593-2.013,0.802-2.652,0.256-0.776,1.067-2.233,1.194-3.043,0.155-0.894,0-2.717-0.154-3.608-0.238-1.321-1.64-3.782-1.604-5.121,0.019-0.575,0.683-1.604,0.802-2.169,0.117-0.548,0.273-1.686,0.163-2.241-0.172-0.813-0.912-2.397-1.521-2.962-0.093-0.073-0.21-0.155-0.347-0.227l0.538-2.325c0.072-0.01,0.136-0.037,0.182-0.063,0.4-0.283,0.274-1.604,0.693-1.868,0.409-0.255,1.439,0.237,1.922,0.156,0.375-0.056,1.112-0.329,1.386-0.585,0.374-0.354,0.93-1.347,0.911-1.868-0.027-0.528-1.104-1.292-1.076-1.812,0.038-0.538,1.104-1.213,1.286-1.713,0.181-0.474,0.201-1.522,0.164-2.032-0.063-0.922-0.492-2.752-0.802-3.627-0.271-0.757-1.148-2.133-1.439-2.888-0.2-0.501-0.538-1.542-0.593-2.078-0.082-0.802,0.219-2.405,0.219-3.208-0.009-0.829,0.028-2.533-0.273-3.307-0.292-0.766-1.594-1.887-1.977-2.625-0.283-0.556-0.656-1.776-0.748-2.397-0.219-1.603,0.009-4.856,0.164-6.461,0.074-0.729,0.62-2.168,0.483-2.887-0.109-0.565-1.02-1.414-1.175-1.97-0.155-0.574-0.201-1.803,0-2.351,0.146-0.419,0.738-1.156,1.121-1.394,0.418-0.255,1.43-0.438,1.921-0.419,0.447,0.009,1.268,0.529,1.713,0.473,0.348-0.037,0.994-0.428,1.222-0.691,0.419-0.484,0.755-1.777,0.911-2.406,0.246-1.003,0.246-3.099,0.482-4.11,0.255-1.121,1.048-3.271,1.496-4.325,0.5-1.194,1.502-3.616,2.295-4.645,0.866-1.138,3.271-2.775,4.265-3.793,0.792-0.802,2.096-2.668,2.943-3.417,0.956-0.856,3.398-1.938,4.273-2.884,0.529-0.576,1.232-2.007,1.549-2.724,0.302-0.706,0.838-2.173,0.902-2.937,0.056-0.547-0.418-1.66-0.264-2.188,0.108-0.383,0.656-1.054,1.012-1.229,0.545-0.26,1.803,0.008,2.406-0.05,1.038-0.108,3.07-0.628,4.109-0.751,0.93-0.11,2.807-0.284,3.735-0.214,0.712,0.054,2.15,0.276,2.78,0.59,0.554,0.27,1.393,1.214,1.867,1.601,0.618,0.498,1.74,1.752,2.516,1.922,0.602,0.133,1.858-0.242,2.396-0.533,0.464-0.245,1.138-1.064,1.494-1.44,0.611-0.643,1.705-2.023,2.305-2.673,0.666-0.729,1.885-2.391,2.771-2.829,0.884-0.435,2.917-0.467,3.899-0.481,1.313-0.019,3.937,0.258,5.231,0.481,0.538,0.092,1.566,0.415,2.086,0.534,1.969,0.45,5.924,1.223,7.901,1.602,1.867,0.355,5.594,1.104,7.479,1.335,1.222,0.147,3.692,0.138,4.911,0.32,0.693,0.103,2.051,0.436,2.726,0.64,0.466,0.142,1.578,0.274,1.813,0.695,0.19,0.341-0.299,1.157-0.263,1.549,0.044,0.509,0.364,1.53,0.691,1.92,0.319,0.375,1.24,0.813,1.703,0.961,0.483,0.151,1.486,0.26,1.979,0.215,0.557-0.051,1.586-0.542,2.142-0.64,0.426-0.079,1.322-0.134,1.759-0.109,0.437,0.029,1.286,0.247,1.713,0.321,0.41,0.072,1.247,0.381,1.658,0.267,0.229-0.067,0.564-0.466,0.736-0.641,0.613-0.598,1.651-1.961,2.251-2.563,0.903-0.904,3.063-2.353,3.848-3.363,0.473-0.616,1.021-2.089,1.385-2.778,0.282-0.552,0.647-1.863,1.175-2.189,0.383-0.237,1.395,0.113,1.813-0.054,0.318-0.126,0.931-0.575,1.012-0.907,0.128-0.483-0.482-1.416-0.693-1.87-0.272-0.597-1.167-1.649-1.273-2.296-0.13-0.721,0.243-2.192,0.471-2.885,0.268-0.785,1.323-2.138,1.551-2.937,0.102-0.36,0.073-1.121,0.109-1.496,0.074-0.667-0.036-2.133,0.373-2.669,0.346-0.452,1.531-0.792,2.076-0.907,0.804-0.167,2.452-0.013,3.264,0,0.992,0.014,2.998-0.15,3.955,0.105,1.084,0.291,2.988,1.552,3.956,2.136,1.027,0.631,2.932,2.158,3.997,2.724,0.797,0.423,2.472,1.175,3.364,1.335,0.584,0.104,1.768,0.004,2.353-0.054,0.808-0.082,2.395-0.49,3.205-0.587,1.096-0.132,3.317-0.32,4.43-0.267,0.592,0.028,1.758,0.319,2.351,0.375,0.556,0.049,1.688,0.16,2.243,0.053,0.91-0.18,2.596-1.057,3.416-1.495,1.104-0.586,3.18-1.975,4.22-2.671,0.819-0.551,2.441-1.668,3.206-2.298,0.82-0.675,2.161-2.423,3.09-2.937,0.737-0.401,2.434-0.731,3.262-0.8,0.984-0.079,2.964,0.246,3.956,0.322,1.094,0.083,3.28,0.251,4.374,0.319,0.298,0.019,0.682,0.041,1.102,0.066l-1.013,2.884-1.237,2.683-0.484,3.204-0.272,2.925-1.805,2.523-0.966,2.684,0.482,2.483,1.969,1.843,2.277,1.721,2.443,0.962,1.238,1.281,0.283,1.724,0.931,1.241,1.028,0.16,1.211,1.881-0.08,1.404-1.768,0.68h-1.605l-1.357,0.48-1.521-0.802-0.602-1.16-1.758,0.481-2.207,0.401-1.567,0.522,0.684,1.398,2.169,2.325,1.96,0.92,0.837,1.403,1.204,2.601-0.955,2.565-0.649,1.641-1.679-0.719-1.365-0.32-0.756,0.718-1.686-0.158-1.204-0.603-1.356-0.079-0.447,0.599,0.602,1.203-0.437,1.282-1.242,0.398-1.32-1.159-0.518-0.644-1.85,1.404-0.721,1.241,0.127,1.241-0.127,1.919-0.957,1.686-1.484,2.525-1.12,4.2,0.026,3.181,2.032,1.814,1.55,1.977,0.346,2.188,0.292,2.998,1.12,1.011,1.257,2.078,1.066,2.806,0.236,1.631-0.792,0.456-1.923-0.082-1.313,0.583,0.912,1.631,0.902,1.521,0.83,1.231-0.292,1.494-1.732,1.066-1.922,0.911-0.748,0.929,0.183,2.406,0.802,1.494,0.855,1.468,1.414,1.868-0.166,1.367-0.982,1.867-1.204,0.83-1.839-0.374-1.66-1.631-0.372-1.759-0.374-1.603-0.483-0.938-0.985-0.32-0.929,0.348-0.783,1.147,0.083,1.229,0.938,1.413,1.286,2.779,0.982,0.829,0.984,1.331-0.11,3.473,0.304,2.059-0.966,2.296-1.067,1.549-0.155,1.714-0.055,1.276-1.395,0.801-1.494,0.374-0.912,1.065,0.056,1.395,0.638,1.705-0.21,1.339-1.121,1.541-0.154,1.978v1.021l1.012,0.054,0.957-0.701,1.157,0.501,12.894,13.531,0.237,6.651-0.839,1.122-2.487-0.046,0.482,6.453-1.957,2.405,1.238,4.045,4.765,2.797-0.163,1.732-4.966-0.165-0.838,2.805-1.924,2.279,0.767,2.042-1.605,2.807-2.04,3.48,0.05,1.6z","name":"Чернігівська область"},"77":{"path":"M449.44,447.03c0.218-0.009,0.41-0.019,0.574,0,0.674,0.044,2.013,0.373,2.615,0.692,0.829,0.437,2.105,1.859,2.825,2.46,0.628,0.509,1.795,1.723,2.568,1.968,0.584,0.201,1.887,0.174,2.452-0.045,0.72-0.283,1.84-1.422,2.296-2.033,0.401-0.528,0.866-1.795,1.121-2.405,0.164-0.383,0.273-1.277,0.593-1.55,0.574-0.501,2.259-0.399,2.988-0.637,0.346-0.12,1.021-0.411,1.34-0.583,0.328-0.201,0.865-0.774,1.222-0.911,0.691-0.283,2.195-0.402,2.943-0.374,0.792,0.018,2.515,0.1,3.143,0.583,0.419,0.319,0.583,1.466,0.912,1.868,0.292,0.354,1.002,0.992,1.44,1.12,0.611,0.183,1.895-0.074,2.515-0.21,0.447-0.1,1.303-0.428,1.704-0.637,0.447-0.238,1.158-1.075,1.66-1.176,0.609-0.127,1.895,0.246,2.449,0.529,0.438,0.217,0.985,1.139,1.451,1.283,0.417,0.128,1.32-0.237,1.758-0.218,0.446,0.028,1.448,0.054,1.757,0.382,0.284,0.292-0.027,1.322,0.274,1.595,0.337,0.311,1.376,0.237,1.813,0.109,0.319-0.091,0.802-0.565,1.066-0.748,0.456-0.309,1.303-1.047,1.813-1.229,0.574-0.2,1.805-0.182,2.406-0.21,0.547-0.027,1.659-0.135,2.196,0,0.666,0.174,1.713,1.258,2.397,1.33,0.428,0.056,1.321-0.208,1.659-0.472,0.273-0.229,0.464-0.939,0.638-1.23,0.2-0.337,0.51-1.13,0.856-1.285,0.456-0.202,1.494,0.391,1.976,0.274,0.301-0.083,0.712-0.656,1.013-0.757,0.391-0.129,1.249-0.082,1.658,0,0.775,0.172,2.169,0.984,2.89,1.339,0.482,0.236,1.375,0.93,1.913,1.011,0.229,0.036,0.656,0.063,1.058,0.036,0.045,0.12,0.082,0.229,0.118,0.329,0.2,0.52,0.703,1.532,0.802,2.078,0.165,0.93-0.254,2.852-0.036,3.763,0.227,0.975,1.256,2.734,1.796,3.572,0.309,0.466,1.138,1.448,1.657,2.06-0.054,0.045-0.109,0.09-0.154,0.127-0.802,0.573-2.552,1.467-3.417,1.922-0.574,0.3-1.694,0.919-2.296,1.121-0.337,0.109-1.066,0.391-1.394,0.265-0.429-0.156-0.812-1.103-1.122-1.44-0.355-0.392-1.092-1.168-1.547-1.44-0.512-0.309-1.65-0.801-2.242-0.801-0.492-0.01-1.439,0.391-1.87,0.638-0.583,0.337-1.485,1.368-2.031,1.769-0.729,0.538-2.306,1.457-3.099,1.921-0.783,0.446-2.332,1.432-3.197,1.704-0.748,0.237-2.37,0.656-3.099,0.374-0.902-0.336-1.85-2.232-2.57-2.88-0.611-0.565-1.877-2.25-2.661-1.977-0.52,0.173-0.42,1.567-0.593,2.078-0.126,0.391-0.292,1.266-0.591,1.549-0.401,0.401-1.577,0.629-2.133,0.747-0.747,0.173-2.286,0.2-3.043,0.319-0.783,0.137-2.359,0.994-3.098,0.702-0.447-0.183-0.802-1.203-1.067-1.604-0.382-0.593-0.948-1.959-1.493-2.406-0.529-0.428-1.915-0.747-2.561-0.956-0.703-0.229-2.133-0.547-2.834-0.749-0.628-0.182-1.859-0.893-2.515-0.802-0.329,0.046-0.92,0.474-1.122,0.748-0.253,0.345-0.437,1.22-0.473,1.659-0.046,0.473-0.019,1.493,0.209,1.92,0.255,0.467,1.249,0.996,1.659,1.333,0.538,0.446,1.623,1.33,2.132,1.813,0.3,0.282,1.103,0.775,1.122,1.175,0.017,0.347-0.584,0.856-0.858,1.066-0.411,0.337-1.384,0.976-1.913,0.967-0.33-0.01-0.875-0.438-1.131-0.646-0.593-0.485-1.358-1.906-2.022-2.299-0.357-0.199-1.221-0.446-1.604-0.318-0.465,0.164-0.947,1.14-1.284,1.495-0.301,0.328-1.24,0.793-1.276,1.23-0.037,0.419,0.948,0.92,1.012,1.339,0.053,0.383-0.32,1.12-0.538,1.441-0.31,0.473-1.194,1.221-1.65,1.548-0.464,0.337-1.53,0.774-2.033,1.067-0.601,0.355-1.803,1.056-2.35,1.494-0.429,0.346-1.175,1.148-1.549,1.549-0.292,0.338-0.748,1.141-1.122,1.394-0.355,0.247-1.221,0.558-1.658,0.529-0.437-0.026-1.185-0.582-1.594-0.747-0.447-0.173-1.34-0.556-1.823-0.584-0.383-0.036-1.185,0.109-1.54,0.265-0.329,0.137-0.875,0.601-1.13,0.857-0.264,0.265-0.593,1.002-0.902,1.229-0.602,0.431-2.197,0.513-2.834,0.902-0.628,0.393-1.513,1.651-2.079,2.133-0.519,0.446-1.694,1.148-2.195,1.604-0.984,0.901-2.716,2.945-3.518,4.01-0.711,0.929-1.905,2.942-2.57,3.899-0.437,0.63-1.257,1.934-1.813,2.451-0.811,0.773-2.788,1.869-3.735,2.459-0.611,0.376-1.777,1.232-2.46,1.442-0.548,0.171-1.723,0.244-2.297,0.163-0.628-0.1-1.795-0.702-2.406-0.913-0.737-0.252-2.205-0.891-2.988-0.955-1.113-0.103-3.336,0.402-4.429,0.639-1.075,0.226-3.125,1.166-4.219,1.229-0.865,0.046-2.552-0.694-3.417-0.592-0.82,0.099-2.25,1.093-3.044,1.338-0.783,0.237-2.396,0.521-3.207,0.583-0.993,0.083-3.008,0.093-4-0.053-0.692-0.092-1.986-0.675-2.67-0.749-0.801-0.072-2.414,0.156-3.208,0.275-0.793,0.108-2.351,0.573-3.152,0.637-1.24,0.101-3.727-0.092-4.965-0.209-1.113-0.119-3.309-0.62-4.43-0.703-1.002-0.072-3.007-0.055-4.01,0.056-0.592,0.063-1.785,0.266-2.342,0.482-0.537,0.211-1.468,0.911-1.977,1.175-0.465,0.228-1.431,0.629-1.923,0.805-0.438,0.145-1.358,0.272-1.769,0.471-1.029,0.521-2.771,2.07-3.626,2.837-0.911,0.81-2.743,2.459-3.417,3.47-0.628,0.932-1.376,3.063-1.769,4.11-0.245,0.684-0.755,2.061-0.847,2.779-0.064,0.438,0.073,1.32,0.046,1.758-0.009,0.301,0.072,0.994-0.155,1.175-0.247,0.192-0.93-0.045-1.231-0.099-0.684-0.146-1.996-0.665-2.669-0.855-1.249-0.365-3.764-1.014-5.022-1.341-0.783-0.2-2.241-0.612-3.226-0.821,0.246-0.729,0.62-1.812,0.82-2.275,0.456-1.021,1.695-2.908,2.086-3.948,0.402-1.083,0.904-3.344,1.068-4.482,0.136-0.948,0.445-2.87,0.218-3.799-0.218-0.849-1.44-2.196-1.822-2.99-0.266-0.546-0.721-1.695-0.848-2.295-0.165-0.749-0.273-2.279-0.219-3.044,0.073-0.884,0.492-2.634,0.801-3.472,0.512-1.377,2.033-3.929,2.726-5.231,0.547-1.029,1.386-3.316,2.241-4.109,0.329-0.31,1.221-0.62,1.658-0.746,0.529-0.164,1.695-0.119,2.188-0.384,0.82-0.428,1.849-2.077,2.561-2.669,0.637-0.52,2.133-1.25,2.778-1.76,0.493-0.382,1.458-1.192,1.814-1.703,0.473-0.674,0.812-2.37,1.34-2.998,0.482-0.575,1.931-1.213,2.504-1.705,0.674-0.574,1.832-1.904,2.406-2.56,0.756-0.885,2.061-2.826,2.88-3.637,1.129-1.102,3.718-2.952,5.021-3.846,1.413-0.955,4.228-2.932,5.823-3.516,0.947-0.355,2.998-0.747,4.01-0.646,0.819,0.082,2.333,0.866,3.088,1.176,0.966,0.391,2.761,1.604,3.8,1.657,0.611,0.027,1.895-0.327,2.35-0.746,0.338-0.329,0.666-1.294,0.694-1.769,0.027-0.666-0.639-1.905-0.748-2.56-0.2-1.176-0.218-3.563-0.273-4.757-0.055-1.294-0.027-3.891-0.155-5.176-0.11-1.13-0.656-3.353-0.748-4.482-0.09-1.112-0.044-3.326,0-4.438,0.019-0.493,0.156-1.978,0.156-1.978l4.757-2.005c0.592,0.547,1.339,1.14,1.813,1.422,0.565,0.336,1.806,0.893,2.461,0.966,0.701,0.063,2.068-0.411,2.77-0.484,0.829-0.091,2.524-0.364,3.317-0.109,0.456,0.146,1.185,0.848,1.549,1.175,0.401,0.366,1.166,1.167,1.495,1.605,0.428,0.583,0.956,1.967,1.439,2.504,0.365,0.41,1.239,1.121,1.759,1.285,0.492,0.146,1.54,0.073,2.032-0.055,0.528-0.136,1.458-0.729,1.923-1.011,0.536-0.328,1.521-1.158,2.085-1.45,0.292-0.146,0.902-0.391,1.23-0.428,0.346-0.027,1.057,0.082,1.385,0.219,0.337,0.146,0.976,0.591,1.175,0.901,0.302,0.483,0.502,1.631,0.484,2.196-0.037,0.865-1.139,2.452-1.02,3.307,0.054,0.365,0.546,0.958,0.801,1.232,0.31,0.327,1.002,0.983,1.44,1.066,0.629,0.118,1.914-0.375,2.459-0.693,0.31-0.182,0.666-0.921,1.01-1.012,0.266-0.073,0.831,0.127,1.067,0.264,0.484,0.283,1.204,1.168,1.55,1.604,0.382,0.475,0.892,1.623,1.338,2.023,0.602,0.555,2.105,1.302,2.88,1.548,1.148,0.365,3.563,0.565,4.757,0.593,1.029,0.018,3.079-0.219,4.109-0.319,0.73,0.01,2.09-0.28,3.04-0.35","name":"Чернівецька область"},"43":{"path":"M1137,751.74c0.183,0.74-0.092,2.253-0.092,3.009,0,2.059,0.274,6.206,0.092,8.248-0.182,1.118-0.546,3.398-1.094,4.364-0.363,0.563-1.367,1.503-2.003,1.767-0.639,0.265-2.097,0.366-2.735,0.201-0.546-0.137-1.367-1.012-1.914-1.203-0.454-0.164-1.364-0.409-1.821-0.283-0.273,0.1-0.82,0.62-1.004,0.922-0.181,0.354-0.364,1.192-0.364,1.604,0,0.438,0.184,1.329,0.093,1.758-0.093,0.547-0.638,1.533-1.003,1.969-0.638,0.8-2.371,1.896-3.099,2.641-0.273,0.32-1.001,0.967-1.001,1.404-0.092,0.337,0.091,1.231,0.363,1.323,0.364,0.072,0.638-0.741,1.003-0.84,0.273-0.119,1.003-0.182,1.275,0.037,0.364,0.284,0.364,1.293,0.272,1.723-0.092,0.437-0.817,1.093-0.909,1.521-0.276,0.885-0.276,2.78-0.094,3.683,0.186,0.863,0.911,2.478,1.368,3.242,0.455,0.831,1.914,2.18,2.097,3.091,0.182,0.582,0.091,1.84-0.183,2.405-0.184,0.638-1.094,1.759-1.642,2.196-0.638,0.545-2.186,1.331-3.007,1.521-0.911,0.218-2.824-0.126-3.734,0-1.002,0.156-3.1,0.721-4.102,1.203-0.546,0.282-1.458,1.057-1.914,1.485-0.273,0.283-0.729,1.139-1.092,1.276-0.457,0.153-1.276-0.218-1.731-0.319-1.46-0.317-4.283-1.303-5.741-1.52-1.093-0.166-3.28-0.385-4.373-0.156-1.005,0.2-2.733,1.183-3.646,1.722-0.639,0.4-1.642,1.668-2.369,1.921-0.638,0.221-2.006-0.054-2.734,0-0.729,0.046-2.188,0.238-2.823,0.439-0.367,0.099-1.005,0.519-1.37,0.555-0.637,0.064-1.821-0.219-2.367-0.473-0.729-0.301-1.822-1.202-2.278-1.768-0.639-0.712-1.093-2.578-1.64-3.317-0.457-0.702-1.822-1.857-2.46-2.37-0.73-0.527-2.28-1.477-3.099-1.758-1.001-0.31-2.917-0.52-3.827-0.564-2.187-0.092-6.378,0.027-8.476,0.481-1.548,0.338-4.465,1.504-5.832,2.279-0.819,0.519-2.552,1.777-3.19,2.568-0.362,0.419-1,1.378-1,1.925,0,0.481,0.729,1.312,0.729,1.803,0.091,0.619-0.183,1.914-0.547,2.441-0.183,0.355-1.003,0.738-1.277,1.038-0.272,0.257-0.818,0.777-0.818,1.123-0.093,0.409,0.181,1.237,0.364,1.64,0.091,0.229,0.364,0.638,0.364,0.885,0.09,0.481-0.091,1.631-0.457,1.877-0.454,0.256-1.55-0.202-1.912-0.438-0.548-0.266-1.094-1.367-1.643-1.559-0.544-0.221-1.91-0.091-2.459,0.155-0.363,0.19-1.093,0.883-1.274,1.285-0.366,0.527-0.366,1.812-0.638,2.358-0.273,0.511-0.913,1.478-1.367,1.806-0.362,0.29-1.459,0.481-1.914,0.636-0.548,0.184-1.73,0.357-2.095,0.722-0.639,0.536-1.188,2.122-1.551,2.888-0.271,0.758-0.271,2.415-0.638,3.126-0.457,0.711-1.55,1.895-2.277,2.361-0.728,0.536-2.462,1.538-3.372,1.521-0.729-0.008-2.005-0.848-2.551-1.239-0.548-0.383-1.459-1.575-2.096-1.84-0.456-0.21-1.551-0.202-2.098-0.129-0.729,0.119-2.095,0.839-2.823,1.05-0.82,0.245-2.644,0.591-3.464,0.718-0.637,0.102-2.005,0.138-2.644,0.237-2.185,0.335-6.648,1.221-8.745,1.887-1.551,0.481-4.557,1.859-6.015,2.479-1.367,0.528-4.01,1.367-5.193,2.123-0.549,0.401-1.642,1.476-2.096,2.005-1.187,1.248-3.464,3.835-4.466,5.248-0.546,0.757-1.368,2.407-1.823,3.245-0.455,1.065-1.093,3.334-1.639,4.4-0.639,1.396-1.906,4.2-2.89,5.367-0.392,0.475-1.368,1.259-1.922,1.522-1.039,0.491-3.429,0.555-4.484,1.001-0.984,0.419-2.744,1.687-3.563,2.371-0.62,0.5-1.768,1.639-2.241,2.277-0.592,0.793-1.35,2.624-1.887,3.444-0.502,0.776-1.522,2.35-2.242,2.926-1.103,0.865-3.792,1.857-5.13,2.287-0.966,0.3-2.962,0.701-3.965,0.8-1.492,0.138-4.502-0.072-6.004-0.044-1.258,0.017-3.772-0.019-5.012,0.202-1.305,0.234-3.718,1.564-5.04,1.637-0.737,0.046-2.259-0.217-2.888-0.6-0.692-0.421-1.422-1.995-2.04-2.525-0.44-0.372-1.506-0.872-2.006-1.157-0.438-0.246-1.42-0.592-1.759-0.965-0.255-0.272-0.51-0.993-0.602-1.358-0.127-0.5,0.027-1.585-0.201-2.041-0.3-0.61-1.349-1.56-1.968-1.841-0.773-0.364-2.542-0.382-3.401-0.401-0.955-0.027-2.888,0.538-3.807,0.274-0.501-0.138-1.274-0.91-1.677-1.238-0.92-0.749-2.688-2.333-3.525-3.162-0.492-0.483-1.56-1.432-1.886-2.042-0.229-0.448-0.438-1.457-0.438-1.968,0-0.312,0.028-1.048,0.282-1.239,0.236-0.183,0.903,0.09,1.203,0.045,0.455-0.082,1.357-0.392,1.722-0.683,0.365-0.301,0.684-1.284,1.039-1.604,0.394-0.365,1.368-0.874,1.886-1.003,0.493-0.126,1.532-0.036,2.04,0,0.503,0.037,1.532,0.101,1.997,0.283,0.282,0.109,0.712,0.601,1.003,0.683,0.308,0.085,1.066,0.157,1.284-0.082,0.283-0.301,0.228-1.302,0-1.64-0.21-0.319-1.039-0.465-1.403-0.565-0.337-0.091-1.103-0.008-1.357-0.236-0.337-0.3-0.511-1.285-0.483-1.722,0.028-0.484,0.621-1.313,0.758-1.768,0.173-0.559,0.399-1.706,0.445-2.28,0.072-1.026-0.092-3.098-0.2-4.127-0.1-0.939-0.582-2.779-0.603-3.727-0.019-1.011,0.119-3.089,0.484-4.044,0.302-0.813,1.374-2.226,1.959-2.881,0.501-0.574,1.769-1.449,2.277-2.005,0.364-0.384,1.011-1.229,1.286-1.677,0.264-0.438,0.765-1.349,0.885-1.841,0.253-1.094,0.189-3.382,0.035-4.492-0.192-1.366-1.058-4-1.56-5.286-0.5-1.284-1.794-3.745-2.442-4.966-0.655-1.229-2.231-3.554-2.768-4.848-0.275-0.683-0.693-2.104-0.758-2.844-0.053-0.61,0.056-1.858,0.236-2.441,0.137-0.403,0.702-1.048,0.849-1.441,0.138-0.361,0.236-1.138,0.272-1.527,0.046-0.411-0.046-1.259,0-1.679,0.037-0.326,0.101-1.011,0.283-1.283,0.182-0.248,0.811-0.447,1.048-0.639,0.272-0.221,0.956-0.685,0.956-1.04,0-0.219-0.363-0.564-0.564-0.646-0.237-0.091-0.775,0.054-1.039,0.081-0.455,0.046-1.349,0.228-1.805,0.2-0.427-0.026-1.282-0.228-1.676-0.4-0.31-0.128-0.802-0.629-1.121-0.721-0.392-0.107-1.22-0.063-1.603,0.046-0.355,0.092-0.931,0.613-1.286,0.722-0.364,0.107-1.137,0.117-1.521,0.117-0.339,0-1.031-0.018-1.36-0.117-0.208-0.064-0.545-0.457-0.765-0.447-0.31,0.027-0.864,0.474-0.956,0.766-0.108,0.327,0.155,1.037,0.356,1.32,0.226,0.311,1.093,0.51,1.284,0.838,0.138,0.245,0.163,0.877,0.037,1.12-0.2,0.394-1.059,0.839-1.476,0.967-0.54,0.154-1.688-0.055-2.252,0-0.511,0.045-1.551,0.21-2.032,0.401-0.519,0.192-1.457,0.774-1.886,1.121-0.337,0.273-0.82,1.021-1.167,1.285-0.338,0.246-1.104,0.674-1.522,0.709-0.528,0.056-1.557-0.346-2.041-0.555-0.63-0.272-1.813-0.992-2.323-1.439-0.91-0.812-2.305-2.835-3.042-3.809-0.85-1.121-2.279-3.582-3.246-4.604-0.884-0.937-2.979-2.478-4.045-3.206-0.949-0.647-2.961-1.769-3.965-2.323-1.486-0.82-4.392-2.646-6.004-3.162-1.605-0.521-5.003-0.921-6.688-0.921-1.241,0-3.745,0.219-4.887,0.684-0.993,0.392-2.578,1.896-3.443,2.524-0.474,0.326-1.376,1.038-1.886,1.313-0.439,0.237-1.35,0.784-1.842,0.729-0.619-0.073-1.458-1.203-2.041-1.403-0.627-0.218-1.986-0.209-2.642-0.2-0.575,0-1.74,0.363-2.287,0.2-0.465-0.146-1.212-0.865-1.522-1.249-0.528-0.646-1.275-2.169-1.558-2.96-0.283-0.756-0.766-2.353-0.722-3.163,0.047-0.939,0.768-2.743,1.239-3.563,0.565-0.994,2.087-2.743,2.963-3.489,1.411-1.195,4.738-2.871,6.334-3.8,0.819-0.483,2.577-1.286,3.316-1.886,0.682-0.547,1.686-2.006,2.324-2.597,0.383-0.356,1.158-1.075,1.639-1.25,0.512-0.183,1.76-0.429,2.168-0.073,0.193,0.166,0.185,0.757,0.119,1.004-0.081,0.3-0.71,0.684-0.765,0.992-0.045,0.284,0.111,0.911,0.327,1.084,0.292,0.238,1.157,0.246,1.524,0.119,0.427-0.155,1.027-0.93,1.319-1.276,0.374-0.455,1.166-1.392,1.321-1.968,0.154-0.602-0.31-1.867-0.199-2.479,0.09-0.536,0.583-1.547,0.883-2.005,0.712-1.12,2.487-3.132,3.518-3.962,1.121-0.911,3.726-2.188,5.011-2.844,1.303-0.673,4.02-1.786,5.323-2.44,1.026-0.531,3.151-1.514,4.044-2.244,0.483-0.401,1.285-1.384,1.604-1.931,0.329-0.557,0.811-1.796,0.92-2.433,0.081-0.51-0.173-1.551-0.072-2.05,0.082-0.476,0.427-1.432,0.758-1.807,0.226-0.253,0.864-0.59,1.203-0.672,0.227-0.065,0.772-0.154,0.956,0,0.226,0.181,0.217,0.863,0.234,1.156,0.047,0.465-0.19,1.396-0.071,1.84,0.109,0.429,0.602,1.186,0.92,1.486,0.273,0.256,0.966,0.601,1.32,0.72,0.622,0.209,1.951,0.493,2.599,0.401,0.673-0.092,1.856-0.803,2.451-1.121,0.811-0.439,2.416-1.377,3.124-1.958,0.693-0.585,1.86-1.988,2.434-2.69,0.301-0.354,0.73-1.229,1.131-1.476,0.392-0.253,1.395-0.2,1.841-0.363,0.445-0.166,1.304-0.631,1.677-0.921,0.39-0.301,0.903-1.268,1.366-1.44,0.511-0.199,1.723-0.11,2.205,0.155,0.282,0.164,0.466,0.903,0.758,1.048,0.337,0.154,1.127,0.027,1.484-0.083,0.374-0.127,1.038-0.573,1.32-0.847,0.384-0.355,0.83-1.375,1.24-1.723,0.537-0.438,1.85-1.013,2.523-1.156,0.438-0.09,1.368-0.082,1.807,0.035,0.334,0.1,0.9,0.566,1.236,0.684,0.401,0.139,1.303,0.473,1.677,0.283,0.2-0.1,0.339-0.556,0.402-0.757,0.183-0.5,0.28-1.547,0.446-2.05,0.182-0.555,0.584-1.677,0.957-2.124,0.217-0.245,0.81-0.599,1.118-0.719,0.402-0.154,1.297-0.119,1.688-0.283,0.373-0.145,1.128-0.564,1.321-0.92,0.163-0.284,0.21-1.013,0.081-1.322-0.145-0.354-0.811-0.837-1.165-1.001-0.576-0.266-1.888-0.329-2.517-0.356-0.756-0.035-2.276-0.035-3.007,0.154-0.438,0.121-1.158,0.802-1.604,0.802-0.335,0.011-1.056-0.271-1.238-0.555-0.227-0.366,0.009-1.294,0.036-1.723,0.037-0.437,0.202-1.295,0.202-1.722,0-0.71-0.193-2.114-0.32-2.807-0.128-0.711-0.693-2.077-0.72-2.796-0.037-0.842,0.42-2.472,0.566-3.291,0.082-0.527,0.39-1.585,0.354-2.122,0-0.065-0.01-0.139-0.019-0.21l1.343-0.674-2.646-10.736,2.278,0.047,0.421-1.212c0.218,0.403,0.49,0.792,0.701,0.992,0.3,0.274,1.11,0.476,1.447,0.701,0.393,0.265,1.192,0.849,1.386,1.275,0.201,0.439-0.026,1.451,0.055,1.925,0.091,0.52,0.383,1.557,0.692,1.977,0.374,0.501,1.494,1.131,2.032,1.439,0.665,0.384,2.012,1.249,2.778,1.287,0.521,0.026,1.633-0.303,1.978-0.694,0.282-0.328,0.301-1.276,0.32-1.712,0.008-0.283-0.246-0.876-0.111-1.124,0.191-0.334,1.005-0.672,1.387-0.691,0.446-0.02,1.329,0.338,1.658,0.639,0.336,0.31,0.811,1.194,0.801,1.657-0.008,0.438-0.556,1.186-0.801,1.55-0.21,0.301-0.855,0.766-0.967,1.121-0.164,0.564-0.127,1.904,0.274,2.352,0.244,0.272,1.085,0.227,1.44,0.318,0.39,0.092,1.219,0.191,1.549,0.429,0.438,0.327,0.857,1.421,1.176,1.868,0.235,0.337,0.655,1.074,1.011,1.283,0.4,0.229,1.375,0.256,1.85,0.237,0.529-0.027,1.722-0.081,2.078-0.482,0.31-0.347,0.116-1.386,0.245-1.84,0.109-0.446,0.347-1.403,0.675-1.722,0.274-0.268,1.065-0.475,1.439-0.52,0.447-0.055,1.321,0.154,1.769,0.198,0.444,0.037,1.347,0.1,1.794,0.12,0.319,0.009,1.086-0.246,1.284,0,0.275,0.318-0.308,1.229-0.281,1.641,0.047,0.591,0.364,1.813,0.766,2.25,0.42,0.447,1.722,0.684,2.277,0.955,0.394,0.193,1.239,0.52,1.521,0.838,0.338,0.377,0.574,1.388,0.768,1.843,0.116,0.31,0.408,0.921,0.481,1.238,0.101,0.492,0.319,1.549,0.117,2.006-0.164,0.382-0.873,0.993-1.283,1.048-0.355,0.045-0.968-0.675-1.32-0.602-0.357,0.063-0.904,0.69-1.002,1.038-0.119,0.429,0.116,1.388,0.397,1.724,0.283,0.326,1.187,0.547,1.604,0.637,0.639,0.146,1.978,0.339,2.608,0.165,0.582-0.165,1.603-0.938,2.004-1.404,0.326-0.392,0.854-1.33,0.91-1.841,0.055-0.437-0.21-1.32-0.391-1.723-0.193-0.437-0.766-1.202-1.084-1.566-0.302-0.337-1.011-0.909-1.358-1.192-0.318-0.265-1.075-0.649-1.321-0.967-0.181-0.22-0.418-0.756-0.446-1.039-0.018-0.237,0.037-0.757,0.199-0.92,0.272-0.264,1.104-0.246,1.487-0.282,0.418-0.037,1.312-0.174,1.676,0.045,0.155,0.082,0.328,0.42,0.365,0.591,0.045,0.21-0.094,0.629-0.119,0.85-0.055,0.336-0.238,1.021-0.199,1.357,0.026,0.31,0.225,0.901,0.399,1.165,0.218,0.329,0.802,0.966,1.202,1.04,0.43,0.072,1.295-0.364,1.641-0.647,0.365-0.29,0.921-1.104,1.039-1.558,0.1-0.355-0.291-1.177-0.082-1.476,0.174-0.247,0.829-0.402,1.12-0.367,0.265,0.03,0.795,0.293,0.921,0.52,0.164,0.276-0.072,0.979,0,1.287,0.083,0.318,0.393,0.947,0.646,1.156,0.33,0.273,1.214,0.438,1.644,0.484,0.49,0.044,1.467-0.139,1.957-0.166,0.419-0.009,1.277-0.091,1.686,0,0.292,0.074,1.004,0.238,1.086,0.52,0.053,0.228-0.529,0.538-0.529,0.769,0,0.462,0.784,1.138,1.047,1.52,0.32,0.474,1.222,1.348,1.285,1.923,0.027,0.391-0.41,1.102-0.602,1.438-0.301,0.514-1.139,1.341-1.447,1.842-0.209,0.347-0.63,1.085-0.685,1.486-0.035,0.348,0.02,1.139,0.281,1.359,0.165,0.135,0.685-0.139,0.849,0,0.318,0.281-0.054,1.375,0.237,1.684,0.182,0.192,0.784,0.273,1.038,0.2,0.384-0.101,1.003-0.7,1.185-1.038,0.274-0.582,0.364-1.95,0.364-2.606,0.093-0.528,0-1.594,0-2.124,0.093-0.528,0-1.648,0.273-2.123,0.091-0.264,0.637-0.712,0.912-0.756,0.273-0.055,0.91,0.201,1.095,0.438,0.273,0.29,0.273,1.111,0.273,1.484,0,0.547-0.185,1.649-0.185,2.195,0,0.721-0.182,2.207,0.092,2.889,0.093,0.301,0.455,0.867,0.729,1.002,0.456,0.184,1.367,0.084,1.822-0.08,0.364-0.156,0.821-0.976,1.185-1.121,0.364-0.146,1.185,0.136,1.55,0,0.455-0.156,1.093-0.773,1.277-1.167,0.362-0.591,0.18-1.978,0.18-2.644,0-0.482,0-1.476-0.091-1.96-0.089-0.453-0.639-1.266-0.729-1.721,0-0.327-0.092-1.047,0.09-1.32,0.275-0.349,1.094-0.656,1.549-0.685,0.365-0.017,1.096,0.248,1.367,0.447,0.639,0.366,1.551,1.431,1.915,2.041,0.363,0.592,0.728,1.959,0.728,2.642-0.091,0.792-0.638,2.326-0.911,3.045-0.272,0.664-1.002,2.022-1.55,2.478-0.546,0.392-1.821,0.53-2.368,0.84-0.364,0.227-1.002,0.819-1.275,1.166-0.455,0.602-0.82,2.086-1.184,2.724-0.273,0.355-0.822,1.012-1.094,1.32-0.365,0.419-1.275,1.094-1.551,1.561-0.273,0.398-0.818,1.329-0.729,1.767,0.184,0.383,1.094,0.711,1.549,0.721,0.64,0.017,1.914-0.646,2.461-1.039,0.547-0.429,1.275-1.722,1.822-2.171,0.638-0.49,2.187-1.01,2.825-1.475,0.729-0.502,1.913-1.731,2.46-2.369,0.547-0.583,1.366-1.948,1.914-2.479,0.637-0.574,2.005-1.613,2.824-1.841,0.458-0.137,1.549-0.192,2.004,0.036,0.184,0.118,0.549,0.583,0.549,0.838,0,0.558-0.912,1.458-1.367,1.77-0.365,0.234-1.276,0.28-1.641,0.437-0.547,0.201-1.55,0.666-2.006,1.002-0.363,0.338-1.092,1.168-1.365,1.642-0.274,0.481-0.64,1.548-0.549,2.085,0,0.354,0.274,1.131,0.639,1.275,0.364,0.165,1.095-0.19,1.459-0.355,0.456-0.21,1.002-1.065,1.458-1.203,0.637-0.2,2.005-0.08,2.643,0.239,0.364,0.218,0.818,1.001,0.91,1.403,0.273,0.528,0.364,1.686,0.364,2.242-0.091,0.509-0.636,1.428-0.819,1.922-0.091,0.337-0.274,1.01-0.274,1.367,0,0.399,0.091,1.256,0.364,1.557,0.185,0.293,1.095,0.492,1.459,0.52,0.364,0.038,1.096-0.045,1.459-0.236,0.273-0.183,0.455-0.938,0.728-1.121,0.365-0.21,1.186-0.373,1.549-0.282,0.367,0.091,0.912,0.603,1.186,0.92,0.183,0.355,0.272,1.221,0.272,1.649,0,0.465-0.455,1.331-0.455,1.796,0,0.446,0.092,1.422,0.455,1.723,0.184,0.217,0.912,0.173,1.276,0.197,0.638,0.064,2.098-0.052,2.826,0.037,1.002,0.138,3.098,0.521,4.011,1.003,0.816,0.475,2.275,1.942,2.914,2.689,0.638,0.656,1.548,2.15,2.096,2.878,0.273,0.476,0.911,1.424,1.186,1.889,0.818,1.191,2.732,3.397,3.28,4.729,0.454,0.929,0.819,2.952,0.819,3.964-0.092,0.801-0.457,2.432-0.819,3.114-0.365,0.558-1.368,1.47-2.006,1.722-0.456,0.202-1.549,0.021-2.004,0.202-0.547,0.229-1.459,1.039-1.914,1.486-0.363,0.483-1.003,1.611-1.276,2.205-0.272,0.666-0.819,2.079-0.729,2.798,0.091,0.746,0.638,2.186,1.185,2.723,0.273,0.338,1.095,0.857,1.549,0.851,0.456-0.012,1.275-0.477,1.548-0.851,0.185-0.444-0.18-1.529-0.09-2.04,0-0.556,0.09-1.693,0.274-2.197,0.183-0.38,0.728-1.084,1.092-1.245,0.274-0.093,0.821-0.102,1.003,0.042,0.366,0.293,0.366,1.34,0.455,1.807,0.185,0.708,0.275,2.204,0.548,2.879,0.365,0.629,1.093,1.958,1.73,2.203,0.638,0.248,2.097-0.427,2.825-0.598,0.546-0.138,1.552-0.648,2.096-0.603,0.82,0.053,2.097,0.773,2.733,1.201,0.82,0.567,1.824,2.415,2.643,2.882,0.637,0.309,1.915,0.317,2.554,0.436,0.543,0.11,1.638,0.229,2.096,0.447,0.728,0.318,2.004,1.411,2.64,1.84,0.638,0.402,1.823,1.257,2.554,1.486,0.638,0.18,1.913,0.301,2.46,0.2,0.455-0.074,1.187-0.374,1.458-0.648,0.182-0.199,0.546-0.745,0.546-1.038,0-0.383-0.637-1.001-0.817-1.32-0.274-0.401-0.824-1.231-1.187-1.568-0.456-0.401-1.548-0.92-2.005-1.238-0.548-0.311-1.549-0.901-2.006-1.276-1.184-0.947-3.189-3.207-4.191-4.292-0.729-0.82-2.368-2.433-3.097-3.325-1.822-2.206-5.013-6.953-6.562-9.332-1.185-1.769-3.372-5.439-4.558-7.209-1.273-1.966-4.099-5.786-5.557-7.688-0.73-1.05-2.369-3.108-3.19-4.165-0.455-0.602-1.185-1.648-1.822-2.508l2.096-1.166c0.183,0.35,0.365,0.648,0.548,0.913,0.911,1.365,3.099,3.79,4.099,5.048,0.821,1.048,2.643,3.07,3.466,4.165,0.819,1.121,2.276,3.5,3.005,4.684,1.094,1.876,3.281,5.74,4.465,7.572,1.095,1.612,3.554,4.702,4.739,6.204,1.185,1.386,3.646,4.047,4.828,5.367,1.094,1.178,3.282,3.49,4.375,4.648,0.638,0.654,1.914,1.94,2.46,2.644,0.365,0.436,0.912,1.512,1.367,1.839,0.456,0.356,1.641,0.646,2.277,0.721,0.913,0.119,2.644,0.08,3.555-0.156,0.729-0.208,2.097-1.12,2.825-1.52,0.819-0.493,2.461-1.688,3.279-2.087,0.639-0.283,2.097-0.575,2.733-0.758,0.64-0.172,1.824-0.373,2.462-0.647,0.729-0.337,2.005-1.257,2.552-1.875,0.365-0.457,0.819-1.56,0.911-2.124,0.092-0.558-0.183-1.687-0.092-2.241,0-0.328,0.092-1.002,0.272-1.284,0.274-0.458,1.184-1.003,1.642-1.359,0.365-0.364,1.185-1.085,1.458-1.531,0.272-0.383,0.546-1.312,0.819-1.713,0.183-0.337,0.638-1.011,0.911-1.248,0.272-0.22,1.003-0.537,1.367-0.521,0.273,0.02,0.821,0.237,0.911,0.447,0.183,0.311,0.092,1.111,0,1.478,0,0.382-0.363,1.109-0.363,1.484,0.273,0.875,1.731,2.142,2.368,2.76,0.729,0.666,2.188,1.85,3.005,2.325,0.729,0.383,2.188,1.011,2.919,1.167,0.546,0.107,1.821,0.172,2.369,0.035,0.453-0.1,1.183-0.574,1.64-0.803,0.546-0.355,1.822-1.021,2.278-1.565,0.455-0.593,0.911-2.097,1.002-2.843,0.182-0.502,0-1.598,0.182-2.08,0.092-0.301,0.457-0.864,0.821-1.002,0.273-0.136,0.909,0.045,1.185,0,0.547-0.072,1.548-0.265,1.913-0.6,0.364-0.283,0.638-1.149,0.729-1.56,0.182-0.546,0.091-1.703,0.271-2.251,0.276-0.646,1.005-1.794,1.277-2.396,0.365-0.548,0.91-1.631,1.183-2.204,0.185-0.492,0.458-1.58,0.73-2.041,0.274-0.438,0.913-1.287,1.276-1.522,0.455-0.2,1.275-0.11,1.731-0.2,0.729-0.166,2.096-0.874,2.823-0.967,0.729-0.091,2.277,0.137,3.099,0.283,0.639,0.135,2.005,0.491,2.553,0.802,0.546,0.29,1.367,1.311,2.005,1.521,0.637,0.235,2.006,0.273,2.645,0.118,0.545-0.118,1.272-0.885,1.821-1.003,0.363-0.091,1.275,0.01,1.639,0.129,0.729,0.182,1.913,0.929,2.552,1.238,0.729,0.337,2.004,1.212,2.734,1.357,0.546,0.101,1.551,0.101,2.004-0.118,0.363-0.185,0.638-1.11,1.003-1.239,0.547-0.173,1.731,0.165,2.188,0.521,0.1,0.31,0.4,1.34,0.5,1.83","name":"АР Крим"}}});
\ No newline at end of file
@@ -1,2 +0,0 @@
-/** Add USA District Map Data Points */
-jQuery.fn.vectorMap('addMap', 'usa_districts_en', {"width":"2583.2649","height":"1556.9987","paths":{"nv2":{"name":"NV-2","path":"M 245.89352,459.40969 L 206.53125,641.72388 C 270.05694,728.77235 333.62764,815.78798 397.15738,902.83344 C 397.64674,902.51273 398.13843,902.19577 398.62837,901.87642 L 402.10203,900.26367 L 405.66431,900.26367 L 404.76045,898.86354 C 404.25672,898.09469 403.78601,896.39704 403.78612,895.90931 L 407.22391,888.99199 L 404.91995,888.26533 L 406.19599,883.35615 L 408.94302,882.66493 L 408.94302,881.01674 L 412.34579,879.26216 L 411.63688,871.99582 L 408.67718,873.11238 L 403.30718,872.38572 L 402.59827,870.13496 L 400.71966,871.73001 L 389.60748,871.60592 L 388.77451,870.27674 L 383.61718,871.34011 C 382.40404,870.75993 380.42708,869.28427 380.42708,869.28427 L 382.28797,866.44862 L 374.96847,860.51147 L 370.83906,859.838 L 371.60114,853.75912 L 370.41372,853.75912 C 369.76747,853.75912 369.2439,853.59181 369.24401,853.38691 C 369.24401,853.18206 370.16461,847.75867 371.28213,841.33543 C 372.39965,834.91218 373.38763,829.57125 373.49748,829.46117 L 387.10857,831.10942 L 395.89906,839.84671 L 395.89906,842.04434 L 399.30183,847.34347 L 401.44629,847.98149 C 402.62182,848.33368 405.4374,848.79708 407.72015,849.00942 L 411.885,849.39932 L 412.98381,851.80961 L 410.67985,857.16189 L 418.22976,857.16189 L 420.71094,854.84018 L 420.16154,849.94869 L 422.04015,847.05991 L 432.63837,838.96058 L 435.01322,833.25384 C 434.37919,832.09792 433.78768,830.92408 433.32956,829.69159 C 433.32955,829.52009 433.58995,829.37258 433.91441,829.37258 L 437.76025,831.78288 L 440.05702,831.01992 L 440.77481,833.50071 L 444.39533,832.26052 L 446.29417,831.07522 L 449.56785,829.68904 L 451.77896,829.37258 C 452.70638,829.37258 454.30765,829.13728 455.34124,828.8409 L 457.21985,828.30922 L 460.9948,830.09919 L 465.47866,828.62823 L 513.66688,508.00553 C 430.50121,496.27262 313.56875,474.90448 245.89352,459.40969 z "},"il15":{"name":"IL-15","path":"M 1697.938,577.56744 L 1670.7158,581.00566 L 1673.0729,602.34388 L 1679.9848,601.12098 L 1679.8784,607.60751 L 1674.8984,608.86586 L 1671.4778,613.61556 L 1673.0374,616.41576 L 1673.0729,622.22883 L 1671.3184,623.68209 L 1672.1159,624.90494 L 1687.5701,623.6289 C 1688.0948,625.95089 1688.194,628.34332 1688.5094,630.70031 L 1666.4623,633.16375 L 1668.3764,647.32427 L 1686.7726,644.86078 L 1688.4563,657.81615 L 1680.7291,659.03899 L 1684.3978,660.81127 L 1682.6964,663.771 L 1677.4504,662.06962 L 1675.8908,664.05457 L 1676.5643,671.05503 L 1687.2511,669.84989 L 1687.2511,674.65279 L 1691.6287,673.90843 L 1692.3198,677.38209 L 1695.0491,677.38209 C 1696.6112,678.76475 1698.2468,680.30842 1698.9836,680.04051 L 1699.0368,681.45833 L 1704.4954,681.06843 L 1706.5335,697.90506 L 1731.3631,694.96308 L 1733.9683,714.7417 L 1743.2201,713.53462 L 1743.183,719.13649 L 1746.9953,721.12399 L 1747.7552,723.10752 L 1744.3177,724.98404 L 1745.6654,735.72546 L 1744.2284,738.97011 L 1741.5887,739.67642 L 1741.6955,742.65503 L 1739.9055,746.111 L 1736.8914,745.41979 L 1736.8914,747.8459 L 1733.2594,748.27318 L 1732.905,752.52664 L 1729.2364,753.60771 L 1730.0693,767.21879 L 1724.9982,768.56601 L 1725.8527,775.83235 C 1722.5927,776.04201 1719.0294,776.10428 1715.6075,777.28533 L 1716.3342,784.00229 L 1721.2788,784.00229 L 1721.3143,779.1285 C 1722.5207,778.64031 1727.5083,778.14566 1731.3454,777.65754 L 1732.1252,782.86803 L 1736.2014,782.92117 L 1736.8217,784.2681 L 1737.318,783.63008 L 1736.3964,779.46526 C 1736.3059,778.99738 1736.0213,778.16789 1735.7761,777.62209 L 1735.333,776.62961 L 1735.7584,775.63714 C 1735.9908,775.09128 1736.124,773.8369 1736.0596,772.85464 L 1735.9533,771.08236 L 1737.0875,770.37345 L 1735.4748,766.49219 L 1735.8115,765.60605 C 1735.9977,765.1207 1736.3575,764.71991 1736.6267,764.71991 L 1737.123,764.71991 L 1736.8749,760.48414 L 1738.1332,759.91701 C 1738.8291,759.60838 1739.5239,759.03501 1739.6751,758.64097 L 1739.9586,757.93206 L 1736.5913,756.17754 L 1736.5913,752.81021 L 1737.7256,752.81021 L 1737.7256,749.28335 L 1740.5612,749.81503 L 1740.5612,748.14909 L 1742.8297,748.73397 L 1742.8297,744.9413 L 1745.1869,743.27536 L 1746.6933,738.91556 L 1745.6477,736.98375 L 1746.9237,736.29259 C 1747.623,735.91828 1748.5121,735.28899 1748.9087,734.89246 L 1749.6353,734.18355 L 1749.5112,733.13793 C 1749.4456,732.57001 1749.5899,730.83397 1749.8302,729.27437 C 1750.0704,727.71476 1750.5077,725.88487 1750.7873,725.19813 L 1751.2835,723.93979 L 1754.6331,722.20295 L 1755.4129,717.61278 L 1754.5091,716.23041 C 1754.012,715.47176 1753.6052,714.45053 1753.6052,713.96189 L 1753.6052,713.07575 L 1751.9038,712.41998 L 1751.9038,709.69068 L 1753.2153,707.59939 L 1752.5063,705.72078 L 1749.7948,704.69286 L 1749.0681,700.13813 L 1748.058,699.39377 C 1747.5077,698.98686 1746.6134,697.95435 1746.073,697.10751 L 1745.0982,695.56566 L 1745.0982,693.40348 L 1745.9844,692.67682 C 1746.4693,692.27438 1747.0963,691.49588 1747.3845,690.95774 L 1747.9162,689.98295 L 1745.6299,687.09417 L 1746.0907,682.87615 L 1748.6605,680.94434 L 1735.5811,579.0384 L 1704.8853,583.80586 L 1698.7178,583.80586 L 1697.938,577.56744 z "},"mn6":{"name":"MN-6","path":"M 1426.9213,308.55346 L 1402.2689,309.90039 L 1405.3704,312.43475 L 1383.7132,313.85257 L 1384.5462,329.2891 L 1388.4452,332.8691 L 1385.7336,336.85673 L 1386.2299,341.12791 L 1402.5525,339.88732 L 1402.5525,342.77613 L 1408.0998,342.77613 C 1408.6296,349.28543 1409.0149,355.36118 1409.3606,361.31805 L 1430.2722,359.92787 L 1430.3418,353.55158 L 1431.352,353.55158 L 1432.0609,350.73366 L 1435.4283,348.0437 L 1433.7865,346.48409 C 1434.54,345.43124 1437.7262,344.37839 1440.621,343.32554 L 1444.9986,344.49524 L 1445.4239,345.77128 L 1448.7203,344.03445 L 1451.3433,345.2396 L 1452.6194,349.51078 L 1464.7175,348.67521 L 1465.7873,363.33455 C 1469.0123,362.89988 1471.5414,363.9962 1474.4184,364.32702 L 1473.7271,354.08326 C 1472.6345,353.59861 1471.9428,352.71291 1471.7776,351.30078 L 1474.4361,348.64237 L 1473.2664,346.51564 L 1472.8765,337.92009 L 1461.5339,338.38088 L 1461.5339,331.52217 L 1439.5754,332.95772 L 1439.4159,324.52168 L 1428.2505,324.57484 L 1426.9213,308.55346 z "},"pa12":{"name":"PA-12","path":"M 2074.6765,602.15928 L 2071.6284,588.33875 L 2073.254,588.29633 C 2078.1767,583.70627 2077.7965,585.68827 2080.2717,582.95652 L 2086.0952,582.71067 L 2088.3053,580.71052 L 2085.5331,578.32586 L 2086.7578,572.34725 L 2084.5248,570.69997 L 2080.2602,571.5109 C 2079.6866,572.76976 2078.7493,574.16733 2077.4925,574.41534 C 2077.538,572.43226 2077.1529,571.46905 2076.3372,570.0299 L 2076.9354,569.06187 L 2079.4773,569.06187 L 2080.7251,567.70076 L 2081.9489,570.0742 L 2085.8087,568.32523 L 2087.725,570.19613 L 2090.6167,570.09682 L 2091.5485,567.80727 L 2089.2529,563.88971 L 2095.1869,564.76127 L 2092.7481,565.71153 L 2092.7481,566.62756 L 2095.0166,567.4928 L 2094.7387,571.43145 L 2097.3622,571.8522 L 2097.6886,567.81719 L 2100.6372,565.37552 L 2100.7176,561.34323 L 2103.4874,559.87346 C 2104.2258,562.21953 2105.78,562.93392 2106.9263,564.46415 C 2106.9263,564.7427 2106.5259,565.12425 2106.0365,565.31205 L 2105.668,565.4722 C 2105.6236,567.64008 2105.3752,569.2188 2104.991,570.68414 L 2107.7696,570.88037 L 2109.6173,572.47865 L 2110.5746,571.09673 L 2112.1107,571.55338 L 2112.2227,570.24292 L 2111.2742,569.16044 L 2113.1166,566.49877 L 2112.0479,564.80839 L 2112.0305,560.69381 L 2113.4521,559.28778 L 2115.3446,560.07514 L 2117.6338,558.22441 L 2118.019,559.27452 C 2117.267,560.42392 2116.3563,561.6413 2116.6013,562.85868 L 2117.4519,567.41828 L 2123.5648,570.465 L 2124.3524,571.83184 L 2126.8044,571.19065 L 2129.191,565.64302 L 2130.9882,566.16927 C 2130.7102,563.2365 2131.2708,565.0628 2133.4857,556.48714 L 2124.4239,552.58362 L 2122.8059,556.01789 L 2117.163,556.01789 L 2117.9067,552.25412 L 2116.2006,551.99567 C 2114.8297,553.36701 2114.5919,554.37576 2114.1728,557.15215 L 2113.5727,557.56007 L 2111.9906,555.45077 C 2112.9751,553.33335 2113.2343,550.80801 2113.7203,548.46396 L 2109.0589,547.16643 L 2108.4179,546.2916 C 2108.0654,545.81043 2106.9552,544.9921 2105.9508,544.47308 L 2104.1245,543.52941 L 2102.2864,546.33461 L 2099.0943,543.97461 L 2097.8523,544.74226 L 2097.8523,542.47374 C 2099.0076,541.76801 2099.9364,540.33709 2100.6385,538.58889 L 2099.4937,534.44279 L 2101.8994,531.06423 L 2104.2267,531.04421 L 2102.9125,527.472 C 2104.1654,526.4772 2105.1011,526.57019 2108.167,526.5272 L 2107.387,532.19849 L 2110.8638,532.19849 L 2111.86,528.24021 L 2118.9381,528.17182 L 2112.5165,542.95644 L 2112.9081,545.52601 C 2114.2507,545.26394 2115.4974,546.43958 2116.7921,546.89637 L 2118.1679,545.7545 L 2118.937,546.99891 L 2120.4049,545.78063 L 2121.8022,547.86501 L 2121.8807,546.92389 L 2125.5881,550.5173 L 2126.9653,547.49467 C 2128.2876,547.36673 2129.3703,548.32906 2130.6447,549.26743 C 2131.2367,548.4602 2132.1187,548.0132 2132.9949,548.33438 L 2134.3546,545.40252 L 2136.6365,545.75686 L 2138.1674,538.00629 L 2133.0959,535.03413 L 2128.653,535.03413 C 2127.9209,535.93663 2127.128,536.92548 2126.1408,537.50597 L 2124.4983,535.0917 L 2126.4067,531.08964 L 2127.9101,532.33737 L 2129.6115,530.92535 C 2129.3602,529.48084 2129.9222,528.51076 2130.6876,527.40512 C 2133.0369,529.35315 2134.7084,530.11511 2136.9222,531.01262 L 2139.0369,529.68926 L 2139.7074,524.91501 L 2140.9059,523.99004 L 2143.2226,524.18335 L 2143.2226,526.5272 L 2140.5103,527.16001 L 2141.7985,529.4603 L 2145.7604,528.65164 L 2147.9291,529.28087 L 2147.7596,536.6454 L 2154.4498,537.93456 C 2155.2899,540.11322 2155.1989,541.7037 2155.1323,543.73532 L 2153.2392,545.82715 L 2152.7368,551.88488 L 2147.4955,553.46582 L 2146.5586,558.28641 L 2143.7974,558.72754 L 2142.0924,562.33848 L 2143.2005,564.40888 L 2140.2953,566.31241 L 2138.5577,565.64561 L 2132.3701,569.68316 L 2132.0026,572.2032 L 2130.2024,573.718 L 2131.4002,576.15529 L 2130.4967,578.11098 L 2125.0928,576.15098 L 2125.076,573.78968 C 2122.7374,573.09472 2120.2027,572.59588 2117.7661,572.46464 L 2116.1555,574.76407 L 2111.7227,573.16896 L 2112.4091,576.15098 L 2110.2366,579.83737 L 2112.4471,580.59931 L 2112.4226,582.46006 L 2111.2288,582.34533 L 2110.0841,585.2167 L 2108.3275,585.22958 L 2105.7471,590.85856 L 2103.24,587.76181 L 2099.8372,590.6008 L 2103.5236,593.99954 L 2103.5236,596.06877 L 2074.6765,602.15928 z "},"wa3":{"name":"WA-3","path":"M 191.0061,115.69425 L 186.94758,117.34247 L 186.91214,118.72485 L 183.93471,118.61851 L 183.26125,120.44396 L 179.39768,119.04386 L 178.0862,119.62871 L 177.48362,123.38594 L 178.81283,124.98099 L 175.87085,136.96158 L 137.14659,127.26722 L 136.73897,128.54326 L 136.75669,129.8193 L 139.59234,133.22208 L 140.77976,131.18396 L 142.39253,132.51317 L 144.20026,131.00673 L 146.32699,133.7892 L 145.99026,134.90574 L 142.39253,135.93366 L 142.39253,137.40465 L 140.03541,138.14901 L 140.31897,139.37188 C 140.48003,140.04429 140.78289,141.54688 140.99243,142.70376 L 141.38234,144.79505 L 138.13907,147.68386 L 136.20729,147.24079 L 135.79966,148.44594 L 134.45273,147.61297 L 134.45273,146.53188 C 134.45273,145.93276 134.85131,144.43622 135.33887,143.21772 L 136.22501,141.00237 L 135.87055,136.05772 L 134.55907,142.49109 L 133.26531,148.90673 L 130.07521,157.89217 L 130.50055,157.89217 C 130.73438,157.89217 131.08308,157.50937 131.26263,157.04148 L 131.58164,156.19079 L 133.83243,156.19079 L 134.93125,158.67198 C 135.53433,160.03537 136.30656,161.33058 136.65036,161.54307 L 137.27065,161.91524 L 141.32917,160.00118 L 142.53432,161.20633 L 145.42313,160.10752 L 147.05362,160.74554 L 146.38016,162.5001 L 150.29689,164.13059 L 154.85164,164.13059 L 156.69481,166.96623 L 156.03907,170.65257 L 156.78342,171.62732 C 157.18835,172.16092 158.238,172.86825 159.12283,173.20465 L 160.7356,173.82495 L 164.12065,172.63752 L 168.35639,172.63752 L 176.88105,183.00534 L 178.0862,190.50207 L 177.20006,204.68029 L 175.62273,208.34891 L 178.97233,211.85801 L 181.80798,213.27584 C 183.36758,214.05833 185.52934,215.37735 186.61085,216.20009 L 188.57808,217.68881 L 191.73273,217.35207 L 192.12263,218.39772 C 192.33309,218.96716 192.78039,219.62515 193.11511,219.86871 L 193.71768,220.31178 L 195.70263,219.99277 C 196.79435,219.81805 198.70841,219.60548 199.9561,219.51425 C 201.20378,219.42303 203.24544,219.15479 204.49313,218.9294 C 205.74081,218.70401 207.78247,218.21641 209.03016,217.84831 L 211.29867,217.19257 L 213.49629,215.17217 L 216.11926,215.17217 L 216.11926,211.43267 L 222.46402,210.93643 L 227.21372,206.16901 L 229.44679,197.02405 L 233.07996,197.66207 L 237.91827,177.15683 L 243.00471,178.29109 L 243.74907,177.08594 L 242.36669,170.45762 C 243.8777,168.97385 245.25093,167.03082 246.76194,164.07742 L 246.08847,161.45445 L 249.20768,158.99099 L 246.74421,157.25415 L 246.60243,154.3299 L 233.1154,151.45881 L 230.82917,153.92227 L 229.85441,153.92227 C 229.32074,153.92111 228.08685,153.44538 227.12511,152.85891 C 226.16337,152.27243 224.50452,151.61092 223.43877,151.38792 L 215.8357,149.22574 C 214.07981,147.62231 212.55355,146.52407 210.43025,145.3799 L 210.99738,144.31653 L 211.56451,143.25317 C 208.06208,141.39018 204.55964,139.57311 201.7461,136.83752 L 197.35085,137.15653 L 194.67471,133.80693 L 196.44699,129.99653 L 192.90243,128.27742 L 192.19352,126.04435 L 193.15055,125.38861 L 190.59847,123.79356 C 190.81744,121.69443 191.21532,120.01027 192.06946,118.08683 L 191.1656,117.62604 L 191.0061,115.69425 z "},"wa2":{"name":"WA-2","path":"M 224.64392,9.2158414 L 222.92481,9.9601978 C 221.98445,10.376454 221.22331,10.921849 221.22342,11.165346 C 221.22342,11.408844 221.86133,11.843619 222.64124,12.140099 L 224.05907,12.689505 L 224.05907,13.238911 C 224.05906,13.540864 223.54871,14.148768 222.92481,14.585841 L 221.79055,15.365643 L 224.05907,17.421485 L 224.05907,20.133069 L 225.91996,22.968712 L 225.31738,24.227029 C 224.98862,24.914709 224.57637,25.933482 224.3958,26.495544 L 224.07679,27.523465 L 225.19332,26.832277 L 225.19332,28.019702 L 226.36303,28.019702 L 225.19332,25.839801 L 226.68204,24.670098 C 227.50312,24.024249 228.37894,23.482673 228.63154,23.482673 C 228.88402,23.482672 229.81525,24.097043 230.68738,24.847326 L 232.26471,26.21198 L 230.29748,28.391881 L 230.29748,32.663069 L 232.53055,35.516435 L 231.3254,37.78495 L 228.86194,37.306435 L 228.68471,42.268811 L 227.33778,43.881583 L 225.19332,42.729603 L 225.19332,40.212969 L 223.20837,39.007821 L 221.75511,39.078712 C 220.95959,39.121167 220.00257,39.343713 219.62837,39.57495 C 219.25423,39.806188 218.95479,40.230534 218.95491,40.514257 L 218.95491,41.028217 L 220.53223,40.425643 L 221.34748,41.737128 L 220.72719,42.375148 C 220.3801,42.722276 220.08905,43.334305 220.08917,43.739801 L 220.08917,44.466435 L 223.26154,44.466435 L 223.93501,43.792969 C 224.30932,43.418666 224.64582,43.227257 224.66164,43.367623 C 224.67729,43.507989 224.77923,44.690207 224.89204,45.990593 L 225.08699,48.347722 L 229.09233,52.122672 L 230.22659,55.135543 L 228.02897,57.120494 L 225.86679,55.170989 L 225.19332,56.269801 L 223.01342,55.702672 L 221.91461,59.637127 L 222.53491,62.827226 L 226.32758,66.619899 L 226.32758,66.070494 C 226.32758,65.766586 226.05091,65.343633 225.70728,65.131187 C 225.36355,64.91874 224.71382,63.885324 224.27174,62.827226 L 223.47422,60.895444 L 225.97313,57.510395 L 227.9758,57.510395 L 229.07461,61.515741 L 228.06441,65.02485 L 229.25184,67.364256 C 229.90036,68.654644 230.82256,70.162202 231.30768,70.71386 L 232.19382,71.724058 L 231.14818,75.942077 L 227.46184,76.296533 L 227.46184,76.739602 C 227.46183,76.977388 228.12782,77.791127 228.95055,78.547325 L 230.45699,79.911978 L 231.40059,78.24977 L 235.64976,83.83356 L 238.80441,83.226137 L 240.77164,85.406038 L 238.23728,87.479602 L 238.18841,89.367914 C 244.76225,90.524873 249.38099,91.535196 254.68402,93.132049 C 254.12835,98.973855 252.69274,103.03549 251.18349,107.39253 L 253.5852,106.76198 L 256.95253,110.37742 L 256.95253,111.95475 L 259.25649,111.95475 L 263.47451,109.84574 L 268.82679,109.06594 L 271.69788,107.98485 L 271.69788,103.35921 L 274.9057,102.13633 L 274.05501,97.492968 L 275.84501,95.508018 L 273.47015,92.955938 L 273.39926,87.65683 L 276.50075,83.970493 L 276.14629,81.347523 L 277.65273,80.762671 C 278.47506,80.450019 279.87105,80.195543 280.77194,80.195543 L 282.42015,80.195543 L 285.30897,78.884058 L 284.82989,76.942578 C 284.82989,76.942578 287.5916,75.796376 287.71982,75.720262 C 286.10805,72.396962 284.83841,68.975911 284.74184,66.141385 L 282.88095,65.432474 L 284.75956,63.358909 L 284.03293,61.44485 L 285.98243,59.300395 L 285.90073,55.681776 L 289.9958,55.24188 L 291.13173,53.872936 L 296.36798,53.824058 L 296.72243,56.376137 L 300.44421,56.376137 L 301.60907,52.945943 L 299.35995,52.924488 L 298.24659,49.694652 L 305.14075,44.998118 L 302.65956,39.876237 L 304.00649,36.296237 L 302.88996,35.179702 L 302.88996,32.060494 L 304.36636,30.913364 L 303.73095,30.017525 L 301.11712,30.659837 L 299.93137,28.126039 L 300.35672,27.036368 L 224.64392,9.2158414 z M 209.13649,22.295247 L 208.00224,23.429504 L 209.49095,25.237227 L 210.62521,24.10297 L 209.13649,22.295247 z M 200.80679,22.348415 L 200.80679,23.021881 C 200.80679,23.394714 201.48573,24.408914 202.31323,25.272673 L 203.81966,26.849999 L 204.29818,26.548712 C 204.56239,26.385435 204.77669,26.00571 204.77669,25.698019 C 204.77669,25.39033 204.14222,24.514138 203.37659,23.748514 C 202.61097,22.982892 201.71774,22.348415 201.39164,22.348415 L 200.80679,22.348415 z M 223.49194,23.961188 L 222.07412,24.42198 L 221.70194,26.318316 L 223.49194,26.318316 L 223.49194,23.961188 z M 213.00006,24.049801 L 207.41738,28.303267 L 207.22243,30.908514 L 209.03016,32.025049 L 206.8857,31.706039 L 205.84006,29.756534 C 205.26363,28.680441 204.42828,27.579868 203.97917,27.328514 L 203.16392,26.885445 L 201.99422,27.062673 C 201.35387,27.16039 200.68304,27.399123 200.48778,27.594356 L 200.13332,27.948811 L 201.05491,29.437524 L 201.16125,34.222672 L 205.57422,38.511583 L 209.79224,40.40792 L 211.086,42.83594 L 214.70144,42.481484 L 214.75461,39.344554 L 217.20035,37.625445 L 216.6155,36.083564 L 217.82065,35.321484 L 217.11174,30.855346 L 217.64342,30.855346 C 217.93556,30.855346 218.66845,30.48793 219.27392,30.040098 L 220.37273,29.224851 L 215.32174,24.049801 L 213.00006,24.049801 z M 223.72233,28.19693 C 223.69723,28.201339 223.66808,28.215735 223.65144,28.232376 C 223.51834,28.365499 223.75492,29.010626 224.1654,29.66792 L 224.90976,30.873069 L 225.29966,29.685643 L 224.59075,28.83495 C 224.25316,28.428135 223.89806,28.166067 223.72233,28.19693 z M 220.51451,31.97188 L 218.95491,33.265643 L 218.95491,37.093762 L 221.09936,37.093762 L 221.54243,36.101286 C 221.78097,35.555426 221.90483,34.725999 221.826,34.258118 C 221.74716,33.790237 221.42302,33.092261 221.09936,32.698514 L 220.51451,31.97188 z M 223.26154,35.410098 L 222.81847,36.119009 C 222.575,36.502297 222.36245,36.987854 222.35768,37.200098 C 222.35292,37.412344 222.9319,37.672856 223.63372,37.78495 C 224.33554,37.897043 224.98667,37.93431 225.08699,37.873563 C 225.18731,37.812816 224.82566,37.244405 224.27174,36.597524 L 223.26154,35.410098 z M 219.59293,45.529801 L 218.90174,46.841286 C 218.51875,47.561803 217.11146,49.28167 215.76481,50.651682 C 214.41822,52.021695 213.15341,53.619194 212.96461,54.213959 L 212.62788,55.295048 L 213.6558,56.836929 C 214.22752,57.679439 214.85131,58.745414 215.03818,59.211781 L 215.37491,60.062474 L 217.53709,60.062474 L 217.43075,62.047424 C 217.37585,63.139147 217.22369,65.18081 217.07629,66.584454 L 216.81045,69.136533 L 218.44095,70.979701 L 218.10422,72.539305 L 221.50699,72.539305 L 221.57788,76.367424 L 223.70461,77.927028 L 226.32758,75.463563 L 226.32758,70.731583 L 225.12243,69.650493 C 224.45555,69.056284 223.54874,67.739979 223.11976,66.726236 L 222.33996,64.883068 L 221.11709,64.883068 L 220.8158,66.017325 C 220.65264,66.641167 220.33303,67.151583 220.08917,67.151583 L 219.6461,67.151583 L 219.8056,57.421781 L 217.44847,55.507722 L 217.90926,54.107623 L 219.46887,54.107623 L 220.65629,52.122672 L 222.30451,54.249405 L 225.19332,53.522771 L 225.19332,52.760692 C 225.19332,52.340817 224.61911,51.262133 223.91728,50.368118 L 222.64124,48.737623 L 222.64124,45.884256 L 219.59293,45.529801 z "},"fl18":{"name":"FL-18","path":"M 2270.6671,1438.4156 L 2270.4012,1438.4511 L 2270.5962,1439.798 C 2270.5961,1439.7979 2270.3389,1439.8111 2270.2772,1440.0993 C 2270.2154,1440.3873 2270.1365,1440.5933 2270.3835,1440.7373 C 2270.6304,1440.8813 2270.7734,1440.8614 2270.7734,1440.8614 L 2270.7911,1441.269 L 2268.7709,1442.6903 L 2269.4514,1443.9771 L 2268.8345,1444.3211 L 2268.1326,1443.1123 L 2267.5479,1443.4489 L 2266.13,1440.8614 L 2265.8465,1441.0031 L 2267.282,1443.6261 L 2266.9098,1443.8565 L 2266.8566,1446.834 L 2262.9931,1449.4924 L 2266.0059,1453.7104 L 2266.3604,1450.9279 L 2269.1251,1449.1202 L 2270.8265,1449.7759 L 2270.8265,1453.1433 L 2271.695,1453.6749 C 2271.5206,1449.6144 2271.6832,1445.5188 2271.181,1441.4817 L 2270.6671,1438.4156 z M 2263.1703,1461.7565 L 2262.7981,1463.9896 L 2260.6182,1463.9896 L 2260.6182,1466.0809 L 2263.4539,1467.3746 L 2263.4539,1470.9369 L 2260.2283,1470.2989 L 2263.1703,1479.2843 L 2263.9855,1477.6007 C 2264.432,1476.6695 2264.9986,1475.8992 2265.2616,1475.8993 C 2265.5246,1475.8992 2265.9737,1475.3076 2266.2541,1474.5701 L 2266.768,1473.2231 L 2263.2589,1466.0986 L 2264.5704,1462.6427 L 2263.1703,1461.7565 z M 2272.971,1462.3059 L 2271.9608,1462.9262 L 2271.9608,1465.691 L 2272.4925,1465.691 C 2272.7859,1465.6908 2273.1484,1465.488 2273.3077,1465.2302 L 2273.609,1464.7516 L 2272.971,1462.3059 z M 2272.1026,1470.1217 L 2269.9758,1470.5293 L 2269.4087,1474.4815 L 2267.4415,1478.0969 L 2264.9603,1478.4514 L 2264.4995,1479.8692 L 2266.8566,1479.8692 L 2266.8566,1482.8112 L 2268.1504,1482.3681 L 2269.7632,1478.1678 C 2270.6532,1475.8507 2271.5508,1473.0875 2271.7481,1472.0357 L 2272.1026,1470.1217 z M 2265.7933,1483.272 L 2265.3325,1483.9809 C 2265.0801,1484.3706 2264.8717,1485.3278 2264.8717,1486.1076 L 2264.8717,1487.5254 L 2263.5956,1487.7204 C 2262.8938,1487.82 2262.3196,1487.9907 2262.3196,1488.1103 C 2262.3196,1488.2299 2262.6133,1488.9818 2262.9754,1489.7762 C 2263.3373,1490.5707 2263.7958,1491.2118 2264.0033,1491.2118 C 2264.2107,1491.2116 2264.9203,1490.6375 2265.5629,1489.9357 C 2266.2052,1489.2337 2266.9319,1488.0217 2267.1756,1487.2419 C 2267.4193,1486.4619 2267.6356,1485.2498 2267.6719,1484.548 L 2267.7428,1483.272 L 2265.7933,1483.272 z M 2246.6172,1509.8738 L 2245.1994,1511.5752 L 2245.5716,1512.1778 C 2245.7728,1512.5033 2246.1899,1512.7627 2246.4932,1512.7627 C 2246.7965,1512.7627 2247.1917,1512.3654 2247.3793,1511.8765 L 2247.716,1510.9904 L 2246.6172,1509.8738 z M 2237.3659,1517.0693 L 2235.5228,1518.8947 L 2236.338,1520.2062 L 2238.5356,1518.239 L 2237.3659,1517.0693 z M 2231.6415,1521.181 L 2230.011,1522.5279 L 2230.3123,1523.0419 C 2230.4832,1523.3185 2230.8368,1523.5381 2231.0921,1523.5381 C 2231.3475,1523.5381 2231.8611,1523.1807 2232.2263,1522.7406 L 2232.8821,1521.9431 L 2231.6415,1521.181 z M 2219.7141,1521.1987 L 2216.6657,1521.5532 L 2216.6657,1522.652 C 2217.6917,1523.2119 2218.7397,1523.7164 2219.8381,1524.1052 C 2220.0201,1524.1098 2220.3323,1523.9476 2220.5293,1523.7508 L 2220.8838,1523.3963 L 2219.7141,1521.1987 z M 2213.0503,1522.2975 L 2211.8275,1523.0596 L 2212.4123,1523.9812 L 2210.64,1524.6724 L 2211.3489,1525.8066 L 2209.0273,1525.8066 L 2207.6094,1528.0751 L 2205.0042,1528.0751 L 2204.632,1529.0322 C 2204.4317,1529.5542 2203.7983,1530.5112 2203.2142,1531.1589 C 2202.6299,1531.8066 2201.7292,1532.7837 2201.2115,1533.3388 C 2200.6939,1533.8939 2199.5632,1534.6956 2198.6949,1535.1288 C 2197.8265,1535.5619 2196.3689,1536.097 2195.4516,1536.2985 L 2193.7679,1536.653 L 2192.4387,1538.2657 L 2193.1477,1540.1089 L 2194.1224,1539.6835 C 2194.6657,1539.4506 2196.2633,1538.878 2197.6669,1538.4075 C 2199.0706,1537.9371 2200.6018,1537.2387 2201.0697,1536.8656 C 2201.5376,1536.4925 2202.3445,1536.0372 2202.8597,1535.8554 C 2203.3747,1535.6737 2205.0974,1534.5877 2206.6879,1533.4451 L 2209.5766,1531.3716 L 2209.5766,1529.174 L 2211.9869,1530.4677 L 2214.5922,1529.2803 L 2215.2302,1530.9462 L 2217.0734,1530.0069 C 2218.0928,1529.4905 2219.3608,1528.6993 2219.8913,1528.2346 L 2220.8661,1527.3839 L 2219.1824,1524.8142 L 2215.1061,1524.1584 L 2213.0503,1522.2975 z M 2174.4501,1539.5417 L 2173.9362,1540.1798 C 2173.6509,1540.5375 2173.2474,1541.4097 2173.0323,1542.1116 L 2172.6424,1543.3876 L 2173.564,1543.3876 C 2174.0734,1543.3876 2174.981,1543.1257 2175.5844,1542.8027 L 2176.6832,1542.2179 L 2176.6832,1540.1266 L 2174.4501,1539.5417 z "},"fl17":{"name":"FL-17","path":"M 2267.6187,1432.1949 L 2262.2487,1434.4989 L 2265.7719,1440.8044 L 2266.13,1440.7123 L 2267.4947,1443.0058 C 2267.615,1443.0058 2267.8447,1442.8834 2268.115,1442.7045 L 2268.8593,1444.1223 L 2269.3024,1443.9274 L 2268.4694,1442.4564 C 2268.797,1442.206 2269.1535,1441.8963 2269.4974,1441.5526 L 2269.4087,1440.0284 L 2269.4087,1436.218 C 2269.3962,1436.2033 2269.3857,1436.1785 2269.3733,1436.1648 C 2268.9297,1435.6724 2268.5628,1434.9067 2268.558,1434.4635 C 2268.5533,1434.0201 2268.3341,1433.3229 2268.0795,1432.9216 L 2267.6187,1432.1949 z "},"ca20":{"name":"CA-20","path":"M 153.34521,756.8687 L 132.75135,770.74565 L 144.4661,789.15959 L 142.29092,799.43176 L 139.27333,799.29701 L 138.03273,800.16546 L 137.34154,803.74546 L 138.15679,804.43662 C 138.61146,804.81393 138.98976,805.43034 138.98976,805.8013 C 138.98976,806.17214 138.46712,807.02216 137.83778,807.69761 L 136.70352,808.9382 L 136.96937,812.35872 L 137.55422,812.42961 C 137.87776,812.46659 138.33047,812.46659 138.56441,812.42961 C 138.79836,812.39269 139.02464,812.67773 139.06065,813.06763 C 139.09661,813.45753 139.11197,814.35848 139.15399,814.70522 C 141.24528,817.39318 144.11165,819.79043 145.4763,822.4784 L 148.89679,823.45318 L 150.04877,827.38763 L 151.9652,827.43607 L 153.84144,830.34731 L 152.35273,832.73991 L 153.73511,834.13998 L 153.68666,835.74212 L 155.57828,836.17813 L 154.74531,841.22909 C 157.64476,843.32418 160.01746,846.04333 162.5256,848.58407 L 168.33867,849.77147 L 169.02986,852.3413 L 167.16897,857.21503 L 168.35639,858.40248 L 170.81986,857.091 L 171.49333,857.64038 C 171.86332,857.94345 173.31523,858.49175 174.71887,858.86328 L 177.27095,859.53674 L 179.2559,861.30902 L 179.2559,863.68387 L 184.25372,866.83852 L 185.60065,868.66394 C 186.34404,869.66765 187.43727,871.5863 188.02867,872.93516 L 189.10976,875.39859 C 193.22026,877.46033 197.08855,878.6986 201.58659,880.1306 L 203.23481,883.00169 L 208.09085,885.16387 L 209.296,887.78684 L 210.11125,887.78684 C 210.56353,887.78684 211.34019,887.39087 211.83035,886.9007 L 212.71649,886.01456 L 212.71649,885.14612 L 212.71649,884.29543 L 209.42006,883.03714 L 209.03016,881.01674 C 208.81822,879.90506 208.60098,877.64198 208.55164,875.98347 L 208.46303,872.9706 L 206.76164,872.01357 L 205.00709,873.32506 L 205.06026,880.1306 L 202.72085,880.46731 L 201.44481,877.68486 L 193.43412,875.69991 L 193.43412,871.83635 L 192.26441,869.63872 L 190.59729,869.63872 L 191.76818,866.23595 L 196.03936,866.23595 L 197.20907,867.40565 L 199.06996,866.69674 L 199.42441,864.62315 C 199.61582,863.48362 199.79124,862.2944 199.81431,861.98248 C 199.83734,861.67056 199.55596,860.69833 199.19402,859.82031 L 198.53828,858.22526 L 198.53828,853.26288 L 200.24675,846.33682 L 186.62857,843.37357 L 192.97332,813.40434 L 195.61402,814.06011 L 197.27996,806.12031 L 194.47976,806.12031 L 195.77352,800.44902 L 193.04422,800.44902 L 188.4363,803.7809 L 188.04639,803.391 C 187.83145,803.17776 186.98016,803.0011 186.15006,803.0011 C 185.32001,803.0011 184.51602,803.16245 184.36006,803.35555 L 184.07649,803.71001 L 175.46323,801.93773 L 178.65332,791.37496 L 184.236,791.37496 L 184.94491,788.57476 L 187.26659,787.33417 L 188.89709,788.6811 L 188.89709,790.80783 L 191.27194,790.80783 L 192.54798,794.2106 L 195.41907,794.15741 L 198.05386,789.31912 C 197.24215,787.52126 196.57578,786.45002 195.32809,784.94276 L 192.34593,786.31924 L 188.47529,784.7171 L 187.74511,782.77939 L 187.16026,780.61721 C 185.783,779.76493 185.56836,779.59088 183.17381,779.36839 L 181.54804,784.52807 L 183.79293,786.2708 L 183.79293,788.53932 L 178.68877,788.53932 L 178.68877,786.69728 L 164.56963,783.51195 L 163.30424,784.04363 L 161.64419,782.99206 L 156.57075,781.27298 L 158.18352,774.85734 L 156.09224,771.24189 L 155.596,759.70434 L 153.34521,756.8687 z "},"pa10":{"name":"PA-10","path":"M 2275.3459,409.67959 L 2206.617,427.27831 L 2211.278,441.15524 C 2209.893,442.25895 2208.3398,443.12544 2206.8296,444.06177 C 2206.8337,445.31137 2207.1213,446.55685 2207.4145,447.78355 L 2212.9794,446.43662 L 2214.5745,450.2293 L 2217.162,450.24702 L 2220.8838,456.44999 L 2220.4939,458.04504 L 2218.2608,455.65246 L 2216.0455,456.16643 L 2215.2479,453.93336 L 2209.0627,455.19167 L 2207.5031,459.87048 L 2202.8243,460.79207 L 2202.5407,462.40484 L 2201.0697,463.00742 L 2201.0697,465.8785 L 2199.3683,466.53425 L 2199.3683,468.05841 L 2206.9714,469.84841 L 2207.7335,472.18781 L 2210.2501,471.83336 L 2211.916,473.87147 L 2210.5514,474.73989 L 2210.6578,476.21088 L 2212.1465,475.04118 L 2215.0884,473.18029 L 2216.9493,472.55999 L 2216.9493,472.04603 C 2216.9493,471.7583 2217.4597,471.00392 2218.0836,470.38009 L 2219.2178,469.24583 L 2220.9192,469.24583 L 2220.9192,471.39029 L 2223.7549,473.25118 L 2223.7549,476.01593 L 2220.3521,477.78821 L 2220.3521,478.88702 L 2217.5873,478.88702 L 2217.2329,483.05187 L 2215.2479,483.65444 C 2214.1562,483.99268 2212.6888,484.6605 2211.9869,485.12543 L 2210.7109,485.9584 L 2210.7109,486.61415 C 2209.183,491.82085 2206.353,496.57201 2203.9585,501.41266 L 2206.2093,510.06137 L 2214.9644,509.37019 L 2217.2329,508.04098 L 2220.9192,508.20048 L 2222.9219,510.02593 L 2226.0234,508.94484 L 2226.0234,510.64623 L 2228.3273,510.64623 L 2228.9831,508.94484 L 2229.7451,508.94484 C 2230.1641,508.94484 2230.7009,508.62582 2230.9503,508.23593 C 2231.1997,507.84603 2232.5943,506.98158 2234.0341,506.30415 L 2236.6393,505.06355 L 2248.6199,495.01474 C 2248.2573,493.92763 2247.5702,492.96548 2246.9185,492.00187 L 2242.6296,493.3488 C 2241.6931,491.2571 2241.2182,490.51199 2240.0952,489.16623 L 2239.9889,485.23177 L 2236.8697,483.40633 L 2236.5152,480.87197 L 2233.6442,480.53524 L 2231.5883,474.75761 L 2233.4138,473.80058 C 2235.7495,470.24587 2237.3535,466.24292 2239.3509,462.49345 L 2244.5259,461.83771 L 2245.3589,468.20019 L 2249.1339,465.3291 L 2249.701,465.89623 L 2253.3696,461.27058 L 2255.7267,462.01494 L 2259.7675,457.42474 L 2263.4539,458.02732 L 2263.4539,460.7389 L 2264.5881,460.7389 L 2264.5881,456.9994 L 2265.7756,455.81197 L 2264.0033,454.3587 L 2267.4592,450.81415 L 2270.6316,444.57573 L 2273.3786,445.14286 L 2273.6622,444.50484 C 2273.6622,444.28366 2273.2752,443.67208 2272.7938,443.14019 L 2271.9077,442.16544 L 2273.5736,441.52742 L 2277.5966,446.43662 L 2273.095,449.8394 C 2273.7136,450.66199 2274.5314,451.23076 2275.4522,451.73573 L 2274.0875,453.36623 L 2271.9608,453.36623 L 2271.9785,454.07514 C 2271.9884,454.46504 2272.3439,455.23065 2272.7583,455.77652 C 2273.1727,456.32239 2273.7691,456.76899 2274.0875,456.769 L 2274.6547,456.769 L 2275.9484,461.87316 L 2278.1815,461.87316 L 2278.9613,460.02999 C 2279.385,459.01625 2280.2694,457.6087 2280.769,457.19435 L 2298.6158,450.76098 L 2298.6158,457.33613 L 2302.4085,457.33613 L 2303.4364,458.47039 C 2304.001,459.09423 2304.743,459.59577 2305.0847,459.58692 L 2305.7049,459.5692 L 2309.5685,453.189 L 2309.8521,446.47207 L 2310.5787,444.66435 C 2310.9776,443.67592 2311.6414,442.66298 2312.0497,442.41355 L 2312.7941,441.97049 L 2312.7941,440.46405 L 2315.1867,439.82603 L 2313.6448,438.17781 L 2312.1738,437.11445 L 2305.2796,437.41573 L 2303.6314,435.78524 L 2301.0439,436.44098 L 2297.4816,432.4888 C 2297.4807,432.27885 2296.7022,431.58847 2295.7625,430.96464 L 2294.0611,429.83039 L 2294.7523,426.65801 L 2293.4762,425.13385 L 2292.6078,420.1892 L 2290.1089,419.00177 L 2290.1089,417.56623 L 2288.6379,416.09524 L 2284.4376,415.599 L 2283.0552,416.50286 L 2280.6804,414.23435 L 2279.6879,411.96583 L 2277.6321,411.54049 C 2277.6321,411.3036 2277.1249,410.78018 2276.4978,410.38851 L 2275.3459,409.67959 z "},"ny14":{"name":"NY-14","path":"M 2358.1904,464.84616 L 2358.8492,465.17559 L 2358.5528,465.86738 L 2359.1787,465.96622 L 2360.3646,466.59213 L 2360.8588,465.86738 L 2361.6494,466.39447 L 2360.5623,467.54747 L 2359.4752,467.44864 L 2358.4539,469.82053 L 2357.8609,466.36153 L 2358.1904,464.84616 z "},"ny8":{"name":"NY-8","path":"M 2357.615,461.41237 L 2357.0478,466.25068 L 2357.0301,468.96227 L 2356.9947,472.15237 C 2356.9946,472.15235 2356.8938,472.60831 2356.9238,472.96761 C 2356.9536,473.32692 2357.0833,473.80058 2357.0833,473.80058 L 2357.3137,474.10187 L 2358.4834,474.8285 L 2358.8201,475.14751 L 2358.8378,476.17543 L 2358.9974,476.19316 L 2359.1746,475.99821 L 2359.4758,476.40583 C 2359.476,476.40584 2359.826,477.61098 2359.7063,477.61098 C 2359.5866,477.61097 2358.3416,477.69959 2358.3416,477.69959 L 2358.0935,477.43375 L 2357.9694,477.96543 L 2358.1644,478.4085 L 2361.6026,478.23128 L 2361.3368,477.59326 C 2361.4815,477.46261 2361.5671,477.32354 2361.5671,477.20336 C 2361.5671,476.96624 2361.1833,476.44427 2360.7164,476.05138 C 2360.71,476.046 2360.7051,476.03898 2360.6987,476.03365 L 2360.2734,474.97029 L 2357.4023,473.97781 L 2357.5795,472.04603 L 2357.7568,471.53207 L 2357.7745,471.51435 L 2357.7745,471.49662 L 2358.253,470.14969 L 2357.7745,466.67603 L 2358.1821,461.67821 L 2357.615,461.41237 z "},"ca49":{"name":"CA-49","path":"M 301.26539,1042.2656 L 297.45408,1037.3657 L 289.97831,1038.6444 L 289.4105,1036.4732 L 287.05737,1034.9878 L 284.70424,1033.5023 L 282.22095,1035.2417 L 280.01057,1035.2417 L 277.93629,1037.1189 L 277.93629,1034.6745 L 278.43877,1034.6745 L 283.47723,1029.4998 L 278.701,1024.1751 L 271.66073,1027.3527 L 267.43779,1025.0614 L 264.1832,1025.3893 L 258.11169,1012.4677 L 254.69905,1009.2799 L 255.92926,1005.751 L 258.47811,1005.751 L 260.3553,1003.6767 L 260.3553,1001.4072 L 266.71168,994.38322 L 265.30293,992.68574 L 267.39479,990.37424 L 269.80871,990.9801 L 272.89333,987.76051 L 272.10377,984.61482 L 275.95134,985.20611 L 278.29012,983.15441 L 280.04634,985.13425 L 281.77065,985.6179 L 281.19224,989.29465 L 282.50962,990.88199 L 279.07055,992.0809 C 279.33522,993.55538 279.59989,994.37465 280.30133,995.41233 L 278.53439,998.82928 C 276.64311,999.74428 274.27704,1000.5874 272.43415,1001.5978 L 276.92349,1005.9694 L 278.62229,1004.0561 L 281.62263,1004.9003 L 281.95877,1012.0752 L 303.45708,1016.1049 L 303.45708,1019.3633 L 308.25312,1024.0177 L 307.94449,1027.5854 L 305.54877,1032.4032 C 307.03532,1033.4515 308.37629,1034.3542 309.79004,1034.6745 L 309.78561,1035.9253 L 303.45708,1038.5865 L 303.45708,1041.3587 C 302.72705,1041.6845 302.0458,1042.1181 301.26539,1042.2656 z "},"nc3":{"name":"NC-3","path":"M 2338.6162,745.18942 L 2308.0267,753.14691 C 2308.0266,753.35386 2308.9185,754.24697 2309.728,754.77741 C 2310.5376,755.30784 2312.7264,756.25313 2314.6018,756.8687 C 2318.1522,757.40123 2319.9607,758.35418 2320.8579,759.52711 L 2322.7897,758.94229 L 2322.9138,760.4487 L 2324.4379,760.46645 L 2324.3848,761.42348 L 2328.0534,762.3982 L 2326.2988,764.11734 L 2330.889,764.86169 L 2331.8461,765.92506 C 2332.3766,766.5113 2333.1304,766.98843 2333.512,766.98843 C 2333.8933,766.98843 2334.4929,767.33086 2334.8412,767.75048 L 2335.4792,768.51259 L 2344.2697,768.33536 L 2348.3459,772.65971 L 2349.6929,772.65971 L 2348.8776,771.10011 C 2348.4282,770.24233 2347.589,769.02998 2347.0168,768.40625 C 2346.4444,767.78241 2345.2693,766.23239 2344.4115,764.96803 C 2343.5537,763.70356 2342.8519,762.49127 2342.8519,762.27417 C 2342.8519,762.05696 2342.4628,761.43754 2341.9835,760.89179 C 2341.5042,760.34593 2340.4834,759.09008 2339.715,758.10929 L 2338.3149,756.33701 L 2338.3149,754.08625 L 2333.8133,753.37734 L 2331.4739,750.8607 L 2331.8106,749.12387 L 2338.5984,749.12387 L 2339.715,751.67595 L 2341.0265,751.67595 L 2341.9835,753.71404 C 2342.5136,754.83112 2343.0752,755.61761 2343.2241,755.46863 C 2343.3731,755.31958 2342.4188,753.05867 2341.115,750.45305 C 2340.2966,748.79318 2339.5594,746.73297 2338.6162,745.18942 z M 2344.2697,756.69147 L 2343.8976,759.15496 L 2346.2547,760.8209 L 2346.2547,761.51206 C 2346.2547,761.89986 2346.5591,762.52535 2346.9281,762.89444 C 2347.2973,763.26358 2347.7076,763.44416 2347.8497,763.30209 C 2347.9918,763.15997 2347.2409,761.61488 2346.1838,759.86387 L 2344.2697,756.69147 z M 2350.8803,767.55556 L 2351.855,770.24942 C 2352.3891,771.73104 2353.1915,773.51744 2353.6451,774.21932 L 2354.4603,775.49536 L 2355.2401,775.49536 C 2355.6617,775.49536 2356.6567,776.0191 2357.4554,776.64731 C 2358.2541,777.27552 2359.0219,777.65073 2359.1746,777.498 C 2359.3273,777.34527 2358.2195,775.80909 2356.6934,774.07754 C 2355.1673,772.34586 2353.4005,770.17212 2352.7766,769.25694 C 2352.1528,768.34165 2351.463,767.58533 2351.2525,767.57325 L 2350.8803,767.55556 z M 2348.984,779.37662 L 2347.4776,779.74882 C 2346.6523,779.95594 2345.6577,780.39529 2345.2622,780.72355 L 2344.5356,781.32612 L 2345.723,782.74394 L 2344.376,785.70367 L 2341.6645,785.70367 L 2340.0517,781.87556 L 2338.2263,781.16664 L 2335.5855,781.82236 C 2334.1264,782.1792 2332.0339,782.92247 2330.9422,783.4706 C 2329.8505,784.01879 2327.8221,785.50376 2326.4406,786.78473 L 2324.3139,789.15959 L 2326.3166,792.34968 L 2325.0937,797.20572 L 2326.7419,803.0011 L 2304.7125,808.1584 L 2298.3323,812.71318 L 2288.5316,809.89523 L 2287.5568,812.34097 L 2289.2582,812.89041 L 2289.4,815.42473 L 2290.0558,815.65516 C 2290.4127,815.77414 2291.0118,816.18588 2291.4027,816.57674 C 2291.7934,816.96755 2292.6519,817.57716 2293.299,817.92367 L 2294.4687,818.54394 L 2296.8436,816.878 L 2299.3248,820.95424 L 2296.8968,823.50632 L 2301.1679,826.55463 L 2302.7984,823.13417 L 2307.7608,823.13417 L 2319.1743,826.02295 L 2320.3794,824.92414 C 2321.0402,824.32032 2322.2253,823.63664 2323.0024,823.39998 C 2323.7794,823.16326 2325.5586,822.8907 2326.9546,822.79741 L 2329.4889,822.63793 L 2330.6941,823.63041 L 2332.9449,823.06328 C 2334.1819,822.74795 2336.0889,822.37904 2337.1806,822.24803 C 2338.2723,822.11708 2340.0838,822.01188 2341.2037,822.01761 L 2343.2418,822.03536 L 2347.3535,818.27813 L 2346.68,815.6906 L 2349.0903,815.07028 L 2349.0903,810.72823 L 2350.2246,810.01932 L 2350.2246,807.21912 L 2351.9259,806.56335 L 2351.9259,804.98605 L 2354.2299,802.68209 L 2355.3465,803.35555 L 2357.5795,802.64664 L 2359.3873,798.83622 L 2358.0935,796.40823 L 2359.3695,794.86632 L 2357.0301,790.02803 L 2357.0301,787.54684 L 2351.855,780.88308 L 2348.984,779.37662 z M 2361.0709,779.78427 C 2360.9543,779.89248 2361.0576,780.44781 2361.3013,781.00711 C 2361.545,781.56641 2361.7135,782.40015 2361.6735,782.86803 L 2361.6026,783.71872 L 2361.9216,782.97437 L 2362.2583,782.23001 L 2363.0736,783.39971 C 2363.5258,784.04539 2364.1519,784.56942 2364.456,784.56942 L 2365.0053,784.56942 L 2363.1445,782.08823 C 2362.1209,780.71884 2361.1874,779.676 2361.0709,779.78427 z M 2357.6327,780.03239 L 2355.0451,780.12097 L 2355.7541,780.40454 C 2356.14,780.5605 2357.2247,781.3699 2358.1644,782.19457 L 2359.8657,783.68328 L 2359.8657,785.61503 C 2360.5752,785.83718 2361.3014,785.91538 2362.0279,785.95179 C 2362.1242,785.88697 2361.8336,784.95756 2361.3899,783.89595 L 2360.5924,781.96414 L 2357.6327,780.03239 z M 2368.9576,789.39001 L 2368.9576,790.2584 C 2368.9523,790.73484 2369.3439,791.70713 2369.8437,792.42058 L 2370.7653,793.71437 L 2371.3501,793.12949 L 2370.1627,791.25087 L 2368.9576,789.39001 z M 2373.6895,800.6085 C 2373.5414,800.75663 2373.6085,802.24863 2373.8313,803.92268 L 2374.2389,806.971 L 2374.4871,806.22664 C 2374.6243,805.81723 2374.557,804.32523 2374.3453,802.91246 C 2374.1334,801.49974 2373.8377,800.46036 2373.6895,800.6085 z M 2374.7352,808.10526 L 2374.7706,812.64229 L 2375.0187,811.36625 C 2375.1544,810.6608 2375.143,809.63991 2375.001,809.09773 L 2374.7352,808.10526 z M 2250.3213,812.78407 C 2246.8641,816.00632 2243.0707,819.01857 2239.0673,821.94671 C 2240.9342,822.41584 2242.1708,826.16207 2243.5335,828.52189 L 2247.3793,829.86882 L 2245.3235,839.86446 L 2245.5184,841.90256 C 2245.6217,843.02553 2245.8812,844.23725 2246.1033,844.59642 L 2246.5109,845.25219 L 2245.1817,845.76612 C 2244.4482,846.04498 2243.5056,846.68362 2243.0904,847.18394 C 2242.6751,847.68432 2242.0109,848.08783 2241.6194,848.08783 C 2241.2279,848.08783 2240.5693,848.48811 2240.1661,848.97397 L 2239.4395,849.86011 L 2242.3283,852.74889 L 2245.0399,853.24513 L 2247.7515,853.75912 L 2251.296,857.72902 L 2255.4077,857.69357 L 2256.5597,859.51899 L 2264.9249,860.63555 L 2269.5505,856.43523 L 2271.9608,861.02545 L 2271.2519,864.53456 L 2269.6923,864.53456 L 2269.6923,865.13714 C 2269.6923,865.46959 2269.9541,866.2351 2270.2772,866.83852 L 2270.862,867.93734 L 2272.5279,867.93734 L 2272.5279,870.1881 L 2269.6923,872.03127 L 2269.6923,874.24664 L 2270.9683,873.85674 C 2271.6701,873.63891 2272.4557,873.11403 2272.7051,872.68704 L 2273.1482,871.90724 L 2277.508,871.90724 L 2278.3055,877.29496 L 2287.2556,890.95919 L 2290.3925,892.18209 L 2295.4966,887.00704 C 2298.3039,884.16317 2301.494,880.8031 2302.5857,879.54572 L 2304.5707,877.25951 L 2307.7431,875.20367 C 2309.4894,874.07168 2312.6794,872.32935 2314.8322,871.32236 C 2316.9849,870.31536 2320.1526,868.98533 2321.8681,868.38038 L 2324.9873,867.28156 L 2332.3954,867.29932 L 2335.4792,868.46902 L 2335.4792,870.70209 L 2336.4717,871.32236 L 2337.0566,866.98031 L 2340.991,857.16189 L 2339.0061,857.16189 L 2338.3149,855.35417 L 2340.2644,852.05773 L 2341.6467,852.05773 L 2342.0012,850.78169 C 2342.1978,850.07987 2342.6326,848.92832 2342.976,848.22961 L 2343.5962,846.97127 L 2341.6113,844.75595 L 2342.2848,843.67483 L 2341.3809,843.32038 C 2340.8893,843.13175 2340.0582,842.99099 2339.5377,843.00137 L 2338.5984,843.01912 L 2339.8745,844.08248 C 2340.5763,844.66793 2341.1505,845.39431 2341.1505,845.69523 L 2341.1505,846.24466 L 2337.6946,846.93582 L 2335.4792,845.55345 L 2333.7247,841.84942 L 2332.6436,841.84942 L 2332.6436,845.89021 L 2326.5469,848.67265 L 2324.6861,847.96374 L 2323.9949,845.19899 L 2324.8278,844.24196 C 2325.2804,843.70869 2326.0798,842.3325 2326.6001,841.19364 L 2327.5394,839.12011 L 2327.5394,837.50731 C 2327.5441,836.61867 2327.9229,834.87362 2328.3724,833.62605 C 2328.8219,832.37837 2329.2094,830.7963 2329.2231,830.11694 L 2329.2408,828.89404 L 2327.3799,827.01543 L 2325.0405,827.31674 C 2323.7609,827.48064 2322.5456,827.61982 2322.3289,827.63575 L 2321.939,827.6712 L 2322.1517,834.03364 L 2312.1738,837.86176 C 2304.7212,834.15813 2300.4773,832.38563 2291.4204,829.60295 L 2291.5799,824.58744 L 2288.2657,823.09872 L 2288.8861,819.25285 L 2287.1315,818.57939 L 2285.0402,820.54664 L 2283.6047,819.21741 L 2281.7615,820.13899 L 2280.8754,823.7013 L 2277.7562,823.7013 L 2276.9941,818.8807 L 2274.4774,817.01978 C 2273.0918,815.99634 2271.6089,815.02179 2271.181,814.85761 L 2270.4012,814.55635 L 2269.7632,816.02731 L 2270.4189,816.82486 L 2267.1934,821.02513 L 2266.1832,821.291 C 2265.6215,821.43789 2265.1552,821.74209 2265.1552,821.94671 C 2265.1552,822.15133 2266.06,822.79106 2267.1579,823.38229 L 2269.1429,824.46335 L 2272.3507,821.39734 L 2273.8749,823.61265 C 2274.7182,824.8296 2275.3788,826.04893 2275.3281,826.32427 C 2275.2774,826.59955 2275.2557,827.12783 2275.2927,827.49397 C 2275.3296,827.85988 2276.027,828.9444 2276.8346,829.90427 L 2278.3055,831.6411 L 2280.5032,831.6411 L 2280.1842,828.57503 L 2283.3743,827.42308 L 2283.8882,828.25602 C 2284.177,828.71256 2284.4329,829.68927 2284.4376,830.4182 L 2284.4376,831.74744 L 2287.7518,832.98803 L 2286.1745,836.03635 L 2294.3624,840.13028 L 2297.8183,840.14803 L 2300.0337,842.18612 C 2301.2519,843.30189 2302.7337,844.46394 2303.3124,844.77364 L 2304.358,845.34077 L 2301.4515,849.1512 L 2301.4515,850.00189 C 2301.4515,850.47215 2301.6706,850.99346 2301.93,851.15384 L 2302.3908,851.43741 L 2303.8263,859.41265 L 2306.0949,858.20751 L 2305.3505,855.30097 L 2311.6421,855.93899 L 2313.0776,852.90842 L 2316.764,852.55397 C 2316.7626,855.19186 2316.9692,856.52245 2317.4729,858.86328 L 2314.0701,858.86328 L 2312.6523,860.56466 L 2313.4853,861.8584 L 2312.7764,863.68387 L 2302.6744,867.47654 L 2300.0691,866.98031 L 2300.6008,865.40295 L 2295.4966,860.56466 L 2292.3243,860.72414 L 2290.3216,862.47872 L 2286.139,861.50394 L 2286.139,857.091 L 2284.9516,854.85793 L 2286.3694,850.92347 L 2287.8404,850.92347 L 2287.8404,849.89555 C 2287.8404,849.3341 2288.1102,848.61554 2288.443,848.28275 L 2289.0455,847.68018 L 2281.5843,844.68506 L 2274.7787,844.64961 L 2274.0521,841.84942 L 2271.4646,841.84942 L 2270.7556,839.5809 L 2268.6289,839.5809 L 2268.2745,839.01377 C 2268.0817,838.70185 2267.7119,838.44664 2267.4592,838.44664 L 2266.9984,838.44664 L 2266.325,842.66466 L 2269.2315,845.71298 L 2268.5226,847.94605 L 2263.0463,848.65496 L 2261.6639,840.16572 L 2258.3497,841.88486 L 2258.3497,844.52553 L 2254.9647,845.67753 C 2254.9131,847.97594 2254.7426,850.15547 2254.0077,852.39444 L 2249.8428,848.44229 L 2249.8428,845.9611 L 2251.9873,845.39397 L 2250.7112,840.59107 L 2254.0962,837.87951 L 2254.9469,838.21622 C 2255.4148,838.40246 2256.0528,838.66062 2256.3648,838.78335 C 2256.6767,838.90613 2257.2747,838.78477 2257.694,838.51753 L 2258.456,838.03899 L 2256.6129,834.47674 C 2258.0412,834.39145 2259.0075,834.22204 2260.0156,833.5906 L 2258.2788,826.99773 L 2260.2106,825.57991 L 2257.0914,821.6277 C 2256.0193,821.98063 2255.4482,822.76814 2254.3267,822.93919 L 2250.4099,822.8683 C 2250.4099,822.66011 2251.0654,821.64568 2251.8632,820.59978 L 2253.3164,818.68572 L 2251.81,815.74374 L 2250.3213,812.78407 z M 2375.5504,813.20942 L 2375.1073,818.03001 L 2371.7754,819.76684 L 2371.7754,820.88335 L 2369.8082,821.82268 L 2367.8587,822.76196 L 2367.5574,823.50632 C 2367.3976,823.92299 2367.3718,824.26843 2367.4865,824.26843 C 2367.6014,824.26843 2369.0189,823.3752 2370.6412,822.28348 L 2373.5832,820.29852 L 2375.7453,820.29852 L 2375.5504,813.20942 z M 2365.1117,824.83555 L 2363.6939,826.53694 L 2364.2255,826.53694 C 2364.516,826.53694 2365.2504,826.16184 2365.856,825.70394 L 2366.9548,824.871 L 2365.1117,824.83555 z M 2362.3469,827.72434 C 2362.0664,827.71952 2360.7974,828.74545 2359.4049,830.11694 L 2356.7111,832.77536 L 2356.0199,832.77536 C 2355.6406,832.77536 2355.3287,832.99398 2355.3287,833.25384 C 2355.3287,833.51381 2355.5022,833.90581 2355.7186,834.12229 L 2356.1085,834.51219 L 2359.3873,831.26889 C 2361.1902,829.48476 2362.5374,827.89697 2362.3824,827.74209 C 2362.3727,827.73239 2362.3656,827.72468 2362.3469,827.72434 z M 2352.6348,836.74526 C 2352.4009,836.7465 2351.2138,838.6938 2349.9942,841.06961 C 2348.7745,843.44537 2346.9241,846.62657 2345.8825,848.14097 C 2344.8408,849.65537 2343.9925,851.08959 2344.0039,851.33107 C 2344.015,851.57255 2344.6632,851.00849 2345.4394,850.07278 C 2346.2155,849.13702 2347.7815,846.71249 2348.9131,844.68506 C 2350.0448,842.65757 2351.438,840.32021 2352.0146,839.49226 C 2352.5909,838.66431 2353.0602,837.70728 2353.0602,837.36553 C 2353.0602,837.02377 2352.8688,836.74384 2352.6348,836.74526 z "},"ca52":{"name":"CA-52","path":"M 283.95344,1065.9706 L 282.33443,1064.7324 L 280.6774,1064.7324 L 282.66513,1059.0202 L 278.93104,1055.9029 L 277.0856,1052.019 L 270.20312,1049.902 L 270.48303,1048.8946 L 274.14271,1047.2413 L 274.65801,1041.6316 L 278.42376,1038.7307 L 278.22705,1037.2919 L 280.26254,1035.8088 L 282.95941,1035.8088 L 284.84477,1033.9234 C 285.99417,1034.9765 286.92635,1035.5317 288.68004,1036.3358 L 289.04096,1037.7737 L 289.40182,1039.2116 C 291.97516,1039.1522 294.36177,1038.7817 296.9351,1038.0999 C 298.33472,1040.0879 299.23639,1041.4537 301.13396,1042.9438 C 302.28033,1042.3857 303.2522,1042.1535 304.16004,1041.2534 L 303.90492,1039.1077 L 310.26263,1036.237 L 310.26263,1034.1074 L 309.64315,1034.1074 C 309.30248,1034.1074 308.42587,1033.6371 307.69518,1033.0624 L 306.36668,1032.0174 L 308.37437,1028.716 L 309.04489,1023.7168 L 304.02421,1018.8372 L 304.02421,1016.1835 L 331.02549,1021.0296 L 327.81725,1041.7333 L 326.32123,1042.5971 L 324.89154,1051.6884 L 318.07012,1051.6884 L 318.66861,1053.9769 L 316.82624,1055.8192 L 316.93495,1065.8666 L 316.18436,1065.8666 C 315.77149,1065.8666 315.27905,1065.6163 315.08991,1065.3104 L 314.74618,1064.7541 L 312.64616,1064.8993 C 311.4912,1064.9792 310.29099,1065.1953 309.97906,1065.3795 L 304.02421,1065.7641 L 304.02421,1064.7656 C 301.65692,1063.6789 299.32248,1062.4924 296.77654,1061.9054 C 296.23992,1061.9102 294.98456,1062.365 294.63072,1062.5942 L 294.05602,1065.0159 L 286.39167,1064.016 L 283.95344,1065.9706 z "},"nd":{"name":"ND At-Large","path":"M 982.15351,305.34701 C 986.02951,237.61191 986.50321,182.94335 990.01381,118.2581 C 1086.4729,122.07516 1175.094,121.85443 1270.1279,119.73357 L 1271.4229,123.64287 C 1272.1351,125.79298 1272.9243,128.44539 1273.1768,129.53711 C 1273.4293,130.62883 1274.314,133.20094 1275.1429,135.2529 C 1275.9718,137.30485 1276.6499,139.24351 1276.6499,139.56101 L 1274.831,143.78439 L 1274.8297,145.87659 C 1274.8289,147.0273 1275.1268,151.2865 1275.4916,155.34147 C 1275.8564,159.39644 1276.1077,163.99018 1276.05,165.54978 C 1275.9923,167.10939 1275.9315,169.02345 1275.915,169.80325 L 1275.8849,171.22107 C 1276.6987,173.10389 1277.5339,174.97652 1278.4439,176.81484 C 1278.7544,177.39605 1279.1245,178.41688 1279.2666,179.08335 C 1279.4087,179.74983 1279.6475,181.16685 1279.7974,182.23228 L 1280.7702,185.01331 C 1281.1554,185.47744 1281.4874,186.26457 1281.5079,186.76249 C 1281.5285,187.26041 1282.0097,188.68864 1282.5773,189.93632 C 1283.145,191.184 1284.24,193.60848 1285.0109,195.32404 C 1285.7817,197.03961 1286.6456,198.95366 1286.9307,199.57751 C 1287.2158,200.20135 1287.5653,201.33105 1287.7075,202.08795 L 1289.1268,204.62495 L 1290.0118,217.95359 L 1291.8542,243.3029 L 1294.3692,247.21632 L 1293.1171,253.45473 L 1294.1633,258.4856 L 1293.6763,263.44575 L 1295.7783,267.86442 L 1297.0231,275.35861 L 1298.7837,278.43592 L 1302.4631,282.86607 L 1302.8269,286.43499 L 1304.5605,295.98939 L 1304.6416,301.51894 L 1304.7228,307.04849 C 1196.4871,309.80656 1087.3014,309.71443 982.15351,305.34701 z "},"nm3":{"name":"NM-3","path":"M 713.06579,847.18394 C 709.88159,884.54179 706.31361,920.13575 702.11312,957.54367 L 705.48044,957.54367 L 707.58948,960.94644 C 710.00624,960.82649 710.31828,960.28137 711.27582,959.61721 L 713.68611,962.0275 L 713.7747,966.0506 C 715.28485,965.49754 716.79857,964.94719 718.31173,964.40235 L 723.41589,964.38466 L 725.50717,965.97971 L 728.23648,964.73912 L 728.23648,962.98453 C 728.23648,962.01877 727.98547,960.33474 727.66935,959.24506 L 727.08453,957.26011 L 727.75799,954.1409 C 738.18137,954.42072 767.93549,957.47278 767.93549,957.47278 L 767.93549,954.65483 L 773.27007,954.99159 L 773.94354,957.82723 L 793.08413,959.38684 L 794.71463,964.91634 L 818.28591,966.93674 L 818.87074,968.88624 L 820.00499,968.88624 L 819.45562,966.77721 L 825.21549,966.01515 L 825.21549,965.57206 C 825.21549,965.33324 824.9731,964.88657 824.66611,964.57958 L 824.09898,964.0302 L 827.07641,959.82988 L 829.75252,960.50334 L 829.75252,959.38684 L 837.63918,958.62473 L 838.40123,953.46743 L 843.38136,954.31813 L 842.637,967.50387 L 847.33351,969.6306 L 847.33351,973.9904 L 845.06499,973.9904 L 845.06499,979.50216 L 889.54915,982.14288 L 889.99225,971.01298 L 949.52301,974.22077 L 947.30769,1012.5552 L 956.71846,1012.5552 L 955.37153,1045.4486 L 960.75925,1045.4486 L 960.01489,1061.8245 L 966.14701,1062.1789 L 965.91661,1071.9796 L 976.63881,1072.6708 L 976.63881,1078.3066 L 999.14681,1078.9092 L 1005.5624,895.72664 L 1007.8309,895.72664 L 1008.5753,865.79285 C 908.9196,862.19102 811.56555,854.8315 713.06579,847.18394 z "},"co4":{"name":"CO-4","path":"M 868.8844,608.72407 L 868.8844,611.94962 L 871.15291,614.37761 L 871.15291,616.13219 L 872.28717,616.13219 L 872.28717,617.6918 L 874.16578,619.2514 L 875.84948,622.93774 C 876.77889,624.96522 877.90957,628.02766 878.36611,629.74328 C 878.82242,631.45885 879.48046,634.06066 879.81938,635.52091 L 880.43965,638.17932 L 882.49549,638.711 L 882.49549,641.01496 L 884.88809,641.77702 L 884.25007,644.96711 L 886.05779,648.74209 L 889.40737,651.89675 L 890.22262,654.98051 L 913.08499,656.39833 L 910.81648,661.69741 L 911.54314,662.1582 C 911.94444,662.41284 912.42497,662.63187 912.6242,662.63675 C 912.82343,662.64151 913.1531,663.49646 913.35086,664.55081 L 913.70532,666.46486 L 922.88571,662.49496 L 925.57957,665.75595 L 924.39212,673.30585 L 981.99111,676.05286 L 978.69471,747.58196 L 962.67331,746.76672 L 960.59977,791.44585 L 962.15941,791.58763 L 963.34681,791.46355 L 964.55191,792.70414 L 967.86611,792.84592 C 969.22921,792.97937 971.00211,793.3332 971.81821,793.64348 C 973.42281,794.01636 974.84351,794.21945 976.67431,794.2106 L 980.04161,794.2106 L 980.04161,797.04625 L 983.21401,797.0285 L 982.22151,799.84645 L 983.21401,801.65417 L 985.64201,801.01615 L 986.40411,802.23899 L 983.40891,805.37595 L 984.15331,810.37377 L 986.49271,814.62724 L 988.37131,814.62724 L 989.39921,813.49298 C 989.96381,812.86914 990.68591,812.35872 990.99431,812.35872 L 991.54371,812.35872 L 990.94111,824.26843 L 1006.9802,824.28612 L 1005.1371,864.42823 L 1055.3811,866.23595 L 1060.5658,617.06024 C 992.94311,616.2121 933.53372,612.13513 868.8844,608.72407 z "},"az1":{"name":"AZ-1","path":"M 542.20054,827.51166 L 541.88153,827.81298 L 539.65044,834.63327 L 541.73975,835.38058 L 541.36757,839.86446 L 536.38748,839.95305 L 533.02015,846.58137 L 533.92559,852.97654 L 533.51639,855.17694 L 531.53144,856.59476 L 532.11629,858.43793 C 532.43995,859.44963 532.72813,861.30652 532.77203,862.54961 L 532.86064,864.80038 L 539.53858,867.79102 L 539.84342,870.86156 C 539.43463,871.58318 538.36176,872.851 537.45084,873.67951 L 535.7849,875.18592 L 539.38262,877.04684 L 539.43579,878.99635 L 540.09291,878.98926 L 542.12945,876.268 L 544.70142,879.2393 L 545.05391,879.84704 C 545.33826,879.99738 545.59877,880.20155 545.86916,880.41417 L 546.41856,880.87496 C 547.09133,881.49319 547.73362,882.22461 548.36807,882.8776 C 549.05775,883.58742 549.73213,884.19102 550.35302,884.4904 C 550.35637,884.49199 550.3674,884.48853 550.37074,884.4904 C 552.23489,884.88989 553.97204,885.76094 555.68757,886.63483 L 558.48777,887.98176 C 560.3424,888.75952 562.2195,889.22735 564.2654,888.83246 L 571.30057,880.98249 L 568.90859,878.30768 L 568.87332,875.46949 L 566.6048,872.5807 L 567.24282,870.93246 L 570.1848,869.58552 L 570.64559,870.31219 C 570.89252,870.71167 571.23507,872.05327 571.4254,873.30731 C 571.61567,874.5614 572.05168,876.29539 572.38242,877.15318 L 572.985,878.71278 L 577.94738,878.62414 L 577.94738,880.9813 L 581.88183,880.9813 L 585.88718,882.89535 L 585.97582,884.91575 C 586.02431,886.02761 586.01229,887.57785 585.94037,888.35397 C 585.86846,889.13008 585.51406,890.10776 585.16057,890.53384 C 584.80697,890.95992 583.92724,891.53749 583.21107,891.80988 L 581.91728,892.30612 L 580.00322,896.29377 L 577.87648,896.29377 L 578.67404,897.56981 L 584.09721,896.93179 L 585.46183,898.56229 L 589.28995,898.56229 L 589.28995,896.40011 C 591.1228,895.284 592.95077,894.15921 594.81945,893.10367 C 595.5168,892.71774 596.64221,891.99459 597.33609,891.50862 C 597.7079,891.2482 598.12564,890.85098 598.50579,890.4275 L 602.95423,891.22506 L 605.41767,889.48823 L 609.58255,889.48823 L 610.36235,882.08011 L 613.96005,880.57364 L 615.12975,881.61932 C 615.77367,882.20187 616.59929,882.68268 616.95522,882.68268 L 617.59324,882.68268 L 617.9477,880.76862 C 618.14557,879.71371 618.79176,878.0548 619.38322,877.08229 L 620.46433,875.31001 L 623.37087,875.31001 L 626.47232,877.61397 L 630.45998,878.25199 L 634.87292,876.40882 L 635.88314,878.21654 L 636.55661,877.66711 C 636.92133,877.3671 638.42071,876.93126 639.90619,876.71008 L 642.6178,876.32018 L 643.23807,875.31001 L 645.43569,875.31001 L 645.43569,878.50011 L 639.05549,887.46783 L 638.48836,891.70354 L 636.52116,893.49357 L 633.36651,892.28842 L 629.60928,894.8582 L 628.95351,897.48117 L 629.62698,898.56229 L 631.70057,898.56229 L 632.39173,900.33456 L 633.52599,899.62565 L 633.52599,897.55206 L 634.92612,896.64823 C 635.69497,896.1445 636.65172,895.73725 637.05285,895.74434 L 637.77945,895.76209 L 639.56948,899.41298 L 644.35463,899.76743 L 645.01034,901.45107 L 642.97225,902.93978 L 649.01569,904.33991 L 651.24876,904.32216 C 651.60571,903.96521 652.11011,903.66644 652.36532,903.66644 L 652.82611,903.66644 L 652.5248,908.3984 L 656.47701,908.48704 L 656.81371,910.24156 L 655.13008,914.28236 L 647.65107,918.00414 L 646.83582,919.59919 C 646.38234,920.47602 646.00282,921.43555 646.00282,921.74367 L 646.00282,922.3108 L 652.80836,921.22968 L 652.80836,917.22434 L 655.59087,914.44189 L 658.63918,914.44189 L 657.91252,925.60724 L 653.90718,925.69582 C 651.70416,925.73654 649.66335,925.90452 649.37015,926.08572 L 648.83846,926.42248 L 649.40559,927.48585 C 649.71836,928.07022 649.97272,928.84889 649.97272,929.22268 L 649.97272,929.91384 L 643.18493,928.49602 L 642.42282,930.48097 L 644.49641,932.00513 L 643.87609,932.64315 L 621.5277,930.33919 L 619.73767,932.11146 L 612.82579,931.34941 L 611.78018,930.35694 L 612.71945,929.29357 C 613.24235,928.71578 613.67648,927.68803 613.67648,927.50354 L 606.19747,926.77694 L 609.47621,891.79219 L 605.73668,891.79219 L 605.73668,896.25832 L 602.42255,897.97741 L 602.05035,900.54724 L 597.51332,901.13206 L 598.08044,904.76526 L 595.93602,905.50961 L 594.69542,903.87912 C 594.14071,903.03262 593.49186,901.69074 593.25985,900.88394 L 592.8345,899.41298 L 591.38124,902.33721 L 589.09503,904.05634 L 588.15569,902.49674 L 585.07193,903.20565 L 576.37008,898.8813 L 575.18262,897.00268 L 575.96242,891.47318 L 579.02849,891.11872 L 579.71965,888.9211 L 581.10203,888.9211 C 581.86079,888.9211 582.4844,888.76826 582.4844,888.58434 L 579.93233,886.17404 L 581.13747,884.93345 L 577.36255,882.00922 C 576.82945,882.12599 576.36259,882.24979 576.10421,882.36367 L 575.12948,882.80671 L 574.75728,881.83199 C 574.52016,881.8929 574.29042,881.97587 574.06612,882.08011 C 572.58132,882.76957 571.39443,884.62725 571.03549,885.96137 C 570.24446,889.2599 568.01304,891.36712 565.32876,892.12889 C 562.59648,893.08042 559.4669,891.94911 557.01678,890.39206 C 553.72116,890.17218 551.18077,888.46371 548.77569,886.56394 C 546.72283,884.94241 544.74861,883.18879 542.48411,882.02691 L 541.19035,882.94849 L 540.42827,890.05535 L 533.78223,890.05535 L 533.07332,887.78684 L 529.74144,887.78684 L 529.74144,883.90552 L 522.36876,883.12572 L 522.36876,880.41417 C 520.85382,880.40804 519.32938,880.37214 517.83173,880.55595 C 517.13028,886.78245 516.13495,893.58743 515.49233,899.82057 L 490.21965,916.51542 L 477.44154,1007.4864 L 506.77272,1011.474 L 529.20975,1021.6469 L 531.30104,1020.2114 L 531.93906,1018.6695 L 537.89391,1012.626 L 558.38144,1018.1378 L 562.81213,1018.7581 C 565.25209,1019.0926 568.36523,1019.3607 569.72401,1019.3607 L 572.1875,1019.3607 L 574.01292,1021.1861 L 573.51668,1021.8241 C 573.23907,1022.181 572.87322,1023.0538 572.70143,1023.7559 L 572.38242,1025.032 L 574.2079,1025.032 L 574.42057,1030.8982 L 575.67886,1030.8982 L 575.35985,1032.316 C 575.06801,1032.5262 574.76919,1033.303 574.68639,1034.0528 L 574.52691,1035.4175 L 575.3953,1036.3923 C 575.8777,1036.9253 576.38794,1037.8756 576.51186,1038.519 C 576.63549,1039.1623 577.18686,1040.4206 577.7347,1041.3015 C 578.28255,1042.1825 579.22313,1043.4705 579.84374,1044.1726 C 580.46412,1044.8744 581.19895,1045.4486 581.45648,1045.4486 C 581.71402,1045.4486 581.91728,1045.1682 581.91728,1044.8283 C 581.91728,1044.4884 582.49149,1043.7299 583.19332,1043.1447 C 583.89514,1042.5591 584.75071,1042.0739 585.08968,1042.0635 L 585.70995,1042.0458 C 587.03176,1046.6688 588.79564,1051.1923 589.76849,1055.9051 L 578.05371,1054.7708 L 577.27391,1064.4474 L 572.34698,1069.0199 L 572.985,1073.7873 L 571.10639,1076.6761 L 563.76916,1075.914 L 563.76916,1078.8383 L 562.6349,1079.5472 L 562.6349,1081.6562 L 559.03718,1082.4538 L 556.11292,1085.1831 L 553.84441,1084.8641 L 552.76332,1082.4006 L 543.3348,1081.6031 L 543.03351,1081.1068 C 542.86377,1080.8322 542.37126,1080.6106 541.95243,1080.6106 L 541.19035,1080.6106 L 540.41054,1087.3275 L 537.68124,1088.001 L 537.68124,1090.234 C 542.03079,1091.1982 546.45356,1091.7499 550.79609,1092.7507 L 550.05173,1097.6422 L 547.88955,1098.7942 L 547.88955,1099.8043 C 547.88955,1100.3548 547.65979,1101.0499 547.37559,1101.3462 L 546.86163,1101.8779 L 546.08183,1110.4557 C 572.36382,1114.2458 579.27548,1114.769 590.99134,1115.3649 L 590.99134,1112.4407 L 593.50797,1110.6684 L 596.13094,1110.6684 L 597.21206,1113.5395 L 598.93114,1114.1952 L 598.93114,1116.3397 L 613.49926,1117.8639 L 613.00302,1123.0389 L 684.56757,1130.5179 C 697.00918,996.02182 702.32148,945.63414 711.52394,847.0776 C 652.03055,840.80998 608.30152,835.86938 542.20054,827.51166 z "},"de":{"name":"DE At-Large","path":"M 2304.9429,542.38771 C 2298.6078,542.32568 2292.0756,548.15692 2293.937,554.56325 L 2317.402,626.34051 L 2346.8041,619.14506 C 2344.9492,614.13743 2342.5439,607.80442 2340.7606,602.80467 L 2339.9808,600.53615 L 2335.1956,600.5184 L 2327.0609,594.54586 L 2326.3697,591.4089 L 2325.0405,589.97338 C 2324.3082,589.18348 2322.9751,588.23734 2322.0808,587.86434 L 2320.4503,587.17318 L 2318.3413,580.42078 L 2318.9616,578.80804 L 2318.1641,577.76236 C 2317.7276,577.18616 2317.3587,576.27013 2317.3488,575.72427 L 2317.3311,574.7318 L 2315.5234,574.7318 L 2314.9385,572.46328 L 2314.3182,572.46328 C 2313.984,572.46323 2312.8706,571.88906 2311.837,571.18724 L 2309.9584,569.9112 L 2309.3381,568.01484 L 2305.4568,565.71088 L 2304.7125,562.73345 L 2305.8467,561.5992 L 2304.234,558.33821 L 2302.0186,557.64702 L 2302.0186,554.47464 L 2303.1529,553.02137 C 2303.7767,552.22829 2304.2978,551.37005 2304.3049,551.10731 C 2304.3119,550.84459 2304.775,550.01266 2305.3505,549.26415 L 2306.4139,547.89949 L 2305.829,545.73731 L 2307.2291,543.13207 L 2307.619,542.79533 C 2306.747,542.53066 2305.8479,542.39657 2304.9429,542.38771 z "},"nv3":{"name":"NV-3","path":"M 465.40953,829.11953 L 461.04973,830.62594 L 457.80649,829.27901 L 453.92518,829.65121 C 451.79476,829.85606 449.29587,830.3101 448.36023,830.66138 C 447.42446,831.01261 446.02071,831.73553 445.24102,832.27418 C 444.46122,832.81267 443.01997,833.4216 442.03322,833.62112 L 440.2255,833.97557 L 439.48115,831.60072 L 437.47844,832.22099 C 436.44503,831.37279 435.0209,830.5652 433.85029,829.93478 L 435.59983,833.30211 L 432.94141,839.2924 L 422.16597,847.53346 L 420.69501,850.29821 L 421.29758,854.7998 L 418.23151,857.72408 L 410.64617,857.72408 L 410.64617,858.04309 C 410.64617,858.21959 410.91192,858.88477 411.24874,859.51406 L 411.86907,860.66606 L 410.82339,861.81802 C 410.25269,862.45899 408.9445,863.3504 407.91686,863.78527 L 405.38286,864.74865 L 403.2558,859.9926 L 397.10597,859.9926 L 396.41481,858.89379 L 397.61996,856.64297 L 402.06835,855.43782 L 402.79501,853.1693 L 395.33369,842.12805 L 395.33369,839.84178 L 387.11033,831.67161 C 382.7435,831.16114 378.39619,830.2205 373.99547,830.11201 C 372.40793,837.71431 371.08435,845.38161 369.8129,853.04527 L 372.2055,853.18706 L 371.4434,859.28369 L 375.07659,860.01029 L 382.89231,866.39049 L 380.996,869.26158 C 381.82389,869.90397 382.64892,870.51057 383.67211,870.76804 L 388.81171,869.66923 L 389.94597,871.0693 L 400.82775,871.05161 L 402.61778,869.5629 L 403.84062,871.83141 L 408.66122,872.55802 C 409.7856,872.10879 410.91597,871.65968 412.09943,871.4592 L 413.03877,879.66488 L 409.51191,881.11814 L 409.51191,883.24488 C 408.73704,883.191 407.36681,883.73924 406.67515,884.06954 L 405.57745,887.90594 C 406.39148,888.03207 407.12557,888.33888 407.81052,888.72118 L 404.40775,895.70396 L 404.4255,896.69643 L 406.07369,899.86884 L 405.47112,900.82587 L 401.80253,900.82587 L 397.38953,903.14752 L 419.80887,933.63069 L 422.07738,931.36217 L 420.09243,929.92666 L 420.81904,928.04804 L 423.70788,928.04804 L 424.6826,925.49596 L 424.39904,911.83168 L 422.55587,908.26943 L 422.55587,903.32475 L 423.5661,902.24369 L 424.3459,896.41287 L 423.21164,895.72171 L 423.76102,884.87537 L 425.99409,880.87002 L 425.49785,880.21425 C 425.21939,879.85566 424.74096,878.54508 424.43448,877.29002 L 424.08003,873.32012 C 424.18909,872.39185 424.32503,870.47019 424.39904,869.06666 L 424.54082,866.51458 L 429.25508,865.89425 L 430.77924,864.68911 L 436.8416,864.52963 L 438.68545,866.53641 L 444.04947,866.81703 L 446.19508,869.05951 C 446.99064,870.10422 446.96639,871.76693 447.20827,872.54673 L 449.68946,875.65953 L 454.14596,875.49177 L 456.00036,871.34839 C 456.18088,870.7795 458.27233,867.55095 458.94075,866.83359 L 460.16359,865.5221 C 461.90885,853.38742 463.64829,841.25189 465.40953,829.11953 z "},"pa11":{"name":"PA-11","path":"M 2249.077,494.20087 L 2247.3577,491.28956 L 2242.8807,492.59958 L 2241.8262,490.27917 L 2240.6543,489.02134 L 2240.5419,485.05698 L 2237.4713,483.24308 L 2236.8272,480.02265 L 2234.2467,480.01111 L 2232.2355,475.22678 L 2234.3733,473.50067 L 2239.7867,463.10127 L 2244.0408,462.44166 C 2244.4195,464.49641 2244.2903,466.75882 2245.1513,468.68007 L 2249.1357,465.89348 L 2249.7289,466.48674 L 2253.418,461.89619 L 2255.9188,462.52387 L 2259.7675,457.97287 L 2262.8867,458.60398 L 2262.8867,461.3074 L 2265.1552,461.3074 L 2265.1552,456.99722 L 2266.3376,455.8149 L 2264.664,454.42596 L 2267.9909,451.494 L 2270.9263,444.86409 L 2273.5384,445.5197 L 2274.327,444.24385 L 2273.6415,443.41801 L 2272.9562,442.59215 L 2273.4861,442.59215 C 2273.7775,442.59215 2274.5957,443.37618 2275.3041,444.33442 L 2276.5922,446.07668 L 2272.2444,449.93759 L 2274.3543,452.16991 L 2271.3937,453.332 L 2271.3937,455.12054 L 2274.298,458.02485 L 2275.6521,462.15809 L 2278.4739,462.15809 C 2279.2172,460.51344 2279.941,458.86555 2281.1607,457.5226 L 2297.8557,451.65413 L 2298.0487,457.90463 L 2302.3022,457.92422 L 2304.9693,460.73611 L 2306.11,460.0311 L 2305.2981,462.72522 L 2301.4515,466.74295 L 2301.4515,468.68007 L 2302.8693,468.69265 L 2299.1546,471.62017 L 2297.4459,475.76918 L 2292.661,480.01443 L 2288.6911,482.02982 C 2286.5076,483.13829 2283.78,484.61696 2282.6298,485.31575 C 2281.4795,486.01455 2279.8904,487.28543 2279.0986,488.13994 L 2277.6587,489.69359 C 2272.7485,487.16652 2268.9323,485.34731 2264.0866,481.72629 L 2263.386,482.8597 L 2253.917,482.13185 L 2251.5442,486.783 L 2251.5442,492.32368 C 2250.7965,493.06789 2250.0032,493.72036 2249.077,494.20087 z "},"hi2":{"name":"HI-2","path":"M 694.18097,1347.0439 C 690.82119,1348.3348 688.068,1350.9419 684.48658,1351.7405 C 683.54549,1353.7499 682.70728,1355.9714 680.80025,1357.27 C 680.89723,1358.5008 680.61003,1359.9024 680.94033,1361.0296 C 682.62374,1362.816 684.88199,1363.8519 687.21589,1364.5009 C 688.49221,1365.6897 689.6132,1367.2158 690.98418,1368.1991 C 694.13152,1368.2448 697.196,1368.9315 700.25985,1369.5518 C 701.72151,1369.9554 702.48509,1368.3137 703.57835,1367.638 C 704.90344,1366.5015 706.22202,1365.3575 707.54394,1364.2173 C 707.38531,1362.763 706.9252,1361.2586 706.97103,1359.8297 C 707.97138,1357.7832 708.97169,1355.7366 709.97193,1353.69 C 708.74858,1352.5356 709.04677,1350.5035 708.11583,1349.481 C 706.87717,1348.7339 705.77841,1347.5979 704.21813,1347.7448 C 702.17799,1347.5171 700.13781,1347.2894 698.09767,1347.0617 C 697.43396,1348.222 696.66034,1348.8398 695.54559,1347.7706 C 695.0907,1347.5284 694.63586,1347.2861 694.18097,1347.0439 z M 664.42441,1360.4601 C 662.72966,1361.0942 661.64111,1362.5738 660.74748,1364.0024 C 659.08205,1364.955 657.07981,1365.4714 656.04627,1367.2181 C 655.22331,1368.0831 654.45587,1368.9748 654.45451,1370.2352 C 654.22012,1371.3625 653.76624,1372.521 654.65692,1373.484 C 655.41965,1375.5346 657.0092,1374.6177 657.42167,1373.092 C 658.19983,1371.9527 658.7728,1370.544 659.69495,1369.5829 C 661.15241,1369.1149 662.61084,1368.6501 664.06995,1368.1872 C 664.35556,1366.5813 664.38545,1364.865 664.82661,1363.3262 C 665.72761,1362.4193 666.49324,1361.5631 664.94866,1360.8931 C 664.77393,1360.7488 664.59914,1360.6044 664.42441,1360.4601 z M 786.1444,1380.2741 C 784.62705,1380.7336 782.71685,1380.4501 781.69307,1381.8727 C 779.96741,1382.811 780.53516,1384.9135 778.91726,1385.7939 C 777.884,1386.5962 776.97223,1387.7361 775.85368,1388.3203 C 773.4059,1388.3203 770.95812,1388.3203 768.51027,1388.3203 C 769.3021,1389.3088 770.50101,1390.1661 771.03836,1391.2367 C 771.07801,1392.3468 770.20049,1393.7254 771.31739,1394.5168 C 772.47348,1395.8354 773.77924,1397.3079 773.947,1399.0298 C 774.79213,1399.9593 776.03029,1400.7186 776.645,1401.7478 C 776.69576,1402.9486 777.097,1405.6271 778.58798,1405.2458 C 780.53647,1405.0549 783.07113,1404.3764 780.81873,1402.199 C 780.33014,1400.5848 783.24275,1400.0387 782.55771,1398.2005 C 782.0562,1395.2846 783.45344,1393.0535 786.65839,1393.1231 C 789.49971,1391.5695 791.60324,1392.722 792.19958,1395.8027 C 792.67546,1397.0718 793.17158,1398.3266 794.35745,1399.0957 C 796.70411,1401.181 799.13375,1403.6947 802.34302,1404.1999 C 801.59373,1403.1708 800.08358,1402.4248 800.4644,1400.9566 C 800.87716,1399.6811 799.63265,1399.1722 798.84865,1398.462 C 798.43964,1397.7545 799.62942,1396.2104 799.15921,1395.693 C 798.19096,1395.7902 796.53182,1395.1965 797.06163,1396.7918 C 797.06594,1399.271 795.33308,1398.1207 794.56065,1396.8366 C 793.84352,1395.77 791.18385,1393.6753 792.54235,1392.556 C 794.04797,1391.2122 792.30631,1390.0011 791.43929,1389.0061 C 789.76972,1387.1908 787.96131,1385.3672 787.42339,1382.8823 C 787.02697,1381.9987 786.57111,1381.1432 786.1444,1380.2741 z M 843.8143,1409.0205 C 841.98815,1409.7805 843.00115,1413.162 840.16131,1411.8556 C 837.18117,1411.535 834.14998,1411.3248 831.20312,1410.8521 C 830.07964,1410.3995 829.02937,1409.3934 827.76706,1409.9949 C 826.31657,1409.8738 827.04198,1411.6917 826.7473,1412.6005 C 825.71473,1413.8194 824.68692,1415.0424 823.66354,1416.2691 C 823.66972,1417.702 824.23861,1418.4784 825.73401,1418.0945 C 830.31738,1418.1324 834.92377,1418.0191 839.49284,1418.1508 C 842.6446,1419.1246 845.78054,1420.1519 848.95391,1421.0542 C 850.35846,1419.7046 852.59141,1420.0655 854.13633,1419.1456 C 855.81628,1417.5477 857.49067,1415.944 859.16222,1414.3373 C 858.14604,1413.6556 857.22815,1412.5793 856.14005,1412.1505 C 852.40812,1412.6353 848.5614,1413.6591 844.84222,1412.6182 C 844.49718,1411.4196 844.15458,1410.2204 843.8143,1409.0205 z M 864.97529,1421.2314 C 863.69307,1421.9372 862.17612,1422.3895 861.02224,1423.223 C 860.03248,1424.8744 859.46609,1426.7216 858.9673,1428.5687 C 860.58146,1428.886 859.43218,1430.1518 860.08613,1431.0247 C 861.34062,1432.403 862.00768,1434.4605 863.9138,1435.0597 C 865.6778,1435.9421 867.43482,1436.8381 869.19331,1437.7314 C 870.07911,1437.2258 870.93151,1435.2752 871.88678,1436.5571 C 873.11433,1437.0598 873.07712,1438.3043 873.24596,1439.4261 C 873.69155,1442.0957 874.10238,1444.7837 874.0848,1447.4966 C 875.04092,1448.1429 875.90143,1449.1416 876.93082,1449.5499 C 879.10808,1449.2122 881.39826,1449.2797 883.49896,1448.6491 C 885.16797,1448.0327 886.74549,1446.9542 888.46276,1446.6111 C 889.83748,1446.6076 891.29681,1446.8912 892.62134,1446.6845 C 893.94536,1445.5194 895.77997,1445.211 897.26409,1444.7631 C 898.65213,1443.3456 900.03411,1441.9222 901.41331,1440.4961 C 901.31407,1439.4566 901.59973,1438.2639 901.28361,1437.3107 C 900.41432,1436.5395 899.72117,1435.3742 898.76119,1434.8248 C 897.69232,1434.7108 896.30813,1435.2662 895.77747,1434.0096 C 895.34169,1432.278 893.73711,1434.4661 893.29112,1433.2822 C 892.72218,1432.5149 892.62758,1431.0041 891.35307,1431.4221 C 890.11866,1431.3689 889.40306,1429.9429 888.39147,1429.3002 C 887.33769,1428.5518 886.52511,1427.2888 885.3203,1426.8626 C 883.87361,1426.7226 882.38524,1426.2481 880.96781,1426.2744 C 878.14794,1427.661 875.21061,1428.8026 872.20618,1429.7206 C 871.3746,1427.2503 869.2532,1425.7313 868.51883,1423.2355 C 867.72853,1422.2927 866.22303,1422.014 865.15763,1421.3226 L 864.98885,1421.2382 L 864.97529,1421.2314 z M 840.11027,1427.8243 C 839.2821,1428.668 838.44904,1429.5068 837.61133,1430.3409 C 839.21098,1431.6646 840.80603,1432.9939 842.39648,1434.3286 C 842.49085,1435.9709 841.78387,1437.7981 842.91047,1439.2023 C 843.18031,1440.764 844.44824,1440.3554 845.6214,1440.1341 C 847.56013,1439.8032 849.61802,1439.3817 851.34214,1438.4716 C 852.02565,1437.3709 853.55122,1436.5845 853.18968,1435.1104 C 853.58066,1433.8066 852.58081,1433.0804 851.7211,1432.2946 C 850.05442,1430.7496 848.42245,1428.9184 846.35498,1427.9786 C 844.27362,1427.9173 842.19209,1427.8671 840.11027,1427.8243 z M 865.7374,1447.8688 C 863.39919,1449.3738 861.07056,1450.8951 858.80777,1452.5122 C 859.65307,1453.0999 860.19735,1454.8935 861.31374,1454.518 C 863.70969,1453.5341 866.52174,1454.2434 868.82116,1453.0615 C 868.66577,1451.3194 868.94911,1449.3691 867.88183,1447.8688 C 867.16702,1447.8688 866.45221,1447.8688 865.7374,1447.8688 z M 908.28975,1467.6474 C 907.55634,1468.5093 906.46138,1469.2215 905.95034,1470.1755 C 906.08345,1471.9878 905.67687,1473.9085 906.16903,1475.6486 C 907.15277,1478.3303 908.6974,1480.7479 910.48737,1482.9599 C 910.29375,1484.0905 911.01208,1485.6064 909.81084,1486.3114 C 908.40856,1487.8472 906.44669,1488.9835 905.86374,1491.0948 C 905.26508,1491.8142 905.19561,1493.8046 904.26875,1493.7244 C 903.05804,1492.7605 902.31113,1493.805 901.53853,1494.7384 C 900.13359,1496.3903 898.23824,1497.7211 897.63607,1499.8995 C 896.5098,1501.3725 897.43598,1503.0576 898.55827,1504.2645 C 900.20436,1504.9936 897.50409,1506.4139 899.36944,1506.6652 C 900.31989,1507.1395 901.57296,1507.3289 901.76006,1508.5711 C 902.80958,1511.1489 903.25087,1513.9185 903.8945,1516.6154 C 905.11156,1516.8137 905.70211,1517.4437 905.38321,1518.7004 C 905.5571,1520.4988 906.919,1521.8753 907.1974,1523.9275 C 908.24784,1525.4872 907.33601,1527.3097 907.25933,1529.0204 C 906.66663,1533.1536 906.17566,1537.3162 906.25166,1541.4982 C 907.90977,1542.0489 907.92769,1544.4 909.35056,1544.959 C 911.12641,1545.5566 913.19462,1545.5666 914.52816,1547.0454 C 915.67756,1548.4062 917.94114,1548.1219 918.87572,1549.538 C 919.60068,1550.2865 919.80847,1551.9798 921.11485,1551.6533 C 922.24735,1551.571 922.78647,1550.1125 923.67221,1549.4578 C 925.53301,1547.8387 926.14614,1545.3882 927.92165,1543.7059 C 928.43303,1542.7196 927.49312,1541.1729 928.7154,1540.4747 C 929.74275,1539.5316 930.59242,1538.1932 931.71307,1537.4751 C 932.95633,1537.778 933.79285,1537.0698 934.55161,1536.1683 C 935.36079,1535.5157 936.0237,1534.4995 936.92357,1534.0724 C 938.24418,1534.4382 938.97169,1533.3 939.84314,1532.5268 C 940.97848,1531.5879 941.9764,1530.2894 943.19737,1529.5748 C 945.9176,1529.5614 948.7212,1529.8373 951.38966,1529.6442 C 954.66369,1527.2812 958.37753,1525.6288 961.94921,1523.8226 C 965.02291,1520.9003 968.09651,1517.9781 971.17011,1515.0558 C 970.97031,1514.0442 971.76621,1512.3848 970.30751,1512.1925 C 968.18181,1511.163 965.79931,1510.5532 964.12531,1508.793 C 963.12501,1507.8382 961.72521,1507.0863 960.96021,1506.0234 C 960.86481,1504.6581 961.09641,1503.1801 960.81151,1501.8798 C 960.04262,1501.2721 959.75617,1499.5213 958.54847,1499.9905 C 957.03282,1500.2092 955.51484,1500.4104 953.99681,1500.6118 C 954.20948,1498.0597 954.42215,1495.5076 954.63482,1492.9555 C 950.76049,1488.5869 946.37624,1484.583 941.02045,1482.1141 C 935.77184,1479.5383 930.39019,1476.4377 924.36433,1476.491 C 921.82076,1474.5759 919.00831,1473.0738 916.15866,1471.6704 C 916.61457,1470.2077 914.86617,1470.1215 913.95434,1469.5128 C 912.16057,1468.6208 910.25768,1468.0039 908.28975,1467.6474 z "},"ak":{"name":"AK At-Large","path":"M 367.87794,1192.7957 C 365.21207,1196.1501 362.22304,1200.2146 357.85597,1201.094 C 356.02087,1200.8228 353.20897,1201.5157 351.95722,1200.6687 C 351.81292,1196.6151 345.58491,1203.1323 343.77759,1204.0512 C 341.51322,1206.0272 339.15344,1207.8362 336.15406,1208.4767 C 334.27329,1209.7948 333.41655,1205.0241 331.78965,1207.914 C 328.49467,1210.2843 326.60247,1214.0172 322.94027,1215.9269 C 323.75064,1218.7385 320.82949,1222.8879 318.66331,1225.0898 C 316.01205,1227.2568 312.95961,1229.6772 309.33086,1229.0001 C 306.48787,1229.2305 303.77877,1228.7483 301.18321,1227.5686 C 296.22759,1224.6255 298.33844,1231.0395 296.09154,1233.4837 C 295.7298,1235.7349 289.60037,1234.7227 293.63476,1237.3936 C 296.03976,1238.9619 296.07533,1243.1615 299.2609,1243.4815 C 302.07288,1245.8921 303.11826,1250.1595 305.75672,1252.8893 C 307.57365,1254.437 308.00698,1256.4877 307.77033,1258.7822 C 308.1343,1260.6856 307.15787,1263.369 308.48425,1264.7001 C 312.36462,1267.6755 317.1905,1268.0395 321.72086,1269.2108 C 322.08673,1270.0681 319.52598,1274.654 319.13608,1272.5618 C 318.51882,1270.349 317.646,1268.4833 315.01693,1269.2759 C 313.72877,1269.9811 315.31999,1274.9583 318.12026,1274.1346 C 320.31535,1273.4864 322.69475,1280.0868 321.59413,1279.4396 C 319.1433,1275.0456 317.3296,1279.9245 319.33601,1281.0755 C 321.32282,1280.5218 323.66618,1281.8329 324.02812,1283.5591 C 323.1973,1286.386 322.30082,1281.0356 320.20412,1283.6842 C 318.86531,1284.652 317.75054,1288.2987 316.13643,1285.8673 C 314.73792,1285.6268 312.72057,1285.6421 310.82573,1284.4303 C 308.54038,1284.1857 307.50858,1284.291 305.71176,1283.1578 C 302.82709,1283.9571 303.17836,1282.0285 303.79506,1279.8647 C 303.32819,1277.5691 305.87692,1275.9319 306.19607,1274.4879 C 304.59923,1272.6667 302.53286,1272.3752 300.24878,1272.833 C 296.33711,1273.136 292.31276,1272.9062 288.71922,1274.7388 C 286.90872,1275.9407 288.8298,1278.1763 290.42774,1278.873 C 288.31436,1279.9196 286.52051,1276.9677 284.50021,1276.2169 C 279.36435,1277.9932 274.43083,1280.4214 269.07837,1281.5527 C 266.92333,1283.3953 268.52383,1284.9601 270.09782,1286.5197 C 272.50009,1289.7443 276.53298,1290.7958 279.75003,1293.0052 C 278.803,1295.1891 276.18431,1294.7247 274.91308,1295.3048 C 275.43751,1297.7926 277.8026,1299.8002 276.62662,1302.4838 C 274.80939,1306.7108 280.65065,1307.8198 283.15993,1309.749 C 285.47811,1311.9797 287.29507,1313.0619 290.26677,1311.4927 C 293.07301,1310.1089 295.96315,1311.8666 298.81585,1312.2228 C 300.36851,1314.4737 300.97074,1317.5191 303.29098,1314.2846 C 302.86127,1316.8656 303.90846,1319.7533 306.29149,1315.7096 C 308.50904,1313.6965 311.06551,1311.5984 314.23779,1312.0102 C 316.539,1313.1433 318.10893,1309.1978 319.4014,1310.1867 C 320.70134,1311.9549 321.98406,1315.7381 318.7282,1315.8822 C 317.36588,1317.5291 313.87133,1314.028 314.47628,1317.0185 C 314.0104,1319.2128 316.9033,1318.5325 317.08635,1321.0869 C 318.4594,1323.8037 317.52304,1327.0948 317.91275,1330.0563 C 318.40898,1332.389 315.47934,1333.3089 314.33656,1334.9729 C 313.011,1337.0606 310.46894,1335.1858 308.51036,1335.2562 C 306.37429,1335.7734 305.82612,1330.9723 304.29588,1334.0819 C 301.7762,1336.5565 297.62874,1341.0887 294.34764,1340.4197 C 293.15422,1337.9085 289.66419,1333.2392 286.51029,1335.2032 C 284.3769,1335.9041 282.73402,1337.0824 282.07414,1339.3094 C 279.75641,1344.3102 276.10566,1347.9791 271.86144,1351.4155 C 270.7012,1352.993 267.63562,1353.9543 268.8217,1356.2906 C 270.28277,1359.3136 267.02568,1357.5143 265.38508,1357.3578 C 264.2518,1357.7819 267.23501,1362.0028 264.06736,1360.896 C 261.83046,1361.218 263.26256,1365.0539 265.80313,1363.6724 C 268.2459,1366.1691 263.16906,1363.8226 264.50171,1366.7958 C 264.35627,1368.9912 266.72437,1368.8691 266.11984,1371.8247 C 265.64501,1374.7044 270.14489,1371.2364 270.3145,1373.7794 C 271.45224,1375.7709 266.88704,1373.7543 268.82164,1376.8405 C 269.07242,1378.9181 270.29173,1381.522 267.29976,1381.8272 C 264.88903,1381.8457 264.18274,1385.3595 267.10455,1384.5601 C 271.37523,1384.1339 264.46956,1385.6072 268.2608,1388.0309 C 270.2581,1390.742 273.36133,1393.5606 273.52489,1397.0777 C 272.68443,1399.6748 274.92087,1400.2791 276.88431,1401.0729 C 281.31945,1401.4975 285.78788,1400.5311 290.09633,1399.4614 C 290.668,1393.9555 292.67853,1400.0451 293.02096,1402.6405 C 293.62899,1405.1057 294.20832,1407.5779 294.80313,1410.0464 C 292.54559,1410.7041 292.6461,1412.9436 291.39774,1413.8204 C 289.70293,1415.4547 293.30792,1419.6786 292.26536,1422.5204 C 292.69558,1424.4539 287.70126,1424.6249 290.11239,1426.4891 C 292.77883,1430.7062 296.36503,1424.118 299.68997,1424.1183 C 302.51876,1425.907 301.32696,1422.989 303.83197,1422.4436 C 306.58677,1420.664 307.1106,1421.1748 306.47824,1423.503 C 308.11918,1424.7726 309.20133,1427.4581 311.63485,1426.8347 C 313.02865,1424.0221 312.89846,1424.7103 313.43569,1426.8347 C 315.54861,1426.8613 315.04626,1430.4063 315.98152,1432.0006 C 316.19018,1434.1166 317.33925,1436.3415 319.66956,1435.7469 C 322.09966,1434.8014 320.73295,1432.547 320.41761,1430.6622 C 320.36152,1429.5143 322.32635,1424.6864 323.13073,1428.2228 C 324.31144,1435.0533 329.82807,1432.1338 334.25361,1430.386 C 335.46445,1429.3215 339.53829,1429.0835 337.64593,1431.1312 C 335.49152,1433.4135 332.18866,1434.8976 331.58447,1438.2439 C 330.67933,1440.383 333.81894,1441.4167 330.57536,1442.3123 C 329.62716,1445.6375 329.16644,1449.2495 327.92918,1452.4047 C 324.41548,1455.7822 319.79104,1457.8267 316.90528,1461.8853 C 316.24128,1463.4363 317.17281,1467.1643 314.47774,1465.3731 C 313.87418,1462.7399 310.61598,1467.0687 308.87122,1466.9745 C 305.11492,1467.8413 302.29017,1469.3594 299.23549,1471.5471 C 296.3984,1473.1615 295.49627,1476.3151 294.00059,1478.9999 C 294.69986,1479.9251 298.98496,1482.1191 295.82203,1481.6679 C 295.35138,1480.7893 292.51759,1479.094 291.57127,1480.9748 C 291.05496,1483.075 288.88856,1478.0183 292.26536,1479.5856 C 293.14123,1476.7663 289.81985,1477.6777 288.05926,1477.2025 C 285.1241,1476.3673 282.31803,1477.3051 279.504,1478.1338 C 274.6478,1480.958 270.84925,1485.4703 265.73806,1487.9147 C 264.07114,1487.3911 260.30064,1488.3338 262.28675,1490.2103 C 264.05512,1491.307 265.44308,1493.6453 267.47077,1493.8957 C 269.39423,1493.516 271.68746,1493.8193 273.3957,1493.0447 C 274.96052,1489.477 275.22457,1494.7982 276.73879,1491.6154 C 278.35411,1489.08 277.28212,1495.367 280.14084,1493.3358 C 278.67849,1490.9089 277.7396,1489.2821 280.67732,1486.926 C 279.94675,1484.289 284.3857,1482.8244 284.39926,1484.2069 C 281.60875,1486.5306 281.8788,1490.0221 285.88313,1489.0447 C 288.57781,1487.3675 292.67198,1487.5501 295.04172,1486.8513 C 295.07141,1484.9333 298.64959,1486.5494 299.28181,1483.9717 C 300.5629,1482.6661 302.52741,1484.4679 302.24734,1482.4137 C 304.4319,1485.5421 307.76152,1481.5509 310.76778,1482.362 C 312.90035,1482.3821 312.64413,1480.2511 315.51235,1481.4348 C 318.28258,1482.2279 317.12442,1478.4765 319.66088,1477.2364 C 321.53878,1475.1366 314.11589,1473.4519 320.39733,1473.2726 C 322.78059,1473.0943 326.26685,1473.8181 324.31265,1470.4393 C 325.40056,1468.5084 325.71475,1472.6294 328.35811,1471.2565 C 327.61566,1469.5902 329.66558,1467.2238 330.44038,1467.3527 C 330.53531,1470.5809 334.67462,1466.2165 336.21056,1465.7038 C 338.61305,1466.2752 340.03095,1465.1582 340.78668,1462.9057 C 342.3123,1461.3831 342.1738,1459.3559 341.89898,1457.9327 C 343.19366,1455.9426 346.33896,1458.6702 345.71039,1455.9865 C 347.97547,1456.5159 349.2843,1455.5838 349.68585,1453.3055 C 350.15388,1450.3618 353.80777,1454.9855 353.67716,1451.1109 C 356.71357,1451.462 355.5746,1448.325 356.81694,1447.6574 C 358.50776,1447.1504 362.33861,1448.7835 362.36858,1446.6157 C 365.50539,1447.1552 365.3821,1443.6657 367.27257,1441.7005 C 368.61529,1440.6845 364.74225,1438.5831 368.61541,1439.3283 C 367.56518,1436.0725 370.94418,1438.1462 372.21915,1436.5345 C 374.20624,1435.3776 374.52522,1433.2378 374.97068,1431.1728 C 372.84306,1429.8399 371.04364,1427.5939 368.29041,1428.0026 C 364.4384,1428.5217 368.12014,1423.8796 368.55034,1421.976 C 370.90672,1422.4472 371.67848,1421.7272 371.63755,1419.5611 C 372.82137,1417.6407 374.63594,1417.331 376.72872,1417.6918 C 378.98491,1418.2414 378.15097,1414.1882 379.67803,1413.6469 C 381.77799,1414.1037 382.0714,1411.2334 383.29978,1410.068 C 381.7067,1408.1139 383.59055,1406.8816 384.9698,1405.5565 C 387.2609,1404.6318 384.6035,1401.1395 387.00883,1400.7195 C 388.67578,1399.8499 387.85434,1397.3046 390.76156,1397.3166 C 392.49732,1396.5966 390.36775,1393.2296 393.43593,1393.3442 C 394.99736,1392.2502 398.44805,1392.3997 397.76724,1389.8298 C 399.22444,1388.5989 401.60646,1387.6366 403.73587,1387.9655 C 407.32029,1386.8267 406.92697,1390.2267 409.15319,1392.1231 C 409.66878,1392.9331 405.64512,1395.2327 405.15578,1392.8627 C 403.76333,1391.1292 401.25985,1392.4125 400.13149,1393.9304 C 398.35188,1396.5564 392.54117,1395.7982 394.50537,1399.9411 C 394.85022,1401.9597 395.46201,1404.0389 393.6027,1405.058 C 394.25513,1407.4296 392.3627,1408.8006 390.92049,1410.3485 C 389.49925,1411.7523 389.58765,1414.2177 389.41198,1416.0533 C 390.58899,1420.1777 393.97599,1417.9707 396.37906,1416.8571 C 396.16861,1420.3124 392.89088,1419.5785 392.21343,1421.2819 C 389.65735,1420.5091 386.73769,1424.3199 387.67147,1426.3079 C 390.16745,1428.335 392.65702,1427.0254 395.46807,1426.531 C 398.84396,1427.157 399.68363,1422.8442 402.56081,1421.976 C 403.79386,1421.2711 403.20888,1419.1211 405.92282,1420.718 C 406.97096,1419.2284 406.88477,1415.825 409.43469,1416.8325 C 412.29242,1417.6901 412.80806,1416.5266 411.77104,1413.9952 C 412.94767,1410.955 421.18442,1413.2978 424.66563,1412.2808 C 426.76379,1412.8475 429.89867,1412.111 427.73259,1409.8286 C 426.85147,1408.9087 422.58072,1406.9658 423.81844,1406.706 C 426.10376,1407.5655 427.08798,1404.7395 427.18951,1403.1514 C 427.06772,1399.3157 421.08693,1404.2886 423.50979,1401.5918 C 425.6995,1400.046 429.97627,1397.4367 425.13963,1396.7108 C 421.50284,1398.1765 423.39627,1394.2794 425.14101,1392.8242 C 425.07571,1394.8499 425.01806,1396.8175 427.93961,1395.9476 C 430.17275,1397.4455 429.91311,1390.7385 430.31518,1393.5184 C 430.59289,1396.838 432.93381,1393.6988 433.16698,1392.8242 C 436.87715,1393.303 439.06595,1395.4068 437.74257,1397.813 C 438.24314,1399.8547 442.92117,1396.1687 441.73359,1398.7456 C 440.66011,1401.1072 444.54377,1399.1342 444.66707,1398.5361 C 448.32158,1399.5813 442.74689,1402.3425 446.98266,1402.5632 C 448.93102,1401.835 452.21764,1407.4118 452.60046,1404.275 C 452.04608,1401.0674 456.02773,1402.6383 454.68273,1405.3178 C 457.33914,1404.8309 456.65572,1407.684 459.80327,1406.706 C 461.76957,1406.7072 462.71582,1409.171 464.24818,1410.2198 C 469.42386,1409.0472 474.48348,1406.4473 479.91363,1407.6342 C 482.46251,1408.3953 485.98059,1407.9491 488.04195,1409.6024 C 491.07244,1411.9744 494.91436,1412.5477 498.65178,1412.2587 C 501.42837,1412.1365 503.67011,1409.0565 504.99362,1406.8381 C 505.58403,1406.5501 505.81006,1410.4941 506.25721,1411.8202 C 504.14776,1411.6576 503.90849,1415.116 505.8979,1415.4459 C 510.44341,1417.8304 515.2651,1419.6785 520.10084,1421.2819 C 523.64496,1421.292 524.34993,1426.2205 527.35171,1427.595 C 529.62406,1429.2523 531.66184,1431.4501 534.66279,1431.5118 C 536.97489,1431.1334 537.99077,1434.8679 539.8466,1434.259 C 541.89897,1433.3239 537.52513,1431.09 541.48807,1431.8668 C 543.09994,1432.2881 546.04733,1429.9585 544.3876,1428.5232 C 544.43532,1426.2825 536.83774,1422.5762 540.8829,1422.9087 C 544.25448,1421.8269 544.66525,1425.748 545.70345,1428.0514 C 546.07526,1431.5991 550.09069,1426.0544 551.57354,1430.175 C 552.58985,1432.273 555.61144,1430.1867 554.63189,1428.1561 C 556.64699,1430.5008 558.51519,1434.398 559.60394,1437.6952 C 560.36991,1440.6026 563.02362,1443.0331 563.40292,1445.9159 C 563.16116,1447.7669 562.31043,1449.7589 564.17273,1451.0547 C 565.43172,1453.6622 566.80115,1449.267 568.11359,1448.4845 C 568.11024,1446.4889 569.64796,1445.312 570.69845,1444.0756 C 569.81883,1441.9707 569.69157,1439.3218 567.34774,1438.2719 C 564.15361,1437.2995 569.47447,1434.861 566.70933,1433.6805 C 563.59956,1430.4181 565.71434,1430.6646 567.65671,1433.2587 C 568.75297,1436.0945 571.14172,1433.7099 571.63223,1435.7482 C 570.69318,1437.4779 570.56376,1438.8547 572.54814,1440.6514 C 574.02982,1442.296 575.20985,1443.9973 573.9363,1446.1607 C 576.01273,1448.6221 580.64821,1446.3228 581.80969,1448.6671 C 581.47389,1451.8242 586.14828,1450.617 586.56008,1453.2101 C 590.20666,1452.2839 588.20532,1454.7173 589.00837,1456.7735 C 591.33433,1458.1162 587.72002,1460.6768 587.22492,1459.4147 C 587.37118,1455.0475 580.67362,1459.7859 584.80612,1461.9999 C 586.15089,1462.9594 589.19575,1459.0179 587.3933,1462.8967 C 586.88045,1464.7706 589.24583,1466.2955 590.81139,1464.8362 C 590.44933,1466.8246 593.13667,1469.4628 593.50099,1466.7444 C 596.06748,1465.064 594.30938,1470.4289 594.86482,1472.1466 C 596.25571,1474.5154 599.81518,1473.8546 598.99261,1470.2065 C 599.03708,1466.0744 599.40361,1467.0849 600.07039,1470.4615 C 599.58231,1473.0126 600.32418,1475.2723 600.39853,1477.9805 C 601.81408,1480.3091 603.46828,1479.1965 603.89465,1478.1979 C 602.94947,1481.8326 605.70719,1482.7384 608.81494,1483.7502 C 610.16709,1483.3742 608.63216,1478.4925 611.47982,1480.6169 C 611.68478,1482.919 612.43855,1484.5182 615.0406,1483.7502 C 617.62965,1484.204 615.90547,1480.3662 616.38084,1478.7169 C 616.40965,1471.7337 614.74478,1464.8554 613.80159,1457.9622 C 612.10684,1455.8032 608.26732,1454.1873 605.69987,1453.3076 C 604.03342,1454.7887 601.9701,1452.6473 600.11428,1452.4 C 598.33758,1451.5189 596.01071,1450.9661 594.74624,1451.5919 C 594.01441,1449.614 593.32859,1447.565 590.81139,1448.3515 C 590.57478,1446.3204 590.95158,1443.5229 588.08134,1444.7822 C 586.04983,1444.9739 589.52071,1441.2998 586.59019,1440.6007 C 580.84404,1434.4512 574.5682,1428.6645 569.66021,1421.8548 C 567.19019,1418.5489 562.85005,1417.6914 559.84391,1415.6971 C 558.9234,1413.8361 558.20694,1411.7673 555.93331,1411.2826 C 552.17987,1411.1406 549.92242,1408.536 550.46734,1404.7105 C 548.51099,1403.5341 546.55158,1402.363 544.58925,1401.1967 C 542.54861,1403.3716 538.20563,1404.4262 537.34486,1406.8802 C 539.36959,1409.6321 534.52931,1408.7611 536.09851,1411.3825 C 536.6423,1412.8566 536.76959,1416.1713 534.50269,1415.7292 C 532.63634,1416.4179 531.54703,1418.8355 529.96005,1420.1758 C 528.49497,1422.111 528.13579,1417.3053 527.18353,1416.2811 C 525.90083,1414.0041 522.99267,1413.0375 521.02713,1411.3109 C 518.42914,1409.6844 516.04177,1407.8357 514.49161,1405.1345 C 512.94,1404.4338 510.86807,1404.6349 509.90152,1402.5051 C 508.34765,1401.2531 511.37439,1398.4689 509.6976,1397.4605 C 508.0415,1396.3133 505.88108,1397.8377 504.0066,1397.8346 C 502.32155,1398.8836 501.07241,1402.0415 498.85391,1400.5098 C 496.09184,1398.3172 496.22594,1401.5597 493.87891,1400.9831 C 490.17434,1399.0532 492.10845,1393.2055 490.76993,1389.6555 C 483.33274,1334.0052 477.3169,1278.1564 469.45471,1222.5714 C 468.50721,1222.0914 466.59218,1225.6092 465.17703,1222.2202 C 461.55698,1220.5727 458.10739,1218.4921 454.72611,1216.3515 C 451.94163,1218.0126 452.36524,1215.4231 450.34466,1216.2213 C 447.2238,1218.1662 442.71247,1220.6148 439.11533,1218.7136 C 437.46053,1217.3675 435.73199,1216.2838 433.50881,1216.7317 C 430.60133,1216.5367 427.41351,1216.9816 424.67779,1216.3659 C 423.23836,1215.1394 422.13246,1212.7085 419.97682,1214.1367 C 419.14255,1212.7161 417.28663,1212.3312 415.53194,1211.7709 C 414.46905,1210.0547 411.71054,1211.3977 409.93229,1210.9723 C 407.92912,1212.6403 408.31335,1212.0009 406.18333,1210.8459 C 403.59562,1211.2334 400.93746,1213.1652 398.46133,1211.5145 C 399.18091,1209.0081 395.85672,1209.284 394.33637,1208.3398 C 395.50423,1205.7098 395.91122,1202.572 391.75003,1202.9044 C 388.84696,1202.4898 385.39406,1202.1168 383.13666,1203.8797 C 380.42786,1203.8718 380.17654,1202.4002 381.17412,1200.1705 C 379.56166,1199.0176 377.67401,1195.3607 376.46315,1198.8608 C 376.63956,1202.2809 369.43709,1203.8426 373.00435,1200.3057 C 375.01389,1200.0163 376.77975,1197.3565 374.88191,1196.2494 C 372.20657,1195.7645 370.5205,1193.5579 367.87794,1192.7957 z M 264.45833,1293.5691 C 262.5408,1295.1535 265.14516,1298.2254 266.41619,1295.9671 C 267.0476,1293.7733 266.55223,1293.2885 264.45833,1293.5691 z M 230.49123,1308.0366 C 228.69859,1309.0939 225.16737,1312.5056 226.81282,1314.6831 C 227.69941,1316.8967 229.16142,1317.7683 231.44141,1316.7857 C 233.79737,1315.5716 235.03757,1317.8391 236.54989,1319.2575 C 238.65225,1320.2192 235.99665,1323.7667 238.82033,1323.7621 C 241.6379,1323.7429 239.43027,1332.3017 243.1265,1327.3161 C 243.78923,1325.7097 246.50155,1324.8825 247.77844,1326.3215 C 248.99216,1328.3571 252.57877,1324.9951 250.70664,1323.8705 C 248.59953,1321.7939 245.18195,1321.7428 243.64507,1319.0107 C 241.65409,1317.1876 242.13917,1314.089 240.03499,1312.1577 C 237.60534,1312.2148 234.77863,1313.988 232.86221,1311.8269 C 231.27695,1310.8427 229.95858,1310.1249 230.49123,1308.0366 z M 301.28855,1331.05 C 300.98059,1335.2637 307.60762,1332.1469 303.71625,1331.05 C 302.90702,1331.05 302.09778,1331.05 301.28855,1331.05 z M 252.02975,1383.6057 C 250.5022,1386.1705 248.64364,1384.3462 246.71825,1383.8216 C 244.43958,1383.8455 244.72772,1386.8317 245.58919,1388.1011 C 247.99471,1390.6752 250.85716,1392.7941 253.54808,1394.9065 C 255.10107,1398.1108 255.99949,1394.8494 257.56295,1394.9065 C 259.70644,1394.9167 262.50232,1395.5895 261.56794,1392.4736 C 261.60355,1390.4867 261.61626,1388.4994 261.63858,1386.5123 C 259.39065,1386.3264 258.28502,1384.5337 257.1476,1383.6057 C 255.44165,1383.6057 253.7357,1383.6057 252.02975,1383.6057 z M 0.052913,1422.6701 C 0.134557,1424.7361 -0.671268,1427.3279 2.009148,1427.8378 C 3.815132,1428.1744 5.156646,1427.1588 5.503699,1428.5927 C 6.436405,1425.7752 1.912798,1423.4545 0.052913,1422.6701 z M 546.73659,1430.7606 C 546.76512,1433.6717 543.26621,1431.6184 541.97194,1432.7125 C 541.1011,1435.075 539.53334,1438.445 542.21076,1440.1227 C 544.78052,1442.9811 547.92129,1445.4596 550.12951,1448.5585 C 550.75492,1450.5139 552.5586,1452.4734 551.07467,1454.4682 C 552.55433,1456.4433 555.53603,1453.8966 554.3239,1451.9898 C 553.03683,1448.1542 556.34799,1450.0284 556.08514,1452.9933 C 558.14128,1454.4487 555.57693,1458.2118 558.24214,1459.1279 C 560.91319,1460.2303 562.2171,1462.2791 563.39775,1464.8001 C 564.12289,1466.8582 567.6807,1469.1155 567.1222,1465.5367 C 566.6875,1462.0305 566.7421,1458.3895 564.77744,1455.3069 C 561.7489,1449.6642 560.68798,1443.114 557.52441,1437.6035 C 558.17761,1436.3205 557.90346,1434.0014 556.32319,1433.0815 C 553.00106,1433.1469 549.87631,1431.6719 546.73659,1430.7606 z M 2.200258,1435.4891 C -1.704244,1436.315 6.662973,1442.3323 5.605643,1436.0314 C 4.473883,1435.8344 3.353747,1435.5287 2.200258,1435.4891 z M 383.88542,1437.0941 C 379.7073,1437.0569 380.03684,1440.7799 377.40011,1443.3687 C 376.48186,1445.0855 369.52904,1447.4542 373.30052,1448.3515 C 375.65232,1446.4409 377.7588,1447.877 379.94706,1448.3273 C 380.90506,1445.7797 384.19387,1448.6574 384.57951,1447.1357 C 384.70056,1445.6632 387.56371,1448.1415 387.21674,1444.9335 C 387.56749,1443.5829 384.84527,1441.5131 383.57631,1441.6836 C 380.56446,1441.8717 384.25773,1439.8189 383.88542,1438.5691 C 383.88542,1438.0775 383.88542,1437.5858 383.88542,1437.0941 z M 580.33493,1448.5033 C 577.37027,1448.6653 574.20608,1448.2459 571.36159,1448.7586 C 568.72393,1449.7274 571.32745,1451.6335 572.01595,1453.1872 C 571.5682,1452.3485 569.21717,1451.6076 567.90205,1453.6538 C 565.7215,1454.3366 566.93104,1457.2984 568.30874,1458.2853 C 569.42275,1459.5151 572.23809,1461.3978 572.33065,1462.2333 C 570.44596,1461.4255 569.03693,1464.7198 571.29008,1465.0965 C 569.75231,1468.1818 575.4283,1471.2999 573.70015,1467.1018 C 572.50328,1464.6121 577.4559,1466.6159 575.24387,1462.8639 C 573.7276,1460.7363 574.19956,1456.5308 576.2824,1460.3395 C 577.47927,1461.3065 581.86527,1459.6495 582.04142,1458.1048 C 584.0579,1457.695 586.2739,1457.6077 587.25452,1455.4934 C 586.71609,1452.3472 581.79376,1451.6008 580.33493,1448.5033 z M 372.62812,1449.436 C 371.63723,1453.0082 369.64511,1449.7096 367.92541,1450.8441 C 365.33311,1451.3359 367.86346,1455.2764 365.14279,1454.5983 C 362.32908,1454.1659 359.53635,1456.493 358.36132,1458.7651 C 356.84499,1462.391 360.28158,1461.6109 359.59222,1464.6664 C 359.13099,1466.9854 359.85477,1468.5423 362.25463,1469.021 C 364.14996,1469.3342 366.62223,1466.0404 364.10381,1470.3238 C 360.73405,1473.45 366.61958,1473.3336 367.45976,1470.9329 C 369.37654,1469.7943 369.82474,1467.683 370.63724,1466.3288 C 372.69485,1464.5723 376.58763,1466.2756 376.87683,1462.9922 C 378.87212,1463.1786 380.55806,1462.992 380.48359,1460.5087 C 381.95526,1460.2347 383.68969,1461.4583 383.51678,1458.7927 C 385.76719,1458.7762 385.93864,1455.9998 383.56006,1455.9865 C 380.31645,1455.9238 383.18073,1452.6 382.3335,1451.1157 C 380.77447,1449.0105 377.55475,1454.1621 378.33269,1449.7397 C 375.82892,1448.4915 375.04926,1452.3841 373.42437,1450.1022 C 373.15895,1449.8802 372.89354,1449.658 372.62812,1449.436 z M 578.03579,1461.4525 C 575.52557,1463.1652 579.11231,1464.9602 577.94584,1466.8241 C 575.34528,1469.254 577.99195,1472.3725 579.7927,1469.6948 C 580.08687,1467.8251 584.19844,1472.4368 580.48953,1471.4344 C 577.6595,1471.8523 579.88764,1474.7998 582.15853,1473.6021 C 582.26368,1474.7628 583.90495,1479.975 581.20258,1477.4166 C 577.64396,1475.6932 580.00112,1479.689 581.55284,1481.384 C 582.83597,1482.4778 585.92863,1481.4564 586.70118,1483.1489 C 587.32519,1485.2784 587.9927,1487.3831 590.03232,1488.5627 C 591.88292,1490.3707 593.90354,1492.4807 596.72983,1490.914 C 598.59415,1489.767 603.4642,1490.5985 602.46129,1487.3261 C 601.78759,1483.174 599.24771,1479.3067 597.00925,1476.0088 C 593.88783,1476.1575 595.73713,1473.1739 593.95396,1471.8545 C 591.77482,1469.7363 590.23717,1466.7177 587.04162,1466.0477 C 584.76931,1465.7954 584.32219,1463.5953 583.41501,1461.8863 C 581.62192,1461.7416 579.82882,1461.5971 578.03579,1461.4525 z M 41.698393,1465.5953 C 39.850866,1465.0081 37.388299,1468.2325 40.245139,1467.7861 C 42.316863,1468.3315 41.569145,1466.984 41.698393,1465.5953 z M 359.6356,1473.8376 C 358.40238,1475.0526 355.53756,1475.4113 356.12176,1477.6117 C 358.23751,1477.6345 359.8529,1476.8807 360.58358,1474.8024 C 360.29348,1474.4787 359.94938,1474.1588 359.6356,1473.8376 z M 360.9804,1474.727 C 359.75223,1478.0928 366.33442,1478.5596 365.71932,1475.7766 C 364.36414,1474.7096 362.61573,1474.7177 360.9804,1474.727 z M 61.436614,1478.2408 C 59.571172,1478.162 56.732931,1479.9445 59.224197,1481.2123 C 61.771914,1482.3857 63.291214,1480.1734 61.436614,1478.2408 z M 346.75153,1486.0493 C 345.26287,1487.0087 342.40959,1488.2161 343.95053,1490.1701 C 347.25258,1494.0152 350.84067,1486.8779 346.963,1486.1233 L 346.75153,1486.0493 z M 289.64083,1488.6088 C 288.13357,1491.1897 288.3645,1494.0263 291.62052,1494.4588 C 294.00884,1494.3156 292.43173,1491.3385 292.33165,1489.7588 C 292.50018,1487.8171 290.83532,1488.8766 289.64083,1488.6088 z M 257.01853,1489.086 C 254.08546,1489.8445 249.76457,1488.089 247.71358,1490.6016 C 246.30563,1491.9338 245.67963,1494.8216 243.288,1494.1615 C 241.43071,1494.0911 242.00419,1498.1354 243.6235,1498.873 C 245.46422,1500.7252 248.73144,1498.374 250.38128,1496.9379 C 252.27385,1497.1608 254.65271,1496.5153 256.26749,1497.2342 C 257.26015,1499.6384 261.97252,1496.2357 261.02312,1494.1062 C 260.62417,1491.4449 260.88703,1488.2388 257.01853,1489.086 z M 82.497954,1492.0793 C 83.682664,1493.928 83.282214,1499.1434 86.287354,1497.3072 C 87.300844,1495.7374 86.200614,1492.5999 84.774354,1492.0793 C 84.015554,1492.0793 83.256754,1492.0793 82.497954,1492.0793 z M 298.68571,1494.0964 C 297.03061,1494.467 293.72291,1494.7952 295.36445,1496.9585 C 297.06992,1498.6038 300.74108,1495.36 298.68571,1494.0964 z M 94.362574,1495.8968 C 94.150684,1498.7617 90.671574,1497.4785 90.978874,1499.7142 C 90.416934,1502.22 94.372394,1501.1864 94.709614,1499.2804 C 96.298494,1497.6272 96.032274,1497.2755 94.362574,1495.8968 z M 99.177834,1497.632 C 97.865964,1499.5829 97.693374,1500.5409 95.837514,1499.91 C 95.996254,1501.7538 94.940774,1504.7094 97.914954,1503.9753 C 100.27061,1505.1073 105.26088,1504.1385 102.93149,1501.5286 C 99.462494,1501.9456 102.51527,1498.7473 100.52927,1498.1372 C 100.08201,1497.9604 99.627754,1497.8018 99.177834,1497.632 z M 230.44785,1498.0007 C 228.93492,1498.6026 226.97007,1500.3382 227.96462,1501.7751 C 232.30476,1504.1049 233.99218,1501.3862 230.65478,1498.2766 L 230.44785,1498.0007 z M 105.55479,1498.2176 C 104.53,1501.9425 109.22918,1502.6731 107.98411,1498.6948 C 107.17433,1498.5357 106.36457,1498.3767 105.55479,1498.2176 z M 219.27732,1499.5841 C 217.77177,1500.6001 214.33639,1500.4402 215.34504,1503.0095 C 216.67491,1505.8607 213.40408,1505.3568 213.68012,1507.7655 C 211.54839,1508.2334 206.81564,1509.0555 205.42479,1508.6239 C 207.79671,1507.0326 206.56958,1505.5841 204.71604,1504.1754 C 203.37425,1503.7018 200.12527,1504.0402 199.43295,1505.6523 C 199.07026,1509.0897 195.62807,1507.6511 193.43461,1509.2491 C 192.50931,1511.3498 188.88321,1515.8222 193.75591,1513.6204 C 197.76637,1513.1308 198.85525,1509.3725 202.799,1509.5261 C 205.13214,1508.4878 206.90957,1513.0747 209.25637,1511.6873 C 212.50938,1510.1179 216.65104,1511.0467 219.87185,1509.9744 C 220.92921,1506.8898 224.45604,1508.6946 226.59646,1506.8376 C 228.66365,1504.4736 224.38957,1504.9835 226.11822,1503.3994 C 225.37407,1500.4926 223.98255,1501.238 222.40073,1503.1847 C 221.30724,1501.5166 222.73448,1499.7503 219.44931,1499.639 L 219.27732,1499.5841 z M 264.50171,1501.1024 C 264.00431,1503.7985 264.69275,1505.3087 267.62728,1504.5729 C 269.11211,1503.6482 265.86346,1500.8824 264.50171,1501.1024 z M 127.76571,1501.7098 C 128.69564,1504.8905 126.32985,1504.991 123.71287,1504.6676 C 119.72217,1502.3907 117.86512,1504.9895 121.64758,1507.2779 C 124.83604,1507.5871 128.65731,1508.1996 130.60715,1505.7442 C 132.94069,1506.1357 132.17817,1501.3884 130.20177,1501.9866 C 129.38975,1501.8943 128.57773,1501.802 127.76571,1501.7098 z M 238.12623,1502.4906 C 238.11417,1507.0643 243.64063,1502.7172 239.51442,1502.4906 C 239.05169,1502.4906 238.58897,1502.4905 238.12623,1502.4906 z M 131.93026,1508.7374 C 132.3142,1511.6049 134.92005,1512.7297 137.48299,1512.2079 C 137.03052,1509.712 134.37633,1508.1768 131.93026,1508.7374 z M 148.39324,1509.2147 C 145.163,1510.7393 145.27934,1513.1016 148.87151,1512.2079 C 151.25344,1513.3211 151.43124,1509.4523 149.21763,1509.5257 C 148.94283,1509.4219 148.66804,1509.3183 148.39324,1509.2147 z M 171.62361,1510.7112 C 169.48019,1510.3207 167.10906,1511.958 168.23741,1513.6586 C 170.52965,1513.6345 171.67377,1513.2284 171.62361,1510.7112 z M 179.82256,1510.8197 C 179.81049,1515.3934 185.33696,1511.0464 181.21075,1510.8197 C 180.74801,1510.8197 180.28529,1510.8197 179.82256,1510.8197 z "},"ca46":{"name":"CA-46","path":"M 218.67134,976.43614 L 217.25352,976.91463 L 217.27124,979.37812 L 219.11441,980.29971 C 220.12141,980.80332 221.13126,981.24982 221.36521,981.29218 L 221.79055,981.36308 L 224.69709,982.01879 L 225.51233,981.9479 L 227.9758,981.62889 L 227.6768,980.25173 L 230.04936,981.34532 L 231.96342,982.28466 L 232.58372,982.85179 C 233.55328,983.74836 234.71817,985.18819 235.17124,986.04189 C 235.62432,986.89547 236.77879,988.49041 237.74105,989.58644 L 239.4956,991.57139 L 240.59441,991.57139 C 241.20646,991.57139 242.20645,991.30944 242.80976,990.98651 L 243.90857,990.40169 L 244.18045,988.49035 L 238.9415,982.34529 L 235.57887,983.1176 C 234.13518,979.69509 233.80783,979.86081 234.41495,979.02401 L 233.59452,978.1381 L 230.91151,981.12125 L 230.19115,980.86684 L 227.56818,979.69713 L 225.0161,979.11226 L 225.51233,981.7135 L 224.80342,981.80612 L 221.79055,981.02631 L 221.79055,978.74011 L 218.67134,976.43614 z M 204.20956,993.71582 L 204.20956,994.03483 C 204.20956,994.20996 204.50331,995.01267 204.8653,995.80711 L 205.52105,997.24268 L 206.14134,997.26037 C 206.48117,997.26735 207.40193,997.76177 208.17946,998.35919 L 209.59728,999.4403 L 208.37441,1002.6835 L 209.49095,1005.2002 L 210.96194,1005.5015 C 211.76901,1005.662 213.31615,1006.2549 214.40016,1006.8307 L 216.36738,1007.894 L 217.82065,1007.3269 L 217.82065,1006.5649 C 217.82065,1006.1468 217.17393,1004.5923 216.38511,1003.1089 C 215.59635,1001.6254 214.53527,999.96541 214.02798,999.40486 C 213.52074,998.84436 212.84869,998.37694 212.53926,998.37694 C 212.22984,998.37694 210.90786,997.50129 209.59728,996.42743 L 207.22243,994.47793 L 204.20956,993.71582 z M 200.18649,1020.9912 L 198.82184,1021.4342 L 199.19402,1025.3155 L 199.7257,1025.8472 C 200.01131,1026.1436 200.23966,1026.9578 200.23966,1027.6372 C 200.23966,1028.3165 200.63455,1029.8288 201.1258,1031.0045 C 201.6171,1032.1804 202.7012,1033.9858 203.51837,1035.0099 L 204.98936,1036.8708 L 207.00976,1036.729 C 208.11873,1036.658 209.03016,1036.4579 209.03016,1036.2682 C 209.03016,1036.0786 207.76625,1034.1676 206.22996,1032.0325 L 203.44748,1028.1512 L 200.18649,1020.9912 z "},"ca24":{"name":"CA-24","path":"M 148.72119,878.99822 C 146.46963,880.43697 145.47859,881.3505 144.32998,883.15691 L 137.60526,882.41318 L 137.29013,883.44434 L 138.49528,886.64816 L 137.30048,889.26285 L 136.15588,888.11861 C 136.15588,887.62787 135.7546,887.21478 135.59201,887.21478 L 131.14036,890.13901 L 127.7231,888.38578 L 124.05342,892.23131 L 120.27627,897.28131 L 120.27627,898.07881 L 119.70914,899.7625 C 117.80977,902.59814 118.496,903.28267 119.53192,904.83121 L 120.63073,906.39082 L 123.67904,909.97082 L 123.67904,911.47722 L 139.27508,912.27478 L 152.53172,919.59425 L 168.05687,922.37676 L 177.13092,930.08613 L 175.28776,933.66613 L 176.70558,935.08396 C 177.48583,935.86415 178.12329,936.76379 178.1234,937.06891 L 178.1234,937.61834 L 180.23244,938.29181 L 181.47303,945.82396 L 186.29363,950.73319 L 186.94934,950.73319 C 187.30425,950.73319 188.96775,951.73117 190.65343,952.94851 L 194.19213,955.47904 L 194.17703,954.05447 L 203.2366,949.51029 L 209.29778,950.80408 L 210.07691,946.65111 L 212.32835,946.48489 L 211.81633,941.94372 L 206.47983,911.08732 L 201.3335,910.02781 L 201.24709,908.5543 L 189.18241,906.16039 L 189.05512,903.16788 L 187.23229,902.98158 L 187.53355,901.59245 L 182.66043,900.70178 L 182.66043,899.21307 L 175.57132,897.95478 C 173.06578,895.21634 171.24302,893.26576 168.21226,891.15763 L 165.58318,891.01261 L 161.05381,886.66795 C 159.10231,885.28319 158.01435,884.84957 157.85372,884.03046 L 155.5063,883.69121 L 153.31644,880.77826 L 151.55606,880.50814 L 150.72338,879.01239 L 148.72119,878.99822 z M 152.19501,996.10349 L 152.6735,998.65557 L 156.27125,1001.2076 L 159.95759,1001.2076 L 158.77013,998.63782 L 155.0838,996.10349 L 152.19501,996.10349 z "},"ca23":{"name":"CA-23","path":"M 98.96875,823.875 L 99.75,831.34375 L 101.625,832.90625 C 102.65978,833.77016 103.80191,834.46876 104.15625,834.46875 L 104.78125,834.46875 L 105.6875,836.59375 C 106.1847,837.76345 106.75982,839.37643 106.96875,840.15625 C 107.17762,840.93605 108.10746,842.89368 109.03125,844.53125 L 110.71875,847.53125 L 111.25,847.53125 C 111.54519,847.53125 112.821,848.1538 114.0625,848.9375 L 116.3125,850.375 L 116.3125,856.375 L 113.09375,861.4375 L 113.6875,862.84375 C 114.02693,863.61045 115.26779,865.17534 116.4375,866.3125 L 118.5625,868.375 L 118.5625,867.375 L 120.15625,867.375 L 124.25,870.96875 L 124.25,872.46875 C 124.25,873.29052 123.85065,875.27329 123.375,876.875 L 122.5,879.78125 L 120.75,881.5625 L 120.9375,882.3125 L 119.65625,885.15625 L 120.09375,885.46875 C 120.34414,885.65294 120.95022,886.52249 121.40625,887.40625 L 122.21875,889.03125 L 120.625,892.0625 L 119.03125,895.09375 C 118.1087,897.11063 117.1825,899.208 116.84375,901.4375 C 116.82215,902.74187 116.8594,903.53411 116.90625,904.0625 C 116.81012,904.19755 116.72294,904.32618 116.65625,904.5 L 116.34375,905.375 L 117,907.0625 L 119.21875,907.0625 L 122.5,910.375 L 123.25,914.90625 L 127.28125,915.28125 C 129.50734,915.48025 133.25423,915.91431 135.59375,916.25 L 139.84375,916.84375 L 142.34375,918.40625 L 145.3125,918.40625 L 148.59375,921.6875 L 149.1875,921.0625 L 151.96875,923.65625 L 156.65625,924.0625 L 160,926.4375 L 161.625,925.125 L 167.625,926.375 L 169.71875,928.34375 C 170.86764,929.42884 172.02246,930.3125 172.28125,930.3125 C 172.53997,930.31247 173.24316,930.98131 173.84375,931.78125 L 174.9375,933.21875 L 176.5625,930.125 L 168.0625,922.9375 L 152.53125,920.15625 L 139.28125,912.84375 L 123.59375,912.03125 L 123.0625,910.65625 C 122.7719,909.89187 121.48288,908.00487 120.1875,906.46875 C 119.49362,905.64577 118.82989,904.91848 118.3125,904.40625 C 117.64131,903.00997 119.65418,897.02997 120.21875,896.28125 C 120.47112,896.21401 121.12321,895.42386 121.6875,894.46875 C 122.2776,893.46978 123.86882,891.56851 125.21875,890.21875 L 127.65625,887.75 L 130.78125,889.40625 C 132.20064,888.53503 133.84506,887.90802 135,886.6875 C 134.99014,886.51088 135.05818,886.44897 134.3335,885.62646 C 135.0708,885.2526 133.43506,883.48128 132.65625,882.84375 C 132.54366,882.71221 132.44097,882.58156 132.34375,882.4375 C 132.32024,882.41912 132.30481,882.39343 132.28125,882.375 C 131.81585,882.011 131.3513,881.63959 131.03125,881.15625 C 130.695,880.64844 130.54133,880.01541 130.78125,879.25 C 130.87887,878.81674 130.90472,878.2365 130.78125,877.90625 C 130.71951,877.74112 130.64591,877.63509 130.53125,877.59375 C 130.41659,877.55241 130.21981,877.5809 129.90625,877.71875 L 129.84375,877.71875 L 129.78125,877.71875 C 129.34067,877.6951 128.70964,877.83461 128.09375,877.875 C 127.47786,877.91539 126.82374,877.84791 126.40625,877.3125 L 126.25,877.09375 L 126.46875,876.9375 C 126.68732,876.80087 126.77912,876.68709 126.8125,876.59375 C 126.84588,876.50041 126.83748,876.41026 126.78125,876.28125 C 126.66878,876.02324 126.35355,875.68433 126.03125,875.34375 L 126,875.34375 L 126,875.3125 C 125.32909,874.30727 125.41843,872.83213 126.09375,871.8125 C 126.09189,871.80408 126.09573,871.78969 126.09375,871.78125 C 126.00549,871.40506 125.79355,871.0098 125.59375,870.59375 C 125.38946,870.16837 125.18261,869.72439 125.1875,869.21875 L 125.1875,869.09375 L 125.28125,869.03125 C 125.48608,868.85071 125.55625,868.66904 125.5625,868.5 C 125.56875,868.33096 125.49463,868.15057 125.375,867.9375 C 125.13575,867.51135 124.68919,867.07567 124.40625,866.6875 C 124.09241,866.30288 123.80026,865.64996 123.75,865.03125 C 123.72487,864.7219 123.77339,864.40121 123.96875,864.15625 C 124.16411,863.91129 124.48859,863.80749 124.90625,863.84375 L 124.96875,863.84375 L 125.03125,863.875 C 125.37864,864.07174 125.5813,864.03619 125.71875,863.96875 C 125.8562,863.90131 125.96208,863.74683 126,863.53125 C 126.03792,863.31567 125.98761,863.05409 125.875,862.84375 C 125.76239,862.63341 125.58279,862.47162 125.3125,862.40625 L 125.28125,862.40625 L 125.25,862.40625 C 124.36054,861.91548 123.34343,862.03927 122.25,862.03125 C 122.23976,862.03163 122.22899,862.03095 122.21875,862.03125 C 120.93151,862.06853 119.66046,861.44184 118.75,860.625 L 118.71875,860.59375 L 118.6875,860.5625 C 118.07383,859.49148 118.32026,858.00142 118.8125,856.9375 C 118.86572,856.71304 118.84811,856.52089 118.75,856.3125 C 118.65189,856.10411 118.46501,855.88669 118.28125,855.65625 C 117.91373,855.19538 117.4499,854.68496 117.46875,853.96875 C 117.36327,852.61284 117.55149,851.39744 116.75,850.375 L 116.6875,850.3125 L 116.6875,850.21875 C 116.72548,849.64975 116.58684,849.18021 116.3125,848.90625 C 116.03816,848.63229 115.64729,848.51924 115.0625,848.6875 L 115,848.6875 L 114.96875,848.6875 C 113.83894,848.58467 112.50903,848.18299 111.84375,847.09375 C 111.83558,847.08038 111.82047,847.07609 111.8125,847.0625 C 111.10531,846.19235 110.36071,845.32699 110.125,844.125 C 110.11535,844.107 110.10375,844.08067 110.09375,844.0625 C 109.81609,843.55799 109.42027,843.00348 109.09375,842.40625 C 108.75547,841.78751 108.48577,841.12462 108.59375,840.4375 L 108.59375,840.375 L 108.65625,840.3125 C 108.8932,840.08138 109.20534,839.99593 109.5,839.96875 C 109.79466,839.94157 110.0863,839.97161 110.34375,839.96875 C 110.6012,839.96589 110.81706,839.91322 110.9375,839.84375 C 111.04074,839.78421 111.09448,839.67042 111.125,839.46875 C 110.93002,839.13731 110.62318,838.84049 110.375,838.46875 C 110.11407,838.07791 109.98744,837.55793 110.25,836.9375 C 110.25509,836.92222 110.27575,836.92128 110.28125,836.90625 C 110.48824,836.34091 110.96339,835.91569 111.21875,835.5625 C 111.34982,835.38121 111.41112,835.23974 111.40625,835.09375 C 111.40138,834.94776 111.31997,834.7808 111.0625,834.53125 L 111.0625,834.5 C 110.25029,833.46316 108.82188,832.72592 108.34375,831.21875 C 108.34089,831.20975 108.34654,831.19656 108.34375,831.1875 C 107.78782,829.99519 107.41314,828.69965 107.34375,827.375 L 107.34375,827.28125 L 107.375,827.21875 C 107.50883,827.00841 107.50578,826.89009 107.46875,826.75 C 107.43172,826.60991 107.34022,826.45198 107.1875,826.28125 C 107.01336,826.08657 106.78817,825.86983 106.59375,825.625 L 98.96875,823.875 z M 123.15625,938.8125 C 122.86288,938.8125 122.44787,939.08605 122.25,939.40625 C 122.05213,939.72649 121.58511,939.95151 121.21875,939.90625 C 120.85244,939.86106 119.83345,939.86933 118.9375,939.90625 L 117.3125,939.96875 L 118.71875,941.65625 L 121.28125,941.65625 L 122.46875,943.0625 L 125.9375,943.3125 L 125.9375,941.6875 L 123.6875,940.25 L 123.6875,938.8125 L 123.15625,938.8125 z M 145.21875,943.28125 L 145.21875,944.0625 C 145.21864,944.48895 145.5476,945.16897 145.9375,945.5625 L 146.65625,946.28125 L 146.65625,950.4375 L 151.75,952.9375 L 163.09375,952.71875 L 164.09375,951.71875 C 164.64052,951.17291 165.09375,950.57457 165.09375,950.375 C 165.09364,950.1755 164.63962,949.6644 164.09375,949.25 C 163.54778,948.83568 162.64942,948.47868 162.09375,948.46875 L 161.0625,948.46875 L 160.40625,950.15625 L 157.90625,950.15625 L 153.59375,946.1875 L 150.84375,946.1875 L 149.3125,945.125 C 148.46727,944.52747 147.20183,943.85956 146.5,943.65625 L 145.21875,943.28125 z M 127.59375,944.625 L 128.46875,945.59375 C 128.94548,946.12057 129.64107,947.42853 130,948.5 C 130.35898,949.57148 131.14357,951.04529 131.78125,951.75 L 132.96875,953.03125 L 133.84375,952.78125 C 134.33268,952.6496 135.75232,952.35758 137,952.125 C 138.24756,951.89239 139.81893,951.74762 140.46875,951.8125 L 141.625,951.9375 L 141.625,948.46875 L 139.6875,948.46875 L 138.46875,947 L 139.03125,944.78125 L 127.59375,944.625 z "},"mi4":{"name":"MI-4","path":"M 1788.1469,306.76346 L 1786.3568,309.31554 L 1784.7441,309.31554 L 1783.9111,311.28277 C 1783.4591,312.36447 1783.0959,313.74875 1783.0959,314.36653 L 1783.0959,315.50078 L 1780.278,318.53138 L 1779.9766,320.58722 C 1779.8019,321.71894 1779.3367,323.28107 1778.9487,324.06088 L 1778.2398,325.47871 L 1775.1561,325.83316 L 1775.1561,324.62801 L 1772.9762,324.62801 L 1772.2495,327.95989 L 1770.6368,329.2891 L 1768.7227,328.56247 L 1767.9075,329.89168 L 1768.4037,331.64623 C 1768.6818,332.61614 1768.9176,334.12894 1768.9176,335.01356 L 1768.9176,336.62633 C 1772.596,335.88245 1776.3469,335.2403 1780.1007,335.08445 L 1782.5287,350.94633 L 1804.0796,347.77395 L 1806.9153,369.87425 L 1797.15,371.32752 L 1805.4797,424.49583 L 1816.1134,422.70583 L 1818.0275,433.23316 L 1860.2608,427.03019 L 1862.1394,437.59296 L 1876.3531,435.14722 L 1877.5405,436.77771 L 1881.475,436.58276 L 1877.7178,417.1586 L 1884.0802,416.36108 L 1881.3687,408.84662 L 1876.8316,407.37563 L 1875.5378,404.52227 L 1876.2113,401.84613 L 1875.4138,399.34722 L 1869.2994,400.07385 L 1869.2994,397.20276 L 1863.9117,398.03573 L 1861.271,382.35108 L 1853.2249,383.69801 L 1852.5869,384.3892 L 1842.2013,386.1792 L 1838.6745,364.45108 L 1849.0778,362.71425 L 1845.3914,342.12039 L 1824.8685,345.31049 L 1821.2176,323.70643 L 1801.1199,326.89653 L 1801.8111,329.66128 L 1800.5528,330.44108 L 1799.5603,328.88148 L 1799.5249,330.01574 L 1797.5045,327.41049 L 1795.6081,328.13712 L 1795.236,329.34227 C 1795.027,330.00073 1794.4958,330.87991 1794.0663,331.3095 L 1793.2865,332.0893 L 1793.9422,333.15267 L 1793.2333,335.40346 L 1790.3267,335.40346 L 1790.8939,330.24613 L 1792.7016,328.26118 L 1792.4535,320.1796 L 1791.7269,320.78217 C 1791.3285,321.11283 1791.1035,321.488 1791.2306,321.61514 C 1791.3578,321.74227 1791.2587,322.79062 1791.0002,323.93682 L 1790.5217,326.01039 L 1791.7623,326.79019 L 1789.9014,331.45128 L 1789.9014,334.92494 L 1787.4734,334.55276 L 1785.9138,329.44861 L 1786.6404,324.91158 L 1787.5974,324.29128 L 1786.9594,322.05821 C 1786.6,320.82434 1786.376,319.29699 1786.4632,318.67316 C 1786.5503,318.04932 1786.8826,317.36894 1787.2075,317.16673 L 1787.7924,316.81227 L 1785.3644,312.87781 L 1785.3644,310.62702 L 1788.2,309.33326 L 1788.1469,306.76346 z M 1768.7227,312.66514 L 1765.7984,313.00187 L 1765.9757,316.84772 L 1769.2012,319.48841 L 1770.3355,319.13395 L 1769.9456,314.13613 L 1768.7227,312.66514 z M 1763.8844,320.02009 L 1762.5906,322.44811 C 1762.7564,323.12445 1763.1044,323.60065 1763.5477,324.06088 L 1765.9225,322.96207 L 1765.7984,320.39227 L 1763.8844,320.02009 z "},"wi8":{"name":"WI-8","path":"M 1590.6089,265.15039 L 1592.4697,283.83019 L 1587.72,284.64544 L 1589.4923,299.12494 L 1607.2505,296.82098 C 1608.9784,298.65225 1611.37,301.38152 1611.7313,302.54903 L 1614.6586,302.50999 L 1614.6586,300.56049 L 1611.0621,297.14101 L 1620.5177,296.24279 L 1622.1731,301.48207 L 1633.1435,300.61366 L 1635.6778,332.7096 L 1633.9942,333.98564 L 1633.6574,339.08979 L 1629.3685,339.44425 L 1635.0797,387.38015 L 1693.4718,380.77375 L 1692.692,375.15564 L 1707.3842,373.33019 L 1708.3235,372.40861 L 1709.4578,358.42534 C 1710.443,356.18651 1711.3639,353.92107 1712.2402,351.63752 C 1712.814,350.1198 1713.4545,347.6953 1713.658,346.24979 L 1714.0302,343.62682 L 1714.81,342.36851 C 1715.2441,341.67766 1715.6075,340.78739 1715.6075,340.38356 L 1715.6075,339.6392 L 1717.9824,338.16821 L 1717.3267,335.52752 L 1718.8154,334.28692 L 1718.3191,330.86643 L 1720.1446,328.06623 L 1720.1446,325.76227 L 1721.651,325.76227 L 1722.9802,323.21019 L 1722.6966,315.27039 L 1725.3374,314.89821 L 1725.0006,314.04752 C 1724.8208,313.57894 1724.6816,312.69633 1724.6816,312.09801 L 1724.6816,311.01692 L 1723.9727,311.01692 L 1719.5774,314.17158 L 1719.5774,318.26554 L 1715.0759,320.3391 L 1714.3138,325.47871 L 1711.2123,331.14999 L 1709.9186,336.57316 L 1710.4857,337.65425 C 1710.8041,338.24935 1711.0705,339.00547 1711.0705,339.33791 L 1711.0705,339.94049 L 1709.4223,339.94049 L 1708.3944,338.09732 L 1706.817,340.22405 L 1701.7129,342.01405 L 1697.8316,349.29811 L 1697.3708,351.85019 L 1696.8923,354.40227 L 1691.2388,358.72663 L 1690.0513,363.17504 L 1687.3574,363.86623 L 1683.6357,361.57999 L 1685.0889,359.82544 L 1685.5675,351.24762 C 1686.4174,349.65925 1687.3467,348.1018 1687.8182,346.35613 C 1687.8182,345.97546 1688.4624,344.70425 1689.2538,343.53821 L 1690.6893,341.4292 L 1690.0159,338.30999 L 1691.2033,336.07692 L 1693.6313,335.19078 C 1694.9605,334.70965 1696.552,334.24002 1697.1759,334.14514 L 1698.3101,333.96791 L 1698.8772,326.89653 L 1697.0518,326.89653 L 1691.9122,321.89871 L 1693.525,314.15385 L 1694.6238,313.05504 L 1694.6238,310.59158 L 1693.0642,309.29781 L 1691.2033,312.15118 L 1688.0487,312.15118 L 1686.9498,313.24999 L 1684.3269,312.5588 L 1684.7168,311.37138 C 1684.9347,310.71251 1685.0922,309.31001 1685.0535,308.26989 L 1684.9826,306.39128 L 1687.2334,303.50247 L 1686.4891,300.52504 L 1684.8054,299.28445 L 1685.6561,297.90207 L 1687.2511,298.50465 L 1687.2511,296.44881 L 1684.894,294.32207 L 1685.1598,292.92197 C 1685.3068,292.15323 1685.2992,291.18719 1685.1421,290.77752 L 1684.8586,290.03316 L 1683.3344,290.03316 L 1682.271,288.13683 L 1678.2302,288.29633 L 1676.458,286.54178 L 1673.3564,287.62286 L 1670.2372,285.81514 L 1670.2372,285.07079 C 1670.2372,284.65918 1670.6387,283.71944 1671.1234,282.9795 L 1671.9918,281.63257 L 1670.8044,280.88821 L 1670.8044,278.49564 L 1666.9054,277.44999 L 1661.7126,277.96395 L 1660.2239,276.95376 L 1653.6133,276.47524 L 1652.5145,275.37643 L 1651.1321,275.90811 C 1650.3684,276.19847 1649.3479,276.8061 1648.8813,277.27277 C 1648.4146,277.73944 1647.8194,278.12346 1647.5521,278.12346 C 1647.2847,278.12346 1646.6748,277.74245 1646.2052,277.27277 L 1645.3545,276.42207 L 1639.7541,276.4398 L 1626.8519,270.8394 L 1590.6089,265.15039 z M 1730.3529,302.36821 L 1727.9958,302.74039 C 1726.6998,302.94763 1725.4156,303.26269 1725.1424,303.43158 L 1724.6462,303.73286 L 1725.426,307.86227 L 1726.6134,308.85475 C 1727.268,309.40206 1727.9577,309.85457 1728.1553,309.86494 C 1728.3528,309.8753 1728.7099,309.30845 1728.9351,308.60663 C 1729.1844,307.88763 1729.2534,307.14477 1729.2541,306.39128 L 1729.1655,305.45197 L 1730.3529,304.70762 L 1730.3529,302.36821 z "},"mi1":{"name":"MI-1","path":"M 1640.7465,140.80742 L 1639.4705,141.19732 C 1638.7687,141.40937 1637.9591,141.8066 1637.6628,142.08346 C 1637.3665,142.36033 1636.6532,142.5797 1636.0855,142.5797 L 1635.0576,142.5797 L 1632.9308,143.96208 C 1631.7674,144.72591 1630.0834,146.12955 1629.1736,147.08128 C 1628.2639,148.03301 1627.3068,148.81812 1627.0469,148.81812 L 1626.5683,148.81812 L 1626.5683,150.44861 L 1625.2923,150.83851 C 1624.5905,151.05741 1622.9954,151.94163 1621.7477,152.78802 C 1620.5001,153.6344 1617.6117,155.54075 1615.3321,157.04148 L 1611.185,159.77079 L 1609.519,161.79118 C 1608.6014,162.90434 1607.8531,164.15141 1607.8531,164.55594 L 1607.8531,165.30029 L 1609.2178,165.81425 C 1609.9672,166.09922 1610.7499,166.59962 1610.9546,166.93079 C 1611.1592,167.26195 1611.6287,167.52589 1612.0002,167.51564 C 1612.3717,167.50539 1614.5602,166.42075 1616.874,165.10534 L 1621.092,162.71277 L 1621.5351,161.38356 L 1619.5147,161.01138 L 1622.3149,158.38841 L 1630.5382,154.3299 L 1635.0753,150.43089 L 1635.0753,147.84336 L 1640.7465,142.54425 L 1640.7465,140.80742 z M 1673.9945,182.15465 L 1663.1481,182.66861 L 1655.2083,185.29158 L 1654.6412,185.98277 C 1654.3293,186.35455 1652.3668,187.74307 1650.2814,189.06653 L 1646.4887,191.4591 L 1645.3368,193.92257 C 1644.7004,195.27629 1643.4109,197.27673 1642.4657,198.35326 L 1640.7465,200.30277 L 1636.8121,202.16366 L 1635.2348,204.27267 C 1634.3696,205.43124 1633.4871,206.46563 1633.2853,206.55891 C 1633.0834,206.65218 1632.0137,207.61471 1630.8927,208.70336 L 1628.8546,210.68831 L 1628.4824,212.21247 C 1628.2798,213.05803 1627.7772,214.42534 1627.3659,215.24306 L 1626.6215,216.73178 L 1620.7553,218.64584 L 1619.3729,218.11415 L 1616.2182,223.5196 L 1607.5695,229.35039 L 1604.4681,229.35039 L 1599.9133,231.17584 L 1597.1131,230.46693 L 1591.3178,232.68227 L 1590.2366,233.94059 C 1589.6358,234.6334 1589.125,235.34943 1589.1201,235.53564 C 1589.1152,235.72185 1587.7754,237.32926 1586.1427,239.11564 L 1583.183,242.37663 L 1579.5675,243.79445 C 1577.5795,244.57333 1575.0737,245.71461 1574.0026,246.34653 C 1572.9316,246.97845 1571.767,247.49851 1571.4151,247.49851 C 1571.0631,247.49851 1570.2004,248.02889 1569.501,248.68593 L 1568.2427,249.89108 L 1568.863,251.52158 L 1571.0961,249.50118 L 1572.9924,251.84059 L 1574.3925,251.3798 L 1574.3925,252.72673 L 1576.0939,252.07098 L 1577.0864,253.15207 C 1579.1023,255.72045 1580.2854,258.81244 1582.2083,261.44633 L 1583.183,262.63376 L 1627.419,269.81148 L 1638.7616,274.8093 L 1645.8862,275.11059 L 1647.4103,277.20187 L 1648.6509,274.88019 L 1653.4184,274.11811 L 1654.2336,275.4296 L 1660.5252,275.65999 L 1662.0139,276.86514 L 1667.118,276.51069 L 1671.9386,278.40702 L 1671.9386,280.26791 L 1673.7464,280.9591 L 1671.4247,284.91128 L 1673.7287,286.52405 L 1676.7238,284.96445 L 1679.0986,287.19752 L 1682.7141,287.19752 L 1683.7065,288.08366 C 1684.2524,288.57425 1685.4294,289.57109 1686.3118,290.28128 L 1687.9069,291.55732 L 1685.9751,293.4891 L 1688.3854,296.0589 L 1688.3854,297.90207 L 1686.5954,299.67435 L 1687.9423,299.67435 L 1687.3043,301.34029 L 1688.4917,302.08465 L 1687.8005,305.57603 L 1686.6308,306.30267 L 1686.1877,311.69039 L 1690.3703,310.92831 L 1692.6388,308.26989 L 1695.4534,310.47163 L 1695.6857,313.4784 L 1694.1343,315.20162 L 1693.086,321.45025 L 1697.7784,325.76227 L 1698.5937,325.76227 L 1698.5937,323.31653 L 1701.7129,318.08831 C 1703.4284,315.21332 1704.8321,312.58023 1704.8321,312.23979 C 1704.8321,311.89936 1705.5058,310.14322 1706.3386,308.34079 C 1707.1713,306.53835 1707.9191,304.55165 1707.9867,303.92781 C 1708.0543,303.30397 1708.3778,302.02792 1708.7134,301.09217 C 1709.0489,300.15641 1710.0203,297.25931 1710.8756,294.65881 L 1712.4352,289.94455 L 1717.2203,284.929 L 1716.6355,278.97415 L 1718.3191,276.74108 L 1720.1269,278.24752 L 1720.694,280.32108 C 1721.0095,281.45702 1721.2771,283.20636 1721.2788,284.22009 L 1721.2788,286.06326 L 1721.7396,286.06326 C 1721.9919,286.06326 1722.6938,285.68826 1723.2992,285.23029 C 1723.9047,284.77233 1724.8525,284.38953 1725.4083,284.3796 L 1726.4184,284.36187 L 1726.6843,283.65296 C 1726.8269,283.26306 1727.0025,282.43657 1727.0919,281.8098 C 1727.1813,281.18302 1727.6923,280.06533 1728.2085,279.32861 L 1729.13,277.98168 L 1728.0312,275.09287 L 1729.6794,273.44465 L 1732.3024,275.28782 L 1734.8899,275.28782 L 1734.9077,273.30287 L 1736.9812,270.62673 L 1739.4269,271.38881 L 1739.4269,272.52306 C 1739.4269,273.14372 1739.1379,274.78815 1738.7889,276.17395 L 1738.1509,278.69059 L 1737.5129,278.76148 C 1737.16,278.79842 1736.6835,278.79841 1736.4495,278.76148 L 1736.0242,278.69059 L 1736.0242,281.45534 L 1734.8899,282.16425 L 1734.8899,284.929 L 1733.1885,284.929 L 1733.1885,286.38227 L 1734.3228,287.35702 C 1734.9502,287.89422 1735.8552,288.33178 1736.3255,288.33178 L 1737.1762,288.33178 L 1736.4673,285.51385 L 1738.3459,284.78722 L 1738.0091,282.37692 L 1740.5612,282.02247 L 1740.5612,279.34633 L 1743.964,278.60197 L 1743.964,276.42207 L 1744.6729,276.35118 C 1745.0628,276.31422 1745.6852,276.32281 1746.0553,276.3689 L 1746.7287,276.45752 L 1747.4908,268.74811 L 1748.4124,267.61386 C 1748.925,266.997 1750.0739,266.03219 1750.9467,265.4694 L 1752.5241,264.4592 L 1753.4988,264.56554 C 1754.0296,264.63135 1755.1583,264.4043 1756.0155,264.05158 L 1757.5751,263.41356 L 1760.4462,263.96296 C 1762.0305,264.26343 1763.5434,264.62226 1763.7958,264.77821 L 1764.2566,265.06178 L 1764.8414,262.81098 L 1765.8871,262.49197 C 1766.4625,262.31167 1767.4012,261.89941 1767.9784,261.58811 L 1769.024,261.03871 L 1773.3661,261.76534 L 1775.5814,260.57791 L 1776.5916,258.43346 C 1777.1488,257.25297 1778.1959,255.33198 1778.931,254.16227 L 1780.278,252.03554 L 1783.5921,252.03554 L 1784.2479,250.9899 L 1786.6404,251.18485 C 1787.9616,251.2935 1790.4543,251.6238 1792.1699,251.9292 C 1793.8855,252.23459 1797.1421,252.79875 1799.4008,253.1698 L 1803.4948,253.84326 L 1806.2772,256.34217 C 1807.8075,257.71799 1809.3536,258.84109 1809.6978,258.84108 C 1810.0418,258.84108 1810.8096,259.33264 1811.4168,259.9399 C 1812.0241,260.54715 1813.3472,261.46413 1814.3411,261.97801 L 1816.1311,262.91732 L 1817.035,261.46405 L 1816.2552,259.9399 L 1815.4754,258.41574 L 1816.1489,257.74227 L 1814.8374,256.14722 L 1815.5463,254.30405 L 1817.0881,254.30405 L 1816.0248,251.48613 C 1816.3007,250.57937 1816.6738,249.77394 1817.3362,249.09356 L 1817.9034,248.72138 L 1820.1364,250.28098 L 1822.1568,249.1999 L 1823.9291,250.9899 L 1824.0532,253.45336 L 1824.5849,251.46841 L 1826.1976,251.46841 L 1826.1976,252.67356 L 1828.4661,251.96465 L 1828.4661,252.47861 C 1828.4661,252.76148 1829.0809,253.2712 1829.8308,253.61287 L 1831.1955,254.23316 L 1833.1804,252.03554 L 1835.7679,252.03554 L 1836.0692,251.57475 C 1836.229,251.31614 1837.7135,250.81177 1839.3657,250.45821 C 1841.0178,250.10467 1844.0197,249.64317 1846.0471,249.43029 C 1848.0746,249.21742 1850.4991,249.05852 1851.4349,249.09356 C 1852.3706,249.1286 1854.5621,249.20104 1856.3087,249.25306 L 1859.481,249.3594 L 1861.5368,248.20742 L 1865.3473,249.80247 L 1867.5803,248.61504 L 1868.0766,246.77188 C 1868.3498,245.76533 1868.4532,244.75503 1868.3247,244.52108 C 1868.1961,244.28714 1867.5907,244.09574 1866.9778,244.09574 L 1865.8612,244.09574 L 1864.7978,241.26009 L 1863.6281,241.26009 L 1863.6281,239.55871 L 1862.3521,239.47009 C 1861.6503,239.42306 1860.3104,239.44596 1859.3747,239.52326 L 1857.6733,239.66504 L 1856.9289,240.85247 L 1855.1744,240.51574 C 1854.207,240.32227 1853.4198,240.25131 1853.4198,240.37395 C 1853.4198,240.49661 1853.5671,240.9971 1853.7566,241.49049 L 1854.111,242.39435 L 1855.5643,242.39435 L 1855.9188,243.29821 C 1856.1081,243.7916 1856.2555,244.6678 1856.2555,245.24772 L 1856.2555,246.29336 L 1855.0503,247.03772 L 1852.959,245.14138 L 1852.2147,247.49851 L 1850.017,247.49851 L 1850.017,246.50603 L 1845.1079,245.26544 L 1842.0772,242.87287 L 1842.0772,240.92336 L 1843.4419,239.55871 L 1840.5176,239.55871 L 1839.0998,237.85732 L 1837.3453,237.85732 L 1835.3071,239.70049 L 1833.5703,239.02702 L 1833.5703,235.8192 L 1834.935,234.45455 L 1838.0364,234.45455 L 1838.5859,233.58613 L 1837.7883,230.55554 C 1837.3555,228.88684 1836.68,227.11878 1836.2819,226.63881 L 1835.5553,225.77039 L 1835.5553,216.59 L 1834.8463,216.64316 C 1834.4564,216.67436 1833.3912,216.73816 1832.4892,216.78495 L 1830.8588,216.87356 L 1830.1498,219.7092 L 1823.9646,219.7092 L 1823.0962,221.37514 C 1822.6202,222.29542 1822.2277,223.44385 1822.2277,223.92722 L 1822.2277,224.81336 L 1820.3314,224.81336 L 1818.3819,226.58564 L 1814.4297,223.11198 L 1812.5689,223.11198 L 1807.8723,226.51475 L 1806.8621,226.51475 C 1806.3034,226.51475 1805.7153,226.30262 1805.5506,226.03623 L 1805.2493,225.53999 L 1797.7703,225.96534 L 1797.0614,225.25643 C 1796.6719,224.86215 1796.1719,224.04761 1795.9449,223.44871 L 1795.5372,222.3499 L 1796.7601,221.60554 L 1796.1753,219.08891 C 1795.8578,217.71179 1795.598,215.3578 1795.5904,213.86069 L 1795.5727,211.1491 L 1797.3095,207.7995 L 1796.4766,207.7995 C 1796.019,207.7995 1795.4993,208.03075 1795.3246,208.31346 L 1795.0056,208.82742 L 1792.0281,209.1996 C 1790.3909,209.40637 1788.1575,209.84542 1787.0658,210.17435 L 1785.0808,210.77693 L 1783.1136,212.26564 C 1782.0269,213.08481 1779.98,214.4878 1778.5766,215.38485 L 1776.0245,217.01534 L 1772.3382,217.5293 C 1770.3055,217.81483 1766.2096,218.26954 1763.2463,218.52178 L 1757.8586,218.96485 L 1751.0531,222.04861 L 1748.2529,221.51693 L 1738.1332,230.48465 L 1735.9887,230.48465 L 1735.6166,231.47712 C 1735.4095,232.02298 1734.5227,233.23523 1733.6493,234.17098 C 1732.7759,235.10675 1732.0557,236.06378 1732.0543,236.29772 C 1732.0529,236.53166 1731.6715,236.72307 1731.2036,236.72306 L 1730.3529,236.72306 L 1730.3529,235.58881 L 1728.9351,235.87237 L 1728.9351,231.92019 L 1726.8261,231.51257 L 1725.8513,232.50504 L 1727.5172,235.71287 L 1727.5172,238.99158 L 1727.1273,238.99158 C 1726.9135,238.99158 1726.1603,238.46068 1725.4614,237.80415 L 1724.2031,236.599 L 1723.5473,237.00663 C 1723.1931,237.22557 1722.6803,238.01169 1722.3954,238.76118 L 1721.8814,240.12584 L 1719.1344,240.12584 L 1718.4609,238.37128 L 1717.7343,238.4599 C 1717.3402,238.51149 1716.7257,238.5323 1716.3696,238.49534 L 1715.7316,238.42445 L 1715.0404,235.6597 L 1712.7188,234.93306 L 1708.5184,238.14089 L 1701.7129,239.55871 L 1699.7279,239.20425 C 1698.6362,239.0097 1697.4176,238.58395 1697.0164,238.26495 L 1696.2897,237.68009 L 1696.3784,236.77623 C 1696.4258,236.27812 1696.432,235.29816 1696.3961,234.59633 L 1696.3252,233.32029 L 1693.5073,233.32029 L 1692.7984,232.18603 C 1692.4088,231.56219 1691.8124,231.05178 1691.4869,231.05178 L 1690.902,231.05178 L 1689.8918,229.35039 C 1689.3403,228.41688 1688.4253,227.40554 1687.8537,227.0996 L 1686.8081,226.55019 L 1686.4359,225.06148 C 1686.2314,224.24687 1685.6063,223.08632 1685.0358,222.47396 L 1683.9901,221.35742 L 1679.5949,221.07386 L 1679.2759,219.42564 L 1677.7694,218.71673 C 1676.9365,218.32683 1675.5855,218.00782 1674.7743,218.00782 L 1673.3033,218.00782 L 1672.0804,216.78495 L 1667.437,218.04326 L 1664.5483,217.31663 L 1661.1809,218.699 L 1659.3023,217.99009 L 1660.2416,216.96217 C 1660.7519,216.39825 1661.1632,215.75365 1661.1632,215.52663 L 1661.1632,215.10128 L 1657.8845,217.05079 L 1655.7046,219.79782 C 1654.5062,221.31077 1653.3393,222.54485 1653.0993,222.54485 C 1652.8593,222.54485 1652.6563,222.78624 1652.6563,223.07653 C 1652.6563,223.36682 1652.082,224.51074 1651.3802,225.61089 L 1650.1042,227.59584 L 1648.9699,227.649 L 1647.4635,224.24623 L 1648.261,215.65069 L 1649.8561,215.03039 L 1651.522,211.82257 L 1651.522,208.63247 L 1653.7905,207.23237 L 1653.7905,204.36128 L 1655.4919,203.70554 L 1655.4919,202.50039 C 1655.4967,201.83195 1655.688,200.98735 1655.9172,200.6395 C 1656.1464,200.29164 1656.853,199.84963 1657.4768,199.64703 L 1658.6111,199.27485 L 1662.0139,194.15297 L 1666.8877,190.32485 L 1665.7002,189.58049 L 1665.7002,187.43604 L 1670.255,186.19544 L 1671.4778,186.95752 L 1673.6932,185.89415 C 1674.9085,185.3121 1675.905,184.65255 1675.9085,184.44089 C 1675.9121,184.22922 1675.4756,183.63586 1674.9515,183.11168 L 1673.9945,182.15465 z M 1819.3921,258.84108 L 1819.3921,260.96782 L 1820.6681,261.85395 C 1821.37,262.34352 1822.1356,262.75918 1822.3695,262.77554 C 1822.6035,262.79189 1822.7949,262.46906 1822.7949,262.0489 C 1822.7949,261.62875 1822.3139,260.73553 1821.7315,260.06395 C 1821.149,259.39238 1820.3834,258.84108 1820.0301,258.84108 L 1819.3921,258.84108 z M 1823.7696,263.21861 L 1825.9673,265.27445 L 1828.1826,267.31257 L 1829.9372,267.33029 L 1831.6917,267.34801 L 1832.3297,265.94791 L 1832.9677,264.54782 L 1832.5424,264.2997 C 1832.314,264.15856 1830.2516,263.85281 1827.9522,263.62623 L 1823.7696,263.21861 z M 1816.4147,266.39098 L 1815.4222,266.40871 L 1815.4222,268.96079 L 1813.7208,269.33296 C 1812.7879,269.53786 1811.1929,269.65455 1810.1762,269.59881 C 1809.1596,269.54306 1808.095,269.53177 1807.8014,269.56336 L 1807.2697,269.61653 L 1809.3256,271.12296 L 1808.5103,273.69277 L 1806.419,275.78405 L 1804.3455,277.85762 L 1802.8745,282.37692 L 1804.6467,286.57722 L 1807.7483,289.46603 L 1813.0296,289.46603 L 1813.6499,291.06108 L 1812.6929,291.87633 C 1812.1681,292.32786 1810.8657,293.11736 1809.8041,293.63088 L 1807.8723,294.57019 L 1803.4416,294.57019 L 1802.201,295.20821 C 1800.0223,296.52812 1798.2942,298.44667 1796.4766,300.20603 L 1795.041,301.58841 L 1794.403,304.54811 L 1795.5904,308.39395 L 1796.7778,312.25752 L 1796.8842,318.01742 L 1796.9905,323.77732 L 1795.8086,327.64244 L 1797.8816,327.06229 L 1799.2945,329.04098 L 1799.2413,328.19029 L 1800.7047,329.89115 L 1801.5224,329.61358 L 1800.5875,326.6544 L 1821.5897,323.19247 L 1825.5065,344.58385 L 1845.84,341.60043 L 1849.574,363.02804 L 1839.2176,364.85219 L 1842.6798,385.70068 L 1852.5691,384.03474 L 1852.8704,383.55623 L 1861.6432,381.99662 L 1864.3902,397.55722 C 1867.3018,397.07345 1870.2158,396.60425 1873.1275,396.12167 L 1873.2693,391.10613 L 1875.0416,390.43266 L 1872.0465,386.49821 L 1871.692,373.96821 L 1872.7731,373.96821 L 1872.1174,372.92257 L 1873.4288,370.05148 L 1880.3584,367.97791 L 1880.4825,365.479 L 1881.918,363.75989 L 1883.903,363.75989 L 1884.541,359.82544 L 1883.903,353.71108 L 1885.2677,349.58168 L 1887.3589,348.44742 L 1889.1489,349.13861 L 1889.1489,347.43722 L 1892.3036,344.06989 L 1891.8428,338.45177 C 1891.5932,335.36797 1891.1502,331.77482 1890.8503,330.4588 L 1890.3009,328.06623 L 1891.0098,321.24296 L 1890.4073,320.53405 C 1890.0795,320.13747 1889.6336,318.78658 1889.4148,317.5389 C 1889.1959,316.29122 1888.6602,314.70292 1888.2273,314.01207 C 1887.7944,313.32122 1887.4475,312.36419 1887.4475,311.88534 L 1887.4475,311.01692 L 1884.7005,311.01692 L 1883.8498,310.16623 C 1883.382,309.69835 1882.7197,309.31553 1882.3966,309.31554 L 1881.8117,309.31554 L 1881.2269,308.199 C 1880.8992,307.58682 1880.5242,306.37459 1880.4116,305.50514 C 1880.2989,304.6357 1880.1503,303.6726 1880.0749,303.36069 C 1879.9994,303.04877 1879.967,302.41369 1880.004,301.94286 L 1880.0749,301.07445 L 1882.432,299.60346 L 1885.1436,301.37574 L 1887.3235,301.37574 L 1884.4524,295.24366 L 1881.7762,294.02079 L 1881.7762,292.30168 L 1881.3332,292.30168 C 1881.0885,292.30168 1880.4523,291.56261 1879.9154,290.65346 L 1878.9406,289.00524 L 1880.3584,288.45584 L 1875.272,283.90108 L 1874.1023,284.02514 C 1873.4601,284.09361 1872.6623,284.31601 1872.33,284.52138 L 1871.7275,284.89356 L 1870.0261,284.41504 C 1869.0893,284.1464 1867.7053,283.581 1866.96,283.17445 L 1865.6131,282.44782 L 1858.9848,281.63257 L 1855.8479,278.63742 L 1850.3006,278.88554 L 1848.422,280.03752 L 1845.48,278.10574 L 1845.48,276.08534 L 1841.2265,272.07999 L 1838.958,271.63692 C 1837.7103,271.39914 1836.1791,271.24576 1835.5553,271.28247 L 1831.3018,271.37108 L 1831.3018,272.45217 L 1830.5929,272.45217 C 1830.2019,272.45217 1828.0403,271.55895 1825.79,270.46722 C 1823.5396,269.3755 1821.4372,268.48228 1821.1112,268.48227 C 1820.7851,268.48227 1819.948,268.16327 1819.2503,267.77336 C 1818.5527,267.38346 1817.8467,266.91448 1817.6907,266.72772 C 1817.5347,266.54096 1816.9605,266.38617 1816.4147,266.39098 z M 1781.5008,273.10791 C 1780.8274,276.8664 1780.3384,280.66782 1780.6147,284.48593 L 1780.8982,284.929 L 1784.3364,284.929 L 1786.4632,282.37692 L 1786.4986,279.32861 L 1785.3644,278.6197 L 1785.3289,275.00425 L 1783.9465,273.26742 L 1781.5008,273.10791 z "},"ma10":{"name":"MA-10","path":"M 2467.4962,334.16286 L 2466.2024,336.71494 L 2465.0681,336.96306 C 2464.4443,337.09135 2463.4872,337.17884 2462.9414,337.17573 L 2461.9489,337.17573 C 2461.6852,338.76541 2461.3963,340.15316 2460.7792,341.64187 L 2462.5692,341.64187 L 2463.4317,338.91583 L 2465.3517,338.93029 L 2466.422,342.13488 L 2466.6648,346.49363 L 2467.9661,347.24332 C 2468.7944,346.74567 2470.7082,346.52566 2473.0257,346.35613 L 2474.8688,349.86524 L 2476.1626,349.56395 L 2476.836,351.35395 L 2476.1271,352.70088 L 2475.4182,354.03009 L 2478.6792,357.73415 C 2480.4744,359.76626 2482.272,361.56341 2482.6845,361.72177 L 2483.4467,362.00534 L 2487.0798,360.19762 L 2488.8875,361.33187 L 2489.2774,364.61059 L 2490.5712,365.40811 L 2489.2065,366.79049 L 2489.7914,367.51712 C 2490.1205,367.9137 2490.5346,369.07456 2490.6952,370.10465 C 2490.8559,371.13473 2491.1999,372.25078 2491.475,372.58583 L 2491.9713,373.20613 L 2491.7232,374.51762 C 2491.5842,375.23904 2491.0874,376.35743 2490.6067,377.01653 C 2490.1257,377.67563 2489.0969,379.16719 2488.3204,380.33068 C 2487.5439,381.49419 2486.9026,382.63316 2486.9026,382.84732 C 2486.9026,383.06147 2486.9939,383.11907 2487.1152,382.9891 C 2487.2367,382.85913 2488.2362,381.57828 2489.3306,380.13573 C 2490.4249,378.69319 2491.6106,376.96375 2491.9713,376.28989 L 2492.6271,375.06702 L 2499.0604,371.98326 L 2499.9288,368.49187 L 2502.7822,367.18039 L 2502.7822,365.60306 C 2504.1669,365.28872 2505.5422,364.89819 2506.9647,364.84098 C 2507.2414,364.89695 2508.0069,364.47883 2508.6661,363.90167 C 2509.3252,363.32453 2510.8921,362.19565 2512.1398,361.40276 C 2513.3875,360.60988 2515.3897,359.60253 2516.5882,359.16969 L 2518.7681,358.38989 L 2520.4873,360.64068 L 2520.0087,354.40227 L 2515.897,345.89534 L 2510.4207,339.08979 L 2506.4685,337.10484 L 2501.2226,337.10484 L 2499.9997,338.57583 L 2502.091,339.88732 L 2502.6758,337.67197 L 2506.1849,337.67197 L 2508.3471,339.83415 L 2509.0915,341.88999 L 2509.8181,343.94583 L 2511.5904,343.64455 L 2513.8412,345.91306 L 2514.5501,347.93346 C 2514.94,349.04063 2515.259,350.48782 2515.259,351.14128 L 2515.259,352.3287 L 2513.1323,353.94148 C 2511.9626,354.83501 2510.2748,355.94934 2509.375,356.40494 L 2507.7269,357.23791 C 2507.0881,358.26324 2506.4484,359.28795 2505.795,360.30395 L 2504.1114,359.24059 L 2500.2301,360.35712 L 2495.0019,360.35712 L 2491.156,357.7696 L 2490.7839,354.49088 L 2487.895,350.71593 L 2487.1684,350.71593 C 2486.7636,350.71593 2486.3508,350.97442 2486.2469,351.28306 L 2486.0519,351.83247 L 2484.0669,351.26534 C 2482.9752,350.95036 2481.5716,350.29292 2480.9477,349.81207 L 2479.8135,348.94366 L 2481.5148,347.59672 L 2481.9047,342.77613 L 2481.4263,342.77613 L 2476.1271,338.36316 L 2476.1271,337.10484 L 2474.5675,337.10484 L 2473.1497,335.40346 L 2468.2582,335.40346 L 2467.4962,334.16286 z M 2522.1,376.23672 L 2522.738,379.49771 L 2521.5329,381.76623 L 2518.396,383.04227 C 2516.6695,383.74294 2515.259,384.4845 2515.259,384.70821 C 2515.259,384.93191 2515.4504,385.31829 2515.6844,385.5589 L 2516.1097,386.00197 L 2524.0673,385.50573 L 2527.4346,383.89296 L 2527.8245,381.87257 C 2526.4456,380.24206 2525.0792,378.60119 2523.7305,376.94564 C 2523.4171,376.55572 2522.9235,376.23672 2522.6317,376.23672 L 2522.1,376.23672 z M 2495.0196,378.07989 L 2491.9713,381.90801 L 2489.9863,388.39455 L 2487.2748,389.03257 L 2486.8849,390.20227 L 2488.728,391.12385 C 2489.7478,391.6313 2490.7803,392.06093 2491.0143,392.08088 L 2491.4396,392.11633 L 2491.4396,389.83009 L 2495.1259,387.56158 L 2504.6076,384.63732 L 2503.8987,381.07504 L 2502.215,379.39138 L 2502.215,382.38653 L 2499.0958,381.55356 L 2497.7312,378.80653 L 2495.0196,378.07989 z M 2486.0519,383.04227 C 2485.8959,383.04227 2485.7683,383.16986 2485.7683,383.32583 C 2485.7683,383.48179 2485.8959,383.60939 2486.0519,383.6094 C 2486.2078,383.6094 2486.3354,383.48178 2486.3354,383.32583 C 2486.3354,383.16987 2486.2078,383.04226 2486.0519,383.04227 z M 2485.4847,383.89296 L 2484.4923,384.67276 C 2483.9464,385.10086 2483.4998,385.54746 2483.4998,385.66524 C 2483.4998,385.78301 2483.5948,385.8779 2483.7125,385.87791 C 2483.8302,385.87791 2484.2769,385.43129 2484.7049,384.88544 L 2485.4847,383.89296 z "},"ri1":{"name":"RI-1","path":"M 2450.3405,358.23039 C 2444.7047,359.84682 2439.2047,361.95571 2433.7166,364.00801 C 2433.8811,365.60998 2434.3771,367.17617 2434.8685,368.72227 L 2443.5704,365.60306 C 2444.0471,366.5622 2444.4195,367.56789 2444.7756,368.58049 L 2446.9909,368.65138 C 2448.2024,368.68804 2450.3971,369.06943 2451.8824,369.50207 L 2454.594,370.28187 L 2456.8271,373.96821 L 2459.5918,373.96821 L 2460.1057,372.55039 L 2461.6122,373.96821 L 2460.4425,373.96821 L 2460.9919,377.65455 L 2461.4881,376.18356 L 2463.1895,377.60138 L 2462.8528,374.25177 L 2461.2046,372.26682 L 2456.8625,371.09712 L 2456.3131,370.0692 C 2456.0107,369.5042 2455.6471,368.37546 2455.4978,367.55257 C 2455.3486,366.72965 2455.0609,365.78663 2454.8598,365.46128 L 2454.4876,364.8587 L 2452.7154,365.17771 L 2450.3405,358.23039 z M 2465.3517,375.6696 L 2465.3517,377.67227 L 2462.9946,379.14326 L 2463.668,380.93326 L 2462.4451,387.66791 L 2463.6148,389.08573 L 2462.2857,390.41494 L 2463.6857,390.41494 L 2464.2174,388.9794 L 2464.7669,387.54385 L 2466.4859,386.88811 L 2466.4859,385.80702 C 2466.4859,385.21315 2465.9478,383.57543 2465.2808,382.15613 L 2464.0579,379.56861 L 2465.2276,378.41663 L 2466.1315,379.72811 C 2466.6354,380.44764 2467.0531,381.45394 2467.0531,381.9789 C 2467.0531,382.50386 2467.6156,383.96956 2468.2937,385.23989 L 2469.5166,387.56158 L 2471.023,386.30326 L 2471.023,383.57395 L 2468.1873,377.97356 L 2468.1873,375.6696 L 2465.3517,375.6696 z M 2457.979,377.93811 L 2457.979,379.67494 L 2459.769,380.36613 L 2460.7792,383.04227 L 2461.9489,383.04227 L 2461.9489,379.53316 L 2459.6804,378.94831 L 2459.6804,377.93811 L 2457.979,377.93811 z M 2458.936,383.44989 C 2459.2017,385.61964 2459.3464,387.82616 2459.9994,389.9187 L 2460.3893,390.52128 L 2461.9135,388.99712 L 2460.4247,383.94613 L 2458.936,383.44989 z "},"fl16":{"name":"FL-16","path":"M 2212.944,1342.4114 L 2171.0296,1350.6348 L 2177.7997,1387.4095 L 2145.5265,1393.9492 L 2147.9014,1397.7064 L 2151.1624,1396.9798 L 2151.9245,1399.0002 L 2150.5953,1399.4433 L 2150.5953,1401.6054 L 2152.7574,1401.6054 C 2153.1104,1403.4611 2153.4983,1405.3131 2153.5018,1407.2058 L 2153.3423,1407.9856 L 2180.9544,1402.9878 C 2182.0129,1408.1591 2182.9089,1413.3692 2184.3217,1418.4598 L 2200.3785,1415.1102 L 2201.371,1420.8878 C 2203.9364,1420.6834 2206.3366,1419.9974 2208.7437,1419.0801 L 2206.6879,1408.8009 L 2209.3463,1407.2235 L 2208.3538,1403.874 L 2205.7308,1404.5474 C 2205.156,1402.5544 2204.2042,1400.6125 2203.994,1398.5394 L 2214.5568,1396.3949 L 2215.3543,1384.5738 L 2224.8714,1372.416 L 2220.3344,1351.893 L 2234.4949,1348.7561 L 2235.2038,1344.9989 L 2238.8547,1344.3254 L 2241.3181,1349.1106 L 2238.4648,1351.2905 L 2239.0673,1353.1514 C 2237.5374,1355.0776 2235.7769,1356.8606 2234.548,1358.9999 C 2234.5538,1359.1998 2235.2872,1362.9159 2236.1785,1367.2587 L 2237.7913,1375.1453 L 2238.8192,1375.9074 C 2239.3854,1376.3215 2240.2782,1376.6518 2240.8042,1376.6518 L 2241.7612,1376.6518 L 2243.2322,1378.4241 L 2247.2907,1377.786 L 2250.4099,1382.7484 L 2250.3036,1386.2398 L 2248.7085,1388.0829 L 2248.7085,1393.7188 L 2250.4453,1397.0684 L 2251.5442,1397.0684 L 2251.5442,1393.9847 C 2252.7645,1395.2698 2253.8453,1396.7636 2255.4077,1397.6355 L 2255.709,1397.6355 L 2256.4179,1394.6049 L 2255.3546,1392.6554 L 2257.2775,1391.3558 L 2256.5508,1390.3988 L 2259.165,1388.5083 L 2258.0484,1388.1007 L 2255.7149,1389.5874 L 2254.4211,1387.9037 L 2262.8336,1381.5787 L 2260.4764,1376.9885 C 2259.1868,1374.4636 2256.9433,1370.6117 2255.4786,1368.4284 C 2254.0141,1366.245 2252.6555,1363.948 2252.4657,1363.3243 C 2252.276,1362.7004 2251.5459,1361.552 2250.8352,1360.7722 C 2250.1246,1359.9924 2248.1002,1357.1165 2246.3337,1354.3742 C 2244.5672,1351.632 2243.0151,1349.0974 2242.8954,1348.7384 L 2242.6828,1348.0827 L 2239.7053,1343.1912 L 2238.4825,1342.4114 L 2213.8124,1347.4801 L 2212.944,1342.4114 z "},"fl25":{"name":"FL-25","path":"M 2199.7954,1415.7787 L 2184.4829,1418.8447 L 2185.759,1423.3528 L 2180.5662,1426.0225 L 2181.3106,1430.4532 L 2179.9438,1432.6118 L 2181.2021,1433.2627 L 2180.9384,1440.1653 L 2182.9942,1442.5224 L 2181.0625,1445.4643 L 2184.1108,1447.6797 L 2183.4905,1450.6571 L 2189.6403,1456.0449 L 2190.5087,1456.0449 C 2190.9803,1456.0449 2191.5248,1455.8014 2191.7138,1455.4954 L 2192.0506,1454.9461 L 2194.2659,1455.0878 C 2195.4824,1455.1692 2196.6644,1455.4127 2196.8889,1455.6372 C 2197.1135,1455.8617 2197.8731,1456.0448 2198.5903,1456.0449 L 2199.9018,1456.0449 L 2202.0462,1457.0196 C 2203.2265,1457.5562 2204.3183,1458.0937 2204.4742,1458.207 C 2204.6303,1458.3202 2204.7868,1459.0944 2204.8287,1459.9261 C 2204.8707,1460.7579 2205.0858,1461.9977 2205.3072,1462.6732 L 2205.7148,1463.896 L 2208.2669,1464.534 L 2210.9076,1467.352 L 2213.5483,1470.1876 L 2213.5483,1471.889 L 2215.8168,1473.1119 L 2215.8168,1474.8841 L 2220.3538,1480.0237 L 2220.3538,1481.5657 L 2221.9312,1481.5657 L 2222.2679,1482.4695 C 2222.4573,1482.9629 2222.6224,1483.7456 2222.6224,1484.2063 L 2222.6224,1485.0393 L 2221.5767,1484.3835 L 2220.7969,1490.6397 L 2221.6831,1491.9158 C 2222.1763,1492.6176 2222.9131,1493.5899 2223.3136,1494.0602 C 2223.7141,1494.5305 2224.6783,1495.3402 2225.458,1495.8679 L 2226.8758,1496.8249 L 2227.7265,1496.4882 C 2228.1944,1496.3005 2229.4038,1496.0285 2230.4204,1495.8857 L 2232.2635,1495.6198 L 2232.9016,1494.6096 L 2235.1701,1494.6096 L 2238.4488,1491.0119 L 2245.2189,1490.622 L 2245.8746,1491.6676 L 2248.1431,1491.0828 L 2248.1431,1489.789 L 2249.6851,1489.0801 C 2250.5246,1488.6902 2251.5245,1488.3711 2251.9181,1488.3712 L 2252.627,1488.3712 L 2253.8499,1483.8342 L 2254.8247,1483.8519 C 2255.3585,1483.8537 2256.5013,1484.2196 2257.359,1484.6671 L 2258.9186,1485.4824 L 2258.9186,1484.9507 C 2258.9186,1484.6582 2259.8117,1483.4299 2260.9035,1482.2214 L 2262.8885,1480.0237 L 2259.3085,1469.5319 L 2262.8885,1470.3117 L 2262.8885,1467.5824 L 2260.0528,1466.2886 L 2260.0528,1463.4175 L 2262.3214,1463.4175 L 2262.3214,1461.0427 L 2264.0227,1461.6807 L 2264.1312,1458.6635 L 2262.6162,1458.6635 L 2261.1871,1457.1082 L 2262.3214,1454.9992 L 2261.0094,1454.742 C 2259.9508,1452.7371 2259.3986,1450.9855 2258.9186,1448.619 L 2259.787,1446.9531 C 2260.263,1446.0327 2260.8634,1445.2694 2261.134,1445.2694 C 2261.4045,1445.2694 2261.7777,1444.8765 2261.9669,1444.3833 L 2262.3214,1443.4794 C 2261.2067,1442.145 2260.6344,1440.2683 2260.2068,1438.2831 L 2239.5122,1442.5933 L 2238.7678,1441.4059 C 2235.2933,1441.9979 2231.8559,1443.0517 2228.3291,1443.2313 L 2224.237,1427.0787 L 2203.2514,1431.4988 L 2199.7954,1415.7787 z "},"fl20":{"name":"FL-20","path":"M 2267.4894,1419.3063 L 2266.3781,1419.7181 L 2266.0591,1421.1359 L 2266.2364,1422.6955 L 2267.4238,1423.7412 L 2266.9275,1425.9565 L 2265.1907,1426.6477 L 2261.9651,1424.6273 L 2263.7729,1422.412 L 2263.1172,1421.2245 L 2261.8588,1421.8271 L 2262.6209,1422.9791 L 2261.2031,1423.4576 L 2260.7954,1422.412 L 2258.7139,1423.3525 L 2255.9749,1429.0403 L 2252.8734,1428.4377 C 2252.724,1428.587 2252.762,1429.5872 2252.962,1430.653 C 2253.1619,1431.7188 2253.5179,1432.8783 2253.7418,1433.2406 L 2254.1494,1433.914 L 2258.3851,1432.7443 L 2262.1069,1434.3039 L 2267.6187,1431.9114 L 2268.2745,1432.7089 C 2268.6737,1433.2548 2268.877,1434.2349 2268.877,1434.747 C 2268.8771,1435.2593 2269.2893,1435.6202 2269.4974,1435.8281 C 2269.4908,1436.192 2269.4645,1438.219 2269.5328,1439.993 C 2269.6073,1441.9302 2269.6745,1441.9602 2269.6746,1441.9602 L 2270.7025,1441.1804 L 2270.7025,1440.9677 C 2270.7025,1440.9677 2270.2737,1440.9431 2270.0999,1440.7196 C 2269.926,1440.496 2270.004,1440.3655 2270.1531,1439.993 C 2270.3021,1439.6204 2270.472,1439.6384 2270.4721,1439.6385 L 2270.2594,1438.2738 L 2270.5784,1438.1852 L 2269.9581,1435.8635 C 2269.7504,1433.3344 2269.2695,1430.8388 2268.8948,1428.3314 L 2268.2922,1428.1718 L 2260.8841,1431.2911 L 2260.317,1430.0859 L 2263.1172,1428.8453 L 2259.9271,1427.8351 L 2262.7804,1426.63 L 2263.3298,1427.4984 L 2264.34,1426.9313 L 2264.6768,1427.9592 L 2268.0086,1426.5946 L 2267.4894,1419.3063 z "},"fl22":{"name":"FL-22","path":"M 2263,1382.0164 L 2254.7875,1387.9766 L 2255.8508,1389.2526 L 2258.0307,1387.8703 L 2259.7144,1388.3665 L 2256.9496,1390.5819 L 2257.4636,1391.3439 L 2255.6027,1392.6909 L 2256.6483,1394.2682 L 2258.013,1393.2757 L 2257.2332,1392.4073 L 2262.1956,1387.7462 L 2264.0564,1390.511 L 2264.7122,1395.0835 L 2265.0135,1403.0587 L 2265.1552,1407.2767 L 2264.34,1407.4008 L 2264.2869,1405.9298 L 2264.5704,1405.9298 L 2264.34,1402.3498 L 2264.021,1402.332 L 2263.6311,1395.4734 L 2263.4921,1395.4902 L 2263.7729,1402.3144 L 2264.2514,1411.7074 L 2260.0511,1414.3658 L 2260.0688,1416.6344 L 2260.4233,1418.4066 L 2261.8943,1416.0849 L 2266.0059,1414.2595 L 2267.4238,1414.7734 L 2267.477,1416.2976 L 2266.449,1419.5586 L 2267.6542,1419.1332 L 2268.115,1426.7009 L 2264.5881,1428.1718 L 2264.3046,1427.1794 L 2263.188,1427.7465 L 2262.6918,1426.8249 L 2260.3701,1427.8883 L 2263.7552,1428.7922 L 2260.5119,1430.1214 L 2260.9372,1431.0429 L 2268.5935,1427.8883 L 2269.2138,1427.6934 L 2268.8948,1426.1338 C 2268.7181,1425.276 2268.2907,1420.8735 2267.9554,1416.3508 C 2267.6202,1411.8279 2267.139,1405.3201 2266.8744,1401.889 C 2266.6097,1398.4579 2266.0993,1394.3746 2265.7401,1392.8149 C 2265.3809,1391.2553 2264.8633,1388.9584 2264.5881,1387.7108 C 2264.3131,1386.4631 2263.924,1384.7156 2263.7374,1383.8295 L 2263,1382.0164 z "},"fl19":{"name":"FL-19","path":"M 2262.2842,1390.9009 L 2259.5017,1392.4959 L 2257.8889,1396.519 L 2260.0865,1399.9218 L 2258.775,1402.3675 L 2259.5194,1410.4845 L 2256.8458,1413.5694 L 2258.9371,1421.6043 L 2262.0538,1420.427 L 2261.8943,1420.0371 L 2263.8261,1418.956 L 2264.7122,1420.4979 L 2265.297,1420.1789 L 2265.2084,1419.9308 L 2264.8008,1420.0194 L 2264.6413,1419.4168 L 2265.2439,1417.8041 L 2266.13,1417.3433 L 2266.0059,1416.8116 L 2266.6617,1416.3685 L 2267.0871,1417.1837 L 2267.3529,1416.2621 L 2267.2288,1414.8798 L 2265.9882,1414.4722 L 2262.0183,1416.2445 L 2260.3701,1418.8674 L 2259.7783,1416.5732 L 2259.7499,1414.0822 L 2264.0742,1411.2821 L 2263.4007,1395.4911 L 2261.0613,1394.4454 L 2261.6816,1393.3112 C 2262.0168,1392.6847 2262.2842,1391.8889 2262.2842,1391.5389 L 2262.2842,1390.9009 z "},"fl12":{"name":"FL-12","path":"M 2166.209,1313.049 L 2164.5198,1313.5893 L 2163.1197,1318.7045 L 2160.5939,1319.3718 L 2159.7988,1316.1511 L 2158.8099,1316.2834 L 2155.6133,1319.4977 L 2153.1651,1315.969 L 2149.4128,1315.9452 L 2150.4712,1317.6349 L 2150.1943,1319.8211 L 2147.7822,1323.082 L 2140.4415,1326.5146 L 2138.8934,1330.2016 L 2139.2362,1331.8529 L 2136.3993,1334.4007 L 2137.569,1338.5301 L 2140.8477,1339.8948 L 2141.4149,1342.9076 L 2137.4982,1344.9457 L 2138.2248,1349.8372 L 2132.0572,1351.2196 L 2130.8698,1347.9054 C 2130.2172,1346.0897 2129.5205,1343.8064 2129.3279,1342.819 L 2128.9735,1341.0113 L 2130.3558,1338.8136 L 2125.4289,1332.5043 L 2122.7174,1333.869 C 2123.0201,1334.4703 2123.7094,1336.0118 2125.2517,1340.3555 C 2127.5415,1346.8044 2125.8994,1345.0194 2125.7125,1347.356 C 2125.5255,1349.6926 2124.9603,1351.6218 2123.7453,1355.3136 C 2123.0025,1357.5706 2121.9121,1358.8689 2121.1754,1359.5493 C 2144.0498,1355.1954 2168.2831,1350.5714 2193.7913,1345.5792 C 2192.6094,1344.6914 2192.5769,1343.4005 2192.1111,1342.1478 C 2191.1291,1341.8956 2191.1323,1341.7625 2190.8928,1340.3944 L 2186.2003,1335.2514 L 2181.7428,1334.8472 L 2180.4227,1331.2815 L 2179.1981,1331.1083 L 2179.0307,1329.3704 L 2175.5667,1327.2584 L 2173.583,1327.6312 L 2173.5486,1326.4425 L 2171.2979,1325.4385 L 2171.3455,1324.3616 L 2174.7812,1325.5197 L 2176.5212,1325.0192 L 2176.5035,1321.3329 L 2166.209,1313.049 z "},"fl11":{"name":"FL-11","path":"M 2122.097,1334.1703 L 2109.9684,1340.2527 L 2109.1772,1341.4189 L 2112.8989,1340.8163 L 2114.9725,1343.1203 L 2115.2738,1348.5789 L 2118.836,1348.9334 L 2118.836,1348.5257 C 2118.836,1348.2966 2118.4822,1347.7067 2118.0562,1347.2142 C 2117.6303,1346.7218 2117.1276,1345.5977 2116.922,1344.733 L 2116.5321,1343.1734 L 2118.4816,1342.4291 L 2118.9247,1343.7583 L 2121.5299,1343.7583 L 2122.097,1344.4672 C 2122.409,1344.8571 2122.8602,1345.7943 2123.0895,1346.5408 L 2123.4972,1347.8877 L 2121.9907,1352.5488 L 2119.9703,1354.0375 L 2119.9703,1355.5439 L 2118.4993,1356.1111 L 2117.1436,1360.3674 L 2120.502,1359.6734 C 2121.2384,1358.9884 2122.3172,1357.6943 2123.0541,1355.4553 C 2124.269,1351.7636 2124.8166,1349.8344 2125.0036,1347.4978 C 2125.1905,1345.1612 2126.8326,1346.9463 2124.5428,1340.4973 C 2123.1046,1336.4469 2122.4331,1334.8677 2122.097,1334.1703 z "},"tx25":{"name":"TX-25","path":"M 1323.3732,1358.4218 L 1309.2261,1343.2197 L 1292.8396,1357.35 C 1286.9121,1351.3716 1283.5141,1346.805 1278.2337,1340.2972 L 1282.3835,1335.8489 C 1283.4194,1332.3444 1284.6879,1328.8991 1285.5549,1325.348 C 1281.1043,1323.1237 1278.183,1321.076 1274.85,1317.793 L 1273.5415,1314.8854 L 1272.1411,1312.1416 C 1269.1643,1313.3975 1267.8933,1314.4182 1266.5635,1315.5565 L 1264.6113,1309.555 L 1255.099,1299.0229 L 1255.099,1280.8882 L 1259.961,1283.6056 L 1266.8186,1284.3494 L 1265.9113,1281.5771 C 1265.2672,1280.7583 1264.7402,1279.7672 1264.7402,1279.3747 L 1264.7402,1278.6612 L 1266.23,1278.0896 L 1269.2773,1278.6721 L 1269.2773,1283.4682 L 1271.4238,1285.4109 L 1276.2685,1284.8543 L 1279.2468,1282.6524 L 1282.4522,1281.9425 L 1286.4204,1286.5226 L 1291.2847,1288.9247 L 1294.8251,1281.9052 L 1296.0716,1283.7923 L 1294.5731,1287.0222 L 1296.7621,1287.924 L 1299.2452,1288.2964 L 1300.5865,1291.5346 L 1304.7228,1292.8785 L 1305.6561,1294.4664 L 1315.0536,1292.8074 L 1316.9508,1299.6313 C 1320.4541,1297.1631 1324.4924,1295.4437 1327.6419,1292.4936 L 1329.0102,1291.0309 L 1330.2962,1292.0982 C 1331.4642,1292.0292 1332.5915,1291.8515 1333.6801,1291.4556 L 1333.9956,1291.1401 L 1336.0579,1291.6794 C 1336.932,1293.6082 1337.512,1294.9487 1337.9743,1297.4658 L 1342.6277,1305.4785 C 1347.6159,1309.8686 1348.5452,1309.0234 1350.3568,1311.4135 L 1353.9014,1311.0008 L 1358.7773,1320.4577 L 1361.2946,1320.7695 L 1362.9573,1322.1484 L 1356.1739,1329.7973 L 1354.3543,1336.3419 L 1339.3661,1346.6265 L 1337.7768,1346.0166 L 1323.3732,1358.4218 z "},"tx20":{"name":"TX-20","path":"M 1230.0722,1344.457 L 1225.0503,1342.5339 L 1226.2242,1340.3404 L 1225.0907,1336.235 C 1225.8492,1334.9673 1226.167,1333.2383 1227.6371,1332.6431 L 1227.7291,1331.1262 L 1229.6328,1333.2442 L 1231.4301,1331.2688 L 1233.0444,1332.4415 L 1234.5368,1331.0604 L 1237.1456,1331.0048 L 1237.1644,1332.6483 L 1238.9378,1333.3332 L 1238.2617,1335.5258 L 1241.273,1336.3546 L 1241.7291,1335.855 L 1241.7639,1331.6875 L 1242.981,1331.6713 L 1245.4465,1334.3046 L 1242.9058,1338.6468 L 1238.9549,1339.4516 L 1239.1472,1339.9274 L 1240.5765,1340.2107 L 1236.1002,1340.3598 C 1233.0225,1342.1492 1231.4959,1342.9887 1230.0722,1344.457 z "},"tx22":{"name":"TX-22","path":"M 1426.9036,1313.5233 L 1425.2376,1316.093 L 1424.7237,1319.9389 C 1424.4425,1319.9389 1422.6961,1317.5112 1422.0475,1316.412 L 1420.3107,1315.0829 L 1411.4848,1319.3895 L 1409.8366,1318.0248 L 1408.9327,1319.4958 L 1409.4112,1321.3567 L 1407.9402,1323.2885 L 1397.9978,1324.0683 L 1393.5316,1319.3718 L 1387.3287,1319.3718 L 1386.9565,1317.44 L 1383.8372,1317.5818 C 1382.1232,1317.6615 1380.271,1317.8641 1379.7256,1318.0248 L 1378.7331,1318.3084 L 1378.0065,1322.8454 L 1377.2444,1323.6252 C 1376.8197,1324.0499 1376.4646,1324.6667 1376.4646,1324.9899 L 1376.4646,1325.5748 L 1378.999,1326.9217 L 1377.7229,1327.4888 C 1377.0275,1327.7991 1376.4646,1328.2385 1376.4646,1328.4635 C 1376.8805,1330.2515 1377.5723,1331.9569 1378.166,1333.6918 L 1378.166,1337.9629 L 1376.4646,1338.6187 L 1376.4646,1340.4796 L 1381.6928,1344.1482 L 1384.3512,1341.7025 L 1388.5515,1340.4087 L 1390.2706,1341.3303 L 1393.4607,1341.3303 L 1397.1471,1333.2664 L 1398.8662,1331.8841 L 1401.9854,1331.8486 L 1401.9854,1329.3851 L 1403.864,1327.3116 L 1407.9402,1327.347 L 1410.7759,1328.9775 L 1412.5659,1328.9952 L 1423.2527,1345.7964 L 1431.033,1340.6922 L 1426.1592,1333.0892 L 1414.6572,1326.1419 L 1415.7382,1323.6961 L 1418.5324,1327.4603 L 1420.3285,1327.347 L 1423.1818,1323.9088 L 1425.7339,1323.9088 L 1427.4885,1321.4276 L 1426.6378,1320.4883 C 1426.1761,1319.9783 1425.8127,1319.2125 1425.8225,1318.7692 L 1425.8402,1317.954 L 1428.6759,1314.7284 L 1430.8735,1315.4373 L 1431.2279,1314.5157 L 1429.6506,1313.5233 L 1426.9036,1313.5233 z "},"tx18":{"name":"TX-18","path":"M 1407.1179,1318.7973 C 1406.3225,1318.7926 1405.3772,1318.6012 1405.0173,1318.372 L 1404.363,1317.9553 L 1403.2911,1314.8361 C 1402.7016,1313.1205 1401.8477,1311.1362 1401.3934,1310.4263 L 1400.5675,1309.1358 L 1396.3997,1308.0099 L 1395.6352,1304.5293 L 1398.0874,1302.8117 L 1395.2613,1298.6162 L 1399.1314,1298.6162 L 1402.2994,1296.274 C 1404.8671,1296.6551 1407.4761,1296.8631 1409.9783,1297.5715 C 1410.261,1297.7463 1410.4923,1298.2222 1410.4923,1298.6294 L 1410.4923,1299.3695 L 1405.5022,1301.2753 L 1402.5525,1300.5349 L 1402.5525,1305.2695 L 1403.7267,1307.4634 L 1408.2571,1307.0013 L 1408.7909,1303.6324 L 1410.3721,1302.3201 L 1411.2829,1303.2309 C 1411.7838,1303.7318 1412.1937,1304.499 1412.1937,1304.9357 C 1412.1937,1305.3724 1411.5697,1307.1406 1410.8071,1308.8651 L 1409.4205,1312.0005 L 1405.1759,1312.4642 L 1405.9352,1314.4429 L 1408.1404,1314.2683 L 1409.7917,1317.5784 L 1408.5641,1318.806 L 1407.1179,1318.7973 z "},"tx17":{"name":"TX-17","path":"M 1308.2319,1143.5619 C 1290.8387,1143.5403 1275.3279,1143.7003 1257.9347,1144.3062 L 1257.9347,1146.8583 L 1268.7101,1172.7336 C 1266.6972,1174.5426 1264.2111,1175.7562 1262.0109,1177.3237 C 1265.4099,1184.6215 1270.6964,1190.9679 1274.5055,1198.0417 L 1278.6349,1195.8618 C 1284.7619,1205.3696 1290.2534,1215.4088 1297.421,1224.1827 L 1325.6889,1206.1233 L 1337.2441,1224.9094 C 1333.3366,1227.4419 1329.3526,1229.8534 1325.4584,1232.4061 C 1326.3481,1233.8493 1327.655,1235.0248 1328.8967,1236.2165 L 1328.365,1238.2724 L 1329.4815,1238.2724 L 1328.7903,1241.108 C 1329.4581,1243.4978 1330.0242,1244.183 1331.0943,1244.5108 L 1332.6539,1244.5108 L 1333.3097,1247.7718 L 1335.1528,1248.4807 L 1337.3327,1247.311 L 1337.3327,1242.8094 L 1343.1103,1242.8094 L 1346.5131,1240.3991 L 1350.9438,1242.2954 C 1349.6467,1246.2654 1347.567,1250.3471 1345.7865,1254.1165 L 1340.1329,1257.2712 L 1339.4772,1259.8233 L 1338.467,1259.8233 L 1338.467,1261.5247 L 1336.2693,1261.5247 L 1335.4718,1264.0413 L 1339.6012,1267.1959 L 1339.6012,1268.6492 C 1339.6012,1269.4495 1339.3448,1270.585 1339.0341,1271.1658 L 1338.467,1272.2115 L 1339.1759,1274.0546 L 1343.518,1276.27 L 1344.7231,1276.27 C 1345.3799,1276.27 1346.4163,1276.012 1347.0271,1275.6851 L 1348.1436,1275.0825 L 1351.2273,1276.7485 L 1354.9314,1275.5079 L 1356.3315,1277.2625 L 1360.0178,1275.7029 L 1360.9749,1274.2142 L 1364.0586,1279.7968 L 1366.2563,1280.3817 L 1366.2563,1281.445 C 1366.2563,1282.0367 1366.5782,1283.0407 1366.9652,1283.6604 C 1367.3521,1284.28 1367.7987,1284.7795 1367.9576,1284.7769 C 1372.5259,1284.3332 1377.1227,1283.8957 1381.6219,1282.9692 L 1381.2675,1279.4778 C 1381.0804,1277.5558 1380.6724,1273.562 1380.3636,1270.5987 C 1380.0548,1267.6355 1379.1622,1261.1277 1378.3786,1256.1369 C 1377.595,1251.1462 1376.8465,1246.6829 1376.7127,1246.2122 L 1376.4823,1245.3437 L 1378.804,1244.6348 C 1380.0835,1244.2355 1381.5031,1243.5308 1381.9586,1243.0752 L 1382.7916,1242.2423 L 1389.3313,1242.0296 L 1386.1235,1237.7761 L 1386.478,1235.8975 C 1386.6787,1234.8661 1387.0729,1233.8807 1387.3464,1233.6999 L 1387.8426,1233.3631 L 1387.2223,1231.7504 L 1370.3148,1231.4668 L 1366.7879,1233.1682 L 1363.8814,1235.4722 C 1362.2828,1236.7357 1360.0836,1238.1345 1358.9899,1238.5914 L 1357.005,1239.4243 L 1354.9137,1237.1913 L 1356.0479,1234.2138 L 1353.9567,1232.3175 L 1350.9615,1222.1092 L 1351.3869,1216.2784 L 1350.3767,1214.7365 C 1349.8213,1213.8899 1348.7494,1212.785 1348.0018,1212.273 C 1347.2543,1211.7611 1344.9682,1209.5339 1342.9154,1207.3284 C 1340.8625,1205.1229 1338.8838,1202.7621 1338.5201,1202.0825 L 1337.8644,1200.8419 L 1336.7124,1200.8419 C 1336.084,1200.8419 1334.8571,1200.4786 1333.9831,1200.0266 L 1332.4058,1199.1936 L 1330.5449,1196.3934 L 1332.2994,1192.1932 C 1327.9344,1186.1081 1325.7333,1182.6208 1319.4859,1172.5918 L 1317.2883,1173.6197 L 1308.9763,1160.558 L 1308.2319,1143.5619 z "},"la6":{"name":"LA-6","path":"M 1656.9806,1217.4835 C 1635.6909,1219.4761 1609.2337,1222.2955 1599.7893,1222.3928 L 1600.1437,1224.2359 C 1600.3403,1225.2496 1600.4836,1227.3049 1600.4627,1228.7907 L 1600.4273,1231.4845 L 1605.496,1231.3605 C 1605.1673,1230.5416 1604.8438,1229.4046 1604.4149,1228.6312 L 1602.1818,1228.6312 L 1602.1818,1227.0184 L 1605.6555,1226.2563 L 1607.9772,1228.3476 L 1607.4632,1234.4974 L 1604.2908,1237.014 L 1606.7188,1238.3078 L 1608.9165,1237.1381 L 1612.3015,1237.1381 L 1615.7397,1235.1532 L 1617.4766,1237.7938 C 1616.3822,1239.0647 1614.7227,1239.7089 1613.3294,1240.6118 L 1610.7065,1239.956 L 1607.7999,1244.369 L 1608.4202,1249.0478 L 1610.3697,1249.0478 C 1611.4411,1249.0478 1613.0002,1249.3012 1613.8257,1249.615 L 1615.3144,1250.1821 L 1614.8536,1251.5999 L 1611.823,1251.9544 L 1611.823,1252.3797 C 1611.823,1252.611 1612.8313,1253.5534 1614.0738,1254.471 L 1616.3423,1256.1369 L 1616.679,1257.1294 C 1616.8612,1257.6753 1617.2207,1258.1219 1617.4943,1258.1219 C 1617.7679,1258.1219 1618.9656,1259.0191 1620.1527,1260.1245 L 1622.3149,1262.1449 L 1627.0114,1261.4715 L 1629.6344,1261.7196 L 1627.1355,1263.8286 L 1627.1355,1265.2819 L 1623.7859,1267.7631 L 1622.2617,1267.2136 L 1621.6237,1269.3581 L 1613.6485,1269.0568 L 1612.9218,1270.4924 L 1614.8359,1273.2571 L 1614.6764,1276.2877 L 1619.6919,1276.27 L 1620.454,1278.6803 L 1625.9126,1278.0423 L 1626.462,1279.4955 L 1629.6875,1279.2651 L 1634.0296,1277.1561 L 1633.622,1274.1433 L 1634.579,1274.1078 L 1635.1462,1268.8264 L 1636.0677,1268.4897 C 1636.5679,1268.2978 1637.4476,1267.677 1638.0172,1267.1073 L 1639.0452,1266.0617 L 1640.463,1266.0617 L 1641.8808,1266.0617 L 1641.8808,1265.0869 L 1647.8357,1263.935 L 1652.5677,1264.6439 L 1653.7905,1266.2035 C 1654.4622,1267.0612 1655.2244,1267.7631 1655.4919,1267.7631 L 1655.9881,1267.7631 L 1656.3426,1265.335 L 1658.1503,1264.2008 L 1660.0289,1265.1223 C 1661.06,1265.6367 1662.2383,1266.0617 1662.6519,1266.0617 L 1663.414,1266.0617 L 1665.6825,1261.6132 L 1669.5461,1260.2132 L 1665.0976,1255.9243 C 1664.5435,1255.3783 1663.9456,1254.6133 1663.9457,1254.3469 C 1663.9457,1254.0805 1663.7684,1253.5932 1662.9887,1252.7519 L 1661.1632,1251.2631 L 1661.1632,1250.2707 C 1661.1632,1249.7253 1660.9317,1249.0251 1660.6493,1248.7288 L 1660.1353,1248.1971 L 1656.9806,1217.4835 z M 1599.2753,1219.5571 L 1597.7511,1219.9116 C 1596.9124,1220.1118 1596.0229,1220.3974 1595.7839,1220.5319 L 1595.3586,1220.78 L 1596.0497,1221.8788 L 1597.6448,1220.5496 L 1599.2398,1221.8788 L 1599.9842,1220.6914 L 1599.2753,1219.5571 z "},"tx16":{"name":"TX-16","path":"M 832.09079,1203.1118 L 828.66414,1200.3728 L 828.2832,1198.7648 C 828.0737,1197.8805 827.45468,1196.6465 826.90763,1196.0226 C 826.36058,1195.3988 825.74814,1194.2504 825.54669,1193.4706 C 825.34525,1192.6908 824.3589,1190.344 823.3548,1188.2557 L 821.52915,1184.4586 L 817.39195,1182.1208 L 814.77539,1182.4116 L 813.17682,1179.1524 L 811.09007,1178.6068 L 810.0761,1177.1064 C 809.51844,1176.2812 809.03071,1175.1531 808.9922,1174.5996 L 808.92228,1173.5931 L 809.90301,1172.987 L 809.90301,1167.8978 L 837.82111,1169.6512 L 836.4367,1176.4567 L 832.16945,1176.4567 L 830.91099,1191.4447 L 827.45378,1193.7818 L 828.72925,1197.4405 L 832.97324,1197.4405 L 834.32874,1200.4155 C 833.72004,1201.464 833.04498,1202.4007 832.09079,1203.1118 z "},"tx19":{"name":"TX-19","path":"M 1004.0206,978.91733 L 997.62261,1143.9695 L 1041.8586,1145.4227 L 1041.8586,1118.0942 L 1069.2759,1118.7387 L 1067.8402,1172.9108 C 1076.6951,1172.9726 1085.5508,1173.439 1094.4067,1173.3893 C 1095.2688,1155.1986 1094.9151,1136.9495 1095.9663,1118.7677 L 1123.1176,1119.3703 L 1122.5327,1146.3975 L 1136.5514,1146.3975 L 1138.3592,1149.1623 L 1137.1186,1151.4662 L 1128.7889,1155.4716 L 1125.1911,1155.4716 L 1122.3909,1157.297 L 1122.3909,1173.5488 L 1212.8614,1174.1192 C 1216.475,1172.0539 1228.258,1165.1433 1231.1556,1163.2696 L 1236.437,1159.8668 L 1235.8167,1147.195 C 1234.1868,1147.1096 1232.5548,1147.0269 1230.9429,1146.7874 L 1230.2163,1119.1753 L 1238.0852,1119.1753 L 1237.3408,1078.9978 L 1233.8317,1078.3243 L 1231.1556,1075.5064 L 1228.6049,1075.3238 L 1228.1508,1074.0558 L 1228.1291,1070.5113 C 1225.7993,1069.3966 1225.9353,1069.0127 1222.4182,1069.268 L 1220.5219,1065.2981 L 1210.6858,1065.2981 L 1211.4833,1119.5653 L 1177.4024,1120.3096 L 1177.4024,1147.5318 L 1149.0637,1147.5318 L 1148.7624,1120.026 L 1129.7636,1119.7247 L 1129.7636,1092.5203 L 1076.4535,1092.5203 L 1076.4535,1064.731 L 1103.1085,1064.731 L 1103.1085,1035.2403 L 1054.619,1034.4959 L 1054.9558,1007.451 L 1046.6615,1007.451 L 1047.0869,980.40605 L 1004.0206,978.91733 z "},"tx12":{"name":"TX-12","path":"M 1291.3953,1088.9934 L 1264.2794,1089.1175 L 1264.9174,1116.3397 L 1257.9347,1116.3397 L 1257.9347,1143.7391 C 1268.236,1143.3434 1278.3862,1143.1548 1288.5242,1143.0656 L 1295.826,1138.3868 L 1294.798,1136.1183 L 1296.5349,1130.0748 L 1298.2008,1128.6748 L 1298.2008,1121.8869 L 1296.2336,1116.3397 L 1291.3953,1116.3397 L 1291.3953,1088.9934 z "},"tx6":{"name":"TX-6","path":"M 1308.1079,1126.5126 L 1306.3356,1127.7709 L 1305.0064,1130.2698 L 1301.7454,1131.6344 C 1301.0464,1132.7673 1300.8922,1133.4846 1300.4693,1134.8245 L 1300.4693,1136.8272 L 1299.2996,1139.0249 L 1296.2513,1139.0249 L 1289.8534,1143.0833 L 1308.8877,1142.9593 L 1309.5079,1160.6643 L 1317.3946,1173.1412 L 1319.6277,1171.936 L 1332.8666,1192.1932 L 1331.112,1196.3934 L 1332.8134,1198.9633 L 1334.2489,1199.619 C 1335.039,1199.9789 1336.1676,1200.2748 1336.7656,1200.2748 L 1337.8644,1200.2748 L 1339.2468,1202.3306 C 1340.0148,1203.4608 1342.3681,1206.1405 1344.4572,1208.2854 C 1346.5463,1210.4303 1348.4586,1212.1845 1348.7107,1212.1845 C 1350.1051,1213.1251 1350.9066,1214.7393 1352.1135,1215.9062 L 1351.6704,1222.4637 L 1354.5061,1231.7858 L 1356.9518,1234.0898 L 1355.4986,1237.1381 L 1357.0227,1238.9458 L 1360.3014,1237.5635 L 1363.5093,1235.0823 C 1365.2764,1233.719 1367.0058,1232.6011 1367.3551,1232.6011 C 1368.5395,1231.9811 1369.5424,1231.6253 1370.5452,1230.9351 L 1387.7363,1231.0946 L 1388.4452,1233.9126 L 1387.3641,1234.586 L 1386.9742,1237.5103 L 1389.2782,1240.5409 C 1392.7815,1237.9112 1395.8073,1234.6949 1399.1497,1231.8744 L 1405.2641,1236.571 L 1407.5149,1236.571 L 1409.1454,1234.1252 L 1411.6089,1238.0597 L 1417.2093,1236.1102 L 1418.9461,1238.3787 L 1429.881,1225.2107 C 1429.561,1223.3804 1428.8151,1221.2962 1428.4809,1219.4685 L 1427.0631,1218.9191 L 1426.3188,1213.9922 L 1423.554,1213.301 L 1422.5615,1210.9793 L 1421.3564,1209.207 C 1420.5238,1208.4378 1418.7749,1207.3341 1417.4574,1206.7435 L 1415.0648,1205.6625 L 1415.0293,1202.6142 L 1413.0267,1201.9938 L 1411.9101,1199.6013 L 1404.5374,1199.2645 L 1387.5236,1202.6319 L 1386.6729,1203.394 C 1386.2044,1203.8161 1385.0748,1204.4516 1384.174,1204.794 L 1382.5435,1205.4144 L 1380.4345,1203.5003 L 1380.4345,1201.9761 L 1382.4194,1201.9761 L 1382.3308,1197.4037 L 1381.0016,1196.0744 L 1381.0016,1199.0696 L 1379.6901,1199.8849 L 1378.166,1197.7936 L 1378.166,1195.5782 L 1376.181,1194.0718 L 1373.6289,1194.0363 L 1373.6289,1190.3323 L 1368.0994,1188.3651 L 1367.3551,1183.7217 L 1365.122,1183.1368 L 1365.122,1182.4633 C 1365.122,1182.0942 1365.3697,1181.5421 1365.6714,1181.2405 L 1366.2208,1180.6911 L 1365.5651,1178.1567 L 1363.5447,1178.1567 L 1362.7649,1170.7841 L 1359.8938,1170.0574 L 1360.4609,1165.8217 L 1358.6178,1166.0698 L 1356.5974,1164.9532 L 1357.3063,1162.7025 L 1355.9948,1163.5 L 1353.7972,1160.6998 L 1350.9083,1159.9732 L 1350.3767,1158.573 L 1349.845,1157.173 L 1348.9234,1157.173 C 1348.418,1157.173 1347.3233,1156.8051 1346.4954,1156.3577 C 1345.6674,1155.9104 1344.266,1155.3962 1343.3762,1155.2057 L 1341.7457,1154.8513 L 1342.5077,1150.8105 L 1340.6114,1149.7294 L 1339.1404,1147.8153 L 1338.3429,1143.5973 L 1337.0491,1142.5694 L 1309.4725,1143.4732 L 1308.9054,1128.533 L 1308.1079,1126.5126 z "},"tx32":{"name":"TX-32","path":"M 1315.0011,1131.6587 L 1313.3878,1126.8329 L 1314.364,1122.8906 L 1320.0142,1120.3868 L 1319.8723,1118.0425 L 1328.2586,1118.0425 L 1328.2586,1120.311 L 1325.9901,1120.311 L 1325.9901,1125.7734 L 1322.996,1125.4151 L 1321.6136,1123.5247 L 1318.065,1123.5247 L 1315.7818,1125.5909 L 1315.7818,1128.2508 L 1319.1846,1128.2508 L 1319.1846,1129.8412 L 1315.0011,1131.6587 z "},"ga12":{"name":"GA-12","path":"M 2091.6467,1102.3028 C 2090.6951,1101.308 2089.5036,1100.285 2089.9125,1099.4503 C 2080.8227,1097.1796 2080.3424,1097.565 2078.8097,1097.6258 L 2074.3602,1095.3573 L 2071.5879,1095.3573 L 2068.0232,1093.0684 L 2065.8995,1083.9677 C 2064.2258,1084.8989 2062.6369,1084.633 2060.8339,1084.3775 C 2057.9447,1083.6954 2056.2005,1082.918 2055.3176,1082.0688 L 2055.3176,1080.7764 C 2057.4615,1080.0339 2058.9429,1078.894 2060.2575,1077.654 L 2061.9981,1073.5229 L 2061.4252,1069.2114 L 2055.0341,1063.2044 L 2048.7967,1062.3873 C 2042.6537,1058.3252 2035.5961,1056.8383 2027.2031,1052.1882 C 2025.5118,1046.4134 2024.6107,1040.6385 2024.0868,1034.8637 L 2026.8462,1035.7276 L 2030.5465,1035.0862 C 2031.43,1034.3187 2032.1945,1033.4305 2033.2816,1032.9731 C 2033.6144,1032.9731 2034.689,1032.3327 2035.6698,1031.5499 C 2036.6506,1030.7671 2037.6369,1029.9377 2037.8615,1029.7068 L 2041.8749,1024.9754 L 2044.9764,1023.3715 L 2045.259,1021.3745 L 2046.2544,1020.4963 L 2046.748,1019.869 L 2044.6719,1016.2429 L 2044.2586,1009.4393 L 2041.5248,1007.071 L 2041.6496,1005.9853 L 2042.8094,1005.3699 L 2044.1366,1006.8539 C 2047.9059,1006.7121 2052.2801,1007.5787 2056.5232,1008.2267 L 2058.2973,1012.0362 L 2067.2857,1021.117 L 2075.2208,1024.4147 L 2082.0917,1024.4006 C 2083.0671,1023.3512 2084.2469,1023.0173 2085.5564,1023.1374 L 2089.2945,1019.8991 L 2096.4345,1019.0098 L 2103.2587,1020.6731 L 2104.6467,1022.1977 L 2105.5311,1022.1977 C 2106.0176,1022.1977 2107.1871,1022.5967 2108.1302,1023.0844 L 2109.8448,1023.9711 L 2109.3292,1027.7975 L 2111.9956,1030.3024 L 2113.0707,1032.0857 L 2113.1648,1033.5403 L 2115.3092,1033.5403 L 2116.6783,1041.7636 L 2118.4064,1043.1235 L 2117.8725,1046.8156 L 2123.0094,1049.6457 L 2126.2087,1049.4018 L 2127.2012,1051.3815 C 2127.7471,1051.5666 2128.9195,1052.3579 2129.8068,1053.1399 L 2131.4198,1054.5616 L 2130.7693,1056.2567 L 2131.8918,1057.2178 C 2132.5092,1057.7464 2133.0143,1058.3956 2133.0143,1058.6605 C 2133.0143,1058.9254 2133.3789,1059.5067 2133.8245,1059.9523 C 2134.2701,1060.3978 2134.8671,1060.7625 2135.1513,1060.7625 L 2135.6679,1060.7625 L 2137.0447,1063.7842 L 2135.6898,1067.0553 L 2138.7403,1070.2393 L 2138.5895,1070.7468 C 2138.5066,1071.026 2138.7362,1072.0838 2139.0997,1073.0975 L 2139.7608,1074.9407 L 2141.0028,1075.5464 L 2135.9467,1081.4585 L 2128.3572,1081.2476 L 2123.3854,1078.9106 C 2120.0838,1079.0512 2119.1091,1078.4162 2118.2689,1077.7364 L 2118.2689,1076.0749 L 2114.0154,1076.1247 C 2110.8314,1077.713 2109.5605,1076.9489 2103.24,1079.8544 L 2108.588,1083.6379 L 2105.8591,1086.5028 L 2102.6677,1086.5028 L 2099.8187,1088.8132 L 2097.4658,1095.5244 C 2093.0054,1100.2082 2093.8263,1100.2445 2093.2721,1101.4909 L 2091.6467,1102.3028 z "},"ca50":{"name":"CA-50","path":"M 269.71293,1049.7704 L 266.87728,1049.0898 L 266.51483,1046.5842 L 269.92957,1046.5842 L 270.66054,1045.4015 L 266.79783,1040.6294 C 266.21836,1036.3323 265.78121,1032.0124 265.05629,1027.7359 L 264.5129,1025.8836 L 266.61408,1025.4713 L 268.35358,1026.1918 C 269.31032,1026.5881 270.39609,1027.2154 270.76643,1027.5857 L 271.43972,1028.259 L 278.61611,1024.839 C 279.94244,1026.316 281.74173,1027.8866 282.71177,1029.6319 L 278.56127,1034.1074 L 277.22075,1034.1074 L 277.92875,1038.3609 L 274.31722,1041.3439 L 273.68283,1046.8678 L 270.04419,1048.4698 L 269.71293,1049.7704 z "},"ca45":{"name":"CA-45","path":"M 282.52669,1011.3929 L 282.18976,1004.4104 L 278.83695,1003.5181 L 277.0856,1005.0969 L 273.35888,1001.761 L 279.20984,999.25893 L 281.00917,995.48566 C 280.47037,994.68544 279.99141,993.39619 279.63768,992.5046 L 283.04045,991.46177 L 283.04045,990.70006 C 283.04045,990.28112 282.76727,989.76945 282.43328,989.56308 L 281.82617,989.18781 L 282.45451,985.27093 L 280.38062,984.76721 L 276.62623,979.66305 L 278.3554,977.6781 L 278.16768,976.05288 C 283.36454,978.54949 285.62811,981.4313 287.00281,983.80939 L 285.72927,985.34392 L 286.89843,990.57086 L 291.96219,992.4374 L 291.54738,995.30633 L 295.81474,996.35212 L 296.36798,986.18503 L 301.24381,986.55134 L 303.52803,983.64736 L 307.89847,985.28778 L 309.68795,984.17728 L 316.18785,986.08913 L 317.08392,980.21475 L 377.18382,989.87137 L 377.2763,987.51035 L 421.41127,994.07578 C 420.95836,996.86537 420.08732,997.92267 417.54368,1000.8318 L 415.66942,1000.8535 L 414.92937,1002.3256 L 416.23314,1003.9338 L 415.86655,1006.6836 C 414.15547,1006.8894 415.01301,1008.708 415.21346,1016.4404 L 412.97851,1017.6726 L 411.80889,1025.1746 L 405.54025,1031.8389 C 357.94642,1025.0235 332.99278,1021.4184 282.52669,1011.3929 z "},"ca44":{"name":"CA-44","path":"M 254.40045,1008.3962 L 251.90406,1004.6219 L 253.61623,1000.5242 C 252.21889,999.44881 255.15536,997.17587 256.43815,997.81117 L 258.4844,994.2445 L 259.9031,994.1803 C 261.17323,991.49568 261.53098,989.49536 261.48956,986.46859 L 259.60004,986.12645 L 255.81342,979.55348 L 257.05828,978.0329 L 257.23454,976.16812 L 260.07174,975.97671 L 260.2061,973.42463 L 263.16934,973.42463 L 264.10912,970.41795 C 269.47858,971.01621 272.19324,972.11553 274.99663,973.51214 L 275.30476,972.85654 L 277.69696,973.77325 C 278.58815,976.14339 276.84898,975.53571 278.01313,977.55849 L 276.07838,979.68432 L 278.19372,982.51877 L 275.87158,984.79591 L 271.73164,984.23382 L 272.22905,987.85159 L 269.82006,990.41581 L 267.4143,989.81205 L 264.72588,992.67378 L 266.14455,994.38322 L 259.78817,1001.4072 L 259.78817,1003.8227 L 258.42707,1005.1838 L 255.76355,1005.1838 L 254.40045,1008.3962 z "},"ca42":{"name":"CA-42","path":"M 253.54976,998.29136 L 253.54976,995.6258 L 251.56481,995.18315 L 255.84759,992.57771 L 256.98628,990.45007 L 255.99998,988.88468 C 255.45752,988.02372 254.15817,986.53319 253.1125,985.57236 L 251.21132,983.82549 L 251.931,980.95809 L 247.87847,978.56707 L 247.31472,974.48845 L 241.56489,973.6415 L 241.64006,972.60116 C 241.64006,972.21501 241.12964,971.43713 240.5058,970.87256 C 239.88196,970.30798 239.37154,969.63043 239.37154,969.36683 C 239.37154,969.10328 239.15755,968.62451 239.44718,968.62451 L 243.7876,970.4011 C 245.16466,970.51782 245.37663,969.95812 245.96444,969.32316 C 248.04954,969.28272 249.5333,968.75365 251.24257,968.14949 L 254.1353,969.24507 L 256.32442,968.48182 L 257.98592,968.70482 L 258.84184,969.89766 L 258.95459,972.56509 L 259.78817,973.49156 L 259.78817,975.69315 L 256.95253,975.69315 L 256.91495,977.77377 L 255.34886,979.65868 L 259.26715,986.5219 L 260.92243,987.15709 C 261.03354,990.17438 260.61847,991.61319 259.67724,993.84127 L 258.06246,993.84127 L 256.51298,997.24206 C 255.07662,997.24206 254.49691,997.25697 253.54976,998.29136 z "},"ca41":{"name":"CA-41","path":"M 295.45904,995.75952 L 292.04861,994.85904 L 292.39807,991.95528 L 287.74138,990.39863 L 287.0923,988.97406 C 286.73529,988.19051 286.44322,987.10213 286.44322,986.55531 C 286.44322,986.00854 286.72378,985.28063 287.06667,984.93774 L 287.69017,984.31424 L 287.35159,983.26471 C 287.16541,982.68743 286.15546,981.3219 285.10724,980.23018 C 284.05907,979.13846 282.14552,977.62042 280.85496,976.85678 L 278.50853,975.46834 L 277.87828,973.48265 L 275.66778,972.78106 L 275.66778,971.72325 L 277.13301,971.72325 L 282.05983,966.7032 L 281.37468,964.9177 L 279.27823,964.9177 L 271.61417,957.29124 L 272.15963,954.4379 L 271.15786,952.56609 L 273.39926,951.97991 L 273.39926,951.10959 C 273.39926,950.63094 273.14502,950.08213 272.83423,949.8901 L 272.41106,949.20971 L 274.04817,946.10066 L 276.14264,947.99612 L 278.62155,945.5172 L 281.78018,946.14892 L 281.78018,937.82018 L 278.98689,935.81748 C 278.9929,935.26493 279.42166,933.30028 279.82409,931.74068 L 280.55575,928.90503 C 282.83604,927.57511 284.45406,926.62364 287.39662,925.76677 L 289.49097,930.41116 L 291.26382,928.25992 L 298.77566,924.65157 L 303.53166,924.65157 L 304.65951,924.04797 C 305.27984,923.71597 307.35961,923.19115 309.28121,922.88167 L 312.77501,922.31902 L 320.75451,918.56565 L 326.99293,917.13462 L 328.6997,915.6535 L 331.81619,915.25481 L 334.93273,914.85612 L 336.63411,914.01796 C 337.56988,913.557 338.97352,912.56577 339.75332,911.81529 C 340.53312,911.06475 342.58057,909.23474 344.30317,907.74858 L 347.43519,905.04649 L 349.40733,904.2562 C 350.49202,903.8215 352.47067,902.69773 353.80433,901.75885 L 356.2292,900.05179 L 358.39632,900.01663 L 360.56343,899.98147 L 361.35917,899.34867 C 361.79682,899.00062 362.92053,898.54028 363.85629,898.32574 C 364.79205,898.11113 366.57851,897.74108 367.82619,897.50346 C 369.07388,897.26577 370.73273,896.72779 371.51253,896.30789 C 376.06753,893.78525 379.88147,889.70697 384.82758,887.90418 L 419.65478,935.78283 L 418.52171,943.95918 L 420.85273,946.92254 L 420.85273,950.0194 L 425.27712,955.02834 L 425.72419,958.41342 C 425.97004,960.27519 426.20188,962.0537 426.23937,962.36563 C 426.27691,962.67755 426.70447,963.79541 427.18959,964.84976 L 428.07165,966.76683 L 427.06908,971.22877 L 427.72519,972.29038 L 429.92678,972.29038 L 429.92678,972.77533 C 429.92678,973.04205 431.45735,974.84399 433.32803,976.77971 C 435.19876,978.71538 436.98521,980.77723 437.29793,981.3616 C 437.6107,981.94603 437.86659,982.95132 437.86659,983.59569 L 437.86659,984.76721 L 436.38683,984.76721 L 434.20912,986.76191 L 432.0314,988.75662 L 430.55375,989.10659 C 429.74105,989.29908 428.69328,989.77671 428.2254,990.16798 C 427.75752,990.55924 426.48148,991.06489 425.38976,991.29157 C 424.29803,991.51825 422.7378,992.09151 421.92261,992.56551 L 420.44037,993.42726 L 376.61669,987.03572 C 376.69707,987.83106 376.58264,988.59504 376.3621,989.30424 L 316.64719,979.66305 L 315.89484,985.33434 L 309.68285,983.58367 L 307.78791,984.64414 L 303.17352,983.01013 L 300.72613,985.84305 L 295.80085,985.6179 L 295.45904,995.75952 z "},"ca37":{"name":"CA-37","path":"M 226.66193,969.98035 L 223.86769,975.70478 L 225.88451,977.80077 C 226.90914,978.85398 227.08688,979.33003 227.86385,979.65001 L 230.56332,980.86684 L 233.32808,977.81852 L 232.83661,977.15804 L 230.69335,977.77956 C 230.35713,975.49749 231.5022,976.02208 231.32191,973.66209 L 226.66193,969.98035 z "},"ca47":{"name":"CA-47","path":"M 244.68639,988.60741 L 239.22151,982.2749 L 240.97552,977.15974 L 244.57684,977.12265 L 245.77507,978.1922 C 244.97578,980.34723 243.94167,982.15626 243.90857,984.20008 L 245.06716,984.20008 L 246.32755,986.96631 L 244.68639,988.60741 z "},"ca43":{"name":"CA-43","path":"M 261.31454,972.85751 C 260.57904,972.85751 259.80706,972.68737 259.59915,972.4794 C 259.39118,972.27149 259.22105,971.55691 259.22105,970.89144 L 259.22105,969.68159 L 257.87436,968.24732 L 258.96884,966.41946 L 261.3674,965.8136 L 265.004,967.84023 L 271.10971,961.2667 L 274.99515,961.22292 L 279.11195,965.20739 L 281.16385,965.17819 L 281.7041,966.6348 L 279.1884,969.0561 C 278.0056,970.21111 276.7422,971.15612 276.38094,971.15612 L 275.47592,971.14154 L 274.87561,973.08458 L 273.05003,972.1106 C 272.15039,971.6151 270.06194,970.94243 268.40898,970.61576 C 266.75603,970.28909 265.02708,970.02186 264.5668,970.02186 L 263.73,970.02186 L 262.65189,972.85751 L 261.31454,972.85751 z "},"ca25":{"name":"CA-25","path":"M 230.86835,948.97827 L 229.44679,948.91844 L 226.82331,946.30142 L 228.24431,944.02604 L 226.74419,942.21855 L 225.34384,943.38082 L 223.92018,941.66543 L 218.61463,941.66543 L 217.53709,942.68705 L 212.41098,941.46824 L 208.93193,922.58075 C 222.21514,925.24059 220.12859,925.70075 229.06817,928.05434 L 230.54339,924.72161 C 232.09086,924.09743 232.99792,923.4454 235.26933,923.51731 L 235.8626,925.78582 L 238.6286,925.78582 L 240.5058,923.71155 C 240.46198,921.18165 240.34727,920.28218 241.22503,916.12178 L 268.94146,921.10701 C 272.41189,903.64416 275.45698,888.16631 278.28939,870.20721 L 279.63768,870.20721 L 279.63768,867.9387 L 277.76048,867.9387 L 279.32423,866.09553 L 280.08469,860.94929 L 261.9875,857.82821 L 262.62166,853.79592 L 264.36133,853.11679 L 264.17174,846.03335 C 263.28738,843.87316 262.93469,841.50029 262.33389,836.39812 L 263.92544,834.64705 L 261.9063,830.92612 L 261.80605,825.25364 L 263.1145,825.40404 L 263.83475,823.13474 L 261.41232,819.73276 L 262.70271,819.73276 L 262.34025,817.18068 L 259.78817,816.81823 C 259.8976,815.85978 259.93183,814.67573 258.83819,814.01803 L 258.59661,809.28511 L 256.76039,807.84109 L 258.6631,805.73863 L 256.63709,803.90516 L 256.38415,800.84862 L 255.11226,799.31612 L 257.08479,799.31612 L 255.45452,790.80919 L 256.84608,790.80919 L 257.61891,785.1902 C 256.77532,784.20623 256.18237,780.74096 255.91525,775.24548 L 248.74011,769.2583 L 246.64396,769.2583 L 246.05437,762.87964 L 247.38161,761.40113 L 245.99753,756.78147 L 244.04746,756.78147 L 242.63542,755.08009 L 243.99869,755.08009 L 243.29102,751.85806 L 245.04283,750.40417 L 245.04283,749.30206 C 245.04283,748.69592 244.77866,747.70633 244.45574,747.10302 L 243.86865,746.00603 L 241.07293,746.00603 L 241.07293,745.2404 C 241.07293,744.81937 240.29364,743.39899 239.34109,742.0841 L 237.60925,739.69337 L 236.26385,740.14186 L 234.38592,738.00821 L 233.52298,732.50422 L 231.33986,727.89205 L 229.54263,727.593 C 228.55419,727.42848 227.24474,727.35702 226.63287,727.43415 L 225.52033,727.57434 L 225.10928,725.58486 L 228.46554,723.65866 L 228.4952,721.50822 C 228.51154,720.32553 228.68502,719.09883 228.88068,718.7822 L 229.3367,717.57995 L 226.28333,715.5752 L 225.09686,711.51683 L 226.43142,709.02322 L 225.70975,705.1765 L 223.07833,702.33712 L 220.35815,702.33712 L 219.23847,699.87782 L 218.12815,699.2643 C 217.51752,698.92686 216.68809,698.34997 216.28498,697.98236 C 215.88192,697.61475 215.55214,697.04949 215.55214,696.72629 L 215.50201,695.86294 L 213.26922,694.9168 L 214.48089,692.65271 L 213.73092,687.65155 C 214.96203,686.58665 215.62241,685.91318 216.11926,684.42799 L 216.11926,683.05474 L 218.22806,683.05474 L 220.88495,677.67581 C 220.06241,674.17566 219.29,671.77824 219.3447,667.40085 L 221.70411,664.83284 L 384.23873,887.40255 L 383.16895,888.02072 C 382.58056,888.36072 380.16379,889.97533 377.7983,891.60878 C 375.43286,893.24228 372.73186,895.0103 371.79609,895.53784 C 370.86033,896.06533 369.07388,896.69303 367.82619,896.9327 C 366.57851,897.17237 364.79205,897.54401 363.85629,897.75861 C 362.92053,897.97315 361.79682,898.43349 361.35917,898.78154 L 360.56343,899.41434 L 356.2292,899.48466 C 353.24218,901.76214 350.42222,903.53839 347.43519,904.47937 C 340.20489,910.09139 338.2649,913.25313 334.93273,914.29875 L 328.41007,915.0921 L 326.9648,916.53737 L 320.75451,917.96994 L 312.74178,921.75723 C 308.11249,922.47725 306.1562,922.80749 303.53166,924.08444 L 298.77566,924.08444 L 290.81949,927.93587 L 289.48417,929.17861 L 287.56177,925.14724 C 284.98377,925.91184 282.15171,926.85429 280.09333,928.61041 L 278.28689,936.15509 L 281.19048,938.54622 L 281.21855,945.45498 L 278.43888,944.92364 L 276.03789,947.50073 L 273.99254,944.97485 L 272.05494,949.0381 L 270.69406,949.0381 L 268.96245,946.39534 L 262.89028,943.64403 L 262.45675,948.9642 L 257.93752,946.57727 L 254.48739,947.87951 L 252.87748,946.54347 L 245.44782,946.30131 L 242.91252,943.12176 L 241.49544,943.76743 C 240.71598,944.12257 239.16823,945.21219 238.05592,946.18879 L 236.03359,947.96441 L 234.16178,948.50126 C 233.13228,948.7965 231.6502,949.01116 230.86835,948.97827 z "},"ca22":{"name":"CA-22","path":"M 107.46875,825.84375 C 107.49909,825.87617 107.53277,825.90426 107.5625,825.9375 C 107.73608,826.13156 107.89806,826.35757 107.96875,826.625 C 108.02677,826.8445 107.95856,827.09577 107.84375,827.34375 C 107.90968,828.60231 108.27228,829.84879 108.8125,831 L 108.8125,831.03125 C 109.20446,832.30433 110.49694,833.01526 111.40625,834.15625 C 111.41572,834.16813 111.42812,834.17552 111.4375,834.1875 C 111.72689,834.47999 111.89651,834.77027 111.90625,835.0625 C 111.91641,835.36723 111.787,835.65094 111.625,835.875 C 111.301,836.32313 110.84816,836.70549 110.71875,837.09375 C 110.49623,837.59451 110.59787,837.86601 110.8125,838.1875 C 111.02713,838.50899 111.38039,838.84638 111.625,839.3125 L 111.65625,839.375 L 111.65625,839.4375 C 111.62892,839.83608 111.44601,840.13215 111.1875,840.28125 C 110.92899,840.43035 110.62753,840.4656 110.34375,840.46875 C 110.05997,840.4719 109.80179,840.44668 109.5625,840.46875 C 109.37505,840.48604 109.239,840.55271 109.125,840.625 C 109.07927,841.11225 109.23258,841.64122 109.53125,842.1875 C 109.84816,842.76715 110.25985,843.34186 110.5625,843.90625 L 110.59375,843.9375 L 110.59375,843.96875 C 110.78772,845.06576 111.48212,845.87314 112.21875,846.78125 L 112.21875,846.8125 L 112.25,846.8125 C 112.77299,847.70462 113.9112,848.08641 114.96875,848.1875 C 114.97867,848.18845 114.9901,848.1866 115,848.1875 C 115.67289,848.02334 116.27039,848.14592 116.65625,848.53125 C 117.01655,848.89106 117.12155,849.47349 117.125,850.0625 L 117.15625,850.0625 C 118.09642,851.26186 117.86887,852.65364 117.96875,853.9375 L 117.96875,853.96875 C 117.95591,854.45652 118.31357,854.87485 118.6875,855.34375 C 118.87446,855.5782 119.05627,855.815 119.1875,856.09375 C 119.31873,856.3725 119.39442,856.71702 119.3125,857.0625 L 119.28125,857.09375 C 118.83406,858.02903 118.67139,859.39297 119.125,860.25 C 119.96476,860.99614 121.10991,861.57264 122.21875,861.53125 C 123.24887,861.54164 124.38326,861.38737 125.4375,861.9375 C 125.45898,861.94871 125.47858,861.95693 125.5,861.96875 C 125.87392,862.08161 126.15333,862.32771 126.3125,862.625 C 126.4821,862.94178 126.55813,863.29452 126.5,863.625 C 126.44187,863.95548 126.25229,864.28304 125.9375,864.4375 C 125.64778,864.57966 125.27456,864.47922 124.875,864.28125 L 124.875,864.3125 C 124.56222,864.28535 124.42277,864.36967 124.34375,864.46875 C 124.26473,864.56783 124.23082,864.76386 124.25,865 C 124.28837,865.47228 124.58716,866.09883 124.8125,866.375 C 125.05175,866.70323 125.52122,867.16869 125.8125,867.6875 C 125.95814,867.94691 126.07368,868.22875 126.0625,868.53125 C 126.05368,868.76989 125.866,869.00408 125.6875,869.21875 C 125.68394,869.5872 125.83411,869.96451 126.03125,870.375 C 126.22839,870.78549 126.48792,871.20761 126.59375,871.6875 L 126.59375,871.8125 L 126.53125,871.90625 C 125.89265,872.71225 125.84065,874.18381 126.40625,875.03125 C 126.71226,875.352 127.07604,875.69466 127.25,876.09375 C 127.3398,876.29975 127.3644,876.54876 127.28125,876.78125 C 127.24198,876.89106 127.11548,876.96664 127.03125,877.0625 C 127.30333,877.27399 127.60135,877.40524 128.0625,877.375 C 128.62101,877.33838 129.25469,877.18881 129.8125,877.21875 C 130.13622,877.10005 130.44518,877.03762 130.6875,877.125 C 130.96504,877.22508 131.15497,877.46457 131.25,877.71875 C 131.44006,878.2271 131.36175,878.87903 131.25,879.375 C 131.04827,880.01858 131.16548,880.4642 131.4375,880.875 C 131.70952,881.2858 132.16908,881.65035 132.65625,882.03125 L 132.6875,882.0625 L 132.71875,882.09375 C 133.0459,882.6083 133.59995,883.04654 134.09375,883.5625 C 134.58755,884.07846 135.03184,884.69381 135.03125,885.53125 C 135.24003,885.79509 135.47379,886.06315 135.65625,886.3125 L 137.28125,888.5 L 138.03125,886.5 L 136.75,883.09375 L 137.4375,881.96875 L 144.09375,882.5625 L 145.09375,881.34375 C 145.65056,880.67147 146.689,879.82742 147.375,879.4375 L 148.625,878.71875 L 151.34375,878.71875 L 152,880.40625 L 153.625,880.40625 L 155.75,883.3125 L 158.28125,883.5 L 158.28125,883.96875 C 158.28125,884.22407 158.70415,884.60311 159.25,884.8125 C 159.79586,885.02188 161.47227,886.4099 162.96875,887.90625 L 165.6875,890.625 L 168.3125,890.625 L 170.53125,892.375 C 171.74382,893.33838 173.37646,894.8677 174.15625,895.78125 L 175.5625,897.4375 L 177.28125,897.65625 C 178.21701,897.76729 179.92403,898.05104 181.09375,898.28125 L 183.21875,898.6875 L 183.21875,900.09375 L 188.03125,901.1875 L 187.75,902.53125 L 189.46875,902.53125 L 189.46875,905.71875 L 201.9375,908.3125 L 201.9375,909.6875 L 206.71875,910.75 L 208.78125,921.78125 L 214.90625,923.21875 C 217.59529,923.74862 220.56423,924.53441 221.5,924.96875 C 222.43576,925.40305 224.22108,926.14157 225.46875,926.59375 C 226.71643,927.04592 228.32346,927.44681 228.53125,927.46875 C 229.04743,926.49119 229.39622,925.33902 229.90625,924.3125 L 231.34375,923.625 C 232.13727,923.25052 233.35166,922.93748 234.03125,922.9375 L 235.59375,923 L 236.1875,925.53125 L 238.5625,925.46875 L 239.9375,923.90625 C 239.78428,920.62983 240.04639,918.55028 240.65625,915.5 L 268.65625,920.5 C 272.08538,903.70511 275.22128,886.84519 278.03125,869.9375 L 279.4375,869.9375 L 279.3125,868.34375 L 276.96875,868.3125 L 278.9375,865.875 L 279.71875,861.28125 C 252.57187,856.86026 249.67003,855.97834 201.09375,846.5 C 200.26738,848.90496 199.75617,851.39026 199.09375,853.84375 L 199.125,858 L 200.75,861.1875 L 199.90625,866.8125 L 196.9375,868.375 L 195.625,866.8125 L 191.875,866.8125 L 191.28125,869.0625 L 192.8125,869.0625 L 194,871.28125 L 194,875.21875 L 202.09375,877.28125 L 203.28125,879.875 L 204.53125,879.75 L 204.375,872.875 C 205.13944,872.28751 206.43808,871.37722 206.75,871.375 C 207.57656,871.59805 208.3367,871.91294 209.03125,872.4375 C 209.13283,877.92612 209.34692,879.23213 210,882.625 L 213.28125,883.75 L 213.28125,886.5625 L 211.5,888.34375 L 208.71875,888.34375 L 207.5625,885.8125 L 203,883.59375 L 200.78125,880.46875 C 196.54155,879.37023 192.7967,878.13165 188.59375,876.1875 C 187.10708,872.65525 185.9996,870.25102 183.59375,867.34375 L 178.84375,864.09375 L 178.6875,861.375 C 177.12516,859.34735 174.0367,859.79788 170.5625,857.84375 L 168.25,859.09375 L 166.40625,857.34375 L 168.5,852.46875 L 167.84375,850.375 L 162.5,849.28125 L 154.1875,841.375 L 154.96875,836.8125 L 107.46875,825.84375 z "},"nc13":{"name":"NC-13","path":"M 2213.8301,776.54097 C 2189.4216,782.08823 2165.0689,787.63543 2138.9514,793.18268 L 2140.9541,804.34803 L 2146.6606,799.65873 L 2147.9216,802.34658 L 2151.3501,798.95305 L 2153.5372,802.87701 L 2152.4536,805.25946 L 2154.1185,807.76963 L 2158.4206,806.8527 L 2158.5351,809.94843 L 2152.7184,814.07536 L 2155.3095,816.86031 L 2154.636,817.6578 L 2157.259,817.99456 L 2157.3299,819.6782 L 2158.4642,819.58961 L 2160.3605,816.86031 L 2160.5378,818.86295 L 2162.0442,819.16427 L 2162.7176,819.16427 C 2163.0856,819.16427 2163.9537,819.56302 2164.6494,820.05041 L 2165.9077,820.93654 L 2166.5989,819.16427 L 2169.0269,819.09338 L 2166.7584,818.20724 L 2164.8621,819.37694 L 2162.6645,817.85278 C 2161.4533,817.01337 2160.1874,816.32862 2159.8643,816.32862 L 2159.2794,816.32862 C 2158.8019,815.31681 2158.3423,814.29762 2157.9679,813.24486 L 2160.2364,812.46506 L 2160.2364,810.79912 L 2163.7633,810.09021 L 2162.6863,806.34194 L 2175.4697,803.56721 C 2176.1425,806.22046 2176.6574,808.5348 2176.6832,811.25991 C 2175.3053,811.58936 2175.1144,811.923 2172.2348,810.72823 L 2171.5613,812.5005 L 2172.8551,814.06011 L 2176.9667,814.04236 L 2180.6354,808.42427 L 2179.572,802.52256 L 2202.0432,797.99018 L 2204.0117,806.79377 L 2207.3081,808.67239 L 2207.3081,810.25575 L 2211.6148,809.67087 L 2215.2327,812.52183 L 2217.6795,812.6306 L 2216.2581,817.49833 L 2212.9794,819.19971 L 2212.9794,820.42256 L 2209.4526,818.98704 L 2210.7109,821.36189 L 2214.0125,822.69674 L 2209.6475,824.49879 L 2208.6019,826.8205 L 2212.0578,829.37258 L 2216.2626,829.30328 C 2216.5773,827.23837 2217.3066,825.55354 2218.4912,824.28612 L 2225.1727,825.50902 L 2225.8284,826.55463 L 2234.0164,817.30335 L 2230.9149,814.06011 L 2228.9477,814.06011 L 2227.1454,812.33938 C 2226.2827,812.47776 2224.9812,811.46447 2223.5422,810.09021 L 2217.0202,808.74328 L 2216.2936,804.50751 L 2216.9671,799.59833 L 2214.8758,791.65853 L 2207.9993,792.58011 L 2206.741,784.68307 L 2212.8908,783.9314 L 2212.2351,777.65754 L 2213.8301,776.54097 z "},"nc12":{"name":"NC-12","path":"M 2132.9722,813.67015 L 2129.1153,817.12612 L 2133.5814,821.98216 C 2133.4164,823.39045 2133.2046,824.7675 2135.336,827.70664 L 2134.6448,828.80546 C 2133.2619,828.32663 2131.4372,828.82984 2129.0444,830.59543 L 2130.4578,836.73204 L 2128.4772,836.10724 L 2128.1579,836.70743 L 2130.1786,838.55519 L 2130.1786,839.29059 L 2128.8317,839.22644 L 2126.7758,841.28229 C 2126.3431,842.48097 2126.9489,844.21814 2128.3111,845.19241 C 2121.424,843.60542 2122.8722,842.77616 2114.3432,841.23124 L 2113.7243,855.99979 L 2114.9171,856.55467 L 2117.3873,863.38255 L 2111.1103,864.53042 C 2113.2227,865.75593 2114.939,866.46887 2115.9295,866.23595 L 2117.0792,868.11893 L 2117.1347,874.17575 L 2114.8661,874.17575 L 2114.8661,872.47436 C 2114.2781,871.97972 2112.8814,873.4057 2111.4102,875.00869 L 2113.1648,876.28473 L 2113.1648,878.71278 L 2109.1949,878.71278 L 2109.1949,882.22189 L 2106.9972,882.80671 L 2108.3265,884.9512 L 2111.4811,884.9512 L 2110.7722,887.78684 L 2114.2813,887.78684 L 2115.3092,885.23476 L 2114.0154,882.34592 L 2114.9725,880.67998 L 2120.3071,879.47483 L 2118.8892,877.96842 C 2119.5275,875.93731 2120.3658,874.17666 2120.0412,870.86156 L 2121.2286,867.68922 C 2120.1958,867.34401 2120.4659,864.65916 2120.502,862.39008 C 2120.7964,858.09062 2121.8499,855.84961 2122.9123,853.63503 L 2121.7958,852.51852 L 2119.35,853.83001 L 2117.1524,850.88803 L 2120.2716,847.62704 L 2126.4214,850.67536 L 2127.6974,852.11087 L 2129.5052,851.41971 L 2130.5331,846.40414 C 2131.7878,846.58392 2133.0057,846.54167 2134.1485,846.04968 L 2134.1485,842.52288 L 2139.4299,839.10236 L 2137.7108,836.85159 L 2134.7156,838.16308 L 2133.4042,836.99338 L 2133.4751,831.37523 L 2136.9775,830.17456 L 2137.6754,828.23833 L 2140.3338,828.23833 L 2143.5061,832.20823 C 2145.1232,832.64356 2148.2982,829.18401 2151.1978,826.41285 L 2150.4712,824.10889 L 2154.7956,824.80011 L 2156.8337,822.95694 L 2156.9578,825.68625 L 2158.1806,822.56704 L 2160.8568,822.56704 L 2161.9378,819.46553 L 2160.2364,819.16427 L 2160.201,817.39199 L 2158.5528,819.97951 L 2157.0286,820.03265 L 2157.0286,818.33127 L 2154.2816,818.1009 L 2153.874,818.57939 L 2151.3219,817.94137 L 2150.613,819.78454 L 2148.5572,818.68572 L 2146.9444,819.6782 C 2148.0241,820.0318 2148.9777,820.57438 2149.3901,821.92902 L 2147.1748,826.24226 L 2145.3782,826.33555 L 2144.9794,825.31846 L 2140.8389,825.26527 L 2137.8039,818.75662 L 2137.8039,816.34632 L 2133.2669,815.36711 L 2132.9722,813.67015 z "},"il12":{"name":"IL-12","path":"M 1688.7567,838.26573 C 1688.603,838.41942 1688.1626,837.9491 1687.7781,837.22051 C 1687.3935,836.49198 1686.4158,835.21514 1685.6054,834.38311 L 1684.1319,832.87024 L 1681.0127,833.4761 L 1681.0127,835.53591 L 1683.2812,836.25594 L 1683.2812,838.05669 L 1682.2887,837.22771 C 1681.7429,836.77186 1680.5779,836.09221 1679.6999,835.71745 L 1678.1035,835.03604 L 1678.8007,832.83933 L 1676.8047,830.72314 C 1675.7069,829.55928 1674.4181,827.78394 1673.9408,826.77803 C 1673.4635,825.77211 1673.0729,824.41338 1673.0729,823.75875 L 1673.0729,822.5684 L 1671.5104,822.5684 L 1670.0705,820.83344 L 1671.3472,818.03137 L 1673.5636,818.03137 L 1674.3149,815.66423 L 1673.6178,811.94869 L 1672.5012,810.93807 C 1671.887,810.38228 1670.6159,808.72984 1669.6766,807.26602 C 1668.7372,805.8022 1667.9687,804.30788 1667.9687,803.94531 L 1667.9687,803.28602 L 1668.786,803.28602 C 1669.2354,803.28602 1669.7726,803.01193 1669.9797,802.67693 L 1670.3561,802.06778 L 1667.9373,799.49307 L 1667.4615,795.73374 L 1666.7226,795.26507 C 1666.3162,795.00736 1665.5767,794.79254 1665.0792,794.78777 L 1664.1746,794.77909 L 1662.0891,792.47457 L 1659.7578,792.79414 L 1659.4618,789.64686 L 1658.099,789.12873 C 1657.3496,788.84381 1656.581,788.35931 1656.3912,788.05215 C 1656.2013,787.745 1655.2833,787.32617 1654.3511,787.12144 L 1652.6563,786.74918 L 1650.8731,784.53692 L 1649.0899,783.79829 L 1647.0867,786.27216 L 1644.7929,786.27216 L 1644.0471,783.92238 L 1645.9618,781.80659 L 1645.1506,780.49409 L 1642.2226,781.05379 L 1640.4921,779.76754 C 1639.5403,779.0601 1638.0903,778.32295 1637.2698,778.12944 L 1635.7779,777.77765 L 1635.2018,775.57453 L 1630.7558,774.37732 L 1628.4756,771.95959 C 1627.2216,770.62985 1625.5221,769.08964 1624.699,768.53686 L 1623.2025,767.53185 L 1621.9144,762.74806 L 1622.5626,758.01889 L 1625.4341,753.78754 L 1625.4373,752.02355 C 1625.439,751.0533 1625.6915,749.35571 1625.9984,748.25112 L 1626.5563,746.24269 L 1629.404,742.38287 L 1629.404,740.03439 L 1627.1277,735.78739 L 1631.1054,730.62663 L 1631.1054,726.75201 L 1625.7176,724.27621 L 1629.1204,722.8049 L 1633.2838,722.75375 L 1635.7998,738.63335 L 1650.7076,737.62988 L 1654.0255,764.72314 L 1681.0127,761.81616 L 1681.0127,767.55692 L 1702.4711,765.02089 L 1706.4774,796.90895 L 1697.5371,798.30811 L 1696.5379,794.02963 L 1689.9314,793.64484 L 1692.3708,817.84031 L 1697.9718,817.76561 L 1698.3659,821.43414 L 1694.7121,821.43414 L 1690.6539,826.17534 L 1690.6539,828.06949 L 1687.2511,832.76691 L 1687.2511,833.65066 C 1687.2511,834.13675 1687.6527,835.3111 1688.1436,836.26036 C 1688.6345,837.20962 1688.9104,838.11204 1688.7567,838.26573 z "},"ca17":{"name":"CA-17","path":"M 90.9375,738.34375 C 90.885403,738.35406 90.799072,738.36459 90.71875,738.46875 L 90.71875,738.5 L 90.6875,738.53125 C 90.531048,738.63951 90.414955,738.83095 90.3125,739.0625 C 90.210045,739.29405 90.100941,739.57255 89.84375,739.78125 L 89.8125,739.8125 L 89.78125,739.8125 C 89.568791,739.89147 89.506962,740.04257 89.4375,740.28125 C 89.368038,740.51993 89.344384,740.82069 89.125,741.09375 C 88.808428,741.46394 88.613602,742.07068 88.125,742.53125 C 88.112856,742.5427 88.106317,742.55125 88.09375,742.5625 C 88.08313,742.59648 88.045036,742.59406 88.03125,742.625 L 88.03125,742.65625 C 87.90425,742.92044 87.680835,743.12739 87.46875,743.1875 C 87.214248,743.25963 87.001415,743.27408 86.84375,743.34375 L 86.8125,743.34375 L 86.78125,743.34375 C 86.591188,743.37712 86.38904,743.34968 86.25,743.25 C 86.11096,743.15032 86.029559,742.99162 86,742.84375 C 85.940881,742.548 86.041499,742.23902 86.25,742 C 86.318731,741.91711 86.342933,741.8704 86.34375,741.8125 C 86.344567,741.7546 86.326857,741.68197 86.28125,741.59375 C 86.240847,741.51559 86.159673,741.40344 86.09375,741.3125 C 86.020751,741.48388 86.019734,741.64213 85.84375,741.78125 L 85.78125,741.84375 L 85.71875,741.84375 C 85.524416,741.8731 85.362808,741.89492 85.28125,741.9375 C 85.199692,741.98008 85.164741,741.98015 85.15625,742.15625 L 85.15625,742.1875 L 85.15625,742.21875 C 85.126584,742.34114 85.088916,742.44365 85.03125,742.53125 C 84.973584,742.61885 84.848857,742.68936 84.71875,742.6875 C 84.588643,742.68564 84.526938,742.64496 84.46875,742.59375 C 84.410562,742.54254 84.355257,742.49197 84.3125,742.4375 C 84.226986,742.32855 84.146473,742.20774 84.09375,742.15625 C 84.023313,742.22617 83.955129,742.31803 83.875,742.34375 C 83.739225,742.38733 83.649807,742.37646 83.5625,742.375 C 83.475193,742.37354 83.416215,742.37123 83.40625,742.375 C 83.396285,742.37877 83.394438,742.34615 83.375,742.40625 C 83.336374,742.55572 83.311867,742.68425 83.1875,742.78125 C 83.125317,742.82975 83.021355,742.85286 82.9375,742.84375 C 82.853645,742.83464 82.795264,742.7859 82.75,742.75 C 82.568943,742.60638 82.52517,742.44488 82.46875,742.28125 L 82.4375,742.25 C 82.376997,742.05027 82.30522,741.78462 82.1875,741.625 C 82.12864,741.54519 82.045926,741.5182 82,741.5 C 81.954074,741.4818 81.934149,741.46048 81.84375,741.5 L 81.84375,741.46875 C 81.666641,741.58633 81.485966,741.67951 81.3125,741.625 C 81.129601,741.56753 81.037569,741.4248 80.96875,741.3125 C 80.899931,741.2002 80.857865,741.09999 80.8125,741.03125 C 80.992689,741.50562 81.055024,742.02581 80.96875,742.53125 C 80.968648,742.54122 80.969015,742.55256 80.96875,742.5625 C 80.954247,743.10714 80.659878,743.5753 80.28125,743.9375 C 80.187488,744.21941 80.201841,744.57154 80.21875,744.9375 L 82.46875,744.375 L 84.625,745.53125 L 86.28125,744.125 L 89.125,746.8125 L 90.875,752.8125 L 91.09375,753.25 L 91.4375,757.3125 L 90.625,758.90625 C 90.17113,759.77328 89.197338,761.83187 88.46875,763.5 L 87.125,766.53125 L 85.75,767.625 C 84.99577,768.21827 84.037979,768.68751 83.59375,768.6875 L 82.78125,768.6875 L 83.40625,767.6875 L 81.65625,766.21875 L 79.15625,768.75 L 81.15625,769.875 L 81.15625,770.875 C 81.15625,771.42097 80.850322,772.14969 80.5,772.5 L 79.875,773.15625 L 79.59375,786.53125 L 81.9375,791 L 86.34375,795 L 89.5,801.3125 L 90.3125,806.1875 L 91.15625,806.84375 C 91.61642,807.21783 92.492252,807.98537 93.09375,808.53125 L 94.1875,809.53125 L 94.1875,816.75 L 95.3125,818.1875 C 95.93634,818.98057 96.458383,819.83104 96.46875,820.09375 C 96.47913,820.3565 96.978011,821.14316 97.5625,821.84375 L 98.625,823.125 L 153.15625,835.625 L 153.15625,835 C 153.15625,834.66579 152.80471,834.02346 152.34375,833.5625 L 151.5,832.71875 L 152.875,830.5 L 151.6875,828.09375 L 149.5625,827.90625 L 148.46875,823.59375 L 144.84375,822.59375 C 143.06944,819.26895 140.70403,817.78675 138.65625,814.71875 L 138.46875,813.125 L 136.5625,812.53125 L 136.34375,808.40625 L 138.71875,805.96875 L 136.625,803.625 L 137.25,799.6875 C 139.33445,798.35475 139.84788,799.07711 141.8125,799.0625 L 143.65625,789.3125 L 131.40625,769.84375 L 122.53125,762.34375 L 121.28125,757.34375 L 119.84375,757.34375 L 119.09375,755.40625 L 120.875,754.0625 L 111.09375,751.875 L 109.78125,749.96875 L 107.9375,749.96875 L 103.53125,754 L 101.6875,753.03125 L 102.0625,752.46875 L 101.59375,751.8125 C 101.14447,751.65342 100.04403,750.71789 99.15625,749.75 L 97.5625,748 L 97.21875,746.5625 C 97.214941,746.54641 97.22298,746.51672 97.21875,746.5 C 97.149802,746.52523 97.124431,746.55722 97.09375,746.625 L 97.0625,746.65625 L 97.0625,746.6875 C 96.661807,747.17748 96.154154,747.51794 95.8125,747.9375 C 95.667851,748.09968 95.531253,748.20254 95.34375,748.21875 C 95.156247,748.23496 94.987838,748.11337 94.90625,748 C 94.743074,747.77327 94.666047,747.50782 94.59375,747.34375 L 94.59375,747.3125 L 94.59375,747.25 C 94.591537,747.22709 94.596699,747.22984 94.59375,747.21875 C 94.597837,747.21978 94.518075,747.22525 94.40625,747.25 C 94.294425,747.27475 94.157364,747.32397 93.96875,747.25 C 93.874443,747.21301 93.794113,747.12997 93.75,747.03125 C 93.710128,746.94202 93.687191,746.85329 93.6875,746.75 C 93.687533,746.73901 93.68719,746.72998 93.6875,746.71875 C 93.648471,746.39788 93.727578,746.11349 93.9375,745.9375 C 94.088958,745.81052 94.296112,745.80932 94.5,745.8125 C 94.615679,745.64465 94.60239,745.46734 94.65625,745.28125 C 94.510662,745.32623 94.311718,745.42402 94.09375,745.5625 C 93.878741,745.6991 93.582976,745.81799 93.28125,745.75 C 93.278507,745.74938 93.283998,745.7819 93.28125,745.78125 C 93.253774,745.77851 93.244295,745.75681 93.21875,745.75 C 93.053054,745.70585 92.914335,745.6146 92.84375,745.5 C 92.762283,745.36773 92.725274,745.23019 92.6875,745.125 C 92.656239,745.03795 92.627426,745.01038 92.625,745 C 92.485813,745.10127 92.336671,745.19648 92.1875,745.15625 C 91.997069,745.1049 91.879681,745.00309 91.78125,744.875 C 91.584388,744.61883 91.410342,744.26089 91.34375,744.1875 C 91.200269,744.04811 91.117754,743.89363 91.125,743.71875 C 91.132647,743.53418 91.216863,743.37639 91.34375,743.28125 C 91.597524,743.09096 91.988442,743.048 92.28125,743.28125 L 92.3125,743.28125 L 92.3125,743.3125 C 92.400695,743.42001 92.450466,743.43574 92.46875,743.4375 C 92.487034,743.43926 92.528365,743.44256 92.5625,743.40625 C 92.630769,743.33362 92.676875,743.10011 92.625,742.9375 L 92.625,742.90625 C 92.582101,742.56524 92.266,742.21399 92.09375,741.71875 L 92.0625,741.71875 C 91.942341,741.51036 91.745969,741.25163 91.59375,740.96875 C 91.441531,740.68587 91.345085,740.31531 91.5,739.9375 L 91.53125,739.90625 L 91.5625,739.875 C 91.715761,739.72471 91.714954,739.6154 91.6875,739.46875 C 91.660046,739.3221 91.587472,739.1454 91.46875,738.9375 L 91.4375,738.90625 L 91.4375,738.84375 C 91.399754,738.64903 91.229669,738.45164 91.09375,738.375 C 91.02579,738.33668 90.989597,738.33344 90.9375,738.34375 z "},"ca19":{"name":"CA-19","path":"M 179.2559,787.97355 L 179.2559,786.37589 L 164.40439,782.86809 L 163.32662,783.53418 L 162.64254,782.97369 C 162.26631,782.6654 160.86085,782.11965 159.51937,781.76094 L 157.08026,781.10874 L 158.92677,774.19992 L 158.40076,773.85584 C 158.11147,773.66659 157.58137,772.95434 157.22278,772.27299 C 156.86418,771.5917 156.57075,770.71764 156.57075,770.33063 L 156.57075,769.62699 L 163.03857,775.37507 L 168.19156,775.95587 L 172.73392,773.75371 L 174.71887,776.18952 L 174.71887,778.6474 L 176.98738,780.58976 L 177.77293,783.23037 L 180.3301,776.78115 L 179.03863,772.57328 L 174.76407,770.39256 L 169.30035,770.39256 L 161.80535,763.20188 L 160.99475,758.40386 L 159.41297,757.79692 L 162.19996,753.12332 C 166.41347,752.76989 168.41941,752.17054 172.62995,752.71975 L 177.52803,753.40694 L 180.58768,752.42002 L 174.74229,745.77407 L 175.26762,744.25978 L 174.78959,743.28976 C 174.52673,742.75621 173.89285,741.0094 173.38096,739.40794 C 172.86912,737.80648 172.55378,735.45539 172.55417,734.56148 L 169.91864,721.05945 L 141.24983,728.39685 L 139.86745,727.767 C 139.1071,727.42059 138.37034,726.83827 138.23015,726.47298 L 137.97534,725.80887 L 139.10092,720.1162 C 142.09893,719.04643 143.96244,717.1516 145.92909,714.89578 L 141.07368,710.27692 L 139.0353,710.27692 L 137.67595,714.81395 L 136.40388,714.7624 L 130.99852,711.53419 L 130.07028,709.81295 L 133.22381,709.70979 L 134.19225,708.50623 L 142.47397,708.03563 L 145.43906,709.84261 L 150.13384,689.60508 L 159.50853,706.95751 L 160.44991,706.18248 C 160.9677,705.75616 162.09901,705.05315 162.96394,704.62021 C 163.82886,704.1872 165.27039,703.17737 166.16731,702.37613 L 167.79814,700.91929 L 168.19689,698.08365 L 171.03253,697.6849 L 172.60376,695.8993 C 173.4679,694.91726 176.70212,691.56167 179.79081,688.44246 C 182.87957,685.32326 186.60645,681.68654 188.07282,680.36088 L 190.73889,677.95058 L 197.54699,676.65554 L 202.73297,682.55839 C 206.42165,681.42612 207.91081,680.2939 212.46691,680.52472 L 211.74914,684.08045 L 213.83016,686.46489 L 213.22127,687.56438 L 213.72763,692.41236 L 212.44161,695.10055 L 215.18464,696.27718 C 214.96425,699.10993 217.90556,698.99747 219.05813,701.02172 L 219.70409,702.90424 L 222.72711,702.90424 L 225.30079,705.64382 C 227.12165,710.37123 224.0168,709.0577 224.75339,712.66986 L 226.04422,715.81879 L 228.66716,717.66655 L 228.31015,718.79133 C 228.11381,719.40996 227.93114,720.69088 227.9042,721.63775 L 227.85526,723.35939 L 224.6262,725.26681 L 225.18382,728.12225 C 227.7812,727.3214 229.17039,728.16246 231.14818,728.10512 L 233.1274,732.43038 L 234.0249,738.10184 L 216.56616,749.69236 L 216.01815,751.11018 C 215.71677,751.88999 215.44954,753.2389 215.42425,754.10786 L 215.37837,755.68765 L 214.89812,755.98449 C 214.63401,756.1477 214.41788,756.71994 214.41788,757.25604 L 214.41788,758.23077 L 210.96543,760.84903 L 209.12929,759.33355 L 208.65205,760.75137 L 207.04521,760.75137 L 206.96842,762.16919 L 206.35302,760.89315 C 206.01456,760.19133 205.52039,759.63475 205.25716,759.61711 C 204.87497,759.59154 204.80698,760.21748 204.82826,760.72041 C 203.17888,759.4928 202.72461,759.83455 202.23785,760.22218 C 201.80583,760.56626 202.52692,761.8972 203.35337,762.40796 L 201.09035,764.10804 L 199.1054,763.51057 C 199.00613,764.41701 199.34004,765.26833 198.80641,765.85553 C 198.55687,765.85553 197.88341,765.54094 197.4989,765.15637 L 196.79974,764.45727 L 196.12917,767.0216 L 194.22016,766.41568 L 191.09129,769.48714 L 191.22356,770.21221 C 191.48563,770.21221 191.31776,770.33585 190.59847,770.95969 C 189.87918,771.58353 189.07448,772.09395 188.81032,772.09395 L 188.32996,772.09395 C 188.23755,774.94275 187.7326,777.14695 186.8151,779.17069 L 182.81333,778.82593 L 180.8915,784.70144 L 183.2258,786.33648 L 183.2258,787.97355 L 179.2559,787.97355 z "},"ca21":{"name":"CA-21","path":"M 194.31441,766.8471 L 196.35767,767.39801 L 196.96585,765.30116 L 197.98963,765.93391 C 198.74636,766.3415 198.85106,766.27175 199.43332,765.40137 L 199.37172,763.91686 L 201.05646,764.5517 L 204.01233,762.50199 L 203.21351,761.89618 C 202.22274,761.14479 201.99174,758.80175 204.97479,761.13112 C 205.12511,759.75788 205.31357,759.75788 205.95978,760.9404 L 207.00891,762.60696 L 207.43983,761.3185 L 208.81782,761.16594 L 209.31372,760.00843 L 210.84463,761.30858 L 214.79428,758.46511 L 214.79428,757.52328 C 214.79428,757.00526 215.02396,756.43944 215.30469,756.26595 L 215.81511,755.95051 L 215.85325,753.62364 L 216.8069,749.99986 L 234.30066,738.41132 L 236.01645,740.59947 L 237.44786,740.17895 C 239.30554,742.64392 240.59103,744.76555 240.6177,746.29594 L 243.61396,746.38243 L 244.56172,748.08886 L 244.76558,750.21486 L 242.87145,751.76958 L 243.52137,754.74185 L 241.95832,754.74185 L 243.55143,756.9008 C 243.99703,757.34639 243.70161,757.23415 244.17715,757.23415 L 245.70923,757.19604 L 246.86289,761.37419 L 245.64754,762.60639 L 246.21776,769.62399 L 248.51439,769.63692 L 255.59547,775.59421 C 256.03421,781.4451 256.35851,784.53051 257.17871,785.28893 L 256.60994,790.52818 L 255.04126,790.62352 L 256.72257,799.01878 L 254.46823,799.00528 L 256.03268,800.86189 L 256.17987,803.90754 L 258.23751,805.83844 L 256.18883,807.87438 L 258.22931,809.47017 L 258.46036,814.34503 C 259.45555,814.95322 259.43924,815.49392 259.30156,817.01916 L 262.10184,817.50468 L 262.3256,819.28155 L 260.62306,819.25393 L 263.4753,823.15685 L 262.86632,824.95839 L 261.48956,824.78803 L 261.48956,831.03682 L 263.433,834.6796 L 261.97185,836.01531 C 263.37708,849.78207 263.91702,841.54549 263.77707,852.65452 L 262.19048,853.26339 L 261.47618,857.73038 C 236.3785,852.90797 213.93854,848.33283 187.29569,842.70691 L 193.48051,814.05149 L 196.09718,814.70822 L 197.80951,805.79818 L 194.95387,805.7764 L 196.46384,799.98692 L 193.1356,799.91484 L 188.72379,802.91887 L 185.22319,802.35781 L 183.81646,803.13959 C 181.26832,802.46153 178.67402,802.02825 176.07935,801.58906 L 179.24853,791.86989 L 184.54647,791.94345 L 185.15562,789.16662 L 187.04732,787.9385 L 188.53651,788.87908 L 188.54133,791.16892 L 190.84689,791.31553 L 192.12825,794.60816 L 195.60565,794.77909 L 198.59794,789.42529 C 197.90183,787.53249 196.89484,785.92139 195.47971,784.49149 L 192.29317,785.8399 L 188.88268,784.42718 L 188.53015,782.93938 C 188.33625,782.12107 187.81245,781.03031 187.36618,780.51541 L 186.55468,779.57925 C 187.86282,779.68876 188.56181,775.68648 188.76587,772.59795 C 189.89451,772.40071 191.13084,771.16703 191.82875,769.9468 L 191.58646,769.48487 L 194.31441,766.8471 z "},"ca18":{"name":"CA-18","path":"M 177.79265,782.25315 L 177.55451,780.60088 L 175.22898,778.48776 L 175.34977,776.11801 L 172.64783,773.29399 L 167.85848,775.36254 L 163.28889,774.84361 L 156.66205,768.91842 L 156.3758,759.70394 L 153.4975,756.04443 L 132.42598,769.82543 L 123.06993,762.13244 L 121.86276,756.78147 L 120.04373,756.81981 L 119.59379,755.57173 L 121.67731,754.04825 L 119.53158,751.67731 L 120.84164,751.67731 L 120.84164,749.92851 L 122.57995,747.0906 L 121.48597,745.71254 L 122.9689,744.08471 L 122.35581,741.1577 L 121.41024,741.09101 L 120.94849,739.48405 L 118.74678,739.80946 L 117.27877,738.04065 L 114.75788,739.69241 L 114.75788,735.24958 L 113.51644,733.75372 L 114.15174,731.32443 L 116.57803,730.97712 L 117.38108,725.33628 L 115.38042,723.47241 L 115.85046,719.44608 L 125.37867,713.15674 L 126.56357,703.34955 L 124.81154,700.39782 L 128.64204,699.40137 L 131.24698,688.58691 L 132.61019,690.45112 L 133.33169,694.96331 L 128.78144,704.01332 L 128.78144,705.82881 C 128.78144,706.82736 129.09904,708.55568 129.48724,709.66952 C 129.87544,710.78342 130.44965,711.88711 130.76328,712.12218 C 131.0769,712.35726 132.42502,713.18669 133.75902,713.96535 L 136.18457,715.38108 L 138.24308,715.38108 L 139.60243,710.84405 L 140.8251,710.84405 L 145.35703,714.95766 L 144.37816,715.9241 C 143.75472,716.62587 142.19251,717.81661 140.90654,718.57021 L 138.56856,719.94039 L 137.40821,725.80887 L 137.67947,726.5158 C 137.82868,726.90462 138.55188,727.61659 139.2866,728.09803 L 140.62241,728.97328 L 169.50945,721.74239 C 170.14735,725.77564 171.24009,729.73715 171.57635,733.81276 L 171.73679,736.08127 C 172.64634,739.14632 174.05229,741.57942 174.46865,744.75823 L 174.08125,746.0966 L 179.5001,751.88982 L 176.64575,752.65317 L 171.11141,751.73215 L 162.30471,752.14712 L 158.73972,758.26939 L 160.73511,759.06382 L 161.43538,763.35784 L 169.18647,770.95969 L 174.68042,770.95969 L 178.44133,772.75318 L 179.76291,776.98759 C 179.12629,778.74914 178.61989,780.56951 177.79265,782.25315 z "},"ca16":{"name":"CA-16","path":"M 105.93994,745.42364 L 102.61292,743.39253 L 99.192294,736.724 L 95.226974,734.68489 C 94.744124,732.24317 94.586374,730.51672 94.753724,727.94496 L 97.739884,724.3961 C 96.819994,723.54586 96.211274,723.24052 95.158304,721.94423 L 95.320854,721.03076 L 98.656194,721.07907 L 98.974294,719.13564 L 100.69749,719.14602 L 103.25859,722.41965 L 103.94762,728.36526 L 101.55927,731.72658 L 101.55927,733.48927 L 102.65626,734.07636 C 103.25958,734.39928 104.28041,734.66345 104.92478,734.66345 L 106.0963,734.66345 L 106.0963,736.1926 L 101.46174,738.49855 L 103.37551,740.83687 L 106.76167,740.86937 L 107.73955,742.20485 C 107.1814,743.30247 106.63285,744.4112 105.93994,745.42364 z "},"il16":{"name":"IL-16","path":"M 1680.8178,492.71078 C 1648.276,497.10563 1615.4663,498.26063 1582.9703,503.02543 L 1582.6159,503.36217 L 1583.7501,504.19514 L 1587.4365,507.11939 L 1590.3075,507.84603 L 1594.9155,512.01088 L 1594.3306,515.67949 L 1596.7941,518.53286 L 1604.7339,521.49256 L 1605.3719,522.30781 C 1605.7182,522.75824 1606.2925,523.12305 1606.6479,523.12306 C 1607.0035,523.12306 1607.3019,523.18685 1607.3214,523.26484 L 1607.9417,528.49306 L 1609.0405,529.82227 L 1608.4734,543.75236 L 1607.5319,544.78028 L 1607.3392,552.04662 L 1612.3901,552.04662 L 1612.3901,546.49939 L 1622.1199,545.13474 L 1621.3933,540.91672 L 1624.353,539.56979 L 1628.6242,539.56979 C 1629.8225,540.77597 1630.8958,542.17743 1632.4168,542.97256 L 1632.9485,542.97256 L 1632.4168,534.69603 L 1641.0301,533.40227 C 1647.5854,534.16442 1648.2216,533.89072 1668.465,531.02741 L 1669.2093,526.06504 L 1673.3564,525.28524 L 1674.9116,523.82578 L 1675.9817,525.32068 L 1678.6733,524.71811 L 1678.1948,513.62365 L 1695.3004,511.62098 L 1695.0669,506.78266 C 1691.0065,506.78692 1690.6366,506.44097 1688.7044,505.82563 L 1688.3145,508.25365 C 1686.5392,508.45991 1684.7525,508.9643 1682.9622,508.82078 C 1682.0019,503.48956 1681.6107,498.06918 1680.8178,492.71078 z "},"il17":{"name":"IL-17","path":"M 1624.2289,540.13692 L 1622.0313,541.32434 L 1622.7225,545.66642 L 1612.9572,547.0488 L 1612.9572,552.61375 L 1606.7188,552.61375 L 1606.9138,544.97524 L 1602.7312,548.66157 L 1603.4401,551.49722 L 1602.0932,553.10999 L 1602.873,558.19642 L 1599.6297,559.91553 L 1596.9536,563.3892 L 1592.5938,563.3892 L 1591.8494,564.27533 C 1591.4472,564.76485 1590.5342,565.72189 1589.8113,566.40207 C 1589.0884,567.08228 1587.6847,567.95002 1586.6921,568.31615 L 1584.8844,568.97187 L 1579.9574,569.06051 L 1576.7319,571.34672 L 1573.5418,570.73575 L 1571.0606,572.46328 L 1569.3947,582.29939 L 1572.8861,586.6415 L 1574.9419,586.6415 L 1577.9548,591.42665 L 1578.4156,601.67041 L 1574.3925,606.06566 L 1574.3925,606.77457 C 1574.3925,607.16509 1574.0307,607.77759 1573.595,608.13919 L 1572.8152,608.79497 L 1572.0176,618.87919 L 1569.5719,621.09457 L 1567.3211,621.50216 C 1566.0842,621.7234 1564.395,622.25973 1563.5639,622.68962 L 1562.0574,623.46942 L 1559.7358,627.38612 L 1561.7916,629.22929 L 1561.7384,638.2493 L 1558.6015,638.51693 L 1557.9812,641.45801 C 1557.6434,642.65493 1557.2045,645.48649 1557.0065,647.74962 L 1556.652,651.8613 L 1557.6622,655.68942 C 1558.2214,657.79341 1559.15,660.45392 1559.718,661.59107 C 1560.2861,662.72822 1561.1729,664.0916 1561.703,664.6217 L 1562.6778,665.57873 L 1561.3308,669.30051 L 1561.6321,670.08031 C 1561.8005,670.51042 1562.8334,671.43144 1563.9184,672.13615 L 1565.8856,673.42989 L 1565.8856,677.91378 C 1568.1104,679.57586 1570.4381,681.12395 1572.4253,683.07107 C 1572.6342,683.40914 1573.4025,683.91235 1574.1267,684.18764 L 1575.4382,684.70157 L 1576.9623,687.87397 L 1579.479,688.22843 L 1580.5246,689.75259 C 1581.1041,690.5895 1581.7347,691.70595 1581.9247,692.23378 L 1582.2792,693.1908 L 1583.5729,694.00605 L 1594.118,700.15583 L 1599.293,704.97642 L 1599.8778,707.59939 C 1600.2009,709.0408 1600.9038,711.14145 1601.4374,712.26051 L 1602.4122,714.2986 L 1601.1716,717.59503 L 1601.9514,718.62295 C 1602.3815,719.18367 1603.0074,720.65401 1603.3515,721.9017 L 1603.9895,724.17021 L 1606.9315,727.28942 L 1609.2709,727.25397 L 1610.3166,725.8007 C 1610.8962,725.00525 1611.5667,723.67324 1611.7875,722.84097 L 1612.1774,721.33457 L 1616.3069,720.98011 C 1616.5758,715.98847 1616.5594,713.75608 1615.6865,708.57417 L 1611.7736,708.3839 L 1611.7036,704.18635 L 1609.6608,702.01675 L 1608.8633,696.66447 L 1612.3901,696.66447 L 1613.5776,694.53774 L 1615.5093,696.69991 L 1625.7531,695.28209 L 1628.3938,717.61278 L 1644.8582,715.94684 L 1644.1671,720.34209 L 1648.6155,721.051 L 1648.9699,715.66328 L 1654.3576,714.6885 L 1654.8362,712.56177 L 1669.6701,711.26803 L 1669.6701,707.63484 L 1675.0578,706.48288 L 1680.5519,706.99682 L 1679.7544,698.45444 L 1684.9826,697.67464 L 1684.256,690.99318 L 1678.177,690.99318 L 1677.4681,684.18764 L 1672.9489,684.18764 L 1674.3489,699.50011 L 1668.465,700.22672 L 1667.8447,697.79873 L 1664.566,697.79873 L 1664.566,703.85991 L 1647.6939,704.60427 L 1645.1772,683.6914 L 1641.0301,683.33694 L 1640.6934,679.26071 L 1644.1493,675.55662 L 1644.1493,672.27793 L 1646.5596,670.38157 L 1647.3572,667.03199 L 1652.7626,664.26724 L 1663.7153,663.09754 L 1664.7964,662.06962 L 1666.799,662.08731 C 1667.9063,662.09208 1669.1285,662.28751 1669.5106,662.53041 L 1670.2018,662.97345 L 1671.3715,671.85259 L 1676.0326,671.14368 L 1675.2528,663.82414 L 1677.4327,661.48474 L 1682.4837,663.20387 C 1683.0741,662.51963 1683.4884,661.71335 1683.9015,660.89991 L 1679.9139,658.87952 L 1681.633,658.52506 L 1678.691,657.55028 L 1677.734,658.04652 C 1668.8151,660.34617 1661.1489,660.3511 1651.3093,663.31021 L 1649.413,664.74573 L 1646.2406,667.7586 L 1646.0457,670.04486 L 1643.3873,672.27793 L 1641.9163,672.27793 L 1640.1794,675.62751 L 1640.1794,684.01041 L 1604.539,687.78533 L 1603.3338,690.42605 L 1587.5605,690.42605 L 1586.7984,685.28645 L 1581.198,686.0308 L 1581.198,680.78486 L 1574.9596,680.78486 L 1574.9596,675.82249 L 1569.5896,676.15919 L 1567.6756,647.8914 L 1583.9628,646.6685 L 1583.3425,641.33397 L 1605.5137,639.9516 L 1606.2758,645.02031 L 1617.2107,644.34685 L 1618.8944,642.57457 C 1619.822,641.60166 1621.044,639.96856 1621.606,638.94137 L 1622.6339,637.06276 L 1623.3251,631.97635 L 1629.2799,626.60632 L 1630.6269,621.64395 L 1629.8648,616.13219 L 1624.3707,616.13219 L 1624.0163,611.3116 L 1613.3294,611.79009 L 1612.9041,606.63279 L 1623.2188,605.21497 L 1622.882,600.53615 L 1611.9471,600.89061 L 1610.5824,590.6114 L 1605.5846,590.6114 L 1605.5846,584.37299 L 1626.462,582.54751 C 1626.2277,579.23764 1626.3282,575.87802 1625.7531,572.60506 L 1620.897,573.13675 L 1620.897,578.54217 L 1610.2634,579.26883 L 1609.4481,574.97992 L 1599.5057,575.4584 L 1598.7081,569.43266 L 1603.2806,568.45794 L 1602.554,562.69801 L 1609.0405,559.82692 L 1609.714,556.53048 L 1612.78,554.93543 L 1614.6055,552.17068 L 1618.1677,550.20345 C 1620.1336,549.11789 1622.4496,548.06813 1623.3073,547.86405 L 1624.8669,547.49187 L 1624.8669,546.09177 L 1631.0877,542.74217 L 1628.6419,540.13692 L 1624.2289,540.13692 z "},"il18":{"name":"IL-18","path":"M 1657.6186,566.13622 C 1657.1568,566.90884 1656.0748,567.31846 1654.3931,567.35912 L 1650.3877,571.36447 L 1650.2992,575.08625 L 1626.9582,577.67378 L 1627.2418,583.23873 L 1606.1517,585.04645 L 1606.1517,590.04427 L 1610.9208,590.09004 L 1612.2677,600.3515 L 1623.2204,600.01479 L 1623.7401,605.41613 L 1613.2499,606.90767 L 1613.6158,611.41623 L 1624.3868,610.63643 L 1624.8669,615.56506 L 1630.3307,615.5193 L 1631.1586,621.62625 L 1629.7762,626.64222 L 1623.839,632.31351 L 1623.077,637.57675 C 1621.7986,639.93385 1619.826,642.291 1617.831,644.6481 L 1605.7087,645.35702 L 1605.0352,640.32375 L 1583.9628,641.86566 L 1584.6895,647.18249 L 1568.3136,648.35219 L 1569.8555,675.78704 L 1575.2432,675.39714 L 1575.5976,680.21774 L 1581.7652,680.21774 L 1581.7652,685.42823 L 1587.2947,684.66612 L 1588.0745,689.85892 L 1603.1388,689.85892 L 1604.3263,687.23595 L 1639.6123,683.42553 L 1639.6123,675.71615 L 1641.4378,672.02982 L 1643.3695,672.02982 L 1645.8507,669.83219 L 1645.8507,667.7409 L 1650.4409,663.16843 C 1660.5986,660.18851 1670.6938,659.42124 1677.2909,657.83385 L 1678.6733,657.0009 L 1682.2178,658.38328 L 1687.96,657.47939 L 1686.4004,645.26843 L 1668.0042,647.78506 L 1666.037,633.16375 L 1660.986,633.81952 L 1658.558,614.28902 L 1664.7255,613.33199 L 1666.5687,611.20526 L 1668.7131,611.2584 L 1668.2523,608.47596 L 1671.1411,608.36962 L 1670.5031,603.03504 L 1668.2168,602.71603 L 1664.9736,582.10447 L 1659.9935,582.10447 L 1657.6186,566.13622 z "},"oh12":{"name":"OH-12","path":"M 1958.242,611.97803 L 1956.0196,609.77309 L 1957.8016,606.774 C 1957.1021,604.45751 1956.1315,602.47987 1954.2522,601.63808 L 1952.5918,602.06893 L 1951.0996,600.02801 L 1947.8884,606.07371 L 1945.0635,605.42163 L 1945.0374,603.56814 L 1946.5706,602.04874 L 1945.0672,594.48512 L 1941.4,594.91324 L 1939.4978,583.361 C 1944.1262,582.51139 1949.2597,582.46999 1954.3688,582.3894 L 1954.7771,585.59747 L 1963.4428,584.70606 L 1963.4428,589.52989 L 1976.4822,587.60188 L 1977.0041,588.56316 L 1982.158,588.43822 L 1983.1743,597.42466 L 1980.056,600.76283 L 1974.6923,602.11339 L 1975.4639,608.93726 L 1965.1472,610.08161 C 1963.9661,609.21084 1962.6224,608.12229 1961.2307,607.62662 C 1960.4304,607.43425 1959.8158,608.05866 1960.1663,608.90584 L 1962.2683,612.38642 L 1958.242,611.97803 z "},"pa18":{"name":"PA-18","path":"M 2071.4808,587.77383 L 2065.1368,556.58502 L 2066.0403,556.57634 C 2066.5372,556.57157 2067.3172,556.33144 2067.7737,556.04273 L 2068.6036,555.5178 L 2066.7466,551.62357 L 2069.4627,550.38601 L 2070.0618,552.61088 C 2070.3913,553.83456 2070.8953,554.98059 2071.1817,555.15763 L 2071.7025,555.47952 L 2076.7479,548.65707 L 2087.9275,557.71205 L 2091.2121,557.02571 L 2090.6035,559.3529 L 2094.0284,560.54681 L 2095.3461,561.96869 C 2096.0709,562.75072 2096.8993,563.39057 2097.1872,563.39057 L 2097.7105,563.39057 L 2098.4233,559.82641 L 2100.3328,558.43014 L 2097.7537,557.61155 L 2100.1208,555.95358 L 2100.1208,553.30848 L 2096.1907,552.57119 L 2095.4702,551.4054 L 2096.0537,550.82184 L 2098.6132,552.1916 L 2099.9225,550.40095 L 2102.4211,551.05434 L 2101.694,553.34539 L 2104.7029,552.94623 C 2106.3579,552.7267 2107.918,552.41972 2108.1698,552.26407 L 2108.6277,551.98106 L 2108.6277,549.40623 C 2106.7476,548.44178 2104.6853,547.75151 2102.9564,546.52604 L 2104.1341,544.10154 L 2107.5518,545.86888 L 2108.188,547.52671 L 2113.1569,548.77791 L 2112.7995,551.12186 C 2112.603,552.41104 2112.2427,553.85684 2111.9989,554.33475 L 2111.5557,555.2037 L 2113.5763,557.88241 L 2114.2212,557.48381 C 2114.5759,557.26458 2114.8661,556.72947 2114.8661,556.29468 C 2114.8661,555.85988 2115.1623,554.85411 2115.5243,554.05963 L 2116.1824,552.61512 L 2117.2609,552.61512 L 2116.5161,556.58502 L 2123.0962,556.58502 L 2124.5381,553.32743 L 2132.8179,556.73561 L 2132.2068,559.44908 C 2131.8707,560.94149 2131.4045,562.35379 2131.1707,562.58752 C 2130.937,562.82125 2130.7457,563.59996 2130.7457,564.31798 L 2130.7457,565.62348 L 2129.0295,564.96489 L 2126.4923,570.68579 L 2124.5047,571.2249 L 2124.0806,570.53539 C 2123.8474,570.1562 2122.3806,569.22288 2120.821,568.46145 L 2117.9854,567.0769 L 2117.6411,565.09195 C 2117.4517,564.00023 2117.2061,562.8518 2117.0952,562.53987 C 2116.9844,562.22795 2117.2228,561.37859 2117.625,560.65239 L 2118.3563,559.33204 L 2117.705,557.63501 L 2115.3472,559.50271 L 2113.2468,558.85252 L 2111.4634,560.63594 L 2111.4807,564.80839 L 2112.5495,566.49877 L 2110.7906,569.18312 L 2111.4106,569.80305 C 2111.7515,570.14401 2112.0305,570.61915 2112.0305,570.85888 L 2112.0305,571.29477 L 2110.4438,570.68596 L 2109.661,571.95258 L 2107.9304,570.51633 L 2105.5085,570.47969 L 2105.7473,569.629 C 2105.8786,569.16112 2105.9997,568.14029 2106.0163,567.36049 L 2106.0466,565.94265 L 2107.7663,564.62414 L 2106.212,563.18374 C 2105.3572,562.39152 2104.6539,561.53975 2104.6491,561.29092 C 2104.6444,561.04208 2104.423,560.49541 2104.1573,560.0761 L 2103.6741,559.31371 L 2100.3071,561.05484 L 2100.1471,565.31197 L 2097.2507,567.64405 L 2097.0016,571.35642 L 2095.3002,571.00281 L 2095.6019,567.25903 L 2094.4585,566.96002 C 2093.8298,566.79561 2093.3153,566.46537 2093.3153,566.22621 C 2093.3153,565.98705 2093.5567,565.65118 2094.2119,565.47984 L 2095.4712,564.94168 L 2095.1212,564.47383 L 2089.4399,563.63884 L 2088.7412,564.04751 L 2091.157,567.95642 L 2090.5152,569.629 L 2087.7829,569.629 L 2087.0768,568.77831 C 2086.6885,568.31043 2086.0831,567.9292 2085.7314,567.93113 C 2085.3796,567.933 2084.3907,568.30033 2083.5338,568.7474 L 2081.9757,569.56015 L 2080.7333,567.23872 L 2079.4773,568.49474 L 2076.4228,568.49474 L 2075.7383,570.27831 L 2076.3034,571.33419 C 2076.6142,571.91493 2076.8685,572.91727 2076.8685,573.56164 L 2076.8685,574.73316 L 2077.6787,574.73316 C 2078.1243,574.73316 2078.8671,574.35488 2079.3295,573.89262 C 2079.7918,573.43029 2080.2566,572.8136 2080.3624,572.52215 L 2080.5549,571.99228 L 2084.5248,571.30634 L 2086.1808,572.39523 L 2084.9223,578.4195 L 2087.7636,580.73338 L 2086.1043,582.11054 L 2080.3176,582.45524 L 2079.2573,583.41476 C 2078.6741,583.94253 2077.9619,584.38472 2077.6746,584.39737 C 2077.3872,584.41008 2076.2685,585.1757 2075.1886,586.09876 L 2073.225,587.77712 L 2071.4808,587.77383 z "},"pa19":{"name":"PA-19","path":"M 2231.2339,528.74118 C 2231.1375,528.74248 2230.1631,529.43368 2228.6286,530.21217 C 2227.0942,530.99066 2225.4991,531.62998 2225.0841,531.62999 L 2224.322,531.62999 L 2224.3752,535.44038 L 2219.7141,539.07355 L 2214.0251,539.46345 L 2215.6556,543.18524 L 2218.6684,540.52682 C 2219.883,542.19923 2220.7896,543.9787 2221.5395,546.32217 L 2219.2001,548.67929 L 2220.3521,550.84147 L 2212.6427,554.58098 L 2210.6932,551.31999 L 2208.1057,550.66424 L 2207.7689,551.53266 L 2209.2222,554.10246 L 2211.7388,554.77593 L 2215.6733,570.54922 L 2271.057,556.74316 C 2267.9709,553.67657 2263.0333,550.61161 2261.8057,547.54504 L 2256.9319,546.269 L 2252.962,540.75722 L 2251.8809,541.8383 L 2246.9362,541.89147 L 2243.9411,538.13425 L 2243.0904,539.51662 L 2241.2295,535.59989 L 2236.7988,534.89098 L 2232.2086,531.48821 L 2231.2339,528.74118 z "},"oh16":{"name":"OH-16","path":"M 1980.0424,567.99028 L 1978.0474,557.71928 L 1975.9196,557.71928 L 1975.9196,554.88364 L 1973.4956,552.45962 C 1973.1234,550.90284 1972.7527,549.34088 1972.654,547.75187 C 1976.8895,547.00046 1981.2193,546.88433 1985.4507,546.1087 L 1984.8708,539.63395 L 1982.4633,539.2876 L 1981.1949,531.53007 L 1985.4889,530.49354 L 1984.8722,526.69327 L 1988.5812,525.95148 L 1990.7518,527.91582 L 1992.6936,525.34156 C 1995.7008,524.53647 1998.7521,523.87244 2001.7064,522.88907 L 2004.37,536.16839 L 2006.4727,536.16839 L 2006.8281,539.85473 C 2010.8421,539.91478 2014.4579,539.44395 2018.0289,538.91328 L 2017.3438,533.9155 L 2031.7506,531.16473 L 2034.9961,546.2657 L 2028.024,547.90789 L 2028.7334,552.44431 L 2020.458,553.74938 L 2010.5145,557.07777 L 2010.5145,554.8072 L 1983.7742,560.21283 L 1984.5209,566.64668 L 1980.0424,567.99028 z "},"pa16":{"name":"PA-16","path":"M 2271.5302,556.65397 L 2270.4695,555.3406 C 2269.8861,554.61824 2268.6431,553.54757 2267.7073,552.96132 C 2266.7716,552.37508 2265.2091,551.07048 2264.2352,550.06222 C 2263.2613,549.05395 2262.368,547.97966 2262.2502,547.6749 L 2262.036,547.1208 L 2257.0359,545.52601 L 2253.0219,539.85069 L 2251.6824,541.27255 L 2247.2193,541.27255 C 2246.1028,540.08958 2244.8415,538.9933 2244.1715,537.49337 C 2245.67,535.49972 2250.788,531.6446 2254.0962,528.72022 L 2260.9018,525.54307 L 2269.6923,517.11898 L 2269.6923,515.18463 L 2273.7021,515.18463 C 2272.1409,517.44969 2270.9933,519.3011 2270.2594,521.97983 L 2281.8855,527.8179 L 2278.881,530.06584 L 2280.5787,534.12891 L 2279.9561,536.20692 C 2279.6136,537.34983 2279.3335,538.81448 2279.3335,539.46171 L 2279.3335,540.63848 L 2280.4518,541.32967 L 2286.5981,538.13055 L 2293.2298,538.73952 L 2294.5442,540.70542 L 2296.3754,540.70542 L 2297.4886,537.77758 L 2298.822,538.22208 L 2299.0049,542.59026 C 2294.5478,544.85602 2292.4174,547.48373 2292.0451,551.45584 L 2271.5302,556.65397 z "},"oh17":{"name":"OH-17","path":"M 2043.532,500.63286 L 2030.6653,503.0786 L 2032.4907,512.68434 L 2015.2465,515.94533 L 2016.3807,523.69019 L 2013.8818,526.36632 L 2010.8158,525.78147 L 2009.2207,524.1687 L 2008.2991,525.65741 L 2010.0537,527.5892 L 2011.5069,527.02207 L 2014.4667,532.1085 L 2013.7755,535.58217 L 2015.7774,538.71746 L 2017.4441,538.43553 L 2016.6997,533.41999 L 2035.4681,529.69821 L 2033.7667,520.51781 L 2043.8687,518.49741 L 2044.3118,519.82662 C 2044.557,520.551 2044.6969,521.4892 2044.6131,521.91791 L 2044.4536,522.69771 L 2052.4465,521.31533 L 2054.396,525.39157 L 2057.2787,524.86279 C 2055.6159,517.92057 2054.4694,510.32794 2052.7655,503.39761 L 2044.5954,504.97494 L 2043.532,500.63286 z "},"pa17":{"name":"PA-17","path":"M 2243.2001,538.69552 L 2241.3556,535.12859 L 2239.5409,534.73002 C 2238.5428,534.51081 2236.8157,533.82893 2235.7029,533.21474 C 2234.5901,532.60055 2233.3555,531.78741 2232.9594,531.40775 C 2232.5632,531.02809 2232.1217,530.10789 2231.9782,529.36285 C 2231.8347,528.6178 2231.3627,527.65358 2230.9293,527.22012 L 2230.1411,526.43202 L 2221.701,528.83869 L 2219.6597,526.5831 L 2216.9493,528.35904 L 2216.9493,534.467 L 2215.8342,534.467 L 2212.9872,528.84891 L 2214.1925,525.67891 L 2210.0477,522.78583 L 2216.475,516.98668 L 2218.8151,519.31452 L 2218.0071,521.99017 L 2220.7071,521.91985 L 2220.9203,520.9624 L 2223.1877,521.55533 L 2223.1877,520.88478 C 2223.1877,520.51597 2222.9424,519.7558 2222.6425,519.1955 L 2222.0973,518.17679 L 2223.4932,516.86542 C 2224.261,516.14416 2224.8891,515.2666 2224.8891,514.91527 C 2224.8891,514.56395 2225.1378,513.94119 2225.5277,513.10164 L 2226.3069,511.22357 L 2228.2108,511.21473 L 2229.0615,510.36403 C 2229.5294,509.89615 2230.1937,509.51334 2230.5377,509.51334 L 2231.7767,507.91432 L 2236.9327,505.26902 L 2252.0658,492.78304 L 2252.1113,486.86667 L 2254.0923,482.71245 L 2263.386,483.42683 L 2264.0829,482.29925 C 2268.2387,485.15584 2273.0273,487.66084 2277.3237,490.16584 L 2268.2064,499.33661 L 2268.558,499.84303 L 2271.9046,501.57361 L 2280.4376,499.3717 L 2278.5415,504.54356 L 2280.7292,506.14326 L 2283.5869,505.54545 L 2284.2302,505.96979 C 2284.5841,506.20318 2284.9695,506.90455 2285.0867,507.52839 L 2285.2999,508.66265 L 2287.7337,509.01112 L 2288.435,511.80513 L 2287.7692,513.06953 C 2287.403,513.76495 2286.8227,514.52143 2286.4795,514.7506 C 2286.1362,514.97976 2285.3104,515.17117 2284.6442,515.17595 C 2283.9781,515.18072 2282.702,514.80339 2281.8086,514.33743 L 2280.1842,513.49023 L 2276.9904,513.48324 L 2274.5129,514.84983 L 2269.4341,514.90106 L 2268.9991,517.10841 L 2260.9018,524.98118 L 2257.7826,526.41239 C 2256.067,527.19956 2253.4282,528.75966 2251.9184,529.87927 C 2250.4087,530.99888 2248.0173,532.93278 2246.6042,534.17682 L 2244.0349,536.43872 L 2243.2001,538.69552 z "},"nj12":{"name":"NJ-12","path":"M 2328.1124,508.04012 L 2324.4202,504.55311 L 2321.301,503.82045 L 2321.301,502.22299 L 2318.3721,499.91915 L 2315.1672,500.56015 L 2314.6136,499.50724 C 2314.3091,498.92814 2313.8861,497.40342 2313.6734,496.11898 L 2313.3381,494.60354 L 2314.924,493.15539 L 2318.6803,487.35829 L 2320.9124,489.59037 L 2318.9725,492.55119 L 2319.6666,494.73841 L 2321.1274,495.88746 C 2321.9308,496.51944 2322.9421,497.03651 2323.3746,497.03651 L 2324.161,497.03651 L 2325.4529,494.20087 L 2326.7277,494.20087 L 2327.658,495.77574 C 2328.1697,496.64192 2329.0682,497.78493 2329.6548,498.31576 L 2330.7213,499.28091 L 2334.6285,497.18563 L 2334.7057,495.83503 C 2334.7482,495.0922 2335.1251,493.64958 2335.5435,492.6292 L 2336.3041,490.77397 L 2334.9903,488.67026 L 2336.7282,486.1891 L 2338.925,488.17713 L 2338.2484,491.25724 L 2339.3108,491.91385 L 2344.0419,489.38027 L 2346.6802,492.39807 L 2348.2912,490.787 L 2350.2863,492.24584 L 2349.5754,494.09851 L 2346.8937,494.77156 L 2347.2151,496.89651 L 2347.5366,499.02146 L 2348.0495,499.9473 L 2348.9288,499.43487 C 2349.074,499.03841 2349.9483,498.32332 2350.8718,497.84579 L 2352.5508,496.97753 L 2351.8066,494.63284 L 2353.3037,491.83558 L 2354.8552,491.03328 C 2355.7085,490.59201 2356.7849,490.23097 2357.2473,490.23097 L 2358.0879,490.23097 L 2358.4191,491.22344 C 2358.6012,491.7693 2359.2147,492.81802 2359.7825,493.55394 L 2360.8148,494.89196 L 2363.2302,490.79809 L 2364.3969,492.78986 L 2363.0502,497.03651 L 2361.7121,497.03651 L 2360.7773,501.44507 L 2359.5822,495.61869 C 2357.7582,495.40168 2355.9286,494.97472 2354.09,495.13376 L 2353.702,495.35591 L 2354.3534,499.36966 L 2351.8795,500.01657 L 2352.3329,501.28997 L 2356.1633,500.96583 L 2355.6042,501.47786 C 2355.2967,501.75949 2353.8017,502.40179 2352.2819,502.9052 L 2349.5186,503.82049 L 2346.4041,501.6027 L 2344.3692,503.85124 L 2342.2802,501.9607 L 2339.4491,503.25061 L 2339.4491,504.89529 L 2338.2509,506.65725 L 2333.8563,506.56793 L 2332.6436,509.51334 L 2328.1124,508.04012 z "},"ny16":{"name":"NY-16","path":"M 2359.8372,464.39949 L 2359.3202,463.57592 L 2359.062,461.50925 L 2359.6857,458.87836 L 2360.9341,458.94006 L 2361,461.16852 L 2362.9525,462.80078 L 2361.0461,464.59715 L 2359.8372,464.39949 z "},"mi12":{"name":"MI-12","path":"M 1914.1449,460.46932 L 1914.0948,459.46423 C 1914.0906,459.07433 1913.9467,458.23291 1913.7752,457.5944 L 1913.4634,456.43349 L 1916.4449,454.83784 L 1917.3933,456.37256 L 1922.1396,453.9471 L 1921.3267,451.24458 L 1928.8981,449.21578 L 1927.7434,444.72448 L 1933.0636,443.20639 L 1933.4991,443.89175 C 1933.7387,444.26869 1933.9386,444.88714 1933.9434,445.26606 L 1933.9521,445.95502 L 1935.0863,446.56206 C 1935.7102,446.89592 1936.2206,447.38555 1936.2206,447.65012 L 1936.2206,448.13115 L 1933.9658,448.72081 L 1932.7315,451.94978 L 1933.1279,456.16696 C 1924.7693,458.34153 1921.9323,459.33138 1914.1449,460.46932 z "},"ny17":{"name":"NY-17","path":"M 2346.8041,442.02365 C 2346.2692,442.02365 2345.0865,442.17929 2344.1811,442.36039 L 2342.5329,442.6794 C 2341.8183,443.86596 2341.1508,445.41839 2340.6188,446.61385 L 2358.1821,451.57623 L 2358.1821,456.21959 L 2358.1644,458.47039 L 2360.6278,458.47039 L 2362.7014,456.59177 L 2362.7014,455.06761 L 2361.5317,455.06761 C 2360.8873,455.06761 2359.8666,455.32957 2359.2632,455.65246 L 2359.0859,455.74108 L 2359.2632,451.87751 L 2359.4936,448.95326 L 2357.7745,448.58108 C 2356.8774,447.3226 2355.8135,445.68449 2354.9566,444.3985 L 2351.6424,445.85177 L 2349.0726,444.89474 L 2347.7788,442.02365 L 2346.8041,442.02365 z "},"ny19":{"name":"NY-19","path":"M 2361.3368,401.72207 L 2357.1364,402.89177 C 2357.69,405.01277 2358.3229,407.11714 2358.7315,409.27197 L 2358.7315,409.69732 L 2355.5002,409.69732 L 2350.7208,412.60385 L 2346.8218,411.31009 L 2346.8218,407.4288 L 2342.9428,407.4288 L 2345.0849,416.2193 L 2344.4115,422.67039 L 2336.5071,424.01732 L 2335.3552,427.3492 L 2332.3246,426.67573 L 2326.1925,431.24821 L 2322.4352,431.24821 L 2322.4352,428.97969 L 2322.0099,428.97969 L 2311.0572,432.4888 L 2311.4294,433.71167 C 2311.6379,434.3839 2312.1655,435.14222 2312.5991,435.39534 L 2313.3789,435.85613 L 2312.7232,436.93722 L 2313.7511,437.29167 C 2314.3167,437.49191 2315.2894,438.10106 2315.9133,438.6386 L 2317.0475,439.61336 L 2339.8922,446.4189 L 2342.3202,442.09454 C 2344.2038,441.75386 2346.179,441.68158 2347.956,440.94256 L 2351.4651,438.53227 L 2354.1059,441.01346 L 2355.3287,440.25138 L 2355.3287,438.17781 L 2359.9012,436.35237 L 2361.5671,437.20306 C 2362.4759,437.67301 2363.5257,438.05374 2363.9065,438.05375 C 2364.2874,438.05375 2365.0331,437.65583 2365.5725,437.16761 L 2366.5649,436.28148 L 2367.6815,437.45118 L 2371.4033,433.56989 L 2366.9548,428.69613 L 2361.3368,401.72207 z "},"ny18":{"name":"NY-18","path":"M 2359.8835,436.90177 L 2355.8958,438.56771 L 2355.8958,440.18049 L 2354.159,441.61603 L 2351.4651,439.0994 L 2348.5232,441.01346 L 2348.5232,441.98821 C 2348.5232,442.51656 2348.8422,443.33974 2349.2321,443.83138 C 2349.622,444.32299 2350.3238,444.85204 2350.7917,445.00108 L 2351.6424,445.26692 L 2353.2552,444.45167 C 2354.1419,444.00359 2354.9538,443.73998 2355.0629,443.8491 L 2358.1644,448.31524 L 2359.7786,448.48865 L 2359.2632,455.08534 C 2359.8665,454.76244 2360.9113,454.50047 2361.5849,454.50048 L 2362.8077,454.50048 L 2363.0632,455.78072 L 2364.0733,456.0772 L 2364.4028,455.15623 L 2367.1675,451.87751 L 2367.9119,448.90009 L 2362.5419,443.14019 C 2364.0734,441.23459 2365.7702,439.47181 2367.4511,437.6993 L 2366.5344,436.56831 L 2365.537,437.77019 L 2364.0129,438.62088 C 2363.5677,438.62088 2362.4656,438.22624 2361.5494,437.75247 L 2359.8835,436.90177 z "},"ny22":{"name":"NY-22","path":"M 2305.8875,436.17163 L 2304.2365,434.5207 L 2300.8844,435.19112 L 2300.8844,433.59453 L 2298.6158,432.87453 L 2298.6158,431.38003 L 2295.8167,429.54594 L 2296.3304,428.13037 L 2293.7089,419.62344 L 2291.5012,418.48918 L 2291.8934,416.50423 L 2290.0733,416.50423 L 2289.4204,414.80285 L 2286.7731,414.80285 L 2286.1027,413.71813 C 2285.2213,413.98571 2284.4407,414.35106 2283.7802,414.99524 L 2283.4063,415.55393 C 2282.4119,414.59302 2281.6741,413.43598 2281.0112,412.23053 L 2280.1369,410.54938 L 2278.1018,410.54124 L 2276.6563,408.56443 L 2275.8114,408.56443 L 2222.6206,422.25196 L 2222.6203,420.9377 L 2220.3721,413.70915 L 2220.9543,412.19203 L 2217.6368,398.21386 L 2216.9991,397.81977 C 2216.6484,397.60301 2216.1385,396.6483 2215.866,395.69818 L 2215.3706,393.97067 L 2219.2475,392.1219 L 2219.7998,393.57454 C 2220.1036,394.37349 2220.3521,395.24755 2220.3521,395.51688 L 2222.337,397.97001 L 2225.8801,410.54938 L 2224.4285,412.10368 C 2224.6623,414.13573 2226.3114,415.54295 2226.824,417.4117 L 2226.9822,418.48918 L 2227.9206,418.44193 L 2231.1275,418.20562 L 2231.1275,414.80285 L 2232.5802,414.80285 L 2233.8806,411.35775 L 2236.6751,412.05911 L 2237.4329,410.83295 C 2238.5591,410.84933 2239.7065,410.89495 2240.7687,410.5863 C 2240.7687,410.45065 2240.5133,409.66775 2240.201,408.84652 L 2239.6333,407.35339 L 2241.7428,408.02292 L 2243.1761,406.29592 L 2246.3475,406.29592 L 2248.8955,410.4187 C 2249.7569,409.40011 2250.3366,408.25374 2250.7796,407.00483 L 2251.1,405.72879 L 2260.4028,405.821 L 2261.881,404.03989 L 2262.8017,404.60894 L 2265.787,403.24879 L 2265.4388,399.29134 L 2269.3762,398.25863 L 2269.5815,398.8745 C 2269.6944,399.21323 2270.0941,399.49037 2270.4698,399.49037 L 2271.1527,399.49037 C 2273.1113,397.60169 2274.8744,395.4711 2277.0436,393.8201 L 2280.4677,398.75861 L 2280.4677,401.88024 L 2282.3422,401.16093 L 2286.0527,402.3855 L 2292.5815,409.94647 C 2298.1269,403.8508 2305.2663,398.08466 2309.9795,391.26701 L 2313.2675,388.13911 L 2319.9332,389.69413 L 2330.6586,387.95775 L 2331.0753,387.34387 L 2331.5093,383.65068 L 2333.6261,382.51778 L 2337.046,383.80865 L 2338.84,397.90574 L 2340.2998,399.66394 L 2340.9792,402.55458 L 2344.5724,416.18069 L 2343.7026,422.45909 L 2336.0972,423.48217 L 2334.9594,426.74604 L 2332.353,426.09189 L 2326.2003,430.68245 L 2323.0024,430.68245 L 2323.0024,428.41394 L 2322.3226,428.41394 L 2310.5198,432.05981 L 2311.2368,435.88234 C 2310.4323,435.76665 2309.6308,435.71483 2308.8242,435.76856 L 2305.8875,436.17163 z "},"ny20":{"name":"NY-20","path":"M 2350.5708,411.93125 L 2347.3889,410.8695 L 2347.3889,406.86305 L 2342.6634,406.81738 L 2340.8881,399.57218 L 2339.3331,397.88034 L 2337.56,383.26243 L 2333.4943,381.97895 L 2331.0157,383.58875 L 2330.6586,387.29711 L 2320.1317,389.12212 L 2313.1992,387.68923 C 2309.4213,390.28205 2305.1411,397.25928 2292.5944,409.16896 L 2286.3867,401.99802 L 2282.4653,400.70384 L 2280.9435,401.32721 L 2281.0349,398.73898 L 2277.1263,393.25196 C 2274.8759,394.76368 2272.9089,396.91319 2270.8901,398.94608 L 2270.3534,398.92324 L 2268.3485,390.45771 L 2272.9594,389.27715 L 2274.3669,385.87928 L 2275.8093,385.87928 L 2276.4549,384.19702 L 2278.2002,384.86516 C 2280.0064,381.17982 2282.5419,378.83198 2285.8075,377.39647 L 2281.0349,373.30162 L 2281.0349,369.00303 L 2284.4376,367.59356 C 2284.5927,366.16062 2284.4071,364.80338 2283.4335,363.62125 L 2285.005,356.09416 L 2287.3621,354.62209 L 2288.9464,355.93689 C 2289.7974,353.83686 2290.8224,351.82377 2292.87,350.71731 L 2293.4713,354.87769 L 2297.4296,362.41042 L 2295.6858,370.25098 L 2301.735,374.94807 L 2311.126,376.97649 L 2312.6244,374.9272 L 2315.0618,375.56459 L 2317.8894,374.25315 L 2318.0395,371.22543 L 2337.8488,362.00719 L 2337.2162,360.35849 L 2337.8691,358.65711 L 2339.8773,358.65711 L 2341.4219,356.80148 L 2343.6827,357.58161 L 2344.5533,351.85156 L 2342.4668,351.85156 L 2341.1452,348.95092 L 2341.8406,346.18028 L 2340.0275,346.18028 L 2336.6469,338.72434 L 2334.1772,339.09117 C 2333.8015,340.24257 2333.5687,341.53034 2330.9671,343.46448 L 2325.9174,339.20084 L 2325.2493,336.53909 C 2324.4724,336.52113 2323.7565,336.2854 2322.5565,337.77894 L 2319.6286,335.86052 L 2315.7373,335.75021 L 2298.0487,291.5178 L 2312.5105,284.99376 L 2312.8494,282.84181 L 2308.9349,281.51428 L 2306.4868,274.15186 L 2304.1854,275.51798 L 2302.8084,274.98136 L 2305.4343,272.6408 L 2301.6232,263.92927 L 2297.0254,266.18155 C 2294.8211,262.59408 2293.1158,258.4051 2291.9257,254.56811 L 2301.165,250.89382 L 2302.7122,253.86271 L 2308.7847,250.90353 L 2314.035,262.74731 L 2316.9051,263.09592 L 2319.0857,268.66738 L 2317.8941,269.40381 L 2319.7062,274.72206 L 2329.2192,274.72206 L 2329.943,277.60611 L 2333.2958,277.5577 L 2332.5903,287.48246 L 2333.5759,290.88523 L 2335.4903,291.0144 L 2335.9676,287.78019 L 2338.0811,286.87595 L 2339.489,289.46741 L 2341.8211,289.98411 L 2354.5665,339.75093 L 2355.8107,381.97851 L 2357.4978,384.55333 L 2361.1946,401.21668 L 2356.5021,402.65233 C 2357.0717,404.82496 2357.6785,406.98845 2358.2033,409.17246 L 2355.3791,409.13156 L 2350.5708,411.93125 z "},"ny25":{"name":"NY-25","path":"M 2198.1277,337.33524 L 2196.4795,342.8293 L 2195.5048,343.20148 C 2194.9752,343.40277 2194.0712,344.1789 2193.4844,344.92059 C 2192.8975,345.66228 2191.8767,346.51489 2191.2158,346.81692 C 2190.555,347.11894 2189.4344,347.68875 2188.7347,348.09296 C 2188.035,348.49716 2186.9707,349.27693 2186.3598,349.82979 L 2185.2433,350.83999 L 2181.3974,351.10583 C 2179.2769,351.24974 2177.0234,351.56871 2176.3996,351.81474 C 2175.7758,352.06079 2174.3589,352.55843 2173.245,352.91356 C 2172.1311,353.2687 2170.7546,353.55156 2170.1966,353.55158 L 2169.1865,353.55158 L 2162.5227,357.09613 L 2158.5882,360.92425 L 2156.8514,360.46346 L 2155.5045,362.35979 C 2155.8901,363.21235 2156.6178,364.7197 2157.2236,365.44356 L 2164.6317,363.38771 L 2166.1913,362.14712 C 2167.0509,361.47091 2168.0854,360.92424 2168.4776,360.92425 L 2169.1865,360.92425 L 2171.0828,368.38554 L 2175.2299,367.69435 C 2176.9268,366.95128 2179.9646,366.16708 2181.7873,365.88663 L 2181.7873,367.30445 C 2189.3449,365.80688 2193.4621,363.99619 2199.2974,362.34207 L 2198.1277,354.84534 L 2203.7281,353.64019 L 2203.9053,356.06821 L 2209.1513,357.75187 L 2210.2501,360.92425 L 2211.5616,360.92425 L 2214.2909,370.05148 L 2218.3671,368.82861 L 2223.7549,372.23138 L 2239.156,367.35762 L 2233.8214,350.1488 L 2231.1275,350.1488 L 2231.1275,347.40177 L 2229.373,345.54088 L 2224.4461,344.88514 L 2224.4638,343.66227 L 2218.4912,342.35078 L 2218.438,343.98128 L 2219.4305,343.94583 L 2219.909,344.95603 L 2219.0938,346.28524 L 2216.9493,345.71811 L 2216.9493,346.76375 L 2212.6958,346.09029 L 2207.2018,347.9689 L 2205.8726,346.14346 L 2201.0343,347.79168 L 2198.1277,337.33524 z "},"az8":{"name":"AZ-8","path":"M 593.17132,1188.335 L 593.89322,1182.0404 L 592.55383,1180.4266 C 591.78526,1180.5157 590.88891,1180.6743 590.2311,1180.425 C 590.2311,1180.2648 591.21524,1178.916 591.59198,1178.3127 L 589.20029,1174.2992 L 584.60632,1171.1457 L 581.48399,1173.6815 L 577.87938,1169.576 L 574.01678,1170.243 L 573.41244,1168.8005 L 574.08222,1164.14 L 571.68747,1159.446 C 572.15336,1155.1569 572.36677,1150.8305 573.05107,1146.5691 L 586.5569,1148.154 L 588.15569,1146.8271 L 588.15569,1144.3062 L 590.42421,1142.2532 L 590.42421,1140.7276 L 591.42615,1140.7276 L 592.0826,1138.2174 L 590.5192,1136.4741 L 591.07839,1133.5913 L 587.58856,1130.9168 L 587.58856,1129.5344 L 582.77846,1128.8892 L 580.82527,1130.6569 L 578.97881,1129.5436 L 579.62029,1124.8973 L 578.14542,1122.5434 L 575.53504,1123.2635 L 572.99833,1120.7094 L 574.10037,1114.7342 L 591.55846,1116.3127 L 591.55846,1113.1141 L 593.63274,1111.2369 L 595.55644,1111.2369 L 596.57574,1113.9178 L 598.36401,1114.6041 L 598.36401,1116.8179 L 612.82579,1118.3361 L 612.46271,1123.5726 L 684.40106,1131.0864 L 677.96222,1197.5873 L 593.17132,1188.335 z "},"ga8":{"name":"GA-8","path":"M 2004.8255,1013.8666 L 1996.3185,1015.8516 L 1987.6521,1014.5578 L 1986.1279,1016.6136 L 1986.1279,1020.938 L 1987.2482,1021.827 L 1992.459,1021.8162 L 1995.202,1025.6404 C 1994.2634,1025.4953 1993.195,1027.9795 1991.7618,1031.2963 L 1991.5749,1041.0966 L 1993.3413,1044.0799 L 1997.636,1043.371 L 2001.9327,1051.3698 C 2001.9429,1054.3482 2003.857,1056.6002 2004.7191,1059.3964 L 2000.9442,1059.4851 L 2002.2025,1064.1461 L 2016.558,1064.1993 L 2017.6922,1067.5666 L 2021.1304,1070.5086 L 2026.1283,1072.2277 L 2021.0418,1075.2051 L 2020.1556,1094.2217 L 2029.7968,1094.2217 C 2029.5547,1096.498 2030.2072,1096.7136 2026.9612,1105.9364 L 2026.9612,1117.474 L 2016.1857,1117.474 L 2015.1401,1130.2344 L 2017.5327,1132.8041 L 2018.0289,1139.592 L 2005.0027,1139.592 C 2004.1076,1142.5729 2004.3311,1151.4179 2004.276,1158.7857 C 2007.4437,1159.5025 2014.0904,1159.5745 2025.8269,1158.6971 L 2025.8269,1156.6767 L 2027.2093,1155.8792 L 2027.2093,1151.094 L 2028.6449,1147.0001 L 2031.9413,1146.9647 L 2032.8275,1144.9797 L 2033.4832,1133.07 L 2045.322,1132.5029 C 2046.3451,1127.202 2047.4022,1128.2177 2048.0513,1123.2161 C 2051.1986,1121.7337 2049.1994,1119.9501 2053.2441,1117.0841 L 2053.1909,1112.4761 L 2048.4412,1111.0938 L 2041.742,1106.734 L 2045.7828,1099.6094 L 2059.837,1084.8995 C 2058.3404,1084.2318 2057.2816,1084.3188 2054.8214,1082.1525 L 2054.8214,1080.4334 C 2058.596,1078.9478 2060.7881,1076.403 2061.2725,1073.5215 L 2060.9003,1069.6756 L 2054.6796,1063.7385 L 2048.2994,1062.9942 C 2044.4447,1059.992 2039.0977,1058.744 2026.6422,1052.7504 C 2024.7511,1046.9308 2023.8949,1040.7983 2023.4698,1034.7086 C 2021.5091,1034.2956 2018.8801,1033.9891 2016.0794,1033.7161 L 2015.6718,1028.9487 C 2014.4075,1027.8822 2013.3231,1025.8382 2012.3399,1023.366 L 2012.269,1016.9858 L 2004.8255,1013.8666 z "},"tx30":{"name":"TX-30","path":"M 1316.4254,1142.429 L 1315.7469,1140.2911 L 1318.1196,1134.2715 L 1319.5028,1132.9896 C 1320.2635,1132.2846 1320.886,1131.4554 1320.886,1131.147 C 1320.886,1130.8386 1320.6308,1130.4285 1320.3188,1130.2357 L 1319.7517,1129.8852 L 1319.7517,1127.6836 L 1316.3489,1127.6836 L 1316.3489,1125.554 L 1318.1108,1124.0918 L 1321.4734,1124.0918 L 1322.8709,1125.9052 L 1327.0684,1126.2325 L 1329.8404,1123.6284 L 1330.21,1124.2265 C 1330.2028,1126.1216 1329.5658,1127.2874 1329.0945,1128.8179 L 1331.7156,1128.8179 L 1333.1063,1130.3185 C 1333.8712,1131.1439 1334.4971,1132.0098 1334.4971,1132.2428 C 1334.4971,1132.4758 1334.1505,1132.7994 1333.727,1132.962 L 1332.957,1133.2574 L 1332.2382,1136.851 L 1335.5812,1141.7098 C 1329.1296,1142.1484 1324.8661,1142.355 1316.4254,1142.429 z "},"ca33":{"name":"CA-33","path":"M 224.85893,966.52013 L 219.6698,965.36727 C 220.44102,962.79778 220.17017,962.04554 220.72536,961.4331 C 222.38142,961.04841 223.98666,960.7146 224.95648,959.22436 L 226.73166,965.31384 L 224.85893,966.52013 z "},"nc8":{"name":"NC-8","path":"M 2191.0997,902.4457 L 2178.7605,894.45247 L 2138.9691,902.04071 L 2135.7828,895.10728 L 2133.169,894.1135 L 2132.4966,892.36158 L 2133.6357,891.65761 L 2135.3028,892.29733 L 2139.2412,890.41922 L 2139.9139,888.29981 L 2136.8845,884.90929 L 2137.644,881.02428 L 2136.8832,879.79333 L 2135.3365,881.07691 L 2123.4813,876.90874 L 2120.6951,870.77859 L 2121.7884,867.79521 C 2120.9169,865.69945 2121.0491,864.17727 2121.3083,862.72763 L 2164.085,853.15541 C 2167.3728,859.78475 2169.927,865.31374 2170.6043,868.02745 L 2173.2804,869.04488 L 2173.2804,870.66795 L 2178.8705,874.68407 L 2179.2352,877.86345 L 2186.427,877.86345 C 2188.3366,873.65632 2191.1524,869.65057 2194.5352,865.77079 C 2196.6688,866.81697 2199.0118,867.30459 2201.6368,867.04031 L 2201.6368,868.77419 L 2204.4593,874.5361 L 2208.3498,870.1657 L 2209.1101,871.39591 L 2214.1137,870.64555 L 2213.0798,872.4806 L 2214.3969,875.97015 L 2212.1287,877.63422 L 2208.8817,876.72919 L 2201.9204,887.75786 L 2193.697,889.14364 L 2195.5741,893.52839 L 2191.0997,902.4457 z "},"in8":{"name":"IN-8","path":"M 1741.012,611.55739 L 1749.6353,681.84823 L 1747.2782,683.51417 L 1746.9237,686.72196 L 1748.0048,688.08665 C 1748.5937,688.83537 1749.0681,689.77607 1749.0681,690.17793 C 1749.0681,690.57986 1748.4015,691.69988 1747.5794,692.67682 L 1746.073,694.46684 L 1747.3136,697.1784 L 1750.1492,699.02157 L 1750.8582,703.82447 L 1754.1723,705.08276 L 1754.1723,708.76909 L 1752.4178,710.7009 L 1753.1798,711.48071 C 1753.5967,711.9077 1754.524,713.38178 1755.2357,714.75939 L 1756.5294,717.27602 L 1755.7496,722.85872 L 1751.957,725.10949 L 1751.2658,727.28942 L 1751.9747,729.55793 L 1750.7695,729.55793 L 1750.7695,735.19377 L 1747.4199,737.67496 L 1747.9871,738.61424 L 1746.7465,743.22216 L 1743.964,745.65021 L 1743.964,749.35424 L 1740.0473,751.21516 L 1738.8598,750.4708 L 1738.8598,753.30645 L 1738.2927,753.6609 C 1737.9808,753.85361 1737.7256,754.36675 1737.7256,754.79516 L 1737.7256,755.57496 L 1739.9941,756.28387 L 1741.1461,758.46375 L 1739.7637,760.67912 L 1737.7256,761.2108 L 1738.4168,764.66672 L 1736.6622,766.43899 L 1738.3459,770.49754 L 1737.0344,772.07483 L 1737.7788,775.03457 L 1736.4495,776.62961 L 1737.8496,778.31325 L 1737.1939,780.03239 L 1738.4522,780.05008 C 1739.1442,780.05485 1740.0836,780.29094 1740.5435,780.58176 L 1741.3764,781.11345 L 1743.5386,778.79179 L 1742.3335,777.17899 C 1741.6715,776.28367 1741.1283,775.1975 1741.1283,774.78645 C 1741.1283,774.37528 1741.5289,773.477 1742.0145,772.78374 L 1742.9006,771.52546 L 1745.0096,771.52546 L 1747.3845,774.53833 L 1749.2099,773.65219 C 1750.2197,773.17007 1751.7315,772.47415 1752.5595,772.09259 L 1754.066,771.40137 L 1755.3774,772.19892 L 1755.023,775.77892 L 1757.1675,775.77892 L 1758.3903,773.84711 L 1755.8028,771.08236 L 1756.5649,766.98843 L 1758.7448,766.70486 L 1760.1626,769.54051 L 1762.4665,769.87721 L 1764.5578,767.55556 L 1767.8366,767.55556 L 1769.3784,768.33536 C 1770.2207,768.76371 1771.4768,769.28859 1772.1786,769.50506 L 1773.4547,769.89496 L 1773.4547,767.73278 C 1775.6572,764.54847 1777.7631,761.41786 1778.5943,758.99543 L 1780.6856,759.6512 L 1781.4654,754.5116 L 1783.663,754.5116 C 1783.7717,752.0667 1783.4824,750.71631 1782.9718,749.97457 L 1780.4197,749.97457 L 1777.9208,731.08209 L 1779.4095,730.10731 L 1784.1947,730.35543 L 1784.9036,729.62882 L 1786.4632,730.2314 L 1789.866,727.80335 L 1796.4057,727.0413 L 1789.4202,677.77659 L 1792.0505,675.5235 L 1790.6708,668.25257 L 1787.4911,669.03464 L 1788.8277,658.49234 L 1786.9136,658.43415 L 1784.6023,644.38229 L 1765.6748,647.01025 L 1764.806,641.67068 L 1759.6536,642.16924 L 1758.9116,635.9817 L 1754.6631,635.86538 L 1753.7847,629.05983 L 1750.3041,629.05983 L 1753.7469,623.50487 L 1758.6739,623.50487 L 1758.0359,626.76586 C 1759.6655,626.98006 1761.2612,627.53086 1762.8915,627.64655 L 1760.198,609.19524 L 1741.012,611.55739 z "},"ca8":{"name":"CA-8","path":"M 75.967584,688.72467 L 74.726994,688.74236 C 74.046214,688.74661 72.931894,688.88204 72.263534,689.06137 L 71.058384,689.39813 L 70.827984,690.99318 L 73.415514,691.36533 L 73.238284,693.17305 L 72.423034,693.03127 L 72.352144,693.81107 L 75.914424,693.82882 L 76.658774,690.90454 L 75.967584,688.72467 z "},"ca12":{"name":"CA-12","path":"M 70.898874,691.578 L 70.562144,693.79338 L 69.179764,700.7584 L 67.496104,701.27239 L 67.531554,704.03714 L 70.615314,702.26486 L 71.820464,701.80407 L 72.529374,701.80407 C 73.980934,703.32693 74.886504,703.96625 74.886504,703.96625 L 75.967584,704.07259 L 79.051354,708.13107 L 81.248974,707.70573 C 81.248974,707.70573 82.132084,707.22639 78.324714,704.79919 C 74.517354,702.37199 74.324444,702.0658 74.443434,698.4013 L 75.435904,698.3481 L 74.780164,696.11503 L 76.180264,694.39595 C 76.180264,694.3959 74.113164,694.38427 73.185114,694.36051 C 72.788544,694.3503 72.250714,694.23018 71.767294,694.11239 L 71.891354,692.37556 L 72.742044,692.51734 L 72.812934,691.84387 L 70.898874,691.578 z "},"oh8":{"name":"OH-8","path":"M 1887.507,663.27811 L 1888.1631,659.23533 L 1886.3133,659.23533 C 1886.3238,658.19142 1886.7042,657.05507 1887.4964,655.81572 L 1885.8178,655.17157 L 1886.5079,653.4175 L 1876.868,655.08327 L 1867.6905,593.49979 L 1871.5679,592.75503 L 1871.5679,590.05902 L 1876.1882,589.32022 L 1875.5356,586.59046 L 1881.8567,585.24296 L 1883.7897,597.23115 L 1885.1966,598.86346 L 1886.6123,607.75479 C 1901.8901,604.96463 1899.2383,606.63097 1905.5512,605.39537 C 1906.7933,612.30254 1906.9988,619.62434 1907.297,626.909 L 1906.1506,627.56857 L 1906.648,633.14741 C 1904.6006,633.1481 1902.9927,632.56288 1901.5281,631.78659 L 1902.7225,623.3501 L 1900.9865,622.46611 L 1886.7787,624.84096 L 1890.5443,645.69474 L 1895.9545,644.95067 C 1895.9045,646.02589 1896.7446,647.10111 1898.0596,648.17633 L 1899.2794,662.61361 L 1887.507,663.27811 z "},"va8":{"name":"VA-8","path":"M 2243.0372,628.61039 C 2242.8403,626.53277 2242.7809,624.82066 2241.8126,622.84473 L 2243.7066,620.75185 L 2242.663,618.20006 L 2239.9558,620.18427 L 2239.3509,617.55138 L 2234.5736,617.20469 L 2232.1176,618.51918 L 2231.6312,617.75169 C 2231.3637,617.32963 2231.1449,616.72904 2231.1449,616.41712 C 2231.1449,616.1052 2231.3566,615.51623 2231.6153,615.10824 L 2232.0857,614.36655 L 2236.2181,616.80469 L 2243.3208,616.47247 L 2247.2974,618.39997 L 2248.003,620.6606 C 2248.391,621.90392 2248.7085,623.44753 2248.7085,624.09082 L 2248.7085,625.26036 L 2244.8209,628.6912 L 2243.0372,628.61039 z "},"md8":{"name":"MD-8","path":"M 2243.1644,614.8494 L 2241.6682,613.29791 L 2236.7707,613.29791 L 2235.7143,610.51938 L 2231.1391,609.2874 L 2225.5853,610.02416 L 2223.1877,607.62662 L 2221.4863,607.62662 L 2221.4863,604.91235 L 2223.3214,603.43532 L 2223.1877,601.92999 L 2225.5285,599.39061 C 2226.8159,597.99389 2228.0616,596.85118 2228.2968,596.85118 L 2228.7244,596.85118 L 2230.0005,601.91932 L 2232.4556,603.23319 L 2233.8543,601.32032 L 2234.6313,602.57753 L 2236.1159,601.34539 L 2238.7838,604.66037 L 2242.4843,606.52883 L 2243.0093,605.14787 C 2243.2981,604.38832 2243.7936,603.6067 2244.1104,603.41087 L 2244.6864,603.05489 L 2247.6013,603.78648 L 2247.2303,605.84833 C 2247.0262,606.98236 2246.6249,608.20646 2246.3385,608.56862 L 2245.8178,609.227 L 2246.955,609.92985 L 2248.3082,609.59019 L 2250.4379,610.98703 C 2250.9753,611.80716 2251.5349,612.47501 2251.4362,612.77099 L 2251.2569,613.30914 L 2247.1119,610.81865 L 2246.1199,610.59594 L 2243.1644,614.8494 z "},"il8":{"name":"IL-8","path":"M 1693.4895,518.15916 L 1695.3829,517.23402 L 1694.5144,512.3437 L 1696.0182,512.07232 L 1695.6292,506.11057 L 1690.9374,506.0932 L 1688.2772,504.87208 L 1687.8182,507.68572 C 1686.3585,507.93934 1684.8807,508.3828 1683.4026,508.12241 L 1681.6474,492.64314 L 1711.2621,489.09671 C 1711.6794,490.70417 1711.5959,491.81099 1711.6376,493.54362 C 1710.4775,493.78254 1709.3034,494.00909 1708.2349,494.49257 L 1709.436,497.85349 L 1707.5232,499.25219 L 1705.5074,496.7628 L 1703.1307,498.91369 C 1703.0661,500.90133 1703.7941,502.80552 1704.5638,504.12562 L 1704.5068,515.15177 L 1702.908,514.22997 L 1701.7478,511.21473 L 1699.1608,511.21473 C 1699.1286,512.96554 1699.3468,514.59118 1700.3159,515.71617 L 1705.4902,518.74849 L 1703.9567,520.79799 L 1699.6298,521.13061 L 1699.5695,517.5281 C 1697.0652,517.84475 1695.8542,518.32828 1694.6849,519.85485 L 1696.8759,523.06034 C 1693.9948,522.26104 1693.909,521.04453 1693.4895,518.15916 z "},"mi8":{"name":"MI-8","path":"M 1859.6582,427.5087 L 1839.5075,430.80514 L 1842.8039,451.41672 L 1853.2071,449.96346 L 1856.9112,471.35484 C 1871.3946,469.01698 1883.9127,466.95295 1897.904,463.52138 L 1894.8202,447.28732 L 1903.5576,446.48979 C 1905.2299,445.46556 1906.7306,444.77106 1910.6998,444.239 L 1910.9657,439.06395 L 1914.1026,439.2589 L 1914.1026,437.59296 L 1919.6321,436.28148 L 1918.4978,431.83306 L 1893.4024,437.25623 L 1893.7746,442.99841 L 1883.2118,444.57573 L 1881.4927,437.04355 L 1877.257,437.43346 L 1876.3176,435.73207 L 1861.6077,438.23098 L 1859.6582,427.5087 z "},"nj8":{"name":"NJ-8","path":"M 2344.9507,471.51732 L 2342.9631,470.53541 L 2342.5978,471.2043 L 2342.0855,469.22085 L 2344.4201,467.25189 L 2344.7707,465.76677 L 2343.4832,463.36737 C 2342.7281,462.24124 2342.2615,461.62275 2341.4454,460.00026 C 2340.7338,458.34947 2339.3616,456.48997 2339.3616,456.48997 L 2340.4959,455.18072 L 2342.2036,456.6048 C 2345.2174,456.08909 2346.0925,456.13712 2347.0313,456.42704 L 2347.0726,458.23903 L 2348.1505,458.39134 C 2348.122,459.27366 2348.2576,460.55508 2349.0545,461.35202 L 2350.1128,462.42532 L 2349.6574,468.98776 L 2348.6515,468.05362 L 2347.6739,469.08335 L 2347.0578,468.03102 C 2346.7317,467.7454 2346.4238,467.34869 2346.0257,467.121 L 2345.3252,467.03561 L 2346.0171,470.39177 L 2344.9507,471.51732 z "},"ma8":{"name":"MA-8","path":"M 2458.9715,338.78873 C 2458.7375,338.79911 2458.5461,338.45209 2458.5461,338.01759 L 2458.5461,337.22757 L 2456.6397,336.13897 C 2456.9644,335.61149 2456.9302,335.05838 2456.8447,334.24897 L 2453.9066,334.98638 C 2454.77,333.51616 2455.3515,332.37914 2455.728,330.72951 L 2459.0909,331.4021 L 2460.3378,329.07231 L 2462.5589,331.08233 L 2460.8146,332.05842 L 2460.8146,334.8377 L 2461.9489,334.8377 L 2461.9489,336.64084 L 2460.6729,337.70535 C 2459.971,338.29083 2459.2054,338.77836 2458.9715,338.78873 z "},"mn8":{"name":"MN-8","path":"M 1394.8963,132.65495 L 1388.5161,133.55881 L 1392.3087,190.64386 L 1376.4646,191.4591 L 1376.4646,202.69534 L 1370.7933,202.69534 L 1370.7933,205.28287 L 1374.0897,207.23237 L 1377.5988,207.23237 L 1377.5988,212.72643 C 1372.3467,213.12796 1367.0318,213.48762 1361.1521,213.47079 L 1361.1521,218.50405 L 1362.2864,218.57495 L 1365.76,277.2196 L 1383.5537,276.4398 L 1383.9259,277.55633 L 1387.1337,277.55633 L 1389.6858,312.71831 L 1404.2716,311.99168 L 1400.6562,309.42187 L 1427.4707,307.96861 L 1428.7999,323.9191 L 1439.6994,323.77732 L 1440.0716,332.26653 L 1462.0656,330.72465 L 1462.101,337.81375 L 1472.8056,337.33524 L 1475.145,335.22623 L 1475.1804,332.85138 L 1476.8464,330.65375 L 1476.8464,328.17257 L 1472.9119,323.88366 L 1473.4259,323.05069 L 1471.6536,321.5797 L 1469.1192,321.47336 C 1467.7268,321.41468 1466.4134,321.19549 1466.195,320.97712 L 1465.8051,320.5695 L 1465.9291,311.63722 L 1469.4737,308.64207 L 1469.4737,306.55079 L 1470.6257,305.84187 L 1469.9345,304.72534 L 1470.9093,302.61633 C 1471.4425,301.46231 1472.6611,299.69561 1473.6208,298.68187 L 1475.3754,296.83871 L 1476.9172,296.83871 L 1480.1251,293.3296 L 1482.3936,294.03851 L 1483.6342,290.45851 L 1487.0547,291.13197 L 1487.0547,288.88118 L 1489.0396,287.1798 L 1486.4875,250.7595 L 1489.6599,251.39752 L 1490.9891,249.28851 L 1489.6068,248.79227 L 1493.0095,245.26544 L 1495.5794,245.22999 L 1494.1438,242.87287 L 1497.8301,239.48782 C 1499.8576,237.62015 1502.4097,235.39944 1503.5014,234.56089 C 1504.5931,233.72235 1507.0814,231.43322 1509.0309,229.47445 C 1510.9804,227.51568 1512.5749,225.72923 1512.5755,225.50455 C 1512.576,225.27988 1513.5477,224.2037 1514.7376,223.11198 C 1515.9275,222.02025 1517.5232,220.58967 1518.2822,219.9396 C 1519.0413,219.28953 1520.4751,217.75829 1521.4723,216.53683 C 1522.4694,215.31537 1524.1283,213.18546 1525.1586,211.80485 C 1526.1889,210.42423 1527.7391,208.3121 1528.5968,207.10831 C 1529.4546,205.90453 1530.1565,204.71823 1530.1565,204.46762 C 1530.1565,204.217 1530.9752,203.01144 1531.9819,201.79148 C 1532.9887,200.57152 1536.6253,196.75403 1540.0635,193.30227 L 1546.3196,187.02841 L 1551.3352,183.48386 C 1554.0913,181.53846 1557.6641,179.34934 1559.275,178.61009 C 1560.8858,177.87085 1563.7305,176.5863 1565.602,175.75673 C 1567.4735,174.92716 1569.5152,174.03976 1570.139,173.7895 C 1570.7629,173.53923 1572.9845,172.52684 1575.0837,171.53871 L 1578.9118,169.74871 L 1579.7802,168.20683 L 1586.0186,165.38891 L 1592.0089,159.52267 L 1594.1002,160.19613 L 1594.6673,158.74287 L 1584.654,158.79604 L 1582.5273,160.72782 L 1581.198,160.72782 C 1580.4696,160.72782 1578.9153,160.3061 1577.7421,159.78851 L 1575.6154,158.8492 L 1575.1014,156.88198 L 1572.3012,155.03881 L 1567.8705,154.84386 L 1564.1842,155.57049 C 1562.1567,155.96937 1559.3494,156.36576 1557.9458,156.43891 C 1556.5421,156.51206 1554.5324,156.76375 1553.4796,157.00604 L 1551.5656,157.44911 L 1550.7681,156.17307 L 1548.8363,156.97059 C 1547.7673,157.41007 1546.1026,157.9374 1545.1499,158.14029 L 1543.4308,158.49475 L 1540.861,153.35515 L 1539.2305,153.35515 L 1539.2305,149.40297 L 1536.8202,150.32455 C 1535.4946,150.8346 1534.1547,151.56207 1533.8428,151.93732 C 1533.5309,152.31258 1532.51,153.02473 1531.5743,153.51465 L 1529.8729,154.40079 L 1526.4347,157.80356 L 1522.9965,161.22406 L 1521.3305,161.57851 C 1520.413,161.77593 1518.9861,162.30085 1518.1582,162.74821 C 1517.3302,163.19558 1516.2727,163.56347 1515.801,163.56346 L 1514.9326,163.56346 L 1514.5073,162.28742 L 1509.7221,164.73316 L 1509.0487,161.38356 L 1503.4483,160.62148 L 1503.785,158.63653 L 1502.1722,155.62366 L 1500.4354,155.53505 C 1499.4743,155.48886 1498.2723,155.42506 1497.777,155.39326 C 1497.2815,155.36146 1496.4724,154.99369 1495.9693,154.57802 L 1495.0477,153.83366 L 1492.726,154.56029 L 1492.726,154.0995 C 1492.726,153.84052 1492.1517,153.37948 1491.4499,153.07158 L 1490.1739,152.50445 L 1489.8017,149.29663 L 1487.5155,147.01039 L 1485.1584,147.36485 C 1483.8625,147.56037 1482.0356,147.80006 1481.0998,147.89653 L 1479.3984,148.07376 L 1479.044,151.72465 L 1480.3732,153.33742 L 1479.7174,155.05653 L 1478.8491,155.05653 C 1478.3671,155.05653 1477.428,155.37555 1476.7755,155.76544 L 1475.5881,156.47435 L 1474.95,155.41099 C 1474.593,154.82566 1473.3325,152.91159 1472.1498,151.15752 L 1469.9877,147.96742 L 1470.5548,144.97227 L 1468.499,143.12911 L 1462.6327,144.38742 L 1459.8325,142.56198 L 1459.8325,141.85307 C 1459.8373,141.47036 1460.0286,140.87171 1460.2578,140.52386 C 1460.487,140.176 1461.2758,139.72041 1461.9947,139.49594 L 1463.3062,139.08831 L 1462.8277,137.75911 L 1459.1059,138.07812 C 1455.8159,136.73684 1452.3599,135.73835 1449.1988,134.10821 L 1449.057,133.7892 L 1435.0029,133.7892 L 1433.9041,134.78168 C 1433.3052,135.32364 1431.9817,136.05677 1430.9621,136.41218 L 1429.119,137.05019 L 1429.6506,139.14148 L 1428.9949,139.69089 C 1428.6262,139.99684 1426.3445,140.78684 1423.9439,141.44544 L 1419.5841,142.65059 L 1414.1786,142.29614 L 1414.0192,140.59475 C 1413.9285,139.65899 1413.5765,138.19154 1413.2394,137.33376 L 1412.619,135.77416 L 1396.5976,135.75643 L 1394.914,134.69307 L 1394.8963,132.65495 z "},"wa8":{"name":"WA-8","path":"M 246.09695,153.1863 L 245.89352,153.66945 L 233.13488,150.88861 L 230.50794,153.35652 L 229.69383,153.3544 C 229.24603,153.35323 228.09277,152.87244 227.13103,152.28597 C 226.1693,151.69949 224.51044,151.03718 223.4447,150.81417 C 222.37895,150.59116 220.23095,150.01376 218.67134,149.53106 L 215.8357,148.65344 L 214.70144,147.67308 C 214.0776,147.13387 212.98974,146.3949 212.28394,146.0309 L 211.0007,145.36909 L 212.15333,143.21531 L 209.79754,141.56524 L 211.00944,140.81625 L 210.96344,139.0048 C 210.93815,138.0085 211.15161,136.15656 211.43779,134.88939 L 211.95818,132.58543 L 214.57134,129.05093 L 213.90899,126.51809 L 215.02493,124.43295 L 217.43001,124.43295 L 221.10671,121.6286 L 221.63453,116.77672 L 225.25707,108.27921 L 226.89471,107.36273 L 226.89471,105.89351 L 224.6262,103.84052 L 224.6262,95.576328 C 226.04402,94.686475 227.46184,94.514187 228.87966,94.581091 L 230.92552,95.792954 L 233.98382,92.096393 L 234.60482,92.101508 L 237.3803,89.725948 C 242.93074,90.654139 248.50255,91.759546 253.89151,93.393569 C 254.00562,93.507704 253.70992,95.4979 253.23438,97.816226 C 252.75884,100.13456 251.97002,103.09639 251.4815,104.39808 L 250.32067,108.21018 L 253.304,107.2637 L 256.13978,110.029 L 256.28816,112.52325 L 259.26625,112.52325 L 263.8436,110.18804 L 265.98222,109.92577 L 264.3019,111.24065 C 263.50928,111.56917 262.521,112.24736 262.10575,112.74773 L 261.35067,113.65751 L 259.4572,113.65751 L 254.54569,118.66196 L 254.18942,123.99172 L 257.51966,125.24876 L 257.51966,126.14525 C 257.51966,126.63832 257.20065,127.36517 256.81075,127.76048 L 256.10184,128.47921 L 258.04601,129.91592 L 257.39801,133.90916 L 253.26619,133.79058 L 253.55923,138.51218 L 248.4456,143.62579 L 248.4456,145.34028 L 247.36255,145.68403 C 246.7669,145.87308 245.96855,146.40243 245.58852,146.86034 L 244.89759,147.69291 L 245.59895,150.19804 C 245.98472,151.57585 246.20885,152.92057 246.09695,153.1863 z "},"tx15":{"name":"TX-15","path":"M 1309.3839,1343.7583 L 1292.8485,1357.9365 L 1287.0887,1352.2475 L 1261.4261,1379.1684 L 1265.8745,1384.4675 L 1251.6963,1397.7773 L 1251.6963,1429.3947 L 1230.7125,1429.3947 L 1230.7125,1468.5266 L 1237.8371,1468.5266 C 1238.0103,1473.6785 1239.9546,1474.6358 1240.0347,1497.9641 L 1244.4719,1498.0212 L 1244.3269,1500.1848 L 1243.3843,1501.3315 C 1242.501,1502.2243 1240.9421,1504.0098 1239.9283,1505.2837 C 1238.9146,1506.5573 1238.0852,1507.8471 1238.0852,1508.1547 C 1238.0852,1508.4623 1237.3943,1509.2576 1236.5433,1509.927 C 1235.6924,1510.5964 1234.5495,1511.8147 1234.0089,1512.6386 L 1233.0165,1514.145 L 1234.3988,1515.0134 L 1241.4171,1515.0312 L 1242.1969,1517.4946 L 1242.1083,1525.3281 L 1242.6931,1526.8345 C 1243.0085,1527.664 1243.7593,1528.8101 1244.359,1529.3689 L 1245.4402,1530.3791 L 1245.7769,1531.921 C 1245.9626,1532.7701 1246.2284,1533.718 1246.3617,1534.03 C 1246.4951,1534.3419 1247.0588,1535.3627 1247.62,1536.2985 L 1248.6479,1537.9999 L 1251.076,1539.0987 L 1251.4127,1541.4027 L 1255.1345,1541.7571 L 1254.8155,1543.5648 L 1258.2182,1544.575 L 1265.8745,1544.5928 L 1265.8745,1545.1244 C 1265.8745,1545.4192 1266.1297,1545.6561 1266.4416,1545.6561 L 1267.0087,1545.6561 L 1267.0087,1544.4155 L 1270.5178,1544.6814 C 1272.4499,1544.8358 1274.3639,1544.8377 1274.7713,1544.6814 L 1275.5157,1544.3978 L 1275.5157,1540.7292 L 1277.7665,1538.6911 L 1284.3948,1539.3823 L 1288.5596,1538.2303 L 1291.5725,1535.6427 L 1290.7573,1534.3136 L 1288.0634,1534.3136 L 1287.447,1533.5777 C 1285.7424,1532.6336 1284.1775,1532.2021 1281.9136,1531.5843 L 1276.7208,1527.7916 L 1276.6499,1522.4039 C 1273.7755,1522.3947 1272.113,1522.4787 1268.5861,1521.6772 L 1269.3481,1515.8996 L 1269.7912,1515.616 C 1270.0337,1515.4541 1270.3914,1514.4853 1270.5887,1513.4716 L 1270.9432,1511.6284 L 1269.4545,1511.6284 C 1269.0948,1496.9449 1268.9582,1486.1666 1268.7101,1471.9294 L 1264.1731,1471.9294 L 1264.1731,1448.11 L 1270.4115,1448.11 L 1270.4115,1433.1165 L 1275.7638,1427.6934 L 1277.7842,1427.6934 L 1277.7842,1429.5897 L 1278.4931,1428.8808 C 1280.6114,1430.2108 1281.8238,1430.0078 1283.3846,1429.9441 L 1284.9087,1431.0429 C 1285.5511,1431.7325 1285.724,1432.6506 1285.724,1432.9039 L 1285.724,1433.3646 L 1287.2659,1433.3646 L 1286.8937,1431.6633 L 1288.5242,1431.6633 L 1289.6584,1433.8077 L 1293.3802,1434.3394 L 1294.9044,1432.1772 L 1296.2691,1433.3115 L 1298.8388,1432.6557 L 1298.2008,1431.0252 L 1299.9731,1427.6047 L 1298.6262,1425.992 L 1294.7803,1425.992 L 1297.3501,1422.0752 L 1299.8491,1420.941 C 1300.559,1419.647 1301.1954,1418.0909 1302.153,1417.0774 L 1304.3861,1416.3508 L 1304.9532,1417.3433 C 1305.5471,1418.2 1306.4834,1418.0257 1307.1685,1419.1687 L 1308.7813,1420.9233 C 1313.1795,1418.4145 1316.3871,1416.4678 1320.0885,1412.9835 L 1315.2856,1410.6618 L 1314.6121,1407.9856 L 1332.583,1404.3524 L 1332.1045,1401.0383 L 1333.8945,1398.309 L 1332.3349,1397.0152 L 1331.7855,1398.4862 L 1326.5572,1393.6656 L 1325.9901,1393.6656 L 1325.9901,1394.9239 L 1324.9976,1394.5163 C 1324.4518,1394.2883 1323.3013,1394.034 1322.4456,1393.9669 L 1320.886,1393.8429 L 1318.8301,1391.9819 L 1311.936,1390.7946 L 1310.6245,1387.6221 L 1311.2271,1377.0948 L 1310.3764,1375.8897 C 1309.9156,1375.2318 1309.5434,1374.2662 1309.5434,1373.7452 L 1309.5434,1372.8059 L 1308.0192,1372.2211 L 1307.2217,1372.735 C 1306.7822,1373.0133 1305.85,1373.2442 1305.1481,1373.249 L 1303.8721,1373.249 L 1303.8899,1371.2641 L 1321.0277,1356.2706 L 1309.3839,1343.7583 z "},"fl14":{"name":"FL-14","path":"M 2140.2983,1394.9239 L 2141.0604,1400.4712 L 2139.8198,1400.4712 L 2139.8198,1402.1726 L 2143.0453,1402.1726 L 2144.41,1405.1854 L 2141.3972,1408.3223 L 2142.939,1411.8315 L 2143.8252,1409.173 L 2146.9798,1409.6516 L 2148.4331,1407.897 C 2147.373,1405.524 2146.1554,1403.2032 2145.4911,1400.6839 L 2145.4911,1399.9041 L 2147.2279,1399.9041 L 2147.8659,1398.2381 L 2146.5722,1396.3772 C 2145.8643,1395.3524 2145.1566,1394.1191 2145.0766,1394.0101 L 2140.2983,1394.9239 z M 2180.0328,1403.9625 L 2154.4411,1408.6768 L 2153.9271,1410.006 L 2153.4309,1415.7837 L 2151.9954,1415.7837 L 2150.5776,1413.5151 L 2149.78,1413.5151 C 2149.3332,1413.5151 2148.7906,1413.7795 2148.5926,1414.1 L 2148.2382,1414.6848 L 2151.5346,1417.7686 L 2154.7247,1425.9565 L 2155.2209,1425.6552 L 2155.6994,1423.7944 L 2157.8084,1423.1386 C 2158.6137,1423.3721 2159.2028,1423.6858 2159.6693,1424.3437 L 2159.6693,1424.8577 L 2162.505,1424.8577 L 2162.505,1425.9742 L 2164.3481,1426.8072 C 2165.3619,1427.2612 2166.8732,1428.2505 2167.6978,1429.0048 C 2168.5222,1429.7591 2169.8334,1431.3715 2170.622,1432.5848 L 2172.0576,1434.7825 L 2176.311,1447.2593 C 2177.3375,1448.6975 2178.1259,1450.3992 2179.5188,1451.5128 L 2179.9442,1451.5128 L 2180.5822,1454.632 L 2184.9065,1459.5766 L 2185.2787,1457.0954 L 2188.717,1455.6421 L 2182.8507,1450.7152 L 2183.5596,1447.9328 L 2180.4581,1445.4516 C 2181.2086,1444.4806 2181.867,1443.467 2182.3545,1442.3501 L 2180.4581,1440.0639 L 2180.724,1433.471 L 2179.5188,1432.7266 L 2180.724,1430.4936 L 2179.9974,1425.6907 L 2185.2079,1423.1563 C 2183.223,1416.8527 2181.8237,1410.4013 2180.3341,1403.9625 C 2180.3211,1403.9485 2180.217,1403.9429 2180.0328,1403.9625 z M 2144.2328,1414.6671 L 2143.2226,1415.2874 C 2143.5628,1416.1011 2144.0772,1416.8182 2144.6582,1417.361 L 2144.2328,1414.6671 z M 2145.4911,1417.8218 C 2145.4162,1418.42 2145.5859,1418.8725 2145.8633,1419.3814 L 2146.2532,1419.7536 L 2146.838,1419.1687 L 2145.4911,1417.8218 z M 2150.1699,1426.7718 C 2150.0763,1426.7846 2150.0281,1426.8075 2150.0281,1426.8427 C 2150.0281,1426.9834 2150.9852,1427.6076 2152.1549,1428.225 L 2154.2816,1429.3416 L 2157.259,1429.3947 L 2158.6591,1427.7111 L 2156.7628,1426.9845 L 2155.5222,1428.2073 L 2154.6183,1427.7465 C 2154.1203,1427.4932 2152.885,1427.1233 2151.8713,1426.9313 C 2151.111,1426.7871 2150.4507,1426.7332 2150.1699,1426.7718 z "},"fl21":{"name":"FL-21","path":"M 2263.283,1458.3197 C 2262.79,1458.3197 2262.2321,1458.0697 2262.0433,1457.7643 L 2261.7,1457.2088 L 2262.2934,1456.1002 C 2262.6197,1455.4904 2262.8867,1454.8471 2262.8867,1454.6706 C 2262.8867,1454.4942 2262.5129,1454.3498 2262.056,1454.3498 L 2261.2253,1454.3498 L 2260.718,1453.3573 C 2260.4391,1452.8114 2260.0534,1451.534 2259.861,1450.5186 L 2259.5111,1448.6723 L 2260.1557,1447.2576 C 2260.5102,1446.4795 2261.0056,1445.8428 2261.2564,1445.8428 C 2261.5073,1445.8428 2261.9843,1445.335 2262.3165,1444.7144 L 2262.9205,1443.5859 C 2261.7615,1441.9337 2261.2893,1441.1242 2260.5673,1437.7864 L 2253.8127,1439.1603 L 2253.8127,1434.544 L 2258.4871,1433.2853 L 2262.1205,1434.5863 L 2266.7614,1443.3103 L 2266.6294,1446.619 L 2262.6239,1449.3876 L 2265.9211,1453.9813 L 2265.6863,1456.3347 L 2264.1795,1458.3197 L 2263.283,1458.3197 z "},"tx14":{"name":"TX-14","path":"M 1460.2224,1301.7376 C 1438.3038,1303.3609 1437.7859,1302.8337 1427.2935,1304.396 L 1431.4229,1306.9658 L 1430.1646,1313.5233 L 1431.5647,1314.1967 L 1430.838,1317.1033 L 1433.7446,1316.412 L 1433.7446,1314.1613 L 1436.1017,1310.8471 L 1440.7982,1308.5963 C 1442.0103,1309.9614 1442.618,1311.7657 1443.5098,1313.346 L 1442.8895,1318.7338 L 1440.5501,1323.2885 L 1438.5652,1324.405 L 1440.4083,1325.114 L 1444.8745,1323.6429 C 1447.3325,1322.8414 1449.7112,1321.9578 1450.1559,1321.6757 L 1450.9534,1321.1618 L 1454.7106,1324.0328 L 1454.0549,1325.114 L 1449.9077,1324.7595 L 1449.571,1327.152 L 1446.8063,1328.4104 L 1445.158,1327.7901 L 1443.4567,1330.9979 L 1439.983,1333.674 L 1439.983,1335.145 L 1442.2161,1334.5602 L 1442.8718,1332.4689 L 1444.9986,1330.7852 C 1450.4149,1327.2977 1456.3039,1324.5746 1461.7111,1321.1263 L 1460.2224,1301.7376 z M 1381.7992,1312.2118 C 1378.8297,1313.385 1375.0224,1315.5554 1372.8846,1315.7386 L 1372.2111,1318.2021 L 1370.3325,1319.1237 L 1371.9275,1321.2858 L 1371.9275,1323.7847 L 1367.5677,1324.5114 L 1367.231,1323.4835 L 1363.0307,1322.7568 L 1356.8986,1329.7928 L 1354.6301,1336.6692 L 1339.424,1347.1788 L 1337.6163,1346.6471 L 1323.438,1358.9999 L 1321.0986,1356.8023 L 1304.7228,1371.14 L 1304.3506,1372.6819 C 1305.5834,1372.5492 1306.708,1372.7135 1308.0547,1371.7071 L 1310.146,1372.6287 L 1310.3764,1374.5427 L 1311.9537,1376.3682 L 1311.1916,1387.4627 L 1312.5917,1390.3692 L 1319.1314,1391.4326 L 1320.7442,1392.8504 C 1321.29,1393.0889 1322.0591,1393.2314 1322.4456,1393.1694 C 1322.832,1393.1074 1323.6613,1393.3298 1324.2887,1393.6656 L 1325.423,1394.2682 L 1325.423,1393.0985 L 1326.9472,1393.0985 L 1331.6614,1397.8837 L 1332.2108,1396.4304 L 1334.8161,1398.6635 L 1337.6163,1399.0534 L 1337.8112,1400.4712 C 1337.9191,1401.251 1338.2674,1402.2042 1338.591,1402.5979 L 1339.1759,1403.3245 L 1339.8139,1402.8106 C 1340.1624,1402.5308 1341.2849,1402.1227 1342.2951,1401.9067 C 1343.3052,1401.6907 1344.2776,1401.2757 1344.4572,1400.9851 C 1344.6369,1400.6944 1346.675,1399.5265 1348.9943,1398.3799 L 1353.2123,1396.2886 L 1353.2123,1395.0835 L 1351.0856,1393.6656 C 1349.9233,1392.8858 1348.2629,1391.6098 1347.3992,1390.83 C 1346.5356,1390.0502 1345.4608,1389.0932 1345.0067,1388.7033 L 1344.1914,1387.9944 L 1341.9406,1387.9944 L 1341.1963,1385.6372 L 1341.8166,1385.0169 L 1338.8923,1381.1888 L 1339.5481,1380.3913 C 1339.9104,1379.9547 1340.8416,1379.4482 1341.6039,1379.257 L 1342.9863,1378.9025 L 1345.3434,1381.2597 L 1344.0673,1382.8193 L 1345.2016,1383.4219 C 1345.825,1383.7555 1346.7998,1384.0245 1347.3815,1384.0245 L 1348.4449,1384.0245 L 1349.8627,1387.9412 L 1352.5211,1386.2575 C 1353.9888,1385.3409 1355.8464,1384.3437 1356.6328,1384.0245 L 1358.0506,1383.4396 L 1359.1671,1381.0116 L 1364.5726,1379.3102 L 1365.3524,1380.09 L 1363.4206,1383.351 L 1364.1118,1385.1764 L 1362.7117,1386.8601 L 1363.4206,1386.8601 C 1363.8063,1386.8601 1365.0512,1386.3755 1366.1854,1385.779 C 1367.3196,1385.1824 1369.425,1384.1419 1370.8819,1383.475 L 1373.5403,1382.2699 L 1376.7304,1382.0395 L 1376.376,1385.7967 L 1379.956,1383.989 C 1381.9308,1382.9966 1386.999,1379.9918 1391.2099,1377.3252 C 1395.4209,1374.6585 1399.8314,1371.736 1401.0106,1370.821 L 1403.1551,1369.155 L 1408.2415,1367.2233 L 1417.2093,1358.3973 L 1426.1592,1349.5891 L 1430.9444,1346.0445 C 1433.5759,1344.0941 1436.9418,1341.4711 1438.4234,1340.2315 C 1439.905,1338.9918 1441.1172,1337.7224 1441.1172,1337.4136 L 1441.1172,1336.8641 L 1439.6994,1337.3604 L 1437.7145,1336.3502 L 1437.7145,1339.0441 L 1434.7548,1340.391 L 1433.1066,1339.0263 L 1433.1774,1331.1751 L 1430.8558,1330.5726 L 1431.5647,1327.3116 L 1428.1265,1327.3116 L 1425.2908,1324.4759 L 1423.5186,1324.4759 L 1420.417,1327.7901 L 1418.4349,1327.7264 L 1415.9332,1324.5291 L 1415.242,1326.2305 L 1426.2479,1332.6816 L 1431.6887,1340.6037 L 1423.1641,1346.3635 L 1412.6899,1329.7219 L 1410.7759,1329.5447 L 1407.9402,1327.9142 L 1403.9172,1327.8787 L 1402.5525,1329.2433 L 1402.517,1332.1676 L 1398.8662,1332.3803 L 1397.7142,1333.5146 L 1393.7798,1341.7025 C 1391.2562,1341.9361 1389.9663,1341.9698 1388.5515,1340.9758 L 1384.3158,1342.2696 L 1381.8877,1344.8039 C 1379.7326,1343.5345 1377.8546,1342.3442 1375.8974,1340.6391 L 1375.8974,1338.3174 L 1377.5988,1337.3781 L 1377.5988,1333.7449 L 1375.738,1328.2686 L 1377.6166,1326.9039 L 1376.4646,1326.3014 C 1375.9932,1325.9103 1375.8974,1325.1509 1375.8974,1324.7595 C 1375.8974,1324.368 1376.261,1323.7551 1376.695,1323.3948 L 1377.4748,1322.7391 L 1378.2192,1317.7944 C 1380.1595,1317.4789 1382.4166,1317.0842 1385.8222,1317.0855 L 1387.6122,1315.8981 L 1381.7992,1312.2118 z M 1373.3099,1386.8778 C 1372.9797,1386.8679 1372.214,1387.235 1371.6085,1387.693 L 1370.5097,1388.526 L 1371.1123,1388.5437 C 1371.4425,1388.5537 1372.2082,1388.1865 1372.8137,1387.7285 L 1373.9125,1386.8955 L 1373.3099,1386.8778 z M 1369.1982,1389.0577 L 1366.8766,1390.2274 C 1365.5987,1390.8793 1364.5549,1391.5488 1364.5549,1391.6984 C 1364.5549,1391.848 1364.6878,1391.9643 1364.8562,1391.9643 C 1365.0245,1391.9643 1366.196,1391.4401 1367.4614,1390.7946 C 1368.7269,1390.1489 1369.6378,1389.497 1369.4818,1389.3413 L 1369.1982,1389.0577 z M 1360.1951,1394.7999 C 1359.8831,1394.7999 1359.1646,1395.3103 1358.6,1395.9342 L 1357.5721,1397.0684 L 1358.1392,1397.0684 C 1358.4511,1397.0684 1359.1697,1396.5579 1359.7343,1395.9342 L 1360.7622,1394.7999 L 1360.1951,1394.7999 z M 1353.7794,1401.5877 L 1352.5034,1402.4029 C 1351.8016,1402.8527 1350.1427,1403.507 1348.8171,1403.8562 L 1346.4068,1404.4942 L 1346.4068,1405.5753 L 1344.3509,1405.5753 L 1340.7355,1408.8009 L 1340.7355,1410.1478 L 1339.7784,1410.52 C 1339.2564,1410.7203 1338.3632,1411.3504 1337.7935,1411.9201 L 1336.7656,1412.948 L 1335.1174,1412.948 C 1334.2071,1412.948 1333.1013,1413.0843 1332.6716,1413.2493 L 1331.8918,1413.5506 L 1332.3526,1417.4673 L 1330.4563,1418.2117 L 1329.8005,1417.5559 C 1329.4472,1417.2026 1328.969,1416.9179 1328.7194,1416.9179 L 1328.2586,1416.9179 L 1328.2586,1419.4877 L 1325.9901,1420.9055 L 1325.9901,1422.3942 L 1323.1899,1425.0172 L 1323.7925,1426.0097 L 1322.6228,1427.6402 C 1321.9793,1428.5439 1321.4531,1429.4394 1321.4531,1429.6251 C 1321.4531,1429.8109 1321.538,1429.9619 1321.6481,1429.9619 C 1321.758,1429.9619 1323.0162,1428.4943 1324.4305,1426.7009 C 1325.845,1424.9073 1329.1646,1421.3018 1331.8209,1418.6902 L 1336.6592,1413.9405 L 1346.7435,1406.426 L 1353.7263,1403.0233 L 1353.7794,1401.5877 z M 1332.1222,1405.0082 L 1315.0906,1408.411 L 1315.6046,1410.1301 C 1317.1536,1411.2544 1319.0954,1412.0132 1321.1695,1412.6999 L 1317.5364,1415.8722 C 1315.7379,1417.3213 1313.2138,1419.0308 1311.936,1419.6827 C 1310.658,1420.3346 1309.455,1421.1391 1309.2598,1421.4549 L 1308.9054,1422.0221 L 1314.364,1429.8378 L 1314.7716,1429.5897 C 1316.6271,1427.4101 1318.0275,1424.8844 1319.734,1422.5892 C 1319.9035,1422.4332 1320.0275,1421.0815 1319.9998,1419.594 L 1319.9467,1416.9002 L 1321.3113,1415.7659 L 1324.0052,1416.7584 L 1324.8913,1416.4217 C 1325.383,1416.2296 1327.3609,1414.6855 1329.2866,1413.0012 L 1332.7957,1409.9351 L 1332.7957,1407.9147 L 1331.5551,1407.1526 L 1332.1222,1405.0082 z "},"fl13":{"name":"FL-13","path":"M 2141.0657,1407.9913 L 2137.7489,1404.6528 C 2135.9247,1402.8167 2133.3667,1399.9127 2132.0647,1398.1996 C 2130.7626,1396.4865 2128.4463,1393.1708 2126.9175,1390.8314 C 2125.3886,1388.492 2123.0593,1385.4295 2121.7413,1384.0258 C 2120.4232,1382.6222 2118.1456,1380.2427 2116.6801,1378.7382 C 2115.2145,1377.2337 2113.5715,1375.7586 2113.0289,1375.4604 L 2112.0422,1374.9181 L 2110.3,1371.549 L 2111.4634,1371.549 L 2111.4634,1369.904 L 2112.1842,1369.4504 C 2112.5807,1369.201 2113.1842,1368.3589 2113.5253,1367.5791 C 2113.8664,1366.7993 2114.2143,1365.9061 2114.2985,1365.5941 C 2114.3826,1365.2822 2114.9276,1364.6935 2115.5095,1364.2859 L 2116.5675,1363.5449 L 2116.5675,1362.4762 C 2116.5675,1361.8885 2116.7631,1361.2867 2117.0022,1361.1389 L 2170.2486,1350.7343 L 2177.1831,1387.0742 L 2139.7107,1394.5133 L 2140.426,1399.9054 L 2139.2527,1399.9054 L 2139.2527,1402.7411 L 2142.6155,1402.7411 L 2143.9056,1405.1515 L 2141.0657,1407.9913 z "},"fl9":{"name":"FL-9","path":"M 2106.9263,1313.5764 L 2104.2325,1313.9663 C 2102.7509,1314.1833 2101.3195,1314.5854 2101.0424,1314.8524 L 2100.5284,1315.331 L 2100.298,1318.0603 C 2100.17,1319.561 2099.9535,1321.6828 2099.8195,1322.7746 C 2099.6855,1323.8663 2099.4047,1325.6527 2099.1992,1326.7445 C 2098.9937,1327.8362 2098.49,1329.2307 2098.065,1329.8459 C 2097.6399,1330.4612 2097.2852,1331.2907 2097.2852,1331.6891 L 2097.2852,1332.4157 L 2098.9865,1332.4157 L 2098.9865,1333.9399 L 2103.1691,1339.3099 L 2101.1842,1343.8115 C 2102.1057,1344.7577 2102.892,1344.771 2104.0907,1344.8394 L 2103.0451,1343.8292 L 2108.3442,1341.8797 L 2109.8506,1339.753 L 2125.5176,1331.9018 L 2130.9584,1338.8136 L 2129.5406,1340.9936 C 2130.2944,1345.0802 2130.9894,1346.8715 2132.4826,1350.6348 L 2137.6045,1349.2878 L 2136.8778,1344.5027 L 2138.6501,1343.776 C 2139.6206,1343.374 2140.538,1342.8495 2140.6882,1342.6063 C 2140.8385,1342.3632 2140.7944,1341.7492 2140.5996,1341.2417 L 2140.2452,1340.3201 L 2137.0374,1338.6542 L 2135.8677,1334.4361 L 2138.7387,1331.441 L 2137.4627,1324.086 L 2106.7491,1329.5801 L 2104.8528,1325.6456 L 2103.559,1325.4684 L 2103.6477,1318.3439 L 2106.9263,1315.1892 L 2106.9263,1313.5764 z "},"fl15":{"name":"FL-15","path":"M 2214.35,1346.8696 L 2213.3503,1341.8754 L 2194.4225,1345.4641 L 2193.4788,1344.6931 C 2192.9143,1343.9959 2192.48,1342.5193 2192.48,1342.0859 L 2191.5941,1341.6567 L 2191.4285,1340.9191 C 2191.4285,1340.6045 2190.7267,1339.5384 2189.8689,1338.5501 C 2189.0111,1337.5618 2187.8627,1336.2879 2187.3168,1335.7193 L 2186.3244,1334.6856 L 2182.0709,1334.4021 L 2180.8201,1330.964 L 2179.5188,1330.7157 L 2179.4708,1329.2979 L 2175.7143,1326.9639 L 2173.8475,1327.2773 L 2173.8475,1326.2551 L 2172.7133,1325.8951 C 2172.0894,1325.6971 2171.579,1325.3193 2171.579,1325.0555 L 2171.579,1324.5758 L 2174.8145,1325.7971 L 2176.7659,1325.1904 L 2176.7384,1321.0859 L 2166.2819,1312.7242 L 2164.2372,1313.2589 L 2162.753,1318.5138 L 2160.8441,1318.8814 L 2160.1135,1315.9704 L 2158.7328,1315.9704 L 2155.6703,1318.9439 L 2153.4017,1315.4032 L 2149.0152,1315.4032 L 2148.2309,1314.4928 L 2148.1336,1309.8147 L 2149.5004,1309.4346 L 2149.7446,1310.7925 L 2175.8325,1304.062 L 2204.1861,1298.3979 C 2204.7662,1296.8512 2205.3142,1296.0157 2206.848,1294.3882 L 2210.8348,1295.1361 L 2210.1332,1292.9257 L 2212.9794,1290.2519 L 2212.9843,1285.0619 L 2216.3509,1290.1366 L 2213.3934,1293.2236 L 2213.9565,1301.5086 L 2218.0949,1311.7169 L 2220.7749,1315.6868 C 2222.2488,1317.8703 2223.796,1320.0124 2224.213,1320.4472 C 2224.63,1320.8819 2226.8175,1323.6892 2229.0742,1326.6856 L 2233.1772,1332.1335 L 2238.4082,1341.8773 L 2214.35,1346.8696 z "},"tx9":{"name":"TX-9","path":"M 1397.9687,1323.4811 L 1393.6527,1318.806 L 1390.7299,1318.806 C 1389.1224,1318.806 1387.8071,1318.6993 1387.8071,1318.5688 L 1387.1365,1316.5838 L 1391.1164,1314.0153 L 1395.4126,1313.9974 L 1398.8955,1315.7606 L 1398.7709,1317.7446 L 1400.6895,1319.6366 L 1402.1624,1320.0063 L 1403.7917,1318.377 L 1408.7909,1319.9047 L 1408.7822,1320.6314 C 1408.7775,1321.0311 1408.5861,1321.6497 1408.3569,1322.0062 L 1407.9402,1322.6542 L 1397.9687,1323.4811 z "},"fl24":{"name":"FL-24","path":"M 2174.84,1249.0833 L 2172.7133,1250.2175 L 2172.7133,1253.0177 L 2169.8776,1253.0177 L 2169.8776,1256.1724 L 2175.5489,1261.7728 L 2175.5489,1270.581 L 2178.3314,1271.2722 L 2179.2352,1279.9563 L 2173.564,1281.8349 L 2173.2509,1288.1215 L 2171.8336,1287.8502 L 2167.8927,1284.8833 L 2165.8368,1285.9998 L 2164.2063,1284.6528 L 2164.9507,1280.0804 L 2156.9752,1281.533 L 2159.3897,1286.2033 C 2161.9414,1288.1093 2163.5087,1288.3583 2165.6242,1288.4455 L 2170.781,1287.6951 L 2172.0044,1289.314 L 2177.7997,1287.7012 L 2180.1923,1296.9348 L 2176.7775,1299.5218 L 2176.9822,1303.3677 L 2203.8569,1297.8681 C 2204.5826,1296.2991 2205.5441,1295.1546 2207.0246,1293.8687 L 2210.1438,1294.5067 L 2209.5412,1292.9471 L 2212.4123,1290.2532 L 2212.4123,1283.235 L 2207.1663,1278.1663 C 2204.2811,1275.38 2199.8787,1270.8383 2197.3834,1268.0643 C 2194.888,1265.2903 2192.1575,1262.2329 2191.3222,1261.2765 C 2190.4869,1260.3201 2188.5729,1258.1723 2187.0687,1256.4914 C 2185.5646,1254.8104 2184.0034,1252.9612 2183.5951,1252.3797 L 2182.8507,1251.3163 L 2180.4404,1252.6101 L 2178.4378,1250.1112 L 2174.84,1249.0833 z "},"tx31":{"name":"TX-31","path":"M 1236.2774,1146.9469 L 1237.0396,1160.3453 L 1233.1228,1162.8797 L 1244.6958,1182.0557 L 1248.3998,1179.8581 L 1253.8939,1188.5954 L 1238.1561,1198.662 L 1248.0986,1214.3998 L 1253.0964,1211.7237 L 1268.143,1235.9861 L 1268.143,1238.5559 L 1272.6446,1246.0881 L 1265.6441,1253.7266 L 1261.0362,1264.1299 L 1261.8691,1264.2008 L 1263.2693,1264.059 C 1264.0389,1263.9745 1264.9372,1263.7409 1265.2542,1263.545 L 1265.8213,1263.1906 L 1268.143,1265.4059 L 1268.143,1266.1857 L 1270.8369,1268.2948 L 1271.4926,1271.6089 L 1274.0978,1274.5154 L 1276.467,1274.5092 C 1279.9026,1273.6505 1277.2526,1274.6025 1286.4219,1270.6255 L 1288.9673,1272.2647 L 1290.9302,1272.1698 L 1299.4769,1276.2522 L 1308.8895,1272.5429 L 1337.3504,1254.5596 L 1339.7483,1256.9234 L 1345.3429,1253.639 C 1346.5978,1251.2453 1349.462,1246.1357 1350.4653,1242.3841 L 1346.7967,1241.108 L 1343.436,1243.3765 L 1337.8998,1243.3765 L 1337.8998,1247.7718 L 1335.1423,1249.009 C 1332.7733,1248.095 1332.5713,1247.2971 1332.2285,1245.3605 C 1330.9402,1245.1517 1330.356,1245.1943 1329.2689,1243.6778 L 1328.2232,1240.9662 L 1328.879,1238.9281 L 1327.7978,1238.2724 C 1329.0133,1235.4999 1326.1636,1234.7302 1324.8559,1232.5479 C 1328.466,1229.5869 1332.6708,1227.4198 1336.4643,1224.6967 L 1325.4053,1206.8144 C 1316.1036,1212.8457 1306.7218,1218.7509 1297.4565,1224.8385 C 1289.459,1214.51 1284.6831,1206.7591 1278.2982,1196.2694 L 1274.5764,1198.5556 L 1261.3374,1177.2883 L 1268.143,1172.769 L 1257.4739,1147.2482 L 1236.2774,1146.9469 z "},"tx13":{"name":"TX-13","path":"M 1149.6131,1146.966 L 1149.629,1119.4193 L 1130.3307,1119.1767 L 1130.3307,1091.9545 L 1076.7371,1091.9554 L 1077.0606,1065.2995 L 1103.6757,1065.2995 L 1103.6757,1034.6745 L 1055.1862,1033.9342 L 1055.509,1006.8852 L 1047.2464,1006.8854 L 1047.6454,979.83926 L 1003.8371,978.34521 L 1006.6967,896.68639 C 1058.4305,898.65297 1103.5417,898.60391 1155.8515,899.13077 L 1155.8515,1020.4963 L 1158.4603,1020.4963 L 1159.8833,1019.0785 C 1163.6187,1021.9674 1165.7384,1027.1128 1169.7484,1029.5704 L 1171.7407,1031.8389 L 1178.0757,1031.8389 L 1178.669,1029.5704 L 1181.3378,1029.5704 L 1185.3767,1031.8389 L 1188.1778,1031.8389 L 1188.1778,1027.3019 L 1188.7402,1027.3019 L 1190.7192,1029.5704 L 1193.282,1029.5704 L 1193.282,1030.2951 C 1193.6703,1031.6736 1194.9326,1032.5757 1195.8341,1033.6421 C 1197.0185,1036.2067 1196.8489,1039.1881 1197.9638,1041.8139 L 1207.1313,1042.5377 L 1208.5771,1041.1965 L 1210.7241,1042.6143 L 1214.9224,1045.0356 L 1217.039,1044.6631 L 1220.2605,1047.1196 L 1224.4559,1046.4388 L 1225.7472,1044.8829 L 1228.3764,1044.8829 L 1234.2809,1051.2689 C 1235.4523,1049.9283 1237.3443,1048.6609 1238.8163,1048.6393 L 1238.9568,1045.8061 L 1240.9218,1044.6389 L 1244.04,1046.4575 L 1251.2205,1047.2734 L 1252.9758,1044.7673 L 1253.9166,1046.2897 L 1252.2068,1048.8993 L 1254.6708,1054.524 L 1261.4588,1054.524 C 1260.8149,1056.8856 1260.6749,1058.8873 1260.8228,1061.3929 C 1262.8521,1061.4862 1264.4493,1062.4434 1265.8307,1063.8324 L 1270.1797,1061.1496 C 1270.6787,1059.3697 1271.0336,1058.5256 1272.9004,1057.3935 L 1274.3677,1057.4694 C 1274.7297,1056.4107 1275.119,1055.3761 1275.8134,1054.524 L 1279.4856,1056.2546 L 1279.4856,1059.6638 L 1281.3299,1060.3715 L 1285.0106,1059.0405 L 1286.7978,1059.7264 L 1287.1418,1064.4488 L 1292.323,1064.7861 L 1293.7114,1061.6088 L 1297.5529,1061.9822 L 1298.2008,1059.128 L 1299.3848,1058.3963 L 1300.9108,1059.6628 L 1301.4405,1062.4337 L 1299.1586,1063.9489 L 1302.2387,1070.4867 L 1300.1094,1076.2656 L 1306.0729,1079.4255 L 1307.2749,1088.7056 L 1263.6592,1088.5518 L 1264.3525,1115.7739 L 1257.3675,1115.7739 L 1257.3675,1146.3989 L 1231.4976,1146.2029 L 1230.8047,1119.7438 L 1238.6523,1119.7438 L 1237.8016,1078.6947 L 1234.0045,1077.7152 L 1231.5376,1075.0534 L 1228.7275,1074.6571 L 1228.7275,1070.1681 C 1226.9045,1069.0076 1225.4173,1068.351 1222.7543,1068.7023 L 1220.8612,1064.7324 L 1210.114,1064.7324 L 1210.9014,1119.0012 L 1176.8353,1119.7438 L 1176.8353,1146.966 L 1149.6131,1146.966 z "},"tx24":{"name":"TX-24","path":"M 1309.8377,1142.8304 L 1309.5434,1128.8917 L 1308.2439,1125.6814 L 1306.699,1126.6741 L 1304.0417,1124.933 L 1302.0832,1120.8058 L 1302.8292,1116.3908 L 1310.3941,1116.0575 L 1311.0514,1114.154 C 1312.7689,1113.2469 1314.97,1111.4934 1316.4053,1110.1027 L 1318.4599,1110.1027 L 1319.4681,1120.0274 L 1313.5816,1122.7655 L 1312.8681,1126.9888 L 1314.8548,1132.3356 C 1316.1996,1131.6259 1317.5217,1130.8687 1319.0093,1130.5228 C 1319.3808,1130.5209 1319.833,1130.7591 1320.0141,1131.0521 L 1320.3433,1131.5849 L 1317.557,1134.2056 L 1315.1797,1140.2911 L 1315.8583,1142.429 L 1309.8377,1142.8304 z "},"tx26":{"name":"TX-26","path":"M 1296.5394,1138.4591 L 1295.3252,1136.1906 L 1297.0966,1130.0661 L 1298.7679,1128.679 L 1298.7888,1122.2959 L 1296.783,1115.7836 L 1291.9624,1115.7739 L 1291.9624,1089.1189 L 1307.9944,1089.1189 L 1306.9197,1079.0766 L 1301.0365,1075.8661 L 1302.767,1070.9708 L 1305.3466,1070.9708 L 1306.7077,1069.6097 L 1306.7077,1065.3523 L 1311.9404,1060.1937 L 1311.4412,1056.7926 L 1312.8186,1056.7926 L 1314.2147,1089.0622 L 1319.4681,1089.4025 L 1319.7784,1108.9401 C 1315.7265,1108.8868 1316.0533,1110.4628 1310.6776,1113.668 L 1310.0667,1115.391 L 1302.2995,1115.7739 L 1301.538,1120.852 L 1303.4489,1124.8788 L 1306.2787,1127.1048 L 1304.3187,1130.0961 L 1301.1195,1131.3037 L 1300.5108,1132.6396 C 1300.1761,1133.3743 1299.9022,1134.5805 1299.9022,1135.3202 C 1299.9022,1136.0598 1299.7473,1137.0686 1299.558,1137.562 L 1299.2137,1138.4591 L 1296.5394,1138.4591 z "},"ga13":{"name":"GA-13","path":"M 1967.8104,1029.779 L 1967.4127,1025.8617 L 1961.7414,1021.3694 L 1961.7414,1020.7507 C 1961.7414,1020.4105 1960.5973,1018.938 1959.1988,1017.4786 L 1956.4361,1014.6049 L 1949.9886,1015.4855 L 1949.5481,1016.4903 L 1945.0111,1016.521 L 1936.6082,1019.5795 L 1933.385,1015.7185 L 1933.385,1013.8666 L 1936.5499,1010.0558 L 1934.0079,1005.0602 L 1934.1535,1001.2694 L 1938.6156,1000.6132 L 1937.8404,994.4084 L 1942.7816,994.4084 L 1944.7917,991.00562 L 1946.0356,990.99695 C 1946.7198,990.99218 1947.5627,990.80078 1947.9086,990.5716 C 1948.2546,990.34242 1948.88,989.1979 1949.2986,988.0282 L 1950.0596,985.90147 L 1951.4117,985.90147 L 1952.0646,987.60285 L 1954.3687,987.60285 L 1954.3687,990.94925 L 1956.1058,991.92137 L 1951.6893,995.47057 L 1951.0198,998.81822 L 1945.9728,1001.2614 L 1945.2529,1004.1297 L 1948.4139,1007.8907 L 1953.1696,1009.1537 L 1960.3236,1009.1522 L 1969.9648,1007.428 C 1973.5948,1007.8272 1976.9921,1009.0516 1980.0445,1011.0432 L 1981.05,1011.8501 L 1980.3005,1018.2278 L 1979.3577,1018.2278 C 1978.8392,1018.2278 1978.1087,1018.5341 1977.7344,1018.9084 L 1977.0539,1019.5889 L 1977.0539,1021.6501 L 1970.5319,1024.7704 L 1969.9648,1029.8438 L 1967.8104,1029.779 z "},"ca40":{"name":"CA-40","path":"M 244.13219,983.99064 C 244.32042,981.81037 245.25013,980.17381 246.10568,978.11711 L 244.81598,976.82741 L 240.62716,976.82741 L 239.14977,981.98675 L 235.69095,982.77908 L 234.35474,979.76162 C 235.78447,977.70697 238.28934,975.86238 241.28853,973.8324 L 247.02778,974.85193 L 247.6036,978.82274 L 251.43176,981.13106 L 250.7951,983.64991 L 244.13219,983.99064 z "},"ca39":{"name":"CA-39","path":"M 228.18379,967.04784 L 227.02005,969.75355 C 228.34418,970.90976 229.98946,972.60156 231.5558,973.42327 L 231.51448,975.44129 L 231.30768,975.86902 C 231.07175,976.24009 230.86938,976.74824 230.86461,977.00327 L 230.86461,977.46407 L 232.97362,976.80829 L 233.68253,977.65899 C 234.07669,978.1339 234.61912,978.52743 234.86996,978.52743 C 236.56663,976.52053 238.6791,975.29332 241.12941,973.59829 L 241.32105,972.34216 L 240.06273,970.99523 C 239.37134,970.25926 238.80441,969.36229 238.80441,968.99258 L 238.80441,968.31912 L 236.92111,968.13718 L 236.89513,968.83186 L 238.02231,969.87413 L 237.95372,974.8411 L 231.87481,974.90966 L 232.36269,970.7707 L 228.18379,967.04784 z "},"ga9":{"name":"GA-9","path":"M 1966.4701,975.69315 L 1965.7113,974.27533 C 1965.2939,973.49553 1964.7404,972.85751 1964.4812,972.85751 L 1964.0099,972.08332 C 1964.0099,971.65746 1963.5038,970.66567 1962.8852,969.87934 L 1961.7606,968.44955 L 1960.04,961.84375 L 1960.04,956.9779 L 1957.9983,956.9779 L 1956.5841,958.39572 L 1951.6483,958.7575 C 1948.9336,958.95644 1944.288,959.52845 1941.3248,960.0286 C 1938.3615,960.5287 1933.3105,961.22269 1930.1003,961.57074 L 1924.2635,962.20348 L 1921.952,960.60163 C 1920.6807,959.72059 1918.1002,957.62528 1916.2175,955.94544 L 1912.7944,952.89112 L 1900.2079,953.49902 C 1896.0069,954.28852 1891.8954,955.6447 1887.6597,956.22714 C 1885.8151,950.46761 1883.9284,944.72083 1882.0579,938.96981 C 1911.4505,934.58885 1937.7975,930.20784 1965.6673,925.25584 L 1965.9729,925.75026 C 1966.141,926.0222 1967.7459,927.09629 1969.5394,928.13708 C 1971.333,929.17788 1973.2834,930.22831 1973.8738,930.47138 C 1974.4642,930.71446 1976.4255,931.99271 1978.2324,933.31196 L 1981.5175,935.71058 L 1984.7101,940.70636 L 1985.3694,943.31265 C 1985.7321,944.74607 1986.3859,946.86895 1986.8223,948.03009 L 1987.6157,950.14134 L 1989.9497,952.63154 C 1991.2334,954.0011 1992.9501,955.60715 1993.7646,956.20043 L 1995.2455,957.27922 L 1994.385,959.7181 C 1993.9117,961.05947 1992.9847,962.91495 1992.3251,963.84135 C 1991.6654,964.76776 1991.2438,965.93286 1991.1661,966.4675 L 1990.934,967.68178 L 1981.0514,967.79713 L 1981.745,972.85751 L 1976.9003,972.85751 L 1974.2724,975.69315 L 1966.4701,975.69315 z "},"ca34":{"name":"CA-34","path":"M 232.23231,974.63999 L 232.70948,970.61922 L 228.43394,966.73427 L 228.31233,963.80982 C 227.10377,962.74322 227.72259,962.25447 228.20578,961.69278 L 231.1506,962.69014 L 234.98735,969.9018 L 233.71387,973.5549 L 234.3343,974.55889 L 232.23231,974.63999 z "},"ca38":{"name":"CA-38","path":"M 234.68166,974.57352 L 234.15493,973.5532 L 235.41863,969.86437 L 232.74364,964.75188 C 234.20453,965.61244 235.9445,965.5796 237.45703,966.21694 L 237.81398,966.57383 C 240.53807,964.93761 241.67981,964.51742 243.15853,964.71257 L 246.3694,968.29972 L 247.69926,967.19609 C 250.25532,967.22841 252.66487,965.22424 254.31254,963.71817 L 256.69875,965.20711 L 256.09181,968.19537 L 254.13275,968.93042 L 251.13473,967.74711 C 249.3887,968.56684 247.59872,969.04952 245.67688,968.88761 C 245.33578,969.80777 244.77491,970.01007 244.03821,970.15372 L 238.8982,968.00243 L 236.60915,967.81193 C 236.41584,968.97137 237.1016,969.55937 237.74341,970.14737 L 237.67016,974.55889 L 234.68166,974.57352 z "},"tn9":{"name":"TN-9","path":"M 1645.9384,967.25688 L 1646.5189,965.03703 L 1651.089,965.57262 L 1652.186,959.12403 L 1656.4298,959.13169 L 1657.1933,956.48722 L 1656.059,956.12721 C 1655.4352,955.92922 1654.9287,955.59297 1654.9334,955.38007 C 1654.9382,955.16717 1655.1296,954.71217 1655.3588,954.36894 C 1655.588,954.02571 1656.3709,953.43119 1657.0987,953.0477 L 1658.4219,952.35047 L 1660.3847,954.12678 L 1662.0053,952.98339 L 1661.0907,951.73831 C 1660.7681,951.13551 1660.617,950.52948 1660.755,950.3915 C 1660.893,950.25351 1661.7431,950.41736 1662.6441,950.75554 L 1664.2824,951.37047 L 1665.5814,952.75637 C 1666.2958,953.51859 1667.098,954.14226 1667.3639,954.14226 C 1667.6298,954.14226 1667.9942,953.75945 1668.1738,953.29157 L 1668.5002,952.44087 L 1671.3715,952.44087 L 1671.3694,952.86622 C 1671.3682,953.10016 1670.8615,954.12099 1670.2435,955.13473 L 1669.1197,956.9779 L 1667.7898,957.76581 L 1673.0849,961.00264 L 1678.7442,961.67293 L 1678.7442,963.78345 L 1645.9384,967.25688 z "},"nc9":{"name":"NC-9","path":"M 2110.7545,864.5877 L 2109.0422,864.92991 L 2107.5289,866.05872 L 2107.4935,871.97813 L 2091.029,874.77833 L 2091.8088,876.65694 L 2093.8824,877.01139 L 2093.8824,878.67734 L 2089.3454,881.26486 L 2089.3454,882.96625 L 2090.8873,883.67516 C 2091.866,884.08786 2092.8764,884.45241 2093.9533,884.38407 L 2096.1863,882.36367 L 2097.2852,884.59674 C 2096.9015,886.1843 2095.945,887.5263 2095.4243,889.04513 L 2106.1465,887.53872 L 2108.0783,890.0908 L 2107.4758,891.20731 L 2106.8732,892.34156 L 2107.6176,893.56446 L 2112.4913,888.77932 L 2122.8059,898.72176 C 2122.699,902.77463 2123.0371,903.40942 2123.4263,905.08427 L 2138.278,902.08909 L 2135.1764,895.15951 L 2132.9966,894.69872 L 2132.0218,892.30612 L 2133.5991,891.01238 L 2135.336,891.82763 L 2138.9691,889.71859 L 2139.4299,888.37166 L 2136.3461,885.03978 L 2137.0905,880.75087 L 2135.3714,881.77879 L 2123.2667,877.29496 L 2120.5906,872.1908 C 2120.4684,874.27608 2120.3924,876.01342 2119.4564,877.84434 L 2121.1932,879.7407 L 2115.1497,881.12308 L 2114.4408,882.23958 L 2115.6459,885.44743 L 2114.3168,888.35397 L 2110.2051,888.35397 L 2110.7368,885.51833 L 2107.9011,885.51833 L 2107.1568,884.52585 C 2106.7424,883.97999 2106.3869,883.21436 2106.377,882.82446 L 2106.3061,882.47001 L 2108.8227,881.81424 L 2108.6277,878.14565 L 2112.5976,878.14565 L 2112.5976,877.48988 C 2112.5976,877.12454 2112.626,876.8412 2112.1546,876.32018 L 2110.8785,874.92011 L 2113.6787,871.90724 L 2115.4333,871.90724 L 2115.4333,873.60862 L 2116.5675,873.60862 L 2116.6384,872.04902 C 2116.6744,871.19124 2116.7479,870.1066 2116.798,869.63872 C 2116.8478,869.17084 2116.6786,868.34141 2116.4257,867.79555 L 2115.965,866.80308 L 2115.0611,866.80308 C 2114.5686,866.80308 2113.1699,866.23499 2111.9419,865.54473 L 2110.7545,864.5877 z "},"ca15":{"name":"CA-15","path":"M 103.31778,753.59693 L 102.21333,752.99804 C 102.93362,752.21002 101.66912,751.08659 100.41707,749.83454 L 98.140624,747.55809 L 97.771414,746.07317 C 97.568334,745.25645 96.905244,743.69498 96.297844,742.60325 C 95.690454,741.51153 93.785584,739.01032 92.064804,737.045 L 88.936064,733.47174 L 90.822694,729.80571 L 90.090454,725.02226 L 89.626944,725.02226 C 89.372014,725.02226 88.762414,724.62125 88.272244,724.13108 C 87.782074,723.64091 87.381054,723.04599 87.381054,722.8091 C 87.381054,722.57215 88.019074,722.03684 88.798874,721.61949 L 90.216694,720.86067 L 90.312734,714.55698 C 91.337644,715.01227 92.293284,716.0863 93.755074,715.90794 L 98.792474,715.21746 L 98.440064,720.7688 L 95.141244,720.7688 L 94.716464,722.01489 L 96.820964,724.61387 L 94.186594,727.45638 C 94.109154,730.20196 94.223784,732.1792 94.818604,734.97276 L 98.917244,737.21553 L 102.44796,743.79405 L 105.1345,745.15533 L 107.66225,749.16873 L 103.31778,753.59693 z "},"ca14":{"name":"CA-14","path":"M 71.96875,702.34375 C 70.49866,702.85286 69.238643,703.74017 67.90625,704.53125 L 66.96875,703.96875 L 66.96875,706.40625 L 69.0625,706.96875 L 69.78125,717.71875 L 67.53125,723.59375 L 67.53125,726.59375 L 69.15625,727.9375 L 69.9375,731.53125 L 71.84375,733.25 L 72.84375,735.90625 C 73.39069,737.36422 74.587206,739.58361 75.5,740.84375 C 76.4128,742.10385 77.807202,743.54712 78.59375,744.0625 L 79.6875,744.78125 C 79.677715,744.45647 79.701178,744.11597 79.8125,743.78125 L 79.84375,743.71875 L 79.875,743.6875 C 80.219332,743.39728 80.464306,742.96762 80.46875,742.53125 L 80.46875,742.5 L 80.46875,742.46875 C 80.54607,742.04493 80.497509,741.62354 80.34375,741.21875 L 80.375,741.21875 C 80.299074,741.06732 80.194979,740.89809 80.21875,740.6875 C 80.225016,740.63199 80.235925,740.56512 80.28125,740.5 C 80.326575,740.43488 80.418026,740.39101 80.5,740.375 C 80.640001,740.34766 80.736813,740.40549 80.84375,740.46875 C 80.862042,740.47957 80.887563,740.45692 80.90625,740.46875 C 81.053105,740.52528 81.153504,740.65114 81.21875,740.75 C 81.294559,740.86487 81.328623,740.95557 81.375,741.03125 C 81.421377,741.10693 81.475859,741.12723 81.46875,741.125 C 81.461641,741.12277 81.475862,741.14602 81.59375,741.0625 L 81.625,741.0625 L 81.625,741.03125 C 81.814364,740.94846 82.02147,740.96546 82.1875,741.03125 C 82.35353,741.09704 82.468157,741.21583 82.5625,741.34375 C 82.751187,741.59959 82.872273,741.87843 82.9375,742.09375 C 82.950646,742.13188 82.948756,742.14944 82.96875,742.1875 C 83.034121,742.07227 83.114306,741.94572 83.21875,741.90625 C 83.354305,741.85502 83.474157,741.87353 83.5625,741.875 C 83.650843,741.87647 83.722205,741.88392 83.75,741.875 C 83.777795,741.86608 83.782891,741.84121 83.8125,741.78125 L 83.8125,741.75 L 83.875,741.6875 C 83.971868,741.62006 84.118474,741.62361 84.21875,741.65625 C 84.319026,741.68889 84.381797,741.72685 84.4375,741.78125 C 84.537875,741.87928 84.622078,742.0074 84.6875,742.09375 C 84.725173,741.82776 84.876097,741.59731 85.0625,741.5 C 85.234468,741.41023 85.402211,741.39732 85.5625,741.375 C 85.709112,741.23243 85.801559,740.9274 85.8125,740.8125 L 85.875,740.03125 L 86.28125,740.71875 C 86.378475,740.88663 86.581979,741.11043 86.71875,741.375 C 86.787136,741.50729 86.846164,741.64149 86.84375,741.8125 C 86.841336,741.98351 86.753337,742.15772 86.625,742.3125 L 86.625,742.34375 C 86.528514,742.45436 86.478109,742.64049 86.5,742.75 C 86.510945,742.80475 86.546016,742.83193 86.5625,742.84375 C 86.578984,742.85557 86.594673,742.86005 86.6875,742.84375 C 86.934783,742.75122 87.189153,742.73131 87.34375,742.6875 C 87.514018,742.63924 87.570022,742.62599 87.625,742.40625 L 87.65625,742.3125 L 87.71875,742.28125 C 88.147417,741.94737 88.293467,741.31511 88.75,740.78125 C 88.849511,740.65739 88.885514,740.411 88.96875,740.125 C 89.044803,739.86368 89.237919,739.5698 89.5625,739.40625 L 89.53125,739.375 C 89.66139,739.2694 89.768948,739.08343 89.875,738.84375 C 89.97068,738.62751 90.110623,738.38202 90.34375,738.1875 C 90.35352,738.17483 90.36486,738.1683 90.375,738.15625 C 90.388343,738.14609 90.392168,738.13474 90.40625,738.125 C 90.531772,737.9885 90.684673,737.87524 90.84375,737.84375 C 91.029422,737.807 91.194378,737.85327 91.34375,737.9375 C 91.621583,738.09416 91.795658,738.37372 91.875,738.6875 C 91.880972,738.71112 91.901604,738.72603 91.90625,738.75 C 92.016442,738.94255 92.14188,739.13132 92.1875,739.375 C 92.232182,739.61367 92.126842,739.89238 91.9375,740.125 L 91.96875,740.125 C 91.878169,740.34591 91.914995,740.53395 92.03125,740.75 C 92.147505,740.96605 92.346069,741.20179 92.5,741.46875 L 92.53125,741.46875 L 92.53125,741.5 C 92.640849,741.86212 93.005305,742.25524 93.09375,742.8125 C 93.095521,742.82366 93.092213,742.83244 93.09375,742.84375 C 93.18911,743.17958 93.125162,743.51711 92.90625,743.75 C 92.79317,743.8703 92.626425,743.9557 92.4375,743.9375 C 92.262373,743.92063 92.104923,743.80932 91.96875,743.65625 C 91.88305,743.58798 91.72875,743.63314 91.65625,743.6875 C 91.62,743.71468 91.625336,743.71064 91.625,743.71875 C 91.624664,743.72686 91.603741,743.76796 91.6875,743.84375 L 91.71875,743.84375 L 91.71875,743.875 C 91.909672,744.08541 92.017746,744.38227 92.15625,744.5625 C 92.225502,744.65262 92.308033,744.6863 92.3125,744.6875 C 92.316967,744.6887 92.298574,744.70871 92.375,744.625 L 92.375,744.59375 L 92.40625,744.59375 C 92.484645,744.53898 92.581399,744.50439 92.6875,744.5 C 92.793601,744.49561 92.904192,744.53372 92.96875,744.59375 C 93.097866,744.71381 93.115591,744.85553 93.15625,744.96875 C 93.196909,745.08197 93.244811,745.15959 93.28125,745.21875 C 93.317689,745.27791 93.319316,745.27881 93.34375,745.28125 L 93.375,745.28125 L 93.40625,745.3125 C 93.493028,745.34242 93.605755,745.2876 93.8125,745.15625 C 94.019245,745.0249 94.254345,744.82128 94.5625,744.75 L 94.625,744.75 C 94.648171,744.7071 94.67118,744.61749 94.6875,744.53125 C 94.69566,744.48813 94.711494,744.44495 94.71875,744.40625 C 94.722378,744.3869 94.712347,744.36706 94.71875,744.34375 C 94.725153,744.32044 94.714465,744.29405 94.78125,744.21875 C 94.789598,744.20934 94.812098,744.18782 94.8125,744.1875 C 94.812902,744.18718 94.87459,744.15645 94.875,744.15625 C 94.875819,744.15586 95.030396,744.12487 95.03125,744.125 C 95.032104,744.12513 95.124105,744.18683 95.125,744.1875 C 95.125895,744.18817 95.176422,744.20432 95.1875,744.21875 C 95.23181,744.27649 95.241766,744.31818 95.25,744.34375 C 95.263797,744.3866 95.268716,744.43966 95.28125,744.5 C 95.283676,744.51168 95.278601,744.51823 95.28125,744.53125 C 95.478803,745.14094 95.231268,745.7437 94.90625,746.1875 L 94.8125,746.3125 L 94.65625,746.28125 C 94.458399,746.23436 94.311352,746.26106 94.25,746.3125 C 94.188648,746.36394 94.154373,746.46514 94.1875,746.6875 L 94.1875,746.71875 C 94.1862,746.76592 94.184576,746.76707 94.1875,746.78125 C 94.192467,746.77624 94.225491,746.76926 94.3125,746.75 C 94.420226,746.72615 94.536306,746.67269 94.71875,746.71875 C 94.809972,746.74178 94.905213,746.81623 94.96875,746.90625 C 95.019141,746.97765 95.04741,747.06918 95.0625,747.15625 C 95.066436,747.17896 95.091474,747.19519 95.09375,747.21875 C 95.17502,747.41633 95.262201,747.60604 95.3125,747.6875 C 95.319274,747.68304 95.359635,747.66693 95.40625,747.625 C 95.416309,747.61265 95.427328,747.60591 95.4375,747.59375 C 95.824052,747.13152 96.294871,746.7976 96.625,746.40625 C 96.631965,746.39086 96.648319,746.38952 96.65625,746.375 C 96.747613,746.20774 96.886841,746.08409 97.03125,746.03125 C 96.742054,745.20407 96.212119,744.03494 95.6875,743.15625 C 95.0357,742.06453 93.727899,740.15489 92.78125,738.90625 C 91.8346,737.65766 90.482156,736.07591 89.78125,735.375 L 88.5,734.09375 L 88.5,733.21875 C 88.79554,731.88248 89.486231,730.76455 90.28125,729.65625 L 89.53125,725.65625 L 86.8125,723.875 L 86.8125,721.8125 L 89.53125,720.5625 L 89.9375,714.25 L 87.59375,714.25 L 84.3125,710.34375 L 83.3125,710.96875 L 81.65625,708.5625 L 79.03125,708.5625 L 71.96875,702.34375 z "},"ca9":{"name":"CA-9","path":"M 82.349544,684.87386 C 81.826364,686.02122 81.585464,687.36617 81.711524,689.16277 L 79.691124,689.69446 L 79.513904,692.15795 L 80.435484,691.57307 L 83.501554,693.98337 L 82.908764,694.68201 L 84.308834,696.66696 L 88.446174,696.65953 C 89.447884,698.23819 89.969714,699.61921 90.519774,701.48013 L 93.249074,701.39149 C 94.750724,701.33869 96.129524,701.15176 96.297394,700.98389 L 96.598654,700.68257 L 93.339414,696.6107 L 94.742444,696.21978 L 92.965514,694.33782 C 92.289324,693.75141 91.505894,693.25676 91.210934,693.25676 C 90.915964,693.25676 89.814714,692.85087 88.765184,692.35287 L 86.851124,691.44904 L 86.496674,690.22614 C 86.294604,689.55443 85.745564,688.21385 85.291524,687.23102 L 84.476274,685.44099 L 83.412914,685.15743 L 82.349544,684.87386 z "},"ca13":{"name":"CA-13","path":"M 80.416004,691.79068 L 79.547584,692.35781 C 79.547594,692.35781 80.938684,693.25194 81.426204,694.07694 C 81.913724,694.90195 82.968084,696.45179 82.968084,696.45179 L 83.960554,697.49741 L 85.591054,699.78368 L 86.105014,711.19714 L 87.646894,713.67833 L 90.553434,713.67833 L 91.085114,714.19226 C 91.381444,714.4739 92.144824,714.83306 92.768774,714.98981 C 93.392614,715.14651 94.413334,715.18281 95.037294,715.06071 C 95.661134,714.93855 96.684434,714.83448 97.323524,714.83028 L 98.493234,714.81259 L 99.166694,712.93397 C 99.541294,711.89811 99.857774,710.53292 99.857884,709.90335 L 99.857884,708.76909 L 97.039964,707.05001 L 97.022244,706.3411 L 98.776794,704.42704 L 98.776794,701.99899 L 96.827294,701.44962 L 90.269864,701.85721 C 89.761554,699.94202 89.515744,698.85188 88.407414,696.8992 L 84.294454,696.94106 L 82.666794,694.67952 L 83.216204,694.00605 L 80.416004,691.79068 z "},"oh15":{"name":"OH-15","path":"M 1928.2808,630.80761 L 1928.2808,627.47613 L 1930.9573,627.47613 L 1931.7595,611.67309 L 1930.3787,597.88579 L 1927.7137,598.3953 L 1926.2145,581.74003 L 1938.2159,579.0958 L 1940.9318,595.61733 L 1944.5562,595.02916 L 1945.9468,602.09718 L 1944.7275,603.31645 L 1944.7275,605.80228 L 1947.9514,606.58424 L 1951.1677,600.75558 L 1952.1844,602.5722 L 1954.0852,602.00144 C 1956.0261,603.41938 1956.7992,604.96707 1957.2005,606.55611 L 1955.6137,609.62462 L 1957.7554,612.26942 L 1962.3085,612.88011 L 1962.2912,616.41712 L 1961.429,618.10818 L 1960.4697,616.09159 L 1957.0825,614.39718 L 1955.503,616.14699 L 1956.7017,617.88133 L 1956.0294,619.99071 C 1952.6561,621.06162 1949.1106,620.97042 1945.6513,621.46031 L 1946.9313,628.5345 C 1940.4578,629.54881 1935.0751,629.92159 1928.2808,630.80761 z "},"pa9":{"name":"PA-9","path":"M 2152.5802,508.43088 C 2146.1779,514.09728 2151.1115,510.80788 2146.6253,514.5984 L 2146.6253,516.76058 L 2144.6758,517.52266 L 2143.3998,515.78583 C 2141.186,516.42555 2139.5119,516.92222 2137.569,516.88464 L 2136.7183,513.85405 L 2118.712,517.36316 L 2120.5374,525.46246 L 2112.9344,542.93712 L 2113.1648,545.24108 C 2114.3232,545.23901 2115.5139,545.72095 2116.6384,546.46395 L 2118.1626,545.18791 L 2118.9424,546.4285 L 2120.4488,545.18791 L 2121.6362,547.22603 L 2121.6717,546.16266 L 2125.4467,549.81355 L 2126.7582,546.94246 C 2128.5479,547.12372 2129.3222,547.54664 2130.604,548.6084 C 2130.9316,547.83021 2131.8596,547.65698 2132.6953,547.79316 L 2134.1131,544.95751 L 2136.3107,545.29425 L 2137.6045,538.15197 L 2133.0675,535.59989 L 2128.6545,535.59989 L 2126.1378,537.8684 L 2123.8693,535.12137 L 2126.2796,530.40712 L 2127.857,531.73632 L 2129.0444,530.99197 C 2128.9033,529.22451 2129.3758,528.23821 2130.6572,526.80939 C 2133.0992,528.81264 2134.5148,529.36823 2136.7538,530.38939 L 2138.6855,529.3083 L 2139.3945,524.84217 L 2140.8832,523.60157 L 2143.5061,523.97375 L 2143.5061,526.75623 L 2140.9895,527.37652 L 2141.982,528.95385 L 2145.5974,528.22722 L 2148.3267,528.9184 L 2148.3267,536.09613 L 2154.6183,537.37217 C 2155.6227,539.52991 2155.8126,541.30599 2155.6994,543.73464 L 2153.8562,545.77276 L 2153.1473,552.29474 L 2147.9723,553.74801 L 2146.9089,558.53316 L 2144.0733,559.1889 L 2142.6023,562.23721 L 2143.7897,564.45256 L 2140.3869,566.86286 L 2138.3843,566.22484 L 2132.7307,569.9289 L 2132.3762,572.37464 L 2130.8166,573.68613 L 2132.0041,576.2914 L 2130.7281,578.68395 L 2124.7732,576.43318 L 2124.5073,574.21781 C 2122.4892,573.44941 2120.4083,573.02809 2117.9499,572.83543 L 2116.4789,575.38751 L 2112.4913,574.05833 L 2112.9698,576.14962 L 2110.8785,579.71187 L 2112.5976,580.36764 L 2112.5976,582.6716 L 2111.4457,582.6716 L 2110.1519,585.50724 L 2108.6455,585.50724 L 2105.7566,591.53299 L 2103.24,588.39603 L 2100.4044,590.64685 L 2104.0907,593.81919 L 2104.0907,595.91048 C 2140.2229,588.20445 2177.0225,579.9187 2214.9112,570.72645 L 2211.278,554.95316 L 2209.0755,554.56208 L 2207.2825,551.75885 L 2207.9504,550.12277 L 2211.0831,550.89464 L 2212.7173,554.19176 L 2219.6786,550.59335 L 2218.6684,548.76791 L 2220.9192,545.91454 C 2220.2806,544.17109 2219.8244,542.60891 2218.4912,541.21801 L 2215.4251,544.14226 L 2213.5526,539.04604 L 2219.6609,538.57731 L 2223.7549,535.31632 L 2223.7549,531.12024 C 2226.1044,531.25895 2228.6154,529.3806 2231.0457,528.30908 L 2230.1155,526.97311 L 2221.6293,529.43236 L 2219.5014,527.18157 L 2217.3453,528.58167 L 2217.2732,534.89284 L 2215.6171,534.8665 L 2212.43,528.81207 L 2213.4225,525.69286 L 2209.2943,522.83274 L 2216.6657,516.28207 L 2219.3065,519.31266 L 2218.757,521.42167 L 2220.3521,521.42167 L 2220.3521,520.21652 L 2222.6206,520.92543 C 2222.6174,520.00976 2222.3721,519.13442 2221.5218,518.1784 L 2224.322,515.55543 L 2225.6983,512.03702 L 2225.5406,509.39094 L 2222.8701,510.46244 L 2220.9192,508.66128 L 2217.2671,508.55797 C 2216.3353,508.93054 2215.4036,509.82755 2214.2298,509.91773 L 2214.2096,511.90826 L 2208.7259,516.29979 L 2205.784,512.73751 L 2201.5128,516.65425 L 2201.176,519.68484 L 2196.6036,524.82444 L 2191.978,521.13811 L 2196.515,514.35029 L 2191.3399,511.70959 C 2189.6232,513.24002 2188.8344,513.68123 2183.6482,513.51732 L 2178.934,517.55811 L 2169.665,516.51246 L 2159.9529,519.47765 L 2158.7949,518.76453 L 2159.4885,515.42765 C 2158.454,515.41421 2157.7019,515.52179 2156.8691,515.75038 L 2155.6921,516.48779 L 2155.7812,521.08494 L 2153.2043,521.95942 L 2152.4422,521.17962 L 2152.0174,514.55072 L 2154.2548,511.89001 L 2154.2414,510.33878 L 2152.5802,508.43088 z "},"il14":{"name":"IL-14","path":"M 1610.8888,578.70306 L 1609.832,574.44959 L 1600.0742,574.82895 L 1599.3462,569.7287 L 1603.9509,568.95071 L 1603.2166,563.07338 L 1609.5208,560.46043 L 1610.2223,556.72121 L 1612.8972,555.50241 L 1614.7635,552.65406 L 1621.9321,548.64522 L 1625.4391,547.73651 C 1625.2346,546.25139 1626.9759,545.66305 1628.3366,544.78437 L 1630.3886,543.54106 L 1633.4979,543.54106 L 1633.0788,535.24234 L 1640.472,534.07819 L 1647.2685,534.45316 L 1668.99,531.52633 L 1669.728,526.60461 L 1671.5422,526.21685 C 1672.5401,526.00359 1673.6949,525.55597 1674.1086,525.22214 L 1674.8607,524.61518 L 1675.7002,525.9734 L 1679.2894,525.25554 L 1678.8094,514.05037 C 1683.8044,513.65475 1688.7586,512.70896 1693.7668,512.46521 L 1694.6779,516.90082 L 1692.9224,517.5745 L 1692.9224,518.62139 C 1692.9224,519.19718 1693.2128,520.30561 1693.5677,521.08456 L 1694.213,522.50084 L 1697.3142,523.58193 L 1698.1244,528.98502 C 1698.7537,529.89603 1699.3892,530.81078 1699.663,531.8605 L 1695.758,533.929 C 1696.29,540.84095 1697.8595,547.65396 1698.4914,554.56211 L 1683.4245,556.58502 L 1681.9542,545.87648 L 1655.4919,549.21235 L 1655.4919,552.04799 L 1634.4077,554.41067 L 1635.1866,561.12205 L 1629.9711,561.12205 L 1629.9711,566.22621 L 1625.2897,566.22621 L 1625.8268,571.81505 L 1620.3299,572.57109 L 1620.3299,577.97436 L 1610.8888,578.70306 z "},"pa14":{"name":"PA-14","path":"M 2097.5525,561.20238 L 2096.9692,562.90269 L 2094.4387,560.24591 L 2091.0765,559.09441 L 2091.8058,556.44324 L 2088.0568,557.15465 L 2079.9124,550.39272 L 2093.1278,548.95503 C 2093.8705,548.31411 2094.6089,547.76005 2095.5634,547.51096 L 2096.3044,547.51096 L 2097.6454,548.958 C 2098.3831,549.75388 2098.9865,550.64711 2098.9865,550.94295 C 2098.9865,551.2388 2098.8421,551.48086 2098.6657,551.48086 C 2098.4892,551.48086 2097.8697,551.22657 2097.289,550.91577 L 2096.2331,550.35067 L 2095.0531,551.36095 L 2095.9615,553.15634 L 2099.6112,553.64759 L 2099.699,555.75691 L 2096.9656,557.62772 L 2099.3143,558.56697 C 2098.2654,559.11468 2097.944,560.13971 2097.5525,561.20238 z "},"il13":{"name":"IL-13","path":"M 1703.1307,548.11716 L 1703.1307,546.37671 L 1698.0779,546.37671 L 1696.3007,534.35527 L 1698.1683,533.27069 C 1699.1821,532.84895 1700.7771,532.4689 1701.7129,532.42612 C 1702.6486,532.38335 1704.3973,532.14942 1705.5988,531.90627 L 1707.7834,531.46419 L 1710.7808,528.51215 L 1712.3238,538.92444 L 1716.7295,539.66878 L 1716.1685,540.71694 C 1715.86,541.29344 1715.6075,542.38878 1715.6075,543.15104 L 1715.7298,544.95254 L 1718.2085,546.1461 L 1703.1307,548.11716 z "},"oh13":{"name":"OH-13","path":"M 2007.5221,539.40698 L 2007.0706,535.44654 L 2004.8308,535.46573 L 2002.2106,522.27374 L 1991.8339,524.95741 L 1991.4948,526.02587 C 1991.3083,526.61352 1990.9489,527.09433 1990.6962,527.09433 C 1990.4435,527.09433 1989.9754,526.77532 1989.656,526.38542 L 1989.0754,525.67651 L 1988.9673,522.41184 L 1986.1527,519.7664 L 1984.143,520.24964 L 1981.7712,516.23306 L 1978.1881,516.89033 L 1978.1881,514.05037 L 1973.3675,514.04512 C 1974.652,512.90397 1975.8113,511.58543 1977.2572,510.6476 C 1977.4028,510.6476 1978.8841,509.74903 1980.5489,508.65079 L 1983.5758,506.65397 L 1985.4414,507.3391 L 1987.1024,516.24054 L 1991.2829,515.67195 L 1991.3087,516.61884 L 1993.475,516.69779 L 1993.9261,516.16455 L 1995.0582,517.47271 L 1996.4519,517.13405 L 1996.9034,515.18463 L 1998.1953,515.02045 L 2002.6617,512.86729 L 2004.8633,513.07746 C 2004.8273,514.93536 2005.1304,515.57453 2006.1827,516.83967 L 2005.9774,522.13514 L 2010.5949,521.39677 L 2011.6701,522.68595 C 2012.2614,523.395 2012.7537,524.29413 2012.7641,524.68403 L 2012.783,525.39294 C 2011.3344,525.58223 2010.6467,524.89915 2009.0171,523.48634 L 2007.6754,525.464 L 2009.8477,528.23122 L 2011.3652,527.66144 L 2013.9049,532.11825 L 2013.1931,535.6774 L 2015.5425,538.85507 C 2012.4586,539.36739 2010.565,539.38719 2007.5221,539.40698 z "},"oh9":{"name":"OH-9","path":"M 1974.3499,536.77016 L 1971.3368,523.45175 L 1948.7278,527.13168 L 1946.7353,518.54373 L 1941.8919,519.60221 L 1941.8919,518.02027 L 1924.659,520.97032 L 1923.7438,520.29368 L 1923.7438,518.5874 L 1919.9996,518.24419 L 1919.0954,511.78186 L 1910.6573,513.20615 L 1910.1847,516.20367 L 1905.8792,519.69096 L 1902.1339,519.72166 L 1900.9641,516.36614 L 1897.8148,516.99601 C 1897.6197,514.61502 1897.1094,512.23085 1897.1956,509.83873 C 1903.1512,508.60984 1909.0584,506.90535 1915.0951,506.09573 L 1915.804,506.11057 L 1915.804,507.19343 L 1919.9544,507.97206 L 1922.0065,506.69051 L 1927.3395,509.52611 L 1933.4995,510.2501 L 1935.0018,511.50332 C 1935.8281,512.19258 1937.3209,513.17525 1938.3191,513.68702 L 1940.1342,514.6175 L 1942.9451,514.6175 L 1943.8363,513.7263 C 1944.3265,513.23614 1944.7569,512.53432 1944.7929,512.16669 C 1944.8288,511.79907 1944.8127,511.05168 1944.7572,510.50582 C 1944.7017,509.95995 1944.8106,509.51334 1944.9992,509.51334 C 1945.1878,509.51334 1945.8984,510.03161 1946.5783,510.66505 L 1947.8145,511.81677 L 1950.9659,511.1246 L 1950.9659,513.51884 L 1951.9584,513.8859 C 1952.5043,514.08779 1954.0059,515.05 1955.2955,516.02415 L 1957.64,517.79533 L 1962.2077,519.3028 L 1964.8937,518.62866 L 1968.6165,515.30495 L 1972.8004,514.33394 L 1977.621,514.68272 L 1977.621,517.57937 L 1981.598,516.83328 L 1983.9918,520.89035 L 1986.0699,520.23077 L 1988.3964,522.5573 L 1988.3964,525.27159 L 1984.0537,526.24609 L 1984.6983,530.12296 L 1980.5639,531.05893 L 1981.1567,535.4791 L 1974.3499,536.77016 z "},"oh14":{"name":"OH-14","path":"M 2044.8435,465.3291 L 2043.9928,466.09118 C 2040.9955,468.33861 2037.5937,469.998 2034.4225,471.97514 L 2033.7667,471.3194 L 2033.7667,472.45365 L 2031.0729,474.19048 C 2029.5913,475.14067 2027.7886,476.09597 2027.0675,476.31722 C 2026.3463,476.53846 2024.1113,477.95346 2022.1052,479.47187 C 2020.0991,480.99028 2017.882,482.78332 2017.1782,483.44177 C 2016.4744,484.10022 2015.0945,485.01196 2014.1122,485.47989 L 2012.3222,486.33058 L 2010.0891,488.989 C 2008.8593,490.45 2007.4819,492.36379 2007.0231,493.24246 L 2006.1901,494.83751 L 2007.3421,500.43791 L 2009.3093,499.81761 L 2009.9119,501.97979 C 2010.2409,503.16454 2010.5128,504.46656 2010.5145,504.88633 C 2010.5162,505.30608 2010.0806,506.37574 2009.5574,507.26118 L 2008.6182,508.87395 L 2010.0891,510.64623 L 2011.7374,510.64623 L 2011.2766,512.06405 L 2005.4103,513.07425 L 2005.4103,514.01355 C 2005.4103,514.53114 2005.7134,515.25592 2006.0838,515.62632 L 2006.7572,516.29979 L 2006.4914,521.56345 L 2010.6031,520.78365 L 2013.3501,523.74335 L 2013.4037,525.8853 L 2015.8136,523.74335 L 2014.5553,515.50227 L 2031.7995,512.22355 L 2030.1158,502.56464 L 2043.8156,499.87078 L 2045.1625,504.42553 L 2052.6061,502.63553 L 2044.8435,465.3291 z "},"pa13":{"name":"PA-13","path":"M 2293.7952,508.12959 L 2291.8103,515.46682 C 2292.4249,516.04509 2293.1607,516.46908 2293.9193,516.86692 L 2294.8941,515.34276 L 2303.915,515.87444 L 2308.2748,517.73533 L 2307.5836,519.22405 L 2309.409,522.55593 C 2311.3054,520.99415 2312.5391,518.76624 2314.0524,516.8492 L 2315.7006,518.00118 L 2320.6807,520.28741 L 2321.9213,522.3787 L 2322.0985,521.47484 L 2323.2328,522.41415 L 2323.1442,523.37118 L 2324.1012,522.04197 L 2323.8176,521.72296 L 2323.7822,520.87227 L 2324.6683,518.86959 L 2321.5491,517.57583 L 2321.2124,518.37335 L 2322.2049,518.76326 L 2321.2833,519.61395 L 2320.0427,519.15316 L 2320.4503,518.08979 C 2320.6318,518.16494 2320.8225,518.2493 2320.8225,518.2493 L 2321.2301,517.41632 L 2304.996,510.57533 L 2304.7302,512.70207 L 2302.444,513.6591 L 2298.3323,512.18811 L 2293.7952,508.12959 z "},"il9":{"name":"IL-9","path":"M 1714.3697,521.95179 C 1713.9588,521.93068 1713.0484,521.63647 1712.3465,521.298 L 1711.2721,520.75683 L 1710.9326,519.04851 L 1708.5288,518.29815 L 1709.2567,516.93295 L 1715.8911,515.74669 L 1719.2907,513.7166 C 1720.4675,515.30041 1721.1964,517.18318 1722.0454,518.94521 L 1716.1345,518.48184 L 1714.4476,519.8818 L 1715.1169,521.99017 L 1714.3697,521.95179 z "},"pa15":{"name":"PA-15","path":"M 2293.2281,518.37523 C 2292.0632,517.76443 2290.8984,517.15291 2289.7127,516.58432 L 2291.9782,508.41399 L 2290.4195,506.53589 L 2290.7366,503.51243 L 2283.9276,500.25802 L 2285.1098,498.04899 L 2283.7942,496.75295 L 2282.1945,498.91999 L 2280.6222,499.05716 C 2279.7575,499.13259 2277.5187,499.59988 2275.6471,500.09556 L 2272.2444,500.9968 L 2269.0727,499.71281 L 2269.2407,499.01263 C 2269.3331,498.62753 2270.7188,497.19594 2272.3199,495.83132 C 2273.9211,494.46669 2276.4484,491.99318 2277.9362,490.33464 L 2280.6414,487.3191 L 2283.532,485.4771 C 2285.1218,484.464 2287.8796,482.92502 2289.6605,482.05715 C 2291.4414,481.18928 2293.483,479.96748 2294.1976,479.34203 C 2294.912,478.71657 2295.8839,477.91202 2296.3572,477.55414 C 2296.8305,477.19626 2297.6599,476.2106 2298.2004,475.36379 C 2298.7408,474.51698 2299.183,473.50428 2299.183,473.11333 L 2299.183,472.40252 C 2300.2796,471.49542 2301.2902,470.43765 2302.5794,469.81433 C 2302.7909,469.81433 2303.9067,470.75722 2305.0592,471.90965 L 2307.1545,474.00497 L 2305.326,475.02825 L 2306.016,477.77741 L 2304.8749,479.5988 L 2302.6111,481.44797 L 2303.307,486.82819 L 2304.5637,487.30923 L 2304.7533,489.66834 L 2304.6441,490.41189 C 2304.5841,490.82084 2303.6259,492.28727 2302.5149,493.67062 C 2301.4038,495.05398 2299.7236,497.33425 2298.7811,498.7379 C 2297.8386,500.14154 2296.5437,502.37895 2295.9035,503.70991 L 2294.7396,506.12985 L 2304.2871,510.21221 L 2304.2871,512.38458 L 2302.4428,513.0923 L 2298.3323,511.62576 L 2293.609,507.41011 L 2291.1587,515.44605 L 2293.6128,517.43329 L 2293.2281,518.37523 z "},"mi15":{"name":"MI-15","path":"M 1901.8033,507.62376 L 1897.6622,487.11176 L 1897.6559,478.27607 L 1894.8212,471.75969 L 1897.9394,469.96067 L 1904.8936,469.20615 C 1905.4279,473.29237 1906.2251,477.37225 1907.6798,481.23822 L 1913.0257,479.87355 C 1912.0316,475.29688 1911.6301,474.07858 1912.1176,472.36641 L 1915.804,471.28116 L 1915.804,468.25183 L 1917.5386,466.81221 L 1920.2972,469.40372 L 1919.2114,471.43249 L 1921.4753,476.71391 L 1921.4753,481.72403 L 1923.2047,481.72403 L 1923.7578,483.17878 C 1924.062,483.97888 1924.3109,484.96067 1924.3109,485.36052 C 1924.3109,485.76036 1923.8005,486.67603 1923.1766,487.39532 C 1922.5528,488.11462 1922.0424,489.05321 1922.0424,489.48109 L 1922.0424,490.25904 L 1919.2067,491.33715 L 1919.1204,492.34366 C 1919.0728,492.89724 1918.9747,493.60538 1918.9022,493.9173 C 1918.8298,494.22922 1918.741,494.80344 1918.705,495.19334 L 1918.6396,495.90225 L 1917.1565,495.90225 L 1916.1966,498.07777 C 1915.6688,499.2743 1915.2368,500.79049 1915.2368,501.44707 L 1915.2368,502.64086 L 1915.804,502.99136 C 1916.1159,503.18414 1916.3711,503.56481 1916.3711,503.83731 L 1916.3711,504.33275 L 1901.8033,507.62376 z "},"nj13":{"name":"NJ-13","path":"M 2354.9034,463.59227 L 2354.2653,466.81781 L 2354.8679,469.15722 L 2353.5387,469.86613 C 2352.8075,470.26359 2351.7455,470.63506 2351.1816,470.68138 L 2350.1537,470.76999 L 2348.7004,468.6787 L 2348.0092,469.36989 L 2349.7815,472.08147 L 2353.6451,472.08147 L 2352.9539,474.81078 L 2350.1537,475.75009 L 2350.5081,475.30702 L 2348.8599,475.8387 L 2348.47,477.50464 C 2348.2517,478.41919 2347.9408,481.02083 2347.7966,483.28227 L 2347.5484,487.39395 L 2347.9738,487.39395 C 2348.2103,487.39395 2348.5396,486.8114 2348.7181,486.10019 L 2349.0548,484.80642 L 2348.7181,483.56583 L 2348.3991,482.30751 L 2350.0828,481.65177 L 2349.0548,477.06157 L 2349.6574,476.44128 C 2349.7811,476.37944 2353.0586,474.98533 2353.2197,474.91712 C 2353.2236,474.91544 2353.3083,474.88167 2353.3083,474.88167 C 2353.5279,474.73401 2354.0254,473.98281 2354.4958,473.07395 L 2355.4528,471.23078 C 2355.716,468.97301 2355.9642,466.71344 2356.268,464.46068 L 2354.9034,463.59227 z "},"ny13":{"name":"NY-13","path":"M 2356.0376,473.57019 C 2356.0376,473.57019 2355.7229,473.85935 2355.8427,474.75761 C 2355.9624,475.65589 2356.3054,475.38956 2357.4732,475.8387 C 2358.6409,476.28783 2357.739,476.65396 2357.739,476.65395 L 2357.3846,477.36286 L 2357.9517,477.78821 L 2358.0935,477.00841 L 2358.3948,477.54009 L 2359.5645,477.48692 L 2359.3518,476.44128 L 2359.1214,476.2286 L 2358.9619,476.49444 L 2358.7492,476.26405 L 2358.6429,475.14751 L 2356.6225,473.71197 L 2356.0376,473.57019 z M 2355.0451,475.50197 L 2350.5613,477.06157 L 2350.8803,482.85692 L 2349.7638,482.85692 L 2350.3486,485.12543 L 2351.3588,485.12543 L 2351.3588,483.68989 L 2353.8754,482.57336 L 2355.1692,480.64157 C 2355.8787,479.5817 2356.463,478.41619 2356.463,478.05405 C 2356.463,477.69191 2356.144,476.98094 2355.7541,476.459 L 2355.0451,475.50197 z "},"mi14":{"name":"MI-14","path":"M 1924.0273,482.25589 L 1923.5153,481.1818 L 1922.0424,480.7483 L 1922.0424,476.71391 L 1919.7785,471.43249 L 1920.8643,469.40372 L 1919.4706,468.09445 C 1918.7041,467.37435 1918.1921,466.67003 1918.3329,466.5293 C 1918.4736,466.38856 1917.9723,465.05694 1917.2188,463.57014 L 1915.849,460.86686 L 1925.0315,458.7186 L 1926.9187,461.47827 L 1924.0273,462.31754 L 1921.4753,465.7985 L 1921.4753,468.3072 L 1923.3056,470.32974 L 1922.137,473.68197 L 1923.3054,478.28507 L 1925.6822,478.0377 L 1926.0599,479.83816 L 1924.0273,482.25589 z "},"mi13":{"name":"MI-13","path":"M 1923.8051,477.78317 L 1922.6866,473.73233 L 1923.8727,470.32974 L 1922.0424,468.3072 L 1922.0424,465.7985 L 1924.486,462.49332 L 1927.725,461.78192 L 1925.4882,458.64065 L 1933.9709,456.37709 L 1933.2327,460.45671 L 1931.35,463.09648 L 1925.7704,466.128 L 1924.2426,471.23215 L 1924.88,477.11889 L 1923.8051,477.78317 z "},"nj9":{"name":"NJ-9","path":"M 2348.5232,458.47039 L 2348.5232,459.23246 C 2348.5232,459.65262 2348.9827,460.54423 2349.5511,461.19969 L 2350.5968,462.38712 L 2350.1714,465.9494 C 2349.9405,467.90823 2349.8417,469.65887 2349.9587,469.84841 C 2350.0759,470.03796 2350.6403,470.14032 2351.1993,470.0788 C 2351.7584,470.01731 2352.6194,469.79527 2353.1134,469.58256 L 2353.9995,469.19266 L 2353.9995,466.65831 L 2354.3103,464.26161 L 2354.7316,463.01161 L 2355.3996,463.22009 L 2356.3921,463.62771 L 2357.1719,459.03751 L 2352.8653,459.03751 L 2350.8803,460.82751 L 2350.2423,459.65781 C 2349.8946,459.00809 2349.3735,458.47037 2349.0726,458.47039 L 2348.5232,458.47039 z "},"mi9":{"name":"MI-9","path":"M 1910.2109,461.09947 C 1908.8725,455.62807 1907.6842,451.47785 1906.9163,445.496 L 1911.2669,444.76097 L 1911.2669,442.35326 C 1911.2669,441.02902 1911.4281,439.7844 1911.6251,439.58742 L 1914.4768,439.7823 L 1914.7381,438.08042 L 1919.6162,436.93111 L 1922.4794,450.45858 L 1920.8716,450.9189 L 1921.5532,453.75531 L 1917.7889,455.60202 L 1916.5921,454.02021 L 1912.9724,456.31209 L 1913.657,460.5937 L 1910.2109,461.09947 z "},"ny24":{"name":"NY-24","path":"M 2264.0033,278.76148 L 2255.7976,282.14653 C 2254.2586,281.7372 2252.7149,281.32577 2251.1366,281.1895 L 2265.5983,321.5088 C 2260.3642,323.21019 2252.3711,324.08389 2249.896,326.61296 L 2251.0479,331.92979 L 2249.8073,334.2692 L 2246.3337,334.2692 C 2245.6487,337.14713 2242.6186,337.08218 2243.0372,339.17841 C 2241.9318,340.09669 2240.8118,341.00072 2240.1556,342.29713 C 2245.4506,345.41825 2245.9636,345.73442 2248.6376,349.08544 L 2250.6758,348.39425 L 2252.8379,354.54405 L 2257.2154,353.35663 L 2258.4206,357.43286 L 2266.6263,354.77445 L 2268.115,358.77979 L 2266.963,363.54722 C 2258.1248,366.22039 2263.5884,363.56849 2240.4497,371.57564 L 2239.3509,367.76524 L 2223.4004,372.83395 L 2218.0481,369.34257 L 2214.1669,370.54771 L 2211.0831,361.49138 L 2209.6653,361.49138 L 2208.9741,358.33672 L 2203.3382,356.33405 L 2203.2319,354.24276 L 2198.6949,355.18207 L 2199.9886,362.69653 L 2189.3727,366.17019 L 2190.9146,372.12504 L 2188.6283,372.72762 L 2191.2513,380.49019 L 2194.1047,380.95098 C 2194.3957,382.85844 2196.0812,384.52993 2197.6138,386.16148 L 2199.5633,393.07336 L 2208.1588,390.98207 L 2212.1996,406.52494 L 2218.8988,405.37296 L 2217.3215,398.72692 L 2216.3467,398.19524 L 2214.8403,393.55187 L 2219.4837,391.5492 C 2220.1022,392.7379 2220.5277,394.01339 2220.7952,395.34187 L 2222.7269,397.64583 L 2226.4487,410.54801 L 2224.8891,412.35573 C 2226.0033,414.9932 2227.3702,416.69671 2227.3349,418.11563 L 2230.7376,417.76118 L 2230.5604,414.23435 L 2232.1909,414.23435 L 2233.578,410.84274 L 2236.3561,411.53284 L 2237.1182,410.30997 L 2240.1661,410.26445 L 2238.8852,406.73761 L 2241.7789,407.41108 L 2243.179,405.72742 L 2246.7413,405.72742 L 2248.9212,409.75049 C 2249.7361,408.40252 2250.3234,407.32769 2250.4099,405.16029 L 2260.4055,405.2489 L 2261.8766,403.47662 L 2262.869,404.0792 L 2265.2616,402.80316 L 2264.8992,398.95732 L 2269.5505,397.68128 L 2267.8669,390.00732 L 2272.6058,388.77228 L 2273.8844,385.50385 L 2275.4887,385.49858 L 2276.2013,383.48975 L 2277.989,384.28003 C 2280.6462,379.27754 2281.6191,379.32822 2285.0048,377.19375 L 2280.4677,373.31247 L 2280.4677,368.54504 L 2283.8705,367.269 C 2284.0143,366.0671 2284.1125,365.32043 2282.9361,363.79986 L 2284.4731,355.92643 L 2287.3442,354.04781 L 2288.8506,355.28841 C 2289.3598,353.24495 2290.2332,352.02093 2291.8805,350.66033 L 2287.61,349.81207 L 2286.1568,339.19925 C 2285.0632,338.93378 2284.0606,337.98544 2283.2857,335.26168 C 2284.6437,334.18164 2284.4085,331.73588 2285.4478,330.24613 L 2283.0376,324.11405 L 2275.3636,322.7494 L 2276.9409,312.43475 L 2264.0033,278.76148 z "},"ny21":{"name":"NY-21","path":"M 2301.6401,374.25315 L 2296.1504,370.10929 L 2298.0007,362.39362 L 2294.0363,354.97077 L 2293.3802,350.31572 L 2288.1314,349.29948 L 2286.6839,339.31933 L 2298.171,339.94822 L 2296.9384,333.98701 L 2303.7872,329.5016 L 2306.7345,336.55593 L 2314.9061,334.95499 L 2315.4247,336.2076 L 2319.4338,336.26839 L 2322.4409,338.37464 C 2323.2963,337.84232 2323.6631,336.73722 2325.0071,336.77766 L 2325.5991,339.52525 L 2331.0052,344.0034 C 2332.6284,342.57648 2333.9038,341.84539 2334.5992,339.60668 L 2336.4738,339.37473 L 2339.6938,346.79967 L 2341.2325,346.84987 L 2340.5628,348.59505 L 2341.9455,352.41869 L 2343.9861,352.41869 L 2343.2713,356.98528 L 2341.3107,356.36298 L 2339.8773,358.08998 L 2337.6661,358.14796 L 2336.6078,360.28803 L 2337.1671,361.66831 L 2317.3636,370.85037 L 2317.3906,374.12015 L 2314.9995,375.08381 L 2312.4129,374.47991 L 2310.9538,376.47004 L 2301.6401,374.25315 z "},"ma9":{"name":"MA-9","path":"M 2468.7175,356.95572 C 2468.4259,356.95572 2467.6769,356.4453 2467.0531,355.82146 L 2465.9188,354.68721 L 2461.4382,354.68721 L 2460.3807,352.79765 L 2460.9139,348.73235 L 2457.48,345.46625 L 2454.0952,350.80361 L 2452.8349,348.44879 L 2450.5394,348.44879 L 2451.2846,347.24306 L 2449.2963,345.04602 L 2454.0091,345.04602 L 2454.0091,341.07612 L 2451.1978,341.07612 L 2452.4931,338.23331 L 2453.1093,338.29842 C 2453.4482,338.33423 2454.2998,338.17847 2455.0016,337.95229 L 2456.2776,337.54106 L 2456.2776,336.4002 L 2458.0134,337.42252 L 2458.4676,339.49122 L 2461.5559,337.45403 L 2461.2582,338.83973 C 2461.0945,339.60186 2460.7728,340.67204 2460.5433,341.2179 L 2460.1262,342.21037 L 2463.0616,342.21037 L 2463.7732,339.37473 L 2464.8126,339.37473 L 2465.4169,340.93434 C 2465.7492,341.79212 2466.0757,343.4688 2466.1424,344.66029 L 2466.2636,346.82664 L 2467.8496,347.80682 L 2468.3454,347.50038 C 2468.6181,347.33184 2469.6955,347.15376 2470.7397,347.10466 L 2472.6381,347.01537 L 2474.4136,350.02106 L 2472.1572,350.61112 L 2472.1572,355.84954 C 2471.0311,356.28902 2469.9096,356.74092 2468.7175,356.95572 z "},"wa9":{"name":"WA-9","path":"M 209.03016,141.43543 L 206.47808,139.94108 C 205.07443,139.11919 203.37611,137.95167 202.70401,137.34659 L 201.48196,136.24644 L 197.47928,136.5913 L 195.24717,133.75363 L 196.02192,132.35428 C 196.44807,131.58464 196.80575,130.66113 196.81681,130.30204 L 196.83689,129.64915 L 193.29172,127.83284 L 192.69687,126.438 L 193.89377,125.40671 L 191.1656,123.82592 L 191.16878,123.13696 C 191.17048,122.75804 191.43045,121.51721 191.74646,120.37958 L 192.32096,118.31115 L 195.30882,116.35345 L 196.28382,117.64608 L 197.39938,118.6109 L 199.0716,118.24311 L 199.86042,115.07533 L 201.64495,113.75809 L 202.09956,114.03904 C 202.34955,114.19356 203.19049,115.32804 203.96825,116.56012 C 204.74607,117.79219 206.39454,119.8124 207.63162,121.04948 L 209.88085,123.2987 L 212.12634,123.2987 L 214.48798,118.66951 L 212.75852,116.03004 L 214.43189,114.64127 L 213.15585,113.1038 L 218.67134,112.23969 L 218.95491,103.87744 L 220.41152,105.08633 L 224.56999,104.14845 L 225.44876,105.11952 C 225.93212,105.6536 226.32758,106.29756 226.32758,106.55054 C 226.32758,106.80351 225.95424,107.29383 225.49793,107.64014 L 224.66822,108.26979 L 221.06741,116.77672 L 220.54173,121.60165 L 217.36201,123.86583 L 215.04932,123.86583 L 213.31436,126.34286 L 213.99662,129.06121 L 211.39106,132.58543 L 210.88291,134.88939 C 210.60343,136.15656 210.32746,138.0647 210.26962,139.12967 L 210.16441,141.066 L 209.03016,141.43543 z "},"tx23":{"name":"TX-23","path":"M 838.25945,1169.5612 L 837.03661,1177.0225 L 832.72994,1177.0225 L 831.27668,1191.821 L 828.01569,1193.8414 L 829.14994,1196.872 L 833.11984,1196.872 L 834.96301,1200.4165 L 832.58816,1203.9433 C 832.58816,1204.1119 832.86776,1204.2447 833.20849,1204.2447 C 833.54916,1204.2447 834.47126,1204.7551 835.26433,1205.3789 L 836.7176,1206.5132 L 839.67727,1206.5486 L 842.79648,1209.2956 L 842.79648,1211.6528 L 843.78895,1212.0249 C 844.33481,1212.233 845.30324,1212.9269 845.95113,1213.5668 C 846.59896,1214.2067 848.06641,1216.0757 849.21212,1217.714 C 850.35778,1219.3522 851.30341,1220.9474 851.30341,1221.2585 C 851.30341,1221.5696 851.54478,1221.8256 851.83509,1221.8256 C 852.12535,1221.8256 853.27951,1222.3999 854.40492,1223.1017 C 855.53039,1223.8035 857.45829,1225.3237 858.69383,1226.469 L 860.9446,1228.5425 L 860.9446,1231.4136 L 863.92202,1234.4797 C 865.55961,1236.1645 867.60127,1237.9895 868.45905,1238.5382 L 870.01866,1239.5307 L 870.01866,1241.0726 L 871.17066,1242.1359 C 871.79972,1242.7221 873.01202,1243.5223 873.86453,1243.9259 C 874.71698,1244.3295 876.0444,1244.9255 876.8242,1245.2374 C 877.604,1245.5493 878.80376,1246.0516 879.50037,1246.3717 C 880.19691,1246.6917 881.27684,1247.4282 881.89291,1248.0021 C 882.50898,1248.5761 883.19997,1249.0478 883.41707,1249.0478 C 883.63411,1249.0478 884.67077,1250.0687 885.73878,1251.3163 L 887.68829,1253.5849 L 890.3644,1253.5849 L 891.88856,1258.9726 L 893.00512,1259.1675 C 893.61915,1259.2814 894.41795,1259.6205 894.7774,1259.9119 L 895.43311,1260.4435 L 896.35469,1264.2362 C 896.86698,1266.3287 897.32925,1269.1593 897.38262,1270.5101 L 897.48895,1272.9558 L 899.50935,1274.0369 L 899.50935,1275.8269 L 900.92717,1276.9435 L 902.34499,1278.06 L 902.34499,1280.5412 L 904.40083,1281.8172 L 905.67687,1286.1948 L 905.39331,1289.8811 C 905.23508,1291.9086 905.11207,1294.2692 905.10974,1295.127 C 905.10748,1295.9848 905.15148,1297.7735 905.21608,1299.0969 L 905.34017,1301.5072 L 907.16559,1304.9454 C 908.1732,1306.8447 909.3872,1309.0294 909.85945,1309.7837 C 910.3317,1310.5381 911.24749,1312.9403 911.89759,1315.136 L 913.08499,1319.1414 L 919.92598,1324.6177 L 919.92598,1326.0001 L 921.37925,1326.6558 C 922.17368,1327.0178 923.25832,1327.3104 923.78955,1327.3116 C 924.32072,1327.3127 925.56664,1327.8151 926.57205,1328.4281 L 928.39747,1329.5447 L 929.12413,1332.4157 L 930.16974,1332.4157 L 931.21542,1335.1982 L 932.81046,1336.1907 C 933.68214,1336.7379 935.45538,1338.1359 936.76261,1339.3099 L 939.13747,1341.4544 L 940.73252,1341.8088 C 941.60873,1342.0011 943.07152,1342.391 943.97581,1342.6772 C 944.8801,1342.9633 946.2838,1343.1901 947.09502,1343.1912 L 948.56598,1343.1912 L 952.25232,1345.4419 L 952.25232,1346.0623 C 952.25232,1346.3989 953.06864,1347.3513 954.06004,1348.189 C 955.05138,1349.0266 956.56221,1350.0182 957.42737,1350.3866 C 958.29252,1350.7552 960.16422,1351.2358 961.59221,1351.45 L 964.19751,1351.8399 L 966.02291,1353.8248 C 967.02731,1354.9197 968.50611,1356.5262 969.31941,1357.3871 C 970.13261,1358.248 971.36031,1359.2518 972.04871,1359.6202 L 973.30701,1360.2936 L 974.90201,1358.9645 L 976.67431,1360.719 C 977.64181,1361.6865 978.71871,1362.4891 979.08461,1362.509 C 979.45051,1362.5289 980.52741,1362.627 981.47721,1362.7217 C 982.42711,1362.8163 983.75801,1363.0612 984.41921,1363.2711 L 985.62431,1363.661 L 986.51051,1362.3672 C 987.00481,1361.6614 987.41431,1360.6547 987.41431,1360.1164 L 987.41431,1359.1239 L 988.76121,1357.6884 C 989.49881,1356.8926 990.32821,1356.239 990.60441,1356.2351 C 990.88051,1356.2313 991.67481,1355.3336 992.37671,1354.2502 C 993.07851,1353.1667 993.65271,1352.0632 993.65271,1351.7867 L 993.65271,1351.2728 L 998.18971,1350.5461 L 998.18971,1348.7916 L 1000.4582,1349.5005 L 1000.4582,1348.2953 L 998.75691,1348.2953 L 998.75691,1347.4978 C 998.75691,1347.0537 999.04711,1345.3948 999.41261,1343.8115 L 1000.0861,1340.9227 L 1001.8761,1340.9227 L 1003.223,1337.9984 L 1002.6027,1336.4033 L 1003.6307,1333.4082 C 1004.1935,1331.7679 1004.9501,1330.1801 1005.3143,1329.8637 L 1005.9878,1329.2788 L 1006.803,1325.5393 L 1008.5221,1326.195 L 1007.7955,1324.2987 L 1010.383,1321.5517 L 1011.5705,1317.3868 L 1013.2364,1317.3691 C 1014.1595,1317.3571 1015.6515,1317.0283 1016.5505,1316.6425 L 1018.181,1315.9336 L 1020.2192,1316.5893 L 1021.3002,1314.6752 L 1023.4979,1314.9765 C 1024.7071,1315.1481 1026.1361,1315.4699 1026.6703,1315.6854 L 1027.645,1316.0753 L 1028.9742,1310.794 L 1031.5972,1309.0571 L 1034.9822,1309.8015 L 1036.3291,1311.432 L 1039.5015,1311.432 L 1041.6105,1314.3385 L 1045.74,1315.2601 L 1046.2184,1314.8348 C 1046.4765,1314.6017 1047.6243,1314.2664 1048.7883,1314.0904 L 1050.915,1313.7714 L 1051.6062,1314.8879 L 1054.5305,1314.7993 C 1056.1395,1314.75 1058.4755,1314.9038 1059.7232,1315.136 C 1060.9709,1315.3682 1062.2821,1315.7858 1062.6297,1316.0576 L 1063.2501,1316.5538 L 1070.8354,1316.6602 L 1073.1394,1314.5866 L 1075.2129,1317.3336 L 1076.8788,1315.9513 L 1077.8004,1316.3057 C 1078.3078,1316.5005 1078.722,1316.8779 1078.722,1317.1564 L 1078.722,1317.6704 L 1080.7778,1317.6704 L 1082.0184,1319.992 C 1082.7001,1321.2692 1083.259,1322.6581 1083.259,1323.0758 L 1083.259,1323.8379 L 1086.3782,1324.1924 L 1086.715,1327.7192 L 1089.4798,1327.1875 L 1090.2418,1329.1902 L 1089.0367,1332.4157 L 1093.4851,1332.4157 L 1094.7611,1335.2159 L 1099.2982,1336.1198 L 1102.2578,1341.6847 L 1109.347,1346.1509 L 1109.347,1347.5155 L 1113.3701,1349.0928 L 1114.4689,1350.8829 C 1115.0788,1351.8697 1115.5854,1353.0838 1115.5854,1353.5767 L 1115.5854,1354.4806 L 1116.9323,1355.9161 C 1117.6699,1356.7119 1118.5304,1357.3694 1118.8464,1357.3694 C 1119.1623,1357.3694 1119.736,1357.7544 1120.1224,1358.2201 L 1120.8136,1359.0708 L 1120.9377,1360.6304 C 1121.0018,1361.4904 1121.3653,1363.239 1121.7352,1364.5294 C 1122.1051,1365.8199 1122.3543,1367.3512 1122.3023,1367.9322 C 1122.2504,1368.5132 1122.2529,1369.4422 1122.3023,1369.988 L 1122.3909,1370.9805 L 1124.6594,1370.9805 L 1124.6594,1371.7248 C 1124.6594,1372.1306 1124.9784,1373.1361 1125.3683,1373.9756 L 1126.0773,1375.5175 L 1127.4774,1375.5175 L 1127.8141,1377.0771 C 1128.0003,1377.9349 1128.4488,1379.2316 1128.8066,1379.9659 C 1129.1643,1380.7002 1129.4776,1381.9763 1129.5155,1382.8016 C 1129.5534,1383.6268 1129.627,1384.732 1129.675,1385.2473 L 1129.7636,1386.1866 L 1133.2905,1387.4095 L 1132.6347,1389.1286 L 1135.5235,1391.0249 L 1134.9209,1393.2757 L 1136.0375,1395.367 L 1138.306,1395.367 L 1138.9972,1397.1924 L 1137.4907,1398.114 L 1138.9617,1399.8863 L 1138.2705,1402.6688 L 1141.7442,1407.8261 L 1141.3897,1409.9883 L 1143.5519,1412.3809 L 1145.1115,1412.3809 L 1145.8027,1414.1886 L 1187.1677,1412.8239 L 1185.7675,1364.7421 L 1212.5289,1364.7421 L 1212.8479,1347.2142 L 1243.4552,1363.2888 L 1249.9594,1352.1589 L 1247.7264,1351.574 L 1247.7264,1350.2803 L 1244.3236,1348.7738 L 1244.359,1346.3104 L 1245.0502,1345.4243 C 1245.4302,1344.937 1246.2518,1344.3113 1246.8757,1344.0419 L 1248.0099,1343.5633 L 1245.4578,1343.1203 L 1245.4578,1340.196 L 1236.242,1340.9049 C 1232.9111,1342.7218 1232.168,1343.3667 1230.3403,1344.9103 L 1224.4741,1342.5532 L 1225.6615,1340.3378 L 1224.545,1336.297 L 1225.4666,1334.3475 C 1225.9744,1333.2825 1226.5947,1332.4157 1226.8489,1332.4157 L 1227.3097,1332.4157 L 1227.3097,1331.565 C 1227.3097,1331.0972 1227.4646,1330.7144 1227.6642,1330.7144 C 1228.4491,1331.2322 1229.0577,1331.9226 1229.6137,1332.6993 L 1230.3049,1331.5827 C 1231.9034,1329.3721 1234.0093,1327.6052 1235.923,1325.6811 L 1239.4853,1325.3266 L 1240.46,1322.491 L 1239.2549,1319.3718 L 1229.6137,1319.3718 L 1226.6186,1320.5592 C 1224.9695,1321.2076 1222.8086,1322.3561 1221.8157,1323.1113 C 1220.8227,1323.8664 1219.6767,1324.4759 1219.2636,1324.4759 C 1218.8504,1324.4759 1217.308,1325.114 1215.8431,1325.8938 L 1213.1847,1327.3116 L 1209.7819,1327.3116 L 1206.7513,1323.3417 L 1165.2091,1323.3417 L 1162.5153,1318.6274 L 1161.9304,1309.2344 L 1162.8697,1306.3987 C 1163.3803,1304.8377 1163.7913,1303.0366 1163.7913,1302.3934 L 1163.7913,1301.2237 L 1173.4325,1301.2237 L 1173.4325,1285.9112 L 1135.559,1285.9112 L 1134.8855,1283.5363 L 1127.0875,1277.9536 L 1124.0392,1270.7759 C 1119.8267,1267.9829 1117.2574,1266.1085 1111.6155,1265.3882 L 1111.6155,1259.8233 L 1105.3771,1259.8233 L 1105.3771,1236.7659 C 1079.1309,1236.3895 1055.4128,1236.1494 1029.0982,1234.8164 L 1027.6804,1232.9555 L 1027.6804,1228.0463 L 1022.9662,1223.9169 L 1019.333,1223.6865 L 1015.1327,1219.5571 L 1013.8921,1220.2128 C 1013.2092,1220.5723 1012.4663,1221.1457 1012.2439,1221.4889 L 1011.8363,1222.1092 L 1010.5425,1222.1978 C 1009.8292,1222.2467 1008.7061,1222.4651 1008.0436,1222.6763 L 1006.8384,1223.0485 L 1002.2305,1218.5292 L 1000.0683,1217.8203 C 998.88041,1217.4308 997.30541,1216.7346 996.57701,1216.2607 L 995.26551,1215.3922 L 994.32621,1216.8987 L 991.17151,1216.5265 C 989.43691,1216.3226 987.30901,1215.8302 986.43961,1215.4454 C 985.57001,1215.0606 984.57131,1214.3865 984.22421,1213.939 L 983.60391,1213.1237 L 980.96321,1212.9643 C 979.51411,1212.8789 978.01401,1212.6158 977.63131,1212.3794 L 976.94021,1211.954 L 973.51961,1212.2376 L 972.03091,1209.8273 L 971.72971,1206.6195 C 971.56361,1204.8498 971.35691,1202.7559 971.26891,1201.9761 C 971.18061,1201.1963 971.07871,1200.2393 971.03841,1199.8494 L 970.96761,1199.1405 L 967.72431,1199.1405 L 964.72911,1196.1453 L 964.72911,1194.0363 L 963.09861,1194.0363 L 962.38971,1191.7678 L 959.90855,1192.3881 L 956.22222,1189.3398 L 956.22222,1188.2055 C 956.22222,1187.5851 955.9238,1186.1016 955.5665,1184.9091 L 954.92848,1182.7469 L 953.47522,1183.314 L 950.55093,1180.8506 L 950.74591,1178.653 L 949.39898,1178.4757 L 949.48756,1176.8629 L 944.02895,1175.392 C 907.97539,1173.6481 875.3094,1171.9028 838.25945,1169.5612 z "},"tx21":{"name":"TX-21","path":"M 1239.503,1339.6404 L 1243.2237,1338.9391 L 1245.9229,1334.3975 L 1243.2437,1331.2828 L 1241.4879,1331.2828 L 1241.4879,1335.8199 L 1238.7776,1335.1795 L 1239.3481,1332.998 L 1237.518,1332.2957 L 1237.518,1330.7157 L 1234.3421,1330.7157 L 1232.981,1332.0768 L 1231.5722,1330.668 L 1236.2774,1326.4177 L 1239.4528,1325.9893 L 1241.2425,1322.6027 L 1239.5026,1318.8058 L 1229.153,1318.7667 C 1225.1667,1320.3137 1222.0317,1322.0498 1219.7481,1323.6914 L 1215.9672,1324.9756 C 1215.9672,1325.2 1215.1196,1325.6902 1214.0837,1326.0647 C 1213.0479,1326.4393 1211.7848,1326.7458 1211.2769,1326.7458 L 1210.3536,1326.7458 L 1207.3256,1322.7759 L 1165.7763,1322.7672 L 1163.1286,1318.1316 L 1162.5037,1309.8691 C 1163.3111,1307.0822 1164.1185,1304.7682 1164.3584,1301.7922 L 1173.9996,1301.7922 L 1173.9996,1285.9125 L 1193.8491,1285.9125 L 1193.8491,1295.7288 L 1233.1126,1294.9866 L 1232.2823,1272.3015 L 1242.2554,1272.3015 L 1256.9169,1276.5348 L 1259.0689,1273.8772 L 1259.0689,1271.8289 L 1257.902,1271.4399 L 1260.8559,1264.5937 C 1262.9071,1264.5618 1264.2016,1264.5298 1266.1582,1263.9304 L 1266.867,1264.6892 C 1267.2569,1265.1066 1267.5759,1265.7411 1267.5759,1266.0993 L 1267.5759,1266.7505 L 1270.3244,1268.9125 L 1271.0571,1272.2482 L 1273.3295,1275.1371 L 1275.3634,1275.1371 L 1274.531,1279.689 L 1271.4235,1282.5689 L 1273.423,1284.7783 L 1271.7216,1284.7783 L 1269.8444,1282.704 L 1269.8444,1278.099 L 1266.0268,1277.3828 L 1264.1731,1278.0941 L 1264.1731,1280.5916 C 1264.8776,1281.4193 1265.4437,1282.3031 1265.8564,1283.2958 L 1265.8745,1283.7982 L 1260.7774,1283.0996 L 1254.6451,1280.0521 L 1254.5319,1299.6168 C 1257.6065,1303.3852 1261.8337,1306.458 1264.1731,1310.7634 L 1265.9295,1316.5672 L 1262.7553,1321.2304 C 1252.8273,1326.2397 1250.6556,1327.5601 1246.5921,1330.2993 L 1246.5921,1332.9224 L 1249.7113,1334.4104 L 1250.0648,1337.4652 L 1248.8207,1339.7898 L 1239.503,1339.6404 z "},"fl5":{"name":"FL-5","path":"M 2138.8484,1329.7075 L 2137.7459,1323.5516 L 2107.0411,1329.1441 L 2105.0957,1325.0444 L 2104.0732,1325.0444 L 2104.0774,1318.5354 L 2107.4935,1315.2527 L 2107.4935,1313.0041 L 2101.2551,1313.7835 L 2101.1901,1311.8995 C 2101.1543,1310.8633 2101.0446,1308.8671 2100.9464,1307.4634 C 2100.8481,1306.0598 2100.4859,1302.9973 2100.1413,1300.6579 C 2099.7969,1298.3185 2099.5262,1295.5405 2099.54,1294.4845 L 2099.5651,1292.5645 L 2098.5265,1291.3003 L 2098.5328,1287.0161 L 2097.1463,1285.3454 L 2095.3002,1285.3139 L 2093.8309,1283.77 C 2093.0229,1282.9209 2092.1952,1281.7634 2091.9918,1281.1978 L 2091.6219,1280.1693 L 2090.4796,1280.8753 L 2090.4796,1277.3813 L 2089.2036,1276.8725 C 2088.5017,1276.5926 2087.4243,1276.2015 2086.8092,1276.0034 L 2085.6908,1275.6432 L 2087.1426,1274.746 L 2086.4073,1271.8164 L 2085.7496,1271.5758 C 2085.3879,1271.4434 2082.9036,1271.4546 2080.229,1271.6006 L 2075.3661,1271.8661 L 2074.068,1275.3051 L 2072.344,1273.8743 L 2072.8719,1273.0202 L 2070.5658,1270.9333 L 2071.1863,1268.4613 L 2070.4828,1267.8948 C 2070.096,1267.5832 2068.9646,1267.1541 2067.9686,1266.9413 L 2065.4135,1266.3792 L 2066.7816,1264.9288 C 2071.1282,1262.5895 2071.5787,1259.6185 2071.6776,1256.5903 L 2073.1065,1254.513 L 2072.5215,1250.1589 L 2074.8977,1246.4971 L 2079.1195,1246.0755 L 2083.3413,1245.6539 L 2084.3288,1246.6414 L 2089.3454,1245.6464 L 2089.3454,1247.4379 L 2095.0166,1246.1371 C 2095.1062,1248.8373 2093.5321,1250.0051 2093.3153,1252.3989 L 2098.5255,1254.7036 L 2100.4532,1253.6719 L 2105.2424,1257.2725 L 2106.3167,1260.3918 L 2107.8679,1259.2233 L 2110.8138,1266.9137 L 2111.5707,1272.8755 L 2108.0606,1273.5775 L 2108.0606,1276.8385 C 2111.1724,1276.8865 2113.7722,1277.4465 2115.7168,1278.6616 L 2133.6789,1275.2986 L 2135.3426,1282.9777 C 2136.9227,1283.5868 2138.4712,1284.294 2140.0953,1284.7783 L 2141.6701,1277.8031 L 2145.6649,1279.5887 L 2147.7559,1287.8975 L 2146.6497,1290.4496 L 2147.9732,1293.3546 L 2150.4834,1292.7246 C 2155.5784,1297.7121 2156.023,1302.6098 2156.9756,1308.5483 L 2150.0735,1310.2832 L 2149.6766,1308.9608 L 2147.7596,1309.6963 L 2147.7848,1314.5525 C 2148.7054,1315.6677 2149.5951,1316.7778 2150.0155,1318.172 C 2150.1784,1319.3291 2149.0354,1320.9885 2147.7006,1322.7217 L 2140.3193,1326.2092 L 2138.8484,1329.7075 z "},"tx2":{"name":"TX-2","path":"M 1462.4246,1321.0745 L 1460.8069,1301.1378 C 1445.6239,1302.0118 1437.4064,1302.5803 1425.7061,1303.9432 L 1430.7569,1307.462 L 1429.7747,1313.1347 L 1426.9524,1313.1347 L 1425.9174,1308.0838 L 1423.8765,1309.1648 L 1418.9992,1309.1648 L 1418.9992,1306.3292 L 1414.2006,1305.9493 L 1413.8864,1303.6154 C 1413.8816,1302.7686 1413.6902,1301.8019 1413.461,1301.4672 C 1413.2319,1301.1325 1412.5978,1300.694 1412.0519,1300.4925 L 1410.9372,1299.8819 L 1411.0594,1297.2988 L 1402.0297,1295.6676 L 1398.7365,1298.2867 L 1395.4499,1298.1883 L 1396.8854,1295.5455 C 1397.5069,1294.3272 1398.0155,1292.973 1398.0155,1292.5363 C 1398.0155,1292.0995 1397.3852,1290.8133 1396.6147,1289.678 C 1395.8443,1288.5428 1395.3977,1287.622 1395.6222,1287.632 C 1395.8468,1287.6419 1396.44,1287.9619 1396.9405,1288.343 C 1397.4409,1288.7243 1398.0416,1289.6385 1398.2753,1290.3747 L 1398.7001,1291.7132 L 1402.4822,1291.0994 L 1403.2459,1292.1778 L 1406.9719,1293.3495 L 1408.9667,1295.5537 L 1411.3696,1295.5537 L 1420.2876,1286.5831 L 1416.062,1276.1461 L 1416.5381,1275.717 C 1416.8,1275.481 1418.2738,1274.564 1419.8131,1273.6793 L 1422.6119,1272.0706 L 1422.137,1273.1785 C 1421.8758,1273.7878 1421.541,1275.1531 1421.3932,1276.2124 L 1421.1243,1278.1383 L 1422.4256,1283.9531 L 1423.6898,1284.7468 C 1424.3852,1285.1833 1425.7006,1285.6945 1426.613,1285.8828 L 1428.2721,1286.2253 L 1428.812,1287.9121 C 1429.1089,1288.8398 1429.8743,1290.1731 1430.5128,1290.8749 L 1431.6738,1292.151 L 1434.1534,1292.151 C 1435.6425,1291.1834 1437.0487,1290.0525 1438.6696,1289.3153 C 1438.8553,1289.3153 1439.3374,1289.7619 1439.7409,1290.3078 L 1440.4745,1291.3003 L 1444.3894,1287.0468 L 1446.1,1287.0468 L 1446.745,1288.7275 L 1460.6832,1288.4094 L 1464.086,1286.748 L 1464.086,1284.4947 L 1468.0559,1283.0952 L 1471.7729,1283.776 L 1474.4966,1286.5346 L 1474.0776,1289.3153 L 1476.3854,1289.3153 L 1476.9735,1291.5642 L 1480.3869,1293.267 L 1481.9565,1293.7537 L 1486.5121,1294.5233 L 1488.2104,1297.8074 L 1486.6423,1301.5603 L 1483.6519,1303.5197 L 1483.6519,1306.9319 L 1484.5026,1307.2584 C 1484.9705,1307.4379 1485.3533,1307.8323 1485.3533,1308.1349 C 1485.3533,1308.4374 1486.1304,1309.462 1487.0801,1310.4118 L 1488.8069,1312.1386 L 1488.4872,1312.4583 C 1488.3114,1312.6342 1486.1353,1312.8123 1483.6514,1312.8541 L 1479.1352,1312.93 C 1473.5614,1315.6365 1468.0468,1318.4693 1462.4246,1321.0745 z "},"tx29":{"name":"TX-29","path":"M 1424.7073,1317.4494 L 1424.387,1319.212 L 1423.2527,1317.4982 C 1422.6289,1316.5556 1421.7027,1315.5281 1421.1946,1315.2147 L 1420.2708,1314.645 L 1411.6436,1318.742 L 1410.8732,1317.9717 C 1410.4495,1317.5479 1409.7748,1316.4094 1409.3739,1315.4415 L 1408.645,1313.6818 L 1406.2388,1313.9854 L 1405.6717,1312.8512 L 1409.6416,1312.284 L 1411.183,1309.1648 C 1412.0308,1307.4493 1412.7326,1305.599 1412.7426,1305.0531 L 1412.7608,1304.0607 L 1410.4,1301.6999 L 1408.2878,1303.6114 L 1407.9402,1306.6127 L 1404.0892,1306.9805 L 1403.137,1305.4785 L 1403.1196,1301.2034 L 1405.9639,1301.9173 L 1410.1189,1299.9456 L 1413.0444,1301.7146 L 1413.9141,1306.3188 L 1418.3709,1307.0315 L 1418.7157,1309.4484 L 1423.4929,1309.7951 L 1425.6654,1308.6324 L 1426.3914,1313.1728 L 1425.7095,1314.4298 C 1425.3345,1315.1212 1424.8835,1316.48 1424.7073,1317.4494 z "},"la2":{"name":"LA-2","path":"M 1688.9544,1289.2215 L 1689.5926,1286.6791 L 1687.1102,1284.9426 L 1685.6571,1286.7926 L 1682.4098,1285.2831 L 1679.7404,1281.3875 L 1679.5437,1276.6623 L 1679.9506,1277.6892 C 1680.3042,1278.6249 1680.9826,1279.8372 1681.4582,1280.383 L 1682.3228,1281.3755 L 1683.8105,1281.3755 L 1685.7151,1279.4709 C 1686.7627,1278.4234 1687.8801,1277.4664 1688.1984,1277.3442 L 1688.777,1277.1221 L 1689.5412,1274.0028 L 1687.2511,1274.0028 L 1687.2511,1265.0001 L 1689.3778,1265.3267 C 1690.5475,1265.5064 1691.7913,1265.8775 1692.1417,1266.1516 L 1692.779,1266.65 L 1698.4476,1262.8353 L 1701.9964,1263.3561 L 1701.9964,1264.8074 L 1703.6255,1265.4325 L 1706.3604,1263.2812 L 1708.1255,1264.4055 L 1709.2713,1263.1697 L 1712.7816,1264.0792 L 1709.9363,1267.1478 L 1709.9363,1268.8222 L 1707.5716,1269.5728 L 1708.3151,1272.585 L 1706.8738,1271.1672 L 1703.078,1271.1672 L 1701.1458,1274.5628 L 1698.0935,1274.57 L 1697.3314,1275.803 L 1694.9664,1275.1846 L 1693.4895,1276.4103 L 1693.4895,1277.7387 L 1693.4895,1279.0671 L 1694.5865,1279.6542 C 1695.1898,1279.9771 1696.3293,1280.2413 1697.1186,1280.2413 L 1698.5538,1280.2413 L 1699.7679,1282.5098 L 1699.2502,1282.5098 C 1698.9655,1282.5098 1698.4041,1282.114 1698.0027,1281.6304 L 1697.2729,1280.7511 L 1694.4662,1281.092 L 1693.4212,1283.0485 C 1692.8465,1284.1246 1692.0082,1285.211 1691.5583,1285.4628 L 1690.7404,1285.9205 L 1691.2318,1289.8824 L 1688.9544,1289.2215 z "},"fl3":{"name":"FL-3","path":"M 2132.4294,1178.2276 L 2128.7962,1178.653 L 2128.8671,1180.1062 L 2126.1733,1181.1342 L 2128.8671,1186.2915 L 2128.495,1192.0336 L 2134.0954,1197.6872 L 2133.9536,1200.452 L 2135.0347,1201.3913 L 2135.1055,1205.9815 L 2136.7715,1209.6324 L 2136.9842,1210.4122 L 2131.8446,1214.6302 L 2132.5889,1219.6457 L 2128.9026,1223.4384 L 2126.2796,1224.0942 L 2125.9252,1227.1425 L 2122.6642,1228.0109 L 2120.4843,1230.3326 L 2116.3726,1232.0694 L 2115.1497,1231.6263 L 2110.8785,1233.7708 L 2108.7873,1232.6542 L 2105.863,1235.7203 L 2108.9467,1239.8497 L 2111.9419,1238.2901 L 2112.7217,1241.9587 L 2115.4156,1245.5564 L 2114.6889,1249.2073 L 2121.016,1247.8072 L 2122.7705,1251.1746 L 2133.5814,1249.0478 L 2133.5814,1254.152 L 2134.7156,1254.152 L 2134.7156,1256.4205 L 2137.5513,1256.4205 L 2137.5513,1259.2561 L 2142.6554,1259.2561 L 2143.2403,1261.3297 L 2144.4455,1261.7196 L 2145.1898,1259.0612 L 2149.461,1260.5322 L 2149.461,1261.6132 C 2149.461,1262.2116 2149.9427,1263.6461 2150.5421,1264.8033 C 2151.1416,1265.9606 2152.928,1268.5058 2154.512,1270.4569 C 2156.0961,1272.408 2157.4008,1274.2582 2157.4008,1274.5686 C 2157.06,1275.0385 2156.9436,1275.2162 2156.2665,1275.1357 L 2156.2665,1276.8371 L 2154.1221,1278.1663 L 2155.2564,1281.445 L 2158.0211,1286.5847 L 2161.3707,1289.0481 L 2164.0646,1290.0583 L 2165.3229,1295.8182 L 2167.0065,1295.446 L 2165.571,1288.8 L 2161.9733,1288.1443 L 2158.9073,1286.2302 L 2156.5324,1281.1969 L 2164.7735,1279.6019 L 2164.7735,1278.1841 C 2164.7735,1277.4058 2165.0605,1276.2069 2165.4115,1275.5256 C 2165.7624,1274.8443 2166.5608,1273.7289 2167.1838,1273.0445 L 2168.318,1271.8039 L 2167.5028,1265.2287 L 2164.3481,1261.2411 L 2163.5683,1256.6154 L 2158.6414,1254.2229 L 2154.3348,1246.354 L 2146.4481,1245.7868 L 2145.4202,1244.4399 C 2144.851,1243.6997 2143.9512,1241.8169 2143.4353,1240.2573 C 2142.9192,1238.6977 2142.2555,1237.1027 2141.9465,1236.7128 L 2141.3794,1236.0039 L 2138.2425,1236.0039 L 2137.6222,1233.5936 L 2139.4122,1230.8465 L 2143.3644,1229.1983 L 2148.3267,1229.1983 L 2147.033,1222.1092 L 2146.0405,1221.418 C 2145.4939,1221.0347 2144.1364,1219.3225 2143.0099,1217.6253 L 2140.9541,1214.5416 L 2140.9541,1210.6957 L 2137.2855,1208.693 L 2135.5486,1205.6093 L 2135.4778,1197.4746 L 2129.5229,1191.3779 L 2130.09,1186.5041 L 2132.0572,1186.4332 L 2135.4778,1186.575 L 2134.9638,1179.61 L 2132.6421,1180.1062 L 2132.4294,1178.2276 z "},"la4":{"name":"LA-4","path":"M 1533.0807,1102.4627 L 1466.0709,1106.8757 L 1469.7927,1168.8346 L 1475.466,1174.9484 L 1477.3071,1175.3211 L 1479.682,1180.1417 L 1482.5708,1182.871 L 1481.9328,1184.5546 L 1483.581,1187.0713 L 1483.3683,1188.1524 C 1483.2575,1188.7416 1483.124,1189.3433 1483.0671,1189.4993 C 1483.0101,1189.6553 1483.0061,1190.5133 1483.0671,1191.4134 L 1483.1911,1193.0616 L 1481.986,1193.8059 L 1484.2013,1197.4391 L 1486.9129,1197.4391 L 1488.3307,1199.1405 L 1487.7281,1201.4267 L 1488.7738,1202.1534 C 1489.3479,1202.5554 1489.8976,1203.2324 1489.9967,1203.6598 C 1490.0958,1204.0871 1490.6551,1204.9304 1491.2372,1205.5384 L 1492.2829,1206.655 L 1491.6803,1211.2097 L 1492.4424,1211.9895 C 1492.8645,1212.4115 1493.5955,1212.7516 1494.0552,1212.7516 L 1494.8881,1212.7516 L 1495.5085,1214.5416 C 1495.8508,1215.5239 1496.1287,1216.9275 1496.1287,1217.6608 L 1496.1287,1218.99 L 1496.6604,1218.99 C 1496.9539,1218.99 1497.3538,1218.7348 1497.5466,1218.4229 L 1497.901,1217.8557 L 1500.0986,1217.8557 L 1500.0986,1220.6914 L 1499.5209,1220.7379 L 1499.6267,1224.1442 L 1501.3372,1228.8368 L 1498.7163,1230.8997 L 1501.2329,1232.672 L 1501.2152,1233.629 C 1501.2053,1234.1571 1500.8543,1235.0441 1500.4354,1235.5962 L 1499.6733,1236.5887 L 1500.2404,1241.7106 L 1498.5213,1243.6601 L 1497.2098,1250.0225 L 1494.4273,1252.4506 L 1494.4273,1256.2964 L 1492.1588,1256.8813 L 1492.1588,1259.8233 L 1493.2931,1259.8233 L 1493.2931,1261.2233 C 1493.2931,1261.9885 1493.6067,1263.2835 1493.9843,1264.1122 L 1494.6578,1265.6186 L 1492.4424,1267.3377 L 1504.9192,1266.6288 L 1504.5293,1261.2304 L 1510.5905,1261.2411 L 1510.945,1266.2035 C 1515.2125,1265.5462 1519.0465,1265.4092 1522.6952,1265.4946 L 1524.3966,1263.7932 L 1527.2322,1263.7932 L 1527.6044,1262.7298 L 1542.6333,1261.436 L 1542.6333,1258.6536 L 1544.5013,1258.0687 C 1543.3158,1256.8171 1544.033,1255.6925 1544.6567,1254.5616 L 1542.6105,1254.3535 L 1543.6612,1251.5999 L 1544.441,1245.645 L 1541.8712,1245.645 L 1538.9115,1249.1896 C 1535.9925,1247.8048 1534.405,1245.5586 1533.5947,1242.8094 L 1530.6613,1242.2969 L 1530.1565,1234.8696 L 1538.2558,1234.8696 L 1536.3594,1214.7365 L 1535.3469,1210.2702 L 1533.3138,1209.617 L 1533.3549,1207.9439 C 1531.6118,1207.4117 1529.8687,1207.4807 1528.1256,1207.5486 C 1529.9474,1204.7943 1530.4901,1205.4123 1531.42,1205.0094 L 1530.7642,1203.308 L 1531.9598,1203.2751 C 1534.3506,1201.3191 1537.6638,1197.5182 1538.8686,1197.3411 L 1539.4855,1195.229 L 1541.3775,1195.7811 L 1541.8633,1198.7735 L 1542.6612,1198.957 L 1542.651,1201.7989 L 1546.6032,1201.9407 L 1567.6528,1195.0113 L 1567.5869,1194.4794 L 1564.9433,1194.783 L 1564.4405,1192.1341 L 1562.8385,1192.1044 L 1562.0981,1188.9219 C 1558.4182,1188.0567 1558.5418,1187.3921 1558.123,1186.6105 L 1559.3104,1182.2861 L 1557.7331,1181.4709 L 1559.4877,1177.7668 L 1557.3609,1176.4376 L 1544.9727,1177.182 L 1545.6285,1182.6938 L 1526.1334,1184.4306 L 1526.9841,1175.2502 L 1529.3058,1174.754 C 1529.902,1167.7448 1529.2298,1159.944 1526.86,1158.6439 L 1526.1866,1156.0387 L 1532.425,1156.0387 C 1532.6921,1153.6226 1533.0591,1151.5996 1534.339,1150.775 C 1533.9815,1145.696 1533.6479,1139.7282 1532.8681,1137.3235 L 1527.9588,1137.3235 L 1527.2854,1132.5029 L 1527.693,1122.8617 C 1528.6887,1121.4007 1529.3482,1119.8666 1529.0222,1118.112 L 1534.0555,1117.3499 L 1533.4529,1103.5793 L 1533.0807,1102.4627 z "},"fl2":{"name":"FL-2","path":"M 2064.9949,1266.3466 L 2064.9588,1263.9703 L 2063.8246,1262.9438 C 2063.2007,1262.3793 2062.6903,1261.6136 2062.6903,1261.2424 C 2062.6903,1260.8713 2062.2236,1260.1452 2061.6532,1259.629 L 2060.616,1258.6904 L 2056.9834,1258.6904 L 2056.3305,1256.989 L 2055.7311,1256.989 C 2055.4014,1256.989 2054.1748,1256.5668 2053.0053,1256.0508 L 2050.8791,1255.1128 L 2050.2947,1252.7899 C 2049.9733,1251.5123 2049.5478,1249.7028 2049.3492,1248.7688 C 2049.1506,1247.8348 2048.7221,1246.7502 2048.3971,1246.3585 L 2047.8061,1245.6464 L 2044.5422,1245.6464 L 2044.5422,1244.5655 L 2040.6986,1243.5042 L 2039.5572,1242.3628 C 2038.9294,1241.735 2038.2465,1240.6881 2038.0396,1240.0363 L 2037.6635,1238.8512 L 2032.3069,1233.4531 L 2028.358,1231.9753 C 2026.1861,1231.1625 2023.2607,1230.1819 2021.857,1229.7962 C 2020.4534,1229.4104 2017.6544,1228.2252 2015.6372,1227.1623 L 2011.9694,1225.2298 L 2008.8131,1225.2298 L 2008.8131,1226.364 L 2007.805,1226.364 C 2007.2506,1226.364 2006.2842,1226.7231 2005.6576,1227.162 L 2004.5183,1227.96 L 2000.0226,1227.8596 L 1999.2987,1226.7859 L 1998.0376,1227.5652 L 1998.0376,1230.4104 L 1995.8119,1229.704 L 1993.3662,1231.0128 L 1993.9717,1235.5263 L 1995.707,1236.8559 L 1996.4358,1239.8819 L 1994.3513,1240.9736 L 1992.5012,1240.6925 C 1991.4836,1240.5379 1990.5148,1240.1909 1990.3482,1239.9214 L 1990.0453,1239.4312 L 1989.079,1239.9009 C 1988.5476,1240.1593 1987.4269,1240.7283 1986.5885,1241.1654 C 1985.7502,1241.6024 1983.6238,1243.2361 1981.8633,1244.7957 C 1980.1028,1246.3553 1977.8941,1248.3372 1976.955,1249.1999 C 1976.0159,1250.0625 1974.0589,1251.5655 1972.6061,1252.5397 C 1971.1533,1253.5141 1969.6457,1254.7073 1969.2558,1255.1914 L 1968.5469,1256.0715 L 1968.5469,1255.3587 C 1968.5469,1254.9667 1968.7975,1254.1778 1969.1037,1253.6056 L 1969.6604,1252.5653 L 1967.836,1251.8653 L 1967.0573,1252.5116 C 1966.6289,1252.8671 1966.2784,1253.4527 1966.2784,1253.813 L 1966.2784,1254.4679 L 1962.759,1257.5561 L 1958.2388,1257.5561 L 1949.2096,1261.526 L 1946.996,1261.526 L 1946.9822,1259.6828 C 1946.9746,1258.6691 1946.7302,1256.8093 1946.4393,1255.55 L 1945.9103,1253.2603 L 1943.5995,1250.7573 C 1942.3285,1249.3806 1940.5949,1247.7967 1939.7471,1247.2376 L 1938.2056,1246.221 L 1934.2154,1246.2135 L 1932.1129,1244.7849 C 1930.9566,1243.9991 1929.7634,1242.8945 1929.4614,1242.3303 L 1928.9124,1241.3043 L 1922.8931,1239.9571 L 1921.1917,1238.8018 C 1920.2559,1238.1664 1917.8315,1236.8 1915.804,1235.7653 C 1913.7765,1234.7306 1910.5226,1233.3063 1908.5731,1232.6001 L 1905.0285,1231.3162 L 1904.206,1224.638 L 1905.6943,1222.6556 L 1909.6248,1222.0902 L 1911.1806,1220.1624 L 1930.2778,1217.4136 L 1929.3386,1209.3502 L 1932.3308,1208.9803 L 1930.3439,1195.1006 L 1927.7391,1195.7543 L 1927.0251,1192.9095 L 1920.9081,1194.0021 C 1920.8174,1191.2373 1921.9447,1188.8047 1923.657,1186.5317 L 1923.125,1185.1453 L 1924.8847,1183.6849 L 1949.8317,1179.5097 L 1949.8317,1180.9937 L 1951.5611,1180.9937 C 1956.943,1189.5851 1956.3819,1193.4765 1960.7149,1195.9307 L 2027.1456,1188.65 L 2027.9398,1191.5541 C 2026.4865,1193.6317 2024.562,1195.0812 2022.4913,1196.3357 L 2021.7806,1198.5747 L 2018.8109,1198.5747 L 2016.4693,1196.3971 L 2013.3858,1196.9987 C 2014.0073,1198.1478 2014.5944,1199.3114 2015.0515,1200.5315 L 2007.1426,1201.5537 L 2006.4464,1203.7475 L 2003.2949,1203.0553 L 2002.603,1206.5145 L 1995.5643,1207.0584 L 1994.9329,1205.1574 L 2003.1631,1210.6021 L 2005.9018,1209.9147 L 2006.596,1207.7276 L 2013.9558,1206.4559 L 2015.1119,1209.7723 L 2019.7851,1211.8796 L 2020.21,1210.6048 L 2022.2409,1211.1359 L 2038.3038,1208.1943 L 2038.3038,1211.1745 L 2050.8847,1208.7476 L 2052.2124,1201.657 C 2053.356,1200.6316 2054.0238,1199.015 2054.1834,1198.0475 L 2056.6672,1196.7182 L 2062.4067,1196.4733 L 2070.9137,1199.9444 L 2073.3435,1199.8702 L 2077.5381,1221.3419 L 2079.137,1220.7284 C 2078.9434,1222.5286 2076.2579,1224.9039 2074.0329,1227.1729 L 2074.0775,1231.3782 L 2071.8499,1232.0846 L 2072.1712,1246.0415 L 2073.9744,1247.108 L 2072.2015,1250.2772 L 2072.8429,1254.4369 L 2071.1972,1256.6387 C 2070.6709,1262.3404 2070.2062,1261.1996 2064.9949,1266.3466 z "},"ms4":{"name":"MS-4","path":"M 1760.4107,1128.7988 L 1726.6665,1133.1231 L 1726.3298,1139.0071 L 1722.6966,1139.9641 L 1722.8916,1144.5366 L 1721.5801,1144.5898 L 1722.9448,1148.0989 L 1724.912,1148.0989 L 1727.216,1145.1569 L 1730.3883,1145.9544 L 1731.434,1147.9394 L 1730.7428,1151.7675 L 1728.5452,1152.3346 L 1728.3679,1154.6209 C 1726.3602,1154.3118 1724.5289,1153.9439 1722.8739,1152.5473 L 1720.6045,1154.5219 L 1717.5925,1155.5247 L 1717.9824,1160.4517 L 1716.6709,1162.8797 L 1717.4153,1165.1837 L 1720.8526,1164.8275 L 1721.4029,1167.3813 L 1720.6763,1170.2524 L 1717.8584,1171.5461 L 1714.4434,1168.5259 L 1716.1328,1183.8034 L 1703.1307,1185.1395 L 1703.1307,1188.9322 L 1699.7457,1188.9322 L 1696.3075,1195.7377 L 1694.2157,1195.385 L 1693.0595,1197.0847 L 1694.6238,1197.5277 L 1694.6532,1203.6157 L 1693.4031,1203.5591 L 1691.1328,1208.2482 L 1695.758,1208.2146 C 1695.6003,1209.7666 1695.7952,1210.6721 1696.3429,1211.9009 L 1701.837,1211.5287 L 1702.5104,1214.1162 L 1702.0142,1214.7011 C 1701.7429,1215.0292 1701.5289,1215.9417 1701.5357,1216.7215 C 1701.5425,1217.5013 1701.1842,1219.543 1700.7382,1221.2585 C 1700.2921,1222.9741 1699.6709,1224.8881 1699.3558,1225.512 L 1698.7887,1226.6462 L 1698.576,1233.31 L 1699.0722,1233.948 C 1699.3475,1234.2996 1699.7313,1235.2525 1699.9229,1236.057 L 1700.2596,1237.5103 L 1704.0168,1242.26 L 1708.1817,1245.0779 L 1708.9615,1249.1896 L 1712.3289,1253.0177 L 1711.6376,1254.8254 L 1712.6124,1256.899 C 1713.1529,1258.0403 1713.9325,1259.3554 1714.3315,1259.8233 L 1715.0582,1260.674 L 1721.7574,1260.7271 L 1722.5017,1256.7395 L 1725.0184,1254.4887 C 1726.3953,1253.2513 1727.5172,1252.0407 1727.5172,1251.7948 C 1727.5172,1251.549 1726.8569,1251.0145 1726.0463,1250.5897 L 1724.5753,1249.8099 L 1726.4716,1247.9136 L 1728.4743,1247.9136 L 1730.3883,1250.0225 L 1729.6617,1251.8835 L 1730.3352,1251.8835 C 1730.7063,1251.8835 1733.4542,1250.6104 1736.4318,1249.0478 L 1741.8372,1246.1944 L 1748.0402,1244.4045 L 1751.8329,1244.8475 L 1752.3646,1242.8094 L 1753.4102,1243.1993 C 1753.985,1243.4118 1754.5835,1243.7223 1754.7394,1243.9082 C 1754.8954,1244.0941 1755.7181,1244.6987 1756.5649,1245.2374 L 1758.1067,1246.2122 L 1760.8361,1246.2122 L 1762.3071,1244.4576 L 1770.3355,1245.1665 L 1770.8671,1245.6982 C 1771.1635,1245.9844 1771.8892,1246.2122 1772.4799,1246.2122 L 1773.561,1246.2122 L 1774.1459,1243.9437 L 1775.2269,1243.9437 C 1775.8144,1243.9437 1776.2903,1243.7792 1776.2903,1243.5715 C 1771.3651,1211.9742 1765.6714,1180.4918 1760.4107,1148.9496 L 1760.4107,1128.7988 z "},"fl4":{"name":"FL-4","path":"M 2112.9344,1161.9936 L 2112.2432,1164.8292 L 2109.7443,1164.7406 L 2110.3312,1167.186 L 2109.3366,1167.3635 L 2109.9038,1172.769 L 2112.8281,1176.6857 L 2113.5724,1190.6867 L 2105.3667,1192.4058 L 2103.4121,1189.57 L 2103.0501,1185.0299 L 2100.3867,1181.9494 L 2100.8222,1180.0733 L 2027.5955,1188.6209 L 2028.4394,1191.9816 C 2026.6423,1193.8788 2024.8452,1195.4995 2023.0481,1196.4455 L 2021.9579,1199.0373 L 2018.8087,1199.1405 L 2016.363,1196.8365 L 2014.2088,1197.5297 L 2015.9631,1200.9936 L 2007.6928,1201.8698 L 2006.5129,1204.3864 L 2003.8153,1203.6421 L 2003.0709,1207.0094 L 1998.8883,1207.3639 L 2003.1241,1210.0045 L 2005.3826,1209.4789 L 2006.2079,1207.1689 L 2014.3426,1205.8751 L 2015.53,1209.2779 L 2019.3679,1211.2077 L 2019.7069,1209.7407 L 2022.176,1210.4831 L 2038.6051,1207.6474 L 2038.8709,1210.3413 L 2050.4793,1208.1082 L 2051.844,1201.5685 L 2053.439,1199.3549 C 2053.3104,1198.0602 2054.3956,1196.87 2056.4668,1196.2025 L 2062.6372,1195.8086 L 2070.6301,1199.1051 L 2073.8025,1199.0519 L 2077.737,1220.4078 L 2079.7042,1220.0711 L 2079.7042,1221.5635 L 2078.5522,1223.4913 L 2082.388,1228.3178 L 2086.7933,1228.6134 L 2089.2745,1225.9905 L 2089.6821,1222.9776 L 2092.1279,1220.6914 L 2098.3663,1220.6914 L 2101.2551,1219.3799 L 2101.2551,1217.8557 L 2103.3463,1217.8557 C 2104.8279,1215.7827 2105.1508,1214.2444 2104.8625,1212.9882 L 2106.6322,1212.9883 C 2108.1984,1210.7835 2109.1023,1209.0645 2108.6277,1208.3563 L 2110.2582,1206.9917 L 2110.6127,1204.5637 L 2114.9231,1203.8959 L 2113.4206,1196.1096 L 2124.6137,1179.3087 L 2125.9247,1180.8501 L 2128.5831,1179.8222 L 2128.5832,1178.4044 L 2132.6425,1177.9791 L 2132.8907,1179.7867 L 2135.0348,1179.2549 L 2135.9393,1186.7525 L 2130.3741,1186.7882 L 2130.02,1191.0938 L 2135.9748,1197.2615 L 2135.8683,1200.9656 L 2138.1716,1199.7431 L 2143.6479,1200.7887 L 2147.7596,1199.6544 L 2146.0071,1190.9918 L 2148.3267,1190.3146 C 2148.3267,1190.1392 2147.9593,1188.7993 2147.5115,1187.3371 C 2147.0636,1185.8749 2146.1431,1182.8285 2145.4734,1180.567 L 2144.2682,1176.4553 L 2142.3719,1176.4553 L 2142.2655,1174.8957 C 2142.2031,1174.038 2141.8363,1171.2544 2141.4681,1168.7105 L 2140.8123,1164.0849 L 2137.2677,1163.5532 L 2135.2119,1164.6165 L 2123.0718,1163.8722 C 2122.5138,1162.8351 2119.796,1162.77 2116.5321,1162.9506 C 2115.9622,1162.282 2114.7322,1161.98 2112.9344,1161.9936 z "},"nm2":{"name":"NM-2","path":"M 728.30737,954.70803 L 727.59846,956.9411 L 728.20104,959.08552 C 728.52884,960.26589 728.80191,962.04962 728.80361,963.05542 L 728.80361,964.8809 L 725.54262,966.56453 L 723.41589,964.95179 L 718.63074,964.91634 L 713.47344,966.67087 L 713.33421,962.11762 L 711.27582,960.29067 L 710.56691,960.71602 C 710.17655,960.95727 709.25117,961.2219 708.51106,961.3009 L 707.16413,961.44268 L 705.26777,958.1108 L 702.14856,958.1108 C 694.69638,1038.0385 686.78487,1117.9327 679.1444,1197.8467 L 722.31707,1201.409 L 724.92235,1173.9033 L 812.45509,1180.4429 L 811.32084,1179.929 C 810.69699,1179.6491 809.64764,1178.6952 808.99918,1177.8023 C 808.35061,1176.9092 807.66535,1175.5663 807.47502,1174.8249 L 807.13826,1173.4779 L 809.17641,1172.0955 L 809.38908,1166.8673 C 872.15826,1170.8323 901.51284,1172.632 995.17691,1176.2427 L 999.04041,1079.6358 L 976.07171,1078.732 L 976.07171,1073.2379 L 965.26081,1072.5113 L 966.02291,1062.4625 L 959.44776,1062.4625 L 960.12123,1046.0157 L 954.50314,1046.0157 L 956.34631,1013.1223 L 946.61648,1013.1223 L 948.93819,974.75245 L 890.66571,971.89912 L 888.53898,1009.4359 L 887.2275,1010.3221 L 886.30591,1031.4831 L 829.39806,1027.7967 L 830.16017,1016.5251 L 828.93727,1016.5251 C 828.26148,1016.5251 827.46132,1016.3045 827.16499,1016.0288 C 826.86867,1015.7531 823.75757,1014.3235 820.25311,1012.8564 L 813.89067,1010.1803 L 814.52869,998.09337 C 815.36469,994.77595 817.77346,994.15472 820.18222,992.63476 L 829.02591,993.41456 L 829.80571,989.30288 L 832.53502,989.30288 L 835.42381,985.5102 L 835.42381,983.31258 L 832.3046,981.52255 L 830.99311,981.98334 L 824.06354,980.19337 L 821.72413,981.45166 L 820.57212,984.76585 L 818.21502,984.76585 L 816.42499,983.15305 L 806.91544,981.59452 L 806.78381,966.35186 L 794.0943,965.37714 L 792.67648,959.81218 L 773.55511,958.33362 L 773.03965,955.27516 L 768.33293,955.10332 L 768.21905,957.82723 C 754.55551,956.94178 736.55501,954.63929 728.30737,954.70803 z "},"ms2":{"name":"MS-2","path":"M 1623.4643,1181.8634 L 1622.4608,1180.3123 L 1619.3643,1180.9316 L 1616.9271,1180.2943 L 1616.9271,1178.7252 L 1615.3487,1178.7252 L 1614.6173,1175.8109 L 1613.7251,1174.1936 L 1611.157,1172.4284 L 1612.1473,1168.2411 L 1614.0875,1167.8674 L 1613.4728,1169.4695 L 1615.2113,1170.9123 L 1617.0654,1170.2008 L 1616.421,1166.9789 L 1620.2778,1163.2408 L 1619.0906,1161.0225 L 1619.7352,1160.3744 C 1620.0898,1160.018 1621.181,1159.4542 1622.1602,1159.1215 L 1623.9404,1158.5165 L 1625.0475,1156.7614 L 1624.3354,1154.9058 L 1623.0416,1154.8971 C 1622.33,1154.8924 1621.3649,1154.6335 1620.897,1154.322 L 1620.0464,1153.7555 L 1624.918,1154.4918 L 1624.5874,1153.488 L 1626.145,1151.4495 L 1627.7026,1149.411 L 1627.7026,1147.1481 L 1624.7819,1145.8174 L 1623.6865,1146.4943 L 1624.3316,1148.5268 L 1623.0397,1148.8729 C 1622.3291,1149.0633 1621.1735,1149.2225 1620.4717,1149.2268 L 1619.1957,1149.2345 L 1619.1957,1145.7961 L 1620.1881,1145.489 C 1620.734,1145.32 1621.6238,1144.9453 1622.1654,1144.6561 C 1622.707,1144.367 1623.5152,1144.1304 1623.9613,1144.1304 L 1624.7724,1144.1304 L 1625.2923,1142.7126 L 1626.0437,1143.4215 C 1626.4571,1143.8114 1627.071,1144.1304 1627.4081,1144.1304 L 1628.021,1144.1304 L 1629.2703,1140.8208 L 1628.0429,1139.5933 L 1630.3624,1139.5933 L 1632.339,1137.4092 L 1631.9459,1135.3399 L 1626.954,1134.7727 L 1626.676,1132.8374 L 1628.2697,1131.5147 L 1628.2697,1129.3494 L 1626.496,1128.6688 L 1623.6777,1129.9529 L 1620.3299,1128.2216 L 1620.3299,1126.9129 C 1620.3299,1126.1931 1620.4914,1125.4427 1620.6888,1125.2453 L 1621.0476,1124.8864 L 1623.2479,1127.6836 L 1626.5683,1127.6836 L 1626.5683,1125.3572 L 1621.9751,1123.0207 L 1625.4341,1119.8311 L 1625.4341,1118.1813 L 1623.7471,1116.7813 L 1622.0313,1117.4397 L 1622.0313,1119.1476 L 1618.5289,1120.9587 L 1617.0423,1118.9256 L 1618.0853,1117.5997 C 1618.659,1116.8704 1619.7815,1115.7599 1620.5798,1115.1319 L 1622.0313,1113.9902 L 1622.0313,1112.3431 L 1620.5766,1111.79 C 1619.7765,1111.4858 1618.4298,1111.2369 1617.584,1111.2369 L 1616.0462,1111.2369 L 1616.1063,1106.7293 L 1620.7242,1102.4909 L 1618.2527,1096.208 L 1615.5093,1096.208 L 1615.5093,1101.2957 L 1613.4039,1101.7021 L 1612.2621,1100.5603 L 1613.5841,1098.1006 C 1614.3113,1096.7477 1615.2538,1095.2153 1615.6787,1094.6952 L 1616.4512,1093.7494 L 1616.0765,1091.1895 L 1612.7519,1089.3535 L 1612.2444,1087.8311 L 1616.2485,1088.5822 L 1618.1113,1086.7195 L 1617.3983,1081.9648 L 1619.1957,1080.4731 L 1619.1957,1077.2092 L 1616.4365,1077.2092 L 1615.6836,1079.5812 L 1614.8876,1078.0468 C 1614.4497,1077.2029 1614.0915,1076.0041 1614.0915,1075.3828 L 1614.0915,1074.2532 L 1617.4943,1069.9569 L 1617.4943,1066.922 L 1614.9422,1067.2844 L 1614.5982,1069.6956 L 1612.089,1072.0528 L 1610.5236,1071.0853 L 1614.0915,1069.2402 L 1614.0915,1066.2752 L 1613.099,1065.5218 C 1612.5532,1065.1075 1611.8037,1064.7603 1611.4336,1064.7504 L 1610.7606,1064.7324 L 1610.4052,1068.4094 L 1608.1366,1068.8341 L 1610.1216,1066.628 L 1610.1216,1063.638 L 1608.9873,1063.031 C 1608.3635,1062.6971 1607.8531,1062.2186 1607.8531,1061.9675 L 1607.8531,1061.5111 L 1610.15,1060.7531 C 1611.4133,1060.3361 1612.5858,1059.7704 1612.7555,1059.4958 L 1613.064,1058.9966 L 1612.4057,1056.3734 L 1607.0024,1054.1525 L 1609.5866,1052.7655 L 1612.5431,1055.0912 L 1615.5761,1055.0912 L 1617.6333,1053.5869 L 1616.8691,1051.1793 L 1614.7014,1050.4913 L 1612.5639,1051.6353 L 1611.2559,1050.3273 L 1611.2559,1047.9396 L 1614.2333,1048.0541 C 1615.8709,1048.1171 1617.6573,1048.0502 1618.2032,1047.9054 L 1619.1957,1047.642 L 1619.1957,1045.6547 L 1615.5948,1044.0322 L 1614.4106,1042.0943 L 1617.0001,1038.5916 L 1616.6436,1036.7599 L 1612.8364,1035.4788 L 1615.8311,1034.1143 L 1616.4814,1035.8088 L 1619.1957,1035.8088 L 1619.1957,1033.6072 L 1618.6285,1033.2567 C 1618.3166,1033.0639 1618.062,1032.7298 1618.0627,1032.5143 L 1618.064,1032.1225 L 1621.5317,1031.9983 L 1622.036,1031.4932 C 1622.3134,1031.2154 1622.7137,1029.9036 1622.9254,1028.5779 L 1623.3105,1026.1676 L 1619.9896,1026.1676 L 1618.644,1024.822 L 1620.4142,1022.866 L 1623.711,1024.7498 L 1625.7176,1023.5011 L 1626.0765,1020.4963 L 1620.5568,1020.4963 L 1619.8762,1019.8158 C 1619.5019,1019.4415 1619.1957,1018.8034 1619.1957,1018.3979 L 1619.1957,1017.6607 L 1621.4642,1019.9292 L 1623.6113,1019.9292 L 1623.9556,1019.0321 C 1624.1449,1018.5387 1624.2998,1017.5179 1624.2998,1016.7636 L 1624.2998,1015.3922 L 1627.1093,1015.3922 L 1628.9673,1012.5565 L 1627.1093,1009.7209 L 1629.8922,1009.7209 L 1630.2547,1012.273 L 1633.0903,1012.273 L 1632.7996,1008.303 L 1636.2161,1006.0345 L 1636.8707,1003.9941 L 1635.973,1002.6239 C 1635.4792,1001.8704 1635.0753,1000.9016 1635.0753,1000.4711 L 1635.0753,999.68836 L 1636.2095,998.66186 C 1636.8334,998.09729 1637.3438,997.3117 1637.3438,996.91607 C 1637.3438,996.5205 1636.7413,995.47539 1636.005,994.59368 L 1634.6663,992.99057 L 1634.1301,989.25427 L 1635.0506,989.28632 L 1635.0753,992.13988 L 1637.8286,992.13988 L 1640.2298,989.08714 L 1639.8959,986.75216 L 1635.3588,986.75216 L 1635.4155,986.04325 C 1635.4467,985.65335 1635.5105,984.39858 1635.5573,983.25485 L 1635.6424,981.17541 L 1636.4386,981.97166 L 1636.174,985.90147 L 1639.4734,985.90147 L 1640.8442,984.24976 L 1640.4239,983.56977 C 1640.1927,983.19575 1639.9028,981.97234 1639.7795,980.85107 L 1639.5554,978.81236 L 1637.9699,976.39026 L 1638.3185,976.04171 C 1638.5102,975.85002 1638.8797,975.69315 1639.1397,975.69315 L 1639.6123,975.69315 L 1639.6123,977.82277 L 1641.3881,979.29652 L 1644.6155,977.39 L 1647.2685,977.6781 L 1646.985,976.26028 L 1651.4319,976.26028 L 1651.7389,977.81988 C 1651.9078,978.67766 1652.1038,980.27271 1652.1744,981.36444 L 1652.3027,983.34939 L 1650.9925,985.75656 L 1651.9771,989.18945 L 1650.7078,990.45869 L 1653.5653,994.94065 L 1655.562,1010.5911 L 1658.7468,1012.4189 L 1659.5629,1018.951 L 1669.5237,1017.5955 C 1671.1985,1024.3951 1671.6365,1031.1946 1671.9386,1037.9942 L 1668.3616,1039.7787 L 1663.1481,1039.796 L 1661.6455,1040.7488 L 1662.4559,1048.9737 L 1694.544,1045.7787 L 1696.3006,1058.9725 L 1702.1415,1058.3675 L 1701.3624,1059.6282 L 1699.0028,1059.6282 L 1699.8673,1069.4247 L 1707.0741,1068.835 L 1709.6649,1090.1418 L 1702.4448,1090.9454 L 1703.2371,1098.4765 L 1704.9343,1100.3802 L 1704.5338,1101.6968 C 1704.3136,1102.4211 1703.5517,1103.7908 1702.8409,1104.7407 L 1701.5485,1106.468 L 1703.1903,1108.6699 C 1704.0933,1109.881 1704.8321,1111.2092 1704.8321,1111.6215 L 1704.8321,1112.3712 L 1704.3465,1112.3712 C 1704.0795,1112.3712 1702.6911,1111.4779 1701.2613,1110.3862 L 1698.6617,1108.4013 L 1695.0863,1108.4013 L 1692.0793,1110.7665 L 1690.9167,1107.9224 L 1685.8699,1111.7038 L 1684.288,1109.4454 L 1681.0127,1112.5834 L 1681.0127,1115.7739 L 1675.3892,1115.7739 L 1673.8516,1118.4678 C 1673.0058,1119.9494 1671.9347,1121.6083 1671.4712,1122.1541 C 1671.0077,1122.7 1670.4338,1123.1466 1670.1956,1123.1466 L 1667.2285,1119.0463 L 1662.0726,1119.753 L 1657.7081,1116.2456 L 1655.8757,1117.7589 L 1653.5069,1117.7589 L 1653.818,1124.3199 L 1664.847,1123.4078 L 1665.4781,1128.7304 L 1673.9236,1128.0862 L 1672.8432,1129.3027 C 1672.0449,1130.2525 1672.1801,1130.9789 1671.4127,1132.0136 C 1670.7662,1132.8354 1670.2372,1133.8563 1670.2372,1134.2821 C 1670.2372,1134.7079 1670.0444,1135.0563 1669.8085,1135.0563 C 1669.5728,1135.0563 1669.042,1135.8197 1668.6289,1136.7528 L 1667.878,1138.4493 L 1669.7092,1140.2806 L 1669.0531,1141.0712 C 1668.6922,1141.5061 1668.0454,1141.8619 1667.6157,1141.8619 L 1666.8345,1141.8619 L 1666.8345,1146.8991 L 1668.0529,1147.6521 L 1667.4461,1151.9905 L 1667.8581,1152.1721 C 1668.0847,1152.272 1669.0956,1153.4887 1670.1044,1154.8758 C 1671.1132,1156.2629 1671.9386,1157.7213 1671.9386,1158.1168 L 1671.9386,1158.8358 L 1674.3202,1160.1104 L 1673.7921,1162.8727 L 1674.8293,1163.5138 L 1673.7888,1164.8673 L 1673.859,1166.2946 L 1676.4757,1165.6048 L 1676.4757,1166.1408 C 1676.4757,1166.4355 1676.1566,1166.9308 1675.7667,1167.2415 L 1667.3731,1171.9197 L 1663.4986,1171.9197 L 1662.7408,1173.1459 L 1659.9452,1172.4442 L 1643.7556,1174.2599 L 1644.2734,1179.6482 L 1623.4643,1181.8634 z "},"tx4":{"name":"TX-4","path":"M 1382.4888,1129.385 C 1382.0592,1129.385 1381.4035,1129.0186 1381.0318,1128.5708 L 1380.3561,1127.7566 L 1377.0317,1127.0264 L 1377.0317,1125.8826 L 1372.6728,1126.619 L 1367.2843,1122.5059 L 1348.6753,1123.3093 L 1348.6753,1124.848 L 1337.8998,1125.2098 L 1337.8998,1122.0888 L 1335.549,1121.3426 L 1336.2948,1116.9278 L 1333.3628,1115.5919 L 1333.3628,1110.7093 L 1329.9744,1106.8501 L 1334.6029,1102.2683 L 1331.3473,1099.9982 L 1328.8657,1101.5957 L 1325.5131,1101.5957 L 1324.7866,1104.9037 L 1322.9947,1105.5914 L 1320.3517,1103.8596 L 1320.0353,1088.8353 L 1314.7813,1088.4951 L 1313.3692,1055.5157 L 1314.927,1056.035 L 1315.6379,1060.4087 L 1318.2847,1062.5519 L 1319.5932,1060.7625 L 1321.3742,1060.7625 L 1321.7367,1063.3145 L 1324.3543,1063.6856 L 1327.1244,1061.8706 L 1327.1244,1060.2768 C 1327.1244,1059.4002 1327.2923,1058.515 1327.4975,1058.3098 L 1327.8707,1057.9367 L 1329.3929,1059.2 L 1329.3929,1058.427 L 1330.601,1059.1737 L 1328.8832,1061.0719 L 1329.2798,1061.6261 C 1329.498,1061.9309 1330.2472,1062.4993 1330.9448,1062.8892 C 1331.6424,1063.2791 1332.7325,1063.5981 1333.3673,1063.5981 L 1334.5214,1063.5981 L 1335.852,1066.5186 L 1339.5756,1065.8201 L 1341.2732,1067.6865 C 1342.2068,1068.713 1342.9782,1069.88 1342.9874,1070.2797 L 1343.004,1071.0064 L 1344.7476,1071.6755 L 1346.9739,1069.6607 L 1346.9739,1066.4337 L 1347.8618,1066.4337 C 1348.3502,1066.4337 1349.2289,1066.6901 1349.8144,1067.0035 L 1350.879,1067.5732 L 1353.8066,1066.2393 L 1355.0052,1061.2822 L 1357.1822,1061.9732 L 1357.1822,1060.8943 L 1360.6652,1061.1683 L 1362.6283,1060.4935 C 1363.7079,1060.1223 1364.8814,1059.5285 1365.2361,1059.1739 L 1365.8808,1058.5291 L 1370.1336,1060.9193 L 1371.1724,1060.473 C 1371.7437,1060.2275 1372.8194,1060.0873 1373.5629,1060.1615 L 1374.9147,1060.2963 L 1374.3423,1057.3017 L 1377.4181,1057.9772 L 1378.872,1056.2254 L 1380.6287,1056.2254 L 1382.6607,1054.3865 L 1384.4044,1055.0556 L 1384.4044,1057.2179 L 1385.964,1057.5056 C 1386.8218,1057.6638 1389.3509,1057.8361 1391.5842,1057.8885 L 1395.6448,1057.9838 L 1396.3504,1056.8421 L 1398.079,1057.5054 L 1400.284,1055.1386 L 1400.284,1052.9615 L 1401.7399,1051.7533 L 1402.5715,1052.2793 C 1403.0289,1052.5686 1404.1201,1052.8092 1404.9963,1052.814 L 1406.5893,1052.8227 L 1406.0134,1053.7546 L 1407.1251,1054.7064 C 1407.7365,1055.2299 1408.4764,1055.6583 1408.7692,1055.6583 C 1409.0621,1055.6583 1409.5058,1056.0017 1409.7552,1056.4215 L 1410.2087,1057.1846 L 1413.7952,1057.8785 L 1415.2629,1059.3462 C 1416.0702,1060.1535 1416.7448,1060.9938 1416.7621,1061.2136 C 1416.7794,1061.4334 1417.5729,1062.2299 1418.5255,1062.9837 L 1420.2576,1064.3543 L 1422.0387,1064.2959 C 1423.0183,1064.2638 1424.394,1064.3537 1425.0959,1064.4957 L 1426.3719,1064.754 L 1426.3719,1066.4337 L 1428.0733,1066.4337 L 1428.0733,1067.7003 L 1430.9089,1067.1581 L 1430.9089,1068.2163 L 1432.185,1068.113 C 1432.8868,1068.0561 1433.7403,1068.0378 1434.0817,1068.0723 C 1434.4231,1068.1069 1435.4439,1068.7848 1436.3502,1069.5789 L 1437.998,1071.0225 L 1441.1172,1070.432 L 1441.1172,1071.9543 L 1445.4637,1074.8306 L 1450.7525,1074.5174 L 1452.4454,1073.1124 L 1454.305,1073.826 L 1455.7867,1072.5963 L 1458.7447,1074.5344 L 1461.3548,1073.3452 L 1462.5746,1074.0991 L 1464.8773,1114.6856 L 1431.7776,1116.7618 L 1430.6254,1115.264 L 1408.579,1116.3411 L 1408.2633,1112.526 L 1381.2076,1114.2933 L 1383.4675,1129.5034 L 1382.4888,1129.385 z "},"tx3":{"name":"TX-3","path":"M 1326.6056,1125.8816 L 1326.5572,1120.8781 L 1328.8258,1120.8781 L 1328.8258,1117.4753 L 1319.8935,1117.4753 L 1319.1846,1109.5355 L 1320.3188,1109.5355 L 1320.3188,1104.4052 L 1323.0784,1106.2133 L 1325.2925,1105.0284 L 1326.0117,1102.1628 L 1329.1761,1102.1628 L 1331.3311,1100.5871 L 1333.7839,1102.4373 L 1329.3289,1106.7608 L 1332.7957,1110.7093 L 1332.7957,1115.7983 L 1335.6313,1117.0902 C 1335.5719,1118.5114 1335.4484,1119.8045 1335.0688,1121.1617 L 1333.6761,1120.951 L 1330.9261,1121.3472 L 1326.6056,1125.8816 z "},"ar4":{"name":"AR-4","path":"M 1485.052,954.70803 L 1483.5988,957.04743 L 1481.4188,956.33852 L 1477.2895,958.30572 L 1475.0386,956.90565 C 1474.1718,957.85088 1473.2307,958.79606 1470.7143,959.74129 L 1468.623,957.41958 L 1468.0559,962.93139 L 1463.2885,963.28585 L 1462.9517,968.60268 L 1457.2766,968.66586 L 1458.1666,974.55753 L 1452.4598,974.55753 L 1452.4598,977.42624 L 1448.4899,979.27179 L 1448.4899,985.75832 C 1444.5531,987.66144 1442.0727,987.03998 1438.2816,988.7003 L 1440.7097,1068.5414 L 1442.5351,1068.4173 L 1442.2515,1071.0225 L 1445.672,1072.4581 L 1445.0695,1073.0607 L 1449.6242,1073.0607 L 1449.6242,1072.0328 L 1450.8116,1072.7771 L 1452.4421,1071.4125 L 1454.303,1072.1214 L 1455.898,1070.8099 L 1458.6273,1072.0505 L 1462.4378,1071.4302 L 1463.7493,1072.9898 L 1465.9205,1105.5643 C 1518.8454,1102.4524 1566.0142,1098.8511 1613.0636,1095.2496 L 1614.1801,1094.133 L 1615.3144,1092.9988 L 1614.9954,1092.2013 L 1614.6941,1091.386 L 1613.932,1091.386 C 1613.5132,1091.386 1612.615,1090.8728 1611.9293,1090.234 L 1610.671,1089.0643 L 1611.9293,1086.7249 L 1613.7194,1086.9908 C 1614.7029,1087.1409 1615.8391,1087.1511 1616.236,1087.0085 L 1616.9449,1086.7427 L 1616.2537,1081.4081 L 1618.0614,1079.9017 L 1618.026,1078.0585 L 1615.6865,1081.1777 L 1615.2081,1080.8942 C 1614.943,1080.7304 1614.3311,1079.798 1613.8434,1078.8206 L 1612.9572,1077.0306 L 1612.9572,1073.4506 L 1616.36,1070.1896 L 1616.2714,1067.8502 L 1615.9524,1068.7009 C 1615.7821,1069.1688 1614.9971,1070.2534 1614.1978,1071.1112 L 1612.7446,1072.6708 L 1611.7698,1072.6708 C 1611.2299,1072.6708 1610.3846,1072.5233 1609.8912,1072.334 L 1608.9873,1071.9796 L 1608.9873,1071.1998 C 1608.9873,1070.7653 1609.1787,1070.4034 1609.4127,1070.4023 C 1609.6466,1070.4011 1610.6563,1069.8998 1611.6635,1069.2857 L 1613.5067,1068.1692 L 1613.1877,1067.3362 C 1613.0141,1066.8839 1612.5009,1066.3737 1612.0534,1066.202 L 1611.2382,1065.9007 L 1611.9116,1068.5237 L 1608.4911,1069.9415 L 1607.3923,1069.268 L 1607.6936,1068.1338 C 1607.8566,1067.5102 1608.1781,1066.9995 1608.4202,1066.9995 C 1608.6624,1066.9995 1609.0308,1066.5578 1609.2355,1066.0247 L 1609.6077,1065.0677 L 1607.2683,1063.2954 L 1606.7897,1060.832 L 1611.8584,1058.9002 L 1611.4863,1057.6419 L 1605.4251,1054.3809 L 1609.0582,1051.5098 L 1613.5953,1054.0619 L 1616.3246,1053.3707 L 1615.722,1051.8111 L 1611.4863,1052.3782 L 1610.0507,1050.6237 L 1610.4052,1046.8664 L 1618.0614,1046.9728 L 1618.0614,1046.0157 L 1617.2816,1046.0157 C 1616.8557,1046.0157 1615.8349,1045.4925 1615.0131,1044.846 L 1613.5244,1043.6586 L 1613.5244,1041.0711 L 1615.7929,1037.8633 C 1614.68,1037.1954 1613.3907,1036.8875 1612.1065,1036.5872 L 1611.7344,1034.6732 L 1613.1522,1034.1415 C 1613.9244,1033.8478 1614.7198,1033.3383 1614.9245,1033.0072 C 1615.1292,1032.6761 1615.5204,1032.4047 1615.7929,1032.4047 C 1616.0654,1032.4047 1616.4456,1032.9151 1616.6436,1033.5389 L 1616.998,1034.6732 L 1618.0968,1034.6732 L 1617.4766,1033.5035 L 1616.8563,1032.3515 L 1617.2994,1031.0223 L 1619.1248,1030.9336 C 1620.1316,1030.883 1621.0316,1030.746 1621.1275,1030.6324 C 1621.5216,1029.5506 1621.7997,1028.4273 1622.0491,1027.3005 L 1619.2489,1027.3005 L 1617.9196,1025.8827 L 1610.5115,1026.2726 L 1609.7494,1027.0346 C 1609.3327,1027.4514 1608.9873,1028.0651 1608.9873,1028.3993 L 1608.9873,1029.0019 L 1607.41,1029.0019 L 1607.0556,1029.9057 C 1606.8662,1030.3991 1606.7188,1031.0062 1606.7188,1031.2704 C 1606.7188,1031.5345 1607.0378,1032.1081 1607.4277,1032.5287 C 1607.8176,1032.9493 1608.7049,1034.0863 1609.395,1035.0631 L 1610.6533,1036.8354 L 1609.0937,1038.1291 L 1608.3316,1036.8885 L 1606.1517,1037.5797 L 1605.4605,1035.772 L 1603.9364,1037.048 L 1602.7844,1036.3214 C 1601.1467,1037.459 1599.783,1038.0941 1598.9208,1037.8101 L 1597.9283,1037.4025 L 1599.2044,1036.534 C 1599.9062,1036.057 1600.4804,1035.4432 1600.4804,1035.1694 L 1600.4804,1034.6732 L 1598.8322,1034.6732 L 1597.1663,1036.4809 L 1594.6673,1033.9643 L 1593.1609,1027.4068 L 1590.219,1027.4423 C 1589.0423,1026.0788 1588.3157,1024.0689 1587.9327,1022.1046 L 1579.1245,1022.0191 L 1578.1852,1006.813 L 1543.2004,1008.5853 L 1543.2004,1011.2791 C 1540.5104,1011.7562 1537.6371,1012.1498 1533.5415,1011.988 L 1532.2477,1014.8237 L 1528.4551,1014.8237 L 1528.4551,1011.4209 L 1525.6194,1011.4209 L 1525.6194,1009.7195 L 1523.3155,1009.7195 L 1521.7543,1004.6154 L 1517.6796,1004.6154 L 1517.6311,1001.9585 L 1512.5755,1002.3468 L 1512.9638,993.45539 L 1492.017,995.15139 L 1491.4854,997.13634 L 1475.2868,998.37694 L 1473.8689,974.48664 L 1476.6145,972.33756 L 1482.3227,972.28902 L 1485.9913,967.18486 L 1494.8273,967.2334 L 1494.4273,960.98189 L 1492.1588,959.77674 L 1485.7191,961.30861 L 1485.0503,962.59951 L 1488.1003,958.96149 L 1487.2851,957.86268 C 1486.843,957.25812 1486.4875,956.30007 1486.4875,955.73595 L 1486.4875,954.70803 L 1485.052,954.70803 z "},"ga3":{"name":"GA-3","path":"M 1946.8864,1093.2794 L 1944.3296,1090.5015 L 1939.096,1090.5581 L 1936.7877,1089.079 L 1936.7877,1086.0888 L 1934.2871,1083.6928 C 1932.9117,1082.3749 1931.46,1080.6961 1931.0609,1079.9619 C 1930.6619,1079.2277 1930.2963,1078.1493 1930.2485,1077.5655 L 1930.1616,1076.504 L 1928.2808,1075.4514 L 1928.2808,1074.4325 C 1928.2808,1073.8721 1927.8927,1072.6356 1927.4184,1071.6847 C 1926.944,1070.7338 1926.1783,1069.6426 1925.717,1069.2596 L 1924.878,1068.5634 L 1924.878,1066.2752 L 1923.2486,1065.0159 L 1905.7994,1011.1805 L 1907.4563,1010.1453 C 1909.8353,1009.8023 1911.744,1009.204 1914.9751,1007.0859 L 1925.2214,1007.5268 L 1925.9724,1002.3353 C 1930.016,1002.0515 1932.7903,1001.5116 1933.8162,1001.0123 L 1933.6815,1005.2581 L 1936.2127,1010.153 L 1932.9796,1013.8856 L 1933.0065,1015.9213 L 1936.5937,1019.9022 L 1945.0838,1016.824 L 1949.7113,1016.6354 L 1950.2075,1015.6321 L 1956.364,1014.8797 L 1961.4438,1020.6441 L 1961.4977,1021.613 L 1967.1404,1026.0883 L 1967.5334,1030.0437 L 1970.2354,1030.0976 L 1970.8565,1024.937 L 1977.3245,1021.9619 L 1977.3313,1019.6372 C 1977.8355,1019.0425 1978.4959,1018.6351 1979.3595,1018.4715 L 1980.5241,1018.4984 L 1981.1186,1013.7936 L 1984.1012,1014.4414 C 1984.3751,1015.4675 1984.7646,1016.378 1985.7495,1016.6932 L 1985.8304,1021.0253 L 1987.2993,1022.1708 L 1992.3687,1022.1438 L 1994.8217,1025.4616 C 1993.8007,1026.2067 1992.9374,1027.4261 1991.4927,1031.349 L 1991.3767,1041.2612 L 1993.3051,1044.383 L 1997.5,1043.7053 L 2001.6291,1051.4629 C 2001.8627,1052.8892 2001.4672,1053.1933 2004.221,1059.115 L 2000.4273,1059.2767 L 2001.8601,1064.1263 L 1998.2811,1065.7699 C 1998.2273,1067.0604 1996.2774,1068.9127 1993.4887,1071.0135 L 1992.3627,1068.5429 C 1985.8464,1066.2652 1980.3662,1062.8996 1975.8829,1058.4873 L 1969.1982,1058.007 L 1966.1255,1060.3097 L 1957.4331,1060.5003 L 1957.4331,1063.0134 L 1962.6976,1070.611 L 1963.4857,1085.9997 C 1961.4659,1086.9524 1958.6457,1090.4208 1953.7671,1093.3175 L 1946.8864,1093.2794 z "},"sc2":{"name":"SC-2","path":"M 2151.7295,1074.9343 L 2150.8788,1076.0089 L 2145.924,1073.6174 L 2143.8976,1074.8829 C 2142.3521,1074.8558 2141.0982,1074.4955 2140.3589,1073.5472 L 2139.6864,1069.3418 L 2137.112,1066.9232 L 2138.35,1063.6433 L 2136.4354,1059.6282 L 2134.9992,1059.5802 C 2132.949,1057.2685 2132.4323,1055.4681 2132.4471,1053.8448 L 2127.9602,1050.6853 L 2126.6755,1048.1726 L 2123.7449,1048.7328 L 2119.3131,1046.4228 L 2120.0237,1042.4711 L 2117.7018,1041.4801 L 2116.2816,1032.5791 L 2114.2221,1032.5204 C 2113.8793,1030.2577 2112.4259,1028.9946 2110.9555,1027.7468 L 2111.651,1023.5658 C 2108.5049,1021.5709 2105.532,1021.8257 2103.7704,1019.5279 L 2097.1876,1018.1756 L 2094.368,1015.5803 L 2105.2082,1000.1106 L 2102.2746,999.05789 L 2098.7107,999.7292 L 2094.5799,997.69769 L 2093.3153,994.92216 C 2093.1984,991.96158 2093.5667,988.71 2094.6029,985.05764 L 2097.1781,981.648 L 2098.9282,974.43095 L 2097.3477,971.87303 L 2095.7672,970.87256 L 2098.6008,957.41374 L 2103.168,958.02834 L 2099.5314,954.27468 L 2100.6599,951.30662 L 2102.1976,951.30662 L 2104.0551,946.76959 L 2105.6532,946.76959 C 2107.3479,949.47252 2109.8214,947.07062 2109.8289,949.0381 L 2112.0305,949.0381 L 2112.0305,946.84603 C 2117.4639,944.88139 2122.0754,942.18129 2127.8116,940.43294 L 2126.7133,945.32125 L 2136.1993,951.30089 L 2137.0034,953.64199 L 2128.1561,956.9779 C 2127.8056,956.9779 2127.0569,957.48832 2126.4923,958.11216 L 2125.4658,959.24642 L 2123.6726,959.28969 L 2121.9002,957.60265 L 2121.9676,955.71116 C 2122.6821,955.80502 2123.5286,954.19336 2124.4723,952.33896 L 2122.3763,950.20015 L 2117.9242,951.13943 L 2116.6055,954.44528 L 2118.5004,958.59274 L 2120.0599,958.63602 C 2123.9319,963.82763 2120.403,961.27419 2124.9984,966.79689 L 2130.4035,968.86339 C 2131.4797,967.95247 2132.5355,968.68157 2134.4321,969.69055 L 2137.3495,969.98324 L 2133.2022,979.2246 L 2135.3009,983.38954 L 2134.241,986.13439 L 2132.4847,986.02391 L 2131.8582,987.99786 L 2128.8278,989.37859 L 2119.6867,990.42023 L 2118.1947,992.42345 C 2120.3327,1006.7324 2121.1729,1007.5436 2120.9315,1011.5129 L 2126.6425,1016.4493 L 2130.2525,1018.0068 L 2138.9627,1026.6214 L 2141.3084,1027.3942 C 2143.6703,1030.502 2145.9458,1033.6098 2146.7936,1035.5496 L 2151.9891,1036.7938 L 2153.4252,1035.6746 C 2155.9616,1037.2895 2157.0704,1038.7746 2158.5686,1040.6492 L 2161.1489,1040.9025 C 2165.1961,1042.3671 2163.2299,1042.6636 2167.5798,1045.1664 L 2167.6091,1046.9756 L 2168.6016,1047.828 C 2169.1474,1048.2968 2170.0407,1048.8387 2170.5865,1049.0323 L 2171.579,1049.3843 L 2171.579,1050.7353 C 2171.579,1051.4783 2171.2989,1052.89 2170.9564,1053.8723 C 2170.614,1054.8546 2170.1674,1055.6624 2169.9639,1055.6674 C 2169.7605,1055.6724 2168.73,1056.438 2167.674,1057.3688 C 2166.6181,1058.2995 2165.523,1059.0611 2165.2408,1059.0611 C 2164.9585,1059.0611 2163.9722,1059.6195 2163.0491,1060.302 L 2161.3707,1061.5429 L 2161.3707,1062.5405 C 2161.3707,1063.0892 2160.7427,1064.7193 2159.9751,1066.1629 L 2158.5795,1068.7876 L 2157.0086,1070.021 C 2156.1447,1070.6993 2155.251,1071.1937 2155.0227,1071.1196 C 2154.7943,1071.0455 2154.1513,1071.6317 2153.5938,1072.4222 C 2153.0363,1073.2128 2152.1974,1074.3432 2151.7295,1074.9343 z "},"ok2":{"name":"OK-2","path":"M 1344.1382,1070.5425 L 1344.091,1068.9858 L 1340.2401,1064.6265 L 1336.7808,1065.3863 L 1335.4493,1062.4638 C 1333.553,1063.0271 1331.8955,1062.5559 1330.4331,1061.2393 L 1332.0903,1059.3446 L 1331.8232,1053.9414 L 1329.96,1051.1213 L 1332.2285,1051.1213 L 1332.2285,1049.0796 L 1333.5066,1047.8015 C 1331.2449,1043.841 1329.5938,1042.4759 1327.8912,1040.8921 L 1313.5133,1041.3833 L 1313.5133,1031.8389 L 1315.7818,1031.8389 L 1315.7818,1021.2315 C 1322.2329,1020.8187 1328.4684,1020.6215 1334.6319,1020.4963 L 1333.8304,1009.8053 L 1339.0341,1009.0249 L 1339.0341,993.90819 L 1337.3495,995.02441 L 1335.2133,993.88119 L 1334.4971,994.59742 L 1333.7906,982.65664 L 1336.482,981.98244 L 1335.5295,960.38067 L 1333.7714,960.38067 L 1332.331,962.35054 L 1330.1227,960.35203 L 1328.6692,961.72364 L 1330.6033,964.2405 L 1326.5572,964.12577 L 1326.5572,949.60523 C 1333.5518,949.63098 1340.5464,949.41944 1347.541,948.86705 L 1347.541,935.54123 L 1373.9125,934.57632 L 1374.4796,938.51628 L 1377.2845,939.91107 C 1378.4684,938.55836 1380.6891,937.60439 1383.7529,936.97471 L 1385.3122,937.57303 L 1388.0907,936.03435 L 1392.7136,935.99414 C 1393.4467,935.10658 1394.3946,934.35349 1395.1256,933.52118 L 1395.234,931.82926 C 1393.8577,931.76915 1393.0729,931.1174 1392.4125,930.34146 L 1392.8934,925.87316 C 1395.0363,923.98338 1395.4499,921.56145 1395.747,919.10369 L 1378.4796,919.26384 L 1376.9698,916.14464 C 1375.7932,916.3648 1374.7925,915.88086 1374.0493,914.3668 L 1369.8381,914.96416 L 1367.155,911.33504 L 1367.1991,901.68285 L 1368.8083,893.99786 L 1373.7374,890.92193 L 1371.0769,887.80782 L 1364.5765,887.7882 L 1363.3325,866.80444 L 1364.5549,866.80444 L 1364.5549,863.40167 C 1383.1595,862.37743 1401.7563,861.35059 1420.7836,860.46729 L 1422.762,892.06963 L 1435.9887,960.09711 L 1439.6139,1069.2604 L 1438.9167,1069.9575 L 1435.2006,1066.4844 L 1432.0432,1066.8521 L 1427.1392,1064.0989 L 1420.8417,1063.4328 L 1417.3858,1060.0916 L 1415.0546,1056.9305 L 1411.0994,1056.2254 L 1410.1669,1054.8742 L 1406.6309,1052.1671 L 1401.0863,1050.8005 C 1400.0337,1051.7783 1398.9186,1052.4051 1399.1497,1054.524 L 1398.0155,1056.0682 L 1395.1798,1055.526 L 1395.1798,1056.8641 L 1385.6426,1056.1499 L 1384.9499,1053.3898 L 1381.7076,1053.3898 L 1380.2956,1055.0912 L 1378.3049,1055.0912 L 1377.0533,1056.5993 L 1373.6289,1056.0967 L 1374.1177,1059.5073 L 1369.9426,1059.9382 L 1365.7408,1057.6604 C 1363.255,1059.6552 1360.4476,1060.8866 1356.81,1060.146 L 1356.694,1061.2498 L 1354.4614,1060.5209 L 1353.3748,1065.3353 L 1350.7375,1066.4014 C 1349.1994,1065.5759 1347.6613,1065.5574 1346.1232,1065.583 L 1345.7741,1069.1849 L 1344.1382,1070.5425 z "},"ok4":{"name":"OK-4","path":"M 1293.0612,960.30842 L 1291.8029,960.75146 C 1291.1115,960.99505 1289.5237,961.2042 1288.2761,961.21226 L 1286.0075,961.23001 L 1286.2014,967.48498 L 1273.2472,967.75199 L 1273.2472,961.93892 L 1271.4749,962.29337 C 1270.5001,962.48835 1268.9688,962.64783 1268.0721,962.64783 L 1266.4416,962.64783 L 1266.4416,970.58763 L 1264.7934,970.58763 L 1263.6414,968.60268 L 1263.606,970.0205 L 1262.7907,970.0205 C 1262.3451,970.0205 1261.5796,969.62453 1261.0893,969.13436 L 1260.2032,968.24822 L 1260.2032,969.13436 C 1260.2032,969.62453 1260.0677,970.0205 1259.9019,970.0205 C 1259.7359,970.0205 1258.6823,969.63763 1257.5625,969.16981 C 1256.4427,968.70193 1254.9301,968.31912 1254.1952,968.31912 L 1252.8483,968.31912 L 1253.5926,1001.1948 L 1216.5343,1001.2126 L 1216.5343,1017.9429 L 1207.5666,1017.5707 L 1206.9994,1015.3908 L 1202.8523,1015.3908 L 1203.5967,1016.5959 L 1201.6295,1018.7758 L 1198.9533,1018.1024 L 1198.9533,1021.0621 L 1197.9077,1021.0621 L 1195.5511,1028.2 L 1196.3481,1029.2855 C 1196.8591,1030.0653 1197.1183,1030.7033 1196.9329,1030.7033 L 1198.4216,1032.5287 L 1198.014,1033.7338 C 1197.7907,1034.4028 1197.6485,1035.3395 1197.695,1035.8074 C 1197.7415,1036.2753 1197.8914,1037.2961 1198.0317,1038.0759 C 1198.1721,1038.8557 1198.3069,1039.8447 1198.333,1040.2736 L 1198.3862,1041.0534 L 1206.111,1041.5691 L 1208.0451,1040.2736 L 1209.3034,1040.6635 C 1210.0024,1040.8753 1211.0898,1041.4649 1211.7137,1041.975 C 1212.3375,1042.485 1213.4168,1043.2205 1214.1063,1043.6055 L 1215.3469,1044.2966 L 1217.0128,1043.6586 L 1220.0966,1045.679 L 1223.5703,1045.4132 L 1225.4134,1043.7472 L 1228.9225,1043.7472 L 1234.4875,1050.092 L 1235.3027,1049.2944 C 1235.7459,1048.856 1236.5468,1048.3314 1237.0927,1048.1247 L 1238.0852,1047.7526 L 1238.0852,1045.6258 L 1240.2119,1043.694 L 1241.7184,1044.0662 C 1242.5377,1044.2719 1243.3368,1044.6749 1243.5083,1044.9524 L 1244.6583,1045.6979 L 1250.4658,1046.5646 L 1252.9412,1043.6641 L 1253.9293,1043.7472 L 1255.1699,1046.0512 L 1253.4863,1049.4185 L 1255.0305,1053.3137 L 1262.4717,1053.5151 L 1261.3198,1060.7611 L 1262.135,1060.7611 C 1262.5835,1060.7611 1263.6941,1061.1888 1264.6162,1061.7181 L 1266.2998,1062.6928 L 1269.3304,1060.6902 L 1269.7026,1059.7332 C 1269.9023,1059.2055 1270.3302,1058.503 1270.6596,1058.1736 C 1270.989,1057.8442 1271.6822,1057.4129 1272.2015,1057.2165 L 1273.1586,1056.8621 L 1274.6827,1053.672 L 1276.9335,1053.3707 L 1280.6198,1055.6392 L 1280.6198,1059.0597 L 1281.0097,1059.0597 C 1281.2215,1059.0597 1282.2223,1058.7552 1283.2428,1058.3862 L 1285.1037,1057.7128 L 1287.9925,1059.042 L 1287.9925,1063.5967 L 1291.8561,1063.5967 L 1293.0967,1060.0522 L 1296.9602,1060.6725 L 1297.6337,1057.9963 L 1300.044,1057.2342 L 1302.0644,1059.3433 L 1302.8087,1062.9587 L 1300.5225,1064.1639 L 1301.4087,1066.2906 C 1301.8923,1067.4583 1302.5509,1068.7406 1302.8796,1069.1439 L 1303.4822,1069.8883 L 1305.2899,1069.5516 L 1305.6444,1064.1107 L 1307.2749,1063.4726 L 1307.2749,1061.8954 L 1308.9586,1061.8954 L 1310.7485,1059.1483 L 1310.0042,1055.2138 L 1311.4574,1054.3277 L 1311.8828,1055.6037 L 1314.7716,1054.2923 L 1316.3489,1056.4367 L 1316.3489,1057.5001 C 1316.3489,1058.0848 1316.6125,1059.062 1316.9338,1059.6623 L 1317.5186,1060.7433 L 1319.5745,1059.4673 L 1322.5873,1060.2117 L 1322.5873,1062.4625 L 1323.1899,1062.4625 C 1323.5224,1062.4625 1324.2588,1062.2137 1324.8204,1061.913 L 1325.8306,1061.3637 L 1326.575,1056.7912 L 1328.7549,1056.7912 L 1329.1093,1057.3583 C 1329.3021,1057.6702 1329.8427,1057.9254 1330.3145,1057.9254 L 1331.6815,1058.9226 L 1331.5545,1054.3173 L 1329.4588,1051.411 L 1329.9246,1050.5528 L 1331.7855,1050.5528 L 1331.6876,1048.9284 L 1332.9198,1047.8944 L 1331.5196,1045.679 C 1330.7468,1044.4624 1329.6034,1043.0059 1328.9853,1042.4534 L 1327.851,1041.461 L 1312.9462,1041.975 L 1312.9462,1031.2704 L 1315.2147,1031.2704 L 1315.2147,1020.6722 C 1321.7378,1020.2579 1326.8068,1019.9682 1334.0363,1019.9278 L 1333.2388,1009.2942 L 1338.467,1008.5144 L 1338.467,994.90327 L 1337.3504,995.59443 L 1335.0465,994.35384 L 1333.0792,997.80981 L 1331.6437,997.80981 L 1330.6646,994.77255 L 1326.9434,996.06016 L 1324.5712,993.76839 L 1322.8521,994.38265 L 1323.9875,995.52354 C 1324.4689,996.0554 1324.8559,996.63012 1324.8559,996.81733 C 1324.8559,997.00443 1324.4598,997.5677 1323.9697,998.05793 C 1323.4796,998.5481 1322.8305,998.94407 1322.5342,998.94407 L 1322.0025,998.94407 L 1320.7265,996.16156 L 1318.3339,995.82486 L 1318.6529,993.92849 L 1317.5186,993.21958 L 1314.4703,995.22228 L 1312.8044,992.70565 L 1310.6776,992.70565 L 1310.6776,994.38928 L 1307.5335,996.12555 L 1301.2137,994.61795 C 1300.8183,984.74345 1300.8383,976.94628 1299.7782,967.238 L 1294.6269,967.15055 L 1293.0612,960.30842 z "},"ca53":{"name":"CA-53","path":"M 269.37254,1064.7373 L 268.79611,1065.583 L 269.46464,1059.9118 L 267.44441,1055.9419 L 264.46523,1055.9757 L 264.60877,1045.5453 L 265.65501,1045.7335 L 266.934,1041.3592 L 268.46524,1043.3667 C 270.69683,1045.5582 269.78506,1045.9256 269.78506,1046.0826 L 266.06852,1046.3007 L 266.68352,1049.556 L 276.51847,1052.5195 L 276.93514,1053.0964 C 277.16432,1053.4137 277.35572,1053.812 277.36049,1053.9814 C 277.36525,1054.1509 276.53974,1054.5337 275.526,1054.8321 L 273.68283,1055.3747 L 273.33552,1057.8112 L 271.27866,1058.3491 L 270.61381,1061.1203 C 270.24818,1062.6445 269.68962,1064.2721 269.37254,1064.7373 z "},"az2":{"name":"AZ-2","path":"M 468.20797,817.16157 L 461.18975,866.14731 C 460.17306,867.43923 459.11474,868.69632 457.99966,869.90453 C 457.37581,870.56598 456.85964,871.36126 456.84768,871.65912 L 454.66777,876.44427 L 448.89015,876.44427 L 446.30263,873.21872 L 445.80639,869.70961 L 443.44926,867.67147 L 438.27421,867.19298 L 436.67916,865.66882 C 435.00092,865.68572 433.32403,865.62986 431.64589,865.65107 C 431.31522,865.65941 430.49641,866.57061 429.82045,866.62585 L 425.51381,867.51199 L 425.95688,872.08446 L 424.75174,873.51998 L 425.37203,875.98347 C 425.71543,877.33296 426.28785,878.98472 426.63035,879.66981 L 427.25065,880.9281 L 426.27589,882.98394 C 425.73775,884.11803 425.17041,885.98672 425.01758,887.13107 C 424.86479,888.27542 424.71779,890.4807 424.69857,892.04031 L 424.66312,894.87595 L 425.95688,898.06605 L 424.59223,900.54724 L 424.91124,902.60308 L 423.74154,904.00315 L 423.4757,907.91991 L 425.54926,911.09226 L 425.70876,926.49337 L 424.50362,928.90367 L 421.33124,929.18723 L 422.2351,930.07337 C 422.72527,930.56354 423.12124,931.27438 423.12124,931.65067 C 423.12124,932.02696 422.64107,932.74648 422.05787,933.24572 L 420.99451,934.14961 L 419.4349,943.70216 L 421.98698,946.28968 L 421.98698,949.44433 L 423.2453,951.09258 C 423.94049,951.99244 424.82033,953.04163 425.1948,953.43199 L 425.86827,954.1409 L 426.57718,957.40189 C 426.95943,959.19521 427.31112,961.04569 427.37471,961.51357 C 427.43828,961.98145 427.80549,963.12977 428.18995,964.06565 L 428.89886,965.76704 L 428.27857,971.15476 L 429.92678,971.15476 L 431.06104,972.28902 C 431.68488,972.91286 432.1953,973.56574 432.1953,973.74228 C 432.1953,973.91855 433.53514,975.41412 435.17273,977.05641 L 438.15015,980.03384 L 439.14263,981.87701 L 439.23124,983.04671 L 442.7049,984.44684 L 444.38857,986.71535 L 452.64738,987.88506 L 453.62213,989.46235 L 459.0453,989.92315 L 460.37451,991.74862 L 464.50391,991.07515 L 465.15966,992.13852 L 467.25094,992.13852 C 468.31222,993.43464 469.52993,994.645 470.19292,996.19701 C 470.19292,996.50496 469.5549,998.14311 468.7751,999.8479 L 467.35728,1002.9494 L 467.35728,1004.1014 C 467.35728,1004.7314 466.97338,1005.9809 466.50659,1006.8839 L 465.65589,1008.5144 L 466.68381,1011.2259 C 469.82121,1012.5588 473.27306,1013.4606 476.43134,1014.4869 L 473.59569,1036.2505 L 504.11431,1046.5829 L 504.22064,1052.7858 L 506.56005,1054.948 L 511.30975,1053.8847 L 517.93807,1054.6467 L 517.58361,1056.4367 C 517.2766,1058.0848 516.93019,1057.1986 516.75064,1058.8647 L 516.57342,1064.6424 L 521.14589,1065.2981 L 521.53579,1063.455 C 521.75255,1062.4412 522.16068,1061.3211 522.43965,1060.9738 L 522.95361,1060.3534 L 523.02451,1052.5377 L 524.8854,1047.2031 L 530.82252,1046.4588 L 532.5948,1043.7472 L 534.7747,1043.7472 L 535.04054,1042.7548 C 535.18754,1042.2089 535.23348,1040.7412 535.14688,1039.4938 L 534.98738,1037.2253 L 533.02015,1032.6882 L 533.00243,1029.2855 L 531.26559,1027.3005 L 531.92134,1025.0851 C 532.63835,1023.4139 532.69572,1022.4513 531.6555,1021.0621 L 529.44015,1022.3027 L 506.77272,1012.0412 L 476.90985,1007.77 L 489.75886,915.9306 C 498.09551,910.40841 506.51292,905.00787 514.83658,899.46612 L 517.2646,879.84704 L 522.93589,879.84704 L 522.93589,882.59404 L 530.30856,883.39159 L 530.30856,887.21971 L 533.64045,887.21971 L 534.34936,889.48823 L 539.89658,889.48823 L 540.65866,882.73582 L 542.28916,881.61932 C 547.48942,884.12546 550.97953,889.75183 557.08767,890.12625 C 562.15249,893.97478 569.23095,892.30674 570.76968,885.89047 C 571.15056,884.47367 572.3391,882.5764 573.94203,881.83199 C 574.31974,881.65652 574.72518,881.54842 575.11173,881.47753 L 575.3776,882.29278 L 577.38025,881.54842 L 581.66916,885.02209 L 581.52738,886.36902 L 582.28948,887.27285 C 582.70933,887.76529 583.05153,888.46711 583.05153,888.83246 L 583.05153,889.48823 L 580.28678,889.48823 L 579.57787,891.75674 L 576.52955,892.04031 L 576.05107,896.32922 C 576.00882,896.78644 576.22501,897.13942 576.44097,897.49892 L 577.11443,898.4205 L 585.46183,902.62077 L 588.33292,901.89417 L 589.21906,903.34743 L 590.37107,902.30176 C 591.00602,901.72715 591.68692,900.75758 591.87747,900.15733 L 592.21424,899.05852 L 594.11054,899.43067 L 594.23463,901.92961 L 596.16638,904.87159 L 597.51332,904.37535 L 597.28295,903.59555 L 596.94619,900.54724 L 601.48322,899.98011 L 601.85542,897.41028 L 605.16955,895.6912 L 605.16955,891.47318 L 610.09648,891.47318 L 606.80005,926.2807 L 614.81074,927.0605 L 614.79305,927.41496 C 614.78312,927.60858 614.4002,928.26265 613.94235,928.86823 C 613.48434,929.47375 613.10935,930.14744 613.10935,930.35694 L 613.10935,930.72909 L 619.61364,931.4912 L 620.90737,929.73661 L 642.74183,932.02288 L 641.4481,930.46327 L 642.15701,928.62011 L 643.22037,927.87575 L 649.3879,929.18723 L 648.07641,926.31615 L 649.15747,925.25278 L 657.34539,924.93377 L 658.07206,915.00902 L 655.73265,915.00902 L 653.37549,918.00414 L 653.37549,921.72592 L 645.43569,923.05516 L 645.43569,920.57397 L 647.40295,917.22434 L 654.49206,913.89245 C 655.11459,912.3438 655.83417,910.82548 656.21114,909.19595 L 653.03879,909.26684 L 651.51463,908.3275 L 652.15265,905.08427 C 649.93002,905.05988 647.74385,904.68886 645.57747,904.21582 L 642.60005,903.52466 L 642.60005,902.08909 L 643.45074,901.77008 C 643.91862,901.59053 644.30143,901.17017 644.30143,900.84849 L 644.30143,900.26367 L 639.23272,900.26367 C 638.57922,898.96171 637.91721,897.66424 637.19463,896.40011 L 634.09312,898.11919 L 634.09312,900.29912 L 632.23225,901.00803 L 631.59423,900.15733 C 631.24823,899.68418 630.3985,899.12136 629.69787,898.89899 L 628.42183,898.49139 C 628.30455,897.14237 628.82421,895.49055 629.53839,894.13159 L 633.4374,891.7213 L 636.37938,892.4479 L 638.06302,891.04783 L 638.06302,888.21219 C 638.41492,887.21506 642.21298,881.20837 644.86856,878.11021 L 644.86856,875.87714 L 644.05331,875.87714 C 643.60386,875.87714 643.0829,876.11476 642.90136,876.40882 L 642.58235,876.9405 L 637.21232,877.72031 L 635.7945,878.85456 L 634.25265,877.57852 L 630.6549,878.83681 L 625.4976,878.05701 L 623.31767,875.87714 L 621.22638,875.87714 L 619.45411,877.86209 L 618.21351,882.55859 L 616.3881,884.06506 L 614.3145,881.51298 C 613.17214,881.78753 612.0224,882.01823 611.08896,882.75357 C 610.98903,882.9152 610.62856,886.04575 610.18513,890.4984 L 605.15186,890.4984 L 603.50361,891.86308 L 598.98433,891.10097 L 589.85708,897.05582 L 589.85708,899.00533 L 585.40869,899.18255 L 583.56552,897.44572 L 578.42592,898.08374 L 577.09668,895.88612 L 579.43609,895.72664 L 581.27926,891.84533 L 584.43391,890.33892 C 585.12893,889.88147 585.34784,888.83625 585.51503,887.73364 L 585.23146,883.49793 L 582.02361,881.67246 L 577.38025,881.30031 L 577.38025,879.27991 L 572.87866,879.2976 L 571.97483,877.93298 L 571.37226,876.19615 C 571.0964,874.62072 570.76616,873.37774 570.73424,871.78315 L 569.98988,870.08176 L 567.56183,871.10968 L 567.18968,872.03127 L 569.44044,875.20367 L 569.44044,877.98612 L 571.76216,880.94585 L 564.40718,889.11602 C 559.21633,890.18007 555.0891,885.79633 550.28213,884.77397 C 548.40995,883.91641 546.51601,880.68497 544.48678,879.91793 L 544.48678,879.51028 L 542.07649,876.72783 L 540.3751,879.27991 L 538.81549,879.27991 L 538.81549,877.61397 L 535.41272,875.84169 L 535.41272,874.5479 L 539.47124,870.82612 L 539.09906,868.2209 L 532.00995,865.15483 L 532.00995,863.0104 C 532.00825,861.82443 531.73586,859.8866 531.40738,858.70374 L 530.8048,856.54156 L 533.07332,854.60981 L 533.2151,853.47555 L 532.50619,846.63456 L 535.5545,839.5809 L 536.19252,839.51001 L 540.80045,839.29734 L 541.1549,835.52236 L 538.7446,834.90209 L 539.15223,833.9805 C 539.3708,833.47565 539.84207,831.99459 540.19787,830.68407 C 540.55369,829.37349 541.03829,828.08894 541.27896,827.84843 L 541.72203,827.42308 L 468.20797,817.16157 z "},"az5":{"name":"AZ-5","path":"M 552.85193,1017.1631 L 553.41906,1023.6683 L 551.77199,1024.3386 L 550.57679,1027.1375 L 551.39866,1028.5233 L 548.62295,1030.8162 L 547.06883,1030.4208 L 547.56994,1043.0277 L 545.80273,1043.8792 C 546.24967,1044.9345 547.01318,1046.2178 547.37891,1047.2795 L 543.9551,1050.8363 L 543.8534,1054.9044 L 541.73542,1059.0586 L 535.78169,1061.4276 L 546.18817,1062.4625 L 546.18817,1059.1306 L 548.40351,1058.4394 L 548.74025,1052.5554 L 552.00124,1050.9958 L 560.38411,1050.9958 L 561.78421,1052.1655 L 589.32539,1055.5152 L 585.26691,1042.613 L 584.23899,1043.1624 C 583.67481,1043.4643 582.79338,1044.3511 582.27173,1045.1473 L 581.3147,1046.6006 L 575.57252,1039.2811 L 575.07629,1037.1898 L 573.92433,1036.1441 L 574.06612,1034.4251 C 574.14466,1033.4749 574.43345,1032.3692 574.72183,1031.9793 L 575.25351,1031.2704 L 573.99523,1031.2704 L 573.69391,1025.5991 L 571.74441,1025.5991 L 572.45332,1021.9128 L 573.64077,1021.133 L 571.87496,1019.9389 L 558.23965,1018.7936 L 552.85193,1017.1631 z "},"az4":{"name":"AZ-4","path":"M 535.74946,1060.6902 L 541.36757,1058.7761 L 542.98035,1055.3734 L 543.06896,1049.7907 L 542.28916,1049.5426 C 541.8603,1049.3993 541.03087,1048.7983 540.44599,1048.2134 C 539.86117,1047.6285 539.04289,1047.15 538.62054,1047.15 L 537.84074,1047.15 L 534.72153,1044.2612 L 532.9847,1044.5979 L 530.8048,1047.5222 L 530.82252,1055.7633 L 535.74946,1060.6902 z "},"az3":{"name":"AZ-3","path":"M 543.35252,1050.6414 L 543.34538,1049.1363 C 541.66141,1048.101 539.95777,1047.0984 538.1747,1046.242 C 537.35434,1045.868 536.49639,1045.2598 536.26807,1044.8904 L 535.85304,1044.2188 C 535.77797,1041.493 535.72117,1038.767 535.1688,1036.0924 L 533.45766,1031.5586 L 533.80446,1028.9119 L 532.03893,1026.961 L 533.22599,1022.6617 L 532.81437,1021.7208 C 532.58797,1021.2033 532.45146,1020.3721 532.51095,1019.8738 L 532.6191,1018.9677 L 538.06229,1013.3204 C 542.74473,1014.6218 547.49761,1015.6976 552.12283,1017.1935 L 552.83645,1023.4279 L 551.39617,1023.9806 L 550.04884,1027.2334 L 550.69843,1028.2845 L 548.53795,1030.2398 L 546.20212,1029.4984 L 546.7553,1034.7691 L 546.7553,1042.558 L 544.89597,1043.5985 L 546.72632,1047.2676 L 543.35252,1050.6414 z "},"ok3":{"name":"OK-3","path":"M 1353.0174,864.16236 C 1226.6314,868.53906 1124.3637,869.22415 1009.7095,865.56248 L 1008.9652,895.62031 C 1060.6952,896.90661 1103.3005,897.75509 1156.9858,898.17238 L 1156.9858,1019.3607 L 1157.5175,1019.3607 C 1157.8109,1019.3607 1158.2108,1019.1055 1158.4036,1018.7936 L 1158.758,1018.2264 L 1160.6721,1018.2619 L 1172.5464,1030.7033 L 1177.4024,1030.7033 L 1177.4024,1028.4348 L 1181.904,1028.4348 L 1186.4588,1030.7033 L 1186.9727,1030.7033 L 1187.3272,1026.5738 L 1189.3121,1026.5561 L 1191.6693,1028.4348 L 1193.796,1028.4348 L 1196.7911,1033.5389 L 1197.8899,1032.8655 L 1196.3481,1030.7033 L 1196.6848,1030.3665 L 1195.072,1028.3107 L 1197.3937,1020.495 L 1198.3153,1020.495 L 1198.5279,1017.4466 L 1201.6117,1018.1201 C 1201.8188,1017.9147 1202.6955,1017.2341 1203.1004,1016.6136 L 1202.0903,1014.9655 L 1207.3716,1014.7705 L 1208.0982,1017.0922 L 1215.9672,1017.0922 L 1215.9672,1000.6455 L 1253.0432,1000.6277 L 1252.2323,967.69289 L 1254.5142,967.66334 L 1259.6361,969.43562 L 1259.6361,967.75199 L 1260.1677,967.75199 C 1260.4612,967.75199 1260.8785,968.03096 1261.0893,968.37226 L 1263.228,969.4988 L 1263.2953,967.81658 L 1264.563,969.2407 C 1264.7277,969.66996 1265.082,970.0205 1265.3605,970.0205 L 1265.8745,970.0205 L 1265.8745,962.0807 C 1269.4437,962.20076 1270.8959,961.8606 1273.4067,961.33634 L 1272.7509,945.79344 C 1282.1164,945.32114 1290.5154,945.26301 1299.7427,945.06684 C 1300.3531,950.45207 1300.3652,955.33107 1300.4693,960.94644 L 1325.9901,960.20209 L 1325.9901,949.03674 C 1333.9972,949.11075 1339.9793,948.72459 1346.9739,948.29238 L 1346.9739,933.74054 L 1350.359,930.53417 L 1351.0679,926.98961 L 1354.3466,926.26295 L 1354.3466,921.81456 L 1340.7355,921.81456 L 1340.7355,916.30275 C 1345.7426,915.7384 1350.4736,915.63428 1355.4808,915.57615 C 1354.2202,898.46962 1354.4972,881.25057 1353.0174,864.16236 z "},"ga4":{"name":"GA-4","path":"M 1985.485,1015.9593 C 1985.2815,1015.9593 1984.971,1015.5841 1984.7951,1015.1255 L 1984.4751,1014.2917 L 1981.5909,1013.5678 L 1981.5909,1011.128 L 1980.3149,1010.2983 C 1979.613,1009.842 1978.0701,1009.0223 1976.8861,1008.4766 L 1974.7333,1007.4845 L 1969.3976,1006.8213 L 1964.2935,1007.8208 L 1964.5283,999.71451 L 1965.6791,996.6878 L 1963.9281,988.45355 L 1970.1879,986.37042 L 1974.4414,990.62383 L 1971.3225,992.72091 L 1979.2664,1001.5091 L 1983.3478,1000.01 L 1987.208,1001.284 L 1987.9409,1003.5934 L 1987.1229,1013.9292 L 1986.489,1014.9442 C 1986.1403,1015.5025 1985.6886,1015.9593 1985.485,1015.9593 z "},"ar2":{"name":"AR-2","path":"M 1535.2606,928.62011 C 1531.366,928.69587 1528.8425,928.62629 1525.1764,929.31127 L 1525.7612,933.72426 L 1516.5454,934.1812 L 1517.2897,945.06684 L 1515.4111,945.06684 L 1517.1283,968.41632 L 1511.0859,968.57251 L 1507.9853,969.61285 L 1508.322,971.86367 L 1506.8826,972.84032 L 1504.5648,971.52691 L 1505.2028,968.99258 L 1502.9697,969.5774 L 1502.2786,967.96466 C 1501.8982,967.07285 1501.0718,965.75995 1500.4531,965.05813 L 1499.3366,963.78209 L 1496.8376,963.78209 L 1494.9768,961.23001 L 1495.278,967.46842 L 1485.9736,967.80513 L 1482.8012,972.8207 L 1476.5628,972.89159 L 1474.4361,974.50433 L 1475.8184,997.68572 L 1491.0246,996.56921 L 1491.4815,994.68725 L 1513.5995,992.82639 L 1513.1426,1001.9215 L 1518.2467,1001.3544 L 1518.2467,1004.0482 L 1522.0926,1004.0482 L 1523.599,1009.1524 L 1526.1866,1009.1524 L 1526.1866,1010.8538 L 1529.0222,1010.8538 L 1529.0222,1014.2565 L 1531.8114,1014.1804 L 1533.4352,1011.4209 L 1536.2708,1011.4209 C 1537.8245,1011.4209 1539.8863,1011.2614 1540.861,1011.0664 L 1542.6333,1010.712 L 1542.6333,1008.1954 L 1561.4726,1006.9902 L 1560.6396,999.51119 L 1556.4748,999.51119 L 1557.5027,990.25991 L 1556.7052,975.30189 L 1553.9759,975.83357 L 1553.9759,971.88136 L 1558.7965,970.74711 L 1562.7487,972.41305 L 1567.2857,972.69661 C 1568.2315,972.55313 1570.3799,971.89838 1572.0708,971.24334 L 1575.1546,970.05595 L 1576.6079,970.4104 C 1577.4093,970.61145 1578.4035,971.10712 1578.8055,971.50921 L 1579.5321,972.23582 L 1580.9677,971.68644 L 1580.5246,967.89377 L 1587.1529,966.90129 L 1587.2592,963.78209 L 1586.3022,963.78209 L 1586.3022,962.0807 L 1586.8162,962.0807 C 1588.1628,961.09356 1588.8263,959.44769 1589.705,958.0576 L 1588.7834,956.67523 C 1588.2818,955.90966 1587.6249,955.27516 1587.3124,955.27516 L 1586.7453,955.27516 L 1587.277,952.43951 L 1586.444,952.43951 L 1586.444,949.56842 L 1589.3683,947.28216 L 1589.5986,945.72255 L 1584.4945,946.04156 L 1578.3978,945.77575 L 1578.3624,941.09694 C 1573.8608,940.87355 1571.3793,941.10924 1568.1009,941.82354 L 1568.8453,946.30743 L 1565.9565,947.72525 L 1566.559,952.79397 L 1545.7525,954.05226 L 1544.2815,932.46592 L 1535.6151,932.82037 L 1535.2606,928.62011 z "},"sc3":{"name":"SC-3","path":"M 2094.4771,1013.625 C 2094.306,1013.5888 2093.6555,1013.4513 2093.0317,1013.3194 C 2092.4078,1013.1874 2091.3,1012.9511 2090.5698,1012.7943 L 2089.2422,1012.509 L 2089.8807,1010.8453 L 2088.7791,1007.948 L 2086.7933,1008.2108 L 2083.8809,1006.7974 L 2084.2226,1001.1954 L 2081.9727,998.94543 L 2080.43,998.94543 L 2078.4223,997.05195 C 2077.3181,996.01059 2075.4717,994.71107 2074.3193,994.16425 L 2072.2241,993.16996 L 2070.063,993.7351 L 2067.9065,992.70701 L 2066.5745,990.61652 C 2065.8418,989.46672 2064.7938,987.68027 2064.2454,986.64662 C 2063.6971,985.61291 2063.0591,984.76658 2062.8276,984.7659 C 2062.5962,984.76517 2061.5319,984.01684 2060.4627,983.10303 L 2058.5186,981.44145 L 2055.9256,980.5113 C 2054.4995,979.99975 2052.3636,979.1726 2051.1792,978.67324 L 2049.0257,977.76527 L 2049.0995,976.40456 L 2045.3929,975.88183 L 2044.2586,974.00577 C 2043.6348,972.97394 2042.4225,971.38065 2041.5648,970.46502 C 2040.707,969.54944 2040.0052,968.68015 2040.0052,968.53321 C 2040.0052,968.38626 2039.3033,967.64837 2038.4455,966.89335 C 2037.5878,966.13839 2036.5921,965.51262 2036.2331,965.50275 L 2035.5802,965.48483 L 2034.4827,963.62482 C 2033.8791,962.60178 2033.1976,961.01682 2032.9681,960.10267 L 2032.551,958.44058 L 2031.4795,957.28393 C 2030.8902,956.64772 2029.667,955.35523 2028.7613,954.41165 C 2027.8555,953.46811 2026.54,951.57005 2025.8378,950.19374 C 2025.1357,948.81743 2024.2056,947.33575 2023.7709,946.90105 L 2022.9805,946.1107 L 2020.4414,946.45506 C 2019.0449,946.64442 2017.5114,946.94937 2017.0338,947.13266 L 2016.1654,947.46591 L 2014.4742,946.76539 C 2013.544,946.38008 2012.7774,945.90443 2012.7705,945.70832 C 2012.7636,945.5122 2011.6158,944.58614 2010.2197,943.65038 C 2008.8236,942.71462 2007.6807,941.75759 2007.6801,941.52365 L 2007.6788,941.0983 L 2003.9925,941.01538 L 2002.2911,939.93103 C 2001.3553,939.33459 2000.031,938.59987 1999.3482,938.29821 L 1998.1066,937.7498 L 1996.9565,935.60078 L 1998.1422,934.41508 L 1998.3946,930.76913 L 2000.2605,929.72487 L 2000.9995,925.78582 L 2002.5347,925.78582 L 2003.2118,924.50978 C 2003.5843,923.80796 2004.3289,922.92126 2004.8666,922.5393 L 2005.8443,921.84485 L 2006.5824,916.99533 L 2020.5746,909.57417 L 2022.82,910.82928 C 2024.0839,910.2174 2025.2456,909.41582 2025.5163,909.15863 L 2026.6438,909.11927 L 2030.5732,907.86036 L 2031.5057,911.47433 L 2034.0645,910.84584 L 2034.1574,912.93911 L 2040.7248,925.47521 L 2041.3778,930.60852 L 2044.8949,938.01363 L 2051.2458,941.33473 L 2054.5847,937.25305 L 2053.8833,933.74627 C 2054.7569,930.02976 2055.2948,926.24197 2056.1438,922.5224 L 2059.8609,923.8332 L 2061.1749,926.15054 L 2067.6697,927.89526 L 2070.2743,930.24346 L 2082.7966,931.34851 L 2084.2696,932.00745 C 2082.7721,934.98108 2081.2315,938.27831 2080.0214,939.09639 L 2079.1117,942.73146 L 2074.0329,948.18497 C 2074.2883,949.58958 2074.13,951.48294 2072.7483,954.82225 L 2076.216,957.54503 L 2077.1755,955.84364 L 2081.5313,955.67526 L 2083.6653,954.11492 C 2085.9258,954.61644 2090.394,956.73704 2094.8443,958.84444 L 2097.8523,958.26942 L 2095.2561,970.93035 L 2097.0123,972.29038 L 2098.4056,974.52135 L 2096.6026,981.648 L 2094.0357,985.05764 C 2093.0134,988.14809 2092.8972,991.5406 2092.7481,994.92216 L 2094.1059,997.90214 L 2098.5673,1000.1782 L 2102.4389,999.45187 L 2104.6091,1000.1406 C 2101.2097,1004.6101 2098.2159,1009.4287 2094.4771,1013.625 z "},"ga5":{"name":"GA-5","path":"M 1952.9509,1008.5487 L 1949.206,1007.4048 L 1946.0223,1003.8416 L 1946.5863,1001.6851 L 1951.7784,998.96408 L 1952.1002,996.18572 L 1957.2082,992.00014 L 1957.9639,988.43199 C 1959.6774,987.91857 1961.5245,987.53746 1963.2439,987.04434 L 1965.0588,996.26064 L 1963.8841,999.22899 L 1963.7303,1007.8365 C 1960.6466,1008.3689 1959.0377,1008.6063 1952.9509,1008.5487 z "},"ok5":{"name":"OK-5","path":"M 1322.609,998.3783 L 1320.9103,995.54265 L 1318.6531,995.54265 L 1319.2362,994.02298 L 1317.5591,992.63113 L 1314.589,994.57723 L 1312.8818,992.13988 L 1310.2577,992.13988 L 1310.1624,994.2285 L 1307.464,995.55904 L 1301.7747,994.3696 C 1301.2923,985.11945 1301.3374,975.86924 1300.3275,966.61909 L 1294.8675,966.61909 L 1293.1975,959.57978 L 1290.9202,960.43359 L 1285.3892,960.57208 L 1285.4404,966.90265 L 1273.9415,967.2245 L 1273.663,946.22106 L 1299.1628,945.50302 L 1299.9022,961.66913 L 1325.9901,960.84237 L 1325.9901,964.82316 L 1331.0943,964.82316 C 1331.1467,964.04937 1330.6328,963.43659 1330.2375,962.81264 L 1329.3808,961.5894 L 1330.0875,960.94519 L 1331.0994,961.80473 C 1331.4849,962.26921 1332.1245,962.64919 1332.5209,962.64919 L 1333.2414,962.64919 L 1333.5679,961.7985 C 1333.7474,961.33062 1334.1246,960.9478 1334.406,960.9478 L 1334.9176,960.9478 L 1335.7788,981.648 L 1333.3476,982.01244 L 1334.0488,994.12483 L 1332.9513,997.13061 L 1332.0516,997.23548 L 1331.0943,994.4084 L 1327.1036,995.73417 L 1324.7317,993.3401 L 1322.2769,994.21864 L 1324.3279,996.79709 C 1323.8509,997.46562 1323.3154,997.99446 1322.609,998.3783 z "},"ar3":{"name":"AR-3","path":"M 1526.1334,884.9512 L 1423.873,891.86308 L 1437.1297,959.97166 L 1438.2639,987.95595 C 1442.5157,986.40179 1444.8921,987.05109 1447.9228,985.26209 L 1447.9228,979.23634 L 1452.0168,977.1805 L 1451.9813,974.13218 L 1457.5108,973.93721 L 1456.8374,968.31912 L 1462.5972,968.31912 L 1462.9517,962.93139 L 1467.7723,962.57694 L 1468.3394,956.56889 L 1470.8915,959.12097 C 1473.4788,958.17313 1474.0299,957.21547 1474.95,956.26763 L 1477.2895,957.73859 L 1481.4543,955.75364 L 1483.3152,956.46255 L 1484.9279,954.33582 L 1486.9129,954.35357 C 1486.6079,955.96569 1487.4811,957.47357 1488.6675,958.96149 L 1487.3382,960.53879 L 1492.1057,959.19186 L 1495.5794,960.98189 L 1496.9617,963.21496 L 1499.3188,963.21496 C 1501.2698,964.82175 1502.1973,966.89341 1503.0406,968.99258 L 1505.8763,968.26592 L 1505.1496,971.58011 L 1507.0105,972.28902 L 1507.9321,971.72189 L 1507.6308,969.47107 L 1511.1045,968.14189 L 1516.2618,968.03555 L 1514.7022,944.49971 L 1516.7403,944.49971 L 1515.9782,934.25595 L 1509.1196,934.57496 L 1507.365,909.33773 L 1513.3376,909.76308 L 1513.6566,911.83661 L 1534.1264,910.86189 L 1534.1264,907.06922 L 1532.9921,907.06922 L 1532.8326,906.07674 L 1534.1972,905.36783 L 1533.5592,904.33991 L 1531.5034,904.88929 L 1530.0147,903.09931 L 1531.2553,901.59285 L 1530.4755,900.22823 C 1529.642,899.70227 1528.1922,899.07764 1527.0372,898.73951 L 1527.5867,896.66592 L 1525.6194,895.10632 L 1526.9487,894.62783 L 1526.7537,893.42268 L 1524.2725,894.64552 L 1524.0953,893.59991 C 1524.4237,892.6747 1525.3715,891.91786 1526.7005,891.24275 L 1526.1334,884.9512 z "},"ca30":{"name":"CA-30","path":"M 216.69178,962.63138 C 216.53287,962.62157 215.9603,962.0047 215.41937,961.26057 L 214.43591,959.90763 L 212.86729,959.5677 C 212.00458,959.38071 209.61957,959.02762 207.5673,958.78296 L 203.83588,958.33822 L 200.56168,959.21386 L 199.38381,958.10728 C 198.73598,957.4987 197.38746,956.71544 196.38716,956.36671 L 194.56837,955.73266 L 194.56837,954.36934 L 203.45284,950.03772 C 205.49324,950.46182 207.52296,950.94343 209.57534,951.30662 L 210.50174,947.05315 C 213.50522,946.7908 213.35391,946.7059 214.62224,947.40965 L 214.20876,948.10103 L 211.33395,948.43309 L 215.6604,953.90412 L 214.97733,954.76463 C 218.38991,956.04498 220.93491,957.32527 224.64324,959.09851 C 223.87235,960.31994 221.83955,960.87096 220.49685,961.10654 L 220.14783,961.80819 L 218.45124,960.29447 L 217.71596,961.47183 C 217.31154,962.11938 216.85069,962.64119 216.69178,962.63138 z "},"ca29":{"name":"CA-29","path":"M 234.12329,962.48654 L 233.63775,961.67866 L 233.41669,957.26147 L 226.65125,957.40211 L 226.44001,951.84193 L 229.42496,951.50035 L 229.52041,949.49634 L 231.06685,949.62077 L 231.14464,952.45902 L 233.46422,955.33567 C 234.2007,954.56148 234.65045,953.92136 235.6172,953.51292 C 236.90037,954.12167 238.03899,955.3237 239.14667,956.22028 L 239.06888,957.36032 L 235.32139,959.31702 L 236.7505,961.039 L 239.66306,960.53278 L 240.4451,961.7436 L 234.12329,962.48654 z "},"ca28":{"name":"CA-28","path":"M 224.05907,958.58509 L 215.42932,954.57231 L 217.06983,952.94862 L 220.11996,954.33832 L 221.37405,953.08422 L 220.8204,952.05364 C 220.57154,951.48679 220.32252,950.40187 220.3494,949.62207 C 220.37629,948.84227 220.73476,947.51927 221.06353,946.66149 L 221.76248,945.0682 L 222.85738,944.7142 C 223.27248,946.70635 224.32813,948.09168 225.4175,949.54438 L 223.58279,953.75043 L 224.35734,955.55265 L 226.42872,955.62451 L 226.32758,956.49006 C 226.32758,956.84553 225.88097,957.47544 225.33511,957.88985 C 224.78924,958.30419 224.21503,958.61707 224.05907,958.58509 z "},"sc5":{"name":"SC-5","path":"M 2083.4967,953.55987 L 2081.5998,955.27652 L 2076.9899,955.27652 L 2076.3046,957.06218 L 2073.395,954.96936 C 2074.3232,952.76164 2074.9964,950.57944 2074.6,948.50421 L 2079.5982,943.13786 C 2080.7459,936.89576 2080.7992,940.92345 2084.5536,932.17498 L 2088.7365,934.40221 L 2089.9187,937.06255 L 2092.4064,933.19088 L 2095.6873,932.04715 L 2094.5528,923.41432 L 2092.1353,921.16202 L 2091.4597,917.78386 L 2089.9125,918.37754 L 2089.9125,916.71176 L 2091.0467,916.71176 C 2090.4825,913.29635 2089.4671,913.54021 2088.7525,909.3227 L 2082.2562,909.53532 L 2080.752,910.68398 L 2079.9877,909.48155 L 2074.3164,908.28429 L 2065.6375,894.70116 L 2105.1606,888.7771 L 2106.935,890.55154 L 2106.0022,892.85306 L 2107.6536,895.23993 L 2112.5417,890.44259 L 2121.6717,899.32746 C 2121.1723,901.68541 2121.8072,904.1379 2122.3972,906.58665 L 2178.2914,895.68541 L 2214.3633,919.78044 L 2213.4045,922.26424 L 2210.1654,920.71581 L 2207.444,923.42957 L 2198.9337,922.29237 L 2196.2019,923.23726 L 2190.7752,929.45401 L 2181.3761,929.95626 C 2180.7732,932.52433 2179.0347,933.53093 2176.2933,933.1585 C 2173.674,936.33005 2171.0109,939.46599 2168.429,942.66805 C 2166.8092,942.30804 2166.3659,941.1224 2164.0093,940.84768 L 2158.8307,947.33671 L 2156.9683,947.33671 C 2155.826,949.89736 2155.6496,952.45794 2155.6994,955.01859 L 2152.101,957.14929 L 2149.3306,955.36703 L 2147.3493,955.98622 C 2146.3086,955.04076 2145.4801,953.48898 2145.3686,949.88879 L 2143.0249,947.33671 C 2141.4539,947.15393 2138.5959,948.57997 2135.4354,950.38395 L 2127.2844,945.09049 L 2128.6069,939.79634 C 2124.5466,940.25742 2117.1779,944.3277 2111.4634,946.49311 L 2111.4634,948.59234 L 2110.2231,948.53319 C 2109.4877,945.80309 2107.8497,949.54426 2106.1324,946.20246 L 2103.7419,946.20246 L 2101.7401,950.73949 L 2100.2318,950.73949 L 2098.9732,954.34983 L 2102.0074,957.51684 L 2097.9104,956.99231 L 2097.2182,958.11216 L 2094.8467,958.40894 C 2091.274,956.58199 2087.7199,954.73638 2083.4967,953.55987 z "},"ca27":{"name":"CA-27","path":"M 224.59058,955.27652 L 224.02351,953.79875 L 225.79862,949.55033 C 224.61279,947.83579 223.67093,946.77185 222.92424,944.40676 L 221.50699,944.8684 L 220.75719,946.40685 C 220.34477,947.25301 219.98368,948.63782 219.95464,949.4842 C 219.92566,950.33059 220.10317,951.48067 220.34919,952.03997 L 220.79643,953.05694 L 220.09399,953.75939 L 217.1266,952.40736 L 215.83058,953.62901 L 212.11683,948.75522 L 214.35096,948.47097 L 215.02902,947.3738 C 214.38287,946.84904 213.85057,946.38933 212.74902,946.43379 L 212.27735,941.77715 L 217.6822,943.09992 L 218.72848,942.11873 L 223.82385,942.15123 L 225.24764,943.93394 L 226.65287,942.58911 L 227.71699,943.96224 L 226.23803,946.33046 L 229.16322,949.38371 L 229.16322,951.2313 L 226.04402,951.59018 L 226.41305,955.27652 L 224.59058,955.27652 z "},"sc4":{"name":"SC-4","path":"M 2064.7816,894.61008 C 2052.64,897.07737 2047.7707,896.28799 2039.5267,899.39523 L 2038.8532,897.80018 C 2037.672,898.92003 2037.625,901.96551 2035.6099,900.75991 L 2025.8269,905.93496 L 2022.6368,909.19595 L 2021.3254,909.47951 L 2022.8318,910.45424 C 2023.8011,910.0311 2024.6549,909.45734 2025.4725,908.7706 L 2026.4827,908.7706 C 2026.9271,908.7706 2029.2244,908.01348 2030.7007,907.44137 L 2031.6223,911.02137 L 2034.3339,910.3479 L 2034.458,912.70506 L 2041.0863,925.32367 L 2041.7774,930.60506 L 2045.2688,937.69417 L 2051.2414,940.97285 L 2054.1479,937.4106 L 2053.4922,933.74196 L 2055.743,921.9209 L 2060.0673,923.46275 L 2061.4143,925.90849 L 2067.7768,927.50354 L 2070.4529,929.78981 L 2082.8234,930.94176 L 2089.2745,933.99008 L 2089.9302,936.27634 L 2092.3051,932.59001 L 2095.0521,931.89879 L 2094.1659,923.63998 L 2091.8443,921.77912 L 2091.0467,918.3409 L 2089.5049,919.10295 L 2089.4517,916.03694 L 2090.6214,916.16097 C 2089.8264,914.32086 2088.6748,912.31164 2088.2288,910.06434 L 2082.4335,910.09978 L 2080.7853,911.32268 L 2079.7042,910.08209 L 2073.7493,908.73516 L 2064.7816,894.61008 z "},"nc2":{"name":"NC-2","path":"M 2252.3949,893.23456 L 2248.298,891.03172 L 2247.7894,889.62757 C 2244.322,886.28128 2241.3686,882.60788 2236.9791,879.8484 L 2233.9632,874.30715 L 2233.9632,870.3461 C 2235.2123,869.32357 2236.5975,868.77742 2238.0304,868.39847 L 2236.7988,870.91397 L 2240.2684,873.69335 L 2241.873,872.36173 L 2242.3907,868.49329 L 2243.9368,868.28833 L 2242.3914,866.30979 C 2243.3157,864.89061 2243.6507,863.74875 2243.6044,861.42829 L 2240.5974,864.67113 L 2239.093,861.98385 L 2239.7408,857.31292 L 2236.8704,856.59249 L 2236.5499,852.56316 L 2230.6815,853.78918 L 2227.1359,850.9169 L 2224.6501,856.10198 L 2220.3937,856.68879 C 2218.8212,856.68142 2219.0385,855.51597 2213.0992,858.3342 L 2208.9055,862.36456 L 2210.2853,866.71551 C 2211.5791,866.04063 2213.0043,865.57627 2215.2112,866.36253 L 2216.1712,868.47344 L 2215.1843,870.05675 L 2209.3873,870.95537 L 2208.2441,869.55575 L 2204.6604,873.7892 L 2202.204,868.71487 L 2202.204,864.53592 L 2200.0884,864.53592 C 2198.5486,863.26079 2196.8106,862.21688 2194.7171,861.58759 C 2195.6615,861.10757 2195.9413,860.09593 2195.9655,858.87984 L 2192.188,857.30146 L 2185.6751,850.94287 L 2186.0388,849.79682 L 2186.4026,848.65071 C 2182.8476,847.19659 2178.9509,849.45087 2175.2033,849.63405 L 2171.5853,830.27024 L 2182.638,827.852 L 2183.6822,831.61552 L 2190.9036,829.49208 L 2197.9103,835.27129 L 2199.2014,833.98028 L 2201.0697,833.91097 L 2201.0697,838.76781 L 2216.6657,841.2347 L 2221.6858,833.17569 L 2216.8199,829.24889 C 2216.7201,828.11827 2217.5488,826.55906 2218.6418,824.87781 L 2224.8891,826.02255 L 2225.8462,827.40147 C 2228.5763,823.93977 2231.7913,820.88908 2234.5297,817.4428 L 2230.9699,813.55729 L 2228.9714,813.52672 L 2227.0946,811.94001 C 2226.1856,812.02151 2224.7206,810.71269 2223.3067,809.53193 L 2217.5663,808.20689 L 2216.8646,805.01208 L 2217.6044,799.03256 L 2216.3721,795.81303 L 2219.8584,788.50818 L 2224.4491,785.47019 L 2226.1179,787.82468 L 2225.3476,790.8933 L 2233.6796,790.56482 L 2235.381,791.62699 L 2244.9339,791.90903 C 2245.2058,792.63875 2245.8853,793.28273 2247.9017,793.64518 L 2256.2003,791.94345 L 2253.7432,811.22583 L 2251.7892,811.22583 L 2238.5002,822.09445 L 2239.9768,823.17063 L 2243.1821,829.058 L 2246.5379,830.35207 L 2244.6899,840.21427 L 2245.2807,845.23824 C 2242.0093,847.79973 2240.263,847.48401 2238.8981,850.01079 L 2242.1644,853.24195 L 2247.5686,854.33611 L 2248.7217,861.13315 L 2252.2169,871.31306 L 2252.1113,883.25117 L 2255.4471,883.25117 L 2256.1788,884.43511 C 2254.8721,886.32427 2253.6091,889.21941 2252.3949,893.23456 z "},"tn5":{"name":"TN-5","path":"M 1801.4586,886.11239 L 1801.0677,885.72153 C 1800.8527,885.50653 1800.6768,884.86278 1800.6768,884.29089 L 1800.6768,883.25117 L 1797.1527,883.25117 L 1798.53,877.15851 L 1796.7797,874.46068 L 1798.4083,872.25891 L 1798.4083,869.77767 L 1794.9255,868.33506 L 1795.5239,865.95085 L 1791.9825,859.514 L 1793.658,858.42103 L 1795.1529,859.69633 C 1796.1636,860.28467 1797.5009,861.04009 1798.1248,861.37498 C 1798.7486,861.70987 1799.7056,862.34238 1800.2515,862.78066 L 1801.216,863.47965 L 1804.6467,860.99426 L 1805.8872,862.09092 L 1807.3635,861.7068 L 1808.0113,863.39475 L 1810.8496,862.10152 L 1810.3544,861.30023 L 1811.6713,859.45666 L 1813.6292,863.1181 L 1817.7175,865.2961 L 1818.3808,867.9387 L 1822.0133,867.6988 L 1822.4025,863.46082 L 1823.3255,865.67018 L 1827.9768,860.84959 L 1829.8779,863.143 L 1830.7347,861.45018 L 1830.7347,860.06582 L 1831.5536,859.50311 L 1832.2818,861.71474 L 1834.85,861.55022 L 1835.4912,859.1482 L 1836.4651,862.55545 L 1837.6191,859.43177 L 1838.3358,859.43177 C 1838.73,859.43177 1839.2168,859.59601 1839.4176,859.79677 L 1839.7826,860.16177 L 1836.6895,865.66905 L 1834.7046,865.67018 L 1834.7046,866.40745 C 1834.7046,866.81295 1834.9834,867.42357 1835.3242,867.76436 L 1835.9439,868.38406 L 1834.7144,870.6815 L 1835.582,873.306 L 1834.8783,875.24343 C 1834.1195,875.55671 1833.1642,875.8785 1832.767,875.8785 L 1831.1529,876.6042 L 1830.2953,878.25528 C 1828.8274,877.45461 1827.3926,876.58826 1825.8816,875.8785 L 1825.7221,878.55217 L 1824.2663,878.19034 L 1824.0429,880.54262 L 1822.0758,882.46853 L 1822.1545,885.09927 L 1814.0044,881.92301 L 1806.2079,881.45122 L 1801.4586,886.11239 z "},"ks4":{"name":"KS-4","path":"M 1294.2309,792.34968 C 1285.698,792.92753 1277.0211,792.1403 1268.5152,793.14724 C 1268.1326,802.16719 1269.5496,811.25259 1268.9405,820.26308 L 1231.8468,821.43278 L 1232.5557,842.41654 L 1238.0852,842.41654 L 1238.0852,866.23595 C 1286.2051,864.87592 1328.0612,864.26019 1376.6418,861.61028 L 1375.7734,838.76565 L 1353.9567,839.38592 L 1352.6806,806.61654 L 1334.5502,807.41404 C 1334.3421,808.5762 1334.1091,809.71159 1333.4514,810.65734 L 1331.8209,809.80664 L 1331.0588,804.61384 L 1326.1142,805.3582 L 1325.3344,796.37278 L 1294.2309,797.7906 L 1294.2309,792.34968 z "},"co3":{"name":"CO-3","path":"M 736.45985,597.55873 L 712.88856,845.71298 C 820.71481,853.9347 893.64768,860.15724 1004.4636,864.39278 L 1006.3068,824.83555 L 990.32081,824.83555 L 990.97661,812.64229 L 988.19411,815.19437 L 986.33321,815.19437 L 983.56851,810.37377 L 982.80641,804.93285 L 984.25961,803.7809 C 985.06091,803.15059 985.71291,802.3924 985.71291,802.09721 L 985.71291,801.56553 L 982.96591,802.25674 L 981.67211,799.84645 L 982.38101,797.61338 L 979.47451,797.61338 L 979.47451,794.90176 C 970.03051,794.98825 974.87541,793.6458 964.00251,793.18268 L 963.18731,791.85345 L 962.40751,791.95978 C 961.97281,792.02069 961.26941,792.04984 960.84791,792.01298 L 960.06809,791.94209 L 961.13141,768.33536 C 947.25382,767.88063 932.4589,767.14331 918.93351,766.29721 L 918.10056,782.86803 C 904.16383,782.24339 891.35132,781.08447 876.29252,780.03239 L 874.28987,778.2778 C 873.18732,777.30972 872.28717,776.2548 872.28717,775.9384 C 872.28717,775.622 871.58535,774.53288 870.72757,773.51041 C 869.86978,772.48782 868.35453,770.67737 867.36024,769.48731 L 865.55252,767.32513 L 863.23086,769.41642 L 855.80499,768.81384 L 850.5768,763.05397 L 850.36413,756.76236 L 848.94631,755.20276 C 848.17246,754.3507 847.25025,752.96742 846.89047,752.11899 L 846.34103,750.0986 L 848.02472,749.97457 L 848.21965,748.20229 C 848.30029,747.46253 848.38854,745.93542 848.41463,744.79952 L 848.46777,742.72592 L 851.01984,741.99932 L 852.36678,740.29793 C 853.10512,739.35519 853.60351,738.4863 853.48334,738.36612 C 853.36322,738.246 852.58682,738.05329 851.74651,737.94078 C 850.90614,737.8282 850.03701,737.56052 849.83245,737.35595 L 849.46024,736.98375 L 846.35878,737.60407 L 843.93074,734.2013 L 843.93074,732.39358 L 841.21918,732.39358 L 840.72294,728.97305 L 842.28255,727.67932 L 841.71542,726.19061 L 842.53066,724.61325 C 842.98312,723.74583 843.36174,722.71694 843.36361,722.32704 L 843.36361,721.61813 L 845.49034,721.61813 L 846.89047,718.23305 L 846.28789,716.65575 L 847.51074,715.43286 L 846.05747,713.67833 L 847.47529,711.97694 L 850.16915,711.97694 L 850.16915,709.79701 L 817.54156,706.7487 L 820.324,672.27793 L 843.15093,673.25266 C 843.46819,663.65639 844.20211,657.63206 844.83463,648.17496 L 843.89529,647.51919 L 844.6574,641.08586 L 846.19925,642.36189 L 846.19925,644.48863 L 849.88559,645.99503 L 851.95918,643.33662 L 853.00479,643.99239 L 853.00479,646.04823 L 854.74163,647.5015 L 858.37482,647.39516 L 860.23569,649.0788 L 860.90915,647.32427 L 862.61054,647.32427 L 863.81569,649.59279 L 865.81839,649.59279 L 867.32479,648.17496 L 867.83878,649.55734 L 874.04175,647.23563 L 876.75331,649.00791 L 877.46222,646.75714 L 879.65984,645.58744 L 879.65984,640.89088 L 881.92836,640.96177 L 881.92836,638.81734 L 879.89027,638.81734 L 879.25225,636.12348 C 878.90607,634.64186 878.33877,632.28118 877.9939,630.87754 C 877.64909,629.4739 877.15716,627.81504 876.89509,627.1912 C 876.63302,626.56736 875.87959,624.94861 875.21146,623.59345 C 874.54327,622.2383 873.98856,620.83766 873.98856,620.47424 L 873.98856,619.80078 L 871.72004,618.40071 L 871.72004,616.69932 L 870.58578,616.69932 L 870.58578,614.60803 L 868.31727,612.55219 L 868.33502,608.63543 L 736.45985,597.55873 z "},"ks2":{"name":"KS-2","path":"M 1377.8824,674.83001 L 1366.9652,675.34395 L 1356.0479,675.84018 L 1356.1188,680.39496 L 1350.5716,680.28863 L 1351.0856,685.74724 L 1334.9666,686.52194 L 1335.7376,703.32823 L 1301.6036,704.7815 L 1302.3479,726.15516 L 1307.2749,726.15516 L 1307.2749,730.41997 L 1308.442,731.07336 L 1307.842,734.25444 L 1314.6475,733.63417 L 1314.6475,734.66209 L 1324.2887,734.66209 L 1324.2887,736.36348 L 1329.1448,736.36348 L 1328.7017,728.42368 L 1331.2006,728.42368 L 1333.2388,725.90704 L 1335.0465,727.41345 L 1335.7554,725.57028 L 1338.2011,725.8007 C 1339.5463,725.92638 1340.9048,726.19441 1341.214,726.38553 L 1341.7811,726.72229 L 1342.2065,725.4285 L 1344.7054,726.75773 L 1344.7054,728.33503 L 1343.2875,728.90216 C 1344.2694,729.12669 1345.0763,729.37435 1345.9637,729.75285 C 1346.3845,730.17361 1347.6737,730.84061 1348.8348,731.22387 L 1350.9438,731.91503 L 1354.9137,838.58843 L 1376.3405,838.14533 L 1377.3174,861.53298 L 1420.7141,859.51684 L 1415.1779,751.65746 L 1394.0456,752.81021 L 1394.0456,748.39721 L 1384.8829,746.99714 L 1383.66,744.30328 L 1380.2927,744.30328 C 1380.5542,742.98425 1380.8475,741.66993 1381.0016,740.33338 C 1381.0016,740.09677 1381.5333,739.76046 1382.1891,739.58902 L 1383.3942,739.27001 L 1380.2041,735.10513 L 1382.4194,733.47464 L 1386.9565,733.8114 L 1387.2932,737.28506 L 1391.777,738.47246 L 1391.777,736.80652 L 1394.6127,737.3382 L 1394.6127,735.79635 L 1396.6508,735.79635 L 1397.98,737.12553 L 1400.1068,735.21147 L 1399.8055,722.75239 L 1402.8893,722.75239 L 1402.8361,719.89899 L 1399.2915,717.75457 L 1398.5117,713.57199 L 1400.5675,711.90605 L 1397.4838,712.38454 L 1395.0026,708.7514 L 1391.777,707.54625 L 1391.777,705.72078 L 1388.197,702.53068 L 1388.9592,699.50011 L 1391.2099,699.50011 L 1391.2099,695.77833 L 1392.9822,693.2617 L 1394.6127,693.2617 L 1394.6127,691.70209 C 1394.6175,690.84431 1394.8576,689.78066 1395.1444,689.32724 L 1395.6761,688.49424 L 1398.4763,690.00071 L 1399.0966,689.6108 C 1399.4383,689.39966 1399.7169,688.9657 1399.7169,688.65378 L 1399.7169,688.08665 L 1398.5649,688.79556 L 1396.3141,688.08665 L 1396.3141,685.88902 L 1398.5826,685.88902 L 1398.5826,684.27622 L 1396.0305,683.90407 L 1395.6761,680.21774 L 1392.3442,680.92665 L 1392.3442,682.41536 L 1390.058,683.14196 L 1386.602,682.37991 L 1385.8222,680.5013 L 1382.9866,680.5013 L 1382.9866,678.25048 L 1380.8598,677.84288 L 1377.8824,674.83001 z "},"ut2":{"name":"UT-2","path":"M 613.00302,592.9685 L 601.81998,594.17365 L 603.48592,597.41695 L 602.67067,600.69563 L 600.63252,600.25259 L 600.63252,602.87556 L 601.87312,604.0984 L 601.25285,605.26811 C 600.912,605.90493 600.7282,607.09466 600.63252,607.90883 C 600.19277,612.14142 597.31839,620.24388 597.31839,620.24388 L 597.95641,621.90982 L 600.18948,621.32494 L 601.46552,622.68962 C 602.16933,623.449 603.04327,624.07199 603.39728,624.07199 L 604.0353,624.07199 L 604.0353,620.24388 L 607.89886,618.40071 L 610.11423,618.34751 L 614.27906,619.78308 L 615.76777,624.69226 L 618.76295,624.72771 L 620.42889,627.08487 L 619.63133,629.10526 L 620.87193,629.17615 C 621.74395,629.16078 623.25846,629.30171 624.22156,629.49516 L 625.95839,629.84962 L 627.92559,633.14605 L 627.23443,634.24487 L 628.98896,637.62989 L 628.98896,640.96177 C 628.39914,642.40556 627.71933,643.82072 627.28757,645.32157 L 629.36116,645.62288 L 630.14097,647.18249 C 630.56932,648.04027 631.40901,649.30378 632.00183,649.98269 L 633.08295,651.22328 L 632.32084,652.42843 L 634.09312,652.42843 L 634.09312,655.13999 L 644.30143,656.54011 L 644.30143,662.72533 L 625.67483,660.27959 L 623.03411,681.63556 L 620.48203,681.36969 L 613.05621,740.90051 L 555.26223,733.51008 L 555.26223,736.23939 L 556.0952,736.93061 C 556.5283,737.29005 557.22554,738.24629 557.69025,739.12823 L 559.79926,739.19912 L 559.74609,742.03476 L 560.8449,742.03476 L 562.56401,745.47298 C 561.9451,746.95115 561.40613,748.47581 560.36639,749.7087 L 559.76381,750.06315 L 560.08282,753.07602 L 558.55866,753.09377 L 555.93569,756.39021 C 522.69048,751.93683 511.26918,750.21826 479.23154,745.82744 L 468.49154,815.81463 C 559.55109,828.98694 617.36821,835.66737 711.71886,845.80156 C 723.47487,713.27039 726.01872,687.53835 735.21925,597.43464 C 721.62609,596.32528 707.92278,595.1566 692.17067,593.60652 L 690.91232,603.21226 L 689.8844,604.24018 L 684.28401,604.31108 L 678.52413,602.1312 L 674.64282,602.69833 L 673.50856,604.11615 C 670.65551,604.53441 667.79468,604.95352 664.91305,605.10863 C 663.19742,605.16835 662.19973,604.79739 661.22671,604.27563 L 658.8873,606.1188 L 656.72512,604.78962 L 651.78044,606.5087 L 648.80302,605.37444 L 648.12955,608.75952 L 646.26869,608.75952 L 644.35463,613.17246 L 640.18975,613.95226 L 638.96691,612.72942 L 636.82242,612.72942 L 636.21985,614.99794 C 632.17764,614.08673 629.00013,610.85653 625.55074,608.65318 L 624.91272,608.44051 L 624.73549,605.35675 L 624.29245,605.35675 C 624.04796,605.35646 623.11005,606.11086 622.21886,607.02269 C 621.32762,607.9344 620.5033,608.99703 620.37569,609.37979 L 620.14532,610.071 L 616.84889,608.97219 L 614.84619,605.39219 L 614.79305,599.11833 L 613.5879,599.11833 L 613.71193,597.27516 C 613.77885,596.26136 613.64002,594.87264 613.41067,594.1914 L 613.00302,592.9685 z "},"nc4":{"name":"NC-4","path":"M 2215.8902,840.65073 L 2201.6368,838.26471 L 2201.6368,833.34385 L 2199.0636,833.39636 L 2197.8501,834.76167 C 2195.5158,832.82963 2193.2603,830.79942 2190.8734,828.93317 L 2184.143,830.93258 L 2183.2072,827.77867 L 2185.1901,827.31158 L 2180.228,802.97314 L 2201.4232,798.49316 L 2203.4056,806.98467 L 2206.741,808.89833 L 2206.741,810.78749 L 2211.7012,810.04365 L 2215.1281,812.92721 L 2217.2118,813.03219 L 2216.0167,817.10361 L 2212.484,818.81622 L 2212.4326,819.7724 L 2208.5895,818.00222 L 2210.5916,821.88983 L 2212.5936,822.77977 L 2209.537,823.83554 L 2207.9125,826.97703 L 2211.7171,829.78358 L 2216.6485,829.67855 L 2221.0549,833.34005 C 2219.3341,835.76072 2218.0009,838.54464 2215.8902,840.65073 z "},"mo3":{"name":"MO-3","path":"M 1633.8415,800.45038 L 1620.3525,789.17995 C 1622.2303,786.84372 1624.3078,784.64978 1626.0012,782.17358 L 1621.1224,778.42373 L 1617.198,780.07946 C 1615.0395,780.9901 1612.9471,781.73513 1612.5482,781.73513 L 1611.823,781.73513 L 1611.823,777.88819 C 1610.66,777.51768 1609.4861,777.23378 1608.2784,777.1051 C 1608.0445,777.15625 1607.8531,776.93195 1607.8531,776.6067 C 1607.8531,776.2814 1606.7022,774.78486 1605.2955,773.281 L 1602.7379,770.54671 L 1603.4922,753.94583 L 1605.0174,753.94583 L 1605.0174,755.08009 L 1607.4183,755.08009 L 1606.8016,752.72196 L 1608.6572,753.43405 L 1610.4052,751.24783 L 1618.1537,750.502 L 1617.4906,751.57495 L 1618.2293,753.49989 L 1621.849,752.91246 L 1621.5576,755.83947 C 1621.3973,757.44927 1621.2742,760.50683 1621.2839,762.63401 L 1621.3017,766.50166 L 1623.5512,769.54187 L 1626.5299,771.00313 L 1628.4511,774.25556 L 1632.5232,776.48874 L 1633.934,775.97163 L 1635.0352,778.86779 L 1638.1945,779.61555 L 1641.8981,782.37321 L 1644.1493,781.65869 L 1644.1493,782.05976 C 1644.1493,782.28031 1643.7342,782.7643 1643.2268,783.13532 L 1642.3043,783.80986 C 1642.8569,784.90215 1643.4062,785.99064 1644.2511,786.88319 L 1644.7501,787.21065 L 1643.6238,788.64253 C 1643.0043,789.43005 1641.5614,792.2176 1640.4173,794.83705 C 1639.2732,797.45651 1638.2474,799.69984 1638.1377,799.82229 L 1636.1883,798.59247 C 1635.4627,799.29435 1634.7083,799.9483 1633.8415,800.45038 z "},"co5":{"name":"CO-5","path":"M 881.02821,698.74963 L 880.33331,701.2015 L 878.52559,701.2015 L 878.52559,701.75088 C 878.52559,702.04862 877.91689,702.87804 877.17866,703.59404 L 873.70499,706.18157 L 873.97086,707.74117 L 870.58578,709.22988 L 870.58578,710.7186 C 868.6424,710.6819 864.03641,709.02821 864.03641,709.02821 L 861.51173,709.01721 L 857.7368,710.80724 L 853.58967,710.13377 L 852.29588,708.55642 L 850.73628,709.85021 L 850.73628,712.54407 L 847.4044,712.54407 L 846.66004,713.73147 L 848.06992,715.35283 L 846.78226,716.61787 L 847.2912,718.46297 L 846.217,721.29912 C 845.81485,721.78362 845.19589,722.18526 844.83463,722.18526 L 844.17885,722.18526 L 842.30824,726.27494 L 842.88756,727.82292 L 841.20018,729.26881 L 841.804,731.89734 L 843.85984,731.98592 C 844.20982,732.3359 844.49786,733.03846 844.49786,733.54553 L 844.53456,734.1371 L 846.8037,736.92573 L 849.14123,736.36348 L 849.797,736.77107 C 850.15872,736.99702 850.96313,737.26533 851.58697,737.35595 C 852.21081,737.44658 853.04024,737.62097 853.43014,737.76355 C 853.82004,737.90607 854.13905,738.28565 854.13905,738.59655 L 850.61225,743.16902 L 849.03489,743.16902 C 848.96156,745.40572 849.15138,748.13956 848.34373,750.54169 L 846.87272,750.54169 L 848.19004,753.3859 L 850.93001,756.29363 L 851.19339,762.74233 L 856.02873,768.30541 L 863.08233,768.79984 L 864.47146,766.98843 L 866.33232,767.00612 L 876.4343,779.46526 L 917.48024,782.3009 L 918.2246,765.71239 L 960.97191,767.52011 L 962.86831,730.74533 L 898.39284,727.28942 L 899.49165,710.45278 L 896.54967,709.10585 L 897.27628,706.2879 L 896.07113,704.03714 L 893.21779,704.03714 L 889.86816,702.30031 L 889.90485,699.36746 L 881.02821,698.74963 z "},"va4":{"name":"VA-4","path":"M 2223.7549,699.99635 L 2222.5675,700.74071 L 2222.9042,704.32071 C 2220.5439,704.35485 2218.6231,704.15595 2216.9848,703.78902 L 2216.9493,716.01773 L 2214.0073,719.8813 L 2213.7592,724.2411 C 2214.8778,729.28134 2215.793,734.38998 2217.3924,739.27001 C 2218.7913,739.9078 2220.8449,740.09036 2221.5927,741.18407 L 2226.6259,742.61959 L 2229.5679,741.14863 L 2232.4036,759.89932 L 2233.2543,760.8386 L 2235.7532,759.33219 L 2235.0797,754.0685 C 2238.1092,749.87226 2241.0005,745.80532 2243.0018,742.63734 C 2244.6101,743.92948 2245.8479,744.76509 2247.6275,745.02988 L 2250.6226,755.98256 L 2247.9819,766.91754 L 2326.3343,747.2984 L 2324.4911,740.74097 L 2327.1495,739.03959 L 2321.9922,735.72546 L 2319.1034,735.72546 L 2317.0298,731.70236 L 2316.25,732.11001 L 2316.0374,733.52783 L 2314.4954,733.52783 L 2314.3891,735.19377 L 2310.4547,736.73563 L 2308.7887,735.61912 L 2309.2849,733.63417 L 2306.6797,730.69219 L 2305.4214,730.69219 L 2305.4214,731.82645 L 2303.8086,731.82645 L 2302.5326,727.98058 L 2301.5756,727.64387 C 2301.043,727.45995 2299.58,726.68792 2298.3323,725.92474 L 2296.0638,724.52467 L 2293.494,725.14493 L 2291.7572,723.70942 L 2292.3774,720.76744 L 2291.2609,719.06605 L 2291.2432,723.62078 L 2280.5032,734.30764 L 2278.1992,728.10467 L 2273.0774,728.01602 L 2270.4366,726.73998 L 2264.3046,726.54506 L 2261.8588,725.05635 L 2261.1322,721.75991 L 2258.3497,719.15464 L 2260.8663,716.46078 L 2259.4663,714.22771 L 2260.1752,711.12625 L 2258.1725,713.83781 L 2256.9319,712.26051 L 2253.0152,712.06553 L 2251.8455,710.20467 L 2250.9061,710.68315 L 2250.2859,708.57417 L 2247.3261,709.05266 L 2249.2756,711.44526 L 2244.6677,711.40981 L 2240.4851,714.63536 L 2234.9556,716.65575 L 2232.6162,719.34962 L 2230.525,719.34962 L 2229.3552,716.26585 C 2230.1673,715.57435 2231.0065,714.90832 2232.2441,714.81259 L 2232.9884,711.69338 L 2237.8622,704.63972 C 2235.2794,704.1703 2231.9854,703.80638 2231.9428,703.00922 L 2229.816,704.19662 L 2228.7704,702.74335 C 2227.3901,702.38356 2225.2085,701.88511 2223.7549,699.99635 z "},"mo2":{"name":"MO-2","path":"M 1622.0017,757.52242 L 1622.7042,752.17321 L 1618.4662,752.96827 L 1618.1971,751.63126 L 1619.2588,749.81044 L 1609.9322,750.66402 L 1608.3649,752.95647 L 1606.8517,752.06358 L 1606.1055,752.33989 L 1606.8213,754.59508 L 1605.4746,754.50564 L 1605.3541,753.32165 L 1603.5076,753.24236 L 1602.4654,743.54072 L 1605.4725,740.33474 L 1609.9048,740.33474 L 1611.854,738.10649 L 1611.3378,737.05271 L 1605.8681,736.59555 L 1602.8058,737.72634 L 1600.4987,735.63852 L 1601.1705,732.96207 C 1599.9697,732.93779 1598.7487,732.88817 1597.6448,733.28289 L 1598.7937,735.75058 L 1591.1228,735.51415 L 1590.2894,734.37989 L 1590.2721,729.40265 L 1582.9771,730.15007 L 1582.8578,726.76528 L 1579.0051,726.65741 L 1578.2723,723.32088 L 1575.1014,723.32088 C 1574.5022,720.03136 1574.3264,718.0121 1574.3925,714.90406 L 1577.9281,714.12749 L 1577.4104,708.73926 L 1598.7015,707.13378 L 1599.0759,709.13069 C 1599.2818,710.229 1599.8505,711.8055 1600.3397,712.63402 L 1601.2292,714.14043 L 1599.7938,717.60592 L 1600.9266,719.47092 C 1601.5497,720.49669 1602.2325,722.15463 1602.444,723.15533 L 1602.8286,724.97474 L 1606.7583,728.42504 L 1609.9673,728.42504 L 1612.9572,724.1106 L 1612.9572,722.18662 L 1616.6436,722.22683 L 1622.882,723.85596 C 1625.2342,725.20749 1627.8672,726.19344 1629.9663,727.9288 L 1626.4514,728.98717 C 1625.2634,728.33327 1624.1065,727.64637 1623.1656,726.6924 L 1620.2449,725.00786 L 1619.1957,725.65631 L 1618.5072,729.55929 L 1614.6039,729.55929 L 1612.9989,733.24563 L 1615.9479,735.8766 L 1613.4514,739.25328 L 1613.8203,741.18543 L 1618.5889,742.83822 L 1621.4014,740.19602 L 1624.2998,740.92348 L 1624.2998,741.97567 L 1627.7656,742.55284 L 1626.9411,743.69146 C 1626.5209,744.18469 1625.7547,745.678 1625.2385,747.00996 L 1624.2998,749.43177 L 1624.2998,751.09499 L 1624.2998,752.7582 L 1623.6417,754.20268 L 1622.9835,755.64721 L 1622.0017,757.52242 z "},"mo5":{"name":"MO-5","path":"M 1420.7006,755.14531 L 1420.7006,754.44842 C 1420.7006,754.06515 1421.0896,753.32176 1421.565,752.79648 L 1422.4293,751.84133 L 1421.7499,750.07069 L 1416.0856,749.15104 L 1414.9995,728.74932 L 1416.8576,727.16425 C 1417.8795,726.31486 1419.0427,725.61304 1419.4424,725.60465 L 1420.1691,725.58939 L 1420.4955,726.44009 C 1420.6751,726.90797 1421.0395,727.29078 1421.3055,727.29078 C 1421.5714,727.29078 1422.415,726.61561 1423.1803,725.79033 L 1424.5715,724.28993 L 1424.0108,722.47018 L 1425.7293,724.56873 L 1427.0154,723.7739 L 1427.6385,726.15652 L 1429.2075,726.15652 L 1429.2075,727.02979 C 1429.2075,727.51009 1428.6674,728.97753 1428.0072,730.29078 C 1427.347,731.60402 1426.4326,733.10481 1425.9752,733.62583 L 1424.6954,734.61388 C 1429.0672,735.8158 1433.6834,736.28436 1438.1774,737.11957 C 1438.8901,739.60479 1438.9509,740.82695 1438.8487,743.59737 L 1424.9101,744.5882 L 1425.5212,754.79652 L 1420.7006,755.14531 z "},"ky3":{"name":"KY-3","path":"M 1838.2491,754.13996 L 1837.8238,754.40101 L 1837.8238,742.46805 L 1839.2824,740.27916 C 1839.6549,738.97119 1838.8813,737.01273 1840.3998,736.35525 L 1844.6982,737.04261 L 1848.3157,732.92259 L 1848.3157,729.55929 L 1848.8423,729.55929 C 1849.1319,729.55929 1849.7517,729.94211 1850.2196,730.40999 L 1856.6444,733.46959 L 1857.9786,732.65916 L 1862.1944,731.53177 L 1865.4951,731.64565 L 1867.9362,735.30453 L 1872.2768,734.37989 L 1873.1728,735.84195 L 1867.7393,736.62424 L 1865.4006,734.55201 L 1861.3596,735.88567 C 1861.1333,738.79147 1860.876,740.76797 1860.123,743.20912 L 1854.2856,747.14028 L 1847.0375,747.14028 L 1838.6745,751.75677 L 1838.6745,752.81781 C 1838.6745,753.40138 1838.4831,753.99636 1838.2491,754.13996 z "},"ks3":{"name":"KS-3","path":"M 1394.6127,752.35361 L 1394.6127,747.85356 L 1385.1077,746.47249 L 1383.8616,743.73751 L 1380.8787,743.73751 L 1381.6587,740.62965 L 1382.3226,740.20731 C 1382.6878,739.97501 1383.3176,739.78105 1383.7222,739.77629 L 1384.4578,739.76761 L 1380.7585,735.16423 L 1382.528,733.86028 L 1386.601,734.09632 L 1386.9565,737.61229 L 1392.3442,739.20048 L 1392.3442,737.42265 L 1394.9991,738.07978 L 1395.1063,736.04878 L 1396.1546,736.00885 L 1398.0469,737.52836 L 1400.7111,735.51868 L 1400.4236,723.32088 L 1405.9553,723.32088 L 1408.2238,725.62932 L 1410.6586,724.32623 L 1411.627,726.05659 L 1414.1786,725.77586 L 1415.1453,751.00254 L 1394.6127,752.35361 z "},"va2":{"name":"VA-2","path":"M 2344.0925,648.54711 L 2328.3901,654.59061 L 2327.309,658.09972 L 2326.2811,658.41873 C 2325.7216,658.59624 2325.2709,658.96396 2325.2709,659.23397 C 2325.2709,659.50387 2324.7605,659.88657 2324.1366,660.08467 C 2323.5128,660.28265 2323.0024,660.65208 2323.0024,660.89991 L 2323.0024,661.34296 L 2325.6253,660.84672 L 2326.9191,662.40632 L 2325.395,666.89021 L 2324.0657,667.59912 C 2323.3294,667.98409 2322.4636,668.37501 2322.1517,668.48526 L 2321.5846,668.69793 L 2323.0733,670.50566 L 2321.9036,672.70328 L 2322.5061,673.30585 L 2321.9745,674.35147 C 2321.6778,674.92773 2321.0831,676.67318 2320.663,678.23279 L 2319.9009,681.06843 L 2320.0604,703.18645 L 2320.8225,704.60427 C 2321.2434,705.38804 2322.3434,707.08115 2323.2682,708.3615 L 2324.9519,710.7009 L 2328.2129,710.43503 L 2331.0485,705.66764 L 2331.403,702.61932 L 2330.9599,702.05219 C 2330.7213,701.74027 2330.407,700.77337 2330.251,699.90771 L 2329.9675,698.33041 L 2330.6586,697.92276 C 2331.0392,697.6967 2331.6513,696.92971 2332.0233,696.22137 L 2332.6968,694.94533 L 2332.0587,693.91741 L 2332.8562,691.45397 C 2333.2951,690.10517 2333.8265,687.34927 2334.0437,685.32189 C 2334.2607,683.29441 2334.4245,680.99754 2334.3981,680.21774 C 2334.3715,679.43793 2334.354,677.01335 2334.3627,674.83001 C 2334.3714,672.64657 2334.6454,669.19808 2334.9653,667.17378 L 2335.5501,663.50513 L 2338.0667,658.95041 L 2341.7354,658.9681 L 2341.9657,658.09972 C 2342.1016,657.62866 2342.4777,655.84527 2342.7987,654.12982 C 2343.1196,652.41425 2343.544,650.46407 2343.738,649.78771 L 2344.0925,648.54711 z M 2309.1255,715.36196 L 2306.981,718.23305 L 2307.1937,720.46612 L 2307.6462,721.39723 L 2308.2001,720.97824 L 2308.7547,721.61433 L 2307.3051,722.67877 L 2306.9467,723.26297 L 2307.6722,723.67397 L 2308.8774,722.16751 L 2310.561,722.22071 L 2310.561,716.79754 L 2309.1255,715.36196 z M 2325.1823,723.76256 L 2322.7011,726.10196 L 2319.0148,725.90704 C 2316.9931,725.79373 2314.5625,725.5164 2313.6093,725.30447 L 2311.8725,724.93226 L 2310.5964,726.47417 L 2311.518,727.98058 L 2315.5943,726.50962 L 2317.9869,728.68949 L 2317.4552,732.11001 L 2319.2806,735.22922 L 2321.9568,735.22922 L 2324.4556,736.70018 C 2325.8367,737.50953 2327.1114,738.41172 2327.2913,738.70288 L 2327.628,739.23457 L 2325.1114,741.27266 L 2326.8128,747.13892 C 2330.6393,746.2474 2334.4348,745.18567 2338.1908,744.03741 C 2338.2766,743.96005 2336.8504,741.63585 2335.0184,738.86236 C 2333.1865,736.08882 2330.5081,731.65183 2329.0813,729.0085 L 2326.4938,724.20566 L 2325.1823,723.76256 z "},"va3":{"name":"VA-3","path":"M 2262.3196,694.36051 L 2262.3196,696.25682 L 2257.499,701.67998 L 2251.2606,700.01404 L 2248.7085,700.65206 L 2248.7085,701.50276 C 2248.7085,701.96582 2248.1981,703.29851 2247.5743,704.46249 C 2246.9504,705.62646 2246.44,707.04962 2246.44,707.63484 L 2246.44,708.6982 L 2250.4985,707.93615 L 2251.1011,710.25781 L 2252.0404,709.69068 L 2253.1038,711.56929 L 2257.3395,711.83516 L 2258.2257,713.27068 L 2260.7246,709.9388 L 2260.0334,714.22771 L 2261.4335,716.46078 L 2258.9168,719.15464 L 2261.6993,721.75991 L 2262.4082,725.0386 L 2264.3046,725.96018 L 2270.1708,726.15516 L 2273.3786,727.48434 L 2278.341,727.60843 L 2280.5918,733.66962 L 2290.676,723.62078 L 2290.676,716.58486 L 2289.5418,715.87595 L 2289.5418,718.81793 L 2287.9467,719.4382 L 2284.5794,717.68368 L 2284.2073,716.74434 L 2283.073,716.19496 L 2279.3335,716.53167 L 2279.2449,715.80506 C 2279.1974,715.41147 2279.1164,714.84094 2279.0677,714.52902 C 2279.0189,714.2171 2278.7921,712.73877 2278.5537,711.23259 L 2278.217,708.98177 L 2276.4624,709.12355 L 2275.4345,706.42969 L 2275.7712,705.10051 C 2275.9507,704.36517 2276.4687,703.30685 2276.9409,702.7611 L 2277.8093,701.76863 L 2281.1944,701.76863 L 2282.6477,699.78368 L 2282.0451,699.07476 C 2281.7207,698.68401 2281.1503,698.36585 2280.769,698.36585 C 2280.3877,698.36585 2279.6135,697.8543 2279.0499,697.2316 L 2278.022,696.09734 L 2276.675,697.2316 L 2276.3029,696.8417 C 2275.9736,696.04539 2275.853,695.27455 2275.9307,694.39595 L 2274.7255,694.39595 L 2275.4168,696.57583 L 2274.8496,697.30249 L 2273.9457,696.68216 C 2273.7498,696.36514 2273.3876,696.09734 2273.1305,696.09734 C 2272.8734,696.09734 2272.5221,696.62953 2272.3507,697.28474 L 2272.0317,698.48989 L 2270.8265,697.72783 L 2270.8265,695.53021 L 2269.7277,695.53021 L 2270.3835,697.2316 L 2269.4442,697.2316 C 2268.9319,697.2316 2267.9258,696.84311 2267.1934,696.36315 C 2266.4608,695.88319 2265.6382,695.55806 2265.3679,695.63655 C 2265.0977,695.71481 2264.2975,695.45841 2263.5956,695.06942 L 2262.3196,694.36051 z M 2294.0079,713.1112 L 2294.7523,714.2986 L 2293.6358,715.66328 L 2294.1675,719.11919 L 2297.517,720.99781 C 2298.1791,720.70159 2298.6929,720.24052 2299.183,719.68632 L 2299.183,716.85068 L 2295.5498,713.1112 L 2294.0079,713.1112 z M 2306.4493,719.91674 C 2305.2298,720.78309 2304.5106,722.17721 2303.6137,723.35496 L 2305.5809,726.35008 L 2306.3253,725.26902 C 2306.7215,724.69571 2307.2669,724.21337 2307.5836,723.83345 L 2306.7861,723.30177 L 2307.3178,722.52196 L 2308.6115,721.63583 L 2308.2216,721.15734 C 2308.2216,721.15728 2307.8888,721.46359 2307.5481,721.77761 C 2307.1886,720.98845 2307.0526,720.43879 2306.4493,719.91674 z M 2315.5943,727.12988 L 2313.4853,727.7679 C 2312.3257,728.12134 2310.7382,728.47477 2309.9584,728.56546 L 2308.5406,728.74269 L 2308.8242,730.12506 L 2307.6013,730.12506 L 2309.6749,733.59872 L 2309.3204,735.26467 L 2310.5964,736.27483 L 2313.9283,735.12288 L 2313.9815,733.24427 L 2315.6829,733.20882 C 2315.6906,731.86717 2316.1894,731.56755 2317.3311,731.22387 L 2317.3311,728.56546 L 2315.5943,727.12988 z "},"in4":{"name":"IN-4","path":"M 1771.5938,580.279 L 1761.9703,581.43101 L 1762.7501,585.93259 C 1760.9811,586.4438 1759.22,586.55371 1757.451,586.6415 L 1763.5122,628.23682 L 1757.4687,627.33298 L 1758.1954,623.82388 L 1754.066,623.82388 L 1750.9291,628.69761 L 1754.066,628.60902 L 1754.8458,635.41457 L 1759.1879,635.41457 L 1759.9854,641.74157 L 1765.2667,641.29853 L 1766.0289,646.40269 L 1784.8859,643.95694 L 1787.1366,658.09972 L 1789.2811,658.09972 L 1788.0228,668.48526 L 1791.0357,667.72315 L 1792.2054,675.78704 L 1789.9014,677.78969 L 1795.1978,716.89276 L 1812.2498,714.15682 L 1813.5613,708.60962 L 1811.2396,696.27457 L 1797.4159,697.88731 L 1794.6157,675.98196 L 1809.4673,673.37675 L 1809.0774,668.41437 L 1822.9721,665.56097 L 1822.405,662.88486 L 1818.1161,663.75325 L 1816.3615,654.32474 L 1807.8546,655.79576 L 1805.8342,652.42843 L 1802.9099,653.84625 L 1802.9454,652.41068 C 1803.1079,650.8999 1804.021,649.49547 1804.9835,648.299 L 1804.0087,645.14434 C 1803.744,644.19644 1802.3086,643.88384 1801.244,641.35167 L 1801.244,639.88071 L 1803.3885,640.55417 L 1805.2139,638.7287 L 1800.6414,609.98236 L 1797.2741,609.23801 L 1797.2741,607.05813 L 1779.2323,609.32665 L 1777.8854,601.31596 L 1774.4471,601.68811 L 1773.5433,595.60922 L 1774.6421,594.47497 L 1773.5256,593.12803 L 1774.0218,590.04427 L 1776.2903,590.04427 L 1776.2903,587.20863 L 1771.6292,587.20863 L 1772.3559,583.30962 L 1771.5938,580.279 z "},"co2":{"name":"CO-2","path":"M 858.25958,709.79327 C 857.70884,709.91452 856.5751,709.93018 855.74017,709.82809 L 854.22208,709.64247 L 853.54396,708.82541 C 853.17102,708.37607 852.53561,708.0084 852.13193,708.0084 C 851.72824,708.0084 851.31288,708.26361 851.20887,708.57548 L 850.41687,709.23777 L 818.41647,706.2608 L 821.0155,672.91743 L 843.72118,673.81213 L 845.47355,647.6092 L 844.45414,646.94809 L 844.83179,641.68401 L 845.71436,642.65754 L 845.96219,644.77355 L 849.88559,646.6592 L 851.99808,644.07026 L 852.54417,644.57353 L 852.53289,646.26947 L 854.71463,648.07623 L 858.25181,647.93133 L 860.44688,649.59415 L 861.2302,647.76584 L 862.3517,647.8441 L 863.84455,650.16128 L 865.98183,650.16128 L 867.02949,648.89641 L 867.89572,650.08001 L 874.04465,647.79907 L 876.78427,649.59415 C 877.27643,648.79665 877.35668,647.82964 877.8498,647.09441 L 880.22697,645.55993 L 880.22697,641.58249 L 884.23067,641.90615 L 883.63411,645.56005 L 885.33527,648.96934 L 888.72976,652.1701 L 889.55488,655.63327 L 911.80305,657.1618 L 910.24027,661.74896 L 912.53096,663.4888 C 912.76938,664.73064 912.98966,665.98388 913.39646,667.17514 L 923.08477,663.20626 L 924.99736,666.44399 L 923.95186,672.86786 L 924.51445,678.23415 L 921.91093,682.70068 L 917.83464,683.49205 L 916.79055,682.06935 L 913.19932,681.28053 L 912.1101,683.14871 L 908.20462,683.00529 L 906.49286,680.78623 L 903.99222,680.78623 L 901.26404,683.73002 L 899.96572,699.56726 L 880.59022,698.27676 L 880.19136,700.0686 L 879.50025,700.13575 C 879.12016,700.17273 878.61774,700.17273 878.3838,700.13575 C 878.14986,700.09883 877.92653,700.32381 877.88757,700.63573 C 877.8486,700.94765 877.78049,701.39426 877.73631,701.62821 C 877.69208,701.86215 877.15688,702.62777 876.54687,703.32959 C 875.93693,704.03141 875.22115,704.60563 874.95625,704.60563 C 874.6914,704.60563 874.11009,704.97024 873.6645,705.41583 C 873.21891,705.86142 872.8543,706.45629 872.8543,706.73781 C 872.8543,707.01927 872.21628,707.59105 871.43648,708.0084 L 870.01866,708.76722 L 870.01866,710.27692 L 869.30974,710.26835 C 868.91984,710.2637 867.58,709.89206 866.33232,709.44256 L 864.0638,708.62533 L 859.87726,708.57553 L 859.56908,709.07421 C 859.39957,709.34847 858.81032,709.67208 858.25958,709.79327 z "},"ca4":{"name":"CA-4","path":"M 180.50642,445.10681 L 169.17343,493.64514 L 174.37865,494.85029 L 164.35283,540.25603 L 157.03823,538.63279 L 156.00538,543.94236 L 159.7996,545.53251 L 161.14971,548.41661 L 160.00904,548.58471 L 160.53669,551.85094 L 159.40815,552.18345 L 159.40815,554.18613 C 157.94841,554.7777 156.84022,554.76781 155.43825,554.52286 L 154.74709,556.10896 L 156.82471,557.43277 L 156.16491,559.41434 L 157.35316,561.66496 L 156.29674,563.65642 L 153.73687,565.86543 L 152.49627,573.68119 L 153.32927,574.63822 L 163.96194,593.99665 L 167.34795,592.2901 L 167.34795,593.1231 C 167.34795,593.58429 167.02418,594.67873 166.63904,595.55109 C 166.25396,596.42356 165.48562,597.47252 164.91996,597.8905 L 163.89204,598.65261 C 164.65435,600.39074 164.68565,599.70678 163.64392,607.54944 L 161.25132,607.37221 C 160.86142,607.43034 160.1727,607.51048 159.72716,607.54944 C 159.28157,607.5884 158.52218,608.02775 158.02578,608.52416 C 157.52948,609.02057 156.66898,609.51942 156.12947,609.62297 C 155.58985,609.72653 154.96317,609.82946 154.72934,609.8534 C 154.4954,609.87727 154.30388,610.28158 154.30399,610.75723 L 154.30399,611.62567 L 150.90122,612.29914 L 149.92069,614.76002 L 147.01677,625.66426 C 143.8047,625.86095 142.30117,626.29066 140.40934,627.18627 L 138.84974,632.09545 L 136.29766,631.45743 L 133.76173,642.80261 L 150.05053,647.72693 C 150.56532,652.04051 150.68751,656.42827 151.59244,660.68231 L 158.2739,661.32033 L 158.2739,660.59366 L 162.20835,660.34555 L 164.06927,661.16079 C 166.66554,662.36974 168.48205,664.64846 170.89091,666.12833 L 187.10887,665.98139 L 187.78234,665.14845 C 188.15562,664.69866 188.78928,664.3332 189.18241,664.3332 L 189.89132,664.3332 L 190.4762,662.15327 L 193.71944,662.52548 L 194.48155,661.88746 C 194.90394,661.54179 195.46818,660.68804 195.73984,659.9734 L 196.23607,658.66191 L 199.14261,658.66191 L 205.11521,655.57815 L 208.44709,651.48416 L 208.46479,651.46647 L 208.50023,651.44871 L 210.89283,649.81822 L 205.32788,642.16198 L 244.45976,459.19207 C 221.13962,454.83071 204.16029,450.80308 180.50642,445.10681 z "},"ca3":{"name":"CA-3","path":"M 127.56036,641.73664 L 125.2564,644.0406 L 126.70967,646.75221 L 127.43627,646.75221 C 127.83684,646.75221 128.8132,646.46229 129.6162,646.09644 L 131.08716,645.42297 L 132.4164,646.75221 L 134.79125,646.75221 L 135.97865,647.93961 L 135.46472,653.32733 L 136.36855,654.08944 C 136.86983,654.50542 137.29002,655.16403 137.29013,655.5604 L 137.29013,656.28706 L 135.58875,656.92508 L 135.58875,660.80634 L 134.17093,661.95835 L 128.94274,662.73815 L 128.25152,660.93043 L 126.62102,660.93043 L 127.18815,663.0926 L 125.36274,665.85736 L 120.94974,667.32832 L 116.73172,666.53082 L 119.63825,653.34508 L 119.07112,652.4235 L 115.45568,652.4235 L 112.28333,650.77525 L 108.08301,650.54488 L 104.68023,652.28171 L 103.26241,651.76772 L 103.26241,650.29676 C 102.43394,650.02749 101.57712,649.86081 100.72808,649.76508 L 98.654494,653.9299 L 99.363404,656.76555 L 105.03469,658.21881 L 107.63996,655.77307 L 114.87086,656.10983 L 115.2962,658.30746 L 112.70868,666.01683 L 115.59746,674.36429 L 119.23066,673.8326 L 120.24083,671.13874 L 122.29667,671.13874 L 124.90194,672.98191 L 125.53996,672.34389 C 125.88795,671.99584 126.4738,671.70587 126.8337,671.70587 C 127.19371,671.70587 128.1943,672.36833 129.06677,673.17683 L 130.66182,674.64785 L 137.36102,675.10864 L 139.16875,675.10864 C 140.16417,675.10518 142.16092,674.73536 143.61719,674.2934 L 146.27561,673.49584 L 148.63271,674.11617 L 148.63271,674.75419 L 149.89105,687.86904 L 159.63858,706.38931 L 160.24115,705.64495 C 160.56657,705.23089 161.57192,704.50009 162.49192,704.03221 C 163.41191,703.56433 164.87045,702.51417 165.71746,701.6928 L 167.24162,700.20409 L 167.63152,697.51023 L 170.20135,697.15577 C 176.07207,692.09409 180.63594,685.27097 187.00254,680.77993 L 190.56257,677.20101 L 197.68934,676.1897 L 202.7935,682.00277 L 205.34558,681.15208 C 206.74769,680.68125 208.53556,680.22738 209.31548,680.1596 C 210.09528,680.09178 211.2102,680.07567 211.79667,680.12416 L 212.86003,680.2128 L 212.25746,683.91683 L 214.19406,686.29957 L 215.55389,684.74983 L 215.55389,682.48132 L 218.10597,682.46357 L 220.40993,677.64297 L 219.63013,674.2402 C 219.19554,672.37701 218.83626,670.00959 218.85033,668.95881 L 218.88578,667.04475 L 221.34927,664.42178 L 211.19409,650.24357 L 210.68016,650.61577 L 208.46479,652.84884 C 207.05763,654.27613 205.91259,655.67207 205.91271,655.9326 L 205.91271,656.3934 L 205.11521,656.3934 C 204.67914,656.3934 203.21159,657.03516 201.85422,657.81122 L 199.39073,659.22904 L 196.27152,659.22904 L 196.27152,661.32033 L 194.10934,663.28753 L 190.84207,662.87647 L 190.60023,664.90033 L 188.62218,665.16898 L 187.65825,666.54852 L 170.48491,666.54852 C 169.22422,665.69397 167.72417,665.05481 166.78083,663.83696 C 166.78083,663.6079 165.79533,662.85231 164.5832,662.17102 L 162.36788,660.93043 L 159.40815,660.93043 L 159.40815,662.17102 C 156.61604,661.87849 153.76987,661.86517 151.02531,661.24944 L 149.57204,648.47129 L 127.56036,641.73664 z "},"oh2":{"name":"OH-2","path":"M 1909.9909,651.29417 L 1910.7885,655.4413 L 1905.5957,654.64375 L 1905.5957,652.42843 C 1904.4283,652.75946 1903.4593,653.89366 1902.6005,655.459 L 1903.9475,659.19853 L 1902.6714,661.60883 L 1899.6408,660.91761 L 1899.8712,662.92031 L 1895.3873,663.20387 L 1895.3873,665.45464 L 1898.0812,666.1281 L 1898.7192,670.02711 L 1896.8052,673.42989 L 1898.2762,674.36922 L 1899.1446,677.66566 L 1903.6107,678.03781 L 1906.1628,680.41266 L 1906.1628,681.91912 L 1910.0263,686.20803 L 1910.8239,690.39061 L 1912.1176,691.41853 L 1919.1713,692.18058 L 1922.6982,690.35516 L 1928.8657,691.13496 L 1930.8683,693.66929 L 1933.4558,694.50229 L 1934.4661,697.16071 L 1936.6105,697.39107 C 1937.7954,697.51437 1938.9641,697.65762 1939.198,697.71008 L 1939.6234,697.79873 L 1939.6234,694.41365 L 1944.1073,692.12744 L 1947.4923,692.12744 L 1948.2012,693.2617 L 1953.1813,693.2617 L 1955.9815,694.53774 L 1956.6018,696.94803 L 1958.4095,694.39595 L 1961.8123,694.39595 L 1963.8681,693.29714 L 1964.5239,689.94751 L 1966.8456,689.2209 L 1967.5368,686.45615 L 1969.0432,686.08394 C 1969.8665,685.88312 1971.1349,685.24238 1971.8788,684.66612 L 1973.2435,683.62051 L 1975.636,683.51417 L 1972.8004,682.71662 L 1972.4459,680.21774 C 1970.7721,680.2863 1969.1107,680.15081 1967.5899,678.99484 L 1965.3037,673.05774 L 1976.15,671.3386 L 1974.7854,657.74526 L 1948.2721,660.88216 L 1948.1303,669.72585 L 1937.6384,673.90843 L 1925.0553,675.68071 L 1923.0172,661.92784 L 1916.3888,662.61899 L 1915.1483,651.29417 L 1909.9909,651.29417 z "},"ne3":{"name":"NE-3","path":"M 973.80321,488.93583 C 972.04701,531.94628 970.29571,571.35562 968.53961,612.56989 C 1003.5264,614.57531 1027.3688,614.97406 1061.6373,615.90177 C 1061.4653,636.67581 1061.1706,656.91345 1060.7511,678.21503 C 1148.7496,679.14807 1208.0121,679.36784 1302.1176,676.70863 L 1300.9124,634.12078 L 1279.6273,634.72335 L 1278.2095,590.77088 L 1283.4555,590.68229 L 1282.7111,569.46811 L 1256.2333,570.07068 C 1256.1286,558.39298 1256.0166,555.94486 1255.4889,547.50959 L 1277.3234,547.50959 L 1276.4904,531.06286 L 1282.3212,530.37167 L 1282.3035,513.8186 L 1286.8582,513.48187 L 1286.8582,511.07157 L 1290.6155,511.67415 L 1292.1751,509.72464 L 1292.0865,505.52434 L 1290.1724,504.97494 L 1287.5849,505.63068 C 1286.4299,503.71484 1284.7311,503.10702 1282.6048,502.36969 L 1282.7643,500.43791 C 1278.0433,499.94989 1274.0549,500.78055 1256.6232,500.95187 L 1254.7623,499.95939 C 1253.0869,500.28896 1253.4626,502.52329 1252.8128,503.80524 L 1249.9641,506.42115 L 1245.2877,506.51919 L 1240.6373,502.17474 L 1238.2447,502.1393 C 1236.402,500.34589 1234.2885,499.79422 1233.1582,499.87078 C 1232.3195,498.4695 1230.6383,497.10484 1225.697,495.77682 L 1224.4564,492.78167 C 1138.7507,493.29459 1059.8681,492.37447 973.80321,488.93583 z "},"oh3":{"name":"OH-3","path":"M 1925.5783,675.11494 L 1923.5436,661.36445 L 1916.8639,661.97014 L 1915.7022,650.7284 L 1909.4171,650.7284 L 1910.0614,654.69831 L 1906.1628,654.00981 L 1906.1628,651.98403 L 1905.3492,651.67182 L 1903.3009,653.45232 L 1902.0661,655.54509 L 1903.3477,659.08907 L 1902.6386,660.93672 L 1899.6868,660.54994 L 1898.608,647.72574 C 1896.5629,646.35306 1896.7515,645.38651 1896.5216,644.34384 L 1891.0707,645.06693 L 1887.435,625.40889 L 1901.0675,622.87762 L 1902.2993,623.63899 L 1900.9448,631.9252 C 1902.8243,633.12757 1904.7037,633.54792 1906.5832,633.71454 L 1907.9813,643.42044 L 1933.3229,641.3507 L 1934.6736,651.44378 L 1944.7275,650.01632 L 1944.8651,655.77954 C 1945.7645,658.06779 1946.6638,657.99871 1947.5632,658.10108 L 1947.5632,669.28213 L 1937.6384,673.34708 L 1925.5783,675.11494 z "},"in5":{"name":"IN-5","path":"M 1829.1609,670.10169 L 1828.3457,659.80246 L 1826.2671,659.80246 L 1825.5017,654.69831 C 1823.8892,655.13641 1822.3474,655.46852 1821.0639,655.41311 L 1822.2746,662.48697 L 1818.4594,663.02875 L 1816.8738,653.69409 L 1808.0495,655.28704 L 1807.0782,653.89763 L 1816.4582,651.76438 L 1817.1167,649.14039 L 1820.6587,647.90563 C 1820.0961,644.42534 1819.6965,640.99937 1819.6299,637.68444 L 1813.0362,639.55478 L 1807.766,636.8663 L 1805.2139,637.16025 L 1801.0314,609.56342 L 1797.8412,608.76088 L 1797.8412,606.49237 L 1794.4639,606.71218 L 1793.2666,599.24219 L 1802.9454,597.86827 L 1798.9302,570.96765 L 1809.1838,569.36188 L 1809.1838,566.42244 L 1820.5263,564.44839 L 1820.5263,567.41527 L 1836.7656,564.71257 L 1840.1645,585.79217 C 1837.992,585.70307 1836.2215,586.09638 1835.0655,587.22712 L 1837.6515,603.53819 C 1831.2519,604.58851 1824.8092,605.42401 1818.4462,606.68201 L 1822.3807,633.71454 C 1827.1589,633.58773 1830.9739,632.22254 1835.9723,631.84801 L 1836.6802,635.8833 L 1835.7721,636.07595 L 1836.3134,640.82872 L 1834.5876,642.53498 L 1836.059,649.7006 L 1831.8689,648.90078 L 1831.8689,653.0103 L 1836.2523,652.30939 L 1838.7712,668.71909 L 1829.1609,670.10169 z "},"ca2":{"name":"CA-2","path":"M 173.74509,495.3505 L 168.40956,494.18177 L 180.03319,445.00347 L 87.391504,422.2699 L 84.988484,427.27831 L 82.914914,427.27831 L 82.188284,428.46573 L 80.203334,427.82771 L 78.732344,430.59247 L 77.420854,430.09623 L 77.190464,437.59296 L 72.919274,443.72504 L 74.148994,444.77668 L 73.646474,446.57127 L 74.744714,447.9785 L 75.365014,454.23464 L 73.202834,457.53736 L 79.724254,459.31479 L 79.919764,470.66365 L 80.799334,473.90177 L 79.080794,473.39953 L 78.360164,477.04385 L 76.192554,478.75753 L 78.324434,481.92418 L 75.034284,486.18299 L 72.188054,487.96821 L 69.906404,486.25969 L 67.088484,486.02386 L 68.098674,490.81444 L 67.549274,498.22256 L 56.188975,544.00048 L 83.978284,550.34524 L 83.978284,554.74048 L 81.497094,556.12189 L 80.697924,558.65593 L 80.646404,564.23989 L 81.762934,568.51108 L 80.308694,575.57733 L 86.813924,577.17754 C 86.626804,580.89824 85.388824,584.53246 84.261844,588.05932 C 83.726594,589.61893 82.878864,591.37884 82.365514,591.95833 L 81.426204,593.00395 L 81.621154,594.17365 C 81.727264,594.81428 82.184344,595.6939 82.631354,596.14091 C 83.078364,596.58792 83.828674,597.69813 84.297294,598.60434 L 85.147984,600.25259 L 86.122734,600.27028 C 86.660604,600.28021 87.590834,600.66296 88.196304,601.12098 L 89.295114,601.95398 L 91.669964,601.95398 L 92.981454,605.44533 L 92.626994,606.38467 C 92.434344,606.90773 92.091204,607.4693 91.864914,607.62526 C 91.638684,607.78122 91.379484,608.86206 91.280064,610.01781 L 90.702614,612.30918 L 93.584024,615.45873 L 93.074244,618.39458 L 95.754574,622.06833 L 92.875114,621.20091 L 91.740854,622.31741 L 92.786504,625.98605 C 94.127054,626.35083 95.531864,626.58772 96.685514,627.38612 C 96.838974,627.63447 97.358234,630.35879 97.855214,633.44731 L 98.759074,639.06546 L 99.219864,639.36672 C 99.469974,639.53413 99.973944,640.86269 100.3364,642.32645 C 100.6989,643.79027 100.99214,645.90566 100.99214,647.02296 L 100.99214,649.0611 L 103.82778,650.12447 L 103.82778,651.29417 L 104.82026,651.27642 C 105.36612,651.2665 106.28563,650.91289 106.85838,650.47892 L 107.90402,649.68137 C 111.41357,649.94112 112.85533,650.00072 115.63115,651.8613 L 119.58333,651.8613 L 120.20362,653.47404 C 119.28616,657.59837 118.3213,661.7125 117.43887,665.84454 C 118.28188,666.28293 119.99952,666.47774 120.93736,666.60245 L 125.14828,665.36605 L 126.53065,662.22909 L 125.82174,660.36823 L 127.64719,660.36823 L 127.64719,658.71999 L 126.90283,658.27694 C 126.48939,658.02752 125.9737,657.36364 125.76857,656.80593 L 125.3964,655.79576 L 126.38887,655.42355 C 126.92946,655.21887 127.69817,654.71203 128.10798,654.30704 L 128.85234,653.58038 L 129.34857,651.32962 L 126.93828,650.23081 L 127.48768,647.32427 L 126.22937,647.32427 L 124.70521,643.88605 L 127.41679,641.15675 L 133.17669,642.52137 L 136.13737,630.69419 L 138.65303,631.1611 L 139.6455,627.01397 C 142.03389,625.92503 143.48843,625.10292 146.61055,625.34803 L 150.21568,611.56391 L 153.7348,611.32833 L 153.88138,609.15974 L 157.08471,608.75952 L 160.17072,606.77457 L 163.34085,606.77457 C 163.60493,604.88626 163.87311,602.99823 164.08521,601.10328 C 164.1084,600.79136 163.91371,600.05857 163.65986,599.47279 L 163.19907,598.40942 L 164.35105,597.48784 C 164.98708,596.9819 165.82054,595.96555 166.19422,595.23702 C 166.5679,594.50843 166.73861,593.52973 166.58412,593.37513 L 163.54321,594.81683 L 153.27432,575.97239 L 151.65638,574.51975 L 153.06067,565.53559 L 155.91501,563.40692 L 156.84175,561.75645 L 155.596,559.13573 L 156.12768,557.64702 L 154.16045,556.21147 L 154.94026,553.78345 C 156.44003,554.03845 157.40619,554.22674 158.83927,553.74801 L 158.83927,551.47949 L 160.06214,551.47949 L 159.31778,548.07672 L 160.5761,548.07672 L 159.40639,545.8791 L 155.40105,544.44355 L 156.6062,537.99246 L 163.78392,539.67613 L 173.74509,495.3505 z "},"ca5":{"name":"CA-5","path":"M 131.59248,661.7172 L 129.38532,662.21667 L 128.74059,660.50531 L 128.1353,660.35434 L 128.1353,658.57798 L 126.51293,657.56956 L 125.9796,655.9313 L 127.65458,655.22023 L 129.09246,653.97578 L 129.89595,650.71179 L 127.48916,649.89302 L 127.86447,647.42811 L 130.90614,646.23663 C 131.94731,647.13417 133.40329,647.10332 134.54323,647.0922 L 135.46069,647.88454 L 134.91061,653.63227 L 136.6786,655.72759 L 135.01986,656.36408 L 135.01986,660.2307 L 134.31095,660.79335 C 133.92105,661.10278 132.69775,661.51848 131.59248,661.7172 z "},"md5":{"name":"MD-5","path":"M 2272.209,604.2978 L 2270.2594,604.91365 C 2269.1677,605.2664 2267.2962,606.24935 2266.0946,607.11127 L 2263.897,608.68863 L 2259.3776,606.33147 L 2258.8282,604.8782 L 2254.0574,604.06023 L 2253.4494,601.47821 L 2251.5271,601.83675 L 2250.7957,600.86605 L 2250.2981,600.92946 L 2250.4099,602.02487 C 2250.4052,602.76486 2250.0564,604.48677 2249.6479,605.85298 L 2248.9035,608.33417 L 2250.2504,608.92648 C 2250.9897,609.66585 2251.7226,611.02803 2251.8809,611.02803 L 2256.3293,608.21009 L 2257.3927,609.27345 L 2259.4308,608.19239 C 2260.8716,610.8436 2262.5326,613.40742 2263.4539,616.29167 L 2263.4539,617.19556 L 2255.2305,621.73259 L 2253.281,623.75298 C 2252.2061,624.86433 2251.107,625.77338 2250.853,625.77338 C 2250.6766,625.87654 2250.4515,625.98651 2250.1972,626.11008 L 2250.4277,627.82922 L 2246.9185,630.399 L 2247.6451,634.72335 L 2245.5362,636.26526 L 2243.0372,641.1213 L 2243.0372,642.55682 C 2243.0372,643.34637 2243.4518,645.26009 2243.9588,646.81028 L 2244.8804,649.62823 L 2247.078,650.81563 L 2249.7542,649.0611 L 2250.4808,646.75714 L 2252.1113,646.75714 L 2252.1113,646.11912 C 2252.1113,645.7658 2252.6625,645.00006 2253.3342,644.41774 C 2254.0058,643.8353 2254.7571,643.35437 2255.0001,643.35437 C 2255.2431,643.35437 2255.9378,644.05619 2256.542,644.91397 C 2257.1461,645.77176 2257.8001,647.02823 2258.013,647.71417 L 2258.4029,648.97246 L 2259.6612,649.34467 C 2260.347,649.54985 2261.2846,650.1577 2261.7525,650.70929 L 2262.6032,651.71952 L 2265.5983,652.41068 L 2266.2186,650.03583 L 2267.7073,650.53206 L 2268.0795,653.06645 L 2269.6391,653.66902 L 2273.9457,652.23345 L 2279.0499,652.49932 L 2281.5134,654.09437 L 2282.2754,656.48692 L 2284.0123,655.81345 L 2285.5719,657.10724 L 2285.5719,655.26407 L 2287.3087,655.26407 L 2287.9645,656.96546 L 2289.9317,656.96546 L 2290.9596,658.09972 C 2291.5242,658.72356 2292.2371,659.23397 2292.537,659.23397 L 2293.0686,659.23397 L 2291.6863,653.58038 L 2286.7061,648.61801 L 2286.7061,645.55199 L 2284.9516,643.77972 L 2285.6428,640.58962 L 2284.5972,639.5617 C 2284.0205,638.99553 2282.4563,637.78023 2281.1235,636.86784 C 2279.7906,635.95527 2278.2463,634.55163 2277.6853,633.74863 L 2276.6574,632.29536 L 2275.913,627.47477 L 2273.6622,623.78843 L 2273.6622,621.23635 L 2273.1128,621.23635 C 2272.8118,621.23635 2272.3095,620.7582 2271.9962,620.17298 L 2271.4291,619.10962 L 2272.5457,616.80566 C 2273.1599,615.53438 2273.6622,614.22602 2273.6622,613.89912 L 2273.6622,613.29655 L 2271.8722,613.29655 L 2272.2621,611.45338 C 2272.4789,610.43964 2272.9316,609.28411 2273.2546,608.88355 L 2273.8394,608.15695 L 2272.209,604.2978 z "},"md4":{"name":"MD-4","path":"M 2236.3912,593.96098 L 2236.6748,596.53081 C 2235.7521,597.93059 2235.5753,598.41243 2234.4949,599.11833 L 2233.9277,599.11833 L 2232.8112,596.1586 L 2229.3376,596.77893 C 2229.5401,598.49982 2230.1799,600.14308 2230.5781,601.82989 L 2232.4745,602.57424 L 2233.8746,600.53615 L 2234.7784,601.97167 L 2236.1785,600.85516 L 2238.9787,604.16929 L 2242.4701,605.90612 L 2243.1081,603.74395 L 2244.5614,602.5211 L 2248.1946,603.24771 L 2247.0958,608.26328 L 2246.5286,609.34434 L 2248.2105,609.10586 L 2250.7085,610.59361 L 2251.922,612.25479 L 2251.7959,613.61528 L 2253.8127,614.55484 L 2253.8127,615.21061 C 2253.8119,615.56711 2252.8968,617.37262 2251.7746,619.23365 L 2249.7364,622.61873 L 2250.1441,625.77338 C 2250.4309,625.67805 2250.7598,625.55277 2251.1011,625.33028 C 2252.8734,623.68209 2254.5059,621.36305 2256.4179,620.38566 L 2262.8867,616.98289 L 2262.869,616.13219 C 2262.8661,615.66431 2262.0397,613.81791 2261.0259,612.0382 L 2259.1827,608.81266 L 2257.5345,609.82289 L 2256.2939,608.79497 L 2252.0482,611.59908 L 2250.1816,609.26358 L 2248.3718,608.26328 L 2249.9137,602.9819 L 2249.5238,601.10328 L 2247.1844,601.42229 C 2245.1038,599.0923 2243.1586,597.08336 2240.8574,595.85734 C 2240.1805,595.12053 2240.2344,595.08111 2238.3584,595.11299 C 2237.4756,595.12847 2236.9441,594.68475 2236.3912,593.96098 z "},"ia5":{"name":"IA-5","path":"M 1384.6348,455.67019 L 1310.784,459.1793 L 1310.2523,461.9086 L 1314.0982,465.08098 L 1313.6374,471.12444 L 1311.741,472.17009 L 1313.0525,473.72969 L 1312.3613,474.84623 L 1315.9945,475.20068 L 1316.473,477.18563 C 1316.7299,478.27736 1317.2073,479.63913 1317.5364,480.21623 L 1318.139,481.26187 L 1317.3769,485.71029 L 1315.3742,486.79138 L 1315.8172,492.9589 L 1314.0804,494.67801 L 1314.7539,496.41484 L 1314.2931,497.14147 C 1314.0463,497.54083 1313.8218,498.33375 1313.7792,498.91375 C 1313.7364,499.49375 1313.4277,500.14402 1313.1057,500.3493 C 1312.7837,500.55458 1311.974,501.94154 1311.298,503.43306 L 1310.0574,506.14464 L 1310.4473,506.76494 L 1315.3033,511.42603 C 1315.9439,513.0806 1316.7817,514.69407 1317.0401,516.4593 C 1316.9684,516.69324 1317.1505,516.88463 1317.4477,516.88464 L 1317.9972,516.88464 L 1318.0503,520.85454 L 1321.4708,520.85454 L 1322.7469,523.63702 L 1321.0101,526.29543 L 1321.1873,529.73365 L 1322.162,530.72613 C 1322.7049,531.26906 1323.1545,532.03024 1323.1545,532.42751 L 1323.1545,533.15415 L 1325.423,535.20999 L 1325.423,537.79751 L 1324.2887,538.50642 L 1324.3242,540.42048 L 1325.299,541.59019 C 1325.8344,542.2292 1326.7203,542.92309 1327.2662,543.13207 L 1328.2586,543.50425 L 1328.2586,548.00583 L 1330.5272,548.71474 L 1330.5272,550.34524 L 1332.2285,550.34524 L 1332.2285,551.97573 L 1334.7806,552.33019 L 1334.8693,556.30009 L 1333.9299,557.5584 L 1335.0642,559.01167 C 1335.6896,559.80678 1336.1984,560.8199 1336.1984,561.28019 L 1336.1984,562.13088 L 1338.467,562.71573 L 1338.467,563.76137 C 1338.4624,564.33644 1338.1237,565.44503 1337.7226,566.22484 L 1336.996,567.64269 L 1338.6442,568.90098 L 1337.8821,570.88593 L 1336.1984,570.23021 L 1336.1984,570.74415 C 1336.1984,571.02782 1336.4902,571.43394 1336.8365,571.64804 L 1337.4568,572.03794 L 1336.8542,575.79516 L 1338.4493,577.12434 L 1337.8289,579.64098 C 1338.3729,580.20527 1339.0428,580.59392 1339.6721,580.75754 L 1339.8848,578.98526 L 1342.1533,578.98526 L 1342.5255,581.60823 L 1341.2671,583.11464 L 1342.1887,583.4514 C 1342.6901,583.64377 1343.7224,583.80586 1344.4927,583.80586 L 1345.8928,583.80586 L 1345.5561,592.54315 L 1348.3917,593.21662 L 1348.7462,595.60922 L 1346.6903,597.13338 L 1346.6903,600.53615 L 1350.0754,601.10328 L 1350.4653,603.08823 L 1348.5512,603.08823 L 1348.9588,604.08071 C 1349.1837,604.62657 1349.4643,606.82714 1349.5792,608.97219 L 1349.7918,612.8712 L 1351.6704,614.25358 L 1351.1033,617.26645 L 1352.6452,618.54249 L 1352.6452,621.11226 L 1350.9615,621.76803 L 1351.2097,622.49464 C 1351.3429,622.89639 1351.5659,624.18916 1351.7059,625.36573 L 1351.954,627.49246 L 1349.8095,628.64447 L 1349.8273,629.33563 C 1349.8384,629.71453 1350.4127,630.68347 1351.1033,631.48011 C 1351.7939,632.2767 1353.0654,633.35544 1353.9212,633.89041 C 1354.777,634.42527 1355.421,635.06244 1355.3568,635.29048 C 1355.2926,635.51852 1355.6097,636.29044 1356.0657,637.00962 L 1356.8986,638.3211 C 1391.536,637.22484 1424.3371,635.87457 1458.2197,632.77385 L 1455.5259,597.47009 L 1424.1388,599.96902 L 1422.2425,571.98474 L 1420.1335,571.43536 L 1419.3891,555.85702 L 1403.1374,556.28236 L 1402.393,534.97959 L 1391.9543,535.74167 L 1391.2099,519.15316 L 1388.4806,519.15316 L 1384.6348,455.67019 z "},"ia2":{"name":"IA-2","path":"M 1550.9453,518.49741 L 1530.1565,520.50009 L 1534.1264,569.62764 L 1529.0222,569.62764 L 1530.7236,591.58613 L 1498.8226,594.22685 L 1500.2227,610.30137 L 1457.4222,613.93457 L 1458.84,632.7384 C 1491.2135,630.24014 1515.4522,627.29816 1543.9802,623.91246 L 1547.4539,627.95325 L 1549.6161,628.32546 L 1549.7401,629.2116 C 1549.8119,629.70302 1550.5088,630.78759 1551.282,631.6219 L 1552.6821,633.14605 L 1554.543,633.14605 L 1554.543,634.81199 L 1557.0242,637.11595 L 1560.6042,637.11595 L 1560.4978,629.86731 L 1558.3002,627.43932 L 1560.6751,623.2213 L 1564.3437,620.66922 L 1568.0832,620.66922 L 1571.0961,618.0817 L 1571.61,608.5114 L 1572.4253,607.60751 C 1572.8802,607.10481 1573.2582,606.41858 1573.2582,606.1011 C 1573.2582,605.78357 1574.1409,604.61256 1575.2255,603.49583 L 1577.2104,601.47543 L 1576.8382,592.02922 L 1574.2862,587.77576 L 1572.5139,587.77576 L 1568.1186,583.16784 L 1570.7062,571.20494 L 1573.6481,569.69853 L 1576.0407,570.3188 L 1579.3903,567.92625 L 1582.4564,567.92625 C 1581.8689,564.92261 1581.5493,562.90081 1581.7652,559.98642 L 1576.218,559.98642 L 1574.2559,538.43489 L 1553.1252,540.0483 L 1550.9453,518.49741 z "},"oh4":{"name":"OH-4","path":"M 1922.964,540.10147 L 1902.8663,543.82325 L 1905.0994,558.46226 L 1901.2713,559.41929 L 1899.0737,561.08523 C 1897.1452,560.95855 1895.6433,561.25848 1894.6962,562.11316 L 1895.4228,564.39939 L 1884.6119,566.31345 L 1884.6119,569.06051 L 1882.2193,569.06051 L 1883.6372,577.56744 L 1881.2091,577.56744 L 1884.2397,597.13338 L 1885.6221,598.83477 L 1886.9867,607.05813 C 1893.8778,605.63407 1899.6644,605.49853 1906.0033,604.71873 L 1907.297,613.91682 C 1915.1664,612.85022 1923.121,612.51533 1930.9747,611.34704 L 1929.7873,598.48031 L 1927.1465,599.13603 C 1926.6857,593.14766 1926.0475,587.17483 1925.6224,581.18289 L 1938.5955,578.61306 L 1939.3576,582.72474 C 1943.2385,582.04135 1948.7446,581.84053 1954.8295,581.8918 L 1955.184,584.94011 L 1967.7849,583.68177 L 1965.6227,571.04546 C 1970.125,570.11747 1975.253,569.40328 1979.6946,568.20982 L 1977.621,558.51543 L 1975.3525,558.28504 L 1975.3525,555.39623 L 1972.6941,552.89731 L 1970.9927,542.38771 L 1957.4525,544.83345 L 1960.2527,562.44989 L 1933.3141,567.9617 L 1932.1976,563.40692 L 1933.4736,561.01434 L 1931.1873,558.5686 L 1929.3619,550.20345 L 1925.0021,550.91236 L 1922.964,540.10147 z "},"ia3":{"name":"IA-3","path":"M 1495.5616,507.08395 L 1474.5778,508.53722 L 1474.5778,513.39326 L 1475.9425,513.83632 L 1477.0236,529.09563 L 1487.9054,529.07791 L 1489.5182,550.69969 L 1441.5426,554.31514 L 1442.3756,569.84031 L 1443.9529,571.41761 L 1443.9529,575.60018 L 1458.397,574.60771 L 1465.3443,575.86605 L 1466.7976,596.84982 L 1456.3411,597.57642 L 1457.3868,613.2611 L 1499.6556,609.76969 L 1498.2378,593.67741 L 1530.1033,590.82407 C 1530.021,583.51656 1528.7093,576.35503 1528.4551,569.06051 L 1533.5592,569.06051 L 1529.4475,520.50009 L 1497.4225,523.12306 L 1496.7491,512.6489 L 1495.5616,512.259 L 1495.5616,507.08395 z "},"ne2":{"name":"NE-2","path":"M 1346.4516,610.11547 L 1346.2744,608.19375 L 1342.9684,608.19375 L 1342.3583,606.60386 L 1338.5773,605.89456 L 1336.8199,603.21243 L 1327.6802,602.40342 L 1325.4172,599.52649 L 1327.0521,597.29496 L 1323.7945,594.50429 L 1323.6305,592.06365 L 1321.0559,590.25383 L 1344.7564,588.94467 L 1344.5292,593.13904 L 1347.1733,593.76328 L 1347.6828,595.43336 L 1345.8023,596.44307 L 1345.6103,601.67177 L 1347.9855,602.01817 L 1348.7237,606.50825 L 1348.6061,609.69931 L 1347.5162,610.44162 L 1346.4516,610.11547 z "},"in2":{"name":"IN-2","path":"M 1779.8092,608.87941 L 1778.4494,600.76317 L 1774.8877,601.10464 L 1774.1659,596.00048 L 1775.3682,594.5361 L 1774.153,592.7856 L 1774.7212,590.61276 L 1776.8574,590.61276 L 1776.8574,586.64286 L 1772.269,586.64286 L 1772.9628,582.94473 L 1771.732,579.70744 L 1764.5641,580.47505 C 1762.4303,566.37432 1761.474,559.01791 1760.4107,546.84413 L 1755.9817,547.59242 C 1755.1472,542.5188 1754.741,539.6933 1754.4418,533.97737 L 1761.1901,528.51215 L 1798.6329,523.02291 L 1799.2295,523.78258 C 1799.5577,524.2004 1801.0384,525.11315 1802.52,525.81092 L 1805.2139,527.07959 C 1805.3578,528.91801 1804.9663,529.9 1804.0397,531.63136 L 1799.0656,531.63136 L 1798.3462,534.90645 C 1799.6375,543.73132 1800.6075,550.09397 1802.2199,558.8118 L 1801.0151,559.21338 L 1802.0947,564.80839 L 1804.5022,564.47801 L 1805.1077,566.79334 L 1808.6166,566.79334 L 1808.6166,568.84171 L 1798.3372,570.36479 L 1802.4851,597.27204 L 1792.6807,598.7062 L 1793.9688,606.85068 L 1779.8092,608.87941 z "},"md2":{"name":"MD-2","path":"M 2279.9538,564.43484 L 2278.6954,565.05514 L 2278.7663,566.56157 L 2273.3786,572.37464 L 2271.819,572.76454 C 2270.9583,572.97886 2270.1253,573.35549 2269.9758,573.59754 L 2269.71,574.04058 L 2271.3582,575.40526 L 2266.5199,579.94229 L 2264.1451,577.88645 L 2261.2562,579.4283 L 2259.4131,578.7017 L 2259.6257,577.0712 L 2260.5828,577.19523 L 2259.2358,575.75972 L 2256.9851,576.92942 C 2257.8746,577.86433 2258.4542,578.67748 2259.0764,579.37516 L 2256.8787,579.12704 L 2255.4786,578.55992 L 2254.9469,578.15226 C 2254.1671,577.54941 2252.9396,576.7341 2252.2176,576.34454 L 2250.9061,575.63563 L 2249.9137,577.23068 L 2248.8149,578.61306 L 2246.316,578.63081 L 2245.7311,580.2613 L 2246.2451,580.54487 C 2246.4827,580.92904 2246.743,581.63092 2246.8299,582.10447 C 2246.9169,582.5778 2246.7791,583.93896 2247.1489,584.6388 L 2247.8578,585.98573 L 2249.3465,584.72744 L 2250.5694,586.35794 L 2252.7316,585.24137 L 2252.6784,584.692 C 2252.6784,584.30941 2252.521,583.84329 2252.324,583.64632 L 2251.9695,583.27417 L 2249.701,584.49702 L 2248.7085,582.95516 L 2249.1693,578.94982 C 2249.6094,578.27335 2249.9166,577.78301 2250.5694,577.4788 L 2252.5721,578.20546 C 2254.0323,578.74015 2255.4857,579.19544 2255.7976,579.21563 L 2257.7826,579.60553 L 2259.4308,579.74731 C 2259.8268,580.14549 2260.258,580.50437 2260.8132,580.81068 L 2260.4764,583.4514 C 2261.1591,583.045 2261.6476,582.88484 2262.3196,582.99061 L 2262.6209,582.12217 C 2262.4909,581.99388 2262.3699,581.83809 2262.2133,581.64368 L 2261.7525,580.97021 L 2262.5677,579.78276 L 2265.8287,580.86388 C 2265.0149,581.71735 2264.7481,582.34136 2263.4539,582.52982 L 2263.064,583.18553 L 2262.7273,583.859 L 2262.6386,585.50724 C 2262.6813,586.59897 2262.5953,587.27833 2262.0892,587.33266 L 2262.1424,593.46474 L 2258.5978,593.57108 L 2257.2686,594.68764 L 2258.5624,596.76117 L 2257.1978,599.77405 L 2257.818,600.76652 L 2259.608,600.07536 L 2259.0409,595.85734 L 2263.1172,593.92553 L 2264.4286,595.71556 L 2268.558,595.71556 L 2268.558,595.32566 C 2268.558,595.10873 2267.9008,594.22543 2267.0871,593.37615 L 2265.5983,591.83424 L 2266.2895,590.71774 L 2270.543,591.12533 L 2271.8545,588.34289 L 2271.2342,583.73497 L 2273.5913,583.13239 L 2272.5634,580.43853 L 2273.7154,579.72962 L 2275.3636,580.36764 L 2275.3636,582.17536 L 2276.551,581.43101 L 2276.2143,578.98526 L 2278.1638,578.96751 L 2279.0145,577.85101 C 2279.4832,577.23051 2279.8729,576.37817 2279.8829,575.97239 L 2279.9006,575.24573 L 2284.03,571.47081 L 2283.197,570.12388 L 2281.6906,570.69101 L 2280.4855,569.25543 L 2281.5134,565.71088 L 2279.9538,564.43484 z "},"ia4":{"name":"IA-4","path":"M 1385.4323,455.42207 L 1389.03,518.51514 L 1391.5821,518.39108 L 1392.3442,535.17454 L 1402.9601,534.37702 C 1403.5802,541.31639 1403.0843,549.07772 1404.1121,555.9988 L 1419.9563,555.28989 L 1420.7006,570.86823 L 1422.9691,571.47081 L 1424.7592,599.13603 C 1443.169,597.59253 1451.7862,596.88878 1466.2127,596.1586 L 1464.7949,576.53952 L 1458.84,575.54704 L 1443.3858,576.45088 L 1443.3858,571.98474 L 1441.8085,570.40744 L 1440.9932,553.87207 L 1488.9156,550.13256 L 1487.4269,529.45009 L 1476.5628,529.64504 L 1475.3901,514.07021 L 1474.1879,513.76543 C 1473.8462,504.66022 1472.5839,495.57053 1472.5043,486.45464 L 1514.9149,482.82147 L 1514.1351,472.20553 L 1554.4544,468.53692 L 1554.419,465.55949 C 1555.0777,464.29436 1555.8322,463.06619 1556.2444,461.69593 C 1556.2463,461.44118 1556.9163,460.35653 1557.7331,459.28563 L 1558.7256,457.33613 L 1556.3685,454.07514 L 1551.4238,452.39147 L 1551.7428,448.42157 L 1550.0946,447.05692 L 1550.7149,443.15791 C 1495.7303,448.60829 1440.5887,452.23443 1385.4323,455.42207 z "},"oh5":{"name":"OH-5","path":"M 1855.2984,518.28474 L 1867.5803,592.87992 L 1871.0008,592.1887 L 1871.0008,589.58348 L 1875.5378,588.80368 L 1874.8821,586.18071 L 1881.8649,584.83378 L 1880.518,577.00031 L 1883.0346,577.00031 L 1881.6699,568.56427 L 1884.0448,568.36929 L 1884.0448,565.78177 L 1894.6607,563.90316 L 1893.7568,561.63464 L 1895.476,560.92573 C 1896.2058,560.73033 1897.265,560.57554 1897.8331,560.57127 L 1898.8787,560.55355 L 1900.5801,558.85217 L 1904.4437,557.85969 L 1901.8207,543.14979 L 1923.7083,539.17989 L 1925.516,550.22118 L 1929.9822,549.63632 L 1931.719,558.53316 L 1934.0407,561.01434 L 1932.7647,563.40692 L 1933.509,567.39457 L 1959.4729,562.25494 L 1956.7081,544.44355 L 1971.3471,541.73197 L 1972.4459,547.15514 L 1984.8519,545.57781 L 1984.3025,540.13692 L 1982.1226,539.97741 L 1981.5909,536.02524 L 1973.8815,537.38989 L 1971.2762,524.75355 L 1971.1168,523.99147 L 1948.2012,527.66009 L 1946.3403,519.15316 L 1941.3248,520.35831 L 1941.3248,518.58603 L 1924.7362,521.49256 L 1923.1443,520.53459 L 1923.1766,519.22405 L 1919.4903,518.86959 L 1918.5176,512.32471 L 1911.391,513.60593 L 1910.7176,516.60108 L 1905.5602,520.35831 L 1901.9594,520.23001 L 1900.5269,517.18593 L 1897.2305,517.52266 L 1896.4976,509.94986 L 1855.2984,518.28474 z "},"nj2":{"name":"NJ-2","path":"M 2342.6834,588.91138 L 2343.1268,583.949 C 2343.3706,581.21969 2343.5531,578.13996 2343.5323,577.10512 L 2343.4943,575.22367 L 2342.0458,573.47827 L 2336.0766,573.97326 L 2335.6881,572.80764 L 2333.7404,573.59533 C 2332.6693,574.02856 2331.5888,574.717 2331.3393,575.12521 C 2331.0899,575.53343 2330.6605,575.86742 2330.3851,575.86742 L 2329.8844,575.86742 L 2329.1515,573.55852 L 2323.3459,570.75781 L 2321.3641,571.38682 L 2319.4754,568.50433 L 2316.7745,569.18216 L 2316.0755,567.36049 L 2313.9926,567.36049 L 2312.4581,565.1697 L 2307.9195,563.75318 L 2308.2451,557.18566 L 2306.975,556.51688 C 2306.2765,556.14904 2305.5358,555.58819 2305.329,555.27053 L 2304.9531,554.69297 L 2306.481,552.33156 L 2307.2671,545.26188 L 2308.768,543.2575 L 2310.5899,545.80958 L 2312.187,545.80958 L 2312.7645,544.8171 C 2313.0822,544.27124 2313.7251,543.33479 2314.1933,542.73609 L 2315.0445,541.64756 L 2317.2024,543.60042 L 2319.9649,540.07064 L 2323.092,541.49545 L 2322.1517,545.49332 L 2326.6755,545.8624 L 2334.39,549.81856 L 2334.9473,549.47414 C 2335.2538,549.28471 2336.2665,547.62036 2337.1978,545.77558 L 2338.8909,542.42144 L 2336.0668,540.57095 C 2334.5134,539.55319 2333.124,538.42285 2332.9791,538.05908 L 2332.7156,537.39769 L 2336.4783,535.61217 L 2336.569,533.58927 L 2337.988,533.15354 L 2342.5683,534.03506 L 2345.0248,536.27635 L 2347.1994,535.58721 C 2348.3953,535.20817 2350.2349,534.53492 2351.2872,534.09109 L 2353.2006,533.28413 L 2353.781,533.86448 L 2352.939,535.15821 C 2352.4759,535.86977 2351.9179,537.41697 2351.6989,538.59644 L 2351.3007,540.74093 L 2354.9526,546.37671 L 2355.8779,546.37671 C 2356.3869,546.37671 2357.0619,546.11812 2357.3779,545.80207 L 2357.9525,545.22743 L 2360.5894,548.03424 L 2362.7739,546.86512 L 2364.3918,548.20787 L 2364.039,549.70259 C 2363.845,550.52468 2363.0181,552.47138 2362.2013,554.0286 L 2360.7164,556.8599 L 2359.6798,557.63624 C 2359.1096,558.06323 2357.537,560.13829 2356.1851,562.24749 L 2353.727,566.08239 L 2352.568,570.266 C 2351.9306,572.56695 2351.4521,574.83241 2351.5047,575.30029 C 2351.5573,575.76817 2351.146,577.68223 2350.5906,579.55375 C 2350.0352,581.42528 2349.1514,583.81204 2348.6266,584.85765 L 2347.6725,586.75873 L 2346.3199,587.83508 L 2344.9674,588.91138 L 2342.6834,588.91138 z "},"md3":{"name":"MD-3","path":"M 2250.3568,578.01048 L 2250.0554,578.29405 C 2249.8969,578.45262 2249.6481,579.52386 2249.5061,580.6689 L 2249.2579,582.74249 L 2249.9137,583.80586 L 2252.2708,582.54751 L 2253.2987,584.35523 L 2258.332,583.87675 L 2258.651,584.40843 C 2258.8311,584.69988 2259.2259,584.94011 2259.5194,584.94011 C 2259.813,584.94011 2260.0818,584.74871 2260.122,584.51477 C 2260.2405,583.30797 2260.3261,582.09296 2260.3879,580.88157 L 2259.4131,580.36764 C 2258.8729,580.07852 2257.8184,579.83596 2257.0737,579.83596 C 2256.3289,579.83596 2254.5091,579.4173 2253.0329,578.91437 L 2250.3568,578.01048 z M 2262.7981,580.29675 L 2262.2133,580.89932 L 2262.5855,581.5019 C 2262.6664,581.6329 2262.8035,581.7393 2262.9576,581.8386 C 2262.7964,582.26531 2262.5146,583.18553 2262.5146,583.18553 L 2262.5146,583.69952 L 2263.383,582.05127 C 2263.501,582.08485 2263.6245,582.10447 2263.7374,582.10447 C 2264.1685,582.10447 2264.6751,581.86219 2264.854,581.57279 L 2265.173,581.0588 L 2262.7981,580.29675 z M 2261.1677,587.20863 C 2260.987,587.20863 2260.1877,587.91045 2259.3954,588.76823 C 2258.6029,589.62601 2257.9348,590.26041 2257.7294,590.84177 L 2257.5522,592.36593 L 2254.752,591.71021 L 2253.8304,593.94328 L 2251.4201,594.82942 L 2251.3492,596.37127 L 2249.0275,597.98407 L 2252.8734,597.98407 L 2254.876,596.17635 L 2256.1698,596.97385 L 2254.0431,601.56407 L 2254.4861,603.58447 L 2258.9168,604.32883 L 2259.6257,605.53398 C 2259.8749,606.03191 2260.1279,606.33538 2263.8261,608.17464 L 2266.0591,606.54414 C 2267.4592,605.7348 2268.4871,605.04953 2270.2594,604.59464 L 2272.1558,604.0984 L 2272.014,603.72625 L 2270.6671,602.84011 L 2269.3201,601.95398 L 2263.9324,603.79714 L 2260.6891,599.96902 C 2260.9214,598.96248 2261.1508,597.95481 2261.4689,596.97385 L 2266.5731,597.93088 L 2268.239,596.28269 L 2263.4539,596.28269 L 2263.4539,595.432 C 2263.4539,594.96411 2263.3064,594.5813 2263.1349,594.5813 L 2259.6789,596.2118 L 2260.2106,599.88038 C 2259.4346,600.48437 2258.6281,601.00937 2257.7294,601.38685 C 2257.5104,601.38685 2257.1837,601.00772 2257.0028,600.53615 L 2256.6838,599.66771 L 2257.9952,596.76117 L 2256.7015,594.68764 L 2258.456,593.21662 L 2261.4512,593.16348 L 2261.4867,587.20863 L 2261.1677,587.20863 z "},"in3":{"name":"IN-3","path":"M 1838.1546,569.69048 L 1837.3866,563.90131 L 1821.0935,566.81495 C 1821.1005,565.85926 1821.1337,564.89027 1820.9517,563.96146 L 1805.5557,566.43134 L 1805.2139,563.82547 L 1802.4491,564.35399 L 1801.6877,559.84744 L 1802.8455,559.13185 L 1798.9031,534.8326 L 1799.5642,532.19849 L 1804.4647,532.19849 C 1805.2453,530.38682 1805.8209,528.91704 1805.781,526.76349 L 1799.3561,523.03593 L 1853.296,514.87172 L 1860.0379,554.60007 L 1856.2824,555.64422 L 1856.9694,560.49661 L 1849.3413,561.24889 L 1844.9129,564.02182 L 1844.9129,568.39504 L 1838.1546,569.69048 z "},"pa4":{"name":"PA-4","path":"M 2064.9804,556.01789 L 2055.5036,510.49027 L 2057.2119,510.04205 L 2057.5465,510.58343 C 2057.7305,510.88118 2058.5802,511.30027 2059.4347,511.51473 L 2060.9883,511.90467 L 2061.9315,515.46819 L 2073.7493,514.64802 L 2075.9579,516.32386 L 2073.6488,521.13948 L 2075.5146,527.66146 L 2079.0606,527.66146 L 2081.1455,536.16839 L 2098.5707,532.14116 L 2099.8629,538.54849 C 2099.2651,540.3011 2098.6099,541.53777 2097.2094,542.43048 L 2097.5114,545.21397 L 2099.1231,544.4449 C 2101.0638,545.83894 2102.9719,547.20553 2105.0832,548.36925 L 2108.0606,549.95975 L 2108.0606,552.04799 L 2102.4934,552.74663 L 2102.9595,550.77151 L 2099.2155,549.84053 L 2096.711,547.17314 L 2095.0517,547.11582 L 2092.6301,548.61654 L 2079.0607,549.8862 L 2076.6408,547.90611 L 2071.5638,555.09601 C 2070.5908,553.31258 2070.2484,552.21707 2069.5048,549.74573 L 2066.082,551.51573 L 2068.0776,555.44463 C 2066.8733,555.92235 2066.2995,556.05611 2064.9804,556.01789 z "},"il2":{"name":"IL-2","path":"M 1723.0567,553.74938 L 1722.3366,551.48086 L 1720.1446,551.48086 L 1720.1446,548.12368 L 1724.6108,541.06012 L 1723.9857,537.93494 L 1726.9472,535.1903 L 1727.6442,531.70546 L 1729.6392,533.61631 L 1731.6476,549.24088 L 1731.26,549.62854 C 1731.0468,549.84175 1729.6709,550.15434 1728.2023,550.32319 L 1725.1475,550.43777 L 1725.1734,553.74938 L 1723.0567,553.74938 z "},"nj3":{"name":"NJ-3","path":"M 2360.5358,547.41008 L 2357.9525,544.6603 L 2357.3779,545.23494 C 2357.0619,545.55099 2356.4077,545.80026 2355.9242,545.78887 L 2355.0451,545.76817 L 2351.8662,540.75009 L 2352.2652,538.60102 C 2352.4846,537.41903 2353.0464,535.86463 2353.5136,535.14679 L 2354.3631,533.84164 L 2353.2263,532.70479 L 2345.0248,535.70923 L 2342.5683,533.48016 L 2337.8378,532.76663 L 2336.0463,533.4541 L 2336.0375,535.3177 C 2334.8939,535.84696 2333.7691,536.43286 2332.542,536.73552 C 2332.2986,536.73552 2331.5787,535.71469 2330.9422,534.467 C 2330.3056,533.21932 2329.5986,532.20753 2329.3711,532.21859 L 2326.1597,533.78757 C 2325.2359,532.50065 2324.1703,531.28423 2323.5695,529.80899 L 2323.5695,529.34124 L 2326.2814,530.02188 L 2327.1344,529.71453 L 2326.916,528.99516 L 2322.5119,525.61029 L 2326.9488,520.41948 L 2331.665,522.7529 L 2333.1075,520.78023 C 2334.8025,521.63018 2336.4551,522.59739 2338.2827,523.12443 L 2338.8629,523.12443 L 2341.7139,517.49826 L 2340.3873,514.58673 L 2341.5823,513.3917 C 2345.2067,517.86585 2348.2817,522.82687 2352.1849,527.07391 L 2352.9195,527.68356 L 2359.2286,516.67922 C 2358.4949,515.64211 2357.6933,514.62106 2357.1333,513.4944 C 2360.2597,514.07769 2363.4681,514.40327 2366.498,515.38948 L 2368.8813,528.22254 L 2368.3733,531.34379 C 2367.426,536.13829 2366.2853,540.91466 2364.8122,545.57688 L 2360.5358,547.41008 z "},"il3":{"name":"IL-3","path":"M 1717.8622,539.24612 C 1716.0249,539.35851 1714.3372,538.81231 1713.8243,538.65778 L 1712.8917,538.3768 L 1711.5457,529.5458 L 1714.9283,530.04226 L 1715.669,527.70855 C 1717.5213,529.00658 1718.4883,530.028 1720.9214,532.63992 C 1720.3665,534.03157 1720.6275,534.74552 1720.446,535.80524 L 1721.7684,535.83167 C 1722.4349,536.00595 1722.6028,536.35168 1722.598,536.54924 L 1722.005,538.50238 L 1717.8622,539.24612 z "},"pa3":{"name":"PA-3","path":"M 2074.9899,440.51722 C 2074.916,440.44332 2072.3742,442.6728 2069.3364,445.46187 C 2066.2985,448.25094 2063.5651,450.53057 2063.2574,450.53058 C 2062.9498,450.53058 2062.6903,450.27536 2062.6903,449.96346 L 2062.6903,449.39633 L 2061.113,449.39633 L 2060.7585,450.30019 C 2060.5691,450.79358 2060.4218,451.6586 2060.4218,452.23197 L 2060.4218,453.27761 L 2057.1608,456.21959 C 2055.3673,457.83776 2052.1772,460.31557 2050.0717,461.73138 L 2046.2436,464.30118 L 2046.2436,465.25821 C 2046.2436,465.7832 2048.2852,475.98585 2050.7806,487.92563 C 2053.276,499.86539 2055.3176,509.75858 2055.3176,509.90187 C 2055.3176,510.04517 2055.86,509.98815 2056.5228,509.77781 L 2057.7279,509.38791 L 2058.0824,509.93732 C 2058.2774,510.23446 2059.2025,510.82618 2060.1382,511.26652 L 2061.8396,512.08177 L 2062.389,514.95286 L 2073.7493,514.06672 L 2076.5318,516.21118 L 2074.3164,521.10266 L 2076.0001,527.09296 L 2079.6156,527.09296 L 2081.4942,535.65306 L 2099.0574,531.36415 L 2099.5005,533.65038 L 2101.45,530.49573 L 2103.4881,530.49573 L 2102.3184,527.41197 L 2104.1084,526.13593 L 2108.7341,526.15365 L 2108.0606,531.7186 L 2110.595,531.61227 L 2111.4279,527.62464 L 2119.2791,527.66009 L 2119.9172,525.39157 C 2118.4713,519.3885 2116.9828,510.58501 2116.4966,508.94484 L 2113.7496,512.20583 L 2108.929,514.72246 L 2108.3087,514.24395 C 2107.8314,514.64009 2106.2538,515.72125 2105.9871,515.64405 C 2105.7202,515.56684 2104.9981,515.76624 2104.3743,516.08712 C 2103.7504,516.40798 2102.8572,516.6415 2102.3893,516.60108 L 2101.3259,516.53019 L 2098.9334,518.62147 L 2099.5537,515.85672 L 2098.8625,514.049 L 2097.1257,514.049 L 2092.3051,505.66613 L 2093.9533,504.01791 L 2094.3432,499.83534 L 2095.6192,498.29345 L 2095.123,496.87563 L 2093.5457,496.43256 L 2091.2063,498.73652 L 2089.0972,496.91108 C 2086.6484,497.26408 2085.4684,497.27649 2084.2412,498.24029 L 2085.4818,500.68603 C 2083.2906,501.51351 2080.5598,502.15383 2077.9142,502.54692 C 2076.7858,497.98035 2075.6575,494.1991 2074.5291,488.84722 L 2075.2912,488.26237 C 2075.7136,487.94036 2076.6192,486.78055 2077.2939,485.67484 C 2077.9686,484.56914 2079.0486,483.06079 2079.6865,482.32524 C 2080.3244,481.58966 2080.8384,480.63637 2080.8384,480.21623 L 2080.8384,479.45415 L 2084.4784,479.14874 L 2083.9399,477.04385 C 2083.7203,475.71819 2083.2708,474.12313 2082.9297,473.4993 C 2082.5885,472.87545 2082.2412,471.74061 2082.7566,471.26347 L 2081.9904,470.94722 L 2081.4055,470.16742 L 2081.4055,469.38761 L 2089.04,468.36376 L 2089.9657,472.18781 L 2094.9812,470.87633 L 2096.429,475.83323 L 2099.4828,475.37791 L 2096.4877,469.24583 L 2094.1441,469.88385 L 2092.8613,463.09472 L 2094.1019,461.78585 L 2093.637,458.96933 L 2097.7814,457.85009 C 2098.4781,460.1102 2099.3633,462.30883 2099.69,464.66382 L 2102.3184,464.0885 L 2103.0628,460.68573 L 2101.1678,457.16297 L 2107.1922,454.44732 C 2108.1943,455.86649 2108.7164,457.11116 2108.6277,458.96662 L 2110.9849,459.71098 L 2112.3141,457.99187 L 2115.0257,457.61969 L 2115.965,455.06761 L 2111.4634,455.77652 L 2110.3509,450.01662 L 2078.818,456.64494 C 2077.3032,451.3317 2076.3713,445.86678 2074.9899,440.51722 z "},"il4":{"name":"IL-4","path":"M 1719.4889,522.46731 L 1718.9926,523.12306 L 1717.4862,524.54088 L 1714.0125,526.1891 L 1710.6984,526.20682 C 1710.7082,528.14412 1710.894,528.31196 1711.5491,529.3792 L 1714.7006,529.77522 L 1715.5728,527.31421 L 1717.6102,528.77662 L 1720.9953,532.1085 L 1722.0514,530.46154 L 1724.0081,531.11603 L 1724.7702,529.80454 L 1717.7875,527.99682 L 1717.4685,528.31583 L 1715.4835,526.98662 L 1714.5796,529.5387 C 1713.878,529.45481 1713.1741,529.3916 1712.4706,529.32603 C 1712.3142,529.31625 1711.8667,529.05343 1711.6908,528.93613 C 1711.5149,528.81881 1711.1664,528.26261 1711.0883,527.9791 C 1711.01,527.69559 1711.0706,526.45495 1711.0705,526.45494 L 1713.977,526.45494 L 1717.3089,524.91306 L 1717.8584,524.50543 L 1720.2332,525.39157 C 1721.0201,525.02483 1721.7282,524.55986 1722.3954,524.0092 L 1719.4889,522.46731 z "},"pa2":{"name":"PA-2","path":"M 2314.141,517.48722 L 2310.1002,522.91038 L 2310.9509,525.19662 L 2314.3005,527.28791 L 2313.9283,527.85504 L 2315.9133,529.94632 L 2317.5261,527.5892 L 2317.4552,522.18375 L 2316.0196,520.44692 L 2316.3564,519.56078 C 2317.0623,520.41732 2318.8907,522.05969 2318.8907,522.05969 L 2318.8552,523.35345 L 2319.3692,523.40662 L 2319.316,521.9888 L 2320.5212,520.46464 L 2315.1158,518.08979 L 2314.141,517.48722 z "},"nj4":{"name":"NJ-4","path":"M 2352.6195,527.18767 L 2341.5518,512.83888 L 2339.8151,514.5756 L 2341.1308,517.46331 L 2338.656,522.5573 L 2338.1792,522.5573 C 2337.9171,522.5573 2336.6457,522.01813 2335.3539,521.35914 L 2333.0053,520.16098 L 2331.67,521.98719 C 2330.4425,521.58023 2329.2054,521.17633 2328.1065,520.51687 L 2329.551,518.06147 L 2329.9218,515.83416 L 2331.3675,515.73372 C 2331.9134,515.7238 2332.7586,515.40479 2333.2459,515.02481 C 2333.7331,514.64483 2334.3197,513.83401 2334.5496,513.22299 L 2334.9674,512.11203 L 2332.5,510.25087 L 2334.0785,506.96126 L 2338.4057,506.96126 C 2339.114,506.0695 2339.7406,505.16645 2340.0162,504.05544 L 2340.0162,503.35136 L 2342.4819,502.56879 L 2344.0011,504.64634 L 2346.447,502.20039 L 2349.513,504.38358 L 2356.5167,502.01838 L 2356.056,500.72285 L 2352.7318,501.04344 L 2352.515,500.25767 L 2354.8806,499.64573 L 2354.2911,495.25085 L 2359.2121,495.90225 L 2360.1493,501.73962 L 2365.4648,503.28819 L 2365.7439,504.27403 C 2365.8974,504.81625 2366.1919,507.32626 2366.3984,509.85184 L 2366.774,514.44381 L 2363.1781,513.9543 C 2361.2003,513.68507 2359.1378,513.32487 2358.5947,513.15385 L 2357.6074,512.8429 L 2356.4424,513.56287 L 2358.6664,516.68612 L 2352.6195,527.18767 z "},"il5":{"name":"IL-5","path":"M 1722.2376,519.34316 L 1716.2583,518.82561 L 1714.873,520.04944 L 1715.6093,522.03702 L 1714.794,522.3383 C 1713.7032,522.14815 1712.1461,521.48007 1711.2768,521.05678 L 1711.478,522.12943 L 1710.6357,523.46412 L 1710.7184,525.9654 L 1713.9611,525.95375 L 1716.4799,524.78178 C 1717.4781,524.28022 1718.06,523.73671 1718.5564,523.11061 L 1719.4603,522.05796 L 1722.6453,523.77385 L 1723.5314,522.74593 L 1722.2376,519.34316 z "},"pa5":{"name":"PA-5","path":"M 2196.5795,524.24343 L 2192.5409,521.13948 L 2197.1883,514.11434 L 2191.3389,511.15021 C 2190.5574,511.895 2189.5721,512.5742 2188.5709,512.96325 L 2183.6486,512.954 L 2178.8924,517.02516 L 2169.9098,515.87842 L 2160.0079,519.02562 L 2159.1393,518.54342 L 2159.8111,515.18463 L 2158.4642,515.19331 C 2157.7233,515.19809 2156.7402,515.4404 2156.2794,515.73179 L 2155.4416,516.26158 L 2155.4416,520.8613 L 2153.3454,521.52661 L 2152.8356,521.05229 L 2152.4209,514.6478 L 2154.5652,512.17543 L 2154.5652,510.20613 L 2152.5802,507.7909 L 2148.8013,511.56349 L 2148.3267,512.66748 L 2146.3958,514.33687 L 2146.3332,516.54618 L 2144.8485,516.9996 L 2143.5061,515.18851 L 2139.1496,516.40067 L 2137.8354,516.4267 L 2137.212,513.30565 L 2118.5551,516.88601 L 2116.737,507.90643 L 2113.4483,511.72359 L 2109.0614,514.10595 L 2108.4277,513.6815 C 2107.8956,514.16308 2106.2778,515.16708 2106.0049,515.0878 C 2105.7319,515.00852 2104.9981,515.21994 2104.3743,515.55762 L 2103.24,516.17159 L 2101.0456,515.82138 L 2099.4611,517.73671 L 2100.1167,515.66959 L 2098.9466,513.48324 L 2097.2941,513.48324 L 2092.8251,505.84658 L 2094.4657,504.16084 L 2094.8929,499.76907 L 2096.0197,498.64224 L 2095.4789,496.57425 L 2093.2311,495.98643 L 2091.0872,498.13026 L 2089.3073,496.35029 L 2087.1996,496.74415 C 2086.0404,496.96078 2084.7783,497.39718 2084.3949,497.71394 L 2083.6979,498.28987 L 2084.8572,500.45611 C 2082.6975,501.12049 2080.7861,501.5808 2078.1605,501.92031 L 2075.2999,489.4997 L 2081.4055,480.82516 L 2081.4055,480.02265 L 2085.2946,479.69024 L 2083.0803,471.81573 L 2083.7419,471.40683 L 2081.8803,470.04555 L 2088.6967,468.91824 L 2089.4179,472.7626 L 2094.5854,471.65721 L 2095.9328,476.33631 L 2100.1283,475.70269 L 2096.6707,468.61866 L 2094.4495,469.32364 L 2093.4142,463.29235 L 2094.463,462.02571 L 2094.1659,459.43392 L 2097.3445,458.55399 L 2097.9317,460.07247 C 2098.2547,460.90764 2098.6575,462.42039 2098.8269,463.43413 L 2099.135,465.2773 L 2102.8498,464.60577 L 2103.5926,460.64648 L 2101.8222,457.44327 L 2107.1173,455.02744 L 2107.5802,455.75713 C 2107.8349,456.15845 2108.0472,457.16096 2108.0519,457.98493 L 2108.0606,459.48305 L 2111.1353,460.25477 L 2112.4391,458.47176 L 2115.6064,458.04553 L 2116.5675,454.65094 L 2112.1636,455.14619 L 2111.1798,449.82902 C 2144.2089,442.36778 2173.9789,435.38934 2205.9217,427.44528 L 2210.7526,441.08163 L 2206.0638,443.81247 C 2206.3192,445.27182 2206.588,446.72914 2207.0061,448.1472 L 2212.6325,446.93908 L 2214.4196,450.79326 L 2217.002,450.81552 L 2220.4457,456.77037 L 2219.8924,456.77037 C 2219.5882,456.77037 2219.1999,456.40737 2219.0296,455.9637 L 2218.7201,455.15703 L 2216.3151,455.78593 L 2215.6827,453.3676 L 2208.5417,454.67375 L 2207.1607,459.60602 L 2202.204,460.30543 L 2202.204,461.91013 L 2200.5026,462.56301 L 2200.5026,465.72308 L 2198.8012,466.37596 L 2198.8012,468.56694 L 2206.683,470.43948 L 2207.4151,472.7461 L 2210.014,472.09381 L 2211.3331,473.68325 L 2210.1438,474.4183 L 2210.1438,476.61988 L 2210.7109,476.61988 C 2211.0228,476.61988 2211.7825,476.11534 2212.3992,475.49869 C 2213.0159,474.88204 2214.4195,474.00183 2215.5184,473.54268 L 2217.5164,472.70785 L 2217.5164,472.1523 C 2217.5164,471.84674 2217.9175,471.19569 2218.4076,470.70554 C 2218.8978,470.21537 2219.5358,469.81433 2219.8254,469.81433 L 2220.3521,469.81433 L 2220.3521,471.48957 L 2223.1877,473.34756 L 2223.1877,475.91514 L 2219.785,477.32461 L 2219.785,478.32126 L 2216.9493,478.32126 L 2216.9493,482.73206 L 2212.3998,484.29112 C 2212.0184,484.75075 2211.3547,485.12681 2210.925,485.12681 L 2210.1438,485.12681 L 2210.1438,486.02423 C 2210.1438,486.5178 2209.3764,488.75087 2208.4386,490.9866 C 2207.5008,493.22233 2205.9866,496.47024 2205.0737,498.20419 L 2203.4138,501.35683 L 2205.7457,510.64249 L 2213.8301,509.96062 L 2213.8301,511.68378 L 2208.7612,515.69498 L 2205.7905,512.13661 L 2200.9382,516.66274 L 2200.6098,519.65474 L 2196.5795,524.24343 z "},"wi2":{"name":"WI-2","path":"M 1648.5269,425.06296 C 1636.339,425.17041 1624.2301,427.07154 1612.1065,428.19989 L 1613.099,440.60583 L 1614.2156,442.00593 L 1613.4712,447.05692 L 1618.7172,447.83672 L 1619.9932,450.65464 L 1614.6941,454.78405 L 1619.3906,498.06306 L 1660.2593,494.19949 L 1656.1299,490.42454 L 1655.3501,487.11038 L 1652.479,484.02662 L 1654.3931,479.73771 L 1654.0741,472.94989 L 1669.103,471.42573 L 1669.103,463.73405 L 1663.1481,462.72385 L 1662.7937,457.61969 L 1661.7835,456.60949 L 1662.4215,453.45484 L 1659.7454,453.08266 L 1659.4087,450.72553 L 1651.3093,451.82435 L 1648.5269,425.06296 z "},"nj5":{"name":"NJ-5","path":"M 2307.5658,488.81833 L 2306.0238,490.93538 L 2305.2764,486.26106 L 2304.2871,486.26106 L 2303.7929,481.72455 L 2307.1282,479.17196 L 2307.3168,477.32655 C 2307.4205,476.31158 2307.6745,475.31202 2307.8812,475.1053 C 2308.0879,474.89858 2308.257,474.38131 2308.257,473.95581 L 2308.257,473.18216 L 2302.3965,467.5038 L 2306.5556,463.24453 L 2306.5556,461.44629 L 2307.7964,457.90576 L 2308.3681,457.5524 C 2308.6826,457.35805 2309.3246,456.27823 2309.7949,455.15281 L 2310.6498,453.10659 L 2311.1346,445.62992 C 2311.4123,444.36915 2311.7449,443.38296 2313.2857,443.16564 L 2314.0292,441.1571 L 2316.1974,440.43009 L 2356.7465,452.05197 L 2357.0867,458.47176 L 2352.632,458.47176 L 2351.1994,460.19791 L 2349.5931,457.90463 L 2347.3889,457.90463 L 2347.3889,456.29777 L 2346.68,456.04282 C 2346.2901,455.9026 2345.1438,455.91438 2344.1327,456.06899 L 2342.2943,456.3501 L 2340.5353,454.8902 L 2339.2223,456.20324 L 2333.3496,456.20324 L 2331.9138,454.47324 L 2329.8079,456.37904 L 2329.8079,454.00167 L 2328.7305,453.33583 L 2327.4995,455.63611 L 2324.7329,455.63611 L 2322.9775,459.03061 L 2321.6208,458.75532 L 2321.3191,460.45671 C 2321.1532,461.39247 2320.4542,463.21113 2319.7657,464.49817 L 2318.5139,466.83824 L 2319.1726,467.4969 L 2318.7613,468.51383 C 2318.535,469.07315 2318.2528,470.65797 2318.1341,472.03566 L 2317.9182,474.54056 L 2316.8283,475.722 C 2316.2289,476.37179 2315.3265,477.90278 2314.823,479.12421 L 2313.9076,481.34498 L 2311.5076,484.02313 C 2310.1877,485.49612 2308.4138,487.65396 2307.5658,488.81833 z "},"or2":{"name":"OR-2","path":"M 398.50635,345.89534 L 395.19015,342.74069 L 397.42867,340.93159 L 395.84408,338.06414 L 397.72814,333.16401 L 397.14103,331.14999 L 400.1589,329.7526 L 407.86193,316.17425 L 412.70025,314.70326 L 419.15134,307.63187 L 419.21997,301.68337 L 423.50614,298.30425 L 423.61611,296.9096 L 426.05595,295.55629 L 430.58843,286.26277 L 430.49529,283.65159 C 433.20961,280.34539 436.01633,277.08173 438.15015,273.35603 L 439.26669,271.15841 L 442.40362,268.83673 L 442.36817,265.93019 L 440.70223,263.73257 L 440.70223,259.19554 L 438.23876,256.57257 L 436.20065,256.57257 L 434.44609,253.20524 L 431.91174,253.1698 L 431.04332,250.05059 L 428.81025,247.21494 L 427.62282,241.49049 C 397.69726,235.79977 370.47298,230.8654 340.76352,224.74247 L 332.94778,227.73762 C 330.89099,227.37478 329.59055,227.01193 328.07401,226.00079 L 317.03273,225.77039 L 314.85334,224.27142 L 312.72609,224.24623 L 310.04996,227.0996 L 296.01352,226.65653 C 293.08722,227.65228 290.33672,228.12632 287.38253,228.21613 L 285.20263,230.18336 L 272.14493,229.70311 L 268.77362,225.27415 C 263.88213,226.50884 256.11855,227.61756 254.09916,228.97821 C 252.55449,227.21585 249.8761,226.83915 246.74421,226.63881 L 242.42177,229.33579 L 240.76417,226.58704 L 241.39402,224.51121 L 236.28882,220.56633 L 232.08748,220.61672 L 228.72016,218.00782 L 219.8056,217.97237 L 216.96996,216.34188 L 214.13431,216.34188 L 211.21006,218.91168 L 209.86313,225.66405 L 210.58976,226.23118 C 210.99095,226.5431 211.73842,227.81915 212.2557,229.06683 C 212.77304,230.31451 213.34725,232.03717 213.53174,232.89495 L 213.86847,234.45455 L 216.49144,236.03188 L 216.29649,242.41207 L 215.49644,243.57524 L 215.55214,246.27564 L 212.06075,247.03772 L 213.4254,252.03554 L 214.76858,252.7055 L 214.48094,255.98465 C 210.67149,255.63491 210.5421,258.00884 207.16926,257.74227 L 206.7262,262.24386 L 208.17946,262.24386 C 208.2601,263.56047 208.81895,264.64839 209.5857,265.34127 C 208.02902,266.85837 207.32478,268.33389 206.4958,270.18366 L 203.64243,270.18366 L 203.60085,271.30908 L 205.34382,272.0091 L 205.34382,273.62187 L 203.73105,274.24217 L 199.9561,288.33178 L 198.11293,288.7394 L 195.56085,302.63405 L 197.03184,303.55564 L 196.89006,309.58138 L 195.86214,309.91811 L 196.30521,312.43475 L 194.01897,316.12108 L 192.29986,316.41512 L 192.29986,318.67316 C 189.81578,321.07349 189.35452,322.63884 188.79075,324.16722 L 186.50451,323.56465 L 183.16699,326.39867 L 182.81818,331.50445 L 181.52441,332.79821 C 181.75749,336.43781 180.04994,336.72543 180.10659,340.18861 C 176.27339,341.03849 174.91007,342.35883 173.01748,342.209 L 170.64263,344.58385 L 171.79461,345.75356 C 171.54488,347.14532 170.70707,347.83141 169.98689,348.34108 L 173.01748,351.9388 L 173.20798,354.09391 L 174.25808,355.14663 L 174.57709,362.66108 L 172.33274,364.26579 L 166.81451,372.81623 L 158.3962,371.13257 L 157.65184,375.10247 L 153.05922,373.89732 L 148.80818,376.73296 L 144.82055,375.8291 L 142.10897,377.90266 L 138.76318,377.74693 C 135.44624,380.74933 134.75837,380.63966 133.53733,380.56367 L 131.33352,382.93593 L 127.69492,381.91139 L 123.39372,381.92573 L 121.69234,382.24474 L 116.09194,380.82692 L 111.43085,382.88276 L 109.26867,391.56692 L 106.62798,394.04811 L 98.333724,394.42029 L 96.986794,397.34455 L 97.713434,401.19039 L 99.255314,401.19039 L 100.4959,403.51207 L 98.085604,407.41108 L 98.688184,408.40356 L 105.6816,407.50605 L 100.97985,424.575 C 196.98885,449.10237 264.67057,463.6496 378.32108,484.65863 L 398.85877,371.98326 C 401.18543,369.92604 402.96225,368.08877 402.70461,364.32702 L 405.19396,363.88714 L 405.77836,361.20418 C 404.58201,360.11748 403.93551,358.70087 403.83886,356.95435 L 406.20189,356.95435 L 408.98073,352.49685 L 405.98013,350.71367 L 406.03512,347.68352 L 401.15183,346.37886 L 401.19498,344.78563 L 400.44881,344.65567 L 398.50635,345.89534 z "},"mi3":{"name":"MI-3","path":"M 1805.781,425.02752 L 1805.781,427.63276 L 1801.8111,429.5291 L 1801.8111,430.34435 C 1801.8111,430.79128 1802.0242,431.23286 1802.2896,431.33682 L 1802.7681,431.53177 L 1803.4416,442.02365 L 1797.7172,442.02365 L 1800.3224,458.43494 L 1810.6396,456.69079 L 1814.2879,478.16039 C 1821.1153,477.10549 1827.9234,475.9263 1834.7578,474.91712 L 1831.2945,453.52313 L 1842.0366,451.60647 L 1838.7224,430.9023 L 1817.405,433.97231 L 1815.7058,423.41474 L 1805.781,425.02752 z "},"wi5":{"name":"WI-5","path":"M 1669.7142,471.23682 L 1669.3865,463.29235 L 1663.4317,462.28213 L 1663.4317,457.40444 L 1662.8646,457.05394 C 1662.5526,456.86116 1662.2974,456.49797 1662.2974,456.24686 L 1662.2974,455.79029 L 1667.6202,455.06072 L 1668.7627,456.20324 L 1671.0879,456.18365 L 1673.7842,453.3415 L 1673.1945,449.48618 L 1678.4596,448.46668 L 1676.6584,426.87173 L 1702.57,423.69431 L 1702.9277,424.05199 C 1703.1244,424.24871 1703.2854,425.38018 1703.2854,426.56637 L 1703.2854,428.72307 L 1701.0157,433.23453 L 1700.24,443.10907 L 1701.9427,446.40186 L 1701.7554,451.09908 L 1701.3088,451.09908 C 1701.0632,451.09908 1700.3294,450.5663 1699.6783,449.91512 C 1699.027,449.26394 1698.1304,447.86029 1697.6856,446.79591 C 1697.241,445.73153 1696.7361,444.86067 1696.5638,444.86067 L 1694.0566,446.03484 L 1694.0566,448.94271 L 1695.9059,452.83969 L 1698.0265,453.97464 L 1698.0265,456.04596 L 1695.3879,457.65284 L 1694.5008,461.3074 L 1691.2774,461.3074 L 1690.3484,462.96734 L 1674.3704,465.06551 L 1674.9066,470.82386 L 1669.7142,471.23682 z "},"mi2":{"name":"MI-2","path":"M 1779.6399,335.61613 C 1774.4918,336.09561 1771.145,336.62807 1768.9176,337.19346 L 1768.9176,339.23158 L 1768.2087,339.79871 C 1767.8188,340.10581 1766.8359,340.51039 1766.0289,340.70257 C 1765.2217,340.89476 1763.9031,341.58464 1763.0869,342.22672 L 1761.5982,343.37871 L 1761.9172,344.35346 C 1762.0964,344.88784 1762.7152,346.34903 1763.2818,347.59672 L 1764.3097,349.86524 L 1764.3097,364.43336 L 1759.3473,379.69266 L 1757.6105,381.67762 C 1756.655,382.76583 1755.8737,383.84829 1755.8737,384.08791 C 1755.8737,384.32753 1756.6678,385.61116 1757.646,386.94128 L 1759.436,389.35158 L 1762.1121,398.60286 L 1761.3855,402.60821 L 1758.7093,407.25157 L 1758.7093,411.18603 L 1760.9601,414.92554 C 1762.2015,416.98378 1763.7551,420.01052 1764.3984,421.64247 C 1765.0417,423.27441 1766.2399,425.78832 1767.0745,427.22514 C 1767.9089,428.66196 1770.2299,432.36905 1772.2318,435.46623 L 1775.8827,441.10207 L 1779.0905,449.91029 L 1780.5615,458.02732 L 1782.0325,466.12662 L 1781.3768,469.65345 L 1781.7312,470.59276 C 1781.9268,471.10251 1782.3326,471.51433 1782.6351,471.51435 L 1800.6237,468.62553 L 1801.4744,463.6986 L 1803.7252,462.95425 L 1802.9454,458.73623 L 1799.7907,459.23246 L 1797.0614,441.42108 L 1802.839,441.45652 L 1802.2364,432.0989 C 1801.2424,431.8378 1801.3136,430.61283 1801.244,429.51138 L 1805.338,427.33148 L 1796.7069,370.74266 L 1806.2063,369.20078 L 1803.5125,348.4297 L 1782.1211,351.92108 L 1779.6399,335.61613 z "},"wi4":{"name":"WI-4","path":"M 1705.7769,463.57592 C 1705.5911,463.57592 1705.1594,463.05323 1704.8175,462.4144 L 1704.1959,461.25289 L 1702.3536,461.90832 L 1699.5992,459.03889 L 1698.6701,459.03889 L 1697.9807,456.86683 L 1698.475,456.36546 L 1698.4265,453.82848 L 1696.3252,452.52763 L 1694.5308,449.04242 L 1694.4569,446.44854 L 1695.2493,445.94685 C 1695.685,445.67093 1696.2053,445.44126 1696.4055,445.43648 C 1696.6056,445.43171 1696.922,446.03603 1697.1085,446.77942 L 1697.4478,448.13105 L 1700.8308,451.7526 L 1702.9901,451.06727 L 1703.5588,453.24204 L 1703.0699,454.01373 C 1702.801,454.43816 1702.577,455.24422 1702.5723,455.80498 L 1702.5636,456.82453 L 1705.4538,459.50313 L 1706.1148,463.57592 L 1705.7769,463.57592 z "},"ny27":{"name":"NY-27","path":"M 2112.875,386.84375 L 2110.3438,387.4375 L 2110.3438,390.28125 L 2108.7813,391.5625 L 2106.8438,390.84375 L 2107.5,388.28125 L 2105.6875,387.59375 L 2103.4375,389.15625 L 2104.0313,389.53125 C 2104.3571,389.7327 2105.135,391.04676 2105.75,392.4375 L 2106.875,394.96875 L 2107.8125,394.96875 L 2109.3438,400.09375 L 2108.2813,401.34375 C 2107.6975,402.02517 2106.5637,403.24716 2105.7813,404.0625 C 2104.9987,404.87786 2103.7928,405.84461 2103.0938,406.21875 L 2101.8125,406.90625 L 2101.8125,409.75 L 2101.0313,411 C 2100.6004,411.69085 2100.103,412.93178 2099.9063,413.78125 L 2099.2813,416.40625 L 2097.6563,417.5 C 2096.1523,418.50758 2093.7199,420.54345 2092.2188,422.03125 L 2089.4688,424.71875 L 2088.7188,427.1875 L 2082.5,433.59375 L 2076.0938,439.6875 L 2079.6563,455.5 L 2110.1563,448.90625 L 2102.8125,416.21875 L 2106.1875,415.875 L 2108.9688,419.1875 L 2112.5313,420.4375 C 2115.2312,419.04706 2117.609,417.09354 2120.25,415.59375 C 2123.1659,413.98273 2126.1238,412.44414 2129.0625,410.875 L 2125.75,396.21875 L 2124.7813,396.40625 L 2124.5313,396.46875 L 2124.4688,396.21875 L 2123.625,391.09375 L 2123.5938,390.875 L 2123.8125,390.8125 L 2124.625,390.5625 L 2123.8125,387.71875 L 2119.375,388.84375 L 2120.2188,391.875 L 2120.2813,392.09375 L 2120.0313,392.1875 L 2115,393.75 L 2114.7813,393.84375 L 2114.6875,393.59375 L 2112.875,386.84375 z "},"ny29":{"name":"NY-29","path":"M 2110.8236,448.7342 L 2103.5474,416.77931 L 2105.5659,416.46464 L 2108.4252,419.70687 L 2112.7705,421.11224 C 2119.803,416.18859 2123.6146,414.58965 2129.0366,411.32835 L 2130.5161,411.91407 C 2140.1423,409.32442 2147.5347,407.72179 2156.9012,405.70357 L 2157.4345,406.03322 C 2157.7279,406.21452 2157.9679,406.764 2157.9679,407.25429 L 2157.9679,408.14571 L 2164.0439,406.96264 L 2163.1106,403.15289 L 2165.5484,402.42561 L 2165.3406,399.61881 L 2172.7805,398.215 L 2171.4309,392.09828 L 2166.1337,392.80098 L 2165.0874,389.70199 L 2164.8661,384.53491 L 2164.2978,382.47651 L 2165.3406,382.47651 L 2165.3406,379.58454 C 2164.7614,378.43666 2164.1864,377.28064 2163.444,376.2381 C 2161.3047,376.701 2159.2411,377.68777 2157.0437,377.77141 L 2156.1085,371.70107 L 2151.2525,371.70107 L 2150.4527,367.74778 L 2152.9569,366.94733 L 2152.8638,363.88262 L 2154.3246,363.73703 L 2155.206,362.75973 L 2156.8449,366.18153 L 2164.6361,363.95168 C 2165.7799,363.07909 2166.8514,362.06892 2168.179,361.49275 L 2168.596,361.49275 L 2170.5649,369.00313 L 2173.1415,368.64997 C 2174.5586,368.45574 2175.999,368.07521 2176.3424,367.80437 C 2176.6858,367.53353 2177.9001,367.14393 2179.041,366.93858 L 2181.1151,366.56522 L 2181.3321,367.99531 L 2188.9497,366.23482 L 2190.3735,371.67725 L 2188.0299,372.35634 L 2190.9639,381.03057 L 2193.697,381.34225 L 2193.697,382.02416 C 2193.697,382.39922 2194.4591,383.49236 2195.3906,384.45339 L 2197.0842,386.20069 C 2197.8354,388.71908 2198.0855,391.47863 2199.3098,393.81909 L 2207.6134,391.70246 L 2211.9363,407.00028 L 2218.9941,405.92039 L 2220.3554,411.68364 L 2219.5265,413.41734 L 2222.0535,420.7665 L 2222.0535,422.09908 C 2170.2836,435.53236 2157.3039,438.23957 2110.8236,448.7342 z "},"ct4":{"name":"CT-4","path":"M 2369.195,447.03267 L 2368.6562,447.50328 L 2364.155,443.23884 L 2373.0742,433.44502 L 2368.2881,428.56834 L 2367.3579,424.44404 C 2367.9404,424.32747 2368.0383,424.59091 2368.3727,424.87474 C 2368.3727,425.11163 2368.8858,425.62588 2369.5128,426.01751 L 2370.653,426.72956 L 2374.9571,424.5338 L 2376.1331,426.39821 L 2378.8646,421.61713 L 2381.566,421.60839 L 2380.9575,417.07158 L 2381.427,416.7814 C 2381.6852,416.62181 2382.0643,415.72734 2382.2693,414.79371 L 2382.6422,413.09618 L 2384.4021,414.08106 L 2385.8056,418.16379 C 2384.9475,418.85294 2384.2188,419.60497 2383.6851,420.54747 L 2387.2112,422.83549 L 2386.7919,424.63224 C 2386.5614,425.62045 2385.7477,427.8923 2385.6542,429.51323 L 2386.0324,432.32325 L 2383.4718,435.78661 L 2381.4166,435.78661 L 2381.4166,436.94519 L 2378.6577,438.20226 L 2377.3133,441.44786 L 2375.4043,442.62765 C 2374.3545,443.27653 2373.0079,444.42722 2372.412,445.18474 L 2371.3287,446.56206 L 2370.5312,446.56206 C 2370.0926,446.56206 2369.4913,446.77383 2369.195,447.03267 z "},"mi5":{"name":"MI-5","path":"M 1883.593,444.13977 L 1878.4721,417.66448 L 1887.6746,416.39322 L 1885.6311,418.96069 L 1881.7744,408.45083 L 1877.2661,407.13893 L 1875.9441,404.54807 L 1876.6503,401.9402 L 1875.6636,398.76153 L 1869.7476,399.57286 L 1869.7816,397.1272 L 1873.4627,396.62032 L 1873.5646,391.46857 L 1875.3435,390.43876 L 1882.6269,391.6142 L 1885.9221,393.42 L 1886.7492,392.3435 C 1887.2041,391.75143 1888.337,389.67196 1889.2668,387.72245 L 1890.9572,384.1779 L 1893.6859,384.1779 L 1894.0704,386.49447 L 1909.2851,383.76573 L 1913.5748,404.36339 L 1902.6823,406.50508 L 1903.424,411.89764 L 1898.7441,412.8842 L 1903.0304,434.57032 L 1892.6119,436.97819 L 1893.2768,442.59215 L 1883.593,444.13977 z "},"ct3":{"name":"CT-3","path":"M 2387.1095,432.38384 L 2386.3674,429.42702 L 2387.7864,423.08631 L 2383.9687,420.62973 L 2386.4686,417.90453 L 2385.9363,417.0626 C 2385.6434,416.59953 2385.4,415.66772 2385.3952,414.99189 L 2385.3865,413.76311 L 2384.1421,413.3483 L 2385.447,408.50217 L 2390.1411,408.848 L 2391.0903,412.53433 L 2394.3343,412.53433 L 2395.0615,408.65843 L 2400.7997,407.90043 L 2398.5244,401.28696 L 2399.2377,400.57353 L 2401.1105,403.05627 L 2402.6377,402.1124 L 2407.7848,402.42892 L 2408.5991,403.74384 L 2402.3853,406.88888 L 2406.3534,416.43842 L 2408.2325,417.49001 L 2406.77,420.79396 L 2402.9169,420.34413 L 2398.2577,423.42726 L 2397.2399,421.60839 L 2395.4058,421.60839 L 2396.1303,422.33294 L 2393.3263,425.66532 L 2393.3263,427.27968 L 2391.8008,427.27968 L 2390.9063,428.27215 C 2390.4144,428.81802 2389.8368,429.96645 2389.6227,430.82423 L 2389.2335,432.38384 L 2387.1095,432.38384 z "},"ct5":{"name":"CT-5","path":"M 2370.522,426.1275 L 2367.2351,423.36129 L 2358.7315,383.22208 C 2363.5868,382.10946 2368.3988,380.78154 2373.2902,379.83581 L 2374.2039,394.95334 L 2375.7969,394.95334 L 2378.4048,392.3454 L 2380.2174,393.48877 L 2385.6701,391.23581 L 2386.029,388.1478 L 2384.8194,388.1478 L 2384.8194,385.31216 L 2385.9537,385.31216 L 2385.9537,383.65449 L 2392.0963,381.98174 L 2392.8896,391.84834 L 2395.4373,393.17488 L 2396.5995,397.75368 L 2391.2181,398.97815 L 2390.497,397.23714 C 2390.1004,396.27959 2389.5614,395.36358 2389.2993,395.20156 L 2388.8226,394.90699 C 2387.5162,395.56387 2386.2125,396.22631 2384.9369,396.94021 L 2386.7309,401.19176 L 2389.1564,401.19176 L 2390.2071,405.40354 L 2394.4245,405.54495 C 2395.5456,404.43047 2396.5374,403.12321 2397.9162,402.32602 L 2400.0315,407.33755 L 2394.5697,408.08874 L 2393.8289,412.03763 L 2391.4084,411.68364 L 2390.4583,407.9973 L 2384.8708,407.9973 L 2383.4816,412.86767 L 2382.0523,412.18675 L 2381.9802,413.59295 C 2381.9784,414.10243 2381.6333,415.17744 2381.2135,415.98185 L 2380.4504,417.4444 L 2380.9782,421.04126 L 2378.6536,421.04126 L 2376.0888,425.60469 L 2375.1243,423.88134 C 2373.6068,424.66535 2372.0888,425.45143 2370.522,426.1275 z "},"or4":{"name":"OR-4","path":"M 126.44204,256.98019 L 121.7455,274.24217 L 116.34006,272.91296 L 115.48937,278.17663 L 110.49154,277.46772 L 112.61828,279.75395 L 111.2359,281.15405 L 97.252634,278.30069 C 97.208794,278.36113 96.090734,281.72473 94.753724,285.7797 C 93.416774,289.83467 90.919984,296.59767 89.224224,300.80861 C 87.528394,305.01954 84.657994,311.54616 82.844024,315.30583 L 79.547584,322.1291 L 73.238284,330.58286 L 70.083624,332.37286 L 69.427884,336.25415 L 65.918774,343.16603 C 63.995644,346.96207 62.427394,350.22345 62.427394,350.43237 L 55.621847,359.20514 L 55.621847,365.46128 L 56.702936,365.46128 L 57.854916,369.60841 L 57.30551,370.49455 L 58.45749,371.20346 L 58.45749,377.65455 L 57.287787,379.35593 C 56.652716,380.29169 55.799983,381.86306 55.373728,382.84732 C 54.947417,383.83158 54.261616,386.12845 53.867292,387.95148 C 53.472911,389.77451 53.096279,392.15885 53.016599,393.25059 C 52.936861,394.34231 52.866649,395.74594 52.874817,396.36979 C 52.882984,396.99363 52.955095,399.5457 53.034322,402.04108 C 53.113606,404.53645 53.218272,406.99805 53.264718,407.51742 C 53.311166,408.03678 53.852378,409.05761 54.469866,409.78593 C 55.087356,410.51425 56.044387,411.69397 56.596599,412.39118 L 57.606797,413.6495 L 100.53293,424.48515 L 104.6671,408.08865 L 98.705904,408.95296 L 97.483034,407.46425 L 99.875604,403.58296 L 99.166694,401.75752 L 97.164024,401.75752 L 96.437394,397.20276 L 98.174224,393.83544 L 106.68115,393.48098 L 108.75471,391.26563 L 110.8499,382.39308 L 116.3755,380.13573 L 121.5864,381.69646 L 122.93293,381.28771 C 124.43616,381.22662 126.76845,381.35247 128.1257,381.55356 L 131.07383,382.43969 L 133.475,380.0462 L 135.08441,379.96485 L 138.56144,377.08629 L 141.94742,377.28759 L 144.37748,375.15564 L 148.63095,376.11266 L 152.88441,373.38336 L 157.24422,374.55306 L 158.11263,370.33504 L 166.4955,372.10732 L 171.84778,363.83078 L 174.16946,362.1294 L 173.99224,355.60742 L 172.76936,354.29593 L 172.45035,352.00969 L 169.31342,348.27019 C 170.65813,347.64655 171.03403,346.81935 171.28065,345.789 L 170.00461,344.53069 L 172.99976,341.64187 C 174.32791,342.18179 174.39245,341.14416 179.78758,339.97593 C 179.49955,336.6691 181.3738,336.51733 181.06362,332.56781 L 182.35738,331.27405 L 182.55233,326.22306 L 186.50451,323.05069 L 188.45402,323.56465 C 189.01026,321.2795 190.22019,319.7716 191.87451,318.58455 L 192.06946,315.90841 L 193.9658,315.62484 L 195.73808,312.84237 L 195.45451,309.47504 L 196.41154,309.19148 L 196.41154,303.64425 L 194.88738,302.75811 L 197.47491,288.38494 L 199.42441,287.76465 L 201.88788,277.94623 L 192.01629,275.23465 C 190.14943,274.28597 189.067,273.17326 188.3654,271.90277 L 184.37778,273.0193 L 182.03837,268.4291 L 172.99976,266.26692 L 168.87035,263.37811 L 165.89293,263.37811 L 161.69263,261.00326 C 157.48827,261.99877 154.85663,263.11313 151.05897,265.04405 L 150.6159,262.97049 L 146.89412,259.9399 L 145.22818,261.60584 L 145.88392,263.0591 C 146.2483,263.85881 146.75634,264.51238 147.01818,264.51237 L 147.49669,264.51237 L 147.49669,266.78089 L 142.39253,267.06445 L 142.39253,266.26692 L 136.43768,266.95811 L 135.64016,268.16326 L 137.00481,269.06712 L 134.77174,270.78623 C 133.36628,268.87559 132.44047,267.46046 132.25511,265.06178 C 134.04144,263.85024 135.10506,261.90757 136.11867,259.63861 L 126.44204,256.98019 z "},"ct2":{"name":"CT-2","path":"M 2408.6388,418.74468 L 2408.6388,417.92797 L 2408.6388,417.11127 L 2407.5947,416.55248 L 2406.5506,415.99369 L 2405.1013,412.7044 C 2404.3041,410.8953 2403.4977,408.89421 2403.3091,408.25754 L 2402.9663,407.09994 L 2406.1045,405.56081 L 2409.2427,404.02166 L 2408.6572,402.92756 L 2408.0717,401.83345 L 2408.0717,399.27756 L 2408.0717,396.72167 L 2407.547,396.39743 L 2407.0224,396.07319 L 2405.5215,396.75706 L 2404.0206,397.44093 L 2403.5032,396.62248 C 2403.2188,396.17234 2403.0775,395.54883 2403.1894,395.23691 L 2403.3929,394.66978 L 2404.0539,394.81922 C 2404.4174,394.90141 2405.2149,394.70103 2405.8261,394.37392 L 2406.9374,393.77918 L 2406.9374,391.53062 L 2406.9374,389.28206 L 2407.7881,389.28206 L 2408.6388,389.28206 L 2408.6388,388.73417 C 2408.6388,388.43283 2408.2088,387.2844 2407.6831,386.18209 L 2406.7274,384.1779 L 2405.9817,384.1779 L 2405.236,384.1779 L 2405.236,383.23008 L 2405.236,382.28226 L 2404.2564,381.19983 L 2403.2769,380.1174 L 2403.2769,375.88009 L 2399.3653,378.5345 L 2398.5874,377.27572 L 2394.5386,378.39365 L 2393.9291,376.80523 L 2391.0578,376.80523 L 2391.0578,374.58811 L 2432.1746,363.76889 L 2442.7048,397.94099 L 2440.8522,399.98806 L 2441.7594,401.28323 C 2442.2583,401.99557 2442.6665,403.00012 2442.6665,403.51557 L 2442.6665,404.45275 L 2440.8943,404.8072 C 2439.9195,405.00216 2438.5432,405.16166 2437.8357,405.16166 L 2436.5495,405.16166 L 2435.8928,406.87286 L 2434.3173,407.5443 C 2433.4507,407.9136 2432.3476,408.69063 2431.8658,409.27104 L 2430.9899,410.32634 L 2427.8179,409.12037 L 2427.2217,411.40008 L 2426.4654,411.40008 C 2426.0494,411.40008 2425.5049,411.72521 2425.2555,412.1226 C 2425.0061,412.51999 2424.1002,413.2915 2423.2424,413.83706 L 2421.6828,414.829 L 2421.6828,414.42396 L 2420.0175,416.22067 L 2419.9814,414.78124 L 2416.9002,415.55457 L 2414.7054,417.59927 L 2413.8213,417.05286 L 2413.0611,418.28295 L 2411.4646,417.67031 L 2408.6388,418.74468 z "},"mn2":{"name":"MN-2","path":"M 1433.7446,408.71094 L 1433.7446,405.81969 L 1422.9691,406.46257 L 1422.9691,404.79659 L 1426.2786,400.35807 L 1424.4325,397.23299 L 1425.8048,395.86075 L 1425.8408,392.40126 L 1427.4629,390.25874 L 1426.7793,385.27171 L 1429.3151,382.57248 L 1432.1168,381.86929 L 1431.7596,379.3573 L 1426.939,379.00852 L 1426.939,376.80523 L 1421.4322,376.80523 C 1421.0522,371.61147 1420.3086,366.42809 1420.2298,361.21852 L 1430.342,360.64206 L 1431.0447,366.04313 L 1441.6112,365.30038 L 1441.9679,370.28325 L 1451.9267,370.76386 L 1456.194,366.59691 L 1457.1907,366.59691 C 1457.7389,366.59691 1458.9306,366.2126 1459.8389,365.74289 L 1461.4904,364.88887 L 1462.6382,367.03356 L 1466.2823,367.87272 L 1467.3194,364.60743 L 1466.058,363.65819 C 1470.8681,363.87265 1471.3028,364.80636 1474.5546,365.02082 L 1474.3749,366.66179 C 1474.2761,367.56433 1474.0261,368.4719 1473.8194,368.67862 C 1473.6127,368.88534 1473.4436,369.79058 1473.4436,370.69027 L 1473.4436,372.32607 L 1477.1299,373.87668 L 1480.4613,377.37235 L 1481.9505,377.37235 L 1481.9505,379.61926 L 1484.8161,380.33847 L 1486.6589,382.42738 L 1495.5859,382.47651 L 1496.2505,384.03612 C 1496.6161,384.8939 1497.2639,386.0155 1497.6901,386.52857 L 1498.4651,387.46142 L 1491.4596,388.27451 L 1491.9923,393.81909 L 1486.5695,393.81909 L 1487.5098,404.56414 L 1433.7446,408.71094 z "},"ri2":{"name":"RI-2","path":"M 2446.317,403.61058 L 2444.0127,404.96339 L 2442.8011,399.77394 L 2444.0405,398.99169 L 2442.6994,393.42797 C 2440.7836,385.18307 2437.5015,377.32413 2435.398,369.1402 L 2443.3015,366.05508 L 2444.4583,369.37358 L 2449.1885,369.28271 L 2454.2927,370.71219 L 2455.5143,372.5818 C 2456.1861,373.61008 2456.8989,375.19363 2457.0981,376.10079 L 2457.4604,377.75016 L 2454.0091,377.24362 L 2454.0091,379.71731 L 2456.0484,379.07005 L 2457.5153,383.12656 L 2455.6459,384.49346 L 2458.5448,387.86423 L 2458.6126,388.99849 C 2458.6499,389.62233 2458.6271,390.38796 2458.5617,390.69988 C 2458.4965,391.0118 2458.3716,392.28784 2458.2842,393.53552 L 2457.979,397.22186 L 2455.9242,397.22186 L 2452.2728,399.73982 C 2450.2645,401.1247 2447.5844,402.86654 2446.317,403.61058 z "},"ny28":{"name":"NY-28","path":"M 2108.8758,390.80906 C 2108.5444,390.91796 2108.1025,390.83627 2107.8937,390.6275 L 2107.5141,390.24792 L 2108.1448,387.73499 L 2105.6614,387.08555 L 2104.4507,387.75846 C 2103.7848,388.12856 2103.0796,388.65153 2102.8835,388.92063 L 2102.5269,389.4099 L 2099.2701,387.83377 L 2099.6424,383.61077 L 2096.1509,383.61077 L 2096.1913,378.79018 L 2093.9428,372.2661 L 2095.5846,371.41705 C 2096.4877,370.95007 2098.3244,369.83341 2099.6661,368.93558 C 2101.0079,368.03776 2104.913,365.88077 2108.3442,364.14226 L 2114.5826,360.98135 L 2119.1196,359.87707 C 2121.615,359.26971 2125.4431,358.33376 2127.6265,357.79719 C 2129.81,357.26061 2133.6201,356.47584 2136.0935,356.05327 L 2140.5905,355.28495 L 2151.0932,355.12785 L 2152.775,356.32535 C 2153.6999,356.98398 2154.8346,357.52285 2155.2965,357.52285 C 2155.7584,357.52285 2156.9295,357.85636 2157.899,358.26398 L 2159.6616,359.00511 L 2158.9849,359.6818 C 2158.6127,360.05398 2158.1263,360.35849 2157.904,360.35849 L 2151.4718,356.38859 L 2148.1322,356.38859 L 2140.6705,359.47132 L 2132.7307,359.64055 C 2126.5941,360.74463 2123.6206,361.62596 2118.9987,363.08644 L 2111.3336,363.9073 C 2111.5074,366.19591 2111.993,367.99447 2112.6568,369.83757 L 2109.2598,371.24462 L 2104.9414,370.57886 L 2103.1184,371.62822 L 2102.5578,377.03776 L 2100.7801,378.1591 L 2103.4937,383.51408 L 2106.6696,384.21163 L 2108.164,386.64165 L 2109.8811,387.46786 L 2109.8794,390.12098 L 2108.8758,390.80906 z "},"ma5":{"name":"MA-5","path":"M 2450.8917,303.12534 L 2450.5372,306.47494 L 2447.3825,306.47494 L 2445.6457,308.45989 L 2446.0888,309.59415 C 2446.3415,310.21799 2446.5809,311.03367 2446.6027,311.40187 L 2446.7717,312.47606 L 2443.8635,312.49658 C 2443.2244,313.75181 2442.9986,315.05934 2442.1465,316.18248 L 2431.3966,319.14672 L 2432.9208,321.32663 L 2431.0422,324.62306 L 2428.561,324.62306 L 2427.8521,326.85613 L 2429.0886,331.74202 L 2427.8561,332.2298 L 2429.3762,337.24167 L 2431.0279,335.44303 L 2431.7865,335.39851 L 2432.5663,339.93554 L 2434.7285,339.93554 L 2435.2333,338.74175 L 2440.9669,336.42643 L 2441.1505,338.49181 C 2444.0508,337.82135 2444.7941,337.77829 2446.5759,338.82037 L 2447.3349,338.10464 L 2446.7445,334.76049 L 2444.795,333.34267 L 2446.585,329.90445 L 2445.9688,329.43638 C 2445.7079,329.15604 2445.4698,328.34119 2445.2736,327.6891 L 2444.9191,326.5194 L 2449.5447,324.42811 L 2448.9776,322.23049 L 2449.4738,321.3089 C 2449.7432,320.79899 2450.0031,321.14656 2450.1796,320.58092 L 2450.1314,318.31375 L 2452.1868,319.19899 L 2453.4437,318.26059 L 2449.4738,312.85514 L 2449.4738,310.58663 L 2452.7703,309.93088 L 2453.5678,305.16346 L 2450.8917,303.12534 z "},"ma3":{"name":"MA-3","path":"M 2422.3384,334.58509 L 2421.1706,334.7079 C 2420.5186,335.29797 2419.4161,336.98058 2419.416,337.29484 L 2415.9423,343.26742 L 2418.7792,347.97312 L 2420.4794,347.87534 L 2421.2415,349.11593 L 2423.3859,348.5488 L 2426.2039,349.86029 L 2425.5658,353.33395 L 2427.7219,355.05368 L 2429.6775,349.66534 C 2431.0779,348.64058 2432.3878,347.44316 2433.9841,346.74108 L 2438.9111,349.13365 L 2442.6506,348.53108 L 2444.671,351.08316 L 2446.288,350.87661 L 2448.0034,357.69987 L 2451.4588,356.86078 L 2453.4615,363.80811 L 2455.3755,363.47138 L 2457.6972,370.24148 L 2461.2772,370.96811 L 2465.2825,374.24682 C 2465.9198,371.9628 2466.3592,369.82722 2466.4522,367.24633 L 2462.7837,367.83118 L 2460.7987,363.68405 L 2461.3304,362.81563 L 2455.5705,357.23296 L 2453.4083,352.44781 L 2450.2182,353.08583 C 2449.0981,351.18078 2447.8604,349.32252 2447.2053,347.20187 L 2447.2053,346.45752 L 2444.9368,345.03969 L 2444.9368,343.48009 L 2441.7467,342.84207 C 2440.8524,341.16137 2440.5024,339.77753 2440.3998,337.20623 L 2435.7387,339.03167 L 2435.1716,340.50267 L 2432.0346,340.50267 L 2431.2903,335.8593 C 2430.6042,336.3522 2430.1697,337.09755 2429.5626,337.67619 L 2429.8144,338.87402 L 2428.9826,339.69412 L 2424.6736,341.26352 L 2422.3384,334.58509 z "},"ma4":{"name":"MA-4","path":"M 2454.2218,333.91474 L 2452.5736,334.02108 C 2449.7703,336.67452 2452.522,334.77572 2448.5682,338.87712 C 2448.5325,340.54089 2449.4544,341.07829 2450.2519,341.73049 C 2450.7921,342.17821 2450.3604,342.64576 2449.9683,342.77613 L 2445.3249,342.88247 L 2445.5022,345.0092 L 2447.7707,346.23207 L 2447.7707,347.08276 C 2447.7708,347.55585 2448.345,348.96533 2449.0467,350.20197 L 2450.4646,352.61227 L 2453.6901,352.13375 L 2455.8168,356.67078 L 2461.9489,362.69653 L 2461.2932,363.65356 L 2463.1718,367.28672 L 2467.0708,366.54237 C 2466.6802,369.87192 2466.3491,372.90396 2465.542,375.16243 L 2469.3216,375.10247 L 2469.3216,378.50524 L 2470.2077,378.50524 L 2472.3876,384.12336 L 2472.9725,383.66257 C 2473.2993,383.40787 2474.2195,383.05324 2475.0106,382.86504 L 2476.4461,382.52831 L 2479.0514,379.0192 L 2477.9703,377.65455 L 2478.0944,376.52029 C 2478.1682,375.89645 2478.4075,374.97352 2478.6261,374.46445 L 2479.0337,373.54286 L 2483.7834,372.72762 L 2482.3655,372.17821 L 2482.3655,370.56544 L 2484.3859,370.56544 L 2484.3505,367.44623 L 2485.7683,367.72979 L 2485.7683,367.19811 C 2485.7684,366.9046 2485.5132,366.50474 2485.2012,366.31197 C 2484.8894,366.11919 2484.6341,365.71933 2484.6341,365.42583 L 2484.6341,364.89415 L 2488.604,364.89415 L 2488.604,361.45593 L 2487.0502,360.76181 L 2483.4467,362.57247 C 2481.3153,361.73331 2479.8424,359.63162 2478.3425,357.98227 L 2474.7979,353.99465 L 2475.4537,352.93128 C 2475.8195,352.34566 2476.1272,351.52391 2476.1271,351.10583 L 2476.1271,350.34375 L 2472.7244,350.85771 L 2472.6121,356.14485 L 2468.3145,357.40915 L 2465.8657,355.25296 L 2460.9919,355.25296 L 2459.8576,352.70088 L 2460.3362,348.73098 L 2457.5182,346.09029 C 2456.3999,347.84451 2455.581,349.90741 2453.9914,351.28306 L 2452.5795,349.07065 L 2449.6878,348.90235 L 2450.6802,347.29824 L 2448.9227,345.48771 L 2449.0381,344.47752 L 2453.442,344.47752 L 2453.442,341.4292 L 2450.6772,341.39375 L 2452.3786,337.58336 L 2453.3711,338.09732 L 2456.0473,337.38841 C 2455.8902,335.92666 2456.5808,336.29577 2456.508,334.62366 L 2453.5129,335.33257 L 2454.2218,333.91474 z "},"ma2":{"name":"MA-2","path":"M 2391.7353,373.35204 L 2391.0026,370.43297 L 2391.3104,370.12515 C 2391.4798,369.95584 2392.5084,369.78641 2393.5963,369.74864 L 2396.083,369.64081 L 2396.178,368.17617 L 2394.6171,367.73299 L 2393.2356,364.40608 L 2393.8563,362.10386 L 2392.5831,360.91993 L 2393.0428,357.84732 L 2388.1097,357.41506 C 2387.976,358.23453 2387.5302,358.37567 2386.8628,358.59614 L 2384.854,354.81048 L 2388.5057,352.99646 L 2392.1824,353.50418 L 2391.4584,348.82026 L 2392.1341,349.01592 C 2392.441,349.01592 2392.8773,349.31526 2393.1034,349.68113 C 2393.3295,350.04699 2393.7441,351.38683 2394.0246,352.65855 C 2394.3052,353.93027 2394.5474,355.48119 2394.5629,356.10503 C 2394.5784,356.72887 2394.7976,358.46003 2395.0978,359.47377 L 2396.3478,360.91317 L 2402.0298,358.62458 L 2402.4899,359.34975 C 2402.7431,359.7486 2403.3063,360.24592 2403.311,360.50273 L 2404.9525,360.62652 L 2404.9673,360.06716 C 2404.9754,359.75951 2405.2306,359.09832 2405.5344,358.59785 C 2405.8382,358.09738 2407.1994,356.99185 2408.5593,356.14113 L 2411.0319,354.59434 L 2414.8636,357.82035 L 2413.9874,350.74059 L 2419.0151,348.2612 L 2420.0306,348.18681 L 2421.3591,349.63857 L 2423.338,348.9775 L 2425.6963,350.22045 L 2425.02,353.60207 L 2427.8885,355.72392 L 2430.2166,349.77646 C 2431.4365,348.90084 2432.5862,347.87936 2433.9948,347.33227 L 2439.1663,349.69368 L 2442.5699,349.01191 L 2444.4758,351.568 L 2445.9833,351.25445 L 2447.2697,357.89132 L 2433.3093,363.04614 L 2433.1262,361.92561 L 2391.7353,373.35204 z "},"mn3":{"name":"MN-3","path":"M 1440.819,343.73416 L 1436.531,345.46142 L 1434.7082,346.73688 L 1436.1017,348.00435 L 1432.3075,351.02122 L 1431.6613,354.1187 L 1430.9089,354.1187 L 1430.9089,358.88613 C 1430.9089,361.51195 1431.0603,364.0566 1431.2457,364.53969 L 1431.5824,365.42583 L 1442.2515,364.71692 L 1442.2809,369.89347 L 1451.7624,370.33839 L 1453.7713,368.4387 C 1454.3769,367.86552 1454.7375,367.49565 1455.1776,366.8233 L 1451.9104,366.59554 L 1448.9862,361.95217 L 1446.307,364.39642 L 1446.9303,354.04781 L 1451.3256,354.79217 L 1451.5914,348.12841 L 1451.0598,345.66494 L 1448.8976,344.45979 L 1445.3176,346.35613 L 1444.3428,344.74336 L 1440.819,343.73416 z "},"mn5":{"name":"MN-5","path":"M 1455.455,366.40059 L 1456.4475,364.18524 L 1455.26,362.74969 L 1454.5689,355.25296 L 1453.5941,355.25296 L 1453.5941,350.1488 L 1451.8927,350.1488 L 1451.8927,355.39474 L 1447.5152,354.70356 L 1446.7885,363.36999 L 1449.0854,361.31515 L 1452.1277,366.10437 L 1455.455,366.40059 z "},"mn4":{"name":"MN-4","path":"M 1465.3238,367.11926 C 1464.9549,367.09464 1464.2703,366.92671 1463.8024,366.74607 C 1463.3345,366.56544 1462.6187,365.94826 1462.2117,365.37454 L 1461.4717,364.33143 L 1459.8295,365.1806 C 1458.9264,365.64765 1457.8158,366.02978 1457.3617,366.02978 L 1456.5359,366.02978 L 1457.1307,363.75523 L 1455.8321,362.1905 L 1455.1315,354.68721 L 1454.1612,354.68721 L 1454.1612,350.21711 L 1454.5866,349.95528 C 1454.8205,349.81128 1457.0536,349.60783 1459.5489,349.50319 L 1464.086,349.31292 L 1465.0459,363.43256 L 1466.777,364.69838 L 1465.9945,367.16404 L 1465.3238,367.11926 z "},"nh2":{"name":"NH-2","path":"M 2389.9388,328.94111 L 2390.1367,327.02805 L 2388.1411,327.53754 L 2386.0661,325.12063 L 2385.6509,323.88253 C 2385.4225,323.20158 2385.1778,321.24079 2385.1072,319.52523 L 2384.9788,316.40602 L 2385.6827,315.55533 C 2386.0699,315.08744 2386.5717,314.09855 2386.7979,313.35779 L 2387.2093,312.01095 L 2385.7661,311.119 L 2385.9292,306.78165 L 2383.709,302.52218 L 2383.3316,291.04984 L 2381.3928,289.96482 L 2381.983,289.00991 L 2381.4601,285.69411 C 2381.1725,283.87041 2380.6759,281.36251 2380.3565,280.12098 L 2379.7758,277.86367 L 2381.2799,276.13988 L 2381.1899,267.5329 L 2383.6413,264.41652 L 2383.4663,255.53596 L 2384.9463,253.75274 L 2384.3572,252.21762 L 2385.3048,250.68438 L 2383.743,249.48483 L 2385.6507,241.63308 L 2384.2523,241.16694 L 2384.2523,239.14592 L 2381.9838,236.26197 L 2381.9838,233.3886 L 2380.7831,232.64655 L 2381.5534,229.13924 L 2382.7611,228.13011 C 2383.4253,227.57509 2384.2877,227.1125 2384.6776,227.10212 L 2385.3865,227.08325 L 2385.3865,225.94899 L 2388.0464,225.94899 L 2390.1057,223.67352 L 2389.3964,222.96421 L 2389.9635,221.90452 C 2390.2754,221.32169 2390.7875,220.84483 2391.1015,220.84483 C 2391.4155,220.84483 2392.1375,220.39822 2392.706,219.85236 C 2393.2745,219.3065 2394.0295,218.30244 2394.3837,217.62113 C 2394.7379,216.93981 2395.0277,215.98278 2395.0277,215.49439 L 2395.0277,214.60642 L 2397.2188,212.4153 L 2396.3411,209.21869 L 2397.5665,206.47313 L 2396.162,206.00496 L 2396.162,205.20153 C 2396.162,204.75965 2395.7154,203.93497 2395.1695,203.36893 C 2394.6236,202.80288 2393.3837,201.33144 2392.4139,200.09907 L 2390.6509,197.8584 L 2391.2243,196.44944 C 2391.5397,195.67451 2391.855,193.89204 2391.925,192.4884 L 2392.0523,189.93632 L 2393.3933,186.56726 L 2391.6249,185.27424 L 2391.6249,183.53569 L 2389.7958,182.83379 L 2391.1864,181.15826 L 2390.4656,177.31588 L 2391.7971,174.05672 L 2391.5415,167.26651 L 2390.2071,166.41785 L 2392.1921,166.40048 L 2392.1921,165.83335 C 2392.1921,165.52143 2392.2201,165.07481 2392.2544,164.84087 C 2392.2887,164.60693 2392.8093,163.72386 2393.4112,162.87848 L 2394.5057,161.34143 L 2396.7673,163.60305 L 2399.1099,163.3207 C 2400.3982,163.16541 2401.6441,162.8378 2401.8784,162.59268 C 2402.1126,162.34756 2402.3898,161.5955 2402.4941,160.92142 L 2402.684,159.69582 L 2423.9664,216.95881 L 2423.1356,218.29275 L 2423.2547,220.61959 L 2414.9458,222.97185 L 2414.746,233.60523 L 2412.3853,228.78463 L 2410.9472,228.78463 L 2409.7162,226.48435 L 2409.1775,226.81727 C 2408.8812,227.00037 2408.6388,227.48009 2408.6388,227.8833 L 2408.6388,228.61641 L 2412.0416,232.17709 L 2412.0416,233.74991 L 2413.7678,235.18251 L 2413.5502,238.70939 L 2416.0544,243.56888 C 2413.9292,245.55455 2410.8337,246.6134 2408.1785,247.84843 C 2410.1276,252.23751 2412.4814,256.78849 2413.1758,259.31577 L 2408.0873,261.25912 C 2408.6758,263.24512 2408.6169,264.94779 2408.6388,267.2171 L 2406.3703,267.81033 L 2406.3703,270.8294 L 2409.6646,268.48364 L 2415.312,268.48364 L 2416.0115,273.97195 L 2433.3089,279.91108 L 2431.6232,292.30305 L 2426.3574,292.30305 L 2425.7114,293.86265 C 2425.3561,294.72044 2425.0591,295.67746 2425.0515,295.98939 L 2425.0375,296.55651 L 2419.3752,299.06352 L 2422.882,306.01055 L 2424.258,305.52631 L 2427.4937,313.28681 C 2429.2513,313.32316 2430.8066,312.99525 2431.4309,312.30307 L 2429.5804,308.72449 L 2430.6632,306.78955 L 2432.0731,309.88404 L 2436.4281,309.88404 L 2437.0352,308.64262 L 2444.228,304.83609 L 2446.2719,306.24282 L 2444.3391,308.59997 L 2445.4741,311.58542 L 2442.7545,311.58542 L 2441.5375,315.27176 L 2389.9388,328.94111 z "},"or5":{"name":"OR-5","path":"M 97.489044,277.84769 L 99.083244,273.27724 C 99.960024,271.2646 100.83448,269.6179 101.02645,269.6179 L 101.37546,269.6179 L 101.52388,265.93156 L 103.30018,261.11097 C 104.27712,258.45964 105.43349,254.93808 105.86996,253.28528 C 106.30636,251.63248 106.66343,249.56263 106.66343,248.68561 L 106.66343,247.09103 L 108.17874,244.88516 C 109.01219,243.67193 110.54344,240.68122 111.58151,238.23914 L 113.46897,233.79898 L 113.46897,231.22895 L 115.64204,229.26234 L 116.75644,226.32963 C 117.36934,224.71663 118.2637,221.99327 118.74395,220.2777 C 119.22419,218.56214 119.91342,216.01006 120.27559,214.60642 C 120.63782,213.20277 121.24669,210.7783 121.62865,209.21869 C 122.01061,207.65909 122.73665,205.48982 123.24202,204.3981 C 123.74738,203.30638 124.85663,200.17563 125.70704,197.44089 L 127.25315,192.46864 L 125.90332,189.50618 L 126.47312,188.93637 C 137.46535,192.11608 139.69004,193.8392 151.46659,195.45027 L 150.89048,199.44213 L 145.22818,198.03345 L 145.22818,198.92802 C 145.22818,199.42003 145.65829,200.72447 146.1839,201.82678 L 147.40344,203.74694 C 148.89338,204.45785 150.19201,205.7147 151.20759,207.00844 L 148.63095,207.23374 L 148.63095,209.01157 L 146.36243,208.29156 L 146.36243,209.6913 L 145.67502,209.00387 L 144.38531,210.29357 C 143.67595,211.0029 143.27677,211.62089 143.0624,212.2963 L 139.23981,227.82301 L 125.36257,224.46987 L 123.42259,233.256 L 153.80469,241.17451 L 157.70501,239.23162 L 156.53083,236.72444 L 158.39285,236.72444 L 157.27311,232.47456 L 159.40639,233.3981 L 159.40639,230.48602 L 161.4581,230.48602 L 165.6052,232.34586 L 165.64481,229.99991 L 166.4955,229.14922 C 166.96338,228.68134 167.35431,227.96128 167.36423,227.54911 L 167.38227,226.79968 L 168.88907,228.78463 L 171.77008,228.78463 L 173.10233,223.23138 L 175.74242,220.75112 L 176.52722,224.32425 L 178.09079,224.92425 L 178.81802,228.80059 L 180.53682,229.76249 L 179.9647,231.33671 L 182.06545,234.83115 L 180.73009,238.369 L 182.83448,240.69434 L 185.26746,240.69434 L 186.37189,239.58989 L 189.6732,241.30262 L 191.02739,240.78297 L 192.01629,241.68109 L 195.70263,240.12395 L 195.70263,237.85869 L 198.56315,238.65097 L 200.975,241.26147 L 203.64368,241.26147 L 207.95233,245.70124 L 211.21201,246.08206 L 212.93308,252.32048 L 214.21122,252.89962 L 214.05551,255.55009 C 210.31413,255.65093 209.66265,257.57401 206.63432,257.5164 L 206.01887,262.81236 L 207.61233,262.81236 C 207.58127,263.89363 207.90672,264.69762 208.70754,265.46198 C 207.40972,266.62281 206.7061,267.90248 206.12132,269.65751 L 203.0753,269.6179 L 203.0753,271.65956 L 204.84534,272.36005 L 204.92463,273.27269 L 203.29507,273.92066 L 202.38933,277.37323 C 196.06995,275.64511 193.11657,275.12364 191.32752,273.8506 C 190.45868,273.28505 189.48497,272.4691 189.16381,272.03735 L 188.57984,271.25237 C 187.41646,271.72512 186.23809,272.14441 185.02405,272.45354 L 182.70098,268.00638 L 173.01748,265.66685 L 169.15607,262.81236 L 165.9121,262.89158 L 161.69754,260.43116 L 158.42521,261.44545 C 156.62548,262.0033 154.31573,262.92189 153.29252,263.48673 C 152.26931,264.05159 151.34415,264.51374 151.23668,264.51374 L 151.01612,262.7243 L 146.9486,259.4492 L 144.74028,261.37573 L 146.34466,264.73365 L 147.3265,264.94405 L 147.17916,266.5552 L 142.83063,266.66617 L 142.72082,265.86602 L 136.19963,266.6644 L 135.12637,268.48251 L 136.2752,269.19255 L 134.7735,270.12068 L 133.76617,268.59325 C 133.21214,267.75316 132.75713,266.65046 132.75509,266.14279 L 132.75135,265.21976 C 134.64748,263.82929 135.87017,262.12191 136.6571,259.14688 L 125.81854,256.33626 L 121.24311,273.64558 L 115.89849,272.35751 L 114.86655,277.53005 L 110.76762,276.88155 L 110.01178,277.62347 C 110.39949,278.59323 111.37515,279.16908 111.92604,279.99091 L 111.2526,280.71026 L 97.489044,277.84769 z "},"or3":{"name":"OR-3","path":"M 212.20797,246.5695 C 211.95174,246.56472 212.05012,246.10087 211.58224,245.7985 C 211.11435,245.49613 210.15704,245.24482 209.45488,245.24005 L 208.17822,245.23137 L 205.97668,242.96285 L 203.77514,240.69434 L 200.8711,240.69434 L 200.13004,239.65008 C 199.72244,239.07574 198.83154,238.31012 198.15019,237.9487 C 197.4689,237.58727 196.51187,237.29157 196.02346,237.29157 L 195.1355,237.29157 L 195.1355,239.87853 L 192.26905,241.16109 L 191.12931,240.17675 L 189.6732,240.73549 L 186.37189,239.02277 L 185.26746,240.12721 L 182.79756,240.12721 L 181.31004,238.33489 L 182.63258,234.83115 L 180.47137,231.3342 L 181.53593,229.43186 L 179.37488,228.74596 L 178.64317,224.84557 L 176.95739,224.01718 L 175.9209,220.30278 L 176.98738,219.64364 L 176.98738,216.92633 L 173.1435,216.20521 L 171.14386,211.77077 L 170.15111,211.77077 C 169.74014,210.76273 169.67151,210.05995 169.17167,209.26455 L 168.54658,207.89259 L 169.6932,203.73974 L 175.31277,205.09649 L 174.57703,209.01835 L 178.40521,212.97148 L 185.43142,216.43254 L 187.37151,218.57632 L 191.08915,218.57632 L 191.79665,220.80543 L 195.80948,221.55824 L 197.88279,220.93607 C 199.02311,220.59387 200.72172,220.32998 201.65748,220.34965 C 202.59325,220.36931 204.57695,220.19971 206.06577,219.97276 L 208.77262,219.56013 L 209.07666,219.06822 C 209.24385,218.79767 209.63613,218.57632 209.94839,218.57632 L 210.51609,218.57632 L 209.15345,226.13056 L 209.9425,226.76291 C 210.37646,227.1107 211.17816,228.23896 211.72402,229.27016 L 212.71649,231.14507 L 212.72517,232.37515 C 212.72993,233.05169 212.92134,233.88603 213.15052,234.22924 C 213.37969,234.57244 214.10857,235.13805 214.77024,235.48616 L 215.97323,236.11906 L 215.87069,241.91488 L 215.09003,242.94 L 214.99803,246.0607 L 212.20797,246.5695 z "},"me2":{"name":"ME-2","path":"M 2436.4836,245.76882 L 2435.4679,246.31238 C 2426.1569,216.42719 2413.2101,187.76367 2403.5418,158.03533 L 2403.5347,157.32642 L 2404.9839,157.32642 L 2406.8541,155.14229 L 2409.2059,155.75732 L 2409.2059,157.26798 L 2411.9768,160.25772 L 2413.9981,159.86844 L 2414.2534,152.82133 L 2413.2253,152.18594 L 2413.9273,150.35685 L 2412.0219,148.9636 L 2412.7301,147.1181 L 2413.4866,147.1181 C 2413.9027,147.1181 2414.4009,147.37331 2414.5937,147.68523 L 2414.9441,148.25236 C 2416.6589,148.21014 2418.423,148.40812 2420.0893,147.95547 L 2420.3861,147.65858 L 2419.8293,144.7455 L 2414.272,141.32607 L 2415.4977,135.19792 C 2416.7852,133.29378 2417.7563,131.06494 2419.499,129.53711 L 2419.9814,129.53711 L 2419.9814,127.97035 L 2423.9513,124.94236 L 2423.9513,122.12884 L 2422.2499,121.47596 L 2422.2499,120.08153 C 2422.2499,119.31459 2422.5111,118.1991 2422.8303,117.60265 C 2423.1495,117.00622 2424.0462,115.88263 2424.8231,115.10581 L 2426.2355,113.6934 L 2426.0616,110.98159 L 2425.8877,108.26979 L 2422.8792,107.91688 L 2423.4493,106.4312 L 2421.7025,105.76087 L 2422.3917,102.31493 L 2421.1156,102.31493 L 2421.1156,100.7349 L 2422.691,100.1304 L 2421.9331,96.360083 L 2419.572,95.308354 L 2420.4411,84.486178 L 2421.711,84.062895 L 2422.5695,82.007995 C 2423.0418,80.877804 2423.7024,79.78362 2424.0375,79.576482 L 2424.6469,79.199858 L 2421.7206,61.765232 L 2437.683,7.8880076 L 2439.4501,6.4924292 L 2445.3863,6.7537502 L 2445.9058,11.29078 L 2448.6214,16.878604 L 2456.2313,18.956993 L 2462.2325,13.124634 L 2467.0531,11.047524 L 2467.0531,8.171572 L 2468.7901,8.171572 L 2469.4429,6.4701859 L 2473.6418,6.4701859 L 2475.6439,5.0062515 L 2474.9342,3.4487544 L 2474.2246,1.8912568 L 2476.1158,0 L 2482.3933,0.11593585 L 2483.0883,0.64332471 C 2483.4706,0.93338835 2485.0594,1.6188122 2486.619,2.1664883 C 2488.1786,2.7141645 2490.3479,3.5875359 2491.4396,4.1073133 C 2492.5313,4.6270913 2494.573,5.9730772 2495.9766,7.0983932 L 2498.5287,9.1444223 L 2502.5169,9.874592 L 2526.0568,75.323204 L 2527.3878,76.145784 L 2526.0342,79.11658 L 2528.7927,81.673055 L 2527.783,83.306697 C 2528.8075,85.662272 2528.9942,88.511357 2530.1874,90.777319 L 2530.6024,91.192293 L 2535.0808,90.928045 L 2537.8935,92.770986 L 2545.5383,92.292738 L 2545.9785,90.97236 L 2548.0311,90.97236 L 2548.3754,91.869439 C 2548.5647,92.36283 2548.7196,93.274285 2548.7196,93.894899 L 2548.7196,95.023281 L 2547.8689,95.873974 C 2547.401,96.341856 2547.0182,97.071075 2547.0182,97.494471 L 2547.0182,98.264274 C 2548.4066,99.727671 2549.7339,101.26622 2551.4285,102.37529 L 2552.1525,102.60854 L 2552.297,107.13553 L 2551.409,109.18518 L 2558.0772,115.65114 L 2561.2132,117.04357 L 2563.4822,114.77449 L 2562.7749,111.95612 L 2568.0057,111.95612 L 2578.7285,123.2987 L 2579.3993,123.2987 C 2579.7683,123.2987 2580.4225,123.74531 2580.8531,124.29117 L 2583.265,128.25087 L 2582.1269,132.37276 L 2580.4788,132.37276 L 2580.4788,134.64127 L 2579.4907,134.64127 L 2578.7313,140.36586 L 2577.076,141.00104 L 2577.076,142.45062 L 2574.4747,144.15505 L 2572.539,142.73959 L 2572.539,139.74543 L 2572.0788,139.74543 C 2571.8257,139.74543 2571.0601,140.26579 2570.3774,140.90178 L 2569.1362,142.05813 L 2569.1362,143.79635 L 2570.9896,145.64964 L 2569.7034,146.07837 L 2569.7034,147.68523 L 2568.002,147.68523 L 2568.002,148.94994 L 2565.0298,147.00253 L 2562.8469,149.18547 L 2563.996,154.20721 L 2562.0797,155.65006 L 2560.6293,155.0935 L 2558.9279,155.74639 L 2558.9279,157.10353 C 2558.9279,157.84996 2558.7774,158.46068 2558.5935,158.46068 C 2558.4096,158.46068 2557.8353,157.97783 2557.3174,157.38769 L 2556.3758,156.31469 L 2552.0866,156.88756 L 2552.3729,157.8159 C 2552.5303,158.32649 2552.7764,159.71828 2552.9198,160.90877 L 2553.1805,163.07329 L 2554.5298,164.69909 L 2552.7251,164.69909 L 2553.469,166.68404 L 2551.7551,165.29321 L 2550.421,166.62733 L 2550.421,168.66899 L 2549.9673,168.66899 C 2549.7177,168.66899 2549.1726,168.34998 2548.7559,167.96008 L 2547.9982,167.25117 L 2548.5926,169.72371 L 2547.6895,173.48959 L 2546.8859,170.93751 L 2545.3359,170.93751 L 2542.4803,165.30216 L 2541.4883,165.66817 C 2540.9426,165.86947 2540.3087,166.308 2540.0796,166.64268 L 2539.6629,167.25117 L 2539.6455,165.83335 L 2537.9442,165.83335 L 2537.9442,167.49914 L 2536.2428,166.84625 L 2536.2428,169.48358 L 2537.7674,170.79368 C 2538.606,171.51424 2539.8493,172.24364 2540.5304,172.41458 L 2541.7686,172.72536 L 2543.1676,175.33938 L 2542.4008,177.75549 L 2539.0781,179.47374 L 2539.362,183.13077 L 2535.3921,182.8052 L 2533.8323,181.24694 L 2533.394,176.32523 L 2534.7124,173.81182 C 2534.1816,173.05864 2533.5808,172.48606 2532.7814,172.07176 L 2532.2945,172.07176 L 2531.5138,175.18226 L 2530.4769,172.07176 L 2529.9166,172.07176 C 2529.6084,172.07176 2528.9916,172.43635 2528.546,172.88195 C 2528.1004,173.32755 2527.7358,173.96341 2527.7358,174.29497 C 2527.7358,174.62652 2527.2254,175.21656 2526.6016,175.60615 L 2525.4673,176.31451 L 2525.4673,176.95934 C 2525.4673,177.314 2525.8238,177.90001 2526.2595,178.26159 L 2527.0516,178.91902 L 2526.4677,181.15186 L 2527.8643,182.83472 L 2528.6992,182.31879 L 2530.1951,185.11402 L 2529.6142,185.69496 L 2527.1859,184.83822 C 2525.8503,184.367 2524.1349,183.98147 2523.3738,183.98147 C 2522.6127,183.98147 2521.5148,183.72717 2520.9341,183.41637 L 2519.8782,182.85128 L 2518.0946,183.53569 L 2518.0946,185.11572 L 2516.6768,185.10751 L 2515.7325,182.13419 L 2514.7882,179.16087 L 2515.4051,175.35645 L 2513.0118,176.63731 L 2511.3345,179.728 L 2511.2891,178.31018 L 2510.6452,178.31018 C 2510.2911,178.31018 2509.3787,178.98204 2508.6176,179.8032 L 2507.234,181.29621 L 2507.8739,183.84593 L 2510.1548,184.44241 L 2510.1548,188.5185 L 2509.0206,188.5185 L 2509.0206,191.73223 L 2508.3117,191.80395 C 2507.9218,191.84339 2506.9392,192.03598 2506.1281,192.23192 L 2504.6534,192.58817 L 2496.5345,188.49955 L 2494.6763,192.39619 L 2492.1637,192.04444 C 2491.6471,191.89363 2491.3299,192.62278 2490.8179,193.19098 L 2487.4697,193.18426 L 2487.4697,185.68285 L 2489.8866,185.68285 L 2489.5351,183.55612 C 2489.3417,182.38642 2489.1808,180.98277 2489.1773,180.43691 L 2489.1711,179.44444 L 2487.0314,179.44444 L 2486.266,174.34028 L 2482.2587,174.52939 L 2483.7474,175.82278 L 2484.6341,176.16302 L 2484.6341,178.81037 L 2483.3702,179.59149 L 2483.9496,183.91181 L 2482.082,185.57331 L 2472.1572,186.38414 L 2471.8793,183.02853 L 2469.4404,183.40782 L 2468.7901,181.71295 L 2467.8934,181.71295 C 2467.4003,181.71295 2466.2438,182.10232 2465.3235,182.57821 L 2463.6503,183.44347 L 2463.6503,185.68285 L 2462.5624,185.68285 C 2461.9641,185.68285 2461.0709,185.83776 2460.5775,186.02709 L 2459.6804,186.37134 L 2459.3292,190.54045 C 2460.8844,190.49029 2461.7741,191.51177 2463.3292,194.47158 L 2464.4408,197.00569 C 2464.9418,198.53741 2465.3517,200.46127 2465.3517,201.28096 C 2465.3517,202.10063 2465.0716,203.29459 2464.7293,203.93419 L 2464.1069,205.0971 L 2465.5146,210.12488 L 2471.1408,209.93632 L 2470.6827,206.71384 L 2471.9473,205.99132 L 2475.0038,208.99755 L 2474.754,210.37481 C 2474.6166,211.1323 2474.3439,212.01148 2474.148,212.32854 L 2473.7917,212.90503 L 2469.8192,212.90503 L 2470.2284,215.59889 C 2470.4534,217.08052 2470.6605,219.10117 2470.6885,220.08923 C 2470.7165,221.07729 2470.9262,222.07221 2471.1544,222.30016 L 2471.5695,222.71461 L 2471.2005,224.1844 C 2470.9977,224.99279 2470.4902,225.99564 2470.0729,226.41296 L 2469.3141,227.17173 L 2465.8995,226.42177 C 2463.6148,225.10215 2461.0305,223.46141 2458.5893,222.44589 L 2457.8191,226.03947 L 2455.7105,226.35883 L 2454.2843,226.0862 C 2453.4999,225.93624 2452.7192,225.58882 2452.5494,225.31415 C 2452.3797,225.03947 2451.7752,224.81473 2451.2061,224.81473 L 2450.1715,224.81473 L 2449.6448,226.82886 L 2447.3515,227.00161 L 2445.8803,224.2525 L 2445.8803,220.74712 L 2443.1831,218.97985 L 2436.4188,226.97463 L 2434.1596,226.38383 L 2434.1683,227.15889 C 2434.173,227.58517 2434.3693,228.23632 2434.6042,228.60589 L 2435.0316,229.27783 C 2436.4072,229.49983 2437.6092,229.6763 2438.9213,229.74498 L 2442.4994,232.20836 L 2442.3682,234.89174 C 2442.296,236.3676 2442.0448,238.03802 2441.81,238.60377 L 2441.3832,239.63241 L 2442.5985,242.29979 L 2440.4123,243.17456 C 2439.2098,243.65568 2438.0625,244.31391 2437.8626,244.63729 C 2437.6627,244.96068 2437.0421,245.46987 2436.4836,245.76882 z "},"wa5":{"name":"WA-5","path":"M 300.67012,27.176996 L 300.2031,28.103065 L 301.22577,30.461944 L 303.78708,29.820931 L 304.58348,30.961682 L 303.13671,32.182308 L 303.13671,35.142011 L 304.36632,36.390465 L 303.01939,39.970465 L 305.53602,45.183206 L 298.55212,49.77316 L 299.6523,52.65123 L 302.11152,52.707767 L 300.74638,56.323212 L 303.45708,56.269801 C 302.484,59.0695 302.81685,59.976928 301.89707,62.19029 C 302.53442,65.069903 303.62484,65.97728 304.76857,67.311088 L 303.45708,69.402375 C 306.71654,72.424042 309.06984,75.179187 311.55639,78.547325 L 310.22718,81.471582 L 317.68283,89.816325 L 318.08101,90.963967 L 319.83293,92.796434 L 320.18738,95.738414 L 327.04623,97.422616 L 328.46432,94.40041 L 327.91505,92.025292 L 331.69771,90.617207 L 332.55788,90.970988 L 334.20609,89.606335 C 335.33156,92.017261 336.48367,90.936802 337.44922,92.681437 L 336.1556,95.561186 L 338.06966,97.475245 L 344.50424,93.577183 L 347.69312,94.49782 L 347.53321,96.315013 L 351.0959,96.766334 L 351.0959,94.515542 L 352.8859,93.02683 L 354.72906,94.196533 L 360.22312,92.58376 C 360.54502,93.43671 363.47879,92.024254 364.54694,96.022114 L 363.93571,98.653744 C 366.5456,101.11657 366.73018,102.06026 366.40837,103.32376 L 364.70698,104.72386 L 351.71619,168.91574 L 344.29035,167.60425 L 344.29035,172.08811 L 342.9257,174.28574 L 344.75114,178.1493 L 380.17851,185.4214 L 381.04738,188.80069 L 379.96629,190.80336 L 381.04738,192.75287 L 379.94857,194.80871 L 374.9153,192.87693 L 371.93788,194.24158 L 369.29718,192.50475 L 362.06122,196.37959 L 360.05855,200.93434 L 356.73174,204.85752 L 354.55184,204.29039 L 352.85045,208.36663 L 350.10342,208.36663 L 348.79193,209.94396 L 341.45471,210.40475 L 340.26728,211.6099 L 342.44718,215.45574 L 343.15609,220.18772 L 340.40906,223.44871 L 427.55193,240.37395 L 426.96708,236.15594 L 425.95688,236.15594 L 425.95688,234.52544 L 428.79253,231.4594 L 428.79253,230.6796 C 428.79252,230.25303 428.48341,229.4128 428.10134,228.80098 L 427.39243,227.68445 L 428.68619,226.39069 L 425.21253,218.00782 L 427.03797,214.32148 L 455.47958,58.649847 C 396.2571,48.144418 364.40154,41.395664 300.67012,27.176996 z "},"wa4":{"name":"WA-4","path":"M 273.1157,228.70571 L 268.87811,224.12165 C 263.52394,225.19138 257.56715,226.40016 254.06721,227.74803 L 252.62438,226.55058 L 246.30701,225.8081 L 242.72633,227.92327 L 241.66597,226.23256 L 242.33534,224.26734 L 236.61155,219.71058 L 232.65305,219.71058 L 229.28306,216.87493 L 220.03285,216.87493 L 216.68639,215.14442 L 216.73275,211.98764 L 222.64124,211.53527 L 227.77019,206.38305 L 229.81633,197.63811 L 233.5212,198.43575 L 238.471,177.88744 L 243.05788,178.87343 L 244.33114,177.15686 L 242.93419,170.46259 C 244.93164,168.44717 246.07686,166.62841 247.3532,164.02297 L 246.59869,161.64584 L 249.86342,159.002 L 247.33902,157.04285 L 245.50016,147.20402 L 249.01273,145.38759 L 249.01273,143.75887 L 254.18681,138.4351 L 253.7606,134.10321 L 257.74005,134.35771 L 258.69243,129.83361 L 256.72993,128.39861 L 258.08679,127.04175 L 258.08679,124.94108 L 254.77033,123.78496 L 255.11243,118.66798 L 259.45124,114.22464 L 261.51516,114.22464 C 262.49454,112.18778 264.40545,112.0014 266.66882,109.85125 C 268.71045,109.70721 270.38702,108.92116 272.26501,108.02182 L 272.26501,103.56015 L 275.53473,102.42031 L 274.62687,97.494341 L 276.42144,95.497503 L 273.90479,92.957311 L 273.82397,87.656614 L 277.06688,83.97186 L 276.74033,81.479602 C 278.56329,80.56459 280.67108,80.575303 282.52964,80.764044 L 285.96803,78.985988 L 285.33063,77.324958 L 288.25142,75.970247 C 286.91456,72.439434 285.61329,70.261614 285.30897,65.983099 L 283.55864,65.311426 L 285.3363,63.34709 L 284.60425,61.439423 L 286.40551,59.449084 L 286.15966,56.093947 L 290.12956,55.7469 L 291.26382,54.392561 L 296.03036,54.298657 L 296.36798,56.661076 L 302.91142,56.559923 L 302.52767,58.258199 C 302.4151,59.251304 302.15609,60.446658 301.95215,60.914539 C 301.74821,61.382421 301.64709,62.273431 301.7274,62.894567 C 301.80765,63.515704 302.35731,64.703532 302.94877,65.534194 L 304.41792,67.392425 L 302.99733,69.387408 C 306.4486,72.651052 308.68297,75.306235 311.20366,78.56988 L 309.8465,81.53349 L 317.3903,89.948557 L 317.71242,90.998913 L 319.55144,92.921128 L 319.90935,95.94317 L 327.19341,97.777905 L 328.87829,94.400455 L 328.31609,92.250572 C 330.82964,91.032312 332.01987,90.583571 332.49343,91.284242 L 334.19183,89.996292 C 335.23635,92.250703 336.81773,91.391247 337.11063,92.679282 L 335.71361,95.837553 L 338.07451,97.974097 L 344.57392,93.956013 L 347.42893,94.627579 L 347.26086,96.578184 L 351.37946,97.141961 L 351.39307,94.663688 L 353.01113,93.37106 L 354.69802,94.628429 L 360.21208,92.984204 C 360.91384,93.552291 361.72824,93.512796 362.5844,93.597282 L 364.17275,96.031631 L 363.50864,98.677689 C 365.49237,101.08616 366.29497,101.84823 366.1312,103.21874 L 364.48836,104.57523 L 351.40715,168.26065 L 343.8804,167.09319 L 343.94554,171.94619 L 342.42779,174.28334 L 344.48117,178.7308 L 379.88494,185.67069 L 380.73398,188.632 L 379.4124,190.78701 L 380.50747,192.83308 L 379.74,194.35459 L 374.925,192.30191 L 372.0931,193.59221 L 369.24401,191.92127 L 361.84135,196.09631 L 359.96352,200.30601 L 356.63697,204.35604 L 354.26146,203.92911 L 352.5926,207.80087 L 349.8224,207.80087 L 348.5184,209.37209 L 341.44059,209.84048 L 339.68719,211.59385 L 341.88987,215.45711 L 342.59991,220.26232 L 338.5387,224.75762 L 332.80328,226.80946 L 328.54011,225.13922 L 317.28499,224.81473 L 315.08322,223.14942 L 312.16172,223.11335 L 309.53404,225.9104 L 295.86488,225.50219 C 292.84862,226.49277 290.48134,227.34428 286.81611,227.08325 L 284.7483,229.10686 L 273.1157,228.70571 z "},"fl23":{"name":"FL-23","path":"M 2238.6065,1344.7508 L 2235.6823,1345.6546 L 2234.9911,1349.341 L 2221.1319,1352.3184 L 2225.3499,1372.3983 L 2215.9214,1384.5384 L 2215.1061,1396.8912 L 2204.437,1398.8938 L 2205.922,1403.9094 L 2208.8677,1403.2182 L 2209.6653,1407.4894 L 2207.3613,1409.2617 C 2208.084,1412.6014 2208.9096,1415.9201 2209.5589,1419.275 C 2206.6486,1420.4236 2204.1598,1420.8697 2201.39,1421.3626 L 2203.3914,1430.8835 L 2224.5853,1426.4401 L 2228.7704,1442.8817 L 2239.1167,1440.8437 L 2239.9231,1442.0476 L 2253.3835,1439.2309 C 2253.3278,1434.2373 2252.9443,1433.2718 2251.9518,1427.6225 L 2255.9394,1428.3668 L 2258.456,1423.2272 L 2260.8663,1422.0752 L 2261.3626,1423.3158 L 2262.4082,1422.9259 L 2261.6993,1421.774 L 2263.188,1421.0473 L 2263.897,1422.5715 L 2262.1601,1424.6627 L 2265.2261,1426.4882 L 2266.8566,1425.8502 L 2267.2643,1423.812 L 2266.0768,1422.7664 L 2265.9174,1421.1891 L 2266.1655,1419.8421 L 2267.0162,1417.2724 L 2266.6617,1416.4748 L 2266.1123,1416.8647 L 2266.2718,1417.4142 L 2265.3679,1417.9104 L 2264.7831,1419.4522 L 2264.8894,1419.9485 L 2265.2793,1419.8421 L 2265.4211,1420.3029 L 2264.6413,1420.6397 L 2263.7906,1419.0978 L 2262.0538,1420.0903 L 2262.1956,1420.4979 L 2258.7874,1421.8448 L 2256.5597,1413.5151 L 2258.9523,1410.4845 L 2258.2079,1402.3675 L 2259.5194,1399.9218 L 2257.5699,1396.2532 C 2257.9441,1395.3405 2259.3954,1392.301 2259.3954,1392.301 L 2262.4437,1390.6173 L 2262.4791,1391.4148 C 2262.4063,1392.9449 2261.4335,1394.3391 2261.4335,1394.3391 L 2263.7197,1395.2429 L 2264.0564,1402.208 L 2264.4818,1402.208 L 2264.6413,1406.107 L 2264.418,1406.1056 L 2264.4534,1407.2576 L 2264.9958,1407.1172 L 2264.4818,1395.3493 L 2263.8792,1390.5464 L 2262.1601,1388.0298 L 2257.499,1392.3718 L 2258.1902,1393.2403 L 2256.6483,1394.5872 L 2255.8508,1398.2027 L 2254.8938,1398.2027 L 2252.1113,1395.4202 L 2252.1113,1397.6355 L 2250.0554,1397.6355 L 2248.1414,1393.6302 L 2248.1882,1387.9437 L 2249.9833,1385.9639 L 2249.9365,1382.8181 L 2247.0932,1378.2531 L 2243.0651,1378.7925 L 2241.7131,1377.1556 L 2239.8294,1376.9708 L 2237.571,1375.5973 L 2233.9822,1358.9379 L 2238.5002,1353.1336 L 2237.9179,1351.3044 L 2240.6447,1348.9688 L 2238.6065,1344.7508 z "},"fl10":{"name":"FL-10","path":"M 2099.7841,1335.6767 L 2099.6423,1344.0419 L 2097.9055,1348.1181 L 2098.5789,1350.8474 L 2106.2529,1358.2201 L 2107.015,1364.1041 L 2107.8302,1363.8027 C 2108.2716,1363.6334 2108.6277,1363.2755 2108.6277,1363.0229 C 2108.6277,1362.7704 2108.3638,1362.4741 2108.0429,1362.3672 L 2107.458,1362.1722 L 2107.2099,1358.8049 L 2111.5343,1357.7239 L 2110.7899,1353.3641 L 2112.6331,1350.5461 L 2111.4102,1348.2599 L 2113.1072,1347.4513 L 2112.7439,1346.9048 L 2110.4532,1347.7637 L 2108.8758,1346.2041 L 2106.6251,1345.7255 C 2105.3852,1345.4655 2103.7989,1345.2302 2103.0982,1345.1938 L 2101.8222,1345.1229 L 2100.5993,1343.8823 L 2101.4855,1342.1455 C 2101.9798,1341.1894 2102.3908,1340.0874 2102.3893,1339.6821 C 2102.3878,1339.2766 2101.794,1338.2022 2101.0778,1337.3072 L 2099.7841,1335.6767 z "},"tx10":{"name":"TX-10","path":"M 1294.6386,1281.3742 L 1296.6235,1284.068 L 1295.2411,1286.6201 L 1296.0209,1287.1163 C 1296.443,1287.3838 1297.3349,1287.6078 1298.0059,1287.6126 L 1299.2287,1287.6126 L 1301.4972,1291.4761 L 1305.0064,1292.2382 L 1305.9457,1293.9396 L 1315.4628,1292.3623 L 1317.306,1298.388 L 1326.2737,1293.2839 L 1328.8081,1290.395 L 1329.836,1290.9445 C 1330.3986,1291.2455 1331.3518,1291.4594 1331.9627,1291.4052 C 1332.5736,1291.3511 1333.2304,1291.0902 1333.416,1290.8381 L 1333.7527,1290.3773 L 1336.5174,1291.0685 L 1337.1555,1292.6104 C 1337.504,1293.4517 1337.9436,1294.8666 1338.1479,1295.765 L 1338.5201,1297.3955 L 1343.4648,1305.8493 L 1345.3257,1307.2317 C 1346.3496,1307.9871 1347.4204,1308.5963 1347.7005,1308.5963 C 1347.9806,1308.5963 1348.8345,1309.0955 1349.5969,1309.6951 L 1350.9792,1310.7762 L 1354.3466,1310.3509 L 1359.2912,1320.1338 L 1361.7015,1320.3111 L 1363.846,1322.2606 L 1367.9576,1322.9163 L 1367.9576,1323.7138 L 1371.3604,1323.2176 L 1371.3604,1322.2783 C 1371.3604,1321.7593 1370.9615,1320.7586 1370.4743,1320.0629 L 1369.5881,1318.8047 L 1371.4491,1318.078 L 1372.4592,1315.4373 L 1374.0366,1315.0474 C 1374.9054,1314.8308 1377.0061,1313.9383 1378.6976,1313.0625 L 1381.7637,1311.4674 L 1388.0198,1315.2778 L 1390.6428,1314.0904 L 1390.6428,1313.5055 L 1387.7186,1308.6849 L 1388.9769,1306.3278 L 1387.7717,1306.3278 L 1386.6374,1303.3326 L 1388.5161,1301.2591 L 1392.2378,1300.0362 L 1392.9291,1297.2538 L 1395.5343,1297.2538 L 1396.4913,1295.2511 C 1397.017,1294.1487 1397.4495,1292.9365 1397.4483,1292.5572 C 1397.4471,1292.1778 1396.9215,1291.0064 1396.2786,1289.952 L 1395.1089,1288.0379 L 1394.2582,1289.2431 L 1391.2631,1290.4482 L 1390.3592,1291.9901 L 1382.1713,1293.5142 L 1381.4447,1283.554 L 1367.2842,1285.4149 L 1365.7246,1283.3591 L 1365.6891,1281.0728 L 1364.4663,1280.5235 C 1363.7899,1280.2156 1363.0413,1279.5735 1362.818,1279.1056 C 1362.5947,1278.6378 1362.0877,1277.5413 1361.6838,1276.6776 L 1360.9572,1275.118 L 1360.5495,1275.7738 C 1359.2382,1276.8524 1357.6106,1277.3178 1356.0125,1277.8473 L 1354.5238,1276.3763 L 1353.7263,1276.8726 C 1353.2857,1277.1514 1352.2816,1277.3995 1351.4932,1277.4043 L 1350.0576,1277.4043 L 1347.7537,1275.7915 L 1346.9384,1276.3054 C 1346.4899,1276.5892 1345.5436,1276.8324 1344.8295,1276.8371 L 1343.518,1276.8371 L 1339.0695,1274.5686 L 1337.8644,1272.3001 L 1338.4493,1271.2013 C 1338.7721,1270.598 1339.0341,1269.4725 1339.0341,1268.7023 L 1339.0341,1267.3023 L 1334.8161,1263.935 L 1336.1807,1260.9575 L 1337.9885,1260.9575 L 1338.0948,1259.4156 L 1339.1582,1259.1321 L 1339.5303,1257.2889 L 1337.2796,1255.1976 L 1309.2598,1273.0799 L 1299.4414,1276.9966 L 1290.6332,1272.6368 L 1288.3115,1272.814 L 1286.4683,1271.1481 L 1283.6859,1272.1583 C 1282.1546,1272.7076 1280.7758,1273.3016 1280.6198,1273.4875 C 1280.4639,1273.6734 1279.6344,1274.0043 1278.7767,1274.2142 L 1277.2171,1274.5863 L 1275.5157,1275.7029 L 1275.5157,1279.1233 L 1272.1306,1282.6502 C 1272.5846,1283.537 1273.3569,1284.0898 1274.1801,1284.6016 L 1276.5081,1284.0503 L 1278.895,1282.3907 L 1282.5871,1281.2678 L 1287.1418,1286.3365 C 1288.4203,1287.0129 1289.7113,1287.6609 1291.0586,1288.1797 L 1294.6386,1281.3742 z "},"tx11":{"name":"TX-11","path":"M 1194.4163,1295.1609 L 1194.4163,1285.3454 L 1136.0785,1285.3454 L 1135.3581,1283.0757 L 1127.5936,1277.8042 L 1124.5553,1270.6553 C 1118.9301,1266.5851 1117.093,1265.5168 1112.1826,1264.8774 L 1112.1826,1259.2575 L 1105.9442,1259.2575 L 1105.9442,1236.1901 C 1080.5179,1235.8447 1055.0916,1235.5861 1029.6654,1234.2549 L 1028.2476,1232.3856 L 1028.2476,1227.4983 C 1023.7748,1223.3262 1022.9472,1222.6563 1020.4042,1222.4867 L 1019.7554,1223.1355 C 1018.3582,1221.7388 1017.1331,1220.114 1015.4971,1218.9914 C 1013.7409,1219.3873 1012.8423,1220.212 1011.5149,1221.4656 L 1007.4614,1222.3952 L 1001.9047,1217.2935 L 997.72981,1216.1039 L 996.91661,1215.0215 L 994.21981,1215.0215 L 993.43361,1215.9413 C 990.33741,1215.7456 988.09901,1215.4784 985.14581,1214.282 L 983.98571,1212.0913 C 980.96851,1212.8089 978.32471,1211.3545 975.39401,1211.3358 C 974.55341,1211.3178 973.66021,1211.0977 973.40901,1210.8467 C 973.15801,1210.5956 972.88341,1209.8373 972.79891,1209.1613 L 971.81821,1198.8583 L 968.13191,1198.5029 L 965.36341,1195.9996 L 965.09751,1193.5838 L 963.63241,1193.3481 L 962.91361,1191.0831 L 959.90855,1191.6792 L 956.83608,1189.0281 C 956.76417,1186.6169 956.2901,1184.5074 955.5145,1182.0962 L 953.46115,1182.7479 L 951.11806,1180.7417 L 951.11806,1178.1581 L 949.9838,1178.1581 L 950.01732,1176.3991 L 947.37013,1175.5785 L 996.48831,1177.2059 L 997.80561,1144.8926 L 1042.4258,1146.134 L 1042.4258,1118.4415 L 1068.6974,1119.1767 L 1067.2559,1173.4679 C 1076.4926,1173.5278 1085.7308,1174.0341 1094.9685,1173.9671 C 1095.8277,1155.774 1095.4592,1137.5213 1096.5202,1119.3376 L 1122.5586,1119.9296 L 1121.9304,1146.966 L 1135.921,1146.966 C 1136.6772,1147.6244 1137.2752,1148.3473 1137.7034,1149.2345 C 1137.7034,1149.5019 1137.2609,1150.4653 1136.7201,1151.0061 L 1128.7804,1154.9102 L 1124.943,1155.0679 L 1121.8238,1157.2516 L 1121.8238,1174.0242 L 1213.0561,1174.7553 C 1219.5571,1171.0581 1225.743,1166.7607 1232.434,1163.4127 L 1244.3819,1182.7516 L 1248.5432,1180.5037 L 1253.1119,1188.37 L 1237.3928,1198.4355 L 1247.9994,1214.9748 L 1252.8996,1212.3366 L 1267.5759,1235.9815 L 1267.5834,1238.5573 L 1272.0608,1246.0663 L 1265.0238,1253.5531 L 1257.198,1271.8462 L 1258.6494,1272.5015 L 1258.6431,1273.7001 L 1256.6208,1275.7042 L 1242.3583,1271.7343 L 1231.7021,1271.7343 L 1232.5305,1294.4195 L 1194.4163,1295.1609 z "},"ga11":{"name":"GA-11","path":"M 1912.5075,953.44968 L 1900.5092,954.07001 L 1888.2805,957.08288 L 1905.6488,1010.7651 L 1907.4743,1009.6663 C 1910.5491,1009.3001 1912.4139,1008.44 1914.8824,1006.7598 L 1924.9489,1007.256 L 1925.7287,1002.0633 L 1931.0633,1001.5493 L 1933.9166,1000.6455 C 1935.2746,1000.5582 1936.623,1000.3796 1937.922,999.95423 L 1937.1954,993.83991 L 1942.2109,993.83991 L 1944.2313,990.43713 L 1947.3328,990.01179 C 1948.4118,988.64291 1948.9246,986.96665 1949.495,985.33298 L 1951.9762,985.33298 L 1952.6319,987.03436 L 1954.3687,987.03436 L 1954.3687,985.82921 L 1955.6271,986.60902 L 1955.2194,985.26209 C 1954.9997,984.52124 1954.2542,983.02193 1953.5535,981.9302 C 1952.8527,980.83848 1951.9622,978.9618 1951.5685,977.76532 L 1950.8419,975.60315 L 1944.1604,976.36525 L 1944.1604,973.13971 L 1940.1728,966.54684 L 1939.0562,961.15912 L 1923.4602,962.75416 C 1919.4212,959.7409 1916.1231,957.0805 1912.5075,953.44968 z "},"ca48":{"name":"CA-48","path":"M 249.52434,1003.804 L 247.25537,998.66186 C 245.42164,996.70147 243.56916,994.74816 241.35649,993.20864 L 239.70468,992.09457 C 244.02754,991.46307 244.21101,991.69917 244.34491,989.23352 L 246.86122,986.97226 L 245.56645,984.22486 L 250.78352,983.92032 C 253.35247,986.05107 255.15303,988.10743 256.63137,990.38689 C 255.71553,992.18735 254.82448,992.9219 250.83508,995.29249 L 253.17729,995.88667 L 253.35155,998.91667 C 252.44108,999.89531 252.52835,1000.0782 253.31425,1000.6422 L 251.68985,1004.4685 L 249.52434,1003.804 z "},"ca36":{"name":"CA-36","path":"M 218.49412,960.82235 L 217.18263,963.2504 L 219.62837,972.99793 L 219.14986,976.31206 L 222.09193,978.42705 L 222.10956,981.02631 C 222.67624,981.1529 224.76798,981.66433 224.76798,981.66433 L 225.24649,981.61119 L 224.59075,978.811 L 226.38075,979.2009 L 223.35962,975.92346 L 224.28588,974.12033 L 220.65024,972.29939 L 220.5641,968.9619 L 219.29623,968.43952 C 219.04315,964.41341 219.7776,965.24692 220.01827,962.36426 L 218.49412,960.82235 z "},"ca35":{"name":"CA-35","path":"M 224.37092,973.67445 L 220.93986,971.96694 L 220.89619,968.68401 L 219.52204,968.22594 L 219.54802,965.62684 L 224.91044,966.86086 L 226.58904,965.78842 C 226.7972,966.22114 227.42118,966.41997 228.14909,966.4109 L 224.37092,973.67445 z "},"ca11":{"name":"CA-11","path":"M 120.57639,753.54254 L 111.48402,751.47576 L 110.74295,750.44228 C 110.33536,749.87384 109.69734,749.40545 109.32513,749.40137 L 108.64838,749.39394 L 106.28572,745.7498 L 108.48799,742.01724 L 107.09166,740.33474 L 103.39954,740.33474 L 102.01643,738.66817 L 106.66343,736.55301 L 106.66343,734.09632 L 105.29199,734.09632 C 104.53771,734.09632 103.51688,733.94144 103.02348,733.75208 L 102.1264,733.40783 L 102.1264,731.47454 L 104.49887,728.41642 L 103.71033,722.13405 L 100.8913,718.78385 L 99.181304,718.78385 L 100.52545,708.77176 L 97.493864,706.78545 L 99.290754,704.79987 L 99.290754,701.66382 L 97.022244,701.07055 L 97.022244,700.5438 C 97.022244,700.25411 96.348044,699.34285 95.524054,698.51887 L 94.025814,697.02062 L 96.171544,696.26476 L 96.171544,692.41236 L 101.00252,692.06307 L 101.74358,693.9942 L 99.857884,695.37306 L 99.857884,698.28016 L 101.17759,699.88332 C 101.90346,700.76504 103.05076,702.64938 103.72723,704.07072 C 104.4037,705.49205 105.47858,707.21471 106.11592,707.89883 L 107.88318,709.34547 L 112.24528,707.4584 L 114.68988,704.02529 L 112.80016,692.31153 L 113.58387,691.51125 C 114.01489,691.0711 114.70679,689.88155 115.12136,688.86781 L 115.87507,687.02464 L 119.2669,685.74361 L 118.57506,682.58147 L 119.75627,682.18777 L 120.11078,678.86252 L 121.32694,678.3199 C 121.99581,678.02142 122.54303,677.59329 122.54303,677.36848 C 122.54303,677.14361 123.57577,675.84279 124.83797,674.47771 L 127.13297,671.99573 L 128.09896,673.15755 C 128.63031,673.79659 129.47152,674.91956 130.09236,675.1573 L 140.52362,675.76504 C 140.77174,675.82016 141.69315,675.56881 142.57124,675.20653 C 143.44932,674.84425 144.72536,674.55172 145.40688,674.55649 C 146.0884,674.56125 146.95628,674.76235 147.33557,675.00333 L 148.02514,675.44155 L 149.59932,689.00959 L 145.1815,709.24253 L 142.66016,707.59049 C 133.93144,707.94324 133.62924,707.64249 132.92386,709.18123 L 129.75054,709.34201 C 129.36076,707.41961 129.22677,706.00882 129.34857,704.01332 L 133.92649,694.90835 C 133.41279,692.51836 133.05591,689.35809 131.08537,687.75176 L 128.20519,698.88466 L 123.91553,699.88349 L 125.99344,703.34496 C 125.5272,706.6934 125.47942,709.74813 124.85737,713.07224 L 115.24344,719.19428 L 114.76193,723.9361 L 116.71045,725.87296 L 116.17134,730.5706 L 113.78526,730.86681 L 112.84687,733.93118 L 114.42698,735.68105 L 114.34241,740.29822 C 115.12968,740.42849 115.31859,740.05407 115.94789,739.60513 L 116.82365,739.02172 L 118.56712,740.46858 L 120.84164,739.87378 L 120.84164,741.469 L 121.84359,741.469 L 122.50004,743.97922 L 120.85713,745.79466 L 122.0131,746.95064 L 121.65026,747.89615 C 121.45068,748.41621 121.05953,748.84167 120.78096,748.84167 L 120.27451,748.84167 L 120.56685,751.18941 L 118.71477,751.34826 L 120.57639,753.54254 z "},"ca10":{"name":"CA-10","path":"M 108.22303,708.57343 C 107.98909,708.57457 107.32243,708.10028 106.74158,707.51942 C 106.16072,706.93857 105.03197,705.08185 104.23317,703.39339 L 102.78086,700.32341 L 100.42501,698.19141 L 100.42501,696.01766 L 102.18674,694.25593 L 101.84283,691.84524 L 95.604424,691.84524 C 95.614634,693.26935 95.661444,694.71139 95.402464,696.0991 L 93.034594,693.34518 L 90.932414,692.65141 C 89.776204,692.26979 88.493534,691.62094 88.082024,691.20943 C 87.670514,690.79792 87.052234,689.62419 86.708044,688.60115 C 86.363854,687.5781 85.820544,686.40732 85.500734,685.99939 C 85.180934,685.59145 84.005734,684.86116 82.889164,684.37649 L 80.859074,683.49529 L 81.709764,683.22726 C 82.177644,683.07981 84.166964,682.21511 86.130474,681.3056 C 88.093994,680.3961 89.833654,679.65197 89.996484,679.65197 L 94.470164,683.59436 L 99.254234,684.31229 L 99.909044,685.10134 C 100.26922,685.5353 100.80567,685.89038 101.1012,685.89038 L 106.66343,682.43311 L 106.66343,680.30615 L 105.23426,678.60766 C 104.44822,677.67348 103.28929,675.7432 102.65899,674.31818 L 101.25266,671.27185 L 97.445604,671.1646 L 95.887984,669.87189 L 95.887984,666.60801 L 96.409064,666.60801 C 96.695634,666.60801 97.772614,665.71478 98.802344,664.62306 L 100.6746,662.63811 L 105.44813,662.63811 L 107.23055,660.85568 L 107.23055,659.5248 C 107.23055,658.79275 107.38544,657.79018 107.5748,657.29678 L 107.91905,656.39969 L 114.60323,656.39969 L 114.60323,657.35196 C 114.60323,657.87564 114.04931,660.0241 113.37227,662.12622 L 112.14127,665.94827 L 113.14208,669.64555 C 113.69253,671.67905 114.43791,673.73863 114.79843,674.22233 L 115.45392,675.10178 L 119.72372,674.39678 L 120.39747,671.71217 L 121.32847,671.7302 C 121.84053,671.74013 122.70608,672.08727 123.25194,672.50161 C 123.7978,672.91601 124.24442,673.54592 124.24442,673.9014 L 124.24442,674.54781 L 123.18661,674.54781 L 122.47401,676.79296 L 119.14026,678.76226 L 119.14026,681.85356 L 117.93902,682.59593 L 118.28956,685.58504 L 115.10723,687.1168 L 114.53222,688.62928 C 114.21594,689.46114 113.56527,690.57475 113.08633,691.104 L 112.2155,692.06625 L 113.97842,703.75494 L 113.12574,705.05803 C 112.65678,705.77477 111.45753,706.85844 110.46075,707.46623 C 109.46396,708.07402 108.45697,708.57224 108.22303,708.57343 z "},"va11":{"name":"VA-11","path":"M 2226.247,638.8187 L 2217.3265,628.48295 L 2217.2528,625.04598 L 2222.9042,627.33474 L 2226.7218,630.95518 L 2226.8467,633.0666 L 2227.6772,633.14741 C 2227.9785,633.14741 2228.3827,632.89221 2228.5754,632.58029 L 2228.9259,632.01316 L 2233.0322,632.01316 L 2234.0099,630.09728 L 2229.4261,626.03069 L 2229.4261,624.16376 L 2232.3341,621.79197 L 2231.9317,619.0267 L 2234.5792,617.71374 L 2239.0673,617.83494 L 2239.869,620.8625 L 2242.4465,618.81482 L 2243.1474,620.64143 L 2241.2706,622.51823 L 2241.6689,623.43755 C 2241.888,623.9432 2242.2216,625.37441 2242.4104,626.61801 L 2242.7537,628.87909 L 2244.742,629.26134 L 2248.6811,625.64549 L 2248.7562,626.08774 C 2249.0419,626.26434 2249.2756,626.64897 2249.2756,626.94246 L 2249.2756,627.47613 L 2248.6576,627.47613 C 2248.3178,627.47613 2247.5606,628.05035 2246.9751,628.75217 L 2245.9106,630.02821 L 2245.8729,632.92056 L 2244.5732,634.22025 L 2241.3358,633.57276 L 2241.3358,635.34901 L 2239.9857,636.18342 L 2230.4009,636.5076 L 2228.3285,638.8187 L 2226.247,638.8187 z "},"va10":{"name":"VA-10","path":"M 2178.8631,597.39919 C 2179.5725,599.2258 2180.5983,601.07215 2179.8024,602.80467 L 2180.8657,603.56672 L 2178.6765,609.40185 L 2180.348,610.84445 L 2179.0935,613.50922 L 2180.5645,614.98018 L 2175.5135,623.50487 L 2178.9871,623.50487 C 2179.5743,622.5606 2179.8168,621.8915 2179.6439,620.90997 C 2179.884,620.44209 2181.1726,619.4888 2182.0178,619.07417 L 2184.8711,618.77286 L 2184.5166,620.74011 L 2186.4661,622.90229 L 2185.8104,624.60368 L 2186.9092,625.29484 L 2186.3421,626.21642 L 2188.0257,627.61655 L 2187.2991,632.29536 L 2185.899,635.23734 C 2187.7478,636.73655 2189.3568,637.14079 2190.8614,637.11595 L 2190.8614,638.25021 L 2192.616,638.25021 L 2194.7073,636.26526 L 2196.1782,630.15088 L 2203.5686,634.7588 L 2205.0219,632.0118 L 2207.8221,632.0118 L 2210.6578,635.06011 L 2212.7845,633.14605 C 2213.3262,633.57633 2213.8058,634.11012 2213.5465,635.87536 L 2220.228,632.61437 L 2216.7721,628.64447 L 2216.7012,624.23147 L 2223.0459,626.8013 L 2227.1576,630.91298 L 2227.1576,632.57892 L 2227.6893,632.57892 C 2227.9828,632.57892 2228.3827,632.32372 2228.5754,632.0118 L 2228.9299,631.44467 L 2232.758,631.44467 L 2233.4315,630.34586 L 2228.859,626.21642 L 2228.9653,624.07199 L 2231.6061,621.82117 C 2231.5697,619.58294 2231.0808,617.68391 2230.5073,615.84863 L 2232.1023,613.6687 L 2236.0899,616.13219 L 2242.4701,616.13219 C 2242.4841,615.40814 2241.8646,614.78963 2241.07,614.20038 L 2235.9836,614.14724 L 2234.5835,611.32929 L 2231.4111,610.46091 L 2224.836,611.18751 L 2222.5851,608.75952 L 2220.5825,608.70632 L 2220.3521,604.8782 L 2222.1421,603.08823 L 2221.7699,601.19187 C 2219.1392,600.8196 2217.8086,599.66726 2216.5063,598.49801 L 2209.7184,598.78157 L 2207.574,611.86098 L 2178.8631,597.39919 z "},"il11":{"name":"IL-11","path":"M 1718.904,546.4285 L 1702.5636,548.75019 L 1702.5636,546.94246 L 1697.9025,546.94246 L 1699.2671,555.20127 L 1683.104,557.11533 C 1682.2814,553.65105 1681.8977,550.09541 1681.2963,546.58801 L 1656.059,549.86672 L 1656.059,552.61375 C 1649.0872,553.19335 1642.136,554.10211 1635.1816,554.88226 L 1635.7842,561.68781 L 1630.5382,561.68781 L 1630.5382,566.79197 L 1625.8949,566.79197 L 1627.2241,577.00031 L 1649.8206,574.64316 L 1649.8206,571.20494 L 1654.3576,566.79197 L 1656.3038,566.69139 L 1657.9492,565.35596 L 1660.2359,581.68531 L 1665.399,581.82091 C 1666.1055,588.7253 1667.3524,595.54718 1668.5359,602.37932 L 1670.8044,602.5211 L 1671.5133,608.75952 L 1668.7362,608.97577 L 1669.1207,611.59516 L 1666.6927,611.59516 L 1664.8495,613.68645 L 1659.0364,614.66117 L 1661.2518,633.14605 L 1687.9423,630.18632 C 1687.6539,628.20052 1687.5249,626.17723 1687.0207,624.23147 L 1671.7792,625.29484 L 1670.8576,623.82388 L 1672.5058,621.9984 L 1672.5058,616.64612 L 1670.9107,613.54467 L 1674.6857,608.47596 L 1679.0277,607.25306 L 1679.3822,601.88308 L 1672.7184,603.05279 L 1670.1132,580.54487 L 1698.4519,576.78764 L 1699.2671,583.23873 L 1704.8144,583.23873 L 1735.5457,578.47127 L 1731.7885,550.29207 C 1729.6907,551.1505 1728.0218,551.13524 1725.8159,550.91236 L 1725.8159,554.31514 L 1722.5372,554.31514 L 1721.9523,552.04662 L 1719.5774,552.04662 L 1719.5774,550.11484 C 1719.5774,549.04863 1719.4249,547.77686 1719.2407,547.29692 L 1718.904,546.4285 z "},"il10":{"name":"IL-10","path":"M 1705.6828,518.42026 L 1703.2108,516.87788 C 1701.8512,516.02957 1700.5153,514.98254 1700.242,514.55115 C 1699.9689,514.11976 1699.7414,513.32019 1699.7366,512.77433 L 1699.7279,511.78186 L 1701.2473,511.78186 L 1702.5074,514.54751 L 1704.8946,515.62352 L 1704.9861,503.48809 L 1704.342,502.28453 C 1703.9877,501.62258 1703.6978,500.58503 1703.6978,499.97888 L 1703.6978,498.87678 L 1705.5062,497.37598 L 1707.4471,499.94908 L 1710.0107,497.87321 L 1708.8668,494.8645 L 1711.6221,493.92908 L 1711.3541,501.8571 L 1712.4276,504.12562 C 1713.0181,505.3733 1714.7654,507.99261 1716.3106,509.9463 L 1719.1201,513.49846 L 1715.7633,515.39572 L 1709.8051,516.51462 L 1707.0479,516.48598 L 1705.6828,518.42026 z "},"oh10":{"name":"OH-10","path":"M 1995.3158,516.88601 C 1995.008,516.88601 1994.5716,516.4394 1994.346,515.89354 L 1993.9356,514.90106 L 1993.4061,516.31889 L 1991.7992,516.31889 L 1991.7992,515.17122 L 1987.4261,515.87051 L 1986.0426,507.46262 L 1989.948,507.91856 L 1993.4443,506.11057 L 1996.6765,506.11057 L 1998.0068,507.44091 L 2000.8517,506.14474 L 2002.0475,508.37908 L 2003.8464,508.29847 L 2004.7236,509.79549 L 2007.3132,510.70134 L 2007.2864,512.2415 L 2005.8356,512.43884 C 2005.1338,512.48827 2004.1011,512.48916 2003.5407,512.44084 L 2002.5217,512.35297 L 2000.3022,513.48523 C 1999.0815,514.10798 1997.7196,514.6175 1997.2757,514.6175 L 1996.4686,514.6175 L 1995.8753,516.88601 L 1995.3158,516.88601 z "},"oh11":{"name":"OH-11","path":"M 2010.939,511.74038 L 2007.6788,512.15254 L 2007.6788,510.61953 L 2004.8141,509.53037 L 2004.1547,507.81195 L 2002.2804,507.81195 L 2000.8776,505.56578 L 1997.9564,506.89677 L 1996.7299,505.62213 L 1999.5684,502.74709 C 2000.9847,501.32184 2002.7541,499.19869 2003.5004,498.02898 L 2005.8472,495.21334 L 2007.1061,501.0344 L 2009.0585,500.49996 C 2009.406,502.16931 2010.3614,503.77786 2010.101,505.50799 L 2008.1251,508.83603 L 2009.8774,510.9676 L 2011.3017,511.04454 L 2010.939,511.74038 z "},"nj11":{"name":"NJ-11","path":"M 2331.7254,486.82819 C 2330.7748,486.82819 2329.8268,486.65805 2329.6189,486.45011 C 2329.4109,486.24216 2329.2408,485.62482 2329.2408,485.07824 C 2329.2408,484.53167 2329.587,483.36196 2330.0101,482.47891 C 2330.4332,481.59585 2331.1989,480.02323 2331.7115,478.98421 C 2332.2241,477.94519 2332.6436,476.76421 2332.6436,476.3598 C 2332.6436,475.95538 2332.2767,475.32002 2331.8283,474.94786 L 2331.013,474.27123 L 2324.825,478.2296 L 2322.3541,477.94642 C 2320.9951,477.79067 2319.173,477.39405 2318.3049,477.06503 L 2316.7267,476.46683 L 2318.4868,474.52191 L 2318.702,472.02634 C 2318.8203,470.65378 2319.0933,469.09638 2319.3086,468.56545 L 2319.7001,467.60013 L 2319.1009,466.63056 L 2321.4288,461.92351 L 2321.8681,459.30146 L 2323.013,459.6795 L 2324.9873,456.21042 L 2327.9332,456.20324 L 2329.1091,453.92576 L 2329.2408,456.77037 L 2330.0059,456.77037 L 2332.0528,454.91459 L 2332.7649,456.77037 L 2339.0405,456.77037 L 2339.7939,457.76285 C 2340.2083,458.30871 2340.5554,459.07654 2340.5653,459.46914 C 2340.5753,459.86175 2341.349,461.23988 2342.2848,462.53166 L 2343.9861,464.88036 L 2343.9861,466.9345 L 2341.6595,469.10202 L 2342.0219,470.54584 L 2342.0477,471.80837 L 2341.3594,473.1134 L 2340.0236,473.25306 L 2335.7493,479.71229 L 2333.04,481.06302 L 2331.6709,485.0454 L 2333.4538,486.82819 L 2331.7254,486.82819 z "},"nj10":{"name":"NJ-10","path":"M 2345.6344,467.45583 L 2346.3787,470.39781 L 2344.9964,472.06375 L 2343.0823,471.03583 L 2341.6999,473.23345 L 2343.1532,473.80058 C 2343.9593,474.10708 2344.8005,474.36295 2345.0141,474.36771 C 2345.6815,474.58248 2346.2846,474.87056 2346.8572,475.2893 L 2345.6166,478.56801 L 2346.2724,481.15553 L 2347.2471,481.15553 L 2347.6193,478.78068 C 2347.8288,477.4705 2348.2687,476.07133 2348.5941,475.6792 L 2350.8799,475.0338 L 2350.675,475.3935 L 2352.5426,474.64783 L 2353.1972,472.43688 L 2349.7044,472.42629 L 2348.3637,470.89405 C 2347.5144,469.92622 2346.8218,468.92241 2346.8218,468.66098 C 2346.8218,468.39954 2346.5614,468.01078 2346.237,467.81029 L 2345.6344,467.45583 z "},"mi10":{"name":"MI-10","path":"M 1913.9431,357.6987 L 1912.6139,358.319 C 1911.8804,358.65884 1911.2694,359.13069 1911.2669,359.36465 C 1911.2645,359.59859 1910.9398,359.78998 1910.5403,359.78999 L 1909.8137,359.78999 L 1908.5376,363.19276 L 1906.3046,363.19276 L 1904.9931,364.77009 L 1899.9244,366.04613 L 1899.9244,368.13742 L 1897.6559,371.02623 L 1898.223,372.55039 L 1895.3873,375.84682 L 1895.3873,378.50524 L 1894.3772,378.50524 C 1894.2566,380.06266 1894.1884,381.62328 1894.129,383.18405 L 1894.311,386.13625 L 1909.8137,383.16633 L 1914.1735,404.80481 L 1903.3094,407.0389 L 1903.9421,412.21583 L 1899.375,413.24187 L 1903.4158,434.45603 L 1918.69,431.02497 C 1919.7413,434.58234 1921.3484,442.7253 1922.8801,450.24514 L 1928.334,448.75831 L 1927.0934,444.3985 L 1933.1014,442.6085 L 1934.5192,444.50484 L 1934.5192,443.15791 L 1935.0332,443.15791 C 1935.3122,443.15791 1936.3551,442.39046 1937.3549,441.45652 L 1939.1626,439.75514 L 1940.669,440.12732 C 1941.4958,440.32456 1942.3669,440.58092 1942.6008,440.71217 C 1942.8347,440.84341 1943.0261,441.47762 1943.0261,442.11227 L 1943.0261,443.26425 L 1941.0412,443.77821 L 1939.7297,446.56068 L 1941.2007,446.56068 L 1941.7856,448.08484 L 1945.2947,447.57088 L 1945.2947,447.00375 C 1945.2947,446.69741 1945.765,445.77586 1946.3403,444.94791 L 1947.3859,443.44148 C 1947.4877,440.32277 1947.6147,437.20435 1947.6341,434.08385 L 1946.2871,424.3186 L 1948.0063,420.68544 L 1947.2796,418.9486 C 1946.8762,417.98927 1945.6195,415.86591 1944.4972,414.23435 C 1943.3748,412.60277 1942.459,411.037 1942.459,410.74296 C 1942.459,410.44893 1941.9671,409.11565 1941.3602,407.78326 C 1940.7532,406.45085 1939.5916,402.70895 1938.7904,399.47128 L 1937.3372,393.58732 L 1932.9596,384.46009 L 1932.2685,381.34088 C 1931.8872,379.62532 1931.0343,376.56281 1930.3721,374.53534 L 1929.1669,370.849 L 1922.2551,361.26098 L 1918.9232,359.31148 L 1916.0166,359.22286 L 1913.9431,357.6987 z "},"mi11":{"name":"MI-11","path":"M 1907.9326,480.64449 C 1905.9097,474.09767 1905.511,470.22847 1904.366,464.42786 L 1903.0983,462.90041 L 1898.8141,463.58548 C 1897.6508,458.42213 1896.3419,453.84125 1895.3873,447.84287 L 1903.6107,447.04965 L 1906.5865,445.5282 C 1907.2467,451.32141 1908.3019,455.3149 1909.8839,461.59097 L 1915.1956,460.69661 L 1918.0916,466.41156 L 1917.5554,466.41156 C 1917.2605,466.41156 1916.6182,466.8126 1916.128,467.30276 L 1915.2368,468.19397 L 1915.2368,470.85847 L 1911.5257,471.86945 L 1911.144,474.35136 L 1912.4486,479.36404 L 1907.9326,480.64449 z "},"ny23":{"name":"NY-23","path":"M 2311.9611,205.20892 L 2252.1999,222.15495 L 2250.1263,221.87138 L 2248.6908,223.20059 C 2247.8993,223.93283 2246.5593,224.83776 2245.7134,225.22098 L 2244.1715,225.9299 L 2244.1715,226.55019 C 2244.1715,226.88975 2243.251,228.03149 2242.1156,229.10227 C 2240.9803,230.17305 2239.8319,231.05178 2239.5636,231.05178 C 2239.2953,231.05178 2239.0673,231.30177 2239.0673,231.60118 C 2239.0673,231.9006 2237.7913,233.33246 2236.2317,234.79128 C 2234.6721,236.25011 2233.396,237.69677 2233.396,237.9991 C 2233.396,238.30143 2232.5666,239.58228 2231.5529,240.85247 C 2230.5391,242.12265 2229.1993,244.00213 2228.5754,245.03504 C 2227.9516,246.06796 2225.3188,250.63032 2222.7269,255.15475 L 2218.0127,263.37811 L 2217.1443,268.94306 L 2213.2098,274.4194 L 2209.1336,276.56386 L 2207.698,279.23999 L 2205.6067,279.89574 L 2205.6067,283.84791 L 2202.8774,286.57722 L 2199.9354,287.32158 L 2199.9178,288.26088 C 2199.904,288.77293 2199.5585,290.11085 2199.1556,291.23831 L 2198.429,293.27643 L 2199.7051,295.03098 L 2202.4698,295.42088 L 2202.8952,297.60079 L 2205.1991,299.4794 L 2210.7463,299.14267 L 2212.5895,302.98851 L 2209.0273,306.55079 L 2207.9816,305.91277 L 2206.1739,306.60395 L 2206.1739,308.00405 L 2209.0804,309.33326 L 2213.0149,317.84019 L 2214.2554,323.98999 L 2213.5465,326.61296 L 2210.5691,328.75742 L 2206.1384,329.00554 L 2204.7383,330.31702 C 2203.97,331.03884 2203.3382,331.84867 2203.3382,332.10702 C 2203.3382,332.36538 2202.3174,333.49644 2201.0697,334.62366 L 2198.4183,336.99859 L 2201.3146,347.38909 L 2206.1496,345.78912 L 2207.3725,347.60492 L 2212.662,345.73911 L 2216.6981,346.42234 L 2216.6981,345.44758 L 2218.9682,346.02595 L 2219.6047,344.97212 L 2219.2887,344.31957 L 2218.1513,344.30829 L 2218.1061,342.00292 L 2224.8891,343.43187 L 2224.8102,344.60649 L 2229.4535,345.22679 L 2231.4578,347.21487 L 2231.4803,349.83795 L 2234.1581,349.86524 L 2240.9459,371.02623 C 2249.8263,367.61914 2258.2729,365.29629 2266.6609,363.11984 L 2267.5663,358.7833 L 2266.4178,355.34933 L 2258.2788,357.99999 L 2257.0594,353.83865 L 2252.6417,355.16785 L 2250.2681,348.94366 L 2248.5136,349.61712 C 2246.7395,347.047 2243.6217,344.72572 2239.6033,342.57121 C 2240.3624,340.78211 2241.2829,340.09282 2242.4563,339.12284 C 2242.2954,337.09213 2245.9982,335.80117 2245.7822,333.98287 L 2249.6159,333.95167 L 2250.6326,331.73134 L 2249.2048,326.06356 C 2252.088,323.99205 2259.2768,322.60694 2264.9681,321.09703 L 2249.7719,279.96663 L 2255.7976,281.61485 L 2264.3808,278.29144 L 2277.508,312.48791 L 2275.9307,322.25316 L 2283.439,323.81586 L 2286.0504,330.19296 C 2284.5027,332.2901 2284.969,334.24339 2283.7809,335.51341 C 2284.2077,337.3216 2285.0301,338.30267 2286.356,338.78027 L 2297.6411,339.53286 L 2296.2942,333.96791 L 2304.0779,328.48515 L 2307.1393,336.11237 L 2314.7436,334.64138 L 2297.3502,291.21235 L 2312.2269,284.66316 L 2312.3583,283.1775 L 2308.576,281.8098 L 2306.5025,274.70296 L 2304.1946,275.98634 L 2301.9945,275.09072 L 2304.8188,272.48762 L 2301.4869,264.47692 L 2296.8081,266.85178 C 2294.5336,262.68132 2292.9818,259.49633 2291.1671,254.34041 L 2301.1679,250.31643 L 2302.9225,253.31158 C 2304.9896,252.3729 2306.9385,250.99391 2309.1609,250.47593 L 2314.2828,261.96029 L 2317.1893,262.31475 L 2319.6174,268.62405 L 2318.6071,269.90009 L 2319.9895,273.86999 L 2329.7016,274.189 L 2330.3928,276.9892 L 2331.3853,276.9892 L 2330.3042,272.16861 L 2328.3015,269.90009 L 2326.5803,263.87616 L 2324.5318,263.72862 L 2325.0051,251.75197 L 2326.7065,248.3492 L 2323.7113,242.44752 L 2324.2607,237.48514 L 2323.3568,235.8192 C 2322.8606,234.90973 2321.9741,233.59677 2321.3719,232.89495 C 2320.7696,232.19312 2319.9748,231.61891 2319.6174,231.61891 L 2318.9616,231.61891 L 2316.7817,226.69198 L 2316.2323,216.60772 L 2313.3966,214.53415 L 2314.017,208.4198 L 2311.9611,205.20892 z "},"tx28":{"name":"TX-28","path":"M 1248.4326,1539.4191 C 1248.1828,1539.4191 1247.5478,1538.9725 1247.0215,1538.4266 C 1246.4952,1537.8807 1245.5686,1536.9675 1244.9625,1536.3972 L 1243.8605,1535.3603 L 1242.816,1535.4972 C 1242.2415,1535.5726 1240.7507,1535.4251 1239.503,1535.1695 L 1237.2345,1534.7049 L 1235.9243,1532.9193 L 1232.0309,1534.7759 L 1227.0302,1529.2108 L 1225.0412,1529.2108 L 1225.0412,1527.5493 L 1222.9822,1526.4473 L 1218.8363,1527.3824 L 1217.4868,1525.7564 L 1215.9672,1526.3395 L 1215.9672,1525.2409 L 1213.1161,1525.2409 L 1210.863,1523.8338 L 1208.7401,1525.1596 L 1207.5532,1523.9728 L 1208.1722,1520.1586 L 1206.3562,1517.3871 L 1204.1492,1516.6866 L 1203.7527,1514.3 C 1203.5346,1512.9873 1203.0036,1511.2242 1202.5726,1510.3819 L 1201.7889,1508.8504 L 1201.7889,1505.5672 L 1199.5204,1503.5142 L 1199.5204,1502.6285 C 1199.5204,1502.1415 1199.103,1500.6498 1198.5927,1499.3137 L 1197.6649,1496.8844 L 1197.1748,1496.8135 C 1196.9053,1496.7746 1196.3658,1496.7107 1195.9759,1496.6718 L 1195.267,1496.6009 L 1194.8953,1493.3499 L 1191.5194,1492.0756 L 1192.053,1490.0351 L 1189.4656,1487.2432 L 1188.0491,1487.2432 L 1188.3908,1485.4001 C 1188.5787,1484.3863 1188.767,1481.898 1188.8092,1479.8706 L 1188.8858,1476.1842 L 1187.8564,1472.2565 L 1185.6258,1471.6472 L 1185.6258,1469.997 L 1182.7901,1469.3265 L 1184.5271,1468.6587 L 1186.0222,1462.8253 L 1184.72,1461.2563 L 1185.9093,1460.5213 L 1185.9093,1458.2135 L 1183.5191,1457.5884 L 1184.1642,1453.6127 L 1181.8622,1450.3799 L 1180.2944,1450.3799 L 1179.2126,1448.4468 L 1176.3807,1449.7371 L 1175.7987,1447.5117 L 1175.3245,1447.5951 C 1175.0637,1447.641 1174.4073,1447.6484 1173.8659,1447.6114 L 1172.8815,1447.5442 L 1169.879,1443.0072 L 1168.4048,1443.0072 L 1167.7444,1441.0222 L 1164.0917,1439.2261 L 1163.8387,1435.9339 L 1162.659,1435.5407 L 1163.2884,1433.0328 L 1160.9557,1430.9217 L 1160.9557,1427.6947 L 1158.1492,1427.6947 L 1157.2839,1426.0215 C 1156.808,1425.1012 1156.4186,1423.9801 1156.4186,1423.5301 L 1156.4186,1422.7119 L 1154.7685,1422.0787 L 1152.4257,1417.4864 L 1151.7283,1417.4537 C 1151.3448,1417.4358 1149.7748,1416.8269 1148.2396,1416.1009 L 1145.4483,1414.7808 L 1187.7449,1413.3875 L 1186.3444,1365.3106 L 1213.1315,1365.3106 L 1213.1315,1348.2967 L 1243.7727,1364.045 L 1251.0793,1351.7601 L 1248.4608,1351.3902 L 1248.1617,1350.177 L 1244.645,1348.5144 L 1244.9688,1346.2717 L 1249.4902,1343.4072 L 1246.025,1342.6254 L 1246.025,1340.3569 L 1249.3878,1340.3569 L 1250.6276,1338.0404 L 1250.2784,1333.843 L 1247.1592,1332.3552 L 1247.1592,1330.8665 C 1252.3842,1327.3551 1254.9592,1325.8098 1263.8598,1321.3581 L 1267.5345,1315.1702 C 1268.8922,1314.4633 1270.2114,1313.6607 1271.661,1313.1585 L 1274.3788,1318.3772 L 1277.008,1320.7183 C 1278.454,1322.006 1280.6465,1323.6138 1281.8801,1324.2913 C 1283.1138,1324.9687 1284.2555,1325.6554 1284.4173,1325.8172 L 1284.7114,1326.1114 L 1281.7332,1335.6674 C 1280.3796,1337.1346 1278.789,1338.4468 1277.7872,1340.187 L 1286.8338,1351.9721 L 1260.8485,1379.1411 L 1265.3008,1384.4589 L 1251.1291,1397.7547 L 1251.1291,1428.829 L 1230.1454,1428.829 L 1230.1454,1469.0951 L 1237.5361,1469.0951 C 1239.477,1480.8059 1239.2809,1486.2766 1239.2558,1498.5858 L 1243.7565,1498.5858 L 1243.7565,1500.0376 L 1239.7866,1503.7821 L 1237.518,1508.193 L 1234.2212,1510.6305 L 1232.1328,1514.5083 L 1233.8317,1515.5823 L 1240.8992,1515.5997 C 1242.3012,1517.7498 1241.4807,1523.49 1241.7715,1527.4352 L 1244.8706,1530.6696 L 1245.2421,1532.6341 C 1245.4464,1533.7145 1245.9135,1534.9813 1246.2801,1535.4492 C 1246.6467,1535.9171 1247.3831,1537.0017 1247.9167,1537.8595 L 1248.8868,1539.4191 L 1248.4326,1539.4191 z "},"tx7":{"name":"TX-7","path":"M 1401.6729,1319.3731 C 1401.2655,1319.3731 1400.5311,1318.9721 1400.0409,1318.482 L 1399.1497,1317.5907 L 1399.1426,1315.6868 L 1395.655,1313.7019 L 1391.2315,1313.7019 L 1388.3344,1308.5977 L 1389.6773,1305.9329 L 1388.0273,1305.9887 L 1387.0668,1303.3415 L 1388.6955,1301.5226 L 1392.551,1300.2304 L 1393.4419,1297.8223 L 1394.0273,1297.8223 C 1394.3493,1297.8223 1394.6127,1298.0418 1394.6127,1298.3103 L 1397.36,1302.8467 L 1395.0785,1304.3616 L 1395.9753,1308.3002 L 1400.1533,1309.2772 L 1401.5944,1311.4338 L 1402.6655,1314.6064 L 1403.7366,1317.7791 L 1403.0751,1318.5761 C 1402.7113,1319.0145 1402.0803,1319.3731 1401.6729,1319.3731 z "},"fl7":{"name":"FL-7","path":"M 2149.0711,1190.9171 L 2146.714,1191.502 C 2146.9058,1194.3466 2147.8657,1197.093 2148.3267,1199.9025 C 2146.7151,1200.6151 2144.965,1201.0103 2143.2403,1201.4267 L 2138.278,1200.3102 L 2135.9393,1201.5862 L 2136.0102,1205.6448 L 2137.2508,1207.8424 C 2138.6177,1208.8223 2139.7012,1209.4827 2141.2376,1210.1995 L 2141.8756,1214.9138 C 2143.9251,1217.7937 2144.7617,1219.7105 2147.6533,1222.1092 L 2149.3015,1229.7654 L 2143.3644,1229.7654 L 2139.5362,1231.3782 L 2138.1362,1233.6999 L 2138.8096,1235.4367 L 2139.8376,1235.4367 C 2140.4025,1235.4367 2141.2569,1235.5904 2141.7339,1235.7734 L 2142.6023,1236.1102 L 2143.772,1239.6016 C 2144.4226,1241.524 2145.331,1243.5698 2145.7747,1244.1563 L 2146.5722,1245.2197 L 2154.5652,1245.8045 L 2159.049,1253.9039 L 2164.1,1256.3496 L 2164.9153,1261.2411 L 2168.0699,1265.2287 L 2168.8675,1271.6975 L 2167.3964,1273.4698 L 2165.9077,1275.2243 L 2165.6596,1276.4649 C 2165.5226,1277.1427 2165.291,1279.283 2165.1457,1281.2324 L 2164.8798,1284.7769 L 2165.89,1285.4149 L 2167.8395,1284.3161 L 2171.579,1287.1872 L 2172.7133,1287.3999 L 2172.7133,1281.4627 L 2178.8099,1279.3715 L 2178.0833,1271.857 L 2174.9818,1271.0418 L 2174.9818,1261.7728 L 2169.3105,1256.1724 L 2169.3105,1252.4506 L 2172.1461,1252.4506 L 2172.1461,1249.7922 L 2174.9109,1248.5338 L 2178.6681,1249.615 L 2180.4936,1252.0429 L 2182.4077,1250.9619 L 2180.529,1248.1617 C 2179.4909,1246.6238 2178.1155,1244.5959 2177.463,1243.6601 C 2176.8106,1242.7243 2173.5873,1237.8754 2170.3207,1232.8847 C 2167.0541,1227.8939 2163.6129,1222.407 2162.6645,1220.6914 C 2161.716,1218.9758 2160.4935,1216.1685 2159.9529,1214.453 L 2158.9781,1211.3338 L 2157.3299,1210.0223 L 2153.2005,1200.4697 L 2149.0711,1190.9171 z "},"fl6":{"name":"FL-6","path":"M 2139.8259,1284.1761 L 2136.0196,1282.6359 L 2133.865,1274.6896 L 2116.284,1278.0639 C 2113.9439,1277.2119 2111.7101,1276.2326 2108.6277,1276.2714 L 2108.6277,1274.093 L 2112.1289,1273.324 L 2111.3314,1266.4529 L 2108.0346,1258.4896 L 2106.4678,1259.9984 L 2105.5085,1257.0538 L 2100.4669,1253.0975 L 2098.5484,1254.1242 L 2093.8939,1252.1684 C 2093.9937,1249.8944 2095.8896,1248.9531 2095.5838,1245.5202 L 2089.9125,1246.902 L 2089.9125,1245.0793 L 2084.5888,1246.1521 L 2083.3721,1245.0899 L 2074.5816,1245.9704 L 2074.2784,1246.7158 L 2072.7134,1245.7486 L 2072.5707,1232.603 L 2074.63,1231.9493 L 2074.6,1227.4344 L 2078.1874,1224.1577 L 2082.3142,1228.9467 L 2086.7933,1229.2271 L 2090.0099,1225.9823 L 2090.1815,1223.2257 L 2092.4646,1221.2959 L 2098.7604,1221.2599 L 2101.7598,1219.7705 L 2101.8222,1218.4242 L 2103.9086,1218.4242 C 2105.9298,1215.457 2105.4348,1214.5026 2105.225,1213.3201 L 2106.713,1213.3201 C 2108.6878,1212.0475 2109.0483,1210.2368 2109.1949,1208.3548 L 2110.8962,1206.9428 L 2110.8962,1204.9581 L 2115.4333,1204.2326 L 2113.8271,1196.0887 L 2124.6697,1179.7217 L 2128.5168,1186.3815 L 2127.8649,1192.0527 L 2133.5814,1197.6814 L 2133.5814,1200.7763 L 2134.7156,1201.4773 L 2134.7156,1206.0595 L 2136.6129,1210.0576 L 2131.2431,1214.7379 L 2131.9992,1219.3974 C 2130.0457,1222.1151 2127.9038,1223.5143 2125.6416,1224.0712 L 2125.4678,1226.8947 L 2121.9158,1227.9568 L 2120.2144,1229.9646 L 2116.6014,1231.6788 L 2114.9452,1231.1815 L 2110.8801,1233.2009 L 2108.6411,1232.0025 L 2105.3403,1235.6968 L 2108.7873,1240.4968 L 2111.4991,1239.0079 L 2112.4997,1242.5395 L 2114.7257,1245.3216 L 2113.9759,1249.8481 L 2120.7369,1248.3638 L 2122.3676,1251.0341 L 2118.836,1252.0489 C 2118.456,1255.0706 2119.4402,1258.2287 2120.5821,1261.4026 L 2125.6749,1262.685 L 2126.3335,1265.9779 L 2134.4464,1268.8987 L 2136.1728,1266.0484 L 2140.6705,1271.9467 L 2141.3022,1277.672 L 2139.8259,1284.1761 z "},"az7":{"name":"AZ-7","path":"M 439.00084,983.61384 L 439.00084,985.36842 L 436.99817,985.81146 C 436.29635,986.08108 435.73926,987.00521 434.87144,987.81416 L 430.97243,990.52572 L 430.33441,989.90545 L 427.55193,992.10308 L 425.47837,992.47523 C 424.34031,992.68007 423.10118,993.08631 422.73134,993.37911 L 422.05787,993.92849 L 421.29579,997.52624 L 417.78669,1001.2126 L 417.0955,1001.2126 C 416.70718,1001.2126 416.20622,1001.4938 415.99669,1001.8328 L 415.62451,1002.4532 L 416.82966,1003.6406 L 416.4752,1005.4128 C 416.28708,1006.3811 415.92612,1007.3032 415.67768,1007.4687 L 415.23461,1007.77 L 415.65995,1017.0744 L 413.85223,1018.1024 L 412.34579,1025.6523 L 409.36837,1028.5942 C 407.73079,1030.2182 406.11837,1032.0364 405.78837,1032.635 L 405.1858,1033.7338 L 401.26906,1033.5921 L 401.67669,1037.8987 L 399.70946,1039.8482 L 402.20837,1041.5851 L 400.9855,1049.0286 L 398.64609,1052.8213 L 399.49679,1053.4239 L 400.11708,1056.7026 L 408.37589,1057.9609 L 409.06708,1069.5338 L 404.97312,1072.9544 L 404.97312,1074.9748 L 401.85391,1076.1799 L 399.30183,1075.914 C 397.89819,1075.7685 396.36694,1075.4893 395.89906,1075.2938 L 395.04837,1074.9393 L 391.89372,1079.9371 L 389.21758,1081.6917 L 388.04787,1088.3909 L 570.34433,1186.1142 L 592.53324,1188.3651 L 593.2244,1182.4988 L 591.98381,1180.9924 L 589.85708,1180.9924 L 589.85708,1180.248 C 589.85708,1179.8425 590.13151,1179.2469 590.45965,1178.9188 L 591.04453,1178.334 L 588.43926,1174.3286 L 584.82381,1171.8297 L 581.49193,1174.2932 L 577.46889,1170.2524 L 573.51668,1170.855 L 572.73688,1168.4269 L 573.48124,1164.457 L 571.08869,1159.8845 C 571.58589,1155.2446 571.80855,1150.5648 572.54196,1145.9544 L 586.48975,1147.5672 L 587.58856,1146.8938 L 587.58856,1144.129 L 589.85708,1141.8605 L 589.85708,1140.2477 L 591.2749,1139.7869 L 591.48746,1138.5776 L 589.88209,1136.6177 L 590.51285,1134.027 L 587.02143,1131.4395 L 587.02143,1130.0748 L 582.99839,1129.614 L 580.9248,1131.2268 L 578.37272,1129.7074 L 578.93985,1125.077 L 577.57523,1123.1984 L 575.25351,1123.801 L 572.40018,1120.9476 L 573.41035,1114.6383 L 545.3985,1110.8783 L 546.25906,1101.3108 L 546.79074,1100.7791 C 547.08264,1100.4828 547.32243,1099.8136 547.32243,1099.2904 L 547.32243,1098.3334 L 549.50233,1096.7738 L 550.24668,1093.1229 L 537.11411,1090.7303 L 537.11411,1087.5402 L 539.89658,1086.849 L 540.65866,1080.0257 L 542.77156,1080.1135 L 544.30955,1081.0891 L 553.56084,1081.8866 L 553.56084,1082.5955 C 553.56084,1082.9849 553.94438,1083.6256 554.41153,1084.0134 L 555.26223,1084.7223 L 557.17629,1083.269 C 558.2261,1082.4682 559.70574,1081.6535 560.47272,1081.4613 L 561.87282,1081.1068 L 562.52856,1079.2637 C 562.89595,1078.2477 563.20203,1076.987 563.20203,1076.4635 L 563.16658,1075.8431 L 554.58876,1074.7798 L 555.35084,1068.8249 L 543.86648,1068.0097 L 544.61084,1063.0827 L 535.12916,1061.8599 L 535.05827,1060.7788 L 530.30856,1056.1886 L 530.4149,1046.9905 L 525.20441,1047.7171 L 525.20441,1048.426 C 525.20253,1048.8159 524.85742,1049.7927 524.44233,1050.5882 L 523.68025,1052.0237 L 523.66253,1055.5683 L 523.62708,1059.1128 L 522.56371,1062.5156 L 521.51807,1065.9361 C 519.77653,1065.6487 518.00208,1065.5042 516.28985,1065.0677 C 516.2197,1065.0007 516.13604,1063.6848 516.11262,1062.1435 C 516.08915,1060.602 516.1616,1058.9053 516.27213,1058.3685 C 516.38266,1057.8317 516.65773,1057.2207 516.8747,1057.0039 C 517.09169,1056.7869 517.2646,1056.2914 517.2646,1055.9051 L 517.2646,1055.1961 L 511.87688,1054.4518 L 506.27649,1055.7101 L 503.47629,1052.8922 C 503.36114,1050.9234 503.55301,1048.8972 503.08639,1046.9728 L 472.70956,1036.5163 L 475.95282,1014.8237 C 474.20253,1014.3541 469.05692,1012.6344 465.72678,1011.35 L 465.01787,1008.089 L 465.65589,1006.8839 C 466.01143,1006.2195 466.6519,1004.3519 467.07371,1002.7367 C 467.49554,1001.1213 468.22873,999.0428 468.70421,998.12882 L 469.57263,996.48057 L 467.69401,993.30822 C 466.46708,992.79458 465.22393,992.33503 463.93678,992.01443 L 460.65807,992.81199 L 458.24777,990.40169 L 453.21451,990.29535 L 452.57649,988.29265 L 451.31817,988.29265 C 450.62673,988.29458 448.69249,988.05077 447.01154,987.74327 L 443.9455,987.17614 L 441.57065,984.55317 L 439.00084,983.61384 z "},"az6":{"name":"AZ-6","path":"M 569.76995,1076.003 C 569.12087,1075.9635 566.9309,1075.7232 564.90342,1075.4691 C 562.87593,1075.215 559.86141,1074.8442 558.20449,1074.6451 L 555.1919,1074.2831 L 555.56638,1071.2862 L 555.9408,1068.2892 L 550.17928,1067.8807 L 544.41771,1067.4722 L 544.80483,1065.6769 L 545.19195,1063.8817 L 545.97362,1063.4281 L 546.7553,1062.9746 L 546.7553,1061.3396 L 546.7553,1059.7046 L 547.86091,1059.3537 L 548.96653,1059.0028 L 549.13695,1056.0593 L 549.30738,1053.1157 L 550.87639,1052.3666 L 552.44536,1051.6175 L 556.16328,1051.6175 L 559.88121,1051.6175 L 560.54911,1052.1629 L 561.21708,1052.7083 L 568.70794,1053.6162 C 572.8279,1054.1155 576.49757,1054.524 576.86274,1054.524 L 577.52674,1054.524 L 577.13666,1059.2029 L 576.74665,1063.8817 L 574.17569,1066.2783 L 571.60466,1068.675 L 572.00126,1071.0225 L 572.39785,1073.3699 L 571.67402,1074.7224 L 570.95014,1076.0749 L 569.76995,1076.003 z "},"ga7":{"name":"GA-7","path":"M 1981.8745,968.31912 L 1982.6757,973.48203 C 1981.0415,973.57793 1978.9931,973.5443 1977.358,973.61264 L 1974.7854,976.25892 L 1967.9798,976.25892 L 1967.9798,976.71971 C 1967.9798,976.97299 1968.7454,977.74695 1969.6812,978.43879 C 1970.617,979.13063 1971.3826,979.95501 1971.3826,980.26426 L 1971.3826,980.81364 L 1968.5469,982.10743 L 1968.5469,983.66704 L 1965.7113,984.7304 L 1965.7113,987.17614 L 1970.7446,985.77602 L 1975.7424,990.79159 L 1972.3396,993.0601 L 1979.4287,1000.7872 L 1983.7176,999.36941 L 1987.7762,1000.7163 L 1988.5382,1003.0912 L 1987.7407,1014.1148 L 1996.0172,1015.3199 C 1996.307,1015.3623 1997.3279,1015.144 1998.2857,1014.8414 C 1999.2437,1014.5387 2000.9921,1014.1389 2002.1848,1013.9552 L 2004.3647,1013.6185 L 2003.6735,1012.8033 C 2003.3004,1012.3538 2002.6618,1011.988 2002.238,1011.988 L 2001.4582,1011.988 L 1999.934,1005.466 L 2002.3265,1000.7163 L 2006.7927,995.89575 L 2007.4839,989.58644 L 2005.2863,987.65463 C 2004.073,986.58826 2002.8354,985.26606 2002.5392,984.71265 L 2002.0075,983.70248 L 2003.319,980.79595 L 2003.9039,980.79595 C 2005.4998,980.23789 2006.8513,979.18281 2008.2459,978.24387 L 2008.2459,974.61067 L 2003.319,971.29654 L 1996.4071,971.13701 L 1993.7842,968.33681 L 1981.8745,968.31912 z "},"ga6":{"name":"GA-6","path":"M 1956.5676,991.45536 C 1956.2362,991.56391 1955.2077,990.8538 1954.9932,990.63937 C 1954.7788,990.42488 1954.9358,989.66902 1954.9358,988.95965 L 1954.6865,986.58911 L 1956.0597,987.31379 L 1955.4783,983.36793 L 1954.1211,981.31702 C 1953.3746,980.18901 1952.4453,978.20298 1952.056,976.90363 L 1951.4313,974.99836 L 1944.7275,975.79285 L 1944.7275,972.76478 L 1940.7448,965.96922 C 1940.3726,964.36901 1939.9899,962.76624 1939.8114,961.13785 C 1946.007,959.83096 1950.9141,959.31379 1957.1512,958.96285 C 1957.6855,958.33357 1957.8229,957.87277 1958.562,957.54503 L 1959.4729,957.54503 L 1959.4867,959.95533 C 1959.4944,961.28099 1959.7622,963.51406 1960.082,964.9177 L 1960.6633,967.46978 L 1965.2407,975.20321 L 1970.4852,980.30039 C 1969.6597,980.84194 1968.8201,981.35894 1967.9064,981.72984 L 1967.9798,983.0939 L 1965.1442,984.17201 L 1965.1442,987.60285 C 1964.697,987.61232 1964.1679,987.85381 1963.8546,987.89248 L 1963.6879,986.35341 L 1957.4638,988.01498 L 1957.087,990.46838 L 1956.5676,991.45536 z "},"ca32":{"name":"CA-32","path":"M 246.52048,967.75335 L 243.12922,964.35058 L 242.07295,964.35058 C 241.49192,964.35058 240.29602,964.72324 239.41527,965.17864 L 237.81398,966.0067 L 237.41846,965.61125 C 237.20091,965.3937 236.72197,965.20524 236.35408,965.19236 C 235.98618,965.17949 234.85578,964.96455 233.84204,964.71473 L 232.52319,964.05073 L 231.99887,962.88767 L 231.99887,961.51493 L 232.45257,961.51493 C 232.70211,961.51493 233.17804,961.7867 233.51021,962.11887 L 234.1142,962.72286 L 241.28299,961.91181 L 245.90895,957.64774 L 247.87847,959.0879 L 247.87847,960.3091 C 247.87847,960.98075 248.17468,962.00465 248.53668,962.58431 L 249.19495,963.63832 C 248.34087,965.03521 247.49551,966.44169 246.52048,967.75335 z "},"ca31":{"name":"CA-31","path":"M 227.55638,966.05196 C 227.29641,966.05196 227.04086,965.73295 226.98846,965.34305 L 225.25936,958.97062 L 224.42613,958.714 L 226.18005,957.57934 L 233.13313,957.44465 L 233.45186,961.5797 L 231.75187,961.1404 L 231.7351,962.61346 L 228.02313,961.29392 C 227.20547,962.21454 226.82798,962.9986 228.02897,964.0103 L 228.22628,966.06716 L 227.55638,966.05196 z "},"tn7":{"name":"TN-7","path":"M 1679.1529,963.77744 L 1679.1313,961.42436 L 1673.055,960.55376 L 1668.4165,957.66821 L 1669.25,957.18127 C 1670.6083,955.34281 1671.9058,953.79438 1671.9127,952.15861 L 1668.0642,952.15861 C 1668.0345,952.78047 1667.7895,953.33053 1667.3455,953.81423 L 1664.2819,950.85603 C 1663.4774,949.4377 1663.4214,948.64321 1663.4317,947.90384 C 1662.1343,948.31064 1661.4059,947.17304 1660.5671,946.33494 L 1662.4412,945.61576 L 1663.9444,946.86328 L 1666.3203,945.97027 L 1667.2692,944.24705 C 1665.9862,943.17206 1664.3581,941.71953 1664.566,941.0983 L 1669.6701,941.0983 L 1669.4889,940.19985 L 1672.7864,939.50053 L 1673.391,940.47888 L 1677.6804,940.76772 C 1677.9783,939.53314 1680.2221,938.81062 1683.1292,938.26266 C 1688.0647,938.51741 1694.0259,937.57547 1699.7392,936.92287 L 1699.0907,934.85659 L 1717.4975,933.01983 L 1724.0436,928.3379 L 1726.3453,924.28055 C 1726.4966,919.33922 1726.296,914.44807 1725.421,909.65334 L 1725.9355,907.6862 L 1729.5022,906.57474 L 1746.1223,904.72561 L 1746.1223,903.10068 L 1751.1098,903.10068 L 1752.3658,901.84466 L 1753.6451,904.23493 L 1755.8641,904.23493 L 1757.2808,901.96642 C 1758.5514,901.84806 1760.3108,902.77696 1762.0849,903.73733 L 1764.3734,901.47693 L 1768.9176,900.73246 L 1768.9176,896.8765 L 1773.3995,894.20526 L 1773.4547,892.89236 L 1775.8042,892.89236 C 1776.7584,892.03588 1777.4912,891.13194 1777.4246,890.05672 L 1792.5982,890.05672 L 1793.9458,888.43291 L 1793.45,876.58072 L 1794.722,876.03412 L 1792.1779,873.26177 L 1793.531,871.9086 L 1791.3192,871.87253 L 1793.4178,870.2827 L 1792.6701,869.07295 L 1794.1144,869.07295 L 1792.3528,867.31145 L 1786.4986,867.17806 L 1786.4986,865.67018 L 1791.1544,861.01445 L 1789.1114,856.48389 L 1785.416,857.08357 L 1782.6334,854.89474 L 1780.7388,854.89474 L 1779.7644,861.70028 L 1780.2959,861.70028 C 1780.5882,861.70028 1780.8273,861.96349 1780.8273,862.28522 C 1780.8273,862.60689 1780.4727,863.00626 1780.0391,863.1726 L 1779.0029,863.61281 L 1776.543,860.76707 L 1773.0932,860.99937 L 1770.1714,863.48708 L 1766.6407,851.11845 L 1791.2177,847.3395 L 1793.3042,849.91625 L 1793.5522,858.10338 L 1791.3831,859.31619 L 1795.1491,866.04749 L 1794.5215,868.44747 L 1798.1167,870.04348 C 1798.1404,871.93968 1797.8303,872.81305 1796.4055,874.40555 L 1798.1557,877.15851 L 1796.7951,883.59786 L 1800.2072,883.65298 C 1800.1006,884.76484 1800.5271,885.76253 1801.4492,886.65394 L 1806.161,881.89647 L 1813.801,882.25467 L 1822.1921,885.47261 L 1822.2083,888.92246 L 1824.0594,892.4069 L 1823.3489,895.608 L 1820.1797,899.14064 L 1819.9592,901.96642 C 1817.0926,902.18896 1813.602,901.86553 1808.3962,900.04136 L 1808.3962,898.86672 L 1806.0924,898.72919 L 1805.7952,897.82173 C 1807.6329,896.42863 1809.5998,895.20057 1811.3765,893.73358 L 1811.4523,889.48959 C 1809.5402,889.8213 1807.4932,889.34429 1805.4368,888.81022 L 1803.1052,893.68464 L 1801.7916,892.78551 L 1801.7392,889.48959 L 1800.807,889.48959 L 1797.8981,891.79366 L 1798.5346,887.7882 L 1797.4282,887.7882 C 1796.7291,887.97649 1795.9861,888.52967 1795.0685,890.53917 L 1790.0378,893.58806 L 1784.9051,891.94378 L 1782.2968,893.39988 L 1784.5056,894.1046 L 1784.4506,896.5749 L 1783.117,897.80091 L 1776.4975,896.54875 L 1777.084,899.05586 C 1778.9881,901.18503 1781.5578,903.45627 1780.8648,904.35709 L 1779.5542,905.93632 L 1776.2264,905.93632 L 1773.0062,909.46187 L 1771.025,908.35314 L 1768.9176,908.90427 L 1768.8754,911.75631 C 1771.5155,913.32884 1774.6427,914.83173 1774.2605,916.83602 L 1772.3204,918.25464 L 1772.3204,920.54278 L 1770.6315,921.94443 L 1771.2531,922.95018 L 1775.1561,922.95018 L 1775.1561,924.39364 L 1779.106,926.52082 C 1780.2871,934.51802 1781.469,942.51731 1780.7819,946.00895 L 1781.9335,949.0381 L 1780.8273,949.0381 L 1780.8273,951.09848 L 1752.1873,954.19892 L 1750.1653,955.3093 C 1726.8413,958.07853 1703.7886,960.78957 1679.1529,963.77744 z "},"nc7":{"name":"NC-7","path":"M 2247.8342,939.75999 L 2191.7154,902.71083 L 2195.9475,893.30273 L 2194.2642,889.67124 L 2202.0886,888.27293 L 2209.2025,877.25089 L 2212.3074,878.21541 L 2215.0507,876.32698 L 2213.6508,872.86103 L 2216.5515,868.47775 L 2215.2723,865.67018 C 2213.0946,865.38735 2212.1192,865.19708 2210.404,866.0704 L 2209.4328,862.75111 L 2214.0784,858.4191 C 2221.6224,854.96585 2216.634,858.40316 2224.918,856.52228 L 2227.2811,851.49503 L 2230.7144,854.38392 L 2236.2317,853.1169 L 2236.2317,857.0403 L 2239.184,857.78125 L 2238.4547,861.66869 L 2240.2405,865.12211 L 2241.3059,864.55197 C 2241.8919,864.23835 2242.501,863.65988 2242.6595,863.26641 L 2242.9477,862.55097 L 2242.9925,863.29715 C 2243.0171,863.70758 2242.7643,864.55334 2242.4307,865.17661 L 2241.8243,866.30979 L 2243.1761,867.9387 L 2242.0479,867.9387 L 2241.3328,872.41062 L 2240.2118,873.10348 L 2237.3965,871.0579 L 2238.6867,867.7689 L 2237.0338,868.18154 C 2236.1248,868.40851 2234.9344,868.99668 2234.3885,869.4886 L 2233.396,870.38302 L 2233.396,874.15199 L 2236.3955,880.26773 L 2237.9034,881.15841 C 2238.7327,881.6483 2240.8013,883.4622 2242.5002,885.18922 L 2245.5893,888.3293 L 2247.3508,889.81081 L 2247.7162,891.26629 L 2252.2416,894.12314 L 2252.6739,893.64953 C 2252.9116,893.38905 2253.5492,891.77228 2254.0908,890.05672 C 2254.6323,888.34115 2255.4464,886.34622 2255.8998,885.62353 L 2256.7242,884.30955 L 2255.3752,882.68404 L 2252.6784,882.68404 L 2252.6784,871.46834 C 2251.605,867.92123 2250.7522,864.29002 2249.3188,860.8674 C 2249.0674,860.54566 2248.7239,859.19783 2248.5555,857.87216 L 2248.2493,855.46187 L 2248.7625,855.46187 C 2249.0447,855.46187 2249.2756,855.69887 2249.2756,855.9885 C 2249.2756,856.27813 2249.6767,856.91615 2250.1668,857.40632 L 2251.0581,858.29751 L 2254.8906,858.29751 L 2255.838,859.99044 L 2265.1041,861.23745 L 2269.2645,857.19683 L 2271.3678,861.32229 L 2270.7036,863.9688 L 2269.1251,863.9688 L 2269.1329,864.67771 C 2269.1372,865.06761 2269.2923,865.95238 2269.4777,866.64388 L 2269.8147,867.90115 L 2271.9608,868.58227 L 2271.9608,870.07677 L 2269.1251,871.93474 L 2269.1251,874.86719 L 2272.2444,874.11501 L 2273.5037,872.47573 L 2276.9652,872.47573 L 2277.7396,877.29632 L 2286.9897,891.65432 L 2289.1693,892.04167 L 2289.5547,893.21477 L 2286.9851,896.74617 C 2285.5718,898.68841 2283.5631,901.86978 2282.5212,903.81588 C 2281.4793,905.76193 2280.0904,909.01299 2279.4348,911.04048 L 2278.2428,914.72681 L 2277.371,922.38305 C 2276.8915,926.59398 2276.4989,930.86871 2276.4985,931.88246 L 2276.4978,933.72563 L 2274.3507,933.72563 L 2273.7493,932.15848 L 2269.4087,931.60904 L 2266.0059,932.13279 C 2264.1344,932.42083 2260.87,933.25797 2258.7517,933.99308 L 2254.9003,935.32958 L 2247.8342,939.75999 z "},"tn6":{"name":"TN-6","path":"M 1818.1989,929.75572 L 1816.9973,926.30889 L 1815.5653,928.26724 L 1812.657,925.12909 L 1811.9125,921.7393 L 1810.1299,921.31555 L 1810.1299,919.10147 L 1812.6862,917.50036 L 1814.6851,913.67592 L 1815.4478,902.18856 C 1817.0174,902.43929 1818.6198,902.42681 1820.2428,902.24998 L 1820.483,899.30108 L 1823.6451,895.81704 L 1824.3307,892.38898 L 1822.5401,888.85951 L 1822.3909,882.50199 L 1824.3959,880.58612 L 1824.4561,878.48888 L 1825.9769,878.82071 L 1826.0973,876.22966 L 1830.4398,878.64762 L 1831.2944,876.72709 L 1832.7461,876.07801 C 1833.3546,876.06049 1834.1818,875.7514 1835.0087,875.44289 L 1835.7755,873.35041 L 1834.9572,870.66341 L 1836.1476,868.30018 C 1835.1223,867.46458 1834.8173,866.67701 1834.9082,865.91581 L 1836.7081,865.91581 L 1839.9687,860.14913 C 1839.8458,859.61217 1839.2442,859.39434 1838.5694,859.22533 L 1837.4939,859.22834 L 1836.5083,861.98385 L 1835.4889,858.54086 L 1834.7121,861.35683 L 1832.4146,861.51058 L 1831.6467,859.18138 L 1830.503,859.97003 C 1830.5801,860.87329 1830.4337,861.7883 1829.8047,862.72871 L 1828.0244,860.49213 L 1823.4004,865.16765 L 1822.2728,862.65442 L 1821.7405,867.54931 L 1818.517,867.7592 L 1817.8979,865.16056 L 1813.7807,862.88155 L 1811.6717,859.01436 L 1810.1201,861.31475 L 1810.5418,862.06012 L 1808.1573,863.09842 L 1807.4868,861.35099 L 1805.8773,861.87722 L 1804.7266,860.72652 L 1801.2759,863.19018 C 1800.3751,862.24166 1798.2814,860.97362 1795.2939,859.46619 L 1793.9291,858.30522 L 1793.5877,849.39143 C 1792.9719,848.78665 1792.233,847.99613 1791.9299,847.25738 L 1817.4071,843.11434 L 1819.1197,843.96486 L 1822.0846,842.46276 L 1869.5245,837.89437 L 1881.7937,835.0914 L 1882.3434,840.83788 L 1884.0448,840.18501 L 1884.0448,841.28365 L 1886.1603,841.28365 L 1889.1497,843.63513 L 1891.8496,848.37276 L 1892.529,853.75345 L 1895.4608,859.53912 L 1894.248,863.01846 L 1894.8227,863.59319 L 1892.9275,865.68737 L 1888.495,866.39616 L 1888.8654,874.17966 L 1887.5421,874.17711 L 1885.3413,871.15579 L 1874.9221,869.64008 L 1869.2785,874.91903 L 1869.9127,876.91731 L 1868.793,877.60932 L 1870.4551,882.32029 L 1869.4867,882.96761 L 1869.583,886.12748 L 1860.7955,886.47541 L 1858.3999,888.63889 L 1855.0072,895.35438 L 1855.6877,899.61017 L 1851.8326,900.88241 C 1849.7076,900.31103 1847.581,899.72921 1845.3579,898.47132 L 1842.7163,899.13435 C 1844.2164,909.53838 1845.2632,910.79451 1844.9129,916.09881 C 1842.4845,918.56469 1840.0655,921.18953 1837.5402,922.00761 L 1837.5402,923.51731 L 1835.8277,923.51731 L 1834.0907,921.48858 L 1827.7668,921.81592 L 1828.2936,924.57188 L 1825.7759,925.20378 L 1821.6636,929.75572 L 1818.1989,929.75572 z "},"mo7":{"name":"MO-7","path":"M 1477.4135,811.22447 L 1477.4135,812.39417 C 1477.4135,813.03848 1477.1515,814.05937 1476.8287,814.66268 L 1476.2438,815.76149 L 1474.6665,815.76149 L 1473.4613,824.37476 L 1473.5499,829.28394 L 1468.942,829.15991 L 1469.1724,839.29734 L 1446.2214,840.59107 L 1446.2214,836.99338 L 1420.8424,837.5605 C 1420.8216,855.28781 1423.429,873.00219 1423.7489,890.72882 L 1501.162,885.48288 L 1499.6378,881.83199 L 1497.7415,881.44209 L 1498.3618,879.86473 L 1495.6325,877.13543 L 1496.2528,874.76057 L 1494.4273,874.05166 L 1494.4273,866.94486 C 1498.2082,866.21604 1501.3943,866.27083 1505.7699,866.23595 L 1505.0433,849.34612 L 1496.6959,849.5411 L 1496.6959,838.44664 L 1495.5616,838.44664 L 1494.8172,829.2485 L 1490.0498,829.90427 L 1489.3232,814.06011 L 1483.0316,814.06011 L 1478.1401,811.22447 L 1477.4135,811.22447 z "},"nc6":{"name":"NC-6","path":"M 2163.347,806.64309 L 2164.2418,810.56869 L 2160.8568,811.31305 L 2160.6085,813.00576 L 2158.4996,813.49298 L 2159.7048,815.74374 L 2164.9863,818.80981 L 2166.8114,817.56031 L 2170.2406,819.42135 L 2167.0952,819.7314 L 2166.0495,821.59226 L 2164.7203,820.67067 C 2163.9871,820.15708 2163.1713,819.7314 2162.9126,819.7314 L 2162.4518,819.7314 L 2161.2644,823.13417 L 2158.5528,823.13417 L 2156.8866,826.6785 L 2156.2665,824.12664 L 2154.7247,825.40268 L 2150.9852,824.65833 L 2151.6232,826.6342 C 2146.7,831.38306 2144.9658,832.72142 2143.3644,832.77536 L 2140.3338,828.80546 L 2138.083,828.80546 L 2137.445,830.45364 L 2133.865,831.6411 L 2133.865,837.02882 L 2134.8929,837.77318 L 2137.6931,836.49714 L 2139.9261,839.26189 L 2134.7156,842.48743 L 2134.7156,846.26236 C 2133.4278,846.49278 2132.45,847.12178 2130.8521,846.95357 L 2130.0723,851.5083 L 2127.7152,852.76664 C 2125.2694,851.17159 2128.3601,851.70254 2120.378,847.98149 L 2117.4891,850.88803 L 2119.545,853.15654 L 2121.9817,851.96915 L 2123.3731,853.31602 C 2121.9939,857.1261 2121.4119,859.12024 2121.2286,862.08882 L 2164.4722,852.74889 C 2167.2308,857.8028 2169.3251,861.79369 2171.1537,867.51199 L 2173.9005,868.57519 L 2173.8744,870.41881 L 2179.5188,874.38842 C 2179.469,875.31528 2179.5182,876.42771 2179.7847,877.30375 L 2186.2712,877.29496 C 2188.0438,872.83194 2190.6578,869.12184 2193.9806,865.10169 C 2195.9124,865.65702 2195.8953,866.47806 2201.5476,866.76763 L 2201.9204,865.13714 L 2200.1479,865.0574 C 2198.0094,863.42413 2197.0226,862.85382 2193.9983,861.75206 C 2195.1294,860.92201 2195.5075,860.4906 2195.5313,859.12903 L 2191.7827,857.66692 L 2184.8798,851.0741 L 2185.7927,848.92072 C 2182.1224,848.24895 2178.4408,850.12649 2174.7514,850.30315 L 2170.9764,829.91323 L 2184.623,826.92684 L 2180.8214,808.92062 L 2177.1085,814.62724 L 2172.412,814.62724 L 2171.0828,812.48275 L 2171.7208,810.01932 C 2173.8798,810.99977 2174.7986,811.44876 2176.2046,811.10049 C 2176.2465,808.63853 2175.7171,806.46779 2174.8932,804.15305 L 2163.347,806.64309 z M 2157.9502,807.55582 L 2142.2301,810.33833 C 2143.357,817.21079 2143.9581,820.82896 2145.6861,825.96981 L 2146.9621,825.96981 L 2148.8584,821.75179 C 2148.6349,821.05921 2148.175,820.37072 2146.3418,819.6782 L 2148.5749,818.13635 L 2150.5244,819.16427 L 2151.0206,817.40968 L 2153.7322,818.20724 L 2154.6538,817.03753 L 2151.7118,813.88288 L 2157.9679,809.84209 L 2157.9502,807.55582 z "},"mo6":{"name":"MO-6","path":"M 1514.4527,628.66216 C 1461.9547,634.11244 1409.044,637.91158 1355.4808,639.1009 L 1355.4808,641.58209 L 1356.5796,642.27325 L 1358.5646,639.9516 L 1360.6204,639.9516 L 1361.2762,641.67068 L 1359.5394,645.28612 L 1359.8052,645.74692 C 1359.9576,645.9935 1360.4664,646.19001 1360.9394,646.19001 L 1361.8079,646.19001 L 1361.4889,649.30922 L 1363.1016,654.71464 L 1364.679,655.40586 C 1365.5452,655.78923 1366.2882,656.3043 1366.3271,656.54011 C 1366.3661,656.77592 1366.43,657.25912 1366.4689,657.62117 L 1366.5398,658.27694 L 1370.5097,659.62387 L 1370.2262,663.16843 L 1372.4947,664.37358 L 1372.4947,666.03952 L 1374.072,666.03952 L 1374.6214,669.72585 L 1373.6644,671.56902 L 1374.0188,671.92348 C 1374.2158,672.12039 1374.9743,672.27793 1375.7025,672.27793 L 1377.0317,672.27793 L 1381.4093,676.77952 L 1384.5285,677.96692 L 1383.9081,679.57972 L 1386.921,679.36704 L 1386.9565,680.96209 L 1388.0907,681.40513 C 1388.7146,681.6486 1389.6371,681.86179 1390.1466,681.88368 L 1391.0859,681.91912 L 1391.6353,679.81008 L 1395.9774,678.99484 L 1397.3774,680.8912 L 1396.7572,682.4685 L 1399.7169,683.58506 L 1399.7169,686.27892 L 1397.1648,687.55496 L 1400.5675,687.30684 L 1400.9043,689.6817 L 1399.0611,691.20585 L 1395.747,689.96526 L 1395.747,693.86427 L 1392.9468,694.92764 L 1392.6632,696.22137 C 1392.5079,696.93425 1392.3074,698.15318 1392.2201,698.93298 L 1392.0606,700.3508 L 1389.5085,700.72295 L 1389.5085,702.30031 L 1392.9113,704.81694 L 1392.9113,706.85503 L 1395.6761,707.54625 L 1398.1927,711.21484 L 1400.6916,710.73635 L 1401.3651,712.50863 L 1399.6814,714.19226 L 1400.3903,717.0279 L 1404.2539,719.31417 L 1404.2539,722.18526 L 1406.2743,722.18526 L 1408.2415,724.48922 L 1409.3226,723.90434 C 1409.9216,723.5838 1410.8191,723.31952 1411.3075,723.31952 L 1412.1937,723.31952 L 1412.1937,724.98546 L 1415.7737,724.27655 L 1414.9815,728.44114 C 1416.5187,727.13573 1418.0876,725.65087 1419.4415,725.38421 L 1420.2909,725.35602 C 1420.5869,726.04383 1420.8311,726.88687 1421.3076,727.03302 C 1422.1434,726.67771 1423.2849,725.36691 1424.3621,724.25721 L 1423.7876,721.97951 L 1425.7817,724.29957 L 1427.1425,723.47139 L 1427.7598,726.03085 L 1429.4037,725.99495 L 1429.4037,727.11979 C 1427.9391,732.20433 1426.5319,733.55727 1425.1302,734.56103 L 1432.6281,735.88493 L 1432.6103,734.21899 L 1430.9089,733.56328 L 1430.9089,731.13523 C 1432.9534,732.04445 1435.6133,732.27692 1438.2816,732.49991 L 1438.2816,724.52467 L 1435.765,722.75239 L 1433.5142,722.75239 C 1434.5043,722.03168 1435.2544,721.09546 1434.9746,720.37476 L 1432.8301,720.94189 L 1431.7226,701.01457 L 1453.1783,699.7273 C 1453.7163,705.09676 1454.2759,709.27718 1454.7283,719.34962 L 1456.8374,719.34962 L 1458.9641,716.51397 L 1463.0935,716.51397 L 1464.5468,718.2685 L 1466.9216,717.93179 L 1466.5495,713.67833 L 1468.4458,712.95167 C 1468.9711,713.81444 1469.6021,714.60678 1471.4586,714.58216 L 1471.1751,717.15199 C 1472.7901,716.72313 1474.0608,716.13536 1474.5069,715.16704 L 1473.4436,713.19979 L 1474.2025,711.64676 L 1476.8479,711.57905 L 1477.5714,709.87766 L 1479.2744,709.70843 L 1480.7615,707.48653 L 1480.1073,704.60427 L 1481.6847,704.60427 L 1482.9671,706.89048 L 1485.9027,706.18157 L 1487.4462,710.02585 L 1492.4424,709.99199 L 1492.7291,712.7133 L 1494.9976,713.93615 L 1493.1366,715.65852 L 1497.8301,714.75939 L 1497.6987,716.79011 C 1496.324,718.3395 1495.0743,720.02064 1495.5616,721.49404 C 1494.1771,721.84442 1493.7683,722.50291 1493.8602,723.31952 L 1496.1287,723.31952 L 1496.1287,724.79048 L 1489.569,732.10701 L 1490.6347,748.78711 C 1496.5479,749.5689 1504.0547,748.62741 1511.1576,748.1314 L 1515.801,732.99615 C 1514.4463,731.81306 1513.1772,731.08737 1511.9552,730.5681 C 1513.2085,724.54054 1515.8507,718.49512 1517.1239,712.47772 L 1503.6191,708.49007 L 1502.757,685.88902 L 1495.154,685.88902 L 1492.0525,645.71147 L 1515.2693,643.10625 L 1514.4527,628.66216 z "},"co7":{"name":"CO-7","path":"M 924.642,673.8326 L 925.08407,678.20029 L 922.56846,683.04845 L 917.57461,684.04829 L 916.34479,682.46158 L 913.51748,681.88708 L 912.17849,683.97099 L 909.62982,685.40997 L 909.71942,690.10211 L 915.4692,695.61675 L 916.04325,695.43743 L 915.68346,693.98337 L 917.0921,693.29221 L 917.0921,686.36258 L 924.44707,686.73478 L 924.99645,685.31696 L 926.73328,685.31696 L 926.73328,686.45122 L 929.56893,686.45122 L 929.56893,683.61557 L 932.42232,683.61557 L 933.11348,680.24825 L 934.95665,679.68112 L 940.19771,681.12231 L 938.64299,682.71168 L 938.64299,685.24607 L 936.32133,685.99043 L 931.94378,685.24607 L 931.19942,686.45122 L 932.9717,686.45122 L 932.9717,688.71973 L 930.27784,688.77287 C 928.79621,688.79476 927.07362,689.00749 926.44972,689.25142 L 925.31546,689.69446 C 944.62892,691.04388 958.61096,691.58691 980.43331,692.26429 L 981.17761,676.84548 L 924.642,673.8326 z "},"co6":{"name":"CO-6","path":"M 904.08358,681.34706 L 901.85051,683.75736 L 900.53903,699.92052 L 890.43705,699.33564 L 890.43705,702.15359 L 891.87262,702.80931 C 892.66705,703.17131 893.95041,703.46508 894.70826,703.46508 L 896.07289,703.46508 L 897.86292,706.19439 L 897.1717,708.92369 L 900.04279,710.23518 L 899.01487,726.55782 C 925.52541,727.98818 938.58338,728.69074 963.63381,730.18098 L 962.76371,745.92884 L 978.05841,746.76178 L 980.77001,692.84911 L 925.66992,690.27934 L 926.32569,692.81366 L 924.74833,693.80614 L 926.04212,693.82389 L 926.69784,695.56072 L 925.58133,696.67723 C 924.96458,697.29398 924.20962,697.79379 923.89764,697.79379 L 923.33051,697.79379 L 923.33051,696.23419 L 919.94549,694.83406 L 918.2441,695.48983 L 918.88212,697.15577 L 914.89447,697.91782 L 914.2919,697.54567 C 913.95979,697.34032 913.68938,696.94968 913.68932,696.67723 C 913.89587,696.24859 914.02285,695.97915 914.92992,695.7734 L 909.15229,690.19069 L 909.15229,684.92706 L 911.70437,683.70416 L 907.71678,683.61557 L 906.29896,681.34706 L 904.08358,681.34706 z "},"va7":{"name":"VA-7","path":"M 2196.5504,631.00157 L 2195.1576,636.56601 L 2192.935,638.81734 L 2190.2943,638.81734 L 2190.2943,637.68308 C 2188.4703,637.93438 2187.1005,636.43829 2185.456,636.10573 L 2181.7999,642.92522 L 2179.4761,643.43439 C 2177.885,646.44636 2177.7694,648.56935 2177.8051,650.5167 L 2176.4472,652.16732 L 2176.116,658.08197 C 2179.5439,658.73575 2179.7487,659.55922 2180.2277,660.36823 L 2183.5131,660.39835 L 2183.5596,661.50249 L 2186.1826,661.50249 L 2187.1625,658.82405 L 2188.2013,658.0202 L 2189.8689,663.41655 C 2192.4788,666.13826 2195.0924,668.38976 2197.7024,669.35365 L 2195.8238,674.15655 L 2204.2421,675.92882 L 2201.2647,684.79021 L 2214.1314,688.31701 L 2211.7566,698.68486 L 2215.8859,700.65206 L 2215.2125,702.7788 L 2217.0025,703.43457 C 2219.0361,703.96319 2220.3488,703.88782 2222.4434,704.01939 L 2222.1421,700.58117 L 2223.7194,699.39377 C 2225.8307,701.16651 2227.4892,702.02814 2228.7172,702.03444 L 2229.8338,703.59404 L 2232.0314,702.42434 C 2232.5658,703.40922 2235.7155,703.83366 2238.6774,704.42704 L 2233.5733,711.69338 L 2232.6694,715.32652 C 2231.6015,715.22733 2230.7609,715.61712 2229.8515,716.38988 L 2230.8617,718.74704 L 2232.4213,718.78249 L 2234.8848,716.12407 L 2240.4851,714.06823 L 2244.6677,710.84269 L 2248.3364,710.84269 L 2246.8477,709.17674 L 2245.8552,709.21219 C 2245.4538,706.32414 2248.1161,703.79322 2248.4073,700.33305 L 2251.5087,699.53556 L 2257.499,701.11286 L 2261.6461,696.15048 L 2262.3728,692.83635 L 2260.7069,692.19833 L 2259.2181,693.82882 L 2258.013,691.91477 L 2255.7976,692.411 L 2255.0887,689.85892 L 2252.6253,691.77298 L 2251.9873,689.30949 L 2251.2606,690.00071 L 2249.701,688.15754 L 2250.5517,688.15754 L 2249.2225,686.56249 L 2252.8734,680.62533 L 2250.7644,679.08348 L 2243.1081,679.08348 L 2242.3992,680.21774 L 2237.3659,680.02276 L 2239.6877,677.77199 L 2238.9787,674.26288 L 2235.5228,671.3386 L 2236.852,668.85741 L 2233.9632,667.77635 L 2230.5781,668.44982 L 2229.7983,666.42942 L 2232.315,664.40902 L 2230.9326,662.2114 L 2227.069,663.82414 L 2224.8714,663.13298 C 2223.9831,662.02963 2223.6106,660.06726 2223.1877,658.1883 L 2226.1475,654.6615 L 2227.7248,655.97298 C 2227.9833,654.66961 2226.9533,653.47325 2224.1625,652.41068 L 2221.6104,654.07662 L 2216.6835,648.13952 L 2212.3591,644.91397 C 2212.8784,642.06999 2211.2376,640.40604 2209.2931,638.90593 L 2206.1916,639.52625 L 2202.8952,635.96395 L 2203.4446,635.09556 L 2196.5504,631.00157 z "},"ca6":{"name":"CA-6","path":"M 71.916024,686.41277 C 71.532014,686.3881 70.898874,686.23922 70.508974,686.0819 C 70.119074,685.92458 69.800064,685.5467 69.800064,685.24221 C 69.800064,684.93772 68.852794,683.55534 67.694994,682.1703 L 65.589984,679.65197 L 62.427394,679.65197 L 62.427394,677.52234 L 60.726005,676.11031 L 60.726005,674.02843 L 56.446679,669.52997 L 53.307621,668.74211 L 52.293368,669.66001 C 51.735484,670.16487 51.098258,670.57791 50.877248,670.57791 C 50.656238,670.57791 51.508008,669.05732 52.770097,667.1989 C 54.032128,665.34042 55.322006,663.14325 55.636422,662.31626 L 56.208031,660.81269 L 55.09436,656.77933 L 56.723608,655.549 L 54.543054,650.7284 L 52.696086,650.7284 L 53.468629,647.21096 L 52.051091,641.93791 L 50.735863,640.15696 C 50.01249,639.17747 48.710419,637.61083 47.842429,636.67564 C 46.974438,635.74044 45.959562,634.59013 45.587185,634.11936 C 45.214808,633.64864 44.492456,632.28033 43.981984,631.07876 C 43.471511,629.87712 42.581913,627.39826 42.005143,625.57023 L 40.956409,622.24658 L 38.410285,619.53633 L 39.680653,619.53633 C 40.379412,619.53633 41.408297,619.29161 41.967089,618.99256 L 42.983157,618.4488 L 47.331049,619.6493 L 48.812673,617.62312 L 52.689281,619.47173 L 53.40477,621.72601 L 57.039668,622.48477 L 62.301094,627.59267 L 64.535744,626.88336 L 65.827104,628.43934 C 66.679304,633.40234 68.046484,637.24957 69.928634,642.29843 L 72.460634,639.91973 L 76.495364,644.14903 L 81.122954,651.69508 L 82.160104,660.38559 L 83.623614,661.35322 C 84.098074,662.26306 83.972894,663.35626 83.974764,663.88743 C 83.976694,664.41866 83.685754,665.4953 83.328234,666.27998 L 82.678144,667.70671 L 81.622884,667.05451 L 79.389134,669.45216 L 76.602034,668.75266 L 76.247014,670.52777 C 76.051754,671.50409 75.669734,672.44025 75.398074,672.60812 L 74.904224,672.91334 L 74.904224,676.15466 L 76.322044,676.75048 L 74.337094,678.00695 L 74.337094,679.55743 L 72.919274,680.03348 L 73.769054,681.68592 C 74.236424,682.59474 74.874444,683.55183 75.186884,683.81282 L 75.754914,684.28739 L 73.293234,683.75168 L 72.614104,686.45751 L 71.916024,686.41277 z "},"ca7":{"name":"CA-7","path":"M 100.74612,685.32326 L 99.955094,683.78237 L 95.093384,683.00495 L 90.216244,679.00856 L 88.991364,679.39733 C 88.317614,679.61113 86.212254,680.52132 84.312774,681.41999 C 82.413234,682.31861 80.412464,683.05406 79.866594,683.05429 L 78.874124,683.05474 L 78.874124,681.35335 L 78.306994,681.35335 C 77.995074,681.35335 77.739864,681.15412 77.739864,680.91054 C 77.739864,680.66702 78.505494,680.17877 79.441254,679.82557 L 81.142634,679.18335 L 81.142634,677.61121 L 84.892044,678.04892 L 85.686364,677.09184 C 86.123224,676.56548 86.539494,675.73385 86.611404,675.24379 L 86.742184,674.35277 L 85.858994,672.6071 C 85.373194,671.647 84.584144,670.41486 84.105544,669.869 L 83.235344,668.87652 L 84.089324,668.87652 C 84.559024,668.87652 85.683184,669.11063 86.587524,669.39675 C 87.491874,669.68292 88.966804,670.07889 89.865194,670.27676 L 91.498574,670.63655 L 90.884774,668.28943 L 92.616844,666.55736 L 91.876434,663.41524 L 93.052344,662.82021 L 93.052344,660.7883 L 99.574324,661.78741 L 99.933084,657.42132 L 105.65484,658.81538 L 106.64607,657.25038 L 106.66343,660.28855 L 104.881,662.07098 L 100.91909,662.07098 L 95.321424,666.89157 L 95.320854,670.43902 L 96.871044,671.72561 L 100.78344,671.71217 L 103.30404,677.79366 L 106.0963,680.4168 L 106.0963,682.21233 C 104.31449,683.24944 102.59988,684.41755 100.74612,685.32326 z "},"in6":{"name":"IN-6","path":"M 1860.0659,555.00632 L 1856.6277,555.82157 L 1857.372,560.92573 L 1849.4322,561.68781 L 1845.4978,564.23989 L 1845.3028,568.81239 L 1838.1782,570.19477 L 1840.6772,586.35794 C 1838.8567,585.93917 1837.0982,586.1173 1835.4312,587.38586 L 1838.0188,603.92117 L 1819.144,607.16447 L 1822.9012,633.14605 C 1826.0302,633.38578 1829.5619,632.06942 1836.2642,631.44467 L 1836.9022,636.03484 L 1835.9806,636.35385 L 1836.53,640.99721 L 1834.8463,642.64546 L 1836.2819,650.00038 L 1832.2057,649.30922 L 1832.1525,652.67655 L 1836.53,652.03853 L 1839.0998,668.94605 L 1828.8738,670.32843 L 1828.0586,659.96058 L 1825.9673,659.99602 L 1825.3115,654.94506 C 1823.5866,655.50953 1822.2206,655.82513 1821.3948,655.76031 L 1823.2025,665.86229 L 1809.4142,668.68018 L 1809.7155,673.3413 L 1817.7793,672.20704 L 1819.8706,684.36486 L 1828.1117,682.61028 L 1825.8077,679.24295 L 1828.2535,676.9213 L 1831.16,680.55444 L 1837.877,678.81761 L 1838.4263,682.69892 L 1843.8495,681.72414 L 1859.3392,668.04216 L 1872.4718,666.26989 L 1873.0744,672.33107 L 1874.7403,674.31602 L 1874.3327,675.7516 L 1877.3101,675.94652 L 1878.8343,674.511 L 1860.0659,555.00632 z "},"in7":{"name":"IN-7","path":"M 1806.9488,653.52321 L 1805.9473,651.73375 L 1803.5125,653.03685 L 1803.5125,652.14623 C 1803.5125,651.6564 1803.9234,650.62842 1804.4257,649.86189 L 1805.3389,648.46817 L 1804.9487,646.90443 C 1804.734,646.04438 1804.2222,644.50814 1803.1847,643.53534 C 1802.2746,642.68193 1801.8111,641.44275 1801.8111,641.09158 L 1801.8111,640.45317 L 1803.4052,640.99869 L 1805.5747,638.94721 L 1805.3053,637.59626 L 1807.766,637.37224 L 1812.637,640.07812 L 1819.1085,638.19344 C 1819.2001,641.57274 1819.6139,644.46872 1820.1082,647.60636 L 1816.7029,648.70795 L 1815.9666,651.40119 C 1812.9539,652.16897 1809.8003,652.57418 1806.9488,653.52321 z "},"oh7":{"name":"OH-7","path":"M 1935.1628,650.7284 L 1933.834,640.49082 L 1908.5077,642.7886 L 1906.6798,627.85764 L 1908.0412,627.01619 L 1907.2813,614.50402 C 1915.9612,613.35218 1922.977,613.18636 1930.9174,612.03457 L 1930.3765,626.909 L 1927.7137,626.909 L 1927.7137,631.5155 L 1947.5535,629.05309 L 1946.4404,621.96029 C 1949.8686,621.73276 1953.0503,621.50528 1956.3553,620.53822 L 1957.2981,617.7805 L 1955.8913,616.08546 L 1957.0318,614.94502 L 1960.0182,616.30568 L 1961.3615,618.89507 L 1962.5182,617.12603 L 1962.814,611.90465 C 1960.0981,608.42928 1959.7603,606.76918 1964.9016,610.49624 L 1995.3256,606.88329 L 1996.1789,612.45209 L 2000.5911,611.8523 L 2000.8733,617.40007 L 2003.6292,616.8732 C 2004.2024,619.31225 2004.7287,622.15011 2004.9772,627.34926 L 1995.1774,628.57738 L 1995.2229,626.60842 L 1988.9636,627.45441 L 1988.9636,623.61415 L 1982.5869,624.28818 L 1983.2571,628.00889 L 1977.621,628.75653 L 1977.621,631.32466 C 1976.3835,631.90858 1974.6375,632.08575 1972.5793,632.01316 L 1972.8004,638.51642 L 1961.9642,640.0065 L 1961.7257,644.23954 L 1963.2454,644.55691 L 1963.0605,646.94152 C 1961.2769,647.9531 1959.4182,648.66474 1957.4702,649.01908 L 1951.4312,644.06527 C 1949.6874,644.71338 1947.9603,645.30319 1946.5389,644.82306 L 1944.8336,649.4104 L 1935.1628,650.7284 z "},"md6":{"name":"MD-6","path":"M 2129.7361,623.14565 L 2129.2774,623.42915 L 2123.4592,593.17323 C 2173.9353,581.37701 2221.6598,570.49795 2271.6772,557.78456 L 2276.5094,561.49749 L 2272.2261,564.07559 L 2271.0266,564.05839 L 2270.0109,563.48996 L 2266.8376,565.13093 L 2267.4039,566.18901 C 2267.7635,567.01593 2266.746,567.29113 2259.3607,569.64777 L 2260.7957,571.37689 L 2256.993,575.30029 L 2255.0139,575.30029 L 2254.3129,574.16603 L 2251.9578,574.16603 L 2250.6167,575.61306 C 2249.8791,576.40897 2249.2756,577.30219 2249.2756,577.59801 L 2248.8236,578.08273 L 2245.9493,578.13593 L 2245.1844,580.54606 L 2245.6704,580.90057 C 2245.9377,581.09561 2246.2354,581.76555 2246.3319,582.3894 C 2246.4284,583.01324 2246.5721,583.96505 2246.6512,584.50456 C 2246.7303,585.04407 2246.9634,585.6539 2247.1692,585.85971 L 2247.5434,586.23396 L 2246.9402,587.20999 L 2242.537,587.20999 L 2241.836,588.34425 L 2236.1961,588.34425 L 2235.5432,590.04563 L 2234.7866,590.04563 C 2234.3705,590.04563 2233.8469,590.34219 2233.6228,590.70464 L 2233.2156,591.36358 L 2235.8578,593.50313 L 2236.1738,596.46678 L 2235.6157,597.50967 C 2235.3087,598.08327 2234.8718,598.55256 2234.6448,598.55256 C 2234.4178,598.55256 2233.9796,597.97835 2233.671,597.27652 L 2233.1098,596.00048 L 2228.0083,596.3698 L 2223.4713,600.62774 L 2218.9343,599.09287 L 2217.2114,597.54744 L 2213.8301,597.73261 L 2211.4955,597.65571 C 2210.2114,597.6134 2208.9274,597.43447 2208.642,597.25809 L 2208.1231,596.93738 L 2207.8414,593.24021 L 2207.2217,592.49364 C 2206.881,592.08299 2206.2505,591.74702 2205.8209,591.74702 L 2205.0396,591.74702 L 2205.0396,587.65417 L 2202.3334,588.33336 L 2201.7045,585.92839 L 2199.9718,586.59335 L 2199.3014,585.5086 L 2201.0697,585.5086 L 2201.0697,582.10583 L 2197.0998,581.49991 L 2197.0998,583.37898 L 2195.312,581.8952 L 2194.9299,582.46721 C 2194.7197,582.78185 2194.0986,583.20498 2193.5496,583.40762 L 2192.5515,583.77591 L 2187.5921,580.28013 L 2183.0177,579.69208 L 2181.666,581.5387 L 2180.0859,581.5387 L 2180.0859,582.62657 C 2180.0859,583.22489 2179.9311,584.11812 2179.7417,584.61152 L 2179.3974,585.5086 L 2175.0628,585.5086 L 2173.3614,587.20999 L 2172.2596,588.79795 L 2173.5832,589.4785 L 2171.0119,590.30101 L 2172.6247,592.03058 L 2171.1221,594.08166 L 2161.4906,594.64919 L 2157.5163,592.51905 L 2155.299,592.41549 L 2154.0292,594.2991 L 2152.4917,597.41831 C 2151.646,599.13387 2150.7801,600.66512 2150.5676,600.82108 C 2149.901,601.71777 2149.7381,602.84204 2148.9974,603.65321 L 2145.2956,601.9212 L 2142.6554,603.62111 L 2142.6554,605.6453 L 2136.9285,612.86752 L 2136.2753,616.13355 L 2134.0424,616.13355 L 2133.4491,618.40207 L 2132.9596,618.40207 C 2132.6904,618.40207 2131.9582,619.4056 2131.3325,620.63213 C 2130.7068,621.8586 2129.9884,622.98974 2129.7361,623.14565 z "},"md7":{"name":"MD-7","path":"M 2251.5665,601.31601 L 2250.9623,600.3384 L 2247.3297,600.79817 L 2245.4515,598.80686 C 2244.4185,597.71168 2242.7509,596.31416 2241.7456,595.70127 L 2239.918,594.58692 L 2237.8724,594.58266 L 2235.9178,593.02306 C 2234.8428,592.16528 2233.9632,591.27205 2233.9632,591.03811 C 2233.9632,590.80417 2234.3147,590.61276 2234.7444,590.61276 L 2235.7736,590.63528 L 2236.4644,588.93389 L 2241.836,588.91138 L 2242.537,587.77712 L 2246.963,587.77712 C 2247.7958,586.66101 2248.178,585.92811 2249.3264,585.24024 L 2250.367,586.92393 C 2252.744,585.86408 2253.1827,584.80429 2254.3876,584.75869 L 2258.0661,584.51409 L 2259.6395,585.77657 L 2260.6619,584.71122 C 2260.4489,583.56284 2261.5478,583.24009 2261.8217,583.24009 L 2262.3196,583.24009 L 2262.3196,586.64286 L 2260.8407,586.64286 C 2258.9786,588.70074 2257.2744,589.54163 2257.2154,591.86997 L 2254.4569,591.17762 L 2253.7156,593.5134 L 2250.977,594.55459 L 2250.977,596.24412 L 2249.8428,596.85118 C 2249.2189,597.18505 2248.7085,597.70442 2248.7085,598.0054 L 2248.7085,598.55256 L 2252.8727,598.55256 L 2254.9539,596.66907 L 2255.611,597.3262 L 2253.7974,601.14797 L 2251.5665,601.31601 z "},"pa7":{"name":"PA-7","path":"M 2299.689,542.31124 L 2299.3489,537.79198 L 2297.3731,536.83634 L 2298.1424,534.41257 L 2296.6769,532.64672 L 2300.6008,529.39336 L 2302.6214,529.36285 L 2303.2742,527.66146 L 2304.0308,527.66146 C 2304.4469,527.66146 2304.955,527.39017 2305.1599,527.0586 L 2305.5325,526.45573 L 2303.5773,524.29519 L 2301.4991,525.40737 L 2300.2773,523.12443 L 2298.7917,523.12443 L 2296.7579,520.87719 L 2298.2114,519.12591 L 2300.2046,520.92981 L 2300.9487,519.72581 L 2304.5707,521.56663 L 2308.257,525.53551 L 2308.257,527.53945 L 2313.9283,531.86443 L 2313.9283,534.83518 L 2307.1635,538.9658 C 2307.742,539.70579 2308.3602,540.50087 2308.7518,541.29881 C 2305.3673,540.71335 2302.4583,540.96692 2299.689,542.31124 z "},"pa6":{"name":"PA-6","path":"M 2280.1927,540.70542 C 2280.0321,540.70542 2279.9006,540.16081 2279.9006,539.49518 C 2279.9006,538.82954 2280.1808,537.34983 2280.5232,536.20692 L 2281.1458,534.12891 L 2279.4996,530.18921 L 2282.8216,527.6995 L 2270.8265,521.75684 L 2270.8265,521.23817 C 2270.8265,520.95291 2271.5284,519.62576 2272.3861,518.28897 L 2273.9457,515.85843 L 2276.9564,514.05037 L 2280.1842,514.05736 L 2283.433,515.75176 L 2286.1932,515.75176 C 2287.2754,514.60785 2288.4182,513.5105 2288.9747,512.01953 L 2287.8685,508.37908 L 2285.5719,508.37908 L 2284.9894,505.76571 L 2283.3266,504.94886 L 2280.7513,505.55473 L 2279.1419,504.50739 L 2281.1314,499.29778 L 2282.0915,499.89113 L 2283.8444,497.3885 L 2284.5295,498.07362 L 2283.2817,500.40518 L 2290.1909,503.83583 L 2289.8391,506.52001 L 2291.4087,508.41117 C 2290.5934,511.31262 2289.6615,514.18527 2288.9747,517.12062 L 2293.4394,519.16825 L 2295.3005,516.01769 L 2304.0036,516.44105 L 2307.6784,517.95758 L 2307.0407,519.61929 L 2308.8533,523.12443 L 2309.882,523.12443 L 2310.6268,525.4712 L 2313.894,527.45809 L 2312.1689,529.92102 L 2308.8242,527.44815 L 2308.8242,525.34912 L 2304.5707,520.99039 L 2300.9487,519.15869 L 2300.2046,520.36268 L 2298.2328,518.57822 L 2295.8367,520.81379 L 2298.4568,523.63755 L 2300.0444,523.69156 L 2301.3693,526.14816 L 2303.5462,524.8789 L 2305.0163,526.66224 C 2304.4913,527.13034 2303.9123,527.27437 2303.1173,527.09433 L 2302.4644,528.79572 L 2300.6008,528.81259 L 2296.0927,532.62614 L 2297.4962,534.31724 L 2296.1525,540.13829 L 2294.7023,540.13829 L 2293.6207,538.20553 L 2286.4226,537.44669 C 2284.3511,538.53944 2282.3524,539.79348 2280.1927,540.70542 z "},"il6":{"name":"IL-6","path":"M 1700.863,532.10302 L 1698.732,529.07928 L 1697.9251,523.97512 L 1695.2951,519.9035 L 1695.674,519.29041 C 1695.8825,518.95322 1696.7522,518.50183 1697.6069,518.28732 L 1699.1608,517.89731 L 1699.2372,521.54704 L 1704.1907,521.30762 L 1707.2549,516.88601 L 1708.7664,516.88601 L 1708.1529,518.48493 L 1710.3906,519.19518 L 1711.1052,522.04234 L 1710.2983,523.3479 L 1710.5875,528.08928 L 1710.0188,528.79572 C 1709.7061,528.79572 1709.0042,529.2417 1708.4591,529.78679 L 1707.468,530.77787 C 1705.2472,531.48688 1703.122,531.9477 1700.863,532.10302 z "},"il7":{"name":"IL-7","path":"M 1723.6891,523.56613 L 1720.3572,526.01187 L 1717.4153,525.07256 L 1714.1011,526.70306 L 1711.2477,526.66761 L 1711.2477,527.46514 C 1711.2477,527.87063 1711.3697,528.3137 1711.744,528.68801 L 1712.4352,529.11335 L 1714.4378,529.36147 L 1715.3772,526.66761 L 1717.3089,527.9791 L 1717.7697,527.57147 L 1725.0361,529.41464 L 1725.2487,529.7691 L 1724.4335,531.48821 L 1725.2487,531.87811 L 1725.8513,529.32603 L 1725.1069,528.19177 C 1725.0848,527.80366 1725.042,527.37806 1724.9652,526.9689 C 1724.7652,525.90305 1724.3833,524.69905 1724.1322,524.29276 L 1723.6891,523.56613 z "},"mi6":{"name":"MI-6","path":"M 1810.2117,457.26524 L 1803.4593,458.57672 L 1804.186,463.46821 L 1801.8643,464.19484 L 1801.1199,469.17494 L 1781.9616,472.08147 L 1781.9439,480.87197 L 1781.0932,485.69256 C 1780.6272,488.34389 1779.8266,491.78919 1779.3209,493.3488 C 1778.8152,494.9084 1777.4347,498.09849 1776.2549,500.43791 L 1774.1104,504.69137 L 1772.6926,510.36266 C 1771.9133,513.48187 1771.0208,516.69407 1770.7077,517.50494 C 1770.3944,518.31583 1768.7919,520.61271 1767.1454,522.6091 C 1765.4988,524.6055 1763.8938,526.43844 1763.5654,526.66761 C 1763.2369,526.89678 1763.1164,527.08818 1763.2995,527.09296 C 1786.0148,523.75802 1808.7369,520.45175 1831.4259,516.93781 L 1827.7572,493.15385 L 1834.1729,491.38157 L 1831.8689,486.89771 L 1826.4812,486.54326 L 1824.7976,477.20537 L 1813.9158,478.69207 C 1812.6493,471.5604 1811.8479,464.31942 1810.2117,457.26524 z "},"mi7":{"name":"MI-7","path":"M 1852.64,450.69009 L 1832.1348,454.03969 L 1835.9097,475.36019 L 1825.4356,477.06157 L 1826.9774,486.25969 L 1832.2057,486.25969 L 1834.7755,491.54108 L 1828.1649,493.38425 L 1831.9576,516.83147 L 1854.5541,513.48187 L 1855.2984,517.11504 L 1900.8991,507.59791 L 1897.0887,486.4192 L 1897.0887,478.46167 L 1894.0936,471.92197 C 1895.2549,470.91291 1896.5006,470.10391 1897.9394,469.56484 L 1904.4968,468.60781 C 1904.0999,465.21591 1904.0667,465.0987 1902.76,463.34415 C 1887.4013,466.59919 1871.9813,469.67263 1856.4327,471.8688 C 1854.9169,464.86051 1854.1992,457.68853 1852.64,450.69009 z "},"nj6":{"name":"NJ-6","path":"M 2340.672,480.5884 C 2340.413,480.5884 2339.4159,481.7093 2338.4389,483.06959 L 2336.6489,485.53306 L 2339.4846,488.19147 L 2338.7934,491.3993 L 2343.9684,488.88266 L 2346.8395,491.57652 L 2348.0978,490.31821 L 2349.4448,490.9385 C 2350.1863,491.27637 2350.7917,491.74779 2350.7917,491.98415 C 2350.7917,492.22049 2350.6356,492.83151 2350.4372,493.3488 L 2350.0651,494.28811 L 2347.6016,495.22741 L 2348.0978,499.51633 L 2348.7358,498.64791 C 2349.0862,498.16877 2349.9486,497.59445 2350.6499,497.37187 L 2351.9259,496.96425 L 2351.2702,494.30583 L 2353.2374,491.31068 L 2354.8148,490.47771 C 2355.6888,490.02577 2356.7794,489.66245 2357.2428,489.66246 L 2358.0935,489.66246 L 2360.6278,494.18177 L 2361.6735,492.46266 C 2362.1822,491.62603 2362.8926,490.80245 2363.3572,490.51316 L 2364.6154,492.79939 L 2364.5091,494.19949 L 2364.4914,494.19949 L 2363.7471,497.60227 L 2362.1343,497.60227 L 2362.1343,498.31118 C 2362.13,498.70108 2361.9765,499.55847 2361.7976,500.22524 L 2361.4608,501.44811 C 2362.6692,501.88231 2363.8658,502.35623 2365.1117,502.67098 L 2365.537,502.70642 L 2365.537,498.45296 L 2365.537,494.19949 L 2364.3319,490.14098 L 2363.7116,488.52821 L 2361.6558,488.45732 C 2360.5195,488.42041 2358.8166,488.22568 2357.8808,488.01425 L 2356.1794,487.62435 L 2352.4931,489.64474 L 2352.4931,488.52821 L 2349.7283,488.52821 L 2349.0194,487.37623 L 2347.7611,488.15603 L 2344.0925,483.79623 L 2342.5861,484.7887 L 2341.0619,485.51099 L 2339.4491,485.30637 L 2339.4491,482.82147 L 2341.1505,482.16573 L 2341.1505,480.5884 L 2340.672,480.5884 z "},"nj7":{"name":"NJ-7","path":"M 2330.4572,498.75409 L 2326.78,493.63374 L 2324.8267,493.63374 L 2324.115,496.46938 L 2322.4868,496.46938 L 2321.0432,495.02578 C 2320.2492,494.2318 2319.5996,493.32959 2319.5996,493.02088 C 2319.5996,492.71216 2320.0192,491.81913 2320.5321,491.03637 L 2321.4647,489.61316 L 2318.2739,486.28272 L 2317.3122,488.39862 C 2316.7833,489.56237 2315.6772,491.2303 2314.8542,492.10513 L 2313.3579,493.69574 L 2310.8403,491.93235 L 2307.9168,491.93235 L 2306.5556,493.29346 L 2306.5556,490.98074 L 2308.1152,488.85696 C 2308.973,487.68888 2310.8574,485.38105 2312.3026,483.72845 L 2314.9304,480.72371 L 2316.3019,477.08611 L 2317.9955,477.97378 L 2324.8484,478.7818 L 2330.9677,474.86732 L 2331.5221,475.20994 C 2331.827,475.39838 2332.0764,475.89963 2332.0764,476.32382 C 2332.0764,476.74802 2331.7303,477.81759 2331.3071,478.70065 C 2330.884,479.58371 2330.1184,481.15632 2329.6057,482.19534 C 2329.0931,483.23436 2328.6737,484.52316 2328.6737,485.05934 L 2328.6737,486.03421 L 2330.0348,487.39532 L 2333.1438,487.39532 L 2333.7653,486.38958 L 2332.2453,485.12805 L 2333.4882,481.15691 L 2334.0941,481.15691 C 2334.4272,481.15691 2335.3364,480.45508 2336.1143,479.5973 C 2336.8923,478.73952 2338.206,476.97388 2339.0336,475.67365 L 2340.5382,473.3096 L 2345.9711,475.41266 C 2345.7142,476.38957 2345.4619,477.12069 2344.9469,478.00596 L 2345.0023,479.9045 L 2346.0402,481.46039 L 2347.4407,481.72142 L 2347.3889,483.95908 L 2347.3889,485.627 L 2346.3363,486.27753 L 2344.9192,484.09733 L 2343.8263,483.39969 L 2342.5084,484.26325 C 2341.7835,484.7382 2340.9262,485.12681 2340.6033,485.12681 L 2340.0162,485.12681 L 2340.0162,482.97965 L 2341.7176,482.32676 L 2341.7176,480.02265 L 2340.1509,480.02265 L 2338.7027,481.92138 C 2337.9061,482.96568 2336.6313,484.94354 2335.8698,486.31663 L 2334.4853,488.81314 L 2335.7388,490.76924 L 2334.9657,492.62683 C 2334.5404,493.64851 2334.1981,495.0309 2334.2049,495.6988 L 2334.2173,496.91317 L 2330.4572,498.75409 z "},"wi6":{"name":"WI-6","path":"M 1707.6323,373.96821 L 1693.33,375.6696 L 1694.2339,381.23455 C 1664.2654,384.91852 1636.0878,387.98905 1604.8689,390.93078 L 1605.2833,395.07603 C 1602.7206,397.39212 1601.8358,399.01229 1600.3032,401.75752 L 1602.873,406.29455 C 1603.8537,407.31221 1604.5098,408.56099 1605.1238,409.85682 L 1603.8832,412.58613 L 1604.6807,414.12801 C 1606.3877,416.85607 1608.9285,418.88752 1611.2559,421.05761 L 1611.2736,422.81217 L 1614.6409,427.40237 C 1626.7106,426.03052 1635.6584,424.82745 1649.0586,424.44266 L 1651.841,451.20405 L 1659.6568,450.15841 L 1660.0289,452.7991 L 1663.095,453.06494 L 1662.5988,455.26256 L 1667.8624,454.44732 L 1669.0321,455.7588 L 1670.8044,455.63474 L 1673.197,453.24217 L 1672.5058,448.95326 L 1677.9998,448.01395 L 1676.1921,426.48078 L 1702.8471,423.13118 L 1705.6119,415.65217 L 1705.3815,408.89979 L 1703.7333,406.40088 L 1703.0421,399.20544 L 1703.9814,395.23554 C 1704.4985,393.05209 1704.8883,390.45217 1704.8675,389.45791 L 1704.8321,387.65019 L 1709.8654,383.53851 L 1710.592,380.22435 L 1709.121,377.08742 L 1707.6323,373.96821 z "},"mn7":{"name":"MN-7","path":"M 1314.9361,414.4799 L 1312.2958,346.11956 L 1310.651,342.18309 L 1304.7228,339.43169 L 1301.4256,339.09117 L 1299.3879,335.29237 C 1298.2671,333.20304 1296.6435,330.62057 1295.7799,329.55354 L 1294.2095,327.6135 L 1294.903,325.80651 L 1302.706,319.42263 L 1306.1441,312.87913 L 1305.6581,294.85513 L 1304.0272,286.16365 L 1303.8721,282.79645 L 1299.8935,277.8722 L 1297.6976,273.30424 L 1296.9069,267.71078 L 1294.6582,263.89958 L 1295.2124,258.13213 L 1294.2372,253.79161 L 1295.791,246.37882 L 1294.4439,244.92518 C 1293.7029,244.12568 1293.0741,243.16568 1293.0466,242.79185 C 1293.019,242.41802 1292.9043,240.83612 1292.7916,239.27652 C 1292.6789,237.71691 1292.4187,234.39921 1292.2134,231.90384 C 1292.008,229.40848 1291.7434,226.21838 1291.6254,224.81473 C 1291.5073,223.41109 1291.247,220.98661 1291.0468,219.42701 C 1290.8466,217.86741 1290.5709,213.78977 1290.4342,210.36559 L 1290.1855,204.13982 L 1289.7027,203.55799 C 1289.4371,203.23798 1288.5255,200.93542 1287.6771,198.44119 C 1286.8286,195.94696 1285.7868,193.50331 1285.362,193.01087 C 1284.9373,192.51843 1284.5897,191.84578 1284.5897,191.5161 C 1284.5897,191.18641 1284.2085,190.18567 1283.7425,189.29224 C 1283.2765,188.3988 1282.8937,187.21221 1282.8919,186.65538 C 1282.8899,186.09854 1282.53,185.07771 1282.0921,184.38686 L 1281.296,183.13077 L 1280.4957,178.16541 L 1276.9859,171.308 L 1277.1906,167.86176 C 1277.3031,165.96633 1277.3803,163.77751 1277.3621,162.99771 C 1277.3438,162.2179 1277.0313,158.38978 1276.6676,154.49077 C 1276.3039,150.59177 1276.0126,146.70832 1276.0202,145.86091 L 1276.0342,144.32015 L 1277.7842,140.93601 L 1277.7842,137.72929 L 1277.0262,136.61063 C 1276.6093,135.99536 1275.8436,134.16797 1275.3248,132.54976 C 1274.8059,130.93155 1274.3821,129.27269 1274.3831,128.86342 C 1274.384,128.45415 1273.7134,126.53782 1272.893,124.60491 L 1271.3736,119.72216 C 1301.5675,118.83508 1331.1935,117.84476 1357.8516,116.31482 L 1356.4877,93.774231 L 1361.2193,94.530844 L 1363.896,93.09831 L 1365.5413,94.269862 C 1366.4462,94.914211 1367.5415,95.520511 1367.9753,95.617184 L 1368.7639,95.792954 C 1369.9771,100.14048 1370.8236,104.62393 1372.536,108.80856 L 1373.0618,109.34733 L 1373.0618,115.35889 L 1374.65,115.35889 L 1376.0214,121.07536 L 1376.2522,128.35954 L 1377.6932,129.69501 C 1378.4858,130.42952 1380.001,131.43369 1381.0604,131.9265 C 1382.1198,132.41931 1384.0512,132.99558 1385.3524,133.20711 L 1387.7183,133.5917 L 1391.6171,190.10063 L 1375.8974,190.91454 L 1375.8974,202.12959 L 1370.2262,202.12959 L 1370.2262,205.43985 L 1374.0464,207.80087 L 1377.0317,207.80087 L 1377.0317,212.16979 C 1371.7998,212.51501 1366.5742,212.86277 1360.585,212.90503 L 1360.585,219.14345 L 1361.894,219.14345 L 1365.2252,277.83853 L 1383.103,276.90008 L 1383.4811,277.95009 L 1386.5408,278.12483 L 1389.108,312.86927 L 1383.1426,313.28681 L 1383.9631,329.44998 L 1387.7976,332.87691 L 1385.1272,336.7215 L 1385.6928,341.70256 L 1401.9854,340.48738 L 1401.9854,343.34463 L 1407.5279,343.34463 L 1408.9225,361.82298 L 1419.5664,361.35746 L 1420.871,377.37235 L 1426.3719,377.37235 L 1426.3719,379.64087 L 1431.4761,379.64087 L 1431.4761,381.37033 C 1429.7495,381.68854 1428.0061,382.59512 1426.2122,385.27171 L 1426.9057,390.33177 L 1424.8211,392.90612 L 1387.7598,395.08628 L 1385.5809,393.11439 L 1383.6774,393.84481 L 1384.4653,406.29592 C 1380.3595,406.23286 1376.7763,406.48333 1373.6289,406.99533 L 1373.6289,411.88559 L 1314.9361,414.4799 z "},"ma6":{"name":"MA-6","path":"M 2454.578,299.65168 L 2454.3572,300.62354 L 2450.9625,302.64682 L 2454.1895,304.8743 L 2453.3374,310.37395 L 2450.041,311.10059 L 2450.041,312.85514 L 2454.0109,318.26059 L 2452.3272,319.66069 L 2450.6081,318.98722 L 2450.6449,320.87278 L 2449.8938,321.28309 L 2449.437,322.22625 L 2450.1473,324.55217 L 2445.5926,326.87385 L 2446.1951,329.16009 L 2446.9122,329.34406 C 2447.1767,329.34406 2447.4251,328.69714 2447.737,328.11445 L 2448.3041,327.05108 L 2451.1752,327.60049 L 2451.5297,325.81049 C 2451.7254,324.83177 2452.1036,323.91475 2452.3627,323.75465 L 2452.8235,323.45336 C 2455.4118,324.75903 2457.9707,326.1206 2460.5328,327.47643 C 2460.9012,326.67594 2461.2914,325.77362 2461.5076,325.33197 L 2462.1456,324.05593 L 2463.5812,324.05593 L 2464.2901,321.78742 L 2464.8218,321.78742 C 2465.1126,321.78742 2465.3535,321.5322 2465.3534,321.22029 L 2465.3534,320.65316 L 2463.7761,320.65316 L 2463.0849,318.86316 L 2463.4039,318.33148 C 2463.5793,318.0477 2464.0616,317.81751 2464.485,317.81752 C 2464.9085,317.81752 2465.3381,317.62114 2465.4421,317.37445 C 2465.546,317.12776 2466.8691,316.10693 2468.3663,315.10593 C 2469.8636,314.10494 2471.3311,313.28048 2471.6273,313.28049 L 2472.159,313.28049 L 2472.159,310.51573 L 2472.7261,310.16128 C 2473.038,309.9685 2473.2933,309.56933 2473.2932,309.25742 L 2473.2932,308.69029 L 2472.2831,309.31059 L 2470.9007,307.62692 L 2469.8905,308.24722 L 2469.8905,310.44484 L 2467.1257,310.44484 L 2466.4168,309.31059 L 2464.2192,309.31059 L 2464.2192,308.69029 C 2464.2192,308.34854 2463.6783,307.31911 2463.014,306.38633 C 2462.3499,305.45356 2461.2526,303.62664 2460.586,302.32781 L 2459.3809,299.95296 L 2454.578,299.65168 z "},"ma7":{"name":"MA-7","path":"M 2452.6462,324.05593 L 2451.6715,328.14989 L 2448.4105,327.67138 L 2445.3976,333.21861 L 2447.1876,334.54781 L 2447.8079,337.95059 L 2446.592,339.21058 L 2444.4583,338.25187 L 2440.9669,338.94306 C 2440.9705,340.18998 2441.3501,341.202 2442.2463,342.68382 L 2444.7015,343.12228 L 2444.7584,342.52715 L 2449.7866,342.53331 L 2450.1119,342.20405 L 2449.2257,341.31791 C 2448.7355,340.82775 2448.3396,340.06214 2448.3396,339.61653 L 2448.3396,338.80128 L 2449.4738,337.66702 C 2450.0977,337.04318 2450.6081,336.36996 2450.6081,336.16059 C 2450.6081,335.95121 2451.0312,335.31318 2451.5474,334.74276 L 2452.4867,333.69712 L 2454.3654,333.65745 C 2455.1419,332.21318 2455.2373,331.47362 2455.5675,330.17029 L 2458.8125,331.00032 C 2459.3643,329.93205 2459.8918,328.85339 2460.3911,327.75999 C 2457.7767,326.59341 2455.2549,325.23352 2452.6462,324.05593 z "},"wa6":{"name":"WA-6","path":"M 136.63263,25.095445 L 136.04778,25.680296 L 138.06818,29.100791 C 137.2441,30.644068 136.71575,32.458829 135.44521,33.690989 L 135.01986,33.690989 L 135.01986,35.959504 L 132.91085,38.068514 L 132.91085,40.850989 C 132.91442,42.376954 132.73325,45.146987 132.50323,47.018514 C 132.27326,48.890038 132.08866,50.548888 132.07788,50.70485 C 132.06711,50.860811 132.0764,51.945443 132.11333,53.115147 L 132.18422,55.24188 L 133.44253,56.500197 C 134.1363,57.193994 134.76247,58.113031 134.82491,58.538316 C 134.88729,58.9636 135.34364,59.749804 135.83511,60.29287 L 136.72125,61.285345 L 136.72125,63.784256 L 138.42263,66.389503 L 138.22768,72.574751 C 138.11675,75.983183 137.80066,80.436567 137.53649,82.464058 C 137.27233,84.491543 137.05429,87.583455 137.05798,89.340493 L 137.0757,92.548315 L 139.14927,95.702968 L 138.4758,108.83554 C 137.81891,111.4428 137.21122,114.06331 136.41996,116.63356 L 136.03006,117.64376 L 137.8555,116.93485 L 137.60739,116.54495 L 138.56441,111.38762 L 141.13422,111.38762 L 143.63313,113.40802 L 143.81036,116.49178 L 145.79531,116.49178 L 145.79531,117.62604 L 148.02838,117.62604 C 148.50548,118.46365 148.95075,119.29636 149.0563,120.23128 C 148.92614,120.36143 147.50474,120.54342 145.90164,120.63891 C 144.29854,120.7344 142.80305,120.99051 142.58748,121.20604 C 142.37198,121.42157 141.76131,121.59593 141.22283,121.59594 L 140.24808,121.59594 L 139.91135,122.44663 C 139.73179,122.91451 139.32922,123.29732 139.00748,123.29732 L 138.42263,123.29732 L 138.42263,120.53257 L 137.28838,119.82366 L 137.28838,126.55831 L 175.00243,136.16406 C 176.12429,135.14186 176.673,131.46173 178.2457,124.98099 L 176.91649,123.38594 L 177.6963,119.23881 L 179.36224,118.60079 L 183.15491,119.77049 L 183.75748,118.19317 L 186.62857,118.19317 L 186.62857,117.07663 L 191.38544,115.09794 L 191.66931,117.15952 L 192.60115,117.64376 L 195.31273,115.7297 L 196.30521,116.97029 C 196.85231,117.64596 197.58799,118.19316 197.9357,118.19317 L 198.57372,118.19317 L 199.24719,114.84356 L 201.87016,113.12445 L 203.32342,114.84356 C 204.125,115.79618 204.77669,116.77356 204.77669,117.00574 C 204.77669,117.23793 205.91263,118.61233 207.31105,120.07178 L 209.86313,122.7302 L 211.93669,122.7302 L 213.86847,118.6894 L 209.17194,112.23831 L 206.97431,111.40534 L 208.00224,109.98752 C 208.56539,109.21387 209.22156,108.57951 209.4555,108.5697 C 209.68944,108.5599 209.88085,108.21691 209.88085,107.80762 C 209.88085,107.39833 210.37448,106.04735 210.97966,104.79475 C 211.58484,103.54215 212.54188,102.14919 213.10639,101.71099 L 213.97481,101.03752 L 211.44045,98.839899 L 212.75194,95.951087 L 210.67837,92.38881 L 208.09085,92.016632 L 206.76164,93.806632 L 202.40184,92.441978 L 201.46253,93.629404 C 200.94684,94.278335 199.96058,95.090503 199.28263,95.437127 L 198.05976,96.075146 L 190.75798,94.409206 L 194.44431,91.343166 C 195.89452,90.14475 198.04073,88.679573 199.21174,88.082176 L 201.33847,87.001087 L 204.97164,87.284651 L 207.15154,80.284157 L 210.44798,78.919503 L 210.44798,76.668711 L 213.2659,77.377622 L 212.91144,75.534454 C 212.71856,74.516514 212.32619,73.379949 212.04303,73.01782 L 211.52907,72.362078 L 212.71649,71.617721 L 210.96194,69.845444 L 211.35184,68.002276 L 213.56719,68.214949 L 213.67352,63.128513 C 213.07832,63.397627 212.45683,63.580748 211.83035,63.74881 L 212.27342,65.450197 C 211.59953,65.796202 210.9106,65.912015 210.19986,65.946434 L 209.24283,62.153761 L 211.58224,61.409405 L 211.58224,59.77891 C 209.59382,59.632987 208.03456,60.08787 206.38946,61.143563 L 207.09837,64.883068 L 205.41471,64.883068 L 203.73105,62.490494 L 204.33362,60.913167 L 199.69026,60.913167 L 198.98134,58.077523 L 197.97115,58.077523 L 197.97115,57.421781 C 197.97115,57.058047 197.52277,56.325554 196.97867,55.809009 L 195.9862,54.869702 L 192.37075,57.014157 L 185.31709,55.631781 L 183.2258,53.540494 L 180.92184,53.540494 L 180.30154,51.927722 L 176.8456,52.016335 L 175.00243,49.730098 L 171.3161,49.056633 C 169.28861,48.691333 167.11935,48.172499 166.4955,47.904652 C 165.87166,47.636805 164.42463,47.011755 163.26996,46.504553 C 162.11523,45.997351 160.3757,44.912697 159.42412,44.111979 L 157.70501,42.658712 L 158.27214,41.719405 L 153.50471,37.625445 L 152.016,38.192573 L 149.00313,34.825247 L 148.25877,34.825247 C 147.84244,34.825247 147.49669,34.626158 147.49669,34.382177 C 145.63156,31.413 143.60901,29.175589 140.70887,27.027227 L 136.63263,25.095445 z "},"wa7":{"name":"WA-7","path":"M 224.64392,87.001087 C 222.50093,88.550573 220.34453,90.434796 218.95491,92.70782 C 218.95491,93.030136 219.64916,93.892767 220.49679,94.621879 L 222.03867,95.951087 L 220.49679,97.811978 L 218.38778,97.138513 L 218.38778,102.06544 L 220.21323,104.65297 L 224.05907,104.01495 L 224.05907,95.862473 L 226.9656,92.814156 L 225.06926,87.001087 L 224.64392,87.001087 z M 214.24065,101.23247 L 213.23045,102.04772 C 211.50106,104.18295 211.07847,105.51629 210.44798,107.02782 L 210.44798,108.92416 C 210.44798,109.96796 210.5939,110.82049 210.76699,110.82049 L 216.40283,108.3393 L 214.48877,107.91396 L 214.70144,101.65782 L 214.24065,101.23247 z "},"tx27":{"name":"TX-27","path":"M 1301.7808,1417.9635 L 1300.4516,1421.1714 L 1297.5425,1422.5572 L 1295.8969,1425.4248 L 1298.5907,1425.4248 L 1300.558,1427.587 L 1298.8211,1430.9189 L 1299.4414,1433.2583 L 1295.7905,1434.0558 L 1294.9213,1432.822 L 1293.7634,1434.9698 L 1289.1529,1434.1909 L 1288.0634,1431.9468 L 1287.9925,1433.9318 L 1285.3814,1433.9318 C 1285.837,1432.35 1284.7546,1431.4824 1283.3753,1430.4278 C 1282.9854,1430.4899 1281.7084,1430.8756 1280.6198,1430.3872 L 1278.6526,1429.5011 L 1277.5994,1430.3408 L 1277.3394,1428.1989 L 1275.7461,1428.2605 L 1270.9786,1433.1342 L 1270.9786,1448.6771 L 1264.4567,1448.6771 L 1264.7934,1471.2914 L 1268.9937,1471.6458 L 1269.8444,1511.0613 L 1271.6699,1511.0613 C 1270.7066,1516.7477 1269.4474,1514.9845 1269.138,1521.1278 C 1272.0674,1521.8899 1274.5974,1521.8535 1277.2171,1521.9962 L 1277.2171,1527.313 L 1281.7718,1530.9817 C 1283.7943,1531.618 1285.9361,1532.0329 1287.7267,1533.197 L 1288.0634,1533.7464 L 1291.2712,1533.7464 L 1292.0333,1535.7314 L 1288.6128,1538.7797 L 1284.3948,1539.9494 L 1277.8019,1539.2582 L 1276.0828,1540.6938 L 1276.0828,1544.3978 L 1277.8728,1545.089 L 1280.5135,1544.4332 L 1283.1719,1546.1169 L 1290.261,1546.8967 L 1290.2788,1547.2689 C 1290.286,1547.4722 1291.1567,1548.5981 1292.2105,1549.7678 L 1294.1246,1551.8945 L 1295.6842,1551.8945 L 1297.7046,1555.2973 L 1300.3984,1554.6239 L 1301.8695,1556.9987 L 1305.1481,1556.9987 L 1304.4924,1552.9756 L 1305.4672,1552.6566 C 1305.9961,1552.488 1307.445,1551.8683 1308.6927,1551.2742 L 1310.9612,1550.1932 L 1317.1819,1549.3247 L 1317.5895,1547.2689 L 1316.4376,1547.8715 C 1315.8064,1548.2093 1314.8798,1548.4918 1314.3817,1548.4918 L 1313.4778,1548.4918 L 1312.7689,1546.6309 L 1314.7716,1545.1599 L 1314.2931,1543.7598 L 1309.2598,1542.5369 L 1309.2421,1541.4027 C 1309.2305,1540.7784 1309.0008,1539.9366 1308.7459,1539.5241 C 1308.4908,1539.1115 1308.1793,1537.9625 1308.037,1536.972 C 1307.8946,1535.9813 1307.7767,1534.37 1307.7711,1533.392 L 1307.7534,1531.6019 L 1305.7153,1532.1336 L 1305.1481,1528.3587 L 1305.6444,1528.1637 C 1305.9177,1528.0597 1306.1406,1527.6131 1306.1406,1527.1713 L 1306.1406,1526.3738 L 1305.5558,1526.3738 C 1305.2341,1526.3738 1304.8315,1526.7565 1304.6519,1527.2244 L 1304.3152,1528.0751 L 1302.6138,1528.0751 L 1303.0037,1526.7991 C 1303.2212,1526.0973 1303.5196,1524.9871 1303.6772,1524.3356 L 1303.9607,1523.1482 L 1301.32,1523.2545 L 1301.6922,1521.6063 L 1300.0263,1520.3835 L 1301.1605,1513.8792 L 1299.7073,1512.1423 L 1299.2819,1509.7498 C 1299.0491,1508.4407 1298.6795,1506.3541 1298.4489,1505.1064 L 1298.0236,1502.8379 L 1294.7449,1498.0173 L 1293.1675,1498.0173 L 1292.4941,1495.9083 L 1293.6106,1492.9841 L 1292.7068,1487.295 L 1293.522,1486.9938 C 1293.9665,1486.8232 1294.967,1486.6747 1295.7551,1486.6747 L 1297.1906,1486.6747 L 1296.8184,1485.186 C 1296.6136,1484.3698 1296.2894,1482.9662 1296.1095,1482.0668 L 1295.7905,1480.4363 C 1296.6148,1480.4838 1297.4385,1480.4195 1298.2363,1480.2945 L 1299.6718,1470.7951 L 1299.1578,1470.7951 C 1298.8738,1470.7951 1297.7037,1471.3178 1296.5526,1471.9648 L 1294.4613,1473.1522 L 1287.7089,1472.213 L 1287.7089,1469.395 L 1288.7014,1469.2001 C 1289.2462,1469.0951 1290.3582,1468.4614 1291.1649,1467.7823 C 1291.9715,1467.1031 1293.2781,1465.9793 1294.0714,1465.2833 L 1295.507,1464.0073 L 1296.0032,1464.3263 C 1296.2759,1464.4948 1296.4994,1465.092 1296.4994,1465.6555 L 1296.4994,1466.6657 L 1295.3297,1468.1722 L 1294.1423,1469.6609 L 1294.6208,1469.6431 C 1294.8774,1469.6362 1295.7196,1469.1365 1296.4994,1468.5266 L 1297.9172,1467.4101 L 1299.8668,1467.3924 L 1300.7529,1465.691 C 1301.239,1464.751 1301.8629,1462.9006 1302.1353,1461.5793 C 1302.4075,1460.2579 1303.0489,1457.6721 1303.5531,1455.8371 C 1304.0572,1454.0022 1304.8012,1451.8329 1305.219,1451.0165 C 1305.6368,1450.2001 1306.2905,1448.6345 1306.6723,1447.5429 C 1307.0543,1446.4511 1307.5005,1445.1799 1307.6471,1444.7072 L 1307.9129,1443.8388 L 1302.7201,1442.3146 L 1300.4693,1439.4435 L 1300.4693,1436.413 L 1301.1782,1435.5091 C 1301.5681,1435.0087 1302.7804,1434.0676 1303.8721,1433.4178 L 1305.8571,1432.2304 L 1308.8345,1432.2304 L 1310.2523,1435.6332 L 1311.8297,1435.6332 L 1314.2931,1430.5645 C 1311.6019,1426.9303 1308.9149,1422.2063 1306.0107,1418.7307 C 1305.0323,1418.7074 1305.1561,1417.4557 1304.1388,1417.226 L 1301.7808,1417.9635 z M 1319.6631,1433.6482 L 1319.096,1435.066 L 1317.1996,1435.066 L 1317.0224,1438.0612 L 1318.3693,1436.4307 C 1319.1077,1435.5276 1319.6943,1434.5272 1319.6808,1434.2153 L 1319.6631,1433.6482 z M 1314.9311,1440.8968 C 1314.6796,1440.9646 1313.9927,1441.6675 1313.2829,1442.5982 L 1311.8119,1444.53 L 1311.8119,1446.9048 L 1309.8801,1448.8366 L 1309.6852,1450.0063 C 1309.5865,1450.6531 1309.0069,1452.0465 1308.3914,1453.0901 C 1307.7756,1454.1337 1307.2749,1455.3188 1307.2749,1455.7308 C 1307.2749,1456.1426 1306.9013,1456.7849 1306.4419,1457.1663 L 1305.6089,1457.8752 L 1305.2368,1459.9311 C 1305.0319,1461.0694 1304.5937,1462.3501 1304.262,1462.7667 L 1303.6594,1463.5288 L 1303.5354,1466.1695 C 1303.4741,1467.6243 1303.1838,1470.0145 1302.8796,1471.4863 L 1302.3302,1474.1625 L 1302.9505,1474.8005 L 1303.9253,1469.9799 C 1304.4619,1467.3295 1305.4732,1463.427 1306.1761,1461.3134 C 1306.8788,1459.1999 1308.7084,1454.6603 1310.2346,1451.2292 C 1311.7608,1447.7981 1313.5144,1444.1297 1314.1336,1443.0767 C 1314.7527,1442.0237 1315.1568,1441.0516 1315.0198,1440.9146 C 1315.0026,1440.8974 1314.967,1440.8871 1314.9311,1440.8968 z M 1302.3302,1476.1829 L 1302.3302,1481.287 L 1302.5784,1480.011 C 1302.7136,1479.3092 1302.7134,1478.1607 1302.5784,1477.4589 L 1302.3302,1476.1829 z M 1302.8265,1490.3611 L 1302.8619,1493.7639 L 1303.1277,1492.7536 C 1303.2715,1492.2018 1303.2653,1491.4362 1303.1101,1491.0522 L 1302.8265,1490.3611 z M 1303.6772,1494.8981 L 1302.9505,1497.7338 L 1303.8721,1498.3718 L 1304.3861,1504.3975 L 1306.1406,1506.3293 L 1306.1406,1507.3041 C 1306.1406,1507.8352 1306.6746,1509.8484 1307.3281,1511.7879 L 1308.5155,1515.3147 L 1309.1535,1515.7046 C 1309.5048,1515.9218 1309.8702,1516.0334 1309.9687,1515.935 L 1309.9687,1515.9173 C 1310.0672,1515.8189 1309.604,1514.3697 1308.9408,1512.6918 C 1308.2776,1511.0136 1307.1282,1507.7294 1306.3887,1505.39 C 1305.6492,1503.0506 1304.7457,1499.7329 1304.3683,1498.0173 L 1303.6772,1494.8981 z M 1310.1105,1516.5376 L 1310.1105,1518.0617 L 1310.8726,1517.2997 L 1310.1105,1516.5376 z M 1310.9612,1518.434 C 1310.8052,1518.434 1310.6776,1518.5615 1310.6776,1518.7175 C 1310.6776,1518.8735 1310.8052,1519.0011 1310.9612,1519.0011 C 1311.1172,1519.0011 1311.2448,1518.8735 1311.2448,1518.7175 C 1311.2448,1518.5615 1311.1172,1518.434 1310.9612,1518.434 z M 1311.5283,1520.1353 C 1311.3724,1520.1353 1311.2448,1520.2629 1311.2448,1520.4189 C 1311.2448,1520.5749 1311.3724,1520.7025 1311.5283,1520.7025 C 1311.6843,1520.7025 1311.8119,1520.5749 1311.8119,1520.4189 C 1311.8119,1520.2629 1311.6843,1520.1353 1311.5283,1520.1353 z M 1311.8119,1521.6417 L 1311.8119,1523.1659 L 1312.574,1522.4039 L 1311.8119,1521.6417 z M 1316.3489,1543.7598 L 1316.4376,1545.9397 L 1317.0401,1544.451 L 1316.3489,1543.7598 z "},"hi1":{"name":"HI-1","path":"M 794.73924,1407.5957 C 794.46946,1407.5303 794.26671,1407.3151 794.05574,1407.1456 C 793.55542,1406.7181 793.16767,1406.1706 792.62396,1405.7922 C 792.30291,1405.5659 791.95027,1405.3273 791.54234,1405.3259 C 791.02432,1405.2114 790.57833,1404.8707 790.2431,1404.4691 C 790.02617,1404.2077 789.80919,1403.9463 789.59221,1403.6849 C 788.89901,1404.1178 788.2058,1404.5508 787.5126,1404.9837 C 786.9867,1404.5473 786.46086,1404.1108 785.93502,1403.6744 C 784.82793,1403.9704 783.72084,1404.2665 782.61374,1404.5626 C 782.12743,1403.6254 781.64118,1402.6882 781.15503,1401.7509 C 781.88986,1400.9608 782.62475,1400.1707 783.35969,1399.3807 C 783.16494,1398.3833 782.97019,1397.3859 782.77549,1396.3885 C 783.17583,1395.6405 783.57616,1394.8925 783.97644,1394.1444 C 785.10514,1393.9578 786.23889,1393.7998 787.3618,1393.5797 C 788.15476,1393.414 788.95748,1393.2588 789.70881,1392.9473 C 789.89409,1392.8761 790.07943,1392.805 790.26471,1392.7339 C 791.0592,1394.5301 791.85375,1396.3263 792.64835,1398.1225 C 793.54787,1398.9672 794.43826,1399.8216 795.34454,1400.6589 C 796.48152,1401.6635 797.68752,1402.596 798.97875,1403.3946 C 799.81334,1403.8882 800.70509,1404.2859 801.6243,1404.5934 C 801.95368,1404.7034 802.29521,1404.7836 802.64439,1404.7773 C 802.86449,1404.8059 803.12169,1404.8234 803.28224,1404.9949 C 803.31542,1405.2233 803.08323,1405.4029 802.96686,1405.5853 C 802.39877,1406.2721 801.76642,1406.9149 801.04339,1407.4392 C 800.90869,1407.5387 800.7537,1407.6269 800.58112,1407.604 C 800.52265,1407.5901 800.34151,1407.6446 800.43259,1407.5473 C 800.63834,1407.2142 800.84415,1406.8812 801.05002,1406.5481 C 800.69092,1406.3261 800.33181,1406.1042 799.97265,1405.8823 C 798.47412,1406.3967 796.98694,1406.9459 795.47106,1407.4081 C 795.22901,1407.4761 794.98861,1407.5595 794.73924,1407.5957 z "},"la1":{"name":"LA-1","path":"M 1682.9504,1280.8084 C 1682.5849,1280.8084 1682.0336,1280.4894 1681.7254,1280.0995 C 1681.4172,1279.7096 1680.9393,1278.6887 1680.6635,1277.831 L 1680.162,1276.2714 L 1679.0277,1275.9878 L 1678.8574,1279.4032 C 1675.9155,1279.4984 1675.0739,1279.6205 1673.3977,1280.3889 L 1673.4584,1279.2278 L 1675.367,1277.8126 L 1673.5929,1275.1051 L 1674.1054,1274.0476 L 1678.7442,1273.336 L 1677.6486,1262.5643 L 1676.2478,1258.6904 L 1672.8705,1258.7173 L 1672.1696,1259.8516 L 1669.9241,1260.04 C 1667.84,1257.8985 1667.1612,1257.6465 1664.6216,1254.6436 C 1664.6198,1254.3288 1663.4884,1252.406 1662.8646,1252.0165 L 1661.7303,1251.3081 L 1661.7303,1250.292 C 1661.7303,1249.7333 1661.5041,1249.0336 1661.2277,1248.7373 L 1660.725,1248.1985 L 1657.8546,1217.5739 L 1700.6655,1212.9343 C 1700.7953,1213.0642 1700.6177,1214.2887 1700.2708,1215.6555 C 1699.9238,1217.0223 1699.4214,1219.5188 1699.1542,1221.2033 L 1698.6684,1224.266 L 1697.5618,1224.9499 L 1696.7608,1234.1321 L 1698.5937,1235.7265 C 1698.5937,1236.2165 1699.1093,1237.6282 1699.7394,1238.8634 L 1700.8852,1241.1094 L 1701.9964,1241.1094 L 1701.9964,1242.5662 L 1703.8396,1243.6492 C 1704.8534,1244.2448 1705.9783,1245.0236 1706.3394,1245.38 C 1706.7006,1245.7364 1707.2642,1246.999 1707.5919,1248.1858 L 1708.1877,1250.3437 L 1710.6335,1252.9472 L 1710.9966,1257.8151 L 1711.6007,1258.0164 C 1711.9329,1258.1272 1712.2048,1258.5226 1712.2048,1258.8952 C 1712.2048,1259.2677 1712.7181,1260.0121 1713.3455,1260.5493 L 1714.4863,1261.526 L 1717.5925,1261.6156 L 1716.7418,1261.9283 C 1716.2739,1262.1004 1715.4688,1262.6082 1714.9527,1263.0568 L 1714.0143,1263.8725 L 1709.3327,1262.4698 L 1708.0893,1263.7133 L 1706.1133,1262.4792 L 1703.5261,1264.8895 L 1702.4289,1264.5211 L 1702.5636,1262.8087 L 1698.365,1262.401 L 1692.8382,1266.1167 C 1690.6432,1265.1305 1689.633,1264.8443 1686.684,1264.612 L 1686.684,1274.57 L 1688.9169,1274.57 L 1688.5397,1275.5624 C 1688.3323,1276.1083 1687.1393,1277.512 1685.8887,1278.6817 C 1684.6382,1279.8514 1683.3159,1280.8084 1682.9504,1280.8084 z "},"al1":{"name":"AL-1","path":"M 1802.3782,1138.3336 L 1787.1898,1140.3718 L 1787.757,1141.8605 L 1792.1699,1141.1516 L 1791.9975,1143.5065 C 1789.8569,1144.0922 1789.48,1144.7125 1787.6506,1145.9899 L 1786.0733,1144.6784 L 1784.7441,1147.8862 L 1785.4438,1150.0199 L 1788.1227,1152.7386 L 1795.0056,1157.3856 L 1795.0056,1160.434 L 1791.656,1161.834 L 1789.3881,1164.9965 L 1785.1871,1159.4946 L 1783.0746,1160.677 L 1782.2791,1159.3331 L 1764.0793,1161.834 L 1777.0524,1241.5688 L 1780.8273,1240.9662 L 1780.8273,1242.1536 L 1784.1061,1240.913 L 1787.9164,1242.0296 L 1787.7747,1243.8728 L 1790.9825,1243.7664 L 1791.2661,1242.2954 C 1791.4218,1241.4847 1791.5201,1237.942 1791.4788,1234.4265 L 1791.4079,1228.0463 L 1792.6839,1226.7703 L 1792.0281,1223.5447 L 1793.8713,1222.8358 L 1793.8713,1222.0915 C 1793.8713,1221.6754 1794.1092,1221.1742 1794.403,1220.9926 L 1794.9347,1220.6736 L 1799.4894,1222.0915 L 1800.0211,1223.2257 C 1800.312,1223.8561 1800.8557,1225.3985 1801.2263,1226.6462 L 1801.8997,1228.9148 L 1800.7655,1231.8744 L 1802.6441,1237.1204 L 1804.3455,1237.8116 C 1805.2865,1238.1943 1806.754,1239.1615 1807.6065,1239.956 C 1808.4587,1240.7506 1809.8026,1241.9632 1810.5839,1242.6499 L 1812.0017,1243.8905 L 1811.3283,1245.6273 L 1809.1306,1246.2299 C 1807.915,1246.5572 1806.9153,1246.9366 1806.9153,1247.0806 C 1806.9153,1247.2245 1807.3669,1247.3464 1807.9255,1247.3464 C 1808.4839,1247.3464 1811.2768,1246.5871 1814.1285,1245.6627 C 1816.9801,1244.7384 1820.4412,1243.4574 1821.8201,1242.8094 L 1824.3368,1241.622 L 1823.8228,1238.9458 L 1825.9673,1238.2724 L 1826.6407,1235.7203 L 1827.3319,1233.1682 L 1828.1117,1233.1682 C 1828.5426,1233.1682 1829.1921,1232.8163 1829.5473,1232.3884 L 1830.1853,1231.6086 L 1826.9597,1230.9706 L 1825.1875,1226.4513 L 1825.985,1224.9094 C 1826.422,1224.067 1826.9067,1222.6409 1827.0661,1221.737 L 1827.3496,1220.0888 L 1826.1622,1217.8734 L 1820.9871,1215.9239 L 1812.1435,1207.3284 L 1814.1993,1201.8521 L 1813.8271,1198.3252 L 1860.8634,1191.9627 L 1859.3747,1181.2759 L 1855.7592,1181.7013 L 1855.0149,1177.306 L 1819.3921,1181.9671 L 1823.5215,1177.5364 C 1823.5215,1177.1792 1824.4778,1174.9844 1825.152,1173.7969 C 1825.8262,1172.6093 1827.323,1170.6139 1828.4839,1169.3662 C 1829.6449,1168.1186 1830.9202,1166.4941 1831.3018,1165.7508 C 1831.6834,1165.0073 1832.0963,1163.3484 1832.2234,1162.0645 C 1832.3505,1160.7803 1832.5181,1158.8842 1832.5956,1157.8464 L 1832.7374,1155.9501 L 1836.1578,1153.593 L 1836.1224,1150.7041 L 1839.0112,1150.3851 L 1843.9204,1147.4254 L 1842.9811,1142.9948 L 1812.5689,1147.1419 L 1811.984,1149.5167 L 1813.1005,1155.0817 L 1810.194,1155.4716 L 1811.4523,1164.3507 L 1808.8825,1166.8142 L 1809.2724,1168.0548 L 1812.1966,1168.3029 L 1812.5334,1169.8093 L 1810.318,1174.3818 L 1807.3406,1172.8576 C 1806.95,1173.9445 1806.0812,1174.5224 1805.2139,1175.2148 C 1804.6237,1176.4154 1804.5937,1177.3403 1805.2139,1179.0251 L 1803.7075,1179.1669 L 1802.3073,1177.6427 L 1802.1301,1179.5391 L 1800.5705,1181.1696 L 1803.4948,1184.3243 L 1800.3401,1183.3849 L 1798.5324,1186.5573 L 1799.9602,1187.9851 L 1793.2765,1189.6999 L 1794.1549,1186.3801 L 1791.0357,1186.0256 C 1790.651,1184.5327 1791.3766,1184.9909 1792.9329,1184.5051 C 1793.0221,1184.0605 1792.7539,1182.9718 1793.0175,1182.348 L 1795.5195,1178.6884 L 1794.8461,1176.9338 L 1791.9878,1179.2357 L 1793.905,1174.7056 L 1792.7725,1173.3222 L 1794.1095,1168.6219 L 1796.3334,1169.1047 L 1795.679,1167.6649 L 1797.4336,1163.3051 L 1800.2618,1163.9085 L 1800.9535,1162.8443 L 1803.9556,1162.8443 L 1804.6956,1160.7041 L 1799.4111,1159.6727 L 1801.2872,1150.236 L 1803.1183,1150.9977 L 1801.9646,1147.3174 L 1800.9959,1147.3592 L 1800.874,1148.9396 L 1798.3391,1146.9942 L 1798.4083,1144.2176 L 1799.8261,1143.6505 L 1797.1349,1142.5301 L 1798.2397,1140.7288 L 1799.6947,1141.4174 L 1800.5247,1140.1591 L 1802.3782,1140.1591 L 1802.3782,1138.3336 z "},"fl1":{"name":"FL-1","path":"M 1828.7497,1240.2459 C 1828.1259,1240.3436 1827.0055,1240.3003 1826.26,1240.1495 L 1824.9044,1239.8754 L 1827.5931,1238.535 L 1827.8429,1235.2839 L 1831.4986,1232.2321 L 1830.7703,1230.3339 L 1827.9446,1230.3339 L 1826.596,1225.8329 L 1827.1735,1225.106 C 1827.4912,1224.7062 1827.9296,1223.3898 1828.1478,1222.1807 L 1828.5444,1219.9824 L 1827.1932,1216.7202 L 1821.5254,1214.7379 L 1820.317,1213.385 C 1819.6523,1212.6409 1818.5014,1211.4924 1817.7593,1210.8329 C 1817.0172,1210.1734 1815.8129,1209.0791 1815.0831,1208.4011 L 1813.7561,1207.1685 L 1815.4819,1201.3575 L 1814.8441,1199.348 C 1854.0977,1194.0477 1886.9123,1189.6356 1923.7235,1183.8912 L 1922.6944,1185.1482 L 1923.1242,1186.7141 C 1921.0978,1188.9618 1920.4776,1190.9134 1920.3755,1194.5673 L 1926.5847,1193.5778 L 1927.2913,1196.3929 L 1929.8236,1195.7573 L 1931.8065,1208.783 L 1928.9321,1209.0604 L 1929.8869,1216.987 L 1910.9834,1219.7761 L 1909.23,1221.8894 L 1905.3602,1222.4993 L 1903.929,1224.3791 L 1904.6011,1231.3031 L 1892.8353,1228.405 L 1850.1882,1234.0596 L 1837.599,1238.2659 L 1834.9881,1238.1123 L 1832.436,1239.0902 C 1831.0324,1239.628 1829.3736,1240.1481 1828.7497,1240.2459 z "},"tx1":{"name":"TX-1","path":"M 1465.3266,1115.1877 L 1431.2634,1117.4031 L 1430.0582,1115.9321 L 1408.6846,1117.1195 L 1409.4998,1138.8476 L 1406.5986,1139.4168 C 1406.5236,1138.1733 1405.4312,1138.4538 1404.2539,1138.1742 C 1403.1622,1137.9462 1401.9216,1137.4809 1401.5069,1137.1462 L 1400.7625,1136.5437 L 1391.2454,1136.1892 L 1390.2352,1135.1258 C 1389.6771,1134.5443 1388.6657,1133.7786 1387.9844,1133.4245 C 1387.3031,1133.0702 1386.6651,1132.7867 1386.5666,1132.7864 L 1386.7792,1143.8454 L 1394.6127,1151.6435 L 1394.6127,1156.4463 L 1393.3367,1160.0972 L 1394.5596,1161.3023 L 1393.9392,1164.4039 L 1395.0558,1165.1128 L 1419.7081,1163.7835 L 1420.7006,1181.5595 L 1422.9691,1181.5595 L 1422.9691,1184.2534 L 1421.1614,1185.7598 L 1423.5363,1186.6282 L 1423.5363,1187.2308 C 1423.5363,1187.5625 1423.182,1187.9713 1422.7565,1188.1346 L 1421.9944,1188.4359 L 1423.4122,1195.2769 L 1424.6705,1197.5454 L 1426.1238,1198.5734 L 1427.5416,1202.2597 L 1421.0019,1208.1259 L 1422.083,1209.3134 C 1422.6733,1209.9657 1423.437,1211.0594 1423.7844,1211.7591 L 1424.4224,1213.0351 L 1426.8859,1213.3896 L 1427.6302,1218.3874 L 1428.924,1218.7773 L 1430.4304,1225.1752 L 1450.1559,1230.8643 L 1472.3093,1224.4663 L 1472.3093,1223.1371 C 1479.7601,1220.9313 1478.6322,1220.9879 1495.1008,1218.8305 L 1494.3565,1214.3998 L 1493.3994,1214.0453 C 1492.8708,1213.8558 1491.9677,1213.233 1491.3968,1212.6452 L 1490.3689,1211.5641 L 1491.1309,1207.0094 L 1486.4521,1201.8875 L 1486.7711,1198.8569 L 1483.9355,1198.467 L 1482.9962,1197.634 C 1482.4788,1197.172 1481.744,1196.0486 1481.3657,1195.1351 L 1480.6745,1193.4692 L 1482.0392,1191.821 L 1481.2948,1189.4461 L 1482.4645,1188.0283 L 1481.6493,1186.4332 C 1481.1942,1185.5562 1480.8163,1184.3483 1480.8163,1183.7571 L 1480.8163,1182.676 L 1478.4592,1180.7088 L 1476.8287,1176.7389 L 1472.522,1174.6831 L 1470.4307,1170.7841 L 1468.9774,1170.7841 L 1465.3266,1115.1877 z "},"ga1":{"name":"GA-1","path":"M 2105.8453,1191.2435 L 2104.1345,1188.6323 L 2103.5923,1184.2613 L 2101.1644,1181.9993 L 2101.8438,1179.2924 L 2049.7754,1184.9636 L 2049.6042,1179.7727 C 2042.7824,1173.0277 2041.1867,1169.0645 2034.8706,1162.3616 L 2027.5295,1157.4579 L 2027.5283,1151.3 L 2028.8905,1147.5331 L 2032.5111,1147.5331 L 2033.3617,1145.5482 L 2034.0503,1133.6385 L 2045.7651,1132.9028 C 2046.1453,1131.3477 2046.3582,1129.6887 2047.2518,1128.3657 C 2047.6577,1127.7649 2048.2798,1125.3008 2048.4137,1123.6193 C 2049.3142,1122.9089 2050.6528,1122.2236 2050.7806,1121.2974 C 2051.0569,1119.2945 2052.5868,1118.6117 2053.6162,1117.3883 L 2053.6162,1112.0516 L 2048.6029,1110.5714 L 2042.3752,1106.676 L 2046.1708,1100.0766 L 2060.4447,1084.9405 C 2062.869,1085.435 2064.6434,1085.4295 2065.607,1084.8004 L 2067.5817,1093.3724 L 2071.365,1095.9244 L 2074.0781,1095.9244 L 2078.5247,1098.1929 C 2081.5256,1097.6089 2085.4551,1098.8821 2089.2021,1099.7902 C 2089.2101,1100.1903 2089.621,1100.8813 2091.6348,1102.73 L 2093.6645,1101.7184 C 2093.7736,1099.9649 2095.8873,1097.8576 2097.8448,1095.7779 L 2100.2918,1089.0667 L 2103.1094,1086.8504 L 2105.9991,1086.8504 L 2109.0877,1083.425 L 2104.087,1079.8604 C 2108.4377,1077.6935 2111.1798,1077.8933 2114.0805,1076.6351 L 2117.7018,1076.6421 L 2117.7439,1077.7978 L 2118.7988,1078.8906 C 2119.4021,1079.2135 2120.5112,1079.3934 2121.3149,1079.3934 L 2123.2397,1079.4356 L 2128.2587,1081.7231 L 2135.8769,1082.0184 L 2141.5077,1075.7914 C 2143.6023,1075.8216 2144.9296,1075.4257 2146.0193,1074.8978 L 2150.5501,1077.2092 L 2155.1323,1077.2092 L 2155.1323,1079.5176 L 2153.2497,1082.3908 L 2150.725,1081.7572 L 2149.3341,1083.4331 L 2149.9925,1085.149 L 2151.8119,1085.149 L 2149.3857,1088.2333 L 2145.62,1087.9088 L 2145.8331,1091.671 L 2147.7138,1091.3482 L 2147.0278,1093.2478 C 2146.6505,1094.2925 2145.789,1095.8398 2145.1134,1096.686 C 2144.4378,1097.5323 2143.6722,1098.1873 2143.412,1098.1417 C 2143.1519,1098.096 2142.3648,1098.0888 2141.663,1098.1258 L 2140.3869,1098.1929 L 2140.3869,1099.9309 L 2142.939,1100.898 L 2144.2251,1099.8648 L 2145.0008,1103.9997 L 2144.2571,1108.4013 L 2143.5434,1108.4013 C 2143.1509,1108.4013 2142.0249,1108.8028 2141.0412,1109.2935 L 2139.2527,1110.1857 L 2139.2527,1111.9363 L 2140.5287,1111.6595 C 2141.2305,1111.5073 2142.2514,1111.1951 2142.7972,1110.9656 L 2143.7897,1110.5484 L 2143.7897,1111.4211 C 2143.7897,1111.9011 2143.0496,1114.3011 2142.145,1116.7545 L 2140.5002,1121.2153 L 2141.0863,1124.2809 L 2142.1478,1124.2809 L 2141.9,1131.1473 L 2139.9391,1132.1967 L 2138.7782,1135.527 L 2139.4867,1136.2355 L 2137.0146,1136.8821 L 2137.6854,1143.2998 L 2135.9169,1145.1929 C 2134.9443,1146.2341 2134.1485,1147.2852 2134.1485,1147.5288 L 2134.1485,1147.9715 L 2137.8349,1148.5346 L 2139.1197,1147.5046 L 2139.688,1151.2195 L 2139.0841,1154.6223 C 2138.752,1156.4938 2138.5095,1158.8717 2138.5452,1159.9065 L 2138.6102,1161.788 L 2139.9587,1163.4127 L 2139.4355,1163.4127 C 2139.1478,1163.4127 2138.6296,1163.13 2138.2841,1162.7844 L 2137.6557,1162.156 L 2133.8162,1163.4232 L 2124.7909,1162.9274 L 2120.967,1161.7511 L 2117.1864,1161.8932 L 2115.7168,1160.6874 L 2111.7522,1160.895 L 2111.1798,1163.6963 L 2108.9113,1163.6963 L 2109.0014,1166.2484 L 2108.0417,1166.2484 L 2108.6293,1173.2715 L 2111.6253,1177.2312 L 2112.5665,1190.054 L 2105.8453,1191.2435 z "},"ms1":{"name":"MS-1","path":"M 1708.8915,1078.9737 L 1707.5767,1068.1863 L 1700.2951,1068.8663 L 1699.5738,1060.1953 L 1701.2535,1060.1953 L 1703.4143,1057.7594 L 1696.9444,1058.4977 C 1696.0824,1054.077 1695.9099,1049.5453 1695.0538,1045.128 L 1662.8799,1048.5517 L 1662.0996,1041.025 L 1662.9315,1040.3458 L 1668.4973,1040.3458 L 1672.5058,1038.4344 C 1672.5553,1030.9196 1671.2582,1023.9819 1670.0883,1016.9898 C 1668.5212,1017.4516 1664.5516,1017.9133 1660.129,1018.3751 L 1659.326,1011.9483 L 1656.0607,1010.1865 L 1653.996,994.80357 L 1651.2402,990.66245 L 1652.3515,989.63402 L 1651.3579,985.78951 L 1653.0509,983.20863 L 1652.0196,975.69315 L 1646.832,975.69315 L 1649.8206,973.34229 L 1649.8206,970.0581 L 1646.7654,968.45727 L 1751.2836,956.34924 L 1754.2138,960.99102 L 1756.8258,962.18114 L 1758.4987,1062.1353 L 1741.1414,1064.292 L 1738.7289,1047.191 L 1722.2245,1049.0034 L 1720.8046,1047.0617 L 1718.4004,1048.3485 L 1716.2437,1047.664 L 1715.1199,1049.7638 L 1717.1303,1051.0193 L 1718.5103,1065.0159 L 1719.7452,1067.5233 L 1724.8137,1066.8286 L 1723.6435,1069.0151 L 1724.6537,1070.8202 L 1722.5075,1072.7626 L 1720.0721,1071.4592 L 1718.7045,1072.5942 L 1713.6226,1072.9557 L 1713.0555,1078.627 L 1708.8915,1078.9737 z "},"ca51":{"name":"CA-51","path":"M 331.8917,1021.2307 L 328.22425,1041.9477 L 326.79223,1042.9204 L 325.45283,1052.2492 L 318.87765,1052.2492 L 319.42709,1054.3582 L 317.55511,1056.1038 L 317.69026,1066.2857 L 315.608,1066.4533 L 313.95072,1065.4704 L 312.49746,1065.5768 C 311.70194,1065.6265 310.80322,1065.8115 310.49481,1066.0021 L 303.45884,1066.3566 L 303.53093,1064.9997 L 297.0964,1062.4221 C 296.19735,1062.3161 295.68276,1062.5224 295.04803,1062.9691 L 294.53343,1065.462 L 286.5769,1064.4101 L 284.66195,1066.1931 C 282.36689,1066.3868 283.3419,1066.1831 281.85921,1065.2233 L 280.20657,1065.2932 L 281.96115,1059.5156 L 277.1228,1055.0317 L 274.25611,1055.9312 L 273.78436,1058.3049 L 271.78271,1058.7923 L 269.67924,1065.8249 L 393.40194,1074.9344 L 394.58934,1073.7647 L 399.6226,1075.1116 L 403.84062,1074.3141 L 403.84062,1072.2228 L 408.09409,1068.8023 C 407.80463,1065.37 408.12847,1061.8905 407.839,1058.4582 L 399.37448,1057.3002 L 398.59468,1053.6671 L 397.33639,1052.8695 L 400.11338,1048.5127 L 400.68597,1041.9523 L 398.50058,1039.8178 L 400.54419,1037.2735 L 399.85303,1032.9669 L 404.69132,1032.9845 L 405.16927,1032.2313 C 380.72346,1029.1441 364.3213,1026.661 331.8917,1021.2307 z "},"ar1":{"name":"AR-1","path":"M 1643.0151,874.158 C 1610.5581,877.78524 1570.3273,881.41254 1526.6296,885.03978 L 1527.1081,891.68585 L 1525.7967,892.37701 C 1525.0764,892.76249 1524.4852,893.31198 1524.4852,893.58216 L 1524.4852,894.0607 C 1525.2938,893.59611 1526.1224,893.188 1527.0018,892.891 L 1527.3208,895.15951 L 1525.9739,895.15951 L 1528.0475,896.68367 L 1527.498,898.27872 L 1530.4989,899.51931 L 1531.8401,901.57516 L 1530.6172,903.04612 L 1531.4148,904.33991 L 1533.5238,903.79047 L 1534.9062,905.45642 L 1533.2757,906.48434 L 1534.6935,906.50209 L 1534.6935,911.44671 L 1513.178,912.45694 L 1512.859,910.18842 L 1507.879,909.83397 L 1509.5095,933.7774 L 1525.1764,932.9976 L 1524.5029,928.76189 C 1528.1321,928.03704 1531.9682,928.13992 1535.7568,928.05298 L 1536.1113,932.2178 L 1544.8309,931.95199 L 1546.2842,953.44968 L 1565.8501,952.26228 L 1565.5385,947.45065 L 1568.1009,945.95298 L 1567.4629,941.27417 C 1571.1645,940.44383 1574.9885,940.34867 1578.8586,940.52981 L 1579.2131,945.3504 L 1585.1325,945.68711 L 1590.4197,945.08618 C 1590.1605,946.32286 1590.3692,947.04833 1589.5277,948.00882 L 1586.7874,949.82278 L 1586.7089,951.7961 L 1587.72,952.42176 L 1587.4409,954.6537 L 1588.8543,956.12585 L 1590.108,957.79383 L 1589.2265,959.72354 L 1587.9649,961.85606 L 1586.6744,963.21496 L 1587.9325,963.34199 L 1587.8618,967.3073 L 1581.074,968.47859 L 1581.6943,972.28902 L 1578.7523,973.03337 L 1577.5117,971.34968 L 1574.8356,970.65852 L 1568.4376,973.52961 L 1561.898,972.87384 L 1558.6043,971.26404 L 1554.543,972.30671 L 1554.543,975.24869 L 1557.2368,974.57523 L 1558.0521,989.30288 L 1557.2368,998.94407 L 1561.2067,998.94407 L 1561.9866,1006.9902 L 1578.646,1006.1927 L 1579.5853,1021.5938 L 1588.3758,1021.5229 L 1589.7582,1026.2017 L 1590.8392,1027.1055 L 1593.3913,1027.0169 L 1595.0927,1033.8225 L 1597.1663,1035.896 L 1599.3107,1033.9643 L 1600.1792,1034.301 C 1600.6586,1034.485 1601.0475,1034.8831 1601.0475,1035.1871 C 1601.0475,1035.4911 1600.4824,1036.137 1599.7893,1036.6227 L 1598.5309,1037.5088 L 1599.3816,1037.5088 C 1599.8495,1037.5088 1600.7968,1037.1085 1601.4906,1036.6227 L 1602.7489,1035.7365 L 1603.9364,1036.4809 L 1605.5669,1035.1162 L 1606.2935,1036.9771 L 1608.3316,1036.3214 L 1609.0582,1037.5265 L 1610.1748,1036.8354 L 1606.1517,1031.9261 L 1606.1517,1029.5867 L 1607.286,1028.8778 C 1607.9098,1028.4882 1608.4202,1027.9495 1608.4202,1027.6904 C 1608.4202,1027.4312 1608.7898,1026.8599 1609.2355,1026.4144 L 1610.033,1025.5991 L 1617.4943,1024.9433 L 1619.3729,1022.1963 L 1621.8009,1022.1963 L 1623.0947,1023.4901 L 1624.8669,1022.7989 L 1624.8669,1021.6292 L 1620.578,1021.6292 L 1618.0614,1019.8569 L 1618.0614,1017.0922 L 1620.4186,1017.0922 L 1621.2693,1017.9429 C 1621.7371,1018.4108 1622.3276,1018.7936 1622.5984,1018.7936 L 1623.0947,1018.7936 L 1623.4491,1014.5401 L 1626.4797,1014.1856 L 1627.738,1012.6792 L 1626.0012,1010.9424 L 1626.0012,1008.5144 L 1630.8218,1008.8688 L 1631.1763,1011.4209 L 1632.0447,1011.4209 L 1631.5662,1008.1954 L 1635.8905,1004.1191 L 1633.941,1001.9746 L 1633.941,999.67067 L 1636.3513,996.60466 L 1633.4802,993.55634 L 1633.0903,988.45218 L 1635.926,988.45218 L 1635.8374,991.00426 L 1637.2729,991.00426 L 1638.159,989.74592 C 1638.6446,989.05266 1639.0452,988.30938 1639.0452,988.09773 L 1639.0452,987.70783 L 1635.0753,987.83186 L 1633.9588,986.71535 L 1634.6854,980.68961 L 1636.2804,980.08704 L 1637.4679,981.25674 C 1637.5764,982.59346 1637.6855,983.93024 1637.84,985.26209 L 1639.5768,984.09238 L 1638.035,981.64664 L 1638.4958,978.91733 L 1636.6349,976.86149 L 1638.2122,975.14235 L 1640.7465,975.12466 L 1640.7465,976.17027 C 1640.7465,976.74217 1640.8978,977.34939 1641.0833,977.53496 L 1641.42,977.87166 L 1644.9469,975.74493 L 1646.5774,977.10961 L 1645.8153,974.71701 L 1648.6864,972.83839 L 1648.6864,970.65852 L 1647.623,970.32176 C 1647.0403,970.13682 1646.1494,969.52205 1645.638,968.95714 L 1644.7165,967.94691 L 1645.4431,964.24288 L 1650.246,964.96948 L 1651.3093,958.14624 L 1655.6514,958.39436 L 1656.1477,956.97654 L 1654.3931,956.97654 L 1653.1348,954.61938 L 1655.0311,952.5104 L 1654.2867,951.30525 L 1650.9726,951.30525 L 1650.2814,948.5405 L 1651.0258,947.33535 L 1653.2057,947.33535 L 1653.8792,942.39067 L 1652.036,941.68176 L 1651.2207,943.64902 L 1649.2535,944.00347 L 1649.2535,939.92723 L 1651.6283,938.84612 L 1651.5929,937.12704 L 1653.8614,935.92189 L 1655.5096,937.28651 L 1654.8539,939.39555 L 1655.935,939.39555 L 1656.5021,937.16248 L 1654.8716,935.81555 L 1655.2083,931.17219 L 1659.3555,930.83542 L 1661.1455,933.36981 L 1662.0139,932.50136 L 1658.8061,929.73661 L 1659.1782,927.82255 C 1660.6046,926.99619 1662.2726,926.42906 1663.4317,925.23503 L 1663.4317,924.88057 L 1659.639,925.32367 L 1658.6997,923.33872 C 1658.1828,922.24938 1657.7604,920.95905 1657.7604,920.46763 L 1657.7604,919.58149 L 1660.5429,917.75602 L 1662.581,918.39404 C 1663.5227,917.93081 1664.5205,917.49934 1665.1508,916.7104 L 1666.2673,913.94565 L 1669.3865,913.5912 L 1669.3865,912.51008 L 1666.5509,911.83661 L 1666.5509,908.52248 L 1669.7233,907.40592 L 1671.9386,908.7883 L 1671.9386,907.03377 L 1667.9687,904.69436 L 1667.9687,902.93978 L 1635.3057,906.3603 L 1637.5565,899.53701 L 1641.3137,895.90387 L 1641.3137,893.84803 L 1643.724,891.41998 C 1645.0496,890.079 1646.5632,888.47953 1647.0913,887.85773 C 1647.6194,887.23576 1648.1,886.38671 1648.1547,885.97912 L 1648.1192,879.97107 L 1644.1493,879.22671 L 1644.1493,875.87714 L 1643.0151,875.87714 L 1643.0151,874.158 z "},"sc1":{"name":"SC-1","path":"M 2184.3367,1035.2762 L 2183.1998,1036.3123 L 2177.5339,1033.2447 L 2177.923,1027.8288 L 2176.5164,1026.134 L 2177.352,1023.5525 C 2179.8084,1023.221 2180.4453,1022.7792 2181.413,1021.5656 L 2178.2656,1018.3631 L 2176.289,1018.5869 L 2173.0993,1015.5025 C 2173.5617,1014.1724 2173.1831,1012.8889 2169.7887,1009.4549 L 2170.4999,1004.7123 L 2168.2613,1002.6267 L 2170.1362,998.83484 C 2171.1674,996.74928 2172.65,994.22669 2173.4308,993.22894 L 2174.8505,991.41492 L 2179.652,989.7842 L 2184.0558,995.76968 L 2184.0558,998.2448 L 2189.7046,1005.4674 L 2189.7271,1012.4686 L 2185.7572,1013.7787 L 2185.7572,1016.4623 C 2188.5496,1017.4951 2190.0159,1019.65 2191.3595,1021.9086 L 2192.4896,1019.3843 C 2193.1335,1018.2065 2193.171,1017.3043 2193.0981,1016.0162 L 2195.3984,1014.7851 L 2195.3984,1012.507 L 2198.2341,1009.4489 L 2198.1789,1007.459 C 2198.1789,1006.8801 2199.5758,1005.8945 2200.0026,1005.0666 C 2200.4294,1004.2386 2200.6469,1002.4577 2201.6989,1000.1653 L 2203.6117,995.99749 L 2206.2369,994.38815 L 2208.3795,995.04659 L 2209.5854,990.56848 L 2213.1786,989.08998 L 2214.631,982.79944 L 2212.9794,981.87519 L 2211.5616,979.66305 L 2210.1438,978.90423 L 2210.1438,976.72929 L 2213.6926,971.78762 L 2212.9632,969.88694 L 2215.4426,957.54503 L 2217.5973,956.77793 L 2217.6583,955.79028 L 2213.0523,951.84777 L 2211.8889,946.20053 L 2208.4424,945.04659 L 2207.6051,943.14626 L 2206.5947,942.37825 L 2206.5768,940.50758 L 2207.9192,940.13339 C 2208.3239,939.41206 2207.6459,938.70105 2208.2321,938.0142 L 2210.2903,936.04864 L 2209.6831,933.72676 L 2210.7109,931.65113 L 2211.537,928.4236 C 2211.9913,927.44071 2212.9095,925.15132 2213.5774,923.33617 L 2214.7918,920.03576 L 2246.4363,940.56854 C 2246.4384,940.74503 2245.3592,941.49693 2244.0381,942.23936 L 2241.6363,943.5893 L 2238.7183,946.57801 C 2237.1135,948.22178 2234.8667,950.97337 2233.7255,952.69268 C 2232.5843,954.41193 2230.7525,957.80211 2229.6547,960.22642 C 2228.557,962.65066 2227.1271,965.64085 2226.4771,966.87124 C 2225.8271,968.10162 2224.9518,970.39849 2224.5318,971.97539 L 2223.7683,974.84246 L 2223.7616,979.84209 L 2223.7549,984.84179 L 2224.7837,986.76424 L 2224.1876,989.88243 L 2217.9617,996.10836 L 2218.6198,997.82359 L 2217.9418,1001.2139 L 2214.6062,1001.2139 L 2212.3179,1002.4386 L 2210.1242,1000.4533 L 2206.9722,1003.4732 L 2205.5134,1007.5073 L 2206.8915,1009.1678 L 2208.4424,1007.8806 L 2208.4424,1008.7808 L 2208.4424,1009.6809 L 2207.2586,1010.3145 C 2206.6075,1010.6629 2205.3432,1011.7565 2204.4489,1012.7447 L 2202.8229,1014.5415 L 2202.1388,1017.3771 L 2199.8144,1019.0785 C 2198.536,1020.0143 2197.0509,1021.0183 2196.5141,1021.3096 L 2195.5381,1021.8394 L 2195.4411,1027.0183 L 2190.8438,1030.9882 L 2190.8614,1032.406 L 2189.9825,1032.406 C 2189.4991,1032.406 2188.2869,1032.8187 2187.2886,1033.3231 C 2186.2904,1033.8274 2184.9621,1034.7064 2184.3367,1035.2762 z "},"nm1":{"name":"NM-1","path":"M 830.17406,1027.1754 L 830.7142,1015.9593 L 829.19361,1015.9593 C 828.35732,1015.9593 827.48548,1015.7679 827.25619,1015.5339 C 827.0269,1015.3 824.11327,1013.9519 820.78145,1012.5381 L 814.72361,1009.9675 L 814.9322,1003.7476 L 815.14079,997.5276 L 815.63396,996.58583 C 815.90516,996.06782 817.01282,995.09661 818.09536,994.42757 L 820.06363,993.21107 L 829.75252,993.99723 L 830.44101,989.87137 L 832.87173,989.84715 L 835.99093,985.43665 L 835.99093,983.19626 L 832.38071,980.90223 L 831.0623,981.23315 C 830.43846,981.2801 829.15318,980.94357 827.38096,980.48533 L 824.1587,979.65205 L 821.30207,980.95367 L 820.17031,984.20008 L 818.40643,984.24256 L 816.6515,982.59726 L 807.50775,981.26706 L 807.42307,966.44907 L 817.84282,967.34036 L 818.56488,969.23344 L 820.69825,969.22822 L 820.06273,967.2739 L 826.39115,966.48321 L 824.72594,963.94179 L 827.20044,960.41164 L 830.26787,961.13354 L 830.23497,959.87911 L 838.14869,959.12613 L 838.91255,954.03246 L 842.74056,954.70939 L 842.10328,968.03691 L 846.76638,969.93764 L 846.76638,973.42463 L 844.49786,973.42463 L 844.49786,980.23018 L 889.20984,982.80874 L 888.01677,1008.8702 L 886.74918,1009.6794 L 885.70748,1030.7046 L 830.17406,1027.1754 z "},"ca26":{"name":"CA-26","path":"M 256.94675,968.32048 L 256.41376,968.32048 L 257.05484,965.11518 L 254.2209,963.25834 L 253.49792,964.12945 C 253.10031,964.60862 251.77612,965.51018 250.55532,966.13295 C 249.33452,966.75577 248.2124,967.1421 248.06177,966.99141 C 247.91108,966.84078 248.23678,966.03228 248.78554,965.19486 L 249.78323,963.67218 L 248.4456,961.5303 L 248.4456,958.81761 L 245.89352,957.11072 L 240.71344,961.76855 L 239.73213,960.26833 L 237.01924,960.73309 L 235.84092,959.45801 L 239.37154,957.5617 L 239.37154,956.05586 L 237.78092,954.53193 C 236.90606,953.69377 235.91648,953.008 235.58182,953.008 C 235.24721,953.008 234.63398,953.41701 234.21906,953.91694 L 233.46473,954.82582 L 231.43174,952.3152 L 231.43174,949.65661 L 235.45807,948.90125 L 237.84018,946.90927 C 239.1503,945.81369 240.81228,944.64784 241.53338,944.31857 L 242.84458,943.71985 L 245.35271,946.86537 L 252.87748,947.1106 L 254.48739,948.44664 L 257.93752,947.1444 L 262.81827,949.58986 L 263.19095,944.56391 L 268.91498,946.94273 L 270.31084,949.39913 L 271.84756,949.34225 L 272.83213,950.14429 L 272.83213,951.74143 L 270.47878,952.35688 L 271.5925,954.4379 L 271.05067,957.27213 L 274.67597,960.9478 L 270.88921,960.9478 L 264.9394,967.2397 L 261.3674,965.3925 L 258.68664,966.06535 L 258.08322,967.19291 C 257.75133,967.81307 257.2399,968.32048 256.94675,968.32048 z "},"ok1":{"name":"OK-1","path":"M 1363.9877,863.45345 L 1353.6376,863.96743 L 1356.1188,916.14327 L 1352.2021,916.14327 C 1350.0456,916.14327 1346.7112,916.31506 1344.794,916.51542 L 1341.3026,916.86988 L 1341.3026,921.24743 L 1354.9137,921.24743 L 1354.9137,926.77694 L 1351.6172,927.43265 L 1350.8552,930.85318 L 1349.207,932.25325 C 1348.2941,933.02137 1347.541,933.92384 1347.541,934.25595 L 1347.541,934.85852 L 1374.267,933.74196 C 1374.4901,933.9763 1374.7477,935.34058 1374.8518,936.27634 L 1375.0468,937.97773 L 1377.3153,939.30691 L 1377.5988,938.82842 C 1377.7623,938.5638 1379.1487,937.92533 1380.6649,937.4106 L 1383.4119,936.47127 L 1385.3614,936.98525 L 1388.0907,935.4611 L 1392.5392,935.42565 L 1394.6127,933.54704 L 1394.6127,932.02288 L 1394.0101,932.02288 C 1393.6759,932.02288 1393.0499,931.68288 1392.6277,931.26077 L 1391.8657,930.48097 L 1392.486,925.5009 L 1393.1594,924.93377 C 1393.5361,924.62185 1394.1397,923.49508 1394.5064,922.43483 C 1394.873,921.37453 1395.1798,920.32256 1395.1798,920.09542 L 1395.1798,919.68783 L 1378.1128,920.09542 L 1376.9077,916.7104 L 1376.1633,916.7104 C 1375.7541,916.7104 1374.998,916.30718 1374.4974,915.80651 L 1373.5935,914.88493 L 1369.8186,915.59384 L 1366.593,911.37582 L 1366.6639,901.68149 L 1368.1526,893.51127 L 1373.1504,890.71107 L 1370.7933,888.35397 L 1363.9877,888.35397 L 1362.7649,866.23595 L 1363.9877,866.23595 L 1363.9877,863.45345 z "},"ky1":{"name":"KY-1","path":"M 1757.9295,767.28969 L 1757.0434,770.63932 L 1759.2764,773.01417 L 1759.2764,775.42447 L 1757.4865,777.19674 L 1754.2964,777.19674 L 1753.6052,775.40672 L 1753.9596,773.98889 L 1754.3141,772.55338 L 1753.2507,773.08506 C 1752.664,773.37231 1751.33,774.03534 1750.291,774.55602 C 1749.2519,775.0767 1748.0104,775.49536 1747.5263,775.49536 L 1746.6401,775.49536 L 1743.9108,772.37615 L 1743.0956,773.47496 C 1742.6405,774.08048 1742.2626,774.86959 1742.2626,775.22949 C 1742.2626,775.58944 1742.773,776.3486 1743.3968,776.91318 L 1744.5311,777.9411 L 1744.4957,779.74882 L 1742.2626,782.42493 L 1738.4345,781.09575 L 1737.6901,785.03021 L 1734.9431,786.82018 L 1733.1176,790.68374 L 1735.333,794.81318 L 1739.4269,798.67674 L 1739.4269,800.78572 L 1738.7535,801.47694 L 1727.7036,804.68768 L 1725.4289,807.37882 L 1722.6435,806.70513 L 1720.1446,808.45971 L 1719.3291,815.72877 L 1719.8964,816.77166 C 1720.4471,817.62412 1721.4837,818.86114 1722.2004,819.53642 L 1723.4942,820.77701 L 1724.2386,823.71899 L 1723.4764,828.8586 L 1718.4255,829.93971 L 1714.172,827.12176 L 1708.483,826.0407 L 1702.4041,822.90374 L 1695.3859,822.44295 L 1691.859,826.8914 L 1691.1501,829.74473 L 1688.3854,832.95258 L 1688.3854,834.13998 C 1688.3901,834.79331 1688.5929,835.63051 1688.8285,836.0009 C 1689.0639,836.37129 1689.954,836.95022 1690.8134,837.27694 L 1692.3907,837.86176 L 1693.0465,839.59859 L 1692.2667,845.85476 L 1689.945,848.01694 L 1690.6184,849.78922 L 1693.4895,850.81714 L 1692.7984,852.62486 L 1690.0513,852.62486 L 1689.431,854.25536 L 1691.9831,857.71127 L 1691.3628,859.00506 C 1691.0199,859.71153 1690.5757,861.04848 1690.3703,861.98248 C 1690.165,862.91649 1689.7384,864.00112 1689.4133,864.39278 L 1688.8107,865.10169 L 1686.2055,865.10169 L 1683.4053,861.53939 L 1681.7393,862.17741 L 1681.0127,868.84117 L 1746.4452,861.14949 L 1747.5972,859.99753 L 1744.4071,849.78922 L 1756.4408,849.78922 L 1756.4408,851.56149 L 1817.7793,841.92031 L 1819.3035,842.50513 L 1821.4479,841.35318 L 1827.3673,840.7683 L 1869.0159,836.70981 L 1885.5158,833.34248 L 1889.9465,832.97028 L 1894.0642,832.4505 L 1894.9443,831.07397 L 1893.4702,826.7613 L 1893.8484,824.57297 L 1892.8676,822.72016 L 1889.2732,819.12859 L 1894.2531,813.82968 L 1894.2531,811.22447 L 1897.077,811.70573 L 1899.2155,808.65464 L 1895.4228,805.83674 L 1895.3873,801.19338 L 1905.3121,789.00011 L 1905.0817,788.34434 C 1904.9535,787.9854 1904.6982,786.54019 1904.5146,785.13655 L 1904.1778,782.58447 L 1899.8889,782.01734 L 1897.6559,778.61457 L 1897.6559,776.18652 L 1896.0431,775.56625 L 1895.6709,773.20909 L 1891.382,776.13338 L 1885.0727,776.34605 L 1885.8348,784.56942 L 1884.222,784.56942 L 1883.1409,785.75681 C 1882.5509,786.40879 1882.0728,787.23821 1882.0598,787.59998 C 1882.0468,787.96181 1881.8311,789.08518 1881.5813,790.09892 L 1880.53,791.79447 L 1879.7913,794.49417 L 1875.8214,795.77021 L 1875.1479,797.06394 C 1874.7824,797.77875 1873.5772,799.45983 1872.4541,800.80348 L 1870.416,803.24922 L 1865.4004,806.68744 L 1859.6051,806.68744 L 1856.6631,803.74546 L 1854.0933,804.91516 L 1853.2958,807.39635 L 1854.4123,808.10526 L 1857.6201,824.44565 L 1856.2378,825.33179 C 1855.4721,825.81266 1853.0623,827.9251 1850.9032,830.04605 L 1846.9865,833.90961 L 1845.1079,832.20823 L 1843.2469,832.20823 L 1842.7153,831.21575 C 1842.4231,830.66989 1842.1221,829.96807 1842.0418,829.65615 C 1841.9614,829.34423 1841.7769,828.64241 1841.6342,828.09654 L 1841.3861,827.10407 L 1840.2518,827.10407 L 1840.4999,825.40268 C 1840.6373,824.46692 1840.6198,823.7013 1840.4645,823.7013 C 1840.3092,823.7013 1839.7234,824.56719 1839.153,825.08345 L 1835.9806,824.26843 L 1834.6691,822.69107 L 1831.5322,825.68625 L 1831.9398,826.53694 L 1828.9447,829.93971 C 1827.2973,831.81124 1825.749,833.34248 1825.5065,833.34248 L 1825.0634,833.34248 L 1825.0634,831.6411 L 1815.9716,831.6411 L 1810.1408,821.71635 L 1811.5409,811.82704 L 1810.8143,809.52308 L 1811.8422,809.45219 C 1812.4091,809.41192 1813.5081,809.31131 1814.2879,809.23951 C 1815.0677,809.16766 1816.0953,808.95079 1816.5742,808.74328 L 1817.4426,808.37107 L 1819.7465,810.51555 L 1821.9442,809.27184 L 1816.3615,798.21595 L 1810.6016,797.09939 L 1800.3933,798.00328 L 1796.6715,794.52961 L 1792.8788,794.84862 L 1785.6687,792.70119 L 1787.562,789.30137 L 1782.8123,789.26592 C 1778.386,787.76621 1773.7638,786.63025 1769.6265,784.40988 L 1768.9176,783.86051 L 1768.9176,781.39701 L 1769.5911,780.70585 C 1769.9654,780.33149 1770.6908,780.03239 1771.2039,780.03239 L 1772.1432,780.03239 L 1774.2877,777.67523 L 1772.3027,776.55872 L 1771.7533,775.49536 L 1771.7178,770.67476 L 1769.5734,769.68229 C 1768.3875,769.13643 1766.9304,768.68981 1766.3479,768.68981 L 1765.3022,768.68981 L 1762.2362,771.61404 L 1758.5853,769.73543 L 1757.9295,767.28969 z M 1673.516,865.58018 L 1672.3285,866.74988 L 1674.2249,869.63872 L 1676.5465,869.63872 L 1676.1921,865.95238 L 1673.516,865.58018 z "},"ks1":{"name":"KS-1","path":"M 1355.4808,675.53892 C 1255.0691,680.62681 1160.3765,680.46194 1060.6802,679.34929 C 1059.5666,741.6321 1058.4885,799.92579 1056.5685,866.2005 C 1117.8383,866.87147 1175.5329,867.53405 1237.518,866.05872 L 1237.518,842.98367 L 1232.0063,842.98367 L 1231.2796,820.86565 L 1268.338,819.71364 C 1268.9967,810.70668 1267.5329,801.59785 1267.9303,792.58011 C 1276.8273,791.60408 1285.8771,792.3646 1294.798,791.78256 L 1294.798,797.20572 L 1325.8483,795.80565 L 1326.6459,804.41892 L 1331.5196,803.63912 L 1332.2994,809.50533 L 1333.3805,810.1611 L 1334.0717,806.68744 L 1352.7338,805.94308 L 1350.1994,732.41127 L 1349.012,732.05682 C 1348.3565,731.85475 1346.7313,731.04182 1345.3966,730.26684 L 1342.5964,728.79583 L 1344.2978,727.8211 L 1344.1914,726.77543 L 1342.5077,726.13741 L 1342.1356,727.16533 C 1339.527,726.44513 1338.1267,726.32621 1336.1275,726.36783 L 1335.2237,727.98058 L 1333.2565,726.6514 L 1331.307,728.9908 L 1329.2334,728.9908 L 1329.8005,736.93061 L 1323.7216,736.93061 L 1323.7216,735.22922 L 1314.0804,735.22922 L 1314.0804,734.37853 L 1307.1154,734.76843 L 1307.8066,731.31246 L 1306.7077,730.6213 L 1306.7077,726.72229 L 1304.2089,726.72229 L 1301.7277,726.72229 L 1301.32,704.32071 L 1335.206,702.83199 L 1334.3376,686.1017 L 1350.4653,685.19781 L 1350.0931,679.93417 L 1355.4808,680.00506 L 1355.4808,675.53892 z "},"nc1":{"name":"NC-1","path":"M 2306.8392,753.43048 L 2215.0884,776.25741 L 2212.8554,778.04744 L 2213.5111,784.44533 L 2207.2372,785.22513 L 2208.531,791.97754 L 2215.5138,790.98506 L 2216.2581,794.97266 L 2219.3419,788.45068 L 2224.5879,784.92387 L 2226.6614,787.58229 L 2225.8993,790.38249 L 2234.1581,790.02803 L 2235.7886,791.10909 L 2245.3766,791.35721 C 2245.5667,792.05569 2246.1182,792.69665 2247.5743,793.16493 L 2255.4255,791.37496 L 2256.7547,791.37496 L 2254.3976,811.64981 L 2251.8277,811.57892 L 2250.7644,812.71318 L 2253.8836,818.68572 L 2250.9239,822.56704 L 2254.6988,822.56704 L 2257.3041,821.07833 L 2260.8841,825.63305 L 2258.775,827.35219 L 2260.6182,833.9982 C 2259.4252,834.54894 2258.2515,835.06049 2257.4636,835.02612 L 2259.0055,838.358 L 2257.0028,839.42137 L 2254.1317,838.46434 L 2251.296,840.71516 L 2252.5012,845.74843 L 2250.2327,846.2978 L 2250.2681,848.22961 L 2253.7595,851.65008 C 2254.2483,849.81831 2254.4804,847.70133 2254.557,845.41166 L 2257.9067,844.18882 L 2257.7826,841.49496 L 2261.9829,839.5809 L 2263.5602,848.19417 L 2268.1859,847.39661 L 2268.7884,845.85476 L 2265.7933,842.70011 L 2266.4313,837.87951 C 2267.3613,837.97371 2268.5265,838.12088 2268.753,839.22644 L 2270.9152,839.22644 L 2271.7481,841.49496 L 2274.4243,841.49496 L 2275.1863,844.25971 L 2281.3893,844.25971 L 2289.7899,847.5207 C 2288.4823,848.53649 2287.8947,849.6404 2288.3012,851.34882 L 2286.7416,851.34882 L 2285.4833,854.78704 L 2286.7061,857.091 L 2286.7061,861.04315 L 2290.1798,861.80526 L 2292.1825,859.99753 L 2295.4966,860.01523 L 2301.5224,865.22572 L 2300.9198,866.80308 L 2302.6921,867.0512 L 2312.4042,863.31166 L 2312.7764,861.98248 L 2312.2447,860.52922 L 2313.9638,858.33159 L 2316.9057,858.29615 C 2316.3428,856.47226 2316.1343,854.5996 2316.3032,853.05021 L 2313.308,853.19199 L 2311.713,856.52387 L 2306.0594,855.88585 L 2306.662,858.22526 L 2303.6137,859.78486 L 2302.0186,851.8805 C 2301.1665,851.54272 2300.9089,850.46438 2300.973,849.02711 L 2303.7909,845.32308 C 2302.529,844.77835 2301.5624,844.45123 2297.8183,840.71516 L 2294.3624,840.69741 L 2285.4124,836.12493 L 2286.9543,833.30704 L 2283.8705,832.031 C 2284.257,830.27908 2283.8462,828.96612 2283.2325,827.75978 L 2280.5386,828.8586 L 2280.7513,831.92466 L 2277.9511,832.06645 L 2274.8142,827.91932 L 2274.8319,825.75714 L 2272.2621,822.03536 L 2269.0366,825.2609 L 2264.4286,821.87582 L 2265.297,821.07833 L 2266.8035,820.86565 L 2269.7809,816.94889 L 2269.2315,816.02731 L 2270.2594,814.09555 C 2272.1043,814.67737 2274.9341,816.88878 2277.5612,818.77437 L 2278.3055,823.13417 L 2280.5032,823.13417 L 2281.1589,819.85543 L 2283.7287,818.68572 L 2284.9693,819.92632 L 2287.1847,817.94137 L 2289.4709,819.16427 L 2288.8506,822.95694 L 2292.2356,824.35701 L 2292.1471,829.08902 C 2300.2575,831.48451 2306.3856,834.33734 2312.1383,837.27694 L 2321.6554,833.67919 L 2321.6554,830.50684 L 2320.344,826.8205 L 2307.4063,823.68355 L 2303.1883,823.7013 L 2301.3983,827.13951 L 2296.3119,823.54176 L 2298.7399,820.95424 L 2296.7372,817.56922 L 2294.5822,819.11634 C 2292.5526,818.04878 2290.6948,816.3622 2288.9747,815.67285 L 2288.9215,813.21282 L 2286.9638,812.59544 L 2288.2835,809.36355 L 2298.1558,811.94897 L 2304.3758,807.57357 L 2326.1518,802.51513 L 2324.3316,797.32981 L 2325.8203,792.29655 L 2323.9772,790.2584 L 2323.8354,788.87602 C 2323.751,788.10717 2323.5076,787.20305 2323.3037,786.87338 L 2322.9315,786.2708 L 2320.8934,786.2708 L 2318.4122,788.25575 C 2317.0426,789.34447 2315.6214,790.23764 2315.2576,790.2407 C 2314.8935,790.24371 2313.4595,790.73263 2312.0851,791.32176 L 2309.5863,792.38513 L 2307.6899,791.32176 L 2307.6899,789.49635 C 2307.6942,788.49809 2307.8454,787.14112 2308.0267,786.46572 L 2308.3634,785.22513 L 2311.1459,784.53397 L 2312.7764,786.16447 L 2314.0524,785.84546 C 2314.7597,785.66982 2316.0294,785.04858 2316.8703,784.46308 L 2318.4122,783.39971 L 2319.7414,779.71338 L 2321.1947,779.02216 C 2321.9983,778.64292 2322.954,778.331 2323.3214,778.331 C 2323.6889,778.331 2324.3154,777.94813 2324.7038,777.48031 L 2325.4127,776.62961 L 2328.0711,776.62961 L 2331.4562,773.31543 L 2335.3374,771.91536 L 2335.2488,770.44434 C 2335.204,769.6351 2334.9816,768.65437 2334.7349,768.26447 L 2334.2741,767.55556 L 2332.6436,767.55556 L 2330.4637,765.37563 L 2325.2178,764.57813 L 2327.0964,762.50454 L 2324.1366,761.76018 L 2324.1366,760.75001 L 2322.4352,760.75001 L 2322.4352,759.52711 L 2321.0174,760.0411 C 2319.0174,758.2327 2317.919,758.17286 2310.8091,756.15978 L 2306.8392,753.43048 z "},"nv1":{"name":"NV-1","path":"M 406.83586,863.67049 L 405.57933,864.03282 L 403.55167,859.71533 L 396.93481,859.37222 C 397.18101,858.59485 397.58089,857.88816 397.96761,857.17754 L 402.1879,855.97171 L 403.45775,853.18467 L 399.65136,847.88435 L 400.75266,848.34548 C 401.35836,848.5991 404.0867,849.08116 406.81561,849.41678 L 411.77725,850.02701 L 412.37256,851.90262 L 411.31334,854.39113 L 410.25411,856.87969 L 410.04841,858.25872 L 411.35633,860.76769 L 409.51015,862.28272 C 408.73035,862.84673 407.5269,863.47125 406.83586,863.67049 z "},"mo1":{"name":"MO-1","path":"M 1614.0915,740.80733 L 1613.9482,739.46936 L 1616.6416,735.70532 L 1613.5977,733.2834 L 1614.7918,730.06268 L 1619.1443,730.12642 L 1619.5178,728.13523 C 1619.7233,727.04005 1620.0726,726.03198 1620.2941,725.89508 L 1620.6969,725.64616 L 1626.2164,729.5703 L 1629.9711,728.86592 L 1629.9711,729.40827 C 1629.9711,729.70658 1629.5245,730.35696 1628.9786,730.85365 C 1628.4328,731.35029 1627.496,732.67204 1626.897,733.79092 L 1625.8078,735.82522 L 1627.0388,738.01541 C 1627.7158,739.21999 1628.2697,740.62233 1628.2697,741.13167 L 1628.2697,742.05773 L 1624.7456,741.6583 L 1624.7071,740.636 L 1620.8859,739.76761 L 1618.5752,742.30217 L 1614.0915,740.80733 z "},"va1":{"name":"VA-1","path":"M 2205.3232,632.57892 L 2203.4269,635.91081 L 2206.2448,638.94137 L 2209.2931,638.3388 C 2212.3697,640.09735 2213.434,642.11134 2213.0503,644.96711 L 2217.0202,647.82051 L 2221.6281,653.4918 L 2224.0562,651.89675 C 2225.6136,652.66453 2227.4168,652.80132 2228.3451,655.29952 L 2227.902,656.45147 L 2226.1475,655.22863 L 2223.6663,658.56051 C 2223.9007,659.95871 2224.3489,661.27257 2225.0663,662.61899 L 2227.069,663.25701 L 2231.0566,661.59107 L 2233.0061,664.5685 L 2230.3655,666.5889 L 2230.844,668.00672 L 2233.9809,667.33325 L 2237.4723,668.71563 L 2236.1077,671.30315 L 2239.4927,673.94387 L 2240.237,678.07325 L 2238.5711,679.49107 L 2242.1865,679.65061 L 2242.8778,678.51635 L 2250.853,678.51635 L 2253.4405,680.62533 L 2249.7896,686.56249 L 2251.3669,688.4588 L 2250.3036,688.4411 L 2251.296,689.48672 L 2252.2176,688.68922 L 2252.8202,691.04632 L 2255.0001,689.30949 L 2255.709,689.73484 L 2256.0812,692.09199 L 2257.9421,691.38308 L 2259.3422,693.27939 L 2260.7423,691.578 L 2262.8867,692.73001 L 2262.8867,694.27187 C 2265.738,696.20793 2264.9749,694.25854 2268.9657,696.85939 L 2269.9404,696.89484 L 2269.4087,695.24665 L 2271.057,695.24665 L 2271.1987,697.55061 L 2271.8545,698.08229 C 2272.0351,696.94741 2272.3793,695.98828 2273.1482,695.44157 L 2274.8142,696.82394 L 2274.5129,694.11239 L 2276.2143,694.11239 L 2276.5865,696.73536 L 2278.022,695.53021 C 2281.0598,699.29935 2280.5922,696.42469 2283.2502,699.62414 L 2281.4779,702.33575 L 2277.7739,702.33575 C 2276.8329,703.33929 2276.2247,704.78791 2275.7889,706.46513 L 2276.7814,708.6982 L 2278.6778,708.48553 L 2279.9538,715.8582 L 2283.2325,715.75186 L 2284.7389,715.87595 L 2286.7061,716.42533 L 2286.7061,715.00751 C 2288.1426,714.24432 2289.5767,713.49696 2291.2609,713.14665 L 2293.4762,715.34427 L 2294.0788,714.35179 L 2293.3877,712.82764 L 2296.0461,712.86308 L 2299.7501,716.74434 L 2299.7501,719.68632 L 2298.4209,721.01556 C 2300.1517,721.72095 2301.8003,722.89065 2303.6846,722.75239 C 2304.7567,720.69558 2305.6466,719.82918 2306.4671,719.36731 C 2306.7187,719.61878 2306.7288,719.77088 2306.9482,720.06255 L 2306.801,718.20305 L 2308.8677,715.2474 C 2308.4602,714.98443 2308.2147,714.85796 2307.7253,714.61761 L 2305.7758,713.66058 L 2305.2087,714.24546 C 2304.892,714.5622 2304.4303,714.81259 2304.1808,714.81259 L 2303.72,714.81259 L 2303.72,713.53655 C 2303.7152,712.83473 2303.4667,711.90265 2303.1883,711.46295 L 2302.6921,710.66546 L 2299.2007,712.10097 L 2297.4816,711.44526 L 2297.4816,709.67298 L 2298.4741,709.35397 C 2299.0199,709.17765 2300.2817,708.62833 2301.2743,708.13107 L 2303.082,707.22724 L 2300.7426,703.9485 L 2298.0487,702.72566 L 2298.0487,701.2015 L 2299.183,701.2015 L 2299.183,699.50011 L 2299.9982,699.50011 C 2300.4477,699.50011 2300.9752,699.75532 2301.1679,700.06724 L 2301.5224,700.63437 L 2303.5428,700.63437 L 2304.5707,701.76863 C 2305.1353,702.39247 2305.8931,702.90288 2306.2544,702.90288 L 2306.9101,702.90288 L 2307.1582,698.02909 L 2306.2366,695.79602 C 2305.7251,694.56184 2305.0332,693.23011 2304.7125,692.83635 L 2304.1453,692.10969 L 2302.6566,693.35028 L 2300.1223,692.97813 L 2299.7324,691.77298 L 2300.8667,690.44375 C 2301.4978,689.71606 2302.0186,689.01146 2302.0186,688.88414 C 2302.0186,688.75682 2300.8322,688.84325 2299.3779,689.06137 L 2296.7372,689.45127 L 2295.2663,687.46632 L 2293.4585,688.08665 C 2292.4593,688.43503 2291.1647,688.72467 2290.5875,688.72467 L 2289.5418,688.72467 L 2288.4075,687.59041 C 2287.7837,686.96657 2287.2733,686.25544 2287.2733,686.01305 C 2287.2733,685.77061 2286.5255,684.74977 2285.6073,683.74454 L 2283.9414,681.91912 L 2281.1589,681.91912 L 2280.5032,680.21774 L 2278.4296,680.21774 L 2274.1762,675.85793 L 2275.9661,674.36922 L 2279.1208,677.38209 L 2281.5311,677.38209 L 2281.8501,677.91378 C 2282.028,678.20165 2282.9705,678.60437 2283.9414,678.81761 L 2285.7137,679.20751 L 2287.4859,681.21021 C 2288.4609,682.31305 2289.395,683.73053 2289.5595,684.36486 L 2289.8608,685.51682 L 2290.552,685.74724 L 2291.2432,685.97761 L 2291.2432,684.18764 L 2292.0584,684.18764 C 2292.506,684.18764 2293.5907,684.47965 2294.4687,684.82566 C 2295.3468,685.17155 2296.8294,685.55776 2297.7651,685.69404 L 2299.4665,685.94216 L 2301.735,684.22308 L 2299.2539,684.18764 L 2298.5095,683.00018 L 2299.8742,681.36969 L 2297.9069,674.05021 L 2298.6158,672.20704 L 2299.6792,672.86276 L 2300.3172,671.83484 L 2299.6261,668.37892 L 2297.3576,667.47503 C 2296.1125,666.97693 2293.9154,666.42936 2292.4661,666.25219 L 2289.8253,665.93318 L 2286.7593,663.771 L 2284.4731,663.771 L 2283.2679,661.50249 L 2278.9081,659.28711 L 2278.2879,657.67437 L 2276.6928,657.95793 C 2275.8105,658.11718 2274.754,658.50924 2274.3534,658.82632 L 2273.6267,659.4112 L 2270.8797,657.94018 L 2267.3706,659.39345 L 2264.978,658.68454 C 2263.6686,658.2956 2262.029,657.75212 2261.3271,657.47939 L 2260.0511,656.98315 L 2260.0511,654.6615 L 2259.0586,654.30704 C 2258.5128,654.11348 2257.6195,653.57074 2257.0737,653.10189 L 2256.0812,652.2512 L 2256.0812,648.01543 L 2254.3798,647.35972 L 2254.3798,649.00791 L 2250.4099,650.67385 L 2250.4099,651.64863 L 2248.4073,652.60566 C 2247.3049,653.13127 2245.8453,653.56269 2245.164,653.56269 L 2243.9234,653.56269 L 2241.3181,650.53206 L 2240.0067,646.15457 L 2240.6801,641.77702 C 2241.0464,639.36978 2241.3379,637.06338 2241.3358,636.65516 L 2241.3358,635.91081 L 2239.9889,636.74375 L 2230.6136,637.06276 L 2228.2919,639.38447 L 2226.3069,639.41991 L 2220.5293,632.96883 L 2213.1389,636.7083 C 2213.1418,635.37067 2213.1881,633.895 2212.7845,633.69543 L 2210.6932,635.60949 L 2207.5208,632.57892 L 2205.3232,632.57892 z "},"co1":{"name":"CO-1","path":"M 915.16029,697.66052 L 914.17365,696.87283 L 914.45727,696.21825 C 915.08111,695.74691 916.52219,695.66995 916.40167,695.41401 C 915.75356,694.03736 916.55865,694.13502 916.94856,693.74512 L 917.65747,693.03621 L 917.65747,686.94439 L 924.55523,687.22592 L 925.22727,685.67975 L 926.3735,685.6261 L 926.34503,686.94967 L 930.01276,686.9436 L 930.09165,684.06746 L 932.62275,683.94593 L 933.42098,680.72322 L 935.06991,680.05253 C 936.59497,680.36995 937.2263,680.64898 938.73089,681.04903 L 939.54971,681.36543 L 938.42793,682.37214 C 938.14516,682.90354 938.45186,684.30327 938.26777,684.88866 L 936.47474,685.54784 L 931.99,684.73752 L 930.57371,686.44407 L 931.48826,686.79507 C 931.99125,686.98806 932.40281,687.37388 932.40281,687.65245 L 932.40281,688.1589 L 927.93962,688.1589 L 924.91144,689.31023 L 925.84862,692.52086 L 923.96292,694.08477 L 925.92864,694.16031 L 926.15254,695.32962 L 925.52496,696.17436 L 923.88465,697.46474 L 923.66166,695.74294 L 920.07326,694.39221 L 917.91301,695.21449 L 918.42059,696.83052 L 915.16029,697.66052 z "},"oh1":{"name":"OH-1","path":"M 1891.6786,676.97523 L 1889.6469,678.28706 L 1886.4891,676.81632 L 1883.8281,674.51781 L 1882.4404,674.51781 L 1880.1527,676.95748 L 1877.005,655.6415 L 1885.9153,653.96575 L 1885.1071,655.27343 L 1886.8596,655.94593 L 1886.3029,656.98622 C 1885.9967,657.55839 1885.7461,658.4261 1885.7461,658.91451 L 1885.7461,659.80246 L 1887.4989,659.80246 L 1886.9005,663.80378 L 1894.9941,663.25554 L 1894.8202,665.91793 L 1897.5111,666.59332 L 1898.3083,669.97936 L 1896.661,672.42749 C 1895.8046,673.69145 1895.5895,674.15717 1895.1228,675.31287 C 1894.9428,675.75846 1894.819,676.25243 1893.9612,676.27659 C 1893.4622,676.29009 1892.3507,676.48461 1891.6786,676.97523 z "},"ne1":{"name":"NE-1","path":"M 1292.5295,505.54207 L 1292.5295,510.06137 L 1290.6332,512.27672 L 1287.4254,511.6387 L 1287.4254,513.97811 L 1283.1719,514.33256 L 1282.8529,531.02741 L 1277.093,531.78949 L 1277.9614,548.059 L 1256.0738,548.07672 L 1256.8004,569.43266 L 1283.2782,568.91873 L 1284.0226,591.019 C 1282.4038,591.0575 1280.7391,590.87324 1279.1666,591.30256 L 1280.0527,634.12078 L 1301.4264,633.55365 L 1302.9151,676.93899 L 1376.4291,673.80209 L 1375.8266,672.82731 L 1374.7455,673.48308 L 1372.4947,672.77417 L 1372.4947,670.00942 L 1373.3454,670.00942 L 1373.3454,667.17378 L 1371.8921,667.17378 L 1371.5199,666.1813 C 1371.3163,665.63544 1370.671,664.84849 1370.0844,664.42672 L 1369.021,663.66467 L 1369.3755,660.22645 L 1365.4588,658.95041 C 1365.2692,657.97722 1365.0581,657.07026 1364.4131,656.36288 C 1364.1791,656.38126 1363.7963,656.37967 1363.5624,656.34513 C 1363.3285,656.3106 1362.5628,656.3237 1361.861,656.38058 L 1360.585,656.48692 L 1360.585,654.2184 L 1361.7724,653.8285 L 1359.9293,649.41556 L 1360.5141,647.20018 L 1358.3873,646.65081 L 1358.0329,643.63793 L 1360.1951,641.83021 L 1359.2558,640.32375 L 1358.3519,642.78724 L 1354.9137,642.78724 L 1354.5061,635.99939 L 1353.7794,635.1487 C 1353.3866,634.67537 1352.7751,634.28031 1352.4148,634.28031 L 1351.759,634.28031 L 1348.6753,630.75345 L 1348.6753,628.07734 L 1350.7843,626.96078 L 1349.893,621.44296 L 1352.0192,620.69338 L 1351.7465,618.79237 L 1350.3287,617.53584 L 1351.0963,614.68324 L 1349.0591,613.40374 L 1348.6753,610.39001 L 1347.6473,611.02803 L 1345.8396,610.33682 L 1345.8396,608.75952 L 1342.5609,608.75952 L 1341.9406,607.16447 L 1338.4315,606.40236 L 1336.7124,603.7617 L 1327.4788,602.94645 L 1324.6566,599.60635 L 1326.0433,597.41695 L 1323.1545,594.74078 L 1323.1545,592.82672 C 1322.1154,591.89657 1320.6889,591.07389 1320.0893,589.85667 L 1344.7555,588.17728 L 1344.9954,585.04645 L 1340.7709,584.33754 L 1340.0443,583.15009 L 1341.3026,581.87405 L 1341.2317,579.55239 L 1340.2038,582.10447 L 1339.4772,582.08672 C 1339.0772,582.07679 1338.3039,581.73896 1337.758,581.32467 L 1336.6648,579.95817 L 1337.37,577.67559 L 1335.525,576.2914 L 1336.1984,572.87088 L 1334.9401,571.34672 L 1335.5959,569.62764 L 1337.5454,569.62764 L 1335.4364,568.08573 C 1336.0756,566.66012 1336.8329,565.27903 1337.3327,563.79682 L 1335.0642,562.9284 L 1335.0642,561.01434 L 1333.8945,559.54335 L 1332.7248,558.05464 L 1333.0792,556.60137 C 1333.2676,555.80807 1333.555,554.7192 1333.7172,554.17335 L 1334.0008,553.18088 L 1331.6987,552.97942 L 1331.4972,551.47681 L 1329.9863,551.28365 L 1329.2334,549.21098 L 1327.2485,549.21098 L 1326.6104,546.76524 L 1327.7447,544.65623 L 1326.7699,544.28405 C 1326.2344,544.07856 1325.2826,543.39928 1324.6609,542.77761 L 1323.5267,541.64335 L 1323.1013,537.30127 L 1324.2887,537.30127 L 1324.2887,535.77712 L 1322.0202,533.72128 L 1322.6051,533.13642 L 1320.0707,530.44256 L 1319.7872,525.7283 L 1321.6835,523.6193 L 1320.4429,521.70524 L 1315.835,522.57365 L 1314.6121,520.28741 L 1310.2346,520.9786 L 1309.4194,518.30246 L 1305.9988,515.13009 L 1306.6369,511.21335 L 1301.6036,511.21335 L 1301.6036,509.0689 L 1296.8893,507.19029 C 1296.4259,507.75054 1295.8989,508.11438 1295.2411,508.37771 L 1293.6992,505.54207 L 1292.5295,505.54207 z "},"ca1":{"name":"CA-1","path":"M 57.394124,414.74831 L 55.480064,421.55385 L 51.829173,427.10108 L 52.821649,428.32395 C 53.366943,428.99735 54.07472,429.54681 54.381253,429.54682 C 54.687786,429.54682 55.059679,429.87083 55.214223,430.27346 C 55.368709,430.67609 55.527505,434.75943 55.568678,439.34751 L 55.639569,447.69494 L 54.593926,447.69494 L 55.143332,449.7685 L 52.591253,455.56385 C 51.190785,458.746 49.225514,462.61022 48.231451,464.1594 C 47.237331,465.70858 46.246842,466.9773 46.033827,466.97732 L 45.661649,466.97732 L 45.519867,468.71415 C 45.447104,469.66918 45.349304,470.6262 45.289471,470.84088 C 45.229582,471.05556 45.49823,471.81406 45.892045,472.52454 L 46.600956,473.81831 L 44.810956,477.34514 C 43.824946,479.28598 42.485331,481.63758 41.83353,482.57336 C 41.181786,483.50912 38.489541,486.69921 35.860956,489.66246 C 33.232371,492.62571 30.023869,496.45382 28.718679,498.16939 C 27.413546,499.88496 25.804829,502.35951 25.138679,503.66345 L 23.915808,506.03831 L 24.57155,513.8186 L 22.78155,517.29227 L 28.842738,526.80939 L 32.617689,530.44256 L 32.422738,535.03276 L 33.344322,535.03276 L 34.868481,538.57731 C 35.70681,540.52682 36.646059,542.57272 36.942045,543.11434 C 37.23803,543.65597 37.473728,544.74062 37.473728,545.52464 L 37.473728,546.94246 L 39.901748,549.37048 L 38.732045,555.73296 L 39.884025,557.91286 L 39.0865,567.64269 L 37.792738,569.34407 C 37.080481,570.27984 35.895891,572.1939 35.152045,573.59754 L 33.805114,576.14962 L 33.805114,582.6716 C 33.809311,586.25869 34.044924,591.69365 34.319075,594.74078 L 34.815312,600.27028 L 33.025312,602.50335 C 32.042081,603.72682 31.235313,604.98085 31.235313,605.30355 C 31.235313,605.62619 31.746863,606.72801 32.36957,607.74929 C 32.99222,608.77058 33.502636,609.92996 33.503827,610.31912 C 33.504962,610.70823 34.368586,612.23953 35.417887,613.7219 L 37.314223,616.41576 L 38.040857,619.41088 L 39.954916,618.98553 C 41.011987,618.74711 42.118371,618.39112 42.418382,618.20573 L 42.967787,617.86902 L 47.221253,619.05642 L 48.692243,617.03603 L 53.246995,619.09187 L 53.796401,621.18315 L 57.039668,621.94526 L 62.303334,627.03167 L 64.500954,626.32276 L 66.379574,628.41405 C 67.337204,633.4307 68.369144,636.58943 70.144244,641.45744 L 72.245804,639.33127 L 76.676504,643.63793 L 81.674324,651.63088 L 82.879474,660.03147 L 83.978284,660.72269 L 84.704914,666.02177 C 84.115274,666.58572 83.730144,667.25397 83.464324,667.95358 C 85.822184,668.76605 88.269134,669.30794 90.677494,669.95622 L 90.181254,667.86494 L 91.953524,666.09266 L 91.336654,663.10497 L 92.485214,662.56585 L 92.485214,660.2087 L 99.142124,661.18064 L 99.290754,659.76566 C 99.290754,658.74063 98.996894,657.08013 98.635014,656.07932 L 97.979274,654.25385 L 100.30095,649.57503 L 99.911054,643.17714 L 99.326204,640.32375 L 98.191944,639.63259 L 97.305804,633.979 L 96.401944,628.32546 L 95.639864,627.33298 L 92.396594,626.37595 L 90.890164,622.01615 L 92.999174,620.68692 L 95.037294,621.41358 L 92.343434,618.4716 L 93.052344,615.63595 L 90.181254,612.51675 L 91.475014,606.65048 L 92.024424,605.97702 L 91.262344,602.5211 L 88.798874,602.48566 L 86.601254,600.81972 L 84.509964,600.81972 L 83.925114,599.26011 C 83.600144,598.40233 82.879584,597.19009 82.312344,596.56625 C 81.745154,595.94241 81.109544,594.89736 80.912244,594.24454 L 80.557784,593.05714 L 82.932634,589.0518 C 83.393434,588.50594 84.087484,587.03849 84.456794,585.79081 C 84.826114,584.54312 85.359604,582.37386 85.661944,580.97021 C 85.964224,579.56657 86.292304,577.87658 86.299964,577.67378 L 79.494424,576.06098 L 81.142634,568.20982 L 79.813434,564.22217 L 80.167884,558.5686 L 81.302144,555.41395 C 81.709044,555.07043 82.680594,554.56217 83.411154,554.35058 L 83.411154,551.05415 L 55.178777,544.35494 L 66.928974,498.38207 C 67.217304,493.19072 67.435774,490.22816 66.237784,485.03682 L 70.438084,485.409 L 72.192634,487.30534 L 74.833334,485.55078 L 77.704424,481.9885 L 75.595414,478.78068 L 78.306994,476.05138 L 78.909564,472.84355 L 80.132444,473.21573 L 79.299474,470.66365 L 79.069074,459.74643 L 72.936994,458.11593 L 72.812934,456.59177 L 74.780164,454.18147 L 74.230754,448.54563 L 72.919274,446.95058 L 73.256004,444.96563 L 72.068574,444.22128 L 76.304324,437.84108 L 76.605604,429.54682 L 78.572834,429.77722 L 80.221054,426.83524 L 82.046504,427.79227 L 82.276894,426.71118 L 84.261844,426.67573 L 86.317684,423.84009 L 85.963234,421.92603 L 57.394124,414.74831 z "},"ut1":{"name":"UT-1","path":"M 514.62391,508.32454 C 508.67395,557.9951 498.61184,609.18248 492.0451,658.75543 C 518.91589,662.54357 543.23912,665.78096 570.98235,669.35365 L 573.32176,665.11793 L 575.50163,663.59378 C 576.69504,662.75244 578.91949,660.66779 580.44631,658.9681 L 583.21107,655.88434 L 585.26691,656.98315 L 586.45431,654.76784 L 586.45431,651.29417 L 587.58856,651.29417 L 587.58856,650.6916 C 587.58856,650.35739 587.20575,649.70615 586.73787,649.23833 L 585.88718,648.38764 L 585.88718,645.05576 L 584.84156,645.05576 L 583.93767,643.26573 C 583.44699,642.28204 583.05153,640.92513 583.05153,640.25286 L 583.05153,639.03001 L 584.66433,636.83239 L 584.04401,633.71318 L 585.42639,632.04724 L 584.32757,622.91999 L 585.16057,622.40605 L 584.77067,613.86368 L 586.36572,613.86368 C 587.31487,608.16863 587.305,605.16568 587.305,599.54368 C 587.81479,598.60389 588.12172,598.50436 589.28995,598.28533 L 591.57622,599.72091 L 593.95107,598.44487 L 602.22757,599.7918 L 602.98968,597.36375 C 602.31162,596.32318 601.57101,595.31278 601.19965,594.12051 L 601.19965,593.60652 L 612.82579,592.27734 L 614.16926,594.0085 L 614.20817,598.44487 L 615.41332,598.85246 L 615.76777,605.07318 L 617.06156,608.22784 L 619.63133,609.18487 L 620.32255,607.90883 C 620.70298,607.2032 621.40475,606.47915 621.88216,606.29603 L 622.75054,605.95932 L 622.75054,604.41741 L 625.30262,604.61239 L 625.58619,608.22784 C 629.81804,610.71504 631.92691,612.65609 635.33371,614.41306 C 635.54661,614.41997 635.88008,613.92033 636.07807,613.29655 L 636.43252,612.16229 L 638.96691,612.16229 L 640.11886,613.31424 L 643.89384,612.55219 L 645.71925,608.21009 L 647.70421,608.19239 L 648.62579,604.77187 L 652.15265,606.01246 L 656.86691,604.27563 L 658.97589,605.58711 L 661.15582,603.61992 L 664.11549,604.75417 L 672.94143,603.65536 L 674.11114,602.07801 L 678.45324,601.49318 L 684.53785,603.627 L 690.16797,603.54902 L 691.47945,593.53563 L 642.88361,588.05932 L 649.68916,525.71058 C 604.85162,520.49239 559.2975,514.81798 514.62391,508.32454 z "},"wv1":{"name":"WV-1","path":"M 2061.969,547.89421 C 2061.4316,548.15076 2060.8199,548.71572 2060.5281,549.37048 L 2058.7204,548.67929 L 2056.8595,551.53266 L 2058.2596,553.07454 C 2059.0276,553.91839 2060.0743,555.29378 2060.599,556.14058 L 2061.556,557.68246 L 2061.556,562.85751 L 2063.2574,566.93375 L 2063.2574,571.18724 L 2061.6624,572.51642 L 2061.2902,574.89127 C 2060.6467,581.23841 2060.9965,587.6473 2060.8649,594.01417 L 2058.6495,594.01417 L 2060.3863,596.49536 L 2059.0394,598.10811 L 2059.3584,601.759 L 2057.5507,603.26546 L 2061.2016,606.77457 L 2059.2875,607.85563 L 2059.2875,612.76487 L 2056.4342,613.93457 L 2050.7452,622.06929 L 2049.4869,626.25187 L 2047.3601,626.8013 L 2045.6587,630.87754 L 2043.7447,630.87754 L 2039.5621,634.97147 L 2037.3467,634.26256 L 2036.053,631.44467 L 2034.3693,631.44467 L 2030.8248,636.12348 L 2031.4805,640.51873 L 2025.8269,641.77702 L 2025.8269,644.59496 L 2023.6293,647.37741 L 2024.3914,649.20288 C 2024.809,650.20234 2025.1783,651.20201 2025.2067,651.43595 C 2025.235,651.66989 2025.2598,652.06711 2025.2598,652.32209 L 2025.2598,652.78288 L 2032.9338,655.28177 L 2037.7544,648.6712 L 2044.7686,642.67518 L 2043.851,646.19001 L 2045.4815,646.19001 L 2047.8032,648.74209 L 2048.5653,651.96764 C 2049.81,651.02377 2052.5225,650.56921 2055.2113,650.10672 L 2055.9556,651.29417 L 2058.3659,651.29417 L 2061.556,654.34249 L 2061.556,655.65397 C 2061.556,656.37094 2061.8612,658.06977 2062.2295,659.44665 L 2062.903,661.96328 L 2060.7419,665.70162 L 2065.2778,668.29028 L 2076.7622,655.42355 L 2078.6231,654.78553 L 2079.8459,653.56269 L 2073.1822,648.65345 L 2072.2252,643.49615 C 2074.244,640.72074 2075.6132,639.23702 2078.2863,637.11595 L 2079.9877,637.38177 C 2084.6241,637.91617 2089.2999,638.02353 2093.9533,638.3388 L 2095.3711,637.1514 L 2099.536,638.30335 L 2100.7943,640.64276 L 2104.2502,639.9516 L 2105.7921,641.22764 L 2105.7921,643.69107 L 2104.4275,645.05576 L 2105.3313,645.05576 C 2107.8234,644.46713 2110.1189,643.32108 2112.4558,642.291 L 2112.9521,635.37912 L 2115.5042,632.86249 L 2116.603,634.20942 C 2117.2078,634.94572 2117.7018,635.88642 2117.7018,636.30071 L 2117.7018,637.04506 L 2120.1121,637.36407 C 2121.4377,637.54255 2124.6916,637.74734 2127.343,637.80711 C 2129.9943,637.86683 2133.5482,637.74751 2135.2473,637.5413 L 2138.3488,637.16909 L 2138.9337,637.64764 C 2142.5869,639.88541 2146.4172,641.83957 2150.1699,643.90375 L 2150.613,643.62018 C 2150.86,643.46751 2151.2444,642.26809 2151.4637,640.94407 C 2151.683,639.62 2152.1026,638.05943 2152.403,637.4881 L 2152.9524,636.46018 L 2151.57,634.3689 C 2150.8101,633.22052 2150.0209,631.75517 2149.8154,631.10791 L 2149.4433,629.92051 L 2151.6409,616.98289 L 2153.1828,614.14724 C 2154.0378,612.58764 2155.1798,610.80118 2155.7172,610.17734 L 2156.6919,609.04308 L 2157.3831,606.77457 C 2157.7587,605.52689 2159.0574,602.52819 2160.2719,600.11081 L 2162.4873,595.71556 L 2155.7172,593.51794 C 2154.8555,597.18539 2151.8075,600.05852 2151.0383,603.81484 C 2150.6651,604.36456 2150.3203,604.71033 2149.5673,604.8782 L 2147.671,604.34652 L 2145.7747,603.83259 L 2144.3214,604.32883 L 2143.4707,606.38467 C 2142.9984,607.51484 2142.4268,608.57486 2142.1947,608.74177 C 2140.4961,610.66167 2139.0733,612.81404 2137.5513,614.87385 L 2137.5513,616.68157 L 2134.7156,617.39048 L 2134.7156,617.90447 C 2134.7156,618.18253 2134.3178,618.84732 2133.8295,619.39318 C 2133.3412,619.93904 2132.3789,621.27889 2131.6851,622.37061 L 2130.409,624.35556 L 2128.8671,625.29484 L 2122.0616,593.34071 L 2073.6075,603.67306 L 2061.969,547.89421 z "},"md1":{"name":"MD-1","path":"M 2291.8103,552.63147 C 2285.2483,554.08872 2278.7822,555.96485 2272.2444,557.52296 L 2274.9382,559.43702 C 2276.4198,560.48717 2277.6321,561.54226 2277.6321,561.79415 L 2277.6321,562.25494 L 2276.8523,562.25494 C 2276.428,562.25494 2275.1365,562.90643 2273.9812,563.69048 L 2271.8899,565.1083 L 2270.0467,564.08038 L 2267.477,565.25009 L 2268.4871,567.16415 L 2264.021,568.59972 L 2260.0688,569.82256 L 2261.3626,571.38217 L 2256.9851,575.86605 L 2255.0178,575.86605 L 2254.3089,574.7318 L 2252.1113,574.7318 L 2251.243,575.49907 C 2254.0282,576.77374 2254.8065,578.06561 2256.9176,578.84541 L 2258.1015,578.86991 L 2257.499,578.13457 C 2256.9327,577.5088 2256.5734,576.89942 2256.7015,576.78764 C 2256.8296,576.67586 2257.4746,576.29877 2258.137,575.95464 L 2259.3422,575.33437 L 2261.3626,577.56744 L 2260.0511,577.56744 L 2260.0511,578.7017 L 2260.9018,578.7017 C 2261.3739,578.7017 2262.2669,578.38654 2262.869,578.01048 L 2263.9501,577.33702 L 2265.0312,578.29405 C 2265.619,578.82607 2266.2896,579.26883 2266.5199,579.26883 C 2266.7502,579.26883 2267.7786,578.37327 2268.8061,577.28388 L 2270.6671,575.31662 L 2269.196,574.07603 L 2269.9936,572.85318 L 2273.2723,571.91385 L 2278.1992,566.7388 L 2278.1992,564.64751 L 2280.0424,563.9386 L 2281.7792,565.37415 L 2282.9667,565.1792 C 2283.6205,565.07225 2284.5849,564.60299 2285.1111,564.13355 L 2286.0681,563.28286 L 2286.6884,563.65504 L 2287.3087,564.04494 L 2286.5467,569.68078 L 2288.6025,571.16949 L 2286.1568,574.60771 L 2288.5139,575.22804 L 2287.7695,576.43318 L 2286.3517,576.43318 C 2285.5698,576.43318 2284.4384,576.69508 2283.835,577.01801 L 2282.7362,577.60289 L 2282.7362,579.83596 L 2280.9108,579.83596 L 2281.5665,582.45893 L 2280.0601,584.65655 L 2279.2449,592.31279 L 2280.4855,592.31279 L 2282.3641,596.24724 L 2283.9414,594.01417 L 2286.139,594.01417 L 2286.139,596.28269 L 2285.0048,596.28269 L 2285.0048,596.86751 C 2285.0048,597.19248 2285.4973,598.00687 2286.1036,598.65754 L 2287.2024,599.82724 L 2286.3871,600.64249 C 2285.9369,601.09273 2285.5719,601.69973 2285.5719,601.98942 L 2285.5719,602.5211 L 2281.1057,602.5211 L 2279.4221,600.14625 L 2278.6423,606.47325 L 2279.3867,610.46091 L 2280.4323,610.46091 L 2279.3689,607.66071 L 2280.4677,606.98724 L 2281.602,607.69615 L 2281.3184,605.07318 L 2283.3034,605.23266 L 2283.3034,604.22249 L 2285.8554,604.24018 L 2287.9467,610.95714 L 2287.2024,612.16229 L 2285.0756,612.16229 L 2284.3667,611.02803 L 2283.6578,611.73695 C 2283.273,612.12917 2282.9196,612.95627 2282.8603,613.58011 C 2282.8009,614.20396 2282.6762,615.47228 2282.5945,616.39801 L 2282.4527,618.0817 L 2285.2883,618.11714 L 2286.6707,616.41576 L 2289.6304,620.11979 L 2290.6583,619.48177 L 2292.9446,620.70467 L 2292.9446,622.93774 L 2291.2077,622.93774 L 2290.5343,624.69226 L 2287.5037,624.63912 L 2287.5746,625.91516 C 2287.6135,626.61698 2287.8355,627.62205 2288.0708,628.14823 L 2288.4962,629.10526 L 2290.1089,628.48494 L 2290.1089,631.33833 L 2286.7061,632.52573 L 2286.7061,633.00427 C 2286.7061,633.27122 2287.5994,634.35642 2288.6911,635.41457 L 2290.676,637.34632 L 2290.676,638.85279 L 2293.6889,639.98704 L 2293.0332,640.66051 C 2292.6705,641.02319 2292.3774,641.50978 2292.3774,641.75932 L 2292.3774,642.22011 L 2295.0713,642.22011 L 2296.5246,643.97464 L 2296.8613,643.4784 C 2297.0448,643.19977 2297.9107,642.78622 2298.7754,642.57457 L 2300.335,642.20236 L 2301.0084,643.9215 L 2301.611,643.9215 C 2301.943,643.9215 2302.6864,644.34248 2303.2592,644.86078 L 2304.2871,645.80011 L 2303.5782,641.93655 L 2302.7984,641.31622 C 2302.3691,640.96988 2302.0186,640.39566 2302.0186,640.04018 L 2302.0186,639.38447 L 2303.1529,639.38447 L 2303.1529,635.41457 L 2303.8086,635.41457 C 2304.174,635.41457 2304.9396,635.83759 2305.51,636.35385 L 2306.5556,637.29318 L 2306.5556,638.97682 L 2304.8011,640.27061 L 2307.6899,642.98216 L 2307.6899,641.08586 L 2309.9939,641.08586 L 2310.5964,642.66315 L 2312.5814,642.14922 L 2314.0701,643.9215 L 2312.6523,645.62288 L 2311.6952,645.62288 C 2311.172,645.62288 2310.5005,645.87832 2310.1888,646.19001 L 2309.6217,646.75714 L 2310.0825,650.70929 L 2311.9434,648.51167 L 2316.1968,647.76731 L 2316.1968,648.2813 C 2316.1968,648.56832 2315.8218,649.30622 2315.3639,649.9118 C 2314.9059,650.51726 2314.5231,651.4545 2314.5132,652.00308 L 2314.4954,653.01325 L 2316.7285,651.61318 L 2318.0046,652.88922 L 2315.8069,655.08685 L 2315.098,658.66685 L 2316.3741,661.50249 L 2318.4653,661.50249 L 2318.4653,659.34031 L 2322.2935,655.3881 L 2324.1898,654.96276 C 2325.2309,654.73409 2326.4764,654.31918 2326.9546,654.04117 C 2332.7647,651.33671 2338.8936,649.35306 2344.8014,646.88117 L 2345.1736,645.44566 C 2345.3851,644.65474 2345.7458,640.47114 2345.9711,636.15892 L 2346.3787,628.32546 L 2347.4952,626.94308 L 2346.7332,620.27932 L 2316.3386,627.54566 L 2291.8103,552.63147 z M 2268.558,593.92553 L 2269.196,595.57378 L 2266.5731,598.53345 L 2261.9829,597.59417 C 2261.6932,598.37341 2261.4643,599.16801 2261.2385,599.96902 L 2264.0564,603.19457 L 2269.2492,601.42229 L 2270.224,601.93622 C 2270.7613,602.22381 2271.5319,602.85872 2271.9431,603.35405 L 2272.7051,604.25794 L 2273.2723,604.06296 C 2273.5887,603.95747 2274.2231,603.32166 2274.6724,602.64513 L 2275.4877,601.42229 L 2272.4925,600.05761 L 2273.0242,598.63979 L 2271.7481,595.21932 L 2270.862,594.90031 C 2270.3767,594.72359 2269.6571,594.42636 2269.2669,594.24454 L 2268.558,593.92553 z M 2282.8071,596.56625 L 2282.7717,597.75365 C 2282.7519,598.40352 2282.9004,599.1054 2283.1084,599.31325 C 2283.3163,599.52122 2283.5827,599.60107 2283.6933,599.49048 C 2283.804,599.37978 2283.6553,598.6779 2283.3566,597.93088 L 2282.8071,596.56625 z M 2303.1529,647.60784 L 2303.1174,648.17496 C 2303.0941,648.48688 2303.1915,649.38011 2303.3478,650.15991 L 2303.6314,651.57774 L 2306.3784,651.73721 L 2304.9606,647.60784 L 2303.1529,647.60784 z M 2306.4848,652.32209 L 2305.8822,652.92467 L 2306.2544,653.52724 C 2306.4599,653.85986 2306.8647,654.12982 2307.1582,654.12982 C 2307.4518,654.12982 2307.6899,653.89162 2307.6899,653.59813 C 2307.6899,653.30464 2307.4199,652.89983 2307.0873,652.69424 L 2306.4848,652.32209 z M 2308.5583,656.50467 L 2307.6899,657.03635 L 2307.6899,658.38328 C 2307.6899,659.1244 2307.9352,660.38326 2308.2393,661.18348 L 2308.7887,662.63675 L 2309.9584,662.63675 L 2310.242,657.81615 L 2308.5583,656.50467 z "},"districtofcolumbia":{"name":"District-of-Columbia","path":"M 2249.2048,621.02249 L 2247.9999,617.47583 L 2243.5169,615.46287 L 2246.2857,611.4316 L 2252.5698,615.28286 C 2251.4688,617.07828 2250.6715,619.49317 2249.2048,621.02249 z "},"wy":{"name":"WY At-Large","path":"M 643.94925,587.01115 C 654.33076,505.04416 662.63931,422.82879 672.40924,340.79256 C 779.40952,352.72127 870.42291,360.08969 977.77311,364.99228 C 974.70261,447.58428 971.13141,530.16504 967.38221,612.73078 C 859.26419,608.72356 751.53492,598.03421 643.94925,587.01115 z "},"in1":{"name":"IN-1","path":"M 1741.0927,611.0294 C 1735.8861,573.88978 1735.4527,571.69017 1731.3917,536.55531 L 1732.7632,537.17059 C 1733.465,537.35148 1734.3171,537.87369 1734.6567,538.33107 L 1735.2743,539.16265 L 1743.6804,539.68396 C 1747.1139,537.95117 1750.4815,536.07899 1753.974,534.467 C 1754.2732,539.71326 1754.6679,543.52755 1755.4444,548.20102 L 1759.8436,547.49756 C 1760.5941,559.22835 1760.6763,557.95361 1763.8135,580.66277 L 1761.4,580.97157 L 1762.1064,585.38939 C 1760.4069,586.19097 1758.7074,585.84695 1757.0079,586.07573 L 1759.994,608.68126 L 1741.0927,611.0294 z "},"ia1":{"name":"IA-1","path":"M 1554.2594,469.15722 L 1514.7199,472.79039 L 1515.5174,483.35316 L 1473.1069,486.98633 C 1473.2251,493.98425 1473.6222,501.05096 1474.6487,507.97009 L 1496.1287,506.51682 L 1496.1287,511.69187 L 1497.263,512.06405 L 1498.0073,522.55593 L 1551.5301,517.93029 L 1553.4974,539.74702 L 1574.6761,537.95702 L 1576.7851,559.50791 L 1582.2351,559.48174 C 1582.2315,563.53966 1582.3579,565.27106 1582.9703,567.92625 L 1583.3602,567.92625 C 1583.575,567.92449 1584.6691,567.66997 1585.7883,567.35912 L 1587.8264,566.79197 L 1591.8849,562.25494 L 1596.3687,562.25494 L 1599.3462,558.35593 L 1601.4729,557.68246 L 1601.4374,555.28989 C 1601.4207,553.97265 1601.5752,551.62126 1601.7742,550.06167 L 1602.1287,547.22603 L 1607.3746,543.20296 L 1607.8531,530.3185 L 1606.6834,528.9184 L 1606.3289,525.00167 L 1603.7946,522.46731 L 1596.2269,519.68484 L 1593.0014,516.17573 L 1593.6926,512.70207 C 1592.3389,511.15846 1591.4108,509.72758 1589.4849,508.37771 C 1589.1457,508.37771 1587.365,507.97059 1586.8162,507.47385 C 1586.2673,506.97711 1584.9626,506.14769 1583.9273,505.63068 L 1581.3034,503.01431 L 1582.2617,501.05871 C 1580.8333,498.98284 1579.5839,496.77527 1578.0611,494.76662 L 1567.8705,493.01207 L 1561.9334,489.9992 L 1559.08,480.6593 L 1556.8115,479.95039 L 1556.8293,477.03273 L 1554.2594,469.15722 z "},"nj1":{"name":"NJ-1","path":"M 2334.4786,549.18483 L 2326.6887,545.29748 L 2322.8093,545.24245 L 2322.9824,544.14547 C 2323.3053,543.54214 2323.5695,542.65547 2323.5695,542.17509 L 2323.5695,541.30168 L 2319.9635,539.43694 L 2316.9905,543.07958 C 2316.451,542.33319 2315.8509,541.72009 2315.0663,541.27255 L 2311.9434,545.2347 L 2310.5012,545.24245 L 2309.2304,542.45327 L 2311.1427,539.53474 L 2317.3311,536.79794 L 2317.3311,535.57319 L 2320.2926,534.44724 L 2319.6189,529.64641 C 2320.623,528.57198 2321.4925,527.30952 2322.7515,526.5272 L 2326.6887,529.54595 L 2323.639,528.79155 L 2322.8943,529.99658 L 2325.9664,534.42972 C 2327.1073,533.81946 2328.2518,533.18767 2329.4902,532.86558 L 2332.8217,539.00009 L 2338.2821,542.50403 C 2337.033,544.72185 2336.1993,547.28609 2334.4786,549.18483 z "},"il1":{"name":"IL-1","path":"M 1719.8436,547.79504 C 1719.7102,547.79504 1719.5774,547.19045 1719.5774,546.79871 L 1719.0566,546.2285 L 1716.1747,544.58025 L 1716.1747,543.17268 C 1716.1747,542.39851 1716.4306,541.28701 1716.7433,540.70266 L 1717.3119,539.64022 L 1722.3104,538.89064 L 1722.9255,536.53868 L 1722.6358,536.06997 C 1722.4765,535.81218 1721.9784,535.60126 1721.5289,535.60126 L 1720.7117,535.60126 L 1720.7117,534.5932 C 1720.7117,534.03875 1721.0926,533.04132 1721.5581,532.37666 L 1722.4046,531.1682 L 1725.4118,532.18039 L 1726.0818,529.4163 L 1727.374,531.25187 L 1726.329,535.03656 L 1723.4281,537.9375 L 1724.017,540.98898 L 1719.8436,547.79504 z "},"pa1":{"name":"PA-1","path":"M 2316.4102,519.91545 L 2316.3032,520.39375 L 2317.8982,522.05969 L 2317.8982,527.69553 L 2316.0374,530.53118 L 2313.7688,528.20949 L 2312.4928,530.14128 L 2314.4954,531.70088 L 2314.4954,534.94415 L 2308.257,538.94949 L 2308.257,539.55207 C 2308.257,539.87849 2308.4923,540.13691 2308.7887,540.13692 C 2309.0852,540.13692 2309.5318,539.79962 2309.7812,539.37484 L 2310.242,538.59504 L 2315.8247,536.14929 L 2317.402,533.8985 L 2319.1566,533.8985 L 2318.7312,532.3389 C 2318.4979,531.48112 2318.3198,530.36729 2318.3413,529.85771 L 2318.3768,528.93613 L 2319.7059,527.5183 C 2320.4299,526.74014 2321.5278,525.36571 2322.1517,524.46999 L 2323.0024,523.45979 L 2323.1265,522.46731 L 2322.1517,521.72296 C 2322.1517,521.72296 2322.0434,522.39021 2321.9745,522.87494 L 2320.6098,520.85454 L 2319.5287,522.09514 L 2319.5287,523.60157 L 2318.6958,523.60157 L 2318.6958,522.1483 L 2316.4102,519.91545 z "},"sd":{"name":"SD At-Large","path":"M 1316.539,521.42304 L 1315.1049,519.02394 L 1311.1928,519.65878 L 1310.7122,518.41418 C 1310.4478,517.72965 1309.5489,516.58198 1308.7147,515.86379 L 1307.1978,514.558 L 1307.9633,511.07304 L 1306.4242,510.09784 L 1302.7378,510.08047 L 1302.7378,508.40743 L 1297.5229,506.03174 L 1295.7882,506.6974 L 1294.5145,505.1623 L 1289.8126,503.8321 L 1288.0802,504.49688 L 1286.9021,503.31878 L 1283.9945,502.14067 L 1283.8268,499.63605 L 1277.4885,499.19963 L 1272.3965,499.52543 L 1257.3499,499.90259 L 1255.0562,498.67506 L 1252.8331,499.38062 L 1252.1173,502.42423 L 1249.2155,505.54344 L 1245.711,505.54344 L 1241.2044,501.04372 L 1240.2099,501.02506 C 1239.6629,501.0148 1238.263,500.49599 1237.099,499.87215 C 1235.9351,499.24831 1234.5324,498.7379 1233.9819,498.7379 L 1232.981,498.7379 L 1232.981,497.63687 L 1226.7248,494.67719 L 1225.1016,491.53832 C 1134.1392,491.9561 1059.274,490.76414 973.94561,487.96245 C 978.98701,366.17459 979.98561,366.54126 982.39611,306.25514 C 1089.0576,309.71988 1198.3449,311.4341 1305.0064,307.45908 L 1305.0064,313.02351 L 1303.5885,315.11002 C 1302.8087,316.25761 1302.1707,317.4523 1302.1707,317.76489 C 1302.1707,318.07748 1301.2148,319.04806 1300.0464,319.92171 C 1298.878,320.79537 1296.8363,322.56668 1295.5093,323.85797 L 1293.0967,326.20575 L 1293.0967,328.33651 L 1297.4604,333.61718 L 1298.2132,335.50348 C 1298.6272,336.54095 1299.4492,338.0916 1300.0398,338.94938 L 1301.1137,340.50899 L 1304.4769,340.50899 L 1309.8851,343.24952 L 1311.3792,346.46384 C 1312.8369,383.5922 1314.2947,420.72055 1315.7525,457.8489 L 1309.4077,458.18819 L 1309.0363,462.37688 L 1312.931,465.7965 L 1312.2452,470.80025 L 1310.5272,470.66503 C 1310.3171,471.62643 1310.2436,472.5299 1310.555,473.46826 C 1310.7619,473.79801 1310.938,474.43157 1310.9462,474.87617 L 1310.9612,475.68455 L 1314.2668,476.57163 L 1315.2147,475.98581 L 1315.2613,476.44462 C 1315.287,476.69697 1315.431,477.6627 1315.5814,478.59069 C 1315.7317,479.51868 1316.0945,480.56678 1316.3875,480.9198 L 1316.9202,481.56165 L 1316.233,484.99756 L 1313.4021,486.28743 L 1313.7917,487.26672 C 1314.0061,487.80533 1314.2225,489.2249 1314.2727,490.42131 L 1314.364,492.59659 L 1312.9462,493.77262 L 1312.9462,498.77349 L 1311.3471,499.3871 L 1310.9844,500.83239 C 1310.7849,501.6273 1310.2514,502.6479 1309.7989,503.10038 L 1308.9763,503.92307 C 1308.9163,505.19096 1309.08,506.43188 1309.3337,507.67017 L 1314.6724,512.41698 L 1315.7818,515.26565 L 1315.7818,517.45314 L 1316.6892,517.45314 L 1316.6892,519.43809 C 1316.6892,520.52982 1316.6216,521.42304 1316.539,521.42304 z "},"wi1":{"name":"WI-1","path":"M 1660.7851,494.09888 L 1656.7189,490.37376 L 1655.5734,486.22537 L 1653.034,483.85727 L 1655.0261,479.61293 L 1654.5614,473.37444 L 1675.5614,471.2033 L 1674.9051,465.4553 L 1690.645,463.41088 L 1691.5583,461.97205 L 1694.7796,461.81989 L 1695.9033,457.97024 L 1697.4421,457.05925 L 1698.6336,459.60602 L 1699.2409,459.60602 C 1699.575,459.60602 1700.3623,460.25955 1700.9906,461.05831 L 1702.133,462.51061 L 1703.7618,461.8856 L 1710.2198,470.21362 L 1709.2662,480.87334 L 1710.9022,487.89119 L 1660.7851,494.09888 z "},"ny1":{"name":"NY-1","path":"M 2401.7316,459.53252 L 2400.7793,460.24536 L 2397.5643,456.5351 L 2399.877,453.61727 L 2396.6745,451.59712 L 2390.3855,452.90272 L 2388.725,450.53196 L 2386.7476,450.53196 L 2386.0671,449.8514 C 2385.6928,449.4771 2385.3865,448.97306 2385.3865,448.73132 L 2385.3865,448.2918 L 2388.6745,448.94939 L 2392.1921,446.34875 L 2392.1921,443.79335 L 2392.8668,443.37636 C 2393.2379,443.14701 2394.3225,442.89592 2395.2771,442.81838 C 2396.2317,442.74083 2398.2887,442.28432 2399.8483,441.80391 C 2401.4079,441.32349 2403.96,440.49386 2405.5196,439.96027 C 2407.0792,439.42668 2409.1209,438.43043 2410.0566,437.74639 C 2410.9924,437.06234 2412.4818,436.33117 2413.3665,436.12157 L 2414.9749,435.74049 L 2416.3491,434.20394 C 2417.1048,433.35885 2418.3589,432.01978 2419.1359,431.22823 C 2419.9128,430.43668 2420.5485,429.47796 2420.5485,429.09774 L 2420.5485,428.40643 L 2421.9663,427.17365 C 2422.7461,426.49562 2423.3842,425.65287 2423.3842,425.30085 C 2423.3842,424.94884 2423.7878,424.16543 2424.2811,423.55996 L 2425.1782,422.45909 L 2424.5949,424.33747 L 2425.5938,425.24144 C 2426.1432,425.73863 2426.8603,426.14542 2427.1875,426.14542 C 2427.5146,426.14542 2428.0674,426.48899 2428.4159,426.90892 L 2429.0496,427.67242 L 2433.2633,427.4166 L 2433.4751,426.78101 C 2433.5917,426.43144 2433.9871,426.14542 2434.354,426.14542 L 2435.021,426.14542 L 2436.4377,428.41394 L 2437.8933,428.41394 L 2440.3399,425.92108 C 2441.6855,424.55 2443.0785,422.8475 2443.4354,422.13773 L 2444.0844,420.84724 L 2446.6364,420.66369 L 2446.6364,421.13979 C 2446.6364,421.40165 2445.9538,422.18842 2445.1194,422.88818 C 2444.2851,423.58794 2442.1796,425.41861 2440.4406,426.95633 C 2438.7016,428.49406 2434.4554,432.3813 2431.0046,435.59466 L 2424.7303,441.43712 L 2416.2593,447.74709 C 2411.6001,451.21757 2406.6397,455.12864 2405.236,456.43836 C 2403.8324,457.74808 2402.2554,459.14045 2401.7316,459.53252 z "},"mn1":{"name":"MN-1","path":"M 1492.017,388.89078 L 1492.6728,394.38484 L 1487.161,394.38484 L 1488.1003,405.10712 L 1433.1774,409.13019 L 1433.1774,406.45405 L 1422.402,407.02118 L 1422.402,404.78811 L 1425.7162,400.35742 L 1423.873,397.23821 L 1425.2376,395.85583 L 1425.0238,393.48251 L 1387.5794,395.69633 L 1385.5556,393.74644 L 1384.2449,394.24535 L 1385.0601,406.86167 C 1381.4388,407.09207 1376.8196,406.75229 1374.1961,407.55286 L 1374.1961,412.44435 C 1354.4057,413.52067 1334.9716,414.24064 1314.8248,415.03187 L 1316.9693,457.90326 C 1397.7558,454.27231 1468.2237,449.90473 1550.0414,442.59078 L 1548.7831,440.23365 L 1549.4743,438.44365 L 1547.0108,435.82068 L 1546.8691,425.29336 L 1546.0006,423.73375 C 1545.5296,422.87496 1543.4995,420.15691 1541.4813,417.69029 L 1537.8127,413.20643 C 1535.8119,412.91227 1533.8139,412.60095 1531.8224,412.2494 C 1531.2343,412.13615 1530.3353,411.70164 1529.8374,411.29237 C 1529.3396,410.8831 1528.4885,410.15358 1527.9411,409.66187 C 1527.3938,409.17016 1526.5314,408.60389 1526.0093,408.40356 L 1525.0523,408.03138 L 1525.0523,406.82623 L 1517.1479,402.60821 L 1515.996,398.12435 L 1514.2237,397.13187 L 1514.8617,395.16464 L 1513.5679,394.01266 C 1512.8632,393.38477 1510.751,392.23647 1508.8714,391.44286 C 1506.9918,390.64925 1504.3743,389.80431 1503.0584,389.58197 L 1500.6658,389.19207 L 1500.0277,388.14643 L 1492.017,388.89078 z "},"ny26":{"name":"NY-26","path":"M 2148.125,356.96875 L 2140.6563,360.03125 L 2132.7188,360.21875 L 2128.1875,361.09375 C 2125.6921,361.5818 2122.6298,362.36216 2121.375,362.8125 C 2120.1202,363.26282 2117.4775,363.80172 2115.5,364.03125 L 2111.9063,364.46875 C 2112.1993,366.68727 2112.5613,367.87727 2113.25,369.9375 L 2109.625,371.8125 L 2104.9375,371.125 L 2103.6875,372 L 2102.9375,377.59375 L 2101.625,378.40625 L 2103.6875,383.03125 L 2107.3438,383.71875 L 2108.625,386.46875 L 2110.0625,387.03125 L 2113,386.28125 L 2113.25,386.21875 L 2113.3125,386.46875 L 2115.125,393.1875 L 2119.6563,391.78125 L 2118.8438,388.75 L 2118.7813,388.5 L 2119.0313,388.4375 L 2123.9375,387.15625 L 2124.1875,387.09375 L 2124.25,387.34375 L 2125.1563,390.6875 L 2125.2188,390.90625 L 2125,391 L 2124.1563,391.25 L 2124.9375,395.875 L 2125.875,395.6875 L 2126.125,395.65625 L 2126.1563,395.875 L 2129.5938,410.90625 L 2130.625,411.3125 L 2157.5313,405.03125 L 2158.8438,407.53125 L 2163.1563,406.71875 L 2162.4375,402.8125 L 2164.7813,402.1875 L 2164.7813,398.9375 L 2171.9688,397.71875 L 2170.8438,392.71875 L 2165.9375,393.40625 L 2164.6563,390.125 L 2164.5313,387.3125 C 2164.461,385.75289 2164.1968,383.88932 2163.9688,383.1875 L 2163.5625,381.90625 L 2164.7813,381.90625 L 2164.7813,379.59375 L 2163.0313,376.96875 L 2156.4375,378.6875 L 2155.5313,372.28125 L 2150.75,372.28125 L 2150.0313,367.25 L 2152.2813,366.53125 L 2152.2813,363.1875 L 2154,363.1875 L 2155.125,362.0625 C 2155.7488,361.43866 2156.2811,360.68853 2156.2813,360.40625 L 2156.2813,359.90625 L 2151.25,356.96875 L 2148.125,356.96875 z "},"ct1":{"name":"CT-1","path":"M 2390.5737,405.03631 L 2389.6019,400.9082 L 2387.0754,400.5441 L 2385.3754,397.25673 C 2386.5663,396.61875 2387.7612,395.96301 2389.0535,395.62043 L 2391.1086,399.53224 L 2397.2912,398.11431 L 2395.6511,392.50299 L 2393.4467,391.55057 L 2392.6359,381.30497 L 2385.5777,383.18303 L 2385.5076,384.85804 L 2384.2523,384.87963 L 2384.2523,388.71493 L 2385.3865,388.71493 L 2385.3865,390.88963 L 2380.1603,392.88556 L 2378.2974,391.70282 L 2377.0484,393.04452 C 2376.3615,393.78245 2375.5667,394.38621 2375.2821,394.38621 L 2374.7647,394.38621 L 2373.9261,379.6657 L 2386.7184,376.16512 L 2387.6798,377.8831 L 2393.467,377.1977 L 2394.471,378.99159 L 2398.0889,377.95397 L 2398.8471,379.1807 L 2400.5804,378.28438 L 2402.9307,376.63396 L 2402.7787,380.20199 L 2404.6689,382.04827 L 2404.6689,384.60141 L 2406.5093,384.54227 L 2408.4027,388.72515 L 2406.3703,388.78999 L 2406.3703,393.69773 L 2404.5665,394.3899 L 2403.6632,393.83157 L 2402.3217,395.44797 L 2403.6317,397.89588 L 2407.5046,396.53338 L 2407.5046,399.18897 L 2407.5046,401.84456 L 2402.4373,401.53294 C 2402.123,401.95704 2401.7182,402.13078 2401.2626,402.32602 L 2399.5197,399.33802 L 2394.177,404.8781 L 2390.5737,405.03631 z "},"ma1":{"name":"MA-1","path":"M 2357.5996,382.372 L 2356.9131,381.26129 L 2355.8958,338.9949 L 2430.9105,319.32679 L 2432.3971,321.35981 L 2430.6264,324.06226 L 2428.0441,324.06226 L 2427.3408,326.86448 L 2428.3564,331.38438 L 2427.2276,331.76064 L 2429.2218,338.86803 L 2428.7133,339.36481 L 2425.0961,340.6293 L 2424.7592,339.57667 L 2422.6448,334.27057 L 2421.8293,334.27057 L 2421.0139,334.27057 L 2419.9494,335.54661 C 2419.3639,336.24843 2418.8764,337.05551 2418.866,337.34013 L 2415.3541,343.30105 L 2418.2596,348.16523 L 2413.4594,350.47238 L 2413.5938,351.58731 C 2413.6677,352.20053 2413.8922,353.70403 2414.0928,354.92842 L 2414.4574,357.15459 L 2412.9401,355.63733 C 2412.1057,354.80284 2411.2229,354.12008 2410.9784,354.12008 L 2404.3853,358.45423 L 2404.5429,360.35849 L 2404.108,360.35849 C 2403.8687,360.35849 2403.3229,359.83339 2402.8949,359.19159 L 2402.1168,358.0247 L 2396.6086,360.46486 L 2395.4492,359.30544 L 2395.2586,357.1381 C 2395.1538,355.94607 2394.8389,353.8908 2394.5588,352.57084 L 2394.0495,350.17091 L 2392.6203,348.44879 L 2390.9129,348.44879 L 2391.6606,353.12486 L 2388.5322,352.52683 L 2384.2433,354.71483 L 2386.5438,359.22424 L 2387.066,359.22424 C 2387.3532,359.22424 2387.7444,358.9714 2387.9354,358.66238 L 2388.2826,358.10051 L 2392.7344,358.27495 L 2392.0654,360.94035 L 2393.3459,362.48324 L 2392.6343,364.33758 L 2394.5138,368.29829 L 2395.0543,368.29829 C 2395.3516,368.29829 2395.5948,368.5197 2395.5948,368.79031 L 2395.5948,369.28232 L 2391.1162,369.02961 L 2390.4917,370.65694 L 2391.2113,373.5242 L 2389.6499,374.48921 L 2389.64,376.42401 L 2388.2222,376.89975 C 2387.8264,375.56932 2387.2738,374.78937 2385.8386,375.05344 L 2357.5996,382.372 z "},"vt":{"name":"VT At-Large","path":"M 2354.8405,337.78477 L 2343.1354,290.32349 C 2342.5532,288.50185 2340.9561,288.86184 2339.9549,288.5741 L 2338.5162,285.36426 L 2334.9121,287.22802 L 2334.796,290.3181 L 2333.7841,286.3482 L 2334.4841,278.06244 L 2332.1989,275.57275 L 2331.3869,271.60285 L 2329.4205,269.33434 L 2327.4339,262.81236 L 2325.838,262.81236 L 2325.838,253.86855 L 2327.7205,248.03973 L 2325.0466,242.33095 L 2325.3475,237.43854 L 2324.5146,235.52189 C 2324.0566,234.46772 2323.0082,232.90341 2322.1849,232.04562 C 2321.3616,231.18784 2320.4741,230.48602 2320.2126,230.48602 C 2319.9511,230.48602 2319.4432,229.77626 2319.0839,228.90878 C 2318.7246,228.04129 2318.2944,226.31864 2318.128,225.08066 C 2317.9616,223.84268 2317.7684,221.34047 2317.6986,219.52021 L 2317.5717,216.21064 L 2314.779,214.10195 L 2315.1697,207.76527 C 2314.5071,206.79339 2313.8696,205.8076 2313.3612,204.75109 L 2389.9882,181.47666 L 2388.8198,183.04001 L 2390.4907,183.98147 L 2390.4907,184.83986 C 2390.4907,185.31197 2390.7975,186.18945 2391.1724,186.78981 L 2391.8541,187.88137 L 2390.4875,190.50345 L 2390.8569,194.82994 L 2390.1067,196.27607 C 2389.694,197.07145 2389.3564,197.91098 2389.3564,198.1417 L 2395.5948,205.78487 L 2395.5948,207.80087 L 2395.364,210.06939 L 2395.3113,212.94664 L 2393.8353,213.85858 L 2393.6558,215.22497 C 2393.5571,215.97649 2393.3,217.00586 2393.0845,217.51246 L 2392.6926,218.43355 L 2388.7927,220.53384 L 2388.079,224.33816 L 2387.1581,224.62961 C 2386.6516,224.7899 2385.5424,225.18041 2384.6931,225.4974 C 2383.8439,225.8144 2382.5678,226.62189 2381.8575,227.29184 L 2380.5659,228.50993 L 2379.3148,232.00678 L 2380.8495,234.10558 L 2380.8495,236.91869 L 2382.7041,238.96803 L 2382.8576,240.36591 C 2382.942,241.13474 2383.1801,242.03725 2383.3866,242.37148 L 2383.7622,242.97917 L 2382.5064,249.02846 L 2383.4708,253.45473 L 2381.978,256.29038 L 2382.6634,263.66305 L 2380.0082,267.0262 L 2379.9008,275.80016 L 2378.7758,277.27414 L 2378.9308,281.43317 L 2380.1301,282.94543 L 2380.9069,290.85377 L 2381.3035,291.15307 C 2381.5217,291.31767 2381.8089,291.83517 2381.9416,292.30305 L 2382.5208,302.6176 L 2384.3658,306.1977 L 2384.6836,311.82373 L 2385.8899,312.22584 L 2385.5537,313.18167 C 2385.3688,313.70738 2384.7368,314.67323 2384.1493,315.32799 L 2383.081,316.51849 L 2384.1382,319.29907 L 2383.5373,322.4427 L 2384.3122,323.96139 C 2384.7384,324.79667 2385.7287,326.1109 2386.5128,326.8819 L 2387.9386,328.28372 L 2389.3564,327.98244 C 2389.4262,328.39994 2389.3022,328.80161 2389.2147,329.1685 L 2354.8405,337.78477 z "},"nh1":{"name":"NH-1","path":"M 2424.0222,217.72425 L 2423.6855,218.66356 L 2424.288,221.05613 L 2415.4798,223.2892 L 2415.1076,235.00396 L 2412.1834,229.17316 L 2410.7655,229.13772 L 2409.5427,226.90465 C 2408.9513,227.38808 2408.9453,227.87615 2409.2059,228.4997 L 2412.6087,231.72524 L 2412.5201,233.51524 L 2414.3455,234.73811 L 2414.3278,238.70801 L 2416.5786,244.04257 C 2414.2461,245.8853 2411.3202,246.84811 2408.7097,248.24287 C 2410.8067,252.54681 2412.4541,255.27087 2413.8847,259.40821 L 2408.7275,261.69445 C 2409.2457,263.44337 2409.2591,265.77011 2409.1528,267.56069 L 2406.9374,268.18098 L 2406.9374,269.74059 L 2409.7376,267.91514 L 2415.976,267.91514 L 2416.7204,273.55098 L 2434.1774,279.54128 L 2432.3342,292.79791 L 2426.7869,292.9397 L 2425.4932,295.95257 L 2425.6704,297.15772 L 2420.0877,299.31989 L 2423.0651,305.38108 L 2424.5539,304.79623 L 2427.8503,312.71831 L 2428.9314,312.71831 C 2429.5208,312.71831 2430.1537,312.55938 2430.3492,312.36385 L 2430.7037,312.0094 L 2429.02,308.74841 L 2430.615,305.70009 L 2432.4937,309.31554 L 2435.7724,309.31554 L 2435.9496,308.8193 C 2436.0536,308.54576 2437.9389,307.42002 2440.1322,306.32039 L 2444.1198,304.31772 L 2446.7605,305.73554 L 2450.0924,305.66465 L 2450.5709,302.06692 C 2452.5253,301.15669 2454.1774,300.67298 2454.0623,298.82366 L 2458.8297,298.82366 L 2459.1133,292.01811 L 2459.6804,290.36989 C 2459.9916,289.46556 2460.2475,288.12572 2460.2475,287.39247 L 2460.2475,286.06326 L 2457.6954,286.04554 L 2453.1584,283.47574 L 2452.2368,277.64494 C 2449.3313,276.48122 2448.2546,275.39099 2446.1402,273.46237 L 2443.8894,273.58643 L 2441.5677,269.81148 L 2442.0108,267.45435 L 2440.6461,260.95009 L 2439.636,260.02851 C 2439.2209,259.53684 2437.5636,255.55174 2435.9496,251.18485 C 2434.3356,246.81795 2430.999,237.50287 2428.5238,230.48465 L 2424.0222,217.72425 z "},"me1":{"name":"ME-1","path":"M 2458.2626,284.92861 L 2454.2927,282.94543 L 2453.3518,276.96763 L 2451.1048,275.82131 C 2449.869,275.19084 2448.3581,274.17517 2447.7472,273.56427 L 2446.6364,272.45354 L 2444.4984,272.45354 L 2442.5645,269.50212 L 2443.1692,267.1896 L 2441.4153,260.26028 L 2440.6949,259.40958 C 2438.5772,255.05522 2437.1094,251.45887 2435.804,247.32107 L 2438.9769,244.78371 L 2442.5718,243.46067 L 2443.2355,241.73112 L 2442.216,239.90939 C 2442.9609,237.30515 2443.2185,235.02578 2443.1512,232.25912 L 2439.0725,229.14811 L 2435.2939,228.78463 L 2434.6539,227.02743 L 2436.811,227.70103 L 2443.3262,219.83425 L 2445.0832,220.9514 L 2445.4613,225.53098 L 2447.3794,227.65038 L 2449.9628,227.65038 L 2450.7088,225.29983 L 2455.7871,227.02604 L 2458.5461,225.97706 L 2458.5461,223.74741 L 2459.5185,223.14645 L 2462.5769,224.98149 C 2464.259,225.99076 2466.5809,227.10436 2467.7366,227.45615 L 2469.838,228.09578 L 2472.0835,225.50934 L 2472.0828,222.99173 C 2471.5426,219.86554 2470.9621,216.74598 2470.4566,213.61394 L 2473.7943,213.47216 L 2475.56,210.95127 L 2475.56,208.84788 L 2472.0404,205.32828 L 2470.1723,206.51156 L 2470.537,209.50226 L 2465.9643,209.50226 L 2464.6551,205.13249 L 2465.287,203.95189 L 2465.9188,202.77128 L 2465.9105,201.17439 C 2465.906,200.2961 2465.5219,198.48542 2465.0569,197.15064 C 2464.592,195.81587 2463.541,193.71041 2462.7213,192.47183 C 2461.9017,191.23326 2460.9936,190.21988 2460.7034,190.21988 L 2460.1757,190.21988 L 2460.5311,186.53355 L 2464.1473,186.18335 L 2464.501,183.73581 L 2467.6842,181.99652 L 2469.217,184.05521 L 2471.3065,183.6979 L 2471.6789,186.95647 L 2482.082,186.15611 L 2484.5147,183.89593 L 2483.9373,179.59149 L 2485.2012,178.81037 L 2485.2012,176.09803 L 2483.2162,174.9419 L 2485.636,174.90741 L 2485.978,176.18345 C 2486.1661,176.88527 2486.3234,178.03371 2486.3277,178.73553 L 2486.3354,180.01157 L 2488.604,180.01157 L 2488.604,180.79137 C 2488.604,181.22026 2488.7635,182.3687 2488.9584,183.34345 L 2489.3129,185.11572 L 2486.9026,185.11572 L 2486.9026,193.62266 L 2491.3727,193.62266 L 2492.0763,192.48424 L 2494.8064,193.16946 L 2496.7379,189.11902 L 2504.8922,193.3919 L 2507.9572,192.37025 L 2508.737,193.14988 L 2508.8263,202.16217 L 2510.1548,203.49069 L 2510.1548,202.12959 L 2511.8562,202.12959 L 2511.8562,202.69671 C 2511.8562,203.00864 2511.601,203.26384 2511.2891,203.26384 L 2510.722,203.26384 L 2510.722,205.46542 L 2510.2136,205.77962 C 2509.9339,205.95243 2509.1544,207.15063 2508.4811,208.44228 L 2507.257,210.79073 L 2507.8155,212.24604 L 2505.842,214.52148 L 2504.7671,213.03818 L 2501.1797,212.38605 L 2499.8636,213.97187 L 2498.1307,213.30688 L 2497.1282,214.88998 L 2497.0213,223.39691 L 2496.4492,221.97909 L 2494.8424,221.97909 L 2494.8424,222.54622 C 2494.8424,222.85814 2494.3377,223.61797 2493.721,224.23474 L 2492.5996,225.35614 L 2490.6926,224.62437 L 2491.4479,228.40082 L 2489.1947,226.36172 L 2488.9467,227.14783 L 2487.9532,231.30032 L 2484.6341,235.81363 L 2484.6341,233.88879 L 2483.6321,233.88879 L 2483.0167,231.53542 L 2480.6642,232.79444 L 2480.6642,232.40303 C 2480.6642,232.18775 2480.1537,232.47353 2479.5299,233.0381 C 2478.9061,233.60267 2478.3956,234.38054 2478.3956,234.76671 L 2478.3956,235.46882 C 2477.719,235.82485 2477.03,235.93372 2476.3137,235.96575 C 2476.1936,235.8457 2476.3728,235.01786 2476.7118,234.12609 L 2477.3283,232.50469 L 2476.5508,231.9207 C 2476.1232,231.59951 2475.5995,230.87393 2475.3871,230.30829 L 2475.0009,229.27987 L 2474.4298,229.63285 C 2474.1156,229.82699 2473.8586,230.37006 2473.8586,230.83967 L 2473.8586,231.69351 L 2470.4558,234.55675 L 2470.4558,236.03595 L 2468.7825,236.67808 L 2469.1711,241.26147 L 2468.1873,241.26147 L 2468.1873,243.53748 L 2471.023,246.00304 L 2471.023,247.94566 L 2472.9202,248.67371 L 2470.3825,250.45122 L 2469.8131,249.88182 L 2465.9188,253.77611 L 2465.9188,256.57394 L 2467.9168,258.57192 L 2467.7099,259.69966 C 2467.5961,260.31992 2467.1216,261.25794 2466.6554,261.78415 L 2465.8077,262.74088 L 2466.4896,263.84426 L 2465.7974,265.648 L 2465.1158,265.648 C 2464.7409,265.648 2463.9715,265.98631 2463.406,266.3998 L 2462.3779,267.15161 L 2461.4138,273.25034 L 2463.1572,275.17671 L 2462.5227,277.5329 C 2462.1738,278.8288 2461.9313,280.32155 2461.9839,280.85013 C 2462.0365,281.3787 2462.0501,282.51299 2462.0142,283.37077 L 2461.9489,284.93038 L 2458.2626,284.92861 z "},"or1":{"name":"OR-1","path":"M 131.59937,161.01138 L 132.46778,164.98128 L 132.41461,175.1896 L 131.04996,177.67079 L 128.60422,178.02524 L 128.42699,184.38772 L 126.74333,188.42851 C 141.07495,192.22942 134.74054,192.07781 151.90956,195.2092 L 151.25392,199.8596 L 145.60769,198.5201 C 145.87238,200.06789 146.34435,202.0688 147.5467,203.13495 C 148.85109,203.51245 150.53804,205.86656 152.03372,207.23237 L 148.89679,207.51594 L 148.96768,209.55405 L 146.92956,208.9692 L 146.52194,210.31613 L 145.65352,209.50089 L 143.65085,211.78712 L 139.43283,228.21613 L 125.66224,224.99059 L 123.81907,232.84178 C 135.91787,236.3009 142.58561,237.84661 153.66422,240.60435 C 154.80596,240.11238 156.09548,239.40524 157.26194,238.97386 L 155.79095,236.49267 L 157.97085,236.47495 L 157.42144,234.17098 L 156.64164,232.18603 L 157.66956,232.18603 L 158.99877,232.82405 L 158.9456,229.91752 L 160.3457,229.91752 C 160.92077,229.91944 162.11754,230.32368 163.02184,230.76821 L 165.37897,231.93792 L 165.3258,230.00613 C 166.28214,229.13755 167.11956,227.95719 167.31075,226.51475 C 168.12138,226.89729 168.69033,227.48061 169.18936,228.25158 L 171.26293,228.21613 L 172.45035,223.39554 C 173.45204,221.73271 175.2222,220.69774 176.61521,219.37247 L 176.65065,217.38752 L 172.80481,216.55455 L 170.81986,212.33653 L 170.32362,212.33653 L 169.82738,212.33653 L 167.91333,208.31346 L 169.20709,203.15613 L 176.43798,204.55623 L 176.42026,201.20663 C 176.41175,199.37168 176.48471,196.72774 176.57976,195.32267 C 176.67481,193.9176 176.93895,192.46222 177.16461,192.09712 L 177.57224,191.44138 L 177.04055,190.11217 C 176.74627,189.38698 176.3106,188.03507 176.08352,187.0993 C 175.85639,186.16354 175.72873,184.94571 175.79996,184.38772 L 175.92402,183.37752 L 167.77154,173.77178 L 163.99659,173.77178 L 161.30273,174.99465 L 156.69481,173.75406 L 154.76303,170.81208 L 155.43649,167.19663 L 153.84144,164.99901 L 149.25125,166.22188 L 148.09927,165.0699 L 147.47897,166.68267 L 145.0864,166.48772 C 143.76402,166.37985 141.4815,166.20295 140.01768,166.09782 L 137.35927,165.90287 L 137.97956,167.53336 L 136.2959,167.53336 L 134.32867,165.12307 C 133.24778,163.7974 132.19667,162.32996 131.98927,161.86208 L 131.59937,161.01138 z "},"wa1":{"name":"WA-1","path":"M 216.11926,74.843266 L 216.11926,78.458711 L 211.29867,80.674058 L 207.32877,84.697127 L 206.25427,84.560914 L 205.13128,87.673537 L 201.40936,87.461879 L 198.85728,88.879701 C 197.46033,89.66049 195.31363,91.151545 194.07214,92.193859 L 191.80362,94.090196 L 198.05976,95.508018 L 199.26491,94.852275 C 199.92992,94.496362 200.90703,93.686814 201.42709,93.044552 L 202.36639,91.874849 L 206.67303,93.186335 L 207.96679,91.43178 L 210.73154,91.821681 C 211.73407,93.278572 212.51334,94.994568 213.93936,96.075146 L 214.41788,96.075146 L 214.48877,95.082671 C 214.52898,94.53681 214.6325,93.45217 214.71917,92.672374 C 214.80582,91.892572 215.06482,90.680329 215.28629,89.978513 L 215.6762,88.702473 L 214.41788,88.702473 C 214.40141,87.554111 214.35547,86.384635 214.666,85.299701 L 217.96243,86.469404 L 217.30669,83.172968 L 218.03332,82.446335 L 217.74976,76.509206 L 216.11926,74.843266 z M 227.37322,77.643464 L 226.55798,78.742275 C 226.11522,79.347753 225.75767,80.113383 225.76045,80.443662 C 225.76329,80.773946 224.96248,81.719537 223.97045,82.534949 L 222.16273,84.005939 L 222.00322,86.079503 L 221.84372,88.135345 L 222.19818,88.135345 C 222.3944,88.135345 222.99431,87.729921 223.54511,87.231483 L 224.5553,86.327622 L 225.08699,86.646632 C 225.3811,86.828408 226.05501,88.280297 226.5757,89.872176 L 227.51501,92.778711 L 225.78653,94.568711 L 229.09233,93.806632 L 229.44679,94.37376 C 229.64029,94.686827 230.11935,94.940883 230.51016,94.940889 L 231.21907,94.940889 L 233.7357,91.538117 L 234.39144,91.538117 C 234.75191,91.538117 235.63671,90.975735 236.35867,90.297523 L 237.67016,89.074651 L 237.67016,87.142869 L 240.20451,85.459206 L 238.82214,83.793265 L 235.54342,84.27178 L 231.39249,78.82152 L 230.67516,80.482396 L 227.37322,77.643464 z "},"pa8":{"name":"PA-8","path":"M 2304.2871,491.93098 C 2299.8714,497.91221 2298.5125,499.9537 2295.3194,506.00286 L 2321.5137,517.13276 L 2320.9288,518.42652 L 2320.6275,518.32019 L 2320.2731,519.01137 L 2321.3187,519.43672 L 2321.9922,518.78098 L 2321.0529,518.46197 L 2321.6023,517.16821 L 2325.0405,518.67464 L 2324.5088,519.70256 C 2324.0165,520.6893 2323.7918,521.41494 2324.0126,521.31533 C 2324.2334,521.21574 2325.3811,520.50008 2326.5647,519.72029 L 2328.7269,518.30246 L 2329.3826,515.18326 L 2331.3144,515.18326 L 2333.955,512.38306 L 2332.874,511.97543 C 2332.2814,511.7539 2331.4561,511.10628 2331.0485,510.53989 L 2330.3042,509.51197 L 2328.1065,509.51197 L 2323.7113,505.54207 L 2321.9745,505.54207 L 2318.5894,501.32405 L 2315.0803,501.58989 L 2312.9536,499.46316 L 2312.156,494.19949 L 2308.895,492.49811 L 2308.1861,493.63237 L 2305.4214,493.63237 L 2305.4214,491.93098 L 2304.2871,491.93098 z "},"ny12":{"name":"NY-12","path":"M 2357.617,473.83418 L 2360.3418,474.88217 L 2360.5813,473.23533 L 2361.8389,472.12746 L 2359.8327,470.57046 L 2359.2938,469.76201 L 2359.1141,469.37277 L 2361.0903,467.6361 L 2364.1444,470.57046 L 2364.8331,468.59426 L 2363.3061,466.79772 L 2363.8151,466.4983 L 2363.0366,465.62997 L 2360.5214,467.66605 L 2359.5034,467.66605 L 2357.7667,471.94781 L 2357.617,473.83418 z "},"ny11":{"name":"NY-11","path":"M 2362.0785,472.15741 L 2360.7909,473.3551 L 2360.4915,474.82228 L 2360.8208,475.87026 L 2361.2101,476.40923 L 2361.8389,475.72055 L 2361.779,474.88217 L 2362.7671,474.85222 L 2362.8869,473.71441 L 2363.9947,473.65452 L 2362.0785,472.15741 z "},"ny10":{"name":"NY-10","path":"M 2361.1203,467.81576 L 2359.3237,469.40271 L 2359.8028,470.30098 L 2364.1744,473.68447 L 2363.0067,473.83418 L 2362.8869,474.97199 L 2361.9287,474.97199 L 2361.9587,476.49906 L 2362.7971,475.90021 L 2363.9947,476.97813 L 2367.0489,474.28332 C 2365.1625,471.34897 2363.9948,470.78006 2361.1203,467.81576 z "},"ny9":{"name":"NY-9","path":"M 2362.7971,476.07986 L 2361.8988,476.67871 L 2361.809,476.04992 L 2361.3897,476.49906 C 2361.3897,476.49906 2361.779,476.94819 2361.6293,477.5171 C 2361.4796,478.086 2361.809,478.44531 2361.809,478.44531 L 2362.1084,480.60116 L 2371.8396,474.52286 L 2367.0788,468.59426 L 2366.4799,467.78582 L 2368.8155,465.5102 L 2367.5579,464.5221 L 2365.5218,465.89945 L 2365.7014,466.37852 L 2363.6953,466.79772 L 2365.0128,468.38467 L 2364.2642,470.51058 C 2364.2642,470.51058 2364.8032,470.98966 2366.3602,472.81614 C 2367.1098,473.6954 2367.2585,474.31326 2367.2585,474.31326 L 2363.9348,477.21767 L 2362.7971,476.07986 z "},"ny5":{"name":"NY-5","path":"M 2369.0251,465.51019 L 2367.1986,467.21691 L 2369.1748,466.04916 C 2369.1748,466.04916 2369.7437,465.80962 2370.9114,463.89331 C 2372.0792,461.97699 2375.2531,459.94091 2375.2531,459.94091 L 2375.7321,459.61154 L 2370.7018,455.92863 L 2369.3245,455.56932 L 2368.2765,456.37777 L 2368.8454,457.06644 L 2365.8811,461.85723 L 2365.7314,462.48601 C 2365.7314,462.48601 2365.5218,463.23458 2365.3721,463.3244 C 2365.2224,463.41423 2363.2162,465.54014 2363.2162,465.54014 L 2363.9648,466.46835 L 2365.432,466.25876 L 2365.1625,465.89945 L 2367.468,464.22268 L 2369.0251,465.51019 z "},"ny6":{"name":"NY-6","path":"M 2371.9295,474.46297 L 2374.6542,473.29522 L 2373.187,472.42689 L 2372.7679,469.67219 L 2371.5701,467.12709 L 2371.5103,463.71365 C 2370.6297,464.20551 2370.9841,464.55167 2369.564,466.0791 L 2367.2884,467.33668 L 2366.7494,467.78582 L 2371.9295,474.46297 z "},"ny4":{"name":"NY-4","path":"M 2377.0197,472.42689 L 2374.8339,473.20539 L 2373.3367,472.36701 L 2372.9775,469.55242 L 2371.6899,467.0672 L 2371.6001,463.26452 C 2372.8377,461.89715 2374.225,460.91903 2375.8519,459.7912 L 2381.3613,465.95933 L 2380.3133,467.00732 L 2379.3252,466.25876 L 2378.427,467.21691 L 2380.3133,469.28294 C 2380.3133,469.28294 2378.0677,470.89983 2377.918,470.89983 C 2377.7682,470.89983 2376.4508,471.19925 2376.4508,471.19925 L 2377.0197,472.42689 z "},"ny3":{"name":"NY-3","path":"M 2377.1465,472.39376 L 2379.655,471.34856 L 2381.2228,470.19884 L 2382.93,469.85044 L 2389.4451,465.53027 L 2390.1767,466.57547 L 2394.8105,464.27603 L 2393.6607,463.3005 L 2395.1937,462.22046 L 2394.8802,460.79202 L 2391.3613,463.23082 L 2389.898,461.3843 L 2387.6683,462.32498 L 2387.8076,463.1263 L 2387.076,463.68374 L 2386.0307,463.19599 L 2386.3095,465.32123 L 2385.1597,466.15739 L 2382.0938,460.19974 C 2382.0938,460.19974 2378.784,459.78166 2378.6447,459.74682 C 2378.5053,459.71198 2377.1117,458.98034 2377.1117,458.98034 L 2379.6898,455.46149 L 2377.1117,451.5594 L 2374.9865,452.53492 L 2373.3489,452.7788 L 2371.3283,453.71949 L 2371.3283,454.79953 L 2370.2482,455.42665 L 2375.9968,459.50293 L 2381.6061,465.94835 L 2380.317,467.27227 L 2379.4112,466.61031 C 2379.4112,466.61031 2378.5402,466.88903 2378.6447,467.13291 C 2378.7492,467.37679 2380.4215,469.18848 2380.4215,469.18848 L 2378.0872,470.93048 L 2376.6936,471.27888 L 2377.1465,472.39376 z "},"ny2":{"name":"NY-2","path":"M 2394.8802,464.1715 L 2400.3849,460.37394 L 2397.1448,456.47185 L 2399.3048,453.78916 L 2396.5873,451.87296 L 2390.4206,453.26657 L 2388.6438,450.89744 L 2386.5882,450.89744 L 2384.7417,448.98123 L 2380.9441,448.56315 L 2380.526,449.74771 L 2379.446,450.33999 L 2376.6239,450.40968 L 2379.8989,455.28729 L 2377.5298,458.84098 L 2380.4563,459.81649 L 2382.1287,459.74682 L 2385.2294,465.80899 L 2386.1004,465.11219 L 2385.8217,462.84758 L 2387.0411,463.47471 L 2387.5637,462.98694 L 2387.2502,462.29014 L 2390.1767,461.2101 L 2391.3265,462.9521 L 2394.9847,460.54814 L 2395.3679,462.39466 L 2393.9395,463.3005 L 2394.8802,464.1715 z "},"ny15":{"name":"NY-15","path":"M 2358.1821,458.68306 L 2357.6681,461.28831 L 2358.3593,461.64276 L 2358.1821,464.65293 L 2359.0862,465.10371 C 2358.7705,465.49613 2359.0247,465.55986 2359.0859,465.70128 L 2360.4329,466.46336 L 2361.195,464.81514 L 2359.5822,464.44296 L 2359.1746,463.75177 L 2358.7492,461.44781 L 2359.3518,458.75395 L 2358.1821,458.68306 z "},"ny7":{"name":"NY-7","path":"M 2363.0907,462.93584 L 2361.3425,464.70369 L 2361.0086,465.82333 L 2361.7157,466.35368 L 2365.1533,463.30905 L 2365.5264,462.03227 L 2362.8354,460.20549 L 2363.3265,458.02514 C 2363.3265,458.02514 2364.1122,457.35728 2364.0925,457.27871 C 2364.0729,457.20014 2363.9943,456.25728 2363.9943,456.25728 L 2362.9729,455.88407 L 2362.8746,456.61086 L 2360.9889,458.41799 L 2361.0675,459.10549 L 2361.1461,461.10905 L 2363.1104,462.71977 L 2363.0907,462.93584 z "},"tx8":{"name":"TX-8","path":"M 1498.8226,1218.9722 L 1497.263,1220.266 L 1495.0122,1219.6635 L 1479.3984,1221.8256 L 1473.2132,1223.6334 L 1473.0005,1224.7499 L 1450.7939,1231.6441 L 1430.4304,1225.7955 L 1418.9815,1239.1231 L 1417.0143,1236.6419 L 1411.4493,1238.5559 L 1408.9859,1234.9936 L 1407.639,1237.1381 L 1404.9628,1237.1381 L 1399.1675,1232.4593 L 1390.5365,1240.1687 L 1389.544,1242.8094 L 1382.7739,1242.8094 L 1382.4372,1243.3411 C 1382.2565,1243.6332 1381.3056,1244.2712 1380.3281,1244.7589 C 1379.3506,1245.2465 1378.2553,1245.645 1377.8824,1245.645 L 1377.2089,1245.645 C 1379.0904,1255.6888 1380.258,1264.7213 1381.6042,1275.4193 L 1382.5258,1292.7167 L 1389.7921,1291.352 L 1390.5365,1290.6254 C 1390.9486,1290.2207 1391.586,1289.8811 1391.9366,1289.8811 C 1392.2871,1289.8811 1393.2556,1289.2178 1394.0988,1288.4101 L 1395.6229,1286.9391 L 1398.0687,1288.2506 L 1399.1675,1291.1394 L 1403.1196,1290.395 L 1403.1196,1291.4584 L 1405.2818,1292.3268 C 1406.4692,1292.802 1407.7778,1293.5868 1408.1883,1294.0814 L 1408.9327,1294.9852 L 1411.2367,1294.9852 L 1419.5664,1286.372 L 1415.1534,1275.8269 L 1423.2704,1271.1658 C 1422.8324,1273.4944 1421.3247,1275.6513 1421.6576,1278.1309 L 1422.8628,1283.8021 L 1425.4858,1285.2023 L 1428.6759,1285.9821 L 1429.4557,1287.9847 C 1429.7884,1288.9305 1430.5028,1290.1571 1431.0507,1290.6963 L 1432.0432,1291.6711 L 1434.0459,1291.7597 L 1438.7956,1288.1265 L 1440.6742,1290.4482 C 1441.8398,1289.3023 1442.6319,1287.7597 1444.0238,1286.7619 L 1446.4873,1286.7619 L 1447.1607,1288.1443 L 1460.6477,1287.9493 L 1463.5366,1286.6732 L 1463.5188,1283.9439 L 1467.8255,1282.6324 L 1471.8308,1283.0755 L 1475.2159,1286.4783 L 1474.5424,1288.605 L 1477.0236,1288.9949 L 1477.9806,1291.6534 L 1481.9505,1293.213 L 1487.1079,1293.9928 L 1489.0396,1296.5803 L 1489.8372,1293.6915 L 1491.2196,1292.2027 C 1491.976,1291.3904 1492.8746,1290.1855 1493.2222,1289.5089 L 1493.8425,1288.2683 L 1492.5133,1287.8252 L 1492.9032,1287.01 C 1493.1133,1286.5608 1493.599,1285.7579 1493.9843,1285.22 L 1494.6932,1284.2452 L 1493.1513,1280.5235 L 1493.364,1274.5686 L 1491.8753,1274.5332 L 1490.0675,1272.0165 L 1490.5815,1267.7985 L 1493.2222,1265.1578 L 1492.6905,1264.3425 C 1492.4039,1263.8895 1492.1635,1262.9681 1492.1588,1262.3045 L 1492.1588,1261.0993 L 1491.0069,1259.9296 L 1491.1487,1256.7041 L 1493.2931,1254.8254 L 1493.2931,1251.8303 L 1496.2174,1249.1187 L 1496.5364,1245.3615 L 1499.0707,1240.8776 L 1498.3618,1236.4292 L 1500.2759,1233.5227 L 1497.8301,1231.8922 L 1497.8301,1229.1983 L 1498.6454,1229.1983 C 1499.0948,1229.1983 1499.6244,1228.9395 1499.8151,1228.6312 L 1500.1518,1228.0818 L 1498.2555,1224.0587 L 1498.8226,1218.9722 z "},"tx5":{"name":"TX-5","path":"M 1407.5326,1113.1496 L 1381.7814,1114.7447 L 1384.0005,1129.9508 C 1379.5568,1129.7116 1381.398,1127.9215 1376.519,1127.383 L 1376.4646,1126.4948 L 1372.5479,1127.2392 L 1367.1881,1123.0826 L 1349.2424,1123.8896 L 1349.2424,1125.4138 L 1337.362,1125.7246 L 1337.3756,1122.4375 L 1333.6464,1121.4439 L 1330.5272,1122.0996 L 1330.598,1123.9073 C 1330.6329,1124.8967 1330.4728,1126.2715 1330.2436,1126.9734 L 1329.836,1128.2494 L 1331.9804,1128.2494 L 1333.5223,1130.0039 C 1334.3715,1130.9718 1335.0642,1132.0006 1335.0642,1132.2902 C 1335.0642,1132.5798 1334.7172,1132.957 1334.2844,1133.1231 L 1333.4869,1133.4245 L 1332.7957,1136.8804 L 1336.0781,1141.5811 L 1338.8049,1143.2161 L 1339.6073,1147.5617 L 1340.8418,1149.1268 L 1342.9199,1150.6545 L 1342.1763,1154.6031 C 1343.5564,1154.7706 1345.4207,1155.2683 1346.6359,1155.9278 C 1348.3352,1156.8501 1348.8316,1156.573 1350.1977,1156.8078 L 1351.1884,1159.5553 L 1354.1219,1160.3751 L 1356.0462,1162.8311 L 1357.9266,1162.1353 L 1357.1227,1164.7346 L 1358.5008,1165.6366 L 1360.8685,1165.3963 L 1360.5495,1169.5257 L 1363.332,1170.2169 L 1363.93,1177.8927 L 1365.8292,1177.8321 L 1366.5735,1180.774 L 1365.6828,1181.7459 L 1365.2946,1182.7001 L 1367.9399,1183.2609 L 1368.5882,1188.1587 L 1374.1354,1190.0019 L 1374.0889,1193.5978 L 1376.1042,1193.5335 L 1378.4376,1195.4347 L 1378.3536,1197.7476 L 1379.7388,1199.4834 L 1380.7345,1198.9691 L 1380.6981,1195.4741 L 1382.7499,1197.1612 L 1383.0929,1202.5433 L 1381.0016,1202.5433 L 1381.0016,1203.0395 C 1381.0016,1203.3131 1381.3419,1203.8237 1381.7637,1204.1738 L 1382.5435,1204.8118 C 1384.4514,1204.2842 1385.7267,1203.7039 1387.1602,1202.2801 L 1404.5374,1198.6974 L 1412.1987,1199.0727 L 1413.2752,1201.5122 L 1415.5965,1202.561 L 1415.5965,1205.3612 L 1420.7206,1207.8738 L 1426.9381,1202.1915 C 1425.8607,1197.6788 1424.1507,1199.4923 1422.8097,1195.4542 L 1421.3918,1188.2764 L 1422.1716,1187.9751 C 1422.6058,1187.8086 1423.0746,1187.2094 1423.0746,1186.9672 L 1420.3298,1185.8334 L 1422.402,1184.0229 L 1422.402,1182.1266 L 1420.1335,1182.1266 L 1419.017,1164.4216 L 1394.5418,1165.7153 L 1393.3544,1164.971 L 1394.0279,1161.4619 L 1392.7873,1159.7782 L 1394.081,1156.5526 L 1394.1519,1152.6536 L 1386.2475,1144.2885 L 1385.7868,1132.2193 L 1387.6477,1132.2193 L 1391.9366,1135.6221 L 1400.9398,1135.8524 C 1404.6984,1137.8617 1404.4922,1137.7801 1407.0895,1138.0146 L 1407.0895,1138.9894 L 1408.9504,1138.2805 L 1407.5326,1113.1496 z "},"fl8":{"name":"FL-8","path":"M 2133.0143,1249.5441 L 2119.4032,1252.5215 C 2119.2398,1254.9592 2120.0008,1257.7821 2120.9273,1260.674 L 2126.0847,1262.2513 L 2127.0772,1265.6718 L 2134.3966,1268.4188 L 2136.2044,1265.3882 L 2140.8832,1271.4494 L 2141.6453,1277.2979 L 2146.0582,1279.2829 L 2148.3622,1288.1797 L 2147.157,1290.4482 L 2148.3976,1292.7699 L 2150.3649,1292.1496 C 2152.0569,1294.0009 2153.6779,1294.7516 2155.5399,1299.2387 L 2157.3959,1308.5343 L 2176.6596,1303.5414 L 2176.4528,1299.3627 L 2179.5543,1296.8993 L 2177.6392,1288.4022 L 2171.8626,1289.8456 L 2170.6752,1288.286 L 2166.1988,1289.1477 L 2167.5457,1295.7455 L 2165.0234,1296.2974 L 2163.5853,1290.3578 L 2161.0712,1289.4075 L 2157.6932,1286.8514 L 2154.748,1281.7929 L 2153.3935,1278.0718 L 2155.9406,1276.4748 L 2155.8717,1274.7261 L 2156.9912,1274.4052 C 2151.9133,1268.4192 2148.4764,1263.4069 2148.8939,1260.993 L 2145.562,1259.8233 L 2144.8186,1262.2986 L 2142.7106,1261.6093 L 2142.1947,1259.8233 L 2136.9842,1259.8233 L 2136.9842,1256.9876 L 2134.1485,1256.9876 L 2134.1485,1254.7191 L 2133.0143,1254.7191 L 2133.0143,1249.5441 z "},"sc6":{"name":"SC-6","path":"M 2210.321,921.28288 L 2207.4145,923.8704 L 2199.4038,922.82473 L 2196.32,923.60453 L 2191.1273,929.70117 L 2181.7873,930.48097 C 2181.1204,932.61042 2179.7038,934.04685 2176.3996,933.74196 L 2168.5839,943.13503 C 2166.5569,942.5552 2166.0982,941.63304 2164.2241,941.16783 L 2158.925,947.90248 L 2157.454,947.90248 C 2156.4809,949.69744 2156.0177,952.05023 2156.2665,955.16882 L 2152.0485,957.65001 L 2149.2306,955.84228 L 2147.1393,956.55119 C 2145.5395,954.38652 2144.6392,952.18924 2144.8708,949.92288 L 2143.0453,947.90248 C 2142.0863,947.49869 2139.2496,948.96715 2136.3993,950.45456 L 2137.6222,953.89278 L 2128.1051,957.54367 C 2126.9927,957.99437 2126.2473,958.92463 2125.4644,959.81218 L 2123.7453,959.81218 L 2121.6717,957.93357 L 2121.6717,955.27516 C 2122.5997,955.63687 2123.2538,953.59662 2123.9934,952.26228 L 2122.3983,950.64948 L 2118.1803,951.44704 L 2117.0638,954.42446 L 2118.8183,958.1108 L 2120.2539,958.12849 C 2124.0865,963.07142 2121.3204,962.0304 2125.358,966.4405 L 2130.2495,968.33681 C 2131.6513,967.54073 2133.2793,968.55459 2134.8929,969.45337 L 2137.7152,969.65828 L 2133.7941,979.25404 L 2135.8853,983.48981 L 2134.3745,986.54918 L 2132.8149,986.46723 L 2132.3053,988.20407 L 2128.9912,989.92315 L 2119.7754,990.98651 L 2118.6366,992.50404 C 2120.3251,1002.8607 2121.8676,1008.892 2121.3529,1011.3033 L 2126.7406,1016.0884 L 2130.4976,1017.5707 L 2139.1109,1026.303 L 2141.4149,1027.0473 C 2144.4381,1030.4611 2145.8517,1032.8505 2147.2102,1035.2049 L 2151.8182,1036.4455 L 2153.36,1035.1694 C 2154.8523,1035.6196 2156.6537,1037.893 2158.7528,1040.3155 C 2162.605,1039.7406 2164.9212,1043.31 2167.875,1044.7928 L 2168.1762,1044.3498 C 2168.3367,1044.1023 2169.0217,1043.7285 2169.7004,1043.5168 L 2170.9233,1043.1269 L 2171.9512,1044.9524 L 2173.4222,1043.1801 L 2175.8325,1043.1801 L 2181.2911,1037.5088 L 2182.9216,1037.5088 L 2182.9216,1036.5518 L 2177.1243,1033.3823 L 2177.5547,1027.9723 L 2176.2078,1026.3595 L 2177.0858,1023.2484 C 2179.1459,1023.1441 2180.1359,1022.5292 2181.0411,1021.6551 L 2178.209,1018.6487 L 2176.0275,1018.7936 L 2172.7133,1015.4794 C 2173.5699,1014.024 2171.8486,1011.909 2169.407,1009.6098 L 2170.0965,1004.812 L 2167.8039,1002.7542 C 2171.6079,994.91206 2172.8714,993.43055 2174.8578,990.7207 L 2179.5543,989.28513 C 2180.0891,989.48022 2180.907,990.1471 2184.453,995.36083 L 2184.4955,997.96906 L 2190.2943,1005.8027 L 2190.2943,1012.6083 L 2186.1331,1014.0405 L 2186.1119,1016.3088 C 2188.4593,1017.3332 2190.2051,1019.2001 2191.2513,1021.2994 C 2192.3695,1019.3475 2192.9547,1017.3962 2192.6584,1015.8404 L 2195.1075,1014.6996 L 2195.0225,1012.381 L 2197.8582,1009.2054 L 2197.6882,1007.1597 C 2201.0492,1004.3151 2199.1411,1003.2553 2203.3733,995.82151 L 2206.2148,993.98969 L 2208.1002,994.54093 L 2209.0804,990.41938 L 2212.8445,988.89165 L 2214.1314,983.04671 C 2211.8772,982.37824 2212.6714,980.29126 2209.5766,978.93503 L 2209.5766,976.7374 L 2213.1212,971.79278 L 2212.3946,969.87872 L 2214.9112,957.38414 L 2217.2861,956.44486 L 2212.749,952.1382 L 2211.6325,946.62644 L 2208.1057,945.49219 C 2207.7551,943.84967 2207.1253,943.04531 2206.3688,942.6211 L 2206.2802,940.38803 L 2207.7689,939.99813 L 2207.574,938.06632 L 2209.8602,935.99278 L 2209.2222,933.60018 C 2211.3281,930.75223 2209.8853,930.04462 2213.4048,922.61206 L 2210.321,921.28288 z "},"la3":{"name":"LA-3","path":"M 1598.3005,1252.6455 L 1596.7764,1253.5849 C 1598.3741,1256.2702 1600.0921,1257.3383 1601.4552,1259.965 C 1596.0316,1260.3465 1590.9576,1260.381 1585.5047,1260.7625 L 1585.5047,1262.7475 L 1587.5251,1262.6589 C 1586.5998,1265.5109 1587.3761,1266.5755 1588.1277,1267.6744 L 1586.6744,1269.234 L 1587.9327,1272.0874 L 1586.6035,1272.7786 L 1586.639,1274.3736 L 1590.3253,1273.8774 C 1590.0517,1280.0941 1588.4341,1282.8289 1587.2592,1286.5669 L 1589.5809,1297.4487 L 1591.8671,1295.7119 L 1593.7458,1294.808 L 1595.9966,1297.0588 L 1595.394,1298.6007 C 1595.0686,1299.4566 1594.8091,1300.7831 1594.8091,1301.5427 L 1594.8091,1302.925 L 1595.4117,1302.925 C 1595.7444,1302.925 1596.9105,1302.2489 1597.9992,1301.4186 L 1599.9842,1299.9122 L 1608.7038,1299.8058 L 1608.881,1304.91 L 1607.6227,1306.4342 L 1612.8687,1305.6544 L 1614.8713,1312.0346 L 1615.7574,1311.6623 C 1616.2431,1311.456 1617.2383,1311.1617 1617.9551,1311.0066 L 1619.2489,1310.7231 L 1620.7198,1312.7435 L 1624.2644,1312.0346 L 1625.2037,1313.7359 L 1629.1027,1314.2144 L 1629.3154,1314.8524 C 1629.4306,1315.1979 1630.1279,1315.7027 1630.875,1315.9867 L 1632.2396,1316.5007 L 1632.2396,1318.5742 L 1633.5157,1319.868 L 1632.8245,1321.6757 L 1630.0952,1320.9845 L 1628.8014,1324.8835 L 1626.3734,1325.9647 L 1629.6875,1328.3218 L 1631.9561,1328.9421 C 1633.2037,1329.2876 1635.2088,1329.5783 1636.4222,1329.5801 L 1638.6376,1329.5801 L 1639.8959,1331.2637 L 1646.2584,1331.4587 L 1647.5166,1330.6789 L 1649.3244,1332.2562 C 1650.321,1333.1258 1651.8594,1334.5281 1652.7449,1335.3754 L 1654.3576,1336.9173 L 1654.3576,1338.6542 L 1657.4768,1338.5655 L 1656.059,1337.9984 L 1656.059,1336.0134 L 1658.8415,1333.4082 L 1663.1481,1332.9297 L 1664.2824,1331.7777 L 1664.2824,1327.5951 L 1668.4473,1327.2584 L 1669.0675,1325.6102 L 1667.9865,1325.6102 C 1667.3909,1325.6102 1666.7949,1325.4187 1666.6572,1325.1848 C 1666.5195,1324.9509 1666.6322,1324.1714 1666.9054,1323.448 L 1667.4016,1322.1365 L 1669.8119,1322.8986 L 1670.698,1321.4631 L 1672.4526,1322.1897 C 1673.4172,1322.5892 1674.2071,1322.9958 1674.2071,1323.0936 C 1674.2071,1323.1914 1673.9463,1323.9605 1673.6223,1324.8126 L 1673.0374,1326.3722 L 1673.7641,1326.833 C 1674.1661,1327.0881 1675.0531,1327.3068 1675.7491,1327.3116 L 1677.0251,1327.3116 L 1677.2732,1326.0355 C 1677.4155,1325.3337 1677.6942,1324.0576 1677.8758,1323.1999 L 1678.1948,1321.6403 L 1680.6228,1321.6403 L 1682.5192,1323.5898 C 1683.5644,1324.666 1684.4155,1325.8018 1684.4155,1326.1064 L 1684.4155,1326.6558 L 1682.6786,1327.028 L 1684.4864,1329.5801 L 1686.7194,1329.5801 L 1687.4106,1331.4055 L 1685.8687,1332.3625 L 1686.4713,1332.9651 L 1690.9374,1330.608 L 1693.6313,1327.985 C 1695.1129,1326.5449 1696.3252,1325.1647 1696.3252,1324.919 C 1696.3252,1324.6733 1696.0446,1324.4759 1695.7049,1324.4759 C 1695.365,1324.4759 1694.6066,1323.9017 1694.0212,1323.1999 C 1693.4357,1322.4981 1692.9505,1321.7324 1692.9401,1321.4985 L 1692.9224,1321.0732 L 1695.1909,1321.0732 L 1694.9073,1319.6908 L 1697.5303,1319.2831 L 1696.3252,1317.8476 L 1695.6163,1310.9712 L 1696.3429,1308.0292 L 1697.1227,1308.0292 C 1697.5464,1308.0292 1698.2054,1308.412 1698.5937,1308.8799 C 1698.982,1309.3478 1699.6235,1309.7306 1700.0292,1309.7306 L 1700.7736,1309.7306 L 1704.265,1306.2392 L 1706.2499,1306.6468 L 1706.1081,1309.447 L 1707.6677,1310.3509 L 1707.6677,1312.9207 L 1706.0904,1315.0651 L 1706.6044,1316.4298 L 1711.0351,1316.4475 L 1714.5442,1316.3766 L 1719.861,1318.7515 L 1726.6665,1320.0807 L 1731.0441,1324.7595 L 1732.1606,1327.8787 L 1733.9506,1327.8787 L 1736.0242,1329.7573 L 1736.0951,1332.1322 L 1737.1584,1329.4738 L 1739.3206,1328.9066 L 1739.8877,1326.7445 L 1740.4903,1326.7445 C 1740.8191,1326.7445 1741.4173,1327.1476 1741.8195,1327.6306 C 1742.2218,1328.1134 1743.0402,1329.0066 1743.645,1329.6155 C 1744.2496,1330.2244 1744.8876,1330.7037 1745.0628,1330.6966 C 1745.2379,1330.6895 1745.7894,1329.8601 1746.2857,1328.8534 L 1747.1895,1327.028 L 1748.4301,1326.9571 C 1749.1136,1326.9212 1749.7499,1326.7936 1749.8479,1326.6736 C 1749.946,1326.5534 1750.3969,1325.676 1750.8582,1324.7241 L 1751.7089,1323.0049 L 1750.0075,1321.4099 L 1752.8786,1320.2225 L 1752.2937,1318.9464 C 1751.9793,1318.2446 1751.5254,1317.6704 1751.2835,1317.6704 C 1751.0415,1317.6704 1750.4449,1318.0659 1749.9543,1318.5565 L 1749.0681,1319.4604 L 1747.0832,1319.0705 L 1747.0655,1316.3412 L 1746.2148,1316.0753 C 1745.7536,1315.9262 1744.8197,1315.1871 1744.1235,1314.4449 C 1743.4272,1313.7025 1742.5646,1312.5564 1742.2094,1311.8928 L 1741.5537,1310.6876 L 1740.9689,1311.7687 C 1740.6433,1312.3644 1740.1022,1313.0341 1739.7637,1313.2574 L 1739.1434,1313.665 L 1737.8496,1312.2649 C 1737.1352,1311.4957 1736.3227,1310.8649 1736.0419,1310.8649 C 1735.761,1310.8649 1735.3662,1311.12 1735.1735,1311.432 L 1734.819,1311.9991 L 1732.4974,1311.9991 L 1733.0645,1309.8192 L 1725.9576,1309.447 L 1724.5044,1311.0066 L 1722.4308,1308.3128 L 1722.4308,1307.3557 C 1722.4239,1306.8283 1722.1709,1306.2409 1721.8814,1306.062 L 1721.3675,1305.7429 L 1720.6408,1308.0292 L 1720.0382,1308.0292 C 1719.7143,1308.0292 1718.9503,1307.3912 1718.3368,1306.6114 L 1717.2203,1305.1936 L 1714.7568,1305.1581 L 1713.7644,1304.4138 C 1713.2185,1303.9993 1712.7719,1303.3691 1712.7719,1303.0136 C 1712.7719,1302.6581 1712.9633,1302.3592 1713.1972,1302.3579 L 1713.6226,1302.3579 L 1713.8176,1298.388 L 1712.7719,1298.388 L 1712.7719,1296.1195 L 1715.1645,1296.1195 L 1714.4556,1293.3193 L 1716.0329,1293.5497 C 1716.8949,1293.6839 1718.7409,1293.9234 1720.1446,1294.0814 L 1722.6966,1294.3649 L 1721.2788,1293.7801 C 1720.499,1293.452 1718.9678,1292.8003 1717.8761,1292.3268 C 1716.7843,1291.8534 1715.5083,1291.2645 1715.0404,1291.033 L 1714.1897,1290.6254 L 1713.8176,1288.0911 L 1722.8207,1288.6405 L 1726.5425,1290.5722 L 1725.7627,1288.5164 L 1727.7477,1284.8478 L 1729.4667,1285.025 C 1730.4193,1285.12 1731.6502,1285.3776 1732.1961,1285.6099 L 1733.1885,1286.0352 L 1733.1885,1283.4122 L 1731.9657,1284.6528 L 1729.8566,1284.1035 L 1729.2541,1282.5084 L 1727.5172,1282.5084 L 1727.5172,1281.4627 L 1734.8899,1279.017 L 1734.8899,1278.4853 C 1734.8899,1278.1988 1734.7831,1277.9714 1734.6418,1277.9714 C 1734.5005,1277.9714 1733.7255,1278.2789 1732.9227,1278.6449 L 1731.4517,1279.3006 L 1730.1402,1277.9891 L 1732.8164,1275.1357 L 1735.457,1275.1357 L 1735.457,1272.8672 L 1733.8443,1272.8672 L 1733.419,1270.8823 L 1731.0263,1276.1814 L 1728.5806,1277.4928 L 1726.9501,1276.1282 L 1726.9501,1274.0015 L 1724.912,1274.0015 L 1724.2208,1273.328 C 1723.8465,1272.9537 1723.5473,1272.3382 1723.5473,1271.9633 L 1723.5473,1271.2722 L 1727.2337,1268.915 L 1722.0764,1268.8973 L 1720.7117,1267.5326 L 1720.7117,1270.4569 L 1716.9368,1273.0445 L 1716.7595,1279.9563 L 1714.3492,1281.9413 L 1710.5743,1281.9413 L 1707.3842,1279.1765 L 1708.8197,1276.8371 L 1708.3766,1276.8548 C 1708.14,1276.8647 1707.458,1277.2476 1706.8525,1277.7055 L 1705.7537,1278.5385 L 1703.0776,1278.5385 L 1701.1458,1275.1357 L 1700.1356,1275.1357 C 1699.5788,1275.1338 1698.5184,1275.5371 1697.7784,1276.0219 L 1696.4315,1276.908 L 1695.2441,1275.6497 L 1693.9326,1276.7308 L 1694.0566,1278.9816 C 1695.5454,1279.5892 1697.0341,1279.8392 1698.5228,1279.6728 L 1700.0292,1282.5084 L 1699.533,1282.8629 C 1698.669,1282.9482 1697.8768,1282.1744 1697.1227,1281.1615 L 1694.9605,1281.4982 C 1694.2354,1282.8924 1693.4985,1284.29 1692.1249,1285.4681 L 1691.1324,1286.1239 L 1691.5578,1290.1647 L 1688.598,1289.3317 L 1689.2538,1286.7619 L 1687.1802,1285.4504 L 1685.5904,1287.2811 C 1682.551,1286.8171 1680.72,1283.8281 1679.4286,1281.7253 L 1679.3124,1279.7905 C 1676.8583,1279.7429 1674.753,1280.094 1673.0729,1280.9311 L 1673.0729,1279.2474 L 1674.792,1277.8119 L 1673.0906,1275.1889 L 1673.7109,1273.5761 L 1678.177,1272.8495 L 1677.2502,1262.6664 L 1675.9802,1259.0903 L 1673.0608,1259.0903 L 1672.269,1260.3904 C 1670.4268,1260.5234 1668.2903,1261.1272 1665.8952,1262.1449 L 1663.9988,1266.0971 L 1663.2752,1266.7114 L 1658.0908,1264.5899 L 1656.6262,1265.4591 L 1656.2608,1268.0583 L 1655.0244,1268.0927 L 1652.2309,1265.0692 L 1647.8357,1264.5021 L 1642.2176,1265.4414 L 1642.2176,1266.487 L 1639.1693,1266.5047 C 1638.1832,1267.5338 1636.9855,1268.6214 1635.5361,1269.11 L 1634.9689,1274.4268 L 1634.0473,1274.48 L 1634.4727,1277.5992 L 1629.6344,1279.7614 L 1626.3025,1280.2045 L 1625.7531,1278.4853 L 1620.135,1279.1056 L 1619.5147,1276.713 L 1614.1978,1276.5181 L 1614.4814,1273.2039 L 1612.4079,1270.6519 L 1613.294,1269.0391 L 1607.0378,1268.2061 C 1607.3563,1267.1133 1605.9913,1265.4528 1604.7162,1263.8286 L 1604.7162,1261.8437 L 1603.1388,1260.9752 L 1604.8402,1260.6385 C 1605.0312,1259.632 1603.8322,1257.6542 1602.4831,1255.5698 L 1598.3005,1252.6455 z M 1593.0723,1308.0292 L 1592.4166,1309.7306 L 1588.8366,1309.7306 L 1587.4542,1311.9637 L 1588.4821,1312.513 C 1589.047,1312.8154 1591.1379,1313.6218 1593.1432,1314.3031 C 1595.1485,1314.9842 1597.0278,1315.7472 1597.3081,1316.0045 L 1597.8043,1316.4829 L 1600.9235,1316.2526 L 1602.235,1312.6194 L 1604.5921,1311.875 L 1603.8123,1311.3788 C 1603.3812,1311.1057 1602.4854,1310.8873 1601.8096,1310.8825 C 1601.1339,1310.8778 1600.4958,1310.6734 1600.3918,1310.4395 C 1600.2879,1310.2056 1599.3395,1309.5675 1598.3005,1309.0217 L 1596.4219,1308.0292 L 1593.0723,1308.0292 z "},"la7":{"name":"LA-7","path":"M 1572.124,1315.3191 C 1571.0323,1315.282 1568.863,1315.0529 1567.3034,1314.81 C 1565.7438,1314.5671 1562.7859,1314.346 1560.7304,1314.3187 L 1556.9929,1314.269 L 1548.2137,1312.0236 L 1538.3798,1307.8593 L 1524.2016,1304.1121 L 1520.1284,1304.0607 L 1514.5604,1305.7498 L 1507.1625,1305.7621 L 1493.693,1308.5552 L 1489.7296,1311.1854 L 1488.1086,1309.5644 C 1487.217,1308.6728 1486.4875,1307.6997 1486.4875,1307.402 C 1486.4875,1307.1043 1486.1047,1306.7138 1485.6368,1306.5343 L 1484.7862,1306.2078 L 1484.7862,1304.858 L 1489.3313,1300.4198 L 1491.1074,1294.0899 L 1495.5616,1289.266 L 1495.5616,1287.6139 L 1493.6844,1287.6139 L 1495.7374,1285.3454 L 1494.8556,1285.3454 L 1496.1959,1283.7305 L 1493.9088,1279.2474 L 1494.6565,1278.4998 L 1494.3813,1274.4134 L 1491.5917,1272.2191 L 1491.5917,1268.3985 L 1492.2674,1267.7607 L 1505.5885,1267.0417 L 1505.3235,1264.2838 L 1505.0585,1261.526 L 1510.3069,1261.526 L 1510.3069,1266.6709 C 1514.5871,1266.2237 1518.8278,1265.8555 1522.8314,1265.9614 L 1524.4852,1264.3617 L 1527.7934,1264.3617 L 1528.1737,1263.2208 L 1543.0475,1261.7959 L 1542.9941,1258.9389 L 1544.7335,1258.3849 L 1550.8391,1258.9739 C 1550.8292,1256.9074 1551.7437,1255.6114 1552.8416,1254.4681 L 1552.2467,1252.0154 C 1554.424,1251.6778 1557.211,1252.2718 1560.2155,1252.4645 L 1563.2291,1250.607 L 1560.5673,1248.6857 L 1560.6305,1247.8305 L 1563.266,1246.9979 L 1562.4277,1245.7474 C 1563.7772,1244.7656 1566.1895,1244.6105 1568.3231,1244.2385 L 1568.5143,1243.1015 L 1572.0575,1244.0205 L 1574.1737,1242.888 L 1573.453,1238.4976 L 1571.4869,1237.9816 L 1571.5568,1234.4035 C 1579.1113,1233.4161 1585.546,1233.1286 1592.5406,1232.4911 L 1592.5406,1235.0863 L 1595.0963,1235.9772 C 1594.8922,1236.7623 1595.7546,1238.7394 1597.1324,1241.2925 C 1596.8476,1242.9241 1596.7423,1244.5793 1596.4819,1246.2135 C 1596.2703,1248.284 1596.6386,1250.3931 1597.8258,1252.5567 L 1596.3934,1253.442 C 1597.2988,1255.9188 1599.5719,1257.4822 1600.891,1259.6574 L 1585.1093,1260.4091 L 1585.1679,1263.2274 L 1587.0016,1263.2274 C 1586.0806,1265.0592 1586.667,1266.4603 1587.6916,1267.7361 L 1586.3899,1269.0378 L 1587.7067,1271.9278 L 1586.3022,1272.6409 L 1586.3022,1274.6554 L 1589.9885,1274.2885 C 1589.7225,1277.335 1589.134,1280.7919 1586.8379,1286.4222 C 1587.6019,1290.1436 1588.4182,1293.8547 1589.1378,1297.585 L 1585.2636,1299.0129 L 1580.0638,1303.5899 L 1580.0638,1304.3388 C 1580.0638,1304.7507 1580.6348,1306.1575 1581.3327,1307.465 L 1582.6016,1309.8424 L 1588.0036,1309.1257 L 1588.0036,1310.3272 L 1586.5488,1310.8803 C 1585.7487,1311.1844 1584.2073,1311.4333 1583.1235,1311.4333 L 1581.1528,1311.4333 L 1578.83,1312.7094 C 1577.5525,1313.4112 1575.9676,1314.3007 1575.3081,1314.686 L 1574.1089,1315.3865 L 1572.124,1315.3191 z "},"la5":{"name":"LA-5","path":"M 1612.9041,1096.4902 C 1587.2385,1098.5503 1561.9357,1100.6507 1533.5592,1102.4096 L 1533.8073,1103.278 L 1534.8176,1118.0411 L 1529.5893,1118.75 C 1529.7698,1119.7356 1529.5364,1121.0892 1528.3133,1123.3225 L 1527.8702,1132.5029 L 1528.5614,1136.7563 L 1533.4352,1136.7563 C 1534.3188,1142.1223 1534.5566,1145.3747 1534.853,1150.9168 C 1534.0609,1151.5737 1533.3488,1152.9907 1532.8681,1156.6058 L 1526.7891,1156.6058 C 1526.7658,1160.2778 1530.5001,1156.0232 1529.7134,1175.0198 L 1527.6044,1175.6047 L 1526.6296,1183.9521 L 1544.9727,1181.9849 L 1544.6182,1176.7389 L 1557.8572,1175.8173 L 1560.0725,1177.7136 L 1558.3711,1181.1164 L 1559.8067,1182.0203 L 1558.442,1186.6637 C 1559.1561,1187.8238 1560.7349,1188.2429 1562.536,1188.4714 L 1563.1917,1191.7678 L 1564.6804,1191.7678 L 1565.0349,1194.3199 L 1568.1541,1193.9477 L 1568.1541,1195.4542 L 1545.7525,1202.6496 L 1542.3497,1202.2597 L 1542.4206,1199.1405 L 1541.5699,1199.1405 L 1541.2155,1196.1099 L 1539.7267,1195.6136 L 1539.1652,1197.6539 C 1537.0806,1198.2527 1533.6456,1203.6073 1531.3262,1203.6775 L 1531.9819,1205.3789 C 1530.441,1205.4212 1529.5381,1206.1015 1528.9336,1207.0803 C 1530.8709,1207.1412 1532.701,1207.2481 1533.5592,1207.7715 L 1533.5592,1209.2779 L 1535.6505,1209.9336 L 1536.9089,1214.1694 L 1538.8229,1235.4367 L 1530.6704,1235.4367 L 1531.0071,1241.9055 L 1533.8428,1242.579 C 1534.8577,1245.9103 1536.7412,1247.5044 1538.8428,1248.6623 L 1541.5699,1245.0779 L 1544.9195,1245.0425 C 1544.4563,1249.0866 1543.9976,1253.1614 1543.0764,1254.152 L 1544.9195,1254.152 C 1543.9956,1256.2841 1543.9199,1257.6892 1545.1854,1257.9447 L 1550.5731,1258.6713 C 1550.6034,1257.1649 1550.9682,1255.6584 1552.3986,1254.152 L 1551.8314,1251.9366 C 1552.8463,1251.4763 1555.7177,1251.5465 1560.0194,1252.0252 L 1562.5891,1250.6429 L 1560.2143,1248.9769 L 1560.2143,1247.4882 L 1562.5891,1246.8502 L 1561.9334,1245.7691 C 1563.0187,1244.8287 1565.5304,1244.3162 1568.1541,1243.8373 L 1568.1541,1242.6853 L 1571.9645,1243.3942 L 1573.595,1242.774 L 1573.1519,1238.9458 L 1570.9897,1238.3787 L 1570.9897,1233.8239 L 1593.1077,1231.9631 L 1593.1077,1234.7987 L 1595.3763,1235.5076 C 1595.7485,1237.9119 1596.635,1239.6734 1597.6271,1241.3029 C 1596.8306,1245.3951 1596.4581,1249.2792 1598.141,1252.1316 L 1602.7844,1255.3394 C 1603.7991,1257.1107 1605.1796,1258.7449 1605.0174,1260.9575 L 1603.5996,1261.0461 L 1605.0174,1261.6132 L 1605.0174,1263.6336 L 1606.1517,1265.0869 C 1606.7755,1265.88 1607.286,1266.808 1607.286,1267.1427 L 1607.286,1267.7453 C 1612.9814,1268.9542 1617.08,1268.7437 1621.4287,1268.7555 L 1622.0845,1266.682 L 1623.6795,1267.3023 L 1626.5329,1265.211 L 1626.5683,1263.6336 L 1628.8014,1261.9677 L 1622.1022,1262.7829 L 1618.7881,1259.3802 C 1615.514,1258.5917 1618.5225,1258.0891 1611.2559,1252.486 L 1611.2559,1251.7239 L 1614.6586,1251.3163 L 1614.6586,1250.3239 C 1612.8841,1249.4698 1610.5254,1249.4944 1608.1366,1249.5618 L 1607.2151,1244.4753 L 1610.4052,1239.4066 L 1613.3294,1240.2219 L 1617.0512,1237.9002 L 1615.6865,1235.5785 L 1612.4256,1237.7052 L 1609.0405,1237.7052 L 1606.8252,1238.7332 L 1603.706,1237.0849 L 1607.2683,1234.2493 L 1607.5873,1228.454 L 1605.3896,1226.6817 L 1602.5717,1227.426 L 1602.4122,1228.3299 L 1604.6984,1228.1881 L 1605.8504,1231.6618 L 1600.1968,1231.7504 C 1600.2765,1226.8632 1599.9252,1223.8717 1599.2221,1222.4282 L 1597.5562,1221.0458 L 1596.7055,1222.4282 C 1595.9508,1222.2044 1595.3081,1221.1092 1594.8091,1220.5319 L 1599.2398,1219.0431 L 1600.5867,1220.6382 L 1599.8424,1221.8256 L 1600.2146,1221.8256 L 1603.8832,1219.4862 L 1603.8832,1217.9443 L 1599.9133,1215.4986 L 1599.931,1214.5416 C 1599.9409,1214.0212 1600.3238,1213.1089 1600.7817,1212.5035 C 1601.2396,1211.8979 1601.6147,1211.0475 1601.6147,1210.6249 L 1601.6147,1209.8627 L 1599.931,1208.9057 C 1599.0001,1208.3744 1598.0946,1207.5806 1597.9283,1207.1512 L 1597.6271,1206.3714 L 1598.8677,1204.8649 L 1604.7339,1204.5282 L 1605.0883,1202.0825 L 1604.0604,1201.3204 C 1603.4968,1200.8956 1602.7154,1200.0431 1602.3236,1199.4241 C 1601.9317,1198.8049 1601.4461,1197.9423 1601.2425,1197.51 L 1600.8703,1196.7124 L 1601.4374,1195.8086 C 1601.7545,1195.3051 1602.4249,1194.8085 1602.9262,1194.7098 L 1603.8477,1194.5326 L 1604.2022,1195.9681 C 1604.3999,1196.7558 1604.9129,1197.6901 1605.3365,1198.0417 L 1606.0986,1198.6797 L 1607.3746,1197.8822 L 1604.2908,1194.6566 L 1603.3515,1188.755 L 1603.9541,1187.7979 L 1606.4707,1187.7979 L 1607.7291,1186.9118 C 1608.4223,1186.4262 1608.9873,1185.7846 1608.9873,1185.4762 L 1608.9873,1184.9091 L 1604.9997,1185.6534 L 1603.3161,1184.2534 L 1603.3161,1181.6304 L 1604.4503,1180.9215 L 1605.7087,1181.8076 C 1606.4024,1182.2935 1607.4227,1182.6938 1607.9772,1182.6938 L 1608.9873,1182.6938 L 1608.9873,1176.3845 L 1610.1925,1174.1336 L 1610.5824,1168.2851 L 1611.5926,1167.5585 C 1612.1482,1167.1523 1612.9488,1166.8142 1613.3649,1166.8142 L 1614.1269,1166.8142 L 1614.6941,1168.3206 C 1615.007,1169.1436 1615.3907,1169.6796 1615.5448,1169.5257 C 1615.6987,1169.3717 1615.5997,1168.654 1615.3321,1167.9307 L 1614.8359,1166.6192 L 1618.4336,1163.4645 L 1618.4336,1160.0618 L 1619.9046,1158.3072 L 1620.8616,1158.3072 C 1621.3876,1158.3072 1622.312,1157.9362 1622.9174,1157.4742 L 1624.0163,1156.6235 L 1623.1656,1156.0564 C 1622.6977,1155.7434 1621.7327,1155.494 1621.0211,1155.4893 L 1619.7273,1155.4716 L 1619.0362,1153.6816 L 1619.9578,1152.7777 L 1623.396,1153.3625 C 1623.2909,1152.1358 1624.0862,1151.8481 1624.8669,1151.0231 L 1626.5683,1149.3218 L 1626.5683,1147.5318 L 1625.505,1147.5318 L 1625.1505,1150.013 L 1618.345,1150.0839 L 1618.345,1145.1037 L 1619.1957,1144.7138 C 1619.6635,1144.4944 1620.6249,1144.0109 1621.3224,1143.6505 C 1622.02,1143.2901 1622.9771,1142.9948 1623.4491,1142.9948 L 1624.2998,1142.9948 L 1624.2998,1141.8605 L 1626.338,1141.8605 L 1627.8267,1143.2783 L 1627.0291,1138.4577 L 1627.7912,1138.3868 C 1628.2085,1138.3499 1628.765,1138.3566 1629.0318,1138.4045 C 1629.2985,1138.4524 1629.8728,1138.1985 1630.3079,1137.8374 C 1630.7429,1137.4764 1631.1054,1136.9591 1631.1054,1136.6854 L 1631.1054,1136.1892 L 1629.723,1136.1892 C 1628.9635,1136.1892 1627.6874,1135.9439 1626.8873,1135.6398 L 1625.4341,1135.0904 L 1625.4341,1134.3637 C 1625.4359,1133.9661 1625.831,1132.8931 1626.3025,1131.9889 C 1626.7741,1131.0847 1627.0617,1130.2491 1626.9405,1130.128 C 1626.8193,1130.0068 1626.0686,1130.2092 1625.2746,1130.5711 L 1623.8213,1131.2268 L 1619.4792,1129.1001 L 1619.2843,1128.0722 C 1619.1786,1127.5016 1619.2543,1126.417 1619.4438,1125.6619 L 1619.7805,1124.2795 L 1620.4894,1124.2972 C 1620.8734,1124.3042 1621.8186,1124.8038 1622.5984,1125.4138 C 1623.3782,1126.0237 1624.3869,1126.5233 1624.8493,1126.5303 L 1625.6999,1126.548 L 1623.6087,1125.1302 C 1622.4611,1124.3504 1621.1389,1123.7124 1620.6667,1123.7124 L 1619.7982,1123.7124 L 1624.3707,1119.193 L 1623.6087,1117.9348 L 1622.2972,1120.5577 L 1617.9196,1122.2237 L 1616.36,1120.0969 L 1616.36,1117.474 L 1620.897,1113.061 L 1620.0109,1112.7243 C 1619.5152,1112.534 1618.2699,1112.3698 1617.2462,1112.3698 L 1615.3853,1112.3698 L 1614.6764,1107.2656 L 1615.9347,1104.5363 L 1618.026,1103.9692 L 1619.3552,1101.0804 L 1617.4411,1097.0573 L 1616.3423,1097.0573 L 1616.6436,1101.7184 L 1614.8359,1102.9058 L 1611.9471,1102.1792 L 1611.2736,1100.4069 L 1612.9041,1096.4902 z "},"wv2":{"name":"WV-2","path":"M 2052.1984,718.79786 L 2049.7949,713.98254 L 2047.4675,713.9201 L 2046.5966,712.55672 L 2047.0943,711.0274 L 2045.0385,709.33991 L 2044.1824,709.93267 L 2042.7434,708.29872 L 2040.7871,708.29872 L 2039.6603,705.57616 L 2036.2305,705.48587 C 2036.1012,706.30231 2036.5798,707.14835 2035.3574,707.64867 L 2033.7809,705.45632 L 2031.4271,708.29197 L 2032.1241,705.79564 L 2030.527,700.83598 L 2029.2909,700.95281 L 2028.1015,701.90383 L 2025.8362,701.60178 L 2022.166,705.75571 L 2020.0915,705.2132 L 2017.6595,693.73236 L 2009.2447,688.30964 L 2010.5145,687.52485 L 2010.4784,684.47256 L 2008.8131,682.2708 L 2008.8131,680.98807 C 2008.8131,680.28256 2008.5169,679.05529 2008.1549,678.26086 C 2007.7929,677.46637 2007.2825,676.81632 2007.0207,676.81632 L 2006.5446,676.81632 L 2006.5446,675.31264 L 2009.3395,672.68695 L 2008.9115,669.16009 L 2010.1705,664.05593 L 2012.3347,661.58784 L 2011.6302,660.44797 L 2012.955,659.62915 L 2014.3258,661.50385 L 2016.7267,661.50385 L 2018.4631,664.15382 L 2017.7682,667.6281 L 2020.2369,668.41165 L 2022.4242,666.4322 L 2022.4242,665.19682 C 2022.4242,664.51734 2022.578,663.80758 2022.766,663.61952 L 2023.1079,663.27766 L 2025.8674,664.32679 L 2026.521,662.62365 L 2025.0883,660.89742 L 2025.1833,657.55612 C 2024.167,656.80848 2023.1946,656.02516 2022.4242,655.04204 L 2024.1612,654.69831 L 2024.7771,653.09322 C 2027.5019,654.00306 2030.2066,654.97614 2032.9489,655.83256 L 2038.2849,648.74345 L 2044.1078,643.74563 L 2043.1734,646.59982 C 2045.3021,646.35363 2047.1958,648.25748 2048.1699,652.91565 C 2049.5479,651.58579 2052.2051,651.02342 2055.2171,650.67396 L 2055.9517,651.86266 L 2058.1447,651.86266 L 2060.9889,654.33574 L 2062.3307,661.59737 L 2060.1099,665.9329 L 2065.3924,668.85384 C 2069.1421,664.54451 2072.9373,660.2742 2076.6487,655.93181 C 2078.1287,655.51213 2079.429,654.99021 2080.2713,653.62893 L 2073.5106,648.35758 L 2072.7104,643.72947 L 2078.2863,637.85833 L 2093.9543,638.89787 L 2095.3885,637.70764 L 2099.1384,638.78309 L 2100.7787,641.12499 L 2104.9414,640.80365 L 2105.312,643.41817 L 2103.716,645.53765 C 2105.4794,645.85172 2109.119,644.42375 2113.1648,642.61846 L 2113.6755,635.53712 L 2115.5623,633.31891 C 2116.4485,634.6186 2117.5008,635.84717 2117.2806,637.62104 C 2124.3759,638.24312 2131.4712,638.855 2138.5665,637.70826 L 2150.2549,644.50627 L 2151.6277,643.07217 L 2153.3562,636.26662 L 2149.8772,630.12422 L 2152.0122,617.50107 C 2154.9975,612.19201 2156.1085,610.78803 2157.1597,609.50841 C 2157.4007,607.40085 2160.1127,601.91178 2163.4559,595.55909 L 2171.6521,595.2314 L 2174.5607,592.32277 L 2173.2515,590.74524 L 2175.0761,590.04501 L 2174.6219,588.68231 L 2176.3681,586.64286 L 2180.6531,586.64286 L 2183.2052,580.90057 L 2187.5809,581.44717 L 2192.0228,585.01673 L 2198.2341,583.6267 L 2198.2341,582.67296 L 2199.9354,582.67296 L 2199.9354,584.2979 L 2197.6669,585.01792 L 2200.9225,589.36695 L 2203.0547,589.77177 L 2203.4135,592.88128 L 2206.1069,592.88128 L 2206.9288,598.09313 L 2208.4359,598.67143 L 2206.5135,609.89514 L 2178.132,595.71692 L 2178.0053,600.30312 L 2178.9978,600.91653 L 2178.2632,603.23121 L 2179.7479,604.14876 L 2177.0212,609.97023 L 2178.5017,610.88517 L 2177.2503,613.50366 L 2178.8823,615.41597 L 2173.0742,625.42244 L 2174.3562,625.84977 L 2173.1392,628.52061 L 2171.7919,628.00361 L 2169.868,632.69797 L 2168.3569,632.11808 C 2166.4564,632.99854 2164.8698,637.43599 2163.4624,643.90494 L 2156.4486,640.52009 L 2154.7457,644.48999 L 2153.7463,650.59779 L 2154.6425,653.12957 L 2152.4375,653.3795 L 2150.7759,664.36774 L 2148.0678,670.14961 L 2140.1279,669.41167 L 2135.2515,663.83719 L 2130.1106,663.06623 L 2130.7494,661.40148 C 2130.104,660.58544 2129.8293,659.69533 2129.6824,658.68817 L 2127.3248,656.9172 L 2126.3955,659.42924 L 2125.6052,658.15059 L 2123.9402,658.78957 L 2123.9402,657.14263 L 2121.8343,655.23679 L 2120.7064,656.68326 C 2120.0981,660.57002 2119.1232,664.27348 2119.3803,668.59296 L 2113.0689,675.11494 L 2108.6982,675.11494 L 2104.8109,680.2191 L 2105.3206,672.56286 L 2098.3302,663.06759 L 2097.0964,664.30144 L 2094.5088,661.50941 L 2091.832,662.60164 L 2089.4147,662.22138 L 2088.1132,668.67043 L 2082.6415,677.24746 L 2078.2863,677.79666 L 2076.5147,676.26644 L 2071.9766,680.98886 L 2075.1671,681.35335 L 2075.4574,682.98164 L 2058.2547,699.78504 C 2057.2613,702.36468 2056.1436,704.44701 2054.7098,705.26486 L 2055.4841,718.21672 C 2054.2941,718.69481 2053.0684,719.27986 2052.1984,718.79786 z "},"ms3":{"name":"MS-3","path":"M 1720.6586,1047.7171 L 1718.5353,1048.7437 L 1716.3022,1048.0348 L 1715.5368,1049.6518 L 1717.5125,1050.8363 L 1718.9402,1064.9948 L 1719.9837,1067.1129 L 1725.2232,1066.5457 L 1724.0068,1069.0078 L 1725.2133,1070.8099 L 1722.5194,1073.1912 L 1720.0205,1071.8443 L 1718.9841,1072.9062 L 1713.9062,1073.2379 L 1713.4469,1078.9637 L 1708.8155,1079.3488 L 1710.0426,1090.6594 L 1703.0244,1091.4569 L 1703.6433,1098.3476 L 1705.5056,1100.3715 C 1704.9283,1102.0221 1704.4176,1103.6267 1702.1205,1106.4681 L 1705.3992,1110.8633 L 1705.3992,1112.9369 L 1703.8574,1112.9369 L 1698.6646,1108.967 L 1695.12,1108.967 L 1692.054,1111.3064 L 1690.8311,1108.4885 L 1685.9042,1112.1926 L 1684.3269,1109.995 L 1681.3494,1112.5647 L 1681.3494,1116.3397 L 1675.5186,1116.3397 C 1673.7227,1120.0393 1671.9268,1122.402 1670.1309,1123.9959 L 1667.1003,1119.4589 L 1662.1202,1120.3096 L 1657.7959,1116.8005 L 1655.9527,1118.2538 L 1654.0741,1118.3247 L 1654.3576,1123.8542 L 1665.0976,1122.9857 L 1665.8243,1128.0544 L 1675.0578,1127.5405 C 1671.5964,1130.6007 1674.0886,1129.596 1670.6271,1133.7789 C 1670.601,1134.4319 1670.5602,1135.0931 1669.6701,1135.7461 L 1668.3586,1138.2982 L 1670.2904,1140.6022 L 1667.4016,1142.8707 L 1667.2421,1146.3621 L 1668.3586,1147.5318 L 1667.8978,1151.5017 L 1669.103,1152.2283 C 1669.103,1152.63 1669.8634,1153.8422 1670.7867,1154.9222 C 1671.7097,1156.0021 1672.3158,1157.8625 1672.3285,1158.1831 L 1674.8984,1160.0972 L 1674.3667,1162.8088 L 1675.625,1163.2696 L 1674.9161,1164.014 C 1674.5262,1164.4272 1674.2071,1165.0017 1674.2071,1165.2723 L 1674.2071,1165.7508 L 1676.3871,1165.0596 L 1676.7592,1165.6976 L 1676.5997,1167.0445 L 1667.3485,1172.4146 L 1663.8216,1172.255 L 1663.0418,1173.7615 L 1659.3023,1173.1057 L 1644.4329,1174.8071 L 1644.8051,1180.1948 L 1623.0415,1182.2684 L 1622.1554,1180.8328 L 1619.0184,1181.6304 L 1615.8106,1180.3012 L 1616.4309,1179.291 L 1614.6586,1179.291 L 1614.6586,1178.4757 C 1614.4399,1177.1615 1613.9392,1175.9455 1613.3471,1174.754 L 1612.6205,1174.754 C 1612.225,1174.754 1611.498,1175.15 1611.0077,1175.6401 L 1610.1216,1176.5439 L 1610.1216,1183.1368 L 1607.2683,1183.8635 L 1606.1694,1183.2786 C 1605.5725,1182.9591 1604.7854,1182.6938 1604.4149,1182.6938 L 1603.7414,1182.6938 L 1605.2479,1184.5192 L 1610.1216,1183.9698 L 1610.1216,1186.575 L 1607.1265,1188.9322 L 1604.7339,1188.9322 L 1605.1415,1194.054 L 1608.438,1197.2973 L 1607.7291,1199.1405 L 1604.4326,1199.1405 L 1603.7768,1197.7227 C 1603.4216,1196.9429 1602.9221,1196.3049 1602.6603,1196.3049 C 1602.3985,1196.3049 1602.1818,1196.4392 1602.1818,1196.6061 C 1602.1818,1196.773 1602.6161,1197.6025 1603.1566,1198.4493 C 1603.6971,1199.2961 1604.5902,1200.328 1605.1415,1200.7355 L 1606.1517,1201.4799 L 1606.1517,1204.7763 L 1603.9541,1205.946 L 1599.3462,1205.946 L 1599.3462,1206.4068 C 1600.1672,1207.6906 1601.5614,1208.4591 1602.7489,1209.3843 L 1602.7489,1211.9363 L 1601.1362,1214.6833 C 1602.426,1215.5886 1603.7216,1216.4626 1605.0174,1217.3595 L 1605.0174,1219.8938 L 1602.938,1221.4968 C 1637.9065,1218.3513 1670.5543,1215.2058 1695.8289,1212.0604 C 1695.2189,1210.9675 1694.9236,1209.8746 1695.1909,1208.7817 L 1690.4655,1208.7817 L 1692.9401,1203.1104 L 1694.0566,1203.1104 L 1694.0566,1197.9708 L 1692.3907,1197.3328 L 1694.1098,1194.7275 L 1696.077,1195.2415 L 1699.3735,1188.3651 L 1702.5636,1188.3651 L 1702.5636,1184.6078 L 1715.5539,1183.3013 L 1713.8911,1167.6244 L 1717.911,1171.1258 L 1720.1446,1170.146 C 1721.4052,1167.6991 1720.9857,1166.484 1720.3927,1165.3963 L 1717.3621,1165.7153 L 1716.2744,1162.9284 L 1717.5859,1160.3033 L 1717.0608,1155.2766 C 1719.533,1154.534 1721.4413,1153.439 1722.9093,1152.0688 C 1724.1995,1153.1119 1725.9153,1153.8511 1728.0844,1154.2664 L 1728.0844,1151.9625 L 1730.2289,1151.3953 L 1730.8846,1148.1166 L 1730.2643,1146.5039 L 1727.2514,1145.7418 L 1724.9297,1148.666 L 1722.7453,1148.666 L 1721.1548,1144.129 L 1722.4308,1144.129 L 1721.7042,1139.6629 L 1725.5323,1138.6704 C 1725.7027,1136.7015 1725.6646,1134.7016 1725.9931,1132.751 L 1760.1271,1128.1608 C 1759.673,1106.3502 1759.7414,1084.4833 1758.5498,1062.6928 L 1740.6627,1064.8373 L 1738.1687,1047.8057 L 1722.1379,1049.5192 L 1720.6586,1047.7171 z "},"il19":{"name":"IL-19","path":"M 1664.9913,662.47721 L 1663.7153,663.66467 L 1652.9398,664.83437 L 1647.5698,667.26236 L 1646.8255,670.5588 L 1644.9114,672.15385 L 1644.7165,675.43259 L 1641.3669,679.36704 L 1641.4732,682.82295 L 1645.7089,683.05338 L 1648.2433,704.03714 L 1663.9988,703.29278 L 1663.9988,697.2316 L 1668.5359,697.2316 L 1668.9258,699.571 L 1673.7818,698.93298 L 1672.3817,683.62051 L 1678.0353,683.62051 C 1678.6677,686.28516 1678.7411,688.07944 1678.7442,690.42605 L 1684.8231,690.42605 L 1685.4257,698.13543 L 1680.481,698.91523 L 1681.0481,707.35127 C 1675.2419,707.27573 1675.5765,706.61463 1670.2372,708.09563 L 1670.2372,711.79972 L 1655.3856,713.1112 L 1654.8007,715.36196 L 1649.2535,716.08863 L 1649.2535,721.75991 L 1643.4759,721.051 L 1644.2557,716.47853 L 1628.0748,718.19761 L 1625.1683,696.20368 L 1615.1194,697.30249 L 1613.5244,695.24665 L 1612.337,697.2316 L 1609.4481,697.2316 L 1610.2279,702.05219 L 1612.0889,703.50546 L 1612.0889,708.00704 L 1616.2714,708.00704 C 1616.9558,711.92046 1617.44,716.15419 1617.2107,721.52949 L 1625.505,723.798 L 1629.3685,722.18526 L 1633.941,722.18526 L 1636.2095,738.22434 L 1651.3093,736.80652 L 1654.4994,763.88691 L 1681.5798,761.28169 L 1681.5798,767.04157 L 1702.9712,764.38315 L 1707.0829,797.45384 L 1697.0341,798.87167 L 1696.0062,794.49417 L 1690.6539,794.15741 L 1692.8692,817.17932 L 1698.3101,817.17932 L 1698.8772,821.04288 L 1705.9309,823.04553 L 1709.0856,825.24315 L 1714.7568,825.98751 L 1718.7091,828.80546 L 1719.6661,828.80546 C 1720.1901,828.80546 1721.0242,828.65483 1721.5092,828.46869 L 1722.3776,828.13199 L 1723.1043,824.26843 L 1722.4131,821.53912 L 1718.2305,817.23246 L 1718.2837,815.49563 C 1718.3115,814.54654 1718.5173,812.42116 1718.7445,810.76367 L 1719.1698,807.7508 L 1721.8637,805.97852 L 1725.0184,806.61654 L 1725.6918,805.53543 C 1726.0626,804.94164 1727.0813,804.10564 1727.9426,803.67456 C 1728.8039,803.24338 1731.3869,802.41526 1733.6848,801.8314 L 1737.8496,800.76803 L 1738.4522,799.22612 L 1734.3405,795.85879 L 1732.0366,790.6306 L 1733.4721,786.6607 L 1736.5382,784.39219 L 1735.9533,783.43516 L 1731.6112,783.43516 L 1730.8314,778.22466 L 1721.846,779.53615 L 1721.846,784.56942 L 1715.7316,784.56942 L 1715.1822,776.87773 C 1718.4352,775.75476 1721.9498,775.4725 1725.3728,775.49536 L 1724.593,768.15813 L 1729.7858,766.86434 L 1728.9351,753.18236 L 1732.5505,752.22533 L 1732.905,747.98962 L 1736.5913,747.63516 L 1736.5913,744.78177 L 1739.7991,745.49068 L 1741.1283,742.5487 L 1741.1283,739.32315 L 1743.9994,738.59655 L 1745.0982,735.70771 L 1743.964,724.59556 L 1747.3667,722.82328 C 1747.362,722.62717 1747.1706,722.1949 1746.9414,721.8485 C 1745.7452,720.74833 1744.2799,720.03244 1742.8297,719.31417 L 1742.8297,714.13912 L 1733.4544,715.4683 L 1730.6364,695.63655 L 1705.9663,698.50764 L 1703.9814,681.63556 L 1698.5937,682.02546 L 1698.5937,680.21774 C 1697.5157,680.14656 1696.273,679.10923 1695.0137,677.94922 L 1691.8768,677.94922 L 1691.1501,674.67048 L 1686.684,675.27305 L 1686.684,670.57655 L 1670.9462,672.29563 C 1669.8817,664.52217 1670.4078,663.13315 1669.0321,662.63675 L 1664.9913,662.47721 z "},"ga2":{"name":"GA-2","path":"M 1969.3445,1058.3508 L 1966.2784,1060.7611 L 1957.7715,1060.7611 L 1957.7715,1062.8524 L 1962.9997,1070.4909 L 1963.7972,1086.2819 C 1962.2604,1086.3828 1959.4513,1090.7065 1953.837,1093.6546 L 1946.7125,1093.6191 L 1944.1604,1090.8189 L 1939.0562,1090.8189 C 1939.244,1093.3483 1939.4454,1095.8883 1937.8157,1097.0041 L 1941.0412,1097.7662 L 1944.7275,1100.5132 L 1944.0456,1102.3657 C 1941.3756,1104.9178 1938.6673,1107.4727 1937.4081,1109.9241 L 1938.4182,1116.96 C 1938.1048,1120.6404 1937.1025,1124.3209 1935.5471,1128.0013 C 1936.8958,1130.5584 1938.1016,1133.2203 1937.922,1136.8981 L 1942.4945,1141.4706 L 1942.0514,1142.7112 L 1943.4338,1145.5468 L 1943.2743,1162.2062 L 1942.5122,1162.986 L 1944.249,1166.3534 L 1943.6287,1167.9307 L 1948.4848,1172.4854 L 1950.9659,1177.4301 L 1950.9659,1179.8936 C 1951.7596,1180.1231 1952.2618,1180.4352 1952.6673,1181.1164 C 1956.4073,1187.7378 1959.0061,1194.5116 1961.2882,1194.8009 C 1991.7952,1191.4414 2022.8708,1188.0345 2049.0792,1185.0332 L 2049.0792,1179.7518 C 2044.3702,1175.2825 2040.4131,1168.6811 2034.5111,1162.4721 L 2027.2448,1157.6338 L 2027.2271,1156.3045 L 2026.2168,1156.8362 L 2026.1991,1159.0161 C 2018.0759,1159.478 2010.4078,1160.3278 2003.7089,1159.3883 C 2003.7369,1151.5643 2003.4176,1142.0227 2004.4356,1139.0249 L 2017.5327,1139.1312 L 2017.2137,1133.0523 L 2014.6616,1130.5534 L 2015.7073,1116.9068 L 2026.3941,1116.9068 L 2026.3941,1105.9896 C 2027.3393,1102.2546 2029.2336,1097.9614 2029.2297,1094.7888 L 2019.5708,1094.7888 L 2020.6873,1074.9748 L 2025.0471,1072.334 L 2021.0063,1070.9162 L 2017.3909,1067.8325 L 2016.2212,1064.731 L 2001.9366,1064.5538 L 1998.5693,1066.0247 C 1997.7101,1068.5019 1995.8893,1069.7365 1993.3411,1071.7138 L 1991.9764,1068.9136 C 1985.8009,1066.8829 1980.4899,1063.4374 1975.8133,1058.9711 L 1969.3445,1058.3508 z "},"ga10":{"name":"GA-10","path":"M 2026.9419,1035.2081 C 2024.184,1034.2652 2020.4909,1033.7258 2016.4693,1033.2567 L 2016.1062,1028.7197 C 2014.4832,1027.0777 2013.4377,1025.2433 2012.783,1023.2786 L 2012.783,1016.6661 L 2004.8675,1013.4687 L 2002.7942,1011.4223 L 2002.084,1011.4223 L 2000.8597,1005.3853 C 2001.3552,1002.8669 2003.2569,999.80758 2007.2245,995.99715 L 2007.9691,989.1134 C 2004.0549,985.93816 2003.2794,984.82999 2002.6066,983.78937 L 2003.7115,981.44003 C 2004.9154,981.37181 2006.7628,979.7408 2008.7286,978.45354 L 2008.7073,974.27533 L 2003.187,970.58899 L 1996.8959,970.58899 L 1994.1466,967.84494 L 1991.6175,967.74002 C 1991.7991,964.12957 1993.2829,964.60743 1995.8872,957.27213 C 1993.3762,955.33601 1990.8309,952.88516 1988.2392,949.73833 C 1986.799,946.53865 1986.0018,943.33891 1985.2772,940.13923 L 1981.5547,934.85988 C 1974.8425,929.47284 1973.339,929.50659 1966.324,925.14922 C 1981.4951,922.71063 1993.085,920.08357 2005.3394,917.49145 L 2004.6962,920.70787 L 2002.2236,923.38863 C 2000.8637,924.86305 1999.7484,926.37019 1999.7451,926.73781 C 1999.7417,927.10542 1999.3965,927.74871 1998.9779,928.16731 C 1998.5593,928.58591 1997.9016,929.5173 1997.5164,930.2371 L 1996.816,931.54575 L 1997.3849,933.02828 L 1995.6335,935.52887 L 1996.8405,938.17798 L 1999.5658,939.75891 C 2001.0647,940.62838 2002.3762,941.54066 2002.4801,941.78617 L 2002.6692,942.23256 L 2006.3139,942.23256 L 2007.6178,943.22503 C 2008.335,943.77089 2009.5951,944.81259 2010.418,945.53988 C 2011.241,946.26717 2013.0223,947.367 2014.3766,947.98392 L 2016.8389,949.10565 L 2017.5329,948.52961 C 2017.9146,948.21281 2019.2453,947.79076 2020.4899,947.59175 L 2022.7529,947.22987 L 2024.3698,950.26072 C 2025.259,951.92768 2026.597,953.92959 2027.3431,954.70939 C 2028.0892,955.48919 2029.4568,956.96543 2030.3825,957.98994 L 2032.0654,959.85268 L 2032.0654,960.70638 C 2032.0654,961.17596 2032.5862,962.58108 2033.2228,963.82887 L 2034.3803,966.09767 L 2035.6331,966.62255 C 2036.3222,966.91122 2037.3326,967.5033 2037.8784,967.93829 C 2038.4243,968.37322 2038.8709,968.95339 2038.8709,969.22754 C 2038.8709,969.50175 2039.5151,970.36685 2040.3025,971.14999 C 2041.0898,971.93314 2042.3021,973.45123 2042.9964,974.52345 L 2044.2586,976.47301 L 2047.945,977.42698 L 2047.945,978.50577 L 2050.1909,979.65154 C 2051.4262,980.28173 2052.782,980.79731 2053.2039,980.79731 C 2053.6259,980.79731 2055.2949,981.43595 2056.9128,982.21649 C 2058.5309,982.99703 2059.8562,983.82646 2059.8582,984.05966 C 2059.8602,984.29286 2060.6258,984.91841 2061.5596,985.44975 L 2063.2574,986.41585 L 2063.2574,988.5613 L 2064.4568,989.64168 C 2065.1164,990.23592 2065.873,991.28908 2066.138,991.98211 L 2066.6199,993.2421 L 2070.7506,994.96798 L 2071.7145,994.37233 L 2075.4791,995.94526 L 2079.8628,1000.0797 L 2080.8043,1000.0797 C 2081.3221,1000.0797 2082.0102,1000.3441 2082.3334,1000.6672 L 2082.9209,1001.2548 L 2082.5091,1003.9282 C 2082.2827,1005.3986 2082.2142,1006.7967 2082.3571,1007.0351 C 2082.4999,1007.2735 2083.6563,1007.9988 2084.9267,1008.647 C 2086.1972,1009.2952 2087.5449,1010.1134 2087.9217,1010.4653 L 2088.6067,1011.1052 L 2088.1013,1013.0377 L 2089.8294,1013.9314 C 2090.7799,1014.4229 2091.953,1014.825 2092.4364,1014.825 L 2093.3153,1014.825 L 2093.3153,1016.5264 L 2095.4676,1018.6787 L 2089.081,1019.4767 L 2085.336,1022.7648 C 2084.0886,1022.6557 2082.9325,1022.8386 2082.0861,1024.0125 L 2075.3733,1024.0125 L 2067.7055,1020.7799 L 2058.9212,1012.0527 L 2056.9552,1007.6927 C 2052.2425,1007.0465 2046.8693,1006.1311 2044.2019,1006.3181 L 2042.917,1005.0332 L 2041.412,1005.8062 L 2041.2303,1007.0874 L 2043.9904,1009.5742 L 2044.3496,1016.5677 L 2046.23,1019.8016 C 2045.3353,1020.6136 2044.3436,1021.3771 2044.5422,1022.7357 L 2041.3078,1024.4083 L 2039.5053,1026.564 C 2038.514,1027.7496 2037.5191,1028.9087 2037.2944,1029.1396 C 2037.0698,1029.3706 2036.0835,1030.2 2035.1027,1030.9828 C 2034.1219,1031.7656 2033.1175,1032.406 2032.8707,1032.406 C 2032.6239,1032.406 2031.8952,1032.8975 2031.2512,1033.4983 L 2030.0804,1034.5904 L 2026.9419,1035.2081 z "},"nc5":{"name":"NC-5","path":"M 2138.4339,793.27127 C 2111.0674,798.07326 2081.3023,803.83472 2058.809,806.68744 L 2057.7634,809.80664 L 2058.8267,812.89041 L 2057.7811,817.76414 L 2058.809,820.86565 L 2059.8547,820.86565 L 2059.8547,822.62018 L 2054.0948,822.35437 L 2050.2844,826.51919 L 2051.3832,827.19265 L 2050.4439,830.50684 L 2052.1453,832.3677 L 2053.5631,831.94236 C 2055.7041,833.91534 2056.5687,835.11714 2056.9304,836.49714 C 2058.7078,836.38479 2062.8594,834.33757 2069.8503,833.92731 C 2078.6173,835.24032 2080.0833,835.95377 2082.5576,839.49226 C 2082.5518,841.93891 2082.7008,844.72725 2084.2589,850.88803 L 2085.4286,850.92347 C 2086.4107,849.84746 2090.7846,848.33595 2093.3861,847.62704 L 2094.2191,850.07278 C 2095.7012,850.29839 2096.6808,848.15901 2097.5687,844.7205 L 2103.8603,847.94605 L 2104.4452,850.12592 L 2107.5112,851.31338 L 2109.6025,854.6807 C 2110.8893,855.09805 2112.1833,855.49805 2113.4483,855.97444 L 2114.0154,840.62652 C 2121.8839,842.01984 2122.8635,843.36478 2127.3075,844.68506 C 2125.9478,843.56867 2126.0738,842.48284 2126.278,841.17096 L 2128.6784,839.01371 L 2129.9656,839.09924 L 2130.0729,841.67731 L 2129.9477,838.66918 L 2127.7922,836.80378 L 2128.4039,835.80263 L 2130.1964,836.30216 L 2128.7393,830.47888 C 2131.1183,828.37069 2133.054,827.85903 2134.6877,828.43416 L 2135.0896,827.72904 C 2133.0173,825.8016 2133.0559,823.87416 2133.0143,821.94671 L 2128.5836,817.21476 L 2132.9788,813.04988 L 2133.6346,815.10572 L 2138.1184,815.86783 L 2138.1184,818.86295 L 2141.0418,824.94745 L 2144.7568,824.91949 C 2143.507,821.13719 2142.6603,815.7539 2141.671,810.0175 L 2153.666,807.89729 L 2151.889,805.26961 L 2152.9701,802.85932 L 2151.3042,799.66922 L 2147.8659,803.10744 L 2146.5899,800.34268 L 2140.5465,805.49998 L 2138.4339,793.27127 z "},"nc10":{"name":"NC-10","path":"M 2050.1903,826.86003 L 2046.7044,838.16308 C 2045.2654,839.41796 2043.4696,840.31601 2041.1926,840.73285 L 2040.0406,838.58843 L 2036.6201,838.07444 L 2035.9644,840.14803 L 2035.1491,840.21892 C 2034.7023,840.25788 2034.0985,840.32174 2033.8022,840.3607 C 2033.5059,840.39966 2032.9337,840.7506 2032.5439,841.1405 C 2032.154,841.53041 2031.5615,841.84942 2031.2147,841.84942 L 2030.5766,841.84942 L 2028.1914,844.85378 L 2031.0135,843.58942 L 2031.8811,845.27555 L 2032.0654,846.38644 L 2034.947,846.40805 L 2036.512,848.40531 L 2038.8886,845.76612 L 2040.2639,850.1401 L 2042.9925,852.52726 L 2043.7175,857.14028 L 2044.7032,857.71325 L 2046.3134,855.74747 C 2046.8116,855.384 2047.1296,855.22106 2047.4848,855.31498 C 2048.1635,854.9358 2049.0613,853.67983 2049.9014,852.6548 L 2051.1816,853.05214 L 2051.1753,850.27604 L 2052.4077,849.62129 L 2051.7922,847.96482 L 2052.4523,847.97299 C 2053.3718,848.6718 2054.1749,849.95249 2054.9218,851.5138 L 2053.6418,855.57535 L 2052.0426,855.58998 L 2052.0184,857.08555 L 2058.8362,861.28015 L 2062.4426,869.51463 L 2061.5505,872.0924 L 2056.3379,874.0583 L 2054.0433,873.34621 C 2046.1123,876.66187 2045.5503,876.24118 2043.017,876.81988 L 2043.369,880.44337 L 2041.9227,880.17722 C 2042.0421,881.77233 2041.8602,883.60835 2042.7362,884.5981 L 2046.7134,884.16266 L 2047.8817,882.84879 L 2049.6801,883.51216 L 2052.5431,882.45679 L 2055.3917,883.70227 L 2058.4511,880.50411 C 2061.0039,881.15126 2062.7958,882.09621 2063.4746,883.47666 L 2062.8276,886.9594 L 2066.3884,892.20148 L 2066.3916,893.20195 L 2094.6295,889.14874 L 2096.7712,884.75622 L 2096.1332,883.09028 L 2094.0774,884.9512 C 2091.7142,884.78038 2090.2343,883.96178 2088.7782,883.12572 L 2088.7782,881.05219 L 2093.4543,878.32969 L 2093.4164,877.39727 L 2091.5185,876.99914 L 2090.5137,874.36931 L 2106.9727,871.53781 L 2106.9618,865.95238 L 2108.6687,864.49776 L 2116.8247,863.01698 L 2114.5471,856.89602 L 2109.4784,855.05285 L 2107.2099,851.56149 L 2104.197,850.2677 L 2103.6477,848.17642 L 2097.8346,845.23444 C 2097.119,847.06394 2096.8199,849.39937 2094.8572,850.25001 L 2093.971,850.42724 L 2093.2089,847.99919 C 2089.759,849.27636 2085.656,850.62726 2085.8717,851.4906 L 2083.8541,851.46741 C 2082.4603,847.13494 2082.1045,843.24512 2082.0654,839.71315 C 2080.414,836.191 2075.0134,834.93668 2070.063,834.3881 C 2063.4636,834.76439 2061.0825,836.06771 2056.5923,836.90751 C 2056.3313,835.26029 2055.0399,833.76023 2053.4922,832.29681 L 2052.1275,832.8108 L 2050.0717,830.55998 L 2050.8679,827.46261 L 2050.1903,826.86003 z "},"nc11":{"name":"NC-11","path":"M 2030.8848,843.88977 L 2028.1841,845.09265 L 2026.9612,849.59424 L 2022.371,853.72367 L 2019.0037,853.05021 L 2018.2948,848.56632 L 2016.6465,847.9283 L 2011.5069,853.0679 L 2011.2411,857.26823 L 2009.7524,858.20751 L 2007.0585,856.43523 L 2005.8356,857.64038 L 2006.2787,859.25318 C 2006.5254,860.13381 2006.6608,861.10343 2006.58,861.41536 C 2006.4992,861.72728 2006.3564,862.3653 2006.261,862.83318 C 2006.1655,863.30106 2005.4913,864.83372 2004.7546,866.23595 L 2003.4077,868.78803 L 1999.3491,868.43357 L 1995.2906,871.05654 L 1994.1386,873.51998 L 1991.5334,873.89219 L 1991.3207,875.00869 C 1991.2042,875.61955 1990.7258,876.70424 1990.2574,877.41899 L 1989.4067,878.71278 L 1988.042,878.71278 L 1986.6951,880.1483 L 1985.1709,881.26486 C 1984.3306,881.88473 1983.3038,882.78193 1982.9024,883.24981 C 1982.501,883.71769 1981.8483,884.55443 1981.4491,885.11067 L 1980.7225,886.1209 L 1977.621,886.38671 C 1975.9088,886.52645 1973.0087,886.99326 1971.1877,887.43238 L 1967.8735,888.22988 L 1964.2403,891.75674 L 1962.3085,891.75674 L 1962.3085,892.27067 C 1962.3085,892.55634 1961.1426,894.02378 1959.721,895.53166 L 1957.1335,898.27872 L 1957.7538,902.35496 L 1957.3639,902.74486 C 1957.1518,902.9568 1956.9085,903.63548 1956.8145,904.25127 L 1956.6372,905.36783 L 1957.1846,907.76412 L 1954.6523,910.29476 L 1949.4302,912.23695 L 1947.6341,910.47199 L 1945.1706,913.94565 L 1945.9859,927.34407 C 1965.4358,923.78845 1984.4551,920.41738 2005.1267,916.3382 L 2019.8721,908.48704 L 2022.1584,908.43384 L 2023.4166,907.33503 C 2024.116,906.73625 2024.6927,905.94517 2024.6927,905.5805 L 2024.6927,904.92473 L 2026.2168,904.53483 C 2027.0556,904.32431 2028.5044,903.60775 2029.4424,902.93978 C 2030.3805,902.27182 2032.05,901.26573 2033.1465,900.70671 C 2034.2429,900.14769 2035.4388,899.69654 2035.8049,899.69654 L 2036.4784,899.69654 L 2038.3215,896.8609 L 2040.0052,896.8609 L 2040.0052,897.92427 C 2044.7831,896.18318 2056.4114,895.15968 2066.0931,893.29859 C 2066.6677,892.51051 2064.2316,889.40639 2062.6194,886.93615 L 2063.2397,883.53337 C 2062.2393,882.05952 2060.2026,881.2141 2058.5171,880.84575 L 2055.3708,884.02961 L 2052.482,882.71813 L 2049.6641,883.78149 L 2047.8386,883.09028 L 2046.7346,884.45343 L 2042.6281,884.96889 C 2041.5469,883.77758 2041.7621,881.72208 2041.7065,879.84704 L 2043.1244,880.1306 L 2042.8408,876.49741 C 2045.9551,876.07949 2049.7713,874.79761 2054.0593,872.93516 L 2056.4696,873.69721 L 2061.5206,871.76545 L 2062.2295,869.53238 L 2058.685,861.37991 L 2051.9149,857.16189 L 2051.9149,855.4605 L 2053.5277,855.4605 L 2054.8214,851.52605 C 2054.1407,850.26226 2053.4101,849.0532 2052.3756,848.08783 L 2051.9503,848.08783 L 2052.5529,849.68288 L 2051.3477,850.42724 L 2051.3477,853.28057 L 2049.9477,852.81978 C 2046.1208,857.6668 2048.1396,853.51667 2044.7194,857.90625 L 2043.5497,857.17958 L 2042.8231,852.60711 L 2040.0406,850.17912 L 2038.7114,846.17377 L 2036.496,848.92077 L 2034.8479,846.67001 L 2031.7818,846.67001 L 2031.6046,845.37622 L 2030.8848,843.88977 z "},"al5":{"name":"AL-5","path":"M 1791.0838,993.94704 C 1790.1059,988.5389 1789.8665,983.29494 1788.15,977.72268 L 1758.1422,980.83638 L 1758.1422,961.07076 L 1755.3857,960.37892 L 1752.0866,955.49055 C 1794.7441,951.45293 1837.8639,945.10393 1880.9256,939.04563 L 1883.3136,946.78966 L 1881.7668,948.09638 L 1881.1534,952.82187 L 1878.8134,954.82718 L 1875.9003,961.5231 C 1871.0681,966.6044 1867.0958,970.92689 1867.2684,971.59219 L 1862.3403,974.23353 C 1861.035,972.80902 1861.1394,971.88204 1861.0457,970.88515 C 1857.4963,970.63623 1858.4387,968.7465 1857.7774,966.25063 L 1851.7168,967.08215 L 1849.4734,968.62508 L 1849.4254,972.85751 L 1846.4735,973.10846 L 1844.7362,975.75128 L 1844.2063,975.26599 L 1842.8164,976.23283 L 1839.4352,975.40193 C 1838.8202,971.99797 1837.9821,974.42227 1837.3392,970.7952 L 1834.7836,970.72232 L 1833.2405,973.10846 L 1832.0641,973.13636 L 1830.2671,970.3859 L 1827.0429,973.37036 C 1823.7857,974.04967 1819.7146,972.87804 1814.9715,970.58582 C 1815.9591,976.37376 1818.6087,979.67003 1820.7038,981.88506 L 1818.8823,984.08183 L 1817.6288,983.5214 L 1816.7006,979.13477 C 1815.0114,977.84104 1814.004,977.60091 1813.1237,977.55713 L 1813.1537,975.16595 L 1810.847,974.22134 L 1809.9282,974.33147 L 1811.3047,991.34227 L 1791.0838,993.94704 z "},"al2":{"name":"AL-2","path":"M 1888.1742,1078.2712 L 1861.4305,1082.4006 L 1860.6153,1085.1476 L 1846.0649,1087.5579 L 1846.7029,1090.1277 L 1835.6439,1091.6696 C 1836.704,1094.6146 1838.5101,1097.873 1837.3984,1098.9359 L 1840.5708,1104.7136 L 1842.0063,1104.9262 L 1841.3152,1106.7162 L 1844.2926,1109.5696 L 1842.5026,1111.6431 C 1842.8502,1112.8242 1842.772,1114.0065 1842.0418,1115.1877 L 1844.7002,1117.7043 L 1840.2518,1118.6791 L 1841.4747,1128.8697 L 1844.0267,1128.8697 C 1844.31,1130.5322 1844.73,1132.1932 1844.8597,1134.0093 L 1842.3608,1134.7182 C 1842.9309,1139.2621 1843.3895,1144.0487 1844.3989,1147.5672 L 1838.958,1150.8459 L 1836.4768,1150.9346 L 1836.6895,1154.0006 L 1833.2159,1156.3045 C 1832.7188,1172.5608 1828.9947,1165.0255 1823.8405,1177.8554 L 1820.4732,1181.3468 L 1855.5111,1176.6503 L 1856.096,1181.1696 L 1859.7646,1180.6379 L 1861.4128,1191.8742 C 1910.7149,1184.702 1936.3599,1180.7776 1949.814,1178.0858 L 1947.4214,1173.3361 L 1942.3881,1168.2851 L 1942.973,1166.0698 L 1941.2539,1162.7556 L 1942.2641,1161.4264 L 1942.0691,1144.9797 L 1940.35,1140.9744 L 1936.7877,1137.4121 L 1936.2384,1133.1586 L 1935.1395,1132.4674 L 1935.1395,1131.3509 C 1935.141,1130.7366 1934.9617,1129.0221 1934.7496,1127.5405 L 1934.3774,1124.8466 L 1935.5294,1124.8466 L 1935.9548,1123.287 C 1936.1896,1122.4293 1936.4293,1121.3446 1936.4865,1120.8767 C 1936.5437,1120.4089 1936.7606,1119.1328 1936.965,1118.0411 L 1937.3372,1116.0561 L 1936.7523,1114.2839 L 1930.7443,1115.294 L 1925.8351,1110.5266 L 1917.2218,1112.1039 L 1916.4243,1107.1593 C 1915.4285,1106.8085 1903.6495,1108.5841 1894.4658,1109.8709 L 1892.7112,1109.1797 L 1893.2606,1107.3365 L 1891.9491,1105.8833 L 1891.701,1107.9037 L 1886.8627,1108.6657 L 1889.716,1127.6291 L 1873.3934,1129.9508 L 1872.649,1124.8998 L 1867.1904,1125.5555 L 1865.4004,1114.0003 L 1867.598,1110.3849 L 1867.598,1106.0251 L 1873.677,1109.4633 L 1876.8139,1108.01 L 1875.3784,1099.8752 L 1876.1936,1099.4853 L 1877.2215,1100.974 L 1878.6748,1099.5562 C 1879.7007,1100.6856 1880.8759,1100.6831 1882.0421,1100.7614 L 1885.5335,1098.9536 L 1884.9487,1097.2346 L 1887.8374,1097.9789 L 1887.8197,1096.7915 L 1890.8503,1096.9864 C 1890.5217,1092.4041 1889.2125,1089.4435 1888.6527,1084.4564 C 1887.5411,1084.1711 1886.9254,1083.3804 1886.7386,1082.1702 C 1888.077,1081.1909 1888.0112,1079.6913 1888.1742,1078.2712 z "},"al4":{"name":"AL-4","path":"M 1775.2021,1074.9828 L 1772.9283,1073.4276 L 1773.5865,1069.3712 L 1771.2156,1067.3411 L 1772.8785,1065.5037 L 1770.3693,1063.1616 L 1770.3277,1060.2546 C 1771.0511,1060.4318 1772.5928,1058.2452 1774.3048,1055.5665 L 1772.3007,1054.101 L 1772.8245,1050.1491 L 1770.016,1050.1287 L 1768.9325,1052.1532 L 1766.7397,1051.5798 L 1768.0015,1055.6598 L 1766.9743,1057.4923 C 1765.4365,1057.884 1763.7908,1056.8195 1762.0311,1054.2148 C 1761.3383,1053.8643 1760.3958,1054.3935 1759.703,1054.8149 L 1758.1234,981.42268 L 1787.7236,978.32508 L 1790.6206,994.52426 L 1811.9336,991.84758 L 1810.4118,974.6941 L 1812.5865,975.24739 L 1812.5865,977.96166 C 1814.2198,978.18001 1815.492,978.68714 1816.4624,979.43575 L 1817.2668,983.72352 L 1818.9194,984.35769 L 1821.3305,981.94659 C 1818.2918,978.38474 1815.6752,974.80276 1815.389,971.10979 C 1818.9741,972.8511 1822.6719,974.29189 1827.0429,973.93749 L 1830.2839,970.87256 L 1832.0072,973.42463 L 1833.5304,973.42463 L 1834.8773,970.97906 L 1837.0792,971.15612 C 1837.6927,974.26279 1838.9036,972.52216 1839.1186,975.62884 L 1842.9279,976.6605 L 1844.1665,975.70302 L 1844.7592,976.29567 L 1846.5895,973.50239 L 1849.7335,973.14107 L 1849.7335,968.74463 L 1852.002,967.32 L 1857.3897,966.64081 C 1857.5346,969.72894 1858.5826,971.37208 1860.7925,971.15612 C 1860.6631,972.82229 1861.3345,973.81403 1862.3215,974.54001 L 1867.5267,971.79743 C 1867.5636,970.65427 1872.3212,965.86929 1876.3007,961.68467 L 1879.1321,954.99295 L 1881.2876,953.22748 L 1881.9234,948.48776 L 1883.4642,947.209 L 1890.0273,966.60928 L 1887.7131,968.67714 L 1887.4475,971.9535 C 1886.6661,976.2098 1886.2831,973.95887 1879.7913,984.19118 L 1877.9395,984.42143 L 1877.9063,985.90147 L 1875.982,985.90147 L 1877.651,994.58545 L 1880.216,992.82594 L 1879.5077,993.68775 L 1884.2661,1001.2916 L 1884.2661,1004.3366 L 1877.7945,1004.0916 L 1876.2378,1005.1336 L 1876.3263,1007.0066 L 1873.1891,1007.0509 L 1872.2704,1010.5091 C 1871.0943,1010.6561 1870.1327,1011.2677 1869.6624,1012.9437 L 1868.1063,1012.0295 L 1860.2701,1016.1614 L 1860.9011,1014.8675 L 1859.5413,1013.2205 L 1854.0308,1012.0994 L 1850.3145,1016.5635 L 1850.2536,1015.9578 C 1848.0997,1017.3907 1845.6863,1018.5669 1843.6481,1018.4947 L 1843.3437,1021.0634 L 1840.8221,1021.329 L 1834.1698,1017.6607 L 1828.052,1017.6607 L 1822.5445,1022.1977 L 1820.761,1022.1977 L 1820.6094,1029.0475 L 1819.2707,1029.0032 L 1819.9236,1030.7046 L 1818.2578,1030.7046 L 1818.2578,1032.9731 L 1815.4222,1032.9731 L 1815.4222,1034.1074 L 1813.4325,1034.6829 L 1813.3811,1037.6661 L 1814.2781,1038.4652 C 1813.5312,1039.299 1812.5525,1039.4378 1811.4523,1039.2116 L 1811.4523,1040.8773 L 1810.1935,1040.3573 L 1809.5296,1041.6571 L 1807.9167,1041.6571 L 1807.5087,1037.4662 C 1805.7837,1037.5334 1804.2386,1037.4533 1803.7961,1036.4711 L 1791.0357,1037.7388 L 1791.0357,1039.2472 L 1789.2252,1039.9419 L 1789.8703,1043.1677 L 1780.7571,1044.4061 L 1784.1915,1067.3279 C 1780.464,1069.0663 1778.0751,1072.1763 1775.2021,1074.9828 z "},"wv3":{"name":"WV-3","path":"M 2119.9349,668.5916 L 2113.2002,675.68071 L 2108.8227,675.68071 L 2104.3468,681.69357 L 2105.0202,672.6984 L 2098.3131,663.71781 L 2096.913,664.88751 L 2094.4318,662.03417 C 2092.9146,662.96863 2091.3209,663.20178 2089.6821,662.92031 L 2088.3883,669.15873 L 2083.0892,677.66566 L 2078.2863,678.37457 L 2076.5141,676.83266 L 2072.7746,680.69622 L 2075.433,681.06843 L 2075.8406,683.17741 L 2058.5609,699.9609 C 2056.8301,703.82662 2055.9713,704.84116 2054.9632,705.45496 L 2055.7253,718.2685 C 2054.4516,719.00911 2053.4899,719.45039 2052.2162,719.34962 L 2049.6818,714.24546 L 2047.5196,714.24546 L 2046.2259,712.68585 L 2046.8639,711.01991 L 2045.1625,709.61979 L 2044.0991,710.25781 L 2042.699,708.57417 L 2040.5546,708.57417 L 2039.3849,706.02209 L 2036.6024,705.86256 C 2036.6875,706.86785 2036.3004,707.66535 2035.2909,708.18427 L 2033.749,706.07523 L 2030.7007,709.51345 L 2031.5514,705.79167 L 2030.3285,701.2015 C 2029.6606,701.32462 2028.9865,701.45211 2028.5562,702.40665 L 2025.8978,702.05219 L 2022.1406,706.23476 L 2019.8189,705.29543 L 2017.1428,693.91741 L 2008.8663,688.51199 L 2006.58,688.28157 L 2005.4457,689.64625 L 2005.6939,697.88731 L 2004.5951,698.70256 C 2003.9895,699.14532 2003.0366,699.50011 2002.4861,699.50011 L 2001.4936,699.50011 L 1995.716,702.90288 L 1992.9158,702.90288 L 1993.2879,704.46249 C 1993.4917,705.32027 1993.977,706.4049 1994.369,706.87278 L 1995.078,707.72348 L 1995.8578,712.43773 L 1993.9259,713.5188 L 1995.202,714.31635 L 1995.202,717.57734 L 1994.6349,717.93179 C 1994.3229,718.1245 1994.0677,718.53233 1994.0677,718.83563 L 1994.0677,719.38506 L 1995.0602,719.73952 C 1995.6061,719.93784 1997.1373,721.27649 1998.463,722.69919 C 1999.7886,724.12183 2000.8733,725.43825 2000.8733,725.64117 C 2000.8733,725.84403 2001.6283,726.33766 2002.557,726.72229 L 2004.2584,727.41345 L 2004.0988,728.35278 C 2004.0191,728.86371 2003.7667,729.5889 2003.5317,729.96553 L 2003.1063,730.63899 L 2004.6837,731.45424 C 2005.5524,731.90346 2006.7487,732.81887 2007.3421,733.47464 L 2008.4232,734.66209 L 2007.413,734.66209 L 2008.8663,736.02672 C 2009.6706,736.77249 2011.1512,737.80767 2012.1627,738.33068 L 2014.0059,739.27001 L 2013.3501,740.98909 L 2016.3275,744.87041 L 2018.9683,744.87041 L 2019.9784,746.69582 L 2020.3329,745.79199 C 2020.5255,745.28997 2020.8848,744.87041 2021.1304,744.87041 C 2021.376,744.87041 2021.9214,745.63603 2022.3356,746.57179 L 2023.0799,748.27318 L 2023.6825,748.27318 C 2024.0118,748.27318 2024.559,748.65038 2024.9054,749.10612 L 2025.5434,749.93912 L 2028.379,749.93912 C 2029.9386,749.94417 2031.7826,749.93022 2032.473,749.90367 L 2033.7313,749.85048 L 2035.539,751.6582 L 2032.6148,754.79516 L 2036.0176,756.21298 L 2036.3366,757.77259 C 2036.5175,758.63207 2036.8722,759.715 2037.1164,760.18288 C 2037.3605,760.65076 2038.2522,761.37913 2039.1013,761.79563 L 2040.6432,762.55773 L 2041.2635,764.15278 L 2045.96,764.18823 L 2049.9299,767.591 L 2054.4669,766.93523 L 2057.1608,765.1807 L 2057.7102,763.01853 L 2058.3659,763.01853 C 2058.7227,763.01853 2059.7089,762.3754 2060.5636,761.58295 L 2062.1232,760.12969 L 2062.1232,758.41061 L 2063.9486,756.58513 L 2064.8702,757.22315 C 2065.3829,757.57653 2067.1837,758.66031 2068.8578,759.63345 L 2071.9061,761.40573 L 2074.8836,758.55239 L 2082.6461,755.07872 L 2083.5855,755.66355 L 2087.9098,751.56962 L 2085.8717,750.0809 L 2086.6338,746.00466 L 2087.4136,746.00466 C 2087.8392,746.00466 2089.0152,746.51616 2090.0366,747.13892 C 2091.0579,747.76157 2092.0843,748.27193 2092.3051,748.27318 C 2092.5258,748.27431 2094.7482,746.35912 2097.2497,744.01971 L 2101.8045,739.76625 L 2104.197,739.76625 L 2104.4983,740.90051 C 2104.6614,741.52435 2104.9802,742.03476 2105.2073,742.03476 C 2105.4342,742.03476 2107.0427,740.65834 2108.7873,738.9687 L 2111.9596,735.88493 L 2110.3291,735.26467 L 2110.3291,732.73028 L 2114.3877,728.56546 L 2110.9317,727.36031 L 2110.2405,724.56011 L 2111.4279,722.32704 L 2110.7899,721.70672 L 2111.4811,719.52684 C 2111.8649,718.33372 2112.384,716.85425 2112.6331,716.23041 C 2112.8822,715.60657 2113.2644,714.45813 2113.4838,713.67833 C 2113.7031,712.89853 2114.379,711.62249 2114.9725,710.84269 C 2115.566,710.06288 2116.9572,708.04487 2118.074,706.3588 L 2120.1121,703.29278 L 2120.6438,701.37873 C 2120.9346,700.32545 2121.2651,698.13248 2121.3881,696.50493 C 2121.511,694.87745 2121.7055,692.754 2121.8135,691.79068 L 2122.0084,690.03615 L 2126.3328,684.16989 L 2124.9859,682.53939 L 2125.3226,681.47602 C 2125.5079,680.89217 2126.108,679.93241 2126.6518,679.3316 L 2127.6265,678.23279 L 2129.0798,672.72097 L 2127.7861,671.16137 L 2128.1937,669.58407 C 2128.4162,668.72215 2128.6712,666.94415 2128.7608,665.61417 L 2128.9203,663.18612 L 2130.285,661.55563 C 2129.8597,660.96184 2129.4651,660.26076 2129.2799,658.82661 L 2127.6265,657.58573 L 2126.8113,659.8011 L 2126.2265,659.8011 L 2125.6416,658.70229 L 2123.7271,659.32256 L 2123.6317,657.29916 L 2121.9115,655.65851 L 2121.2252,656.61667 C 2120.5369,660.71157 2119.4817,664.95324 2119.9349,668.5916 z "},"oh18":{"name":"OH-18","path":"M 2042.8054,545.4183 C 2037.9303,546.17112 2033.1354,546.9155 2028.6499,548.16915 L 2029.2703,552.83023 L 2020.8089,554.14804 L 2009.9271,557.71791 L 2010.0309,555.39878 L 1984.4202,560.62951 L 1985.1355,567.09325 C 1980.6566,568.63579 1974.4729,570.12819 1966.2075,571.55939 L 1968.5051,584.09322 L 1963.9593,584.65655 L 1963.939,589.01635 L 1976.6285,587.10229 L 1977.3374,588.18335 L 1982.4416,588.05932 L 1983.7075,597.41819 L 1980.5275,601.22731 L 1975.2107,602.57424 L 1975.9196,608.83926 L 1995.6982,606.491 L 1996.4362,611.96981 L 2000.8923,611.31914 L 2001.1898,616.8829 L 2003.7798,616.22078 C 2004.6847,618.36169 2005.2021,622.59564 2005.5521,627.73304 L 1994.6349,629.07997 L 1994.7602,627.14816 L 1988.6053,628.01779 L 1988.48,624.10494 L 1983.1859,624.76315 L 1983.8531,628.29381 L 1978.1046,629.11541 L 1978.1046,631.72063 C 1976.3287,632.31504 1974.7259,632.76358 1973.1726,632.57892 L 1973.2878,638.87048 L 1962.2933,640.27696 L 1962.0984,643.9633 L 1963.5681,644.25571 L 1963.4428,647.28883 C 1961.7741,648.37896 1959.6552,649.01885 1957.4348,649.55734 L 1951.409,644.61266 C 1949.8317,645.56963 1948.3387,645.59975 1946.872,645.33932 L 1945.2238,649.87635 L 1945.4415,655.73882 C 1946.0517,656.62569 1946.4341,657.63683 1948.2138,657.88568 L 1948.1303,660.38593 L 1975.3525,657.0009 L 1976.6817,671.10823 L 1979.1097,670.41701 L 1979.5705,676.28328 L 1987.3863,675.68071 L 1988.3787,674.63503 L 1993.6601,674.54645 C 1993.2845,669.74276 1993.0378,664.14434 1992.2423,662.06962 L 1998.1085,662.06962 C 1997.4837,658.86347 1997.0523,655.04692 1996.7616,650.72704 L 1998.4807,650.6916 L 1998.0908,644.61266 L 2000.058,643.33662 L 2000.1467,644.47088 L 2001.5999,644.57721 L 2001.4404,639.52625 L 2005.9774,638.79959 L 2005.9774,632.72071 C 2010.4797,632.41491 2013.3098,631.89639 2016.1857,631.37378 L 2016.2212,628.8217 L 2021.5735,628.78625 L 2021.5026,626.14553 L 2020.1556,624.90494 L 2020.581,621.67939 L 2025.3307,621.23635 C 2025.7095,619.62434 2025.4017,618.11289 2025.0117,616.61068 L 2021.9811,616.69932 C 2022.0439,614.86738 2021.9786,613.40929 2021.2722,611.57741 L 2018.8265,612.25088 C 2018.344,610.0114 2017.8292,607.72394 2017.8871,606.34922 L 2023.2749,605.39219 L 2022.5483,601.67041 C 2024.4579,601.68011 2026.4352,601.60899 2027.7942,601.06784 L 2027.8119,599.18922 L 2030.9311,598.46256 L 2030.9311,596.95615 C 2033.0092,596.03032 2035.0296,595.47073 2036.8859,595.87504 L 2037.6481,594.84712 L 2035.4681,581.80316 C 2038.9457,580.97373 2042.2043,580.66946 2045.4638,580.38533 L 2045.4815,582.6716 L 2047.8209,582.6716 L 2048.583,587.8289 L 2053.2972,587.10229 L 2054.0593,589.47714 L 2056.0443,589.47714 C 2055.9952,587.59377 2055.7803,585.56639 2055.1758,583.23873 L 2052.9251,583.23873 C 2051.1915,576.47827 2049.5364,569.74486 2049.1147,563.53098 L 2045.4638,564.00949 L 2045.4283,555.25444 L 2047.4487,554.74048 L 2046.7398,550.22118 L 2043.7624,550.27434 L 2042.8054,545.4183 z "},"in9":{"name":"IN-9","path":"M 1781.9706,775.4577 L 1780.2311,772.09395 L 1776.7489,772.09395 L 1773.5541,769.94107 L 1773.5958,767.76528 C 1775.5732,765.07153 1777.6907,762.4316 1778.7282,759.37637 L 1780.8753,759.98541 L 1781.7177,754.79771 L 1783.863,754.76947 C 1783.9577,752.29543 1783.8268,750.53755 1782.943,749.71941 L 1780.6812,749.71941 L 1778.1916,731.21145 L 1779.4391,730.30439 L 1784.24,730.50555 L 1784.9646,729.83747 L 1786.4584,730.40409 L 1789.995,727.90124 L 1796.7058,727.14928 L 1795.2576,717.14774 L 1812.5202,714.33285 L 1813.8609,708.6086 L 1811.4572,695.8985 L 1797.7581,697.42045 L 1795.0637,676.2763 C 1803.2477,674.79485 1811.6289,673.2496 1817.6171,672.47853 L 1819.6096,684.59563 L 1828.5203,682.69269 L 1826.2536,679.27194 L 1828.1805,677.34506 L 1831.0677,680.88269 L 1837.5105,679.20031 L 1838.2323,683.04816 L 1843.8627,681.97867 L 1859.4732,668.36429 L 1872.1699,666.62831 L 1872.6672,672.43486 L 1874.4509,674.40586 L 1874.12,675.96563 L 1877.3078,676.33115 L 1878.9406,674.97605 L 1878.9406,677.78498 L 1877.5228,679.31481 C 1876.743,680.1562 1876.105,681.13977 1876.105,681.50047 C 1876.105,681.8611 1877.0099,683.08293 1878.1159,684.2156 L 1880.1269,686.27501 L 1878.1788,689.66928 L 1878.905,691.56167 L 1880.9077,691.56167 C 1882.0093,691.56167 1882.9105,691.69824 1882.9105,691.8652 C 1882.9105,692.0321 1882.5095,692.78066 1882.0195,693.52853 L 1881.1285,694.88839 L 1882.3833,697.23296 L 1878.5124,697.23296 L 1877.1003,698.93434 L 1874.005,698.93434 L 1867.1358,705.73989 L 1865.5053,705.73989 L 1863.3677,703.37785 L 1861.0876,703.67548 C 1859.8336,703.8391 1857.6651,704.17915 1856.2687,704.43113 L 1853.7297,704.8892 L 1852.6242,708.03557 L 1854.5541,711.30263 L 1854.5541,713.58776 L 1856.5193,717.01202 L 1855.3183,718.32328 C 1854.6577,719.0445 1853.9484,720.1922 1853.742,720.87383 L 1853.3667,722.11306 L 1848.3277,724.0375 L 1847.7577,726.08949 C 1847.4442,727.21807 1847.1863,729.07894 1847.1846,730.22471 L 1847.1814,732.30788 L 1844.3099,735.72058 L 1840.5733,735.11421 L 1838.6745,737.01301 L 1838.6745,739.24041 L 1836.6895,742.27999 L 1836.6895,752.95823 L 1835.5553,753.57107 C 1834.9314,753.90817 1833.7425,754.6312 1832.9132,755.17786 L 1831.4054,756.17175 L 1830.0193,754.50167 L 1824.1497,754.74729 L 1820.5263,752.1672 L 1820.5263,748.76709 L 1819.3522,746.57315 L 1816.5564,746.57315 L 1816.5564,748.84167 L 1814.2523,748.84167 L 1813.6773,750.34025 L 1810.318,749.84719 L 1810.318,752.18807 L 1812.2494,753.2689 L 1810.8028,755.01197 L 1808.3331,755.36365 L 1808.4903,761.33359 L 1809.8255,762.94247 L 1806.0646,763.30345 L 1805.7177,767.4706 L 1803.9879,768.90617 L 1804.773,764.72127 L 1801.3109,764.72127 L 1800.9604,765.2884 C 1800.7676,765.60032 1800.382,765.85553 1800.1035,765.85553 C 1799.825,765.85553 1798.7778,764.64329 1797.7765,763.16167 C 1796.7752,761.68005 1795.8817,760.37338 1795.7907,760.25791 C 1795.6999,760.1425 1794.9967,760.20585 1794.2281,760.39873 L 1792.8307,760.74944 L 1790.3967,764.68781 L 1786.3644,765.80114 L 1784.2301,767.73273 L 1784.2223,770.05512 C 1784.2181,771.33241 1784.0654,772.93409 1783.8829,773.6143 L 1783.5512,774.85116 L 1781.9706,775.4577 z "},"oh6":{"name":"OH-6","path":"M 1992.8745,701.76999 L 1991.7256,698.47435 L 1988.3512,697.07666 L 1987.665,696.11055 C 1987.2875,695.57921 1986.4403,694.85896 1985.7823,694.51006 L 1984.586,693.87561 L 1980.5843,694.52497 L 1978.1881,692.1288 L 1978.1881,691.22383 C 1978.1881,690.72612 1977.8316,689.64149 1977.3959,688.81354 C 1976.9602,687.98558 1976.386,686.28737 1976.1199,685.03969 L 1975.8363,683.2217 L 1973.084,682.40872 L 1972.6334,679.70205 C 1970.3261,679.79931 1968.8854,679.43033 1967.9085,678.19717 L 1965.7924,673.47089 C 1971.1688,672.66358 1975.8375,671.85633 1978.6892,671.04902 L 1979.0388,676.53276 L 1987.5457,676.15624 L 1988.6233,675.11494 L 1994.2351,675.11494 C 1993.7608,668.08521 1993.2865,663.01973 1992.8121,662.63811 L 1998.7277,662.63811 C 1998.1747,658.72299 1997.629,654.81876 1997.3372,651.29553 L 1998.9607,651.29553 L 1998.4789,644.63472 L 1999.739,643.85594 L 1999.739,645.05712 L 2002.0075,645.05712 L 2002.0075,640.05266 L 2006.5446,639.28613 L 2006.5446,633.27956 C 2009.6934,632.90105 2013.2109,632.39971 2016.7529,631.8902 L 2016.7529,629.17751 L 2021.857,629.17751 L 2021.857,626.00159 L 2020.4766,624.67122 L 2020.8562,621.98831 L 2025.5434,621.52128 C 2026.1432,619.72535 2025.8319,617.92948 2025.2382,616.13355 L 2022.4242,616.13355 C 2022.4495,614.31551 2022.4605,612.50217 2021.7027,610.94518 L 2019.1605,611.5832 C 2018.6529,609.31672 2018.428,607.68634 2018.4543,606.62116 L 2023.6685,605.8392 L 2022.9399,601.95534 C 2024.6584,601.94842 2026.3769,602.04421 2028.0955,601.26684 L 2028.0454,599.45821 L 2031.4481,598.77766 L 2031.4982,597.39023 C 2033.261,596.45186 2035.136,596.29896 2037.0306,596.28405 L 2038.2234,594.84683 L 2036.1267,582.24228 C 2039.0352,581.39023 2042.0701,581.17018 2045.1093,580.97157 L 2045.1093,583.24009 L 2047.3084,583.24009 L 2048.0898,588.45132 L 2053.1338,587.69494 L 2053.7486,590.04563 L 2056.4519,590.04563 C 2056.4844,587.58809 2056.232,585.1305 2055.7306,582.67296 L 2053.2562,582.67296 C 2051.4926,576.09313 2050.2372,569.51331 2049.4078,562.93346 L 2045.8838,563.50533 L 2045.7366,555.56733 L 2047.9382,554.9916 L 2046.8463,549.77948 L 2044.1038,549.77948 L 2043.3378,544.67131 L 2035.4664,546.1617 L 2032.2975,531.06185 L 2036.0353,530.42177 L 2034.4994,521.10756 L 2043.4906,519.26337 C 2044.3844,520.60691 2044.2286,521.95045 2043.7985,523.29399 L 2052.1736,521.79422 L 2054.1226,526.03826 L 2057.3359,525.39161 L 2061.71,546.4727 L 2060.6405,547.23233 C 2060.0524,547.67766 2059.1389,548.05013 2058.6108,548.06006 L 2057.6505,548.07809 L 2056.7676,549.33854 C 2056.282,550.03178 2055.8848,550.95513 2055.8848,551.3904 L 2055.8848,552.18182 L 2057.6059,554.24164 C 2058.5525,555.37454 2059.6065,556.64519 2059.9481,557.0653 L 2060.5691,557.82914 L 2059.9366,563.9577 L 2060.866,563.9577 L 2061.3248,565.5173 C 2061.5771,566.37508 2061.811,567.84254 2061.8445,568.77831 L 2061.9054,570.47969 L 2060.7762,571.2452 L 2060.6588,572.9412 C 2060.5943,573.87402 2060.235,575.56559 2059.8606,576.70024 L 2059.1797,578.76329 L 2059.8075,581.26455 L 2058.9284,582.68697 L 2060.265,589.19494 L 2059.1537,590.60669 L 2059.7485,592.88128 L 2058.1177,592.88128 L 2057.4592,594.59712 L 2058.8593,596.28405 L 2057.582,597.82307 L 2058.2675,601.25062 L 2057.019,602.02226 L 2057.019,604.61517 L 2059.3144,606.69245 L 2057.927,607.54983 L 2058.1826,611.88207 L 2055.6368,613.01435 L 2054.0372,615.28286 C 2053.1575,616.53054 2051.6869,618.69981 2050.7692,620.10345 L 2049.1008,622.65553 L 2049.0792,624.61434 L 2046.3583,626.39717 L 2044.9717,629.74464 L 2043.0633,629.74464 L 2041.1394,631.72959 C 2040.0813,632.82132 2039.0742,633.71296 2038.9014,633.71097 C 2038.7287,633.70899 2038.1526,632.94336 2037.6212,632.00958 L 2036.6551,630.31177 L 2033.7929,630.31177 L 2032.8244,631.87138 C 2032.2917,632.72916 2031.3615,633.99091 2030.7573,634.67532 L 2029.6587,635.91965 L 2030.3914,639.82524 L 2024.9762,640.80836 L 2024.6208,644.48999 L 2023.6694,644.48999 L 2022.4826,647.89424 L 2024.1961,651.99509 L 2023.594,653.56405 L 2021.2899,653.56405 L 2021.2899,656.26925 L 2024.2463,658.20634 L 2023.5782,661.54701 L 2024.419,661.86965 C 2024.8814,662.04716 2025.2598,662.41477 2025.2598,662.68665 L 2025.2598,663.18091 L 2022.343,661.8519 L 2021.8251,662.67038 C 2021.5403,663.12051 2021.3033,664.03177 2021.2986,664.69542 L 2021.2899,665.90199 L 2019.5885,667.31403 L 2019.5257,666.81921 C 2019.4912,666.5471 2019.5093,665.7513 2019.566,665.05073 L 2019.6691,663.77701 L 2017.2428,660.36959 L 2015.4244,660.36959 L 2013.4314,658.56595 L 2011.0816,659.31178 L 2011.0816,661.13096 L 2009.2795,663.12232 L 2008.0782,667.4587 L 2008.1837,672.14012 L 2005.4103,674.74551 L 2005.4103,677.13136 L 2007.6788,679.07372 L 2007.6788,682.22083 L 2009.8696,686.30836 L 2008.5862,687.59177 L 2005.5492,687.59177 L 2004.1196,689.31437 L 2004.7544,695.4651 L 2004.1405,697.81251 L 2002.6487,698.15517 C 2001.8281,698.34362 1999.8209,699.23401 1998.188,700.13388 L 1995.2192,701.76999 L 1992.8745,701.76999 z "},"wi3":{"name":"WI-3","path":"M 1520.6394,339.32019 C 1505.273,340.53002 1490.5766,341.85938 1474.5424,342.93564 L 1474.5911,346.13184 L 1475.7653,348.85504 L 1472.8233,352.34643 L 1475.0918,353.5693 L 1475.4108,367.44623 L 1474.4893,371.52247 L 1477.8743,372.92257 L 1479.2035,374.35811 C 1479.9362,375.14593 1481.1069,376.0188 1481.8087,376.28989 L 1483.0848,376.76841 L 1483.0848,379.07237 L 1484.9811,379.07237 L 1487.1256,381.02187 L 1496.4123,381.62445 L 1498.6808,386.01969 L 1502.6153,388.71356 L 1505.2914,388.71356 L 1512.859,391.69098 L 1516.0314,394.65068 L 1515.5352,396.58247 L 1516.953,397.13187 L 1517.6619,400.6587 L 1520.7988,403.61841 L 1525.6903,405.81603 L 1526.3106,407.4288 L 1527.8348,407.4288 L 1528.2778,408.17316 C 1528.5273,408.57871 1529.5448,409.47193 1530.5287,410.15811 L 1532.3186,411.3987 L 1538.9469,412.56841 L 1545.1854,420.13603 L 1548.4251,425.49211 L 1548.2869,435.30672 L 1550.5022,438.12464 L 1549.8819,439.77286 L 1551.8137,443.83138 L 1551.1757,446.24167 L 1552.9834,448.22662 L 1552.4871,451.54078 L 1557.3479,453.37089 L 1560.0098,457.54939 L 1558.8142,459.79959 C 1558.0849,460.87414 1557.3027,462.36205 1557.0774,463.09603 C 1556.852,463.83002 1556.4048,464.76634 1556.0671,465.18732 L 1555.4469,465.9494 L 1555.7836,470.64593 L 1557.9458,476.33494 L 1557.9458,479.33009 L 1559.9307,479.84405 L 1563.1031,488.84722 L 1567.8705,491.75375 L 1578.965,493.7387 C 1580.6513,496.24661 1582.3953,498.99817 1583.7679,501.57217 L 1618.6285,498.06306 L 1614.1093,454.78405 L 1619.536,450.55891 L 1618.5754,448.21237 L 1613.0247,447.45385 L 1613.8648,442.18325 L 1612.766,440.80087 L 1611.7149,427.76742 L 1614.1379,427.49201 L 1610.8155,422.87002 L 1610.8345,421.12978 C 1608.1402,418.79307 1605.4671,416.39288 1603.2806,412.53296 L 1604.709,409.89093 C 1604.238,408.70395 1603.447,407.5703 1602.5914,406.4474 L 1599.7184,401.77524 C 1601.1017,398.49957 1602.9058,396.54628 1604.7339,394.66841 L 1604.4037,390.99521 L 1586.2491,393.03791 L 1586.0541,392.7189 C 1584.3985,380.27701 1584.2116,367.60495 1582.1819,355.20757 L 1561.9766,356.97207 C 1561.5861,355.28753 1559.8057,353.71883 1558.0245,352.15018 L 1555.7836,352.41732 L 1555.9608,357.7696 L 1523.8826,361.03059 C 1523.0107,353.17672 1522.5423,343.19405 1520.6394,339.32019 z "},"wi7":{"name":"WI-7","path":"M 1565.8679,218.50405 L 1564.326,218.68128 L 1562.7664,218.85851 L 1562.5891,221.26881 L 1562.4119,223.6791 L 1563.5994,223.6791 L 1564.7867,223.6791 L 1564.9994,222.97019 C 1565.1186,222.5803 1565.3696,221.41677 1565.5489,220.38267 L 1565.8679,218.50405 z M 1560.3561,225.29188 L 1558.0521,226.46158 C 1556.7885,227.10624 1555.5806,227.90254 1555.376,228.23386 L 1555.0038,228.83643 L 1555.695,230.60871 L 1556.6697,230.18336 C 1557.213,229.95493 1558.2026,229.65503 1558.8673,229.5099 L 1560.0725,229.24405 L 1561.5612,226.49702 L 1560.3561,225.29188 z M 1546.0715,227.61356 L 1543.6967,229.98841 L 1541.8358,229.63396 L 1540.6129,230.85683 C 1539.9409,231.52879 1539.2447,232.48454 1539.0533,232.98356 L 1538.6988,233.88742 L 1537.0861,233.88742 L 1536.4303,235.58881 L 1535.3847,235.58881 C 1534.8134,235.58881 1534.0861,235.85941 1533.7542,236.19138 L 1533.1516,236.79396 L 1531.397,235.05712 L 1530.7413,236.77623 L 1526.8246,238.40673 L 1525.903,239.96633 L 1522.2167,241.75633 C 1520.1938,242.73661 1518.1148,243.52861 1517.591,243.52861 L 1516.634,243.52861 L 1506.6206,248.65049 L 1503.2178,248.7391 C 1501.3463,248.79297 1499.2127,248.67608 1498.4681,248.47326 C 1497.7236,248.27043 1496.6741,247.71024 1496.1465,247.23267 L 1495.1895,246.36425 L 1493.2931,246.36425 L 1493.2931,248.06564 L 1491.5208,248.06564 L 1492.2475,249.23534 L 1490.741,252.60267 L 1487.6218,252.60267 L 1490.298,287.48108 L 1488.6852,288.79257 L 1487.799,292.01811 L 1484.3254,291.75227 L 1483.1025,295.2791 L 1480.1073,294.69425 L 1479.5757,296.75009 L 1477.8566,297.459 C 1476.909,297.85147 1475.3949,298.80588 1474.4893,299.56801 L 1472.841,300.95039 L 1472.0612,302.77583 C 1471.64,303.78401 1471.1268,305.66995 1470.9093,306.95841 L 1470.5194,309.29781 L 1467.3824,311.92079 L 1467.152,320.48088 L 1472.0258,320.16187 L 1474.0107,321.63286 L 1474.0107,323.31653 L 1477.9806,327.41049 L 1477.9452,331.14999 L 1476.2792,333.34762 L 1476.2792,335.79336 L 1474.1525,337.72514 L 1474.5778,342.36851 L 1520.9761,338.73534 C 1522.2563,342.31449 1523.4582,346.73417 1524.5384,360.32167 L 1555.7481,357.36197 L 1555.3937,352.13375 L 1558.2293,351.81474 C 1559.8718,353.2536 1561.9023,354.58162 1562.1992,356.40494 L 1582.6867,354.80989 C 1584.4217,367.44 1585.0094,379.4583 1586.5149,392.47078 L 1634.4904,387.47296 L 1628.766,338.98346 L 1633.2853,338.54039 L 1633.7283,333.45395 L 1635.4297,332.28425 L 1632.7359,301.12762 L 1621.925,301.92514 L 1620.1881,296.71465 L 1612.3015,297.60079 L 1615.3498,300.57821 L 1614.9245,302.79356 L 1611.2913,302.93534 C 1610.3748,301.06112 1608.737,299.26045 1606.8252,297.47673 L 1588.9961,299.62118 L 1587.0111,284.25554 L 1592.0976,283.38712 L 1590.0063,265.06178 L 1581.198,263.59079 L 1581.1803,262.61603 C 1581.1733,262.25951 1580.6737,261.32228 1580.0638,260.54247 L 1578.9473,259.12465 L 1578.9295,257.1397 L 1578.5042,257.1397 C 1578.2702,257.13772 1577.6517,256.39219 1577.1395,255.49148 L 1576.218,253.86098 L 1571.5568,253.06346 L 1571.5568,251.50386 L 1568.5085,252.65584 L 1567.5869,250.9899 L 1565.4602,250.26326 C 1564.2929,249.86612 1562.8921,249.6168 1562.3588,249.69613 L 1561.4017,249.83792 L 1558.1053,247.74663 C 1556.2994,246.59707 1554.7354,245.4307 1554.6316,245.1591 C 1554.5276,244.88751 1554.1125,244.66287 1553.6923,244.66287 L 1552.9125,244.66287 L 1552.558,247.1795 L 1550.5731,248.49098 C 1549.4814,249.21403 1548.1452,250.17807 1547.5957,250.63544 C 1547.0462,251.09281 1546.2338,251.46842 1545.7879,251.46841 C 1545.342,251.46841 1544.8323,251.25035 1544.6714,250.9899 L 1544.3879,250.5291 L 1545.7348,246.08069 L 1548.021,244.18435 L 1545.9475,240.6398 L 1546.6209,239.82455 L 1547.3121,238.99158 L 1546.8867,238.99158 C 1546.65,238.99158 1547.092,238.3432 1547.8792,237.55603 L 1549.3148,236.13821 L 1550.6263,230.94544 L 1550.0768,230.2897 C 1549.7766,229.93095 1548.7571,229.1807 1547.8083,228.62376 L 1546.0715,227.61356 z M 1557.4318,231.42396 L 1554.5962,234.18871 C 1553.0321,235.70597 1551.3531,237.1641 1550.8744,237.43197 L 1550.006,237.91049 L 1550.006,240.69296 L 1551.6719,240.69296 L 1552.8062,238.54851 L 1555.7481,237.82188 L 1555.0924,235.78376 L 1556.3862,235.18118 C 1557.0916,234.84287 1558.158,234.40282 1558.761,234.20643 L 1559.8598,233.85197 L 1557.4318,231.42396 z "},"al7":{"name":"AL-7","path":"M 1838.1605,1027.8676 L 1835.9984,1033.2554 L 1832.4715,1034.2301 L 1828.0231,1030.7033 L 1826.0204,1030.6324 L 1825.0279,1031.6249 L 1825.0279,1033.1667 L 1829.1042,1034.6554 L 1828.7497,1037.7924 L 1825.0811,1037.881 C 1825.3148,1038.5365 1825.8426,1039.1926 1827.4205,1039.8482 L 1824.7621,1042.6307 L 1826.1976,1044.9524 C 1825.1074,1046.6163 1824.0026,1048.2691 1820.5087,1048.8514 C 1817.7182,1051.8624 1816.5422,1052.4212 1815.8298,1052.2542 L 1813.6322,1055.5152 L 1813.579,1058.4039 L 1807.8014,1061.1155 L 1805.6924,1057.7837 C 1804.5467,1057.6689 1803.746,1058.5645 1802.9631,1059.5382 L 1799.9325,1060.1585 L 1796.7956,1062.4625 L 1794.5802,1059.3964 L 1793.0738,1059.3964 C 1793.1793,1060.3233 1793.4777,1061.4051 1794.4384,1063.0651 C 1793.8123,1062.3895 1790.4682,1065.5712 1787.2075,1068.4882 L 1784.4251,1068.6477 L 1784.1415,1067.992 C 1782.2424,1068.5565 1778.3612,1072.4006 1775.1738,1075.5419 L 1772.3204,1073.681 L 1772.9939,1069.5338 L 1770.6013,1067.3894 L 1772.3382,1065.4754 L 1770.0519,1063.4195 L 1770.0519,1059.6268 C 1770.984,1060.263 1772.3494,1057.5657 1773.6319,1055.5152 L 1771.8242,1054.5049 L 1772.4622,1050.5528 L 1770.3178,1050.5528 L 1768.9354,1052.7858 L 1767.2694,1052.1478 L 1768.3151,1055.7987 L 1767.1808,1057.9254 C 1764.7677,1058.0868 1762.9751,1057.0182 1761.7931,1054.7176 C 1760.9968,1054.7909 1760.3505,1055.0236 1759.7018,1055.5328 L 1761.7399,1148.5597 L 1763.9553,1161.1606 L 1782.3869,1158.7503 L 1783.1845,1160.0086 L 1785.3112,1158.8744 L 1789.3343,1163.9785 L 1791.0711,1161.7277 L 1794.4384,1159.9732 L 1794.4384,1157.7755 L 1787.8456,1152.9372 L 1785.0454,1150.0661 L 1784.2124,1147.5318 L 1786.0024,1144.0581 L 1787.6506,1145.4227 C 1789.0463,1144.1494 1790.3275,1143.5812 1791.6028,1143.0302 L 1791.6028,1141.7542 L 1787.2253,1142.4985 L 1786.5873,1140.0882 L 1802.9454,1137.802 L 1802.9454,1140.7262 L 1800.7477,1140.7262 L 1800.0034,1141.9314 L 1798.4438,1141.3465 L 1797.7349,1142.4985 L 1800.8009,1143.7746 L 1798.9755,1144.767 L 1798.9755,1146.8229 L 1800.6768,1148.2407 L 1800.6768,1146.9647 L 1802.2719,1146.9647 L 1803.7429,1151.7144 L 1801.5984,1150.9168 L 1799.8085,1159.2288 L 1805.2139,1160.3276 L 1804.2214,1163.181 L 1801.1731,1163.2342 L 1800.4642,1164.3684 L 1797.8412,1163.8544 L 1796.2285,1167.6649 L 1797.2209,1169.5435 L 1794.5625,1169.1713 L 1793.446,1173.5311 L 1794.5448,1174.6299 L 1793.1269,1177.7845 L 1794.9347,1176.3845 L 1796.0867,1178.5466 L 1793.1801,1183.1191 C 1793.2734,1183.6985 1793.3456,1184.2776 1793.3042,1184.8736 L 1791.3192,1185.4053 L 1794.6689,1185.7598 L 1793.7473,1189.0917 L 1799.2059,1187.7979 L 1797.9475,1186.5396 L 1800.1806,1182.7647 L 1802.0947,1183.4558 L 1799.9857,1181.0455 L 1801.8111,1179.2201 L 1801.8111,1177.0225 L 1802.396,1177.0225 C 1803.3123,1177.5506 1803.5182,1178.8705 1804.7708,1178.7239 C 1804.0918,1177.5762 1804.5502,1176.2356 1804.8417,1174.9666 C 1806.3036,1174.4105 1806.7467,1173.4186 1807.3584,1172.255 L 1810.194,1173.7615 L 1812.0549,1169.5966 L 1811.3814,1168.5155 L 1809.1483,1168.5155 L 1808.5103,1166.8673 L 1810.9384,1164.2798 L 1809.8572,1155.188 L 1812.4271,1154.8513 L 1811.3637,1149.0736 L 1811.984,1146.6102 L 1842.8216,1142.4276 L 1841.9,1134.5764 L 1844.4875,1133.7435 L 1843.6546,1129.3837 L 1841.1557,1129.3837 L 1839.8087,1118.1651 L 1843.8318,1117.4208 L 1841.3152,1115.3827 C 1842.5393,1114.0694 1842.2095,1112.8907 1842.0063,1111.6963 L 1843.8495,1109.6582 L 1840.9607,1106.7694 L 1841.7228,1105.1389 L 1840.3936,1104.9971 L 1836.9908,1099.0423 C 1838.2216,1098.0115 1836.6208,1094.8977 1835.0945,1091.8291 L 1830.5043,1092.414 L 1828.8738,1081.7449 L 1813.1537,1084.0134 L 1813.1537,1081.6031 L 1807.5887,1082.1348 L 1806.9507,1073.3797 C 1808.7176,1073.5022 1810.6214,1073.2849 1812.0194,1072.5467 L 1811.3105,1068.1515 L 1812.8347,1064.9791 L 1816.9109,1064.4474 L 1816.5919,1060.0876 L 1819.0731,1057.3051 L 1821.3593,1058.014 L 1822.0151,1056.3126 L 1825.0634,1056.2241 L 1825.0634,1054.3454 C 1827.5055,1051.0685 1829.2829,1048.0108 1829.0333,1045.5904 L 1832.9146,1042.6307 L 1834.6337,1037.5088 L 1836.849,1037.5088 C 1838.1057,1035.9086 1838.8903,1034.5079 1838.6745,1033.5212 L 1841.4924,1030.8273 L 1839.8087,1029.4272 L 1839.8087,1027.8676 L 1838.1605,1027.8676 z "},"al6":{"name":"AL-6","path":"M 1830.8673,1091.9888 L 1829.4539,1081.1791 L 1813.7208,1083.4476 L 1813.7208,1081.0696 L 1808.0147,1081.6115 L 1807.3335,1073.9553 C 1808.5543,1074.2079 1810.4949,1073.7406 1812.6074,1073.1015 L 1811.7455,1068.1365 L 1813.1124,1065.451 L 1817.4396,1064.7591 L 1817.041,1060.4789 L 1819.3481,1058.0215 L 1821.6468,1058.6226 L 1822.3491,1056.7926 L 1825.3327,1056.6809 L 1825.4444,1054.4909 C 1827.9899,1051.5419 1829.6172,1048.627 1829.4887,1045.777 L 1833.2393,1043.0457 L 1835.0677,1037.9656 L 1836.777,1037.9656 C 1838.379,1036.4454 1838.9753,1035.0593 1839.0927,1033.737 L 1841.9885,1030.8502 L 1840.1525,1029.3651 L 1840.1525,1027.5997 L 1837.8882,1027.5252 L 1835.7814,1033.0086 L 1832.486,1033.7901 L 1828.1241,1030.3236 L 1825.8574,1030.1375 L 1824.4962,1031.4986 L 1824.5335,1033.3762 L 1828.7023,1034.8853 L 1828.4897,1037.4313 L 1824.4962,1037.582 C 1825.3524,1039.3978 1826.1257,1039.7644 1826.8837,1039.8626 L 1824.3651,1042.5321 L 1825.8541,1044.8752 C 1825.1224,1046.6044 1823.5686,1047.9943 1820.4692,1048.4904 C 1818.6975,1050.1843 1817.3738,1052.0979 1815.8125,1051.8931 L 1813.1537,1055.5086 L 1813.1537,1058.2679 L 1807.8861,1060.7147 L 1805.7411,1057.3597 C 1804.7116,1057.5307 1803.657,1057.5716 1802.867,1058.9881 L 1799.5958,1059.7066 L 1796.8286,1061.8833 L 1794.9794,1059.0611 L 1792.737,1059.0611 C 1792.9712,1060.8416 1793.4028,1062.0543 1794.034,1062.6932 C 1792.6633,1062.8993 1789.6609,1065.825 1787.0279,1068.1351 L 1784.906,1068.3027 L 1781.1193,1044.8645 L 1790.321,1043.5873 L 1789.6516,1040.1535 L 1791.4114,1039.6255 L 1791.4114,1038.0003 L 1803.6047,1036.8344 C 1803.9147,1037.4813 1805.1881,1037.9972 1807.1988,1037.7937 L 1807.5508,1042.0472 L 1809.684,1042.0472 L 1810.3544,1040.9625 L 1812.0194,1041.6014 L 1812.0194,1039.7787 C 1813.2867,1039.7513 1814.4019,1039.4706 1814.9101,1038.1783 L 1813.7208,1037.4433 L 1813.7208,1035.1355 L 1815.9893,1034.5422 L 1815.9893,1033.5403 L 1818.825,1033.5403 L 1818.825,1031.2718 L 1820.6477,1031.2718 L 1819.9948,1029.5704 L 1820.9138,1029.5704 L 1821.1471,1022.7967 L 1822.2695,1022.7648 L 1828.052,1018.2278 L 1834.2622,1018.2278 L 1840.8238,1021.7251 L 1843.4951,1021.347 L 1843.8575,1018.7949 C 1846.3299,1018.7498 1848.111,1017.5195 1850.017,1016.5034 L 1850.1296,1017.1316 L 1854.2705,1012.6085 L 1859.2292,1013.5637 L 1860.3437,1014.91 L 1859.792,1016.7497 L 1868.1391,1012.4735 L 1869.5051,1013.2191 L 1868.9937,1015.0407 L 1870.6216,1016.8538 L 1866.2794,1021.2855 L 1866.2636,1023.6913 L 1865.548,1023.46 L 1864.7029,1022.5627 L 1862.7102,1022.4793 L 1865.7441,1025.5686 L 1865.1166,1028.6694 L 1862.8377,1029.066 L 1865.1132,1031.5346 C 1864.2312,1032.752 1863.5072,1034.0881 1862.9653,1035.5606 L 1861.9351,1035.5606 L 1861.3318,1034.6629 L 1860.8114,1035.038 L 1858.8434,1040.8632 L 1856.8226,1042.3204 L 1859.2844,1044.446 L 1857.9408,1045.8025 L 1858.6128,1048.3651 L 1854.2902,1053.0193 L 1854.2638,1055.2791 L 1852.5961,1055.286 L 1852.529,1056.3707 L 1855.0609,1059.5076 L 1853.2809,1061.3296 L 1868.9202,1059.0221 L 1872.3635,1060.8746 L 1871.501,1061.8967 L 1868.9456,1061.8967 L 1865.3243,1067.5032 L 1866.5782,1070.2551 L 1863.6012,1074.7535 L 1864.3582,1081.4497 L 1861.1174,1082.0711 L 1860.4662,1084.8299 L 1845.4975,1087.2524 L 1846.0818,1089.6501 L 1830.8673,1091.9888 z "},"al3":{"name":"AL-3","path":"M 1890.1946,967.09622 L 1888.1919,968.90394 C 1888.4215,971.94891 1887.4769,974.34293 1885.6044,976.7374 L 1879.9154,984.57087 L 1878.3735,984.76585 L 1878.0722,986.46723 L 1876.6012,986.46723 L 1877.9481,993.92849 L 1880.6243,992.40433 L 1879.9863,993.89305 L 1884.6119,1001.2835 L 1884.6119,1004.5976 L 1878.019,1004.4204 L 1876.6721,1005.2534 L 1876.6721,1007.451 L 1873.4111,1007.4332 L 1872.4364,1010.8006 C 1871.1568,1010.9953 1869.9784,1011.6969 1869.3349,1015.0718 L 1871.0894,1017.0035 L 1866.4638,1021.5051 L 1866.4638,1023.8977 C 1864.1586,1023.3536 1865.2624,1022.6988 1863.4332,1022.7635 L 1866.003,1025.5105 L 1865.2586,1028.931 L 1863.4332,1029.2855 L 1865.5245,1031.3944 C 1864.4404,1032.8655 1863.6807,1034.3364 1863.0964,1035.8074 L 1861.7673,1035.772 L 1861.2178,1035.0985 L 1859.0025,1041.142 L 1857.3188,1042.3649 L 1859.6582,1044.4916 L 1858.3822,1046.0157 L 1859.038,1048.4615 L 1854.5541,1053.1403 L 1854.5541,1055.6569 L 1852.8527,1055.6569 L 1852.8527,1056.3304 L 1855.4934,1059.5027 L 1854.2883,1060.8497 L 1869.1045,1058.5635 L 1872.8085,1060.8142 L 1871.3907,1062.2675 L 1869.1045,1062.2675 L 1865.7372,1067.5843 L 1867.0663,1070.3845 L 1864.1067,1074.8507 L 1864.7978,1081.3726 L 1888.6527,1077.6686 C 1888.5739,1079.6627 1888.2395,1081.7332 1887.1817,1082.2588 C 1887.4788,1083.2014 1887.7473,1083.9805 1888.954,1084.0134 C 1889.6783,1090.6786 1891.1296,1093.0236 1891.1339,1097.3409 L 1888.0147,1097.1282 L 1888.0147,1098.2093 L 1885.1613,1097.5004 L 1885.7639,1099.06 L 1882.0598,1100.9386 C 1880.5464,1101.1027 1879.5272,1100.6627 1878.7634,1099.9107 L 1877.1506,1101.2399 L 1875.8037,1099.8752 L 1877.1152,1108.1163 L 1873.4997,1109.7468 L 1867.8107,1106.3795 L 1867.8816,1110.4734 L 1865.7549,1114.0889 L 1867.5626,1125.2011 L 1872.9503,1124.5985 L 1873.6238,1129.5609 L 1889.4325,1127.2569 L 1886.5083,1108.4353 L 1891.3643,1107.691 L 1891.701,1105.3516 L 1893.6328,1107.3011 L 1892.9948,1108.967 L 1894.7139,1109.6051 L 1916.5306,1106.6453 L 1917.5408,1111.6431 L 1926.03,1110.1544 L 1930.8329,1114.7447 L 1936.7346,1113.7522 L 1935.8485,1109.8177 L 1936.7877,1108.2581 C 1937.3081,1107.3986 1938.7823,1105.7408 1940.0487,1104.5718 L 1942.3527,1102.4451 L 1942.7426,1100.336 L 1940.7576,1099.2726 C 1939.6708,1098.6831 1938.3309,1098.1916 1937.7802,1098.1916 L 1936.7877,1098.1916 L 1936.7877,1095.4268 L 1937.8688,1094.7534 L 1937.5144,1090.9075 L 1935.6535,1089.0466 L 1935.6535,1086.335 L 1930.6202,1082.1348 L 1929.9645,1079.4763 L 1928.8479,1079.4763 L 1928.8302,1078.4839 C 1928.8203,1077.938 1928.4374,1076.9979 1927.9795,1076.3926 L 1927.1465,1075.2938 L 1927.1465,1073.2379 L 1926.0123,1073.2379 L 1926.0123,1071.1466 L 1923.7438,1069.0908 L 1923.7438,1066.9995 L 1922.6804,1066.9995 L 1890.1946,967.09622 z "},"tn8":{"name":"TN-8","path":"M 1745.5413,850.92347 L 1748.696,860.40513 L 1746.9237,862.30149 L 1680.9241,869.88684 L 1678.4606,873.11238 L 1676.4757,872.35028 L 1676.4757,870.77298 L 1675.0578,870.77298 L 1675.0578,875.02644 L 1677.0782,877.98612 L 1675.944,880.9813 L 1671.9386,880.9813 L 1671.9386,882.20414 L 1676.4757,883.99417 L 1676.4757,886.01456 L 1675.8022,886.43991 C 1675.4351,886.66676 1673.5848,886.98509 1671.6905,887.16651 L 1668.2523,887.50328 L 1674.2071,891.17186 L 1674.2071,894.62783 L 1670.3436,896.91404 L 1670.0778,899.28889 C 1669.9293,900.60168 1669.6416,902.19191 1669.4397,902.81575 L 1669.0675,903.95001 L 1673.0729,906.51978 L 1673.0729,909.37318 L 1671.3538,910.02889 L 1669.7233,908.68196 L 1667.4016,909.40862 L 1667.4016,910.95047 L 1670.8044,911.69483 L 1670.8044,913.64434 L 1669.4397,915.00902 L 1666.9586,915.00902 L 1666.2496,917.79146 L 1662.3152,919.67008 L 1660.7024,919.04981 L 1658.8238,920.43219 L 1659.4618,922.09813 C 1659.8116,923.01824 1660.3923,923.96489 1660.7556,924.18941 L 1661.4291,924.59701 L 1663.3608,922.84248 L 1664.566,923.58684 L 1664.566,926.33384 L 1660.0289,928.6378 L 1660.0289,929.18723 C 1660.0289,929.4856 1660.6867,930.15476 1661.4822,930.67595 L 1662.9178,931.63298 L 1662.581,933.99008 L 1660.8087,934.32684 L 1657.7427,931.4912 L 1656.1654,932.11146 L 1655.5982,934.27364 L 1657.8491,937.14473 L 1656.8211,940.24624 L 1654.0741,940.24624 L 1654.0564,937.49919 L 1652.6563,937.03839 L 1652.6563,938.84612 L 1650.3877,940.77793 L 1650.4586,943.08189 L 1650.9726,941.80585 C 1651.2547,941.10403 1651.6451,940.52981 1651.841,940.52981 C 1653.1241,941.06285 1654.3253,941.76105 1655.5096,942.49701 L 1655.1374,943.3477 C 1654.9332,943.82267 1654.6068,945.10937 1654.4108,946.2011 L 1654.0564,948.18605 L 1651.522,948.5582 L 1651.522,950.10011 L 1655.1906,950.45456 L 1656.3958,952.9003 L 1658.4516,951.84493 L 1660.3592,953.67517 L 1661.5062,952.91964 L 1660.6555,951.60816 C 1659.7221,949.37515 1661.6316,949.89622 1663.9519,950.8152 L 1663.1299,948.59251 L 1663.1074,948.14113 C 1662.1499,948.45288 1661.2475,947.51723 1660.1365,946.24306 L 1662.552,945.26482 L 1664.0248,946.51024 L 1666.1545,945.70781 L 1666.9763,944.28704 C 1665.4804,942.93597 1664.1212,941.65743 1664.2469,941.16783 L 1664.2117,940.81967 L 1669.2962,940.85829 L 1669.1609,939.9447 L 1672.9426,939.06826 L 1673.7497,940.18482 L 1677.2891,940.32513 C 1677.4304,939.11562 1680.3129,938.41459 1682.9976,937.69417 C 1687.9301,938.00467 1693.5525,937.0608 1699.019,936.40037 L 1698.5051,934.43318 L 1717.5925,932.46592 L 1723.7423,927.76941 L 1725.7804,924.10077 C 1725.922,919.23322 1725.9259,914.38529 1724.9098,909.68317 L 1725.5323,907.45787 L 1729.3312,906.2842 L 1745.8868,904.5291 L 1745.8838,902.84666 L 1750.9337,902.68945 L 1752.4178,901.38018 L 1753.9419,903.82592 L 1755.5901,903.91456 L 1756.9193,901.68149 C 1758.1532,901.56041 1759.8017,902.11177 1762.0412,903.16391 L 1764.1502,901.00803 L 1768.386,900.47634 L 1768.3505,896.70137 L 1773.0648,894.02526 L 1773.1002,892.58968 L 1775.6346,892.51879 C 1776.3058,891.69804 1777.3052,891.02248 1777.0701,889.55912 L 1792.613,889.48823 L 1793.5877,888.26533 L 1793.1624,876.40882 L 1794.1903,875.96572 L 1791.6914,873.16552 L 1792.8079,872.22625 L 1790.7521,872.08446 L 1793.0206,870.22354 L 1792.1699,868.71714 L 1793.3396,868.71714 L 1792.294,867.56513 L 1786.2505,867.47654 L 1786.2505,865.56248 L 1790.6635,861.09635 L 1788.8558,856.94922 L 1785.3289,857.51635 L 1782.5819,855.31872 L 1781.0755,855.28328 L 1780.2425,861.32671 C 1781.9036,862.09744 1781.7413,862.98069 1778.8778,864.00288 L 1776.503,861.25582 L 1773.2597,861.34446 L 1769.7152,864.46367 L 1765.9934,851.15384 L 1755.3774,852.85523 L 1755.3065,850.92347 L 1745.5413,850.92347 z "},"tn4":{"name":"TN-4","path":"M 1781.1894,951.02209 L 1781.1638,949.32235 L 1782.2657,949.24697 L 1781.1311,946.00623 C 1782.1646,942.461 1780.3939,933.70368 1779.4341,926.04324 L 1775.5181,924.18505 L 1775.4412,922.61376 L 1771.7276,922.58813 L 1771.1463,921.93343 L 1772.7337,920.78732 L 1772.7337,918.3726 L 1774.5889,917.14 C 1775.0857,914.11692 1771.9762,912.93191 1769.3822,911.55282 L 1769.3822,909.25419 L 1770.9539,908.77145 L 1773.0089,910.01108 L 1776.3972,906.50345 L 1779.5173,906.50345 C 1783.683,903.54644 1779.8909,901.60198 1777.5221,898.9979 L 1776.9515,896.96945 L 1783.1818,898.06406 L 1784.7972,896.72337 L 1784.7972,893.991 L 1782.9717,893.29048 L 1784.8768,892.26529 L 1790.1706,894.06535 L 1795.3198,890.90888 C 1796.2336,888.63107 1797.2641,888.26357 1798.1108,888.20152 L 1797.4233,892.57159 L 1800.8486,889.92854 L 1801.449,889.92854 L 1801.449,892.89622 L 1803.1498,894.12915 L 1805.6046,889.1475 C 1807.4417,889.80758 1809.2788,890.19572 1811.1159,889.90291 L 1810.9877,893.48875 L 1805.2881,897.69946 L 1805.9024,898.97697 L 1808.0495,899.13077 L 1808.0495,900.2905 C 1810.4579,901.2967 1812.7418,901.74201 1815.0159,902.1437 L 1814.3564,913.59256 L 1812.4825,917.32092 L 1809.7509,919.11072 L 1809.7509,921.28441 L 1811.4523,921.93729 C 1811.8309,923.85787 1812.1475,925.79223 1813.7208,927.44728 L 1815.8155,928.56838 L 1816.9798,927.40418 L 1817.7123,930.32285 L 1821.6797,930.32285 L 1826.1601,925.52636 L 1828.8607,924.80849 L 1828.3395,922.21269 L 1833.9404,921.79182 L 1835.7445,923.97413 L 1837.9088,923.95213 L 1837.8868,922.10658 C 1839.5584,921.69064 1841.9193,919.80965 1845.3552,916.21802 C 1845.5981,909.97802 1843.8573,905.93377 1843.1396,899.47156 L 1845.372,898.95514 C 1847.0904,900.01964 1849.4119,900.74919 1851.872,901.40167 L 1856.2502,899.91682 L 1855.4424,895.41376 L 1858.848,888.72453 L 1860.9079,886.82357 L 1869.9318,886.50836 L 1869.8325,883.14591 L 1870.9068,882.3128 L 1869.1246,877.73817 L 1870.4248,877.03947 L 1869.6129,875.12422 L 1875.1024,869.96278 L 1885.1856,871.48285 L 1887.1859,874.39069 L 1889.1887,874.43516 L 1888.8653,866.67088 L 1893.1217,865.94961 L 1895.2728,863.52076 L 1894.6608,862.86573 L 1895.9373,859.42706 L 1893.164,853.8874 L 1892.1856,848.2468 L 1889.3981,843.46783 L 1886.4861,841.18315 L 1884.2996,841.04778 L 1884.2649,839.7934 L 1882.8204,840.25533 L 1882.1945,835.04189 C 1903.318,833.31458 1924.4415,830.42342 1944.9577,827.12743 C 1946.4823,830.90349 1948.6823,834.10062 1951.1473,837.07062 L 1950.9659,838.01319 L 1948.6873,837.4173 L 1948.8234,844.93176 L 1944.9213,846.97161 C 1945.4604,847.71954 1945.5067,848.55707 1944.5652,849.57416 L 1937.0207,849.30461 L 1937.6534,853.83171 C 1936.7352,853.78532 1935.6345,853.31335 1934.3115,852.32258 L 1929.5425,852.88875 L 1929.644,854.7639 L 1926.8935,857.79242 C 1930.3108,859.86953 1933.5148,862.33677 1934.657,865.08298 L 1930.0924,870.51652 C 1931.2596,871.80198 1931.9947,873.12668 1931.6836,874.54654 L 1928.8479,877.21046 L 1928.8479,879.89224 C 1926.9059,881.82739 1925.0504,883.77696 1923.9061,885.84505 L 1921.8295,885.2009 L 1921.374,886.83718 C 1919.5729,885.58235 1917.6807,884.16328 1916.528,884.07566 L 1916.5866,881.70161 C 1915.4381,881.88762 1914.2896,880.86804 1913.1411,879.87091 C 1911.3107,881.90861 1909.3368,884.37726 1908.2802,884.09358 C 1906.205,888.76253 1903.6275,893.54308 1900.3387,898.48175 L 1901.2417,900.53396 L 1899.1814,902.53355 L 1901.113,904.66788 L 1899.6122,906.53708 L 1898.6679,905.92673 C 1896.8364,912.96769 1893.6252,920.3153 1890.6335,927.61408 L 1890.2578,929.61683 L 1892.4212,930.18255 C 1892.6662,932.34058 1890.5868,933.16235 1890.1935,934.93412 L 1889.3581,936.62394 C 1853.3702,941.5714 1817.1773,946.61533 1781.1894,951.02209 z "},"tn3":{"name":"TN-3","path":"M 1971.1699,822.15939 L 1960.9261,823.75444 L 1960.1463,825.01278 L 1945.9327,827.01543 C 1946.3727,830.77118 1949.7588,833.70465 1951.604,836.83384 L 1951.1609,838.44664 L 1949.1582,838.03899 L 1949.2646,845.30533 L 1945.6491,847.0776 C 1945.7398,847.95036 1945.7187,849.03533 1944.7807,850.05503 L 1937.4612,849.71833 L 1938.0638,854.32625 C 1936.5579,854.1835 1935.2994,853.6462 1934.2357,852.76664 L 1929.9822,853.31602 L 1929.9822,854.89338 L 1927.501,857.67582 C 1930.129,860.14022 1933.8536,861.54404 1935.1572,865.15483 L 1930.6557,870.52486 C 1931.5,871.82336 1932.4073,873.10643 1932.2507,874.5479 L 1929.1315,877.25951 L 1929.1315,880.18374 C 1927.1626,881.85258 1925.6608,883.7689 1924.1337,886.17404 L 1922.1133,885.64236 L 1921.4753,887.3083 C 1919.3609,885.92382 1917.5209,884.54077 1916.1407,884.33087 L 1916.1762,882.11555 C 1914.6199,881.64291 1913.9938,880.98941 1913.1279,880.37872 C 1911.6296,882.31841 1910.1245,884.30932 1908.6263,884.38407 C 1906.5616,889.08449 1903.8991,893.79092 1900.9523,898.49139 L 1901.6612,900.70671 L 1899.8003,902.58533 L 1901.5372,904.51714 L 1899.499,907.01602 L 1898.8964,906.41344 C 1896.1774,917.22553 1891.1903,927.31673 1890.9035,929.06315 L 1893.2606,929.68347 L 1892.4808,932.87357 L 1891.7542,933.4407 C 1891.3488,933.75381 1890.8246,934.58324 1890.6022,935.28387 L 1889.9287,936.50671 C 1908.2555,933.87053 1926.578,930.75898 1944.9048,927.53899 L 1944.0364,914.35325 L 1941.9273,914.88493 L 1940.669,913.36077 L 1934.4306,911.55305 C 1932.6069,912.72848 1930.5066,913.80325 1925.7819,913.96335 L 1924.4881,915.5407 L 1921.3689,914.03424 L 1922.0069,912.97087 C 1919.4915,912.45966 1917.0555,911.31157 1914.6875,909.62129 L 1923.5279,890.28311 C 1924.7493,890.28272 1926.4949,889.01547 1928.5555,886.98713 L 1928.5167,885.00263 L 1932.4345,880.47729 L 1934.241,879.66323 L 1934.241,876.73299 L 1935.932,876.0766 L 1935.9161,872.76269 L 1938.2484,872.04318 C 1938.7963,871.54734 1939.4749,868.36977 1940.3009,866.68143 L 1942.2012,864.84972 L 1944.4224,864.79714 L 1947.8272,861.23217 L 1945.3459,859.89522 L 1951.2785,851.08023 L 1953.745,852.30999 C 1954.2203,851.58276 1958.4564,851.1269 1961.9148,850.68982 L 1965.7822,854.32625 L 1964.2403,854.85793 L 1964.7366,856.18711 L 1974.1651,860.47602 L 1976.9298,862.90407 L 1981.7504,861.61028 L 1982.4416,862.54961 L 1986.1279,862.72684 L 1986.1279,856.93147 L 1987.2799,856.55932 C 1985.5252,855.55675 1982.5879,854.99648 1980.5984,854.09582 L 1980.1022,855.4605 L 1975.9196,855.4605 L 1975.9196,852.69575 L 1974.9626,852.48308 L 1975.0867,846.40414 L 1977.1957,844.41919 L 1976.3982,843.46216 L 1979.411,839.66949 L 1983.4873,840.07714 L 1983.8594,838.34031 C 1982.9303,837.19408 1982.9409,836.04831 1982.8669,834.90209 L 1980.882,832.73991 L 1976.5399,831.67654 C 1976.6668,829.10439 1975.4994,826.75194 1974.041,824.17978 L 1971.1699,822.15939 z "},"tn2":{"name":"TN-2","path":"M 1921.6892,913.95648 L 1922.3942,912.80907 C 1919.4628,912.29973 1917.5004,910.82622 1915.1745,909.45201 L 1923.865,890.54172 C 1925.8877,889.82918 1927.4531,888.52864 1928.8479,887.00885 L 1928.8479,884.95256 L 1932.8178,880.53689 L 1934.5192,879.88401 L 1934.5192,876.97714 L 1936.2206,876.32426 L 1936.2206,872.93669 L 1938.4609,872.35084 L 1940.521,866.7572 L 1942.378,865.10305 L 1944.505,865.10305 L 1948.2631,861.22571 L 1945.9116,859.75713 L 1951.5102,851.43985 L 1953.825,852.67868 C 1954.3082,851.62677 1958.4895,851.27799 1961.8876,850.91196 L 1965.158,854.22847 L 1963.8059,854.67917 L 1964.5245,856.552 L 1974.0335,860.84335 L 1973.914,864.77973 L 1972.4446,865.34675 L 1970.2349,864.16411 L 1969.4338,864.57988 C 1968.4492,865.30246 1968.1922,866.1591 1967.8868,867.25219 L 1962.3129,868.80277 C 1964.7265,873.30044 1967.5338,877.17926 1970.8394,880.27516 L 1971.7682,886.16389 L 1966.9172,887.50736 L 1965.3218,889.00186 C 1964.4443,889.82385 1963.1734,890.66315 1962.4977,890.86686 L 1961.2691,891.23731 L 1960.1363,894.48673 L 1957.9734,895.17324 L 1955.4471,899.66813 L 1956.6403,901.89757 L 1955.3693,902.6831 L 1956.0256,907.47182 L 1953.2258,909.90622 L 1952.2377,909.9149 C 1951.6942,909.91966 1950.8814,910.15649 1950.4315,910.44119 L 1949.6134,910.95875 L 1948.1967,909.05553 L 1947.1711,909.67149 C 1946.6069,910.01023 1945.6349,911.07462 1945.0111,912.03681 L 1943.9485,914.00129 L 1942.0368,914.53303 L 1940.8869,913.17946 L 1934.42,911.22837 C 1932.0768,912.63144 1929.4244,913.69572 1925.7518,913.64275 L 1924.466,915.24937 L 1921.6892,913.95648 z "},"tn1":{"name":"TN-1","path":"M 1972.7713,886.08681 L 1972.0804,886.08681 L 1971.3106,879.9257 C 1968.0686,876.73628 1965.2041,873.17783 1963.1195,869.12422 L 1968.0885,867.72659 C 1968.5499,865.89352 1969.3351,865.03142 1970.2249,864.48346 L 1972.4347,865.6661 L 1974.2182,864.98169 L 1974.2182,860.93545 L 1976.8398,863.2782 L 1981.5428,861.97057 L 1981.8745,862.79427 L 1986.3712,862.95658 L 1986.3712,857.16257 L 1987.77,856.62363 C 1985.7208,855.22951 1982.8715,854.74978 1980.4223,853.81282 L 1979.9474,855.29479 L 1976.1629,855.23762 L 1976.1629,852.63059 L 1975.2076,852.30676 L 1975.4588,846.47826 L 1977.6235,844.31081 L 1976.9127,843.60008 L 1979.6988,840.28896 L 1983.744,840.65192 L 1984.3718,838.25115 C 1983.4494,837.19386 1983.2191,836.02126 1983.2625,834.80301 L 1980.9277,832.3178 L 1977.0539,831.34857 C 1976.7689,828.76184 1976.3885,826.18311 1974.201,823.75495 L 1971.8555,822.11209 C 1996.6471,817.75416 2021.4798,813.40995 2045.3288,808.73783 L 2046.4883,806.85077 L 2058.5021,805.19078 L 2056.8493,807.93347 L 2056.5302,810.31247 L 2057.6646,812.43222 L 2056.4329,818.17582 L 2057.725,819.73276 L 2056.8801,819.73276 L 2058.2006,821.32384 L 2056.7355,821.84798 L 2054.7505,820.82709 L 2053.758,821.359 C 2053.2122,821.65152 2052.0378,822.70825 2051.1483,823.70725 L 2049.531,825.52365 L 2045.6918,836.9239 L 2044.7967,837.91297 C 2044.3044,838.45696 2043.4346,839.02421 2042.8638,839.17342 L 2041.826,839.44485 L 2040.6734,836.91523 L 2036.5406,837.16612 L 2034.3258,839.54353 L 2032.8142,838.96352 L 2032.0868,839.84002 C 2031.6867,840.32208 2031.0716,840.72503 2030.7199,840.7354 C 2030.3682,840.74578 2029.5267,841.21673 2028.8498,841.78193 L 2027.6193,842.80962 L 2026.9605,845.30765 C 2026.5982,846.68152 2025.95,848.35512 2025.5201,849.02671 C 2025.0902,849.69831 2023.9834,850.78555 2023.0604,851.44274 L 2021.3823,852.63762 L 2019.55,850.80534 L 2020.1959,848.77031 L 2017.2184,846.42824 L 2015.9573,847.25455 C 2015.2637,847.70905 2014.1744,848.657 2013.5367,849.36109 C 2012.899,850.06518 2011.8164,851.09753 2011.1309,851.65513 L 2009.8844,852.66893 L 2010.5402,854.73492 L 2009.8654,856.49342 L 2006.3068,855.47281 L 2005.1267,856.65238 L 2005.0508,862.80471 L 2004.4313,864.09566 C 2004.0905,864.80571 2003.669,865.83323 2003.4946,866.37909 L 2003.1774,867.37157 L 1998.5001,867.37157 L 1997.0581,868.50583 C 1996.265,869.12967 1995.2954,869.64008 1994.9034,869.64008 L 1994.1907,869.64008 L 1993.4987,872.39707 L 1991.0644,872.75929 L 1990.6468,873.60998 C 1990.4172,874.07786 1989.9014,875.1625 1989.5006,876.02028 L 1988.7719,877.57988 L 1986.6894,877.57988 L 1983.8473,880.48245 C 1982.2842,882.07886 1980.7864,883.77599 1980.519,884.25385 L 1980.0327,885.12275 L 1977.1272,885.22501 C 1975.5291,885.28121 1974.0508,885.49814 1973.8418,885.70701 C 1973.6329,885.91588 1973.1512,886.08681 1972.7713,886.08681 z "},"ky2":{"name":"KY-2","path":"M 1878.5861,726.93496 C 1874.1123,726.9619 1869.5918,727.29084 1865.0637,727.69701 L 1863.5927,731.25932 L 1865.8258,731.38335 L 1868.0057,735.05199 L 1872.4009,733.95318 L 1873.4997,736.07991 L 1867.474,736.87741 L 1865.3295,734.96335 L 1861.7318,736.13305 C 1861.6329,738.56121 1861.1807,740.98898 1860.4558,743.41714 L 1854.1431,747.67667 L 1847.0751,747.70605 L 1839.0389,752.07028 C 1839.4859,754.08886 1838.392,754.70056 1837.0617,755.09642 C 1836.2344,755.10067 1834.981,755.24506 1834.2792,755.43318 L 1833.0032,755.78763 L 1833.0032,758.4815 L 1831.4259,758.4815 L 1829.6004,755.6813 L 1823.6101,755.84077 C 1822.3975,755.06931 1821.1717,754.3182 1819.977,753.51912 C 1819.8339,753.41165 1819.5787,752.14468 1819.4098,750.70117 L 1819.1085,748.0782 L 1817.8325,747.65285 L 1817.2299,749.97457 L 1815.2627,749.97457 L 1813.7917,751.95952 L 1811.4523,750.54169 L 1811.4523,751.07338 C 1811.4523,751.37242 1811.8562,751.85692 1812.3562,752.13674 L 1813.2778,752.63298 L 1812.8701,754.79516 L 1809.1306,756.49655 L 1809.8041,760.98038 L 1811.0092,762.43365 L 1810.3535,764.15278 L 1806.9153,764.15278 L 1806.9153,768.49483 L 1804.186,769.96585 L 1802.8213,769.11516 L 1803.4416,765.28704 L 1802.9808,765.28704 C 1802.7267,765.28704 1802.1994,765.66985 1801.8111,766.13773 L 1801.1022,766.98843 L 1798.9755,766.98843 L 1797.3095,764.68447 C 1796.3911,763.41648 1795.5519,762.12292 1795.4487,761.81338 L 1795.2714,761.24625 L 1793.3574,761.99061 L 1791.2129,765.62375 L 1786.6404,766.98843 L 1785.5061,768.40625 L 1784.9745,775.10546 L 1783.9289,775.86751 C 1783.3529,776.2886 1782.5649,776.62961 1782.1743,776.62961 L 1781.4654,776.62961 L 1779.445,773.22684 L 1776.1485,773.22684 L 1771.9997,770.83407 L 1772.0351,774.60905 C 1771.9052,775.62625 1772.7916,776.59508 1774.6572,777.51728 L 1772.1609,780.35009 C 1770.9976,780.32945 1769.9575,780.55505 1769.2668,781.47947 L 1769.2897,783.71912 C 1771.3947,785.45601 1777.6389,787.19295 1782.7945,788.92984 L 1788.076,789.03556 L 1786.1256,792.50939 L 1792.9143,794.60119 L 1796.707,794.28218 L 1800.411,797.68478 L 1810.6193,796.78089 L 1816.5744,797.9507 L 1822.281,809.45145 L 1819.6407,810.99381 L 1817.4601,808.81371 C 1815.9762,809.27071 1814.3206,809.69339 1811.2038,809.82377 L 1811.8949,811.84587 L 1810.4769,821.66304 L 1816.1841,831.34041 L 1825.4529,831.35816 L 1825.4529,833.12998 L 1831.6392,826.40202 L 1831.1792,825.70638 L 1834.8469,822.19529 C 1835.5244,823.32682 1836.473,824.35406 1838.976,824.78361 L 1840.3227,823.04553 C 1841.106,823.40622 1840.8634,824.99027 1840.429,826.80275 L 1841.581,826.74961 C 1842.0147,828.58507 1842.3675,830.49958 1843.371,831.76513 L 1845.1256,831.80058 L 1846.951,833.51971 C 1850.2158,830.19832 1853.4427,826.81228 1857.0353,824.39246 L 1854.0578,808.30018 L 1852.7818,807.48493 L 1853.6857,804.61384 L 1856.8758,803.17833 L 1859.6051,806.12031 L 1865.4004,806.12031 L 1870.3628,802.71753 C 1872.696,799.98658 1874.932,797.30894 1875.5201,795.57523 L 1879.6141,794.17516 L 1880.3939,791.12684 L 1881.28,789.77991 L 1881.794,787.21008 L 1883.9207,784.39219 L 1885.6753,784.39219 L 1884.6651,776.09793 L 1883.265,757.01048 L 1881.8826,754.68882 L 1878.5685,755.11417 L 1877.381,753.59001 L 1875.5733,755.00783 L 1874.2441,750.22268 C 1876.1692,748.61125 1874.6146,748.66427 1878.657,744.12605 L 1878.657,740.15615 L 1880.0394,740.1384 L 1879.8267,729.62882 L 1880.5002,726.93496 C 1879.863,726.92526 1879.2252,726.93111 1878.5861,726.93496 z "},"ky5":{"name":"KY-5","path":"M 1894.7155,832.33657 L 1895.4167,830.92204 L 1893.7911,826.59496 L 1894.2798,824.60609 C 1894.0794,823.24266 1891.7533,820.9594 1889.8234,819.18423 L 1894.6906,814.27828 L 1894.8202,811.66064 L 1897.044,812.24218 L 1899.665,808.69553 L 1895.7276,805.5445 L 1895.7276,801.38853 L 1909.9573,784.11186 C 1910.643,784.64439 1911.3924,784.92501 1912.2186,785.12923 C 1912.8886,783.37709 1913.454,779.94891 1913.9513,775.43331 L 1917.562,775.08351 C 1917.4355,773.26836 1918.0695,772.04977 1918.6295,770.83532 L 1922.2009,771.81118 L 1925.904,770.49283 L 1926.617,768.24649 C 1928.2877,767.72955 1929.9556,767.199 1931.7948,767.52448 L 1936.0877,765.38243 L 1939.5958,766.95134 L 1940.7251,761.78797 L 1941.7668,760.58242 L 1942.9706,761.51643 L 1942.133,758.66116 L 1945.5664,754.85318 L 1946.9879,754.85159 L 1949.2646,748.21822 C 1947.4505,746.57877 1945.7311,744.87375 1942.8302,743.98676 L 1942.6907,742.38491 L 1941.229,741.80139 L 1941.3814,737.52331 C 1943.062,737.2284 1944.5022,736.72723 1945.5782,735.91414 C 1945.5106,733.50458 1944.6105,731.26159 1943.2487,729.11087 L 1945.1001,727.75707 L 1945.0678,726.05597 L 1950.1395,720.48053 L 1950.1313,714.87701 L 1951.8608,712.91344 L 1951.4359,712.07018 L 1953.7994,710.57614 L 1958.3349,715.10948 L 1960.5263,719.98338 C 1962.2791,721.56142 1964.0088,722.72386 1965.6757,722.75375 L 1965.4087,725.07535 L 1963.8498,726.05756 L 1964.5263,729.61725 L 1967.6962,732.08211 C 1969.0749,731.94078 1970.1803,731.95127 1970.7826,732.24125 L 1977.1179,731.00536 C 1977.3331,729.21607 1979.74,726.26864 1981.8396,723.57818 L 1979.5439,719.84222 L 1980.6566,718.53505 C 1981.7981,718.72288 1982.8893,718.06836 1984.3756,716.35988 L 1983.7363,715.62959 L 1984.7235,714.4587 L 1987.1809,714.52222 L 1989.9351,712.2313 L 1993.9583,712.1164 L 1992.8347,714.11882 L 1994.0677,714.88087 L 1994.0677,717.08246 L 1992.3663,717.08246 L 1992.3663,717.84638 C 1992.3663,718.26651 1992.8429,719.15974 1993.4253,719.83134 C 1994.0078,720.50287 1994.63,721.05236 1994.8082,721.05236 C 1994.9863,721.05236 1995.8794,721.75418 1996.7928,722.61197 C 1997.7062,723.46975 1998.8998,724.87339 1999.4451,725.73117 L 2000.4366,727.29078 L 2001.8862,727.29078 L 2002.4971,728.88277 L 2001.8593,731.32182 L 2002.9259,732.28372 C 2003.5125,732.81274 2004.3115,733.27115 2004.7014,733.30234 C 2005.0913,733.33354 2005.6767,733.39734 2006.0023,733.44413 L 2006.5943,733.52919 L 2006.262,734.97605 L 2008.6554,738.0187 L 2011.6269,739.37261 L 2011.9958,740.56261 C 2012.1987,741.21708 2012.8341,742.41939 2013.4078,743.23441 L 2014.4508,744.71626 L 2013.8593,745.30778 L 2017.4503,746.55954 L 2018.4623,745.93411 L 2019.1428,747.70741 L 2021.1164,747.70741 L 2022.2607,748.69989 C 2022.8901,749.24575 2023.4396,749.88377 2023.4817,750.11771 C 2023.5239,750.35165 2023.5584,750.80983 2023.5584,751.13588 L 2023.5584,751.72869 L 2027.3985,751.00833 L 2028.1909,752.29061 L 2030.364,751.60086 L 2030.364,751.98107 C 2030.364,752.19017 2027.6741,755.84406 2024.3865,760.10088 C 2021.099,764.35763 2017.8707,768.5423 2017.2126,769.40008 C 2016.5546,770.25787 2015.7868,770.95969 2015.5066,770.95969 C 2015.2263,770.95969 2013.6694,771.81889 2012.0468,772.86904 L 2009.0966,774.77839 L 2005.1958,778.54033 C 2003.0503,780.60938 2001.0694,782.30226 2000.7938,782.30226 L 2000.2928,782.30226 L 2001.001,786.73159 L 1998.9273,790.24206 L 1997.1869,790.27768 L 1995.0965,793.14735 L 1995.7907,795.91335 L 1995.0907,798.70266 L 1993.129,799.86006 C 1992.0501,800.49666 1990.0546,801.29767 1988.6948,801.6401 L 1986.2222,802.2627 L 1985.3244,805.00766 C 1984.8306,806.51735 1984.4265,808.09097 1984.4265,808.50452 L 1984.4265,809.25636 L 1975.636,813.37014 L 1971.2266,816.89711 L 1970.3121,816.9574 C 1969.8091,816.99058 1968.9726,817.05438 1968.4531,817.09918 C 1967.9336,817.14398 1966.111,818.07391 1964.4029,819.16563 L 1961.2973,821.15058 L 1959.5658,824.00386 C 1932.507,827.66286 1898.1678,832.50109 1894.7155,832.33657 z "},"va9":{"name":"VA-9","path":"M 1961.4578,822.66362 L 1967.6962,818.43171 L 1972.7194,817.46067 L 1974.8463,815.17775 L 1979.3402,812.9182 C 1981.812,811.6755 1984.2227,810.6587 1984.6975,810.6587 L 1985.5608,810.6587 L 1985.6448,809.94979 C 1985.691,809.55989 1985.7664,808.85806 1985.8124,808.39018 C 1985.8584,807.9223 1986.2133,806.45486 1986.601,805.12919 L 1987.3059,802.7189 L 1990.1355,802.7189 L 1995.7284,799.88478 L 1997.0308,797.45123 L 1996.4738,793.29826 L 1997.1764,792.33726 C 1997.5629,791.80876 1998.1215,791.37632 1998.4178,791.37632 C 1998.7142,791.37632 1999.7456,790.60491 2000.7099,789.66206 L 2002.4633,787.94786 L 2001.8702,783.52618 L 2005.7048,779.93677 C 2007.8137,777.96265 2010.2053,775.76883 2011.0194,775.06162 C 2011.8334,774.35441 2013.591,773.24363 2014.9251,772.59325 L 2017.3509,771.41073 L 2018.895,769.35823 C 2019.7443,768.22942 2023.0842,763.85317 2026.3171,759.63333 C 2029.5499,755.4135 2032.421,751.87581 2032.6973,751.77185 L 2033.1996,751.58277 L 2033.1996,752.01073 C 2033.1996,752.24614 2032.7858,752.8959 2032.2801,753.45469 L 2031.3606,754.47071 L 2032.0297,756.21434 L 2034.1422,756.21434 L 2034.761,757.49038 C 2035.1014,758.1922 2035.5205,759.42146 2035.6923,760.22201 L 2036.0046,761.67761 L 2037.5795,762.49053 C 2038.4458,762.93765 2039.4879,763.75007 2039.8955,764.29593 L 2040.6366,765.2884 L 2045.6201,765.2884 L 2046.0736,766.00293 C 2046.323,766.39595 2047.4306,767.19078 2048.5349,767.76925 L 2050.5427,768.82099 L 2056.7416,767.53412 L 2057.812,765.94134 C 2058.4008,765.06529 2059.7307,763.76742 2060.7672,763.05715 L 2062.6519,761.76574 L 2063.0311,760.54964 C 2063.2397,759.88077 2063.6649,759.16999 2063.9762,758.97008 L 2064.542,758.60655 L 2067.8233,760.52968 C 2069.6279,761.58738 2071.4637,762.45276 2071.9027,762.45276 L 2072.7009,762.45276 L 2075.2985,759.68767 L 2078.4939,758.17167 C 2080.2512,757.33782 2082.2339,756.59466 2082.8998,756.52014 L 2084.1105,756.38465 L 2089.3917,751.50133 L 2087.2123,749.12523 L 2087.9434,747.13733 L 2092.0233,749.90963 L 2093.3781,748.99876 C 2094.1234,748.49782 2096.432,746.46999 2098.5086,744.49247 L 2102.284,740.89705 L 2104.0549,741.57658 L 2103.8071,742.7088 L 2105.6759,743.94196 L 2113.7319,735.78954 L 2113.7319,734.09632 L 2112.0305,734.09632 L 2112.0305,732.67482 L 2115.4333,729.46317 L 2115.4333,727.29078 L 2112.6376,727.29078 L 2111.4234,725.02226 L 2112.685,722.66511 L 2112.1084,721.16261 L 2112.941,717.87236 L 2114.3685,720.48937 C 2117.4766,719.81699 2120.5691,718.90051 2123.4103,717.45977 L 2123.5973,715.16778 L 2124.7479,715.08606 L 2124.9125,717.54252 L 2127.8026,714.15336 L 2127.1584,708.49472 L 2135.1079,707.90519 L 2137.3551,709.47914 L 2139.4626,707.26093 L 2140.7937,707.7017 C 2140.4664,709.88463 2140.0125,712.04228 2139.0571,714.09959 L 2131.7429,713.39613 C 2130.4547,716.68502 2129.5238,719.83309 2124.1919,724.71494 L 2124.1778,726.36233 L 2127.7523,730.14536 C 2126.4862,734.01965 2125.8485,736.36626 2125.9744,737.89955 C 2125.146,738.12747 2124.5261,738.62808 2124.5167,739.92697 L 2130.7457,741.58214 C 2131.4209,742.30784 2130.1638,743.72912 2129.3473,744.99183 L 2126.516,745.84048 L 2121.3837,751.26688 C 2121.7671,752.69446 2122.0101,754.2624 2122.7462,755.33728 L 2126.4402,754.29915 L 2127.1918,755.31187 L 2126.2985,756.74126 C 2127.5543,760.18583 2126.8617,762.77506 2128.2125,764.7228 L 2126.8186,766.27339 L 2127.5043,767.89838 L 2125.312,770.50236 L 2125.312,772.99494 L 2123.41,774.71578 L 2131.896,774.69202 L 2135.0293,778.21962 L 2137.9188,777.12103 L 2140.8672,782.51153 L 2144.5706,784.18876 C 2144.4734,786.10452 2143.872,788.01796 2140.9665,790.37058 L 2141.529,791.28065 C 2113.9239,796.34998 2085.8438,802.05258 2059.729,805.13469 L 2058.9271,803.8371 L 2045.7098,805.79982 L 2044.2586,807.77428 C 2021.3631,812.02145 2007.0141,814.96808 1961.4578,822.66362 z "},"va5":{"name":"VA-5","path":"M 2142.0566,791.21673 L 2141.5337,790.37058 C 2143.8116,788.55962 2145.0604,786.46402 2144.924,783.98527 L 2141.1847,782.20216 L 2138.0775,776.67459 L 2135.1727,777.86845 L 2132.0809,774.36246 L 2124.0878,774.43953 L 2125.6416,773.00135 L 2125.6416,770.54551 L 2127.7407,767.84048 L 2127.1779,766.40383 L 2128.517,764.79024 C 2127.3139,763.33912 2127.9033,761.30977 2126.6423,756.77495 L 2127.5047,755.32089 L 2130.7742,754.11614 L 2133.4893,755.86255 L 2135.3412,754.10156 C 2136.181,752.34295 2136.2669,750.17096 2138.5593,749.20894 L 2137.2815,746.78265 L 2137.2815,742.87706 C 2138.7375,741.00786 2140.9678,740.46648 2142.9252,740.05117 L 2142.9714,737.62562 L 2145.1433,733.92284 C 2146.6294,733.85881 2148.0304,734.92836 2149.1966,735.7617 L 2149.3641,736.77175 C 2153.1063,735.4555 2156.3686,734.13925 2157.9558,732.82301 L 2160.9192,734.73026 L 2157.9281,738.56082 L 2158.9425,741.78404 L 2162.49,743.11809 L 2164.7748,735.38813 L 2167.4632,735.90206 C 2169.7631,733.85977 2172.5136,730.91609 2173.6683,731.16432 L 2173.5199,727.50192 L 2174.7663,727.94388 L 2177.7719,723.60444 L 2177.4953,722.79793 L 2179.2818,722.20097 L 2180.2354,719.68088 C 2177.5268,717.0836 2175.1956,714.31238 2172.8811,711.18971 L 2169.2064,710.79465 L 2167.0578,706.29426 L 2165.7658,706.92144 C 2164.7722,706.01001 2163.9151,705.78072 2163.0492,705.50737 L 2162.5024,701.2049 L 2166.0541,698.75292 C 2167.3352,699.83925 2168.7428,699.91355 2170.1526,699.96981 L 2170.2502,698.03544 L 2173.8237,693.70542 L 2172.6543,692.672 C 2173.7811,690.02861 2175.5607,687.53024 2177.8724,685.15017 L 2177.0811,683.3383 L 2177.3237,676.53276 L 2178.9884,674.80438 C 2179.904,673.85376 2180.6531,672.87586 2180.6531,672.63131 C 2180.6531,672.38671 2181.5463,671.09655 2182.638,669.76425 L 2184.623,667.34187 L 2184.623,666.44127 C 2184.623,665.94594 2184.8432,665.40462 2185.1123,665.23828 C 2185.3815,665.07194 2185.9295,663.71701 2186.3302,662.22739 C 2186.7309,660.73772 2187.2577,659.29505 2187.5009,659.02141 L 2187.9432,658.52393 L 2189.2649,663.4888 C 2191.827,665.8729 2194.3753,668.3952 2197.0645,669.50887 L 2195.3444,674.40041 L 2203.7169,676.25254 L 2200.7102,684.954 L 2213.4618,688.65792 L 2211.1453,698.88937 L 2215.2564,700.84988 L 2214.6026,702.90986 L 2216.6291,703.69153 L 2216.6291,715.87573 L 2213.435,719.88776 L 2213.3178,724.17157 C 2214.4045,729.54665 2215.6124,734.80064 2217.0929,739.78202 C 2220.4489,740.56806 2221.0875,741.05868 2221.4638,741.52083 L 2226.7092,743.06467 L 2229.2215,741.74031 L 2231.8316,759.90068 L 2233.265,761.43051 L 2236.3502,759.40898 L 2235.6442,754.08682 L 2243.1314,743.16216 C 2244.3461,744.32517 2245.7285,745.19486 2247.4683,745.4389 L 2250.082,756.2807 L 2247.2907,767.18295 C 2214.6432,775.30996 2178.8294,783.28617 2142.0566,791.21673 z "},"va6":{"name":"VA-6","path":"M 2122.8213,754.99655 C 2122.4126,754.35626 2122.0565,752.92579 2121.7103,751.34991 L 2126.6336,746.06336 L 2129.5518,745.33092 C 2130.5125,743.95223 2131.6182,742.54938 2131.1166,741.41438 L 2124.7433,739.74912 C 2124.7849,738.79351 2125.4158,738.32892 2126.2087,737.9993 C 2125.9866,736.59969 2126.9466,733.48065 2128.0949,730.08757 L 2124.5073,726.3861 L 2124.5171,724.7387 C 2128.1751,721.67552 2130.8452,718.09479 2131.8574,713.64578 L 2139.2224,714.40034 C 2140.2175,712.3065 2140.7051,709.98428 2141.0753,707.60914 L 2139.3592,706.95065 L 2137.3668,709.15224 L 2134.96,707.57523 L 2126.7138,708.16527 L 2127.4426,713.99813 L 2125.1122,716.7989 L 2125.0745,714.81395 L 2123.3138,714.96758 L 2123.0622,717.20655 C 2120.6047,718.4848 2117.5673,719.34882 2114.4317,720.14269 L 2113.0842,717.57354 L 2113.9751,716.21368 C 2114.4652,715.46581 2114.8661,714.49585 2114.8661,714.05825 L 2114.8661,713.26262 L 2117.9848,708.57633 L 2121.1035,703.89003 L 2121.7043,701.55397 C 2122.0347,700.26914 2122.5373,698.47871 2122.8211,697.57522 L 2123.3373,695.93247 L 2122.5642,694.68156 L 2122.8927,691.54925 L 2124.3156,689.00341 C 2125.0982,687.60317 2125.931,686.45751 2126.1662,686.45751 C 2126.4014,686.45751 2126.8757,685.83889 2127.2201,685.08274 L 2127.8465,683.70802 L 2126.2386,682.37351 L 2127.0624,680.78044 C 2127.5155,679.90423 2128.1683,679.09329 2128.5131,678.97839 L 2129.1399,678.7694 L 2129.4113,676.80039 C 2129.5607,675.71746 2129.6838,674.00195 2129.6849,672.98821 C 2129.6861,671.97446 2129.687,670.69842 2129.6868,670.15256 C 2129.6867,669.6067 2129.6648,668.04205 2129.6383,666.67561 L 2129.59,664.19108 L 2134.4321,664.91105 L 2139.5362,670.54348 L 2148.6954,671.29158 L 2151.2591,666.94641 L 2151.8303,663.79981 C 2152.1445,662.06916 2152.618,659.50472 2152.8824,658.10108 C 2153.1469,656.69743 2153.3785,655.22999 2153.3971,654.84009 L 2153.4309,654.13118 L 2155.2816,654.13118 L 2154.6726,649.59012 L 2155.305,647.46543 C 2155.6529,646.2968 2156.1526,645.18971 2156.4155,645.00517 C 2156.6784,644.82062 2156.8498,644.43781 2156.7965,644.15448 C 2156.743,643.87114 2156.7295,643.1683 2156.7665,642.59266 L 2156.8337,641.54608 L 2163.1899,645.13328 L 2164.5362,644.61663 L 2166.5716,635.98306 L 2167.6091,634.31729 L 2169.3828,634.9979 L 2170.3392,633.65885 C 2170.8651,632.92238 2171.4335,631.80417 2171.6023,631.17398 L 2171.9091,630.02821 L 2174.2054,629.69315 L 2175.5694,625.921 L 2175.2149,624.99721 L 2175.3016,624.07336 L 2178.8719,624.03661 C 2179.8437,623.15812 2180.2418,622.08012 2180.0859,620.80947 C 2181.365,619.34968 2182.9426,619.1268 2184.56,619.0689 L 2184.2108,620.77579 L 2186.189,622.89685 L 2185.5338,624.60413 L 2186.5451,625.34117 L 2185.9719,626.26854 L 2187.6461,627.6884 L 2186.9599,632.15755 L 2181.6148,642.64381 L 2179.3083,643.1193 C 2177.9669,645.40256 2177.5703,647.88828 2177.6783,650.4821 L 2176.176,652.00382 L 2175.7332,658.37086 C 2178.3341,658.84611 2179.5995,659.63198 2179.9719,660.62548 L 2183.2328,660.68384 L 2183.2328,661.8181 L 2186.1644,661.8181 C 2185.5134,665.38414 2184.3566,664.53447 2184.3282,667.2057 C 2178.7243,674.24411 2180.7653,673.09307 2176.99,676.37714 L 2176.8641,683.37721 L 2177.4798,685.08291 C 2175.2031,687.18457 2173.6351,689.97915 2172.2745,692.69156 L 2173.3971,693.77858 L 2169.9749,697.97839 L 2169.8776,699.50147 C 2168.5862,699.70462 2167.3454,699.04766 2166.1046,698.39001 L 2162.133,701.11172 L 2162.7885,705.77057 C 2163.8448,706.08493 2164.8243,706.5067 2165.6223,707.18278 L 2167.0107,706.82656 L 2169.0286,711.12761 L 2172.7093,711.48275 C 2175.0675,714.54694 2177.4772,717.43096 2180.0417,719.77326 L 2179.2217,721.98994 L 2177.2398,722.72216 L 2177.5317,723.53293 L 2174.6982,727.67796 L 2173.2804,727.19624 L 2173.3885,730.86862 C 2172.2783,731.11759 2170.313,732.4804 2167.4395,735.5818 L 2164.675,735.02704 L 2162.2018,742.60325 L 2159.2459,741.55174 L 2158.3007,738.63863 L 2161.3707,734.63453 L 2157.8648,732.31248 C 2156.7733,733.63462 2153.0109,734.95683 2149.461,736.27897 L 2149.461,735.87705 C 2148.7546,734.71013 2147.1938,733.97042 2145.036,733.52919 L 2142.6554,737.56392 L 2142.6554,739.746 C 2140.5381,740.24077 2138.4413,740.78283 2136.9842,742.80095 L 2136.9842,746.64773 L 2138.2473,749.00801 C 2137.032,749.71692 2135.8779,750.69272 2135.2248,753.85509 L 2133.5233,755.4845 L 2130.8371,753.80302 L 2127.4675,754.97772 L 2126.4465,753.95677 L 2122.8213,754.99655 z "},"ky6":{"name":"KY-6","path":"M 1905.5236,788.80887 C 1905.0212,787.6914 1904.7261,784.95705 1904.4045,782.42981 L 1899.9995,781.79162 L 1897.9265,778.48327 L 1897.9265,776.0706 L 1896.3099,775.43184 L 1895.7876,772.67463 L 1891.3058,775.889 L 1885.0649,776.09067 L 1883.6745,757.06504 L 1882.0598,754.44144 L 1878.6677,754.92367 L 1877.4167,753.28393 L 1875.7052,754.66194 L 1874.4383,750.31042 C 1875.8661,749.31942 1875.5424,747.81761 1878.9406,744.21759 L 1878.9406,740.33474 L 1880.1515,740.33474 L 1880.0222,729.84286 L 1880.7742,726.72365 L 1879.1368,726.70442 L 1882.8193,723.65838 L 1883.4056,724.70484 L 1890.949,724.44946 L 1893.7357,727.81299 L 1895.2433,725.77439 L 1898.7179,726.55005 L 1899.4915,724.69996 L 1901.3108,725.31218 L 1902.1912,724.00637 L 1905.9034,723.59951 L 1905.8264,725.84279 C 1908.0801,725.37712 1909.2377,724.84294 1909.8547,724.27496 L 1910.7042,725.09191 L 1917.1443,718.47862 L 1921.5935,723.49357 L 1924.2532,724.22437 L 1925.4071,726.53877 L 1928.4969,725.86315 L 1929.8714,726.62423 L 1929.1107,727.75191 L 1929.9986,729.76335 L 1934.4968,730.48258 L 1941.0346,737.51532 L 1940.7992,742.08768 L 1942.459,742.72462 L 1942.459,744.16705 C 1944.7241,744.619 1946.8098,746.56482 1948.9286,748.23575 L 1946.7889,754.51296 L 1945.4122,754.51296 L 1941.8449,758.57581 L 1942.5999,761.03494 L 1941.7569,760.23823 L 1940.3833,761.61176 L 1939.4484,766.58491 L 1936.1991,765.10312 L 1931.7191,767.23978 C 1930.351,767.00192 1928.7234,767.11008 1926.4363,768.0975 L 1925.7258,770.33619 L 1922.1913,771.52024 L 1918.6567,770.53933 C 1917.9315,771.63593 1917.2215,772.75051 1917.2987,774.79989 L 1913.6717,775.15088 C 1913.2189,778.72357 1912.7901,782.64696 1912.0497,784.78232 C 1911.3349,784.70882 1910.7727,784.3399 1909.9559,783.65509 L 1905.5236,788.80887 z "},"ky4":{"name":"KY-4","path":"M 1941.1932,737.12831 L 1934.6836,730.16612 L 1930.0522,729.42551 L 1929.4114,727.75554 L 1930.1275,726.59684 L 1928.6178,725.6638 L 1925.5497,726.27738 L 1924.3408,724.0185 L 1921.7588,723.26927 L 1917.2218,717.86408 L 1910.6704,724.61478 L 1909.9535,723.89787 C 1909.0967,724.68057 1907.6577,725.09934 1906.1628,725.48323 L 1906.1628,723.28912 L 1902.0881,723.70709 L 1901.2515,725.06066 L 1899.3668,724.33746 L 1898.6267,726.22928 L 1895.1563,725.53523 L 1893.8176,727.32747 L 1891.1139,724.11423 L 1883.5008,724.3843 L 1882.8324,723.30273 L 1878.6822,726.72365 C 1874.2436,726.83929 1869.8242,726.94126 1864.8336,727.45122 L 1863.3629,731.10324 C 1860.9961,731.40672 1858.7454,731.94231 1856.7024,732.89327 C 1853.9201,731.37876 1850.8118,730.30841 1848.3157,728.33759 C 1848.3157,728.11436 1848.5643,727.27768 1848.8683,726.4782 L 1849.4209,725.0247 L 1854.1182,723.14518 L 1854.8705,721.34472 C 1855.2842,720.35445 1856.0203,719.2143 1856.5062,718.81101 L 1857.3897,718.07783 L 1857.3897,715.59789 L 1855.7244,713.39613 L 1855.7064,712.34756 C 1855.6964,711.77091 1855.2756,710.42936 1854.7713,709.36645 L 1853.8542,707.4339 L 1855.161,705.85933 L 1856.9842,705.54298 C 1857.9871,705.36893 1859.6527,705.05559 1860.6856,704.8466 L 1862.5636,704.46663 L 1864.8066,706.87415 L 1867.6397,706.87415 L 1874.6871,700.01966 L 1876.105,699.72628 C 1876.8848,699.56499 1877.9659,699.19318 1878.5075,698.90009 L 1879.4924,698.36722 L 1883.4517,698.36722 L 1883.4332,696.24048 C 1883.4231,695.07078 1883.4927,693.34813 1883.588,692.41236 L 1883.7612,690.71098 L 1879.5077,690.35896 L 1879.5077,689.93447 C 1879.5077,689.70098 1879.8824,689.01458 1880.3404,688.40906 C 1880.7983,687.80359 1881.1812,686.93617 1881.1911,686.48145 L 1881.2091,685.65463 L 1877.2254,681.57499 L 1883.291,675.05743 L 1884.0264,675.94351 C 1884.4308,676.43079 1885.9292,677.34597 1887.3561,677.97718 L 1889.9506,679.12477 L 1893.0729,676.81632 L 1895.3109,676.81632 L 1896.0309,674.54781 L 1897.0671,674.54781 L 1897.4397,676.10741 C 1897.6446,676.9652 1898.0635,677.98603 1898.3706,678.37593 L 1898.929,679.08484 L 1903.1513,679.08484 L 1904.0899,680.12195 C 1904.6062,680.69237 1905.0285,681.44251 1905.0285,681.78885 C 1905.0285,682.13525 1906.0494,683.59811 1907.297,685.03969 L 1909.5656,687.66073 L 1909.5656,690.9684 L 1912.1176,692.56424 L 1919.7699,693.29425 L 1923.0989,691.57273 L 1928.363,692.29423 L 1930.1126,694.96444 L 1932.2788,694.96444 L 1933.317,697.695 L 1934.9105,698 C 1935.787,698.1677 1937.3336,698.4668 1938.3473,698.66467 L 1940.1905,699.02446 L 1940.2558,698.27052 C 1940.2917,697.85584 1940.2764,697.07405 1940.2217,696.53323 L 1940.1223,695.54995 L 1945.2968,693.03598 L 1949.0615,694.39731 L 1953.7205,694.39731 L 1954.47,695.22833 C 1954.8822,695.68538 1955.5485,696.451 1955.9507,696.92971 C 1956.3529,697.40843 1956.9181,697.80009 1957.2067,697.80009 C 1957.4954,697.80009 1958.0048,697.28967 1958.3386,696.66583 L 1958.9457,695.53157 L 1962.6233,695.53157 L 1965.1442,693.76587 L 1965.1442,691.74916 L 1968.5469,688.71729 L 1968.5469,687.02464 L 1970.9353,687.02464 L 1974.3142,684.1814 L 1974.7707,684.46349 C 1975.0217,684.61865 1975.359,685.57739 1975.5201,686.59402 C 1975.6812,687.61066 1976.2559,689.67245 1976.7972,691.1758 L 1977.7814,693.90919 L 1980.4786,695.67642 L 1984.4082,695.03874 L 1989.0709,698.93434 L 1990.577,698.93434 L 1991.1476,700.77751 C 1991.4614,701.79125 1991.8924,703.51391 1992.1054,704.60563 C 1992.3183,705.69735 1992.8119,706.97339 1993.2023,707.44127 C 1993.5926,707.90916 1994.0539,709.05759 1994.2274,709.99335 L 1994.5428,711.69474 L 1989.6428,711.82966 L 1987.0483,714.24682 L 1984.5654,714.24682 L 1983.3022,715.76899 L 1983.9944,716.46134 C 1982.5772,718.06172 1981.4452,718.64348 1980.5955,718.21672 L 1979.2871,719.79334 L 1981.4727,723.60444 C 1978.8016,726.9805 1977.0012,729.59463 1976.9183,730.70597 L 1970.9969,731.95116 C 1970.1183,731.70485 1969.0039,731.69425 1967.8025,731.7707 L 1964.8606,729.46628 L 1964.1488,726.13514 L 1965.5996,725.30583 L 1965.9949,722.49814 C 1964.3333,722.3474 1962.6718,721.43829 1961.0103,719.90943 L 1958.6222,714.99758 L 1953.8315,710.12691 L 1951.2324,711.94728 L 1951.566,712.8586 L 1949.8752,714.7122 L 1949.8317,720.22118 L 1944.7275,726.05597 L 1944.8187,727.46704 L 1942.7426,728.91589 C 1944.0072,731.12899 1945.0547,733.36025 1945.3532,735.65389 C 1944.0372,736.53384 1942.6709,737.13727 1941.1932,737.12831 z "},"mo8":{"name":"MO-8","path":"M 1636.815,905.34225 L 1637.3504,903.93407 C 1637.6448,903.15954 1638.3089,901.70764 1638.826,900.70756 C 1639.3431,899.70754 1640.3696,898.41472 1641.1071,897.83466 L 1642.4479,896.77991 L 1642.4479,894.50488 L 1644.9209,892.13899 C 1646.281,890.83777 1647.549,889.32654 1647.7387,888.78068 C 1647.9284,888.23481 1648.3192,887.7882 1648.6071,887.7882 L 1649.1305,887.7882 L 1649.6809,885.23612 L 1648.9699,879.06548 L 1645.2431,878.10408 L 1645.7707,877.25044 C 1645.1408,875.89659 1644.5105,874.54285 1643.8668,873.19547 C 1596.5297,877.51909 1549.4509,882.48867 1501.5719,885.45764 L 1500.4318,881.55194 L 1498.3808,880.90099 L 1499.0673,879.79027 L 1496.2028,877.13554 L 1496.8657,874.60081 L 1494.9945,873.55361 L 1494.9945,867.49293 C 1498.3101,866.63634 1502.4925,866.81981 1506.5091,866.80444 L 1505.7397,850.52246 C 1510.0963,849.9986 1513.7051,849.724 1516.2904,849.79058 L 1515.7996,837.26503 L 1514.7155,836.62922 L 1514.2269,823.87631 C 1521.4042,823.5053 1528.7385,823.22842 1535.2136,822.43603 L 1535.2119,814.34503 C 1536.8155,813.70185 1541.505,813.96631 1545.4689,814.01729 L 1543.7109,788.40434 L 1546.4074,787.97355 L 1546.4074,786.08314 C 1547.1,786.43697 1548.5187,785.90739 1549.8303,785.22961 L 1562.3983,783.88484 C 1562.6632,781.4531 1562.1797,779.66285 1561.7351,777.83919 C 1563.1972,777.62572 1564.9351,777.48207 1566.4019,777.55863 L 1568.3944,800.01074 L 1579.0254,799.21875 C 1579.6438,800.79883 1579.8897,802.50305 1579.4966,804.42028 L 1587.3598,804.07603 L 1587.8136,801.2075 L 1589.8161,800.63759 L 1587.3786,772.24095 L 1602.2578,770.81093 C 1604.711,773.35989 1607.7567,776.20518 1607.9742,777.63638 L 1611.2559,778.46467 L 1611.2559,782.30226 C 1614.1987,781.91452 1617.5505,780.7088 1621.1681,778.97163 C 1622.5702,780.01452 1623.9756,781.05299 1625.373,782.10224 C 1623.8603,784.7032 1621.5694,786.79772 1619.7096,789.15845 L 1633.9623,801.17404 L 1636.1883,799.1596 L 1638.3389,800.62914 C 1640.6572,795.48982 1643.0079,790.10731 1645,787.41419 L 1647.6538,787.40642 L 1649.6698,784.91678 L 1652.5027,787.97355 L 1654.3073,787.97355 L 1658.6111,790.9001 L 1658.6111,793.27416 L 1660.2316,793.71034 C 1661.1229,793.95018 1662.2714,794.52077 1662.7837,794.97821 L 1663.7153,795.80991 L 1666.5509,796.19692 L 1666.2001,798.25792 L 1668.4976,802.15177 L 1666.8345,802.15177 L 1666.8345,803.34211 C 1666.8345,803.99675 1667.2197,805.34419 1667.6905,806.33638 C 1668.1613,807.32857 1669.565,809.37279 1670.8097,810.87908 L 1673.0729,813.61786 L 1673.0729,816.64843 L 1669.7213,817.91352 L 1668.959,820.95067 L 1670.2129,823.70266 L 1671.9386,823.70266 L 1671.9386,824.6184 C 1671.9386,825.12201 1672.627,826.79884 1673.4683,828.34461 L 1674.998,831.15513 L 1677.0428,832.24951 L 1677.0428,835.04523 L 1679.3113,837.31375 L 1680.8738,837.31375 L 1681.5798,838.16444 C 1681.9681,838.63232 1682.6284,839.01513 1683.0471,839.01513 L 1683.8084,839.01513 L 1685.0286,836.73516 L 1681.9813,833.91097 L 1682.5729,833.91097 C 1682.8983,833.91097 1683.9564,834.60582 1684.9243,835.4551 L 1686.684,836.99922 L 1686.684,837.65414 C 1686.684,838.01438 1687.0875,838.644 1687.5807,839.05336 L 1688.4775,839.7976 L 1690.7876,838.35488 L 1691.9091,839.47638 L 1691.106,845.31576 L 1688.9525,846.66065 L 1688.9525,849.65169 L 1689.6614,850.22721 C 1690.0513,850.54378 1690.8807,850.92824 1691.5046,851.08159 L 1692.6388,851.36039 L 1689.7465,851.49196 L 1689.0659,852.17252 L 1688.3854,852.85307 L 1688.3854,855.1052 L 1690.8657,857.74541 L 1689.5196,859.09149 L 1689.5196,860.43315 C 1689.5196,861.17109 1689.2554,862.26849 1688.9325,862.8718 L 1688.3454,863.9688 L 1686.7612,863.9688 L 1684.3382,860.56602 L 1681.7187,860.56602 L 1680.5725,861.98385 L 1680.1626,865.10305 C 1679.9371,866.81862 1679.4111,869.05169 1678.9938,870.06543 L 1678.2349,871.9086 L 1677.1247,871.9086 L 1677.7526,865.82529 L 1677.2516,865.51564 C 1676.976,865.34539 1675.8024,865.02814 1674.6434,864.81075 L 1672.5363,864.41541 L 1671.2022,867.34349 L 1674.2788,871.99259 L 1673.5516,875.3036 L 1675.8451,878.21938 L 1675.2441,879.78573 L 1671.0973,880.13196 L 1670.6849,882.30548 L 1673.3564,884.36019 L 1675.3414,884.38543 L 1675.3414,885.4683 L 1673.4982,885.77387 C 1672.4845,885.94191 1670.6342,886.14489 1669.3865,886.22491 L 1667.118,886.37038 L 1667.118,888.07177 L 1673.0729,891.98807 L 1673.0729,893.91455 L 1669.103,896.25685 L 1669.0943,898.40275 C 1669.0895,899.58295 1668.8981,900.82082 1668.669,901.15355 L 1668.2523,901.75851 L 1636.815,905.34225 z "},"mo4":{"name":"MO-4","path":"M 1452.9029,699.94315 L 1432.0432,701.36097 L 1433.1243,720.69655 L 1435.1624,720.20031 C 1435.4035,721.47414 1434.6545,722.02425 1433.9218,722.59285 L 1435.9422,722.59285 L 1438.4943,724.48922 L 1438.5469,732.70646 C 1433.4883,732.43214 1432.6049,731.97084 1431.0374,731.37065 L 1431.0923,733.44033 L 1432.8668,734.13262 L 1432.8668,735.87331 L 1438.3536,736.67415 C 1439.4249,739.17757 1439.2924,741.58843 1439.1234,743.99641 L 1425.4625,745.01219 L 1426.1182,755.2914 L 1420.1335,755.64585 C 1420.0861,754.20971 1420.2414,752.96481 1422.102,751.81484 L 1421.5683,750.56846 L 1416.0572,749.59572 L 1420.7006,836.88704 L 1446.7885,836.3908 L 1446.7885,840.07714 L 1468.6407,838.94288 L 1468.5395,828.81425 L 1473.1815,828.81425 C 1472.7018,825.07755 1473.188,820.37509 1474.1525,815.19437 L 1476.1552,815.19437 C 1476.8916,813.80853 1476.9972,812.26498 1476.8464,810.65734 L 1478.3896,810.65734 L 1482.943,813.43978 L 1489.6068,813.77654 L 1490.4574,829.2308 L 1495.3844,828.68137 L 1496.087,837.98324 L 1497.0846,838.07965 L 1497.5466,848.93852 L 1505.7699,848.77899 L 1505.7699,849.94869 C 1509.5864,849.45234 1512.6214,849.34663 1515.6947,849.22209 L 1515.3048,837.59595 L 1514.4364,837.02882 L 1513.8515,823.43543 C 1527.3506,822.55819 1529.7347,822.75306 1534.6935,821.87582 L 1534.6935,814.18414 C 1536.4799,813.71807 1538.0087,813.2156 1545.0613,813.49298 L 1543.1827,788.53932 L 1525.1055,789.28367 L 1525.7258,792.33199 L 1517.6619,793.09404 L 1513.1426,792.36744 L 1513.1426,788.6811 L 1511.3881,787.22783 L 1512.0261,785.56189 L 1510.8209,784.10862 L 1514.6136,781.5211 L 1514.5782,780.40454 L 1512.8236,780.2982 L 1512.859,778.13602 L 1510.431,778.11833 C 1509.7591,775.78459 1509.746,772.52502 1509.4031,769.34553 L 1512.0615,769.38097 L 1512.4337,764.04645 L 1523.3509,763.58565 L 1523.3509,768.74295 L 1529.3944,768.51259 L 1530.5996,769.25694 L 1533.6479,768.17582 L 1533.0984,766.24407 C 1534.6895,765.67547 1536.0582,764.93797 1537.157,763.97556 C 1534.6351,762.13023 1533.7368,760.70283 1533.6656,759.73978 L 1536.9266,760.46645 L 1541.2155,759.29674 L 1541.8712,757.38268 L 1540.542,755.82308 L 1540.8788,753.97991 L 1536.9266,754.28117 L 1532.1414,752.40256 L 1530.759,749.691 C 1528.7964,749.51434 1527.7138,748.93757 1526.8246,748.27318 L 1522.7661,748.1314 L 1524.8928,745.80969 C 1523.4595,744.80836 1521.8445,743.54537 1520.9938,743.61206 L 1522.518,740.35107 L 1521.3837,738.86236 L 1519.3988,738.86236 L 1518.619,736.66474 L 1517.4138,736.5584 C 1517.5997,734.29317 1516.9159,733.83612 1516.1555,733.56328 L 1511.4767,748.68078 C 1504.4637,749.06784 1497.2913,750.26408 1490.2802,749.40744 L 1489.1637,731.91503 L 1495.8275,724.56011 L 1495.7743,723.72711 L 1493.559,723.63853 C 1493.2919,722.04807 1494.1691,721.54854 1495.3135,721.29912 C 1494.9274,720.36903 1495.4605,718.93743 1497.4225,716.72665 L 1497.5111,715.0784 L 1492.5133,716.05318 L 1494.3742,713.9087 L 1492.5133,712.86308 L 1492.1588,710.34645 L 1487.2319,710.3287 L 1485.6546,706.50058 L 1482.8544,707.08546 L 1481.4897,704.83464 L 1480.4441,704.88783 L 1481.0644,707.47536 L 1479.2921,710.02744 L 1477.7679,710.09833 L 1477.0945,711.87061 L 1474.2766,711.9415 L 1473.674,713.12889 L 1474.9855,715.14929 C 1474.0867,716.65439 1472.5667,717.12999 1470.8915,717.36467 L 1471.1574,714.81259 C 1469.8308,714.76262 1468.7782,714.3683 1468.304,713.25298 L 1466.9216,713.82011 L 1467.2584,718.28625 L 1464.2632,718.62295 L 1462.8808,716.83298 L 1459.0881,716.86843 L 1456.8374,719.8813 L 1454.303,719.91674 C 1454.0663,713.21289 1453.8344,706.50806 1452.9029,699.94315 z "},"mo9":{"name":"MO-9","path":"M 1580.0638,803.90726 C 1580.2991,802.147 1579.7422,800.38669 1579.3323,798.62644 L 1568.9419,799.40545 L 1566.8811,777.29259 C 1565.4929,777.03001 1563.648,777.02122 1561.0396,777.43658 C 1562.1182,780.18052 1562.1223,781.92637 1561.9157,783.38514 L 1549.7573,784.66396 C 1548.4887,785.64322 1547.2372,786.22855 1546.0361,785.6553 L 1546.087,787.59153 C 1545.5803,788.19643 1533.2136,788.52332 1524.7526,788.94181 L 1525.285,792.01037 L 1517.7641,792.70187 L 1513.4806,791.8936 L 1513.4806,788.50138 L 1511.9567,787.22471 L 1512.595,785.56127 L 1511.4649,784.19948 L 1514.844,781.70116 L 1514.844,780.03375 L 1513.1426,780.03375 L 1513.1426,777.76523 L 1510.8385,777.76523 C 1510.1058,775.59982 1509.9566,772.72142 1509.8218,769.82543 L 1512.3606,769.82543 L 1512.859,764.43771 L 1523.0384,763.98264 L 1522.962,769.11408 L 1529.3052,768.95143 L 1530.4555,769.66233 L 1534.0223,768.31602 L 1533.4831,766.42357 C 1535.2189,765.70314 1536.7777,764.89419 1537.5718,763.70294 C 1536.0345,762.74693 1534.7496,761.58431 1533.9572,760.01881 L 1537.0045,760.78364 L 1541.4306,759.59182 L 1542.1598,757.29416 L 1540.8629,755.73138 L 1541.2155,753.66226 L 1537.2456,753.99001 L 1532.4457,752.15852 L 1531.0392,749.50714 C 1529.3519,749.21558 1527.957,748.75337 1527.0828,747.98746 L 1523.3464,747.91107 L 1525.2991,745.87604 C 1523.6506,744.63976 1522.2173,743.65465 1521.3793,743.36389 L 1522.8173,740.20782 L 1521.5106,738.63335 L 1519.4575,738.63335 L 1518.7374,736.36484 L 1517.6796,736.36484 L 1517.6796,734.24077 C 1515.3523,731.8227 1513.7514,730.85751 1512.368,730.32724 L 1512.3853,729.50145 L 1517.6796,712.15213 L 1504.1496,708.35566 L 1503.3255,685.32326 L 1495.7157,685.32326 C 1494.8897,672.51227 1493.8695,659.50722 1492.6113,646.26425 L 1515.897,643.62597 C 1516.0023,638.66331 1515.3344,633.70785 1515.1471,628.74774 L 1543.1929,625.11914 L 1543.9373,625.87229 C 1544.3467,626.28652 1544.8369,627.03575 1545.0266,627.53726 L 1545.3714,628.44909 L 1548.9469,629.16419 L 1548.2879,630.23044 L 1552.138,634.43298 L 1553.2706,633.73298 L 1553.9475,637.11732 L 1554.5525,637.11732 C 1554.8853,637.11732 1555.6534,637.57924 1556.2594,638.14382 L 1557.3612,639.17038 L 1556.7939,641.12124 C 1556.4818,642.19425 1556.0765,645.24143 1555.8932,647.89276 L 1555.56,652.71335 L 1557.89,660.9961 L 1559.164,663.09317 C 1559.8646,664.24654 1560.6949,665.36498 1561.0088,665.57867 L 1561.5797,665.9671 L 1560.0531,668.81958 L 1561.3723,671.99573 L 1564.7513,673.92794 L 1564.7513,678.46933 L 1566.8195,680.05315 C 1567.9569,680.92421 1569.8382,682.46634 1570.9999,683.48009 C 1572.1616,684.49383 1573.3968,685.32326 1573.7447,685.32326 L 1574.3773,685.32326 L 1576.0008,689.20882 L 1579.0871,689.57672 L 1580.0679,691.41359 C 1580.6073,692.42388 1581.3924,693.6647 1581.8126,694.17092 C 1582.2328,694.67719 1583.6483,695.63706 1584.9583,696.304 C 1586.2682,696.97089 1588.9477,698.52527 1590.9127,699.75821 C 1592.8777,700.99115 1595.3248,702.86432 1596.3507,703.92071 L 1598.216,705.84152 L 1598.4821,706.62767 L 1576.9446,708.29197 L 1577.3227,713.68916 L 1573.8254,714.3886 C 1573.634,717.55505 1574.1027,720.72156 1574.5409,723.88801 L 1577.7051,723.88801 L 1578.4525,727.29078 L 1582.3323,727.29078 L 1582.3323,730.78384 L 1589.705,729.99428 L 1589.7223,734.37989 L 1590.751,736.00556 L 1599.3462,736.32871 L 1598.1019,733.5825 C 1599.1399,733.27189 1599.7101,733.30127 1600.7189,733.28612 L 1600.1458,735.63058 L 1602.6457,737.96187 L 1605.9897,737.01341 L 1611.4785,737.6647 L 1609.8612,739.97019 L 1605.4631,739.92964 L 1602.0739,743.41345 L 1603.0327,753.25716 L 1602.2215,770.33573 L 1586.8331,771.79938 L 1589.469,800.37983 L 1587.5325,800.88616 L 1587.1529,803.56959 L 1580.0638,803.90726 z "},"id2":{"name":"ID-2","path":"M 550.81381,280.23247 L 549.04153,280.92366 L 549.67955,282.5896 L 546.32995,284.32643 L 545.69193,286.77217 L 543.91965,286.09871 L 543.91965,287.64059 L 542.11193,288.33178 L 541.08401,287.69376 L 541.08401,289.04069 L 538.44332,288.52673 L 537.04322,291.66366 L 533.16193,292.95742 L 532.5948,292.58524 C 532.27676,292.3887 532.00487,291.9288 531.99223,291.55732 C 531.97952,291.18583 531.21389,289.99657 530.29084,288.91663 L 528.60718,286.9494 L 528.60718,285.42524 L 527.52609,286.09871 L 524.31827,284.99989 C 523.18304,285.04689 520.95954,287.22279 518.94827,289.14702 L 518.62926,289.14702 L 518.62926,288.01277 L 516.44936,288.08366 L 515.12015,286.20504 L 513.54282,286.80762 L 513.54282,290.9193 L 514.94292,290.90158 L 514.23401,292.089 C 516.80516,294.50276 517.88336,297.27668 519.10777,300.01108 L 520.66738,300.08197 L 514.21629,306.55079 C 512.82462,312.54428 511.85601,318.54591 510.99074,324.5394 C 507.45379,327.65597 504.04964,330.87388 499.86084,333.52484 L 496.015,332.7096 C 496.14887,331.70356 495.48674,330.56096 494.40223,329.35999 L 491.37163,330.70692 L 490.21965,335.13762 L 487.72074,337.40613 L 484.51292,337.97326 L 483.00649,339.51514 L 482.91787,343.20148 L 484.63698,343.76861 L 485.34589,346.28524 L 483.94579,351.07039 L 480.75569,354.86306 C 482.56026,356.325 484.13165,357.67116 484.1053,358.26583 L 485.91302,358.23039 L 485.275,363.63583 C 487.71811,366.85489 487.00801,364.94969 491.21213,368.01336 L 489.79431,369.98059 L 490.36144,371.55791 L 492.02738,371.59336 L 488.74866,373.2593 L 488.44738,375.12019 L 489.67025,376.59118 L 490.57411,376.04177 L 491.19441,379.19643 C 490.42346,380.15874 488.3186,380.05932 486.37381,380.08257 L 486.37381,378.55841 L 483.99896,377.3887 L 484.1053,371.2389 L 482.58114,370.0692 L 481.695,370.95534 L 482.4748,371.00851 C 481.21071,374.54533 478.90228,377.0665 476.48451,379.49771 C 473.40395,379.81097 470.37502,380.08026 466.96738,380.72059 C 465.95437,381.91617 465.11185,383.96839 464.29124,386.12603 L 461.77461,385.62979 C 460.27138,387.96694 459.26168,389.89596 458.83263,391.35425 C 455.28029,393.26829 453.56473,393.55328 452.13342,393.58732 L 449.49272,395.96217 L 442.43906,395.34187 L 436.82094,386.87039 L 431.89401,388.02237 C 431.19977,390.30695 430.68339,392.57405 430.81292,394.81019 L 432.24847,395.37732 L 440.95035,408.95296 C 440.2526,414.29578 439.07861,419.55311 437.83114,424.79712 C 433.43304,424.07084 428.86775,423.36547 425.21253,422.54633 L 425.54926,423.5388 L 428.03045,424.549 L 427.35698,427.08336 L 429.52159,428.46334 L 429.68224,429.8138 C 432.5647,431.37736 433.68918,433.85654 437.01114,435.38347 L 437.12592,432.75575 L 439.26079,432.12963 L 439.18046,433.27922 L 441.47024,433.3714 L 441.39699,434.34258 L 444.55282,434.71491 C 444.55247,435.66501 444.66617,436.59756 445.91516,437.35545 L 452.5501,437.56643 C 452.98376,438.17602 453.76705,438.66907 455.94371,438.69767 L 457.455,440.04813 L 460.04253,440.08476 C 459.10796,447.07871 458.83264,442.24291 458.11782,449.96935 C 464.57641,450.96642 471.40793,451.93685 476.57787,453.02596 L 469.46629,500.04801 C 529.72814,509.92453 600.00749,518.23181 650.25628,523.97375 L 667.69549,372.51494 L 664.70037,371.15029 L 664.02691,367.78296 L 660.78361,364.61059 L 660.74817,360.97742 L 658.78097,359.87861 L 659.56077,359.08108 L 657.89483,355.85554 L 655.7149,354.68583 L 654.97054,355.87326 L 654.03126,355.78465 C 653.51302,355.7338 652.66919,355.71328 652.15265,355.7492 L 651.21331,355.82009 L 651.78044,358.01771 L 648.66124,362.11167 L 651.23107,365.56762 L 649.91958,366.8791 L 646.48136,364.89415 L 644.85087,364.89415 C 643.96065,364.89415 642.5849,364.64895 641.7848,364.34474 L 640.33153,363.79534 L 640.33153,364.20296 C 640.33153,364.43122 639.32352,364.93165 638.08077,365.3195 C 636.83802,365.70736 635.42632,366.0284 634.96156,366.02841 L 634.12856,366.02841 L 632.40948,362.73197 L 630.84988,363.01554 C 629.98625,363.17886 627.95049,363.40158 626.33054,363.49405 C 624.7106,363.58652 623.12587,363.80213 622.82143,363.99029 L 622.27206,364.34474 L 620.57067,362.62564 L 617.66414,362.62564 L 616.95522,361.49138 C 616.56561,360.86754 615.97438,360.35711 615.64374,360.35712 C 615.31305,360.35712 614.35619,360.67835 613.5347,361.06603 L 612.04599,361.77494 L 611.39027,365.30177 L 609.36988,367.12722 L 605.75443,364.9296 L 604.21252,365.51445 L 602.75926,363.75989 L 600.06539,363.75989 L 600.06539,362.74969 L 597.93866,362.39524 C 596.76896,362.20144 595.3208,362.03408 594.71312,362.02306 L 593.59661,362.00534 L 590.70777,364.18524 L 590.70777,368.11969 L 589.14817,369.99831 L 587.62401,369.99831 L 586.95054,368.72227 C 586.57675,368.02045 585.26884,366.55299 584.04401,365.46128 L 581.81094,363.47633 L 581.42104,357.75187 L 579.52473,352.96672 L 581.04889,351.12356 L 580.85391,349.65257 C 580.74837,348.83815 580.51607,347.90863 580.32223,347.59672 C 580.12844,347.2848 579.90641,346.69937 579.84374,346.28524 C 579.78096,345.87111 579.32788,344.66866 578.83351,343.62682 L 577.92968,341.73049 L 574.47371,338.82395 L 572.82552,339.65692 C 571.92594,340.1221 570.80995,340.5076 570.32658,340.50762 L 569.44044,340.50762 L 569.44044,337.95554 L 565.5946,334.8895 L 565.31104,333.02861 C 565.15168,331.9995 564.84471,330.57576 564.61985,329.87395 L 564.21223,328.59791 L 567.17193,328.59791 L 567.26057,327.03831 C 567.30906,326.18053 567.30538,324.90077 567.24282,324.18494 L 567.11876,322.87346 L 564.8148,320.5695 L 565.4351,318.95673 L 563.30837,318.95673 L 562.68807,317.16673 C 562.34564,316.18441 562.06777,315.04901 562.06777,314.63237 C 562.06777,314.21572 561.2676,312.57912 560.29549,310.9992 L 558.54094,308.12811 L 559.23213,307.4192 L 557.40668,304.63673 L 558.06243,300.59593 L 557.58391,299.99336 C 557.32405,299.66171 556.99406,298.68859 556.83955,297.83118 L 556.55599,296.27158 L 557.30035,295.2791 C 557.71497,294.73287 558.07022,293.84 558.08015,293.29415 L 558.09787,292.30168 L 555.26223,292.30168 L 555.26223,291.41554 C 555.26223,290.93217 555.63555,289.82325 556.0952,288.93435 L 556.92817,287.32158 L 556.23698,286.75445 C 555.8553,286.44472 555.0511,286.08667 554.44698,285.97465 L 553.34817,285.7797 L 552.85193,283.79475 C 552.5754,282.7035 551.99675,281.46254 551.57589,281.02999 L 550.81381,280.23247 z "},"id1":{"name":"ID-1","path":"M 379.5567,484.73578 L 400.00144,372.55176 L 401.16446,371.53323 C 401.80412,370.97304 402.66757,369.85924 403.08317,369.05811 C 403.49881,368.25698 403.83886,367.01997 403.83886,366.30919 L 403.83886,365.01688 L 405.43329,364.40504 L 406.22211,360.81352 L 405.59764,360.18901 C 405.25413,359.84554 404.97312,359.10514 404.97312,358.54368 L 404.97312,357.52285 L 406.61677,357.52285 L 409.60367,353.60681 L 409.21995,351.568 L 406.67451,350.44834 L 406.67451,347.27893 L 405.9656,347.01977 C 405.5757,346.87723 404.74627,346.68645 404.12243,346.59582 C 403.49859,346.50518 402.66502,346.22937 402.27002,345.9829 L 401.55186,345.53477 L 402.20939,344.47088 L 400.42163,343.78487 L 398.60472,345.29279 L 396.40335,342.57421 L 398.16758,341.58688 L 398.16758,339.03445 L 396.84407,337.71097 L 398.87949,333.19731 L 398.20319,331.43493 L 398.69421,331.43493 C 398.96422,331.43493 399.97706,330.74008 400.94492,329.89082 C 401.91273,329.04156 402.70461,328.14326 402.70461,327.89459 C 402.70461,327.64594 403.39798,326.36293 404.24544,325.04346 C 405.0929,323.724 406.24831,321.87881 406.81306,320.94305 C 407.37775,320.00729 407.99359,318.78203 408.18154,318.22027 L 408.52329,317.19887 L 410.1628,316.87097 C 411.06448,316.69063 411.93962,316.32084 412.10749,316.0492 L 412.41272,315.55533 L 414.61431,314.08414 L 416.92774,311.84231 C 418.20009,310.6093 419.51311,309.10156 419.8455,308.49178 L 420.44989,307.38307 L 420.62655,301.81605 L 424.26571,298.82503 L 424.2555,297.44712 L 426.54131,296.22379 L 427.62118,293.83807 L 431.62817,286.45821 L 431.62817,284.43755 L 434.88916,280.27398 C 436.68271,277.98401 438.65399,275.1284 439.26978,273.92819 L 440.38934,271.74598 L 441.7031,270.88519 C 442.42562,270.41176 443.27223,269.54709 443.58449,268.96372 L 444.15213,267.90304 L 441.83649,262.66817 L 441.79877,258.55889 L 439.71764,256.06599 L 436.64964,255.29596 L 435.62614,252.60404 L 434.76139,252.53315 C 434.28579,252.49416 433.58817,252.43036 433.21103,252.39137 L 432.52537,252.32048 L 431.81322,248.83851 L 429.2261,245.3392 L 429.93489,244.19229 L 429.31718,242.5851 C 428.97741,241.70114 428.59851,239.99013 428.47516,238.78285 L 428.25086,236.5878 L 426.95225,235.02305 L 428.09309,235.02305 L 428.45191,234.03058 C 428.64921,233.48471 429.17596,232.41005 429.62246,231.64243 L 430.43425,230.24676 L 429.31077,228.89308 L 428.96476,221.92445 L 428.31149,221.27122 C 427.95221,220.91194 427.65827,220.17987 427.65827,219.64441 L 427.65827,218.67084 L 426.43168,218.26198 L 428.17441,214.88998 L 456.76479,58.841168 L 495.52208,65.664123 L 485.08895,126.67716 L 489.75886,136.34032 L 491.15508,136.34266 L 491.48452,137.65526 C 491.66572,138.37719 491.76797,139.20662 491.71171,139.49843 C 491.65551,139.79024 491.63974,140.60321 491.67666,141.30503 L 491.74381,142.58107 L 493.4452,142.58107 L 493.4452,144.23827 L 495.81149,146.44282 L 494.49887,148.89555 L 496.43051,151.84362 L 493.4452,154.01825 L 493.4452,154.79163 C 493.4452,155.21699 494.06303,156.72695 494.8181,158.1471 L 496.19101,160.72919 L 492.87807,160.72919 L 492.87807,162.91538 L 494.18428,163.94902 C 494.90266,164.51752 495.66029,165.42927 495.86786,165.97513 L 496.24523,166.96761 L 497.73014,166.96761 L 499.68361,169.24909 L 499.68361,170.26847 C 499.68361,170.82912 500.00262,171.69311 500.39253,172.18843 C 500.78243,172.68376 502.37543,173.75337 503.93254,174.56534 C 505.48971,175.37732 507.05708,176.04167 507.41562,176.04167 L 508.06759,176.04167 L 508.75665,178.78718 L 508.07287,180.56913 L 509.89193,181.26718 L 509.89193,182.8073 L 512.07906,183.97781 L 513.38136,186.6735 C 514.09764,188.15613 515.13679,189.97783 515.6906,190.72171 L 516.69748,192.07424 L 516.69748,195.32404 L 518.19736,195.32404 L 521.0241,199.64153 L 520.02278,202.64559 L 521.93088,206.66662 L 523.23017,206.66662 L 524.64692,208.93513 L 526.33866,208.93513 L 526.33866,209.95596 C 526.33866,210.51742 526.07512,211.24037 525.75293,211.56251 L 525.1672,212.14824 L 525.93475,214.14843 L 529.45787,213.44647 L 529.6469,212.89219 C 529.75091,212.58733 530.18028,212.3379 530.6012,212.3379 L 531.36637,212.3379 L 532.13132,214.74802 L 530.76873,215.59016 L 532.60623,219.14345 L 536.05443,219.14345 L 538.32442,220.35832 L 541.04408,218.57632 L 543.85273,218.57632 L 544.43268,219.51469 L 541.94247,227.65038 L 539.91414,227.65038 L 539.26126,229.35176 L 539.69494,230.34424 C 539.93348,230.8901 540.0642,231.71246 539.98537,232.1717 C 539.90659,232.63095 539.35591,233.34724 538.76167,233.76347 L 537.68124,234.52024 L 537.68124,238.35888 L 536.54698,239.05989 L 536.54698,241.26147 L 534.80998,241.26147 L 534.1516,242.9773 L 535.46155,244.55574 L 534.73869,247.43599 L 531.15926,247.78345 L 530.80974,250.80529 L 533.14421,251.54622 L 533.14421,253.59941 L 531.3924,255.05329 L 531.76665,256.80609 C 531.97252,257.77013 532.43048,258.91698 532.78436,259.35463 L 533.42777,260.15037 L 533.53434,262.19027 C 533.59292,263.31222 533.72052,264.74059 533.8179,265.36444 L 533.9949,266.49869 L 529.26493,266.84305 L 528.27966,268.37225 C 527.73777,269.21332 526.95173,270.10555 526.53296,270.35499 L 525.77153,270.80852 L 525.77153,271.55189 C 525.77153,271.96074 526.3664,273.17186 527.09351,274.24326 L 528.41543,276.19126 L 527.33953,278.60248 L 524.56145,279.29973 L 524.68673,280.55545 C 524.75569,281.2461 524.61748,282.51299 524.37963,283.37077 L 523.9472,284.93038 C 522.33319,285.45821 520.6447,287.25234 518.96599,288.88024 L 518.96599,287.76602 L 516.53896,287.76602 L 515.1601,285.88034 L 513.2947,286.59616 L 513.2947,291.16879 L 514.49588,291.16879 L 513.92643,292.09023 C 515.43098,293.31474 517.09194,295.65641 519.06717,300.24285 L 520.20222,300.24285 L 513.89371,306.34939 C 512.61633,312.30115 511.41419,318.25291 510.53755,324.20467 C 507.36194,327.43532 503.80276,330.42993 499.75105,333.12144 L 496.28084,332.4274 C 496.3887,331.2884 495.41644,330.1494 494.62392,329.0104 L 491.18417,330.43517 L 489.99995,334.83309 L 487.69536,336.98014 L 484.50787,337.61765 L 482.66975,339.45575 L 482.66975,343.38023 L 484.32798,344.01654 L 484.99702,346.12451 L 483.7393,350.79538 L 480.40124,355.02282 C 482.00457,356.2147 483.76329,357.40012 483.80401,358.65711 L 485.63419,358.65711 L 484.8621,363.80581 C 487.41549,366.90947 488.30033,366.01873 490.92956,368.16172 L 489.45573,369.85591 L 490.16379,371.70107 L 491.46025,371.71779 L 488.63464,373.14738 L 488.24741,375.15833 L 489.60381,376.79274 L 490.47985,376.25132 L 491.02458,379.10081 C 490.43356,379.73152 488.70323,379.89616 486.6396,379.92443 L 486.63965,378.54652 L 484.19417,377.2566 L 484.37114,371.27282 L 482.62166,369.8209 L 481.30864,371.13394 L 482.12571,371.13394 C 481.14307,373.80142 479.29987,376.50077 476.49712,379.23566 L 466.80994,380.3515 C 465.78198,382.12182 464.76643,383.8957 464.20025,385.79797 L 461.80021,385.26021 C 460.11162,387.73198 459.22556,389.57957 458.74744,391.10986 C 456.22939,392.38432 453.78516,393.50444 451.99739,393.25196 L 449.34104,395.75356 L 442.61981,395.10415 L 436.99706,386.56266 L 431.69832,387.69765 C 430.68268,390.04619 430.50966,392.50708 430.49391,394.98894 L 432.15089,395.6248 L 440.69724,408.95026 C 439.92668,414.11345 438.84123,419.33963 437.74022,424.56891 L 424.67478,422.21769 L 425.17958,423.59334 L 427.61687,424.69517 L 426.9869,427.20498 L 429.35966,428.68678 L 429.35966,430.11532 L 429.83332,430.11532 C 432.92878,432.01917 433.82478,434.2011 437.29946,435.75101 L 437.29946,432.9712 L 439.00084,432.41944 L 439.00084,433.5181 L 441.26936,433.5181 L 441.26936,434.57702 L 444.38857,434.93592 C 444.13628,435.86745 444.68588,436.75679 445.71259,437.62102 L 452.32837,437.77156 C 452.92265,438.61607 454.25234,438.97029 456.05883,439.00666 L 457.37581,440.32364 L 459.78815,440.32364 C 459.24086,446.21283 458.34847,442.4295 457.70963,450.28601 C 463.83423,451.3181 470.07285,451.84521 476.11182,453.31646 L 468.91161,499.87215 C 439.12664,495.69455 409.34167,490.0223 379.5567,484.73578 z "},"ut3":{"name":"UT-3","path":"M 588.22658,599.11833 L 587.94302,600.11081 C 587.78632,600.65661 587.68061,603.01734 587.6949,605.35675 C 587.70919,607.69615 587.55442,610.44973 587.3582,611.47108 L 586.79107,614.59028 L 585.40869,614.32447 L 585.86948,622.88454 L 584.9479,623.45167 L 585.97582,632.41763 L 584.57569,633.92041 L 585.30235,637.18685 L 583.50064,639.64308 L 584.87701,644.48863 L 586.45431,644.48863 L 586.4952,648.31493 L 587.88149,649.55581 L 588.15569,651.8393 L 587.02143,651.93219 L 587.03584,654.89947 L 585.40869,657.63892 L 583.45919,656.55781 L 579.27661,660.74038 C 577.28474,662.72579 574.59054,664.88445 573.69391,665.43694 L 571.49629,669.99167 L 491.92104,659.44665 C 488.15505,691.71037 484.22819,709.44273 479.33787,745.11853 L 555.13817,755.87622 L 556.94589,754.0685 C 557.9417,753.07273 558.95579,752.24308 559.21441,752.24308 L 559.69292,752.24308 L 559.07262,749.86823 L 559.65747,749.49602 C 559.97914,749.29401 560.62485,748.21034 561.09302,747.08573 L 561.94371,745.04764 C 560.25293,741.25309 560.15863,743.25108 559.49797,742.19424 L 559.32074,739.60672 L 557.0345,739.44724 L 556.83955,738.34843 L 554.6951,736.32803 L 554.6951,732.87206 L 612.45364,740.04981 L 620.05668,680.71397 L 622.75054,680.96209 C 623.50947,673.85024 624.20659,667.85785 625.26718,659.92513 L 643.7343,662.1582 L 643.7343,657.10724 L 633.52599,655.70711 L 633.52599,653.13734 L 631.73602,652.67655 L 632.48037,651.22328 L 631.31067,649.87635 C 630.8767,649.35005 630.24532,648.34868 629.82196,647.5015 L 629.00671,646.01279 L 626.77364,645.80011 C 626.93896,644.43691 627.24407,643.76401 627.89015,642.32645 L 628.42183,641.44031 L 628.42183,637.82487 L 626.72044,634.56388 L 627.32302,633.02197 L 625.58619,630.23952 L 623.03411,629.76098 L 619.41866,629.74328 L 618.65661,628.52038 L 619.8972,627.26209 L 618.03629,625.20625 L 615.41332,625.20625 L 613.85371,620.17298 L 610.66361,618.96784 L 607.95206,618.96784 L 604.60242,620.70467 L 604.60242,624.63912 L 601.76678,624.63912 L 601.76678,624.12513 C 601.76678,623.8355 601.3703,623.19686 600.88064,622.70731 L 599.97681,621.80348 L 597.81463,622.47694 L 596.75126,620.26157 C 597.61438,617.63582 598.41375,614.99 599.19701,612.33952 C 599.67237,610.72133 600.06528,608.72833 600.06539,607.90883 C 600.06539,607.08904 600.34493,605.90493 600.68572,605.26811 L 601.30599,604.0984 L 600.06539,602.87556 L 600.06539,600.30573 L 593.75609,599.11833 L 591.43443,600.35893 L 590.81411,599.7386 C 590.47338,599.39781 589.75948,599.11833 589.21906,599.11833 L 588.22658,599.11833 z "},"mt":{"name":"MT At-Large","path":"M 496.43964,65.833717 L 485.86765,126.40377 C 486.58853,128.79194 488.64768,130.78942 489.67025,133.13346 C 490.11056,135.26253 493.12192,136.03467 492.87807,138.27307 C 492.56925,140.24412 492.91587,141.83972 494.98708,142.49109 C 493.95672,144.24402 496.53697,144.66263 496.86569,146.05336 C 496.33707,147.78324 496.10943,149.46362 497.37965,150.92713 C 497.83178,153.34133 496.10214,153.95945 494.56173,154.96792 C 495.44172,156.84053 496.77298,158.69671 497.37965,160.58604 C 497.75249,162.98505 493.58008,161.09639 494.27817,162.25198 C 496.27373,163.61572 496.42046,166.14655 498.70886,166.20415 C 500.47769,167.44824 500.57718,169.54335 500.95965,171.48554 C 503.1458,172.6595 505.25249,174.0626 507.65886,174.74653 C 509.18319,175.01632 509.55205,177.40856 509.89193,178.62782 C 508.33371,180.83586 512.0467,179.16074 511.02619,181.71158 C 511.96974,182.87003 513.94418,183.46899 514.16312,185.39792 C 514.68642,188.07606 517.68891,189.52835 517.30005,192.22118 C 516.66719,195.53504 519.97706,193.88671 520.38381,196.45693 C 520.50244,198.69894 523.3907,197.49834 522.15609,199.71792 C 521.32067,202.04566 521.37317,204.49199 523.60936,205.86772 C 524.43623,207.52365 526.20631,207.53201 527.18936,208.4198 C 529.47352,209.94181 525.02813,213.70744 528.89074,212.28336 C 528.86941,210.80485 531.48788,210.71597 532.31124,212.1593 C 533.66791,212.98556 533.51925,216.24216 532.08084,215.88108 C 532.80517,218.74959 535.47719,217.74523 537.66351,218.55722 C 539.22876,220.12191 539.54347,216.64124 541.43847,217.56475 C 544.12359,216.62017 546.92244,218.97573 544.9653,221.80049 C 543.65818,223.78803 544.42059,228.15454 541.75748,228.67693 C 539.53093,228.57299 541.41946,231.55208 541.17262,232.93039 C 540.09251,234.44506 538.0229,235.47784 538.56738,237.91049 C 537.79972,239.63968 538.03816,242.75241 535.41272,242.48296 C 536.3079,243.75718 536.81162,245.08835 536.13936,246.59465 C 536.37541,248.37991 533.80627,249.23786 532.64797,248.04792 C 530.68898,249.66909 533.66805,250.31951 534.27847,251.59247 C 534.90113,253.5287 533.52295,254.67589 532.78975,255.88138 C 533.03361,258.31553 535.65519,259.6388 534.79243,262.22613 C 534.72143,264.09064 536.43766,267.52427 533.79995,268.11009 C 531.2702,267.88004 529.19286,267.3326 528.35906,270.28999 C 526.17603,271.36125 527.66399,272.87066 528.57173,274.31306 C 529.84657,275.86402 529.18813,279.67504 527.13619,279.82485 C 524.17586,279.05812 527.50993,282.01898 525.77153,282.94405 C 524.06045,284.43416 527.99959,283.88169 528.89074,284.43277 C 530.0813,286.19797 532.07761,291.02871 533.85312,291.45098 C 536.64867,291.29504 536.90945,288.28062 537.69896,287.28613 C 539.29934,286.9244 541.77995,288.05477 542.76767,286.64811 C 543.7898,284.99156 545.40483,285.69838 545.47926,283.51118 C 546.71344,282.57479 549.10982,282.30557 548.45668,280.26791 C 548.36393,278.67038 551.80842,278.37586 552.39114,280.07296 C 554.12027,281.09659 553.61853,283.42473 554.39381,284.84039 C 555.96551,285.1853 557.9996,285.01588 557.97381,287.14435 C 558.76074,288.44597 555.39825,290.79162 557.08767,291.18514 C 560.41108,290.78078 558.34444,294.99067 558.23965,296.9096 C 557.13888,298.5452 559.86044,299.83294 559.16124,301.34029 C 558.01061,302.86054 558.25194,304.30577 559.51569,305.68237 C 560.76967,307.77075 559.62755,309.40163 561.78421,311.35366 C 564.34901,312.64352 562.71069,316.28216 564.4249,317.5389 C 566.85066,317.78712 566.39913,319.006 566.48074,320.53405 C 568.30063,321.69293 568.53497,323.73274 568.80243,325.69138 C 568.01582,326.98445 568.60694,330.10564 566.55163,329.73217 C 564.53531,329.32306 566.73425,333.54275 567.18968,334.6591 C 568.28583,335.93462 570.93869,336.43582 570.5747,338.43405 C 570.49559,340.31748 573.43093,337.68614 574.65094,337.6188 C 576.43983,339.16819 579.22472,340.58068 580.07411,342.52801 C 580.14585,344.18783 581.8072,347.10227 582.07681,349.70573 C 583.31525,351.61428 580.8665,352.33295 581.13747,353.67564 C 582.26992,355.83803 582.82451,358.14133 582.73252,360.58752 C 582.30899,363.06597 584.63904,364.66961 586.5252,365.76257 C 588.3733,365.51842 587.48898,369.84897 589.20136,368.36781 C 591.21518,367.53441 587.21471,365.49001 589.36084,364.3093 C 590.37328,362.11638 592.67662,361.47811 594.67767,360.48118 C 597.13118,360.55147 599.77622,362.64618 602.58203,362.59019 C 603.94926,363.39289 605.0931,363.89041 606.83549,364.0789 C 608.3841,365.45832 609.78893,366.1081 610.66361,363.77762 C 610.81135,361.86415 610.66622,360.67543 612.7372,360.53435 C 613.48763,358.70667 615.60948,359.21883 617.09701,359.3292 C 617.61491,361.39863 619.10561,361.8314 621.06691,361.49138 C 622.25039,363.73337 624.34554,362.53498 627.14579,362.2889 C 630.56813,361.95489 634.07037,360.70855 635.12104,364.98276 C 637.43345,364.43086 639.61224,362.85933 642.05067,363.2991 C 644.38208,363.70203 647.19521,362.9278 648.83846,365.03593 C 647.38769,363.079 647.75349,360.89996 649.60057,358.83296 C 651.22965,357.81397 648.96142,354.43166 651.49688,354.86306 C 654.02253,355.19341 654.54996,354.10268 655.66176,352.34643 C 657.36899,354.01514 659.48035,355.38419 660.23423,357.7696 C 660.78837,359.38038 662.3697,360.9268 662.21918,362.57247 C 661.20266,364.31684 663.9153,365.36573 664.68262,366.77276 C 665.92815,368.29355 664.47658,371.10335 667.69549,371.11484 C 668.38875,371.34652 668.03583,370.85476 668.12084,370.4591 C 668.76629,359.94508 670.07823,349.45096 671.54136,339.0189 C 776.67999,350.32401 845.12607,357.79797 977.91641,363.6759 C 982.01571,280.38435 985.32071,204.41362 988.54851,117.76782 C 770.22397,107.9288 665.88584,91.520201 496.43964,65.833717 z "}}})
\ No newline at end of file